@@ -0,0 +1,107 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import sys
+
+if sys.hexversion < 0x3040000:
+    print('Python >= 3.4 required')
+    sys.exit(1)
+
+import os
+import re
+import time
+import argparse
+import subprocess
+import importlib.util
+import importlib.machinery
+
+generators_dir = os.path.dirname(os.path.realpath(__file__))
+
+def create_generators_module():
+    if sys.hexversion < 0x3050000:
+        generators_module = importlib.machinery.SourceFileLoader('generators', os.path.join(generators_dir, '__init__.py')).load_module()
+    else:
+        generators_spec = importlib.util.spec_from_file_location('generators', os.path.join(generators_dir, '__init__.py'))
+        generators_module = importlib.util.module_from_spec(generators_spec)
+
+        generators_spec.loader.exec_module(generators_module)
+
+    sys.modules['generators'] = generators_module
+
+if 'generators' not in sys.modules:
+    create_generators_module()
+
+from generators import common
+
+def get_config_dirs():
+    config_base_path = os.path.join(generators_dir, 'configs')
+    config_dirs = [(config_base_path, '')]
+
+    for config_name in sorted(os.listdir(config_base_path)):
+        config_path = os.path.join(config_base_path, config_name)
+
+        if config_name == '__pycache__' or not os.path.isdir(config_path):
+            continue
+
+        if re.match('^[a-z0-9_]+$', config_name) == None:
+            raise common.GeneratorError('Invalid config name: {0}'.format(config_name))
+
+        config_dirs.append((config_path, '.' + config_name))
+
+    return config_dirs
+
+def load_all_device_models(use_snapshot):
+    common.enable_device_model_snapshot = use_snapshot
+
+    start = time.time()
+
+    for config_path, config_subdir in get_config_dirs():
+        for config in sorted(os.listdir(config_path)):
+            if config.endswith('_config.py'):
+                common.get_device_model(config_path, config_subdir, config)
+
+    return time.time() - start
+
+def benchmark(rounds):
+    results = {}
+
+    for mode in ['import', 'snapshot']:
+        durations = []
+
+        for _ in range(rounds):
+            # every round runs in a fresh process to measure a cold start
+            output = subprocess.check_output([sys.executable, os.path.realpath(__file__), '--measure', mode])
+            durations.append(float(output.decode('utf-8').strip()))
+
+        durations.sort()
+        results[mode] = durations[len(durations) // 2]
+
+        print('{0:>8}: {1:.3f} s (median of {2})'.format(mode, results[mode], rounds))
+
+    if results['snapshot'] > 0:
+        print('speedup: {0:.1f}x'.format(results['import'] / results['snapshot']))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-b', '--benchmark', action='store_true', help='compare loading all device models with and without snapshot')
+    parser.add_argument('-r', '--rounds', type=int, default=5, help='number of benchmark rounds [default: 5]')
+    parser.add_argument('--measure', choices=['import', 'snapshot'], help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.measure != None:
+        print(load_all_device_models(args.measure == 'snapshot'))
+        return 0
+
+    for config_path, config_subdir in get_config_dirs():
+        count = common.build_device_model_snapshot(config_path, config_subdir)
+
+        print('{0}: {1} device models'.format(os.path.relpath(os.path.join(config_path, common.DEVICE_MODEL_SNAPSHOT_FILENAME), generators_dir), count))
+
+    if args.benchmark:
+        benchmark(args.rounds)
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,1458 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C/C++ Bindings Version 2.1.30                             *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+
+#define IPCON_EXPOSE_INTERNALS
+
+#include "brick_dc.h"
+
+#include <string.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+
+
+typedef void (*UnderVoltage_CallbackFunction)(uint16_t voltage, void *user_data);
+
+typedef void (*EmergencyShutdown_CallbackFunction)(void *user_data);
+
+typedef void (*VelocityReached_CallbackFunction)(int16_t velocity, void *user_data);
+
+typedef void (*CurrentVelocity_CallbackFunction)(int16_t velocity, void *user_data);
+
+#if defined _MSC_VER || defined __BORLANDC__
+	#pragma pack(push)
+	#pragma pack(1)
+	#define ATTRIBUTE_PACKED
+#elif defined __GNUC__
+	#ifdef _WIN32
+		// workaround struct packing bug in GCC 4.7 on Windows
+		// https://gcc.gnu.org/bugzilla/show_bug.cgi?id=52991
+		#define ATTRIBUTE_PACKED __attribute__((gcc_struct, packed))
+	#else
+		#define ATTRIBUTE_PACKED __attribute__((packed))
+	#endif
+#else
+	#error unknown compiler, do not know how to enable struct packing
+#endif
+
+typedef struct {
+	PacketHeader header;
+	int16_t velocity;
+} ATTRIBUTE_PACKED SetVelocity_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetVelocity_Request;
+
+typedef struct {
+	PacketHeader header;
+	int16_t velocity;
+} ATTRIBUTE_PACKED GetVelocity_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetCurrentVelocity_Request;
+
+typedef struct {
+	PacketHeader header;
+	int16_t velocity;
+} ATTRIBUTE_PACKED GetCurrentVelocity_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t acceleration;
+} ATTRIBUTE_PACKED SetAcceleration_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetAcceleration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t acceleration;
+} ATTRIBUTE_PACKED GetAcceleration_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t frequency;
+} ATTRIBUTE_PACKED SetPWMFrequency_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetPWMFrequency_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t frequency;
+} ATTRIBUTE_PACKED GetPWMFrequency_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED FullBrake_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetStackInputVoltage_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t voltage;
+} ATTRIBUTE_PACKED GetStackInputVoltage_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetExternalInputVoltage_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t voltage;
+} ATTRIBUTE_PACKED GetExternalInputVoltage_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetCurrentConsumption_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t voltage;
+} ATTRIBUTE_PACKED GetCurrentConsumption_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED Enable_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED Disable_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED IsEnabled_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t enabled;
+} ATTRIBUTE_PACKED IsEnabled_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t voltage;
+} ATTRIBUTE_PACKED SetMinimumVoltage_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetMinimumVoltage_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t voltage;
+} ATTRIBUTE_PACKED GetMinimumVoltage_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t mode;
+} ATTRIBUTE_PACKED SetDriveMode_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetDriveMode_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t mode;
+} ATTRIBUTE_PACKED GetDriveMode_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t period;
+} ATTRIBUTE_PACKED SetCurrentVelocityPeriod_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetCurrentVelocityPeriod_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t period;
+} ATTRIBUTE_PACKED GetCurrentVelocityPeriod_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t voltage;
+} ATTRIBUTE_PACKED UnderVoltage_Callback;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED EmergencyShutdown_Callback;
+
+typedef struct {
+	PacketHeader header;
+	int16_t velocity;
+} ATTRIBUTE_PACKED VelocityReached_Callback;
+
+typedef struct {
+	PacketHeader header;
+	int16_t velocity;
+} ATTRIBUTE_PACKED CurrentVelocity_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t enable_dynamic_baudrate;
+	uint32_t minimum_dynamic_baudrate;
+} ATTRIBUTE_PACKED SetSPITFPBaudrateConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetSPITFPBaudrateConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t enable_dynamic_baudrate;
+	uint32_t minimum_dynamic_baudrate;
+} ATTRIBUTE_PACKED GetSPITFPBaudrateConfig_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t communication_method;
+} ATTRIBUTE_PACKED GetSendTimeoutCount_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t timeout_count;
+} ATTRIBUTE_PACKED GetSendTimeoutCount_Response;
+
+typedef struct {
+	PacketHeader header;
+	char bricklet_port;
+	uint32_t baudrate;
+} ATTRIBUTE_PACKED SetSPITFPBaudrate_Request;
+
+typedef struct {
+	PacketHeader header;
+	char bricklet_port;
+} ATTRIBUTE_PACKED GetSPITFPBaudrate_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t baudrate;
+} ATTRIBUTE_PACKED GetSPITFPBaudrate_Response;
+
+typedef struct {
+	PacketHeader header;
+	char bricklet_port;
+} ATTRIBUTE_PACKED GetSPITFPErrorCount_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t error_count_ack_checksum;
+	uint32_t error_count_message_checksum;
+	uint32_t error_count_frame;
+	uint32_t error_count_overflow;
+} ATTRIBUTE_PACKED GetSPITFPErrorCount_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED EnableStatusLED_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED DisableStatusLED_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED IsStatusLEDEnabled_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t enabled;
+} ATTRIBUTE_PACKED IsStatusLEDEnabled_Response;
+
+typedef struct {
+	PacketHeader header;
+	char port;
+} ATTRIBUTE_PACKED GetProtocol1BrickletName_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t protocol_version;
+	uint8_t firmware_version[3];
+	char name[40];
+} ATTRIBUTE_PACKED GetProtocol1BrickletName_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetChipTemperature_Request;
+
+typedef struct {
+	PacketHeader header;
+	int16_t temperature;
+} ATTRIBUTE_PACKED GetChipTemperature_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED Reset_Request;
+
+typedef struct {
+	PacketHeader header;
+	char port;
+	uint8_t offset;
+	uint8_t chunk[32];
+} ATTRIBUTE_PACKED WriteBrickletPlugin_Request;
+
+typedef struct {
+	PacketHeader header;
+	char port;
+	uint8_t offset;
+} ATTRIBUTE_PACKED ReadBrickletPlugin_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t chunk[32];
+} ATTRIBUTE_PACKED ReadBrickletPlugin_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetIdentity_Request;
+
+typedef struct {
+	PacketHeader header;
+	char uid[8];
+	char connected_uid[8];
+	char position;
+	uint8_t hardware_version[3];
+	uint8_t firmware_version[3];
+	uint16_t device_identifier;
+} ATTRIBUTE_PACKED GetIdentity_Response;
+
+#if defined _MSC_VER || defined __BORLANDC__
+	#pragma pack(pop)
+#endif
+#undef ATTRIBUTE_PACKED
+
+static void dc_callback_wrapper_under_voltage(DevicePrivate *device_p, Packet *packet) {
+	UnderVoltage_CallbackFunction callback_function;
+	void *user_data;
+	UnderVoltage_Callback *callback;
+
+	if (packet->header.length != sizeof(UnderVoltage_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (UnderVoltage_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + DC_CALLBACK_UNDER_VOLTAGE];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + DC_CALLBACK_UNDER_VOLTAGE];
+	callback = (UnderVoltage_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+	if (callback_function == NULL) {
+		return;
+	}
+
+	callback->voltage = leconvert_uint16_from(callback->voltage);
+
+	callback_function(callback->voltage, user_data);
+}
+
+static void dc_callback_wrapper_emergency_shutdown(DevicePrivate *device_p, Packet *packet) {
+	EmergencyShutdown_CallbackFunction callback_function;
+	void *user_data;
+	EmergencyShutdown_Callback *callback;
+
+	if (packet->header.length != sizeof(EmergencyShutdown_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (EmergencyShutdown_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + DC_CALLBACK_EMERGENCY_SHUTDOWN];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + DC_CALLBACK_EMERGENCY_SHUTDOWN];
+	callback = (EmergencyShutdown_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+	if (callback_function == NULL) {
+		return;
+	}
+
+	callback_function(user_data);
+}
+
+static void dc_callback_wrapper_velocity_reached(DevicePrivate *device_p, Packet *packet) {
+	VelocityReached_CallbackFunction callback_function;
+	void *user_data;
+	VelocityReached_Callback *callback;
+
+	if (packet->header.length != sizeof(VelocityReached_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (VelocityReached_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + DC_CALLBACK_VELOCITY_REACHED];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + DC_CALLBACK_VELOCITY_REACHED];
+	callback = (VelocityReached_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+	if (callback_function == NULL) {
+		return;
+	}
+
+	callback->velocity = leconvert_int16_from(callback->velocity);
+
+	callback_function(callback->velocity, user_data);
+}
+
+static void dc_callback_wrapper_current_velocity(DevicePrivate *device_p, Packet *packet) {
+	CurrentVelocity_CallbackFunction callback_function;
+	void *user_data;
+	CurrentVelocity_Callback *callback;
+
+	if (packet->header.length != sizeof(CurrentVelocity_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (CurrentVelocity_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + DC_CALLBACK_CURRENT_VELOCITY];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + DC_CALLBACK_CURRENT_VELOCITY];
+	callback = (CurrentVelocity_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+	if (callback_function == NULL) {
+		return;
+	}
+
+	callback->velocity = leconvert_int16_from(callback->velocity);
+
+	callback_function(callback->velocity, user_data);
+}
+
+void dc_create(DC *dc, const char *uid, IPConnection *ipcon) {
+	IPConnectionPrivate *ipcon_p = ipcon->p;
+	DevicePrivate *device_p;
+
+	device_create(dc, uid, ipcon_p, 2, 0, 3, DC_DEVICE_IDENTIFIER);
+
+	device_p = dc->p;
+
+	device_p->response_expected[DC_FUNCTION_SET_VELOCITY] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_GET_VELOCITY] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_GET_CURRENT_VELOCITY] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_SET_ACCELERATION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_GET_ACCELERATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_SET_PWM_FREQUENCY] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_GET_PWM_FREQUENCY] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_FULL_BRAKE] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_GET_STACK_INPUT_VOLTAGE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_GET_CURRENT_CONSUMPTION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_ENABLE] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_DISABLE] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_IS_ENABLED] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_SET_MINIMUM_VOLTAGE] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[DC_FUNCTION_GET_MINIMUM_VOLTAGE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_SET_DRIVE_MODE] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_GET_DRIVE_MODE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_SET_CURRENT_VELOCITY_PERIOD] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[DC_FUNCTION_GET_CURRENT_VELOCITY_PERIOD] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_SET_SPITFP_BAUDRATE_CONFIG] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_GET_SPITFP_BAUDRATE_CONFIG] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_GET_SEND_TIMEOUT_COUNT] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_SET_SPITFP_BAUDRATE] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_GET_SPITFP_BAUDRATE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_GET_SPITFP_ERROR_COUNT] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_ENABLE_STATUS_LED] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_DISABLE_STATUS_LED] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_IS_STATUS_LED_ENABLED] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_GET_PROTOCOL1_BRICKLET_NAME] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_GET_CHIP_TEMPERATURE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_RESET] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_WRITE_BRICKLET_PLUGIN] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[DC_FUNCTION_READ_BRICKLET_PLUGIN] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[DC_FUNCTION_GET_IDENTITY] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+	device_p->callback_wrappers[DC_CALLBACK_UNDER_VOLTAGE] = dc_callback_wrapper_under_voltage;
+	device_p->callback_wrappers[DC_CALLBACK_EMERGENCY_SHUTDOWN] = dc_callback_wrapper_emergency_shutdown;
+	device_p->callback_wrappers[DC_CALLBACK_VELOCITY_REACHED] = dc_callback_wrapper_velocity_reached;
+	device_p->callback_wrappers[DC_CALLBACK_CURRENT_VELOCITY] = dc_callback_wrapper_current_velocity;
+
+	ipcon_add_device(ipcon_p, device_p);
+}
+
+void dc_destroy(DC *dc) {
+	device_release(dc->p);
+}
+
+int dc_get_response_expected(DC *dc, uint8_t function_id, bool *ret_response_expected) {
+	return device_get_response_expected(dc->p, function_id, ret_response_expected);
+}
+
+int dc_set_response_expected(DC *dc, uint8_t function_id, bool response_expected) {
+	return device_set_response_expected(dc->p, function_id, response_expected);
+}
+
+int dc_set_response_expected_all(DC *dc, bool response_expected) {
+	return device_set_response_expected_all(dc->p, response_expected);
+}
+
+void dc_register_callback(DC *dc, int16_t callback_id, void (*function)(void), void *user_data) {
+	device_register_callback(dc->p, callback_id, function, user_data);
+}
+
+int dc_get_api_version(DC *dc, uint8_t ret_api_version[3]) {
+	return device_get_api_version(dc->p, ret_api_version);
+}
+
+int dc_set_velocity(DC *dc, int16_t velocity) {
+	DevicePrivate *device_p = dc->p;
+	SetVelocity_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_SET_VELOCITY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.velocity = leconvert_int16_to(velocity);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_get_velocity(DC *dc, int16_t *ret_velocity) {
+	DevicePrivate *device_p = dc->p;
+	GetVelocity_Request request;
+	GetVelocity_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_VELOCITY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_velocity = leconvert_int16_from(response.velocity);
+
+	return ret;
+}
+
+int dc_get_current_velocity(DC *dc, int16_t *ret_velocity) {
+	DevicePrivate *device_p = dc->p;
+	GetCurrentVelocity_Request request;
+	GetCurrentVelocity_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_CURRENT_VELOCITY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_velocity = leconvert_int16_from(response.velocity);
+
+	return ret;
+}
+
+int dc_set_acceleration(DC *dc, uint16_t acceleration) {
+	DevicePrivate *device_p = dc->p;
+	SetAcceleration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_SET_ACCELERATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.acceleration = leconvert_uint16_to(acceleration);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_get_acceleration(DC *dc, uint16_t *ret_acceleration) {
+	DevicePrivate *device_p = dc->p;
+	GetAcceleration_Request request;
+	GetAcceleration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_ACCELERATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_acceleration = leconvert_uint16_from(response.acceleration);
+
+	return ret;
+}
+
+int dc_set_pwm_frequency(DC *dc, uint16_t frequency) {
+	DevicePrivate *device_p = dc->p;
+	SetPWMFrequency_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_SET_PWM_FREQUENCY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.frequency = leconvert_uint16_to(frequency);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_get_pwm_frequency(DC *dc, uint16_t *ret_frequency) {
+	DevicePrivate *device_p = dc->p;
+	GetPWMFrequency_Request request;
+	GetPWMFrequency_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_PWM_FREQUENCY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_frequency = leconvert_uint16_from(response.frequency);
+
+	return ret;
+}
+
+int dc_full_brake(DC *dc) {
+	DevicePrivate *device_p = dc->p;
+	FullBrake_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_FULL_BRAKE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_get_stack_input_voltage(DC *dc, uint16_t *ret_voltage) {
+	DevicePrivate *device_p = dc->p;
+	GetStackInputVoltage_Request request;
+	GetStackInputVoltage_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_STACK_INPUT_VOLTAGE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_voltage = leconvert_uint16_from(response.voltage);
+
+	return ret;
+}
+
+int dc_get_external_input_voltage(DC *dc, uint16_t *ret_voltage) {
+	DevicePrivate *device_p = dc->p;
+	GetExternalInputVoltage_Request request;
+	GetExternalInputVoltage_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_voltage = leconvert_uint16_from(response.voltage);
+
+	return ret;
+}
+
+int dc_get_current_consumption(DC *dc, uint16_t *ret_voltage) {
+	DevicePrivate *device_p = dc->p;
+	GetCurrentConsumption_Request request;
+	GetCurrentConsumption_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_CURRENT_CONSUMPTION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_voltage = leconvert_uint16_from(response.voltage);
+
+	return ret;
+}
+
+int dc_enable(DC *dc) {
+	DevicePrivate *device_p = dc->p;
+	Enable_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_ENABLE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_disable(DC *dc) {
+	DevicePrivate *device_p = dc->p;
+	Disable_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_DISABLE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_is_enabled(DC *dc, bool *ret_enabled) {
+	DevicePrivate *device_p = dc->p;
+	IsEnabled_Request request;
+	IsEnabled_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_IS_ENABLED, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_enabled = response.enabled != 0;
+
+	return ret;
+}
+
+int dc_set_minimum_voltage(DC *dc, uint16_t voltage) {
+	DevicePrivate *device_p = dc->p;
+	SetMinimumVoltage_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_SET_MINIMUM_VOLTAGE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.voltage = leconvert_uint16_to(voltage);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_get_minimum_voltage(DC *dc, uint16_t *ret_voltage) {
+	DevicePrivate *device_p = dc->p;
+	GetMinimumVoltage_Request request;
+	GetMinimumVoltage_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_MINIMUM_VOLTAGE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_voltage = leconvert_uint16_from(response.voltage);
+
+	return ret;
+}
+
+int dc_set_drive_mode(DC *dc, uint8_t mode) {
+	DevicePrivate *device_p = dc->p;
+	SetDriveMode_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_SET_DRIVE_MODE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.mode = mode;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_get_drive_mode(DC *dc, uint8_t *ret_mode) {
+	DevicePrivate *device_p = dc->p;
+	GetDriveMode_Request request;
+	GetDriveMode_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_DRIVE_MODE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_mode = response.mode;
+
+	return ret;
+}
+
+int dc_set_current_velocity_period(DC *dc, uint16_t period) {
+	DevicePrivate *device_p = dc->p;
+	SetCurrentVelocityPeriod_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_SET_CURRENT_VELOCITY_PERIOD, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.period = leconvert_uint16_to(period);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_get_current_velocity_period(DC *dc, uint16_t *ret_period) {
+	DevicePrivate *device_p = dc->p;
+	GetCurrentVelocityPeriod_Request request;
+	GetCurrentVelocityPeriod_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_CURRENT_VELOCITY_PERIOD, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_period = leconvert_uint16_from(response.period);
+
+	return ret;
+}
+
+int dc_set_spitfp_baudrate_config(DC *dc, bool enable_dynamic_baudrate, uint32_t minimum_dynamic_baudrate) {
+	DevicePrivate *device_p = dc->p;
+	SetSPITFPBaudrateConfig_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_SET_SPITFP_BAUDRATE_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.enable_dynamic_baudrate = enable_dynamic_baudrate ? 1 : 0;
+	request.minimum_dynamic_baudrate = leconvert_uint32_to(minimum_dynamic_baudrate);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_get_spitfp_baudrate_config(DC *dc, bool *ret_enable_dynamic_baudrate, uint32_t *ret_minimum_dynamic_baudrate) {
+	DevicePrivate *device_p = dc->p;
+	GetSPITFPBaudrateConfig_Request request;
+	GetSPITFPBaudrateConfig_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_SPITFP_BAUDRATE_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_enable_dynamic_baudrate = response.enable_dynamic_baudrate != 0;
+	*ret_minimum_dynamic_baudrate = leconvert_uint32_from(response.minimum_dynamic_baudrate);
+
+	return ret;
+}
+
+int dc_get_send_timeout_count(DC *dc, uint8_t communication_method, uint32_t *ret_timeout_count) {
+	DevicePrivate *device_p = dc->p;
+	GetSendTimeoutCount_Request request;
+	GetSendTimeoutCount_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_SEND_TIMEOUT_COUNT, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.communication_method = communication_method;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_timeout_count = leconvert_uint32_from(response.timeout_count);
+
+	return ret;
+}
+
+int dc_set_spitfp_baudrate(DC *dc, char bricklet_port, uint32_t baudrate) {
+	DevicePrivate *device_p = dc->p;
+	SetSPITFPBaudrate_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_SET_SPITFP_BAUDRATE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.bricklet_port = bricklet_port;
+	request.baudrate = leconvert_uint32_to(baudrate);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_get_spitfp_baudrate(DC *dc, char bricklet_port, uint32_t *ret_baudrate) {
+	DevicePrivate *device_p = dc->p;
+	GetSPITFPBaudrate_Request request;
+	GetSPITFPBaudrate_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_SPITFP_BAUDRATE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.bricklet_port = bricklet_port;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_baudrate = leconvert_uint32_from(response.baudrate);
+
+	return ret;
+}
+
+int dc_get_spitfp_error_count(DC *dc, char bricklet_port, uint32_t *ret_error_count_ack_checksum, uint32_t *ret_error_count_message_checksum, uint32_t *ret_error_count_frame, uint32_t *ret_error_count_overflow) {
+	DevicePrivate *device_p = dc->p;
+	GetSPITFPErrorCount_Request request;
+	GetSPITFPErrorCount_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_SPITFP_ERROR_COUNT, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.bricklet_port = bricklet_port;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_error_count_ack_checksum = leconvert_uint32_from(response.error_count_ack_checksum);
+	*ret_error_count_message_checksum = leconvert_uint32_from(response.error_count_message_checksum);
+	*ret_error_count_frame = leconvert_uint32_from(response.error_count_frame);
+	*ret_error_count_overflow = leconvert_uint32_from(response.error_count_overflow);
+
+	return ret;
+}
+
+int dc_enable_status_led(DC *dc) {
+	DevicePrivate *device_p = dc->p;
+	EnableStatusLED_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_ENABLE_STATUS_LED, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_disable_status_led(DC *dc) {
+	DevicePrivate *device_p = dc->p;
+	DisableStatusLED_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_DISABLE_STATUS_LED, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_is_status_led_enabled(DC *dc, bool *ret_enabled) {
+	DevicePrivate *device_p = dc->p;
+	IsStatusLEDEnabled_Request request;
+	IsStatusLEDEnabled_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_IS_STATUS_LED_ENABLED, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_enabled = response.enabled != 0;
+
+	return ret;
+}
+
+int dc_get_protocol1_bricklet_name(DC *dc, char port, uint8_t *ret_protocol_version, uint8_t ret_firmware_version[3], char ret_name[40]) {
+	DevicePrivate *device_p = dc->p;
+	GetProtocol1BrickletName_Request request;
+	GetProtocol1BrickletName_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_PROTOCOL1_BRICKLET_NAME, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.port = port;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_protocol_version = response.protocol_version;
+	memcpy(ret_firmware_version, response.firmware_version, 3 * sizeof(uint8_t));
+	memcpy(ret_name, response.name, 40);
+
+	return ret;
+}
+
+int dc_get_chip_temperature(DC *dc, int16_t *ret_temperature) {
+	DevicePrivate *device_p = dc->p;
+	GetChipTemperature_Request request;
+	GetChipTemperature_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_CHIP_TEMPERATURE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_temperature = leconvert_int16_from(response.temperature);
+
+	return ret;
+}
+
+int dc_reset(DC *dc) {
+	DevicePrivate *device_p = dc->p;
+	Reset_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_RESET, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_write_bricklet_plugin(DC *dc, char port, uint8_t offset, uint8_t chunk[32]) {
+	DevicePrivate *device_p = dc->p;
+	WriteBrickletPlugin_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_WRITE_BRICKLET_PLUGIN, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.port = port;
+	request.offset = offset;
+	memcpy(request.chunk, chunk, 32 * sizeof(uint8_t));
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int dc_read_bricklet_plugin(DC *dc, char port, uint8_t offset, uint8_t ret_chunk[32]) {
+	DevicePrivate *device_p = dc->p;
+	ReadBrickletPlugin_Request request;
+	ReadBrickletPlugin_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_READ_BRICKLET_PLUGIN, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.port = port;
+	request.offset = offset;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_chunk, response.chunk, 32 * sizeof(uint8_t));
+
+	return ret;
+}
+
+int dc_get_identity(DC *dc, char ret_uid[8], char ret_connected_uid[8], char *ret_position, uint8_t ret_hardware_version[3], uint8_t ret_firmware_version[3], uint16_t *ret_device_identifier) {
+	DevicePrivate *device_p = dc->p;
+	GetIdentity_Request request;
+	GetIdentity_Response response;
+	int ret;
+
+	ret = packet_header_create(&request.header, sizeof(request), DC_FUNCTION_GET_IDENTITY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_uid, response.uid, 8);
+	memcpy(ret_connected_uid, response.connected_uid, 8);
+	*ret_position = response.position;
+	memcpy(ret_hardware_version, response.hardware_version, 3 * sizeof(uint8_t));
+	memcpy(ret_firmware_version, response.firmware_version, 3 * sizeof(uint8_t));
+	*ret_device_identifier = leconvert_uint16_from(response.device_identifier);
+
+	return ret;
+}
+
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,1593 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C/C++ Bindings Version 2.1.30                             *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+
+#define IPCON_EXPOSE_INTERNALS
+
+#include "bricklet_arinc429.h"
+
+#include <string.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+
+
+typedef void (*Heartbeat_CallbackFunction)(uint8_t seq_number, uint16_t timestamp, uint16_t frames_processed[3], uint16_t frames_lost[3], void *user_data);
+
+typedef void (*FrameMessage_CallbackFunction)(uint8_t channel, uint8_t seq_number, uint16_t timestamp, uint8_t frame_status, uint32_t frame, uint16_t age, void *user_data);
+
+#if defined _MSC_VER || defined __BORLANDC__
+	#pragma pack(push)
+	#pragma pack(1)
+	#define ATTRIBUTE_PACKED
+#elif defined __GNUC__
+	#ifdef _WIN32
+		// workaround struct packing bug in GCC 4.7 on Windows
+		// https://gcc.gnu.org/bugzilla/show_bug.cgi?id=52991
+		#define ATTRIBUTE_PACKED __attribute__((gcc_struct, packed))
+	#else
+		#define ATTRIBUTE_PACKED __attribute__((packed))
+	#endif
+#else
+	#error unknown compiler, do not know how to enable struct packing
+#endif
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED DebugGetDiscretes_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t rx_discretes;
+	uint16_t tx_discretes;
+} ATTRIBUTE_PACKED DebugGetDiscretes_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t op_code;
+} ATTRIBUTE_PACKED DebugReadRegisterLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t value_length;
+	uint8_t value_data[32];
+	uint8_t rw_error;
+} ATTRIBUTE_PACKED DebugReadRegisterLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t op_code;
+	uint8_t value_length;
+	uint8_t value_data[32];
+} ATTRIBUTE_PACKED DebugWriteRegisterLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t rw_error;
+} ATTRIBUTE_PACKED DebugWriteRegisterLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetCapabilities_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t tx_total_scheduler_tasks;
+	uint16_t tx_used_scheduler_tasks;
+	uint16_t rx_total_frame_filters;
+	uint16_t rx_used_frame_filters[2];
+} ATTRIBUTE_PACKED GetCapabilities_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t period;
+	uint8_t value_has_to_change;
+} ATTRIBUTE_PACKED SetHeartbeatCallbackConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetHeartbeatCallbackConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t period;
+	uint8_t value_has_to_change;
+} ATTRIBUTE_PACKED GetHeartbeatCallbackConfiguration_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t seq_number;
+	uint16_t timestamp;
+	uint16_t frames_processed[3];
+	uint16_t frames_lost[3];
+} ATTRIBUTE_PACKED Heartbeat_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint8_t parity;
+	uint8_t speed;
+} ATTRIBUTE_PACKED SetChannelConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+} ATTRIBUTE_PACKED GetChannelConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t parity;
+	uint8_t speed;
+} ATTRIBUTE_PACKED GetChannelConfiguration_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint8_t mode;
+} ATTRIBUTE_PACKED SetChannelMode_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+} ATTRIBUTE_PACKED GetChannelMode_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t mode;
+} ATTRIBUTE_PACKED GetChannelMode_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+} ATTRIBUTE_PACKED ClearAllRXFilters_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint8_t label;
+	uint8_t sdi;
+} ATTRIBUTE_PACKED ClearRXFilter_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t success;
+} ATTRIBUTE_PACKED ClearRXFilter_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+} ATTRIBUTE_PACKED SetRXStandardFilters_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint8_t label;
+	uint8_t sdi;
+} ATTRIBUTE_PACKED SetRXFilter_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t success;
+} ATTRIBUTE_PACKED SetRXFilter_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint8_t label;
+	uint8_t sdi;
+} ATTRIBUTE_PACKED GetRXFilter_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t configured;
+} ATTRIBUTE_PACKED GetRXFilter_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint8_t label;
+	uint8_t sdi;
+} ATTRIBUTE_PACKED ReadFrame_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t status;
+	uint32_t frame;
+	uint16_t age;
+} ATTRIBUTE_PACKED ReadFrame_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint8_t enabled;
+	uint8_t value_has_to_change;
+	uint16_t timeout;
+} ATTRIBUTE_PACKED SetRXCallbackConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+} ATTRIBUTE_PACKED GetRXCallbackConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t enabled;
+	uint8_t value_has_to_change;
+	uint16_t timeout;
+} ATTRIBUTE_PACKED GetRXCallbackConfiguration_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint8_t seq_number;
+	uint16_t timestamp;
+	uint8_t frame_status;
+	uint32_t frame;
+	uint16_t age;
+} ATTRIBUTE_PACKED FrameMessage_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint32_t frame;
+} ATTRIBUTE_PACKED WriteFrameDirect_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint16_t frame_index;
+	uint32_t frame;
+} ATTRIBUTE_PACKED WriteFrameScheduled_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint16_t task_index_first;
+	uint16_t task_index_last;
+} ATTRIBUTE_PACKED ClearScheduleEntries_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint16_t task_index;
+	uint8_t job;
+	uint16_t frame_index;
+	uint8_t dwell_time;
+} ATTRIBUTE_PACKED SetScheduleEntry_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint16_t task_index;
+} ATTRIBUTE_PACKED GetScheduleEntry_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t job;
+	uint16_t frame_index;
+	uint32_t frame;
+	uint8_t dwell_time;
+} ATTRIBUTE_PACKED GetScheduleEntry_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t mode;
+} ATTRIBUTE_PACKED ResetA429_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetSPITFPErrorCount_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t error_count_ack_checksum;
+	uint32_t error_count_message_checksum;
+	uint32_t error_count_frame;
+	uint32_t error_count_overflow;
+} ATTRIBUTE_PACKED GetSPITFPErrorCount_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t mode;
+} ATTRIBUTE_PACKED SetBootloaderMode_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t status;
+} ATTRIBUTE_PACKED SetBootloaderMode_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetBootloaderMode_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t mode;
+} ATTRIBUTE_PACKED GetBootloaderMode_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t pointer;
+} ATTRIBUTE_PACKED SetWriteFirmwarePointer_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t data[64];
+} ATTRIBUTE_PACKED WriteFirmware_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t status;
+} ATTRIBUTE_PACKED WriteFirmware_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t config;
+} ATTRIBUTE_PACKED SetStatusLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetStatusLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t config;
+} ATTRIBUTE_PACKED GetStatusLEDConfig_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetChipTemperature_Request;
+
+typedef struct {
+	PacketHeader header;
+	int16_t temperature;
+} ATTRIBUTE_PACKED GetChipTemperature_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED Reset_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t uid;
+} ATTRIBUTE_PACKED WriteUID_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED ReadUID_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t uid;
+} ATTRIBUTE_PACKED ReadUID_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetIdentity_Request;
+
+typedef struct {
+	PacketHeader header;
+	char uid[8];
+	char connected_uid[8];
+	char position;
+	uint8_t hardware_version[3];
+	uint8_t firmware_version[3];
+	uint16_t device_identifier;
+} ATTRIBUTE_PACKED GetIdentity_Response;
+
+#if defined _MSC_VER || defined __BORLANDC__
+	#pragma pack(pop)
+#endif
+#undef ATTRIBUTE_PACKED
+
+static void arinc429_callback_wrapper_heartbeat(DevicePrivate *device_p, Packet *packet) {
+	Heartbeat_CallbackFunction callback_function;
+	void *user_data;
+	Heartbeat_Callback *callback;
+	int i;
+	uint16_t aligned_frames_processed[3];
+	uint16_t aligned_frames_lost[3];
+
+
+	if (packet->header.length != sizeof(Heartbeat_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (Heartbeat_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + ARINC429_CALLBACK_HEARTBEAT];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + ARINC429_CALLBACK_HEARTBEAT];
+	callback = (Heartbeat_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+	if (callback_function == NULL) {
+		return;
+	}
+
+	callback->timestamp = leconvert_uint16_from(callback->timestamp);
+	for (i = 0; i < 3; i++) aligned_frames_processed[i] = leconvert_uint16_from(callback->frames_processed[i]);
+	for (i = 0; i < 3; i++) aligned_frames_lost[i] = leconvert_uint16_from(callback->frames_lost[i]);
+
+	callback_function(callback->seq_number, callback->timestamp, aligned_frames_processed, aligned_frames_lost, user_data);
+}
+
+static void arinc429_callback_wrapper_frame_message(DevicePrivate *device_p, Packet *packet) {
+	FrameMessage_CallbackFunction callback_function;
+	void *user_data;
+	FrameMessage_Callback *callback;
+
+	if (packet->header.length != sizeof(FrameMessage_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (FrameMessage_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + ARINC429_CALLBACK_FRAME_MESSAGE];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + ARINC429_CALLBACK_FRAME_MESSAGE];
+	callback = (FrameMessage_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+	if (callback_function == NULL) {
+		return;
+	}
+
+	callback->timestamp = leconvert_uint16_from(callback->timestamp);
+	callback->frame = leconvert_uint32_from(callback->frame);
+	callback->age = leconvert_uint16_from(callback->age);
+
+	callback_function(callback->channel, callback->seq_number, callback->timestamp, callback->frame_status, callback->frame, callback->age, user_data);
+}
+
+void arinc429_create(ARINC429 *arinc429, const char *uid, IPConnection *ipcon) {
+	IPConnectionPrivate *ipcon_p = ipcon->p;
+	DevicePrivate *device_p;
+
+	device_create(arinc429, uid, ipcon_p, 2, 0, 0, ARINC429_DEVICE_IDENTIFIER);
+
+	device_p = arinc429->p;
+
+	device_p->response_expected[ARINC429_FUNCTION_DEBUG_GET_DISCRETES] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_DEBUG_READ_REGISTER_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_DEBUG_WRITE_REGISTER_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_CAPABILITIES] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_SET_HEARTBEAT_CALLBACK_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_HEARTBEAT_CALLBACK_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_SET_CHANNEL_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_CHANNEL_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_SET_CHANNEL_MODE] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_CHANNEL_MODE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_CLEAR_ALL_RX_FILTERS] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_CLEAR_RX_FILTER] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_SET_RX_STANDARD_FILTERS] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_SET_RX_FILTER] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_RX_FILTER] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_READ_FRAME] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_SET_RX_CALLBACK_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_RX_CALLBACK_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_WRITE_FRAME_DIRECT] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_WRITE_FRAME_SCHEDULED] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_CLEAR_SCHEDULE_ENTRIES] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_SET_SCHEDULE_ENTRY] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_SCHEDULE_ENTRY] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_RESET_A429] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_SPITFP_ERROR_COUNT] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_SET_BOOTLOADER_MODE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_BOOTLOADER_MODE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_SET_WRITE_FIRMWARE_POINTER] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_WRITE_FIRMWARE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_SET_STATUS_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_STATUS_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_CHIP_TEMPERATURE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_RESET] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_WRITE_UID] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[ARINC429_FUNCTION_READ_UID] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[ARINC429_FUNCTION_GET_IDENTITY] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+	device_p->callback_wrappers[ARINC429_CALLBACK_HEARTBEAT] = arinc429_callback_wrapper_heartbeat;
+	device_p->callback_wrappers[ARINC429_CALLBACK_FRAME_MESSAGE] = arinc429_callback_wrapper_frame_message;
+
+	ipcon_add_device(ipcon_p, device_p);
+}
+
+void arinc429_destroy(ARINC429 *arinc429) {
+	device_release(arinc429->p);
+}
+
+int arinc429_get_response_expected(ARINC429 *arinc429, uint8_t function_id, bool *ret_response_expected) {
+	return device_get_response_expected(arinc429->p, function_id, ret_response_expected);
+}
+
+int arinc429_set_response_expected(ARINC429 *arinc429, uint8_t function_id, bool response_expected) {
+	return device_set_response_expected(arinc429->p, function_id, response_expected);
+}
+
+int arinc429_set_response_expected_all(ARINC429 *arinc429, bool response_expected) {
+	return device_set_response_expected_all(arinc429->p, response_expected);
+}
+
+void arinc429_register_callback(ARINC429 *arinc429, int16_t callback_id, void (*function)(void), void *user_data) {
+	device_register_callback(arinc429->p, callback_id, function, user_data);
+}
+
+int arinc429_get_api_version(ARINC429 *arinc429, uint8_t ret_api_version[3]) {
+	return device_get_api_version(arinc429->p, ret_api_version);
+}
+
+int arinc429_debug_get_discretes(ARINC429 *arinc429, uint16_t *ret_rx_discretes, uint16_t *ret_tx_discretes) {
+	DevicePrivate *device_p = arinc429->p;
+	DebugGetDiscretes_Request request;
+	DebugGetDiscretes_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_DEBUG_GET_DISCRETES, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_rx_discretes = leconvert_uint16_from(response.rx_discretes);
+	*ret_tx_discretes = leconvert_uint16_from(response.tx_discretes);
+
+	return ret;
+}
+
+int arinc429_debug_read_register_low_level(ARINC429 *arinc429, uint8_t op_code, uint8_t *ret_value_length, uint8_t ret_value_data[32], uint8_t *ret_rw_error) {
+	DevicePrivate *device_p = arinc429->p;
+	DebugReadRegisterLowLevel_Request request;
+	DebugReadRegisterLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_DEBUG_READ_REGISTER_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.op_code = op_code;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_value_length = response.value_length;
+	memcpy(ret_value_data, response.value_data, 32 * sizeof(uint8_t));
+	*ret_rw_error = response.rw_error;
+
+	return ret;
+}
+
+int arinc429_debug_write_register_low_level(ARINC429 *arinc429, uint8_t op_code, uint8_t value_length, uint8_t value_data[32], uint8_t *ret_rw_error) {
+	DevicePrivate *device_p = arinc429->p;
+	DebugWriteRegisterLowLevel_Request request;
+	DebugWriteRegisterLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_DEBUG_WRITE_REGISTER_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.op_code = op_code;
+	request.value_length = value_length;
+	memcpy(request.value_data, value_data, 32 * sizeof(uint8_t));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_rw_error = response.rw_error;
+
+	return ret;
+}
+
+int arinc429_get_capabilities(ARINC429 *arinc429, uint16_t *ret_tx_total_scheduler_tasks, uint16_t *ret_tx_used_scheduler_tasks, uint16_t *ret_rx_total_frame_filters, uint16_t ret_rx_used_frame_filters[2]) {
+	DevicePrivate *device_p = arinc429->p;
+	GetCapabilities_Request request;
+	GetCapabilities_Response response;
+	int ret;
+	int i;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_CAPABILITIES, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_tx_total_scheduler_tasks = leconvert_uint16_from(response.tx_total_scheduler_tasks);
+	*ret_tx_used_scheduler_tasks = leconvert_uint16_from(response.tx_used_scheduler_tasks);
+	*ret_rx_total_frame_filters = leconvert_uint16_from(response.rx_total_frame_filters);
+	for (i = 0; i < 2; i++) ret_rx_used_frame_filters[i] = leconvert_uint16_from(response.rx_used_frame_filters[i]);
+
+	return ret;
+}
+
+int arinc429_set_heartbeat_callback_configuration(ARINC429 *arinc429, uint8_t period, bool value_has_to_change) {
+	DevicePrivate *device_p = arinc429->p;
+	SetHeartbeatCallbackConfiguration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_SET_HEARTBEAT_CALLBACK_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.period = period;
+	request.value_has_to_change = value_has_to_change ? 1 : 0;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_get_heartbeat_callback_configuration(ARINC429 *arinc429, uint8_t *ret_period, bool *ret_value_has_to_change) {
+	DevicePrivate *device_p = arinc429->p;
+	GetHeartbeatCallbackConfiguration_Request request;
+	GetHeartbeatCallbackConfiguration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_HEARTBEAT_CALLBACK_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_period = response.period;
+	*ret_value_has_to_change = response.value_has_to_change != 0;
+
+	return ret;
+}
+
+int arinc429_set_channel_configuration(ARINC429 *arinc429, uint8_t channel, uint8_t parity, uint8_t speed) {
+	DevicePrivate *device_p = arinc429->p;
+	SetChannelConfiguration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_SET_CHANNEL_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.parity = parity;
+	request.speed = speed;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_get_channel_configuration(ARINC429 *arinc429, uint8_t channel, uint8_t *ret_parity, uint8_t *ret_speed) {
+	DevicePrivate *device_p = arinc429->p;
+	GetChannelConfiguration_Request request;
+	GetChannelConfiguration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_CHANNEL_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_parity = response.parity;
+	*ret_speed = response.speed;
+
+	return ret;
+}
+
+int arinc429_set_channel_mode(ARINC429 *arinc429, uint8_t channel, uint8_t mode) {
+	DevicePrivate *device_p = arinc429->p;
+	SetChannelMode_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_SET_CHANNEL_MODE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.mode = mode;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_get_channel_mode(ARINC429 *arinc429, uint8_t channel, uint8_t *ret_mode) {
+	DevicePrivate *device_p = arinc429->p;
+	GetChannelMode_Request request;
+	GetChannelMode_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_CHANNEL_MODE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_mode = response.mode;
+
+	return ret;
+}
+
+int arinc429_clear_all_rx_filters(ARINC429 *arinc429, uint8_t channel) {
+	DevicePrivate *device_p = arinc429->p;
+	ClearAllRXFilters_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_CLEAR_ALL_RX_FILTERS, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_clear_rx_filter(ARINC429 *arinc429, uint8_t channel, uint8_t label, uint8_t sdi, bool *ret_success) {
+	DevicePrivate *device_p = arinc429->p;
+	ClearRXFilter_Request request;
+	ClearRXFilter_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_CLEAR_RX_FILTER, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.label = label;
+	request.sdi = sdi;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_success = response.success != 0;
+
+	return ret;
+}
+
+int arinc429_set_rx_standard_filters(ARINC429 *arinc429, uint8_t channel) {
+	DevicePrivate *device_p = arinc429->p;
+	SetRXStandardFilters_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_SET_RX_STANDARD_FILTERS, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_set_rx_filter(ARINC429 *arinc429, uint8_t channel, uint8_t label, uint8_t sdi, bool *ret_success) {
+	DevicePrivate *device_p = arinc429->p;
+	SetRXFilter_Request request;
+	SetRXFilter_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_SET_RX_FILTER, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.label = label;
+	request.sdi = sdi;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_success = response.success != 0;
+
+	return ret;
+}
+
+int arinc429_get_rx_filter(ARINC429 *arinc429, uint8_t channel, uint8_t label, uint8_t sdi, bool *ret_configured) {
+	DevicePrivate *device_p = arinc429->p;
+	GetRXFilter_Request request;
+	GetRXFilter_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_RX_FILTER, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.label = label;
+	request.sdi = sdi;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_configured = response.configured != 0;
+
+	return ret;
+}
+
+int arinc429_read_frame(ARINC429 *arinc429, uint8_t channel, uint8_t label, uint8_t sdi, bool *ret_status, uint32_t *ret_frame, uint16_t *ret_age) {
+	DevicePrivate *device_p = arinc429->p;
+	ReadFrame_Request request;
+	ReadFrame_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_READ_FRAME, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.label = label;
+	request.sdi = sdi;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_status = response.status != 0;
+	*ret_frame = leconvert_uint32_from(response.frame);
+	*ret_age = leconvert_uint16_from(response.age);
+
+	return ret;
+}
+
+int arinc429_set_rx_callback_configuration(ARINC429 *arinc429, uint8_t channel, bool enabled, bool value_has_to_change, uint16_t timeout) {
+	DevicePrivate *device_p = arinc429->p;
+	SetRXCallbackConfiguration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_SET_RX_CALLBACK_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.enabled = enabled ? 1 : 0;
+	request.value_has_to_change = value_has_to_change ? 1 : 0;
+	request.timeout = leconvert_uint16_to(timeout);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_get_rx_callback_configuration(ARINC429 *arinc429, uint8_t channel, bool *ret_enabled, bool *ret_value_has_to_change, uint16_t *ret_timeout) {
+	DevicePrivate *device_p = arinc429->p;
+	GetRXCallbackConfiguration_Request request;
+	GetRXCallbackConfiguration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_RX_CALLBACK_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_enabled = response.enabled != 0;
+	*ret_value_has_to_change = response.value_has_to_change != 0;
+	*ret_timeout = leconvert_uint16_from(response.timeout);
+
+	return ret;
+}
+
+int arinc429_write_frame_direct(ARINC429 *arinc429, uint8_t channel, uint32_t frame) {
+	DevicePrivate *device_p = arinc429->p;
+	WriteFrameDirect_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_WRITE_FRAME_DIRECT, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.frame = leconvert_uint32_to(frame);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_write_frame_scheduled(ARINC429 *arinc429, uint8_t channel, uint16_t frame_index, uint32_t frame) {
+	DevicePrivate *device_p = arinc429->p;
+	WriteFrameScheduled_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_WRITE_FRAME_SCHEDULED, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.frame_index = leconvert_uint16_to(frame_index);
+	request.frame = leconvert_uint32_to(frame);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_clear_schedule_entries(ARINC429 *arinc429, uint8_t channel, uint16_t task_index_first, uint16_t task_index_last) {
+	DevicePrivate *device_p = arinc429->p;
+	ClearScheduleEntries_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_CLEAR_SCHEDULE_ENTRIES, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.task_index_first = leconvert_uint16_to(task_index_first);
+	request.task_index_last = leconvert_uint16_to(task_index_last);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_set_schedule_entry(ARINC429 *arinc429, uint8_t channel, uint16_t task_index, uint8_t job, uint16_t frame_index, uint8_t dwell_time) {
+	DevicePrivate *device_p = arinc429->p;
+	SetScheduleEntry_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_SET_SCHEDULE_ENTRY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.task_index = leconvert_uint16_to(task_index);
+	request.job = job;
+	request.frame_index = leconvert_uint16_to(frame_index);
+	request.dwell_time = dwell_time;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_get_schedule_entry(ARINC429 *arinc429, uint8_t channel, uint16_t task_index, uint8_t *ret_job, uint16_t *ret_frame_index, uint32_t *ret_frame, uint8_t *ret_dwell_time) {
+	DevicePrivate *device_p = arinc429->p;
+	GetScheduleEntry_Request request;
+	GetScheduleEntry_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_SCHEDULE_ENTRY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.task_index = leconvert_uint16_to(task_index);
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_job = response.job;
+	*ret_frame_index = leconvert_uint16_from(response.frame_index);
+	*ret_frame = leconvert_uint32_from(response.frame);
+	*ret_dwell_time = response.dwell_time;
+
+	return ret;
+}
+
+int arinc429_reset_a429(ARINC429 *arinc429, uint8_t mode) {
+	DevicePrivate *device_p = arinc429->p;
+	ResetA429_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_RESET_A429, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.mode = mode;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_get_spitfp_error_count(ARINC429 *arinc429, uint32_t *ret_error_count_ack_checksum, uint32_t *ret_error_count_message_checksum, uint32_t *ret_error_count_frame, uint32_t *ret_error_count_overflow) {
+	DevicePrivate *device_p = arinc429->p;
+	GetSPITFPErrorCount_Request request;
+	GetSPITFPErrorCount_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_SPITFP_ERROR_COUNT, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_error_count_ack_checksum = leconvert_uint32_from(response.error_count_ack_checksum);
+	*ret_error_count_message_checksum = leconvert_uint32_from(response.error_count_message_checksum);
+	*ret_error_count_frame = leconvert_uint32_from(response.error_count_frame);
+	*ret_error_count_overflow = leconvert_uint32_from(response.error_count_overflow);
+
+	return ret;
+}
+
+int arinc429_set_bootloader_mode(ARINC429 *arinc429, uint8_t mode, uint8_t *ret_status) {
+	DevicePrivate *device_p = arinc429->p;
+	SetBootloaderMode_Request request;
+	SetBootloaderMode_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_SET_BOOTLOADER_MODE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.mode = mode;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_status = response.status;
+
+	return ret;
+}
+
+int arinc429_get_bootloader_mode(ARINC429 *arinc429, uint8_t *ret_mode) {
+	DevicePrivate *device_p = arinc429->p;
+	GetBootloaderMode_Request request;
+	GetBootloaderMode_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_BOOTLOADER_MODE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_mode = response.mode;
+
+	return ret;
+}
+
+int arinc429_set_write_firmware_pointer(ARINC429 *arinc429, uint32_t pointer) {
+	DevicePrivate *device_p = arinc429->p;
+	SetWriteFirmwarePointer_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_SET_WRITE_FIRMWARE_POINTER, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.pointer = leconvert_uint32_to(pointer);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_write_firmware(ARINC429 *arinc429, uint8_t data[64], uint8_t *ret_status) {
+	DevicePrivate *device_p = arinc429->p;
+	WriteFirmware_Request request;
+	WriteFirmware_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_WRITE_FIRMWARE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(request.data, data, 64 * sizeof(uint8_t));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_status = response.status;
+
+	return ret;
+}
+
+int arinc429_set_status_led_config(ARINC429 *arinc429, uint8_t config) {
+	DevicePrivate *device_p = arinc429->p;
+	SetStatusLEDConfig_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_SET_STATUS_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.config = config;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_get_status_led_config(ARINC429 *arinc429, uint8_t *ret_config) {
+	DevicePrivate *device_p = arinc429->p;
+	GetStatusLEDConfig_Request request;
+	GetStatusLEDConfig_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_STATUS_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_config = response.config;
+
+	return ret;
+}
+
+int arinc429_get_chip_temperature(ARINC429 *arinc429, int16_t *ret_temperature) {
+	DevicePrivate *device_p = arinc429->p;
+	GetChipTemperature_Request request;
+	GetChipTemperature_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_CHIP_TEMPERATURE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_temperature = leconvert_int16_from(response.temperature);
+
+	return ret;
+}
+
+int arinc429_reset(ARINC429 *arinc429) {
+	DevicePrivate *device_p = arinc429->p;
+	Reset_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_RESET, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_write_uid(ARINC429 *arinc429, uint32_t uid) {
+	DevicePrivate *device_p = arinc429->p;
+	WriteUID_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_WRITE_UID, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.uid = leconvert_uint32_to(uid);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int arinc429_read_uid(ARINC429 *arinc429, uint32_t *ret_uid) {
+	DevicePrivate *device_p = arinc429->p;
+	ReadUID_Request request;
+	ReadUID_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_READ_UID, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_uid = leconvert_uint32_from(response.uid);
+
+	return ret;
+}
+
+int arinc429_get_identity(ARINC429 *arinc429, char ret_uid[8], char ret_connected_uid[8], char *ret_position, uint8_t ret_hardware_version[3], uint8_t ret_firmware_version[3], uint16_t *ret_device_identifier) {
+	DevicePrivate *device_p = arinc429->p;
+	GetIdentity_Request request;
+	GetIdentity_Response response;
+	int ret;
+
+	ret = packet_header_create(&request.header, sizeof(request), ARINC429_FUNCTION_GET_IDENTITY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_uid, response.uid, 8);
+	memcpy(ret_connected_uid, response.connected_uid, 8);
+	*ret_position = response.position;
+	memcpy(ret_hardware_version, response.hardware_version, 3 * sizeof(uint8_t));
+	memcpy(ret_firmware_version, response.firmware_version, 3 * sizeof(uint8_t));
+	*ret_device_identifier = leconvert_uint16_from(response.device_identifier);
+
+	return ret;
+}
+
+int arinc429_debug_read_register(ARINC429 *arinc429, uint8_t op_code, uint8_t *ret_value, uint8_t *ret_value_length, uint8_t *ret_rw_error) {
+	int ret = 0;
+	uint8_t value_length;
+	uint8_t value_data[32];
+
+	*ret_value_length = 0;
+
+	ret = arinc429_debug_read_register_low_level(arinc429, op_code, &value_length, value_data, ret_rw_error);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_value, value_data, sizeof(uint8_t) * value_length);
+	memset(&value_data[value_length], 0, sizeof(uint8_t) * (32 - value_length));
+
+	*ret_value_length = value_length;
+
+	return ret;
+}
+
+int arinc429_debug_write_register(ARINC429 *arinc429, uint8_t op_code, uint8_t *value, uint8_t value_length, uint8_t *ret_rw_error) {
+	uint8_t value_data[32];
+
+	if (value_length > 32) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(value_data, value, sizeof(uint8_t) * value_length);
+	memset(&value_data[value_length], 0, sizeof(uint8_t) * (32 - value_length));
+
+	return arinc429_debug_write_register_low_level(arinc429, op_code, value_length, value_data, ret_rw_error);
+}
+
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,2296 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C/C++ Bindings Version 2.1.30                             *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+
+#define IPCON_EXPOSE_INTERNALS
+
+#include "bricklet_performance_stepper.h"
+
+#include <string.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+
+
+#if defined _MSC_VER || defined __BORLANDC__
+	#pragma pack(push)
+	#pragma pack(1)
+	#define ATTRIBUTE_PACKED
+#elif defined __GNUC__
+	#ifdef _WIN32
+		// workaround struct packing bug in GCC 4.7 on Windows
+		// https://gcc.gnu.org/bugzilla/show_bug.cgi?id=52991
+		#define ATTRIBUTE_PACKED __attribute__((gcc_struct, packed))
+	#else
+		#define ATTRIBUTE_PACKED __attribute__((packed))
+	#endif
+#else
+	#error unknown compiler, do not know how to enable struct packing
+#endif
+
+typedef struct {
+	PacketHeader header;
+	uint8_t ramping_mode;
+	int32_t velocity_start;
+	int32_t acceleration_1;
+	int32_t velocity_1;
+	int32_t acceleration_max;
+	int32_t velocity_max;
+	int32_t deceleration_max;
+	int32_t deceleration_1;
+	int32_t velocity_stop;
+	int32_t ramp_zero_wait;
+} ATTRIBUTE_PACKED SetMotionConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetMotionConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t ramping_mode;
+	int32_t velocity_start;
+	int32_t acceleration_1;
+	int32_t velocity_1;
+	int32_t acceleration_max;
+	int32_t velocity_max;
+	int32_t deceleration_max;
+	int32_t deceleration_1;
+	int32_t velocity_stop;
+	int32_t ramp_zero_wait;
+} ATTRIBUTE_PACKED GetMotionConfiguration_Response;
+
+typedef struct {
+	PacketHeader header;
+	int32_t position;
+} ATTRIBUTE_PACKED SetCurrentPosition_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetCurrentPosition_Request;
+
+typedef struct {
+	PacketHeader header;
+	int32_t position;
+} ATTRIBUTE_PACKED GetCurrentPosition_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetCurrentVelocity_Request;
+
+typedef struct {
+	PacketHeader header;
+	int32_t velocity;
+} ATTRIBUTE_PACKED GetCurrentVelocity_Response;
+
+typedef struct {
+	PacketHeader header;
+	int32_t position;
+} ATTRIBUTE_PACKED SetTargetPosition_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetTargetPosition_Request;
+
+typedef struct {
+	PacketHeader header;
+	int32_t position;
+} ATTRIBUTE_PACKED GetTargetPosition_Response;
+
+typedef struct {
+	PacketHeader header;
+	int32_t steps;
+} ATTRIBUTE_PACKED SetSteps_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetSteps_Request;
+
+typedef struct {
+	PacketHeader header;
+	int32_t steps;
+} ATTRIBUTE_PACKED GetSteps_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetRemainingSteps_Request;
+
+typedef struct {
+	PacketHeader header;
+	int32_t steps;
+} ATTRIBUTE_PACKED GetRemainingSteps_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t step_resolution;
+	uint8_t interpolation;
+} ATTRIBUTE_PACKED SetStepConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetStepConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t step_resolution;
+	uint8_t interpolation;
+} ATTRIBUTE_PACKED GetStepConfiguration_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t current;
+} ATTRIBUTE_PACKED SetMotorCurrent_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetMotorCurrent_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t current;
+} ATTRIBUTE_PACKED GetMotorCurrent_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t enabled;
+} ATTRIBUTE_PACKED SetEnabled_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetEnabled_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t enabled;
+} ATTRIBUTE_PACKED GetEnabled_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t standstill_current;
+	uint16_t motor_run_current;
+	uint16_t standstill_delay_time;
+	uint16_t power_down_time;
+	uint16_t stealth_threshold;
+	uint16_t coolstep_threshold;
+	uint16_t classic_threshold;
+	uint8_t high_velocity_chopper_mode;
+} ATTRIBUTE_PACKED SetBasicConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetBasicConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t standstill_current;
+	uint16_t motor_run_current;
+	uint16_t standstill_delay_time;
+	uint16_t power_down_time;
+	uint16_t stealth_threshold;
+	uint16_t coolstep_threshold;
+	uint16_t classic_threshold;
+	uint8_t high_velocity_chopper_mode;
+} ATTRIBUTE_PACKED GetBasicConfiguration_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t slow_decay_duration;
+	uint8_t high_velocity_fullstep;
+	uint8_t fast_decay_duration;
+	uint8_t hysteresis_start_value;
+	int8_t hysteresis_end_value;
+	int8_t sine_wave_offset;
+	uint8_t chopper_mode;
+	uint8_t comparator_blank_time;
+	uint8_t fast_decay_without_comparator;
+} ATTRIBUTE_PACKED SetSpreadcycleConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetSpreadcycleConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t slow_decay_duration;
+	uint8_t high_velocity_fullstep;
+	uint8_t enable_random_slow_decay;
+	uint8_t fast_decay_duration;
+	uint8_t hysteresis_start_value;
+	int8_t hysteresis_end_value;
+	int8_t sine_wave_offset;
+	uint8_t chopper_mode;
+	uint8_t comparator_blank_time;
+	uint8_t fast_decay_without_comparator;
+} ATTRIBUTE_PACKED GetSpreadcycleConfiguration_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t enable_stealth;
+	uint8_t offset;
+	uint8_t gradient;
+	uint8_t enable_autoscale;
+	uint8_t enable_autogradient;
+	uint8_t freewheel_mode;
+	uint8_t regulation_loop_gradient;
+	uint8_t amplitude_limit;
+} ATTRIBUTE_PACKED SetStealthConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetStealthConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t enable_stealth;
+	uint8_t offset;
+	uint8_t gradient;
+	uint8_t enable_autoscale;
+	uint8_t enable_autogradient;
+	uint8_t freewheel_mode;
+	uint8_t regulation_loop_gradient;
+	uint8_t amplitude_limit;
+} ATTRIBUTE_PACKED GetStealthConfiguration_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t minimum_stallguard_value;
+	uint8_t maximum_stallguard_value;
+	uint8_t current_up_step_width;
+	uint8_t current_down_step_width;
+	uint8_t minimum_current;
+	int8_t stallguard_threshold_value;
+	uint8_t stallguard_mode;
+} ATTRIBUTE_PACKED SetCoolstepConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetCoolstepConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t minimum_stallguard_value;
+	uint8_t maximum_stallguard_value;
+	uint8_t current_up_step_width;
+	uint8_t current_down_step_width;
+	uint8_t minimum_current;
+	int8_t stallguard_threshold_value;
+	uint8_t stallguard_mode;
+} ATTRIBUTE_PACKED GetCoolstepConfiguration_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t disable_short_to_voltage_protection;
+	uint8_t disable_short_to_ground_protection;
+	uint8_t short_to_voltage_level;
+	uint8_t short_to_ground_level;
+	uint8_t spike_filter_bandwidth;
+	uint8_t short_detection_delay;
+	uint8_t filter_time;
+} ATTRIBUTE_PACKED SetShortConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetShortConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t disable_short_to_voltage_protection;
+	uint8_t disable_short_to_ground_protection;
+	uint8_t short_to_voltage_level;
+	uint8_t short_to_ground_level;
+	uint8_t spike_filter_bandwidth;
+	uint8_t short_detection_delay;
+	uint8_t filter_time;
+} ATTRIBUTE_PACKED GetShortConfiguration_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetDriverStatus_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t open_load;
+	uint8_t short_to_ground;
+	uint8_t over_temperature;
+	uint8_t motor_stalled;
+	uint8_t actual_motor_current;
+	uint8_t full_step_active;
+	uint8_t stallguard_result;
+	uint8_t stealth_voltage_amplitude;
+} ATTRIBUTE_PACKED GetDriverStatus_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetInputVoltage_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t voltage;
+} ATTRIBUTE_PACKED GetInputVoltage_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetTemperature_Request;
+
+typedef struct {
+	PacketHeader header;
+	int16_t temperature;
+} ATTRIBUTE_PACKED GetTemperature_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t debounce;
+	int32_t stop_deceleration;
+} ATTRIBUTE_PACKED SetGPIOConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetGPIOConfiguration_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t debounce;
+	int32_t stop_deceleration;
+} ATTRIBUTE_PACKED GetGPIOConfiguration_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint32_t action;
+} ATTRIBUTE_PACKED SetGPIOAction_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+} ATTRIBUTE_PACKED GetGPIOAction_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t action;
+} ATTRIBUTE_PACKED GetGPIOAction_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetGPIOState_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t gpio_state[1];
+} ATTRIBUTE_PACKED GetGPIOState_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t config;
+} ATTRIBUTE_PACKED SetErrorLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetErrorLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t config;
+} ATTRIBUTE_PACKED GetErrorLEDConfig_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t config;
+} ATTRIBUTE_PACKED SetEnableLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetEnableLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t config;
+} ATTRIBUTE_PACKED GetEnableLEDConfig_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t config;
+} ATTRIBUTE_PACKED SetStepsLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetStepsLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t config;
+} ATTRIBUTE_PACKED GetStepsLEDConfig_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+	uint8_t config;
+} ATTRIBUTE_PACKED SetGPIOLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+} ATTRIBUTE_PACKED GetGPIOLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t config;
+} ATTRIBUTE_PACKED GetGPIOLEDConfig_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t register;
+	uint32_t value;
+} ATTRIBUTE_PACKED WriteRegister_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t status;
+} ATTRIBUTE_PACKED WriteRegister_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t register;
+} ATTRIBUTE_PACKED ReadRegister_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t status;
+	uint32_t value;
+} ATTRIBUTE_PACKED ReadRegister_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetSPITFPErrorCount_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t error_count_ack_checksum;
+	uint32_t error_count_message_checksum;
+	uint32_t error_count_frame;
+	uint32_t error_count_overflow;
+} ATTRIBUTE_PACKED GetSPITFPErrorCount_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t mode;
+} ATTRIBUTE_PACKED SetBootloaderMode_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t status;
+} ATTRIBUTE_PACKED SetBootloaderMode_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetBootloaderMode_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t mode;
+} ATTRIBUTE_PACKED GetBootloaderMode_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t pointer;
+} ATTRIBUTE_PACKED SetWriteFirmwarePointer_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t data[64];
+} ATTRIBUTE_PACKED WriteFirmware_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t status;
+} ATTRIBUTE_PACKED WriteFirmware_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t config;
+} ATTRIBUTE_PACKED SetStatusLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetStatusLEDConfig_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t config;
+} ATTRIBUTE_PACKED GetStatusLEDConfig_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetChipTemperature_Request;
+
+typedef struct {
+	PacketHeader header;
+	int16_t temperature;
+} ATTRIBUTE_PACKED GetChipTemperature_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED Reset_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t uid;
+} ATTRIBUTE_PACKED WriteUID_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED ReadUID_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t uid;
+} ATTRIBUTE_PACKED ReadUID_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetIdentity_Request;
+
+typedef struct {
+	PacketHeader header;
+	char uid[8];
+	char connected_uid[8];
+	char position;
+	uint8_t hardware_version[3];
+	uint8_t firmware_version[3];
+	uint16_t device_identifier;
+} ATTRIBUTE_PACKED GetIdentity_Response;
+
+#if defined _MSC_VER || defined __BORLANDC__
+	#pragma pack(pop)
+#endif
+#undef ATTRIBUTE_PACKED
+
+void performance_stepper_create(PerformanceStepper *performance_stepper, const char *uid, IPConnection *ipcon) {
+	IPConnectionPrivate *ipcon_p = ipcon->p;
+	DevicePrivate *device_p;
+
+	device_create(performance_stepper, uid, ipcon_p, 2, 0, 0, PERFORMANCE_STEPPER_DEVICE_IDENTIFIER);
+
+	device_p = performance_stepper->p;
+
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_MOTION_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_MOTION_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_CURRENT_POSITION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_CURRENT_POSITION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_CURRENT_VELOCITY] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_TARGET_POSITION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_TARGET_POSITION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_STEPS] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_STEPS] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_REMAINING_STEPS] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_STEP_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_STEP_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_MOTOR_CURRENT] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_MOTOR_CURRENT] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_ENABLED] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_ENABLED] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_BASIC_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_BASIC_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_SPREADCYCLE_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_SPREADCYCLE_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_STEALTH_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_STEALTH_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_COOLSTEP_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_COOLSTEP_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_SHORT_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_SHORT_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_DRIVER_STATUS] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_INPUT_VOLTAGE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_TEMPERATURE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_CONFIGURATION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_ACTION] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_ACTION] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_STATE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_ERROR_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_ERROR_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_ENABLE_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_ENABLE_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_STEPS_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_STEPS_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_WRITE_REGISTER] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_READ_REGISTER] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_SPITFP_ERROR_COUNT] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_BOOTLOADER_MODE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_BOOTLOADER_MODE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_WRITE_FIRMWARE_POINTER] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_WRITE_FIRMWARE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_SET_STATUS_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_STATUS_LED_CONFIG] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_CHIP_TEMPERATURE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_RESET] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_WRITE_UID] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_READ_UID] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[PERFORMANCE_STEPPER_FUNCTION_GET_IDENTITY] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+	ipcon_add_device(ipcon_p, device_p);
+}
+
+void performance_stepper_destroy(PerformanceStepper *performance_stepper) {
+	device_release(performance_stepper->p);
+}
+
+int performance_stepper_get_response_expected(PerformanceStepper *performance_stepper, uint8_t function_id, bool *ret_response_expected) {
+	return device_get_response_expected(performance_stepper->p, function_id, ret_response_expected);
+}
+
+int performance_stepper_set_response_expected(PerformanceStepper *performance_stepper, uint8_t function_id, bool response_expected) {
+	return device_set_response_expected(performance_stepper->p, function_id, response_expected);
+}
+
+int performance_stepper_set_response_expected_all(PerformanceStepper *performance_stepper, bool response_expected) {
+	return device_set_response_expected_all(performance_stepper->p, response_expected);
+}
+
+
+int performance_stepper_get_api_version(PerformanceStepper *performance_stepper, uint8_t ret_api_version[3]) {
+	return device_get_api_version(performance_stepper->p, ret_api_version);
+}
+
+int performance_stepper_set_motion_configuration(PerformanceStepper *performance_stepper, uint8_t ramping_mode, int32_t velocity_start, int32_t acceleration_1, int32_t velocity_1, int32_t acceleration_max, int32_t velocity_max, int32_t deceleration_max, int32_t deceleration_1, int32_t velocity_stop, int32_t ramp_zero_wait) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetMotionConfiguration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_MOTION_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.ramping_mode = ramping_mode;
+	request.velocity_start = leconvert_int32_to(velocity_start);
+	request.acceleration_1 = leconvert_int32_to(acceleration_1);
+	request.velocity_1 = leconvert_int32_to(velocity_1);
+	request.acceleration_max = leconvert_int32_to(acceleration_max);
+	request.velocity_max = leconvert_int32_to(velocity_max);
+	request.deceleration_max = leconvert_int32_to(deceleration_max);
+	request.deceleration_1 = leconvert_int32_to(deceleration_1);
+	request.velocity_stop = leconvert_int32_to(velocity_stop);
+	request.ramp_zero_wait = leconvert_int32_to(ramp_zero_wait);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_motion_configuration(PerformanceStepper *performance_stepper, uint8_t *ret_ramping_mode, int32_t *ret_velocity_start, int32_t *ret_acceleration_1, int32_t *ret_velocity_1, int32_t *ret_acceleration_max, int32_t *ret_velocity_max, int32_t *ret_deceleration_max, int32_t *ret_deceleration_1, int32_t *ret_velocity_stop, int32_t *ret_ramp_zero_wait) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetMotionConfiguration_Request request;
+	GetMotionConfiguration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_MOTION_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_ramping_mode = response.ramping_mode;
+	*ret_velocity_start = leconvert_int32_from(response.velocity_start);
+	*ret_acceleration_1 = leconvert_int32_from(response.acceleration_1);
+	*ret_velocity_1 = leconvert_int32_from(response.velocity_1);
+	*ret_acceleration_max = leconvert_int32_from(response.acceleration_max);
+	*ret_velocity_max = leconvert_int32_from(response.velocity_max);
+	*ret_deceleration_max = leconvert_int32_from(response.deceleration_max);
+	*ret_deceleration_1 = leconvert_int32_from(response.deceleration_1);
+	*ret_velocity_stop = leconvert_int32_from(response.velocity_stop);
+	*ret_ramp_zero_wait = leconvert_int32_from(response.ramp_zero_wait);
+
+	return ret;
+}
+
+int performance_stepper_set_current_position(PerformanceStepper *performance_stepper, int32_t position) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetCurrentPosition_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_CURRENT_POSITION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.position = leconvert_int32_to(position);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_current_position(PerformanceStepper *performance_stepper, int32_t *ret_position) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetCurrentPosition_Request request;
+	GetCurrentPosition_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_CURRENT_POSITION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_position = leconvert_int32_from(response.position);
+
+	return ret;
+}
+
+int performance_stepper_get_current_velocity(PerformanceStepper *performance_stepper, int32_t *ret_velocity) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetCurrentVelocity_Request request;
+	GetCurrentVelocity_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_CURRENT_VELOCITY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_velocity = leconvert_int32_from(response.velocity);
+
+	return ret;
+}
+
+int performance_stepper_set_target_position(PerformanceStepper *performance_stepper, int32_t position) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetTargetPosition_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_TARGET_POSITION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.position = leconvert_int32_to(position);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_target_position(PerformanceStepper *performance_stepper, int32_t *ret_position) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetTargetPosition_Request request;
+	GetTargetPosition_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_TARGET_POSITION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_position = leconvert_int32_from(response.position);
+
+	return ret;
+}
+
+int performance_stepper_set_steps(PerformanceStepper *performance_stepper, int32_t steps) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetSteps_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_STEPS, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.steps = leconvert_int32_to(steps);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_steps(PerformanceStepper *performance_stepper, int32_t *ret_steps) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetSteps_Request request;
+	GetSteps_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_STEPS, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_steps = leconvert_int32_from(response.steps);
+
+	return ret;
+}
+
+int performance_stepper_get_remaining_steps(PerformanceStepper *performance_stepper, int32_t *ret_steps) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetRemainingSteps_Request request;
+	GetRemainingSteps_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_REMAINING_STEPS, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_steps = leconvert_int32_from(response.steps);
+
+	return ret;
+}
+
+int performance_stepper_set_step_configuration(PerformanceStepper *performance_stepper, uint8_t step_resolution, bool interpolation) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetStepConfiguration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_STEP_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.step_resolution = step_resolution;
+	request.interpolation = interpolation ? 1 : 0;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_step_configuration(PerformanceStepper *performance_stepper, uint8_t *ret_step_resolution, bool *ret_interpolation) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetStepConfiguration_Request request;
+	GetStepConfiguration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_STEP_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_step_resolution = response.step_resolution;
+	*ret_interpolation = response.interpolation != 0;
+
+	return ret;
+}
+
+int performance_stepper_set_motor_current(PerformanceStepper *performance_stepper, uint16_t current) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetMotorCurrent_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_MOTOR_CURRENT, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.current = leconvert_uint16_to(current);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_motor_current(PerformanceStepper *performance_stepper, uint16_t *ret_current) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetMotorCurrent_Request request;
+	GetMotorCurrent_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_MOTOR_CURRENT, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_current = leconvert_uint16_from(response.current);
+
+	return ret;
+}
+
+int performance_stepper_set_enabled(PerformanceStepper *performance_stepper, bool enabled) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetEnabled_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_ENABLED, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.enabled = enabled ? 1 : 0;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_enabled(PerformanceStepper *performance_stepper, bool *ret_enabled) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetEnabled_Request request;
+	GetEnabled_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_ENABLED, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_enabled = response.enabled != 0;
+
+	return ret;
+}
+
+int performance_stepper_set_basic_configuration(PerformanceStepper *performance_stepper, uint16_t standstill_current, uint16_t motor_run_current, uint16_t standstill_delay_time, uint16_t power_down_time, uint16_t stealth_threshold, uint16_t coolstep_threshold, uint16_t classic_threshold, bool high_velocity_chopper_mode) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetBasicConfiguration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_BASIC_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.standstill_current = leconvert_uint16_to(standstill_current);
+	request.motor_run_current = leconvert_uint16_to(motor_run_current);
+	request.standstill_delay_time = leconvert_uint16_to(standstill_delay_time);
+	request.power_down_time = leconvert_uint16_to(power_down_time);
+	request.stealth_threshold = leconvert_uint16_to(stealth_threshold);
+	request.coolstep_threshold = leconvert_uint16_to(coolstep_threshold);
+	request.classic_threshold = leconvert_uint16_to(classic_threshold);
+	request.high_velocity_chopper_mode = high_velocity_chopper_mode ? 1 : 0;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_basic_configuration(PerformanceStepper *performance_stepper, uint16_t *ret_standstill_current, uint16_t *ret_motor_run_current, uint16_t *ret_standstill_delay_time, uint16_t *ret_power_down_time, uint16_t *ret_stealth_threshold, uint16_t *ret_coolstep_threshold, uint16_t *ret_classic_threshold, bool *ret_high_velocity_chopper_mode) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetBasicConfiguration_Request request;
+	GetBasicConfiguration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_BASIC_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_standstill_current = leconvert_uint16_from(response.standstill_current);
+	*ret_motor_run_current = leconvert_uint16_from(response.motor_run_current);
+	*ret_standstill_delay_time = leconvert_uint16_from(response.standstill_delay_time);
+	*ret_power_down_time = leconvert_uint16_from(response.power_down_time);
+	*ret_stealth_threshold = leconvert_uint16_from(response.stealth_threshold);
+	*ret_coolstep_threshold = leconvert_uint16_from(response.coolstep_threshold);
+	*ret_classic_threshold = leconvert_uint16_from(response.classic_threshold);
+	*ret_high_velocity_chopper_mode = response.high_velocity_chopper_mode != 0;
+
+	return ret;
+}
+
+int performance_stepper_set_spreadcycle_configuration(PerformanceStepper *performance_stepper, uint8_t slow_decay_duration, bool high_velocity_fullstep, uint8_t fast_decay_duration, uint8_t hysteresis_start_value, int8_t hysteresis_end_value, int8_t sine_wave_offset, uint8_t chopper_mode, uint8_t comparator_blank_time, bool fast_decay_without_comparator) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetSpreadcycleConfiguration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_SPREADCYCLE_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.slow_decay_duration = slow_decay_duration;
+	request.high_velocity_fullstep = high_velocity_fullstep ? 1 : 0;
+	request.fast_decay_duration = fast_decay_duration;
+	request.hysteresis_start_value = hysteresis_start_value;
+	request.hysteresis_end_value = hysteresis_end_value;
+	request.sine_wave_offset = sine_wave_offset;
+	request.chopper_mode = chopper_mode;
+	request.comparator_blank_time = comparator_blank_time;
+	request.fast_decay_without_comparator = fast_decay_without_comparator ? 1 : 0;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_spreadcycle_configuration(PerformanceStepper *performance_stepper, uint8_t *ret_slow_decay_duration, bool *ret_high_velocity_fullstep, bool *ret_enable_random_slow_decay, uint8_t *ret_fast_decay_duration, uint8_t *ret_hysteresis_start_value, int8_t *ret_hysteresis_end_value, int8_t *ret_sine_wave_offset, uint8_t *ret_chopper_mode, uint8_t *ret_comparator_blank_time, bool *ret_fast_decay_without_comparator) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetSpreadcycleConfiguration_Request request;
+	GetSpreadcycleConfiguration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_SPREADCYCLE_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_slow_decay_duration = response.slow_decay_duration;
+	*ret_high_velocity_fullstep = response.high_velocity_fullstep != 0;
+	*ret_enable_random_slow_decay = response.enable_random_slow_decay != 0;
+	*ret_fast_decay_duration = response.fast_decay_duration;
+	*ret_hysteresis_start_value = response.hysteresis_start_value;
+	*ret_hysteresis_end_value = response.hysteresis_end_value;
+	*ret_sine_wave_offset = response.sine_wave_offset;
+	*ret_chopper_mode = response.chopper_mode;
+	*ret_comparator_blank_time = response.comparator_blank_time;
+	*ret_fast_decay_without_comparator = response.fast_decay_without_comparator != 0;
+
+	return ret;
+}
+
+int performance_stepper_set_stealth_configuration(PerformanceStepper *performance_stepper, bool enable_stealth, uint8_t offset, uint8_t gradient, bool enable_autoscale, bool enable_autogradient, uint8_t freewheel_mode, uint8_t regulation_loop_gradient, uint8_t amplitude_limit) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetStealthConfiguration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_STEALTH_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.enable_stealth = enable_stealth ? 1 : 0;
+	request.offset = offset;
+	request.gradient = gradient;
+	request.enable_autoscale = enable_autoscale ? 1 : 0;
+	request.enable_autogradient = enable_autogradient ? 1 : 0;
+	request.freewheel_mode = freewheel_mode;
+	request.regulation_loop_gradient = regulation_loop_gradient;
+	request.amplitude_limit = amplitude_limit;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_stealth_configuration(PerformanceStepper *performance_stepper, bool *ret_enable_stealth, uint8_t *ret_offset, uint8_t *ret_gradient, bool *ret_enable_autoscale, bool *ret_enable_autogradient, uint8_t *ret_freewheel_mode, uint8_t *ret_regulation_loop_gradient, uint8_t *ret_amplitude_limit) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetStealthConfiguration_Request request;
+	GetStealthConfiguration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_STEALTH_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_enable_stealth = response.enable_stealth != 0;
+	*ret_offset = response.offset;
+	*ret_gradient = response.gradient;
+	*ret_enable_autoscale = response.enable_autoscale != 0;
+	*ret_enable_autogradient = response.enable_autogradient != 0;
+	*ret_freewheel_mode = response.freewheel_mode;
+	*ret_regulation_loop_gradient = response.regulation_loop_gradient;
+	*ret_amplitude_limit = response.amplitude_limit;
+
+	return ret;
+}
+
+int performance_stepper_set_coolstep_configuration(PerformanceStepper *performance_stepper, uint8_t minimum_stallguard_value, uint8_t maximum_stallguard_value, uint8_t current_up_step_width, uint8_t current_down_step_width, uint8_t minimum_current, int8_t stallguard_threshold_value, uint8_t stallguard_mode) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetCoolstepConfiguration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_COOLSTEP_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.minimum_stallguard_value = minimum_stallguard_value;
+	request.maximum_stallguard_value = maximum_stallguard_value;
+	request.current_up_step_width = current_up_step_width;
+	request.current_down_step_width = current_down_step_width;
+	request.minimum_current = minimum_current;
+	request.stallguard_threshold_value = stallguard_threshold_value;
+	request.stallguard_mode = stallguard_mode;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_coolstep_configuration(PerformanceStepper *performance_stepper, uint8_t *ret_minimum_stallguard_value, uint8_t *ret_maximum_stallguard_value, uint8_t *ret_current_up_step_width, uint8_t *ret_current_down_step_width, uint8_t *ret_minimum_current, int8_t *ret_stallguard_threshold_value, uint8_t *ret_stallguard_mode) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetCoolstepConfiguration_Request request;
+	GetCoolstepConfiguration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_COOLSTEP_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_minimum_stallguard_value = response.minimum_stallguard_value;
+	*ret_maximum_stallguard_value = response.maximum_stallguard_value;
+	*ret_current_up_step_width = response.current_up_step_width;
+	*ret_current_down_step_width = response.current_down_step_width;
+	*ret_minimum_current = response.minimum_current;
+	*ret_stallguard_threshold_value = response.stallguard_threshold_value;
+	*ret_stallguard_mode = response.stallguard_mode;
+
+	return ret;
+}
+
+int performance_stepper_set_short_configuration(PerformanceStepper *performance_stepper, bool disable_short_to_voltage_protection, bool disable_short_to_ground_protection, uint8_t short_to_voltage_level, uint8_t short_to_ground_level, uint8_t spike_filter_bandwidth, bool short_detection_delay, uint8_t filter_time) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetShortConfiguration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_SHORT_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.disable_short_to_voltage_protection = disable_short_to_voltage_protection ? 1 : 0;
+	request.disable_short_to_ground_protection = disable_short_to_ground_protection ? 1 : 0;
+	request.short_to_voltage_level = short_to_voltage_level;
+	request.short_to_ground_level = short_to_ground_level;
+	request.spike_filter_bandwidth = spike_filter_bandwidth;
+	request.short_detection_delay = short_detection_delay ? 1 : 0;
+	request.filter_time = filter_time;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_short_configuration(PerformanceStepper *performance_stepper, bool *ret_disable_short_to_voltage_protection, bool *ret_disable_short_to_ground_protection, uint8_t *ret_short_to_voltage_level, uint8_t *ret_short_to_ground_level, uint8_t *ret_spike_filter_bandwidth, bool *ret_short_detection_delay, uint8_t *ret_filter_time) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetShortConfiguration_Request request;
+	GetShortConfiguration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_SHORT_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_disable_short_to_voltage_protection = response.disable_short_to_voltage_protection != 0;
+	*ret_disable_short_to_ground_protection = response.disable_short_to_ground_protection != 0;
+	*ret_short_to_voltage_level = response.short_to_voltage_level;
+	*ret_short_to_ground_level = response.short_to_ground_level;
+	*ret_spike_filter_bandwidth = response.spike_filter_bandwidth;
+	*ret_short_detection_delay = response.short_detection_delay != 0;
+	*ret_filter_time = response.filter_time;
+
+	return ret;
+}
+
+int performance_stepper_get_driver_status(PerformanceStepper *performance_stepper, uint8_t *ret_open_load, uint8_t *ret_short_to_ground, uint8_t *ret_over_temperature, bool *ret_motor_stalled, uint8_t *ret_actual_motor_current, bool *ret_full_step_active, uint8_t *ret_stallguard_result, uint8_t *ret_stealth_voltage_amplitude) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetDriverStatus_Request request;
+	GetDriverStatus_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_DRIVER_STATUS, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_open_load = response.open_load;
+	*ret_short_to_ground = response.short_to_ground;
+	*ret_over_temperature = response.over_temperature;
+	*ret_motor_stalled = response.motor_stalled != 0;
+	*ret_actual_motor_current = response.actual_motor_current;
+	*ret_full_step_active = response.full_step_active != 0;
+	*ret_stallguard_result = response.stallguard_result;
+	*ret_stealth_voltage_amplitude = response.stealth_voltage_amplitude;
+
+	return ret;
+}
+
+int performance_stepper_get_input_voltage(PerformanceStepper *performance_stepper, uint16_t *ret_voltage) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetInputVoltage_Request request;
+	GetInputVoltage_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_INPUT_VOLTAGE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_voltage = leconvert_uint16_from(response.voltage);
+
+	return ret;
+}
+
+int performance_stepper_get_temperature(PerformanceStepper *performance_stepper, int16_t *ret_temperature) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetTemperature_Request request;
+	GetTemperature_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_TEMPERATURE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_temperature = leconvert_int16_from(response.temperature);
+
+	return ret;
+}
+
+int performance_stepper_set_gpio_configuration(PerformanceStepper *performance_stepper, uint16_t debounce, int32_t stop_deceleration) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetGPIOConfiguration_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.debounce = leconvert_uint16_to(debounce);
+	request.stop_deceleration = leconvert_int32_to(stop_deceleration);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_gpio_configuration(PerformanceStepper *performance_stepper, uint16_t *ret_debounce, int32_t *ret_stop_deceleration) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetGPIOConfiguration_Request request;
+	GetGPIOConfiguration_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_CONFIGURATION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_debounce = leconvert_uint16_from(response.debounce);
+	*ret_stop_deceleration = leconvert_int32_from(response.stop_deceleration);
+
+	return ret;
+}
+
+int performance_stepper_set_gpio_action(PerformanceStepper *performance_stepper, uint8_t channel, uint32_t action) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetGPIOAction_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_ACTION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.action = leconvert_uint32_to(action);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_gpio_action(PerformanceStepper *performance_stepper, uint8_t channel, uint32_t *ret_action) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetGPIOAction_Request request;
+	GetGPIOAction_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_ACTION, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_action = leconvert_uint32_from(response.action);
+
+	return ret;
+}
+
+int performance_stepper_get_gpio_state(PerformanceStepper *performance_stepper, bool ret_gpio_state[2]) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetGPIOState_Request request;
+	GetGPIOState_Response response;
+	int ret;
+	int i;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_STATE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	for (i = 0; i < 2; i++) ret_gpio_state[i] = (response.gpio_state[i / 8] & (1 << (i % 8))) != 0;
+
+	return ret;
+}
+
+int performance_stepper_set_error_led_config(PerformanceStepper *performance_stepper, uint8_t config) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetErrorLEDConfig_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_ERROR_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.config = config;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_error_led_config(PerformanceStepper *performance_stepper, uint8_t *ret_config) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetErrorLEDConfig_Request request;
+	GetErrorLEDConfig_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_ERROR_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_config = response.config;
+
+	return ret;
+}
+
+int performance_stepper_set_enable_led_config(PerformanceStepper *performance_stepper, uint8_t config) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetEnableLEDConfig_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_ENABLE_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.config = config;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_enable_led_config(PerformanceStepper *performance_stepper, uint8_t *ret_config) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetEnableLEDConfig_Request request;
+	GetEnableLEDConfig_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_ENABLE_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_config = response.config;
+
+	return ret;
+}
+
+int performance_stepper_set_steps_led_config(PerformanceStepper *performance_stepper, uint8_t config) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetStepsLEDConfig_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_STEPS_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.config = config;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_steps_led_config(PerformanceStepper *performance_stepper, uint8_t *ret_config) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetStepsLEDConfig_Request request;
+	GetStepsLEDConfig_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_STEPS_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_config = response.config;
+
+	return ret;
+}
+
+int performance_stepper_set_gpio_led_config(PerformanceStepper *performance_stepper, uint8_t channel, uint8_t config) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetGPIOLEDConfig_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+	request.config = config;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_gpio_led_config(PerformanceStepper *performance_stepper, uint8_t channel, uint8_t *ret_config) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetGPIOLEDConfig_Request request;
+	GetGPIOLEDConfig_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_config = response.config;
+
+	return ret;
+}
+
+int performance_stepper_write_register(PerformanceStepper *performance_stepper, uint8_t register, uint32_t value, uint8_t *ret_status) {
+	DevicePrivate *device_p = performance_stepper->p;
+	WriteRegister_Request request;
+	WriteRegister_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_WRITE_REGISTER, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.register = register;
+	request.value = leconvert_uint32_to(value);
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_status = response.status;
+
+	return ret;
+}
+
+int performance_stepper_read_register(PerformanceStepper *performance_stepper, uint8_t register, uint8_t *ret_status, uint32_t *ret_value) {
+	DevicePrivate *device_p = performance_stepper->p;
+	ReadRegister_Request request;
+	ReadRegister_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_READ_REGISTER, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.register = register;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_status = response.status;
+	*ret_value = leconvert_uint32_from(response.value);
+
+	return ret;
+}
+
+int performance_stepper_get_spitfp_error_count(PerformanceStepper *performance_stepper, uint32_t *ret_error_count_ack_checksum, uint32_t *ret_error_count_message_checksum, uint32_t *ret_error_count_frame, uint32_t *ret_error_count_overflow) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetSPITFPErrorCount_Request request;
+	GetSPITFPErrorCount_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_SPITFP_ERROR_COUNT, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_error_count_ack_checksum = leconvert_uint32_from(response.error_count_ack_checksum);
+	*ret_error_count_message_checksum = leconvert_uint32_from(response.error_count_message_checksum);
+	*ret_error_count_frame = leconvert_uint32_from(response.error_count_frame);
+	*ret_error_count_overflow = leconvert_uint32_from(response.error_count_overflow);
+
+	return ret;
+}
+
+int performance_stepper_set_bootloader_mode(PerformanceStepper *performance_stepper, uint8_t mode, uint8_t *ret_status) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetBootloaderMode_Request request;
+	SetBootloaderMode_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_BOOTLOADER_MODE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.mode = mode;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_status = response.status;
+
+	return ret;
+}
+
+int performance_stepper_get_bootloader_mode(PerformanceStepper *performance_stepper, uint8_t *ret_mode) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetBootloaderMode_Request request;
+	GetBootloaderMode_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_BOOTLOADER_MODE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_mode = response.mode;
+
+	return ret;
+}
+
+int performance_stepper_set_write_firmware_pointer(PerformanceStepper *performance_stepper, uint32_t pointer) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetWriteFirmwarePointer_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_WRITE_FIRMWARE_POINTER, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.pointer = leconvert_uint32_to(pointer);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_write_firmware(PerformanceStepper *performance_stepper, uint8_t data[64], uint8_t *ret_status) {
+	DevicePrivate *device_p = performance_stepper->p;
+	WriteFirmware_Request request;
+	WriteFirmware_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_WRITE_FIRMWARE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(request.data, data, 64 * sizeof(uint8_t));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_status = response.status;
+
+	return ret;
+}
+
+int performance_stepper_set_status_led_config(PerformanceStepper *performance_stepper, uint8_t config) {
+	DevicePrivate *device_p = performance_stepper->p;
+	SetStatusLEDConfig_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_SET_STATUS_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.config = config;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_get_status_led_config(PerformanceStepper *performance_stepper, uint8_t *ret_config) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetStatusLEDConfig_Request request;
+	GetStatusLEDConfig_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_STATUS_LED_CONFIG, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_config = response.config;
+
+	return ret;
+}
+
+int performance_stepper_get_chip_temperature(PerformanceStepper *performance_stepper, int16_t *ret_temperature) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetChipTemperature_Request request;
+	GetChipTemperature_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_CHIP_TEMPERATURE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_temperature = leconvert_int16_from(response.temperature);
+
+	return ret;
+}
+
+int performance_stepper_reset(PerformanceStepper *performance_stepper) {
+	DevicePrivate *device_p = performance_stepper->p;
+	Reset_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_RESET, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_write_uid(PerformanceStepper *performance_stepper, uint32_t uid) {
+	DevicePrivate *device_p = performance_stepper->p;
+	WriteUID_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_WRITE_UID, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.uid = leconvert_uint32_to(uid);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int performance_stepper_read_uid(PerformanceStepper *performance_stepper, uint32_t *ret_uid) {
+	DevicePrivate *device_p = performance_stepper->p;
+	ReadUID_Request request;
+	ReadUID_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_READ_UID, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_uid = leconvert_uint32_from(response.uid);
+
+	return ret;
+}
+
+int performance_stepper_get_identity(PerformanceStepper *performance_stepper, char ret_uid[8], char ret_connected_uid[8], char *ret_position, uint8_t ret_hardware_version[3], uint8_t ret_firmware_version[3], uint16_t *ret_device_identifier) {
+	DevicePrivate *device_p = performance_stepper->p;
+	GetIdentity_Request request;
+	GetIdentity_Response response;
+	int ret;
+
+	ret = packet_header_create(&request.header, sizeof(request), PERFORMANCE_STEPPER_FUNCTION_GET_IDENTITY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_uid, response.uid, 8);
+	memcpy(ret_connected_uid, response.connected_uid, 8);
+	*ret_position = response.position;
+	memcpy(ret_hardware_version, response.hardware_version, 3 * sizeof(uint8_t));
+	memcpy(ret_firmware_version, response.firmware_version, 3 * sizeof(uint8_t));
+	*ret_device_identifier = leconvert_uint16_from(response.device_identifier);
+
+	return ret;
+}
+
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,7403 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C/C++ Bindings Version 2.1.30                             *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+
+#define IPCON_EXPOSE_INTERNALS
+
+#include "bricklet_stream_test.h"
+
+#include <string.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+
+
+typedef void (*NormalReadLowLevel_CallbackFunction)(uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], void *user_data);
+
+typedef void (*NormalReadExtraPrefix1LowLevel_CallbackFunction)(uint8_t extra, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59], void *user_data);
+
+typedef void (*NormalReadExtraPrefix2LowLevel_CallbackFunction)(uint8_t extra_1, uint8_t extra_2, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58], void *user_data);
+
+typedef void (*NormalReadExtraSuffix1LowLevel_CallbackFunction)(uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59], uint8_t extra, void *user_data);
+
+typedef void (*NormalReadExtraSuffix2LowLevel_CallbackFunction)(uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58], uint8_t extra_1, uint8_t extra_2, void *user_data);
+
+typedef void (*NormalReadExtraFullLowLevel_CallbackFunction)(uint8_t extra_1, uint16_t message_length, uint8_t extra_2, uint16_t message_chunk_offset, uint8_t extra_3, char message_chunk_data[56], uint8_t extra_4, void *user_data);
+
+typedef void (*FixedReadLowLevel_CallbackFunction)(uint16_t message_chunk_offset, char message_chunk_data[62], void *user_data);
+
+typedef void (*FixedReadExtraPrefix1LowLevel_CallbackFunction)(uint8_t extra, uint16_t message_chunk_offset, char message_chunk_data[61], void *user_data);
+
+typedef void (*FixedReadExtraPrefix2LowLevel_CallbackFunction)(uint8_t extra_1, uint8_t extra_2, uint16_t message_chunk_offset, char message_chunk_data[60], void *user_data);
+
+typedef void (*FixedReadExtraSuffix1LowLevel_CallbackFunction)(uint16_t message_chunk_offset, char message_chunk_data[61], uint8_t extra, void *user_data);
+
+typedef void (*FixedReadExtraSuffix2LowLevel_CallbackFunction)(uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t extra_1, uint8_t extra_2, void *user_data);
+
+typedef void (*FixedReadExtraFullLowLevel_CallbackFunction)(uint8_t extra_1, uint16_t message_chunk_offset, uint8_t extra_2, char message_chunk_data[59], uint8_t extra_3, void *user_data);
+
+typedef void (*SingleReadLowLevel_CallbackFunction)(uint8_t message_length, char message_data[63], void *user_data);
+
+typedef void (*SingleReadExtraPrefix1LowLevel_CallbackFunction)(uint8_t extra, uint8_t message_length, char message_data[62], void *user_data);
+
+typedef void (*SingleReadExtraPrefix2LowLevel_CallbackFunction)(uint8_t extra_1, uint8_t extra_2, uint8_t message_length, char message_data[61], void *user_data);
+
+typedef void (*SingleReadExtraSuffix1LowLevel_CallbackFunction)(uint8_t message_length, char message_data[62], uint8_t extra, void *user_data);
+
+typedef void (*SingleReadExtraSuffix2LowLevel_CallbackFunction)(uint8_t message_length, char message_data[61], uint8_t extra_1, uint8_t extra_2, void *user_data);
+
+typedef void (*SingleReadExtraFullLowLevel_CallbackFunction)(uint8_t extra_1, uint8_t message_length, uint8_t extra_2, char message_data[60], uint8_t extra_3, void *user_data);
+
+typedef void (*NormalRead_CallbackFunction)(char *message, uint16_t message_length, void *user_data);
+
+typedef void (*NormalReadExtraPrefix1_CallbackFunction)(uint8_t extra, char *message, uint16_t message_length, void *user_data);
+
+typedef void (*NormalReadExtraPrefix2_CallbackFunction)(uint8_t extra_1, uint8_t extra_2, char *message, uint16_t message_length, void *user_data);
+
+typedef void (*NormalReadExtraSuffix1_CallbackFunction)(char *message, uint16_t message_length, uint8_t extra, void *user_data);
+
+typedef void (*NormalReadExtraSuffix2_CallbackFunction)(char *message, uint16_t message_length, uint8_t extra_1, uint8_t extra_2, void *user_data);
+
+typedef void (*NormalReadExtraFull_CallbackFunction)(uint8_t extra_1, uint8_t extra_2, uint8_t extra_3, char *message, uint16_t message_length, uint8_t extra_4, void *user_data);
+
+typedef void (*FixedRead_CallbackFunction)(char *message, uint16_t message_length, void *user_data);
+
+typedef void (*FixedReadExtraPrefix1_CallbackFunction)(uint8_t extra, char *message, uint16_t message_length, void *user_data);
+
+typedef void (*FixedReadExtraPrefix2_CallbackFunction)(uint8_t extra_1, uint8_t extra_2, char *message, uint16_t message_length, void *user_data);
+
+typedef void (*FixedReadExtraSuffix1_CallbackFunction)(char *message, uint16_t message_length, uint8_t extra, void *user_data);
+
+typedef void (*FixedReadExtraSuffix2_CallbackFunction)(char *message, uint16_t message_length, uint8_t extra_1, uint8_t extra_2, void *user_data);
+
+typedef void (*FixedReadExtraFull_CallbackFunction)(uint8_t extra_1, uint8_t extra_2, char *message, uint16_t message_length, uint8_t extra_3, void *user_data);
+
+typedef void (*SingleRead_CallbackFunction)(char *message, uint8_t message_length, void *user_data);
+
+typedef void (*SingleReadExtraPrefix1_CallbackFunction)(uint8_t extra, char *message, uint8_t message_length, void *user_data);
+
+typedef void (*SingleReadExtraPrefix2_CallbackFunction)(uint8_t extra_1, uint8_t extra_2, char *message, uint8_t message_length, void *user_data);
+
+typedef void (*SingleReadExtraSuffix1_CallbackFunction)(char *message, uint8_t message_length, uint8_t extra, void *user_data);
+
+typedef void (*SingleReadExtraSuffix2_CallbackFunction)(char *message, uint8_t message_length, uint8_t extra_1, uint8_t extra_2, void *user_data);
+
+typedef void (*SingleReadExtraFull_CallbackFunction)(uint8_t extra_1, uint8_t extra_2, char *message, uint8_t message_length, uint8_t extra_3, void *user_data);
+
+#if defined _MSC_VER || defined __BORLANDC__
+	#pragma pack(push)
+	#pragma pack(1)
+	#define ATTRIBUTE_PACKED
+#elif defined __GNUC__
+	#ifdef _WIN32
+		// workaround struct packing bug in GCC 4.7 on Windows
+		// https://gcc.gnu.org/bugzilla/show_bug.cgi?id=52991
+		#define ATTRIBUTE_PACKED __attribute__((gcc_struct, packed))
+	#else
+		#define ATTRIBUTE_PACKED __attribute__((packed))
+	#endif
+#else
+	#error unknown compiler, do not know how to enable struct packing
+#endif
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED NormalWriteLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[59];
+} ATTRIBUTE_PACKED NormalWriteExtraInPrefix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[58];
+} ATTRIBUTE_PACKED NormalWriteExtraInPrefix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[59];
+	uint8_t extra;
+} ATTRIBUTE_PACKED NormalWriteExtraInSuffix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[58];
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED NormalWriteExtraInSuffix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint16_t message_length;
+	uint8_t extra_2;
+	uint16_t message_chunk_offset;
+	uint8_t extra_3;
+	char message_chunk_data[56];
+	uint8_t extra_4;
+} ATTRIBUTE_PACKED NormalWriteExtraInFullLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED NormalWriteExtraOut1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+} ATTRIBUTE_PACKED NormalWriteExtraOut1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED NormalWriteExtraOut2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED NormalWriteExtraOut2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[62];
+} ATTRIBUTE_PACKED FixedWriteLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[61];
+} ATTRIBUTE_PACKED FixedWriteExtraInPrefix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED FixedWriteExtraInPrefix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[61];
+	uint8_t extra;
+} ATTRIBUTE_PACKED FixedWriteExtraInSuffix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED FixedWriteExtraInSuffix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint16_t message_chunk_offset;
+	uint8_t extra_2;
+	char message_chunk_data[59];
+	uint8_t extra_3;
+} ATTRIBUTE_PACKED FixedWriteExtraInFullLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[62];
+} ATTRIBUTE_PACKED FixedWriteExtraOut1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+} ATTRIBUTE_PACKED FixedWriteExtraOut1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[62];
+} ATTRIBUTE_PACKED FixedWriteExtraOut2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED FixedWriteExtraOut2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED ShortWriteLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_chunk_written;
+} ATTRIBUTE_PACKED ShortWriteLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[59];
+} ATTRIBUTE_PACKED ShortWriteExtraInPrefix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_chunk_written;
+} ATTRIBUTE_PACKED ShortWriteExtraInPrefix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[58];
+} ATTRIBUTE_PACKED ShortWriteExtraInPrefix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_chunk_written;
+} ATTRIBUTE_PACKED ShortWriteExtraInPrefix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[59];
+	uint8_t extra;
+} ATTRIBUTE_PACKED ShortWriteExtraInSuffix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_chunk_written;
+} ATTRIBUTE_PACKED ShortWriteExtraInSuffix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[58];
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED ShortWriteExtraInSuffix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_chunk_written;
+} ATTRIBUTE_PACKED ShortWriteExtraInSuffix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED ShortWriteExtraOutPrefix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint8_t message_chunk_written;
+} ATTRIBUTE_PACKED ShortWriteExtraOutPrefix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED ShortWriteExtraOutPrefix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint8_t message_chunk_written;
+} ATTRIBUTE_PACKED ShortWriteExtraOutPrefix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED ShortWriteExtraOutSuffix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_chunk_written;
+	uint8_t extra;
+} ATTRIBUTE_PACKED ShortWriteExtraOutSuffix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED ShortWriteExtraOutSuffix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_chunk_written;
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED ShortWriteExtraOutSuffix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint16_t message_length;
+	uint8_t extra_2;
+	uint16_t message_chunk_offset;
+	uint8_t extra_3;
+	char message_chunk_data[56];
+	uint8_t extra_4;
+} ATTRIBUTE_PACKED ShortWriteExtraFullLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_5;
+	uint8_t message_chunk_written;
+	uint8_t extra_6;
+} ATTRIBUTE_PACKED ShortWriteExtraFullLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[63];
+} ATTRIBUTE_PACKED SingleWriteLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint8_t message_length;
+	char message_data[62];
+} ATTRIBUTE_PACKED SingleWriteExtraInPrefix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint8_t message_length;
+	char message_data[61];
+} ATTRIBUTE_PACKED SingleWriteExtraInPrefix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[62];
+	uint8_t extra;
+} ATTRIBUTE_PACKED SingleWriteExtraInSuffix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[61];
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED SingleWriteExtraInSuffix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t message_length;
+	uint8_t extra_2;
+	char message_data[60];
+	uint8_t extra_3;
+} ATTRIBUTE_PACKED SingleWriteExtraInFullLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[63];
+} ATTRIBUTE_PACKED SingleWriteExtraOut1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+} ATTRIBUTE_PACKED SingleWriteExtraOut1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[63];
+} ATTRIBUTE_PACKED SingleWriteExtraOut2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED SingleWriteExtraOut2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[63];
+} ATTRIBUTE_PACKED ShortSingleWriteLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_written;
+} ATTRIBUTE_PACKED ShortSingleWriteLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint8_t message_length;
+	char message_data[62];
+} ATTRIBUTE_PACKED ShortSingleWriteExtraInPrefix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_written;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraInPrefix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint8_t message_length;
+	char message_data[61];
+} ATTRIBUTE_PACKED ShortSingleWriteExtraInPrefix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_written;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraInPrefix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[62];
+	uint8_t extra;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraInSuffix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_written;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraInSuffix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[61];
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraInSuffix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_written;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraInSuffix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[62];
+} ATTRIBUTE_PACKED ShortSingleWriteExtraOutPrefix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint8_t message_written;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraOutPrefix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[62];
+} ATTRIBUTE_PACKED ShortSingleWriteExtraOutPrefix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint8_t message_written;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraOutPrefix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[63];
+} ATTRIBUTE_PACKED ShortSingleWriteExtraOutSuffix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_written;
+	uint8_t extra;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraOutSuffix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[63];
+} ATTRIBUTE_PACKED ShortSingleWriteExtraOutSuffix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_written;
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraOutSuffix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t message_length;
+	uint8_t extra_2;
+	char message_data[60];
+	uint8_t extra_3;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraFullLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_4;
+	uint8_t message_written;
+	uint8_t extra_5;
+} ATTRIBUTE_PACKED ShortSingleWriteExtraFullLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED NormalReadLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED NormalReadLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+} ATTRIBUTE_PACKED NormalReadExtraIn1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED NormalReadExtraIn1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED NormalReadExtraIn2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED NormalReadExtraIn2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED NormalReadExtraOutPrefix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[59];
+} ATTRIBUTE_PACKED NormalReadExtraOutPrefix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED NormalReadExtraOutPrefix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[58];
+} ATTRIBUTE_PACKED NormalReadExtraOutPrefix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED NormalReadExtraOutSuffix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[59];
+	uint8_t extra;
+} ATTRIBUTE_PACKED NormalReadExtraOutSuffix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED NormalReadExtraOutSuffix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[58];
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED NormalReadExtraOutSuffix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED NormalReadExtraOutFullLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint16_t message_length;
+	uint8_t extra_2;
+	uint16_t message_chunk_offset;
+	uint8_t extra_3;
+	char message_chunk_data[56];
+	uint8_t extra_4;
+} ATTRIBUTE_PACKED NormalReadExtraOutFullLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED FixedReadLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[62];
+} ATTRIBUTE_PACKED FixedReadLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+} ATTRIBUTE_PACKED FixedReadExtraIn1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[62];
+} ATTRIBUTE_PACKED FixedReadExtraIn1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED FixedReadExtraIn2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[62];
+} ATTRIBUTE_PACKED FixedReadExtraIn2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED FixedReadExtraOutPrefix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[61];
+} ATTRIBUTE_PACKED FixedReadExtraOutPrefix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED FixedReadExtraOutPrefix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED FixedReadExtraOutPrefix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED FixedReadExtraOutSuffix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[61];
+	uint8_t extra;
+} ATTRIBUTE_PACKED FixedReadExtraOutSuffix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED FixedReadExtraOutSuffix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED FixedReadExtraOutSuffix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED FixedReadExtraOutFullLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint16_t message_chunk_offset;
+	uint8_t extra_2;
+	char message_chunk_data[59];
+	uint8_t extra_3;
+} ATTRIBUTE_PACKED FixedReadExtraOutFullLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED SingleReadLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[63];
+} ATTRIBUTE_PACKED SingleReadLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+} ATTRIBUTE_PACKED SingleReadExtraIn1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[62];
+} ATTRIBUTE_PACKED SingleReadExtraIn1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED SingleReadExtraIn2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[62];
+} ATTRIBUTE_PACKED SingleReadExtraIn2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED SingleReadExtraOutPrefix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint8_t message_length;
+	char message_data[62];
+} ATTRIBUTE_PACKED SingleReadExtraOutPrefix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED SingleReadExtraOutPrefix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint8_t message_length;
+	char message_data[61];
+} ATTRIBUTE_PACKED SingleReadExtraOutPrefix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED SingleReadExtraOutSuffix1LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[62];
+	uint8_t extra;
+} ATTRIBUTE_PACKED SingleReadExtraOutSuffix1LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED SingleReadExtraOutSuffix2LowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[61];
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED SingleReadExtraOutSuffix2LowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED SingleReadExtraOutFullLowLevel_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t message_length;
+	uint8_t extra_2;
+	char message_data[60];
+	uint8_t extra_3;
+} ATTRIBUTE_PACKED SingleReadExtraOutFullLowLevel_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED NormalReadLowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[59];
+} ATTRIBUTE_PACKED NormalReadExtraPrefix1LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[58];
+} ATTRIBUTE_PACKED NormalReadExtraPrefix2LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[59];
+	uint8_t extra;
+} ATTRIBUTE_PACKED NormalReadExtraSuffix1LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_length;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[58];
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED NormalReadExtraSuffix2LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint16_t message_length;
+	uint8_t extra_2;
+	uint16_t message_chunk_offset;
+	uint8_t extra_3;
+	char message_chunk_data[56];
+	uint8_t extra_4;
+} ATTRIBUTE_PACKED NormalReadExtraFullLowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[62];
+} ATTRIBUTE_PACKED FixedReadLowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[61];
+} ATTRIBUTE_PACKED FixedReadExtraPrefix1LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+} ATTRIBUTE_PACKED FixedReadExtraPrefix2LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[61];
+	uint8_t extra;
+} ATTRIBUTE_PACKED FixedReadExtraSuffix1LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED FixedReadExtraSuffix2LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint16_t message_chunk_offset;
+	uint8_t extra_2;
+	char message_chunk_data[59];
+	uint8_t extra_3;
+} ATTRIBUTE_PACKED FixedReadExtraFullLowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[63];
+} ATTRIBUTE_PACKED SingleReadLowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra;
+	uint8_t message_length;
+	char message_data[62];
+} ATTRIBUTE_PACKED SingleReadExtraPrefix1LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t extra_2;
+	uint8_t message_length;
+	char message_data[61];
+} ATTRIBUTE_PACKED SingleReadExtraPrefix2LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[62];
+	uint8_t extra;
+} ATTRIBUTE_PACKED SingleReadExtraSuffix1LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t message_length;
+	char message_data[61];
+	uint8_t extra_1;
+	uint8_t extra_2;
+} ATTRIBUTE_PACKED SingleReadExtraSuffix2LowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t extra_1;
+	uint8_t message_length;
+	uint8_t extra_2;
+	char message_data[60];
+	uint8_t extra_3;
+} ATTRIBUTE_PACKED SingleReadExtraFullLowLevel_Callback;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetIdentity_Request;
+
+typedef struct {
+	PacketHeader header;
+	char uid[8];
+	char connected_uid[8];
+	char position;
+	uint8_t hardware_version[3];
+	uint8_t firmware_version[3];
+	uint16_t device_identifier;
+} ATTRIBUTE_PACKED GetIdentity_Response;
+
+#if defined _MSC_VER || defined __BORLANDC__
+	#pragma pack(pop)
+#endif
+#undef ATTRIBUTE_PACKED
+
+static void stream_test_callback_wrapper_normal_read(DevicePrivate *device_p, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60]) {
+	NormalRead_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ];
+	uint16_t message_chunk_length = message_length - message_chunk_offset;
+
+	callback_function = (NormalRead_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ];
+
+	if (message_chunk_length > 60) {
+		message_chunk_length = 60;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * message_length);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function((char *)high_level_callback->data, high_level_callback->length, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_normal_read_extra_prefix_1(DevicePrivate *device_p, uint8_t extra, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59]) {
+	NormalReadExtraPrefix1_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1];
+	uint16_t message_chunk_length = message_length - message_chunk_offset;
+
+	callback_function = (NormalReadExtraPrefix1_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1];
+
+	if (message_chunk_length > 59) {
+		message_chunk_length = 59;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * message_length);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra, (char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function(extra, (char *)high_level_callback->data, high_level_callback->length, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra, (char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_normal_read_extra_prefix_2(DevicePrivate *device_p, uint8_t extra_1, uint8_t extra_2, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58]) {
+	NormalReadExtraPrefix2_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2];
+	uint16_t message_chunk_length = message_length - message_chunk_offset;
+
+	callback_function = (NormalReadExtraPrefix2_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2];
+
+	if (message_chunk_length > 58) {
+		message_chunk_length = 58;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * message_length);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra_1, extra_2, (char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function(extra_1, extra_2, (char *)high_level_callback->data, high_level_callback->length, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra_1, extra_2, (char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_normal_read_extra_suffix_1(DevicePrivate *device_p, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59], uint8_t extra) {
+	NormalReadExtraSuffix1_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1];
+	uint16_t message_chunk_length = message_length - message_chunk_offset;
+
+	callback_function = (NormalReadExtraSuffix1_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1];
+
+	if (message_chunk_length > 59) {
+		message_chunk_length = 59;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * message_length);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, extra, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function((char *)high_level_callback->data, high_level_callback->length, extra, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, extra, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_normal_read_extra_suffix_2(DevicePrivate *device_p, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58], uint8_t extra_1, uint8_t extra_2) {
+	NormalReadExtraSuffix2_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2];
+	uint16_t message_chunk_length = message_length - message_chunk_offset;
+
+	callback_function = (NormalReadExtraSuffix2_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2];
+
+	if (message_chunk_length > 58) {
+		message_chunk_length = 58;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * message_length);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, extra_1, extra_2, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function((char *)high_level_callback->data, high_level_callback->length, extra_1, extra_2, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, extra_1, extra_2, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_normal_read_extra_full(DevicePrivate *device_p, uint8_t extra_1, uint16_t message_length, uint8_t extra_2, uint16_t message_chunk_offset, uint8_t extra_3, char message_chunk_data[56], uint8_t extra_4) {
+	NormalReadExtraFull_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL];
+	uint16_t message_chunk_length = message_length - message_chunk_offset;
+
+	callback_function = (NormalReadExtraFull_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL];
+
+	if (message_chunk_length > 56) {
+		message_chunk_length = 56;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * message_length);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra_1, extra_2, extra_3, (char *)high_level_callback->data, high_level_callback->length, extra_4, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function(extra_1, extra_2, extra_3, (char *)high_level_callback->data, high_level_callback->length, extra_4, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= message_length) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra_1, extra_2, extra_3, (char *)high_level_callback->data, high_level_callback->length, extra_4, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read(DevicePrivate *device_p, uint16_t message_chunk_offset, char message_chunk_data[62]) {
+	FixedRead_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ];
+	uint16_t message_chunk_length = 1000 - message_chunk_offset;
+
+	callback_function = (FixedRead_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ];
+
+	if (message_chunk_length > 62) {
+		message_chunk_length = 62;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * 1000);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function((char *)high_level_callback->data, high_level_callback->length, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read_extra_prefix_1(DevicePrivate *device_p, uint8_t extra, uint16_t message_chunk_offset, char message_chunk_data[61]) {
+	FixedReadExtraPrefix1_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1];
+	uint16_t message_chunk_length = 1000 - message_chunk_offset;
+
+	callback_function = (FixedReadExtraPrefix1_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1];
+
+	if (message_chunk_length > 61) {
+		message_chunk_length = 61;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * 1000);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra, (char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function(extra, (char *)high_level_callback->data, high_level_callback->length, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra, (char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read_extra_prefix_2(DevicePrivate *device_p, uint8_t extra_1, uint8_t extra_2, uint16_t message_chunk_offset, char message_chunk_data[60]) {
+	FixedReadExtraPrefix2_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2];
+	uint16_t message_chunk_length = 1000 - message_chunk_offset;
+
+	callback_function = (FixedReadExtraPrefix2_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2];
+
+	if (message_chunk_length > 60) {
+		message_chunk_length = 60;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * 1000);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra_1, extra_2, (char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function(extra_1, extra_2, (char *)high_level_callback->data, high_level_callback->length, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra_1, extra_2, (char *)high_level_callback->data, high_level_callback->length, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read_extra_suffix_1(DevicePrivate *device_p, uint16_t message_chunk_offset, char message_chunk_data[61], uint8_t extra) {
+	FixedReadExtraSuffix1_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1];
+	uint16_t message_chunk_length = 1000 - message_chunk_offset;
+
+	callback_function = (FixedReadExtraSuffix1_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1];
+
+	if (message_chunk_length > 61) {
+		message_chunk_length = 61;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * 1000);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, extra, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function((char *)high_level_callback->data, high_level_callback->length, extra, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, extra, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read_extra_suffix_2(DevicePrivate *device_p, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t extra_1, uint8_t extra_2) {
+	FixedReadExtraSuffix2_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2];
+	uint16_t message_chunk_length = 1000 - message_chunk_offset;
+
+	callback_function = (FixedReadExtraSuffix2_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2];
+
+	if (message_chunk_length > 60) {
+		message_chunk_length = 60;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * 1000);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, extra_1, extra_2, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function((char *)high_level_callback->data, high_level_callback->length, extra_1, extra_2, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function((char *)high_level_callback->data, high_level_callback->length, extra_1, extra_2, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read_extra_full(DevicePrivate *device_p, uint8_t extra_1, uint16_t message_chunk_offset, uint8_t extra_2, char message_chunk_data[59], uint8_t extra_3) {
+	FixedReadExtraFull_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL];
+	HighLevelCallback *high_level_callback = &device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL];
+	uint16_t message_chunk_length = 1000 - message_chunk_offset;
+
+	callback_function = (FixedReadExtraFull_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL];
+
+	if (message_chunk_length > 59) {
+		message_chunk_length = 59;
+	}
+
+	if (high_level_callback->data == NULL) { // no stream in-progress
+		if (message_chunk_offset == 0) { // stream starts
+			high_level_callback->data = malloc(sizeof(char) * 1000);
+			high_level_callback->length = message_chunk_length;
+
+			memcpy(high_level_callback->data, message_chunk_data, sizeof(char) * message_chunk_length);
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra_1, extra_2, (char *)high_level_callback->data, high_level_callback->length, extra_3, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		} else { // ignore tail of current stream, wait for next stream start
+		}
+	} else { // stream in-progress
+		if (message_chunk_offset != high_level_callback->length) { // stream out-of-sync
+			free(high_level_callback->data);
+			high_level_callback->data = NULL;
+			high_level_callback->length = 0;
+
+			if (callback_function != NULL) {
+				callback_function(extra_1, extra_2, (char *)high_level_callback->data, high_level_callback->length, extra_3, user_data);
+			}
+		} else { // stream in-sync
+			memcpy(&((char *)high_level_callback->data)[high_level_callback->length], message_chunk_data, sizeof(char) * message_chunk_length);
+			high_level_callback->length += message_chunk_length;
+
+			if (high_level_callback->length >= 1000) { // stream complete
+				if (callback_function != NULL) {
+					callback_function(extra_1, extra_2, (char *)high_level_callback->data, high_level_callback->length, extra_3, user_data);
+				}
+
+				free(high_level_callback->data);
+				high_level_callback->data = NULL;
+				high_level_callback->length = 0;
+			}
+		}
+	}
+}
+
+static void stream_test_callback_wrapper_single_read(DevicePrivate *device_p, uint8_t message_length, char message_data[63]) {
+	SingleRead_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ];
+
+	callback_function = (SingleRead_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ];
+
+	if (callback_function != NULL) {
+		callback_function(message_data, message_length, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_single_read_extra_prefix_1(DevicePrivate *device_p, uint8_t extra, uint8_t message_length, char message_data[62]) {
+	SingleReadExtraPrefix1_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_1];
+
+	callback_function = (SingleReadExtraPrefix1_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_1];
+
+	if (callback_function != NULL) {
+		callback_function(extra, message_data, message_length, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_single_read_extra_prefix_2(DevicePrivate *device_p, uint8_t extra_1, uint8_t extra_2, uint8_t message_length, char message_data[61]) {
+	SingleReadExtraPrefix2_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_2];
+
+	callback_function = (SingleReadExtraPrefix2_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_2];
+
+	if (callback_function != NULL) {
+		callback_function(extra_1, extra_2, message_data, message_length, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_single_read_extra_suffix_1(DevicePrivate *device_p, uint8_t message_length, char message_data[62], uint8_t extra) {
+	SingleReadExtraSuffix1_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1];
+
+	callback_function = (SingleReadExtraSuffix1_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1];
+
+	if (callback_function != NULL) {
+		callback_function(message_data, message_length, extra, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_single_read_extra_suffix_2(DevicePrivate *device_p, uint8_t message_length, char message_data[61], uint8_t extra_1, uint8_t extra_2) {
+	SingleReadExtraSuffix2_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2];
+
+	callback_function = (SingleReadExtraSuffix2_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2];
+
+	if (callback_function != NULL) {
+		callback_function(message_data, message_length, extra_1, extra_2, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_single_read_extra_full(DevicePrivate *device_p, uint8_t extra_1, uint8_t message_length, uint8_t extra_2, char message_data[60], uint8_t extra_3) {
+	SingleReadExtraFull_CallbackFunction callback_function;
+	void *user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_FULL];
+
+	callback_function = (SingleReadExtraFull_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_FULL];
+
+	if (callback_function != NULL) {
+		callback_function(extra_1, extra_2, message_data, message_length, extra_3, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_normal_read_low_level(DevicePrivate *device_p, Packet *packet) {
+	NormalReadLowLevel_CallbackFunction callback_function;
+	void *user_data;
+	NormalReadLowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(NormalReadLowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (NormalReadLowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_LOW_LEVEL];
+	callback = (NormalReadLowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_length = leconvert_uint16_from(callback->message_length);
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_normal_read(device_p, callback->message_length, callback->message_chunk_offset, callback->message_chunk_data);
+
+	if (callback_function != NULL) {
+		callback_function(callback->message_length, callback->message_chunk_offset, callback->message_chunk_data, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_normal_read_extra_prefix_1_low_level(DevicePrivate *device_p, Packet *packet) {
+	NormalReadExtraPrefix1LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	NormalReadExtraPrefix1LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(NormalReadExtraPrefix1LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (NormalReadExtraPrefix1LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1_LOW_LEVEL];
+	callback = (NormalReadExtraPrefix1LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_length = leconvert_uint16_from(callback->message_length);
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_normal_read_extra_prefix_1(device_p, callback->extra, callback->message_length, callback->message_chunk_offset, callback->message_chunk_data);
+
+	if (callback_function != NULL) {
+		callback_function(callback->extra, callback->message_length, callback->message_chunk_offset, callback->message_chunk_data, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_normal_read_extra_prefix_2_low_level(DevicePrivate *device_p, Packet *packet) {
+	NormalReadExtraPrefix2LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	NormalReadExtraPrefix2LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(NormalReadExtraPrefix2LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (NormalReadExtraPrefix2LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2_LOW_LEVEL];
+	callback = (NormalReadExtraPrefix2LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_length = leconvert_uint16_from(callback->message_length);
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_normal_read_extra_prefix_2(device_p, callback->extra_1, callback->extra_2, callback->message_length, callback->message_chunk_offset, callback->message_chunk_data);
+
+	if (callback_function != NULL) {
+		callback_function(callback->extra_1, callback->extra_2, callback->message_length, callback->message_chunk_offset, callback->message_chunk_data, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_normal_read_extra_suffix_1_low_level(DevicePrivate *device_p, Packet *packet) {
+	NormalReadExtraSuffix1LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	NormalReadExtraSuffix1LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(NormalReadExtraSuffix1LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (NormalReadExtraSuffix1LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1_LOW_LEVEL];
+	callback = (NormalReadExtraSuffix1LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_length = leconvert_uint16_from(callback->message_length);
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_normal_read_extra_suffix_1(device_p, callback->message_length, callback->message_chunk_offset, callback->message_chunk_data, callback->extra);
+
+	if (callback_function != NULL) {
+		callback_function(callback->message_length, callback->message_chunk_offset, callback->message_chunk_data, callback->extra, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_normal_read_extra_suffix_2_low_level(DevicePrivate *device_p, Packet *packet) {
+	NormalReadExtraSuffix2LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	NormalReadExtraSuffix2LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(NormalReadExtraSuffix2LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (NormalReadExtraSuffix2LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2_LOW_LEVEL];
+	callback = (NormalReadExtraSuffix2LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_length = leconvert_uint16_from(callback->message_length);
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_normal_read_extra_suffix_2(device_p, callback->message_length, callback->message_chunk_offset, callback->message_chunk_data, callback->extra_1, callback->extra_2);
+
+	if (callback_function != NULL) {
+		callback_function(callback->message_length, callback->message_chunk_offset, callback->message_chunk_data, callback->extra_1, callback->extra_2, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_normal_read_extra_full_low_level(DevicePrivate *device_p, Packet *packet) {
+	NormalReadExtraFullLowLevel_CallbackFunction callback_function;
+	void *user_data;
+	NormalReadExtraFullLowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(NormalReadExtraFullLowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (NormalReadExtraFullLowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL_LOW_LEVEL];
+	callback = (NormalReadExtraFullLowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_length = leconvert_uint16_from(callback->message_length);
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_normal_read_extra_full(device_p, callback->extra_1, callback->message_length, callback->extra_2, callback->message_chunk_offset, callback->extra_3, callback->message_chunk_data, callback->extra_4);
+
+	if (callback_function != NULL) {
+		callback_function(callback->extra_1, callback->message_length, callback->extra_2, callback->message_chunk_offset, callback->extra_3, callback->message_chunk_data, callback->extra_4, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read_low_level(DevicePrivate *device_p, Packet *packet) {
+	FixedReadLowLevel_CallbackFunction callback_function;
+	void *user_data;
+	FixedReadLowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(FixedReadLowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (FixedReadLowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_LOW_LEVEL];
+	callback = (FixedReadLowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_fixed_read(device_p, callback->message_chunk_offset, callback->message_chunk_data);
+
+	if (callback_function != NULL) {
+		callback_function(callback->message_chunk_offset, callback->message_chunk_data, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read_extra_prefix_1_low_level(DevicePrivate *device_p, Packet *packet) {
+	FixedReadExtraPrefix1LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	FixedReadExtraPrefix1LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(FixedReadExtraPrefix1LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (FixedReadExtraPrefix1LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1_LOW_LEVEL];
+	callback = (FixedReadExtraPrefix1LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_fixed_read_extra_prefix_1(device_p, callback->extra, callback->message_chunk_offset, callback->message_chunk_data);
+
+	if (callback_function != NULL) {
+		callback_function(callback->extra, callback->message_chunk_offset, callback->message_chunk_data, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read_extra_prefix_2_low_level(DevicePrivate *device_p, Packet *packet) {
+	FixedReadExtraPrefix2LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	FixedReadExtraPrefix2LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(FixedReadExtraPrefix2LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (FixedReadExtraPrefix2LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2_LOW_LEVEL];
+	callback = (FixedReadExtraPrefix2LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_fixed_read_extra_prefix_2(device_p, callback->extra_1, callback->extra_2, callback->message_chunk_offset, callback->message_chunk_data);
+
+	if (callback_function != NULL) {
+		callback_function(callback->extra_1, callback->extra_2, callback->message_chunk_offset, callback->message_chunk_data, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read_extra_suffix_1_low_level(DevicePrivate *device_p, Packet *packet) {
+	FixedReadExtraSuffix1LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	FixedReadExtraSuffix1LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(FixedReadExtraSuffix1LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (FixedReadExtraSuffix1LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1_LOW_LEVEL];
+	callback = (FixedReadExtraSuffix1LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_fixed_read_extra_suffix_1(device_p, callback->message_chunk_offset, callback->message_chunk_data, callback->extra);
+
+	if (callback_function != NULL) {
+		callback_function(callback->message_chunk_offset, callback->message_chunk_data, callback->extra, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read_extra_suffix_2_low_level(DevicePrivate *device_p, Packet *packet) {
+	FixedReadExtraSuffix2LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	FixedReadExtraSuffix2LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(FixedReadExtraSuffix2LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (FixedReadExtraSuffix2LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2_LOW_LEVEL];
+	callback = (FixedReadExtraSuffix2LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_fixed_read_extra_suffix_2(device_p, callback->message_chunk_offset, callback->message_chunk_data, callback->extra_1, callback->extra_2);
+
+	if (callback_function != NULL) {
+		callback_function(callback->message_chunk_offset, callback->message_chunk_data, callback->extra_1, callback->extra_2, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_fixed_read_extra_full_low_level(DevicePrivate *device_p, Packet *packet) {
+	FixedReadExtraFullLowLevel_CallbackFunction callback_function;
+	void *user_data;
+	FixedReadExtraFullLowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(FixedReadExtraFullLowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (FixedReadExtraFullLowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL_LOW_LEVEL];
+	callback = (FixedReadExtraFullLowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	callback->message_chunk_offset = leconvert_uint16_from(callback->message_chunk_offset);
+
+	stream_test_callback_wrapper_fixed_read_extra_full(device_p, callback->extra_1, callback->message_chunk_offset, callback->extra_2, callback->message_chunk_data, callback->extra_3);
+
+	if (callback_function != NULL) {
+		callback_function(callback->extra_1, callback->message_chunk_offset, callback->extra_2, callback->message_chunk_data, callback->extra_3, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_single_read_low_level(DevicePrivate *device_p, Packet *packet) {
+	SingleReadLowLevel_CallbackFunction callback_function;
+	void *user_data;
+	SingleReadLowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(SingleReadLowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (SingleReadLowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_LOW_LEVEL];
+	callback = (SingleReadLowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	stream_test_callback_wrapper_single_read(device_p, callback->message_length, callback->message_data);
+
+	if (callback_function != NULL) {
+		callback_function(callback->message_length, callback->message_data, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_single_read_extra_prefix_1_low_level(DevicePrivate *device_p, Packet *packet) {
+	SingleReadExtraPrefix1LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	SingleReadExtraPrefix1LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(SingleReadExtraPrefix1LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (SingleReadExtraPrefix1LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_1_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_1_LOW_LEVEL];
+	callback = (SingleReadExtraPrefix1LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	stream_test_callback_wrapper_single_read_extra_prefix_1(device_p, callback->extra, callback->message_length, callback->message_data);
+
+	if (callback_function != NULL) {
+		callback_function(callback->extra, callback->message_length, callback->message_data, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_single_read_extra_prefix_2_low_level(DevicePrivate *device_p, Packet *packet) {
+	SingleReadExtraPrefix2LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	SingleReadExtraPrefix2LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(SingleReadExtraPrefix2LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (SingleReadExtraPrefix2LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_2_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_2_LOW_LEVEL];
+	callback = (SingleReadExtraPrefix2LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	stream_test_callback_wrapper_single_read_extra_prefix_2(device_p, callback->extra_1, callback->extra_2, callback->message_length, callback->message_data);
+
+	if (callback_function != NULL) {
+		callback_function(callback->extra_1, callback->extra_2, callback->message_length, callback->message_data, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_single_read_extra_suffix_1_low_level(DevicePrivate *device_p, Packet *packet) {
+	SingleReadExtraSuffix1LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	SingleReadExtraSuffix1LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(SingleReadExtraSuffix1LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (SingleReadExtraSuffix1LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1_LOW_LEVEL];
+	callback = (SingleReadExtraSuffix1LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	stream_test_callback_wrapper_single_read_extra_suffix_1(device_p, callback->message_length, callback->message_data, callback->extra);
+
+	if (callback_function != NULL) {
+		callback_function(callback->message_length, callback->message_data, callback->extra, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_single_read_extra_suffix_2_low_level(DevicePrivate *device_p, Packet *packet) {
+	SingleReadExtraSuffix2LowLevel_CallbackFunction callback_function;
+	void *user_data;
+	SingleReadExtraSuffix2LowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(SingleReadExtraSuffix2LowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (SingleReadExtraSuffix2LowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2_LOW_LEVEL];
+	callback = (SingleReadExtraSuffix2LowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	stream_test_callback_wrapper_single_read_extra_suffix_2(device_p, callback->message_length, callback->message_data, callback->extra_1, callback->extra_2);
+
+	if (callback_function != NULL) {
+		callback_function(callback->message_length, callback->message_data, callback->extra_1, callback->extra_2, user_data);
+	}
+}
+
+static void stream_test_callback_wrapper_single_read_extra_full_low_level(DevicePrivate *device_p, Packet *packet) {
+	SingleReadExtraFullLowLevel_CallbackFunction callback_function;
+	void *user_data;
+	SingleReadExtraFullLowLevel_Callback *callback;
+
+	if (packet->header.length != sizeof(SingleReadExtraFullLowLevel_Callback)) {
+		return; // silently ignoring callback with wrong length
+	}
+
+	callback_function = (SingleReadExtraFullLowLevel_CallbackFunction)device_p->registered_callbacks[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_FULL_LOW_LEVEL];
+	user_data = device_p->registered_callback_user_data[DEVICE_NUM_FUNCTION_IDS + STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_FULL_LOW_LEVEL];
+	callback = (SingleReadExtraFullLowLevel_Callback *)packet;
+	(void)callback; // avoid unused variable warning
+
+
+	stream_test_callback_wrapper_single_read_extra_full(device_p, callback->extra_1, callback->message_length, callback->extra_2, callback->message_data, callback->extra_3);
+
+	if (callback_function != NULL) {
+		callback_function(callback->extra_1, callback->message_length, callback->extra_2, callback->message_data, callback->extra_3, user_data);
+	}
+}
+
+void stream_test_create(StreamTest *stream_test, const char *uid, IPConnection *ipcon) {
+	IPConnectionPrivate *ipcon_p = ipcon->p;
+	DevicePrivate *device_p;
+
+	device_create(stream_test, uid, ipcon_p, 2, 0, 0, STREAM_TEST_DEVICE_IDENTIFIER);
+
+	device_p = stream_test->p;
+
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_WRITE_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_WRITE_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_WRITE_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_WRITE_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_FULL_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_READ_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_READ_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_READ_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[STREAM_TEST_FUNCTION_GET_IDENTITY] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_NORMAL_READ_LOW_LEVEL] = stream_test_callback_wrapper_normal_read_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1_LOW_LEVEL] = stream_test_callback_wrapper_normal_read_extra_prefix_1_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2_LOW_LEVEL] = stream_test_callback_wrapper_normal_read_extra_prefix_2_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1_LOW_LEVEL] = stream_test_callback_wrapper_normal_read_extra_suffix_1_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2_LOW_LEVEL] = stream_test_callback_wrapper_normal_read_extra_suffix_2_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL_LOW_LEVEL] = stream_test_callback_wrapper_normal_read_extra_full_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_FIXED_READ_LOW_LEVEL] = stream_test_callback_wrapper_fixed_read_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1_LOW_LEVEL] = stream_test_callback_wrapper_fixed_read_extra_prefix_1_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2_LOW_LEVEL] = stream_test_callback_wrapper_fixed_read_extra_prefix_2_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1_LOW_LEVEL] = stream_test_callback_wrapper_fixed_read_extra_suffix_1_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2_LOW_LEVEL] = stream_test_callback_wrapper_fixed_read_extra_suffix_2_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL_LOW_LEVEL] = stream_test_callback_wrapper_fixed_read_extra_full_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_SINGLE_READ_LOW_LEVEL] = stream_test_callback_wrapper_single_read_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_1_LOW_LEVEL] = stream_test_callback_wrapper_single_read_extra_prefix_1_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_2_LOW_LEVEL] = stream_test_callback_wrapper_single_read_extra_prefix_2_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1_LOW_LEVEL] = stream_test_callback_wrapper_single_read_extra_suffix_1_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2_LOW_LEVEL] = stream_test_callback_wrapper_single_read_extra_suffix_2_low_level;
+	device_p->callback_wrappers[STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_FULL_LOW_LEVEL] = stream_test_callback_wrapper_single_read_extra_full_low_level;
+
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_SINGLE_READ].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_1].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_2].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2].exists = true;
+	device_p->high_level_callbacks[-STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_FULL].exists = true;
+	ipcon_add_device(ipcon_p, device_p);
+}
+
+void stream_test_destroy(StreamTest *stream_test) {
+	device_release(stream_test->p);
+}
+
+int stream_test_get_response_expected(StreamTest *stream_test, uint8_t function_id, bool *ret_response_expected) {
+	return device_get_response_expected(stream_test->p, function_id, ret_response_expected);
+}
+
+int stream_test_set_response_expected(StreamTest *stream_test, uint8_t function_id, bool response_expected) {
+	return device_set_response_expected(stream_test->p, function_id, response_expected);
+}
+
+int stream_test_set_response_expected_all(StreamTest *stream_test, bool response_expected) {
+	return device_set_response_expected_all(stream_test->p, response_expected);
+}
+
+void stream_test_register_callback(StreamTest *stream_test, int16_t callback_id, void (*function)(void), void *user_data) {
+	device_register_callback(stream_test->p, callback_id, function, user_data);
+}
+
+int stream_test_get_api_version(StreamTest *stream_test, uint8_t ret_api_version[3]) {
+	return device_get_api_version(stream_test->p, ret_api_version);
+}
+
+int stream_test_normal_write_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60]) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalWriteLowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_WRITE_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 60 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_in_prefix_1_low_level(StreamTest *stream_test, uint8_t extra, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59]) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalWriteExtraInPrefix1LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra = extra;
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 59 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_in_prefix_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58]) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalWriteExtraInPrefix2LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 58 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_in_suffix_1_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59], uint8_t extra) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalWriteExtraInSuffix1LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 59 * sizeof(char));
+	request.extra = extra;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_in_suffix_2_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58], uint8_t extra_1, uint8_t extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalWriteExtraInSuffix2LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 58 * sizeof(char));
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_in_full_low_level(StreamTest *stream_test, uint8_t extra_1, uint16_t message_length, uint8_t extra_2, uint16_t message_chunk_offset, uint8_t extra_3, char message_chunk_data[56], uint8_t extra_4) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalWriteExtraInFullLowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.message_length = leconvert_uint16_to(message_length);
+	request.extra_2 = extra_2;
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	request.extra_3 = extra_3;
+	memcpy(request.message_chunk_data, message_chunk_data, 56 * sizeof(char));
+	request.extra_4 = extra_4;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_out_1_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalWriteExtraOut1LowLevel_Request request;
+	NormalWriteExtraOut1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 60 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra = response.extra;
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_out_2_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalWriteExtraOut2LowLevel_Request request;
+	NormalWriteExtraOut2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 60 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+
+	return ret;
+}
+
+int stream_test_fixed_write_low_level(StreamTest *stream_test, uint16_t message_chunk_offset, char message_chunk_data[62]) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedWriteLowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_WRITE_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 62 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_in_prefix_1_low_level(StreamTest *stream_test, uint8_t extra, uint16_t message_chunk_offset, char message_chunk_data[61]) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedWriteExtraInPrefix1LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra = extra;
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 61 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_in_prefix_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint16_t message_chunk_offset, char message_chunk_data[60]) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedWriteExtraInPrefix2LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 60 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_in_suffix_1_low_level(StreamTest *stream_test, uint16_t message_chunk_offset, char message_chunk_data[61], uint8_t extra) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedWriteExtraInSuffix1LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 61 * sizeof(char));
+	request.extra = extra;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_in_suffix_2_low_level(StreamTest *stream_test, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t extra_1, uint8_t extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedWriteExtraInSuffix2LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 60 * sizeof(char));
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_in_full_low_level(StreamTest *stream_test, uint8_t extra_1, uint16_t message_chunk_offset, uint8_t extra_2, char message_chunk_data[59], uint8_t extra_3) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedWriteExtraInFullLowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	request.extra_2 = extra_2;
+	memcpy(request.message_chunk_data, message_chunk_data, 59 * sizeof(char));
+	request.extra_3 = extra_3;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_out_1_low_level(StreamTest *stream_test, uint16_t message_chunk_offset, char message_chunk_data[62], uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedWriteExtraOut1LowLevel_Request request;
+	FixedWriteExtraOut1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 62 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra = response.extra;
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_out_2_low_level(StreamTest *stream_test, uint16_t message_chunk_offset, char message_chunk_data[62], uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedWriteExtraOut2LowLevel_Request request;
+	FixedWriteExtraOut2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 62 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+
+	return ret;
+}
+
+int stream_test_short_write_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_message_chunk_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortWriteLowLevel_Request request;
+	ShortWriteLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_WRITE_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 60 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_written = response.message_chunk_written;
+
+	return ret;
+}
+
+int stream_test_short_write_extra_in_prefix_1_low_level(StreamTest *stream_test, uint8_t extra, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59], uint8_t *ret_message_chunk_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortWriteExtraInPrefix1LowLevel_Request request;
+	ShortWriteExtraInPrefix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra = extra;
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 59 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_written = response.message_chunk_written;
+
+	return ret;
+}
+
+int stream_test_short_write_extra_in_prefix_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58], uint8_t *ret_message_chunk_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortWriteExtraInPrefix2LowLevel_Request request;
+	ShortWriteExtraInPrefix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 58 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_written = response.message_chunk_written;
+
+	return ret;
+}
+
+int stream_test_short_write_extra_in_suffix_1_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59], uint8_t extra, uint8_t *ret_message_chunk_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortWriteExtraInSuffix1LowLevel_Request request;
+	ShortWriteExtraInSuffix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 59 * sizeof(char));
+	request.extra = extra;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_written = response.message_chunk_written;
+
+	return ret;
+}
+
+int stream_test_short_write_extra_in_suffix_2_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58], uint8_t extra_1, uint8_t extra_2, uint8_t *ret_message_chunk_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortWriteExtraInSuffix2LowLevel_Request request;
+	ShortWriteExtraInSuffix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 58 * sizeof(char));
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_written = response.message_chunk_written;
+
+	return ret;
+}
+
+int stream_test_short_write_extra_out_prefix_1_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_extra, uint8_t *ret_message_chunk_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortWriteExtraOutPrefix1LowLevel_Request request;
+	ShortWriteExtraOutPrefix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 60 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra = response.extra;
+	*ret_message_chunk_written = response.message_chunk_written;
+
+	return ret;
+}
+
+int stream_test_short_write_extra_out_prefix_2_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint8_t *ret_message_chunk_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortWriteExtraOutPrefix2LowLevel_Request request;
+	ShortWriteExtraOutPrefix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 60 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+	*ret_message_chunk_written = response.message_chunk_written;
+
+	return ret;
+}
+
+int stream_test_short_write_extra_out_suffix_1_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_message_chunk_written, uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortWriteExtraOutSuffix1LowLevel_Request request;
+	ShortWriteExtraOutSuffix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 60 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_written = response.message_chunk_written;
+	*ret_extra = response.extra;
+
+	return ret;
+}
+
+int stream_test_short_write_extra_out_suffix_2_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_message_chunk_written, uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortWriteExtraOutSuffix2LowLevel_Request request;
+	ShortWriteExtraOutSuffix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = leconvert_uint16_to(message_length);
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	memcpy(request.message_chunk_data, message_chunk_data, 60 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_written = response.message_chunk_written;
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+
+	return ret;
+}
+
+int stream_test_short_write_extra_full_low_level(StreamTest *stream_test, uint8_t extra_1, uint16_t message_length, uint8_t extra_2, uint16_t message_chunk_offset, uint8_t extra_3, char message_chunk_data[56], uint8_t extra_4, uint8_t *ret_extra_5, uint8_t *ret_message_chunk_written, uint8_t *ret_extra_6) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortWriteExtraFullLowLevel_Request request;
+	ShortWriteExtraFullLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.message_length = leconvert_uint16_to(message_length);
+	request.extra_2 = extra_2;
+	request.message_chunk_offset = leconvert_uint16_to(message_chunk_offset);
+	request.extra_3 = extra_3;
+	memcpy(request.message_chunk_data, message_chunk_data, 56 * sizeof(char));
+	request.extra_4 = extra_4;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_5 = response.extra_5;
+	*ret_message_chunk_written = response.message_chunk_written;
+	*ret_extra_6 = response.extra_6;
+
+	return ret;
+}
+
+int stream_test_single_write_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63]) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleWriteLowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_WRITE_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 63 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_single_write_extra_in_prefix_1_low_level(StreamTest *stream_test, uint8_t extra, uint8_t message_length, char message_data[62]) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleWriteExtraInPrefix1LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra = extra;
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 62 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_single_write_extra_in_prefix_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint8_t message_length, char message_data[61]) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleWriteExtraInPrefix2LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 61 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_single_write_extra_in_suffix_1_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[62], uint8_t extra) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleWriteExtraInSuffix1LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 62 * sizeof(char));
+	request.extra = extra;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_single_write_extra_in_suffix_2_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[61], uint8_t extra_1, uint8_t extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleWriteExtraInSuffix2LowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 61 * sizeof(char));
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_single_write_extra_in_full_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t message_length, uint8_t extra_2, char message_data[60], uint8_t extra_3) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleWriteExtraInFullLowLevel_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_FULL_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.message_length = message_length;
+	request.extra_2 = extra_2;
+	memcpy(request.message_data, message_data, 60 * sizeof(char));
+	request.extra_3 = extra_3;
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int stream_test_single_write_extra_out_1_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63], uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleWriteExtraOut1LowLevel_Request request;
+	SingleWriteExtraOut1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 63 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra = response.extra;
+
+	return ret;
+}
+
+int stream_test_single_write_extra_out_2_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63], uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleWriteExtraOut2LowLevel_Request request;
+	SingleWriteExtraOut2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 63 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+
+	return ret;
+}
+
+int stream_test_short_single_write_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63], uint8_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortSingleWriteLowLevel_Request request;
+	ShortSingleWriteLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 63 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = response.message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_in_prefix_1_low_level(StreamTest *stream_test, uint8_t extra, uint8_t message_length, char message_data[62], uint8_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortSingleWriteExtraInPrefix1LowLevel_Request request;
+	ShortSingleWriteExtraInPrefix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra = extra;
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 62 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = response.message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_in_prefix_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint8_t message_length, char message_data[61], uint8_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortSingleWriteExtraInPrefix2LowLevel_Request request;
+	ShortSingleWriteExtraInPrefix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 61 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = response.message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_in_suffix_1_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[62], uint8_t extra, uint8_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortSingleWriteExtraInSuffix1LowLevel_Request request;
+	ShortSingleWriteExtraInSuffix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 62 * sizeof(char));
+	request.extra = extra;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = response.message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_in_suffix_2_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[61], uint8_t extra_1, uint8_t extra_2, uint8_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortSingleWriteExtraInSuffix2LowLevel_Request request;
+	ShortSingleWriteExtraInSuffix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 61 * sizeof(char));
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = response.message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_out_prefix_1_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[62], uint8_t *ret_extra, uint8_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortSingleWriteExtraOutPrefix1LowLevel_Request request;
+	ShortSingleWriteExtraOutPrefix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 62 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra = response.extra;
+	*ret_message_written = response.message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_out_prefix_2_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[62], uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint8_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortSingleWriteExtraOutPrefix2LowLevel_Request request;
+	ShortSingleWriteExtraOutPrefix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 62 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+	*ret_message_written = response.message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_out_suffix_1_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63], uint8_t *ret_message_written, uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortSingleWriteExtraOutSuffix1LowLevel_Request request;
+	ShortSingleWriteExtraOutSuffix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 63 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = response.message_written;
+	*ret_extra = response.extra;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_out_suffix_2_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63], uint8_t *ret_message_written, uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortSingleWriteExtraOutSuffix2LowLevel_Request request;
+	ShortSingleWriteExtraOutSuffix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.message_length = message_length;
+	memcpy(request.message_data, message_data, 63 * sizeof(char));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = response.message_written;
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_full_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t message_length, uint8_t extra_2, char message_data[60], uint8_t extra_3, uint8_t *ret_extra_4, uint8_t *ret_message_written, uint8_t *ret_extra_5) {
+	DevicePrivate *device_p = stream_test->p;
+	ShortSingleWriteExtraFullLowLevel_Request request;
+	ShortSingleWriteExtraFullLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.message_length = message_length;
+	request.extra_2 = extra_2;
+	memcpy(request.message_data, message_data, 60 * sizeof(char));
+	request.extra_3 = extra_3;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_4 = response.extra_4;
+	*ret_message_written = response.message_written;
+	*ret_extra_5 = response.extra_5;
+
+	return ret;
+}
+
+int stream_test_normal_read_low_level(StreamTest *stream_test, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[60]) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalReadLowLevel_Request request;
+	NormalReadLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_READ_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_length = leconvert_uint16_from(response.message_length);
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 60 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_in_1_low_level(StreamTest *stream_test, uint8_t extra, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[60]) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalReadExtraIn1LowLevel_Request request;
+	NormalReadExtraIn1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra = extra;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_length = leconvert_uint16_from(response.message_length);
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 60 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_in_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[60]) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalReadExtraIn2LowLevel_Request request;
+	NormalReadExtraIn2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_length = leconvert_uint16_from(response.message_length);
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 60 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_out_prefix_1_low_level(StreamTest *stream_test, uint8_t *ret_extra, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[59]) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalReadExtraOutPrefix1LowLevel_Request request;
+	NormalReadExtraOutPrefix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra = response.extra;
+	*ret_message_length = leconvert_uint16_from(response.message_length);
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 59 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_out_prefix_2_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[58]) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalReadExtraOutPrefix2LowLevel_Request request;
+	NormalReadExtraOutPrefix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+	*ret_message_length = leconvert_uint16_from(response.message_length);
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 58 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_out_suffix_1_low_level(StreamTest *stream_test, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[59], uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalReadExtraOutSuffix1LowLevel_Request request;
+	NormalReadExtraOutSuffix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_length = leconvert_uint16_from(response.message_length);
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 59 * sizeof(char));
+	*ret_extra = response.extra;
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_out_suffix_2_low_level(StreamTest *stream_test, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[58], uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalReadExtraOutSuffix2LowLevel_Request request;
+	NormalReadExtraOutSuffix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_length = leconvert_uint16_from(response.message_length);
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 58 * sizeof(char));
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_out_full_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint16_t *ret_message_length, uint8_t *ret_extra_2, uint16_t *ret_message_chunk_offset, uint8_t *ret_extra_3, char ret_message_chunk_data[56], uint8_t *ret_extra_4) {
+	DevicePrivate *device_p = stream_test->p;
+	NormalReadExtraOutFullLowLevel_Request request;
+	NormalReadExtraOutFullLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_1 = response.extra_1;
+	*ret_message_length = leconvert_uint16_from(response.message_length);
+	*ret_extra_2 = response.extra_2;
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	*ret_extra_3 = response.extra_3;
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 56 * sizeof(char));
+	*ret_extra_4 = response.extra_4;
+
+	return ret;
+}
+
+int stream_test_fixed_read_low_level(StreamTest *stream_test, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[62]) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedReadLowLevel_Request request;
+	FixedReadLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_READ_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 62 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_in_1_low_level(StreamTest *stream_test, uint8_t extra, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[62]) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedReadExtraIn1LowLevel_Request request;
+	FixedReadExtraIn1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra = extra;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 62 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_in_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[62]) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedReadExtraIn2LowLevel_Request request;
+	FixedReadExtraIn2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 62 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_out_prefix_1_low_level(StreamTest *stream_test, uint8_t *ret_extra, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[61]) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedReadExtraOutPrefix1LowLevel_Request request;
+	FixedReadExtraOutPrefix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra = response.extra;
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 61 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_out_prefix_2_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[60]) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedReadExtraOutPrefix2LowLevel_Request request;
+	FixedReadExtraOutPrefix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 60 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_out_suffix_1_low_level(StreamTest *stream_test, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[61], uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedReadExtraOutSuffix1LowLevel_Request request;
+	FixedReadExtraOutSuffix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 61 * sizeof(char));
+	*ret_extra = response.extra;
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_out_suffix_2_low_level(StreamTest *stream_test, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[60], uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedReadExtraOutSuffix2LowLevel_Request request;
+	FixedReadExtraOutSuffix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 60 * sizeof(char));
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_out_full_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint16_t *ret_message_chunk_offset, uint8_t *ret_extra_2, char ret_message_chunk_data[59], uint8_t *ret_extra_3) {
+	DevicePrivate *device_p = stream_test->p;
+	FixedReadExtraOutFullLowLevel_Request request;
+	FixedReadExtraOutFullLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_1 = response.extra_1;
+	*ret_message_chunk_offset = leconvert_uint16_from(response.message_chunk_offset);
+	*ret_extra_2 = response.extra_2;
+	memcpy(ret_message_chunk_data, response.message_chunk_data, 59 * sizeof(char));
+	*ret_extra_3 = response.extra_3;
+
+	return ret;
+}
+
+int stream_test_single_read_low_level(StreamTest *stream_test, uint8_t *ret_message_length, char ret_message_data[63]) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleReadLowLevel_Request request;
+	SingleReadLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_READ_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_length = response.message_length;
+	memcpy(ret_message_data, response.message_data, 63 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_single_read_extra_in_1_low_level(StreamTest *stream_test, uint8_t extra, uint8_t *ret_message_length, char ret_message_data[62]) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleReadExtraIn1LowLevel_Request request;
+	SingleReadExtraIn1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra = extra;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_length = response.message_length;
+	memcpy(ret_message_data, response.message_data, 62 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_single_read_extra_in_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint8_t *ret_message_length, char ret_message_data[62]) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleReadExtraIn2LowLevel_Request request;
+	SingleReadExtraIn2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.extra_1 = extra_1;
+	request.extra_2 = extra_2;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_length = response.message_length;
+	memcpy(ret_message_data, response.message_data, 62 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_single_read_extra_out_prefix_1_low_level(StreamTest *stream_test, uint8_t *ret_extra, uint8_t *ret_message_length, char ret_message_data[62]) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleReadExtraOutPrefix1LowLevel_Request request;
+	SingleReadExtraOutPrefix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra = response.extra;
+	*ret_message_length = response.message_length;
+	memcpy(ret_message_data, response.message_data, 62 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_single_read_extra_out_prefix_2_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint8_t *ret_message_length, char ret_message_data[61]) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleReadExtraOutPrefix2LowLevel_Request request;
+	SingleReadExtraOutPrefix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+	*ret_message_length = response.message_length;
+	memcpy(ret_message_data, response.message_data, 61 * sizeof(char));
+
+	return ret;
+}
+
+int stream_test_single_read_extra_out_suffix_1_low_level(StreamTest *stream_test, uint8_t *ret_message_length, char ret_message_data[62], uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleReadExtraOutSuffix1LowLevel_Request request;
+	SingleReadExtraOutSuffix1LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_length = response.message_length;
+	memcpy(ret_message_data, response.message_data, 62 * sizeof(char));
+	*ret_extra = response.extra;
+
+	return ret;
+}
+
+int stream_test_single_read_extra_out_suffix_2_low_level(StreamTest *stream_test, uint8_t *ret_message_length, char ret_message_data[61], uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleReadExtraOutSuffix2LowLevel_Request request;
+	SingleReadExtraOutSuffix2LowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_length = response.message_length;
+	memcpy(ret_message_data, response.message_data, 61 * sizeof(char));
+	*ret_extra_1 = response.extra_1;
+	*ret_extra_2 = response.extra_2;
+
+	return ret;
+}
+
+int stream_test_single_read_extra_out_full_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_message_length, uint8_t *ret_extra_2, char ret_message_data[60], uint8_t *ret_extra_3) {
+	DevicePrivate *device_p = stream_test->p;
+	SingleReadExtraOutFullLowLevel_Request request;
+	SingleReadExtraOutFullLowLevel_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_extra_1 = response.extra_1;
+	*ret_message_length = response.message_length;
+	*ret_extra_2 = response.extra_2;
+	memcpy(ret_message_data, response.message_data, 60 * sizeof(char));
+	*ret_extra_3 = response.extra_3;
+
+	return ret;
+}
+
+int stream_test_get_identity(StreamTest *stream_test, char ret_uid[8], char ret_connected_uid[8], char *ret_position, uint8_t ret_hardware_version[3], uint8_t ret_firmware_version[3], uint16_t *ret_device_identifier) {
+	DevicePrivate *device_p = stream_test->p;
+	GetIdentity_Request request;
+	GetIdentity_Response response;
+	int ret;
+
+	ret = packet_header_create(&request.header, sizeof(request), STREAM_TEST_FUNCTION_GET_IDENTITY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_uid, response.uid, 8);
+	memcpy(ret_connected_uid, response.connected_uid, 8);
+	*ret_position = response.position;
+	memcpy(ret_hardware_version, response.hardware_version, 3 * sizeof(uint8_t));
+	memcpy(ret_firmware_version, response.firmware_version, 3 * sizeof(uint8_t));
+	*ret_device_identifier = leconvert_uint16_from(response.device_identifier);
+
+	return ret;
+}
+
+int stream_test_normal_write(StreamTest *stream_test, const char *message, uint16_t message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[60];
+	uint16_t message_chunk_length;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 60);
+
+		ret = stream_test_normal_write_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data);
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (60 - message_chunk_length));
+
+			ret = stream_test_normal_write_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				break;
+			}
+
+			message_chunk_offset += 60;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_in_prefix_1(StreamTest *stream_test, uint8_t extra, const char *message, uint16_t message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[59];
+	uint16_t message_chunk_length;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 59);
+
+		ret = stream_test_normal_write_extra_in_prefix_1_low_level(stream_test, extra, message_length, message_chunk_offset, message_chunk_data);
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 59) {
+				message_chunk_length = 59;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (59 - message_chunk_length));
+
+			ret = stream_test_normal_write_extra_in_prefix_1_low_level(stream_test, extra, message_length, message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				break;
+			}
+
+			message_chunk_offset += 59;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_in_prefix_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint16_t message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[58];
+	uint16_t message_chunk_length;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 58);
+
+		ret = stream_test_normal_write_extra_in_prefix_2_low_level(stream_test, extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data);
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 58) {
+				message_chunk_length = 58;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (58 - message_chunk_length));
+
+			ret = stream_test_normal_write_extra_in_prefix_2_low_level(stream_test, extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				break;
+			}
+
+			message_chunk_offset += 58;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_in_suffix_1(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t extra) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[59];
+	uint16_t message_chunk_length;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 59);
+
+		ret = stream_test_normal_write_extra_in_suffix_1_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, extra);
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 59) {
+				message_chunk_length = 59;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (59 - message_chunk_length));
+
+			ret = stream_test_normal_write_extra_in_suffix_1_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, extra);
+
+			if (ret < 0) {
+				break;
+			}
+
+			message_chunk_offset += 59;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_in_suffix_2(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t extra_1, uint8_t extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[58];
+	uint16_t message_chunk_length;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 58);
+
+		ret = stream_test_normal_write_extra_in_suffix_2_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2);
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 58) {
+				message_chunk_length = 58;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (58 - message_chunk_length));
+
+			ret = stream_test_normal_write_extra_in_suffix_2_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2);
+
+			if (ret < 0) {
+				break;
+			}
+
+			message_chunk_offset += 58;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_in_full(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint8_t extra_3, const char *message, uint16_t message_length, uint8_t extra_4) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[56];
+	uint16_t message_chunk_length;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 56);
+
+		ret = stream_test_normal_write_extra_in_full_low_level(stream_test, extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4);
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 56) {
+				message_chunk_length = 56;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (56 - message_chunk_length));
+
+			ret = stream_test_normal_write_extra_in_full_low_level(stream_test, extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4);
+
+			if (ret < 0) {
+				break;
+			}
+
+			message_chunk_offset += 56;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_out_1(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[60];
+	uint16_t message_chunk_length;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 60);
+
+		ret = stream_test_normal_write_extra_out_1_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, ret_extra);
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (60 - message_chunk_length));
+
+			ret = stream_test_normal_write_extra_out_1_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, ret_extra);
+
+			if (ret < 0) {
+				break;
+			}
+
+			message_chunk_offset += 60;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_normal_write_extra_out_2(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[60];
+	uint16_t message_chunk_length;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 60);
+
+		ret = stream_test_normal_write_extra_out_2_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, ret_extra_1, ret_extra_2);
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (60 - message_chunk_length));
+
+			ret = stream_test_normal_write_extra_out_2_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, ret_extra_1, ret_extra_2);
+
+			if (ret < 0) {
+				break;
+			}
+
+			message_chunk_offset += 60;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_fixed_write(StreamTest *stream_test, const char *message) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[62];
+	uint16_t message_chunk_length;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	while (message_chunk_offset < message_length) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 62) {
+			message_chunk_length = 62;
+		}
+
+		memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+		memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (62 - message_chunk_length));
+
+		ret = stream_test_fixed_write_low_level(stream_test, message_chunk_offset, message_chunk_data);
+
+		if (ret < 0) {
+			break;
+		}
+
+		message_chunk_offset += 62;
+	}
+
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_in_prefix_1(StreamTest *stream_test, uint8_t extra, const char *message) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[61];
+	uint16_t message_chunk_length;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	while (message_chunk_offset < message_length) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 61) {
+			message_chunk_length = 61;
+		}
+
+		memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+		memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (61 - message_chunk_length));
+
+		ret = stream_test_fixed_write_extra_in_prefix_1_low_level(stream_test, extra, message_chunk_offset, message_chunk_data);
+
+		if (ret < 0) {
+			break;
+		}
+
+		message_chunk_offset += 61;
+	}
+
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_in_prefix_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[60];
+	uint16_t message_chunk_length;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	while (message_chunk_offset < message_length) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 60) {
+			message_chunk_length = 60;
+		}
+
+		memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+		memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (60 - message_chunk_length));
+
+		ret = stream_test_fixed_write_extra_in_prefix_2_low_level(stream_test, extra_1, extra_2, message_chunk_offset, message_chunk_data);
+
+		if (ret < 0) {
+			break;
+		}
+
+		message_chunk_offset += 60;
+	}
+
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_in_suffix_1(StreamTest *stream_test, const char *message, uint8_t extra) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[61];
+	uint16_t message_chunk_length;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	while (message_chunk_offset < message_length) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 61) {
+			message_chunk_length = 61;
+		}
+
+		memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+		memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (61 - message_chunk_length));
+
+		ret = stream_test_fixed_write_extra_in_suffix_1_low_level(stream_test, message_chunk_offset, message_chunk_data, extra);
+
+		if (ret < 0) {
+			break;
+		}
+
+		message_chunk_offset += 61;
+	}
+
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_in_suffix_2(StreamTest *stream_test, const char *message, uint8_t extra_1, uint8_t extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[60];
+	uint16_t message_chunk_length;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	while (message_chunk_offset < message_length) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 60) {
+			message_chunk_length = 60;
+		}
+
+		memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+		memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (60 - message_chunk_length));
+
+		ret = stream_test_fixed_write_extra_in_suffix_2_low_level(stream_test, message_chunk_offset, message_chunk_data, extra_1, extra_2);
+
+		if (ret < 0) {
+			break;
+		}
+
+		message_chunk_offset += 60;
+	}
+
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_in_full(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint8_t extra_3) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[59];
+	uint16_t message_chunk_length;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	while (message_chunk_offset < message_length) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 59) {
+			message_chunk_length = 59;
+		}
+
+		memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+		memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (59 - message_chunk_length));
+
+		ret = stream_test_fixed_write_extra_in_full_low_level(stream_test, extra_1, message_chunk_offset, extra_2, message_chunk_data, extra_3);
+
+		if (ret < 0) {
+			break;
+		}
+
+		message_chunk_offset += 59;
+	}
+
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_out_1(StreamTest *stream_test, const char *message, uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[62];
+	uint16_t message_chunk_length;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	while (message_chunk_offset < message_length) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 62) {
+			message_chunk_length = 62;
+		}
+
+		memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+		memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (62 - message_chunk_length));
+
+		ret = stream_test_fixed_write_extra_out_1_low_level(stream_test, message_chunk_offset, message_chunk_data, ret_extra);
+
+		if (ret < 0) {
+			break;
+		}
+
+		message_chunk_offset += 62;
+	}
+
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_write_extra_out_2(StreamTest *stream_test, const char *message, uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[62];
+	uint16_t message_chunk_length;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	while (message_chunk_offset < message_length) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 62) {
+			message_chunk_length = 62;
+		}
+
+		memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+		memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (62 - message_chunk_length));
+
+		ret = stream_test_fixed_write_extra_out_2_low_level(stream_test, message_chunk_offset, message_chunk_data, ret_extra_1, ret_extra_2);
+
+		if (ret < 0) {
+			break;
+		}
+
+		message_chunk_offset += 62;
+	}
+
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_short_write(StreamTest *stream_test, const char *message, uint16_t message_length, uint16_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[60];
+	uint16_t message_chunk_length;
+	uint8_t message_chunk_written;
+
+	*ret_message_written = 0;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 60);
+
+		ret = stream_test_short_write_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, &message_chunk_written);
+
+		if (ret < 0) {
+			return ret;
+		}
+
+		*ret_message_written = message_chunk_written;
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (60 - message_chunk_length));
+
+			ret = stream_test_short_write_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, &message_chunk_written);
+
+			if (ret < 0) {
+				*ret_message_written = 0;
+
+				break;
+			}
+
+			*ret_message_written += message_chunk_written;
+
+			if (message_chunk_written < 60) {
+				break; // either last chunk or short write
+			}
+
+			message_chunk_offset += 60;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_short_write_extra_in_prefix_1(StreamTest *stream_test, uint8_t extra, const char *message, uint16_t message_length, uint16_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[59];
+	uint16_t message_chunk_length;
+	uint8_t message_chunk_written;
+
+	*ret_message_written = 0;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 59);
+
+		ret = stream_test_short_write_extra_in_prefix_1_low_level(stream_test, extra, message_length, message_chunk_offset, message_chunk_data, &message_chunk_written);
+
+		if (ret < 0) {
+			return ret;
+		}
+
+		*ret_message_written = message_chunk_written;
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 59) {
+				message_chunk_length = 59;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (59 - message_chunk_length));
+
+			ret = stream_test_short_write_extra_in_prefix_1_low_level(stream_test, extra, message_length, message_chunk_offset, message_chunk_data, &message_chunk_written);
+
+			if (ret < 0) {
+				*ret_message_written = 0;
+
+				break;
+			}
+
+			*ret_message_written += message_chunk_written;
+
+			if (message_chunk_written < 59) {
+				break; // either last chunk or short write
+			}
+
+			message_chunk_offset += 59;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_short_write_extra_in_prefix_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint16_t message_length, uint16_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[58];
+	uint16_t message_chunk_length;
+	uint8_t message_chunk_written;
+
+	*ret_message_written = 0;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 58);
+
+		ret = stream_test_short_write_extra_in_prefix_2_low_level(stream_test, extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data, &message_chunk_written);
+
+		if (ret < 0) {
+			return ret;
+		}
+
+		*ret_message_written = message_chunk_written;
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 58) {
+				message_chunk_length = 58;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (58 - message_chunk_length));
+
+			ret = stream_test_short_write_extra_in_prefix_2_low_level(stream_test, extra_1, extra_2, message_length, message_chunk_offset, message_chunk_data, &message_chunk_written);
+
+			if (ret < 0) {
+				*ret_message_written = 0;
+
+				break;
+			}
+
+			*ret_message_written += message_chunk_written;
+
+			if (message_chunk_written < 58) {
+				break; // either last chunk or short write
+			}
+
+			message_chunk_offset += 58;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_short_write_extra_in_suffix_1(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t extra, uint16_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[59];
+	uint16_t message_chunk_length;
+	uint8_t message_chunk_written;
+
+	*ret_message_written = 0;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 59);
+
+		ret = stream_test_short_write_extra_in_suffix_1_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, extra, &message_chunk_written);
+
+		if (ret < 0) {
+			return ret;
+		}
+
+		*ret_message_written = message_chunk_written;
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 59) {
+				message_chunk_length = 59;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (59 - message_chunk_length));
+
+			ret = stream_test_short_write_extra_in_suffix_1_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, extra, &message_chunk_written);
+
+			if (ret < 0) {
+				*ret_message_written = 0;
+
+				break;
+			}
+
+			*ret_message_written += message_chunk_written;
+
+			if (message_chunk_written < 59) {
+				break; // either last chunk or short write
+			}
+
+			message_chunk_offset += 59;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_short_write_extra_in_suffix_2(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t extra_1, uint8_t extra_2, uint16_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[58];
+	uint16_t message_chunk_length;
+	uint8_t message_chunk_written;
+
+	*ret_message_written = 0;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 58);
+
+		ret = stream_test_short_write_extra_in_suffix_2_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2, &message_chunk_written);
+
+		if (ret < 0) {
+			return ret;
+		}
+
+		*ret_message_written = message_chunk_written;
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 58) {
+				message_chunk_length = 58;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (58 - message_chunk_length));
+
+			ret = stream_test_short_write_extra_in_suffix_2_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, extra_1, extra_2, &message_chunk_written);
+
+			if (ret < 0) {
+				*ret_message_written = 0;
+
+				break;
+			}
+
+			*ret_message_written += message_chunk_written;
+
+			if (message_chunk_written < 58) {
+				break; // either last chunk or short write
+			}
+
+			message_chunk_offset += 58;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_short_write_extra_out_prefix_1(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t *ret_extra, uint16_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[60];
+	uint16_t message_chunk_length;
+	uint8_t message_chunk_written;
+
+	*ret_message_written = 0;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 60);
+
+		ret = stream_test_short_write_extra_out_prefix_1_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, ret_extra, &message_chunk_written);
+
+		if (ret < 0) {
+			return ret;
+		}
+
+		*ret_message_written = message_chunk_written;
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (60 - message_chunk_length));
+
+			ret = stream_test_short_write_extra_out_prefix_1_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, ret_extra, &message_chunk_written);
+
+			if (ret < 0) {
+				*ret_message_written = 0;
+
+				break;
+			}
+
+			*ret_message_written += message_chunk_written;
+
+			if (message_chunk_written < 60) {
+				break; // either last chunk or short write
+			}
+
+			message_chunk_offset += 60;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_short_write_extra_out_prefix_2(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint16_t *ret_message_written) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[60];
+	uint16_t message_chunk_length;
+	uint8_t message_chunk_written;
+
+	*ret_message_written = 0;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 60);
+
+		ret = stream_test_short_write_extra_out_prefix_2_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, ret_extra_1, ret_extra_2, &message_chunk_written);
+
+		if (ret < 0) {
+			return ret;
+		}
+
+		*ret_message_written = message_chunk_written;
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (60 - message_chunk_length));
+
+			ret = stream_test_short_write_extra_out_prefix_2_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, ret_extra_1, ret_extra_2, &message_chunk_written);
+
+			if (ret < 0) {
+				*ret_message_written = 0;
+
+				break;
+			}
+
+			*ret_message_written += message_chunk_written;
+
+			if (message_chunk_written < 60) {
+				break; // either last chunk or short write
+			}
+
+			message_chunk_offset += 60;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_short_write_extra_out_suffix_1(StreamTest *stream_test, const char *message, uint16_t message_length, uint16_t *ret_message_written, uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[60];
+	uint16_t message_chunk_length;
+	uint8_t message_chunk_written;
+
+	*ret_message_written = 0;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 60);
+
+		ret = stream_test_short_write_extra_out_suffix_1_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, &message_chunk_written, ret_extra);
+
+		if (ret < 0) {
+			return ret;
+		}
+
+		*ret_message_written = message_chunk_written;
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (60 - message_chunk_length));
+
+			ret = stream_test_short_write_extra_out_suffix_1_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, &message_chunk_written, ret_extra);
+
+			if (ret < 0) {
+				*ret_message_written = 0;
+
+				break;
+			}
+
+			*ret_message_written += message_chunk_written;
+
+			if (message_chunk_written < 60) {
+				break; // either last chunk or short write
+			}
+
+			message_chunk_offset += 60;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_short_write_extra_out_suffix_2(StreamTest *stream_test, const char *message, uint16_t message_length, uint16_t *ret_message_written, uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[60];
+	uint16_t message_chunk_length;
+	uint8_t message_chunk_written;
+
+	*ret_message_written = 0;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 60);
+
+		ret = stream_test_short_write_extra_out_suffix_2_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, &message_chunk_written, ret_extra_1, ret_extra_2);
+
+		if (ret < 0) {
+			return ret;
+		}
+
+		*ret_message_written = message_chunk_written;
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (60 - message_chunk_length));
+
+			ret = stream_test_short_write_extra_out_suffix_2_low_level(stream_test, message_length, message_chunk_offset, message_chunk_data, &message_chunk_written, ret_extra_1, ret_extra_2);
+
+			if (ret < 0) {
+				*ret_message_written = 0;
+
+				break;
+			}
+
+			*ret_message_written += message_chunk_written;
+
+			if (message_chunk_written < 60) {
+				break; // either last chunk or short write
+			}
+
+			message_chunk_offset += 60;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_short_write_extra_full(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint8_t extra_3, const char *message, uint16_t message_length, uint8_t extra_4, uint8_t *ret_extra_5, uint16_t *ret_message_written, uint8_t *ret_extra_6) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_chunk_offset = 0;
+	char message_chunk_data[56];
+	uint16_t message_chunk_length;
+	uint8_t message_chunk_written;
+
+	*ret_message_written = 0;
+
+	if (message_length == 0) {
+		memset(&message_chunk_data, 0, sizeof(char) * 56);
+
+		ret = stream_test_short_write_extra_full_low_level(stream_test, extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4, ret_extra_5, &message_chunk_written, ret_extra_6);
+
+		if (ret < 0) {
+			return ret;
+		}
+
+		*ret_message_written = message_chunk_written;
+	} else {
+		mutex_lock(&device_p->stream_mutex);
+
+		while (message_chunk_offset < message_length) {
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 56) {
+				message_chunk_length = 56;
+			}
+
+			memcpy(message_chunk_data, &message[message_chunk_offset], sizeof(char) * message_chunk_length);
+			memset(&message_chunk_data[message_chunk_length], 0, sizeof(char) * (56 - message_chunk_length));
+
+			ret = stream_test_short_write_extra_full_low_level(stream_test, extra_1, message_length, extra_2, message_chunk_offset, extra_3, message_chunk_data, extra_4, ret_extra_5, &message_chunk_written, ret_extra_6);
+
+			if (ret < 0) {
+				*ret_message_written = 0;
+
+				break;
+			}
+
+			*ret_message_written += message_chunk_written;
+
+			if (message_chunk_written < 56) {
+				break; // either last chunk or short write
+			}
+
+			message_chunk_offset += 56;
+		}
+
+		mutex_unlock(&device_p->stream_mutex);
+	}
+
+	return ret;
+}
+
+int stream_test_single_write(StreamTest *stream_test, const char *message, uint8_t message_length) {
+	char message_data[63];
+
+	if (message_length > 63) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (63 - message_length));
+
+	return stream_test_single_write_low_level(stream_test, message_length, message_data);
+}
+
+int stream_test_single_write_extra_in_prefix_1(StreamTest *stream_test, uint8_t extra, const char *message, uint8_t message_length) {
+	char message_data[62];
+
+	if (message_length > 62) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (62 - message_length));
+
+	return stream_test_single_write_extra_in_prefix_1_low_level(stream_test, extra, message_length, message_data);
+}
+
+int stream_test_single_write_extra_in_prefix_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint8_t message_length) {
+	char message_data[61];
+
+	if (message_length > 61) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (61 - message_length));
+
+	return stream_test_single_write_extra_in_prefix_2_low_level(stream_test, extra_1, extra_2, message_length, message_data);
+}
+
+int stream_test_single_write_extra_in_suffix_1(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t extra) {
+	char message_data[62];
+
+	if (message_length > 62) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (62 - message_length));
+
+	return stream_test_single_write_extra_in_suffix_1_low_level(stream_test, message_length, message_data, extra);
+}
+
+int stream_test_single_write_extra_in_suffix_2(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t extra_1, uint8_t extra_2) {
+	char message_data[61];
+
+	if (message_length > 61) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (61 - message_length));
+
+	return stream_test_single_write_extra_in_suffix_2_low_level(stream_test, message_length, message_data, extra_1, extra_2);
+}
+
+int stream_test_single_write_extra_in_full(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint8_t message_length, uint8_t extra_3) {
+	char message_data[60];
+
+	if (message_length > 60) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (60 - message_length));
+
+	return stream_test_single_write_extra_in_full_low_level(stream_test, extra_1, message_length, extra_2, message_data, extra_3);
+}
+
+int stream_test_single_write_extra_out_1(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_extra) {
+	char message_data[63];
+
+	if (message_length > 63) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (63 - message_length));
+
+	return stream_test_single_write_extra_out_1_low_level(stream_test, message_length, message_data, ret_extra);
+}
+
+int stream_test_single_write_extra_out_2(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	char message_data[63];
+
+	if (message_length > 63) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (63 - message_length));
+
+	return stream_test_single_write_extra_out_2_low_level(stream_test, message_length, message_data, ret_extra_1, ret_extra_2);
+}
+
+int stream_test_short_single_write(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_message_written) {
+	int ret = 0;
+	char message_data[63];
+	uint8_t message_written = 0;
+
+	if (message_length > 63) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (63 - message_length));
+
+	ret = stream_test_short_single_write_low_level(stream_test, message_length, message_data, &message_written);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_in_prefix_1(StreamTest *stream_test, uint8_t extra, const char *message, uint8_t message_length, uint8_t *ret_message_written) {
+	int ret = 0;
+	char message_data[62];
+	uint8_t message_written = 0;
+
+	if (message_length > 62) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (62 - message_length));
+
+	ret = stream_test_short_single_write_extra_in_prefix_1_low_level(stream_test, extra, message_length, message_data, &message_written);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_in_prefix_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint8_t message_length, uint8_t *ret_message_written) {
+	int ret = 0;
+	char message_data[61];
+	uint8_t message_written = 0;
+
+	if (message_length > 61) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (61 - message_length));
+
+	ret = stream_test_short_single_write_extra_in_prefix_2_low_level(stream_test, extra_1, extra_2, message_length, message_data, &message_written);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_in_suffix_1(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t extra, uint8_t *ret_message_written) {
+	int ret = 0;
+	char message_data[62];
+	uint8_t message_written = 0;
+
+	if (message_length > 62) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (62 - message_length));
+
+	ret = stream_test_short_single_write_extra_in_suffix_1_low_level(stream_test, message_length, message_data, extra, &message_written);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_in_suffix_2(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t extra_1, uint8_t extra_2, uint8_t *ret_message_written) {
+	int ret = 0;
+	char message_data[61];
+	uint8_t message_written = 0;
+
+	if (message_length > 61) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (61 - message_length));
+
+	ret = stream_test_short_single_write_extra_in_suffix_2_low_level(stream_test, message_length, message_data, extra_1, extra_2, &message_written);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_out_prefix_1(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_extra, uint8_t *ret_message_written) {
+	int ret = 0;
+	char message_data[62];
+	uint8_t message_written = 0;
+
+	if (message_length > 62) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (62 - message_length));
+
+	ret = stream_test_short_single_write_extra_out_prefix_1_low_level(stream_test, message_length, message_data, ret_extra, &message_written);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_out_prefix_2(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint8_t *ret_message_written) {
+	int ret = 0;
+	char message_data[62];
+	uint8_t message_written = 0;
+
+	if (message_length > 62) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (62 - message_length));
+
+	ret = stream_test_short_single_write_extra_out_prefix_2_low_level(stream_test, message_length, message_data, ret_extra_1, ret_extra_2, &message_written);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_out_suffix_1(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_message_written, uint8_t *ret_extra) {
+	int ret = 0;
+	char message_data[63];
+	uint8_t message_written = 0;
+
+	if (message_length > 63) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (63 - message_length));
+
+	ret = stream_test_short_single_write_extra_out_suffix_1_low_level(stream_test, message_length, message_data, &message_written, ret_extra);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_out_suffix_2(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_message_written, uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	int ret = 0;
+	char message_data[63];
+	uint8_t message_written = 0;
+
+	if (message_length > 63) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (63 - message_length));
+
+	ret = stream_test_short_single_write_extra_out_suffix_2_low_level(stream_test, message_length, message_data, &message_written, ret_extra_1, ret_extra_2);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = message_written;
+
+	return ret;
+}
+
+int stream_test_short_single_write_extra_full(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint8_t message_length, uint8_t extra_3, uint8_t *ret_extra_4, uint8_t *ret_message_written, uint8_t *ret_extra_5) {
+	int ret = 0;
+	char message_data[60];
+	uint8_t message_written = 0;
+
+	if (message_length > 60) {
+		return E_INVALID_PARAMETER;
+	}
+
+	memcpy(message_data, message, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (60 - message_length));
+
+	ret = stream_test_short_single_write_extra_full_low_level(stream_test, extra_1, message_length, extra_2, message_data, extra_3, ret_extra_4, &message_written, ret_extra_5);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_message_written = message_written;
+
+	return ret;
+}
+
+int stream_test_normal_read(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 0;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_normal_read_low_level(stream_test, &message_length, &message_chunk_offset, message_chunk_data);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 60) {
+			message_chunk_length = 60;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_normal_read_low_level(stream_test, &message_length, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 60 < message_length) {
+			ret = stream_test_normal_read_low_level(stream_test, &message_length, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_in_1(StreamTest *stream_test, uint8_t extra, char *ret_message, uint16_t *ret_message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 0;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_normal_read_extra_in_1_low_level(stream_test, extra, &message_length, &message_chunk_offset, message_chunk_data);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 60) {
+			message_chunk_length = 60;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_normal_read_extra_in_1_low_level(stream_test, extra, &message_length, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 60 < message_length) {
+			ret = stream_test_normal_read_extra_in_1_low_level(stream_test, extra, &message_length, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_in_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, char *ret_message, uint16_t *ret_message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 0;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_normal_read_extra_in_2_low_level(stream_test, extra_1, extra_2, &message_length, &message_chunk_offset, message_chunk_data);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 60) {
+			message_chunk_length = 60;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_normal_read_extra_in_2_low_level(stream_test, extra_1, extra_2, &message_length, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 60 < message_length) {
+			ret = stream_test_normal_read_extra_in_2_low_level(stream_test, extra_1, extra_2, &message_length, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_out_prefix_1(StreamTest *stream_test, uint8_t *ret_extra, char *ret_message, uint16_t *ret_message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 0;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[59];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_normal_read_extra_out_prefix_1_low_level(stream_test, ret_extra, &message_length, &message_chunk_offset, message_chunk_data);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 59) {
+			message_chunk_length = 59;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_normal_read_extra_out_prefix_1_low_level(stream_test, ret_extra, &message_length, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 59) {
+				message_chunk_length = 59;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 59 < message_length) {
+			ret = stream_test_normal_read_extra_out_prefix_1_low_level(stream_test, ret_extra, &message_length, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_out_prefix_2(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, char *ret_message, uint16_t *ret_message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 0;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[58];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_normal_read_extra_out_prefix_2_low_level(stream_test, ret_extra_1, ret_extra_2, &message_length, &message_chunk_offset, message_chunk_data);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 58) {
+			message_chunk_length = 58;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_normal_read_extra_out_prefix_2_low_level(stream_test, ret_extra_1, ret_extra_2, &message_length, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 58) {
+				message_chunk_length = 58;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 58 < message_length) {
+			ret = stream_test_normal_read_extra_out_prefix_2_low_level(stream_test, ret_extra_1, ret_extra_2, &message_length, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_out_suffix_1(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 0;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[59];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_normal_read_extra_out_suffix_1_low_level(stream_test, &message_length, &message_chunk_offset, message_chunk_data, ret_extra);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 59) {
+			message_chunk_length = 59;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_normal_read_extra_out_suffix_1_low_level(stream_test, &message_length, &message_chunk_offset, message_chunk_data, ret_extra);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 59) {
+				message_chunk_length = 59;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 59 < message_length) {
+			ret = stream_test_normal_read_extra_out_suffix_1_low_level(stream_test, &message_length, &message_chunk_offset, message_chunk_data, ret_extra);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_out_suffix_2(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 0;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[58];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_normal_read_extra_out_suffix_2_low_level(stream_test, &message_length, &message_chunk_offset, message_chunk_data, ret_extra_1, ret_extra_2);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 58) {
+			message_chunk_length = 58;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_normal_read_extra_out_suffix_2_low_level(stream_test, &message_length, &message_chunk_offset, message_chunk_data, ret_extra_1, ret_extra_2);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 58) {
+				message_chunk_length = 58;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 58 < message_length) {
+			ret = stream_test_normal_read_extra_out_suffix_2_low_level(stream_test, &message_length, &message_chunk_offset, message_chunk_data, ret_extra_1, ret_extra_2);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_normal_read_extra_out_full(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint8_t *ret_extra_3, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra_4) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 0;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[56];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_normal_read_extra_out_full_low_level(stream_test, ret_extra_1, &message_length, ret_extra_2, &message_chunk_offset, ret_extra_3, message_chunk_data, ret_extra_4);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 56) {
+			message_chunk_length = 56;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_normal_read_extra_out_full_low_level(stream_test, ret_extra_1, &message_length, ret_extra_2, &message_chunk_offset, ret_extra_3, message_chunk_data, ret_extra_4);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 56) {
+				message_chunk_length = 56;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 56 < message_length) {
+			ret = stream_test_normal_read_extra_out_full_low_level(stream_test, ret_extra_1, &message_length, ret_extra_2, &message_chunk_offset, ret_extra_3, message_chunk_data, ret_extra_4);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_read(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[62];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_fixed_read_low_level(stream_test, &message_chunk_offset, message_chunk_data);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	if (message_chunk_offset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 62) {
+			message_chunk_length = 62;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_fixed_read_low_level(stream_test, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 62) {
+				message_chunk_length = 62;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 62 < message_length) {
+			ret = stream_test_fixed_read_low_level(stream_test, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_in_1(StreamTest *stream_test, uint8_t extra, char *ret_message, uint16_t *ret_message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[62];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_fixed_read_extra_in_1_low_level(stream_test, extra, &message_chunk_offset, message_chunk_data);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	if (message_chunk_offset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 62) {
+			message_chunk_length = 62;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_fixed_read_extra_in_1_low_level(stream_test, extra, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 62) {
+				message_chunk_length = 62;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 62 < message_length) {
+			ret = stream_test_fixed_read_extra_in_1_low_level(stream_test, extra, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_in_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, char *ret_message, uint16_t *ret_message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[62];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_fixed_read_extra_in_2_low_level(stream_test, extra_1, extra_2, &message_chunk_offset, message_chunk_data);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	if (message_chunk_offset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 62) {
+			message_chunk_length = 62;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_fixed_read_extra_in_2_low_level(stream_test, extra_1, extra_2, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 62) {
+				message_chunk_length = 62;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 62 < message_length) {
+			ret = stream_test_fixed_read_extra_in_2_low_level(stream_test, extra_1, extra_2, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_out_prefix_1(StreamTest *stream_test, uint8_t *ret_extra, char *ret_message, uint16_t *ret_message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[61];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_fixed_read_extra_out_prefix_1_low_level(stream_test, ret_extra, &message_chunk_offset, message_chunk_data);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	if (message_chunk_offset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 61) {
+			message_chunk_length = 61;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_fixed_read_extra_out_prefix_1_low_level(stream_test, ret_extra, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 61) {
+				message_chunk_length = 61;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 61 < message_length) {
+			ret = stream_test_fixed_read_extra_out_prefix_1_low_level(stream_test, ret_extra, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_out_prefix_2(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, char *ret_message, uint16_t *ret_message_length) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_fixed_read_extra_out_prefix_2_low_level(stream_test, ret_extra_1, ret_extra_2, &message_chunk_offset, message_chunk_data);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	if (message_chunk_offset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 60) {
+			message_chunk_length = 60;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_fixed_read_extra_out_prefix_2_low_level(stream_test, ret_extra_1, ret_extra_2, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 60 < message_length) {
+			ret = stream_test_fixed_read_extra_out_prefix_2_low_level(stream_test, ret_extra_1, ret_extra_2, &message_chunk_offset, message_chunk_data);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_out_suffix_1(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[61];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_fixed_read_extra_out_suffix_1_low_level(stream_test, &message_chunk_offset, message_chunk_data, ret_extra);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	if (message_chunk_offset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 61) {
+			message_chunk_length = 61;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_fixed_read_extra_out_suffix_1_low_level(stream_test, &message_chunk_offset, message_chunk_data, ret_extra);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 61) {
+				message_chunk_length = 61;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 61 < message_length) {
+			ret = stream_test_fixed_read_extra_out_suffix_1_low_level(stream_test, &message_chunk_offset, message_chunk_data, ret_extra);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_out_suffix_2(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[60];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_fixed_read_extra_out_suffix_2_low_level(stream_test, &message_chunk_offset, message_chunk_data, ret_extra_1, ret_extra_2);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	if (message_chunk_offset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 60) {
+			message_chunk_length = 60;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_fixed_read_extra_out_suffix_2_low_level(stream_test, &message_chunk_offset, message_chunk_data, ret_extra_1, ret_extra_2);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 60) {
+				message_chunk_length = 60;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 60 < message_length) {
+			ret = stream_test_fixed_read_extra_out_suffix_2_low_level(stream_test, &message_chunk_offset, message_chunk_data, ret_extra_1, ret_extra_2);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_fixed_read_extra_out_full(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra_3) {
+	DevicePrivate *device_p = stream_test->p;
+	int ret = 0;
+	uint16_t message_length = 1000;
+	uint16_t message_chunk_offset;
+	char message_chunk_data[59];
+	bool message_out_of_sync;
+	uint16_t message_chunk_length;
+
+	*ret_message_length = 0;
+
+	mutex_lock(&device_p->stream_mutex);
+
+	ret = stream_test_fixed_read_extra_out_full_low_level(stream_test, ret_extra_1, &message_chunk_offset, ret_extra_2, message_chunk_data, ret_extra_3);
+
+	if (ret < 0) {
+		goto unlock;
+	}
+
+	if (message_chunk_offset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+		goto unlock;
+	}
+
+	message_out_of_sync = message_chunk_offset != 0;
+
+	if (!message_out_of_sync) {
+		message_chunk_length = message_length - message_chunk_offset;
+
+		if (message_chunk_length > 59) {
+			message_chunk_length = 59;
+		}
+
+		memcpy(ret_message, message_chunk_data, sizeof(char) * message_chunk_length);
+		*ret_message_length = message_chunk_length;
+
+		while (*ret_message_length < message_length) {
+			ret = stream_test_fixed_read_extra_out_full_low_level(stream_test, ret_extra_1, &message_chunk_offset, ret_extra_2, message_chunk_data, ret_extra_3);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+
+			message_out_of_sync = message_chunk_offset != *ret_message_length;
+
+			if (message_out_of_sync) {
+				break;
+			}
+
+			message_chunk_length = message_length - message_chunk_offset;
+
+			if (message_chunk_length > 59) {
+				message_chunk_length = 59;
+			}
+
+			memcpy(&ret_message[*ret_message_length], message_chunk_data, sizeof(char) * message_chunk_length);
+			*ret_message_length += message_chunk_length;
+		}
+	}
+
+	if (message_out_of_sync) {
+		*ret_message_length = 0; // return empty array
+
+		// discard remaining stream to bring it back in-sync
+		while (message_chunk_offset + 59 < message_length) {
+			ret = stream_test_fixed_read_extra_out_full_low_level(stream_test, ret_extra_1, &message_chunk_offset, ret_extra_2, message_chunk_data, ret_extra_3);
+
+			if (ret < 0) {
+				goto unlock;
+			}
+		}
+
+		ret = E_STREAM_OUT_OF_SYNC;
+	}
+
+unlock:
+	mutex_unlock(&device_p->stream_mutex);
+
+	return ret;
+}
+
+int stream_test_single_read(StreamTest *stream_test, char *ret_message, uint8_t *ret_message_length) {
+	int ret = 0;
+	uint8_t message_length;
+	char message_data[63];
+
+	*ret_message_length = 0;
+
+	ret = stream_test_single_read_low_level(stream_test, &message_length, message_data);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_message, message_data, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (63 - message_length));
+
+	*ret_message_length = message_length;
+
+	return ret;
+}
+
+int stream_test_single_read_extra_in_1(StreamTest *stream_test, uint8_t extra, char *ret_message, uint8_t *ret_message_length) {
+	int ret = 0;
+	uint8_t message_length;
+	char message_data[62];
+
+	*ret_message_length = 0;
+
+	ret = stream_test_single_read_extra_in_1_low_level(stream_test, extra, &message_length, message_data);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_message, message_data, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (62 - message_length));
+
+	*ret_message_length = message_length;
+
+	return ret;
+}
+
+int stream_test_single_read_extra_in_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, char *ret_message, uint8_t *ret_message_length) {
+	int ret = 0;
+	uint8_t message_length;
+	char message_data[62];
+
+	*ret_message_length = 0;
+
+	ret = stream_test_single_read_extra_in_2_low_level(stream_test, extra_1, extra_2, &message_length, message_data);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_message, message_data, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (62 - message_length));
+
+	*ret_message_length = message_length;
+
+	return ret;
+}
+
+int stream_test_single_read_extra_out_prefix_1(StreamTest *stream_test, uint8_t *ret_extra, char *ret_message, uint8_t *ret_message_length) {
+	int ret = 0;
+	uint8_t message_length;
+	char message_data[62];
+
+	*ret_message_length = 0;
+
+	ret = stream_test_single_read_extra_out_prefix_1_low_level(stream_test, ret_extra, &message_length, message_data);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_message, message_data, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (62 - message_length));
+
+	*ret_message_length = message_length;
+
+	return ret;
+}
+
+int stream_test_single_read_extra_out_prefix_2(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, char *ret_message, uint8_t *ret_message_length) {
+	int ret = 0;
+	uint8_t message_length;
+	char message_data[61];
+
+	*ret_message_length = 0;
+
+	ret = stream_test_single_read_extra_out_prefix_2_low_level(stream_test, ret_extra_1, ret_extra_2, &message_length, message_data);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_message, message_data, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (61 - message_length));
+
+	*ret_message_length = message_length;
+
+	return ret;
+}
+
+int stream_test_single_read_extra_out_suffix_1(StreamTest *stream_test, char *ret_message, uint8_t *ret_message_length, uint8_t *ret_extra) {
+	int ret = 0;
+	uint8_t message_length;
+	char message_data[62];
+
+	*ret_message_length = 0;
+
+	ret = stream_test_single_read_extra_out_suffix_1_low_level(stream_test, &message_length, message_data, ret_extra);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_message, message_data, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (62 - message_length));
+
+	*ret_message_length = message_length;
+
+	return ret;
+}
+
+int stream_test_single_read_extra_out_suffix_2(StreamTest *stream_test, char *ret_message, uint8_t *ret_message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2) {
+	int ret = 0;
+	uint8_t message_length;
+	char message_data[61];
+
+	*ret_message_length = 0;
+
+	ret = stream_test_single_read_extra_out_suffix_2_low_level(stream_test, &message_length, message_data, ret_extra_1, ret_extra_2);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_message, message_data, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (61 - message_length));
+
+	*ret_message_length = message_length;
+
+	return ret;
+}
+
+int stream_test_single_read_extra_out_full(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, char *ret_message, uint8_t *ret_message_length, uint8_t *ret_extra_3) {
+	int ret = 0;
+	uint8_t message_length;
+	char message_data[60];
+
+	*ret_message_length = 0;
+
+	ret = stream_test_single_read_extra_out_full_low_level(stream_test, ret_extra_1, &message_length, ret_extra_2, message_data, ret_extra_3);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_message, message_data, sizeof(char) * message_length);
+	memset(&message_data[message_length], 0, sizeof(char) * (60 - message_length));
+
+	*ret_message_length = message_length;
+
+	return ret;
+}
+
+#ifdef __cplusplus
+}
+#endif
@@ -0,0 +1,1768 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C/C++ Bindings Version 2.1.30                             *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+#ifndef BRICKLET_STREAM_TEST_H
+#define BRICKLET_STREAM_TEST_H
+
+#include "ip_connection.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * \defgroup BrickletStreamTest Stream Test Bricklet
+ */
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+typedef Device StreamTest;
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_WRITE_LOW_LEVEL 1
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL 2
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL 3
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL 4
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL 5
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL 6
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL 7
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL 8
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_WRITE_LOW_LEVEL 9
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL 10
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL 11
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL 12
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL 13
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL 14
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL 15
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL 16
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_WRITE_LOW_LEVEL 17
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL 18
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL 19
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL 20
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL 21
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL 22
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL 23
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL 24
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL 25
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL 26
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_WRITE_LOW_LEVEL 27
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL 28
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL 29
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL 30
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL 31
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_FULL_LOW_LEVEL 32
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL 33
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL 34
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_LOW_LEVEL 35
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL 36
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL 37
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL 38
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL 39
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL 40
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL 41
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL 42
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL 43
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL 44
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_READ_LOW_LEVEL 45
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL 46
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL 47
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL 48
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL 49
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL 50
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL 51
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL 52
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_READ_LOW_LEVEL 53
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL 54
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL 55
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL 56
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL 57
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL 58
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL 59
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL 60
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_READ_LOW_LEVEL 61
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL 62
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL 63
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL 64
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL 65
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL 66
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL 67
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL 68
+
+/**
+ * \ingroup BrickletStreamTest
+ */
+#define STREAM_TEST_FUNCTION_GET_IDENTITY 255
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_NORMAL_READ
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ_LOW_LEVEL 69
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1_LOW_LEVEL 70
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2_LOW_LEVEL 71
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1_LOW_LEVEL 72
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2_LOW_LEVEL 73
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL_LOW_LEVEL 74
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_FIXED_READ
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ_LOW_LEVEL 75
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1_LOW_LEVEL 76
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2_LOW_LEVEL 77
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1_LOW_LEVEL 78
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2_LOW_LEVEL 79
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL_LOW_LEVEL 80
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_SINGLE_READ
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ_LOW_LEVEL 81
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_1
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_1_LOW_LEVEL 82
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_2
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_2_LOW_LEVEL 83
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1_LOW_LEVEL 84
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2_LOW_LEVEL 85
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * See STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_FULL
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_FULL_LOW_LEVEL 86
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(char *message, uint16_t message_length, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ (-69)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(uint8_t extra, char *message, uint16_t message_length, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1 (-70)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(uint8_t extra_1, uint8_t extra_2, char *message, uint16_t message_length, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2 (-71)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(char *message, uint16_t message_length, uint8_t extra, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1 (-72)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(char *message, uint16_t message_length, uint8_t extra_1, uint8_t extra_2, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2 (-73)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(uint8_t extra_1, uint8_t extra_2, uint8_t extra_3, char *message, uint16_t message_length, uint8_t extra_4, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL (-74)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(char *message, uint16_t message_length, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ (-75)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(uint8_t extra, char *message, uint16_t message_length, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1 (-76)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(uint8_t extra_1, uint8_t extra_2, char *message, uint16_t message_length, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2 (-77)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(char *message, uint16_t message_length, uint8_t extra, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1 (-78)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(char *message, uint16_t message_length, uint8_t extra_1, uint8_t extra_2, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2 (-79)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(uint8_t extra_1, uint8_t extra_2, char *message, uint16_t message_length, uint8_t extra_3, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL (-80)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(char *message, uint8_t message_length, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ (-81)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(uint8_t extra, char *message, uint8_t message_length, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_1 (-82)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(uint8_t extra_1, uint8_t extra_2, char *message, uint8_t message_length, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_2 (-83)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(char *message, uint8_t message_length, uint8_t extra, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1 (-84)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(char *message, uint8_t message_length, uint8_t extra_1, uint8_t extra_2, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2 (-85)
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Signature: \code void callback(uint8_t extra_1, uint8_t extra_2, char *message, uint8_t message_length, uint8_t extra_3, void *user_data) \endcode
+ * 
+ * 
+ * \note
+ *  If reconstructing the value fails, the callback is triggered with NULL for message.
+ */
+#define STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_FULL (-86)
+
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * This constant is used to identify a Stream Test Bricklet.
+ *
+ * The {@link stream_test_get_identity} function and the
+ * {@link IPCON_CALLBACK_ENUMERATE} callback of the IP Connection have a
+ * \c device_identifier parameter to specify the Brick's or Bricklet's type.
+ */
+#define STREAM_TEST_DEVICE_IDENTIFIER 21111
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * This constant represents the display name of a Stream Test Bricklet.
+ */
+#define STREAM_TEST_DEVICE_DISPLAY_NAME "Stream Test Bricklet"
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Creates the device object \c stream_test with the unique device ID \c uid and adds
+ * it to the IPConnection \c ipcon.
+ */
+void stream_test_create(StreamTest *stream_test, const char *uid, IPConnection *ipcon);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Removes the device object \c stream_test from its IPConnection and destroys it.
+ * The device object cannot be used anymore afterwards.
+ */
+void stream_test_destroy(StreamTest *stream_test);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Returns the response expected flag for the function specified by the
+ * \c function_id parameter. It is *true* if the function is expected to
+ * send a response, *false* otherwise.
+ *
+ * For getter functions this is enabled by default and cannot be disabled,
+ * because those functions will always send a response. For callback
+ * configuration functions it is enabled by default too, but can be disabled
+ * via the stream_test_set_response_expected function. For setter functions it is
+ * disabled by default and can be enabled.
+ *
+ * Enabling the response expected flag for a setter function allows to
+ * detect timeouts and other error conditions calls of this setter as well.
+ * The device will then send a response for this purpose. If this flag is
+ * disabled for a setter function then no response is sent and errors are
+ * silently ignored, because they cannot be detected.
+ */
+int stream_test_get_response_expected(StreamTest *stream_test, uint8_t function_id, bool *ret_response_expected);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Changes the response expected flag of the function specified by the
+ * \c function_id parameter. This flag can only be changed for setter
+ * (default value: *false*) and callback configuration functions
+ * (default value: *true*). For getter functions it is always enabled.
+ *
+ * Enabling the response expected flag for a setter function allows to detect
+ * timeouts and other error conditions calls of this setter as well. The device
+ * will then send a response for this purpose. If this flag is disabled for a
+ * setter function then no response is sent and errors are silently ignored,
+ * because they cannot be detected.
+ */
+int stream_test_set_response_expected(StreamTest *stream_test, uint8_t function_id, bool response_expected);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Changes the response expected flag for all setter and callback configuration
+ * functions of this device at once.
+ */
+int stream_test_set_response_expected_all(StreamTest *stream_test, bool response_expected);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Registers the given \c function with the given \c callback_id. The
+ * \c user_data will be passed as the last parameter to the \c function.
+ */
+void stream_test_register_callback(StreamTest *stream_test, int16_t callback_id, void (*function)(void), void *user_data);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Returns the API version (major, minor, release) of the bindings for this
+ * device.
+ */
+int stream_test_get_api_version(StreamTest *stream_test, uint8_t ret_api_version[3]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_in_prefix_1_low_level(StreamTest *stream_test, uint8_t extra, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_in_prefix_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_in_suffix_1_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59], uint8_t extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_in_suffix_2_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58], uint8_t extra_1, uint8_t extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_in_full_low_level(StreamTest *stream_test, uint8_t extra_1, uint16_t message_length, uint8_t extra_2, uint16_t message_chunk_offset, uint8_t extra_3, char message_chunk_data[56], uint8_t extra_4);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_out_1_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_out_2_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_low_level(StreamTest *stream_test, uint16_t message_chunk_offset, char message_chunk_data[62]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_in_prefix_1_low_level(StreamTest *stream_test, uint8_t extra, uint16_t message_chunk_offset, char message_chunk_data[61]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_in_prefix_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint16_t message_chunk_offset, char message_chunk_data[60]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_in_suffix_1_low_level(StreamTest *stream_test, uint16_t message_chunk_offset, char message_chunk_data[61], uint8_t extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_in_suffix_2_low_level(StreamTest *stream_test, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t extra_1, uint8_t extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_in_full_low_level(StreamTest *stream_test, uint8_t extra_1, uint16_t message_chunk_offset, uint8_t extra_2, char message_chunk_data[59], uint8_t extra_3);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_out_1_low_level(StreamTest *stream_test, uint16_t message_chunk_offset, char message_chunk_data[62], uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_out_2_low_level(StreamTest *stream_test, uint16_t message_chunk_offset, char message_chunk_data[62], uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_message_chunk_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_in_prefix_1_low_level(StreamTest *stream_test, uint8_t extra, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59], uint8_t *ret_message_chunk_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_in_prefix_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58], uint8_t *ret_message_chunk_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_in_suffix_1_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[59], uint8_t extra, uint8_t *ret_message_chunk_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_in_suffix_2_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[58], uint8_t extra_1, uint8_t extra_2, uint8_t *ret_message_chunk_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_out_prefix_1_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_extra, uint8_t *ret_message_chunk_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_out_prefix_2_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint8_t *ret_message_chunk_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_out_suffix_1_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_message_chunk_written, uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_out_suffix_2_low_level(StreamTest *stream_test, uint16_t message_length, uint16_t message_chunk_offset, char message_chunk_data[60], uint8_t *ret_message_chunk_written, uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_full_low_level(StreamTest *stream_test, uint8_t extra_1, uint16_t message_length, uint8_t extra_2, uint16_t message_chunk_offset, uint8_t extra_3, char message_chunk_data[56], uint8_t extra_4, uint8_t *ret_extra_5, uint8_t *ret_message_chunk_written, uint8_t *ret_extra_6);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_in_prefix_1_low_level(StreamTest *stream_test, uint8_t extra, uint8_t message_length, char message_data[62]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_in_prefix_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint8_t message_length, char message_data[61]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_in_suffix_1_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[62], uint8_t extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_in_suffix_2_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[61], uint8_t extra_1, uint8_t extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_in_full_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t message_length, uint8_t extra_2, char message_data[60], uint8_t extra_3);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_out_1_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63], uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_out_2_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63], uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63], uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_in_prefix_1_low_level(StreamTest *stream_test, uint8_t extra, uint8_t message_length, char message_data[62], uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_in_prefix_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint8_t message_length, char message_data[61], uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_in_suffix_1_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[62], uint8_t extra, uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_in_suffix_2_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[61], uint8_t extra_1, uint8_t extra_2, uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_out_prefix_1_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[62], uint8_t *ret_extra, uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_out_prefix_2_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[62], uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_out_suffix_1_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63], uint8_t *ret_message_written, uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_out_suffix_2_low_level(StreamTest *stream_test, uint8_t message_length, char message_data[63], uint8_t *ret_message_written, uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_full_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t message_length, uint8_t extra_2, char message_data[60], uint8_t extra_3, uint8_t *ret_extra_4, uint8_t *ret_message_written, uint8_t *ret_extra_5);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_low_level(StreamTest *stream_test, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[60]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_in_1_low_level(StreamTest *stream_test, uint8_t extra, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[60]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_in_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[60]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_out_prefix_1_low_level(StreamTest *stream_test, uint8_t *ret_extra, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[59]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_out_prefix_2_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[58]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_out_suffix_1_low_level(StreamTest *stream_test, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[59], uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_out_suffix_2_low_level(StreamTest *stream_test, uint16_t *ret_message_length, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[58], uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_out_full_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint16_t *ret_message_length, uint8_t *ret_extra_2, uint16_t *ret_message_chunk_offset, uint8_t *ret_extra_3, char ret_message_chunk_data[56], uint8_t *ret_extra_4);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_low_level(StreamTest *stream_test, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[62]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_in_1_low_level(StreamTest *stream_test, uint8_t extra, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[62]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_in_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[62]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_out_prefix_1_low_level(StreamTest *stream_test, uint8_t *ret_extra, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[61]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_out_prefix_2_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[60]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_out_suffix_1_low_level(StreamTest *stream_test, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[61], uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_out_suffix_2_low_level(StreamTest *stream_test, uint16_t *ret_message_chunk_offset, char ret_message_chunk_data[60], uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_out_full_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint16_t *ret_message_chunk_offset, uint8_t *ret_extra_2, char ret_message_chunk_data[59], uint8_t *ret_extra_3);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_low_level(StreamTest *stream_test, uint8_t *ret_message_length, char ret_message_data[63]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_in_1_low_level(StreamTest *stream_test, uint8_t extra, uint8_t *ret_message_length, char ret_message_data[62]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_in_2_low_level(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint8_t *ret_message_length, char ret_message_data[62]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_out_prefix_1_low_level(StreamTest *stream_test, uint8_t *ret_extra, uint8_t *ret_message_length, char ret_message_data[62]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_out_prefix_2_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint8_t *ret_message_length, char ret_message_data[61]);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_out_suffix_1_low_level(StreamTest *stream_test, uint8_t *ret_message_length, char ret_message_data[62], uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_out_suffix_2_low_level(StreamTest *stream_test, uint8_t *ret_message_length, char ret_message_data[61], uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_out_full_low_level(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_message_length, uint8_t *ret_extra_2, char ret_message_data[60], uint8_t *ret_extra_3);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * Returns the UID, the UID where the Bricklet is connected to,
+ * the position, the hardware and firmware version as well as the
+ * device identifier.
+ * 
+ * The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+ * A Bricklet connected to an :ref:`Isolator Bricklet <isolator_bricklet>` is always at
+ * position 'z'.
+ * 
+ * The device identifier numbers can be found :ref:`here <device_identifier>`.
+ * |device_identifier_constant|
+ */
+int stream_test_get_identity(StreamTest *stream_test, char ret_uid[8], char ret_connected_uid[8], char *ret_position, uint8_t ret_hardware_version[3], uint8_t ret_firmware_version[3], uint16_t *ret_device_identifier);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write(StreamTest *stream_test, const char *message, uint16_t message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_in_prefix_1(StreamTest *stream_test, uint8_t extra, const char *message, uint16_t message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_in_prefix_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint16_t message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_in_suffix_1(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_in_suffix_2(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t extra_1, uint8_t extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_in_full(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint8_t extra_3, const char *message, uint16_t message_length, uint8_t extra_4);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_out_1(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_write_extra_out_2(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write(StreamTest *stream_test, const char *message);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_in_prefix_1(StreamTest *stream_test, uint8_t extra, const char *message);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_in_prefix_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_in_suffix_1(StreamTest *stream_test, const char *message, uint8_t extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_in_suffix_2(StreamTest *stream_test, const char *message, uint8_t extra_1, uint8_t extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_in_full(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint8_t extra_3);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_out_1(StreamTest *stream_test, const char *message, uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_write_extra_out_2(StreamTest *stream_test, const char *message, uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write(StreamTest *stream_test, const char *message, uint16_t message_length, uint16_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_in_prefix_1(StreamTest *stream_test, uint8_t extra, const char *message, uint16_t message_length, uint16_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_in_prefix_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint16_t message_length, uint16_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_in_suffix_1(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t extra, uint16_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_in_suffix_2(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t extra_1, uint8_t extra_2, uint16_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_out_prefix_1(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t *ret_extra, uint16_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_out_prefix_2(StreamTest *stream_test, const char *message, uint16_t message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint16_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_out_suffix_1(StreamTest *stream_test, const char *message, uint16_t message_length, uint16_t *ret_message_written, uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_out_suffix_2(StreamTest *stream_test, const char *message, uint16_t message_length, uint16_t *ret_message_written, uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_write_extra_full(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, uint8_t extra_3, const char *message, uint16_t message_length, uint8_t extra_4, uint8_t *ret_extra_5, uint16_t *ret_message_written, uint8_t *ret_extra_6);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write(StreamTest *stream_test, const char *message, uint8_t message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_in_prefix_1(StreamTest *stream_test, uint8_t extra, const char *message, uint8_t message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_in_prefix_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint8_t message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_in_suffix_1(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_in_suffix_2(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t extra_1, uint8_t extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_in_full(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint8_t message_length, uint8_t extra_3);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_out_1(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_write_extra_out_2(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_in_prefix_1(StreamTest *stream_test, uint8_t extra, const char *message, uint8_t message_length, uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_in_prefix_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint8_t message_length, uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_in_suffix_1(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t extra, uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_in_suffix_2(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t extra_1, uint8_t extra_2, uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_out_prefix_1(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_extra, uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_out_prefix_2(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint8_t *ret_message_written);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_out_suffix_1(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_message_written, uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_out_suffix_2(StreamTest *stream_test, const char *message, uint8_t message_length, uint8_t *ret_message_written, uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_short_single_write_extra_full(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, const char *message, uint8_t message_length, uint8_t extra_3, uint8_t *ret_extra_4, uint8_t *ret_message_written, uint8_t *ret_extra_5);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_in_1(StreamTest *stream_test, uint8_t extra, char *ret_message, uint16_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_in_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, char *ret_message, uint16_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_out_prefix_1(StreamTest *stream_test, uint8_t *ret_extra, char *ret_message, uint16_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_out_prefix_2(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, char *ret_message, uint16_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_out_suffix_1(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_out_suffix_2(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_normal_read_extra_out_full(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, uint8_t *ret_extra_3, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra_4);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_in_1(StreamTest *stream_test, uint8_t extra, char *ret_message, uint16_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_in_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, char *ret_message, uint16_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_out_prefix_1(StreamTest *stream_test, uint8_t *ret_extra, char *ret_message, uint16_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_out_prefix_2(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, char *ret_message, uint16_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_out_suffix_1(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_out_suffix_2(StreamTest *stream_test, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_fixed_read_extra_out_full(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, char *ret_message, uint16_t *ret_message_length, uint8_t *ret_extra_3);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read(StreamTest *stream_test, char *ret_message, uint8_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_in_1(StreamTest *stream_test, uint8_t extra, char *ret_message, uint8_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_in_2(StreamTest *stream_test, uint8_t extra_1, uint8_t extra_2, char *ret_message, uint8_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_out_prefix_1(StreamTest *stream_test, uint8_t *ret_extra, char *ret_message, uint8_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_out_prefix_2(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, char *ret_message, uint8_t *ret_message_length);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_out_suffix_1(StreamTest *stream_test, char *ret_message, uint8_t *ret_message_length, uint8_t *ret_extra);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_out_suffix_2(StreamTest *stream_test, char *ret_message, uint8_t *ret_message_length, uint8_t *ret_extra_1, uint8_t *ret_extra_2);
+
+/**
+ * \ingroup BrickletStreamTest
+ *
+ * 
+ */
+int stream_test_single_read_extra_out_full(StreamTest *stream_test, uint8_t *ret_extra_1, uint8_t *ret_extra_2, char *ret_message, uint8_t *ret_message_length, uint8_t *ret_extra_3);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
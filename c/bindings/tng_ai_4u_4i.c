@@ -0,0 +1,585 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C/C++ Bindings Version 2.1.30                             *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+
+#define IPCON_EXPOSE_INTERNALS
+
+#include "tng_ai_4u_4i.h"
+
+#include <string.h>
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+
+
+#if defined _MSC_VER || defined __BORLANDC__
+	#pragma pack(push)
+	#pragma pack(1)
+	#define ATTRIBUTE_PACKED
+#elif defined __GNUC__
+	#ifdef _WIN32
+		// workaround struct packing bug in GCC 4.7 on Windows
+		// https://gcc.gnu.org/bugzilla/show_bug.cgi?id=52991
+		#define ATTRIBUTE_PACKED __attribute__((gcc_struct, packed))
+	#else
+		#define ATTRIBUTE_PACKED __attribute__((packed))
+	#endif
+#else
+	#error unknown compiler, do not know how to enable struct packing
+#endif
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetValues_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint64_t timestamp;
+	int32_t voltages[4];
+	int32_t currents[4];
+} ATTRIBUTE_PACKED GetValues_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetVoltages_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint64_t timestamp;
+	int32_t voltages[4];
+} ATTRIBUTE_PACKED GetVoltages_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetCurrents_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint64_t timestamp;
+	int32_t currents[4];
+} ATTRIBUTE_PACKED GetCurrents_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+} ATTRIBUTE_PACKED GetSelectedVoltage_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint64_t timestamp;
+	int32_t voltage;
+} ATTRIBUTE_PACKED GetSelectedVoltage_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t channel;
+} ATTRIBUTE_PACKED GetSelectedCurrent_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint64_t timestamp;
+	int32_t current;
+} ATTRIBUTE_PACKED GetSelectedCurrent_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetTimestamp_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint64_t timestamp;
+} ATTRIBUTE_PACKED GetTimestamp_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED CopyFirmware_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t status;
+} ATTRIBUTE_PACKED CopyFirmware_Response;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t pointer;
+} ATTRIBUTE_PACKED SetWriteFirmwarePointer_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t data[64];
+} ATTRIBUTE_PACKED WriteFirmware_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint8_t status;
+} ATTRIBUTE_PACKED WriteFirmware_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED Reset_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t uid;
+} ATTRIBUTE_PACKED WriteUID_Request;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED ReadUID_Request;
+
+typedef struct {
+	PacketHeader header;
+	uint32_t uid;
+} ATTRIBUTE_PACKED ReadUID_Response;
+
+typedef struct {
+	PacketHeader header;
+} ATTRIBUTE_PACKED GetIdentity_Request;
+
+typedef struct {
+	PacketHeader header;
+	char uid[8];
+	char connected_uid[8];
+	char position;
+	uint8_t hardware_version[3];
+	uint8_t firmware_version[3];
+	uint16_t device_identifier;
+} ATTRIBUTE_PACKED GetIdentity_Response;
+
+#if defined _MSC_VER || defined __BORLANDC__
+	#pragma pack(pop)
+#endif
+#undef ATTRIBUTE_PACKED
+
+void ai_4u_4i_create(AI4U4I *ai_4u_4i, const char *uid, IPConnection *ipcon) {
+	IPConnectionPrivate *ipcon_p = ipcon->p;
+	DevicePrivate *device_p;
+
+	device_create(ai_4u_4i, uid, ipcon_p, 2, 0, 0, AI_4U_4I_DEVICE_IDENTIFIER);
+
+	device_p = ai_4u_4i->p;
+
+	device_p->response_expected[AI_4U_4I_FUNCTION_GET_VALUES] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_GET_VOLTAGES] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_GET_CURRENTS] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_GET_SELECTED_VOLTAGE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_GET_SELECTED_CURRENT] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_GET_TIMESTAMP] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_COPY_FIRMWARE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_SET_WRITE_FIRMWARE_POINTER] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_WRITE_FIRMWARE] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_RESET] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_WRITE_UID] = DEVICE_RESPONSE_EXPECTED_FALSE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_READ_UID] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+	device_p->response_expected[AI_4U_4I_FUNCTION_GET_IDENTITY] = DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+	ipcon_add_device(ipcon_p, device_p);
+}
+
+void ai_4u_4i_destroy(AI4U4I *ai_4u_4i) {
+	device_release(ai_4u_4i->p);
+}
+
+int ai_4u_4i_get_response_expected(AI4U4I *ai_4u_4i, uint8_t function_id, bool *ret_response_expected) {
+	return device_get_response_expected(ai_4u_4i->p, function_id, ret_response_expected);
+}
+
+int ai_4u_4i_set_response_expected(AI4U4I *ai_4u_4i, uint8_t function_id, bool response_expected) {
+	return device_set_response_expected(ai_4u_4i->p, function_id, response_expected);
+}
+
+int ai_4u_4i_set_response_expected_all(AI4U4I *ai_4u_4i, bool response_expected) {
+	return device_set_response_expected_all(ai_4u_4i->p, response_expected);
+}
+
+
+int ai_4u_4i_get_api_version(AI4U4I *ai_4u_4i, uint8_t ret_api_version[3]) {
+	return device_get_api_version(ai_4u_4i->p, ret_api_version);
+}
+
+int ai_4u_4i_get_values(AI4U4I *ai_4u_4i, uint64_t *ret_timestamp, int32_t ret_voltages[4], int32_t ret_currents[4]) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	GetValues_Request request;
+	GetValues_Response response;
+	int ret;
+	int i;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_GET_VALUES, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_timestamp = leconvert_uint64_from(response.timestamp);
+	for (i = 0; i < 4; i++) ret_voltages[i] = leconvert_int32_from(response.voltages[i]);
+	for (i = 0; i < 4; i++) ret_currents[i] = leconvert_int32_from(response.currents[i]);
+
+	return ret;
+}
+
+int ai_4u_4i_get_voltages(AI4U4I *ai_4u_4i, uint64_t *ret_timestamp, int32_t ret_voltages[4]) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	GetVoltages_Request request;
+	GetVoltages_Response response;
+	int ret;
+	int i;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_GET_VOLTAGES, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_timestamp = leconvert_uint64_from(response.timestamp);
+	for (i = 0; i < 4; i++) ret_voltages[i] = leconvert_int32_from(response.voltages[i]);
+
+	return ret;
+}
+
+int ai_4u_4i_get_currents(AI4U4I *ai_4u_4i, uint64_t *ret_timestamp, int32_t ret_currents[4]) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	GetCurrents_Request request;
+	GetCurrents_Response response;
+	int ret;
+	int i;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_GET_CURRENTS, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_timestamp = leconvert_uint64_from(response.timestamp);
+	for (i = 0; i < 4; i++) ret_currents[i] = leconvert_int32_from(response.currents[i]);
+
+	return ret;
+}
+
+int ai_4u_4i_get_selected_voltage(AI4U4I *ai_4u_4i, uint8_t channel, uint64_t *ret_timestamp, int32_t *ret_voltage) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	GetSelectedVoltage_Request request;
+	GetSelectedVoltage_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_GET_SELECTED_VOLTAGE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_timestamp = leconvert_uint64_from(response.timestamp);
+	*ret_voltage = leconvert_int32_from(response.voltage);
+
+	return ret;
+}
+
+int ai_4u_4i_get_selected_current(AI4U4I *ai_4u_4i, uint8_t channel, uint64_t *ret_timestamp, int32_t *ret_current) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	GetSelectedCurrent_Request request;
+	GetSelectedCurrent_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_GET_SELECTED_CURRENT, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.channel = channel;
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_timestamp = leconvert_uint64_from(response.timestamp);
+	*ret_current = leconvert_int32_from(response.current);
+
+	return ret;
+}
+
+int ai_4u_4i_get_timestamp(AI4U4I *ai_4u_4i, uint64_t *ret_timestamp) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	GetTimestamp_Request request;
+	GetTimestamp_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_GET_TIMESTAMP, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_timestamp = leconvert_uint64_from(response.timestamp);
+
+	return ret;
+}
+
+int ai_4u_4i_copy_firmware(AI4U4I *ai_4u_4i, uint8_t *ret_status) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	CopyFirmware_Request request;
+	CopyFirmware_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_COPY_FIRMWARE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_status = response.status;
+
+	return ret;
+}
+
+int ai_4u_4i_set_write_firmware_pointer(AI4U4I *ai_4u_4i, uint32_t pointer) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	SetWriteFirmwarePointer_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_SET_WRITE_FIRMWARE_POINTER, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.pointer = leconvert_uint32_to(pointer);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int ai_4u_4i_write_firmware(AI4U4I *ai_4u_4i, uint8_t data[64], uint8_t *ret_status) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	WriteFirmware_Request request;
+	WriteFirmware_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_WRITE_FIRMWARE, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(request.data, data, 64 * sizeof(uint8_t));
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_status = response.status;
+
+	return ret;
+}
+
+int ai_4u_4i_reset(AI4U4I *ai_4u_4i) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	Reset_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_RESET, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int ai_4u_4i_write_uid(AI4U4I *ai_4u_4i, uint32_t uid) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	WriteUID_Request request;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_WRITE_UID, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	request.uid = leconvert_uint32_to(uid);
+
+	ret = device_send_request(device_p, (Packet *)&request, NULL, 0);
+
+	return ret;
+}
+
+int ai_4u_4i_read_uid(AI4U4I *ai_4u_4i, uint32_t *ret_uid) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	ReadUID_Request request;
+	ReadUID_Response response;
+	int ret;
+
+	ret = device_check_validity(device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_READ_UID, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	*ret_uid = leconvert_uint32_from(response.uid);
+
+	return ret;
+}
+
+int ai_4u_4i_get_identity(AI4U4I *ai_4u_4i, char ret_uid[8], char ret_connected_uid[8], char *ret_position, uint8_t ret_hardware_version[3], uint8_t ret_firmware_version[3], uint16_t *ret_device_identifier) {
+	DevicePrivate *device_p = ai_4u_4i->p;
+	GetIdentity_Request request;
+	GetIdentity_Response response;
+	int ret;
+
+	ret = packet_header_create(&request.header, sizeof(request), AI_4U_4I_FUNCTION_GET_IDENTITY, device_p->ipcon_p, device_p);
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	ret = device_send_request(device_p, (Packet *)&request, (Packet *)&response, sizeof(response));
+
+	if (ret < 0) {
+		return ret;
+	}
+
+	memcpy(ret_uid, response.uid, 8);
+	memcpy(ret_connected_uid, response.connected_uid, 8);
+	*ret_position = response.position;
+	memcpy(ret_hardware_version, response.hardware_version, 3 * sizeof(uint8_t));
+	memcpy(ret_firmware_version, response.firmware_version, 3 * sizeof(uint8_t));
+	*ret_device_identifier = leconvert_uint16_from(response.device_identifier);
+
+	return ret;
+}
+
+#ifdef __cplusplus
+}
+#endif
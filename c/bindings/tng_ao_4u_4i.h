@@ -0,0 +1,382 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C/C++ Bindings Version 2.1.30                             *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+#ifndef TNG_AO_4U_4I_H
+#define TNG_AO_4U_4I_H
+
+#include "ip_connection.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * \defgroup TNGAO4U4I TNG AO 4U 4I
+ */
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * TBD
+ */
+typedef Device AO4U4I;
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_SET_VALUES 1
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_GET_VALUES 2
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_SET_VOLTAGES 3
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_GET_VOLTAGES 4
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_SET_CURRENTS 5
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_GET_CURRENTS 6
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_SET_SELECTED_VOLTAGE 7
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_GET_SELECTED_VOLTAGE 8
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_SET_SELECTED_CURRENT 9
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_GET_SELECTED_CURRENT 10
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_GET_TIMESTAMP 234
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_COPY_FIRMWARE 235
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_SET_WRITE_FIRMWARE_POINTER 237
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_WRITE_FIRMWARE 238
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_RESET 243
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_WRITE_UID 248
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_READ_UID 249
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_FUNCTION_GET_IDENTITY 255
+
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_COPY_STATUS_OK 0
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_COPY_STATUS_DEVICE_IDENTIFIER_INCORRECT 1
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_COPY_STATUS_MAGIC_NUMBER_INCORRECT 2
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_COPY_STATUS_LENGTH_MALFORMED 3
+
+/**
+ * \ingroup TNGAO4U4I
+ */
+#define AO_4U_4I_COPY_STATUS_CRC_MISMATCH 4
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * This constant is used to identify a TNG AO 4U 4I.
+ *
+ * The {@link ao_4u_4i_get_identity} function and the
+ * {@link IPCON_CALLBACK_ENUMERATE} callback of the IP Connection have a
+ * \c device_identifier parameter to specify the Brick's or Bricklet's type.
+ */
+#define AO_4U_4I_DEVICE_IDENTIFIER 206
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * This constant represents the display name of a TNG AO 4U 4I.
+ */
+#define AO_4U_4I_DEVICE_DISPLAY_NAME "TNG AO 4U 4I"
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * Creates the device object \c ao_4u_4i with the unique device ID \c uid and adds
+ * it to the IPConnection \c ipcon.
+ */
+void ao_4u_4i_create(AO4U4I *ao_4u_4i, const char *uid, IPConnection *ipcon);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * Removes the device object \c ao_4u_4i from its IPConnection and destroys it.
+ * The device object cannot be used anymore afterwards.
+ */
+void ao_4u_4i_destroy(AO4U4I *ao_4u_4i);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * Returns the response expected flag for the function specified by the
+ * \c function_id parameter. It is *true* if the function is expected to
+ * send a response, *false* otherwise.
+ *
+ * For getter functions this is enabled by default and cannot be disabled,
+ * because those functions will always send a response. For callback
+ * configuration functions it is enabled by default too, but can be disabled
+ * via the ao_4u_4i_set_response_expected function. For setter functions it is
+ * disabled by default and can be enabled.
+ *
+ * Enabling the response expected flag for a setter function allows to
+ * detect timeouts and other error conditions calls of this setter as well.
+ * The device will then send a response for this purpose. If this flag is
+ * disabled for a setter function then no response is sent and errors are
+ * silently ignored, because they cannot be detected.
+ */
+int ao_4u_4i_get_response_expected(AO4U4I *ao_4u_4i, uint8_t function_id, bool *ret_response_expected);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * Changes the response expected flag of the function specified by the
+ * \c function_id parameter. This flag can only be changed for setter
+ * (default value: *false*) and callback configuration functions
+ * (default value: *true*). For getter functions it is always enabled.
+ *
+ * Enabling the response expected flag for a setter function allows to detect
+ * timeouts and other error conditions calls of this setter as well. The device
+ * will then send a response for this purpose. If this flag is disabled for a
+ * setter function then no response is sent and errors are silently ignored,
+ * because they cannot be detected.
+ */
+int ao_4u_4i_set_response_expected(AO4U4I *ao_4u_4i, uint8_t function_id, bool response_expected);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * Changes the response expected flag for all setter and callback configuration
+ * functions of this device at once.
+ */
+int ao_4u_4i_set_response_expected_all(AO4U4I *ao_4u_4i, bool response_expected);
+
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * Returns the API version (major, minor, release) of the bindings for this
+ * device.
+ */
+int ao_4u_4i_get_api_version(AO4U4I *ao_4u_4i, uint8_t ret_api_version[3]);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * 
+ */
+int ao_4u_4i_set_values(AO4U4I *ao_4u_4i, uint64_t timestamp, int32_t voltages[4], int32_t currents[4]);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * 
+ */
+int ao_4u_4i_get_values(AO4U4I *ao_4u_4i, uint64_t *ret_timestamp, int32_t ret_voltages[4], int32_t ret_currents[4]);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * 
+ */
+int ao_4u_4i_set_voltages(AO4U4I *ao_4u_4i, uint64_t timestamp, int32_t voltages[4]);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * 
+ */
+int ao_4u_4i_get_voltages(AO4U4I *ao_4u_4i, uint64_t *ret_timestamp, int32_t ret_voltages[4]);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * 
+ */
+int ao_4u_4i_set_currents(AO4U4I *ao_4u_4i, uint64_t timestamp, int32_t currents[4]);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * 
+ */
+int ao_4u_4i_get_currents(AO4U4I *ao_4u_4i, uint64_t *ret_timestamp, int32_t ret_currents[4]);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * 
+ */
+int ao_4u_4i_set_selected_voltage(AO4U4I *ao_4u_4i, uint8_t channel, uint64_t timestamp, int32_t voltage);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * 
+ */
+int ao_4u_4i_get_selected_voltage(AO4U4I *ao_4u_4i, uint8_t channel, uint64_t *ret_timestamp, int32_t *ret_voltage);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * 
+ */
+int ao_4u_4i_set_selected_current(AO4U4I *ao_4u_4i, uint8_t channel, uint64_t timestamp, int32_t current);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * 
+ */
+int ao_4u_4i_get_selected_current(AO4U4I *ao_4u_4i, uint8_t channel, uint64_t *ret_timestamp, int32_t *ret_current);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * TODO
+ */
+int ao_4u_4i_get_timestamp(AO4U4I *ao_4u_4i, uint64_t *ret_timestamp);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * TODO
+ */
+int ao_4u_4i_copy_firmware(AO4U4I *ao_4u_4i, uint8_t *ret_status);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * TODO
+ */
+int ao_4u_4i_set_write_firmware_pointer(AO4U4I *ao_4u_4i, uint32_t pointer);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * TODO
+ */
+int ao_4u_4i_write_firmware(AO4U4I *ao_4u_4i, uint8_t data[64], uint8_t *ret_status);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * Calling this function will reset the TNG module. All configurations
+ * will be lost.
+ * 
+ * After a reset you have to create new device objects,
+ * calling functions on the existing ones will result in
+ * undefined behavior!
+ */
+int ao_4u_4i_reset(AO4U4I *ao_4u_4i);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * Writes a new UID into flash. If you want to set a new UID
+ * you have to decode the Base58 encoded UID string into an
+ * integer first.
+ * 
+ * We recommend that you use Brick Viewer to change the UID.
+ */
+int ao_4u_4i_write_uid(AO4U4I *ao_4u_4i, uint32_t uid);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * Returns the current UID as an integer. Encode as
+ * Base58 to get the usual string version.
+ */
+int ao_4u_4i_read_uid(AO4U4I *ao_4u_4i, uint32_t *ret_uid);
+
+/**
+ * \ingroup TNGAO4U4I
+ *
+ * Returns the UID, the UID where the Brick is connected to,
+ * the position, the hardware and firmware version as well as the
+ * device identifier.
+ * 
+ * The position is the position in the stack from '0' (bottom) to '8' (top).
+ * 
+ * The device identifier numbers can be found :ref:`here <device_identifier>`.
+ * |device_identifier_constant|
+ */
+int ao_4u_4i_get_identity(AO4U4I *ao_4u_4i, char ret_uid[8], char ret_connected_uid[8], char *ret_position, uint8_t ret_hardware_version[3], uint8_t ret_firmware_version[3], uint16_t *ret_device_identifier);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -0,0 +1,262 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C/C++ Bindings Version 2.1.30                             *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+#ifndef TNG_UNKNOWN_H
+#define TNG_UNKNOWN_H
+
+#include "ip_connection.h"
+
+#ifdef __cplusplus
+extern "C" {
+#endif
+
+/**
+ * \defgroup TNGUnknown TNG Unknown
+ */
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * 
+ */
+typedef Device Unknown;
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_FUNCTION_GET_TIMESTAMP 234
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_FUNCTION_COPY_FIRMWARE 235
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_FUNCTION_SET_WRITE_FIRMWARE_POINTER 237
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_FUNCTION_WRITE_FIRMWARE 238
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_FUNCTION_RESET 243
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_FUNCTION_WRITE_UID 248
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_FUNCTION_READ_UID 249
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_FUNCTION_GET_IDENTITY 255
+
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_COPY_STATUS_OK 0
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_COPY_STATUS_DEVICE_IDENTIFIER_INCORRECT 1
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_COPY_STATUS_MAGIC_NUMBER_INCORRECT 2
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_COPY_STATUS_LENGTH_MALFORMED 3
+
+/**
+ * \ingroup TNGUnknown
+ */
+#define UNKNOWN_COPY_STATUS_CRC_MISMATCH 4
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * This constant is used to identify a TNG Unknown.
+ *
+ * The {@link unknown_get_identity} function and the
+ * {@link IPCON_CALLBACK_ENUMERATE} callback of the IP Connection have a
+ * \c device_identifier parameter to specify the Brick's or Bricklet's type.
+ */
+#define UNKNOWN_DEVICE_IDENTIFIER -201
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * This constant represents the display name of a TNG Unknown.
+ */
+#define UNKNOWN_DEVICE_DISPLAY_NAME "TNG Unknown"
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * Creates the device object \c unknown with the unique device ID \c uid and adds
+ * it to the IPConnection \c ipcon.
+ */
+void unknown_create(Unknown *unknown, const char *uid, IPConnection *ipcon);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * Removes the device object \c unknown from its IPConnection and destroys it.
+ * The device object cannot be used anymore afterwards.
+ */
+void unknown_destroy(Unknown *unknown);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * Returns the response expected flag for the function specified by the
+ * \c function_id parameter. It is *true* if the function is expected to
+ * send a response, *false* otherwise.
+ *
+ * For getter functions this is enabled by default and cannot be disabled,
+ * because those functions will always send a response. For callback
+ * configuration functions it is enabled by default too, but can be disabled
+ * via the unknown_set_response_expected function. For setter functions it is
+ * disabled by default and can be enabled.
+ *
+ * Enabling the response expected flag for a setter function allows to
+ * detect timeouts and other error conditions calls of this setter as well.
+ * The device will then send a response for this purpose. If this flag is
+ * disabled for a setter function then no response is sent and errors are
+ * silently ignored, because they cannot be detected.
+ */
+int unknown_get_response_expected(Unknown *unknown, uint8_t function_id, bool *ret_response_expected);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * Changes the response expected flag of the function specified by the
+ * \c function_id parameter. This flag can only be changed for setter
+ * (default value: *false*) and callback configuration functions
+ * (default value: *true*). For getter functions it is always enabled.
+ *
+ * Enabling the response expected flag for a setter function allows to detect
+ * timeouts and other error conditions calls of this setter as well. The device
+ * will then send a response for this purpose. If this flag is disabled for a
+ * setter function then no response is sent and errors are silently ignored,
+ * because they cannot be detected.
+ */
+int unknown_set_response_expected(Unknown *unknown, uint8_t function_id, bool response_expected);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * Changes the response expected flag for all setter and callback configuration
+ * functions of this device at once.
+ */
+int unknown_set_response_expected_all(Unknown *unknown, bool response_expected);
+
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * Returns the API version (major, minor, release) of the bindings for this
+ * device.
+ */
+int unknown_get_api_version(Unknown *unknown, uint8_t ret_api_version[3]);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * TODO
+ */
+int unknown_get_timestamp(Unknown *unknown, uint64_t *ret_timestamp);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * TODO
+ */
+int unknown_copy_firmware(Unknown *unknown, uint8_t *ret_status);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * TODO
+ */
+int unknown_set_write_firmware_pointer(Unknown *unknown, uint32_t pointer);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * TODO
+ */
+int unknown_write_firmware(Unknown *unknown, uint8_t data[64], uint8_t *ret_status);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * Calling this function will reset the TNG module. All configurations
+ * will be lost.
+ * 
+ * After a reset you have to create new device objects,
+ * calling functions on the existing ones will result in
+ * undefined behavior!
+ */
+int unknown_reset(Unknown *unknown);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * Writes a new UID into flash. If you want to set a new UID
+ * you have to decode the Base58 encoded UID string into an
+ * integer first.
+ * 
+ * We recommend that you use Brick Viewer to change the UID.
+ */
+int unknown_write_uid(Unknown *unknown, uint32_t uid);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * Returns the current UID as an integer. Encode as
+ * Base58 to get the usual string version.
+ */
+int unknown_read_uid(Unknown *unknown, uint32_t *ret_uid);
+
+/**
+ * \ingroup TNGUnknown
+ *
+ * Returns the UID, the UID where the Brick is connected to,
+ * the position, the hardware and firmware version as well as the
+ * device identifier.
+ * 
+ * The position is the position in the stack from '0' (bottom) to '8' (top).
+ * 
+ * The device identifier numbers can be found :ref:`here <device_identifier>`.
+ * |device_identifier_constant|
+ */
+int unknown_get_identity(Unknown *unknown, char ret_uid[8], char ret_connected_uid[8], char *ret_position, uint8_t ret_hardware_version[3], uint8_t ret_firmware_version[3], uint16_t *ret_device_identifier);
+
+#ifdef __cplusplus
+}
+#endif
+
+#endif
@@ -1417,13 +1417,13 @@ class CBindingsGenerator(c_common.CGeneratorTrait, common.BindingsGenerator):
     def generate(self, device):
         filename = '{0}_{1}'.format(device.get_category().under, device.get_name().under)
 
-        with open(os.path.join(self.get_bindings_dir(), filename + '.c'), 'w') as f:
+        with common.open_output_file(os.path.join(self.get_bindings_dir(), filename + '.c')) as f:
             f.write(device.get_c_source())
 
-        with open(os.path.join(self.get_bindings_dir(), filename + '.h'), 'w') as f:
+        with common.open_output_file(os.path.join(self.get_bindings_dir(), filename + '.h')) as f:
             f.write(device.get_c_header())
 
-        with open(os.path.join(self.get_bindings_dir(), filename + '.symbols'), 'w') as f:
+        with common.open_output_file(os.path.join(self.get_bindings_dir(), filename + '.symbols')) as f:
             f.write(device.get_c_symbols())
 
         if device.is_released():
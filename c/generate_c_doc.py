@@ -524,7 +524,7 @@ class CDocGenerator(c_common.CGeneratorTrait, common.DocGenerator):
         return c_common.CElement
 
     def generate(self, device):
-        with open(device.get_doc_rst_path(), 'w') as f:
+        with common.open_output_file(device.get_doc_rst_path()) as f:
             f.write(device.get_c_doc())
 
 def generate(root_dir, language):
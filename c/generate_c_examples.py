@@ -890,7 +890,7 @@ class CExamplesGenerator(c_common.CGeneratorTrait, common.ExamplesGenerator):
             else:
                 print('  - ' + filename)
 
-            with open(filepath, 'w') as f:
+            with common.open_output_file(filepath) as f:
                 f.write(example.get_c_source())
 
 def generate(root_dir, language):
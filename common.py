@@ -38,6 +38,12 @@ from collections import namedtuple
 import importlib
 import argparse
 import shlex
+import hashlib
+import pickle
+import io
+import time
+import json
+import cProfile
 
 from generators.configs import device_commonconfig
 
@@ -153,11 +159,75 @@ Funktionen direkt zu verwenden.
 
 lang = 'en'
 enable_verbose = False
+enable_incremental = False
+enable_profile = False
+enable_cprofile = False
 
 def print_verbose(*args, **kwargs):
     if enable_verbose:
         print(*args, **kwargs)
 
+# phases are identified by their stack of nested phase names. for each stack
+# the number of calls and the total time is accumulated
+profile_stack = []
+profile_timings = {}
+
+class ProfilePhase(object):
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        if enable_profile:
+            profile_stack.append(self.name)
+
+            self.stack = tuple(profile_stack)
+            self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if not enable_profile:
+            return
+
+        timing = profile_timings.setdefault(self.stack, [0, 0.0])
+
+        timing[0] += 1
+        timing[1] += time.perf_counter() - self.start
+
+        profile_stack.pop()
+
+def profile_phase(name):
+    return ProfilePhase(name)
+
+def write_profile_report(report_dir, report_name, profiler=None):
+    os.makedirs(report_dir, exist_ok=True)
+
+    self_times = dict((stack, total) for stack, (_, total) in profile_timings.items())
+
+    for stack, (_, total) in profile_timings.items():
+        if len(stack) > 1 and stack[:-1] in self_times:
+            self_times[stack[:-1]] -= total # time spent in nested phases
+
+    phases = []
+
+    for stack, (count, total) in sorted(profile_timings.items()):
+        phases.append({'stack': list(stack), 'count': count, 'total': total, 'self': self_times[stack]})
+
+    with open(os.path.join(report_dir, report_name + '.json'), 'w') as f:
+        json.dump({'phases': phases}, f, indent=2)
+
+    # the folded format is understood by flamegraph.pl and speedscope
+    with open(os.path.join(report_dir, report_name + '.folded'), 'w') as f:
+        for phase in phases:
+            f.write('{0} {1}\n'.format(';'.join(phase['stack']), max(int(round(phase['self'] * 1000000)), 0)))
+
+    if profiler != None:
+        profiler.dump_stats(os.path.join(report_dir, report_name + '.prof'))
+
+    print('  profile written to {0}'.format(os.path.join(report_dir, report_name + '.*')))
+
+    profile_timings.clear()
+
 def html_escape(text):
     return text.replace("&", "&amp;").replace('"', "&quot;").replace("'", "&apos;").replace(">", "&gt;").replace("<", "&lt;")
 
@@ -1055,7 +1125,7 @@ def copy_examples(copy_files, path):
     for copy_file in copy_files:
         doc_dest = os.path.join(doc_path, copy_file[1])
         doc_src = copy_file[0]
-        shutil.copy(doc_src, doc_dest)
+        copy_output_file(doc_src, doc_dest)
         print_verbose('      - {0}'.format(copy_file[1]))
 
     if len(copy_files) == 0:
@@ -1408,6 +1478,143 @@ def recreate_dir(path):
 
     os.makedirs(path)
 
+output_file_counts = {'written': 0, 'unchanged': 0}
+produced_output_files = []
+output_dir_snapshots = {}
+
+def get_file_stat(path):
+    stat = os.stat(path)
+
+    return (stat.st_mtime_ns, stat.st_size)
+
+def output_contents_are_equal(old_content, new_content):
+    if isinstance(new_content, bytes):
+        return old_content == new_content
+
+    old_lines = old_content.splitlines(True)
+    new_lines = new_content.splitlines(True)
+
+    if len(old_lines) != len(new_lines):
+        return False
+
+    marker = 'This file was automatically generated on'
+
+    for old_line, new_line in zip(old_lines, new_lines):
+        if old_line != new_line and (marker not in old_line or marker not in new_line):
+            return False
+
+    return True
+
+# only writes the file if its content changed, ignoring the generation date in
+# the header comment. this keeps the mtime of unchanged files stable for build
+# tools and copy_all.py. the file is replaced atomically, so readers never see
+# a partially written file
+def write_output_file(path, content):
+    path = os.path.abspath(path)
+    binary = isinstance(content, bytes)
+
+    produced_output_files.append(path)
+
+    try:
+        with open(path, 'rb' if binary else 'r', newline=None if binary else '') as f:
+            old_content = f.read()
+    except (IOError, OSError, UnicodeDecodeError):
+        old_content = None
+
+    if old_content != None and output_contents_are_equal(old_content, content):
+        output_file_counts['unchanged'] += 1
+        return False
+
+    tmp_path = '{0}.{1}.tmp'.format(path, os.getpid())
+
+    with open(tmp_path, 'wb' if binary else 'w') as f:
+        f.write(content)
+
+    if old_content != None:
+        shutil.copymode(path, tmp_path)
+
+    os.replace(tmp_path, path)
+
+    output_file_counts['written'] += 1
+
+    return True
+
+def copy_output_file(source_path, destination_path):
+    if os.path.isdir(destination_path):
+        destination_path = os.path.join(destination_path, os.path.basename(source_path))
+
+    with open(source_path, 'rb') as f:
+        content = f.read()
+
+    if write_output_file(destination_path, content):
+        shutil.copymode(source_path, destination_path)
+
+# collects everything written to it in memory and passes it to write_output_file
+# on close. can be used as a drop-in replacement for a file opened for writing
+class OutputFile(object):
+    def __init__(self, path, mode='w'):
+        self.path = path
+        self.buffer = io.BytesIO() if 'b' in mode else io.StringIO()
+
+    def write(self, data):
+        return self.buffer.write(data)
+
+    def writelines(self, lines):
+        self.buffer.writelines(lines)
+
+    def close(self):
+        if self.buffer != None:
+            write_output_file(self.path, self.buffer.getvalue())
+
+            self.buffer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type == None:
+            self.close()
+        else:
+            self.buffer = None # don't replace the existing file with partial content
+
+def open_output_file(path, mode='w'):
+    return OutputFile(path, mode)
+
+# replaces recreate_dir for output directories. existing files are kept, so
+# write_output_file can skip unchanged ones. files that are not produced again
+# are removed by cleanup_output_dirs
+def prepare_output_dir(path):
+    path = os.path.abspath(path)
+    snapshot = {}
+
+    if os.path.isfile(path):
+        os.remove(path)
+
+    os.makedirs(path, exist_ok=True)
+
+    for root, _, names in os.walk(path):
+        for name in names:
+            file_path = os.path.join(root, name)
+            snapshot[file_path] = get_file_stat(file_path)
+
+    output_dir_snapshots[path] = snapshot
+
+def cleanup_output_dirs():
+    produced = set(produced_output_files)
+
+    for path, snapshot in output_dir_snapshots.items():
+        # files that were neither produced by write_output_file nor modified
+        # otherwise during this run are left over from a previous run
+        for file_path, stat in snapshot.items():
+            if file_path not in produced and os.path.isfile(file_path) and get_file_stat(file_path) == stat:
+                os.remove(file_path)
+
+        for root, _, _ in sorted(os.walk(path), key=lambda entry: len(entry[0]), reverse=True):
+            if root != path and len(os.listdir(root)) == 0:
+                os.rmdir(root)
+
+    output_dir_snapshots.clear()
+
 def specialize_template(template_filename, destination_filename, replacements, check_completeness=True, remove_template=False):
     lines = []
     replaced = set()
@@ -1427,7 +1634,7 @@ def specialize_template(template_filename, destination_filename, replacements, c
     if check_completeness and replaced != set(replacements.keys()):
         raise GeneratorError('Not all replacements for {0} have been applied'.format(template_filename))
 
-    with open(destination_filename, 'w') as f:
+    with open_output_file(destination_filename) as f:
         f.writelines(lines)
 
     if remove_template:
@@ -1459,10 +1666,12 @@ def wrap_non_empty(prefix, middle, suffix):
 
 def execute(args, **kwargs):
     error = 'command failed: {0}'.format(' '.join(args) if isinstance(args, list) else args)
+    program = os.path.basename(args[0] if isinstance(args, list) else args.split(' ')[0])
 
     try:
-        if subprocess.call(args, **kwargs) != 0:
-            sys.exit(1)
+        with profile_phase('execute:' + program):
+            if subprocess.call(args, **kwargs) != 0:
+                sys.exit(1)
     except Exception as e:
         print(error + '\n' + str(e))
         sys.exit(1)
@@ -1470,8 +1679,25 @@ def execute(args, **kwargs):
 def generate(root_dir, language, generator_class):
     print('=== language: {0}'.format(language))
 
+    if enable_cprofile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+    else:
+        profiler = None
+
+    with profile_phase(generator_class.__name__):
+        subgenerate_all(root_dir, language, generator_class)
+
+    if profiler != None:
+        profiler.disable()
+
+    if enable_profile:
+        write_profile_report(os.path.join(root_dir, '.profile'), '{0}_{1}'.format(generator_class.__name__, language), profiler=profiler)
+
+def subgenerate_all(root_dir, language, generator_class):
     # default config
-    subgenerate(root_dir, language, generator_class, 'tinkerforge')
+    with profile_phase('config:tinkerforge'):
+        subgenerate(root_dir, language, generator_class, 'tinkerforge')
 
     # custom configs
     config_base_path = os.path.join(root_dir, '..', 'configs')
@@ -1488,7 +1714,505 @@ def generate(root_dir, language, generator_class):
         if re.match('^[a-z0-9_]+$', config_name) == None:
             raise GeneratorError('Invalid config name: {0}'.format(config_name))
 
-        subgenerate(root_dir, language, generator_class, config_name)
+        with profile_phase('config:' + config_name):
+            subgenerate(root_dir, language, generator_class, config_name)
+
+def prepare_common_constant_groups(com, common_constant_groups):
+    features = com['features']
+
+    for common_constant_group in common_constant_groups:
+        if common_constant_group['feature'] not in features:
+            common_constant_group['to_be_removed'] = True
+
+    return filter(lambda x: 'to_be_removed' not in x, common_constant_groups)
+
+def prepare_common_packets(com, common_packets):
+    features = com['features']
+
+    for common_packet in common_packets:
+        if not common_packet.get('is_virtual', False):
+            if com['name'] in common_packet['since_firmware']:
+                common_packet['since_firmware'] = common_packet['since_firmware'][com['name']]
+            else:
+                common_packet['since_firmware'] = common_packet['since_firmware']['*']
+
+            if common_packet['since_firmware'] == None:
+                common_packet['to_be_removed'] = True
+
+        if common_packet['feature'] not in features:
+            common_packet['to_be_removed'] = True
+
+    return filter(lambda x: 'to_be_removed' not in x, common_packets)
+
+def build_device_model(config_subdir, config, reload_module=False):
+    with profile_phase('import'):
+        module = importlib.import_module('generators.configs{0}.{1}'.format(config_subdir, config[:-3]))
+
+        if reload_module:
+            module = importlib.reload(module)
+
+    with profile_phase('merge'):
+        com = copy.deepcopy(module.com)
+
+        if com['documented'] and not com['released']:
+            raise GeneratorError('{0} is marked as documented, but as not released'.format(config[:-10]))
+
+        if 'common_included' not in com:
+            com['constant_groups'].extend(prepare_common_constant_groups(com, copy.deepcopy(device_commonconfig.common_constant_groups)))
+            com['packets'].extend(prepare_common_packets(com, copy.deepcopy(device_commonconfig.common_packets)))
+            com['common_included'] = True
+
+        check_name(com['name'], display_name=com['display_name'])
+
+    return com
+
+# the snapshot stores the raw device models of a config directory in a single
+# file, so that a generator doesn't have to import and merge all the config
+# modules on startup. a model from the snapshot is only used if the stat of its
+# config file, the code that builds the models and the helper modules of the
+# config directory are unchanged, otherwise the model is built from the config
+# module as usual. build_configs_snapshot.py creates the snapshots
+DEVICE_MODEL_SNAPSHOT_VERSION = 1
+DEVICE_MODEL_SNAPSHOT_FILENAME = '.device_models.pickle'
+
+enable_device_model_snapshot = True
+_device_model_snapshots = {}
+
+# all files of a config directory except the configs themselves, for example
+# openhab_commonconfig.py and commonconstants.py that many configs import
+def get_non_config_file_paths(directory):
+    paths = []
+
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+
+        if os.path.isfile(path) and not name.endswith('.zip') and not name.endswith('_config.py') and \
+           not name.startswith(DEVICE_MODEL_SNAPSHOT_FILENAME):
+            paths.append(os.path.realpath(path))
+
+    return sorted(paths)
+
+def get_device_model_snapshot_stamp(config_path):
+    return (DEVICE_MODEL_SNAPSHOT_VERSION,
+            hash_file(os.path.realpath(__file__)),
+            hash_file(os.path.realpath(device_commonconfig.__file__)),
+            tuple([(os.path.basename(path), hash_file(path)) for path in get_non_config_file_paths(config_path)]))
+
+def build_device_model_snapshot(config_path, config_subdir):
+    models = {}
+
+    for config in sorted(os.listdir(config_path)):
+        if not config.endswith('_config.py'):
+            continue
+
+        config_stat = os.stat(os.path.join(config_path, config))
+        models[config] = ((config_stat.st_mtime_ns, config_stat.st_size), build_device_model(config_subdir, config))
+
+    filename = os.path.join(config_path, DEVICE_MODEL_SNAPSHOT_FILENAME)
+    tmp_filename = '{0}.{1}.tmp'.format(filename, os.getpid())
+
+    with open(tmp_filename, 'wb') as f:
+        pickle.dump({'stamp': get_device_model_snapshot_stamp(config_path),
+                     'models': models}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    os.replace(tmp_filename, filename)
+
+    _device_model_snapshots.pop(os.path.realpath(config_path), None)
+
+    return len(models)
+
+def get_device_model_snapshot(config_path):
+    config_path = os.path.realpath(config_path)
+    models = _device_model_snapshots.get(config_path)
+
+    if models != None:
+        return models
+
+    try:
+        with profile_phase('snapshot'):
+            with open(os.path.join(config_path, DEVICE_MODEL_SNAPSHOT_FILENAME), 'rb') as f:
+                snapshot = pickle.load(f)
+    except Exception: # missing or written by an incompatible version
+        snapshot = None
+
+    if snapshot != None and snapshot['stamp'] == get_device_model_snapshot_stamp(config_path):
+        models = snapshot['models']
+    else:
+        if snapshot != None:
+            print_verbose('  \033[01;36m! configs snapshot is outdated, run build_configs_snapshot.py\033[0m')
+
+        models = {}
+
+    _device_model_snapshots[config_path] = models
+
+    return models
+
+# raw device models are shared between all generators and languages run in the
+# same process. the cached com dicts are never handed out directly, callers get
+# a deep copy that they are free to modify
+_device_model_cache = {}
+
+def get_device_model(config_path, config_subdir, config):
+    config_filename = os.path.realpath(os.path.join(config_path, config))
+    config_stat = os.stat(config_filename)
+    key = (config_filename, config_stat.st_mtime_ns, config_stat.st_size)
+    com = _device_model_cache.get(key)
+
+    if com != None:
+        return com
+
+    stale_keys = [other_key for other_key in _device_model_cache if other_key[0] == config_filename]
+
+    for stale_key in stale_keys:
+        del _device_model_cache[stale_key]
+
+    if enable_device_model_snapshot:
+        snapshot_model = get_device_model_snapshot(config_path).get(config)
+    else:
+        snapshot_model = None
+
+    if snapshot_model != None and snapshot_model[0] == key[1:]:
+        com = snapshot_model[1]
+    else:
+        com = build_device_model(config_subdir, config, reload_module=len(stale_keys) > 0) # config file changed since it was cached
+
+    _device_model_cache[key] = com
+
+    return com
+
+class NotRecordableError(Exception):
+    pass
+
+class IncrementalStatePickler(pickle.Pickler):
+    # generator state that references the object graph of a device cannot be
+    # replayed for a device that is not rebuilt
+    def persistent_id(self, obj):
+        if isinstance(obj, (Device, Packet, Element, ConstantGroup, Constant, Example, Generator)):
+            raise NotRecordableError()
+
+        return None
+
+def dump_incremental_state(value):
+    data = io.BytesIO()
+
+    try:
+        IncrementalStatePickler(data, protocol=pickle.HIGHEST_PROTOCOL).dump(value)
+    except (NotRecordableError, pickle.PicklingError, TypeError, AttributeError):
+        raise NotRecordableError()
+
+    return data.getvalue()
+
+def hash_file(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+# the manifest maps the inputs of a generator run (generator source, templates,
+# changelog version, device configs) to the files that each device produced and
+# to the changes that each device made to the state of the generator. a device
+# with unchanged inputs is then not rebuilt, its generator state changes are
+# replayed instead and its output files are kept
+class IncrementalManifest(object):
+    VERSION = 1
+
+    def __init__(self, generator, config_path):
+        self.generator = generator
+        self.config_path = config_path
+        self.output_dir = generator.get_incremental_dir()
+        self.filename = os.path.join(generator.get_root_dir(), '.generate_manifests',
+                                     '{0}_{1}_{2}.pickle'.format(generator.__class__.__name__, generator.get_config_name().under, generator.get_language()))
+        self.inputs_hash = self.get_inputs_hash()
+        self.old_devices = {}
+        self.new_devices = {}
+        self.seen_configs = set()
+        self.recordable = True
+        self.state_snapshot = None
+
+        try:
+            with open(self.filename, 'rb') as f:
+                manifest = pickle.load(f)
+        except Exception:
+            manifest = None
+
+        if manifest != None and manifest['version'] == IncrementalManifest.VERSION and \
+           manifest['inputs_hash'] == self.inputs_hash and os.path.isdir(self.output_dir):
+            self.old_devices = manifest['devices']
+
+    def get_inputs_hash(self):
+        generator = self.generator
+        input_paths = set([os.path.realpath(__file__), os.path.realpath(device_commonconfig.__file__)])
+        classes = [generator.__class__, generator.get_device_class(), generator.get_packet_class(), generator.get_element_class(),
+                   generator.get_constant_group_class(), generator.get_constant_class(), generator.get_example_class()]
+
+        for class_ in classes:
+            for base in class_.__mro__:
+                module = sys.modules.get(base.__module__)
+
+                if module != None and getattr(module, '__file__', None) != None:
+                    input_paths.add(os.path.realpath(module.__file__))
+
+        for directory in [generator.get_root_dir(), self.config_path]:
+            input_paths.update(get_non_config_file_paths(directory))
+
+        inputs_hash = hashlib.sha256()
+
+        inputs_hash.update(repr((generator.__class__.__name__, generator.get_language(), generator.get_changelog_version())).encode('utf-8'))
+
+        for path in sorted(input_paths):
+            inputs_hash.update(path.encode('utf-8'))
+            inputs_hash.update(hash_file(path).encode('utf-8'))
+
+        return inputs_hash.hexdigest()
+
+    def is_reusable(self):
+        return len(self.old_devices) > 0
+
+    def get_output_files(self):
+        output_files = {}
+
+        for root, _, names in os.walk(self.output_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+
+                output_files[os.path.relpath(path, self.output_dir)] = (stat.st_mtime_ns, stat.st_size)
+
+        return output_files
+
+    def get_state(self):
+        state = {}
+
+        for name, value in vars(self.generator).items():
+            if isinstance(value, FlavoredName):
+                continue # only caches its flavors
+
+            if isinstance(value, list):
+                state[name] = ('list', list(value))
+            elif isinstance(value, set):
+                state[name] = ('set', set(value))
+            elif isinstance(value, dict):
+                state[name] = ('dict', dict((key, dump_incremental_state(item)) for key, item in value.items()))
+            else:
+                state[name] = ('value', dump_incremental_state(value))
+
+        return state
+
+    def get_reusable_device(self, config, config_hash):
+        device = self.old_devices.get(config)
+
+        if device == None or device['config_hash'] != config_hash:
+            return None
+
+        for relative_path, output_hash in device['outputs'].items():
+            path = os.path.join(self.output_dir, relative_path)
+
+            if not os.path.isfile(path) or hash_file(path) != output_hash:
+                return None
+
+        return device
+
+    def reuse_device(self, config, device):
+        self.seen_configs.add(config)
+
+        for kind, name, change in device['changes']:
+            value = getattr(self.generator, name)
+
+            if kind == 'list':
+                value.extend(change)
+            elif kind == 'set':
+                value.update(change)
+            elif kind == 'dict':
+                value.update(change)
+
+        self.new_devices[config] = device
+        self.state_snapshot = None
+
+    def begin_device(self, config):
+        self.seen_configs.add(config)
+
+        if not self.recordable:
+            return
+
+        try:
+            if self.state_snapshot == None:
+                self.state_snapshot = self.get_state()
+        except NotRecordableError:
+            self.recordable = False
+            return
+
+        self.output_files_snapshot = self.get_output_files()
+        self.produced_output_files_index = len(produced_output_files)
+
+    def end_device(self, config, config_hash, device_identifier, device_info):
+        if not self.recordable:
+            return
+
+        try:
+            state = self.get_state()
+        except NotRecordableError:
+            self.recordable = False
+            return
+
+        changes = []
+
+        for name, (kind, value) in state.items():
+            old_kind, old_value = self.state_snapshot.get(name, (None, None))
+
+            if kind == 'list' and old_kind == 'list' and value[:len(old_value)] == old_value:
+                if len(value) > len(old_value):
+                    changes.append(('list', name, value[len(old_value):]))
+            elif kind == 'set' and old_kind == 'set' and old_value.issubset(value):
+                if len(value) > len(old_value):
+                    changes.append(('set', name, value - old_value))
+            elif kind == 'dict' and old_kind == 'dict' and set(old_value.keys()).issubset(value.keys()):
+                changed_keys = [key for key in value if old_value.get(key) != value[key]]
+
+                if len(changed_keys) > 0:
+                    items = getattr(self.generator, name)
+                    changes.append(('dict', name, dict((key, items[key]) for key in changed_keys)))
+            elif kind != old_kind or value != old_value:
+                self.recordable = False # e.g. a counter or a replaced object, cannot be replayed
+                return
+
+        try:
+            dump_incremental_state(changes)
+        except NotRecordableError:
+            self.recordable = False
+            return
+
+        output_files = self.get_output_files()
+        outputs = {}
+
+        for relative_path, stat in output_files.items():
+            if self.output_files_snapshot.get(relative_path) != stat:
+                outputs[relative_path] = hash_file(os.path.join(self.output_dir, relative_path))
+
+        # unchanged files are not rewritten by write_output_file, so their stat
+        # doesn't change
+        output_dir = os.path.abspath(self.output_dir)
+
+        for path in produced_output_files[self.produced_output_files_index:]:
+            relative_path = os.path.relpath(path, output_dir)
+
+            if not relative_path.startswith('..') and relative_path not in outputs and os.path.isfile(path):
+                outputs[relative_path] = hash_file(path)
+
+        self.new_devices[config] = {
+            'config_hash': config_hash,
+            'device_identifier': device_identifier,
+            'device_info': device_info,
+            'changes': changes,
+            'outputs': outputs
+        }
+
+        self.state_snapshot = state
+
+    def finish(self):
+        # remove output files of devices that are gone or that don't produce them anymore
+        for config, old_device in self.old_devices.items():
+            if config in self.new_devices:
+                new_outputs = self.new_devices[config]['outputs']
+            elif self.recordable and config in self.seen_configs:
+                new_outputs = {}
+            elif config in self.seen_configs:
+                continue # device was generated, but its outputs are unknown
+            else:
+                new_outputs = {} # device is gone
+
+            for relative_path in old_device['outputs']:
+                path = os.path.join(self.output_dir, relative_path)
+
+                if relative_path not in new_outputs and os.path.isfile(path):
+                    os.remove(path)
+
+        if not self.recordable:
+            print_verbose('  \033[01;36m! generator state cannot be recorded, incremental generation disabled\033[0m')
+
+            if os.path.exists(self.filename):
+                os.remove(self.filename)
+
+            return
+
+        os.makedirs(os.path.dirname(self.filename), exist_ok=True)
+
+        with open(self.filename + '.tmp', 'wb') as f:
+            pickle.dump({'version': IncrementalManifest.VERSION,
+                         'inputs_hash': self.inputs_hash,
+                         'devices': self.new_devices}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        os.replace(self.filename + '.tmp', self.filename)
+
+def make_device_info(device):
+    if device.is_brick():
+        ref_name = device.get_name().under + '_brick'
+        hardware_doc_name = device.get_short_display_name().replace(' ', '_').replace('/', '_').replace('-', '').replace('2.0', 'V2').replace('3.0', 'V3') + '_Brick'
+        software_doc_prefix = device.get_name().camel + '_Brick'
+
+        if device.get_device_identifier() != 17:
+            firmware_url_part = device.get_name().under
+        else:
+            firmware_url_part = None
+
+        device_info = (device.get_device_identifier(),
+                       'Brick',
+                       device.get_long_display_name(),
+                       device.get_short_display_name(),
+                       ref_name,
+                       hardware_doc_name,
+                       software_doc_prefix,
+                       device.get_git_name(),
+                       firmware_url_part,
+                       device.has_comcu(),
+                       device.is_released(),
+                       device.is_documented(),
+                       device.is_discontinued(),
+                       True,
+                       device.get_description())
+    elif device.is_bricklet():
+        ref_name = device.get_name().under + '_bricklet'
+        hardware_doc_name = device.get_short_display_name().replace(' ', '_').replace('/', '_').replace('-', '').replace('2.0', 'V2').replace('3.0', 'V3')
+        software_doc_prefix = device.get_name().camel + '_Bricklet'
+        firmware_url_part = device.get_name().under
+
+        device_info = (device.get_device_identifier(),
+                       'Bricklet',
+                       device.get_long_display_name(),
+                       device.get_short_display_name(),
+                       ref_name,
+                       hardware_doc_name,
+                       software_doc_prefix,
+                       device.get_git_name(),
+                       firmware_url_part,
+                       device.has_comcu(),
+                       device.is_released(),
+                       device.is_documented(),
+                       device.is_discontinued(),
+                       True,
+                       device.get_description())
+    elif device.is_tng():
+        ref_name = 'tng_' + device.get_name().under
+        hardware_doc_name = device.get_short_display_name().replace(' ', '_').replace('/', '_').replace('-', '').replace('2.0', 'V2').replace('3.0', 'V3')
+        software_doc_prefix = 'TNG_' + device.get_name().camel
+        firmware_url_part = device.get_name().under
+
+        device_info = (device.get_device_identifier(),
+                       'TNG',
+                       device.get_long_display_name(),
+                       device.get_short_display_name(),
+                       ref_name,
+                       hardware_doc_name,
+                       software_doc_prefix,
+                       device.get_git_name(),
+                       firmware_url_part,
+                       False,
+                       device.is_released(),
+                       device.is_documented(),
+                       device.is_discontinued(),
+                       True,
+                       device.get_description())
+    else:
+        assert False
+
+    return device_info
 
 def subgenerate(root_dir, language, generator_class, config_name):
     global lang
@@ -1496,6 +2220,10 @@ def subgenerate(root_dir, language, generator_class, config_name):
 
     print('--> {0}'.format(config_name))
 
+    output_file_counts['written'] = 0
+    output_file_counts['unchanged'] = 0
+    del produced_output_files[:]
+
     config_path_parts = [root_dir, '..', 'configs']
 
     if config_name != 'tinkerforge':
@@ -1506,163 +2234,113 @@ def subgenerate(root_dir, language, generator_class, config_name):
 
     config_path = os.path.join(*config_path_parts)
 
-    common_constant_groups = copy.deepcopy(device_commonconfig.common_constant_groups)
-    common_packets = copy.deepcopy(device_commonconfig.common_packets)
-
     brick_infos = []
     bricklet_infos = []
     tng_infos = []
     device_identifiers = set()
 
     generator = generator_class(root_dir, config_name, language)
-    generator.prepare()
 
-    def prepare_common_constant_groups(com, common_constant_groups):
-        features = com['features']
-
-        for common_constant_group in common_constant_groups:
-            if common_constant_group['feature'] not in features:
-                common_constant_group['to_be_removed'] = True
+    if enable_incremental and generator.get_incremental_dir() != None:
+        manifest = IncrementalManifest(generator, config_path)
+        generator.reuse_existing_output = manifest.is_reusable()
+    else:
+        manifest = None
 
-        return filter(lambda x: 'to_be_removed' not in x, common_constant_groups)
+    with profile_phase('prepare'):
+        generator.prepare()
 
-    def prepare_common_packets(com, common_packets):
-        features = com['features']
+    for config in sorted(os.listdir(config_path)):
+        if not config.endswith('_config.py'):
+            continue
 
-        for common_packet in common_packets:
-            if not common_packet.get('is_virtual', False):
-                if com['name'] in common_packet['since_firmware']:
-                    common_packet['since_firmware'] = common_packet['since_firmware'][com['name']]
-                else:
-                    common_packet['since_firmware'] = common_packet['since_firmware']['*']
+        if manifest != None:
+            config_hash = hash_file(os.path.join(config_path, config))
+            reusable_device = manifest.get_reusable_device(config, config_hash)
 
-                if common_packet['since_firmware'] == None:
-                    common_packet['to_be_removed'] = True
+            if reusable_device != None:
+                print_verbose('  * {0} \033[01;36m(unchanged)\033[0m'.format(config[:-10]))
 
-            if common_packet['feature'] not in features:
-                common_packet['to_be_removed'] = True
+                device_identifier = reusable_device['device_identifier']
 
-        return filter(lambda x: 'to_be_removed' not in x, common_packets)
+                if device_identifier in device_identifiers:
+                    raise GeneratorError('Device identifier {0} is not unique'.format(device_identifier))
 
-    for config in sorted(os.listdir(config_path)):
-        if not config.endswith('_config.py'):
-            continue
+                device_identifiers.add(device_identifier)
+                manifest.reuse_device(config, reusable_device)
+                device_info = reusable_device['device_info']
 
-        com = copy.deepcopy(importlib.import_module('generators.configs{0}.{1}'.format(config_subdir, config[:-3])).com)
+                if device_info == None:
+                    continue
+                elif device_info[1] == 'Brick':
+                    brick_infos.append(device_info)
+                elif device_info[1] == 'Bricklet':
+                    bricklet_infos.append(device_info)
+                else:
+                    tng_infos.append(device_info)
 
-        if com['documented'] and not com['released']:
-            raise GeneratorError('{0} is marked as documented, but as not released'.format(config[:-10]))
+                continue
 
-        if not com['released'] and not com['documented']:
-            print_verbose('  * {0} \033[01;36m(not released, not documented)\033[0m'.format(config[:-10]))
-        elif not com['released']:
-            print_verbose('  * {0} \033[01;36m(not released)\033[0m'.format(config[:-10]))
-        elif not com['documented']:
-            print_verbose('  * {0} \033[01;36m(not documented)\033[0m'.format(config[:-10]))
-        else:
-            print_verbose('  * {0}'.format(config[:-10]))
+        with profile_phase('device:' + config[:-10]):
+            with profile_phase('model'):
+                com = copy.deepcopy(get_device_model(config_path, config_subdir, config))
 
-        if 'common_included' not in com:
-            com['constant_groups'].extend(prepare_common_constant_groups(com, copy.deepcopy(common_constant_groups)))
-            com['packets'].extend(prepare_common_packets(com, copy.deepcopy(common_packets)))
-            com['common_included'] = True
+            if not com['released'] and not com['documented']:
+                print_verbose('  * {0} \033[01;36m(not released, not documented)\033[0m'.format(config[:-10]))
+            elif not com['released']:
+                print_verbose('  * {0} \033[01;36m(not released)\033[0m'.format(config[:-10]))
+            elif not com['documented']:
+                print_verbose('  * {0} \033[01;36m(not documented)\033[0m'.format(config[:-10]))
+            else:
+                print_verbose('  * {0}'.format(config[:-10]))
 
-        if generator.is_openhab_doc_generator:
-            com['packets'] = [x for x in com['packets'] if 'openhab_doc' not in x or x['openhab_doc']]
-        else:
-            com['packets'] = [x for x in com['packets'] if 'openhab_doc' not in x or not x['openhab_doc']]
+            if generator.is_openhab_doc_generator:
+                com['packets'] = [x for x in com['packets'] if 'openhab_doc' not in x or x['openhab_doc']]
+            else:
+                com['packets'] = [x for x in com['packets'] if 'openhab_doc' not in x or not x['openhab_doc']]
 
-        device = generator.get_device_class()(com, generator)
-        device_identifier = device.get_device_identifier()
+            with profile_phase('bind'):
+                device = generator.get_device_class()(com, generator)
 
-        if device_identifier in device_identifiers:
-            raise GeneratorError('Device identifier {0} is not unique'.format(device_identifier))
+            device_identifier = device.get_device_identifier()
 
-        device_identifiers.add(device_identifier)
+            if device_identifier in device_identifiers:
+                raise GeneratorError('Device identifier {0} is not unique'.format(device_identifier))
 
-        generator.generate(device)
+            device_identifiers.add(device_identifier)
 
-        # only collect device_infos for default config
-        if config_name != 'tinkerforge':
-            continue
+            if manifest != None:
+                manifest.begin_device(config)
 
-        if device.is_brick():
-            ref_name = device.get_name().under + '_brick'
-            hardware_doc_name = device.get_short_display_name().replace(' ', '_').replace('/', '_').replace('-', '').replace('2.0', 'V2').replace('3.0', 'V3') + '_Brick'
-            software_doc_prefix = device.get_name().camel + '_Brick'
+            with profile_phase('generate'):
+                generator.generate(device)
 
-            if device.get_device_identifier() != 17:
-                firmware_url_part = device.get_name().under
+            # only collect device_infos for default config
+            if config_name == 'tinkerforge':
+                device_info = make_device_info(device)
             else:
-                firmware_url_part = None
-
-            device_info = (device.get_device_identifier(),
-                           'Brick',
-                           device.get_long_display_name(),
-                           device.get_short_display_name(),
-                           ref_name,
-                           hardware_doc_name,
-                           software_doc_prefix,
-                           device.get_git_name(),
-                           firmware_url_part,
-                           device.has_comcu(),
-                           device.is_released(),
-                           device.is_documented(),
-                           device.is_discontinued(),
-                           True,
-                           device.get_description())
-
-            brick_infos.append(device_info)
-        elif device.is_bricklet():
-            ref_name = device.get_name().under + '_bricklet'
-            hardware_doc_name = device.get_short_display_name().replace(' ', '_').replace('/', '_').replace('-', '').replace('2.0', 'V2').replace('3.0', 'V3')
-            software_doc_prefix = device.get_name().camel + '_Bricklet'
-            firmware_url_part = device.get_name().under
+                device_info = None
 
-            device_info = (device.get_device_identifier(),
-                           'Bricklet',
-                           device.get_long_display_name(),
-                           device.get_short_display_name(),
-                           ref_name,
-                           hardware_doc_name,
-                           software_doc_prefix,
-                           device.get_git_name(),
-                           firmware_url_part,
-                           device.has_comcu(),
-                           device.is_released(),
-                           device.is_documented(),
-                           device.is_discontinued(),
-                           True,
-                           device.get_description())
+            if manifest != None:
+                manifest.end_device(config, config_hash, device_identifier, device_info)
 
+        if device_info == None:
+            continue
+        elif device_info[1] == 'Brick':
+            brick_infos.append(device_info)
+        elif device_info[1] == 'Bricklet':
             bricklet_infos.append(device_info)
-        elif device.is_tng():
-            ref_name = 'tng_' + device.get_name().under
-            hardware_doc_name = device.get_short_display_name().replace(' ', '_').replace('/', '_').replace('-', '').replace('2.0', 'V2').replace('3.0', 'V3')
-            software_doc_prefix = 'TNG_' + device.get_name().camel
-            firmware_url_part = device.get_name().under
+        else:
+            tng_infos.append(device_info)
 
-            device_info = (device.get_device_identifier(),
-                           'TNG',
-                           device.get_long_display_name(),
-                           device.get_short_display_name(),
-                           ref_name,
-                           hardware_doc_name,
-                           software_doc_prefix,
-                           device.get_git_name(),
-                           firmware_url_part,
-                           False,
-                           device.is_released(),
-                           device.is_documented(),
-                           device.is_discontinued(),
-                           True,
-                           device.get_description())
+    with profile_phase('finish'):
+        generator.finish()
 
-            tng_infos.append(device_info)
-        else:
-            assert False
+    with profile_phase('cleanup'):
+        cleanup_output_dirs()
 
-    generator.finish()
+        if manifest != None:
+            manifest.finish()
 
     # only update device_infos.py for default config
     if config_name == 'tinkerforge':
@@ -1674,7 +2352,10 @@ def subgenerate(root_dir, language, generator_class, config_name):
                                {'en': 'Makes all Bricklet signals available',
                                 'de': 'Macht alle Bricklet Signale zugänglich'}))
 
-        with open(os.path.join(root_dir, '..', 'device_infos.py'), 'w') as f:
+        # generate_all.py --jobs runs several bindings generators at the same
+        # time, all of them write device_infos.py, open_output_file replaces it
+        # atomically
+        with open_output_file(os.path.join(root_dir, '..', 'device_infos.py')) as f:
             f.write('# -*- coding: utf-8 -*-\n')
             f.write('from collections import namedtuple\n')
             f.write('\n')
@@ -1696,12 +2377,17 @@ def subgenerate(root_dir, language, generator_class, config_name):
 
             f.write(']\n')
 
+    print('    {0} files written, {1} unchanged'.format(output_file_counts['written'], output_file_counts['unchanged']))
+
 check_name_valid_word_head = re.compile('^[A-Z]+[A-Z0-9]*[a-z0-9]*$')
 check_name_valid_word_tail = re.compile('^[A-Z0-9]+[a-z0-9]*$')
 check_name_valid_word_constant = re.compile('^[A-Z0-9]+[a-z0-9]*$') # constants are allowed to start with numbers
 check_name_exceptions_whole_name = ['Industrial Dual 0 20mA', 'Industrial Dual 0 20mA V2']
 check_name_exceptions_word_in_constant = ['20mA', '24mA', 'EtOH']
 
+# check_name is called for every name of every device for every generator run,
+# but it only depends on its arguments
+@functools.lru_cache(maxsize=None)
 def check_name(name, display_name=None, is_constant=False):
     if isinstance(name, tuple):
         raise GeneratorError('Name {0} uses old tuple format, update it to new split-camel-case format'.format(name))
@@ -4428,6 +5114,7 @@ class Generator:
         self.config_name = FlavoredName(' '.join([word[0].upper() + word[1:] for word in config_name.split('_')]))
         self.language = language # en or de
         self.date = datetime.datetime.now().strftime("%Y-%m-%d")
+        self.reuse_existing_output = False # set for incremental generation
 
         if self.check_root_dir_name:
             root_dir_name = os.path.split(self.get_root_dir())[1]
@@ -4602,6 +5289,9 @@ class Generator:
                                     version[2],
                                     ' '*delta)
 
+    def get_incremental_dir(self):
+        return None # incremental generation is not supported by default
+
     def prepare(self):
         pass
 
@@ -4626,8 +5316,12 @@ class DocGenerator(Generator):
     def get_doc_example_regex(self):
         raise GeneratorError("get_doc_example_regex() not implemented")
 
+    def get_incremental_dir(self):
+        return os.path.join(self.get_doc_dir(), self.get_language())
+
     def prepare(self):
-        recreate_dir(os.path.join(self.get_doc_dir(), self.get_language()))
+        if not self.reuse_existing_output:
+            prepare_output_dir(os.path.join(self.get_doc_dir(), self.get_language()))
 
     def finish(self):
         # Copy IPConnection examples
@@ -4653,12 +5347,18 @@ class BindingsGenerator(Generator):
 
         self.released_files = []
 
+    def get_incremental_dir(self):
+        if not self.recreate_bindings_dir:
+            return None # bindings directory is shared with another generator
+
+        return self.get_bindings_dir()
+
     def prepare(self):
-        if self.recreate_bindings_dir:
-            recreate_dir(self.get_bindings_dir())
+        if self.recreate_bindings_dir and not self.reuse_existing_output:
+            prepare_output_dir(self.get_bindings_dir())
 
     def finish(self):
-        with open(os.path.join(self.get_bindings_dir(), '__released_files__'), 'w') as f:
+        with open_output_file(os.path.join(self.get_bindings_dir(), '__released_files__')) as f:
             for released_file in self.released_files:
                 f.write(released_file + '\n')
 
@@ -4862,6 +5562,10 @@ def dockerize(bindings_name, script_path, add_arguments=None):
     parser.add_argument('-D', '--no-docker', action='store_false', help='run this script normally [default]', dest='docker')
     parser.add_argument('-v', '--verbose', action='store_true', help='enable verbose prints')
     parser.add_argument('-V', '--no-verbose', action='store_false', help='disable verbose prints [default]', dest='verbose')
+    parser.add_argument('-i', '--incremental', action='store_true', help='only regenerate devices with changed inputs')
+    parser.add_argument('-I', '--no-incremental', action='store_false', help='regenerate all devices [default]', dest='incremental')
+    parser.add_argument('-p', '--profile', action='store_true', help='write a timing report per generator to <bindings>/.profile')
+    parser.add_argument('-P', '--cprofile', action='store_true', help='like --profile, but also write a cProfile dump')
 
     if add_arguments != None:
         add_arguments(parser)
@@ -4871,6 +5575,15 @@ def dockerize(bindings_name, script_path, add_arguments=None):
     global enable_verbose
     enable_verbose = args.verbose
 
+    global enable_incremental
+    enable_incremental = args.incremental
+
+    global enable_profile
+    enable_profile = args.profile or args.cprofile
+
+    global enable_cprofile
+    enable_cprofile = args.cprofile
+
     if args.docker:
         if shutil.which('docker') == None:
             print('error: docker is not installed')
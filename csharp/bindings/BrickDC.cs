@@ -0,0 +1,1228 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Drives one brushed DC motor with up to 28V and 5A (peak)
+	/// </summary>
+	public class BrickDC : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 11;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "DC Brick";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VELOCITY = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VELOCITY = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CURRENT_VELOCITY = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ACCELERATION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_PWM_FREQUENCY = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PWM_FREQUENCY = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FULL_BRAKE = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STACK_INPUT_VOLTAGE = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CURRENT_CONSUMPTION = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_ENABLED = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MINIMUM_VOLTAGE = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MINIMUM_VOLTAGE = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DRIVE_MODE = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DRIVE_MODE = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CURRENT_VELOCITY_PERIOD = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CURRENT_VELOCITY_PERIOD = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPITFP_BAUDRATE_CONFIG = 231;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_BAUDRATE_CONFIG = 232;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SEND_TIMEOUT_COUNT = 233;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPITFP_BAUDRATE = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_BAUDRATE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_STATUS_LED = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_STATUS_LED = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_STATUS_LED_ENABLED = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROTOCOL1_BRICKLET_NAME = 241;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_BRICKLET_PLUGIN = 246;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_BRICKLET_PLUGIN = 247;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_UNDER_VOLTAGE = 21;
+
+		private const int CALLBACK_EMERGENCY_SHUTDOWN = 22;
+
+		private const int CALLBACK_VELOCITY_REACHED = 23;
+
+		private const int CALLBACK_CURRENT_VELOCITY = 24;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte DRIVE_MODE_DRIVE_BRAKE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DRIVE_MODE_DRIVE_COAST = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_USB = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_SPI_STACK = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_CHIBI = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_RS485 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_WIFI = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_ETHERNET = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_WIFI_V2 = 7;
+
+
+		/// <summary>
+		///  This callback is triggered when the input voltage drops below the value set by
+		///  <see cref="Tinkerforge.BrickDC.SetMinimumVoltage"/>. The parameter is the current voltage.
+		/// </summary>
+		public event UnderVoltageEventHandler UnderVoltageCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void UnderVoltageEventHandler(BrickDC sender, int voltage);
+
+		/// <summary>
+		/// </summary>
+		public event UnderVoltageEventHandler UnderVoltage // for backward compatibility
+		{
+			add { UnderVoltageCallback += value; }
+			remove { UnderVoltageCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered if either the current consumption
+		///  is too high (above 5A) or the temperature of the driver chip is too high
+		///  (above 175°C). These two possibilities are essentially the same, since the
+		///  temperature will reach this threshold immediately if the motor consumes too
+		///  much current. In case of a voltage below 3.3V (external or stack) this
+		///  callback is triggered as well.
+		///  
+		///  If this callback is triggered, the driver chip gets disabled at the same time.
+		///  That means, <see cref="Tinkerforge.BrickDC.Enable"/> has to be called to drive the motor again.
+		///  
+		///  <note>
+		///   This callback only works in Drive/Brake mode (see <see cref="Tinkerforge.BrickDC.SetDriveMode"/>). In
+		///   Drive/Coast mode it is unfortunately impossible to reliably read the
+		///   overcurrent/overtemperature signal from the driver chip.
+		///  </note>
+		/// </summary>
+		public event EmergencyShutdownEventHandler EmergencyShutdownCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void EmergencyShutdownEventHandler(BrickDC sender);
+
+		/// <summary>
+		/// </summary>
+		public event EmergencyShutdownEventHandler EmergencyShutdown // for backward compatibility
+		{
+			add { EmergencyShutdownCallback += value; }
+			remove { EmergencyShutdownCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered whenever a set velocity is reached. For example:
+		///  If a velocity of 0 is present, acceleration is set to 5000 and velocity
+		///  to 10000, the <see cref="Tinkerforge.BrickDC.VelocityReachedCallback"/> callback will be triggered after about
+		///  2 seconds, when the set velocity is actually reached.
+		///  
+		///  <note>
+		///   Since we can't get any feedback from the DC motor, this only works if the
+		///   acceleration (see <see cref="Tinkerforge.BrickDC.SetAcceleration"/>) is set smaller or equal to the
+		///   maximum acceleration of the motor. Otherwise the motor will lag behind the
+		///   control value and the callback will be triggered too early.
+		///  </note>
+		/// </summary>
+		public event VelocityReachedEventHandler VelocityReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void VelocityReachedEventHandler(BrickDC sender, short velocity);
+
+		/// <summary>
+		/// </summary>
+		public event VelocityReachedEventHandler VelocityReached // for backward compatibility
+		{
+			add { VelocityReachedCallback += value; }
+			remove { VelocityReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered with the period that is set by
+		///  <see cref="Tinkerforge.BrickDC.SetCurrentVelocityPeriod"/>. The parameter is the *current*
+		///  velocity used by the motor.
+		///  
+		///  The <see cref="Tinkerforge.BrickDC.CurrentVelocityCallback"/> callback is only triggered after the set period
+		///  if there is a change in the velocity.
+		/// </summary>
+		public event CurrentVelocityEventHandler CurrentVelocityCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void CurrentVelocityEventHandler(BrickDC sender, short velocity);
+
+		/// <summary>
+		/// </summary>
+		public event CurrentVelocityEventHandler CurrentVelocity // for backward compatibility
+		{
+			add { CurrentVelocityCallback += value; }
+			remove { CurrentVelocityCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickDC(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 3;
+
+			callbackWrappers[CALLBACK_UNDER_VOLTAGE] = new CallbackWrapper(OnUnderVoltageCallback);
+			callbackWrappers[CALLBACK_EMERGENCY_SHUTDOWN] = new CallbackWrapper(OnEmergencyShutdownCallback);
+			callbackWrappers[CALLBACK_VELOCITY_REACHED] = new CallbackWrapper(OnVelocityReachedCallback);
+			callbackWrappers[CALLBACK_CURRENT_VELOCITY] = new CallbackWrapper(OnCurrentVelocityCallback);
+
+
+			responseExpected[FUNCTION_SET_VELOCITY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_VELOCITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CURRENT_VELOCITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ACCELERATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_ACCELERATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_PWM_FREQUENCY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_PWM_FREQUENCY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FULL_BRAKE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STACK_INPUT_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CURRENT_CONSUMPTION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DISABLE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MINIMUM_VOLTAGE] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_MINIMUM_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DRIVE_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_DRIVE_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CURRENT_VELOCITY_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_CURRENT_VELOCITY_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPITFP_BAUDRATE_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_BAUDRATE_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SEND_TIMEOUT_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPITFP_BAUDRATE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_BAUDRATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DISABLE_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_STATUS_LED_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROTOCOL1_BRICKLET_NAME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_BRICKLET_PLUGIN] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_BRICKLET_PLUGIN] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Sets the velocity of the motor. Whereas -32767 is full speed backward,
+		///  0 is stop and 32767 is full speed forward. Depending on the
+		///  acceleration (see <see cref="Tinkerforge.BrickDC.SetAcceleration"/>), the motor is not immediately
+		///  brought to the velocity but smoothly accelerated.
+		///  
+		///  The velocity describes the duty cycle of the PWM with which the motor is
+		///  controlled, e.g. a velocity of 3277 sets a PWM with a 10% duty cycle.
+		///  You can not only control the duty cycle of the PWM but also the frequency,
+		///  see <see cref="Tinkerforge.BrickDC.SetPWMFrequency"/>.
+		/// </summary>
+		public void SetVelocity(short velocity)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_VELOCITY);
+			LEConverter.To((short)velocity, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the velocity as set by <see cref="Tinkerforge.BrickDC.SetVelocity"/>.
+		/// </summary>
+		public short GetVelocity()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VELOCITY);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the *current* velocity of the motor. This value is different
+		///  from <see cref="Tinkerforge.BrickDC.GetVelocity"/> whenever the motor is currently accelerating
+		///  to a goal set by <see cref="Tinkerforge.BrickDC.SetVelocity"/>.
+		/// </summary>
+		public short GetCurrentVelocity()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CURRENT_VELOCITY);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the acceleration of the motor. It is given in *velocity/s*. An
+		///  acceleration of 10000 means, that every second the velocity is increased
+		///  by 10000 (or about 30% duty cycle).
+		///  
+		///  For example: If the current velocity is 0 and you want to accelerate to a
+		///  velocity of 16000 (about 50% duty cycle) in 10 seconds, you should set
+		///  an acceleration of 1600.
+		///  
+		///  If acceleration is set to 0, there is no speed ramping, i.e. a new velocity
+		///  is immediately given to the motor.
+		/// </summary>
+		public void SetAcceleration(int acceleration)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_ACCELERATION);
+			LEConverter.To((short)acceleration, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the acceleration as set by <see cref="Tinkerforge.BrickDC.SetAcceleration"/>.
+		/// </summary>
+		public int GetAcceleration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the frequency of the PWM with which the motor is driven.
+		///  Often a high frequency
+		///  is less noisy and the motor runs smoother. However, with a low frequency
+		///  there are less switches and therefore fewer switching losses. Also with
+		///  most motors lower frequencies enable higher torque.
+		///  
+		///  If you have no idea what all this means, just ignore this function and use
+		///  the default frequency, it will very likely work fine.
+		/// </summary>
+		public void SetPWMFrequency(int frequency)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_PWM_FREQUENCY);
+			LEConverter.To((short)frequency, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the PWM frequency as set by <see cref="Tinkerforge.BrickDC.SetPWMFrequency"/>.
+		/// </summary>
+		public int GetPWMFrequency()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_PWM_FREQUENCY);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Executes an active full brake.
+		///  
+		///  <note type="caution">
+		///   This function is for emergency purposes,
+		///   where an immediate brake is necessary. Depending on the current velocity and
+		///   the strength of the motor, a full brake can be quite violent.
+		///  </note>
+		///  
+		///  Call <see cref="Tinkerforge.BrickDC.SetVelocity"/> with 0 if you just want to stop the motor.
+		/// </summary>
+		public void FullBrake()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_FULL_BRAKE);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the stack input voltage. The stack input voltage is the
+		///  voltage that is supplied via the stack, i.e. it is given by a
+		///  Step-Down or Step-Up Power Supply.
+		/// </summary>
+		public int GetStackInputVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STACK_INPUT_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the external input voltage. The external input voltage is
+		///  given via the black power input connector on the DC Brick.
+		///  
+		///  If there is an external input voltage and a stack input voltage, the motor
+		///  will be driven by the external input voltage. If there is only a stack
+		///  voltage present, the motor will be driven by this voltage.
+		///  
+		///  <note type="caution">
+		///   This means, if you have a high stack voltage and a low external voltage,
+		///   the motor will be driven with the low external voltage. If you then remove
+		///   the external connection, it will immediately be driven by the high
+		///   stack voltage.
+		///  </note>
+		/// </summary>
+		public int GetExternalInputVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current consumption of the motor.
+		/// </summary>
+		public int GetCurrentConsumption()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CURRENT_CONSUMPTION);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Enables the driver chip. The driver parameters can be configured (velocity,
+		///  acceleration, etc) before it is enabled.
+		/// </summary>
+		public void Enable()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the driver chip. The configurations are kept (velocity,
+		///  acceleration, etc) but the motor is not driven until it is enabled again.
+		///  
+		///  <note type="caution">
+		///   Disabling the driver chip while the motor is still turning can damage the
+		///   driver chip. The motor should be stopped calling <see cref="Tinkerforge.BrickDC.SetVelocity"/> with 0
+		///   before disabling the motor power. The <see cref="Tinkerforge.BrickDC.SetVelocity"/> function will **not**
+		///   wait until the motor is actually stopped. You have to explicitly wait for the
+		///   appropriate time after calling the <see cref="Tinkerforge.BrickDC.SetVelocity"/> function before calling
+		///   the <see cref="Tinkerforge.BrickDC.Disable"/> function.
+		///  </note>
+		/// </summary>
+		public void Disable()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the driver chip is enabled, *false* otherwise.
+		/// </summary>
+		public bool IsEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the minimum voltage, below which the <see cref="Tinkerforge.BrickDC.UnderVoltageCallback"/> callback
+		///  is triggered. The minimum possible value that works with the DC Brick is 6V.
+		///  You can use this function to detect the discharge of a battery that is used
+		///  to drive the motor. If you have a fixed power supply, you likely do not need
+		///  this functionality.
+		/// </summary>
+		public void SetMinimumVoltage(int voltage)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_MINIMUM_VOLTAGE);
+			LEConverter.To((short)voltage, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the minimum voltage as set by <see cref="Tinkerforge.BrickDC.SetMinimumVoltage"/>
+		/// </summary>
+		public int GetMinimumVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MINIMUM_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the drive mode. Possible modes are:
+		///  
+		///  * 0 = Drive/Brake
+		///  * 1 = Drive/Coast
+		///  
+		///  These modes are different kinds of motor controls.
+		///  
+		///  In Drive/Brake mode, the motor is always either driving or braking. There
+		///  is no freewheeling. Advantages are: A more linear correlation between
+		///  PWM and velocity, more exact accelerations and the possibility to drive
+		///  with slower velocities.
+		///  
+		///  In Drive/Coast mode, the motor is always either driving or freewheeling.
+		///  Advantages are: Less current consumption and less demands on the motor and
+		///  driver chip.
+		/// </summary>
+		public void SetDriveMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_DRIVE_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the drive mode, as set by <see cref="Tinkerforge.BrickDC.SetDriveMode"/>.
+		/// </summary>
+		public byte GetDriveMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DRIVE_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets a period with which the <see cref="Tinkerforge.BrickDC.CurrentVelocityCallback"/> callback is triggered.
+		///  A period of 0 turns the callback off.
+		/// </summary>
+		public void SetCurrentVelocityPeriod(int period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_CURRENT_VELOCITY_PERIOD);
+			LEConverter.To((short)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickDC.SetCurrentVelocityPeriod"/>.
+		/// </summary>
+		public int GetCurrentVelocityPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CURRENT_VELOCITY_PERIOD);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  The SPITF protocol can be used with a dynamic baudrate. If the dynamic baudrate is
+		///  enabled, the Brick will try to adapt the baudrate for the communication
+		///  between Bricks and Bricklets according to the amount of data that is transferred.
+		///  
+		///  The baudrate will be increased exponentially if lots of data is sent/received and
+		///  decreased linearly if little data is sent/received.
+		///  
+		///  This lowers the baudrate in applications where little data is transferred (e.g.
+		///  a weather station) and increases the robustness. If there is lots of data to transfer
+		///  (e.g. Thermal Imaging Bricklet) it automatically increases the baudrate as needed.
+		///  
+		///  In cases where some data has to transferred as fast as possible every few seconds
+		///  (e.g. RS485 Bricklet with a high baudrate but small payload) you may want to turn
+		///  the dynamic baudrate off to get the highest possible performance.
+		///  
+		///  The maximum value of the baudrate can be set per port with the function
+		///  <see cref="Tinkerforge.BrickDC.SetSPITFPBaudrate"/>. If the dynamic baudrate is disabled, the baudrate
+		///  as set by <see cref="Tinkerforge.BrickDC.SetSPITFPBaudrate"/> will be used statically.
+		///  
+		///  .. versionadded:: 2.3.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetSPITFPBaudrateConfig(bool enableDynamicBaudrate, long minimumDynamicBaudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SPITFP_BAUDRATE_CONFIG);
+			LEConverter.To((bool)enableDynamicBaudrate, 8, request);
+			LEConverter.To((int)minimumDynamicBaudrate, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the baudrate config, see <see cref="Tinkerforge.BrickDC.SetSPITFPBaudrateConfig"/>.
+		///  
+		///  .. versionadded:: 2.3.5$nbsp;(Firmware)
+		/// </summary>
+		public void GetSPITFPBaudrateConfig(out bool enableDynamicBaudrate, out long minimumDynamicBaudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_BAUDRATE_CONFIG);
+
+			byte[] response = SendRequest(request, 13);
+
+			enableDynamicBaudrate = LEConverter.BoolFrom(8, response);
+			minimumDynamicBaudrate = LEConverter.UIntFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the timeout count for the different communication methods.
+		///  
+		///  The methods 0-2 are available for all Bricks, 3-7 only for Master Bricks.
+		///  
+		///  This function is mostly used for debugging during development, in normal operation
+		///  the counters should nearly always stay at 0.
+		///  
+		///  .. versionadded:: 2.3.3$nbsp;(Firmware)
+		/// </summary>
+		public long GetSendTimeoutCount(byte communicationMethod)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SEND_TIMEOUT_COUNT);
+			LEConverter.To((byte)communicationMethod, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the baudrate for a specific Bricklet port.
+		///  
+		///  If you want to increase the throughput of Bricklets you can increase
+		///  the baudrate. If you get a high error count because of high
+		///  interference (see <see cref="Tinkerforge.BrickDC.GetSPITFPErrorCount"/>) you can decrease the
+		///  baudrate.
+		///  
+		///  If the dynamic baudrate feature is enabled, the baudrate set by this
+		///  function corresponds to the maximum baudrate (see <see cref="Tinkerforge.BrickDC.SetSPITFPBaudrateConfig"/>).
+		///  
+		///  Regulatory testing is done with the default baudrate. If CE compatibility
+		///  or similar is necessary in your applications we recommend to not change
+		///  the baudrate.
+		///  
+		///  .. versionadded:: 2.3.3$nbsp;(Firmware)
+		/// </summary>
+		public void SetSPITFPBaudrate(char brickletPort, long baudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SPITFP_BAUDRATE);
+			LEConverter.To((char)brickletPort, 8, request);
+			LEConverter.To((int)baudrate, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the baudrate for a given Bricklet port, see <see cref="Tinkerforge.BrickDC.SetSPITFPBaudrate"/>.
+		///  
+		///  .. versionadded:: 2.3.3$nbsp;(Firmware)
+		/// </summary>
+		public long GetSPITFPBaudrate(char brickletPort)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SPITFP_BAUDRATE);
+			LEConverter.To((char)brickletPort, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Brick side. All
+		///  Bricklets have a similar function that returns the errors on the Bricklet side.
+		///  
+		///  .. versionadded:: 2.3.3$nbsp;(Firmware)
+		/// </summary>
+		public void GetSPITFPErrorCount(char brickletPort, out long errorCountACKChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SPITFP_ERROR_COUNT);
+			LEConverter.To((char)brickletPort, 8, request);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountACKChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Enables the status LED.
+		///  
+		///  The status LED is the blue LED next to the USB connector. If enabled is is
+		///  on and it flickers if data is transfered. If disabled it is always off.
+		///  
+		///  The default state is enabled.
+		///  
+		///  .. versionadded:: 2.3.1$nbsp;(Firmware)
+		/// </summary>
+		public void EnableStatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the status LED.
+		///  
+		///  The status LED is the blue LED next to the USB connector. If enabled is is
+		///  on and it flickers if data is transfered. If disabled it is always off.
+		///  
+		///  The default state is enabled.
+		///  
+		///  .. versionadded:: 2.3.1$nbsp;(Firmware)
+		/// </summary>
+		public void DisableStatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the status LED is enabled, *false* otherwise.
+		///  
+		///  .. versionadded:: 2.3.1$nbsp;(Firmware)
+		/// </summary>
+		public bool IsStatusLEDEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_STATUS_LED_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the firmware and protocol version and the name of the Bricklet for a
+		///  given port.
+		///  
+		///  This functions sole purpose is to allow automatic flashing of v1.x.y Bricklet
+		///  plugins.
+		/// </summary>
+		public void GetProtocol1BrickletName(char port, out byte protocolVersion, out byte[] firmwareVersion, out string name)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_PROTOCOL1_BRICKLET_NAME);
+			LEConverter.To((char)port, 8, request);
+
+			byte[] response = SendRequest(request, 52);
+
+			protocolVersion = LEConverter.ByteFrom(8, response);
+			firmwareVersion = LEConverter.ByteArrayFrom(9, response, 3);
+			name = LEConverter.StringFrom(12, response, 40);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has an
+		///  accuracy of ±15%. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Brick. Calling this function
+		///  on a Brick inside of a stack will reset the whole stack.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 32 bytes of firmware to the bricklet attached at the given port.
+		///  The bytes are written to the position offset * 32.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void WriteBrickletPlugin(char port, byte offset, byte[] chunk)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(42, FUNCTION_WRITE_BRICKLET_PLUGIN);
+			LEConverter.To((char)port, 8, request);
+			LEConverter.To((byte)offset, 9, request);
+			LEConverter.To((byte[])chunk, 10, 32, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Reads 32 bytes of firmware from the bricklet attached at the given port.
+		///  The bytes are read starting at the position offset * 32.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte[] ReadBrickletPlugin(char port, byte offset)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_READ_BRICKLET_PLUGIN);
+			LEConverter.To((char)port, 8, request);
+			LEConverter.To((byte)offset, 9, request);
+
+			byte[] response = SendRequest(request, 40);
+
+			return LEConverter.ByteArrayFrom(8, response, 32);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Brick is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position is the position in the stack from '0' (bottom) to '8' (top).
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnUnderVoltageCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.UShortFrom(8, response);
+			var handler = UnderVoltageCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnEmergencyShutdownCallback(byte[] response)
+		{
+			if (response.Length != 8)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			var handler = EmergencyShutdownCallback;
+
+			if (handler != null)
+			{
+				handler(this);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnVelocityReachedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short velocity = LEConverter.ShortFrom(8, response);
+			var handler = VelocityReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, velocity);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnCurrentVelocityCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short velocity = LEConverter.ShortFrom(8, response);
+			var handler = CurrentVelocityCallback;
+
+			if (handler != null)
+			{
+				handler(this, velocity);
+			}
+		}
+	}
+}
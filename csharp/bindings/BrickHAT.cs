@@ -0,0 +1,687 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  HAT for Raspberry Pi with 8 Bricklets ports and real-time clock
+	/// </summary>
+	public class BrickHAT : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 111;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "HAT Brick";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SLEEP_MODE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SLEEP_MODE = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BRICKLET_POWER = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BRICKLET_POWER = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VOLTAGES = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VOLTAGES_CALLBACK_CONFIGURATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VOLTAGES_CALLBACK_CONFIGURATION = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_VOLTAGES = 8;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickHAT.SetVoltagesCallbackConfiguration"/>.
+		///  
+		///  The parameters are the same as <see cref="Tinkerforge.BrickHAT.GetVoltages"/>.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public event VoltagesEventHandler VoltagesCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void VoltagesEventHandler(BrickHAT sender, int voltageUSB, int voltageDC);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickHAT(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_VOLTAGES] = new CallbackWrapper(OnVoltagesCallback);
+
+
+			responseExpected[FUNCTION_SET_SLEEP_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SLEEP_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BRICKLET_POWER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_BRICKLET_POWER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_VOLTAGES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_VOLTAGES_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_VOLTAGES_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Sets the sleep mode.
+		///  
+		///  <note>
+		///   Calling this function will cut the Raspberry Pi's power after Power Off Delay seconds.
+		///   You have to shut down the operating system yourself, e.g. by calling 'sudo shutdown -h now'.
+		///  </note>
+		///  
+		///  Parameters:
+		///  
+		///  * Power Off Delay: Time before the RPi/Bricklets are powered off.
+		///  * Power Off Duration: Duration that the RPi/Bricklets stay powered off.
+		///  * Raspberry Pi Off: RPi is powered off if set to true.
+		///  * Bricklets Off: Bricklets are powered off if set to true.
+		///  * Enable Sleep Indicator: If set to true, the status LED will blink in a 1s interval
+		///    during the whole power off duration. This will draw additional 0.3mA.
+		///  
+		///  Example: To turn RPi and Bricklets off in 5 seconds for 10 minutes with sleep
+		///  indicator enabled, call (5, 60*10, true, true, true).
+		///  
+		///  This function can also be used to implement a watchdog. To do this you can
+		///  write a program that calls this function once per second in a loop with
+		///  (10, 2, true, false, false). If the RPi crashes or gets stuck
+		///  the HAT will reset the RPi after 10 seconds.
+		/// </summary>
+		public void SetSleepMode(long powerOffDelay, long powerOffDuration, bool raspberryPiOff, bool brickletsOff, bool enableSleepIndicator)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(19, FUNCTION_SET_SLEEP_MODE);
+			LEConverter.To((int)powerOffDelay, 8, request);
+			LEConverter.To((int)powerOffDuration, 12, request);
+			LEConverter.To((bool)raspberryPiOff, 16, request);
+			LEConverter.To((bool)brickletsOff, 17, request);
+			LEConverter.To((bool)enableSleepIndicator, 18, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the sleep mode settings as set by <see cref="Tinkerforge.BrickHAT.SetSleepMode"/>.
+		/// </summary>
+		public void GetSleepMode(out long powerOffDelay, out long powerOffDuration, out bool raspberryPiOff, out bool brickletsOff, out bool enableSleepIndicator)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SLEEP_MODE);
+
+			byte[] response = SendRequest(request, 19);
+
+			powerOffDelay = LEConverter.UIntFrom(8, response);
+			powerOffDuration = LEConverter.UIntFrom(12, response);
+			raspberryPiOff = LEConverter.BoolFrom(16, response);
+			brickletsOff = LEConverter.BoolFrom(17, response);
+			enableSleepIndicator = LEConverter.BoolFrom(18, response);
+		}
+
+		/// <summary>
+		///  Set to true/false to turn the power supply of the connected Bricklets on/off.
+		/// </summary>
+		public void SetBrickletPower(bool brickletPower)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BRICKLET_POWER);
+			LEConverter.To((bool)brickletPower, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the power status of the connected Bricklets as set by <see cref="Tinkerforge.BrickHAT.SetBrickletPower"/>.
+		/// </summary>
+		public bool GetBrickletPower()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BRICKLET_POWER);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the USB supply voltage and the DC input supply voltage.
+		///  
+		///  There are three possible combinations:
+		///  
+		///  * Only USB connected: The USB supply voltage will be fed back to the
+		///    DC input connector. You will read the USB voltage and a slightly lower
+		///    voltage on the DC input.
+		///  * Only DC input connected: The DC voltage will not be fed back to the
+		///    USB connector. You will read the DC input voltage and the USB voltage
+		///    will be 0.
+		///  * USB and DC input connected: You will read both voltages. In this case
+		///    the USB supply will be without load, but it will work as backup if you
+		///    disconnect the DC input (or if the DC input voltage falls below the
+		///    USB voltage).
+		/// </summary>
+		public void GetVoltages(out int voltageUSB, out int voltageDC)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VOLTAGES);
+
+			byte[] response = SendRequest(request, 12);
+
+			voltageUSB = LEConverter.UShortFrom(8, response);
+			voltageDC = LEConverter.UShortFrom(10, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickHAT.VoltagesCallback"/>
+		///  callback is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public void SetVoltagesCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_VOLTAGES_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickHAT.SetVoltagesCallbackConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public void GetVoltagesCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VOLTAGES_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickHAT.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickHAT.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickHAT.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickHAT.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the HAT is connected to
+		///  (typically '0' as the HAT is the root device in the topology),
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The HAT (Zero) Brick is always at position 'i'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnVoltagesCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltageUSB = LEConverter.UShortFrom(8, response);
+			int voltageDC = LEConverter.UShortFrom(10, response);
+			var handler = VoltagesCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltageUSB, voltageDC);
+			}
+		}
+	}
+}
@@ -0,0 +1,602 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  HAT for Raspberry Pi Zero with 4 Bricklets ports
+	/// </summary>
+	public class BrickHATZero : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 112;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "HAT Zero Brick";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_USB_VOLTAGE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_USB_VOLTAGE_CALLBACK_CONFIGURATION = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_USB_VOLTAGE_CALLBACK_CONFIGURATION = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_USB_VOLTAGE = 4;
+
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OFF = 'x';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OUTSIDE = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_INSIDE = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_SMALLER = '<';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_GREATER = '>';
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickHATZero.SetUSBVoltageCallbackConfiguration"/>.
+		///  
+		///  The parameter is the same as <see cref="Tinkerforge.BrickHATZero.GetUSBVoltage"/>.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public event USBVoltageEventHandler USBVoltageCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void USBVoltageEventHandler(BrickHATZero sender, int voltage);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickHATZero(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_USB_VOLTAGE] = new CallbackWrapper(OnUSBVoltageCallback);
+
+
+			responseExpected[FUNCTION_GET_USB_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_USB_VOLTAGE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_USB_VOLTAGE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the USB supply voltage of the Raspberry Pi.
+		///  
+		///  
+		///  If you want to get the value periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickHATZero.USBVoltageCallback"/> callback. You can set the callback configuration
+		///  with <see cref="Tinkerforge.BrickHATZero.SetUSBVoltageCallbackConfiguration"/>.
+		/// </summary>
+		public int GetUSBVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_USB_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickHATZero.USBVoltageCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change
+		///  within the period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  It is furthermore possible to constrain the callback with thresholds.
+		///  
+		///  The `option`-parameter together with min/max sets a threshold for the <see cref="Tinkerforge.BrickHATZero.USBVoltageCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Threshold is turned off"
+		///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+		///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+		///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+		///  </code>
+		///  
+		///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public void SetUSBVoltageCallbackConfiguration(long period, bool valueHasToChange, char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(18, FUNCTION_SET_USB_VOLTAGE_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+			LEConverter.To((char)option, 13, request);
+			LEConverter.To((short)min, 14, request);
+			LEConverter.To((short)max, 16, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickHATZero.SetUSBVoltageCallbackConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public void GetUSBVoltageCallbackConfiguration(out long period, out bool valueHasToChange, out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_USB_VOLTAGE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 18);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+			option = LEConverter.CharFrom(13, response);
+			min = LEConverter.UShortFrom(14, response);
+			max = LEConverter.UShortFrom(16, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickHATZero.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickHATZero.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickHATZero.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickHATZero.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the HAT is connected to
+		///  (typically '0' as the HAT is the root device in the topology),
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The HAT (Zero) Brick is always at position 'i'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnUSBVoltageCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.UShortFrom(8, response);
+			var handler = USBVoltageCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage);
+			}
+		}
+	}
+}
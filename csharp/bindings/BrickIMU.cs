@@ -0,0 +1,1699 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Full fledged AHRS with 9 degrees of freedom
+	/// </summary>
+	public class BrickIMU : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 16;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "IMU Brick";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MAGNETIC_FIELD = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ANGULAR_VELOCITY = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_DATA = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ORIENTATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_QUATERNION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IMU_TEMPERATURE = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_LEDS_ON = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_LEDS_OFF = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ARE_LEDS_ON = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ACCELERATION_RANGE = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION_RANGE = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MAGNETOMETER_RANGE = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MAGNETOMETER_RANGE = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CONVERGENCE_SPEED = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CONVERGENCE_SPEED = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CALIBRATION = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CALIBRATION = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ACCELERATION_PERIOD = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION_PERIOD = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MAGNETIC_FIELD_PERIOD = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MAGNETIC_FIELD_PERIOD = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ANGULAR_VELOCITY_PERIOD = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ANGULAR_VELOCITY_PERIOD = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALL_DATA_PERIOD = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_DATA_PERIOD = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ORIENTATION_PERIOD = 27;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ORIENTATION_PERIOD = 28;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_QUATERNION_PERIOD = 29;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_QUATERNION_PERIOD = 30;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ORIENTATION_CALCULATION_ON = 37;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ORIENTATION_CALCULATION_OFF = 38;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_ORIENTATION_CALCULATION_ON = 39;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPITFP_BAUDRATE_CONFIG = 231;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_BAUDRATE_CONFIG = 232;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SEND_TIMEOUT_COUNT = 233;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPITFP_BAUDRATE = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_BAUDRATE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_STATUS_LED = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_STATUS_LED = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_STATUS_LED_ENABLED = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROTOCOL1_BRICKLET_NAME = 241;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_BRICKLET_PLUGIN = 246;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_BRICKLET_PLUGIN = 247;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_ACCELERATION = 31;
+
+		private const int CALLBACK_MAGNETIC_FIELD = 32;
+
+		private const int CALLBACK_ANGULAR_VELOCITY = 33;
+
+		private const int CALLBACK_ALL_DATA = 34;
+
+		private const int CALLBACK_ORIENTATION = 35;
+
+		private const int CALLBACK_QUATERNION = 36;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte CALIBRATION_TYPE_ACCELEROMETER_GAIN = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CALIBRATION_TYPE_ACCELEROMETER_BIAS = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CALIBRATION_TYPE_MAGNETOMETER_GAIN = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte CALIBRATION_TYPE_MAGNETOMETER_BIAS = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte CALIBRATION_TYPE_GYROSCOPE_GAIN = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte CALIBRATION_TYPE_GYROSCOPE_BIAS = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_USB = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_SPI_STACK = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_CHIBI = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_RS485 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_WIFI = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_ETHERNET = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_WIFI_V2 = 7;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMU.SetAccelerationPeriod"/>. The parameters are the acceleration
+		///  for the x, y and z axis.
+		/// </summary>
+		public event AccelerationEventHandler AccelerationCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AccelerationEventHandler(BrickIMU sender, short x, short y, short z);
+
+		/// <summary>
+		/// </summary>
+		public event AccelerationEventHandler Acceleration // for backward compatibility
+		{
+			add { AccelerationCallback += value; }
+			remove { AccelerationCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMU.SetMagneticFieldPeriod"/>. The parameters are the magnetic
+		///  field for the x, y and z axis.
+		/// </summary>
+		public event MagneticFieldEventHandler MagneticFieldCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void MagneticFieldEventHandler(BrickIMU sender, short x, short y, short z);
+
+		/// <summary>
+		/// </summary>
+		public event MagneticFieldEventHandler MagneticField // for backward compatibility
+		{
+			add { MagneticFieldCallback += value; }
+			remove { MagneticFieldCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMU.SetAngularVelocityPeriod"/>. The parameters are the angular
+		///  velocity for the x, y and z axis.
+		/// </summary>
+		public event AngularVelocityEventHandler AngularVelocityCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AngularVelocityEventHandler(BrickIMU sender, short x, short y, short z);
+
+		/// <summary>
+		/// </summary>
+		public event AngularVelocityEventHandler AngularVelocity // for backward compatibility
+		{
+			add { AngularVelocityCallback += value; }
+			remove { AngularVelocityCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMU.SetAllDataPeriod"/>. The parameters are the acceleration,
+		///  the magnetic field and the angular velocity for the x, y and z axis as
+		///  well as the temperature of the IMU Brick.
+		/// </summary>
+		public event AllDataEventHandler AllDataCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AllDataEventHandler(BrickIMU sender, short accX, short accY, short accZ, short magX, short magY, short magZ, short angX, short angY, short angZ, short temperature);
+
+		/// <summary>
+		/// </summary>
+		public event AllDataEventHandler AllData // for backward compatibility
+		{
+			add { AllDataCallback += value; }
+			remove { AllDataCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMU.SetOrientationPeriod"/>. The parameters are the orientation
+		///  (roll, pitch and yaw) of the IMU Brick in Euler angles. See
+		///  <see cref="Tinkerforge.BrickIMU.GetOrientation"/> for details.
+		/// </summary>
+		public event OrientationEventHandler OrientationCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void OrientationEventHandler(BrickIMU sender, short roll, short pitch, short yaw);
+
+		/// <summary>
+		/// </summary>
+		public event OrientationEventHandler Orientation // for backward compatibility
+		{
+			add { OrientationCallback += value; }
+			remove { OrientationCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMU.SetQuaternionPeriod"/>. The parameters are the orientation
+		///  (x, y, z, w) of the IMU Brick in quaternions. See <see cref="Tinkerforge.BrickIMU.GetQuaternion"/>
+		///  for details.
+		/// </summary>
+		public event QuaternionEventHandler QuaternionCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void QuaternionEventHandler(BrickIMU sender, float x, float y, float z, float w);
+
+		/// <summary>
+		/// </summary>
+		public event QuaternionEventHandler Quaternion // for backward compatibility
+		{
+			add { QuaternionCallback += value; }
+			remove { QuaternionCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickIMU(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 4;
+
+			callbackWrappers[CALLBACK_ACCELERATION] = new CallbackWrapper(OnAccelerationCallback);
+			callbackWrappers[CALLBACK_MAGNETIC_FIELD] = new CallbackWrapper(OnMagneticFieldCallback);
+			callbackWrappers[CALLBACK_ANGULAR_VELOCITY] = new CallbackWrapper(OnAngularVelocityCallback);
+			callbackWrappers[CALLBACK_ALL_DATA] = new CallbackWrapper(OnAllDataCallback);
+			callbackWrappers[CALLBACK_ORIENTATION] = new CallbackWrapper(OnOrientationCallback);
+			callbackWrappers[CALLBACK_QUATERNION] = new CallbackWrapper(OnQuaternionCallback);
+
+
+			responseExpected[FUNCTION_GET_ACCELERATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_MAGNETIC_FIELD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ANGULAR_VELOCITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ALL_DATA] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ORIENTATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_QUATERNION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IMU_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_LEDS_ON] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_LEDS_OFF] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_ARE_LEDS_ON] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ACCELERATION_RANGE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_ACCELERATION_RANGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MAGNETOMETER_RANGE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_MAGNETOMETER_RANGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CONVERGENCE_SPEED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CONVERGENCE_SPEED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CALIBRATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CALIBRATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ACCELERATION_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ACCELERATION_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MAGNETIC_FIELD_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_MAGNETIC_FIELD_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ANGULAR_VELOCITY_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ANGULAR_VELOCITY_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALL_DATA_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALL_DATA_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ORIENTATION_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ORIENTATION_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_QUATERNION_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_QUATERNION_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ORIENTATION_CALCULATION_ON] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_ORIENTATION_CALCULATION_OFF] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_ORIENTATION_CALCULATION_ON] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPITFP_BAUDRATE_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_BAUDRATE_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SEND_TIMEOUT_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPITFP_BAUDRATE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_BAUDRATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DISABLE_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_STATUS_LED_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROTOCOL1_BRICKLET_NAME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_BRICKLET_PLUGIN] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_BRICKLET_PLUGIN] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the calibrated acceleration from the accelerometer for the
+		///  x, y and z axis.
+		///  
+		///  If you want to get the acceleration periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMU.AccelerationCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMU.SetAccelerationPeriod"/>.
+		/// </summary>
+		public void GetAcceleration(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the calibrated magnetic field from the magnetometer for the
+		///  x, y and z axis.
+		///  
+		///  If you want to get the magnetic field periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMU.MagneticFieldCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMU.SetMagneticFieldPeriod"/>.
+		/// </summary>
+		public void GetMagneticField(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MAGNETIC_FIELD);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the calibrated angular velocity from the gyroscope for the
+		///  x, y and z axis in °/14.375s (you have to divide by 14.375 to
+		///  get the value in °/s).
+		///  
+		///  If you want to get the angular velocity periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMU.AngularVelocityCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMU.SetAngularVelocityPeriod"/>.
+		/// </summary>
+		public void GetAngularVelocity(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ANGULAR_VELOCITY);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the data from <see cref="Tinkerforge.BrickIMU.GetAcceleration"/>, <see cref="Tinkerforge.BrickIMU.GetMagneticField"/>
+		///  and <see cref="Tinkerforge.BrickIMU.GetAngularVelocity"/> as well as the temperature of the IMU Brick.
+		///  
+		///  If you want to get the data periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMU.AllDataCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMU.SetAllDataPeriod"/>.
+		/// </summary>
+		public void GetAllData(out short accX, out short accY, out short accZ, out short magX, out short magY, out short magZ, out short angX, out short angY, out short angZ, out short temperature)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_DATA);
+
+			byte[] response = SendRequest(request, 28);
+
+			accX = LEConverter.ShortFrom(8, response);
+			accY = LEConverter.ShortFrom(10, response);
+			accZ = LEConverter.ShortFrom(12, response);
+			magX = LEConverter.ShortFrom(14, response);
+			magY = LEConverter.ShortFrom(16, response);
+			magZ = LEConverter.ShortFrom(18, response);
+			angX = LEConverter.ShortFrom(20, response);
+			angY = LEConverter.ShortFrom(22, response);
+			angZ = LEConverter.ShortFrom(24, response);
+			temperature = LEConverter.ShortFrom(26, response);
+		}
+
+		/// <summary>
+		///  Returns the current orientation (roll, pitch, yaw) of the IMU Brick as Euler
+		///  angles. Note that Euler angles always experience a
+		///  `gimbal lock &lt;https://en.wikipedia.org/wiki/Gimbal_lock&gt;`__.
+		///  
+		///  We recommend that you use quaternions instead.
+		///  
+		///  The order to sequence in which the orientation values should be applied is
+		///  roll, yaw, pitch.
+		///  
+		///  If you want to get the orientation periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMU.OrientationCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMU.SetOrientationPeriod"/>.
+		/// </summary>
+		public void GetOrientation(out short roll, out short pitch, out short yaw)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ORIENTATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			roll = LEConverter.ShortFrom(8, response);
+			pitch = LEConverter.ShortFrom(10, response);
+			yaw = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the current orientation (x, y, z, w) of the IMU as
+		///  `quaternions &lt;https://en.wikipedia.org/wiki/Quaternions_and_spatial_rotation&gt;`__.
+		///  
+		///  You can go from quaternions to Euler angles with the following formula::
+		///  
+		///   xAngle = atan2(2*y*w - 2*x*z, 1 - 2*y*y - 2*z*z)
+		///   yAngle = atan2(2*x*w - 2*y*z, 1 - 2*x*x - 2*z*z)
+		///   zAngle =  asin(2*x*y + 2*z*w)
+		///  
+		///  This process is not reversible, because of the
+		///  `gimbal lock &lt;https://en.wikipedia.org/wiki/Gimbal_lock&gt;`__.
+		///  
+		///  It is also possible to calculate independent angles. You can calculate
+		///  yaw, pitch and roll in a right-handed vehicle coordinate system according to
+		///  DIN70000 with::
+		///  
+		///   yaw   =  atan2(2*x*y + 2*w*z, w*w + x*x - y*y - z*z)
+		///   pitch = -asin(2*w*y - 2*x*z)
+		///   roll  = -atan2(2*y*z + 2*w*x, -w*w + x*x + y*y - z*z))
+		///  
+		///  Converting the quaternions to an OpenGL transformation matrix is
+		///  possible with the following formula::
+		///  
+		///   matrix = [[1 - 2*(y*y + z*z),     2*(x*y - w*z),     2*(x*z + w*y), 0],
+		///             [    2*(x*y + w*z), 1 - 2*(x*x + z*z),     2*(y*z - w*x), 0],
+		///             [    2*(x*z - w*y),     2*(y*z + w*x), 1 - 2*(x*x + y*y), 0],
+		///             [                0,                 0,                 0, 1]]
+		///  
+		///  If you want to get the quaternions periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMU.QuaternionCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMU.SetQuaternionPeriod"/>.
+		/// </summary>
+		public void GetQuaternion(out float x, out float y, out float z, out float w)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_QUATERNION);
+
+			byte[] response = SendRequest(request, 24);
+
+			x = LEConverter.FloatFrom(8, response);
+			y = LEConverter.FloatFrom(12, response);
+			z = LEConverter.FloatFrom(16, response);
+			w = LEConverter.FloatFrom(20, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature of the IMU Brick.
+		/// </summary>
+		public short GetIMUTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IMU_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Turns the orientation and direction LEDs of the IMU Brick on.
+		/// </summary>
+		public void LedsOn()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_LEDS_ON);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Turns the orientation and direction LEDs of the IMU Brick off.
+		/// </summary>
+		public void LedsOff()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_LEDS_OFF);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the orientation and direction LEDs of the IMU Brick
+		///  are on, *false* otherwise.
+		/// </summary>
+		public bool AreLedsOn()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ARE_LEDS_ON);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Not implemented yet.
+		/// </summary>
+		public void SetAccelerationRange(byte range)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_ACCELERATION_RANGE);
+			LEConverter.To((byte)range, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Not implemented yet.
+		/// </summary>
+		public byte GetAccelerationRange()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION_RANGE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Not implemented yet.
+		/// </summary>
+		public void SetMagnetometerRange(byte range)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_MAGNETOMETER_RANGE);
+			LEConverter.To((byte)range, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Not implemented yet.
+		/// </summary>
+		public byte GetMagnetometerRange()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MAGNETOMETER_RANGE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the convergence speed of the IMU Brick. The convergence speed
+		///  determines how the different sensor measurements are fused.
+		///  
+		///  If the orientation of the IMU Brick is off by 10° and the convergence speed is
+		///  set to 20°/s, it will take 0.5s until the orientation is corrected. However,
+		///  if the correct orientation is reached and the convergence speed is too high,
+		///  the orientation will fluctuate with the fluctuations of the accelerometer and
+		///  the magnetometer.
+		///  
+		///  If you set the convergence speed to 0, practically only the gyroscope is used
+		///  to calculate the orientation. This gives very smooth movements, but errors of the
+		///  gyroscope will not be corrected. If you set the convergence speed to something
+		///  above 500, practically only the magnetometer and the accelerometer are used to
+		///  calculate the orientation. In this case the movements are abrupt and the values
+		///  will fluctuate, but there won't be any errors that accumulate over time.
+		///  
+		///  In an application with high angular velocities, we recommend a high convergence
+		///  speed, so the errors of the gyroscope can be corrected fast. In applications with
+		///  only slow movements we recommend a low convergence speed. You can change the
+		///  convergence speed on the fly. So it is possible (and recommended) to increase
+		///  the convergence speed before an abrupt movement and decrease it afterwards
+		///  again.
+		///  
+		///  You might want to play around with the convergence speed in the Brick Viewer to
+		///  get a feeling for a good value for your application.
+		/// </summary>
+		public void SetConvergenceSpeed(int speed)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_CONVERGENCE_SPEED);
+			LEConverter.To((short)speed, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the convergence speed as set by <see cref="Tinkerforge.BrickIMU.SetConvergenceSpeed"/>.
+		/// </summary>
+		public int GetConvergenceSpeed()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CONVERGENCE_SPEED);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  There are several different types that can be calibrated:
+		///  
+		///  <code>
+		///   "Type", "Description", "Values"
+		///  
+		///   "0",    "Accelerometer Gain", "``[mul x, mul y, mul z, div x, div y, div z, 0, 0, 0, 0]``"
+		///   "1",    "Accelerometer Bias", "``[bias x, bias y, bias z, 0, 0, 0, 0, 0, 0, 0]``"
+		///   "2",    "Magnetometer Gain",  "``[mul x, mul y, mul z, div x, div y, div z, 0, 0, 0, 0]``"
+		///   "3",    "Magnetometer Bias",  "``[bias x, bias y, bias z, 0, 0, 0, 0, 0, 0, 0]``"
+		///   "4",    "Gyroscope Gain",     "``[mul x, mul y, mul z, div x, div y, div z, 0, 0, 0, 0]``"
+		///   "5",    "Gyroscope Bias",     "``[bias xl, bias yl, bias zl, temp l, bias xh, bias yh, bias zh, temp h, 0, 0]``"
+		///  </code>
+		///  
+		///  The calibration via gain and bias is done with the following formula::
+		///  
+		///   new_value = (bias + orig_value) * gain_mul / gain_div
+		///  
+		///  If you really want to write your own calibration software, please keep
+		///  in mind that you first have to undo the old calibration (set bias to 0 and
+		///  gain to 1/1) and that you have to average over several thousand values
+		///  to obtain a usable result in the end.
+		///  
+		///  The gyroscope bias is highly dependent on the temperature, so you have to
+		///  calibrate the bias two times with different temperatures. The values ``xl``,
+		///  ``yl``, ``zl`` and ``temp l`` are the bias for ``x``, ``y``, ``z`` and the
+		///  corresponding temperature for a low temperature. The values ``xh``, ``yh``,
+		///  ``zh`` and ``temp h`` are the same for a high temperatures. The temperature
+		///  difference should be at least 5°C. If you have a temperature where the
+		///  IMU Brick is mostly used, you should use this temperature for one of the
+		///  sampling points.
+		///  
+		///  <note>
+		///   We highly recommend that you use the Brick Viewer to calibrate your
+		///   IMU Brick.
+		///  </note>
+		/// </summary>
+		public void SetCalibration(byte typ, short[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(29, FUNCTION_SET_CALIBRATION);
+			LEConverter.To((byte)typ, 8, request);
+			LEConverter.To((short[])data, 9, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the calibration for a given type as set by <see cref="Tinkerforge.BrickIMU.SetCalibration"/>.
+		/// </summary>
+		public short[] GetCalibration(byte typ)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_CALIBRATION);
+			LEConverter.To((byte)typ, 8, request);
+
+			byte[] response = SendRequest(request, 28);
+
+			return LEConverter.ShortArrayFrom(8, response, 10);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMU.AccelerationCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetAccelerationPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ACCELERATION_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMU.SetAccelerationPeriod"/>.
+		/// </summary>
+		public long GetAccelerationPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMU.MagneticFieldCallback"/> callback is
+		///  triggered periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetMagneticFieldPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_MAGNETIC_FIELD_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMU.SetMagneticFieldPeriod"/>.
+		/// </summary>
+		public long GetMagneticFieldPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MAGNETIC_FIELD_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMU.AngularVelocityCallback"/> callback is
+		///  triggered periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetAngularVelocityPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ANGULAR_VELOCITY_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMU.SetAngularVelocityPeriod"/>.
+		/// </summary>
+		public long GetAngularVelocityPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ANGULAR_VELOCITY_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMU.AllDataCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetAllDataPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ALL_DATA_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMU.SetAllDataPeriod"/>.
+		/// </summary>
+		public long GetAllDataPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_DATA_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMU.OrientationCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetOrientationPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ORIENTATION_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMU.SetOrientationPeriod"/>.
+		/// </summary>
+		public long GetOrientationPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ORIENTATION_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMU.QuaternionCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetQuaternionPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_QUATERNION_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMU.SetQuaternionPeriod"/>.
+		/// </summary>
+		public long GetQuaternionPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_QUATERNION_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Turns the orientation calculation of the IMU Brick on.
+		///  
+		///  As default the calculation is on.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Firmware)
+		/// </summary>
+		public void OrientationCalculationOn()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ORIENTATION_CALCULATION_ON);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Turns the orientation calculation of the IMU Brick off.
+		///  
+		///  If the calculation is off, <see cref="Tinkerforge.BrickIMU.GetOrientation"/> will return
+		///  the last calculated value until the calculation is turned on again.
+		///  
+		///  The trigonometric functions that are needed to calculate the orientation
+		///  are very expensive. We recommend to turn the orientation calculation
+		///  off if the orientation is not needed, to free calculation time for the
+		///  sensor fusion algorithm.
+		///  
+		///  As default the calculation is on.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Firmware)
+		/// </summary>
+		public void OrientationCalculationOff()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ORIENTATION_CALCULATION_OFF);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the orientation calculation of the IMU Brick
+		///  is on, *false* otherwise.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Firmware)
+		/// </summary>
+		public bool IsOrientationCalculationOn()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_ORIENTATION_CALCULATION_ON);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  The SPITF protocol can be used with a dynamic baudrate. If the dynamic baudrate is
+		///  enabled, the Brick will try to adapt the baudrate for the communication
+		///  between Bricks and Bricklets according to the amount of data that is transferred.
+		///  
+		///  The baudrate will be increased exponentially if lots of data is sent/received and
+		///  decreased linearly if little data is sent/received.
+		///  
+		///  This lowers the baudrate in applications where little data is transferred (e.g.
+		///  a weather station) and increases the robustness. If there is lots of data to transfer
+		///  (e.g. Thermal Imaging Bricklet) it automatically increases the baudrate as needed.
+		///  
+		///  In cases where some data has to transferred as fast as possible every few seconds
+		///  (e.g. RS485 Bricklet with a high baudrate but small payload) you may want to turn
+		///  the dynamic baudrate off to get the highest possible performance.
+		///  
+		///  The maximum value of the baudrate can be set per port with the function
+		///  <see cref="Tinkerforge.BrickIMU.SetSPITFPBaudrate"/>. If the dynamic baudrate is disabled, the baudrate
+		///  as set by <see cref="Tinkerforge.BrickIMU.SetSPITFPBaudrate"/> will be used statically.
+		///  
+		///  .. versionadded:: 2.3.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetSPITFPBaudrateConfig(bool enableDynamicBaudrate, long minimumDynamicBaudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SPITFP_BAUDRATE_CONFIG);
+			LEConverter.To((bool)enableDynamicBaudrate, 8, request);
+			LEConverter.To((int)minimumDynamicBaudrate, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the baudrate config, see <see cref="Tinkerforge.BrickIMU.SetSPITFPBaudrateConfig"/>.
+		///  
+		///  .. versionadded:: 2.3.5$nbsp;(Firmware)
+		/// </summary>
+		public void GetSPITFPBaudrateConfig(out bool enableDynamicBaudrate, out long minimumDynamicBaudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_BAUDRATE_CONFIG);
+
+			byte[] response = SendRequest(request, 13);
+
+			enableDynamicBaudrate = LEConverter.BoolFrom(8, response);
+			minimumDynamicBaudrate = LEConverter.UIntFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the timeout count for the different communication methods.
+		///  
+		///  The methods 0-2 are available for all Bricks, 3-7 only for Master Bricks.
+		///  
+		///  This function is mostly used for debugging during development, in normal operation
+		///  the counters should nearly always stay at 0.
+		///  
+		///  .. versionadded:: 2.3.3$nbsp;(Firmware)
+		/// </summary>
+		public long GetSendTimeoutCount(byte communicationMethod)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SEND_TIMEOUT_COUNT);
+			LEConverter.To((byte)communicationMethod, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the baudrate for a specific Bricklet port.
+		///  
+		///  If you want to increase the throughput of Bricklets you can increase
+		///  the baudrate. If you get a high error count because of high
+		///  interference (see <see cref="Tinkerforge.BrickIMU.GetSPITFPErrorCount"/>) you can decrease the
+		///  baudrate.
+		///  
+		///  If the dynamic baudrate feature is enabled, the baudrate set by this
+		///  function corresponds to the maximum baudrate (see <see cref="Tinkerforge.BrickIMU.SetSPITFPBaudrateConfig"/>).
+		///  
+		///  Regulatory testing is done with the default baudrate. If CE compatibility
+		///  or similar is necessary in your applications we recommend to not change
+		///  the baudrate.
+		///  
+		///  .. versionadded:: 2.3.3$nbsp;(Firmware)
+		/// </summary>
+		public void SetSPITFPBaudrate(char brickletPort, long baudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SPITFP_BAUDRATE);
+			LEConverter.To((char)brickletPort, 8, request);
+			LEConverter.To((int)baudrate, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the baudrate for a given Bricklet port, see <see cref="Tinkerforge.BrickIMU.SetSPITFPBaudrate"/>.
+		///  
+		///  .. versionadded:: 2.3.3$nbsp;(Firmware)
+		/// </summary>
+		public long GetSPITFPBaudrate(char brickletPort)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SPITFP_BAUDRATE);
+			LEConverter.To((char)brickletPort, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Brick side. All
+		///  Bricklets have a similar function that returns the errors on the Bricklet side.
+		///  
+		///  .. versionadded:: 2.3.3$nbsp;(Firmware)
+		/// </summary>
+		public void GetSPITFPErrorCount(char brickletPort, out long errorCountACKChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SPITFP_ERROR_COUNT);
+			LEConverter.To((char)brickletPort, 8, request);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountACKChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Enables the status LED.
+		///  
+		///  The status LED is the blue LED next to the USB connector. If enabled is is
+		///  on and it flickers if data is transfered. If disabled it is always off.
+		///  
+		///  The default state is enabled.
+		///  
+		///  .. versionadded:: 2.3.1$nbsp;(Firmware)
+		/// </summary>
+		public void EnableStatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the status LED.
+		///  
+		///  The status LED is the blue LED next to the USB connector. If enabled is is
+		///  on and it flickers if data is transfered. If disabled it is always off.
+		///  
+		///  The default state is enabled.
+		///  
+		///  .. versionadded:: 2.3.1$nbsp;(Firmware)
+		/// </summary>
+		public void DisableStatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the status LED is enabled, *false* otherwise.
+		///  
+		///  .. versionadded:: 2.3.1$nbsp;(Firmware)
+		/// </summary>
+		public bool IsStatusLEDEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_STATUS_LED_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the firmware and protocol version and the name of the Bricklet for a
+		///  given port.
+		///  
+		///  This functions sole purpose is to allow automatic flashing of v1.x.y Bricklet
+		///  plugins.
+		/// </summary>
+		public void GetProtocol1BrickletName(char port, out byte protocolVersion, out byte[] firmwareVersion, out string name)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_PROTOCOL1_BRICKLET_NAME);
+			LEConverter.To((char)port, 8, request);
+
+			byte[] response = SendRequest(request, 52);
+
+			protocolVersion = LEConverter.ByteFrom(8, response);
+			firmwareVersion = LEConverter.ByteArrayFrom(9, response, 3);
+			name = LEConverter.StringFrom(12, response, 40);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has an
+		///  accuracy of ±15%. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Brick. Calling this function
+		///  on a Brick inside of a stack will reset the whole stack.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 32 bytes of firmware to the bricklet attached at the given port.
+		///  The bytes are written to the position offset * 32.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void WriteBrickletPlugin(char port, byte offset, byte[] chunk)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(42, FUNCTION_WRITE_BRICKLET_PLUGIN);
+			LEConverter.To((char)port, 8, request);
+			LEConverter.To((byte)offset, 9, request);
+			LEConverter.To((byte[])chunk, 10, 32, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Reads 32 bytes of firmware from the bricklet attached at the given port.
+		///  The bytes are read starting at the position offset * 32.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte[] ReadBrickletPlugin(char port, byte offset)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_READ_BRICKLET_PLUGIN);
+			LEConverter.To((char)port, 8, request);
+			LEConverter.To((byte)offset, 9, request);
+
+			byte[] response = SendRequest(request, 40);
+
+			return LEConverter.ByteArrayFrom(8, response, 32);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Brick is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position is the position in the stack from '0' (bottom) to '8' (top).
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAccelerationCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = AccelerationCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnMagneticFieldCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = MagneticFieldCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAngularVelocityCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = AngularVelocityCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAllDataCallback(byte[] response)
+		{
+			if (response.Length != 28)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short accX = LEConverter.ShortFrom(8, response);
+			short accY = LEConverter.ShortFrom(10, response);
+			short accZ = LEConverter.ShortFrom(12, response);
+			short magX = LEConverter.ShortFrom(14, response);
+			short magY = LEConverter.ShortFrom(16, response);
+			short magZ = LEConverter.ShortFrom(18, response);
+			short angX = LEConverter.ShortFrom(20, response);
+			short angY = LEConverter.ShortFrom(22, response);
+			short angZ = LEConverter.ShortFrom(24, response);
+			short temperature = LEConverter.ShortFrom(26, response);
+			var handler = AllDataCallback;
+
+			if (handler != null)
+			{
+				handler(this, accX, accY, accZ, magX, magY, magZ, angX, angY, angZ, temperature);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnOrientationCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short roll = LEConverter.ShortFrom(8, response);
+			short pitch = LEConverter.ShortFrom(10, response);
+			short yaw = LEConverter.ShortFrom(12, response);
+			var handler = OrientationCallback;
+
+			if (handler != null)
+			{
+				handler(this, roll, pitch, yaw);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnQuaternionCallback(byte[] response)
+		{
+			if (response.Length != 24)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			float x = LEConverter.FloatFrom(8, response);
+			float y = LEConverter.FloatFrom(12, response);
+			float z = LEConverter.FloatFrom(16, response);
+			float w = LEConverter.FloatFrom(20, response);
+			var handler = QuaternionCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z, w);
+			}
+		}
+	}
+}
@@ -0,0 +1,1973 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Full fledged AHRS with 9 degrees of freedom
+	/// </summary>
+	public class BrickIMUV2 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 18;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "IMU Brick 2.0";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MAGNETIC_FIELD = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ANGULAR_VELOCITY = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ORIENTATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_LINEAR_ACCELERATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GRAVITY_VECTOR = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_QUATERNION = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_DATA = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_LEDS_ON = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_LEDS_OFF = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ARE_LEDS_ON = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SAVE_CALIBRATION = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ACCELERATION_PERIOD = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION_PERIOD = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MAGNETIC_FIELD_PERIOD = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MAGNETIC_FIELD_PERIOD = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ANGULAR_VELOCITY_PERIOD = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ANGULAR_VELOCITY_PERIOD = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TEMPERATURE_PERIOD = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE_PERIOD = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ORIENTATION_PERIOD = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ORIENTATION_PERIOD = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_LINEAR_ACCELERATION_PERIOD = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_LINEAR_ACCELERATION_PERIOD = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GRAVITY_VECTOR_PERIOD = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GRAVITY_VECTOR_PERIOD = 27;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_QUATERNION_PERIOD = 28;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_QUATERNION_PERIOD = 29;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALL_DATA_PERIOD = 30;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_DATA_PERIOD = 31;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SENSOR_CONFIGURATION = 41;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SENSOR_CONFIGURATION = 42;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SENSOR_FUSION_MODE = 43;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SENSOR_FUSION_MODE = 44;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPITFP_BAUDRATE_CONFIG = 231;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_BAUDRATE_CONFIG = 232;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SEND_TIMEOUT_COUNT = 233;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPITFP_BAUDRATE = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_BAUDRATE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_STATUS_LED = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_STATUS_LED = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_STATUS_LED_ENABLED = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROTOCOL1_BRICKLET_NAME = 241;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_BRICKLET_PLUGIN = 246;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_BRICKLET_PLUGIN = 247;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_ACCELERATION = 32;
+
+		private const int CALLBACK_MAGNETIC_FIELD = 33;
+
+		private const int CALLBACK_ANGULAR_VELOCITY = 34;
+
+		private const int CALLBACK_TEMPERATURE = 35;
+
+		private const int CALLBACK_LINEAR_ACCELERATION = 36;
+
+		private const int CALLBACK_GRAVITY_VECTOR = 37;
+
+		private const int CALLBACK_ORIENTATION = 38;
+
+		private const int CALLBACK_QUATERNION = 39;
+
+		private const int CALLBACK_ALL_DATA = 40;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_2HZ = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_6HZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_8HZ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_10HZ = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_15HZ = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_20HZ = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_25HZ = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_30HZ = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_RANGE_2000DPS = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_RANGE_1000DPS = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_RANGE_500DPS = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_RANGE_250DPS = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_RANGE_125DPS = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_523HZ = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_230HZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_116HZ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_47HZ = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_23HZ = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_12HZ = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_64HZ = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_32HZ = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_RANGE_2G = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_RANGE_4G = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_RANGE_8G = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_RANGE_16G = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_7_81HZ = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_15_63HZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_31_25HZ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_62_5HZ = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_125HZ = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_250HZ = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_500HZ = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_1000HZ = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte SENSOR_FUSION_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SENSOR_FUSION_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte SENSOR_FUSION_ON_WITHOUT_MAGNETOMETER = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte SENSOR_FUSION_ON_WITHOUT_FAST_MAGNETOMETER_CALIBRATION = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_USB = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_SPI_STACK = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_CHIBI = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_RS485 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_WIFI = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_ETHERNET = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_WIFI_V2 = 7;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMUV2.SetAccelerationPeriod"/>. The parameters are the acceleration
+		///  for the x, y and z axis.
+		/// </summary>
+		public event AccelerationEventHandler AccelerationCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AccelerationEventHandler(BrickIMUV2 sender, short x, short y, short z);
+
+		/// <summary>
+		/// </summary>
+		public event AccelerationEventHandler Acceleration // for backward compatibility
+		{
+			add { AccelerationCallback += value; }
+			remove { AccelerationCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMUV2.SetMagneticFieldPeriod"/>. The parameters are the magnetic
+		///  field for the x, y and z axis.
+		/// </summary>
+		public event MagneticFieldEventHandler MagneticFieldCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void MagneticFieldEventHandler(BrickIMUV2 sender, short x, short y, short z);
+
+		/// <summary>
+		/// </summary>
+		public event MagneticFieldEventHandler MagneticField // for backward compatibility
+		{
+			add { MagneticFieldCallback += value; }
+			remove { MagneticFieldCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMUV2.SetAngularVelocityPeriod"/>. The parameters are the angular
+		///  velocity for the x, y and z axis.
+		/// </summary>
+		public event AngularVelocityEventHandler AngularVelocityCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AngularVelocityEventHandler(BrickIMUV2 sender, short x, short y, short z);
+
+		/// <summary>
+		/// </summary>
+		public event AngularVelocityEventHandler AngularVelocity // for backward compatibility
+		{
+			add { AngularVelocityCallback += value; }
+			remove { AngularVelocityCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMUV2.SetTemperaturePeriod"/>. The parameter is the temperature.
+		/// </summary>
+		public event TemperatureEventHandler TemperatureCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void TemperatureEventHandler(BrickIMUV2 sender, short temperature);
+
+		/// <summary>
+		/// </summary>
+		public event TemperatureEventHandler Temperature // for backward compatibility
+		{
+			add { TemperatureCallback += value; }
+			remove { TemperatureCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMUV2.SetLinearAccelerationPeriod"/>. The parameters are the
+		///  linear acceleration for the x, y and z axis.
+		/// </summary>
+		public event LinearAccelerationEventHandler LinearAccelerationCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void LinearAccelerationEventHandler(BrickIMUV2 sender, short x, short y, short z);
+
+		/// <summary>
+		/// </summary>
+		public event LinearAccelerationEventHandler LinearAcceleration // for backward compatibility
+		{
+			add { LinearAccelerationCallback += value; }
+			remove { LinearAccelerationCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMUV2.SetGravityVectorPeriod"/>. The parameters gravity vector
+		///  for the x, y and z axis.
+		/// </summary>
+		public event GravityVectorEventHandler GravityVectorCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void GravityVectorEventHandler(BrickIMUV2 sender, short x, short y, short z);
+
+		/// <summary>
+		/// </summary>
+		public event GravityVectorEventHandler GravityVector // for backward compatibility
+		{
+			add { GravityVectorCallback += value; }
+			remove { GravityVectorCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMUV2.SetOrientationPeriod"/>. The parameters are the orientation
+		///  (heading (yaw), roll, pitch) of the IMU Brick in Euler angles. See
+		///  <see cref="Tinkerforge.BrickIMUV2.GetOrientation"/> for details.
+		/// </summary>
+		public event OrientationEventHandler OrientationCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void OrientationEventHandler(BrickIMUV2 sender, short heading, short roll, short pitch);
+
+		/// <summary>
+		/// </summary>
+		public event OrientationEventHandler Orientation // for backward compatibility
+		{
+			add { OrientationCallback += value; }
+			remove { OrientationCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMUV2.SetQuaternionPeriod"/>. The parameters are the orientation
+		///  (w, x, y, z) of the IMU Brick in quaternions. See <see cref="Tinkerforge.BrickIMUV2.GetQuaternion"/>
+		///  for details.
+		/// </summary>
+		public event QuaternionEventHandler QuaternionCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void QuaternionEventHandler(BrickIMUV2 sender, short w, short x, short y, short z);
+
+		/// <summary>
+		/// </summary>
+		public event QuaternionEventHandler Quaternion // for backward compatibility
+		{
+			add { QuaternionCallback += value; }
+			remove { QuaternionCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickIMUV2.SetAllDataPeriod"/>. The parameters are as for
+		///  <see cref="Tinkerforge.BrickIMUV2.GetAllData"/>.
+		/// </summary>
+		public event AllDataEventHandler AllDataCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AllDataEventHandler(BrickIMUV2 sender, short[] acceleration, short[] magneticField, short[] angularVelocity, short[] eulerAngle, short[] quaternion, short[] linearAcceleration, short[] gravityVector, short temperature, byte calibrationStatus);
+
+		/// <summary>
+		/// </summary>
+		public event AllDataEventHandler AllData // for backward compatibility
+		{
+			add { AllDataCallback += value; }
+			remove { AllDataCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickIMUV2(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 3;
+
+			callbackWrappers[CALLBACK_ACCELERATION] = new CallbackWrapper(OnAccelerationCallback);
+			callbackWrappers[CALLBACK_MAGNETIC_FIELD] = new CallbackWrapper(OnMagneticFieldCallback);
+			callbackWrappers[CALLBACK_ANGULAR_VELOCITY] = new CallbackWrapper(OnAngularVelocityCallback);
+			callbackWrappers[CALLBACK_TEMPERATURE] = new CallbackWrapper(OnTemperatureCallback);
+			callbackWrappers[CALLBACK_LINEAR_ACCELERATION] = new CallbackWrapper(OnLinearAccelerationCallback);
+			callbackWrappers[CALLBACK_GRAVITY_VECTOR] = new CallbackWrapper(OnGravityVectorCallback);
+			callbackWrappers[CALLBACK_ORIENTATION] = new CallbackWrapper(OnOrientationCallback);
+			callbackWrappers[CALLBACK_QUATERNION] = new CallbackWrapper(OnQuaternionCallback);
+			callbackWrappers[CALLBACK_ALL_DATA] = new CallbackWrapper(OnAllDataCallback);
+
+
+			responseExpected[FUNCTION_GET_ACCELERATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_MAGNETIC_FIELD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ANGULAR_VELOCITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ORIENTATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_LINEAR_ACCELERATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_GRAVITY_VECTOR] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_QUATERNION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ALL_DATA] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_LEDS_ON] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_LEDS_OFF] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_ARE_LEDS_ON] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SAVE_CALIBRATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ACCELERATION_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ACCELERATION_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MAGNETIC_FIELD_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_MAGNETIC_FIELD_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ANGULAR_VELOCITY_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ANGULAR_VELOCITY_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_TEMPERATURE_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ORIENTATION_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ORIENTATION_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_LINEAR_ACCELERATION_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_LINEAR_ACCELERATION_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_GRAVITY_VECTOR_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_GRAVITY_VECTOR_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_QUATERNION_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_QUATERNION_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALL_DATA_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALL_DATA_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SENSOR_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SENSOR_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SENSOR_FUSION_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SENSOR_FUSION_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPITFP_BAUDRATE_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_BAUDRATE_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SEND_TIMEOUT_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPITFP_BAUDRATE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_BAUDRATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DISABLE_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_STATUS_LED_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROTOCOL1_BRICKLET_NAME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_BRICKLET_PLUGIN] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_BRICKLET_PLUGIN] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the calibrated acceleration from the accelerometer for the
+		///  x, y and z axis. The acceleration is in the range configured with
+		///  <see cref="Tinkerforge.BrickIMUV2.SetSensorConfiguration"/>.
+		///  
+		///  If you want to get the acceleration periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMUV2.AccelerationCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMUV2.SetAccelerationPeriod"/>.
+		/// </summary>
+		public void GetAcceleration(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the calibrated magnetic field from the magnetometer for the
+		///  x, y and z axis.
+		///  
+		///  If you want to get the magnetic field periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMUV2.MagneticFieldCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMUV2.SetMagneticFieldPeriod"/>.
+		/// </summary>
+		public void GetMagneticField(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MAGNETIC_FIELD);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the calibrated angular velocity from the gyroscope for the
+		///  x, y and z axis. The angular velocity is in the range configured with
+		///  <see cref="Tinkerforge.BrickIMUV2.SetSensorConfiguration"/>.
+		///  
+		///  If you want to get the angular velocity periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMUV2.AngularVelocityCallback"/> acallback nd set the period with
+		///  <see cref="Tinkerforge.BrickIMUV2.SetAngularVelocityPeriod"/>.
+		/// </summary>
+		public void GetAngularVelocity(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ANGULAR_VELOCITY);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature of the IMU Brick.
+		///  The temperature is measured in the core of the BNO055 IC, it is not the
+		///  ambient temperature
+		/// </summary>
+		public short GetTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.SByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current orientation (heading, roll, pitch) of the IMU Brick as
+		///  independent Euler angles. Note that Euler angles always
+		///  experience a `gimbal lock &lt;https://en.wikipedia.org/wiki/Gimbal_lock&gt;`__.
+		///  We recommend that you use quaternions instead, if you need the absolute
+		///  orientation.
+		///  
+		///  If you want to get the orientation periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMUV2.OrientationCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMUV2.SetOrientationPeriod"/>.
+		/// </summary>
+		public void GetOrientation(out short heading, out short roll, out short pitch)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ORIENTATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			heading = LEConverter.ShortFrom(8, response);
+			roll = LEConverter.ShortFrom(10, response);
+			pitch = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the linear acceleration of the IMU Brick for the
+		///  x, y and z axis. The acceleration is in the range configured with
+		///  <see cref="Tinkerforge.BrickIMUV2.SetSensorConfiguration"/>.
+		///  
+		///  The linear acceleration is the acceleration in each of the three
+		///  axis of the IMU Brick with the influences of gravity removed.
+		///  
+		///  It is also possible to get the gravity vector with the influence of linear
+		///  acceleration removed, see <see cref="Tinkerforge.BrickIMUV2.GetGravityVector"/>.
+		///  
+		///  If you want to get the linear acceleration periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMUV2.LinearAccelerationCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMUV2.SetLinearAccelerationPeriod"/>.
+		/// </summary>
+		public void GetLinearAcceleration(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_LINEAR_ACCELERATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the current gravity vector of the IMU Brick for the
+		///  x, y and z axis.
+		///  
+		///  The gravity vector is the acceleration that occurs due to gravity.
+		///  Influences of additional linear acceleration are removed.
+		///  
+		///  It is also possible to get the linear acceleration with the influence
+		///  of gravity removed, see <see cref="Tinkerforge.BrickIMUV2.GetLinearAcceleration"/>.
+		///  
+		///  If you want to get the gravity vector periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMUV2.GravityVectorCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMUV2.SetGravityVectorPeriod"/>.
+		/// </summary>
+		public void GetGravityVector(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_GRAVITY_VECTOR);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the current orientation (w, x, y, z) of the IMU Brick as
+		///  `quaternions &lt;https://en.wikipedia.org/wiki/Quaternions_and_spatial_rotation&gt;`__.
+		///  
+		///  You have to divide the return values by 16383 (14 bit) to get
+		///  the usual range of -1.0 to +1.0 for quaternions.
+		///  
+		///  If you want to get the quaternions periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMUV2.QuaternionCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMUV2.SetQuaternionPeriod"/>.
+		/// </summary>
+		public void GetQuaternion(out short w, out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_QUATERNION);
+
+			byte[] response = SendRequest(request, 16);
+
+			w = LEConverter.ShortFrom(8, response);
+			x = LEConverter.ShortFrom(10, response);
+			y = LEConverter.ShortFrom(12, response);
+			z = LEConverter.ShortFrom(14, response);
+		}
+
+		/// <summary>
+		///  Return all of the available data of the IMU Brick.
+		///  
+		///  * acceleration (see <see cref="Tinkerforge.BrickIMUV2.GetAcceleration"/>)
+		///  * magnetic field (see <see cref="Tinkerforge.BrickIMUV2.GetMagneticField"/>)
+		///  * angular velocity (see <see cref="Tinkerforge.BrickIMUV2.GetAngularVelocity"/>)
+		///  * Euler angles (see <see cref="Tinkerforge.BrickIMUV2.GetOrientation"/>)
+		///  * quaternion (see <see cref="Tinkerforge.BrickIMUV2.GetQuaternion"/>)
+		///  * linear acceleration (see <see cref="Tinkerforge.BrickIMUV2.GetLinearAcceleration"/>)
+		///  * gravity vector (see <see cref="Tinkerforge.BrickIMUV2.GetGravityVector"/>)
+		///  * temperature (see <see cref="Tinkerforge.BrickIMUV2.GetTemperature"/>)
+		///  * calibration status (see below)
+		///  
+		///  The calibration status consists of four pairs of two bits. Each pair
+		///  of bits represents the status of the current calibration.
+		///  
+		///  * bit 0-1: Magnetometer
+		///  * bit 2-3: Accelerometer
+		///  * bit 4-5: Gyroscope
+		///  * bit 6-7: System
+		///  
+		///  A value of 0 means for "not calibrated" and a value of 3 means
+		///  "fully calibrated". In your program you should always be able to
+		///  ignore the calibration status, it is used by the calibration
+		///  window of the Brick Viewer and it can be ignored after the first
+		///  calibration. See the documentation in the calibration window for
+		///  more information regarding the calibration of the IMU Brick.
+		///  
+		///  If you want to get the data periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickIMUV2.AllDataCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickIMUV2.SetAllDataPeriod"/>.
+		/// </summary>
+		public void GetAllData(out short[] acceleration, out short[] magneticField, out short[] angularVelocity, out short[] eulerAngle, out short[] quaternion, out short[] linearAcceleration, out short[] gravityVector, out short temperature, out byte calibrationStatus)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_DATA);
+
+			byte[] response = SendRequest(request, 54);
+
+			acceleration = LEConverter.ShortArrayFrom(8, response, 3);
+			magneticField = LEConverter.ShortArrayFrom(14, response, 3);
+			angularVelocity = LEConverter.ShortArrayFrom(20, response, 3);
+			eulerAngle = LEConverter.ShortArrayFrom(26, response, 3);
+			quaternion = LEConverter.ShortArrayFrom(32, response, 4);
+			linearAcceleration = LEConverter.ShortArrayFrom(40, response, 3);
+			gravityVector = LEConverter.ShortArrayFrom(46, response, 3);
+			temperature = LEConverter.SByteFrom(52, response);
+			calibrationStatus = LEConverter.ByteFrom(53, response);
+		}
+
+		/// <summary>
+		///  Turns the orientation and direction LEDs of the IMU Brick on.
+		/// </summary>
+		public void LedsOn()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_LEDS_ON);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Turns the orientation and direction LEDs of the IMU Brick off.
+		/// </summary>
+		public void LedsOff()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_LEDS_OFF);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the orientation and direction LEDs of the IMU Brick
+		///  are on, *false* otherwise.
+		/// </summary>
+		public bool AreLedsOn()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ARE_LEDS_ON);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  A call of this function saves the current calibration to be used
+		///  as a starting point for the next restart of continuous calibration
+		///  of the IMU Brick.
+		///  
+		///  A return value of *true* means that the calibration could be used and
+		///  *false* means that it could not be used (this happens if the calibration
+		///  status is not "fully calibrated").
+		///  
+		///  This function is used by the calibration window of the Brick Viewer, you
+		///  should not need to call it in your program.
+		/// </summary>
+		public bool SaveCalibration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_SAVE_CALIBRATION);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMUV2.AccelerationCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetAccelerationPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ACCELERATION_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMUV2.SetAccelerationPeriod"/>.
+		/// </summary>
+		public long GetAccelerationPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMUV2.MagneticFieldCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetMagneticFieldPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_MAGNETIC_FIELD_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMUV2.SetMagneticFieldPeriod"/>.
+		/// </summary>
+		public long GetMagneticFieldPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MAGNETIC_FIELD_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMUV2.AngularVelocityCallback"/> callback is
+		///  triggered periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetAngularVelocityPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ANGULAR_VELOCITY_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMUV2.SetAngularVelocityPeriod"/>.
+		/// </summary>
+		public long GetAngularVelocityPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ANGULAR_VELOCITY_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMUV2.TemperatureCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetTemperaturePeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_TEMPERATURE_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMUV2.SetTemperaturePeriod"/>.
+		/// </summary>
+		public long GetTemperaturePeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMUV2.OrientationCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetOrientationPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ORIENTATION_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMUV2.SetOrientationPeriod"/>.
+		/// </summary>
+		public long GetOrientationPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ORIENTATION_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMUV2.LinearAccelerationCallback"/> callback is
+		///  triggered periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetLinearAccelerationPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_LINEAR_ACCELERATION_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMUV2.SetLinearAccelerationPeriod"/>.
+		/// </summary>
+		public long GetLinearAccelerationPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_LINEAR_ACCELERATION_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMUV2.GravityVectorCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetGravityVectorPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_GRAVITY_VECTOR_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMUV2.SetGravityVectorPeriod"/>.
+		/// </summary>
+		public long GetGravityVectorPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_GRAVITY_VECTOR_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMUV2.QuaternionCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetQuaternionPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_QUATERNION_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMUV2.SetQuaternionPeriod"/>.
+		/// </summary>
+		public long GetQuaternionPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_QUATERNION_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickIMUV2.AllDataCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetAllDataPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ALL_DATA_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickIMUV2.SetAllDataPeriod"/>.
+		/// </summary>
+		public long GetAllDataPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_DATA_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the available sensor configuration for the Magnetometer, Gyroscope and
+		///  Accelerometer. The Accelerometer Range is user selectable in all fusion modes,
+		///  all other configurations are auto-controlled in fusion mode.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetSensorConfiguration(byte magnetometerRate, byte gyroscopeRange, byte gyroscopeBandwidth, byte accelerometerRange, byte accelerometerBandwidth)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SENSOR_CONFIGURATION);
+			LEConverter.To((byte)magnetometerRate, 8, request);
+			LEConverter.To((byte)gyroscopeRange, 9, request);
+			LEConverter.To((byte)gyroscopeBandwidth, 10, request);
+			LEConverter.To((byte)accelerometerRange, 11, request);
+			LEConverter.To((byte)accelerometerBandwidth, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the sensor configuration as set by <see cref="Tinkerforge.BrickIMUV2.SetSensorConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void GetSensorConfiguration(out byte magnetometerRate, out byte gyroscopeRange, out byte gyroscopeBandwidth, out byte accelerometerRange, out byte accelerometerBandwidth)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SENSOR_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			magnetometerRate = LEConverter.ByteFrom(8, response);
+			gyroscopeRange = LEConverter.ByteFrom(9, response);
+			gyroscopeBandwidth = LEConverter.ByteFrom(10, response);
+			accelerometerRange = LEConverter.ByteFrom(11, response);
+			accelerometerBandwidth = LEConverter.ByteFrom(12, response);
+		}
+
+		/// <summary>
+		///  If the fusion mode is turned off, the functions <see cref="Tinkerforge.BrickIMUV2.GetAcceleration"/>,
+		///  <see cref="Tinkerforge.BrickIMUV2.GetMagneticField"/> and <see cref="Tinkerforge.BrickIMUV2.GetAngularVelocity"/> return uncalibrated
+		///  and uncompensated sensor data. All other sensor data getters return no data.
+		///  
+		///  Since firmware version 2.0.6 you can also use a fusion mode without magnetometer.
+		///  In this mode the calculated orientation is relative (with magnetometer it is
+		///  absolute with respect to the earth). However, the calculation can't be influenced
+		///  by spurious magnetic fields.
+		///  
+		///  Since firmware version 2.0.13 you can also use a fusion mode without fast
+		///  magnetometer calibration. This mode is the same as the normal fusion mode,
+		///  but the fast magnetometer calibration is turned off. So to find the orientation
+		///  the first time will likely take longer, but small magnetic influences might
+		///  not affect the automatic calibration as much.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetSensorFusionMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_SENSOR_FUSION_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the sensor fusion mode as set by <see cref="Tinkerforge.BrickIMUV2.SetSensorFusionMode"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public byte GetSensorFusionMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SENSOR_FUSION_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  The SPITF protocol can be used with a dynamic baudrate. If the dynamic baudrate is
+		///  enabled, the Brick will try to adapt the baudrate for the communication
+		///  between Bricks and Bricklets according to the amount of data that is transferred.
+		///  
+		///  The baudrate will be increased exponentially if lots of data is sent/received and
+		///  decreased linearly if little data is sent/received.
+		///  
+		///  This lowers the baudrate in applications where little data is transferred (e.g.
+		///  a weather station) and increases the robustness. If there is lots of data to transfer
+		///  (e.g. Thermal Imaging Bricklet) it automatically increases the baudrate as needed.
+		///  
+		///  In cases where some data has to transferred as fast as possible every few seconds
+		///  (e.g. RS485 Bricklet with a high baudrate but small payload) you may want to turn
+		///  the dynamic baudrate off to get the highest possible performance.
+		///  
+		///  The maximum value of the baudrate can be set per port with the function
+		///  <see cref="Tinkerforge.BrickIMUV2.SetSPITFPBaudrate"/>. If the dynamic baudrate is disabled, the baudrate
+		///  as set by <see cref="Tinkerforge.BrickIMUV2.SetSPITFPBaudrate"/> will be used statically.
+		///  
+		///  .. versionadded:: 2.0.10$nbsp;(Firmware)
+		/// </summary>
+		public void SetSPITFPBaudrateConfig(bool enableDynamicBaudrate, long minimumDynamicBaudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SPITFP_BAUDRATE_CONFIG);
+			LEConverter.To((bool)enableDynamicBaudrate, 8, request);
+			LEConverter.To((int)minimumDynamicBaudrate, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the baudrate config, see <see cref="Tinkerforge.BrickIMUV2.SetSPITFPBaudrateConfig"/>.
+		///  
+		///  .. versionadded:: 2.0.10$nbsp;(Firmware)
+		/// </summary>
+		public void GetSPITFPBaudrateConfig(out bool enableDynamicBaudrate, out long minimumDynamicBaudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_BAUDRATE_CONFIG);
+
+			byte[] response = SendRequest(request, 13);
+
+			enableDynamicBaudrate = LEConverter.BoolFrom(8, response);
+			minimumDynamicBaudrate = LEConverter.UIntFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the timeout count for the different communication methods.
+		///  
+		///  The methods 0-2 are available for all Bricks, 3-7 only for Master Bricks.
+		///  
+		///  This function is mostly used for debugging during development, in normal operation
+		///  the counters should nearly always stay at 0.
+		///  
+		///  .. versionadded:: 2.0.7$nbsp;(Firmware)
+		/// </summary>
+		public long GetSendTimeoutCount(byte communicationMethod)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SEND_TIMEOUT_COUNT);
+			LEConverter.To((byte)communicationMethod, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the baudrate for a specific Bricklet port.
+		///  
+		///  If you want to increase the throughput of Bricklets you can increase
+		///  the baudrate. If you get a high error count because of high
+		///  interference (see <see cref="Tinkerforge.BrickIMUV2.GetSPITFPErrorCount"/>) you can decrease the
+		///  baudrate.
+		///  
+		///  If the dynamic baudrate feature is enabled, the baudrate set by this
+		///  function corresponds to the maximum baudrate (see <see cref="Tinkerforge.BrickIMUV2.SetSPITFPBaudrateConfig"/>).
+		///  
+		///  Regulatory testing is done with the default baudrate. If CE compatibility
+		///  or similar is necessary in your applications we recommend to not change
+		///  the baudrate.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetSPITFPBaudrate(char brickletPort, long baudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SPITFP_BAUDRATE);
+			LEConverter.To((char)brickletPort, 8, request);
+			LEConverter.To((int)baudrate, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the baudrate for a given Bricklet port, see <see cref="Tinkerforge.BrickIMUV2.SetSPITFPBaudrate"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public long GetSPITFPBaudrate(char brickletPort)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SPITFP_BAUDRATE);
+			LEConverter.To((char)brickletPort, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Brick side. All
+		///  Bricklets have a similar function that returns the errors on the Bricklet side.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void GetSPITFPErrorCount(char brickletPort, out long errorCountACKChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SPITFP_ERROR_COUNT);
+			LEConverter.To((char)brickletPort, 8, request);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountACKChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Enables the status LED.
+		///  
+		///  The status LED is the blue LED next to the USB connector. If enabled is is
+		///  on and it flickers if data is transfered. If disabled it is always off.
+		///  
+		///  The default state is enabled.
+		/// </summary>
+		public void EnableStatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the status LED.
+		///  
+		///  The status LED is the blue LED next to the USB connector. If enabled is is
+		///  on and it flickers if data is transfered. If disabled it is always off.
+		///  
+		///  The default state is enabled.
+		/// </summary>
+		public void DisableStatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the status LED is enabled, *false* otherwise.
+		/// </summary>
+		public bool IsStatusLEDEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_STATUS_LED_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the firmware and protocol version and the name of the Bricklet for a
+		///  given port.
+		///  
+		///  This functions sole purpose is to allow automatic flashing of v1.x.y Bricklet
+		///  plugins.
+		/// </summary>
+		public void GetProtocol1BrickletName(char port, out byte protocolVersion, out byte[] firmwareVersion, out string name)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_PROTOCOL1_BRICKLET_NAME);
+			LEConverter.To((char)port, 8, request);
+
+			byte[] response = SendRequest(request, 52);
+
+			protocolVersion = LEConverter.ByteFrom(8, response);
+			firmwareVersion = LEConverter.ByteArrayFrom(9, response, 3);
+			name = LEConverter.StringFrom(12, response, 40);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has an
+		///  accuracy of ±15%. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Brick. Calling this function
+		///  on a Brick inside of a stack will reset the whole stack.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 32 bytes of firmware to the bricklet attached at the given port.
+		///  The bytes are written to the position offset * 32.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void WriteBrickletPlugin(char port, byte offset, byte[] chunk)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(42, FUNCTION_WRITE_BRICKLET_PLUGIN);
+			LEConverter.To((char)port, 8, request);
+			LEConverter.To((byte)offset, 9, request);
+			LEConverter.To((byte[])chunk, 10, 32, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Reads 32 bytes of firmware from the bricklet attached at the given port.
+		///  The bytes are read starting at the position offset * 32.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte[] ReadBrickletPlugin(char port, byte offset)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_READ_BRICKLET_PLUGIN);
+			LEConverter.To((char)port, 8, request);
+			LEConverter.To((byte)offset, 9, request);
+
+			byte[] response = SendRequest(request, 40);
+
+			return LEConverter.ByteArrayFrom(8, response, 32);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Brick is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position is the position in the stack from '0' (bottom) to '8' (top).
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAccelerationCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = AccelerationCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnMagneticFieldCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = MagneticFieldCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAngularVelocityCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = AngularVelocityCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnTemperatureCallback(byte[] response)
+		{
+			if (response.Length != 9)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short temperature = LEConverter.SByteFrom(8, response);
+			var handler = TemperatureCallback;
+
+			if (handler != null)
+			{
+				handler(this, temperature);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnLinearAccelerationCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = LinearAccelerationCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnGravityVectorCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = GravityVectorCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnOrientationCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short heading = LEConverter.ShortFrom(8, response);
+			short roll = LEConverter.ShortFrom(10, response);
+			short pitch = LEConverter.ShortFrom(12, response);
+			var handler = OrientationCallback;
+
+			if (handler != null)
+			{
+				handler(this, heading, roll, pitch);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnQuaternionCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short w = LEConverter.ShortFrom(8, response);
+			short x = LEConverter.ShortFrom(10, response);
+			short y = LEConverter.ShortFrom(12, response);
+			short z = LEConverter.ShortFrom(14, response);
+			var handler = QuaternionCallback;
+
+			if (handler != null)
+			{
+				handler(this, w, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAllDataCallback(byte[] response)
+		{
+			if (response.Length != 54)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short[] acceleration = LEConverter.ShortArrayFrom(8, response, 3);
+			short[] magneticField = LEConverter.ShortArrayFrom(14, response, 3);
+			short[] angularVelocity = LEConverter.ShortArrayFrom(20, response, 3);
+			short[] eulerAngle = LEConverter.ShortArrayFrom(26, response, 3);
+			short[] quaternion = LEConverter.ShortArrayFrom(32, response, 4);
+			short[] linearAcceleration = LEConverter.ShortArrayFrom(40, response, 3);
+			short[] gravityVector = LEConverter.ShortArrayFrom(46, response, 3);
+			short temperature = LEConverter.SByteFrom(52, response);
+			byte calibrationStatus = LEConverter.ByteFrom(53, response);
+			var handler = AllDataCallback;
+
+			if (handler != null)
+			{
+				handler(this, acceleration, magneticField, angularVelocity, eulerAngle, quaternion, linearAcceleration, gravityVector, temperature, calibrationStatus);
+			}
+		}
+	}
+}
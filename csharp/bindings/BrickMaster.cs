@@ -0,0 +1,4438 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Basis to build stacks and has 4 Bricklet ports
+	/// </summary>
+	public class BrickMaster : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 13;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Master Brick";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STACK_VOLTAGE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STACK_CURRENT = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_EXTENSION_TYPE = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_EXTENSION_TYPE = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_CHIBI_PRESENT = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHIBI_ADDRESS = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIBI_ADDRESS = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHIBI_MASTER_ADDRESS = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIBI_MASTER_ADDRESS = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHIBI_SLAVE_ADDRESS = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIBI_SLAVE_ADDRESS = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIBI_SIGNAL_STRENGTH = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIBI_ERROR_LOG = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHIBI_FREQUENCY = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIBI_FREQUENCY = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHIBI_CHANNEL = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIBI_CHANNEL = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_RS485_PRESENT = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RS485_ADDRESS = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RS485_ADDRESS = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RS485_SLAVE_ADDRESS = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RS485_SLAVE_ADDRESS = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RS485_ERROR_LOG = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RS485_CONFIGURATION = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RS485_CONFIGURATION = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_WIFI_PRESENT = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI_CONFIGURATION = 27;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI_CONFIGURATION = 28;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI_ENCRYPTION = 29;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI_ENCRYPTION = 30;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI_STATUS = 31;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_REFRESH_WIFI_STATUS = 32;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI_CERTIFICATE = 33;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI_CERTIFICATE = 34;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI_POWER_MODE = 35;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI_POWER_MODE = 36;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI_BUFFER_INFO = 37;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI_REGULATORY_DOMAIN = 38;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI_REGULATORY_DOMAIN = 39;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_USB_VOLTAGE = 40;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_LONG_WIFI_KEY = 41;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_LONG_WIFI_KEY = 42;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI_HOSTNAME = 43;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI_HOSTNAME = 44;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STACK_CURRENT_CALLBACK_PERIOD = 45;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STACK_CURRENT_CALLBACK_PERIOD = 46;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STACK_VOLTAGE_CALLBACK_PERIOD = 47;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STACK_VOLTAGE_CALLBACK_PERIOD = 48;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_USB_VOLTAGE_CALLBACK_PERIOD = 49;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_USB_VOLTAGE_CALLBACK_PERIOD = 50;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STACK_CURRENT_CALLBACK_THRESHOLD = 51;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STACK_CURRENT_CALLBACK_THRESHOLD = 52;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STACK_VOLTAGE_CALLBACK_THRESHOLD = 53;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STACK_VOLTAGE_CALLBACK_THRESHOLD = 54;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_USB_VOLTAGE_CALLBACK_THRESHOLD = 55;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_USB_VOLTAGE_CALLBACK_THRESHOLD = 56;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DEBOUNCE_PERIOD = 57;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DEBOUNCE_PERIOD = 58;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_ETHERNET_PRESENT = 65;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ETHERNET_CONFIGURATION = 66;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ETHERNET_CONFIGURATION = 67;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ETHERNET_STATUS = 68;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ETHERNET_HOSTNAME = 69;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ETHERNET_MAC_ADDRESS = 70;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ETHERNET_WEBSOCKET_CONFIGURATION = 71;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ETHERNET_WEBSOCKET_CONFIGURATION = 72;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ETHERNET_AUTHENTICATION_SECRET = 73;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ETHERNET_AUTHENTICATION_SECRET = 74;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI_AUTHENTICATION_SECRET = 75;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI_AUTHENTICATION_SECRET = 76;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CONNECTION_TYPE = 77;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_WIFI2_PRESENT = 78;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_START_WIFI2_BOOTLOADER = 79;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_WIFI2_SERIAL_PORT = 80;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_WIFI2_SERIAL_PORT = 81;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI2_AUTHENTICATION_SECRET = 82;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_AUTHENTICATION_SECRET = 83;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI2_CONFIGURATION = 84;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_CONFIGURATION = 85;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_STATUS = 86;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI2_CLIENT_CONFIGURATION = 87;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_CLIENT_CONFIGURATION = 88;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI2_CLIENT_HOSTNAME = 89;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_CLIENT_HOSTNAME = 90;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI2_CLIENT_PASSWORD = 91;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_CLIENT_PASSWORD = 92;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI2_AP_CONFIGURATION = 93;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_AP_CONFIGURATION = 94;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI2_AP_PASSWORD = 95;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_AP_PASSWORD = 96;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SAVE_WIFI2_CONFIGURATION = 97;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_FIRMWARE_VERSION = 98;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_WIFI2_STATUS_LED = 99;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_WIFI2_STATUS_LED = 100;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_WIFI2_STATUS_LED_ENABLED = 101;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI2_MESH_CONFIGURATION = 102;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_MESH_CONFIGURATION = 103;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI2_MESH_ROUTER_SSID = 104;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_MESH_ROUTER_SSID = 105;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIFI2_MESH_ROUTER_PASSWORD = 106;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_MESH_ROUTER_PASSWORD = 107;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_MESH_COMMON_STATUS = 108;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_MESH_CLIENT_STATUS = 109;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIFI2_MESH_AP_STATUS = 110;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BRICKLET_XMC_FLASH_CONFIG = 111;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BRICKLET_XMC_FLASH_DATA = 112;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BRICKLETS_ENABLED = 113;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BRICKLETS_ENABLED = 114;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPITFP_BAUDRATE_CONFIG = 231;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_BAUDRATE_CONFIG = 232;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SEND_TIMEOUT_COUNT = 233;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPITFP_BAUDRATE = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_BAUDRATE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_STATUS_LED = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_STATUS_LED = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_STATUS_LED_ENABLED = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROTOCOL1_BRICKLET_NAME = 241;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_BRICKLET_PLUGIN = 246;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_BRICKLET_PLUGIN = 247;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_STACK_CURRENT = 59;
+
+		private const int CALLBACK_STACK_VOLTAGE = 60;
+
+		private const int CALLBACK_USB_VOLTAGE = 61;
+
+		private const int CALLBACK_STACK_CURRENT_REACHED = 62;
+
+		private const int CALLBACK_STACK_VOLTAGE_REACHED = 63;
+
+		private const int CALLBACK_USB_VOLTAGE_REACHED = 64;
+
+
+		/// <summary>
+		/// </summary>
+		public const long EXTENSION_TYPE_CHIBI = 1;
+
+		/// <summary>
+		/// </summary>
+		public const long EXTENSION_TYPE_RS485 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const long EXTENSION_TYPE_WIFI = 3;
+
+		/// <summary>
+		/// </summary>
+		public const long EXTENSION_TYPE_ETHERNET = 4;
+
+		/// <summary>
+		/// </summary>
+		public const long EXTENSION_TYPE_WIFI2 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHIBI_FREQUENCY_OQPSK_868_MHZ = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHIBI_FREQUENCY_OQPSK_915_MHZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHIBI_FREQUENCY_OQPSK_780_MHZ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHIBI_FREQUENCY_BPSK40_915_MHZ = 3;
+
+		/// <summary>
+		/// </summary>
+		public const char RS485_PARITY_NONE = 'n';
+
+		/// <summary>
+		/// </summary>
+		public const char RS485_PARITY_EVEN = 'e';
+
+		/// <summary>
+		/// </summary>
+		public const char RS485_PARITY_ODD = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_CONNECTION_DHCP = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_CONNECTION_STATIC_IP = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_CONNECTION_ACCESS_POINT_DHCP = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_CONNECTION_ACCESS_POINT_STATIC_IP = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_CONNECTION_AD_HOC_DHCP = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_CONNECTION_AD_HOC_STATIC_IP = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_ENCRYPTION_WPA_WPA2 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_ENCRYPTION_WPA_ENTERPRISE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_ENCRYPTION_WEP = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_ENCRYPTION_NO_ENCRYPTION = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_EAP_OPTION_OUTER_AUTH_EAP_FAST = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_EAP_OPTION_OUTER_AUTH_EAP_TLS = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_EAP_OPTION_OUTER_AUTH_EAP_TTLS = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_EAP_OPTION_OUTER_AUTH_EAP_PEAP = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_EAP_OPTION_INNER_AUTH_EAP_MSCHAP = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_EAP_OPTION_INNER_AUTH_EAP_GTC = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_EAP_OPTION_CERT_TYPE_CA_CERT = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_EAP_OPTION_CERT_TYPE_CLIENT_CERT = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_EAP_OPTION_CERT_TYPE_PRIVATE_KEY = 16;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_STATE_DISASSOCIATED = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_STATE_ASSOCIATED = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_STATE_ASSOCIATING = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_STATE_ERROR = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_STATE_NOT_INITIALIZED_YET = 255;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_POWER_MODE_FULL_SPEED = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_POWER_MODE_LOW_POWER = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_DOMAIN_CHANNEL_1TO11 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_DOMAIN_CHANNEL_1TO13 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI_DOMAIN_CHANNEL_1TO14 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OFF = 'x';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OUTSIDE = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_INSIDE = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_SMALLER = '<';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_GREATER = '>';
+
+		/// <summary>
+		/// </summary>
+		public const byte ETHERNET_CONNECTION_DHCP = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ETHERNET_CONNECTION_STATIC_IP = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONNECTION_TYPE_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONNECTION_TYPE_USB = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONNECTION_TYPE_SPI_STACK = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONNECTION_TYPE_CHIBI = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONNECTION_TYPE_RS485 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONNECTION_TYPE_WIFI = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONNECTION_TYPE_ETHERNET = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONNECTION_TYPE_WIFI2 = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_PHY_MODE_B = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_PHY_MODE_G = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_PHY_MODE_N = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_CLIENT_STATUS_IDLE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_CLIENT_STATUS_CONNECTING = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_CLIENT_STATUS_WRONG_PASSWORD = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_CLIENT_STATUS_NO_AP_FOUND = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_CLIENT_STATUS_CONNECT_FAILED = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_CLIENT_STATUS_GOT_IP = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_CLIENT_STATUS_UNKNOWN = 255;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_AP_ENCRYPTION_OPEN = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_AP_ENCRYPTION_WEP = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_AP_ENCRYPTION_WPA_PSK = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_AP_ENCRYPTION_WPA2_PSK = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_AP_ENCRYPTION_WPA_WPA2_PSK = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_MESH_STATUS_DISABLED = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_MESH_STATUS_WIFI_CONNECTING = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_MESH_STATUS_GOT_IP = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_MESH_STATUS_MESH_LOCAL = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_MESH_STATUS_MESH_ONLINE = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_MESH_STATUS_AP_AVAILABLE = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_MESH_STATUS_AP_SETUP = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIFI2_MESH_STATUS_LEAF_AVAILABLE = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_USB = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_SPI_STACK = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_CHIBI = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_RS485 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_WIFI = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_ETHERNET = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_WIFI_V2 = 7;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickMaster.SetStackCurrentCallbackPeriod"/>. The parameter is the current
+		///  of the sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickMaster.StackCurrentCallback"/> callback is only triggered if the current has changed
+		///  since the last triggering.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public event StackCurrentEventHandler StackCurrentCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void StackCurrentEventHandler(BrickMaster sender, int current);
+
+		/// <summary>
+		/// </summary>
+		public event StackCurrentEventHandler StackCurrent // for backward compatibility
+		{
+			add { StackCurrentCallback += value; }
+			remove { StackCurrentCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickMaster.SetStackVoltageCallbackPeriod"/>. The parameter is the voltage
+		///  of the sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickMaster.StackVoltageCallback"/> callback is only triggered if the voltage has changed
+		///  since the last triggering.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public event StackVoltageEventHandler StackVoltageCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void StackVoltageEventHandler(BrickMaster sender, int voltage);
+
+		/// <summary>
+		/// </summary>
+		public event StackVoltageEventHandler StackVoltage // for backward compatibility
+		{
+			add { StackVoltageCallback += value; }
+			remove { StackVoltageCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickMaster.SetUSBVoltageCallbackPeriod"/>. The parameter is the USB
+		///  voltage.
+		///  
+		///  The <see cref="Tinkerforge.BrickMaster.USBVoltageCallback"/> callback is only triggered if the USB voltage has changed
+		///  since the last triggering.
+		///  
+		///  Does not work with hardware version 2.1.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public event USBVoltageEventHandler USBVoltageCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void USBVoltageEventHandler(BrickMaster sender, int voltage);
+
+		/// <summary>
+		/// </summary>
+		public event USBVoltageEventHandler USBVoltage // for backward compatibility
+		{
+			add { USBVoltageCallback += value; }
+			remove { USBVoltageCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickMaster.SetStackCurrentCallbackThreshold"/> is reached.
+		///  The parameter is the stack current.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickMaster.SetDebouncePeriod"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public event StackCurrentReachedEventHandler StackCurrentReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void StackCurrentReachedEventHandler(BrickMaster sender, int current);
+
+		/// <summary>
+		/// </summary>
+		public event StackCurrentReachedEventHandler StackCurrentReached // for backward compatibility
+		{
+			add { StackCurrentReachedCallback += value; }
+			remove { StackCurrentReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickMaster.SetStackVoltageCallbackThreshold"/> is reached.
+		///  The parameter is the stack voltage.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickMaster.SetDebouncePeriod"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public event StackVoltageReachedEventHandler StackVoltageReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void StackVoltageReachedEventHandler(BrickMaster sender, int voltage);
+
+		/// <summary>
+		/// </summary>
+		public event StackVoltageReachedEventHandler StackVoltageReached // for backward compatibility
+		{
+			add { StackVoltageReachedCallback += value; }
+			remove { StackVoltageReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickMaster.SetUSBVoltageCallbackThreshold"/> is reached.
+		///  The parameter is the voltage of the sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickMaster.SetDebouncePeriod"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public event USBVoltageReachedEventHandler USBVoltageReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void USBVoltageReachedEventHandler(BrickMaster sender, int voltage);
+
+		/// <summary>
+		/// </summary>
+		public event USBVoltageReachedEventHandler USBVoltageReached // for backward compatibility
+		{
+			add { USBVoltageReachedCallback += value; }
+			remove { USBVoltageReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickMaster(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 10;
+
+			callbackWrappers[CALLBACK_STACK_CURRENT] = new CallbackWrapper(OnStackCurrentCallback);
+			callbackWrappers[CALLBACK_STACK_VOLTAGE] = new CallbackWrapper(OnStackVoltageCallback);
+			callbackWrappers[CALLBACK_USB_VOLTAGE] = new CallbackWrapper(OnUSBVoltageCallback);
+			callbackWrappers[CALLBACK_STACK_CURRENT_REACHED] = new CallbackWrapper(OnStackCurrentReachedCallback);
+			callbackWrappers[CALLBACK_STACK_VOLTAGE_REACHED] = new CallbackWrapper(OnStackVoltageReachedCallback);
+			callbackWrappers[CALLBACK_USB_VOLTAGE_REACHED] = new CallbackWrapper(OnUSBVoltageReachedCallback);
+
+
+			responseExpected[FUNCTION_GET_STACK_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_STACK_CURRENT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_EXTENSION_TYPE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_EXTENSION_TYPE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_IS_CHIBI_PRESENT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHIBI_ADDRESS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHIBI_ADDRESS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHIBI_MASTER_ADDRESS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHIBI_MASTER_ADDRESS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHIBI_SLAVE_ADDRESS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHIBI_SLAVE_ADDRESS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIBI_SIGNAL_STRENGTH] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIBI_ERROR_LOG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHIBI_FREQUENCY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHIBI_FREQUENCY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHIBI_CHANNEL] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHIBI_CHANNEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_IS_RS485_PRESENT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_RS485_ADDRESS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_RS485_ADDRESS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_RS485_SLAVE_ADDRESS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_RS485_SLAVE_ADDRESS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_RS485_ERROR_LOG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_RS485_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_RS485_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_IS_WIFI_PRESENT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI_ENCRYPTION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI_ENCRYPTION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_WIFI_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_REFRESH_WIFI_STATUS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_WIFI_CERTIFICATE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI_CERTIFICATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI_POWER_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI_POWER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_WIFI_BUFFER_INFO] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI_REGULATORY_DOMAIN] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI_REGULATORY_DOMAIN] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_USB_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_LONG_WIFI_KEY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_LONG_WIFI_KEY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI_HOSTNAME] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI_HOSTNAME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STACK_CURRENT_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_STACK_CURRENT_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STACK_VOLTAGE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_STACK_VOLTAGE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_USB_VOLTAGE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_USB_VOLTAGE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STACK_CURRENT_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_STACK_CURRENT_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STACK_VOLTAGE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_STACK_VOLTAGE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_USB_VOLTAGE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_USB_VOLTAGE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_IS_ETHERNET_PRESENT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ETHERNET_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_ETHERNET_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ETHERNET_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ETHERNET_HOSTNAME] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_ETHERNET_MAC_ADDRESS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_ETHERNET_WEBSOCKET_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_ETHERNET_WEBSOCKET_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ETHERNET_AUTHENTICATION_SECRET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_ETHERNET_AUTHENTICATION_SECRET] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI_AUTHENTICATION_SECRET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI_AUTHENTICATION_SECRET] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CONNECTION_TYPE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_IS_WIFI2_PRESENT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_START_WIFI2_BOOTLOADER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_WRITE_WIFI2_SERIAL_PORT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READ_WIFI2_SERIAL_PORT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI2_AUTHENTICATION_SECRET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI2_AUTHENTICATION_SECRET] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI2_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI2_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_WIFI2_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI2_CLIENT_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI2_CLIENT_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI2_CLIENT_HOSTNAME] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI2_CLIENT_HOSTNAME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI2_CLIENT_PASSWORD] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI2_CLIENT_PASSWORD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI2_AP_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI2_AP_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI2_AP_PASSWORD] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI2_AP_PASSWORD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SAVE_WIFI2_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_WIFI2_FIRMWARE_VERSION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_WIFI2_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DISABLE_WIFI2_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_WIFI2_STATUS_LED_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI2_MESH_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI2_MESH_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI2_MESH_ROUTER_SSID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI2_MESH_ROUTER_SSID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIFI2_MESH_ROUTER_PASSWORD] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIFI2_MESH_ROUTER_PASSWORD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_WIFI2_MESH_COMMON_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_WIFI2_MESH_CLIENT_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_WIFI2_MESH_AP_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BRICKLET_XMC_FLASH_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BRICKLET_XMC_FLASH_DATA] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BRICKLETS_ENABLED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_BRICKLETS_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPITFP_BAUDRATE_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_BAUDRATE_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SEND_TIMEOUT_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPITFP_BAUDRATE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_BAUDRATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DISABLE_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_STATUS_LED_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROTOCOL1_BRICKLET_NAME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_BRICKLET_PLUGIN] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_BRICKLET_PLUGIN] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the stack voltage. The stack voltage is the
+		///  voltage that is supplied via the stack, i.e. it is given by a
+		///  Step-Down or Step-Up Power Supply.
+		///  
+		///  <note>
+		///   It is not possible to measure voltages supplied per PoE or USB with this function.
+		///  </note>
+		/// </summary>
+		public int GetStackVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STACK_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the stack current. The stack current is the
+		///  current that is drawn via the stack, i.e. it is given by a
+		///  Step-Down or Step-Up Power Supply.
+		///  
+		///  <note>
+		///   It is not possible to measure the current drawn via PoE or USB with this function.
+		///  </note>
+		/// </summary>
+		public int GetStackCurrent()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STACK_CURRENT);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Writes the extension type to the EEPROM of a specified extension.
+		///  The extension is either 0 or 1 (0 is the lower one, 1 is the upper one,
+		///  if only one extension is present use 0).
+		///  
+		///  Possible extension types:
+		///  
+		///  <code>
+		///   "Type", "Description"
+		///  
+		///   "1",    "Chibi"
+		///   "2",    "RS485"
+		///   "3",    "WIFI"
+		///   "4",    "Ethernet"
+		///   "5",    "WIFI 2.0"
+		///  </code>
+		///  
+		///  The extension type is already set when bought and it can be set with the
+		///  Brick Viewer, it is unlikely that you need this function.
+		/// </summary>
+		public void SetExtensionType(byte extension, long exttype)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_EXTENSION_TYPE);
+			LEConverter.To((byte)extension, 8, request);
+			LEConverter.To((int)exttype, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the type for a given extension as set by <see cref="Tinkerforge.BrickMaster.SetExtensionType"/>.
+		/// </summary>
+		public long GetExtensionType(byte extension)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_EXTENSION_TYPE);
+			LEConverter.To((byte)extension, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns *true* if the Master Brick is at position 0 in the stack and a Chibi
+		///  Extension is available.
+		/// </summary>
+		public bool IsChibiPresent()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_CHIBI_PRESENT);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the address belonging to the Chibi Extension.
+		///  
+		///  It is possible to set the address with the Brick Viewer and it will be
+		///  saved in the EEPROM of the Chibi Extension, it does not
+		///  have to be set on every startup.
+		/// </summary>
+		public void SetChibiAddress(byte address)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_CHIBI_ADDRESS);
+			LEConverter.To((byte)address, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the address as set by <see cref="Tinkerforge.BrickMaster.SetChibiAddress"/>.
+		/// </summary>
+		public byte GetChibiAddress()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIBI_ADDRESS);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the address of the Chibi Master. This address is used if the
+		///  Chibi Extension is used as slave (i.e. it does not have a USB connection).
+		///  
+		///  It is possible to set the address with the Brick Viewer and it will be
+		///  saved in the EEPROM of the Chibi Extension, it does not
+		///  have to be set on every startup.
+		/// </summary>
+		public void SetChibiMasterAddress(byte address)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_CHIBI_MASTER_ADDRESS);
+			LEConverter.To((byte)address, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the address as set by <see cref="Tinkerforge.BrickMaster.SetChibiMasterAddress"/>.
+		/// </summary>
+		public byte GetChibiMasterAddress()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIBI_MASTER_ADDRESS);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets up to 254 slave addresses. 0 has a
+		///  special meaning, it is used as list terminator and not allowed as normal slave
+		///  address. The address numeration (via num parameter) has to be used
+		///  ascending from 0. For example: If you use the Chibi Extension in Master mode
+		///  (i.e. the stack has an USB connection) and you want to talk to three other
+		///  Chibi stacks with the slave addresses 17, 23, and 42, you should call with
+		///  ``(0, 17)``, ``(1, 23)``, ``(2, 42)`` and ``(3, 0)``. The last call with
+		///  ``(3, 0)`` is a list terminator and indicates that the Chibi slave address
+		///  list contains 3 addresses in this case.
+		///  
+		///  It is possible to set the addresses with the Brick Viewer, that will take care
+		///  of correct address numeration and list termination.
+		///  
+		///  The slave addresses will be saved in the EEPROM of the Chibi Extension, they
+		///  don't have to be set on every startup.
+		/// </summary>
+		public void SetChibiSlaveAddress(byte num, byte address)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_CHIBI_SLAVE_ADDRESS);
+			LEConverter.To((byte)num, 8, request);
+			LEConverter.To((byte)address, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the slave address for a given num as set by
+		///  <see cref="Tinkerforge.BrickMaster.SetChibiSlaveAddress"/>.
+		/// </summary>
+		public byte GetChibiSlaveAddress(byte num)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_CHIBI_SLAVE_ADDRESS);
+			LEConverter.To((byte)num, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the signal strength in dBm. The signal strength updates every time a
+		///  packet is received.
+		/// </summary>
+		public byte GetChibiSignalStrength()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIBI_SIGNAL_STRENGTH);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns underrun, CRC error, no ACK and overflow error counts of the Chibi
+		///  communication. If these errors start rising, it is likely that either the
+		///  distance between two Chibi stacks is becoming too big or there are
+		///  interferences.
+		/// </summary>
+		public void GetChibiErrorLog(out int underrun, out int crcError, out int noAck, out int overflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIBI_ERROR_LOG);
+
+			byte[] response = SendRequest(request, 16);
+
+			underrun = LEConverter.UShortFrom(8, response);
+			crcError = LEConverter.UShortFrom(10, response);
+			noAck = LEConverter.UShortFrom(12, response);
+			overflow = LEConverter.UShortFrom(14, response);
+		}
+
+		/// <summary>
+		///  Sets the Chibi frequency range for the Chibi Extension. Possible values are:
+		///  
+		///  <code>
+		///   "Type", "Description"
+		///  
+		///   "0",    "OQPSK 868MHz (Europe)"
+		///   "1",    "OQPSK 915MHz (US)"
+		///   "2",    "OQPSK 780MHz (China)"
+		///   "3",    "BPSK40 915MHz"
+		///  </code>
+		///  
+		///  It is possible to set the frequency with the Brick Viewer and it will be
+		///  saved in the EEPROM of the Chibi Extension, it does not
+		///  have to be set on every startup.
+		/// </summary>
+		public void SetChibiFrequency(byte frequency)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_CHIBI_FREQUENCY);
+			LEConverter.To((byte)frequency, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the frequency value as set by <see cref="Tinkerforge.BrickMaster.SetChibiFrequency"/>.
+		/// </summary>
+		public byte GetChibiFrequency()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIBI_FREQUENCY);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the channel used by the Chibi Extension. Possible channels are
+		///  different for different frequencies:
+		///  
+		///  <code>
+		///   "Frequency", "Possible Channels"
+		///  
+		///   "OQPSK 868MHz (Europe)", "0"
+		///   "OQPSK 915MHz (US)",     "1, 2, 3, 4, 5, 6, 7, 8, 9, 10"
+		///   "OQPSK 780MHz (China)",  "0, 1, 2, 3"
+		///   "BPSK40 915MHz",         "1, 2, 3, 4, 5, 6, 7, 8, 9, 10"
+		///  </code>
+		///  
+		///  It is possible to set the channel with the Brick Viewer and it will be
+		///  saved in the EEPROM of the Chibi Extension, it does not
+		///  have to be set on every startup.
+		/// </summary>
+		public void SetChibiChannel(byte channel)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_CHIBI_CHANNEL);
+			LEConverter.To((byte)channel, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the channel as set by <see cref="Tinkerforge.BrickMaster.SetChibiChannel"/>.
+		/// </summary>
+		public byte GetChibiChannel()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIBI_CHANNEL);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns *true* if the Master Brick is at position 0 in the stack and a RS485
+		///  Extension is available.
+		/// </summary>
+		public bool IsRS485Present()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_RS485_PRESENT);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the address (0-255) belonging to the RS485 Extension.
+		///  
+		///  Set to 0 if the RS485 Extension should be the RS485 Master (i.e.
+		///  connected to a PC via USB).
+		///  
+		///  It is possible to set the address with the Brick Viewer and it will be
+		///  saved in the EEPROM of the RS485 Extension, it does not
+		///  have to be set on every startup.
+		/// </summary>
+		public void SetRS485Address(byte address)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_RS485_ADDRESS);
+			LEConverter.To((byte)address, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the address as set by <see cref="Tinkerforge.BrickMaster.SetRS485Address"/>.
+		/// </summary>
+		public byte GetRS485Address()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_RS485_ADDRESS);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets up to 255 slave addresses. Valid addresses are in range 1-255. 0 has a
+		///  special meaning, it is used as list terminator and not allowed as normal slave
+		///  address. The address numeration (via ``num`` parameter) has to be used
+		///  ascending from 0. For example: If you use the RS485 Extension in Master mode
+		///  (i.e. the stack has an USB connection) and you want to talk to three other
+		///  RS485 stacks with the addresses 17, 23, and 42, you should call with
+		///  ``(0, 17)``, ``(1, 23)``, ``(2, 42)`` and ``(3, 0)``. The last call with
+		///  ``(3, 0)`` is a list terminator and indicates that the RS485 slave address list
+		///  contains 3 addresses in this case.
+		///  
+		///  It is possible to set the addresses with the Brick Viewer, that will take care
+		///  of correct address numeration and list termination.
+		///  
+		///  The slave addresses will be saved in the EEPROM of the Chibi Extension, they
+		///  don't have to be set on every startup.
+		/// </summary>
+		public void SetRS485SlaveAddress(byte num, byte address)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_RS485_SLAVE_ADDRESS);
+			LEConverter.To((byte)num, 8, request);
+			LEConverter.To((byte)address, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the slave address for a given ``num`` as set by
+		///  <see cref="Tinkerforge.BrickMaster.SetRS485SlaveAddress"/>.
+		/// </summary>
+		public byte GetRS485SlaveAddress(byte num)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_RS485_SLAVE_ADDRESS);
+			LEConverter.To((byte)num, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns CRC error counts of the RS485 communication.
+		///  If this counter starts rising, it is likely that the distance
+		///  between the RS485 nodes is too big or there is some kind of
+		///  interference.
+		/// </summary>
+		public int GetRS485ErrorLog()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_RS485_ERROR_LOG);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the configuration of the RS485 Extension. The
+		///  Master Brick will try to match the given baud rate as exactly as possible.
+		///  The maximum recommended baud rate is 2000000 (2MBd).
+		///  Possible values for parity are 'n' (none), 'e' (even) and 'o' (odd).
+		///  
+		///  If your RS485 is unstable (lost messages etc.), the first thing you should
+		///  try is to decrease the speed. On very large bus (e.g. 1km), you probably
+		///  should use a value in the range of 100000 (100kBd).
+		///  
+		///  The values are stored in the EEPROM and only applied on startup. That means
+		///  you have to restart the Master Brick after configuration.
+		/// </summary>
+		public void SetRS485Configuration(long speed, char parity, byte stopbits)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_SET_RS485_CONFIGURATION);
+			LEConverter.To((int)speed, 8, request);
+			LEConverter.To((char)parity, 12, request);
+			LEConverter.To((byte)stopbits, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickMaster.SetRS485Configuration"/>.
+		/// </summary>
+		public void GetRS485Configuration(out long speed, out char parity, out byte stopbits)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_RS485_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			speed = LEConverter.UIntFrom(8, response);
+			parity = LEConverter.CharFrom(12, response);
+			stopbits = LEConverter.ByteFrom(13, response);
+		}
+
+		/// <summary>
+		///  Returns *true* if the Master Brick is at position 0 in the stack and a WIFI
+		///  Extension is available.
+		/// </summary>
+		public bool IsWifiPresent()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_WIFI_PRESENT);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the configuration of the WIFI Extension. The ``ssid`` can have a max length
+		///  of 32 characters. Possible values for ``connection`` are:
+		///  
+		///  <code>
+		///   "Value", "Description"
+		///  
+		///   "0", "DHCP"
+		///   "1", "Static IP"
+		///   "2", "Access Point: DHCP"
+		///   "3", "Access Point: Static IP"
+		///   "4", "Ad Hoc: DHCP"
+		///   "5", "Ad Hoc: Static IP"
+		///  </code>
+		///  
+		///  If you set ``connection`` to one of the static IP options then you have to
+		///  supply ``ip``, ``subnet_mask`` and ``gateway`` as an array of size 4 (first
+		///  element of the array is the least significant byte of the address). If
+		///  ``connection`` is set to one of the DHCP options then ``ip``, ``subnet_mask``
+		///  and ``gateway`` are ignored, you can set them to 0.
+		///  
+		///  The last parameter is the port that your program will connect to.
+		///  
+		///  The values are stored in the EEPROM and only applied on startup. That means
+		///  you have to restart the Master Brick after configuration.
+		///  
+		///  It is recommended to use the Brick Viewer to set the WIFI configuration.
+		/// </summary>
+		public void SetWifiConfiguration(string ssid, byte connection, byte[] ip, byte[] subnetMask, byte[] gateway, int port)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(55, FUNCTION_SET_WIFI_CONFIGURATION);
+			LEConverter.To((string)ssid, 8, 32, request);
+			LEConverter.To((byte)connection, 40, request);
+			LEConverter.To((byte[])ip, 41, 4, request);
+			LEConverter.To((byte[])subnetMask, 45, 4, request);
+			LEConverter.To((byte[])gateway, 49, 4, request);
+			LEConverter.To((short)port, 53, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickMaster.SetWifiConfiguration"/>.
+		/// </summary>
+		public void GetWifiConfiguration(out string ssid, out byte connection, out byte[] ip, out byte[] subnetMask, out byte[] gateway, out int port)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 55);
+
+			ssid = LEConverter.StringFrom(8, response, 32);
+			connection = LEConverter.ByteFrom(40, response);
+			ip = LEConverter.ByteArrayFrom(41, response, 4);
+			subnetMask = LEConverter.ByteArrayFrom(45, response, 4);
+			gateway = LEConverter.ByteArrayFrom(49, response, 4);
+			port = LEConverter.UShortFrom(53, response);
+		}
+
+		/// <summary>
+		///  Sets the encryption of the WIFI Extension. The first parameter is the
+		///  type of the encryption. Possible values are:
+		///  
+		///  <code>
+		///   "Value", "Description"
+		///  
+		///   "0", "WPA/WPA2"
+		///   "1", "WPA Enterprise (EAP-FAST, EAP-TLS, EAP-TTLS, PEAP)"
+		///   "2", "WEP"
+		///   "3", "No Encryption"
+		///  </code>
+		///  
+		///  The ``key`` has a max length of 50 characters and is used if ``encryption``
+		///  is set to 0 or 2 (WPA/WPA2 or WEP). Otherwise the value is ignored.
+		///  
+		///  For WPA/WPA2 the key has to be at least 8 characters long. If you want to set
+		///  a key with more than 50 characters, see <see cref="Tinkerforge.BrickMaster.SetLongWifiKey"/>.
+		///  
+		///  For WEP the key has to be either 10 or 26 hexadecimal digits long. It is
+		///  possible to set the WEP ``key_index`` (1-4). If you don't know your
+		///  ``key_index``, it is likely 1.
+		///  
+		///  If you choose WPA Enterprise as encryption, you have to set ``eap_options`` and
+		///  the length of the certificates (for other encryption types these parameters
+		///  are ignored). The certificates
+		///  themselves can be set with <see cref="Tinkerforge.BrickMaster.SetWifiCertificate"/>. ``eap_options`` consist
+		///  of the outer authentication (bits 1-2), inner authentication (bit 3) and
+		///  certificate type (bits 4-5):
+		///  
+		///  <code>
+		///   "Option", "Bits", "Description"
+		///  
+		///   "outer authentication", "1-2", "0=EAP-FAST, 1=EAP-TLS, 2=EAP-TTLS, 3=EAP-PEAP"
+		///   "inner authentication", "3", "0=EAP-MSCHAP, 1=EAP-GTC"
+		///   "certificate type", "4-5", "0=CA Certificate, 1=Client Certificate, 2=Private Key"
+		///  </code>
+		///  
+		///  Example for EAP-TTLS + EAP-GTC + Private Key: ``option = 2 | (1 &lt;&lt; 2) | (2 &lt;&lt; 3)``.
+		///  
+		///  The values are stored in the EEPROM and only applied on startup. That means
+		///  you have to restart the Master Brick after configuration.
+		///  
+		///  It is recommended to use the Brick Viewer to set the Wi-Fi encryption.
+		/// </summary>
+		public void SetWifiEncryption(byte encryption, string key, byte keyIndex, byte eapOptions, int caCertificateLength, int clientCertificateLength, int privateKeyLength)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(67, FUNCTION_SET_WIFI_ENCRYPTION);
+			LEConverter.To((byte)encryption, 8, request);
+			LEConverter.To((string)key, 9, 50, request);
+			LEConverter.To((byte)keyIndex, 59, request);
+			LEConverter.To((byte)eapOptions, 60, request);
+			LEConverter.To((short)caCertificateLength, 61, request);
+			LEConverter.To((short)clientCertificateLength, 63, request);
+			LEConverter.To((short)privateKeyLength, 65, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the encryption as set by <see cref="Tinkerforge.BrickMaster.SetWifiEncryption"/>.
+		///  
+		///  <note>
+		///   Since Master Brick Firmware version 2.4.4 the key is not returned anymore.
+		///  </note>
+		/// </summary>
+		public void GetWifiEncryption(out byte encryption, out string key, out byte keyIndex, out byte eapOptions, out int caCertificateLength, out int clientCertificateLength, out int privateKeyLength)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI_ENCRYPTION);
+
+			byte[] response = SendRequest(request, 67);
+
+			encryption = LEConverter.ByteFrom(8, response);
+			key = LEConverter.StringFrom(9, response, 50);
+			keyIndex = LEConverter.ByteFrom(59, response);
+			eapOptions = LEConverter.ByteFrom(60, response);
+			caCertificateLength = LEConverter.UShortFrom(61, response);
+			clientCertificateLength = LEConverter.UShortFrom(63, response);
+			privateKeyLength = LEConverter.UShortFrom(65, response);
+		}
+
+		/// <summary>
+		///  Returns the status of the WIFI Extension. The ``state`` is updated automatically,
+		///  all of the other parameters are updated on startup and every time
+		///  <see cref="Tinkerforge.BrickMaster.RefreshWifiStatus"/> is called.
+		///  
+		///  Possible states are:
+		///  
+		///  <code>
+		///   "State", "Description"
+		///  
+		///   "0", "Disassociated"
+		///   "1", "Associated"
+		///   "2", "Associating"
+		///   "3", "Error"
+		///   "255", "Not initialized yet"
+		///  </code>
+		/// </summary>
+		public void GetWifiStatus(out byte[] macAddress, out byte[] bssid, out byte channel, out short rssi, out byte[] ip, out byte[] subnetMask, out byte[] gateway, out long rxCount, out long txCount, out byte state)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI_STATUS);
+
+			byte[] response = SendRequest(request, 44);
+
+			macAddress = LEConverter.ByteArrayFrom(8, response, 6);
+			bssid = LEConverter.ByteArrayFrom(14, response, 6);
+			channel = LEConverter.ByteFrom(20, response);
+			rssi = LEConverter.ShortFrom(21, response);
+			ip = LEConverter.ByteArrayFrom(23, response, 4);
+			subnetMask = LEConverter.ByteArrayFrom(27, response, 4);
+			gateway = LEConverter.ByteArrayFrom(31, response, 4);
+			rxCount = LEConverter.UIntFrom(35, response);
+			txCount = LEConverter.UIntFrom(39, response);
+			state = LEConverter.ByteFrom(43, response);
+		}
+
+		/// <summary>
+		///  Refreshes the Wi-Fi status (see <see cref="Tinkerforge.BrickMaster.GetWifiStatus"/>). To read the status
+		///  of the Wi-Fi module, the Master Brick has to change from data mode to
+		///  command mode and back. This transaction and the readout itself is
+		///  unfortunately time consuming. This means, that it might take some ms
+		///  until the stack with attached WIFI Extension reacts again after this
+		///  function is called.
+		/// </summary>
+		public void RefreshWifiStatus()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_REFRESH_WIFI_STATUS);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  This function is used to set the certificate as well as password and username
+		///  for WPA Enterprise. To set the username use index 0xFFFF,
+		///  to set the password use index 0xFFFE. The max length of username and
+		///  password is 32.
+		///  
+		///  The certificate is written in chunks of size 32 and the index is used as
+		///  the index of the chunk. ``data_length`` should nearly always be 32. Only
+		///  the last chunk can have a length that is not equal to 32.
+		///  
+		///  The starting index of the CA Certificate is 0, of the Client Certificate
+		///  10000 and for the Private Key 20000. Maximum sizes are 1312, 1312 and
+		///  4320 byte respectively.
+		///  
+		///  The values are stored in the EEPROM and only applied on startup. That means
+		///  you have to restart the Master Brick after uploading the certificate.
+		///  
+		///  It is recommended to use the Brick Viewer to set the certificate, username
+		///  and password.
+		/// </summary>
+		public void SetWifiCertificate(int index, byte[] data, byte dataLength)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(43, FUNCTION_SET_WIFI_CERTIFICATE);
+			LEConverter.To((short)index, 8, request);
+			LEConverter.To((byte[])data, 10, 32, request);
+			LEConverter.To((byte)dataLength, 42, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the certificate for a given index as set by <see cref="Tinkerforge.BrickMaster.SetWifiCertificate"/>.
+		/// </summary>
+		public void GetWifiCertificate(int index, out byte[] data, out byte dataLength)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_GET_WIFI_CERTIFICATE);
+			LEConverter.To((short)index, 8, request);
+
+			byte[] response = SendRequest(request, 41);
+
+			data = LEConverter.ByteArrayFrom(8, response, 32);
+			dataLength = LEConverter.ByteFrom(40, response);
+		}
+
+		/// <summary>
+		///  Sets the power mode of the WIFI Extension. Possible modes are:
+		///  
+		///  <code>
+		///   "Mode", "Description"
+		///  
+		///   "0", "Full Speed (high power consumption, high throughput)"
+		///   "1", "Low Power (low power consumption, low throughput)"
+		///  </code>
+		/// </summary>
+		public void SetWifiPowerMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_WIFI_POWER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the power mode as set by <see cref="Tinkerforge.BrickMaster.SetWifiPowerMode"/>.
+		/// </summary>
+		public byte GetWifiPowerMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI_POWER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns informations about the Wi-Fi receive buffer. The Wi-Fi
+		///  receive buffer has a max size of 1500 byte and if data is transfered
+		///  too fast, it might overflow.
+		///  
+		///  The return values are the number of overflows, the low watermark
+		///  (i.e. the smallest number of bytes that were free in the buffer) and
+		///  the bytes that are currently used.
+		///  
+		///  You should always try to keep the buffer empty, otherwise you will
+		///  have a permanent latency. A good rule of thumb is, that you can transfer
+		///  1000 messages per second without problems.
+		///  
+		///  Try to not send more then 50 messages at a time without any kind of
+		///  break between them.
+		/// </summary>
+		public void GetWifiBufferInfo(out long overflow, out int lowWatermark, out int used)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI_BUFFER_INFO);
+
+			byte[] response = SendRequest(request, 16);
+
+			overflow = LEConverter.UIntFrom(8, response);
+			lowWatermark = LEConverter.UShortFrom(12, response);
+			used = LEConverter.UShortFrom(14, response);
+		}
+
+		/// <summary>
+		///  Sets the regulatory domain of the WIFI Extension. Possible domains are:
+		///  
+		///  <code>
+		///   "Domain", "Description"
+		///  
+		///   "0", "FCC: Channel 1-11 (N/S America, Australia, New Zealand)"
+		///   "1", "ETSI: Channel 1-13 (Europe, Middle East, Africa)"
+		///   "2", "TELEC: Channel 1-14 (Japan)"
+		///  </code>
+		/// </summary>
+		public void SetWifiRegulatoryDomain(byte domain)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_WIFI_REGULATORY_DOMAIN);
+			LEConverter.To((byte)domain, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the regulatory domain as set by <see cref="Tinkerforge.BrickMaster.SetWifiRegulatoryDomain"/>.
+		/// </summary>
+		public byte GetWifiRegulatoryDomain()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI_REGULATORY_DOMAIN);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the USB voltage. Does not work with hardware version 2.1.
+		/// </summary>
+		public int GetUSBVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_USB_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets a long Wi-Fi key (up to 63 chars, at least 8 chars) for WPA encryption.
+		///  This key will be used
+		///  if the key in <see cref="Tinkerforge.BrickMaster.SetWifiEncryption"/> is set to "-". In the old protocol,
+		///  a payload of size 63 was not possible, so the maximum key length was 50 chars.
+		///  
+		///  With the new protocol this is possible, since we didn't want to break API,
+		///  this function was added additionally.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Firmware)
+		/// </summary>
+		public void SetLongWifiKey(string key)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_LONG_WIFI_KEY);
+			LEConverter.To((string)key, 8, 64, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the encryption key as set by <see cref="Tinkerforge.BrickMaster.SetLongWifiKey"/>.
+		///  
+		///  <note>
+		///   Since Master Brick firmware version 2.4.4 the key is not returned anymore.
+		///  </note>
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Firmware)
+		/// </summary>
+		public string GetLongWifiKey()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_LONG_WIFI_KEY);
+
+			byte[] response = SendRequest(request, 72);
+
+			return LEConverter.StringFrom(8, response, 64);
+		}
+
+		/// <summary>
+		///  Sets the hostname of the WIFI Extension. The hostname will be displayed
+		///  by access points as the hostname in the DHCP clients table.
+		///  
+		///  Setting an empty String will restore the default hostname.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifiHostname(string hostname)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(24, FUNCTION_SET_WIFI_HOSTNAME);
+			LEConverter.To((string)hostname, 8, 16, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the hostname as set by <see cref="Tinkerforge.BrickMaster.SetWifiHostname"/>.
+		///  
+		///  An empty String means, that the default hostname is used.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public string GetWifiHostname()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI_HOSTNAME);
+
+			byte[] response = SendRequest(request, 24);
+
+			return LEConverter.StringFrom(8, response, 16);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickMaster.StackCurrentCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickMaster.StackCurrentCallback"/> callback is only triggered if the current has changed
+		///  since the last triggering.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetStackCurrentCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_STACK_CURRENT_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickMaster.SetStackCurrentCallbackPeriod"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public long GetStackCurrentCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STACK_CURRENT_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickMaster.StackVoltageCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickMaster.StackVoltageCallback"/> callback is only triggered if the voltage has changed
+		///  since the last triggering.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetStackVoltageCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_STACK_VOLTAGE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickMaster.SetStackVoltageCallbackPeriod"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public long GetStackVoltageCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STACK_VOLTAGE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickMaster.USBVoltageCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickMaster.USBVoltageCallback"/> callback is only triggered if the voltage has changed
+		///  since the last triggering.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetUSBVoltageCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_USB_VOLTAGE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickMaster.SetUSBVoltageCallbackPeriod"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public long GetUSBVoltageCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_USB_VOLTAGE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickMaster.StackCurrentReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the current is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the current is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the current is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the current is greater than the min value (max is ignored)"
+		///  </code>
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetStackCurrentCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_STACK_CURRENT_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((short)min, 9, request);
+			LEConverter.To((short)max, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickMaster.SetStackCurrentCallbackThreshold"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void GetStackCurrentCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STACK_CURRENT_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 13);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.UShortFrom(9, response);
+			max = LEConverter.UShortFrom(11, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickMaster.StackVoltageReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the voltage is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the voltage is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the voltage is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the voltage is greater than the min value (max is ignored)"
+		///  </code>
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetStackVoltageCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_STACK_VOLTAGE_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((short)min, 9, request);
+			LEConverter.To((short)max, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickMaster.SetStackVoltageCallbackThreshold"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void GetStackVoltageCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STACK_VOLTAGE_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 13);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.UShortFrom(9, response);
+			max = LEConverter.UShortFrom(11, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickMaster.USBVoltageReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the voltage is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the voltage is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the voltage is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the voltage is greater than the min value (max is ignored)"
+		///  </code>
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetUSBVoltageCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_USB_VOLTAGE_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((short)min, 9, request);
+			LEConverter.To((short)max, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickMaster.SetUSBVoltageCallbackThreshold"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void GetUSBVoltageCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_USB_VOLTAGE_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 13);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.UShortFrom(9, response);
+			max = LEConverter.UShortFrom(11, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the threshold callbacks
+		///  
+		///  * <see cref="Tinkerforge.BrickMaster.StackCurrentReachedCallback"/>,
+		///  * <see cref="Tinkerforge.BrickMaster.StackVoltageReachedCallback"/>,
+		///  * <see cref="Tinkerforge.BrickMaster.USBVoltageReachedCallback"/>
+		///  
+		///  are triggered, if the thresholds
+		///  
+		///  * <see cref="Tinkerforge.BrickMaster.SetStackCurrentCallbackThreshold"/>,
+		///  * <see cref="Tinkerforge.BrickMaster.SetStackVoltageCallbackThreshold"/>,
+		///  * <see cref="Tinkerforge.BrickMaster.SetUSBVoltageCallbackThreshold"/>
+		///  
+		///  keep being reached.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public void SetDebouncePeriod(long debounce)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DEBOUNCE_PERIOD);
+			LEConverter.To((int)debounce, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the debounce period as set by <see cref="Tinkerforge.BrickMaster.SetDebouncePeriod"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Firmware)
+		/// </summary>
+		public long GetDebouncePeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DEBOUNCE_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns *true* if the Master Brick is at position 0 in the stack and an Ethernet
+		///  Extension is available.
+		///  
+		///  .. versionadded:: 2.1.0$nbsp;(Firmware)
+		/// </summary>
+		public bool IsEthernetPresent()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_ETHERNET_PRESENT);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the configuration of the Ethernet Extension. Possible values for
+		///  ``connection`` are:
+		///  
+		///  <code>
+		///   "Value", "Description"
+		///  
+		///   "0", "DHCP"
+		///   "1", "Static IP"
+		///  </code>
+		///  
+		///  If you set ``connection`` to static IP options then you have to supply ``ip``,
+		///  ``subnet_mask`` and ``gateway`` as an array of size 4 (first element of the
+		///  array is the least significant byte of the address). If ``connection`` is set
+		///  to the DHCP options then ``ip``, ``subnet_mask`` and ``gateway`` are ignored,
+		///  you can set them to 0.
+		///  
+		///  The last parameter is the port that your program will connect to.
+		///  
+		///  The values are stored in the EEPROM and only applied on startup. That means
+		///  you have to restart the Master Brick after configuration.
+		///  
+		///  It is recommended to use the Brick Viewer to set the Ethernet configuration.
+		///  
+		///  .. versionadded:: 2.1.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetEthernetConfiguration(byte connection, byte[] ip, byte[] subnetMask, byte[] gateway, int port)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(23, FUNCTION_SET_ETHERNET_CONFIGURATION);
+			LEConverter.To((byte)connection, 8, request);
+			LEConverter.To((byte[])ip, 9, 4, request);
+			LEConverter.To((byte[])subnetMask, 13, 4, request);
+			LEConverter.To((byte[])gateway, 17, 4, request);
+			LEConverter.To((short)port, 21, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickMaster.SetEthernetConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.1.0$nbsp;(Firmware)
+		/// </summary>
+		public void GetEthernetConfiguration(out byte connection, out byte[] ip, out byte[] subnetMask, out byte[] gateway, out int port)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ETHERNET_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 23);
+
+			connection = LEConverter.ByteFrom(8, response);
+			ip = LEConverter.ByteArrayFrom(9, response, 4);
+			subnetMask = LEConverter.ByteArrayFrom(13, response, 4);
+			gateway = LEConverter.ByteArrayFrom(17, response, 4);
+			port = LEConverter.UShortFrom(21, response);
+		}
+
+		/// <summary>
+		///  Returns the status of the Ethernet Extension.
+		///  
+		///  ``mac_address``, ``ip``, ``subnet_mask`` and ``gateway`` are given as an array.
+		///  The first element of the array is the least significant byte of the address.
+		///  
+		///  ``rx_count`` and ``tx_count`` are the number of bytes that have been
+		///  received/send since last restart.
+		///  
+		///  ``hostname`` is the currently used hostname.
+		///  
+		///  .. versionadded:: 2.1.0$nbsp;(Firmware)
+		/// </summary>
+		public void GetEthernetStatus(out byte[] macAddress, out byte[] ip, out byte[] subnetMask, out byte[] gateway, out long rxCount, out long txCount, out string hostname)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ETHERNET_STATUS);
+
+			byte[] response = SendRequest(request, 66);
+
+			macAddress = LEConverter.ByteArrayFrom(8, response, 6);
+			ip = LEConverter.ByteArrayFrom(14, response, 4);
+			subnetMask = LEConverter.ByteArrayFrom(18, response, 4);
+			gateway = LEConverter.ByteArrayFrom(22, response, 4);
+			rxCount = LEConverter.UIntFrom(26, response);
+			txCount = LEConverter.UIntFrom(30, response);
+			hostname = LEConverter.StringFrom(34, response, 32);
+		}
+
+		/// <summary>
+		///  Sets the hostname of the Ethernet Extension. The hostname will be displayed
+		///  by access points as the hostname in the DHCP clients table.
+		///  
+		///  Setting an empty String will restore the default hostname.
+		///  
+		///  The current hostname can be discovered with <see cref="Tinkerforge.BrickMaster.GetEthernetStatus"/>.
+		///  
+		///  .. versionadded:: 2.1.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetEthernetHostname(string hostname)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(40, FUNCTION_SET_ETHERNET_HOSTNAME);
+			LEConverter.To((string)hostname, 8, 32, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Sets the MAC address of the Ethernet Extension. The Ethernet Extension should
+		///  come configured with a valid MAC address, that is also written on a
+		///  sticker of the extension itself.
+		///  
+		///  The MAC address can be read out again with <see cref="Tinkerforge.BrickMaster.GetEthernetStatus"/>.
+		///  
+		///  .. versionadded:: 2.1.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetEthernetMACAddress(byte[] macAddress)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_SET_ETHERNET_MAC_ADDRESS);
+			LEConverter.To((byte[])macAddress, 8, 6, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Sets the Ethernet WebSocket configuration. The first parameter sets the number of socket
+		///  connections that are reserved for WebSockets. The range is 0-7. The connections
+		///  are shared with the plain sockets. Example: If you set the connections to 3,
+		///  there will be 3 WebSocket and 4 plain socket connections available.
+		///  
+		///  The second parameter is the port for the WebSocket connections. The port can
+		///  not be the same as the port for the plain socket connections.
+		///  
+		///  The values are stored in the EEPROM and only applied on startup. That means
+		///  you have to restart the Master Brick after configuration.
+		///  
+		///  It is recommended to use the Brick Viewer to set the Ethernet configuration.
+		///  
+		///  .. versionadded:: 2.2.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetEthernetWebsocketConfiguration(byte sockets, int port)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_ETHERNET_WEBSOCKET_CONFIGURATION);
+			LEConverter.To((byte)sockets, 8, request);
+			LEConverter.To((short)port, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickMaster.SetEthernetConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.2.0$nbsp;(Firmware)
+		/// </summary>
+		public void GetEthernetWebsocketConfiguration(out byte sockets, out int port)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ETHERNET_WEBSOCKET_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 11);
+
+			sockets = LEConverter.ByteFrom(8, response);
+			port = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  Sets the Ethernet authentication secret. The secret can be a string of up to 64
+		///  characters. An empty string disables the authentication.
+		///  
+		///  See the :ref:`authentication tutorial &lt;tutorial_authentication&gt;` for more
+		///  information.
+		///  
+		///  The secret is stored in the EEPROM and only applied on startup. That means
+		///  you have to restart the Master Brick after configuration.
+		///  
+		///  It is recommended to use the Brick Viewer to set the Ethernet authentication secret.
+		///  
+		///  The default value is an empty string (authentication disabled).
+		///  
+		///  .. versionadded:: 2.2.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetEthernetAuthenticationSecret(string secret)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_ETHERNET_AUTHENTICATION_SECRET);
+			LEConverter.To((string)secret, 8, 64, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the authentication secret as set by
+		///  <see cref="Tinkerforge.BrickMaster.SetEthernetAuthenticationSecret"/>.
+		///  
+		///  .. versionadded:: 2.2.0$nbsp;(Firmware)
+		/// </summary>
+		public string GetEthernetAuthenticationSecret()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ETHERNET_AUTHENTICATION_SECRET);
+
+			byte[] response = SendRequest(request, 72);
+
+			return LEConverter.StringFrom(8, response, 64);
+		}
+
+		/// <summary>
+		///  Sets the WIFI authentication secret. The secret can be a string of up to 64
+		///  characters. An empty string disables the authentication.
+		///  
+		///  See the :ref:`authentication tutorial &lt;tutorial_authentication&gt;` for more
+		///  information.
+		///  
+		///  The secret is stored in the EEPROM and only applied on startup. That means
+		///  you have to restart the Master Brick after configuration.
+		///  
+		///  It is recommended to use the Brick Viewer to set the WIFI authentication secret.
+		///  
+		///  The default value is an empty string (authentication disabled).
+		///  
+		///  .. versionadded:: 2.2.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifiAuthenticationSecret(string secret)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_WIFI_AUTHENTICATION_SECRET);
+			LEConverter.To((string)secret, 8, 64, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the authentication secret as set by
+		///  <see cref="Tinkerforge.BrickMaster.SetWifiAuthenticationSecret"/>.
+		///  
+		///  .. versionadded:: 2.2.0$nbsp;(Firmware)
+		/// </summary>
+		public string GetWifiAuthenticationSecret()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI_AUTHENTICATION_SECRET);
+
+			byte[] response = SendRequest(request, 72);
+
+			return LEConverter.StringFrom(8, response, 64);
+		}
+
+		/// <summary>
+		///  Returns the type of the connection over which this function was called.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public byte GetConnectionType()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CONNECTION_TYPE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns *true* if the Master Brick is at position 0 in the stack and a WIFI
+		///  Extension 2.0 is available.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public bool IsWifi2Present()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_WIFI2_PRESENT);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Starts the bootloader of the WIFI Extension 2.0. Returns 0 on success.
+		///  Afterwards the <see cref="Tinkerforge.BrickMaster.WriteWifi2SerialPort"/> and <see cref="Tinkerforge.BrickMaster.ReadWifi2SerialPort"/>
+		///  functions can be used to communicate with the bootloader to flash a new
+		///  firmware.
+		///  
+		///  The bootloader should only be started over a USB connection. It cannot be
+		///  started over a WIFI2 connection, see the <see cref="Tinkerforge.BrickMaster.GetConnectionType"/> function.
+		///  
+		///  It is recommended to use the Brick Viewer to update the firmware of the WIFI
+		///  Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public short StartWifi2Bootloader()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_START_WIFI2_BOOTLOADER);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.SByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Writes up to 60 bytes (number of bytes to be written specified by ``length``)
+		///  to the serial port of the bootloader of the WIFI Extension 2.0. Returns 0 on
+		///  success.
+		///  
+		///  Before this function can be used the bootloader has to be started using the
+		///  <see cref="Tinkerforge.BrickMaster.StartWifi2Bootloader"/> function.
+		///  
+		///  It is recommended to use the Brick Viewer to update the firmware of the WIFI
+		///  Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public short WriteWifi2SerialPort(byte[] data, byte length)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(69, FUNCTION_WRITE_WIFI2_SERIAL_PORT);
+			LEConverter.To((byte[])data, 8, 60, request);
+			LEConverter.To((byte)length, 68, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.SByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Reads up to 60 bytes (number of bytes to be read specified by ``length``)
+		///  from the serial port of the bootloader of the WIFI Extension 2.0.
+		///  Returns the number of actually read bytes.
+		///  
+		///  Before this function can be used the bootloader has to be started using the
+		///  <see cref="Tinkerforge.BrickMaster.StartWifi2Bootloader"/> function.
+		///  
+		///  It is recommended to use the Brick Viewer to update the firmware of the WIFI
+		///  Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void ReadWifi2SerialPort(byte length, out byte[] data, out byte result)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_READ_WIFI2_SERIAL_PORT);
+			LEConverter.To((byte)length, 8, request);
+
+			byte[] response = SendRequest(request, 69);
+
+			data = LEConverter.ByteArrayFrom(8, response, 60);
+			result = LEConverter.ByteFrom(68, response);
+		}
+
+		/// <summary>
+		///  Sets the WIFI authentication secret. The secret can be a string of up to 64
+		///  characters. An empty string disables the authentication. The default value is
+		///  an empty string (authentication disabled).
+		///  
+		///  See the :ref:`authentication tutorial &lt;tutorial_authentication&gt;` for more
+		///  information.
+		///  
+		///  To apply configuration changes to the WIFI Extension 2.0 the
+		///  <see cref="Tinkerforge.BrickMaster.SaveWifi2Configuration"/> function has to be called and the Master Brick
+		///  has to be restarted afterwards.
+		///  
+		///  It is recommended to use the Brick Viewer to configure the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifi2AuthenticationSecret(string secret)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_WIFI2_AUTHENTICATION_SECRET);
+			LEConverter.To((string)secret, 8, 64, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the WIFI authentication secret as set by
+		///  <see cref="Tinkerforge.BrickMaster.SetWifi2AuthenticationSecret"/>.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public string GetWifi2AuthenticationSecret()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_AUTHENTICATION_SECRET);
+
+			byte[] response = SendRequest(request, 72);
+
+			return LEConverter.StringFrom(8, response, 64);
+		}
+
+		/// <summary>
+		///  Sets the general configuration of the WIFI Extension 2.0.
+		///  
+		///  The ``port`` parameter sets the port number that your programm will connect
+		///  to.
+		///  
+		///  The ``websocket_port`` parameter sets the WebSocket port number that your
+		///  JavaScript programm will connect to.
+		///  
+		///  The ``website_port`` parameter sets the port number for the website of the
+		///  WIFI Extension 2.0.
+		///  
+		///  The ``phy_mode`` parameter sets the specific wireless network mode to be used.
+		///  Possible values are B, G and N.
+		///  
+		///  The ``sleep_mode`` parameter is currently unused.
+		///  
+		///  The ``website`` parameter is used to enable or disable the web interface of
+		///  the WIFI Extension 2.0, which is available from firmware version 2.0.1. Note
+		///  that, for firmware version 2.0.3 and older, to disable the the web interface
+		///  the ``website_port`` parameter must be set to 1 and greater than 1 to enable
+		///  the web interface. For firmware version 2.0.4 and later, setting this parameter
+		///  to 1 will enable the web interface and setting it to 0 will disable the web
+		///  interface.
+		///  
+		///  To apply configuration changes to the WIFI Extension 2.0 the
+		///  <see cref="Tinkerforge.BrickMaster.SaveWifi2Configuration"/> function has to be called and the Master Brick
+		///  has to be restarted afterwards.
+		///  
+		///  It is recommended to use the Brick Viewer to configure the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifi2Configuration(int port, int websocketPort, int websitePort, byte phyMode, byte sleepMode, byte website)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_SET_WIFI2_CONFIGURATION);
+			LEConverter.To((short)port, 8, request);
+			LEConverter.To((short)websocketPort, 10, request);
+			LEConverter.To((short)websitePort, 12, request);
+			LEConverter.To((byte)phyMode, 14, request);
+			LEConverter.To((byte)sleepMode, 15, request);
+			LEConverter.To((byte)website, 16, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the general configuration as set by <see cref="Tinkerforge.BrickMaster.SetWifi2Configuration"/>.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void GetWifi2Configuration(out int port, out int websocketPort, out int websitePort, out byte phyMode, out byte sleepMode, out byte website)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 17);
+
+			port = LEConverter.UShortFrom(8, response);
+			websocketPort = LEConverter.UShortFrom(10, response);
+			websitePort = LEConverter.UShortFrom(12, response);
+			phyMode = LEConverter.ByteFrom(14, response);
+			sleepMode = LEConverter.ByteFrom(15, response);
+			website = LEConverter.ByteFrom(16, response);
+		}
+
+		/// <summary>
+		///  Returns the client and access point status of the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void GetWifi2Status(out bool clientEnabled, out byte clientStatus, out byte[] clientIP, out byte[] clientSubnetMask, out byte[] clientGateway, out byte[] clientMACAddress, out long clientRXCount, out long clientTXCount, out short clientRSSI, out bool apEnabled, out byte[] apIP, out byte[] apSubnetMask, out byte[] apGateway, out byte[] apMACAddress, out long apRXCount, out long apTXCount, out byte apConnectedCount)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_STATUS);
+
+			byte[] response = SendRequest(request, 65);
+
+			clientEnabled = LEConverter.BoolFrom(8, response);
+			clientStatus = LEConverter.ByteFrom(9, response);
+			clientIP = LEConverter.ByteArrayFrom(10, response, 4);
+			clientSubnetMask = LEConverter.ByteArrayFrom(14, response, 4);
+			clientGateway = LEConverter.ByteArrayFrom(18, response, 4);
+			clientMACAddress = LEConverter.ByteArrayFrom(22, response, 6);
+			clientRXCount = LEConverter.UIntFrom(28, response);
+			clientTXCount = LEConverter.UIntFrom(32, response);
+			clientRSSI = LEConverter.SByteFrom(36, response);
+			apEnabled = LEConverter.BoolFrom(37, response);
+			apIP = LEConverter.ByteArrayFrom(38, response, 4);
+			apSubnetMask = LEConverter.ByteArrayFrom(42, response, 4);
+			apGateway = LEConverter.ByteArrayFrom(46, response, 4);
+			apMACAddress = LEConverter.ByteArrayFrom(50, response, 6);
+			apRXCount = LEConverter.UIntFrom(56, response);
+			apTXCount = LEConverter.UIntFrom(60, response);
+			apConnectedCount = LEConverter.ByteFrom(64, response);
+		}
+
+		/// <summary>
+		///  Sets the client specific configuration of the WIFI Extension 2.0.
+		///  
+		///  The ``enable`` parameter enables or disables the client part of the
+		///  WIFI Extension 2.0.
+		///  
+		///  The ``ssid`` parameter sets the SSID (up to 32 characters) of the access point
+		///  to connect to.
+		///  
+		///  If the ``ip`` parameter is set to all zero then ``subnet_mask`` and ``gateway``
+		///  parameters are also set to all zero and DHCP is used for IP address configuration.
+		///  Otherwise those three parameters can be used to configure a static IP address.
+		///  The default configuration is DHCP.
+		///  
+		///  If the ``mac_address`` parameter is set to all zero then the factory MAC
+		///  address is used. Otherwise this parameter can be used to set a custom MAC
+		///  address.
+		///  
+		///  If the ``bssid`` parameter is set to all zero then WIFI Extension 2.0 will
+		///  connect to any access point that matches the configured SSID. Otherwise this
+		///  parameter can be used to make the WIFI Extension 2.0 only connect to an
+		///  access point if SSID and BSSID match.
+		///  
+		///  To apply configuration changes to the WIFI Extension 2.0 the
+		///  <see cref="Tinkerforge.BrickMaster.SaveWifi2Configuration"/> function has to be called and the Master Brick
+		///  has to be restarted afterwards.
+		///  
+		///  It is recommended to use the Brick Viewer to configure the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifi2ClientConfiguration(bool enable, string ssid, byte[] ip, byte[] subnetMask, byte[] gateway, byte[] macAddress, byte[] bssid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(65, FUNCTION_SET_WIFI2_CLIENT_CONFIGURATION);
+			LEConverter.To((bool)enable, 8, request);
+			LEConverter.To((string)ssid, 9, 32, request);
+			LEConverter.To((byte[])ip, 41, 4, request);
+			LEConverter.To((byte[])subnetMask, 45, 4, request);
+			LEConverter.To((byte[])gateway, 49, 4, request);
+			LEConverter.To((byte[])macAddress, 53, 6, request);
+			LEConverter.To((byte[])bssid, 59, 6, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the client configuration as set by <see cref="Tinkerforge.BrickMaster.SetWifi2ClientConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void GetWifi2ClientConfiguration(out bool enable, out string ssid, out byte[] ip, out byte[] subnetMask, out byte[] gateway, out byte[] macAddress, out byte[] bssid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_CLIENT_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 65);
+
+			enable = LEConverter.BoolFrom(8, response);
+			ssid = LEConverter.StringFrom(9, response, 32);
+			ip = LEConverter.ByteArrayFrom(41, response, 4);
+			subnetMask = LEConverter.ByteArrayFrom(45, response, 4);
+			gateway = LEConverter.ByteArrayFrom(49, response, 4);
+			macAddress = LEConverter.ByteArrayFrom(53, response, 6);
+			bssid = LEConverter.ByteArrayFrom(59, response, 6);
+		}
+
+		/// <summary>
+		///  Sets the client hostname (up to 32 characters) of the WIFI Extension 2.0. The
+		///  hostname will be displayed by access points as the hostname in the DHCP clients
+		///  table.
+		///  
+		///  To apply configuration changes to the WIFI Extension 2.0 the
+		///  <see cref="Tinkerforge.BrickMaster.SaveWifi2Configuration"/> function has to be called and the Master Brick
+		///  has to be restarted afterwards.
+		///  
+		///  It is recommended to use the Brick Viewer to configure the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifi2ClientHostname(string hostname)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(40, FUNCTION_SET_WIFI2_CLIENT_HOSTNAME);
+			LEConverter.To((string)hostname, 8, 32, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the client hostname as set by <see cref="Tinkerforge.BrickMaster.SetWifi2ClientHostname"/>.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public string GetWifi2ClientHostname()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_CLIENT_HOSTNAME);
+
+			byte[] response = SendRequest(request, 40);
+
+			return LEConverter.StringFrom(8, response, 32);
+		}
+
+		/// <summary>
+		///  Sets the client password (up to 63 chars) for WPA/WPA2 encryption.
+		///  
+		///  To apply configuration changes to the WIFI Extension 2.0 the
+		///  <see cref="Tinkerforge.BrickMaster.SaveWifi2Configuration"/> function has to be called and the Master Brick
+		///  has to be restarted afterwards.
+		///  
+		///  It is recommended to use the Brick Viewer to configure the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifi2ClientPassword(string password)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_WIFI2_CLIENT_PASSWORD);
+			LEConverter.To((string)password, 8, 64, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the client password as set by <see cref="Tinkerforge.BrickMaster.SetWifi2ClientPassword"/>.
+		///  
+		///  <note>
+		///   Since WIFI Extension 2.0 firmware version 2.1.3 the password is not
+		///   returned anymore.
+		///  </note>
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public string GetWifi2ClientPassword()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_CLIENT_PASSWORD);
+
+			byte[] response = SendRequest(request, 72);
+
+			return LEConverter.StringFrom(8, response, 64);
+		}
+
+		/// <summary>
+		///  Sets the access point specific configuration of the WIFI Extension 2.0.
+		///  
+		///  The ``enable`` parameter enables or disables the access point part of the
+		///  WIFI Extension 2.0.
+		///  
+		///  The ``ssid`` parameter sets the SSID (up to 32 characters) of the access point.
+		///  
+		///  If the ``ip`` parameter is set to all zero then ``subnet_mask`` and ``gateway``
+		///  parameters are also set to all zero and DHCP is used for IP address configuration.
+		///  Otherwise those three parameters can be used to configure a static IP address.
+		///  The default configuration is DHCP.
+		///  
+		///  The ``encryption`` parameter sets the encryption mode to be used. Possible
+		///  values are Open (no encryption), WEP or WPA/WPA2 PSK.
+		///  Use the <see cref="Tinkerforge.BrickMaster.SetWifi2APPassword"/> function to set the encryption
+		///  password.
+		///  
+		///  The ``hidden`` parameter makes the access point hide or show its SSID.
+		///  
+		///  The ``channel`` parameter sets the channel (1 to 13) of the access point.
+		///  
+		///  If the ``mac_address`` parameter is set to all zero then the factory MAC
+		///  address is used. Otherwise this parameter can be used to set a custom MAC
+		///  address.
+		///  
+		///  To apply configuration changes to the WIFI Extension 2.0 the
+		///  <see cref="Tinkerforge.BrickMaster.SaveWifi2Configuration"/> function has to be called and the Master Brick
+		///  has to be restarted afterwards.
+		///  
+		///  It is recommended to use the Brick Viewer to configure the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifi2APConfiguration(bool enable, string ssid, byte[] ip, byte[] subnetMask, byte[] gateway, byte encryption, bool hidden, byte channel, byte[] macAddress)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(62, FUNCTION_SET_WIFI2_AP_CONFIGURATION);
+			LEConverter.To((bool)enable, 8, request);
+			LEConverter.To((string)ssid, 9, 32, request);
+			LEConverter.To((byte[])ip, 41, 4, request);
+			LEConverter.To((byte[])subnetMask, 45, 4, request);
+			LEConverter.To((byte[])gateway, 49, 4, request);
+			LEConverter.To((byte)encryption, 53, request);
+			LEConverter.To((bool)hidden, 54, request);
+			LEConverter.To((byte)channel, 55, request);
+			LEConverter.To((byte[])macAddress, 56, 6, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the access point configuration as set by <see cref="Tinkerforge.BrickMaster.SetWifi2APConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void GetWifi2APConfiguration(out bool enable, out string ssid, out byte[] ip, out byte[] subnetMask, out byte[] gateway, out byte encryption, out bool hidden, out byte channel, out byte[] macAddress)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_AP_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 62);
+
+			enable = LEConverter.BoolFrom(8, response);
+			ssid = LEConverter.StringFrom(9, response, 32);
+			ip = LEConverter.ByteArrayFrom(41, response, 4);
+			subnetMask = LEConverter.ByteArrayFrom(45, response, 4);
+			gateway = LEConverter.ByteArrayFrom(49, response, 4);
+			encryption = LEConverter.ByteFrom(53, response);
+			hidden = LEConverter.BoolFrom(54, response);
+			channel = LEConverter.ByteFrom(55, response);
+			macAddress = LEConverter.ByteArrayFrom(56, response, 6);
+		}
+
+		/// <summary>
+		///  Sets the access point password (at least 8 and up to 63 chars) for the configured encryption
+		///  mode, see <see cref="Tinkerforge.BrickMaster.SetWifi2APConfiguration"/>.
+		///  
+		///  To apply configuration changes to the WIFI Extension 2.0 the
+		///  <see cref="Tinkerforge.BrickMaster.SaveWifi2Configuration"/> function has to be called and the Master Brick
+		///  has to be restarted afterwards.
+		///  
+		///  It is recommended to use the Brick Viewer to configure the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifi2APPassword(string password)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_WIFI2_AP_PASSWORD);
+			LEConverter.To((string)password, 8, 64, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the access point password as set by <see cref="Tinkerforge.BrickMaster.SetWifi2APPassword"/>.
+		///  
+		///  <note>
+		///   Since WIFI Extension 2.0 firmware version 2.1.3 the password is not
+		///   returned anymore.
+		///  </note>
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public string GetWifi2APPassword()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_AP_PASSWORD);
+
+			byte[] response = SendRequest(request, 72);
+
+			return LEConverter.StringFrom(8, response, 64);
+		}
+
+		/// <summary>
+		///  All configuration functions for the WIFI Extension 2.0 do not change the
+		///  values permanently. After configuration this function has to be called to
+		///  permanently store the values.
+		///  
+		///  The values are stored in the EEPROM and only applied on startup. That means
+		///  you have to restart the Master Brick after configuration.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public byte SaveWifi2Configuration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_SAVE_WIFI2_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current version of the WIFI Extension 2.0 firmware.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public byte[] GetWifi2FirmwareVersion()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_FIRMWARE_VERSION);
+
+			byte[] response = SendRequest(request, 11);
+
+			return LEConverter.ByteArrayFrom(8, response, 3);
+		}
+
+		/// <summary>
+		///  Turns the green status LED of the WIFI Extension 2.0 on.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void EnableWifi2StatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_WIFI2_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Turns the green status LED of the WIFI Extension 2.0 off.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public void DisableWifi2StatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_WIFI2_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the green status LED of the WIFI Extension 2.0 is turned on.
+		///  
+		///  .. versionadded:: 2.4.0$nbsp;(Firmware)
+		/// </summary>
+		public bool IsWifi2StatusLEDEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_WIFI2_STATUS_LED_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Requires WIFI Extension 2.0 firmware 2.1.0.
+		///  
+		///  Sets the mesh specific configuration of the WIFI Extension 2.0.
+		///  
+		///  The ``enable`` parameter enables or disables the mesh part of the
+		///  WIFI Extension 2.0. The mesh part cannot be
+		///  enabled together with the client and access-point part.
+		///  
+		///  If the ``root_ip`` parameter is set to all zero then ``root_subnet_mask``
+		///  and ``root_gateway`` parameters are also set to all zero and DHCP is used for
+		///  IP address configuration. Otherwise those three parameters can be used to
+		///  configure a static IP address. The default configuration is DHCP.
+		///  
+		///  If the ``router_bssid`` parameter is set to all zero then the information is
+		///  taken from Wi-Fi scan when connecting the SSID as set by
+		///  <see cref="Tinkerforge.BrickMaster.SetWifi2MeshRouterSSID"/>. This only works if the the SSID is not hidden.
+		///  In case the router has hidden SSID this parameter must be specified, otherwise
+		///  the node will not be able to reach the mesh router.
+		///  
+		///  The ``group_id`` and the ``group_ssid_prefix`` parameters identifies a
+		///  particular mesh network and nodes configured with same ``group_id`` and the
+		///  ``group_ssid_prefix`` are considered to be in the same mesh network.
+		///  
+		///  The ``gateway_ip`` and the ``gateway_port`` parameters specifies the location
+		///  of the brickd that supports mesh feature.
+		///  
+		///  To apply configuration changes to the WIFI Extension 2.0 the
+		///  <see cref="Tinkerforge.BrickMaster.SaveWifi2Configuration"/> function has to be called and the Master Brick
+		///  has to be restarted afterwards.
+		///  
+		///  It is recommended to use the Brick Viewer to configure the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.2$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifi2MeshConfiguration(bool enable, byte[] rootIP, byte[] rootSubnetMask, byte[] rootGateway, byte[] routerBSSID, byte[] groupID, string groupSSIDPrefix, byte[] gatewayIP, int gatewayPort)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(55, FUNCTION_SET_WIFI2_MESH_CONFIGURATION);
+			LEConverter.To((bool)enable, 8, request);
+			LEConverter.To((byte[])rootIP, 9, 4, request);
+			LEConverter.To((byte[])rootSubnetMask, 13, 4, request);
+			LEConverter.To((byte[])rootGateway, 17, 4, request);
+			LEConverter.To((byte[])routerBSSID, 21, 6, request);
+			LEConverter.To((byte[])groupID, 27, 6, request);
+			LEConverter.To((string)groupSSIDPrefix, 33, 16, request);
+			LEConverter.To((byte[])gatewayIP, 49, 4, request);
+			LEConverter.To((short)gatewayPort, 53, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Requires WIFI Extension 2.0 firmware 2.1.0.
+		///  
+		///  Returns the mesh configuration as set by <see cref="Tinkerforge.BrickMaster.SetWifi2MeshConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.4.2$nbsp;(Firmware)
+		/// </summary>
+		public void GetWifi2MeshConfiguration(out bool enable, out byte[] rootIP, out byte[] rootSubnetMask, out byte[] rootGateway, out byte[] routerBSSID, out byte[] groupID, out string groupSSIDPrefix, out byte[] gatewayIP, out int gatewayPort)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_MESH_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 55);
+
+			enable = LEConverter.BoolFrom(8, response);
+			rootIP = LEConverter.ByteArrayFrom(9, response, 4);
+			rootSubnetMask = LEConverter.ByteArrayFrom(13, response, 4);
+			rootGateway = LEConverter.ByteArrayFrom(17, response, 4);
+			routerBSSID = LEConverter.ByteArrayFrom(21, response, 6);
+			groupID = LEConverter.ByteArrayFrom(27, response, 6);
+			groupSSIDPrefix = LEConverter.StringFrom(33, response, 16);
+			gatewayIP = LEConverter.ByteArrayFrom(49, response, 4);
+			gatewayPort = LEConverter.UShortFrom(53, response);
+		}
+
+		/// <summary>
+		///  Requires WIFI Extension 2.0 firmware 2.1.0.
+		///  
+		///  Sets the mesh router SSID of the WIFI Extension 2.0.
+		///  It is used to specify the mesh router to connect to.
+		///  
+		///  Note that even though in the argument of this function a 32 characters long SSID
+		///  is allowed, in practice valid SSID should have a maximum of 31 characters. This
+		///  is due to a bug in the mesh library that we use in the firmware of the extension.
+		///  
+		///  To apply configuration changes to the WIFI Extension 2.0 the
+		///  <see cref="Tinkerforge.BrickMaster.SaveWifi2Configuration"/> function has to be called and the Master Brick
+		///  has to be restarted afterwards.
+		///  
+		///  It is recommended to use the Brick Viewer to configure the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.2$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifi2MeshRouterSSID(string ssid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(40, FUNCTION_SET_WIFI2_MESH_ROUTER_SSID);
+			LEConverter.To((string)ssid, 8, 32, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Requires WIFI Extension 2.0 firmware 2.1.0.
+		///  
+		///  Returns the mesh router SSID as set by <see cref="Tinkerforge.BrickMaster.SetWifi2MeshRouterSSID"/>.
+		///  
+		///  .. versionadded:: 2.4.2$nbsp;(Firmware)
+		/// </summary>
+		public string GetWifi2MeshRouterSSID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_MESH_ROUTER_SSID);
+
+			byte[] response = SendRequest(request, 40);
+
+			return LEConverter.StringFrom(8, response, 32);
+		}
+
+		/// <summary>
+		///  Requires WIFI Extension 2.0 firmware 2.1.0.
+		///  
+		///  Sets the mesh router password (up to 64 characters) for WPA/WPA2 encryption.
+		///  The password will be used to connect to the mesh router.
+		///  
+		///  To apply configuration changes to the WIFI Extension 2.0 the
+		///  <see cref="Tinkerforge.BrickMaster.SaveWifi2Configuration"/> function has to be called and the Master Brick
+		///  has to be restarted afterwards.
+		///  
+		///  It is recommended to use the Brick Viewer to configure the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.2$nbsp;(Firmware)
+		/// </summary>
+		public void SetWifi2MeshRouterPassword(string password)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_WIFI2_MESH_ROUTER_PASSWORD);
+			LEConverter.To((string)password, 8, 64, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Requires WIFI Extension 2.0 firmware 2.1.0.
+		///  
+		///  Returns the mesh router password as set by <see cref="Tinkerforge.BrickMaster.SetWifi2MeshRouterPassword"/>.
+		///  
+		///  .. versionadded:: 2.4.2$nbsp;(Firmware)
+		/// </summary>
+		public string GetWifi2MeshRouterPassword()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_MESH_ROUTER_PASSWORD);
+
+			byte[] response = SendRequest(request, 72);
+
+			return LEConverter.StringFrom(8, response, 64);
+		}
+
+		/// <summary>
+		///  Requires WIFI Extension 2.0 firmware 2.1.0.
+		///  
+		///  Returns the common mesh status of the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.2$nbsp;(Firmware)
+		/// </summary>
+		public void GetWifi2MeshCommonStatus(out byte status, out bool rootNode, out bool rootCandidate, out int connectedNodes, out long rxCount, out long txCount)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_MESH_COMMON_STATUS);
+
+			byte[] response = SendRequest(request, 21);
+
+			status = LEConverter.ByteFrom(8, response);
+			rootNode = LEConverter.BoolFrom(9, response);
+			rootCandidate = LEConverter.BoolFrom(10, response);
+			connectedNodes = LEConverter.UShortFrom(11, response);
+			rxCount = LEConverter.UIntFrom(13, response);
+			txCount = LEConverter.UIntFrom(17, response);
+		}
+
+		/// <summary>
+		///  Requires WIFI Extension 2.0 firmware 2.1.0.
+		///  
+		///  Returns the mesh client status of the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.2$nbsp;(Firmware)
+		/// </summary>
+		public void GetWifi2MeshClientStatus(out string hostname, out byte[] ip, out byte[] subnetMask, out byte[] gateway, out byte[] macAddress)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_MESH_CLIENT_STATUS);
+
+			byte[] response = SendRequest(request, 58);
+
+			hostname = LEConverter.StringFrom(8, response, 32);
+			ip = LEConverter.ByteArrayFrom(40, response, 4);
+			subnetMask = LEConverter.ByteArrayFrom(44, response, 4);
+			gateway = LEConverter.ByteArrayFrom(48, response, 4);
+			macAddress = LEConverter.ByteArrayFrom(52, response, 6);
+		}
+
+		/// <summary>
+		///  Requires WIFI Extension 2.0 firmware 2.1.0.
+		///  
+		///  Returns the mesh AP status of the WIFI Extension 2.0.
+		///  
+		///  .. versionadded:: 2.4.2$nbsp;(Firmware)
+		/// </summary>
+		public void GetWifi2MeshAPStatus(out string ssid, out byte[] ip, out byte[] subnetMask, out byte[] gateway, out byte[] macAddress)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIFI2_MESH_AP_STATUS);
+
+			byte[] response = SendRequest(request, 58);
+
+			ssid = LEConverter.StringFrom(8, response, 32);
+			ip = LEConverter.ByteArrayFrom(40, response, 4);
+			subnetMask = LEConverter.ByteArrayFrom(44, response, 4);
+			gateway = LEConverter.ByteArrayFrom(48, response, 4);
+			macAddress = LEConverter.ByteArrayFrom(52, response, 6);
+		}
+
+		/// <summary>
+		///  This function is for internal use to flash the initial
+		///  bootstrapper and bootloader to the Bricklets.
+		///  
+		///  If you need to flash a boostrapper/bootloader (for exmaple
+		///  because you made your own Bricklet from scratch) please
+		///  take a look at our open source flash and test tool at
+		///  `https://github.com/Tinkerforge/flash-test &lt;https://github.com/Tinkerforge/flash-test&gt;`__
+		///  
+		///  Don't use this function directly.
+		///  
+		///  .. versionadded:: 2.5.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetBrickletXMCFlashConfig(long config, long parameter1, long parameter2, byte[] data, out long returnValue, out byte[] returnData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_BRICKLET_XMC_FLASH_CONFIG);
+			LEConverter.To((int)config, 8, request);
+			LEConverter.To((int)parameter1, 12, request);
+			LEConverter.To((int)parameter2, 16, request);
+			LEConverter.To((byte[])data, 20, 52, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			returnValue = LEConverter.UIntFrom(8, response);
+			returnData = LEConverter.ByteArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  This function is for internal use to flash the initial
+		///  bootstrapper and bootloader to the Bricklets.
+		///  
+		///  If you need to flash a boostrapper/bootloader (for exmaple
+		///  because you made your own Bricklet from scratch) please
+		///  take a look at our open source flash and test tool at
+		///  `https://github.com/Tinkerforge/flash-test &lt;https://github.com/Tinkerforge/flash-test&gt;`__
+		///  
+		///  Don't use this function directly.
+		///  
+		///  .. versionadded:: 2.5.0$nbsp;(Firmware)
+		/// </summary>
+		public long SetBrickletXMCFlashData(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_BRICKLET_XMC_FLASH_DATA);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  This function is only available in Master Brick hardware version &gt;= 3.0.
+		///  
+		///  Enables/disables all four Bricklets if set to true/false.
+		///  
+		///  If you disable the Bricklets the power supply to the Bricklets will be disconnected.
+		///  The Bricklets will lose all configurations if disabled.
+		///  
+		///  .. versionadded:: 2.5.0$nbsp;(Firmware)
+		/// </summary>
+		public void SetBrickletsEnabled(bool brickletsEnabled)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BRICKLETS_ENABLED);
+			LEConverter.To((bool)brickletsEnabled, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the Bricklets are enabled, *false* otherwise.
+		///  
+		///  .. versionadded:: 2.5.0$nbsp;(Firmware)
+		/// </summary>
+		public bool GetBrickletsEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BRICKLETS_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  The SPITF protocol can be used with a dynamic baudrate. If the dynamic baudrate is
+		///  enabled, the Brick will try to adapt the baudrate for the communication
+		///  between Bricks and Bricklets according to the amount of data that is transferred.
+		///  
+		///  The baudrate will be increased exponentially if lots of data is sent/received and
+		///  decreased linearly if little data is sent/received.
+		///  
+		///  This lowers the baudrate in applications where little data is transferred (e.g.
+		///  a weather station) and increases the robustness. If there is lots of data to transfer
+		///  (e.g. Thermal Imaging Bricklet) it automatically increases the baudrate as needed.
+		///  
+		///  In cases where some data has to transferred as fast as possible every few seconds
+		///  (e.g. RS485 Bricklet with a high baudrate but small payload) you may want to turn
+		///  the dynamic baudrate off to get the highest possible performance.
+		///  
+		///  The maximum value of the baudrate can be set per port with the function
+		///  <see cref="Tinkerforge.BrickMaster.SetSPITFPBaudrate"/>. If the dynamic baudrate is disabled, the baudrate
+		///  as set by <see cref="Tinkerforge.BrickMaster.SetSPITFPBaudrate"/> will be used statically.
+		///  
+		///  .. versionadded:: 2.4.6$nbsp;(Firmware)
+		/// </summary>
+		public void SetSPITFPBaudrateConfig(bool enableDynamicBaudrate, long minimumDynamicBaudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SPITFP_BAUDRATE_CONFIG);
+			LEConverter.To((bool)enableDynamicBaudrate, 8, request);
+			LEConverter.To((int)minimumDynamicBaudrate, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the baudrate config, see <see cref="Tinkerforge.BrickMaster.SetSPITFPBaudrateConfig"/>.
+		///  
+		///  .. versionadded:: 2.4.6$nbsp;(Firmware)
+		/// </summary>
+		public void GetSPITFPBaudrateConfig(out bool enableDynamicBaudrate, out long minimumDynamicBaudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_BAUDRATE_CONFIG);
+
+			byte[] response = SendRequest(request, 13);
+
+			enableDynamicBaudrate = LEConverter.BoolFrom(8, response);
+			minimumDynamicBaudrate = LEConverter.UIntFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the timeout count for the different communication methods.
+		///  
+		///  The methods 0-2 are available for all Bricks, 3-7 only for Master Bricks.
+		///  
+		///  This function is mostly used for debugging during development, in normal operation
+		///  the counters should nearly always stay at 0.
+		///  
+		///  .. versionadded:: 2.4.3$nbsp;(Firmware)
+		/// </summary>
+		public long GetSendTimeoutCount(byte communicationMethod)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SEND_TIMEOUT_COUNT);
+			LEConverter.To((byte)communicationMethod, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the baudrate for a specific Bricklet port.
+		///  
+		///  If you want to increase the throughput of Bricklets you can increase
+		///  the baudrate. If you get a high error count because of high
+		///  interference (see <see cref="Tinkerforge.BrickMaster.GetSPITFPErrorCount"/>) you can decrease the
+		///  baudrate.
+		///  
+		///  If the dynamic baudrate feature is enabled, the baudrate set by this
+		///  function corresponds to the maximum baudrate (see <see cref="Tinkerforge.BrickMaster.SetSPITFPBaudrateConfig"/>).
+		///  
+		///  Regulatory testing is done with the default baudrate. If CE compatibility
+		///  or similar is necessary in your applications we recommend to not change
+		///  the baudrate.
+		///  
+		///  .. versionadded:: 2.4.3$nbsp;(Firmware)
+		/// </summary>
+		public void SetSPITFPBaudrate(char brickletPort, long baudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SPITFP_BAUDRATE);
+			LEConverter.To((char)brickletPort, 8, request);
+			LEConverter.To((int)baudrate, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the baudrate for a given Bricklet port, see <see cref="Tinkerforge.BrickMaster.SetSPITFPBaudrate"/>.
+		///  
+		///  .. versionadded:: 2.4.3$nbsp;(Firmware)
+		/// </summary>
+		public long GetSPITFPBaudrate(char brickletPort)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SPITFP_BAUDRATE);
+			LEConverter.To((char)brickletPort, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Brick side. All
+		///  Bricklets have a similar function that returns the errors on the Bricklet side.
+		///  
+		///  .. versionadded:: 2.4.3$nbsp;(Firmware)
+		/// </summary>
+		public void GetSPITFPErrorCount(char brickletPort, out long errorCountACKChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SPITFP_ERROR_COUNT);
+			LEConverter.To((char)brickletPort, 8, request);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountACKChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Enables the status LED.
+		///  
+		///  The status LED is the blue LED next to the USB connector. If enabled is is
+		///  on and it flickers if data is transfered. If disabled it is always off.
+		///  
+		///  The default state is enabled.
+		///  
+		///  .. versionadded:: 2.3.2$nbsp;(Firmware)
+		/// </summary>
+		public void EnableStatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the status LED.
+		///  
+		///  The status LED is the blue LED next to the USB connector. If enabled is is
+		///  on and it flickers if data is transfered. If disabled it is always off.
+		///  
+		///  The default state is enabled.
+		///  
+		///  .. versionadded:: 2.3.2$nbsp;(Firmware)
+		/// </summary>
+		public void DisableStatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the status LED is enabled, *false* otherwise.
+		///  
+		///  .. versionadded:: 2.3.2$nbsp;(Firmware)
+		/// </summary>
+		public bool IsStatusLEDEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_STATUS_LED_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the firmware and protocol version and the name of the Bricklet for a
+		///  given port.
+		///  
+		///  This functions sole purpose is to allow automatic flashing of v1.x.y Bricklet
+		///  plugins.
+		/// </summary>
+		public void GetProtocol1BrickletName(char port, out byte protocolVersion, out byte[] firmwareVersion, out string name)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_PROTOCOL1_BRICKLET_NAME);
+			LEConverter.To((char)port, 8, request);
+
+			byte[] response = SendRequest(request, 52);
+
+			protocolVersion = LEConverter.ByteFrom(8, response);
+			firmwareVersion = LEConverter.ByteArrayFrom(9, response, 3);
+			name = LEConverter.StringFrom(12, response, 40);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has an
+		///  accuracy of ±15%. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Brick. Calling this function
+		///  on a Brick inside of a stack will reset the whole stack.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 32 bytes of firmware to the bricklet attached at the given port.
+		///  The bytes are written to the position offset * 32.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void WriteBrickletPlugin(char port, byte offset, byte[] chunk)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(42, FUNCTION_WRITE_BRICKLET_PLUGIN);
+			LEConverter.To((char)port, 8, request);
+			LEConverter.To((byte)offset, 9, request);
+			LEConverter.To((byte[])chunk, 10, 32, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Reads 32 bytes of firmware from the bricklet attached at the given port.
+		///  The bytes are read starting at the position offset * 32.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte[] ReadBrickletPlugin(char port, byte offset)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_READ_BRICKLET_PLUGIN);
+			LEConverter.To((char)port, 8, request);
+			LEConverter.To((byte)offset, 9, request);
+
+			byte[] response = SendRequest(request, 40);
+
+			return LEConverter.ByteArrayFrom(8, response, 32);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Brick is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position is the position in the stack from '0' (bottom) to '8' (top).
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnStackCurrentCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int current = LEConverter.UShortFrom(8, response);
+			var handler = StackCurrentCallback;
+
+			if (handler != null)
+			{
+				handler(this, current);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnStackVoltageCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.UShortFrom(8, response);
+			var handler = StackVoltageCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnUSBVoltageCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.UShortFrom(8, response);
+			var handler = USBVoltageCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnStackCurrentReachedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int current = LEConverter.UShortFrom(8, response);
+			var handler = StackCurrentReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, current);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnStackVoltageReachedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.UShortFrom(8, response);
+			var handler = StackVoltageReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnUSBVoltageReachedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.UShortFrom(8, response);
+			var handler = USBVoltageReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage);
+			}
+		}
+	}
+}
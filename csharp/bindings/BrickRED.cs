@@ -0,0 +1,2523 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Executes user programs and controls other Bricks/Bricklets standalone
+	/// </summary>
+	public class BrickRED : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 17;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "RED Brick";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CREATE_SESSION = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_EXPIRE_SESSION = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_EXPIRE_SESSION_UNCHECKED = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_KEEP_SESSION_ALIVE = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RELEASE_OBJECT = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RELEASE_OBJECT_UNCHECKED = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ALLOCATE_STRING = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_TRUNCATE_STRING = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STRING_LENGTH = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STRING_CHUNK = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STRING_CHUNK = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ALLOCATE_LIST = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_LIST_LENGTH = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_LIST_ITEM = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_APPEND_TO_LIST = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_REMOVE_FROM_LIST = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_OPEN_FILE = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CREATE_PIPE = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FILE_INFO = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_FILE = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_FILE_ASYNC = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ABORT_ASYNC_FILE_READ = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FILE = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FILE_UNCHECKED = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FILE_ASYNC = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FILE_POSITION = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FILE_POSITION = 27;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FILE_EVENTS = 28;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FILE_EVENTS = 29;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_OPEN_DIRECTORY = 33;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DIRECTORY_NAME = 34;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_NEXT_DIRECTORY_ENTRY = 35;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_REWIND_DIRECTORY = 36;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CREATE_DIRECTORY = 37;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROCESSES = 38;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SPAWN_PROCESS = 39;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_KILL_PROCESS = 40;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROCESS_COMMAND = 41;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROCESS_IDENTITY = 42;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROCESS_STDIO = 43;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROCESS_STATE = 44;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROGRAMS = 46;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DEFINE_PROGRAM = 47;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_PURGE_PROGRAM = 48;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROGRAM_IDENTIFIER = 49;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROGRAM_ROOT_DIRECTORY = 50;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_PROGRAM_COMMAND = 51;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROGRAM_COMMAND = 52;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_PROGRAM_STDIO_REDIRECTION = 53;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROGRAM_STDIO_REDIRECTION = 54;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_PROGRAM_SCHEDULE = 55;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROGRAM_SCHEDULE = 56;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROGRAM_SCHEDULER_STATE = 57;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CONTINUE_PROGRAM_SCHEDULE = 58;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_START_PROGRAM = 59;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_LAST_SPAWNED_PROGRAM_PROCESS = 60;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CUSTOM_PROGRAM_OPTION_NAMES = 61;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CUSTOM_PROGRAM_OPTION_VALUE = 62;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CUSTOM_PROGRAM_OPTION_VALUE = 63;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_REMOVE_CUSTOM_PROGRAM_OPTION = 64;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_ASYNC_FILE_READ = 30;
+
+		private const int CALLBACK_ASYNC_FILE_WRITE = 31;
+
+		private const int CALLBACK_FILE_EVENTS_OCCURRED = 32;
+
+		private const int CALLBACK_PROCESS_STATE_CHANGED = 45;
+
+		private const int CALLBACK_PROGRAM_SCHEDULER_STATE_CHANGED = 65;
+
+		private const int CALLBACK_PROGRAM_PROCESS_SPAWNED = 66;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_SUCCESS = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_UNKNOWN_ERROR = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_INVALID_OPERATION = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_OPERATION_ABORTED = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_INTERNAL_ERROR = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_UNKNOWN_SESSION_ID = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_NO_FREE_SESSION_ID = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_UNKNOWN_OBJECT_ID = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_NO_FREE_OBJECT_ID = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_OBJECT_IS_LOCKED = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_NO_MORE_DATA = 10;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_WRONG_LIST_ITEM_TYPE = 11;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_PROGRAM_IS_PURGED = 12;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_INVALID_PARAMETER = 128;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_NO_FREE_MEMORY = 129;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_NO_FREE_SPACE = 130;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_ACCESS_DENIED = 121;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_ALREADY_EXISTS = 132;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_DOES_NOT_EXIST = 133;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_INTERRUPTED = 134;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_IS_DIRECTORY = 135;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_NOT_A_DIRECTORY = 136;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_WOULD_BLOCK = 137;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_OVERFLOW = 138;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_BAD_FILE_DESCRIPTOR = 139;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_OUT_OF_RANGE = 140;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_NAME_TOO_LONG = 141;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_INVALID_SEEK = 142;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_NOT_SUPPORTED = 143;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_CODE_TOO_MANY_OPEN_FILES = 144;
+
+		/// <summary>
+		/// </summary>
+		public const byte OBJECT_TYPE_STRING = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte OBJECT_TYPE_LIST = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte OBJECT_TYPE_FILE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte OBJECT_TYPE_DIRECTORY = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte OBJECT_TYPE_PROCESS = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte OBJECT_TYPE_PROGRAM = 5;
+
+		/// <summary>
+		/// </summary>
+		public const long FILE_FLAG_READ_ONLY = 1;
+
+		/// <summary>
+		/// </summary>
+		public const long FILE_FLAG_WRITE_ONLY = 2;
+
+		/// <summary>
+		/// </summary>
+		public const long FILE_FLAG_READ_WRITE = 4;
+
+		/// <summary>
+		/// </summary>
+		public const long FILE_FLAG_APPEND = 8;
+
+		/// <summary>
+		/// </summary>
+		public const long FILE_FLAG_CREATE = 16;
+
+		/// <summary>
+		/// </summary>
+		public const long FILE_FLAG_EXCLUSIVE = 32;
+
+		/// <summary>
+		/// </summary>
+		public const long FILE_FLAG_NON_BLOCKING = 64;
+
+		/// <summary>
+		/// </summary>
+		public const long FILE_FLAG_TRUNCATE = 128;
+
+		/// <summary>
+		/// </summary>
+		public const long FILE_FLAG_TEMPORARY = 256;
+
+		/// <summary>
+		/// </summary>
+		public const long FILE_FLAG_REPLACE = 512;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_USER_ALL = 448;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_USER_READ = 256;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_USER_WRITE = 128;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_USER_EXECUTE = 64;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_GROUP_ALL = 56;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_GROUP_READ = 32;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_GROUP_WRITE = 16;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_GROUP_EXECUTE = 8;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_OTHERS_ALL = 7;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_OTHERS_READ = 4;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_OTHERS_WRITE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_PERMISSION_OTHERS_EXECUTE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const long PIPE_FLAG_NON_BLOCKING_READ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const long PIPE_FLAG_NON_BLOCKING_WRITE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_TYPE_UNKNOWN = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_TYPE_REGULAR = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_TYPE_DIRECTORY = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_TYPE_CHARACTER = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_TYPE_BLOCK = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_TYPE_FIFO = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_TYPE_SYMLINK = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_TYPE_SOCKET = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_TYPE_PIPE = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_ORIGIN_BEGINNING = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_ORIGIN_CURRENT = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILE_ORIGIN_END = 2;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_EVENT_READABLE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const int FILE_EVENT_WRITABLE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte DIRECTORY_ENTRY_TYPE_UNKNOWN = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DIRECTORY_ENTRY_TYPE_REGULAR = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte DIRECTORY_ENTRY_TYPE_DIRECTORY = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte DIRECTORY_ENTRY_TYPE_CHARACTER = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte DIRECTORY_ENTRY_TYPE_BLOCK = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte DIRECTORY_ENTRY_TYPE_FIFO = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte DIRECTORY_ENTRY_TYPE_SYMLINK = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte DIRECTORY_ENTRY_TYPE_SOCKET = 7;
+
+		/// <summary>
+		/// </summary>
+		public const long DIRECTORY_FLAG_RECURSIVE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const long DIRECTORY_FLAG_EXCLUSIVE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_SIGNAL_INTERRUPT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_SIGNAL_QUIT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_SIGNAL_ABORT = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_SIGNAL_KILL = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_SIGNAL_USER1 = 10;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_SIGNAL_USER2 = 12;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_SIGNAL_TERMINATE = 15;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_SIGNAL_CONTINUE = 18;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_SIGNAL_STOP = 19;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_STATE_UNKNOWN = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_STATE_RUNNING = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_STATE_ERROR = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_STATE_EXITED = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_STATE_KILLED = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROCESS_STATE_STOPPED = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_STDIO_REDIRECTION_DEV_NULL = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_STDIO_REDIRECTION_PIPE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_STDIO_REDIRECTION_FILE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_STDIO_REDIRECTION_INDIVIDUAL_LOG = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_STDIO_REDIRECTION_CONTINUOUS_LOG = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_STDIO_REDIRECTION_STDOUT = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_START_MODE_NEVER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_START_MODE_ALWAYS = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_START_MODE_INTERVAL = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_START_MODE_CRON = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_SCHEDULER_STATE_STOPPED = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte PROGRAM_SCHEDULER_STATE_RUNNING = 1;
+
+
+		/// <summary>
+		///  This callback reports the result of a call to the <see cref="Tinkerforge.BrickRED.ReadFileAsync"/>
+		///  function.
+		/// </summary>
+		public event AsyncFileReadEventHandler AsyncFileReadCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AsyncFileReadEventHandler(BrickRED sender, int fileId, byte errorCode, byte[] buffer, byte lengthRead);
+
+		/// <summary>
+		/// </summary>
+		public event AsyncFileReadEventHandler AsyncFileRead // for backward compatibility
+		{
+			add { AsyncFileReadCallback += value; }
+			remove { AsyncFileReadCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback reports the result of a call to the <see cref="Tinkerforge.BrickRED.WriteFileAsync"/>
+		///  function.
+		/// </summary>
+		public event AsyncFileWriteEventHandler AsyncFileWriteCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AsyncFileWriteEventHandler(BrickRED sender, int fileId, byte errorCode, byte lengthWritten);
+
+		/// <summary>
+		/// </summary>
+		public event AsyncFileWriteEventHandler AsyncFileWrite // for backward compatibility
+		{
+			add { AsyncFileWriteCallback += value; }
+			remove { AsyncFileWriteCallback -= value; }
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public event FileEventsOccurredEventHandler FileEventsOccurredCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FileEventsOccurredEventHandler(BrickRED sender, int fileId, int events);
+
+		/// <summary>
+		/// </summary>
+		public event FileEventsOccurredEventHandler FileEventsOccurred // for backward compatibility
+		{
+			add { FileEventsOccurredCallback += value; }
+			remove { FileEventsOccurredCallback -= value; }
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public event ProcessStateChangedEventHandler ProcessStateChangedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ProcessStateChangedEventHandler(BrickRED sender, int processId, byte state, long timestamp, byte exitCode);
+
+		/// <summary>
+		/// </summary>
+		public event ProcessStateChangedEventHandler ProcessStateChanged // for backward compatibility
+		{
+			add { ProcessStateChangedCallback += value; }
+			remove { ProcessStateChangedCallback -= value; }
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public event ProgramSchedulerStateChangedEventHandler ProgramSchedulerStateChangedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ProgramSchedulerStateChangedEventHandler(BrickRED sender, int programId);
+
+		/// <summary>
+		/// </summary>
+		public event ProgramSchedulerStateChangedEventHandler ProgramSchedulerStateChanged // for backward compatibility
+		{
+			add { ProgramSchedulerStateChangedCallback += value; }
+			remove { ProgramSchedulerStateChangedCallback -= value; }
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public event ProgramProcessSpawnedEventHandler ProgramProcessSpawnedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ProgramProcessSpawnedEventHandler(BrickRED sender, int programId);
+
+		/// <summary>
+		/// </summary>
+		public event ProgramProcessSpawnedEventHandler ProgramProcessSpawned // for backward compatibility
+		{
+			add { ProgramProcessSpawnedCallback += value; }
+			remove { ProgramProcessSpawnedCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickRED(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_ASYNC_FILE_READ] = new CallbackWrapper(OnAsyncFileReadCallback);
+			callbackWrappers[CALLBACK_ASYNC_FILE_WRITE] = new CallbackWrapper(OnAsyncFileWriteCallback);
+			callbackWrappers[CALLBACK_FILE_EVENTS_OCCURRED] = new CallbackWrapper(OnFileEventsOccurredCallback);
+			callbackWrappers[CALLBACK_PROCESS_STATE_CHANGED] = new CallbackWrapper(OnProcessStateChangedCallback);
+			callbackWrappers[CALLBACK_PROGRAM_SCHEDULER_STATE_CHANGED] = new CallbackWrapper(OnProgramSchedulerStateChangedCallback);
+			callbackWrappers[CALLBACK_PROGRAM_PROCESS_SPAWNED] = new CallbackWrapper(OnProgramProcessSpawnedCallback);
+
+
+			responseExpected[FUNCTION_CREATE_SESSION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_EXPIRE_SESSION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_EXPIRE_SESSION_UNCHECKED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_KEEP_SESSION_ALIVE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RELEASE_OBJECT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RELEASE_OBJECT_UNCHECKED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_ALLOCATE_STRING] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_TRUNCATE_STRING] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_STRING_LENGTH] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STRING_CHUNK] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_STRING_CHUNK] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ALLOCATE_LIST] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_LIST_LENGTH] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_LIST_ITEM] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_APPEND_TO_LIST] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_REMOVE_FROM_LIST] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_OPEN_FILE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_CREATE_PIPE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_FILE_INFO] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READ_FILE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READ_FILE_ASYNC] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_ABORT_ASYNC_FILE_READ] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_WRITE_FILE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_WRITE_FILE_UNCHECKED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FILE_ASYNC] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_FILE_POSITION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_FILE_POSITION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_FILE_EVENTS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_FILE_EVENTS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_OPEN_DIRECTORY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_DIRECTORY_NAME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_NEXT_DIRECTORY_ENTRY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_REWIND_DIRECTORY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_CREATE_DIRECTORY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROCESSES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SPAWN_PROCESS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_KILL_PROCESS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROCESS_COMMAND] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROCESS_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROCESS_STDIO] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROCESS_STATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROGRAMS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_DEFINE_PROGRAM] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_PURGE_PROGRAM] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROGRAM_IDENTIFIER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROGRAM_ROOT_DIRECTORY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_PROGRAM_COMMAND] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROGRAM_COMMAND] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_PROGRAM_STDIO_REDIRECTION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROGRAM_STDIO_REDIRECTION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_PROGRAM_SCHEDULE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROGRAM_SCHEDULE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROGRAM_SCHEDULER_STATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_CONTINUE_PROGRAM_SCHEDULE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_START_PROGRAM] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_LAST_SPAWNED_PROGRAM_PROCESS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CUSTOM_PROGRAM_OPTION_NAMES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CUSTOM_PROGRAM_OPTION_VALUE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CUSTOM_PROGRAM_OPTION_VALUE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_REMOVE_CUSTOM_PROGRAM_OPTION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void CreateSession(long lifetime, out byte errorCode, out int sessionId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_CREATE_SESSION);
+			LEConverter.To((int)lifetime, 8, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			sessionId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ExpireSession(int sessionId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_EXPIRE_SESSION);
+			LEConverter.To((short)sessionId, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ExpireSessionUnchecked(int sessionId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_EXPIRE_SESSION_UNCHECKED);
+			LEConverter.To((short)sessionId, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte KeepSessionAlive(int sessionId, long lifetime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_KEEP_SESSION_ALIVE);
+			LEConverter.To((short)sessionId, 8, request);
+			LEConverter.To((int)lifetime, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Decreases the reference count of an object by one and returns the resulting
+		///  error code. If the reference count reaches zero the object gets destroyed.
+		/// </summary>
+		public byte ReleaseObject(int objectId, int sessionId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_RELEASE_OBJECT);
+			LEConverter.To((short)objectId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ReleaseObjectUnchecked(int objectId, int sessionId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_RELEASE_OBJECT_UNCHECKED);
+			LEConverter.To((short)objectId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Allocates a new string object, reserves ``length_to_reserve`` bytes memory
+		///  for it and sets up to the first 60 bytes. Set ``length_to_reserve`` to the
+		///  length of the string that should be stored in the string object.
+		///  
+		///  Returns the object ID of the new string object and the resulting error code.
+		/// </summary>
+		public void AllocateString(long lengthToReserve, string buffer, int sessionId, out byte errorCode, out int stringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_ALLOCATE_STRING);
+			LEConverter.To((int)lengthToReserve, 8, request);
+			LEConverter.To((string)buffer, 12, 58, request);
+			LEConverter.To((short)sessionId, 70, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			stringId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  Truncates a string object to ``length`` bytes and returns the resulting
+		///  error code.
+		/// </summary>
+		public byte TruncateString(int stringId, long length)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_TRUNCATE_STRING);
+			LEConverter.To((short)stringId, 8, request);
+			LEConverter.To((int)length, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the length of a string object and the resulting error code.
+		/// </summary>
+		public void GetStringLength(int stringId, out byte errorCode, out long length)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_GET_STRING_LENGTH);
+			LEConverter.To((short)stringId, 8, request);
+
+			byte[] response = SendRequest(request, 13);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			length = LEConverter.UIntFrom(9, response);
+		}
+
+		/// <summary>
+		///  Sets a chunk of up to 58 bytes in a string object beginning at ``offset``.
+		///  
+		///  Returns the resulting error code.
+		/// </summary>
+		public byte SetStringChunk(int stringId, long offset, string buffer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_STRING_CHUNK);
+			LEConverter.To((short)stringId, 8, request);
+			LEConverter.To((int)offset, 10, request);
+			LEConverter.To((string)buffer, 14, 58, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns a chunk up to 63 bytes from a string object beginning at ``offset`` and
+		///  returns the resulting error code.
+		/// </summary>
+		public void GetStringChunk(int stringId, long offset, out byte errorCode, out string buffer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_GET_STRING_CHUNK);
+			LEConverter.To((short)stringId, 8, request);
+			LEConverter.To((int)offset, 10, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			buffer = LEConverter.StringFrom(9, response, 63);
+		}
+
+		/// <summary>
+		///  Allocates a new list object and reserves memory for ``length_to_reserve``
+		///  items. Set ``length_to_reserve`` to the number of items that should be stored
+		///  in the list object.
+		///  
+		///  Returns the object ID of the new list object and the resulting error code.
+		///  
+		///  When a list object gets destroyed then the reference count of each object in
+		///  the list object is decreased by one.
+		/// </summary>
+		public void AllocateList(int lengthToReserve, int sessionId, out byte errorCode, out int listId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_ALLOCATE_LIST);
+			LEConverter.To((short)lengthToReserve, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			listId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the length of a list object in items and the resulting error code.
+		/// </summary>
+		public void GetListLength(int listId, out byte errorCode, out int length)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_GET_LIST_LENGTH);
+			LEConverter.To((short)listId, 8, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			length = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the object ID and type of the object stored at ``index`` in a list
+		///  object and returns the resulting error code.
+		///  
+		///  Possible object types are:
+		///  
+		///  * String = 0
+		///  * List = 1
+		///  * File = 2
+		///  * Directory = 3
+		///  * Process = 4
+		///  * Program = 5
+		/// </summary>
+		public void GetListItem(int listId, int index, int sessionId, out byte errorCode, out int itemObjectId, out byte type)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_GET_LIST_ITEM);
+			LEConverter.To((short)listId, 8, request);
+			LEConverter.To((short)index, 10, request);
+			LEConverter.To((short)sessionId, 12, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			itemObjectId = LEConverter.UShortFrom(9, response);
+			type = LEConverter.ByteFrom(11, response);
+		}
+
+		/// <summary>
+		///  Appends an object to a list object and increases the reference count of the
+		///  appended object by one.
+		///  
+		///  Returns the resulting error code.
+		/// </summary>
+		public byte AppendToList(int listId, int itemObjectId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_APPEND_TO_LIST);
+			LEConverter.To((short)listId, 8, request);
+			LEConverter.To((short)itemObjectId, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Removes the object stored at ``index`` from a list object and decreases the
+		///  reference count of the removed object by one.
+		///  
+		///  Returns the resulting error code.
+		/// </summary>
+		public byte RemoveFromList(int listId, int index)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_REMOVE_FROM_LIST);
+			LEConverter.To((short)listId, 8, request);
+			LEConverter.To((short)index, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Opens an existing file or creates a new file and allocates a new file object
+		///  for it.
+		///  
+		///  FIXME: name has to be absolute
+		///  
+		///  The reference count of the name string object is increased by one. When the
+		///  file object gets destroyed then the reference count of the name string object is
+		///  decreased by one. Also the name string object is locked and cannot be modified
+		///  while the file object holds a reference to it.
+		///  
+		///  The ``flags`` parameter takes a ORed combination of the following possible file
+		///  flags (in hexadecimal notation):
+		///  
+		///  * ReadOnly = 0x0001 (O_RDONLY)
+		///  * WriteOnly = 0x0002 (O_WRONLY)
+		///  * ReadWrite = 0x0004 (O_RDWR)
+		///  * Append = 0x0008 (O_APPEND)
+		///  * Create = 0x0010 (O_CREAT)
+		///  * Exclusive = 0x0020 (O_EXCL)
+		///  * NonBlocking = 0x0040 (O_NONBLOCK)
+		///  * Truncate = 0x0080 (O_TRUNC)
+		///  * Temporary = 0x0100
+		///  * Replace = 0x0200
+		///  
+		///  FIXME: explain *Temporary* and *Replace* flag
+		///  
+		///  The ``permissions`` parameter takes a ORed combination of the following
+		///  possible file permissions (in octal notation) that match the common UNIX
+		///  permission bits:
+		///  
+		///  * UserRead = 00400
+		///  * UserWrite = 00200
+		///  * UserExecute = 00100
+		///  * GroupRead = 00040
+		///  * GroupWrite = 00020
+		///  * GroupExecute = 00010
+		///  * OthersRead = 00004
+		///  * OthersWrite = 00002
+		///  * OthersExecute = 00001
+		///  
+		///  Returns the object ID of the new file object and the resulting error code.
+		/// </summary>
+		public void OpenFile(int nameStringId, long flags, int permissions, long uid, long gid, int sessionId, out byte errorCode, out int fileId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(26, FUNCTION_OPEN_FILE);
+			LEConverter.To((short)nameStringId, 8, request);
+			LEConverter.To((int)flags, 10, request);
+			LEConverter.To((short)permissions, 14, request);
+			LEConverter.To((int)uid, 16, request);
+			LEConverter.To((int)gid, 20, request);
+			LEConverter.To((short)sessionId, 24, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			fileId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  Creates a new pipe and allocates a new file object for it.
+		///  
+		///  The ``flags`` parameter takes a ORed combination of the following possible
+		///  pipe flags (in hexadecimal notation):
+		///  
+		///  * NonBlockingRead = 0x0001
+		///  * NonBlockingWrite = 0x0002
+		///  
+		///  The length of the pipe buffer can be specified with the ``length`` parameter
+		///  in bytes. If length is set to zero, then the default pipe buffer length is used.
+		///  
+		///  Returns the object ID of the new file object and the resulting error code.
+		/// </summary>
+		public void CreatePipe(long flags, long length, int sessionId, out byte errorCode, out int fileId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(22, FUNCTION_CREATE_PIPE);
+			LEConverter.To((int)flags, 8, request);
+			LEConverter.To((long)length, 12, request);
+			LEConverter.To((short)sessionId, 20, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			fileId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns various information about a file and the resulting error code.
+		///  
+		///  Possible file types are:
+		///  
+		///  * Unknown = 0
+		///  * Regular = 1
+		///  * Directory = 2
+		///  * Character = 3
+		///  * Block = 4
+		///  * FIFO = 5
+		///  * Symlink = 6
+		///  * Socket = 7
+		///  * Pipe = 8
+		///  
+		///  If the file type is *Pipe* then the returned name string object is invalid,
+		///  because a pipe has no name. Otherwise the returned name string object was used
+		///  to open or create the file object, as passed to <see cref="Tinkerforge.BrickRED.OpenFile"/>.
+		///  
+		///  The returned flags were used to open or create the file object, as passed to
+		///  <see cref="Tinkerforge.BrickRED.OpenFile"/> or <see cref="Tinkerforge.BrickRED.CreatePipe"/>. See the respective function for a list
+		///  of possible file and pipe flags.
+		///  
+		///  FIXME: everything except flags and length is invalid if file type is *Pipe*
+		/// </summary>
+		public void GetFileInfo(int fileId, int sessionId, out byte errorCode, out byte type, out int nameStringId, out long flags, out int permissions, out long uid, out long gid, out long length, out long accessTimestamp, out long modificationTimestamp, out long statusChangeTimestamp)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_FILE_INFO);
+			LEConverter.To((short)fileId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 58);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			type = LEConverter.ByteFrom(9, response);
+			nameStringId = LEConverter.UShortFrom(10, response);
+			flags = LEConverter.UIntFrom(12, response);
+			permissions = LEConverter.UShortFrom(16, response);
+			uid = LEConverter.UIntFrom(18, response);
+			gid = LEConverter.UIntFrom(22, response);
+			length = LEConverter.ULongFrom(26, response);
+			accessTimestamp = LEConverter.ULongFrom(34, response);
+			modificationTimestamp = LEConverter.ULongFrom(42, response);
+			statusChangeTimestamp = LEConverter.ULongFrom(50, response);
+		}
+
+		/// <summary>
+		///  Reads up to 62 bytes from a file object.
+		///  
+		///  Returns the bytes read, the actual number of bytes read and the resulting
+		///  error code.
+		///  
+		///  If there is not data to be read, either because the file position reached
+		///  end-of-file or because there is not data in the pipe, then zero bytes are
+		///  returned.
+		///  
+		///  If the file object was created by <see cref="Tinkerforge.BrickRED.OpenFile"/> without the *NonBlocking*
+		///  flag or by <see cref="Tinkerforge.BrickRED.CreatePipe"/> without the *NonBlockingRead* flag then the
+		///  error code *NotSupported* is returned.
+		/// </summary>
+		public void ReadFile(int fileId, byte lengthToRead, out byte errorCode, out byte[] buffer, out byte lengthRead)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_READ_FILE);
+			LEConverter.To((short)fileId, 8, request);
+			LEConverter.To((byte)lengthToRead, 10, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			buffer = LEConverter.ByteArrayFrom(9, response, 62);
+			lengthRead = LEConverter.ByteFrom(71, response);
+		}
+
+		/// <summary>
+		///  Reads up to 2\ :sup:`63`\  - 1 bytes from a file object asynchronously.
+		///  
+		///  Reports the bytes read (in 60 byte chunks), the actual number of bytes read and
+		///  the resulting error code via the <see cref="Tinkerforge.BrickRED.AsyncFileReadCallback"/> callback.
+		///  
+		///  If there is not data to be read, either because the file position reached
+		///  end-of-file or because there is not data in the pipe, then zero bytes are
+		///  reported.
+		///  
+		///  If the file object was created by <see cref="Tinkerforge.BrickRED.OpenFile"/> without the *NonBlocking*
+		///  flag or by <see cref="Tinkerforge.BrickRED.CreatePipe"/> without the *NonBlockingRead* flag then the error
+		///  code *NotSupported* is reported via the <see cref="Tinkerforge.BrickRED.AsyncFileReadCallback"/> callback.
+		/// </summary>
+		public void ReadFileAsync(int fileId, long lengthToRead)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(18, FUNCTION_READ_FILE_ASYNC);
+			LEConverter.To((short)fileId, 8, request);
+			LEConverter.To((long)lengthToRead, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Aborts a <see cref="Tinkerforge.BrickRED.ReadFileAsync"/> operation in progress.
+		///  
+		///  Returns the resulting error code.
+		///  
+		///  On success the <see cref="Tinkerforge.BrickRED.AsyncFileReadCallback"/> callback will report *OperationAborted*.
+		/// </summary>
+		public byte AbortAsyncFileRead(int fileId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_ABORT_ASYNC_FILE_READ);
+			LEConverter.To((short)fileId, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Writes up to 61 bytes to a file object.
+		///  
+		///  Returns the actual number of bytes written and the resulting error code.
+		///  
+		///  If the file object was created by <see cref="Tinkerforge.BrickRED.OpenFile"/> without the *NonBlocking*
+		///  flag or by <see cref="Tinkerforge.BrickRED.CreatePipe"/> without the *NonBlockingWrite* flag then the
+		///  error code *NotSupported* is returned.
+		/// </summary>
+		public void WriteFile(int fileId, byte[] buffer, byte lengthToWrite, out byte errorCode, out byte lengthWritten)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FILE);
+			LEConverter.To((short)fileId, 8, request);
+			LEConverter.To((byte[])buffer, 10, 61, request);
+			LEConverter.To((byte)lengthToWrite, 71, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			lengthWritten = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  Writes up to 61 bytes to a file object.
+		///  
+		///  Does neither report the actual number of bytes written nor the resulting error
+		///  code.
+		///  
+		///  If the file object was created by <see cref="Tinkerforge.BrickRED.OpenFile"/> without the *NonBlocking*
+		///  flag or by <see cref="Tinkerforge.BrickRED.CreatePipe"/> without the *NonBlockingWrite* flag then the
+		///  write operation will fail silently.
+		/// </summary>
+		public void WriteFileUnchecked(int fileId, byte[] buffer, byte lengthToWrite)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FILE_UNCHECKED);
+			LEConverter.To((short)fileId, 8, request);
+			LEConverter.To((byte[])buffer, 10, 61, request);
+			LEConverter.To((byte)lengthToWrite, 71, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes up to 61 bytes to a file object.
+		///  
+		///  Reports the actual number of bytes written and the resulting error code via the
+		///  <see cref="Tinkerforge.BrickRED.AsyncFileWriteCallback"/> callback.
+		///  
+		///  If the file object was created by <see cref="Tinkerforge.BrickRED.OpenFile"/> without the *NonBlocking*
+		///  flag or by <see cref="Tinkerforge.BrickRED.CreatePipe"/> without the *NonBlockingWrite* flag then the
+		///  error code *NotSupported* is reported via the <see cref="Tinkerforge.BrickRED.AsyncFileWriteCallback"/> callback.
+		/// </summary>
+		public void WriteFileAsync(int fileId, byte[] buffer, byte lengthToWrite)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FILE_ASYNC);
+			LEConverter.To((short)fileId, 8, request);
+			LEConverter.To((byte[])buffer, 10, 61, request);
+			LEConverter.To((byte)lengthToWrite, 71, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Set the current seek position of a file object relative to ``origin``.
+		///  
+		///  Possible file origins are:
+		///  
+		///  * Beginning = 0
+		///  * Current = 1
+		///  * End = 2
+		///  
+		///  Returns the resulting absolute seek position and error code.
+		///  
+		///  If the file object was created by <see cref="Tinkerforge.BrickRED.CreatePipe"/> then it has no seek
+		///  position and the error code *InvalidSeek* is returned.
+		/// </summary>
+		public void SetFilePosition(int fileId, long offset, byte origin, out byte errorCode, out long position)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(19, FUNCTION_SET_FILE_POSITION);
+			LEConverter.To((short)fileId, 8, request);
+			LEConverter.To((long)offset, 10, request);
+			LEConverter.To((byte)origin, 18, request);
+
+			byte[] response = SendRequest(request, 17);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			position = LEConverter.ULongFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the current seek position of a file object and returns the
+		///  resulting error code.
+		///  
+		///  If the file object was created by <see cref="Tinkerforge.BrickRED.CreatePipe"/> then it has no seek
+		///  position and the error code *InvalidSeek* is returned.
+		/// </summary>
+		public void GetFilePosition(int fileId, out byte errorCode, out long position)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_GET_FILE_POSITION);
+			LEConverter.To((short)fileId, 8, request);
+
+			byte[] response = SendRequest(request, 17);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			position = LEConverter.ULongFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte SetFileEvents(int fileId, int events)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_FILE_EVENTS);
+			LEConverter.To((short)fileId, 8, request);
+			LEConverter.To((short)events, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetFileEvents(int fileId, out byte errorCode, out int events)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_GET_FILE_EVENTS);
+			LEConverter.To((short)fileId, 8, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			events = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  Opens an existing directory and allocates a new directory object for it.
+		///  
+		///  FIXME: name has to be absolute
+		///  
+		///  The reference count of the name string object is increased by one. When the
+		///  directory object is destroyed then the reference count of the name string
+		///  object is decreased by one. Also the name string object is locked and cannot be
+		///  modified while the directory object holds a reference to it.
+		///  
+		///  Returns the object ID of the new directory object and the resulting error code.
+		/// </summary>
+		public void OpenDirectory(int nameStringId, int sessionId, out byte errorCode, out int directoryId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_OPEN_DIRECTORY);
+			LEConverter.To((short)nameStringId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			directoryId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the name of a directory object, as passed to <see cref="Tinkerforge.BrickRED.OpenDirectory"/>, and
+		///  the resulting error code.
+		/// </summary>
+		public void GetDirectoryName(int directoryId, int sessionId, out byte errorCode, out int nameStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_DIRECTORY_NAME);
+			LEConverter.To((short)directoryId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			nameStringId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the next entry in a directory object and the resulting error code.
+		///  
+		///  If there is not next entry then error code *NoMoreData* is returned. To rewind
+		///  a directory object call <see cref="Tinkerforge.BrickRED.RewindDirectory"/>.
+		///  
+		///  Possible directory entry types are:
+		///  
+		///  * Unknown = 0
+		///  * Regular = 1
+		///  * Directory = 2
+		///  * Character = 3
+		///  * Block = 4
+		///  * FIFO = 5
+		///  * Symlink = 6
+		///  * Socket = 7
+		/// </summary>
+		public void GetNextDirectoryEntry(int directoryId, int sessionId, out byte errorCode, out int nameStringId, out byte type)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_NEXT_DIRECTORY_ENTRY);
+			LEConverter.To((short)directoryId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			nameStringId = LEConverter.UShortFrom(9, response);
+			type = LEConverter.ByteFrom(11, response);
+		}
+
+		/// <summary>
+		///  Rewinds a directory object and returns the resulting error code.
+		/// </summary>
+		public byte RewindDirectory(int directoryId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_REWIND_DIRECTORY);
+			LEConverter.To((short)directoryId, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  FIXME: name has to be absolute
+		/// </summary>
+		public byte CreateDirectory(int nameStringId, long flags, int permissions, long uid, long gid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(24, FUNCTION_CREATE_DIRECTORY);
+			LEConverter.To((short)nameStringId, 8, request);
+			LEConverter.To((int)flags, 10, request);
+			LEConverter.To((short)permissions, 14, request);
+			LEConverter.To((int)uid, 16, request);
+			LEConverter.To((int)gid, 20, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetProcesses(int sessionId, out byte errorCode, out int processesListId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_GET_PROCESSES);
+			LEConverter.To((short)sessionId, 8, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			processesListId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SpawnProcess(int executableStringId, int argumentsListId, int environmentListId, int workingDirectoryStringId, long uid, long gid, int stdinFileId, int stdoutFileId, int stderrFileId, int sessionId, out byte errorCode, out int processId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(32, FUNCTION_SPAWN_PROCESS);
+			LEConverter.To((short)executableStringId, 8, request);
+			LEConverter.To((short)argumentsListId, 10, request);
+			LEConverter.To((short)environmentListId, 12, request);
+			LEConverter.To((short)workingDirectoryStringId, 14, request);
+			LEConverter.To((int)uid, 16, request);
+			LEConverter.To((int)gid, 20, request);
+			LEConverter.To((short)stdinFileId, 24, request);
+			LEConverter.To((short)stdoutFileId, 26, request);
+			LEConverter.To((short)stderrFileId, 28, request);
+			LEConverter.To((short)sessionId, 30, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			processId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  Sends a UNIX signal to a process object and returns the resulting error code.
+		///  
+		///  Possible UNIX signals are:
+		///  
+		///  * Interrupt = 2
+		///  * Quit = 3
+		///  * Abort = 6
+		///  * Kill = 9
+		///  * User1 = 10
+		///  * User2 = 12
+		///  * Terminate = 15
+		///  * Continue =  18
+		///  * Stop = 19
+		/// </summary>
+		public byte KillProcess(int processId, byte signal)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_KILL_PROCESS);
+			LEConverter.To((short)processId, 8, request);
+			LEConverter.To((byte)signal, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the executable, arguments, environment and working directory used to
+		///  spawn a process object, as passed to <see cref="Tinkerforge.BrickRED.SpawnProcess"/>, and the resulting
+		///  error code.
+		/// </summary>
+		public void GetProcessCommand(int processId, int sessionId, out byte errorCode, out int executableStringId, out int argumentsListId, out int environmentListId, out int workingDirectoryStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_PROCESS_COMMAND);
+			LEConverter.To((short)processId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 17);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			executableStringId = LEConverter.UShortFrom(9, response);
+			argumentsListId = LEConverter.UShortFrom(11, response);
+			environmentListId = LEConverter.UShortFrom(13, response);
+			workingDirectoryStringId = LEConverter.UShortFrom(15, response);
+		}
+
+		/// <summary>
+		///  Returns the process ID and the user and group ID used to spawn a process object,
+		///  as passed to <see cref="Tinkerforge.BrickRED.SpawnProcess"/>, and the resulting error code.
+		///  
+		///  The process ID is only valid if the state is *Running* or *Stopped*, see
+		///  <see cref="Tinkerforge.BrickRED.GetProcessState"/>.
+		/// </summary>
+		public void GetProcessIdentity(int processId, out byte errorCode, out long pid, out long uid, out long gid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_GET_PROCESS_IDENTITY);
+			LEConverter.To((short)processId, 8, request);
+
+			byte[] response = SendRequest(request, 21);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			pid = LEConverter.UIntFrom(9, response);
+			uid = LEConverter.UIntFrom(13, response);
+			gid = LEConverter.UIntFrom(17, response);
+		}
+
+		/// <summary>
+		///  Returns the stdin, stdout and stderr files used to spawn a process object, as
+		///  passed to <see cref="Tinkerforge.BrickRED.SpawnProcess"/>, and the resulting error code.
+		/// </summary>
+		public void GetProcessStdio(int processId, int sessionId, out byte errorCode, out int stdinFileId, out int stdoutFileId, out int stderrFileId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_PROCESS_STDIO);
+			LEConverter.To((short)processId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 15);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			stdinFileId = LEConverter.UShortFrom(9, response);
+			stdoutFileId = LEConverter.UShortFrom(11, response);
+			stderrFileId = LEConverter.UShortFrom(13, response);
+		}
+
+		/// <summary>
+		///  Returns the current state, timestamp and exit code of a process object, and
+		///  the resulting error code.
+		///  
+		///  Possible process states are:
+		///  
+		///  * Unknown = 0
+		///  * Running = 1
+		///  * Error = 2
+		///  * Exited = 3
+		///  * Killed = 4
+		///  * Stopped = 5
+		///  
+		///  The timestamp represents the UNIX time since when the process is in its current
+		///  state.
+		///  
+		///  The exit code is only valid if the state is *Error*, *Exited*, *Killed* or
+		///  *Stopped* and has different meanings depending on the state:
+		///  
+		///  * Error: error code for error occurred while spawning the process (see below)
+		///  * Exited: exit status of the process
+		///  * Killed: UNIX signal number used to kill the process
+		///  * Stopped: UNIX signal number used to stop the process
+		///  
+		///  Possible exit/error codes in *Error* state are:
+		///  
+		///  * InternalError = 125
+		///  * CannotExecute = 126
+		///  * DoesNotExist = 127
+		///  
+		///  The *CannotExecute* error can be caused by the executable being opened for
+		///  writing.
+		/// </summary>
+		public void GetProcessState(int processId, out byte errorCode, out byte state, out long timestamp, out byte exitCode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_GET_PROCESS_STATE);
+			LEConverter.To((short)processId, 8, request);
+
+			byte[] response = SendRequest(request, 19);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			state = LEConverter.ByteFrom(9, response);
+			timestamp = LEConverter.ULongFrom(10, response);
+			exitCode = LEConverter.ByteFrom(18, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetPrograms(int sessionId, out byte errorCode, out int programsListId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_GET_PROGRAMS);
+			LEConverter.To((short)sessionId, 8, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			programsListId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void DefineProgram(int identifierStringId, int sessionId, out byte errorCode, out int programId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_DEFINE_PROGRAM);
+			LEConverter.To((short)identifierStringId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			programId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte PurgeProgram(int programId, long cookie)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_PURGE_PROGRAM);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((int)cookie, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetProgramIdentifier(int programId, int sessionId, out byte errorCode, out int identifierStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_PROGRAM_IDENTIFIER);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			identifierStringId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  FIXME: root directory is absolute: &lt;home&gt;/programs/&lt;identifier&gt;
+		/// </summary>
+		public void GetProgramRootDirectory(int programId, int sessionId, out byte errorCode, out int rootDirectoryStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_PROGRAM_ROOT_DIRECTORY);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			rootDirectoryStringId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  FIXME: working directory is relative to &lt;home&gt;/programs/&lt;identifier&gt;/bin
+		/// </summary>
+		public byte SetProgramCommand(int programId, int executableStringId, int argumentsListId, int environmentListId, int workingDirectoryStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(18, FUNCTION_SET_PROGRAM_COMMAND);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)executableStringId, 10, request);
+			LEConverter.To((short)argumentsListId, 12, request);
+			LEConverter.To((short)environmentListId, 14, request);
+			LEConverter.To((short)workingDirectoryStringId, 16, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  FIXME: working directory is relative to &lt;home&gt;/programs/&lt;identifier&gt;/bin
+		/// </summary>
+		public void GetProgramCommand(int programId, int sessionId, out byte errorCode, out int executableStringId, out int argumentsListId, out int environmentListId, out int workingDirectoryStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_PROGRAM_COMMAND);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 17);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			executableStringId = LEConverter.UShortFrom(9, response);
+			argumentsListId = LEConverter.UShortFrom(11, response);
+			environmentListId = LEConverter.UShortFrom(13, response);
+			workingDirectoryStringId = LEConverter.UShortFrom(15, response);
+		}
+
+		/// <summary>
+		///  FIXME: stdio file names are relative to &lt;home&gt;/programs/&lt;identifier&gt;/bin
+		/// </summary>
+		public byte SetProgramStdioRedirection(int programId, byte stdinRedirection, int stdinFileNameStringId, byte stdoutRedirection, int stdoutFileNameStringId, byte stderrRedirection, int stderrFileNameStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(19, FUNCTION_SET_PROGRAM_STDIO_REDIRECTION);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((byte)stdinRedirection, 10, request);
+			LEConverter.To((short)stdinFileNameStringId, 11, request);
+			LEConverter.To((byte)stdoutRedirection, 13, request);
+			LEConverter.To((short)stdoutFileNameStringId, 14, request);
+			LEConverter.To((byte)stderrRedirection, 16, request);
+			LEConverter.To((short)stderrFileNameStringId, 17, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  FIXME: stdio file names are relative to &lt;home&gt;/programs/&lt;identifier&gt;/bin
+		/// </summary>
+		public void GetProgramStdioRedirection(int programId, int sessionId, out byte errorCode, out byte stdinRedirection, out int stdinFileNameStringId, out byte stdoutRedirection, out int stdoutFileNameStringId, out byte stderrRedirection, out int stderrFileNameStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_PROGRAM_STDIO_REDIRECTION);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 18);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			stdinRedirection = LEConverter.ByteFrom(9, response);
+			stdinFileNameStringId = LEConverter.UShortFrom(10, response);
+			stdoutRedirection = LEConverter.ByteFrom(12, response);
+			stdoutFileNameStringId = LEConverter.UShortFrom(13, response);
+			stderrRedirection = LEConverter.ByteFrom(15, response);
+			stderrFileNameStringId = LEConverter.UShortFrom(16, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte SetProgramSchedule(int programId, byte startMode, bool continueAfterError, long startInterval, int startFieldsStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(18, FUNCTION_SET_PROGRAM_SCHEDULE);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((byte)startMode, 10, request);
+			LEConverter.To((bool)continueAfterError, 11, request);
+			LEConverter.To((int)startInterval, 12, request);
+			LEConverter.To((short)startFieldsStringId, 16, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetProgramSchedule(int programId, int sessionId, out byte errorCode, out byte startMode, out bool continueAfterError, out long startInterval, out int startFieldsStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_PROGRAM_SCHEDULE);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 17);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			startMode = LEConverter.ByteFrom(9, response);
+			continueAfterError = LEConverter.BoolFrom(10, response);
+			startInterval = LEConverter.UIntFrom(11, response);
+			startFieldsStringId = LEConverter.UShortFrom(15, response);
+		}
+
+		/// <summary>
+		///  FIXME: message is currently valid in error-occurred state only
+		/// </summary>
+		public void GetProgramSchedulerState(int programId, int sessionId, out byte errorCode, out byte state, out long timestamp, out int messageStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_PROGRAM_SCHEDULER_STATE);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 20);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			state = LEConverter.ByteFrom(9, response);
+			timestamp = LEConverter.ULongFrom(10, response);
+			messageStringId = LEConverter.UShortFrom(18, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ContinueProgramSchedule(int programId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_CONTINUE_PROGRAM_SCHEDULE);
+			LEConverter.To((short)programId, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte StartProgram(int programId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_START_PROGRAM);
+			LEConverter.To((short)programId, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetLastSpawnedProgramProcess(int programId, int sessionId, out byte errorCode, out int processId, out long timestamp)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_LAST_SPAWNED_PROGRAM_PROCESS);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 19);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			processId = LEConverter.UShortFrom(9, response);
+			timestamp = LEConverter.ULongFrom(11, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetCustomProgramOptionNames(int programId, int sessionId, out byte errorCode, out int namesListId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_CUSTOM_PROGRAM_OPTION_NAMES);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)sessionId, 10, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			namesListId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte SetCustomProgramOptionValue(int programId, int nameStringId, int valueStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_SET_CUSTOM_PROGRAM_OPTION_VALUE);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)nameStringId, 10, request);
+			LEConverter.To((short)valueStringId, 12, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetCustomProgramOptionValue(int programId, int nameStringId, int sessionId, out byte errorCode, out int valueStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_GET_CUSTOM_PROGRAM_OPTION_VALUE);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)nameStringId, 10, request);
+			LEConverter.To((short)sessionId, 12, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			errorCode = LEConverter.ByteFrom(8, response);
+			valueStringId = LEConverter.UShortFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte RemoveCustomProgramOption(int programId, int nameStringId)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_REMOVE_CUSTOM_PROGRAM_OPTION);
+			LEConverter.To((short)programId, 8, request);
+			LEConverter.To((short)nameStringId, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Brick is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position is the position in the stack from '0' (bottom) to '8' (top).
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAsyncFileReadCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int fileId = LEConverter.UShortFrom(8, response);
+			byte errorCode = LEConverter.ByteFrom(10, response);
+			byte[] buffer = LEConverter.ByteArrayFrom(11, response, 60);
+			byte lengthRead = LEConverter.ByteFrom(71, response);
+			var handler = AsyncFileReadCallback;
+
+			if (handler != null)
+			{
+				handler(this, fileId, errorCode, buffer, lengthRead);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAsyncFileWriteCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int fileId = LEConverter.UShortFrom(8, response);
+			byte errorCode = LEConverter.ByteFrom(10, response);
+			byte lengthWritten = LEConverter.ByteFrom(11, response);
+			var handler = AsyncFileWriteCallback;
+
+			if (handler != null)
+			{
+				handler(this, fileId, errorCode, lengthWritten);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFileEventsOccurredCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int fileId = LEConverter.UShortFrom(8, response);
+			int events = LEConverter.UShortFrom(10, response);
+			var handler = FileEventsOccurredCallback;
+
+			if (handler != null)
+			{
+				handler(this, fileId, events);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnProcessStateChangedCallback(byte[] response)
+		{
+			if (response.Length != 20)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int processId = LEConverter.UShortFrom(8, response);
+			byte state = LEConverter.ByteFrom(10, response);
+			long timestamp = LEConverter.ULongFrom(11, response);
+			byte exitCode = LEConverter.ByteFrom(19, response);
+			var handler = ProcessStateChangedCallback;
+
+			if (handler != null)
+			{
+				handler(this, processId, state, timestamp, exitCode);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnProgramSchedulerStateChangedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int programId = LEConverter.UShortFrom(8, response);
+			var handler = ProgramSchedulerStateChangedCallback;
+
+			if (handler != null)
+			{
+				handler(this, programId);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnProgramProcessSpawnedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int programId = LEConverter.UShortFrom(8, response);
+			var handler = ProgramProcessSpawnedCallback;
+
+			if (handler != null)
+			{
+				handler(this, programId);
+			}
+		}
+	}
+}
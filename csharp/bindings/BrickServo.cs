@@ -0,0 +1,1475 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Drives up to 7 RC Servos with up to 3A
+	/// </summary>
+	public class BrickServo : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 14;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Servo Brick";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_ENABLED = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_POSITION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_POSITION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CURRENT_POSITION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VELOCITY = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VELOCITY = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CURRENT_VELOCITY = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ACCELERATION = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_OUTPUT_VOLTAGE = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_OUTPUT_VOLTAGE = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_PULSE_WIDTH = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PULSE_WIDTH = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DEGREE = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DEGREE = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_PERIOD = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PERIOD = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SERVO_CURRENT = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_OVERALL_CURRENT = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STACK_INPUT_VOLTAGE = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MINIMUM_VOLTAGE = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MINIMUM_VOLTAGE = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_POSITION_REACHED_CALLBACK = 29;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_POSITION_REACHED_CALLBACK = 30;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_POSITION_REACHED_CALLBACK_ENABLED = 31;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_VELOCITY_REACHED_CALLBACK = 32;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_VELOCITY_REACHED_CALLBACK = 33;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_VELOCITY_REACHED_CALLBACK_ENABLED = 34;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPITFP_BAUDRATE_CONFIG = 231;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_BAUDRATE_CONFIG = 232;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SEND_TIMEOUT_COUNT = 233;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPITFP_BAUDRATE = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_BAUDRATE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_STATUS_LED = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_STATUS_LED = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_STATUS_LED_ENABLED = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PROTOCOL1_BRICKLET_NAME = 241;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_BRICKLET_PLUGIN = 246;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_BRICKLET_PLUGIN = 247;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_UNDER_VOLTAGE = 26;
+
+		private const int CALLBACK_POSITION_REACHED = 27;
+
+		private const int CALLBACK_VELOCITY_REACHED = 28;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_USB = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_SPI_STACK = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_CHIBI = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_RS485 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_WIFI = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_ETHERNET = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_METHOD_WIFI_V2 = 7;
+
+
+		/// <summary>
+		///  This callback is triggered when the input voltage drops below the value set by
+		///  <see cref="Tinkerforge.BrickServo.SetMinimumVoltage"/>. The parameter is the current voltage.
+		/// </summary>
+		public event UnderVoltageEventHandler UnderVoltageCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void UnderVoltageEventHandler(BrickServo sender, int voltage);
+
+		/// <summary>
+		/// </summary>
+		public event UnderVoltageEventHandler UnderVoltage // for backward compatibility
+		{
+			add { UnderVoltageCallback += value; }
+			remove { UnderVoltageCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when a position set by <see cref="Tinkerforge.BrickServo.SetPosition"/>
+		///  is reached. If the new position matches the current position then the
+		///  callback is not triggered, because the servo didn't move.
+		///  The parameters are the servo and the position that is reached.
+		///  
+		///  You can enable this callback with <see cref="Tinkerforge.BrickServo.EnablePositionReachedCallback"/>.
+		///  
+		///  <note>
+		///   Since we can't get any feedback from the servo, this only works if the
+		///   velocity (see <see cref="Tinkerforge.BrickServo.SetVelocity"/>) is set smaller or equal to the
+		///   maximum velocity of the servo. Otherwise the servo will lag behind the
+		///   control value and the callback will be triggered too early.
+		///  </note>
+		/// </summary>
+		public event PositionReachedEventHandler PositionReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void PositionReachedEventHandler(BrickServo sender, byte servoNum, short position);
+
+		/// <summary>
+		/// </summary>
+		public event PositionReachedEventHandler PositionReached // for backward compatibility
+		{
+			add { PositionReachedCallback += value; }
+			remove { PositionReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when a velocity set by <see cref="Tinkerforge.BrickServo.SetVelocity"/>
+		///  is reached. The parameters are the servo and the velocity that is reached.
+		///  
+		///  You can enable this callback with <see cref="Tinkerforge.BrickServo.EnableVelocityReachedCallback"/>.
+		///  
+		///  <note>
+		///   Since we can't get any feedback from the servo, this only works if the
+		///   acceleration (see <see cref="Tinkerforge.BrickServo.SetAcceleration"/>) is set smaller or equal to the
+		///   maximum acceleration of the servo. Otherwise the servo will lag behind the
+		///   control value and the callback will be triggered too early.
+		///  </note>
+		/// </summary>
+		public event VelocityReachedEventHandler VelocityReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void VelocityReachedEventHandler(BrickServo sender, byte servoNum, short velocity);
+
+		/// <summary>
+		/// </summary>
+		public event VelocityReachedEventHandler VelocityReached // for backward compatibility
+		{
+			add { VelocityReachedCallback += value; }
+			remove { VelocityReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickServo(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 4;
+
+			callbackWrappers[CALLBACK_UNDER_VOLTAGE] = new CallbackWrapper(OnUnderVoltageCallback);
+			callbackWrappers[CALLBACK_POSITION_REACHED] = new CallbackWrapper(OnPositionReachedCallback);
+			callbackWrappers[CALLBACK_VELOCITY_REACHED] = new CallbackWrapper(OnVelocityReachedCallback);
+
+
+			responseExpected[FUNCTION_ENABLE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DISABLE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_POSITION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_POSITION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CURRENT_POSITION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_VELOCITY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_VELOCITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CURRENT_VELOCITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ACCELERATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_ACCELERATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_OUTPUT_VOLTAGE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_OUTPUT_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_PULSE_WIDTH] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_PULSE_WIDTH] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DEGREE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_DEGREE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_PERIOD] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SERVO_CURRENT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_OVERALL_CURRENT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_STACK_INPUT_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MINIMUM_VOLTAGE] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_MINIMUM_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_POSITION_REACHED_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_DISABLE_POSITION_REACHED_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_IS_POSITION_REACHED_CALLBACK_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_VELOCITY_REACHED_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_DISABLE_VELOCITY_REACHED_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_IS_VELOCITY_REACHED_CALLBACK_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPITFP_BAUDRATE_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_BAUDRATE_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SEND_TIMEOUT_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPITFP_BAUDRATE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_BAUDRATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DISABLE_STATUS_LED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_STATUS_LED_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_PROTOCOL1_BRICKLET_NAME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_BRICKLET_PLUGIN] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_BRICKLET_PLUGIN] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Enables a servo (0 to 6). If a servo is enabled, the configured position,
+		///  velocity, acceleration, etc. are applied immediately.
+		/// </summary>
+		public void Enable(byte servoNum)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_ENABLE);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables a servo (0 to 6). Disabled servos are not driven at all, i.e. a
+		///  disabled servo will not hold its position if a load is applied.
+		/// </summary>
+		public void Disable(byte servoNum)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_DISABLE);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the specified servo is enabled, *false* otherwise.
+		/// </summary>
+		public bool IsEnabled(byte servoNum)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_IS_ENABLED);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the position for the specified servo.
+		///  
+		///  The default range of the position is -9000 to 9000, but it can be specified
+		///  according to your servo with <see cref="Tinkerforge.BrickServo.SetDegree"/>.
+		///  
+		///  If you want to control a linear servo or RC brushless motor controller or
+		///  similar with the Servo Brick, you can also define lengths or speeds with
+		///  <see cref="Tinkerforge.BrickServo.SetDegree"/>.
+		/// </summary>
+		public void SetPosition(byte servoNum, short position)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_POSITION);
+			LEConverter.To((byte)servoNum, 8, request);
+			LEConverter.To((short)position, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the position of the specified servo as set by <see cref="Tinkerforge.BrickServo.SetPosition"/>.
+		/// </summary>
+		public short GetPosition(byte servoNum)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_POSITION);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the *current* position of the specified servo. This may not be the
+		///  value of <see cref="Tinkerforge.BrickServo.SetPosition"/> if the servo is currently approaching a
+		///  position goal.
+		/// </summary>
+		public short GetCurrentPosition(byte servoNum)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_CURRENT_POSITION);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the maximum velocity of the specified servo. The velocity
+		///  is accelerated according to the value set by <see cref="Tinkerforge.BrickServo.SetAcceleration"/>.
+		///  
+		///  The minimum velocity is 0 (no movement) and the maximum velocity is 65535.
+		///  With a value of 65535 the position will be set immediately (no velocity).
+		/// </summary>
+		public void SetVelocity(byte servoNum, int velocity)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_VELOCITY);
+			LEConverter.To((byte)servoNum, 8, request);
+			LEConverter.To((short)velocity, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the velocity of the specified servo as set by <see cref="Tinkerforge.BrickServo.SetVelocity"/>.
+		/// </summary>
+		public int GetVelocity(byte servoNum)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_VELOCITY);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the *current* velocity of the specified servo. This may not be the
+		///  value of <see cref="Tinkerforge.BrickServo.SetVelocity"/> if the servo is currently approaching a
+		///  velocity goal.
+		/// </summary>
+		public int GetCurrentVelocity(byte servoNum)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_CURRENT_VELOCITY);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the acceleration of the specified servo.
+		///  
+		///  The minimum acceleration is 1 and the maximum acceleration is 65535.
+		///  With a value of 65535 the velocity will be set immediately (no acceleration).
+		/// </summary>
+		public void SetAcceleration(byte servoNum, int acceleration)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_ACCELERATION);
+			LEConverter.To((byte)servoNum, 8, request);
+			LEConverter.To((short)acceleration, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the acceleration for the specified servo as set by
+		///  <see cref="Tinkerforge.BrickServo.SetAcceleration"/>.
+		/// </summary>
+		public int GetAcceleration(byte servoNum)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_ACCELERATION);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the output voltages with which the servos are driven.
+		///  
+		///  <note>
+		///   We recommend that you set this value to the maximum voltage that is
+		///   specified for your servo, most servos achieve their maximum force only
+		///   with high voltages.
+		///  </note>
+		/// </summary>
+		public void SetOutputVoltage(int voltage)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_OUTPUT_VOLTAGE);
+			LEConverter.To((short)voltage, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the output voltage as specified by <see cref="Tinkerforge.BrickServo.SetOutputVoltage"/>.
+		/// </summary>
+		public int GetOutputVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_OUTPUT_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the minimum and maximum pulse width of the specified servo.
+		///  
+		///  Usually, servos are controlled with a
+		///  `PWM &lt;https://en.wikipedia.org/wiki/Pulse-width_modulation&gt;`__, whereby the
+		///  length of the pulse controls the position of the servo. Every servo has
+		///  different minimum and maximum pulse widths, these can be specified with
+		///  this function.
+		///  
+		///  If you have a datasheet for your servo that specifies the minimum and
+		///  maximum pulse width, you should set the values accordingly. If your servo
+		///  comes without any datasheet you have to find the values via trial and error.
+		///  
+		///  The minimum must be smaller than the maximum.
+		/// </summary>
+		public void SetPulseWidth(byte servoNum, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_PULSE_WIDTH);
+			LEConverter.To((byte)servoNum, 8, request);
+			LEConverter.To((short)min, 9, request);
+			LEConverter.To((short)max, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the minimum and maximum pulse width for the specified servo as set by
+		///  <see cref="Tinkerforge.BrickServo.SetPulseWidth"/>.
+		/// </summary>
+		public void GetPulseWidth(byte servoNum, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_PULSE_WIDTH);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			min = LEConverter.UShortFrom(8, response);
+			max = LEConverter.UShortFrom(10, response);
+		}
+
+		/// <summary>
+		///  Sets the minimum and maximum degree for the specified servo (by default
+		///  given as °/100).
+		///  
+		///  This only specifies the abstract values between which the minimum and maximum
+		///  pulse width is scaled. For example: If you specify a pulse width of 1000µs
+		///  to 2000µs and a degree range of -90° to 90°, a call of <see cref="Tinkerforge.BrickServo.SetPosition"/>
+		///  with 0 will result in a pulse width of 1500µs
+		///  (-90° = 1000µs, 90° = 2000µs, etc.).
+		///  
+		///  Possible usage:
+		///  
+		///  * The datasheet of your servo specifies a range of 200° with the middle position
+		///    at 110°. In this case you can set the minimum to -9000 and the maximum to 11000.
+		///  * You measure a range of 220° on your servo and you don't have or need a middle
+		///    position. In this case you can set the minimum to 0 and the maximum to 22000.
+		///  * You have a linear servo with a drive length of 20cm, In this case you could
+		///    set the minimum to 0 and the maximum to 20000. Now you can set the Position
+		///    with <see cref="Tinkerforge.BrickServo.SetPosition"/> with a resolution of cm/100. Also the velocity will
+		///    have a resolution of cm/100s and the acceleration will have a resolution of
+		///    cm/100s².
+		///  * You don't care about units and just want the highest possible resolution. In
+		///    this case you should set the minimum to -32767 and the maximum to 32767.
+		///  * You have a brushless motor with a maximum speed of 10000 rpm and want to
+		///    control it with a RC brushless motor controller. In this case you can set the
+		///    minimum to 0 and the maximum to 10000. <see cref="Tinkerforge.BrickServo.SetPosition"/> now controls the rpm.
+		///  
+		///  The minimum must be smaller than the maximum.
+		/// </summary>
+		public void SetDegree(byte servoNum, short min, short max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_DEGREE);
+			LEConverter.To((byte)servoNum, 8, request);
+			LEConverter.To((short)min, 9, request);
+			LEConverter.To((short)max, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the minimum and maximum degree for the specified servo as set by
+		///  <see cref="Tinkerforge.BrickServo.SetDegree"/>.
+		/// </summary>
+		public void GetDegree(byte servoNum, out short min, out short max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_DEGREE);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			min = LEConverter.ShortFrom(8, response);
+			max = LEConverter.ShortFrom(10, response);
+		}
+
+		/// <summary>
+		///  Sets the period of the specified servo.
+		///  
+		///  Usually, servos are controlled with a
+		///  `PWM &lt;https://en.wikipedia.org/wiki/Pulse-width_modulation&gt;`__. Different
+		///  servos expect PWMs with different periods. Most servos run well with a
+		///  period of about 20ms.
+		///  
+		///  If your servo comes with a datasheet that specifies a period, you should
+		///  set it accordingly. If you don't have a datasheet and you have no idea
+		///  what the correct period is, the default value will most likely
+		///  work fine.
+		/// </summary>
+		public void SetPeriod(byte servoNum, int period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_PERIOD);
+			LEConverter.To((byte)servoNum, 8, request);
+			LEConverter.To((short)period, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period for the specified servo as set by <see cref="Tinkerforge.BrickServo.SetPeriod"/>.
+		/// </summary>
+		public int GetPeriod(byte servoNum)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_PERIOD);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current consumption of the specified servo.
+		/// </summary>
+		public int GetServoCurrent(byte servoNum)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SERVO_CURRENT);
+			LEConverter.To((byte)servoNum, 8, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current consumption of all servos together.
+		/// </summary>
+		public int GetOverallCurrent()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_OVERALL_CURRENT);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the stack input voltage. The stack input voltage is the
+		///  voltage that is supplied via the stack, i.e. it is given by a
+		///  Step-Down or Step-Up Power Supply.
+		/// </summary>
+		public int GetStackInputVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STACK_INPUT_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the external input voltage. The external input voltage is
+		///  given via the black power input connector on the Servo Brick.
+		///  
+		///  If there is an external input voltage and a stack input voltage, the motors
+		///  will be driven by the external input voltage. If there is only a stack
+		///  voltage present, the motors will be driven by this voltage.
+		///  
+		///  <note type="caution">
+		///   This means, if you have a high stack voltage and a low external voltage,
+		///   the motors will be driven with the low external voltage. If you then remove
+		///   the external connection, it will immediately be driven by the high
+		///   stack voltage
+		///  </note>
+		/// </summary>
+		public int GetExternalInputVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_EXTERNAL_INPUT_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the minimum voltage, below which the <see cref="Tinkerforge.BrickServo.UnderVoltageCallback"/> callback
+		///  is triggered. The minimum possible value that works with the Servo Brick is 5V.
+		///  You can use this function to detect the discharge of a battery that is used
+		///  to drive the stepper motor. If you have a fixed power supply, you likely do
+		///  not need this functionality.
+		/// </summary>
+		public void SetMinimumVoltage(int voltage)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_MINIMUM_VOLTAGE);
+			LEConverter.To((short)voltage, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the minimum voltage as set by <see cref="Tinkerforge.BrickServo.SetMinimumVoltage"/>
+		/// </summary>
+		public int GetMinimumVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MINIMUM_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Enables the <see cref="Tinkerforge.BrickServo.PositionReachedCallback"/> callback.
+		///  
+		///  Default is disabled.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public void EnablePositionReachedCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_POSITION_REACHED_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the <see cref="Tinkerforge.BrickServo.PositionReachedCallback"/> callback.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public void DisablePositionReachedCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_POSITION_REACHED_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if <see cref="Tinkerforge.BrickServo.PositionReachedCallback"/> callback is enabled, *false* otherwise.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public bool IsPositionReachedCallbackEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_POSITION_REACHED_CALLBACK_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Enables the <see cref="Tinkerforge.BrickServo.VelocityReachedCallback"/> callback.
+		///  
+		///  Default is disabled.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public void EnableVelocityReachedCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_VELOCITY_REACHED_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the <see cref="Tinkerforge.BrickServo.VelocityReachedCallback"/> callback.
+		///  
+		///  Default is disabled.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public void DisableVelocityReachedCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_VELOCITY_REACHED_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if <see cref="Tinkerforge.BrickServo.VelocityReachedCallback"/> callback is enabled, *false* otherwise.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Firmware)
+		/// </summary>
+		public bool IsVelocityReachedCallbackEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_VELOCITY_REACHED_CALLBACK_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  The SPITF protocol can be used with a dynamic baudrate. If the dynamic baudrate is
+		///  enabled, the Brick will try to adapt the baudrate for the communication
+		///  between Bricks and Bricklets according to the amount of data that is transferred.
+		///  
+		///  The baudrate will be increased exponentially if lots of data is sent/received and
+		///  decreased linearly if little data is sent/received.
+		///  
+		///  This lowers the baudrate in applications where little data is transferred (e.g.
+		///  a weather station) and increases the robustness. If there is lots of data to transfer
+		///  (e.g. Thermal Imaging Bricklet) it automatically increases the baudrate as needed.
+		///  
+		///  In cases where some data has to transferred as fast as possible every few seconds
+		///  (e.g. RS485 Bricklet with a high baudrate but small payload) you may want to turn
+		///  the dynamic baudrate off to get the highest possible performance.
+		///  
+		///  The maximum value of the baudrate can be set per port with the function
+		///  <see cref="Tinkerforge.BrickServo.SetSPITFPBaudrate"/>. If the dynamic baudrate is disabled, the baudrate
+		///  as set by <see cref="Tinkerforge.BrickServo.SetSPITFPBaudrate"/> will be used statically.
+		///  
+		///  .. versionadded:: 2.3.4$nbsp;(Firmware)
+		/// </summary>
+		public void SetSPITFPBaudrateConfig(bool enableDynamicBaudrate, long minimumDynamicBaudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SPITFP_BAUDRATE_CONFIG);
+			LEConverter.To((bool)enableDynamicBaudrate, 8, request);
+			LEConverter.To((int)minimumDynamicBaudrate, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the baudrate config, see <see cref="Tinkerforge.BrickServo.SetSPITFPBaudrateConfig"/>.
+		///  
+		///  .. versionadded:: 2.3.4$nbsp;(Firmware)
+		/// </summary>
+		public void GetSPITFPBaudrateConfig(out bool enableDynamicBaudrate, out long minimumDynamicBaudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_BAUDRATE_CONFIG);
+
+			byte[] response = SendRequest(request, 13);
+
+			enableDynamicBaudrate = LEConverter.BoolFrom(8, response);
+			minimumDynamicBaudrate = LEConverter.UIntFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the timeout count for the different communication methods.
+		///  
+		///  The methods 0-2 are available for all Bricks, 3-7 only for Master Bricks.
+		///  
+		///  This function is mostly used for debugging during development, in normal operation
+		///  the counters should nearly always stay at 0.
+		///  
+		///  .. versionadded:: 2.3.2$nbsp;(Firmware)
+		/// </summary>
+		public long GetSendTimeoutCount(byte communicationMethod)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SEND_TIMEOUT_COUNT);
+			LEConverter.To((byte)communicationMethod, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the baudrate for a specific Bricklet port.
+		///  
+		///  If you want to increase the throughput of Bricklets you can increase
+		///  the baudrate. If you get a high error count because of high
+		///  interference (see <see cref="Tinkerforge.BrickServo.GetSPITFPErrorCount"/>) you can decrease the
+		///  baudrate.
+		///  
+		///  If the dynamic baudrate feature is enabled, the baudrate set by this
+		///  function corresponds to the maximum baudrate (see <see cref="Tinkerforge.BrickServo.SetSPITFPBaudrateConfig"/>).
+		///  
+		///  Regulatory testing is done with the default baudrate. If CE compatibility
+		///  or similar is necessary in your applications we recommend to not change
+		///  the baudrate.
+		///  
+		///  .. versionadded:: 2.3.2$nbsp;(Firmware)
+		/// </summary>
+		public void SetSPITFPBaudrate(char brickletPort, long baudrate)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SPITFP_BAUDRATE);
+			LEConverter.To((char)brickletPort, 8, request);
+			LEConverter.To((int)baudrate, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the baudrate for a given Bricklet port, see <see cref="Tinkerforge.BrickServo.SetSPITFPBaudrate"/>.
+		///  
+		///  .. versionadded:: 2.3.2$nbsp;(Firmware)
+		/// </summary>
+		public long GetSPITFPBaudrate(char brickletPort)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SPITFP_BAUDRATE);
+			LEConverter.To((char)brickletPort, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Brick side. All
+		///  Bricklets have a similar function that returns the errors on the Bricklet side.
+		///  
+		///  .. versionadded:: 2.3.2$nbsp;(Firmware)
+		/// </summary>
+		public void GetSPITFPErrorCount(char brickletPort, out long errorCountACKChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SPITFP_ERROR_COUNT);
+			LEConverter.To((char)brickletPort, 8, request);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountACKChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Enables the status LED.
+		///  
+		///  The status LED is the blue LED next to the USB connector. If enabled is is
+		///  on and it flickers if data is transfered. If disabled it is always off.
+		///  
+		///  The default state is enabled.
+		///  
+		///  .. versionadded:: 2.3.1$nbsp;(Firmware)
+		/// </summary>
+		public void EnableStatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the status LED.
+		///  
+		///  The status LED is the blue LED next to the USB connector. If enabled is is
+		///  on and it flickers if data is transfered. If disabled it is always off.
+		///  
+		///  The default state is enabled.
+		///  
+		///  .. versionadded:: 2.3.1$nbsp;(Firmware)
+		/// </summary>
+		public void DisableStatusLED()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_STATUS_LED);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the status LED is enabled, *false* otherwise.
+		///  
+		///  .. versionadded:: 2.3.1$nbsp;(Firmware)
+		/// </summary>
+		public bool IsStatusLEDEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_STATUS_LED_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the firmware and protocol version and the name of the Bricklet for a
+		///  given port.
+		///  
+		///  This functions sole purpose is to allow automatic flashing of v1.x.y Bricklet
+		///  plugins.
+		/// </summary>
+		public void GetProtocol1BrickletName(char port, out byte protocolVersion, out byte[] firmwareVersion, out string name)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_PROTOCOL1_BRICKLET_NAME);
+			LEConverter.To((char)port, 8, request);
+
+			byte[] response = SendRequest(request, 52);
+
+			protocolVersion = LEConverter.ByteFrom(8, response);
+			firmwareVersion = LEConverter.ByteArrayFrom(9, response, 3);
+			name = LEConverter.StringFrom(12, response, 40);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has an
+		///  accuracy of ±15%. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Brick. Calling this function
+		///  on a Brick inside of a stack will reset the whole stack.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 32 bytes of firmware to the bricklet attached at the given port.
+		///  The bytes are written to the position offset * 32.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void WriteBrickletPlugin(char port, byte offset, byte[] chunk)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(42, FUNCTION_WRITE_BRICKLET_PLUGIN);
+			LEConverter.To((char)port, 8, request);
+			LEConverter.To((byte)offset, 9, request);
+			LEConverter.To((byte[])chunk, 10, 32, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Reads 32 bytes of firmware from the bricklet attached at the given port.
+		///  The bytes are read starting at the position offset * 32.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte[] ReadBrickletPlugin(char port, byte offset)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_READ_BRICKLET_PLUGIN);
+			LEConverter.To((char)port, 8, request);
+			LEConverter.To((byte)offset, 9, request);
+
+			byte[] response = SendRequest(request, 40);
+
+			return LEConverter.ByteArrayFrom(8, response, 32);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Brick is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position is the position in the stack from '0' (bottom) to '8' (top).
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnUnderVoltageCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.UShortFrom(8, response);
+			var handler = UnderVoltageCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnPositionReachedCallback(byte[] response)
+		{
+			if (response.Length != 11)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte servoNum = LEConverter.ByteFrom(8, response);
+			short position = LEConverter.ShortFrom(9, response);
+			var handler = PositionReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, servoNum, position);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnVelocityReachedCallback(byte[] response)
+		{
+			if (response.Length != 11)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte servoNum = LEConverter.ByteFrom(8, response);
+			short velocity = LEConverter.ShortFrom(9, response);
+			var handler = VelocityReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, servoNum, velocity);
+			}
+		}
+	}
+}
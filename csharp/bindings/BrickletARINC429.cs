@@ -0,0 +1,1442 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  TBD
+	/// </summary>
+	public class BrickletARINC429 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2160;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "ARINC429 Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DEBUG_GET_DISCRETES = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DEBUG_READ_REGISTER_LOW_LEVEL = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DEBUG_WRITE_REGISTER_LOW_LEVEL = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CAPABILITIES = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_HEARTBEAT_CALLBACK_CONFIGURATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_HEARTBEAT_CALLBACK_CONFIGURATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHANNEL_CONFIGURATION = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHANNEL_CONFIGURATION = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHANNEL_MODE = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHANNEL_MODE = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CLEAR_ALL_RX_FILTERS = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CLEAR_RX_FILTER = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RX_STANDARD_FILTERS = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RX_FILTER = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RX_FILTER = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_FRAME = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RX_CALLBACK_CONFIGURATION = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RX_CALLBACK_CONFIGURATION = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FRAME_DIRECT = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FRAME_SCHEDULED = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CLEAR_SCHEDULE_ENTRIES = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SCHEDULE_ENTRY = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SCHEDULE_ENTRY = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET_A429 = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_HEARTBEAT = 7;
+
+		private const int CALLBACK_FRAME_MESSAGE = 20;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte RW_ERROR_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte RW_ERROR_NO_WRITE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte RW_ERROR_NO_READ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte RW_ERROR_INVALID_OP_CODE = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte RW_ERROR_INVALID_LENGTH = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte RW_ERROR_SPI = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX1 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX2 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX3 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX4 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX5 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX6 = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX7 = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX8 = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX9 = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX10 = 10;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX11 = 11;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_TX12 = 12;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX = 32;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX1 = 33;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX2 = 34;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX3 = 35;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX4 = 36;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX5 = 37;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX6 = 38;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX7 = 39;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX8 = 40;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX9 = 41;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX10 = 42;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX11 = 43;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_RX12 = 44;
+
+		/// <summary>
+		/// </summary>
+		public const byte SDI_SDI0 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SDI_SDI1 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte SDI_SDI2 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte SDI_SDI3 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte SDI_DATA = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_DATA = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_AUTO = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte SPEED_HS = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SPEED_LS = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MODE_PASSIVE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MODE_ACTIVE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MODE_RUN = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FRAME_STATUS_UPDATE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FRAME_STATUS_TIMEOUT = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte SCHEDULER_JOB_SKIP = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SCHEDULER_JOB_DWELL = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte SCHEDULER_JOB_SINGLE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte SCHEDULER_JOB_CYCLIC = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte SCHEDULER_JOB_RETRANS_RX1 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte SCHEDULER_JOB_RETRANS_RX2 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte A429_MODE_NORMAL = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte A429_MODE_DEBUG = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletARINC429.SetHeartbeatCallbackConfiguration"/>. It reports the statistics counters
+		///  for processed frames and lost frames for all TX and RX channels.
+		///   * Seq Number:       running counter that is incremented with each callback, starting with 0 and rolling over after 255 to 1. It will restart from 0 whenever the heartbeat is turned off and on again. This counter can be used to detect lost callbacks.
+		///   * Timestamp:        running counter that is incremented on every millisecond, starting when the bricklet is powered up and rolling over after 65535 to 0. This counter can be used to measure the relative timing between events.
+		///   * Frames Processed: number of Arinc429 frames that are transmitted or received on the respective channels TX, RX1 and RX2.
+		///   * Frames Lost:      TX channel: number of Arinc429 frames that could not be transmitted due to a full transmit buffer, RX channels: number of received Arinc429 frames that could not be reported due to a full callback buffer.
+		/// </summary>
+		public event HeartbeatEventHandler HeartbeatCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void HeartbeatEventHandler(BrickletARINC429 sender, byte seqNumber, int timestamp, int[] framesProcessed, int[] framesLost);
+
+		/// <summary>
+		///  This callback is triggered according to the configuration set by <see cref="Tinkerforge.BrickletARINC429.SetRXCallbackConfiguration"/>.
+		///   * Channel:      RX channel on which the frame was received.
+		///   * Seq Number:   running counter that is incremented with each callback, starting with 0 and rolling over after 255 to 1. It will restart from 0 whenever the callback is turned off and on again. This counter can be used to detect lost callbacks.
+		///   * Timestamp:    running counter that is incremented on every millisecond, starting when the bricklet is powered up and rolling over after 65535 to 0. This counter can be used to measure the relative timing between frame receptions.
+		///   * Frame Status: 'update' signals that a new frame (new data) was received, whereas 'timeout' signals that the frame (label and SDI combination) encountered the timeout state.
+		///   * Frame:        the complete Arinc429 frame including the label and SDI bits. If 'parity_auto' is set for the channel, the parity bit will always come as 0.
+		///   * Age:          time in milliseconds since this frame (label + SDI combination) was received last. If not received for so far or after a previous timeout, 60000 or the timeout value set with the 'Set RX Callback Configuration' function will be returned.
+		/// </summary>
+		public event FrameMessageEventHandler FrameMessageCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FrameMessageEventHandler(BrickletARINC429 sender, byte channel, byte seqNumber, int timestamp, byte frameStatus, long frame, int age);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletARINC429(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_HEARTBEAT] = new CallbackWrapper(OnHeartbeatCallback);
+			callbackWrappers[CALLBACK_FRAME_MESSAGE] = new CallbackWrapper(OnFrameMessageCallback);
+
+
+			responseExpected[FUNCTION_DEBUG_GET_DISCRETES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_DEBUG_READ_REGISTER_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_DEBUG_WRITE_REGISTER_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CAPABILITIES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_HEARTBEAT_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_HEARTBEAT_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHANNEL_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHANNEL_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHANNEL_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHANNEL_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_CLEAR_ALL_RX_FILTERS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_CLEAR_RX_FILTER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_RX_STANDARD_FILTERS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_RX_FILTER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_RX_FILTER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READ_FRAME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_RX_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_RX_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_WRITE_FRAME_DIRECT] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FRAME_SCHEDULED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_CLEAR_SCHEDULE_ENTRIES] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_SCHEDULE_ENTRY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SCHEDULE_ENTRY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET_A429] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Low-level debug function to read the discrete signals from the A429 chip.
+		///  RX Discretes Bit   9: MB2-1   - pending frame in RX2, PRIO 1 mailbox
+		///                     8: MB2-2   -                            2 mailbox
+		///                     7: MB2-3   -                            3 mailbox
+		///                     6: R2FLAG  -                       FIFO
+		///                     5: R2INT   -                       FIFO (pulse only)
+		///                     4: MB1-1   - pending frame in RX1, PRIO 1 mailbox
+		///                     3: MB1-2   -                            2 mailbox
+		///                     2: MB1-3   -                            3 mailbox
+		///                     1: R1FLAG  -                       FIFO
+		///                     0: R1INT   -                       FIFO (pulse only)
+		///  TX Discretes Bit 2-7: unused
+		///                     1: TFULL   - TX buffer full
+		///                     0: TEMPTY  - TX buffer empty
+		/// </summary>
+		public void DebugGetDiscretes(out int rxDiscretes, out int txDiscretes)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DEBUG_GET_DISCRETES);
+
+			byte[] response = SendRequest(request, 12);
+
+			rxDiscretes = LEConverter.UShortFrom(8, response);
+			txDiscretes = LEConverter.UShortFrom(10, response);
+		}
+
+		/// <summary>
+		///  Low-level debug function to execute a direct SPI read access on the A429 chip.
+		///   * OP Code:      code number of the SPI read command
+		///   * Value Length: number of bytes read
+		///   * Value Data:   data bytes read
+		///   * RW Error:     'OK' if the read access was successful, else error code
+		/// </summary>
+		public void DebugReadRegisterLowLevel(byte opCode, out byte valueLength, out byte[] valueData, out byte rwError)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_DEBUG_READ_REGISTER_LOW_LEVEL);
+			LEConverter.To((byte)opCode, 8, request);
+
+			byte[] response = SendRequest(request, 42);
+
+			valueLength = LEConverter.ByteFrom(8, response);
+			valueData = LEConverter.ByteArrayFrom(9, response, 32);
+			rwError = LEConverter.ByteFrom(41, response);
+		}
+
+		/// <summary>
+		///  Low-level debug function to execute a direct SPI write access on the A429 chip.
+		///   * OP Code:      code number of the SPI read command
+		///   * Value Length: number of bytes to write
+		///   * Value Data:   data bytes to write
+		///   * RW Error:     'OK' if the write access was successful, else error code
+		/// </summary>
+		public byte DebugWriteRegisterLowLevel(byte opCode, byte valueLength, byte[] valueData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(42, FUNCTION_DEBUG_WRITE_REGISTER_LOW_LEVEL);
+			LEConverter.To((byte)opCode, 8, request);
+			LEConverter.To((byte)valueLength, 9, request);
+			LEConverter.To((byte[])valueData, 10, 32, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Get the TX and RX capabilities and their current usage:
+		///   * TX Total Scheduler Tasks: total number of task entries in the scheduling table.
+		///   * TX Used Scheduler Tasks:  number of task entries that are currently in use.
+		///   * RX Total Frame Filters:   total number of frame filters that can be defined per channel.
+		///   * RX Used Frame Filters:    number of frame filters that are currently in use per each channel.
+		/// </summary>
+		public void GetCapabilities(out int txTotalSchedulerTasks, out int txUsedSchedulerTasks, out int rxTotalFrameFilters, out int[] rxUsedFrameFilters)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CAPABILITIES);
+
+			byte[] response = SendRequest(request, 18);
+
+			txTotalSchedulerTasks = LEConverter.UShortFrom(8, response);
+			txUsedSchedulerTasks = LEConverter.UShortFrom(10, response);
+			rxTotalFrameFilters = LEConverter.UShortFrom(12, response);
+			rxUsedFrameFilters = LEConverter.UShortArrayFrom(14, response, 2);
+		}
+
+		/// <summary>
+		///  Set the bricklet heartbeat which reports the statistics counters for processed frames and lost frames.
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletARINC429.HeartbeatCallback"/> callback is triggered periodically. A value of 0 turns the callback off.
+		///  When 'Value Has To Change' is enabled, the heartbeat will only be sent if there is a change in the statistics numbers.
+		/// </summary>
+		public void SetHeartbeatCallbackConfiguration(byte period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_HEARTBEAT_CALLBACK_CONFIGURATION);
+			LEConverter.To((byte)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Get the configuration of the bricklet heartbeat reporting the statistics counters.
+		/// </summary>
+		public void GetHeartbeatCallbackConfiguration(out byte period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_HEARTBEAT_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			period = LEConverter.ByteFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(9, response);
+		}
+
+		/// <summary>
+		///  Set the data transmission properties of the selected channel:
+		///   * Channel: channel to configure
+		///   * Parity:  'parity_auto' for automatic parity adjustment, 'parity_data' for parity bit supplied by the application or if used for data.
+		///   * Speed:   'speed_hs' for high speed mode (100 kbit/s), 'speed_ls' for low speed mode (12.5 kbit/s).
+		///  When parity set to 'parity_auto', frames received with a parity error will be counted in the lost frames counter but discarded otherwise.
+		/// </summary>
+		public void SetChannelConfiguration(byte channel, byte parity, byte speed)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_CHANNEL_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((byte)parity, 9, request);
+			LEConverter.To((byte)speed, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Get the data transmission properties of the selected channel.
+		/// </summary>
+		public void GetChannelConfiguration(byte channel, out byte parity, out byte speed)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_CHANNEL_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			parity = LEConverter.ByteFrom(8, response);
+			speed = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  Set the operating mode of the selected channel:
+		///   * passive: TX channel: all transmissions are stopped and the hardware interface becomes high-Z. RX channels: all arriving frames will be discarded.
+		///   * active:  TX channel: Arinc429 frames can be sent via the 'Write Frame Direct' function. RX channels: arriving frames will be processed according to the frame filter and callback settings.
+		///   * run:     TX channels only: the scheduler will run and transmit frames according to the entries made in the scheduler task table.
+		/// </summary>
+		public void SetChannelMode(byte channel, byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_CHANNEL_MODE);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((byte)mode, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Get the operating mode of the selected channel.
+		/// </summary>
+		public byte GetChannelMode(byte channel)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_CHANNEL_MODE);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Clear all receive filters on the selected RX channel.
+		/// </summary>
+		public void ClearAllRXFilters(byte channel)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_CLEAR_ALL_RX_FILTERS);
+			LEConverter.To((byte)channel, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Clear one receive filter on the selected RX channel.
+		///   * Channel: selected channel.
+		///   * Label:   label code of the filter.
+		///   * SDI:     SDI code of the filter (SDI_SDI0 to SDI_SDI3 or SDI_DATA if SDI bits are used for data).
+		///   * Success: returns 'True' if the filter was cleared or 'False' if a respective filter was not set.
+		/// </summary>
+		public bool ClearRXFilter(byte channel, byte label, byte sdi)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_CLEAR_RX_FILTER);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((byte)label, 9, request);
+			LEConverter.To((byte)sdi, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Set a receive filter for each label value (0-255) with SDI bits set for data. Any previously existing filters will be overwritten.
+		/// </summary>
+		public void SetRXStandardFilters(byte channel)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_RX_STANDARD_FILTERS);
+			LEConverter.To((byte)channel, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Set a receive filter on the selected channel:
+		///   * Channel: selected channel.
+		///   * Label:   label code for the filter.
+		///   * SDI:     SDI code for the filter (SDI_SDI0 to SDI_SDI3 or SDI_DATA if SDI bits are used for data).
+		///   * Success: returns 'True' if the filter was set or 'False' if a respective filter could not be set up (e.g. because label + SDI collides with an already existing filter or all available filters are used up).
+		/// </summary>
+		public bool SetRXFilter(byte channel, byte label, byte sdi)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_RX_FILTER);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((byte)label, 9, request);
+			LEConverter.To((byte)sdi, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Query if a specific filter is set up or not:
+		///   * Channel:    channel to query.
+		///   * Label:      label code to query for.
+		///   * SDI:        SDI usage to query for (SDI_SDI0 to SDI_SDI3 or SDI_DATA if SDI bits shall be used for data).
+		///   * Configured: returns 'True' if the inquired filter exists, else 'False'.
+		/// </summary>
+		public bool GetRXFilter(byte channel, byte label, byte sdi)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_GET_RX_FILTER);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((byte)label, 9, request);
+			LEConverter.To((byte)sdi, 10, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Direct read of an Arinc429 frame, i.e. without using the callback mechanism.
+		///  In order to be able to do a direct read of a frame with a certain label and SDI combination, a respective receive filter needs to be set up beforehand.
+		///   * Channel: RX channel to read from.
+		///   * Label:   label code of the frame to read.
+		///   * SDI:     SDI code of the frame to read (SDI_SDI0 to SDI_SDI3 or SDI_DATA if SDI bits are used for data).
+		///   * Status:  returns 'True' if a respective frame was received, else 'False'.
+		///   * Frame:   returns the complete Arinc429 frame including the label and SDI bits. If 'parity_auto' is set for the channel, the parity bit will always come as 0.
+		///   * Age:     time in milliseconds since this frame (label + SDI combination) was received last. If not received for so far or after a previous timeout, 60000 or the timeout value set with the 'Set RX Callback Configuration' function will be returned.
+		/// </summary>
+		public void ReadFrame(byte channel, byte label, byte sdi, out bool status, out long frame, out int age)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_READ_FRAME);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((byte)label, 9, request);
+			LEConverter.To((byte)sdi, 10, request);
+
+			byte[] response = SendRequest(request, 15);
+
+			status = LEConverter.BoolFrom(8, response);
+			frame = LEConverter.UIntFrom(9, response);
+			age = LEConverter.UShortFrom(13, response);
+		}
+
+		/// <summary>
+		///  Set the configuration of the Arinc429 frame reception callback:
+		///   * Channel:             selected RX channel.
+		///   * Enabled:             select 'True' for activating the frame callbacks and 'False' for deactivating them.
+		///   * Value Has To Change: select 'True' if callbacks shall only be sent for frames whose data have changed. With 'False' a callback will be sent on every frame reception.
+		///   * Timeout:             time period for all frames (label and SDI combinations) on this channel.
+		///  
+		///  Despite on frame reception, a callback is also generated if a frame encounters a timeout, i.e. if it is not periodically received again before the set timeout period has expired.
+		///  In order to have callbacks being generated at all, respective receive filters need to be set up.
+		/// </summary>
+		public void SetRXCallbackConfiguration(byte channel, bool enabled, bool valueHasToChange, int timeout)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_RX_CALLBACK_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((bool)enabled, 9, request);
+			LEConverter.To((bool)valueHasToChange, 10, request);
+			LEConverter.To((short)timeout, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Get the configuration of the frame reception callback.
+		/// </summary>
+		public void GetRXCallbackConfiguration(byte channel, out bool enabled, out bool valueHasToChange, out int timeout)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_RX_CALLBACK_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			enabled = LEConverter.BoolFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(9, response);
+			timeout = LEConverter.UShortFrom(10, response);
+		}
+
+		/// <summary>
+		///  Immediately transmit an Arinc429 frame:
+		///   * Channel: selected transmit channel.
+		///   * frame:   complete Arinc429 frame including the label and SDI bits. If 'parity_auto' is set for the channel, the parity bit will be set (adjusted) automatically.
+		/// </summary>
+		public void WriteFrameDirect(byte channel, long frame)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_WRITE_FRAME_DIRECT);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((int)frame, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Set or update an Arinc429 frame that is transmitted by the scheduler using the task types 'Single' and 'Cyclic'.
+		///   * Channel:     selected transmit channel.
+		///   * Frame Index: index number that will be used in the transmit scheduler task table to refer to this frame.
+		///   * frame:       complete Arinc429 frame including the label and SDI bits. If 'parity_auto' is set for the channel, the parity bit will be set (adjusted) automatically.
+		/// </summary>
+		public void WriteFrameScheduled(byte channel, int frameIndex, long frame)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(15, FUNCTION_WRITE_FRAME_SCHEDULED);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((short)frameIndex, 9, request);
+			LEConverter.To((int)frame, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Clear a range of transmit scheduler task table entries:
+		///   * Channel: selected TX channel.
+		///   * First:   index of the first table entry to be cleared.
+		///   * Last:    index of the last  table entry to be cleared.
+		///  To clear a single entry, set 'First' and 'Last' to the one index of the one entry to be cleared.
+		/// </summary>
+		public void ClearScheduleEntries(byte channel, int taskIndexFirst, int taskIndexLast)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_CLEAR_SCHEDULE_ENTRIES);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((short)taskIndexFirst, 9, request);
+			LEConverter.To((short)taskIndexLast, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Set an entry in the transmit scheduler task table:
+		///   * Channel:     selected TX channel
+		///   * Task Index:  index number of the task, the scheduler processes the task table in ascending order of these index numbers.
+		///   * Job:         activity assigned to this entry, see below.
+		///   * Frame Index: frame assigned to this task, either the 'Frame Index' used along with the :func: `Write Frame Scheduled` or the extended label (label + SDI) in case of RX1/RX2 retransmits.
+		///   * Dwell Time:  time to wait before executing the next task table entry (0-250 milliseconds).
+		///  
+		///  When the scheduler is set to 'run' mode via the <see cref="Tinkerforge.BrickletARINC429.SetChannelMode"/>, it continuously loops through the task table and executes the assigned tasks.
+		///  It starts with the task stored at task index 0.
+		///  The scheduler can execute the following activity types (jobs):
+		///   * Skip:        the task is skipped, i.e. no frame is transmitted and no dwelling is done. The frame index and dwell time are not used.
+		///   * Dwell        the scheduler executes the dwelling but does not transmit any frame. The frame index is not used.
+		///   * Single:      the scheduler transmits the referenced frame, but only once. On subsequent executions the frame is not sent until it is renewed via the <see cref="Tinkerforge.BrickletARINC429.WriteFrameScheduled"/>, then the process repeats.
+		///   * Cyclic:      the scheduler transmits the referenced frame and executed the dwelling on each round.
+		///   * Retrans RX1: the scheduler retransmits a frame that was previously received on the RX1 channel. The frame to send is referenced by setting the 'Frame Index' to its extended label code, which is a 10 bit number made of the label code in the lower bits and the two SDI bits in the upper bits. If the SDI bits are used for data, set the SDI bits to zero. As long as the referenced frame was not received yet, or if it is in timeout, no frame will be sent.
+		///   * Retrans RX2: same as before, but for frames received on the RX2 channel.
+		/// </summary>
+		public void SetScheduleEntry(byte channel, int taskIndex, byte job, int frameIndex, byte dwellTime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(15, FUNCTION_SET_SCHEDULE_ENTRY);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((short)taskIndex, 9, request);
+			LEConverter.To((byte)job, 11, request);
+			LEConverter.To((short)frameIndex, 12, request);
+			LEConverter.To((byte)dwellTime, 14, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Get a transmit scheduler task table entry.
+		/// </summary>
+		public void GetScheduleEntry(byte channel, int taskIndex, out byte job, out int frameIndex, out long frame, out byte dwellTime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_GET_SCHEDULE_ENTRY);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((short)taskIndex, 9, request);
+
+			byte[] response = SendRequest(request, 16);
+
+			job = LEConverter.ByteFrom(8, response);
+			frameIndex = LEConverter.UShortFrom(9, response);
+			frame = LEConverter.UIntFrom(11, response);
+			dwellTime = LEConverter.ByteFrom(15, response);
+		}
+
+		/// <summary>
+		///  Reset the A429 bricklet. The bricklet will restart in the selected mode:
+		///   * 'Normal': normal operating mode with all high-level Arinc429 frame processing being executed.
+		///   * 'Debug':  debug mode with all high-level processing suspended, for use in conjunction with the low-level debug functions.
+		/// </summary>
+		public void ResetA429(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_RESET_A429);
+			LEConverter.To((byte)mode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletARINC429.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletARINC429.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletARINC429.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletARINC429.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Low-level debug function to execute a direct SPI read access on the A429 chip.
+		///   * OP Code:      code number of the SPI read command
+		///   * Value Length: number of bytes read
+		///   * Value Data:   data bytes read
+		///   * RW Error:     'OK' if the read access was successful, else error code
+		/// </summary>
+		public void DebugReadRegister(byte opCode, out byte[] value, out byte rwError)
+		{
+			byte valueLength;
+			byte[] valueData = new byte[32];
+
+			DebugReadRegisterLowLevel(opCode, out valueLength, out valueData, out rwError);
+
+			value = new byte[valueLength];
+
+			Array.Copy(valueData, value, valueLength);
+		}
+
+		/// <summary>
+		///  Low-level debug function to execute a direct SPI write access on the A429 chip.
+		///   * OP Code:      code number of the SPI read command
+		///   * Value Length: number of bytes to write
+		///   * Value Data:   data bytes to write
+		///   * RW Error:     'OK' if the write access was successful, else error code
+		/// </summary>
+		public byte DebugWriteRegister(byte opCode, byte[] value)
+		{
+			if (value.Length > 32)
+			{
+				throw new ArgumentException("Value can be at most 32 items long");
+			}
+
+			byte valueLength = (byte)value.Length;
+			byte[] valueData = new byte[32];
+
+			Array.Copy(value, valueData, valueLength);
+			Array.Clear(valueData, valueLength, 32 - valueLength);
+
+			return DebugWriteRegisterLowLevel(opCode, valueLength, valueData);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnHeartbeatCallback(byte[] response)
+		{
+			if (response.Length != 23)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte seqNumber = LEConverter.ByteFrom(8, response);
+			int timestamp = LEConverter.UShortFrom(9, response);
+			int[] framesProcessed = LEConverter.UShortArrayFrom(11, response, 3);
+			int[] framesLost = LEConverter.UShortArrayFrom(17, response, 3);
+			var handler = HeartbeatCallback;
+
+			if (handler != null)
+			{
+				handler(this, seqNumber, timestamp, framesProcessed, framesLost);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFrameMessageCallback(byte[] response)
+		{
+			if (response.Length != 19)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte channel = LEConverter.ByteFrom(8, response);
+			byte seqNumber = LEConverter.ByteFrom(9, response);
+			int timestamp = LEConverter.UShortFrom(10, response);
+			byte frameStatus = LEConverter.ByteFrom(12, response);
+			long frame = LEConverter.UIntFrom(13, response);
+			int age = LEConverter.UShortFrom(17, response);
+			var handler = FrameMessageCallback;
+
+			if (handler != null)
+			{
+				handler(this, channel, seqNumber, timestamp, frameStatus, frame, age);
+			}
+		}
+	}
+}
@@ -0,0 +1,609 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Measures acceleration in three axis
+	/// </summary>
+	public class BrickletAccelerometer : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 250;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Accelerometer Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ACCELERATION_CALLBACK_PERIOD = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION_CALLBACK_PERIOD = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ACCELERATION_CALLBACK_THRESHOLD = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION_CALLBACK_THRESHOLD = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DEBOUNCE_PERIOD = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DEBOUNCE_PERIOD = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CONFIGURATION = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CONFIGURATION = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_LED_ON = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_LED_OFF = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_LED_ON = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_ACCELERATION = 14;
+
+		private const int CALLBACK_ACCELERATION_REACHED = 15;
+
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OFF = 'x';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OUTSIDE = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_INSIDE = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_SMALLER = '<';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_GREATER = '>';
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_3HZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_6HZ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_12HZ = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_25HZ = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_50HZ = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_100HZ = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_400HZ = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_800HZ = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_1600HZ = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte FULL_SCALE_2G = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FULL_SCALE_4G = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FULL_SCALE_6G = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FULL_SCALE_8G = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte FULL_SCALE_16G = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILTER_BANDWIDTH_800HZ = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILTER_BANDWIDTH_400HZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILTER_BANDWIDTH_200HZ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILTER_BANDWIDTH_50HZ = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletAccelerometer.SetAccelerationCallbackPeriod"/>. The parameters are the
+		///  X, Y and Z acceleration. The range is
+		///  configured with <see cref="Tinkerforge.BrickletAccelerometer.SetConfiguration"/>.
+		///  
+		///  The <see cref="Tinkerforge.BrickletAccelerometer.AccelerationCallback"/> callback is only triggered if the acceleration has
+		///  changed since the last triggering.
+		/// </summary>
+		public event AccelerationEventHandler AccelerationCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AccelerationEventHandler(BrickletAccelerometer sender, short x, short y, short z);
+
+		/// <summary>
+		/// </summary>
+		public event AccelerationEventHandler Acceleration // for backward compatibility
+		{
+			add { AccelerationCallback += value; }
+			remove { AccelerationCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletAccelerometer.SetAccelerationCallbackThreshold"/> is reached.
+		///  The parameters are the X, Y and Z acceleration. The range is
+		///  configured with <see cref="Tinkerforge.BrickletAccelerometer.SetConfiguration"/>.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletAccelerometer.SetDebouncePeriod"/>.
+		/// </summary>
+		public event AccelerationReachedEventHandler AccelerationReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AccelerationReachedEventHandler(BrickletAccelerometer sender, short x, short y, short z);
+
+		/// <summary>
+		/// </summary>
+		public event AccelerationReachedEventHandler AccelerationReached // for backward compatibility
+		{
+			add { AccelerationReachedCallback += value; }
+			remove { AccelerationReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletAccelerometer(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_ACCELERATION] = new CallbackWrapper(OnAccelerationCallback);
+			callbackWrappers[CALLBACK_ACCELERATION_REACHED] = new CallbackWrapper(OnAccelerationReachedCallback);
+
+
+			responseExpected[FUNCTION_GET_ACCELERATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ACCELERATION_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ACCELERATION_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ACCELERATION_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ACCELERATION_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_LED_ON] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_LED_OFF] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_LED_ON] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the acceleration in x, y and z direction. The values
+		///  are given in gₙ/1000 (1gₙ = 9.80665m/s²). The range is
+		///  configured with <see cref="Tinkerforge.BrickletAccelerometer.SetConfiguration"/>.
+		///  
+		///  If you want to get the acceleration periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletAccelerometer.AccelerationCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletAccelerometer.SetAccelerationCallbackPeriod"/>.
+		/// </summary>
+		public void GetAcceleration(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletAccelerometer.AccelerationCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletAccelerometer.AccelerationCallback"/> callback is only triggered if the acceleration has
+		///  changed since the last triggering.
+		/// </summary>
+		public void SetAccelerationCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ACCELERATION_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletAccelerometer.SetAccelerationCallbackPeriod"/>.
+		/// </summary>
+		public long GetAccelerationCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletAccelerometer.AccelerationReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the acceleration is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the acceleration is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the acceleration is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the acceleration is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetAccelerationCallbackThreshold(char option, short minX, short maxX, short minY, short maxY, short minZ, short maxZ)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(21, FUNCTION_SET_ACCELERATION_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((short)minX, 9, request);
+			LEConverter.To((short)maxX, 11, request);
+			LEConverter.To((short)minY, 13, request);
+			LEConverter.To((short)maxY, 15, request);
+			LEConverter.To((short)minZ, 17, request);
+			LEConverter.To((short)maxZ, 19, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletAccelerometer.SetAccelerationCallbackThreshold"/>.
+		/// </summary>
+		public void GetAccelerationCallbackThreshold(out char option, out short minX, out short maxX, out short minY, out short maxY, out short minZ, out short maxZ)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 21);
+
+			option = LEConverter.CharFrom(8, response);
+			minX = LEConverter.ShortFrom(9, response);
+			maxX = LEConverter.ShortFrom(11, response);
+			minY = LEConverter.ShortFrom(13, response);
+			maxY = LEConverter.ShortFrom(15, response);
+			minZ = LEConverter.ShortFrom(17, response);
+			maxZ = LEConverter.ShortFrom(19, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the threshold callback
+		///  
+		///  * <see cref="Tinkerforge.BrickletAccelerometer.AccelerationReachedCallback"/>
+		///  
+		///  is triggered, if the threshold
+		///  
+		///  * <see cref="Tinkerforge.BrickletAccelerometer.SetAccelerationCallbackThreshold"/>
+		///  
+		///  keeps being reached.
+		/// </summary>
+		public void SetDebouncePeriod(long debounce)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DEBOUNCE_PERIOD);
+			LEConverter.To((int)debounce, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the debounce period as set by <see cref="Tinkerforge.BrickletAccelerometer.SetDebouncePeriod"/>.
+		/// </summary>
+		public long GetDebouncePeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DEBOUNCE_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature of the accelerometer.
+		/// </summary>
+		public short GetTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Configures the data rate, full scale range and filter bandwidth.
+		///  Possible values are:
+		///  
+		///  * Data rate of 0Hz to 1600Hz.
+		///  * Full scale range of ±2gₙ up to ±16gₙ.
+		///  * Filter bandwidth between 50Hz and 800Hz.
+		///  
+		///  Decreasing data rate or full scale range will also decrease the noise on
+		///  the data.
+		/// </summary>
+		public void SetConfiguration(byte dataRate, byte fullScale, byte filterBandwidth)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_CONFIGURATION);
+			LEConverter.To((byte)dataRate, 8, request);
+			LEConverter.To((byte)fullScale, 9, request);
+			LEConverter.To((byte)filterBandwidth, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletAccelerometer.SetConfiguration"/>.
+		/// </summary>
+		public void GetConfiguration(out byte dataRate, out byte fullScale, out byte filterBandwidth)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 11);
+
+			dataRate = LEConverter.ByteFrom(8, response);
+			fullScale = LEConverter.ByteFrom(9, response);
+			filterBandwidth = LEConverter.ByteFrom(10, response);
+		}
+
+		/// <summary>
+		///  Enables the LED on the Bricklet.
+		/// </summary>
+		public void LEDOn()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_LED_ON);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the LED on the Bricklet.
+		/// </summary>
+		public void LEDOff()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_LED_OFF);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the LED is enabled, *false* otherwise.
+		/// </summary>
+		public bool IsLEDOn()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_LED_ON);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAccelerationCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = AccelerationCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAccelerationReachedCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = AccelerationReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+	}
+}
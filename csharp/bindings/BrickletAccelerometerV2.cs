@@ -0,0 +1,1030 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Measures acceleration in three axis
+	/// </summary>
+	public class BrickletAccelerometerV2 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2130;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Accelerometer Bricklet 2.0";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CONFIGURATION = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CONFIGURATION = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_INFO_LED_CONFIG = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_INFO_LED_CONFIG = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CONTINUOUS_ACCELERATION_CONFIGURATION = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CONTINUOUS_ACCELERATION_CONFIGURATION = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FILTER_CONFIGURATION = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FILTER_CONFIGURATION = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_ACCELERATION = 8;
+
+		private const int CALLBACK_CONTINUOUS_ACCELERATION_16_BIT = 11;
+
+		private const int CALLBACK_CONTINUOUS_ACCELERATION_8_BIT = 12;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_0_781HZ = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_1_563HZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_3_125HZ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_6_2512HZ = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_12_5HZ = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_25HZ = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_50HZ = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_100HZ = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_200HZ = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_400HZ = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_800HZ = 10;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_1600HZ = 11;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_3200HZ = 12;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_6400HZ = 13;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_12800HZ = 14;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_25600HZ = 15;
+
+		/// <summary>
+		/// </summary>
+		public const byte FULL_SCALE_2G = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FULL_SCALE_4G = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FULL_SCALE_8G = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte INFO_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte INFO_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte INFO_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte RESOLUTION_8BIT = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte RESOLUTION_16BIT = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte IIR_BYPASS_APPLIED = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte IIR_BYPASS_BYPASSED = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte LOW_PASS_FILTER_NINTH = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte LOW_PASS_FILTER_HALF = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletAccelerometerV2.SetAccelerationCallbackConfiguration"/>.
+		///  
+		///  The parameters are the same as <see cref="Tinkerforge.BrickletAccelerometerV2.GetAcceleration"/>.
+		/// </summary>
+		public event AccelerationEventHandler AccelerationCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AccelerationEventHandler(BrickletAccelerometerV2 sender, int x, int y, int z);
+
+		/// <summary>
+		///  Returns 30 acceleration values with 16 bit resolution. The data rate can
+		///  be configured with <see cref="Tinkerforge.BrickletAccelerometerV2.SetConfiguration"/> and this callback can be
+		///  enabled with <see cref="Tinkerforge.BrickletAccelerometerV2.SetContinuousAccelerationConfiguration"/>.
+		///  
+		///  The returned values are raw ADC data. If you want to put this data into
+		///  a FFT to determine the occurrences of specific frequencies we recommend
+		///  that you use the data as is. It has all of the ADC noise in it. This noise
+		///  looks like pure noise at first glance, but it might still have some frequnecy
+		///  information in it that can be utilized by the FFT.
+		///  
+		///  Otherwise you have to use the following formulas that depend on the
+		///  full scale range (see <see cref="Tinkerforge.BrickletAccelerometerV2.SetConfiguration"/>) to calculate
+		///  the data in gₙ/10000 (same unit that is returned by <see cref="Tinkerforge.BrickletAccelerometerV2.GetAcceleration"/>):
+		///  
+		///  * Full scale 2g: acceleration = value * 625 / 1024
+		///  * Full scale 4g: acceleration = value * 1250 / 1024
+		///  * Full scale 8g: acceleration = value * 2500 / 1024
+		///  
+		///  The data is formated in the sequence "x, y, z, x, y, z, ..." depending on
+		///  the enabled axis. Examples:
+		///  
+		///  * x, y, z enabled: "x, y, z, ..." 10x repeated
+		///  * x, z enabled: "x, z, ..." 15x repeated
+		///  * y enabled: "y, ..." 30x repeated
+		/// </summary>
+		public event ContinuousAcceleration16BitEventHandler ContinuousAcceleration16BitCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ContinuousAcceleration16BitEventHandler(BrickletAccelerometerV2 sender, short[] acceleration);
+
+		/// <summary>
+		///  Returns 60 acceleration values with 8 bit resolution. The data rate can
+		///  be configured with <see cref="Tinkerforge.BrickletAccelerometerV2.SetConfiguration"/> and this callback can be
+		///  enabled with <see cref="Tinkerforge.BrickletAccelerometerV2.SetContinuousAccelerationConfiguration"/>.
+		///  
+		///  The returned values are raw ADC data. If you want to put this data into
+		///  a FFT to determine the occurrences of specific frequencies we recommend
+		///  that you use the data as is. It has all of the ADC noise in it. This noise
+		///  looks like pure noise at first glance, but it might still have some frequnecy
+		///  information in it that can be utilized by the FFT.
+		///  
+		///  Otherwise you have to use the following formulas that depend on the
+		///  full scale range (see <see cref="Tinkerforge.BrickletAccelerometerV2.SetConfiguration"/>) to calculate
+		///  the data in gₙ/10000 (same unit that is returned by <see cref="Tinkerforge.BrickletAccelerometerV2.GetAcceleration"/>):
+		///  
+		///  * Full scale 2g: acceleration = value * 256 * 625 / 1024
+		///  * Full scale 4g: acceleration = value * 256 * 1250 / 1024
+		///  * Full scale 8g: acceleration = value * 256 * 2500 / 1024
+		///  
+		///  The data is formated in the sequence "x, y, z, x, y, z, ..." depending on
+		///  the enabled axis. Examples:
+		///  
+		///  * x, y, z enabled: "x, y, z, ..." 20x repeated
+		///  * x, z enabled: "x, z, ..." 30x repeated
+		///  * y enabled: "y, ..." 60x repeated
+		/// </summary>
+		public event ContinuousAcceleration8BitEventHandler ContinuousAcceleration8BitCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ContinuousAcceleration8BitEventHandler(BrickletAccelerometerV2 sender, short[] acceleration);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletAccelerometerV2(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_ACCELERATION] = new CallbackWrapper(OnAccelerationCallback);
+			callbackWrappers[CALLBACK_CONTINUOUS_ACCELERATION_16_BIT] = new CallbackWrapper(OnContinuousAcceleration16BitCallback);
+			callbackWrappers[CALLBACK_CONTINUOUS_ACCELERATION_8_BIT] = new CallbackWrapper(OnContinuousAcceleration8BitCallback);
+
+
+			responseExpected[FUNCTION_GET_ACCELERATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_INFO_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_INFO_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CONTINUOUS_ACCELERATION_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_CONTINUOUS_ACCELERATION_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_FILTER_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_FILTER_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the acceleration in x, y and z direction. The values
+		///  are given in gₙ/10000 (1gₙ = 9.80665m/s²). The range is
+		///  configured with <see cref="Tinkerforge.BrickletAccelerometerV2.SetConfiguration"/>.
+		///  
+		///  If you want to get the acceleration periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletAccelerometerV2.AccelerationCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletAccelerometerV2.SetAccelerationCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAcceleration(out int x, out int y, out int z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION);
+
+			byte[] response = SendRequest(request, 20);
+
+			x = LEConverter.IntFrom(8, response);
+			y = LEConverter.IntFrom(12, response);
+			z = LEConverter.IntFrom(16, response);
+		}
+
+		/// <summary>
+		///  Configures the data rate and full scale range.
+		///  Possible values are:
+		///  
+		///  * Data rate of 0.781Hz to 25600Hz.
+		///  * Full scale range of ±2g up to ±8g.
+		///  
+		///  Decreasing data rate or full scale range will also decrease the noise on
+		///  the data.
+		/// </summary>
+		public void SetConfiguration(byte dataRate, byte fullScale)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_CONFIGURATION);
+			LEConverter.To((byte)dataRate, 8, request);
+			LEConverter.To((byte)fullScale, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletAccelerometerV2.SetConfiguration"/>.
+		/// </summary>
+		public void GetConfiguration(out byte dataRate, out byte fullScale)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			dataRate = LEConverter.ByteFrom(8, response);
+			fullScale = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletAccelerometerV2.AccelerationCallback"/>
+		///  callback is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  If this callback is enabled, the <see cref="Tinkerforge.BrickletAccelerometerV2.ContinuousAcceleration16BitCallback"/> callback
+		///  and <see cref="Tinkerforge.BrickletAccelerometerV2.ContinuousAcceleration8BitCallback"/> callback will automatically be disabled.
+		/// </summary>
+		public void SetAccelerationCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletAccelerometerV2.SetAccelerationCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAccelerationCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Configures the info LED (marked as "Force" on the Bricklet) to be either turned off,
+		///  turned on, or blink in heartbeat mode.
+		/// </summary>
+		public void SetInfoLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_INFO_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the LED configuration as set by <see cref="Tinkerforge.BrickletAccelerometerV2.SetInfoLEDConfig"/>
+		/// </summary>
+		public byte GetInfoLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_INFO_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  For high throughput of acceleration data (&gt; 1000Hz) you have to use the
+		///  <see cref="Tinkerforge.BrickletAccelerometerV2.ContinuousAcceleration16BitCallback"/> or <see cref="Tinkerforge.BrickletAccelerometerV2.ContinuousAcceleration8BitCallback"/>
+		///  callbacks.
+		///  
+		///  You can enable the callback for each axis (x, y, z) individually and choose a
+		///  resolution of 8 bit or 16 bit.
+		///  
+		///  If at least one of the axis is enabled and the resolution is set to 8 bit,
+		///  the <see cref="Tinkerforge.BrickletAccelerometerV2.ContinuousAcceleration8BitCallback"/> callback is activated. If at least
+		///  one of the axis is enabled and the resolution is set to 16 bit,
+		///  the <see cref="Tinkerforge.BrickletAccelerometerV2.ContinuousAcceleration16BitCallback"/> callback is activated.
+		///  
+		///  The returned values are raw ADC data. If you want to put this data into
+		///  a FFT to determine the occurrences of specific frequencies we recommend
+		///  that you use the data as is. It has all of the ADC noise in it. This noise
+		///  looks like pure noise at first glance, but it might still have some frequnecy
+		///  information in it that can be utilized by the FFT.
+		///  
+		///  Otherwise you have to use the following formulas that depend on the configured
+		///  resolution (8/16 bit) and the full scale range (see <see cref="Tinkerforge.BrickletAccelerometerV2.SetConfiguration"/>) to calculate
+		///  the data in gₙ/10000 (same unit that is returned by <see cref="Tinkerforge.BrickletAccelerometerV2.GetAcceleration"/>):
+		///  
+		///  * 16 bit, full scale 2g: acceleration = value * 625 / 1024
+		///  * 16 bit, full scale 4g: acceleration = value * 1250 / 1024
+		///  * 16 bit, full scale 8g: acceleration = value * 2500 / 1024
+		///  
+		///  If a resolution of 8 bit is used, only the 8 most significant bits will be
+		///  transferred, so you can use the following formulas:
+		///  
+		///  * 8 bit, full scale 2g: acceleration = value * 256 * 625 / 1024
+		///  * 8 bit, full scale 4g: acceleration = value * 256 * 1250 / 1024
+		///  * 8 bit, full scale 8g: acceleration = value * 256 * 2500 / 1024
+		///  
+		///  If no axis is enabled, both callbacks are disabled. If one of the continuous
+		///  callbacks is enabled, the <see cref="Tinkerforge.BrickletAccelerometerV2.AccelerationCallback"/> callback is disabled.
+		///  
+		///  The maximum throughput depends on the exact configuration:
+		///  
+		///  <code>
+		///   "Number of axis enabled", "Throughput 8 bit", "Throughout 16 bit"
+		///  
+		///   "1", "25600Hz", "25600Hz"
+		///   "2", "25600Hz", "15000Hz"
+		///   "3", "20000Hz", "10000Hz"
+		///  </code>
+		/// </summary>
+		public void SetContinuousAccelerationConfiguration(bool enableX, bool enableY, bool enableZ, byte resolution)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_CONTINUOUS_ACCELERATION_CONFIGURATION);
+			LEConverter.To((bool)enableX, 8, request);
+			LEConverter.To((bool)enableY, 9, request);
+			LEConverter.To((bool)enableZ, 10, request);
+			LEConverter.To((byte)resolution, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the continuous acceleration configuration as set by
+		///  <see cref="Tinkerforge.BrickletAccelerometerV2.SetContinuousAccelerationConfiguration"/>.
+		/// </summary>
+		public void GetContinuousAccelerationConfiguration(out bool enableX, out bool enableY, out bool enableZ, out byte resolution)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CONTINUOUS_ACCELERATION_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 12);
+
+			enableX = LEConverter.BoolFrom(8, response);
+			enableY = LEConverter.BoolFrom(9, response);
+			enableZ = LEConverter.BoolFrom(10, response);
+			resolution = LEConverter.ByteFrom(11, response);
+		}
+
+		/// <summary>
+		///  Configures IIR Bypass filter mode and low pass filter roll off corner frequency.
+		///  
+		///  The filter can be applied or bypassed and the corner frequency can be
+		///  half or a ninth of the output data rate.
+		///  
+		///  .. image:: /Images/Bricklets/bricklet_accelerometer_v2_filter.png
+		///     :scale: 100 %
+		///     :alt: Accelerometer filter
+		///     :align: center
+		///     :target: ../../_images/Bricklets/bricklet_accelerometer_v2_filter.png
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetFilterConfiguration(byte iirBypass, byte lowPassFilter)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_FILTER_CONFIGURATION);
+			LEConverter.To((byte)iirBypass, 8, request);
+			LEConverter.To((byte)lowPassFilter, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletAccelerometerV2.SetFilterConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void GetFilterConfiguration(out byte iirBypass, out byte lowPassFilter)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FILTER_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			iirBypass = LEConverter.ByteFrom(8, response);
+			lowPassFilter = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletAccelerometerV2.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletAccelerometerV2.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletAccelerometerV2.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletAccelerometerV2.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAccelerationCallback(byte[] response)
+		{
+			if (response.Length != 20)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int x = LEConverter.IntFrom(8, response);
+			int y = LEConverter.IntFrom(12, response);
+			int z = LEConverter.IntFrom(16, response);
+			var handler = AccelerationCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnContinuousAcceleration16BitCallback(byte[] response)
+		{
+			if (response.Length != 68)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short[] acceleration = LEConverter.ShortArrayFrom(8, response, 30);
+			var handler = ContinuousAcceleration16BitCallback;
+
+			if (handler != null)
+			{
+				handler(this, acceleration);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnContinuousAcceleration8BitCallback(byte[] response)
+		{
+			if (response.Length != 68)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short[] acceleration = LEConverter.SByteArrayFrom(8, response, 60);
+			var handler = ContinuousAcceleration8BitCallback;
+
+			if (handler != null)
+			{
+				handler(this, acceleration);
+			}
+		}
+	}
+}
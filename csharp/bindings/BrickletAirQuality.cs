@@ -0,0 +1,1297 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Measures IAQ index, temperature, humidity and air pressure
+	/// </summary>
+	public class BrickletAirQuality : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 297;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Air Quality Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_VALUES = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TEMPERATURE_OFFSET = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE_OFFSET = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALL_VALUES_CALLBACK_CONFIGURATION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_VALUES_CALLBACK_CONFIGURATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IAQ_INDEX = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_IAQ_INDEX_CALLBACK_CONFIGURATION = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IAQ_INDEX_CALLBACK_CONFIGURATION = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_HUMIDITY = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_HUMIDITY_CALLBACK_CONFIGURATION = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_HUMIDITY_CALLBACK_CONFIGURATION = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_AIR_PRESSURE = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_REMOVE_CALIBRATION = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BACKGROUND_CALIBRATION_DURATION = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BACKGROUND_CALIBRATION_DURATION = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_ALL_VALUES = 6;
+
+		private const int CALLBACK_IAQ_INDEX = 10;
+
+		private const int CALLBACK_TEMPERATURE = 14;
+
+		private const int CALLBACK_HUMIDITY = 18;
+
+		private const int CALLBACK_AIR_PRESSURE = 22;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCURACY_UNRELIABLE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCURACY_LOW = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCURACY_MEDIUM = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCURACY_HIGH = 3;
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OFF = 'x';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OUTSIDE = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_INSIDE = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_SMALLER = '<';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_GREATER = '>';
+
+		/// <summary>
+		/// </summary>
+		public const byte DURATION_4_DAYS = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DURATION_28_DAYS = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletAirQuality.SetAllValuesCallbackConfiguration"/>.
+		///  
+		///  The parameters are the same as <see cref="Tinkerforge.BrickletAirQuality.GetAllValues"/>.
+		/// </summary>
+		public event AllValuesEventHandler AllValuesCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AllValuesEventHandler(BrickletAirQuality sender, int iaqIndex, byte iaqIndexAccuracy, int temperature, int humidity, int airPressure);
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletAirQuality.SetIAQIndexCallbackConfiguration"/>.
+		///  
+		///  The parameters are the same as <see cref="Tinkerforge.BrickletAirQuality.GetIAQIndex"/>.
+		/// </summary>
+		public event IAQIndexEventHandler IAQIndexCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void IAQIndexEventHandler(BrickletAirQuality sender, int iaqIndex, byte iaqIndexAccuracy);
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletAirQuality.SetTemperatureCallbackConfiguration"/>.
+		///  
+		///  The parameter is the same as <see cref="Tinkerforge.BrickletAirQuality.GetTemperature"/>.
+		/// </summary>
+		public event TemperatureEventHandler TemperatureCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void TemperatureEventHandler(BrickletAirQuality sender, int temperature);
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletAirQuality.SetHumidityCallbackConfiguration"/>.
+		///  
+		///  The parameter is the same as <see cref="Tinkerforge.BrickletAirQuality.GetHumidity"/>.
+		/// </summary>
+		public event HumidityEventHandler HumidityCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void HumidityEventHandler(BrickletAirQuality sender, int humidity);
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletAirQuality.SetAirPressureCallbackConfiguration"/>.
+		///  
+		///  The parameter is the same as <see cref="Tinkerforge.BrickletAirQuality.GetAirPressure"/>.
+		/// </summary>
+		public event AirPressureEventHandler AirPressureCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AirPressureEventHandler(BrickletAirQuality sender, int airPressure);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletAirQuality(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_ALL_VALUES] = new CallbackWrapper(OnAllValuesCallback);
+			callbackWrappers[CALLBACK_IAQ_INDEX] = new CallbackWrapper(OnIAQIndexCallback);
+			callbackWrappers[CALLBACK_TEMPERATURE] = new CallbackWrapper(OnTemperatureCallback);
+			callbackWrappers[CALLBACK_HUMIDITY] = new CallbackWrapper(OnHumidityCallback);
+			callbackWrappers[CALLBACK_AIR_PRESSURE] = new CallbackWrapper(OnAirPressureCallback);
+
+
+			responseExpected[FUNCTION_GET_ALL_VALUES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_TEMPERATURE_OFFSET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_TEMPERATURE_OFFSET] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALL_VALUES_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALL_VALUES_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IAQ_INDEX] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_IAQ_INDEX_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_IAQ_INDEX_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_HUMIDITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_HUMIDITY_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_HUMIDITY_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_AIR_PRESSURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_REMOVE_CALIBRATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_BACKGROUND_CALIBRATION_DURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_BACKGROUND_CALIBRATION_DURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns all values measured by the Air Quality Bricklet. The values are
+		///  IAQ (Indoor Air Quality) Index (higher value means greater level of air pollution), IAQ Index Accuracy, Temperature, Humidity and
+		///  Air Pressure.
+		///  
+		///  .. image:: /Images/Misc/bricklet_air_quality_iaq_index.png
+		///     :scale: 100 %
+		///     :alt: Air Quality Index description
+		///     :align: center
+		///     :target: ../../_images/Misc/bricklet_air_quality_iaq_index.png
+		/// </summary>
+		public void GetAllValues(out int iaqIndex, out byte iaqIndexAccuracy, out int temperature, out int humidity, out int airPressure)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_VALUES);
+
+			byte[] response = SendRequest(request, 25);
+
+			iaqIndex = LEConverter.IntFrom(8, response);
+			iaqIndexAccuracy = LEConverter.ByteFrom(12, response);
+			temperature = LEConverter.IntFrom(13, response);
+			humidity = LEConverter.IntFrom(17, response);
+			airPressure = LEConverter.IntFrom(21, response);
+		}
+
+		/// <summary>
+		///  Sets a temperature offset. A offset of 10 will decrease the measured temperature by 0.1 °C.
+		///  
+		///  If you install this Bricklet into an enclosure and you want to measure the ambient
+		///  temperature, you may have to decrease the measured temperature by some value to
+		///  compensate for the error because of the heating inside of the enclosure.
+		///  
+		///  We recommend that you leave the parts in the enclosure running for at least
+		///  24 hours such that a temperature equilibrium can be reached. After that you can measure
+		///  the temperature directly outside of enclosure and set the difference as offset.
+		///  
+		///  This temperature offset is used to calculate the relative humidity and
+		///  IAQ index measurements. In case the Bricklet is installed in an enclosure, we
+		///  recommend to measure and set the temperature offset to improve the accuracy of
+		///  the measurements.
+		/// </summary>
+		public void SetTemperatureOffset(int offset)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_TEMPERATURE_OFFSET);
+			LEConverter.To((int)offset, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the temperature offset as set by
+		///  <see cref="Tinkerforge.BrickletAirQuality.SetTemperatureOffset"/>.
+		/// </summary>
+		public int GetTemperatureOffset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE_OFFSET);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletAirQuality.AllValuesCallback"/>
+		///  callback is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after at least one of the values has changed. If the values didn't
+		///  change within the period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetAllValuesCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_ALL_VALUES_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletAirQuality.SetAllValuesCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAllValuesCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_VALUES_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the IAQ index and accuracy. The higher the IAQ index, the greater the level of air pollution.
+		///  
+		///  .. image:: /Images/Misc/bricklet_air_quality_iaq_index.png
+		///     :scale: 100 %
+		///     :alt: IAQ index description
+		///     :align: center
+		///     :target: ../../_images/Misc/bricklet_air_quality_iaq_index.png
+		///  
+		///  If you want to get the value periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletAirQuality.IAQIndexCallback"/> callback. You can set the callback configuration
+		///  with <see cref="Tinkerforge.BrickletAirQuality.SetIAQIndexCallbackConfiguration"/>.
+		/// </summary>
+		public void GetIAQIndex(out int iaqIndex, out byte iaqIndexAccuracy)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IAQ_INDEX);
+
+			byte[] response = SendRequest(request, 13);
+
+			iaqIndex = LEConverter.IntFrom(8, response);
+			iaqIndexAccuracy = LEConverter.ByteFrom(12, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletAirQuality.IAQIndexCallback"/>
+		///  callback is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after at least one of the values has changed. If the values didn't
+		///  change within the period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetIAQIndexCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_IAQ_INDEX_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletAirQuality.SetIAQIndexCallbackConfiguration"/>.
+		/// </summary>
+		public void GetIAQIndexCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IAQ_INDEX_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns temperature.
+		///  
+		///  
+		///  If you want to get the value periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletAirQuality.TemperatureCallback"/> callback. You can set the callback configuration
+		///  with <see cref="Tinkerforge.BrickletAirQuality.SetTemperatureCallbackConfiguration"/>.
+		/// </summary>
+		public int GetTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletAirQuality.TemperatureCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change
+		///  within the period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  It is furthermore possible to constrain the callback with thresholds.
+		///  
+		///  The `option`-parameter together with min/max sets a threshold for the <see cref="Tinkerforge.BrickletAirQuality.TemperatureCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Threshold is turned off"
+		///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+		///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+		///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+		///  </code>
+		///  
+		///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+		/// </summary>
+		public void SetTemperatureCallbackConfiguration(long period, bool valueHasToChange, char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(22, FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+			LEConverter.To((char)option, 13, request);
+			LEConverter.To((int)min, 14, request);
+			LEConverter.To((int)max, 18, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletAirQuality.SetTemperatureCallbackConfiguration"/>.
+		/// </summary>
+		public void GetTemperatureCallbackConfiguration(out long period, out bool valueHasToChange, out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 22);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+			option = LEConverter.CharFrom(13, response);
+			min = LEConverter.IntFrom(14, response);
+			max = LEConverter.IntFrom(18, response);
+		}
+
+		/// <summary>
+		///  Returns relative humidity.
+		///  
+		///  
+		///  If you want to get the value periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletAirQuality.HumidityCallback"/> callback. You can set the callback configuration
+		///  with <see cref="Tinkerforge.BrickletAirQuality.SetHumidityCallbackConfiguration"/>.
+		/// </summary>
+		public int GetHumidity()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_HUMIDITY);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletAirQuality.HumidityCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change
+		///  within the period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  It is furthermore possible to constrain the callback with thresholds.
+		///  
+		///  The `option`-parameter together with min/max sets a threshold for the <see cref="Tinkerforge.BrickletAirQuality.HumidityCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Threshold is turned off"
+		///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+		///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+		///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+		///  </code>
+		///  
+		///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+		/// </summary>
+		public void SetHumidityCallbackConfiguration(long period, bool valueHasToChange, char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(22, FUNCTION_SET_HUMIDITY_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+			LEConverter.To((char)option, 13, request);
+			LEConverter.To((int)min, 14, request);
+			LEConverter.To((int)max, 18, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletAirQuality.SetHumidityCallbackConfiguration"/>.
+		/// </summary>
+		public void GetHumidityCallbackConfiguration(out long period, out bool valueHasToChange, out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_HUMIDITY_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 22);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+			option = LEConverter.CharFrom(13, response);
+			min = LEConverter.IntFrom(14, response);
+			max = LEConverter.IntFrom(18, response);
+		}
+
+		/// <summary>
+		///  Returns air pressure.
+		///  
+		///  
+		///  If you want to get the value periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletAirQuality.AirPressureCallback"/> callback. You can set the callback configuration
+		///  with <see cref="Tinkerforge.BrickletAirQuality.SetAirPressureCallbackConfiguration"/>.
+		/// </summary>
+		public int GetAirPressure()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_AIR_PRESSURE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletAirQuality.AirPressureCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change
+		///  within the period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  It is furthermore possible to constrain the callback with thresholds.
+		///  
+		///  The `option`-parameter together with min/max sets a threshold for the <see cref="Tinkerforge.BrickletAirQuality.AirPressureCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Threshold is turned off"
+		///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+		///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+		///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+		///  </code>
+		///  
+		///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+		/// </summary>
+		public void SetAirPressureCallbackConfiguration(long period, bool valueHasToChange, char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(22, FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+			LEConverter.To((char)option, 13, request);
+			LEConverter.To((int)min, 14, request);
+			LEConverter.To((int)max, 18, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletAirQuality.SetAirPressureCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAirPressureCallbackConfiguration(out long period, out bool valueHasToChange, out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 22);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+			option = LEConverter.CharFrom(13, response);
+			min = LEConverter.IntFrom(14, response);
+			max = LEConverter.IntFrom(18, response);
+		}
+
+		/// <summary>
+		///  Deletes the calibration from flash. After you call this function,
+		///  you need to power cycle the Air Quality Bricklet.
+		///  
+		///  On the next power up the Bricklet will start a new calibration, as
+		///  if it was started for the very first time.
+		///  
+		///  The calibration is based on the data of the last four days, so it takes
+		///  four days until a full calibration is re-established.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public void RemoveCalibration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_REMOVE_CALIBRATION);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  The Air Quality Bricklet uses an automatic background calibration mechanism to
+		///  calculate the IAQ Index. This calibration mechanism considers a history of
+		///  measured data. The duration of this history can be configured to either be
+		///  4 days or 28 days.
+		///  
+		///  If you keep the Bricklet mostly at one place and it does not get moved around
+		///  to different environments, we recommend that you use a duration of 28 days.
+		///  
+		///  If you change the duration, the current calibration will be discarded and
+		///  the calibration will start from beginning again. The configuration of the
+		///  duration is saved in flash, so you should only have to call this function
+		///  once in the lifetime of the Bricklet.
+		///  
+		///  The Bricklet has to be power cycled after this function is called
+		///  for a duration change to take effect.
+		///  
+		///  Before firmware version 2.0.3 this was not configurable and the duration was
+		///  4 days.
+		///  
+		///  The default value (since firmware version 2.0.3) is 28 days.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public void SetBackgroundCalibrationDuration(byte duration)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BACKGROUND_CALIBRATION_DURATION);
+			LEConverter.To((byte)duration, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the background calibration duration as set by
+		///  <see cref="Tinkerforge.BrickletAirQuality.SetBackgroundCalibrationDuration"/>.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public byte GetBackgroundCalibrationDuration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BACKGROUND_CALIBRATION_DURATION);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletAirQuality.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletAirQuality.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletAirQuality.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletAirQuality.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAllValuesCallback(byte[] response)
+		{
+			if (response.Length != 25)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int iaqIndex = LEConverter.IntFrom(8, response);
+			byte iaqIndexAccuracy = LEConverter.ByteFrom(12, response);
+			int temperature = LEConverter.IntFrom(13, response);
+			int humidity = LEConverter.IntFrom(17, response);
+			int airPressure = LEConverter.IntFrom(21, response);
+			var handler = AllValuesCallback;
+
+			if (handler != null)
+			{
+				handler(this, iaqIndex, iaqIndexAccuracy, temperature, humidity, airPressure);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnIAQIndexCallback(byte[] response)
+		{
+			if (response.Length != 13)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int iaqIndex = LEConverter.IntFrom(8, response);
+			byte iaqIndexAccuracy = LEConverter.ByteFrom(12, response);
+			var handler = IAQIndexCallback;
+
+			if (handler != null)
+			{
+				handler(this, iaqIndex, iaqIndexAccuracy);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnTemperatureCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int temperature = LEConverter.IntFrom(8, response);
+			var handler = TemperatureCallback;
+
+			if (handler != null)
+			{
+				handler(this, temperature);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnHumidityCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int humidity = LEConverter.IntFrom(8, response);
+			var handler = HumidityCallback;
+
+			if (handler != null)
+			{
+				handler(this, humidity);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAirPressureCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int airPressure = LEConverter.IntFrom(8, response);
+			var handler = AirPressureCallback;
+
+			if (handler != null)
+			{
+				handler(this, airPressure);
+			}
+		}
+	}
+}
@@ -0,0 +1,732 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Measures DC voltage between 0V and 45V
+	/// </summary>
+	public class BrickletAnalogIn : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 219;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Analog In Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VOLTAGE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ANALOG_VALUE = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DEBOUNCE_PERIOD = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DEBOUNCE_PERIOD = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RANGE = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RANGE = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_AVERAGING = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_AVERAGING = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_VOLTAGE = 13;
+
+		private const int CALLBACK_ANALOG_VALUE = 14;
+
+		private const int CALLBACK_VOLTAGE_REACHED = 15;
+
+		private const int CALLBACK_ANALOG_VALUE_REACHED = 16;
+
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OFF = 'x';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OUTSIDE = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_INSIDE = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_SMALLER = '<';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_GREATER = '>';
+
+		/// <summary>
+		/// </summary>
+		public const byte RANGE_AUTOMATIC = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte RANGE_UP_TO_6V = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte RANGE_UP_TO_10V = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte RANGE_UP_TO_36V = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte RANGE_UP_TO_45V = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte RANGE_UP_TO_3V = 5;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletAnalogIn.SetVoltageCallbackPeriod"/>. The parameter is the voltage of the
+		///  sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickletAnalogIn.VoltageCallback"/> callback is only triggered if the voltage has changed since
+		///  the last triggering.
+		/// </summary>
+		public event VoltageEventHandler VoltageCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void VoltageEventHandler(BrickletAnalogIn sender, int voltage);
+
+		/// <summary>
+		/// </summary>
+		public event VoltageEventHandler Voltage // for backward compatibility
+		{
+			add { VoltageCallback += value; }
+			remove { VoltageCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletAnalogIn.SetAnalogValueCallbackPeriod"/>. The parameter is the analog
+		///  value of the sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickletAnalogIn.AnalogValueCallback"/> callback is only triggered if the voltage has changed
+		///  since the last triggering.
+		/// </summary>
+		public event AnalogValueEventHandler AnalogValueCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AnalogValueEventHandler(BrickletAnalogIn sender, int value);
+
+		/// <summary>
+		/// </summary>
+		public event AnalogValueEventHandler AnalogValue // for backward compatibility
+		{
+			add { AnalogValueCallback += value; }
+			remove { AnalogValueCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletAnalogIn.SetVoltageCallbackThreshold"/> is reached.
+		///  The parameter is the voltage of the sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletAnalogIn.SetDebouncePeriod"/>.
+		/// </summary>
+		public event VoltageReachedEventHandler VoltageReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void VoltageReachedEventHandler(BrickletAnalogIn sender, int voltage);
+
+		/// <summary>
+		/// </summary>
+		public event VoltageReachedEventHandler VoltageReached // for backward compatibility
+		{
+			add { VoltageReachedCallback += value; }
+			remove { VoltageReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletAnalogIn.SetAnalogValueCallbackThreshold"/> is reached.
+		///  The parameter is the analog value of the sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletAnalogIn.SetDebouncePeriod"/>.
+		/// </summary>
+		public event AnalogValueReachedEventHandler AnalogValueReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AnalogValueReachedEventHandler(BrickletAnalogIn sender, int value);
+
+		/// <summary>
+		/// </summary>
+		public event AnalogValueReachedEventHandler AnalogValueReached // for backward compatibility
+		{
+			add { AnalogValueReachedCallback += value; }
+			remove { AnalogValueReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletAnalogIn(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 3;
+
+			callbackWrappers[CALLBACK_VOLTAGE] = new CallbackWrapper(OnVoltageCallback);
+			callbackWrappers[CALLBACK_ANALOG_VALUE] = new CallbackWrapper(OnAnalogValueCallback);
+			callbackWrappers[CALLBACK_VOLTAGE_REACHED] = new CallbackWrapper(OnVoltageReachedCallback);
+			callbackWrappers[CALLBACK_ANALOG_VALUE_REACHED] = new CallbackWrapper(OnAnalogValueReachedCallback);
+
+
+			responseExpected[FUNCTION_GET_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ANALOG_VALUE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_RANGE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_RANGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_AVERAGING] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_AVERAGING] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the voltage of the sensor. The resolution between 0 and 6V is about 2mV.
+		///  Between 6 and 45V the resolution is about 10mV.
+		///  
+		///  If you want to get the voltage periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletAnalogIn.VoltageCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletAnalogIn.SetVoltageCallbackPeriod"/>.
+		/// </summary>
+		public int GetVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the value as read by a 12-bit analog-to-digital converter.
+		///  
+		///  <note>
+		///   The value returned by <see cref="Tinkerforge.BrickletAnalogIn.GetVoltage"/> is averaged over several samples
+		///   to yield less noise, while <see cref="Tinkerforge.BrickletAnalogIn.GetAnalogValue"/> gives back raw
+		///   unfiltered analog values. The only reason to use <see cref="Tinkerforge.BrickletAnalogIn.GetAnalogValue"/> is,
+		///   if you need the full resolution of the analog-to-digital converter.
+		///  </note>
+		///  
+		///  If you want the analog value periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletAnalogIn.AnalogValueCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletAnalogIn.SetAnalogValueCallbackPeriod"/>.
+		/// </summary>
+		public int GetAnalogValue()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ANALOG_VALUE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletAnalogIn.VoltageCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletAnalogIn.VoltageCallback"/> callback is only triggered if the voltage has changed since
+		///  the last triggering.
+		/// </summary>
+		public void SetVoltageCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletAnalogIn.SetVoltageCallbackPeriod"/>.
+		/// </summary>
+		public long GetVoltageCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletAnalogIn.AnalogValueCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletAnalogIn.AnalogValueCallback"/> callback is only triggered if the analog value has
+		///  changed since the last triggering.
+		/// </summary>
+		public void SetAnalogValueCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ANALOG_VALUE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletAnalogIn.SetAnalogValueCallbackPeriod"/>.
+		/// </summary>
+		public long GetAnalogValueCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ANALOG_VALUE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletAnalogIn.VoltageReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the voltage is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the voltage is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the voltage is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the voltage is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetVoltageCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((short)min, 9, request);
+			LEConverter.To((short)max, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletAnalogIn.SetVoltageCallbackThreshold"/>.
+		/// </summary>
+		public void GetVoltageCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 13);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.UShortFrom(9, response);
+			max = LEConverter.UShortFrom(11, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletAnalogIn.AnalogValueReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the analog value is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the analog value is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the analog value is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the analog value is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetAnalogValueCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_ANALOG_VALUE_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((short)min, 9, request);
+			LEConverter.To((short)max, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletAnalogIn.SetAnalogValueCallbackThreshold"/>.
+		/// </summary>
+		public void GetAnalogValueCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ANALOG_VALUE_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 13);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.UShortFrom(9, response);
+			max = LEConverter.UShortFrom(11, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the threshold callbacks
+		///  
+		///  * <see cref="Tinkerforge.BrickletAnalogIn.VoltageReachedCallback"/>,
+		///  * <see cref="Tinkerforge.BrickletAnalogIn.AnalogValueReachedCallback"/>
+		///  
+		///  are triggered, if the thresholds
+		///  
+		///  * <see cref="Tinkerforge.BrickletAnalogIn.SetVoltageCallbackThreshold"/>,
+		///  * <see cref="Tinkerforge.BrickletAnalogIn.SetAnalogValueCallbackThreshold"/>
+		///  
+		///  keep being reached.
+		/// </summary>
+		public void SetDebouncePeriod(long debounce)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DEBOUNCE_PERIOD);
+			LEConverter.To((int)debounce, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the debounce period as set by <see cref="Tinkerforge.BrickletAnalogIn.SetDebouncePeriod"/>.
+		/// </summary>
+		public long GetDebouncePeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DEBOUNCE_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the measurement range. Possible ranges:
+		///  
+		///  * 0: Automatically switched
+		///  * 1: 0V - 6.05V, ~1.48mV resolution
+		///  * 2: 0V - 10.32V, ~2.52mV resolution
+		///  * 3: 0V - 36.30V, ~8.86mV resolution
+		///  * 4: 0V - 45.00V, ~11.25mV resolution
+		///  * 5: 0V - 3.3V, ~0.81mV resolution, new in version 2.0.3$nbsp;(Plugin)
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Plugin)
+		/// </summary>
+		public void SetRange(byte range)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_RANGE);
+			LEConverter.To((byte)range, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the measurement range as set by <see cref="Tinkerforge.BrickletAnalogIn.SetRange"/>.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Plugin)
+		/// </summary>
+		public byte GetRange()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_RANGE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Set the length of a averaging for the voltage value.
+		///  
+		///  Setting the length to 0 will turn the averaging completely off. If the
+		///  averaging is off, there is more noise on the data, but the data is without
+		///  delay.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public void SetAveraging(byte average)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_AVERAGING);
+			LEConverter.To((byte)average, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the averaging configuration as set by <see cref="Tinkerforge.BrickletAnalogIn.SetAveraging"/>.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public byte GetAveraging()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_AVERAGING);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnVoltageCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.UShortFrom(8, response);
+			var handler = VoltageCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAnalogValueCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int value = LEConverter.UShortFrom(8, response);
+			var handler = AnalogValueCallback;
+
+			if (handler != null)
+			{
+				handler(this, value);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnVoltageReachedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.UShortFrom(8, response);
+			var handler = VoltageReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAnalogValueReachedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int value = LEConverter.UShortFrom(8, response);
+			var handler = AnalogValueReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, value);
+			}
+		}
+	}
+}
@@ -0,0 +1,802 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Measures air pressure and altitude changes
+	/// </summary>
+	public class BrickletBarometer : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 221;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Barometer Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_AIR_PRESSURE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALTITUDE = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_AIR_PRESSURE_CALLBACK_PERIOD = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_AIR_PRESSURE_CALLBACK_PERIOD = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_AIR_PRESSURE_CALLBACK_THRESHOLD = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_AIR_PRESSURE_CALLBACK_THRESHOLD = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALTITUDE_CALLBACK_THRESHOLD = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALTITUDE_CALLBACK_THRESHOLD = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DEBOUNCE_PERIOD = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DEBOUNCE_PERIOD = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_REFERENCE_AIR_PRESSURE = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_REFERENCE_AIR_PRESSURE = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_AVERAGING = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_AVERAGING = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_I2C_MODE = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_I2C_MODE = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_AIR_PRESSURE = 15;
+
+		private const int CALLBACK_ALTITUDE = 16;
+
+		private const int CALLBACK_AIR_PRESSURE_REACHED = 17;
+
+		private const int CALLBACK_ALTITUDE_REACHED = 18;
+
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OFF = 'x';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OUTSIDE = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_INSIDE = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_SMALLER = '<';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_GREATER = '>';
+
+		/// <summary>
+		/// </summary>
+		public const byte I2C_MODE_FAST = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte I2C_MODE_SLOW = 1;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletBarometer.SetAirPressureCallbackPeriod"/>. The parameter is the air
+		///  pressure of the air pressure sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickletBarometer.AirPressureCallback"/> callback is only triggered if the air pressure has
+		///  changed since the last triggering.
+		/// </summary>
+		public event AirPressureEventHandler AirPressureCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AirPressureEventHandler(BrickletBarometer sender, int airPressure);
+
+		/// <summary>
+		/// </summary>
+		public event AirPressureEventHandler AirPressure // for backward compatibility
+		{
+			add { AirPressureCallback += value; }
+			remove { AirPressureCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletBarometer.SetAltitudeCallbackPeriod"/>. The parameter is the altitude of
+		///  the air pressure sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickletBarometer.AltitudeCallback"/> callback is only triggered if the altitude has changed since
+		///  the last triggering.
+		/// </summary>
+		public event AltitudeEventHandler AltitudeCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AltitudeEventHandler(BrickletBarometer sender, int altitude);
+
+		/// <summary>
+		/// </summary>
+		public event AltitudeEventHandler Altitude // for backward compatibility
+		{
+			add { AltitudeCallback += value; }
+			remove { AltitudeCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletBarometer.SetAirPressureCallbackThreshold"/> is reached.
+		///  The parameter is the air pressure of the air pressure sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletBarometer.SetDebouncePeriod"/>.
+		/// </summary>
+		public event AirPressureReachedEventHandler AirPressureReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AirPressureReachedEventHandler(BrickletBarometer sender, int airPressure);
+
+		/// <summary>
+		/// </summary>
+		public event AirPressureReachedEventHandler AirPressureReached // for backward compatibility
+		{
+			add { AirPressureReachedCallback += value; }
+			remove { AirPressureReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletBarometer.SetAltitudeCallbackThreshold"/> is reached.
+		///  The parameter is the altitude of the air pressure sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletBarometer.SetDebouncePeriod"/>.
+		/// </summary>
+		public event AltitudeReachedEventHandler AltitudeReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AltitudeReachedEventHandler(BrickletBarometer sender, int altitude);
+
+		/// <summary>
+		/// </summary>
+		public event AltitudeReachedEventHandler AltitudeReached // for backward compatibility
+		{
+			add { AltitudeReachedCallback += value; }
+			remove { AltitudeReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletBarometer(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 2;
+
+			callbackWrappers[CALLBACK_AIR_PRESSURE] = new CallbackWrapper(OnAirPressureCallback);
+			callbackWrappers[CALLBACK_ALTITUDE] = new CallbackWrapper(OnAltitudeCallback);
+			callbackWrappers[CALLBACK_AIR_PRESSURE_REACHED] = new CallbackWrapper(OnAirPressureReachedCallback);
+			callbackWrappers[CALLBACK_ALTITUDE_REACHED] = new CallbackWrapper(OnAltitudeReachedCallback);
+
+
+			responseExpected[FUNCTION_GET_AIR_PRESSURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ALTITUDE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_AIR_PRESSURE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_AIR_PRESSURE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_AIR_PRESSURE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_AIR_PRESSURE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALTITUDE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALTITUDE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_REFERENCE_AIR_PRESSURE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_REFERENCE_AIR_PRESSURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_AVERAGING] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_AVERAGING] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_I2C_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_I2C_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the air pressure of the air pressure sensor.
+		///  
+		///  If you want to get the air pressure periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletBarometer.AirPressureCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletBarometer.SetAirPressureCallbackPeriod"/>.
+		/// </summary>
+		public int GetAirPressure()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_AIR_PRESSURE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the relative altitude of the air pressure sensor. The value is
+		///  calculated based on the difference between the current air pressure
+		///  and the reference air pressure that can be set with <see cref="Tinkerforge.BrickletBarometer.SetReferenceAirPressure"/>.
+		///  
+		///  If you want to get the altitude periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletBarometer.AltitudeCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletBarometer.SetAltitudeCallbackPeriod"/>.
+		/// </summary>
+		public int GetAltitude()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALTITUDE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletBarometer.AirPressureCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletBarometer.AirPressureCallback"/> callback is only triggered if the air pressure has
+		///  changed since the last triggering.
+		/// </summary>
+		public void SetAirPressureCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_AIR_PRESSURE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletBarometer.SetAirPressureCallbackPeriod"/>.
+		/// </summary>
+		public long GetAirPressureCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_AIR_PRESSURE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletBarometer.AltitudeCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletBarometer.AltitudeCallback"/> callback is only triggered if the altitude has changed since
+		///  the last triggering.
+		/// </summary>
+		public void SetAltitudeCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletBarometer.SetAltitudeCallbackPeriod"/>.
+		/// </summary>
+		public long GetAltitudeCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletBarometer.AirPressureReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the air pressure is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the air pressure is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the air pressure is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the air pressure is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetAirPressureCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_SET_AIR_PRESSURE_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((int)min, 9, request);
+			LEConverter.To((int)max, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletBarometer.SetAirPressureCallbackThreshold"/>.
+		/// </summary>
+		public void GetAirPressureCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_AIR_PRESSURE_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 17);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.IntFrom(9, response);
+			max = LEConverter.IntFrom(13, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletBarometer.AltitudeReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the altitude is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the altitude is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the altitude is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the altitude is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetAltitudeCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_SET_ALTITUDE_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((int)min, 9, request);
+			LEConverter.To((int)max, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletBarometer.SetAltitudeCallbackThreshold"/>.
+		/// </summary>
+		public void GetAltitudeCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALTITUDE_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 17);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.IntFrom(9, response);
+			max = LEConverter.IntFrom(13, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the threshold callbacks
+		///  
+		///  * <see cref="Tinkerforge.BrickletBarometer.AirPressureReachedCallback"/>,
+		///  * <see cref="Tinkerforge.BrickletBarometer.AltitudeReachedCallback"/>
+		///  
+		///  are triggered, if the thresholds
+		///  
+		///  * <see cref="Tinkerforge.BrickletBarometer.SetAirPressureCallbackThreshold"/>,
+		///  * <see cref="Tinkerforge.BrickletBarometer.SetAltitudeCallbackThreshold"/>
+		///  
+		///  keep being reached.
+		/// </summary>
+		public void SetDebouncePeriod(long debounce)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DEBOUNCE_PERIOD);
+			LEConverter.To((int)debounce, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the debounce period as set by <see cref="Tinkerforge.BrickletBarometer.SetDebouncePeriod"/>.
+		/// </summary>
+		public long GetDebouncePeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DEBOUNCE_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the reference air pressure for the altitude calculation.
+		///  Setting the reference to the current air pressure results in a calculated
+		///  altitude of 0cm. Passing 0 is a shortcut for passing the current air pressure as
+		///  reference.
+		///  
+		///  Well known reference values are the Q codes
+		///  `QNH &lt;https://en.wikipedia.org/wiki/QNH&gt;`__ and
+		///  `QFE &lt;https://en.wikipedia.org/wiki/Mean_sea_level_pressure#Mean_sea_level_pressure&gt;`__
+		///  used in aviation.
+		/// </summary>
+		public void SetReferenceAirPressure(int airPressure)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_REFERENCE_AIR_PRESSURE);
+			LEConverter.To((int)airPressure, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the temperature of the air pressure sensor.
+		///  
+		///  This temperature is used internally for temperature compensation of the air
+		///  pressure measurement. It is not as accurate as the temperature measured by the
+		///  :ref:`temperature_bricklet` or the :ref:`temperature_ir_bricklet`.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the reference air pressure as set by <see cref="Tinkerforge.BrickletBarometer.SetReferenceAirPressure"/>.
+		/// </summary>
+		public int GetReferenceAirPressure()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_REFERENCE_AIR_PRESSURE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the different averaging parameters. It is possible to set
+		///  the length of a normal averaging for the temperature and pressure,
+		///  as well as an additional length of a
+		///  `moving average &lt;https://en.wikipedia.org/wiki/Moving_average&gt;`__
+		///  for the pressure. The moving average is calculated from the normal
+		///  averages.  There is no moving average for the temperature.
+		///  
+		///  Setting the all three parameters to 0 will turn the averaging
+		///  completely off. If the averaging is off, there is lots of noise
+		///  on the data, but the data is without delay. Thus we recommend
+		///  to turn the averaging off if the Barometer Bricklet data is
+		///  to be used for sensor fusion with other sensors.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Plugin)
+		/// </summary>
+		public void SetAveraging(byte movingAveragePressure, byte averagePressure, byte averageTemperature)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_AVERAGING);
+			LEConverter.To((byte)movingAveragePressure, 8, request);
+			LEConverter.To((byte)averagePressure, 9, request);
+			LEConverter.To((byte)averageTemperature, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the averaging configuration as set by <see cref="Tinkerforge.BrickletBarometer.SetAveraging"/>.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Plugin)
+		/// </summary>
+		public void GetAveraging(out byte movingAveragePressure, out byte averagePressure, out byte averageTemperature)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_AVERAGING);
+
+			byte[] response = SendRequest(request, 11);
+
+			movingAveragePressure = LEConverter.ByteFrom(8, response);
+			averagePressure = LEConverter.ByteFrom(9, response);
+			averageTemperature = LEConverter.ByteFrom(10, response);
+		}
+
+		/// <summary>
+		///  Sets the I2C mode. Possible modes are:
+		///  
+		///  * 0: Fast (400kHz)
+		///  * 1: Slow (100kHz)
+		///  
+		///  If you have problems with obvious outliers in the
+		///  Barometer Bricklet measurements, they may be caused by EMI issues.
+		///  In this case it may be helpful to lower the I2C speed.
+		///  
+		///  It is however not recommended to lower the I2C speed in applications where
+		///  a high throughput needs to be achieved.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public void SetI2CMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_I2C_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the I2C mode as set by <see cref="Tinkerforge.BrickletBarometer.SetI2CMode"/>.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public byte GetI2CMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_I2C_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAirPressureCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int airPressure = LEConverter.IntFrom(8, response);
+			var handler = AirPressureCallback;
+
+			if (handler != null)
+			{
+				handler(this, airPressure);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAltitudeCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int altitude = LEConverter.IntFrom(8, response);
+			var handler = AltitudeCallback;
+
+			if (handler != null)
+			{
+				handler(this, altitude);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAirPressureReachedCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int airPressure = LEConverter.IntFrom(8, response);
+			var handler = AirPressureReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, airPressure);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAltitudeReachedCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int altitude = LEConverter.IntFrom(8, response);
+			var handler = AltitudeReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, altitude);
+			}
+		}
+	}
+}
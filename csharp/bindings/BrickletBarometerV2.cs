@@ -0,0 +1,1136 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Measures air pressure and altitude changes
+	/// </summary>
+	public class BrickletBarometerV2 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2117;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Barometer Bricklet 2.0";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_AIR_PRESSURE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALTITUDE = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALTITUDE_CALLBACK_CONFIGURATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALTITUDE_CALLBACK_CONFIGURATION = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MOVING_AVERAGE_CONFIGURATION = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MOVING_AVERAGE_CONFIGURATION = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_REFERENCE_AIR_PRESSURE = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_REFERENCE_AIR_PRESSURE = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CALIBRATION = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CALIBRATION = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SENSOR_CONFIGURATION = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SENSOR_CONFIGURATION = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_AIR_PRESSURE = 4;
+
+		private const int CALLBACK_ALTITUDE = 8;
+
+		private const int CALLBACK_TEMPERATURE = 12;
+
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OFF = 'x';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OUTSIDE = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_INSIDE = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_SMALLER = '<';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_GREATER = '>';
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_1HZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_10HZ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_25HZ = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_50HZ = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte DATA_RATE_75HZ = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte LOW_PASS_FILTER_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte LOW_PASS_FILTER_1_9TH = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte LOW_PASS_FILTER_1_20TH = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletBarometerV2.SetAirPressureCallbackConfiguration"/>.
+		///  
+		///  The parameter is the same as <see cref="Tinkerforge.BrickletBarometerV2.GetAirPressure"/>.
+		/// </summary>
+		public event AirPressureEventHandler AirPressureCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AirPressureEventHandler(BrickletBarometerV2 sender, int airPressure);
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletBarometerV2.SetAltitudeCallbackConfiguration"/>.
+		///  
+		///  The parameter is the same as <see cref="Tinkerforge.BrickletBarometerV2.GetAltitude"/>.
+		/// </summary>
+		public event AltitudeEventHandler AltitudeCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AltitudeEventHandler(BrickletBarometerV2 sender, int altitude);
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletBarometerV2.SetTemperatureCallbackConfiguration"/>.
+		///  
+		///  The parameter is the same as <see cref="Tinkerforge.BrickletBarometerV2.GetTemperature"/>.
+		/// </summary>
+		public event TemperatureEventHandler TemperatureCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void TemperatureEventHandler(BrickletBarometerV2 sender, int temperature);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletBarometerV2(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_AIR_PRESSURE] = new CallbackWrapper(OnAirPressureCallback);
+			callbackWrappers[CALLBACK_ALTITUDE] = new CallbackWrapper(OnAltitudeCallback);
+			callbackWrappers[CALLBACK_TEMPERATURE] = new CallbackWrapper(OnTemperatureCallback);
+
+
+			responseExpected[FUNCTION_GET_AIR_PRESSURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ALTITUDE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALTITUDE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALTITUDE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MOVING_AVERAGE_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_MOVING_AVERAGE_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_REFERENCE_AIR_PRESSURE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_REFERENCE_AIR_PRESSURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CALIBRATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CALIBRATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SENSOR_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SENSOR_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the measured air pressure.
+		///  
+		///  
+		///  If you want to get the value periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletBarometerV2.AirPressureCallback"/> callback. You can set the callback configuration
+		///  with <see cref="Tinkerforge.BrickletBarometerV2.SetAirPressureCallbackConfiguration"/>.
+		/// </summary>
+		public int GetAirPressure()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_AIR_PRESSURE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletBarometerV2.AirPressureCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change
+		///  within the period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  It is furthermore possible to constrain the callback with thresholds.
+		///  
+		///  The `option`-parameter together with min/max sets a threshold for the <see cref="Tinkerforge.BrickletBarometerV2.AirPressureCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Threshold is turned off"
+		///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+		///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+		///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+		///  </code>
+		///  
+		///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+		/// </summary>
+		public void SetAirPressureCallbackConfiguration(long period, bool valueHasToChange, char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(22, FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+			LEConverter.To((char)option, 13, request);
+			LEConverter.To((int)min, 14, request);
+			LEConverter.To((int)max, 18, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletBarometerV2.SetAirPressureCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAirPressureCallbackConfiguration(out long period, out bool valueHasToChange, out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 22);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+			option = LEConverter.CharFrom(13, response);
+			min = LEConverter.IntFrom(14, response);
+			max = LEConverter.IntFrom(18, response);
+		}
+
+		/// <summary>
+		///  Returns the relative altitude of the air pressure sensor. The value
+		///  is calculated based on the difference between the
+		///  current air pressure and the reference air pressure that can be set
+		///  with <see cref="Tinkerforge.BrickletBarometerV2.SetReferenceAirPressure"/>.
+		///  
+		///  
+		///  If you want to get the value periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletBarometerV2.AltitudeCallback"/> callback. You can set the callback configuration
+		///  with <see cref="Tinkerforge.BrickletBarometerV2.SetAltitudeCallbackConfiguration"/>.
+		/// </summary>
+		public int GetAltitude()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALTITUDE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletBarometerV2.AltitudeCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change
+		///  within the period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  It is furthermore possible to constrain the callback with thresholds.
+		///  
+		///  The `option`-parameter together with min/max sets a threshold for the <see cref="Tinkerforge.BrickletBarometerV2.AltitudeCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Threshold is turned off"
+		///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+		///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+		///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+		///  </code>
+		///  
+		///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+		/// </summary>
+		public void SetAltitudeCallbackConfiguration(long period, bool valueHasToChange, char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(22, FUNCTION_SET_ALTITUDE_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+			LEConverter.To((char)option, 13, request);
+			LEConverter.To((int)min, 14, request);
+			LEConverter.To((int)max, 18, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletBarometerV2.SetAltitudeCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAltitudeCallbackConfiguration(out long period, out bool valueHasToChange, out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALTITUDE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 22);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+			option = LEConverter.CharFrom(13, response);
+			min = LEConverter.IntFrom(14, response);
+			max = LEConverter.IntFrom(18, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature of the air pressure sensor.
+		///  
+		///  This temperature is used internally for temperature compensation
+		///  of the air pressure measurement. It is not as accurate as the
+		///  temperature measured by the :ref:`temperature_v2_bricklet` or the
+		///  :ref:`temperature_ir_v2_bricklet`.
+		///  
+		///  
+		///  If you want to get the value periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletBarometerV2.TemperatureCallback"/> callback. You can set the callback configuration
+		///  with <see cref="Tinkerforge.BrickletBarometerV2.SetTemperatureCallbackConfiguration"/>.
+		/// </summary>
+		public int GetTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletBarometerV2.TemperatureCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change
+		///  within the period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  It is furthermore possible to constrain the callback with thresholds.
+		///  
+		///  The `option`-parameter together with min/max sets a threshold for the <see cref="Tinkerforge.BrickletBarometerV2.TemperatureCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Threshold is turned off"
+		///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+		///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+		///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+		///  </code>
+		///  
+		///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+		/// </summary>
+		public void SetTemperatureCallbackConfiguration(long period, bool valueHasToChange, char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(22, FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+			LEConverter.To((char)option, 13, request);
+			LEConverter.To((int)min, 14, request);
+			LEConverter.To((int)max, 18, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletBarometerV2.SetTemperatureCallbackConfiguration"/>.
+		/// </summary>
+		public void GetTemperatureCallbackConfiguration(out long period, out bool valueHasToChange, out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 22);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+			option = LEConverter.CharFrom(13, response);
+			min = LEConverter.IntFrom(14, response);
+			max = LEConverter.IntFrom(18, response);
+		}
+
+		/// <summary>
+		///  Sets the length of a `moving averaging &lt;https://en.wikipedia.org/wiki/Moving_average&gt;`__
+		///  for the air pressure and temperature measurements.
+		///  
+		///  Setting the length to 1 will turn the averaging off. With less
+		///  averaging, there is more noise on the data.
+		///  
+		///  If you want to do long term measurements the longest moving average will give
+		///  the cleanest results.
+		/// </summary>
+		public void SetMovingAverageConfiguration(int movingAverageLengthAirPressure, int movingAverageLengthTemperature)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_MOVING_AVERAGE_CONFIGURATION);
+			LEConverter.To((short)movingAverageLengthAirPressure, 8, request);
+			LEConverter.To((short)movingAverageLengthTemperature, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the moving average configuration as set by
+		///  <see cref="Tinkerforge.BrickletBarometerV2.SetMovingAverageConfiguration"/>.
+		/// </summary>
+		public void GetMovingAverageConfiguration(out int movingAverageLengthAirPressure, out int movingAverageLengthTemperature)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MOVING_AVERAGE_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 12);
+
+			movingAverageLengthAirPressure = LEConverter.UShortFrom(8, response);
+			movingAverageLengthTemperature = LEConverter.UShortFrom(10, response);
+		}
+
+		/// <summary>
+		///  Sets the reference air pressure for the altitude calculation.
+		///  Setting the reference to the
+		///  current air pressure results in a calculated altitude of 0mm. Passing 0 is
+		///  a shortcut for passing the current air pressure as reference.
+		///  
+		///  Well known reference values are the Q codes
+		///  `QNH &lt;https://en.wikipedia.org/wiki/QNH&gt;`__ and
+		///  `QFE &lt;https://en.wikipedia.org/wiki/Mean_sea_level_pressure#Mean_sea_level_pressure&gt;`__
+		///  used in aviation.
+		/// </summary>
+		public void SetReferenceAirPressure(int airPressure)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_REFERENCE_AIR_PRESSURE);
+			LEConverter.To((int)airPressure, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the reference air pressure as set by <see cref="Tinkerforge.BrickletBarometerV2.SetReferenceAirPressure"/>.
+		/// </summary>
+		public int GetReferenceAirPressure()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_REFERENCE_AIR_PRESSURE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the one point calibration (OPC) values for the air pressure measurement.
+		///  
+		///  Before the Bricklet can be calibrated any previous calibration has to be removed
+		///  by setting ``measured air pressure`` and ``actual air pressure`` to 0.
+		///  
+		///  Then the current air pressure has to be measured using the Bricklet
+		///  (``measured air pressure``) and with an accurate reference barometer
+		///  (``actual air pressure``) at the same time and passed to this function.
+		///  
+		///  After proper calibration the air pressure measurement can achieve an accuracy
+		///  up to 0.2 hPa.
+		///  
+		///  The calibration is saved in the EEPROM of the Bricklet and only needs to be
+		///  configured once.
+		/// </summary>
+		public void SetCalibration(int measuredAirPressure, int actualAirPressure)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(16, FUNCTION_SET_CALIBRATION);
+			LEConverter.To((int)measuredAirPressure, 8, request);
+			LEConverter.To((int)actualAirPressure, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the air pressure one point calibration values as set by
+		///  <see cref="Tinkerforge.BrickletBarometerV2.SetCalibration"/>.
+		/// </summary>
+		public void GetCalibration(out int measuredAirPressure, out int actualAirPressure)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CALIBRATION);
+
+			byte[] response = SendRequest(request, 16);
+
+			measuredAirPressure = LEConverter.IntFrom(8, response);
+			actualAirPressure = LEConverter.IntFrom(12, response);
+		}
+
+		/// <summary>
+		///  Configures the data rate and air pressure low pass filter. The low pass filter
+		///  cut-off frequency (if enabled) can be set to 1/9th or 1/20th of the configure
+		///  data rate to decrease the noise on the air pressure data.
+		///  
+		///  The low pass filter configuration only applies to the air pressure measurement.
+		///  There is no low pass filter for the temperature measurement.
+		///  
+		///  A higher data rate will result in a less precise temperature because of
+		///  self-heating of the sensor. If the accuracy of the temperature reading is
+		///  important to you, we would recommend the 1Hz data rate.
+		/// </summary>
+		public void SetSensorConfiguration(byte dataRate, byte airPressureLowPassFilter)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_SENSOR_CONFIGURATION);
+			LEConverter.To((byte)dataRate, 8, request);
+			LEConverter.To((byte)airPressureLowPassFilter, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the sensor configuration as set by <see cref="Tinkerforge.BrickletBarometerV2.SetSensorConfiguration"/>.
+		/// </summary>
+		public void GetSensorConfiguration(out byte dataRate, out byte airPressureLowPassFilter)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SENSOR_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			dataRate = LEConverter.ByteFrom(8, response);
+			airPressureLowPassFilter = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletBarometerV2.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletBarometerV2.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletBarometerV2.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletBarometerV2.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAirPressureCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int airPressure = LEConverter.IntFrom(8, response);
+			var handler = AirPressureCallback;
+
+			if (handler != null)
+			{
+				handler(this, airPressure);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAltitudeCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int altitude = LEConverter.IntFrom(8, response);
+			var handler = AltitudeCallback;
+
+			if (handler != null)
+			{
+				handler(this, altitude);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnTemperatureCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int temperature = LEConverter.IntFrom(8, response);
+			var handler = TemperatureCallback;
+
+			if (handler != null)
+			{
+				handler(this, temperature);
+			}
+		}
+	}
+}
@@ -0,0 +1,823 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Measures color (RGB value), illuminance and color temperature
+	/// </summary>
+	public class BrickletColor : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 243;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Color Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COLOR = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_COLOR_CALLBACK_PERIOD = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COLOR_CALLBACK_PERIOD = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_COLOR_CALLBACK_THRESHOLD = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COLOR_CALLBACK_THRESHOLD = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DEBOUNCE_PERIOD = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DEBOUNCE_PERIOD = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_LIGHT_ON = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_LIGHT_OFF = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_LIGHT_ON = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CONFIG = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CONFIG = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ILLUMINANCE = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COLOR_TEMPERATURE = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ILLUMINANCE_CALLBACK_PERIOD = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ILLUMINANCE_CALLBACK_PERIOD = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_COLOR_TEMPERATURE_CALLBACK_PERIOD = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COLOR_TEMPERATURE_CALLBACK_PERIOD = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_COLOR = 8;
+
+		private const int CALLBACK_COLOR_REACHED = 9;
+
+		private const int CALLBACK_ILLUMINANCE = 21;
+
+		private const int CALLBACK_COLOR_TEMPERATURE = 22;
+
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OFF = 'x';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OUTSIDE = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_INSIDE = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_SMALLER = '<';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_GREATER = '>';
+
+		/// <summary>
+		/// </summary>
+		public const byte LIGHT_ON = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte LIGHT_OFF = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte GAIN_1X = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte GAIN_4X = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte GAIN_16X = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte GAIN_60X = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte INTEGRATION_TIME_2MS = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte INTEGRATION_TIME_24MS = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte INTEGRATION_TIME_101MS = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte INTEGRATION_TIME_154MS = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte INTEGRATION_TIME_700MS = 4;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletColor.SetColorCallbackPeriod"/>. The parameter is the color
+		///  of the sensor as RGBC.
+		///  
+		///  The <see cref="Tinkerforge.BrickletColor.ColorCallback"/> callback is only triggered if the color has changed since the
+		///  last triggering.
+		/// </summary>
+		public event ColorEventHandler ColorCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ColorEventHandler(BrickletColor sender, int r, int g, int b, int c);
+
+		/// <summary>
+		/// </summary>
+		public event ColorEventHandler Color // for backward compatibility
+		{
+			add { ColorCallback += value; }
+			remove { ColorCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletColor.SetColorCallbackThreshold"/> is reached.
+		///  The parameter is the color
+		///  of the sensor as RGBC.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletColor.SetDebouncePeriod"/>.
+		/// </summary>
+		public event ColorReachedEventHandler ColorReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ColorReachedEventHandler(BrickletColor sender, int r, int g, int b, int c);
+
+		/// <summary>
+		/// </summary>
+		public event ColorReachedEventHandler ColorReached // for backward compatibility
+		{
+			add { ColorReachedCallback += value; }
+			remove { ColorReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletColor.SetIlluminanceCallbackPeriod"/>. The parameter is the illuminance.
+		///  See <see cref="Tinkerforge.BrickletColor.GetIlluminance"/> for how to interpret this value.
+		///  
+		///  The <see cref="Tinkerforge.BrickletColor.IlluminanceCallback"/> callback is only triggered if the illuminance has changed
+		///  since the last triggering.
+		/// </summary>
+		public event IlluminanceEventHandler IlluminanceCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void IlluminanceEventHandler(BrickletColor sender, long illuminance);
+
+		/// <summary>
+		/// </summary>
+		public event IlluminanceEventHandler Illuminance // for backward compatibility
+		{
+			add { IlluminanceCallback += value; }
+			remove { IlluminanceCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletColor.SetColorTemperatureCallbackPeriod"/>. The parameter is the
+		///  color temperature.
+		///  
+		///  The <see cref="Tinkerforge.BrickletColor.ColorTemperatureCallback"/> callback is only triggered if the color temperature
+		///  has changed since the last triggering.
+		/// </summary>
+		public event ColorTemperatureEventHandler ColorTemperatureCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ColorTemperatureEventHandler(BrickletColor sender, int colorTemperature);
+
+		/// <summary>
+		/// </summary>
+		public event ColorTemperatureEventHandler ColorTemperature // for backward compatibility
+		{
+			add { ColorTemperatureCallback += value; }
+			remove { ColorTemperatureCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletColor(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_COLOR] = new CallbackWrapper(OnColorCallback);
+			callbackWrappers[CALLBACK_COLOR_REACHED] = new CallbackWrapper(OnColorReachedCallback);
+			callbackWrappers[CALLBACK_ILLUMINANCE] = new CallbackWrapper(OnIlluminanceCallback);
+			callbackWrappers[CALLBACK_COLOR_TEMPERATURE] = new CallbackWrapper(OnColorTemperatureCallback);
+
+
+			responseExpected[FUNCTION_GET_COLOR] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_COLOR_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_COLOR_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_COLOR_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_COLOR_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_LIGHT_ON] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_LIGHT_OFF] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_LIGHT_ON] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ILLUMINANCE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_COLOR_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ILLUMINANCE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ILLUMINANCE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_COLOR_TEMPERATURE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_COLOR_TEMPERATURE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the measured color of the sensor.
+		///  
+		///  The red (r), green (g), blue (b) and clear (c) colors are measured
+		///  with four different photodiodes that are responsive at different
+		///  wavelengths:
+		///  
+		///  .. image:: /Images/Bricklets/bricklet_color_wavelength_chart_600.jpg
+		///     :scale: 100 %
+		///     :alt: Chart Responsivity / Wavelength
+		///     :align: center
+		///     :target: ../../_images/Bricklets/bricklet_color_wavelength_chart_600.jpg
+		///  
+		///  If you want to get the color periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletColor.ColorCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletColor.SetColorCallbackPeriod"/>.
+		/// </summary>
+		public void GetColor(out int r, out int g, out int b, out int c)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COLOR);
+
+			byte[] response = SendRequest(request, 16);
+
+			r = LEConverter.UShortFrom(8, response);
+			g = LEConverter.UShortFrom(10, response);
+			b = LEConverter.UShortFrom(12, response);
+			c = LEConverter.UShortFrom(14, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletColor.ColorCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletColor.ColorCallback"/> callback is only triggered if the color has changed since the
+		///  last triggering.
+		/// </summary>
+		public void SetColorCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_COLOR_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletColor.SetColorCallbackPeriod"/>.
+		/// </summary>
+		public long GetColorCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COLOR_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletColor.ColorReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the temperature is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the temperature is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the temperature is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the temperature is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetColorCallbackThreshold(char option, int minR, int maxR, int minG, int maxG, int minB, int maxB, int minC, int maxC)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(25, FUNCTION_SET_COLOR_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((short)minR, 9, request);
+			LEConverter.To((short)maxR, 11, request);
+			LEConverter.To((short)minG, 13, request);
+			LEConverter.To((short)maxG, 15, request);
+			LEConverter.To((short)minB, 17, request);
+			LEConverter.To((short)maxB, 19, request);
+			LEConverter.To((short)minC, 21, request);
+			LEConverter.To((short)maxC, 23, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletColor.SetColorCallbackThreshold"/>.
+		/// </summary>
+		public void GetColorCallbackThreshold(out char option, out int minR, out int maxR, out int minG, out int maxG, out int minB, out int maxB, out int minC, out int maxC)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COLOR_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 25);
+
+			option = LEConverter.CharFrom(8, response);
+			minR = LEConverter.UShortFrom(9, response);
+			maxR = LEConverter.UShortFrom(11, response);
+			minG = LEConverter.UShortFrom(13, response);
+			maxG = LEConverter.UShortFrom(15, response);
+			minB = LEConverter.UShortFrom(17, response);
+			maxB = LEConverter.UShortFrom(19, response);
+			minC = LEConverter.UShortFrom(21, response);
+			maxC = LEConverter.UShortFrom(23, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the threshold callback
+		///  
+		///  * <see cref="Tinkerforge.BrickletColor.ColorReachedCallback"/>
+		///  
+		///  is triggered, if the threshold
+		///  
+		///  * <see cref="Tinkerforge.BrickletColor.SetColorCallbackThreshold"/>
+		///  
+		///  keeps being reached.
+		/// </summary>
+		public void SetDebouncePeriod(long debounce)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DEBOUNCE_PERIOD);
+			LEConverter.To((int)debounce, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the debounce period as set by <see cref="Tinkerforge.BrickletColor.SetDebouncePeriod"/>.
+		/// </summary>
+		public long GetDebouncePeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DEBOUNCE_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Turns the LED on.
+		/// </summary>
+		public void LightOn()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_LIGHT_ON);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Turns the LED off.
+		/// </summary>
+		public void LightOff()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_LIGHT_OFF);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the state of the LED. Possible values are:
+		///  
+		///  * 0: On
+		///  * 1: Off
+		/// </summary>
+		public byte IsLightOn()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_LIGHT_ON);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the configuration of the sensor. Gain and integration time
+		///  can be configured in this way.
+		///  
+		///  For configuring the gain:
+		///  
+		///  * 0: 1x Gain
+		///  * 1: 4x Gain
+		///  * 2: 16x Gain
+		///  * 3: 60x Gain
+		///  
+		///  For configuring the integration time:
+		///  
+		///  * 0: 2.4ms
+		///  * 1: 24ms
+		///  * 2: 101ms
+		///  * 3: 154ms
+		///  * 4: 700ms
+		///  
+		///  Increasing the gain enables the sensor to detect a
+		///  color from a higher distance.
+		///  
+		///  The integration time provides a trade-off between conversion time
+		///  and accuracy. With a longer integration time the values read will
+		///  be more accurate but it will take longer time to get the conversion
+		///  results.
+		/// </summary>
+		public void SetConfig(byte gain, byte integrationTime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_CONFIG);
+			LEConverter.To((byte)gain, 8, request);
+			LEConverter.To((byte)integrationTime, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletColor.SetConfig"/>.
+		/// </summary>
+		public void GetConfig(out byte gain, out byte integrationTime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CONFIG);
+
+			byte[] response = SendRequest(request, 10);
+
+			gain = LEConverter.ByteFrom(8, response);
+			integrationTime = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the illuminance affected by the gain and integration time as
+		///  set by <see cref="Tinkerforge.BrickletColor.SetConfig"/>. To get the illuminance in Lux apply this formula::
+		///  
+		///   lux = illuminance * 700 / gain / integration_time
+		///  
+		///  To get a correct illuminance measurement make sure that the color
+		///  values themselves are not saturated. The color value (R, G or B)
+		///  is saturated if it is equal to the maximum value of 65535.
+		///  In that case you have to reduce the gain, see <see cref="Tinkerforge.BrickletColor.SetConfig"/>.
+		/// </summary>
+		public long GetIlluminance()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ILLUMINANCE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the color temperature.
+		///  
+		///  To get a correct color temperature measurement make sure that the color
+		///  values themselves are not saturated. The color value (R, G or B)
+		///  is saturated if it is equal to the maximum value of 65535.
+		///  In that case you have to reduce the gain, see <see cref="Tinkerforge.BrickletColor.SetConfig"/>.
+		/// </summary>
+		public int GetColorTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COLOR_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletColor.IlluminanceCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletColor.IlluminanceCallback"/> callback is only triggered if the illuminance has changed
+		///  since the last triggering.
+		/// </summary>
+		public void SetIlluminanceCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ILLUMINANCE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletColor.SetIlluminanceCallbackPeriod"/>.
+		/// </summary>
+		public long GetIlluminanceCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ILLUMINANCE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletColor.ColorTemperatureCallback"/> callback is
+		///  triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletColor.ColorTemperatureCallback"/> callback is only triggered if the color temperature
+		///  has changed since the last triggering.
+		/// </summary>
+		public void SetColorTemperatureCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_COLOR_TEMPERATURE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletColor.SetColorTemperatureCallbackPeriod"/>.
+		/// </summary>
+		public long GetColorTemperatureCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COLOR_TEMPERATURE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnColorCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int r = LEConverter.UShortFrom(8, response);
+			int g = LEConverter.UShortFrom(10, response);
+			int b = LEConverter.UShortFrom(12, response);
+			int c = LEConverter.UShortFrom(14, response);
+			var handler = ColorCallback;
+
+			if (handler != null)
+			{
+				handler(this, r, g, b, c);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnColorReachedCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int r = LEConverter.UShortFrom(8, response);
+			int g = LEConverter.UShortFrom(10, response);
+			int b = LEConverter.UShortFrom(12, response);
+			int c = LEConverter.UShortFrom(14, response);
+			var handler = ColorReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, r, g, b, c);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnIlluminanceCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long illuminance = LEConverter.UIntFrom(8, response);
+			var handler = IlluminanceCallback;
+
+			if (handler != null)
+			{
+				handler(this, illuminance);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnColorTemperatureCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int colorTemperature = LEConverter.UShortFrom(8, response);
+			var handler = ColorTemperatureCallback;
+
+			if (handler != null)
+			{
+				handler(this, colorTemperature);
+			}
+		}
+	}
+}
@@ -0,0 +1,1196 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  DMX master and slave
+	/// </summary>
+	public class BrickletDMX : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 285;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "DMX Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DMX_MODE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DMX_MODE = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FRAME_LOW_LEVEL = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_FRAME_LOW_LEVEL = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FRAME_DURATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FRAME_DURATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FRAME_ERROR_COUNT = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_COMMUNICATION_LED_CONFIG = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COMMUNICATION_LED_CONFIG = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ERROR_LED_CONFIG = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ERROR_LED_CONFIG = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FRAME_CALLBACK_CONFIG = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FRAME_CALLBACK_CONFIG = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_FRAME_STARTED = 14;
+
+		private const int CALLBACK_FRAME_AVAILABLE = 15;
+
+		private const int CALLBACK_FRAME_LOW_LEVEL = 16;
+
+		private const int CALLBACK_FRAME_ERROR_COUNT = 17;
+
+		private const int CALLBACK_FRAME = -16;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte DMX_MODE_MASTER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DMX_MODE_SLAVE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_LED_CONFIG_SHOW_COMMUNICATION = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_SHOW_ERROR = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered as soon as a new frame write is started.
+		///  You should send the data for the next frame directly after this callback
+		///  was triggered.
+		///  
+		///  For an explanation of the general approach see <see cref="Tinkerforge.BrickletDMX.WriteFrame"/>.
+		///  
+		///  This callback can be enabled via <see cref="Tinkerforge.BrickletDMX.SetFrameCallbackConfig"/>.
+		///  
+		///  This callback can only be triggered in master mode.
+		/// </summary>
+		public event FrameStartedEventHandler FrameStartedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FrameStartedEventHandler(BrickletDMX sender);
+
+		/// <summary>
+		///  This callback is triggered in slave mode when a new frame was received from the DMX master
+		///  and it can be read out. You have to read the frame before the master has written
+		///  the next frame, see <see cref="Tinkerforge.BrickletDMX.ReadFrame"/> for more details.
+		///  
+		///  The parameter is the frame number, it is increased by one with each received frame.
+		///  
+		///  This callback can be enabled via <see cref="Tinkerforge.BrickletDMX.SetFrameCallbackConfig"/>.
+		///  
+		///  This callback can only be triggered in slave mode.
+		/// </summary>
+		public event FrameAvailableEventHandler FrameAvailableCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FrameAvailableEventHandler(BrickletDMX sender, long frameNumber);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletDMX.FrameCallback"/>
+		/// </summary>
+		public event FrameLowLevelEventHandler FrameLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FrameLowLevelEventHandler(BrickletDMX sender, int frameLength, int frameChunkOffset, byte[] frameChunkData, long frameNumber);
+
+		/// <summary>
+		///  This callback is called if a new error occurs. It returns
+		///  the current overrun and framing error count.
+		/// </summary>
+		public event FrameErrorCountEventHandler FrameErrorCountCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FrameErrorCountEventHandler(BrickletDMX sender, long overrunErrorCount, long framingErrorCount);
+
+		/// <summary>
+		///  This callback is called as soon as a new frame is available
+		///  (written by the DMX master).
+		///  
+		///  The size of the array is equivalent to the number of channels in
+		///  the frame. Each byte represents one channel.
+		///  
+		///  This callback can be enabled via <see cref="Tinkerforge.BrickletDMX.SetFrameCallbackConfig"/>.
+		///  
+		///  This callback can only be triggered in slave mode.
+		///  
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for frame.
+		///  </note>
+		/// </summary>
+		public event FrameEventHandler FrameCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FrameEventHandler(BrickletDMX sender, byte[] frame, long frameNumber);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletDMX(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_FRAME_STARTED] = new CallbackWrapper(OnFrameStartedCallback);
+			callbackWrappers[CALLBACK_FRAME_AVAILABLE] = new CallbackWrapper(OnFrameAvailableCallback);
+			callbackWrappers[CALLBACK_FRAME_LOW_LEVEL] = new CallbackWrapper(OnFrameLowLevelCallback);
+			callbackWrappers[CALLBACK_FRAME_ERROR_COUNT] = new CallbackWrapper(OnFrameErrorCountCallback);
+
+			highLevelCallbacks[-CALLBACK_FRAME] = new HighLevelCallback();
+
+			responseExpected[FUNCTION_SET_DMX_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_DMX_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_WRITE_FRAME_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_READ_FRAME_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_FRAME_DURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_FRAME_DURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_FRAME_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_COMMUNICATION_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_COMMUNICATION_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ERROR_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_ERROR_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_FRAME_CALLBACK_CONFIG] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_FRAME_CALLBACK_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Sets the DMX mode to either master or slave.
+		///  
+		///  Calling this function sets frame number to 0.
+		/// </summary>
+		public void SetDMXMode(byte dmxMode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_DMX_MODE);
+			LEConverter.To((byte)dmxMode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the DMX mode, as set by <see cref="Tinkerforge.BrickletDMX.SetDMXMode"/>.
+		/// </summary>
+		public byte GetDMXMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DMX_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Writes a DMX frame. The maximum frame size is 512 byte. Each byte represents one channel.
+		///  
+		///  The next frame can be written after the <see cref="Tinkerforge.BrickletDMX.FrameStartedCallback"/> callback was called. The frame
+		///  is double buffered, so a new frame can be written as soon as the writing of the prior frame
+		///  starts.
+		///  
+		///  The data will be transfered when the next frame duration ends, see <see cref="Tinkerforge.BrickletDMX.SetFrameDuration"/>.
+		///  
+		///  Generic approach:
+		///  
+		///  * Set the frame duration to a value that represents the number of frames per second you want to achieve.
+		///  * Set channels for first frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletDMX.FrameStartedCallback"/> callback.
+		///  * Set channels for next frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletDMX.FrameStartedCallback"/> callback.
+		///  * and so on.
+		///  
+		///  This approach ensures that you can set new DMX data with a fixed frame rate.
+		///  
+		///  This function can only be called in master mode.
+		/// </summary>
+		public void WriteFrameLowLevel(int frameLength, int frameChunkOffset, byte[] frameChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FRAME_LOW_LEVEL);
+			LEConverter.To((short)frameLength, 8, request);
+			LEConverter.To((short)frameChunkOffset, 10, request);
+			LEConverter.To((byte[])frameChunkData, 12, 60, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the last frame that was written by the DMX master. The size of the array
+		///  is equivalent to the number of channels in the frame. Each byte represents one channel.
+		///  
+		///  The next frame is available after the <see cref="Tinkerforge.BrickletDMX.FrameAvailableCallback"/> callback was called.
+		///  
+		///  Generic approach:
+		///  
+		///  * Call <see cref="Tinkerforge.BrickletDMX.ReadFrame"/> to get first frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletDMX.FrameAvailableCallback"/> callback.
+		///  * Call <see cref="Tinkerforge.BrickletDMX.ReadFrame"/> to get second frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletDMX.FrameAvailableCallback"/> callback.
+		///  * and so on.
+		///  
+		///  Instead of polling this function you can also use the <see cref="Tinkerforge.BrickletDMX.FrameCallback"/> callback.
+		///  You can enable it with <see cref="Tinkerforge.BrickletDMX.SetFrameCallbackConfig"/>.
+		///  
+		///  The frame number starts at 0 and it is increased by one with each received frame.
+		///  
+		///  This function can only be called in slave mode.
+		/// </summary>
+		public void ReadFrameLowLevel(out int frameLength, out int frameChunkOffset, out byte[] frameChunkData, out long frameNumber)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_FRAME_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			frameLength = LEConverter.UShortFrom(8, response);
+			frameChunkOffset = LEConverter.UShortFrom(10, response);
+			frameChunkData = LEConverter.ByteArrayFrom(12, response, 56);
+			frameNumber = LEConverter.UIntFrom(68, response);
+		}
+
+		/// <summary>
+		///  Sets the duration of a frame.
+		///  
+		///  Example: If you want to achieve 20 frames per second, you should
+		///  set the frame duration to 50ms (50ms * 20 = 1 second).
+		///  
+		///  If you always want to send a frame as fast as possible you can set
+		///  this value to 0.
+		///  
+		///  This setting is only used in master mode.
+		/// </summary>
+		public void SetFrameDuration(int frameDuration)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_FRAME_DURATION);
+			LEConverter.To((short)frameDuration, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the frame duration as set by <see cref="Tinkerforge.BrickletDMX.SetFrameDuration"/>.
+		/// </summary>
+		public int GetFrameDuration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FRAME_DURATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current number of overrun and framing errors.
+		/// </summary>
+		public void GetFrameErrorCount(out long overrunErrorCount, out long framingErrorCount)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FRAME_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 16);
+
+			overrunErrorCount = LEConverter.UIntFrom(8, response);
+			framingErrorCount = LEConverter.UIntFrom(12, response);
+		}
+
+		/// <summary>
+		///  Sets the communication LED configuration. By default the LED shows
+		///  communication traffic, it flickers once for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is off.
+		/// </summary>
+		public void SetCommunicationLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_COMMUNICATION_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletDMX.SetCommunicationLEDConfig"/>
+		/// </summary>
+		public byte GetCommunicationLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COMMUNICATION_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the error LED configuration.
+		///  
+		///  By default the error LED turns on if there is any error (see <see cref="Tinkerforge.BrickletDMX.FrameErrorCountCallback"/>
+		///  callback). If you call this function with the Show-Error option again, the LED
+		///  will turn off until the next error occurs.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is off.
+		/// </summary>
+		public void SetErrorLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_ERROR_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletDMX.SetErrorLEDConfig"/>.
+		/// </summary>
+		public byte GetErrorLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ERROR_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Enables/Disables the different callbacks. By default the
+		///  <see cref="Tinkerforge.BrickletDMX.FrameStartedCallback"/> callback and <see cref="Tinkerforge.BrickletDMX.FrameAvailableCallback"/> callback are enabled while
+		///  the <see cref="Tinkerforge.BrickletDMX.FrameCallback"/> callback and <see cref="Tinkerforge.BrickletDMX.FrameErrorCountCallback"/> callback are disabled.
+		///  
+		///  If you want to use the <see cref="Tinkerforge.BrickletDMX.FrameCallback"/> callback you can enable it and disable
+		///  the cb:`Frame Available` callback at the same time. It becomes redundant in
+		///  this case.
+		/// </summary>
+		public void SetFrameCallbackConfig(bool frameStartedCallbackEnabled, bool frameAvailableCallbackEnabled, bool frameCallbackEnabled, bool frameErrorCountCallbackEnabled)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_FRAME_CALLBACK_CONFIG);
+			LEConverter.To((bool)frameStartedCallbackEnabled, 8, request);
+			LEConverter.To((bool)frameAvailableCallbackEnabled, 9, request);
+			LEConverter.To((bool)frameCallbackEnabled, 10, request);
+			LEConverter.To((bool)frameErrorCountCallbackEnabled, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the frame callback config as set by <see cref="Tinkerforge.BrickletDMX.SetFrameCallbackConfig"/>.
+		/// </summary>
+		public void GetFrameCallbackConfig(out bool frameStartedCallbackEnabled, out bool frameAvailableCallbackEnabled, out bool frameCallbackEnabled, out bool frameErrorCountCallbackEnabled)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FRAME_CALLBACK_CONFIG);
+
+			byte[] response = SendRequest(request, 12);
+
+			frameStartedCallbackEnabled = LEConverter.BoolFrom(8, response);
+			frameAvailableCallbackEnabled = LEConverter.BoolFrom(9, response);
+			frameCallbackEnabled = LEConverter.BoolFrom(10, response);
+			frameErrorCountCallbackEnabled = LEConverter.BoolFrom(11, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletDMX.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletDMX.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletDMX.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletDMX.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Writes a DMX frame. The maximum frame size is 512 byte. Each byte represents one channel.
+		///  
+		///  The next frame can be written after the <see cref="Tinkerforge.BrickletDMX.FrameStartedCallback"/> callback was called. The frame
+		///  is double buffered, so a new frame can be written as soon as the writing of the prior frame
+		///  starts.
+		///  
+		///  The data will be transfered when the next frame duration ends, see <see cref="Tinkerforge.BrickletDMX.SetFrameDuration"/>.
+		///  
+		///  Generic approach:
+		///  
+		///  * Set the frame duration to a value that represents the number of frames per second you want to achieve.
+		///  * Set channels for first frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletDMX.FrameStartedCallback"/> callback.
+		///  * Set channels for next frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletDMX.FrameStartedCallback"/> callback.
+		///  * and so on.
+		///  
+		///  This approach ensures that you can set new DMX data with a fixed frame rate.
+		///  
+		///  This function can only be called in master mode.
+		/// </summary>
+		public void WriteFrame(byte[] frame)
+		{
+			if (frame.Length > 65535)
+			{
+				throw new ArgumentException("Frame can be at most 65535 items long");
+			}
+
+			int frameLength = frame.Length;
+			int frameChunkOffset = 0;
+			byte[] frameChunkData = new byte[60];
+			int frameChunkLength;
+
+			if (frameLength == 0)
+			{
+				Array.Clear(frameChunkData, 0, 60);
+
+				WriteFrameLowLevel(frameLength, frameChunkOffset, frameChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (frameChunkOffset < frameLength)
+					{
+						frameChunkLength = Math.Min(frameLength - frameChunkOffset, 60);
+
+						Array.Copy(frame, frameChunkOffset, frameChunkData, 0, frameChunkLength);
+						Array.Clear(frameChunkData, frameChunkLength, 60 - frameChunkLength);
+
+						WriteFrameLowLevel(frameLength, frameChunkOffset, frameChunkData);
+
+						frameChunkOffset += 60;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  Returns the last frame that was written by the DMX master. The size of the array
+		///  is equivalent to the number of channels in the frame. Each byte represents one channel.
+		///  
+		///  The next frame is available after the <see cref="Tinkerforge.BrickletDMX.FrameAvailableCallback"/> callback was called.
+		///  
+		///  Generic approach:
+		///  
+		///  * Call <see cref="Tinkerforge.BrickletDMX.ReadFrame"/> to get first frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletDMX.FrameAvailableCallback"/> callback.
+		///  * Call <see cref="Tinkerforge.BrickletDMX.ReadFrame"/> to get second frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletDMX.FrameAvailableCallback"/> callback.
+		///  * and so on.
+		///  
+		///  Instead of polling this function you can also use the <see cref="Tinkerforge.BrickletDMX.FrameCallback"/> callback.
+		///  You can enable it with <see cref="Tinkerforge.BrickletDMX.SetFrameCallbackConfig"/>.
+		///  
+		///  The frame number starts at 0 and it is increased by one with each received frame.
+		///  
+		///  This function can only be called in slave mode.
+		/// </summary>
+		public void ReadFrame(out byte[] frame, out long frameNumber)
+		{
+			int frameLength = 0;
+			int frameChunkOffset;
+			byte[] frameChunkData = new byte[56];
+			int frameChunkLength;
+			bool frameOutOfSync;
+			int frameCurrentLength;
+
+			lock (streamLock)
+			{
+				frame = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				ReadFrameLowLevel(out frameLength, out frameChunkOffset, out frameChunkData, out frameNumber);
+
+				frameOutOfSync = frameChunkOffset != 0;
+
+				if (!frameOutOfSync) {
+					frame = new byte[frameLength];
+					frameChunkLength = Math.Min(frameLength - frameChunkOffset, 56);
+
+					Array.Copy(frameChunkData, frame, frameChunkLength);
+
+					frameCurrentLength = frameChunkLength;
+
+					while (frameCurrentLength < frameLength)
+					{
+						ReadFrameLowLevel(out frameLength, out frameChunkOffset, out frameChunkData, out frameNumber);
+
+						frameOutOfSync = frameChunkOffset != frameCurrentLength;
+
+						if (frameOutOfSync) {
+							break;
+						}
+
+						frameChunkLength = Math.Min(frameLength - frameChunkOffset, 56);
+
+						Array.Copy(frameChunkData, 0, frame, frameCurrentLength, frameChunkLength);
+
+						frameCurrentLength += frameChunkLength;
+					}
+				}
+
+				if (frameOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (frameChunkOffset + 56 < frameLength)
+					{
+						ReadFrameLowLevel(out frameLength, out frameChunkOffset, out frameChunkData, out frameNumber);
+					}
+
+					throw new StreamOutOfSyncException("Frame is out-of-sync");
+				}
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFrameStartedCallback(byte[] response)
+		{
+			if (response.Length != 8)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			var handler = FrameStartedCallback;
+
+			if (handler != null)
+			{
+				handler(this);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFrameAvailableCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long frameNumber = LEConverter.UIntFrom(8, response);
+			var handler = FrameAvailableCallback;
+
+			if (handler != null)
+			{
+				handler(this, frameNumber);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFrameLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int frameLength = LEConverter.UShortFrom(8, response);
+			int frameChunkOffset = LEConverter.UShortFrom(10, response);
+			byte[] frameChunkData = LEConverter.ByteArrayFrom(12, response, 56);
+			long frameNumber = LEConverter.UIntFrom(68, response);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_FRAME];
+			int frameChunkLength = Math.Min(frameLength - frameChunkOffset, 56);
+			var highLevelHandler = FrameCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (frameChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new byte[frameLength];
+					highLevelCallback.length = frameChunkLength;
+
+					Array.Copy(frameChunkData, (byte[])highLevelCallback.data, frameChunkLength);
+
+					if (highLevelCallback.length >= frameLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (byte[])highLevelCallback.data, frameNumber);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (frameChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, (byte[])highLevelCallback.data, frameNumber);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(frameChunkData, 0, (byte[])highLevelCallback.data, highLevelCallback.length, frameChunkLength);
+					highLevelCallback.length += frameChunkLength;
+
+					if (highLevelCallback.length >= frameLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (byte[])highLevelCallback.data, frameNumber);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = FrameLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, frameLength, frameChunkOffset, frameChunkData, frameNumber);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFrameErrorCountCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long overrunErrorCount = LEConverter.UIntFrom(8, response);
+			long framingErrorCount = LEConverter.UIntFrom(12, response);
+			var handler = FrameErrorCountCallback;
+
+			if (handler != null)
+			{
+				handler(this, overrunErrorCount, framingErrorCount);
+			}
+		}
+	}
+}
@@ -0,0 +1,275 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Two tactile buttons with built-in blue LEDs
+	/// </summary>
+	public class BrickletDualButton : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 230;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Dual Button Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_LED_STATE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_LED_STATE = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BUTTON_STATE = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SELECTED_LED_STATE = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_STATE_CHANGED = 4;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte LED_STATE_AUTO_TOGGLE_ON = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte LED_STATE_AUTO_TOGGLE_OFF = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte LED_STATE_ON = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte LED_STATE_OFF = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BUTTON_STATE_PRESSED = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BUTTON_STATE_RELEASED = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte LED_LEFT = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte LED_RIGHT = 1;
+
+
+		/// <summary>
+		///  This callback is called whenever a button is pressed.
+		///  
+		///  Possible states for buttons are:
+		///  
+		///  * 0 = pressed
+		///  * 1 = released
+		///  
+		///  Possible states for LEDs are:
+		///  
+		///  * 0 = AutoToggleOn: Auto toggle enabled and LED on.
+		///  * 1 = AutoToggleOff: Auto toggle enabled and LED off.
+		///  * 2 = On: LED on (auto toggle is disabled).
+		///  * 3 = Off: LED off (auto toggle is disabled).
+		/// </summary>
+		public event StateChangedEventHandler StateChangedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void StateChangedEventHandler(BrickletDualButton sender, byte buttonL, byte buttonR, byte ledL, byte ledR);
+
+		/// <summary>
+		/// </summary>
+		public event StateChangedEventHandler StateChanged // for backward compatibility
+		{
+			add { StateChangedCallback += value; }
+			remove { StateChangedCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletDualButton(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_STATE_CHANGED] = new CallbackWrapper(OnStateChangedCallback);
+
+
+			responseExpected[FUNCTION_SET_LED_STATE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_LED_STATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BUTTON_STATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SELECTED_LED_STATE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Sets the state of the LEDs. Possible states are:
+		///  
+		///  * 0 = AutoToggleOn: Enables auto toggle with initially enabled LED.
+		///  * 1 = AutoToggleOff: Activates auto toggle with initially disabled LED.
+		///  * 2 = On: Enables LED (auto toggle is disabled).
+		///  * 3 = Off: Disables LED (auto toggle is disabled).
+		///  
+		///  In auto toggle mode the LED is toggled automatically at each press of a button.
+		///  
+		///  If you just want to set one of the LEDs and don't know the current state
+		///  of the other LED, you can get the state with <see cref="Tinkerforge.BrickletDualButton.GetLEDState"/> or you
+		///  can use <see cref="Tinkerforge.BrickletDualButton.SetSelectedLEDState"/>.
+		/// </summary>
+		public void SetLEDState(byte ledL, byte ledR)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_LED_STATE);
+			LEConverter.To((byte)ledL, 8, request);
+			LEConverter.To((byte)ledR, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current state of the LEDs, as set by <see cref="Tinkerforge.BrickletDualButton.SetLEDState"/>.
+		/// </summary>
+		public void GetLEDState(out byte ledL, out byte ledR)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_LED_STATE);
+
+			byte[] response = SendRequest(request, 10);
+
+			ledL = LEConverter.ByteFrom(8, response);
+			ledR = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the current state for both buttons. Possible states are:
+		///  
+		///  * 0 = pressed
+		///  * 1 = released
+		/// </summary>
+		public void GetButtonState(out byte buttonL, out byte buttonR)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BUTTON_STATE);
+
+			byte[] response = SendRequest(request, 10);
+
+			buttonL = LEConverter.ByteFrom(8, response);
+			buttonR = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  Sets the state of the selected LED (0 or 1).
+		///  
+		///  The other LED remains untouched.
+		/// </summary>
+		public void SetSelectedLEDState(byte led, byte state)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_SELECTED_LED_STATE);
+			LEConverter.To((byte)led, 8, request);
+			LEConverter.To((byte)state, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnStateChangedCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte buttonL = LEConverter.ByteFrom(8, response);
+			byte buttonR = LEConverter.ByteFrom(9, response);
+			byte ledL = LEConverter.ByteFrom(10, response);
+			byte ledR = LEConverter.ByteFrom(11, response);
+			var handler = StateChangedCallback;
+
+			if (handler != null)
+			{
+				handler(this, buttonL, buttonR, ledL, ledR);
+			}
+		}
+	}
+}
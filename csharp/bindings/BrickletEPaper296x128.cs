@@ -0,0 +1,1276 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Three color 296x128 e-paper display
+	/// </summary>
+	public class BrickletEPaper296x128 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2146;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "E-Paper 296x128 Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DRAW = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DRAW_STATUS = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_BLACK_WHITE_LOW_LEVEL = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_BLACK_WHITE_LOW_LEVEL = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_COLOR_LOW_LEVEL = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_COLOR_LOW_LEVEL = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FILL_DISPLAY = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DRAW_TEXT = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DRAW_LINE = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DRAW_BOX = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_UPDATE_MODE = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_UPDATE_MODE = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DISPLAY_TYPE = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DISPLAY_TYPE = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_DRAW_STATUS = 11;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte DRAW_STATUS_IDLE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DRAW_STATUS_COPYING = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte DRAW_STATUS_DRAWING = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COLOR_BLACK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte COLOR_WHITE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COLOR_RED = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COLOR_GRAY = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_6X8 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_6X16 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_6X24 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_6X32 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_12X16 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_12X24 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_12X32 = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_18X24 = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_18X32 = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_24X32 = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte ORIENTATION_HORIZONTAL = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ORIENTATION_VERTICAL = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte UPDATE_MODE_DEFAULT = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte UPDATE_MODE_BLACK_WHITE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte UPDATE_MODE_DELTA = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte DISPLAY_TYPE_BLACK_WHITE_RED = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DISPLAY_TYPE_BLACK_WHITE_GRAY = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  Callback for the current draw status. Will be called every time the
+		///  draw status changes (see <see cref="Tinkerforge.BrickletEPaper296x128.GetDrawStatus"/>).
+		/// </summary>
+		public event DrawStatusEventHandler DrawStatusCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void DrawStatusEventHandler(BrickletEPaper296x128 sender, byte drawStatus);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletEPaper296x128(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_DRAW_STATUS] = new CallbackWrapper(OnDrawStatusCallback);
+
+
+			responseExpected[FUNCTION_DRAW] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_DRAW_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_WRITE_BLACK_WHITE_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_READ_BLACK_WHITE_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_WRITE_COLOR_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_READ_COLOR_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FILL_DISPLAY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DRAW_TEXT] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DRAW_LINE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DRAW_BOX] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_UPDATE_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_UPDATE_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DISPLAY_TYPE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_DISPLAY_TYPE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Draws the current black/white and red or gray buffer to the e-paper display.
+		///  
+		///  The Bricklet does not have any double-buffering. You should not call
+		///  this function while writing to the buffer. See <see cref="Tinkerforge.BrickletEPaper296x128.GetDrawStatus"/>.
+		/// </summary>
+		public void Draw()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DRAW);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns one of three draw statuses:
+		///  
+		///  * Idle
+		///  * Copying: Data is being copied from the buffer of the Bricklet to the buffer of the display.
+		///  * Drawing: The display is updating its content (during this phase the flickering etc happens).
+		///  
+		///  You can write to the buffer (through one of the write or draw functions) when the status is
+		///  either *idle* or *drawing*. You should not write to the buffer while it is being *copied* to the
+		///  display. There is no double-buffering.
+		/// </summary>
+		public byte GetDrawStatus()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DRAW_STATUS);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Writes black/white pixels to the specified window into the buffer.
+		///  
+		///  The pixels are written into the window line by line top to bottom
+		///  and each line is written from left to right.
+		///  
+		///  The value 0 (false) corresponds to a black pixel and the value 1 (true) to a
+		///  white pixel.
+		///  
+		///  This function writes the pixels into the black/white pixel buffer, to draw the
+		///  buffer to the display use <see cref="Tinkerforge.BrickletEPaper296x128.Draw"/>.
+		///  
+		///  Use <see cref="Tinkerforge.BrickletEPaper296x128.WriteColor"/> to write red or gray pixels.
+		/// </summary>
+		public void WriteBlackWhiteLowLevel(int xStart, byte yStart, int xEnd, byte yEnd, int pixelsLength, int pixelsChunkOffset, bool[] pixelsChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_BLACK_WHITE_LOW_LEVEL);
+			LEConverter.To((short)xStart, 8, request);
+			LEConverter.To((byte)yStart, 10, request);
+			LEConverter.To((short)xEnd, 11, request);
+			LEConverter.To((byte)yEnd, 13, request);
+			LEConverter.To((short)pixelsLength, 14, request);
+			LEConverter.To((short)pixelsChunkOffset, 16, request);
+			byte[] pixelsChunkDataBits = new byte[54];
+			for (int i = 0; i < 432; i++) {
+				if (pixelsChunkData[i]) {
+					pixelsChunkDataBits[i / 8] |= (byte)(1 << (i % 8));
+				}
+			}
+			LEConverter.To((byte[])pixelsChunkDataBits, 18, 54, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current content of the black/white pixel buffer for the specified window.
+		///  
+		///  The pixels are read into the window line by line top to bottom and
+		///  each line is read from left to right.
+		///  
+		///  The current content of the buffer does not have to be the current content of the display.
+		///  It is possible that the data was not drawn to the display yet and after a restart of
+		///  the Bricklet the buffer will be reset to black, while the display retains its content.
+		/// </summary>
+		public void ReadBlackWhiteLowLevel(int xStart, byte yStart, int xEnd, byte yEnd, out int pixelsLength, out int pixelsChunkOffset, out bool[] pixelsChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_READ_BLACK_WHITE_LOW_LEVEL);
+			LEConverter.To((short)xStart, 8, request);
+			LEConverter.To((byte)yStart, 10, request);
+			LEConverter.To((short)xEnd, 11, request);
+			LEConverter.To((byte)yEnd, 13, request);
+
+			byte[] response = SendRequest(request, 70);
+
+			pixelsLength = LEConverter.UShortFrom(8, response);
+			pixelsChunkOffset = LEConverter.UShortFrom(10, response);
+			byte[] pixelsChunkDataBits = new byte[58];
+			pixelsChunkData = new bool[464];
+			pixelsChunkDataBits = LEConverter.ByteArrayFrom(12, response, 58);
+			for (int i = 0; i < 464; i++) {
+				pixelsChunkData[i] = (pixelsChunkDataBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+		}
+
+		/// <summary>
+		///  The E-Paper 296x128 Bricklet is available with the colors black/white/red and
+		///  black/white/gray. Depending on the model this function writes either red or
+		///  gray pixels to the specified window into the buffer.
+		///  
+		///  The pixels are written into the window line by line top to bottom
+		///  and each line is written from left to right.
+		///  
+		///  The value 0 (false) means that this pixel does not have color. It will be either black
+		///  or white (see <see cref="Tinkerforge.BrickletEPaper296x128.WriteBlackWhite"/>). The value 1 (true) corresponds to a red or gray
+		///  pixel, depending on the Bricklet model.
+		///  
+		///  This function writes the pixels into the red or gray pixel buffer, to draw the buffer
+		///  to the display use <see cref="Tinkerforge.BrickletEPaper296x128.Draw"/>.
+		///  
+		///  Use <see cref="Tinkerforge.BrickletEPaper296x128.WriteBlackWhite"/> to write black/white pixels.
+		/// </summary>
+		public void WriteColorLowLevel(int xStart, byte yStart, int xEnd, byte yEnd, int pixelsLength, int pixelsChunkOffset, bool[] pixelsChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_COLOR_LOW_LEVEL);
+			LEConverter.To((short)xStart, 8, request);
+			LEConverter.To((byte)yStart, 10, request);
+			LEConverter.To((short)xEnd, 11, request);
+			LEConverter.To((byte)yEnd, 13, request);
+			LEConverter.To((short)pixelsLength, 14, request);
+			LEConverter.To((short)pixelsChunkOffset, 16, request);
+			byte[] pixelsChunkDataBits = new byte[54];
+			for (int i = 0; i < 432; i++) {
+				if (pixelsChunkData[i]) {
+					pixelsChunkDataBits[i / 8] |= (byte)(1 << (i % 8));
+				}
+			}
+			LEConverter.To((byte[])pixelsChunkDataBits, 18, 54, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current content of the red or gray pixel buffer for the specified window.
+		///  
+		///  The pixels are written into the window line by line top to bottom
+		///  and each line is written from left to right.
+		///  
+		///  The current content of the buffer does not have to be the current content of the display.
+		///  It is possible that the data was not drawn to the display yet and after a restart of
+		///  the Bricklet the buffer will be reset to black, while the display retains its content.
+		/// </summary>
+		public void ReadColorLowLevel(int xStart, byte yStart, int xEnd, byte yEnd, out int pixelsLength, out int pixelsChunkOffset, out bool[] pixelsChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_READ_COLOR_LOW_LEVEL);
+			LEConverter.To((short)xStart, 8, request);
+			LEConverter.To((byte)yStart, 10, request);
+			LEConverter.To((short)xEnd, 11, request);
+			LEConverter.To((byte)yEnd, 13, request);
+
+			byte[] response = SendRequest(request, 70);
+
+			pixelsLength = LEConverter.UShortFrom(8, response);
+			pixelsChunkOffset = LEConverter.UShortFrom(10, response);
+			byte[] pixelsChunkDataBits = new byte[58];
+			pixelsChunkData = new bool[464];
+			pixelsChunkDataBits = LEConverter.ByteArrayFrom(12, response, 58);
+			for (int i = 0; i < 464; i++) {
+				pixelsChunkData[i] = (pixelsChunkDataBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+		}
+
+		/// <summary>
+		///  Fills the complete content of the display with the given color.
+		///  
+		///  This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+		///  to the display use <see cref="Tinkerforge.BrickletEPaper296x128.Draw"/>.
+		/// </summary>
+		public void FillDisplay(byte color)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_FILL_DISPLAY);
+			LEConverter.To((byte)color, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Draws a text with up to 50 characters at the pixel position (x, y).
+		///  
+		///  You can use one of 9 different font sizes and draw the text in
+		///  black/white/red|gray. The text can be drawn horizontal or vertical.
+		///  
+		///  This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+		///  to the display use <see cref="Tinkerforge.BrickletEPaper296x128.Draw"/>.
+		/// </summary>
+		public void DrawText(int positionX, byte positionY, byte font, byte color, byte orientation, string text)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(64, FUNCTION_DRAW_TEXT);
+			LEConverter.To((short)positionX, 8, request);
+			LEConverter.To((byte)positionY, 10, request);
+			LEConverter.To((byte)font, 11, request);
+			LEConverter.To((byte)color, 12, request);
+			LEConverter.To((byte)orientation, 13, request);
+			LEConverter.To((string)text, 14, 50, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Draws a line from (x, y)-start to (x, y)-end in the given color.
+		///  
+		///  This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+		///  to the display use <see cref="Tinkerforge.BrickletEPaper296x128.Draw"/>.
+		/// </summary>
+		public void DrawLine(int positionXStart, byte positionYStart, int positionXEnd, byte positionYEnd, byte color)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(15, FUNCTION_DRAW_LINE);
+			LEConverter.To((short)positionXStart, 8, request);
+			LEConverter.To((byte)positionYStart, 10, request);
+			LEConverter.To((short)positionXEnd, 11, request);
+			LEConverter.To((byte)positionYEnd, 13, request);
+			LEConverter.To((byte)color, 14, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Draws a box from (x, y)-start to (x, y)-end in the given color.
+		///  
+		///  If you set fill to true, the box will be filled with the
+		///  color. Otherwise only the outline will be drawn.
+		///  
+		///  This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+		///  to the display use <see cref="Tinkerforge.BrickletEPaper296x128.Draw"/>.
+		/// </summary>
+		public void DrawBox(int positionXStart, byte positionYStart, int positionXEnd, byte positionYEnd, bool fill, byte color)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(16, FUNCTION_DRAW_BOX);
+			LEConverter.To((short)positionXStart, 8, request);
+			LEConverter.To((byte)positionYStart, 10, request);
+			LEConverter.To((short)positionXEnd, 11, request);
+			LEConverter.To((byte)positionYEnd, 13, request);
+			LEConverter.To((bool)fill, 14, request);
+			LEConverter.To((byte)color, 15, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  <note>
+		///   The default update mode corresponds to the default e-paper display
+		///   manufacturer settings. All of the other modes are experimental and
+		///   will result in increased ghosting and possibly other long-term
+		///   side effects.
+		///  </note>
+		///  
+		///   If you want to know more about the inner workings of an e-paper display
+		///   take a look at this excellent video from Ben Krasnow:
+		///   `https://www.youtube.com/watch?v=MsbiO8EAsGw &lt;https://www.youtube.com/watch?v=MsbiO8EAsGw&gt;`__.
+		///  
+		///   If you are not sure about this option, leave the update mode at default.
+		///  
+		///  Currently there are three update modes available:
+		///  
+		///  * Default: Settings as given by the manufacturer. An update will take about
+		///    7.5 seconds and during the update the screen will flicker several times.
+		///  * Black/White: This will only update the black/white pixel. It uses the manufacturer
+		///    settings for black/white and ignores the red or gray pixel buffer. With this mode the
+		///    display will flicker once and it takes about 2.5 seconds. Compared to the default settings
+		///    there is more ghosting.
+		///  * Delta: This will only update the black/white pixel. It uses an aggressive method where
+		///    the changes are not applied for a whole buffer but only for the delta between the last
+		///    and the next buffer. With this mode the display will not flicker during an update and
+		///    it takes about 900-950ms. Compared to the other two settings there is more ghosting. This
+		///    mode can be used for something like a flicker-free live update of a text.
+		///  
+		///  With the black/white/red display if you use either the black/white or the delta mode,
+		///  after a while of going back and forth between black and white the white color will
+		///  start to appear red-ish or pink-ish.
+		///  
+		///  If you use the aggressive delta mode and rapidly change the content, we recommend that you
+		///  change back to the default mode every few hours and in the default mode cycle between the
+		///  three available colors a few times. This will get rid of the ghosting and after that you can
+		///  go back to the delta mode with flicker-free updates.
+		/// </summary>
+		public void SetUpdateMode(byte updateMode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_UPDATE_MODE);
+			LEConverter.To((byte)updateMode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the update mode as set by <see cref="Tinkerforge.BrickletEPaper296x128.SetUpdateMode"/>.
+		/// </summary>
+		public byte GetUpdateMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_UPDATE_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the type of the display. The e-paper display is available
+		///  in black/white/red and black/white/gray. This will be factory set
+		///  during the flashing and testing phase. The value is saved in
+		///  non-volatile memory and will stay after a power cycle.
+		/// </summary>
+		public void SetDisplayType(byte displayType)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_DISPLAY_TYPE);
+			LEConverter.To((byte)displayType, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the type of the e-paper display. It can either be
+		///  black/white/red or black/white/gray.
+		/// </summary>
+		public byte GetDisplayType()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DISPLAY_TYPE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletEPaper296x128.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletEPaper296x128.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletEPaper296x128.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletEPaper296x128.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Writes black/white pixels to the specified window into the buffer.
+		///  
+		///  The pixels are written into the window line by line top to bottom
+		///  and each line is written from left to right.
+		///  
+		///  The value 0 (false) corresponds to a black pixel and the value 1 (true) to a
+		///  white pixel.
+		///  
+		///  This function writes the pixels into the black/white pixel buffer, to draw the
+		///  buffer to the display use <see cref="Tinkerforge.BrickletEPaper296x128.Draw"/>.
+		///  
+		///  Use <see cref="Tinkerforge.BrickletEPaper296x128.WriteColor"/> to write red or gray pixels.
+		/// </summary>
+		public void WriteBlackWhite(int xStart, byte yStart, int xEnd, byte yEnd, bool[] pixels)
+		{
+			if (pixels.Length > 65535)
+			{
+				throw new ArgumentException("Pixels can be at most 65535 items long");
+			}
+
+			int pixelsLength = pixels.Length;
+			int pixelsChunkOffset = 0;
+			bool[] pixelsChunkData = new bool[432];
+			int pixelsChunkLength;
+
+			if (pixelsLength == 0)
+			{
+				Array.Clear(pixelsChunkData, 0, 432);
+
+				WriteBlackWhiteLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (pixelsChunkOffset < pixelsLength)
+					{
+						pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 432);
+
+						Array.Copy(pixels, pixelsChunkOffset, pixelsChunkData, 0, pixelsChunkLength);
+						Array.Clear(pixelsChunkData, pixelsChunkLength, 432 - pixelsChunkLength);
+
+						WriteBlackWhiteLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+
+						pixelsChunkOffset += 432;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  Returns the current content of the black/white pixel buffer for the specified window.
+		///  
+		///  The pixels are read into the window line by line top to bottom and
+		///  each line is read from left to right.
+		///  
+		///  The current content of the buffer does not have to be the current content of the display.
+		///  It is possible that the data was not drawn to the display yet and after a restart of
+		///  the Bricklet the buffer will be reset to black, while the display retains its content.
+		/// </summary>
+		public bool[] ReadBlackWhite(int xStart, byte yStart, int xEnd, byte yEnd)
+		{
+			bool[] pixels = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int pixelsLength = 0;
+			int pixelsChunkOffset;
+			bool[] pixelsChunkData = new bool[464];
+			int pixelsChunkLength;
+			bool pixelsOutOfSync;
+			int pixelsCurrentLength;
+
+			lock (streamLock)
+			{
+				ReadBlackWhiteLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+
+				pixelsOutOfSync = pixelsChunkOffset != 0;
+
+				if (!pixelsOutOfSync) {
+					pixels = new bool[pixelsLength];
+					pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 464);
+
+					Array.Copy(pixelsChunkData, pixels, pixelsChunkLength);
+
+					pixelsCurrentLength = pixelsChunkLength;
+
+					while (pixelsCurrentLength < pixelsLength)
+					{
+						ReadBlackWhiteLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+
+						pixelsOutOfSync = pixelsChunkOffset != pixelsCurrentLength;
+
+						if (pixelsOutOfSync) {
+							break;
+						}
+
+						pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 464);
+
+						Array.Copy(pixelsChunkData, 0, pixels, pixelsCurrentLength, pixelsChunkLength);
+
+						pixelsCurrentLength += pixelsChunkLength;
+					}
+				}
+
+				if (pixelsOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (pixelsChunkOffset + 464 < pixelsLength)
+					{
+						ReadBlackWhiteLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Pixels is out-of-sync");
+				}
+			}
+
+			return pixels;
+		}
+
+		/// <summary>
+		///  The E-Paper 296x128 Bricklet is available with the colors black/white/red and
+		///  black/white/gray. Depending on the model this function writes either red or
+		///  gray pixels to the specified window into the buffer.
+		///  
+		///  The pixels are written into the window line by line top to bottom
+		///  and each line is written from left to right.
+		///  
+		///  The value 0 (false) means that this pixel does not have color. It will be either black
+		///  or white (see <see cref="Tinkerforge.BrickletEPaper296x128.WriteBlackWhite"/>). The value 1 (true) corresponds to a red or gray
+		///  pixel, depending on the Bricklet model.
+		///  
+		///  This function writes the pixels into the red or gray pixel buffer, to draw the buffer
+		///  to the display use <see cref="Tinkerforge.BrickletEPaper296x128.Draw"/>.
+		///  
+		///  Use <see cref="Tinkerforge.BrickletEPaper296x128.WriteBlackWhite"/> to write black/white pixels.
+		/// </summary>
+		public void WriteColor(int xStart, byte yStart, int xEnd, byte yEnd, bool[] pixels)
+		{
+			if (pixels.Length > 65535)
+			{
+				throw new ArgumentException("Pixels can be at most 65535 items long");
+			}
+
+			int pixelsLength = pixels.Length;
+			int pixelsChunkOffset = 0;
+			bool[] pixelsChunkData = new bool[432];
+			int pixelsChunkLength;
+
+			if (pixelsLength == 0)
+			{
+				Array.Clear(pixelsChunkData, 0, 432);
+
+				WriteColorLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (pixelsChunkOffset < pixelsLength)
+					{
+						pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 432);
+
+						Array.Copy(pixels, pixelsChunkOffset, pixelsChunkData, 0, pixelsChunkLength);
+						Array.Clear(pixelsChunkData, pixelsChunkLength, 432 - pixelsChunkLength);
+
+						WriteColorLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+
+						pixelsChunkOffset += 432;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  Returns the current content of the red or gray pixel buffer for the specified window.
+		///  
+		///  The pixels are written into the window line by line top to bottom
+		///  and each line is written from left to right.
+		///  
+		///  The current content of the buffer does not have to be the current content of the display.
+		///  It is possible that the data was not drawn to the display yet and after a restart of
+		///  the Bricklet the buffer will be reset to black, while the display retains its content.
+		/// </summary>
+		public bool[] ReadColor(int xStart, byte yStart, int xEnd, byte yEnd)
+		{
+			bool[] pixels = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int pixelsLength = 0;
+			int pixelsChunkOffset;
+			bool[] pixelsChunkData = new bool[464];
+			int pixelsChunkLength;
+			bool pixelsOutOfSync;
+			int pixelsCurrentLength;
+
+			lock (streamLock)
+			{
+				ReadColorLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+
+				pixelsOutOfSync = pixelsChunkOffset != 0;
+
+				if (!pixelsOutOfSync) {
+					pixels = new bool[pixelsLength];
+					pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 464);
+
+					Array.Copy(pixelsChunkData, pixels, pixelsChunkLength);
+
+					pixelsCurrentLength = pixelsChunkLength;
+
+					while (pixelsCurrentLength < pixelsLength)
+					{
+						ReadColorLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+
+						pixelsOutOfSync = pixelsChunkOffset != pixelsCurrentLength;
+
+						if (pixelsOutOfSync) {
+							break;
+						}
+
+						pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 464);
+
+						Array.Copy(pixelsChunkData, 0, pixels, pixelsCurrentLength, pixelsChunkLength);
+
+						pixelsCurrentLength += pixelsChunkLength;
+					}
+				}
+
+				if (pixelsOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (pixelsChunkOffset + 464 < pixelsLength)
+					{
+						ReadColorLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Pixels is out-of-sync");
+				}
+			}
+
+			return pixels;
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnDrawStatusCallback(byte[] response)
+		{
+			if (response.Length != 9)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte drawStatus = LEConverter.ByteFrom(8, response);
+			var handler = DrawStatusCallback;
+
+			if (handler != null)
+			{
+				handler(this, drawStatus);
+			}
+		}
+	}
+}
@@ -0,0 +1,823 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Measures Voltage, Current, Energy, Real/Apparent/Reactive Power, Power Factor and Frequency
+	/// </summary>
+	public class BrickletEnergyMonitor : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2152;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Energy Monitor Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ENERGY_DATA = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET_ENERGY = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WAVEFORM_LOW_LEVEL = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TRANSFORMER_STATUS = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TRANSFORMER_CALIBRATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TRANSFORMER_CALIBRATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CALIBRATE_OFFSET = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ENERGY_DATA_CALLBACK_CONFIGURATION = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ENERGY_DATA_CALLBACK_CONFIGURATION = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_ENERGY_DATA = 10;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletEnergyMonitor.SetEnergyDataCallbackConfiguration"/>.
+		///  
+		///  The parameters are the same as <see cref="Tinkerforge.BrickletEnergyMonitor.GetEnergyData"/>.
+		/// </summary>
+		public event EnergyDataEventHandler EnergyDataCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void EnergyDataEventHandler(BrickletEnergyMonitor sender, int voltage, int current, int energy, int realPower, int apparentPower, int reactivePower, int powerFactor, int frequency);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletEnergyMonitor(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_ENERGY_DATA] = new CallbackWrapper(OnEnergyDataCallback);
+
+
+			responseExpected[FUNCTION_GET_ENERGY_DATA] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET_ENERGY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WAVEFORM_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_TRANSFORMER_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_TRANSFORMER_CALIBRATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_TRANSFORMER_CALIBRATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_CALIBRATE_OFFSET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_ENERGY_DATA_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ENERGY_DATA_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns all of the measurements that are done by the Energy Monitor Bricklet.
+		///  
+		///  * Voltage RMS
+		///  * Current RMS
+		///  * Energy (integrated over time)
+		///  * Real Power
+		///  * Apparent Power
+		///  * Reactive Power
+		///  * Power Factor
+		///  * Frequency (AC Frequency of the mains voltage)
+		///  
+		///  The frequency is recalculated every 6 seconds.
+		///  
+		///  All other values are integrated over 10 zero-crossings of the voltage sine wave.
+		///  With a standard AC mains voltage frequency of 50Hz this results in a 5 measurements
+		///  per second (or an integration time of 200ms per measurement).
+		///  
+		///  If no voltage transformer is connected, the Bricklet will use the current waveform
+		///  to calculate the frequency and it will use an integration time of
+		///  10 zero-crossings of the current waveform.
+		/// </summary>
+		public void GetEnergyData(out int voltage, out int current, out int energy, out int realPower, out int apparentPower, out int reactivePower, out int powerFactor, out int frequency)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ENERGY_DATA);
+
+			byte[] response = SendRequest(request, 36);
+
+			voltage = LEConverter.IntFrom(8, response);
+			current = LEConverter.IntFrom(12, response);
+			energy = LEConverter.IntFrom(16, response);
+			realPower = LEConverter.IntFrom(20, response);
+			apparentPower = LEConverter.IntFrom(24, response);
+			reactivePower = LEConverter.IntFrom(28, response);
+			powerFactor = LEConverter.UShortFrom(32, response);
+			frequency = LEConverter.UShortFrom(34, response);
+		}
+
+		/// <summary>
+		///  Sets the energy value (see <see cref="Tinkerforge.BrickletEnergyMonitor.GetEnergyData"/>) back to 0Wh.
+		/// </summary>
+		public void ResetEnergy()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET_ENERGY);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns a snapshot of the voltage and current waveform. The values
+		///  in the returned array alternate between voltage and current. The data from
+		///  one getter call contains 768 data points for voltage and current, which
+		///  correspond to about 3 full sine waves.
+		///  
+		///  The voltage is given with a resolution of 100mV and the current is given
+		///  with a resolution of 10mA.
+		///  
+		///  This data is meant to be used for a non-realtime graphical representation of
+		///  the voltage and current waveforms.
+		/// </summary>
+		public void GetWaveformLowLevel(out int waveformChunkOffset, out short[] waveformChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WAVEFORM_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 70);
+
+			waveformChunkOffset = LEConverter.UShortFrom(8, response);
+			waveformChunkData = LEConverter.ShortArrayFrom(10, response, 30);
+		}
+
+		/// <summary>
+		///  Returns *true* if a voltage/current transformer is connected to the Bricklet.
+		/// </summary>
+		public void GetTransformerStatus(out bool voltageTransformerConnected, out bool currentTransformerConnected)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TRANSFORMER_STATUS);
+
+			byte[] response = SendRequest(request, 10);
+
+			voltageTransformerConnected = LEConverter.BoolFrom(8, response);
+			currentTransformerConnected = LEConverter.BoolFrom(9, response);
+		}
+
+		/// <summary>
+		///  Sets the transformer ratio for the voltage and current transformer in 1/100 form.
+		///  
+		///  Example: If your mains voltage is 230V, you use 9V voltage transformer and a
+		///  1V:30A current clamp your voltage ratio is 230/9 = 25.56 and your current ratio
+		///  is 30/1 = 30.
+		///  
+		///  In this case you have to set the values 2556 and 3000 for voltage ratio and current
+		///  ratio.
+		///  
+		///  The calibration is saved in non-volatile memory, you only have to set it once.
+		///  
+		///  Set the phase shift to 0. It is for future use and currently not supported by the Bricklet.
+		/// </summary>
+		public void SetTransformerCalibration(int voltageRatio, int currentRatio, short phaseShift)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_SET_TRANSFORMER_CALIBRATION);
+			LEConverter.To((short)voltageRatio, 8, request);
+			LEConverter.To((short)currentRatio, 10, request);
+			LEConverter.To((short)phaseShift, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the transformer calibration as set by <see cref="Tinkerforge.BrickletEnergyMonitor.SetTransformerCalibration"/>.
+		/// </summary>
+		public void GetTransformerCalibration(out int voltageRatio, out int currentRatio, out short phaseShift)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TRANSFORMER_CALIBRATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			voltageRatio = LEConverter.UShortFrom(8, response);
+			currentRatio = LEConverter.UShortFrom(10, response);
+			phaseShift = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Calling this function will start an offset calibration. The offset calibration will
+		///  integrate the voltage and current waveform over a longer time period to find the 0
+		///  transition point in the sine wave.
+		///  
+		///  The Bricklet comes with a factory-calibrated offset value, you should not have to
+		///  call this function.
+		///  
+		///  If you want to re-calibrate the offset we recommend that you connect a load that
+		///  has a smooth sinusoidal voltage and current waveform. Alternatively you can also
+		///  short both inputs.
+		///  
+		///  The calibration is saved in non-volatile memory, you only have to set it once.
+		/// </summary>
+		public void CalibrateOffset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_CALIBRATE_OFFSET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletEnergyMonitor.EnergyDataCallback"/>
+		///  callback is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetEnergyDataCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_ENERGY_DATA_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletEnergyMonitor.SetEnergyDataCallbackConfiguration"/>.
+		/// </summary>
+		public void GetEnergyDataCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ENERGY_DATA_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletEnergyMonitor.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletEnergyMonitor.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletEnergyMonitor.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletEnergyMonitor.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Returns a snapshot of the voltage and current waveform. The values
+		///  in the returned array alternate between voltage and current. The data from
+		///  one getter call contains 768 data points for voltage and current, which
+		///  correspond to about 3 full sine waves.
+		///  
+		///  The voltage is given with a resolution of 100mV and the current is given
+		///  with a resolution of 10mA.
+		///  
+		///  This data is meant to be used for a non-realtime graphical representation of
+		///  the voltage and current waveforms.
+		/// </summary>
+		public short[] GetWaveform()
+		{
+			short[] waveform = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int waveformLength = 1536;
+			int waveformChunkOffset;
+			short[] waveformChunkData = new short[30];
+			int waveformChunkLength;
+			bool waveformOutOfSync;
+			int waveformCurrentLength;
+
+			lock (streamLock)
+			{
+				GetWaveformLowLevel(out waveformChunkOffset, out waveformChunkData);
+
+				if (waveformChunkOffset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+					waveformLength = 0;
+					waveformChunkOffset = 0;
+					waveformOutOfSync = false;
+				} else {
+					waveformOutOfSync = waveformChunkOffset != 0;
+				}
+
+				if (!waveformOutOfSync) {
+					waveform = new short[waveformLength];
+					waveformChunkLength = Math.Min(waveformLength - waveformChunkOffset, 30);
+
+					Array.Copy(waveformChunkData, waveform, waveformChunkLength);
+
+					waveformCurrentLength = waveformChunkLength;
+
+					while (waveformCurrentLength < waveformLength)
+					{
+						GetWaveformLowLevel(out waveformChunkOffset, out waveformChunkData);
+
+						waveformOutOfSync = waveformChunkOffset != waveformCurrentLength;
+
+						if (waveformOutOfSync) {
+							break;
+						}
+
+						waveformChunkLength = Math.Min(waveformLength - waveformChunkOffset, 30);
+
+						Array.Copy(waveformChunkData, 0, waveform, waveformCurrentLength, waveformChunkLength);
+
+						waveformCurrentLength += waveformChunkLength;
+					}
+				}
+
+				if (waveformOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (waveformChunkOffset + 30 < waveformLength)
+					{
+						GetWaveformLowLevel(out waveformChunkOffset, out waveformChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Waveform is out-of-sync");
+				}
+			}
+
+			return waveform;
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnEnergyDataCallback(byte[] response)
+		{
+			if (response.Length != 36)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.IntFrom(8, response);
+			int current = LEConverter.IntFrom(12, response);
+			int energy = LEConverter.IntFrom(16, response);
+			int realPower = LEConverter.IntFrom(20, response);
+			int apparentPower = LEConverter.IntFrom(24, response);
+			int reactivePower = LEConverter.IntFrom(28, response);
+			int powerFactor = LEConverter.UShortFrom(32, response);
+			int frequency = LEConverter.UShortFrom(34, response);
+			var handler = EnergyDataCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage, current, energy, realPower, apparentPower, reactivePower, powerFactor, frequency);
+			}
+		}
+	}
+}
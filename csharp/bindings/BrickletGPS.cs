@@ -0,0 +1,773 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Determine position, velocity and altitude using GPS
+	/// </summary>
+	public class BrickletGPS : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 222;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "GPS Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COORDINATES = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALTITUDE = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MOTION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DATE_TIME = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESTART = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_COORDINATES_CALLBACK_PERIOD = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COORDINATES_CALLBACK_PERIOD = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_CALLBACK_PERIOD = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_CALLBACK_PERIOD = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MOTION_CALLBACK_PERIOD = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MOTION_CALLBACK_PERIOD = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_COORDINATES = 17;
+
+		private const int CALLBACK_STATUS = 18;
+
+		private const int CALLBACK_ALTITUDE = 19;
+
+		private const int CALLBACK_MOTION = 20;
+
+		private const int CALLBACK_DATE_TIME = 21;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte FIX_NO_FIX = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FIX_2D_FIX = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FIX_3D_FIX = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte RESTART_TYPE_HOT_START = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte RESTART_TYPE_WARM_START = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte RESTART_TYPE_COLD_START = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte RESTART_TYPE_FACTORY_RESET = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletGPS.SetCoordinatesCallbackPeriod"/>. The parameters are the same
+		///  as for <see cref="Tinkerforge.BrickletGPS.GetCoordinates"/>.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPS.CoordinatesCallback"/> callback is only triggered if the coordinates changed
+		///  since the last triggering and if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPS.GetStatus"/>.
+		/// </summary>
+		public event CoordinatesEventHandler CoordinatesCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void CoordinatesEventHandler(BrickletGPS sender, long latitude, char ns, long longitude, char ew, int pdop, int hdop, int vdop, int epe);
+
+		/// <summary>
+		/// </summary>
+		public event CoordinatesEventHandler Coordinates // for backward compatibility
+		{
+			add { CoordinatesCallback += value; }
+			remove { CoordinatesCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletGPS.SetStatusCallbackPeriod"/>. The parameters are the same
+		///  as for <see cref="Tinkerforge.BrickletGPS.GetStatus"/>.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPS.StatusCallback"/> callback is only triggered if the status changed since the
+		///  last triggering.
+		/// </summary>
+		public event StatusEventHandler StatusCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void StatusEventHandler(BrickletGPS sender, byte fix, byte satellitesView, byte satellitesUsed);
+
+		/// <summary>
+		/// </summary>
+		public event StatusEventHandler Status // for backward compatibility
+		{
+			add { StatusCallback += value; }
+			remove { StatusCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletGPS.SetAltitudeCallbackPeriod"/>. The parameters are the same
+		///  as for <see cref="Tinkerforge.BrickletGPS.GetAltitude"/>.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPS.AltitudeCallback"/> callback is only triggered if the altitude changed since
+		///  the last triggering and if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPS.GetStatus"/>.
+		/// </summary>
+		public event AltitudeEventHandler AltitudeCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AltitudeEventHandler(BrickletGPS sender, int altitude, int geoidalSeparation);
+
+		/// <summary>
+		/// </summary>
+		public event AltitudeEventHandler Altitude // for backward compatibility
+		{
+			add { AltitudeCallback += value; }
+			remove { AltitudeCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletGPS.SetMotionCallbackPeriod"/>. The parameters are the same
+		///  as for <see cref="Tinkerforge.BrickletGPS.GetMotion"/>.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPS.MotionCallback"/> callback is only triggered if the motion changed since the
+		///  last triggering and if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPS.GetStatus"/>.
+		/// </summary>
+		public event MotionEventHandler MotionCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void MotionEventHandler(BrickletGPS sender, long course, long speed);
+
+		/// <summary>
+		/// </summary>
+		public event MotionEventHandler Motion // for backward compatibility
+		{
+			add { MotionCallback += value; }
+			remove { MotionCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletGPS.SetDateTimeCallbackPeriod"/>. The parameters are the same
+		///  as for <see cref="Tinkerforge.BrickletGPS.GetDateTime"/>.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPS.DateTimeCallback"/> callback is only triggered if the date or time changed
+		///  since the last triggering.
+		/// </summary>
+		public event DateTimeEventHandler DateTimeCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void DateTimeEventHandler(BrickletGPS sender, long date, long time);
+
+		/// <summary>
+		/// </summary>
+		public event DateTimeEventHandler DateTime // for backward compatibility
+		{
+			add { DateTimeCallback += value; }
+			remove { DateTimeCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletGPS(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_COORDINATES] = new CallbackWrapper(OnCoordinatesCallback);
+			callbackWrappers[CALLBACK_STATUS] = new CallbackWrapper(OnStatusCallback);
+			callbackWrappers[CALLBACK_ALTITUDE] = new CallbackWrapper(OnAltitudeCallback);
+			callbackWrappers[CALLBACK_MOTION] = new CallbackWrapper(OnMotionCallback);
+			callbackWrappers[CALLBACK_DATE_TIME] = new CallbackWrapper(OnDateTimeCallback);
+
+
+			responseExpected[FUNCTION_GET_COORDINATES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ALTITUDE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_MOTION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_DATE_TIME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESTART] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_COORDINATES_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_COORDINATES_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_STATUS_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MOTION_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_MOTION_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the GPS coordinates. Latitude and longitude are given in the
+		///  ``DD.dddddd°`` format, the value 57123468 means 57.123468°.
+		///  The parameter ``ns`` and ``ew`` are the cardinal directions for
+		///  latitude and longitude. Possible values for ``ns`` and ``ew`` are 'N', 'S', 'E'
+		///  and 'W' (north, south, east and west).
+		///  
+		///  PDOP, HDOP and VDOP are the dilution of precision (DOP) values. They specify
+		///  the additional multiplicative effect of GPS satellite geometry on GPS
+		///  precision. See
+		///  `here &lt;https://en.wikipedia.org/wiki/Dilution_of_precision_(GPS)&gt;`__
+		///  for more information.
+		///  
+		///  EPE is the "Estimated Position Error". This is not the
+		///  absolute maximum error, it is the error with a specific confidence. See
+		///  `here &lt;https://www.nps.gov/gis/gps/WhatisEPE.html&gt;`__ for more information.
+		///  
+		///  This data is only valid if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPS.GetStatus"/>.
+		/// </summary>
+		public void GetCoordinates(out long latitude, out char ns, out long longitude, out char ew, out int pdop, out int hdop, out int vdop, out int epe)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COORDINATES);
+
+			byte[] response = SendRequest(request, 26);
+
+			latitude = LEConverter.UIntFrom(8, response);
+			ns = LEConverter.CharFrom(12, response);
+			longitude = LEConverter.UIntFrom(13, response);
+			ew = LEConverter.CharFrom(17, response);
+			pdop = LEConverter.UShortFrom(18, response);
+			hdop = LEConverter.UShortFrom(20, response);
+			vdop = LEConverter.UShortFrom(22, response);
+			epe = LEConverter.UShortFrom(24, response);
+		}
+
+		/// <summary>
+		///  Returns the current fix status, the number of satellites that are in view and
+		///  the number of satellites that are currently used.
+		///  
+		///  Possible fix status values can be:
+		///  
+		///  <code>
+		///   "Value", "Description"
+		///  
+		///   "1", "No Fix, <see cref="Tinkerforge.BrickletGPS.GetCoordinates"/>, <see cref="Tinkerforge.BrickletGPS.GetAltitude"/> and <see cref="Tinkerforge.BrickletGPS.GetMotion"/> return invalid data"
+		///   "2", "2D Fix, only <see cref="Tinkerforge.BrickletGPS.GetCoordinates"/> and <see cref="Tinkerforge.BrickletGPS.GetMotion"/> return valid data"
+		///   "3", "3D Fix, <see cref="Tinkerforge.BrickletGPS.GetCoordinates"/>, <see cref="Tinkerforge.BrickletGPS.GetAltitude"/> and <see cref="Tinkerforge.BrickletGPS.GetMotion"/> return valid data"
+		///  </code>
+		///  
+		///  There is also a :ref:`blue LED &lt;gps_bricklet_fix_led&gt;` on the Bricklet that
+		///  indicates the fix status.
+		/// </summary>
+		public void GetStatus(out byte fix, out byte satellitesView, out byte satellitesUsed)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS);
+
+			byte[] response = SendRequest(request, 11);
+
+			fix = LEConverter.ByteFrom(8, response);
+			satellitesView = LEConverter.ByteFrom(9, response);
+			satellitesUsed = LEConverter.ByteFrom(10, response);
+		}
+
+		/// <summary>
+		///  Returns the current altitude and corresponding geoidal separation.
+		///  
+		///  This data is only valid if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPS.GetStatus"/>.
+		/// </summary>
+		public void GetAltitude(out int altitude, out int geoidalSeparation)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALTITUDE);
+
+			byte[] response = SendRequest(request, 16);
+
+			altitude = LEConverter.IntFrom(8, response);
+			geoidalSeparation = LEConverter.IntFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the current course and speed. A course of 0° means the Bricklet is
+		///  traveling north bound and 90° means it is traveling east bound.
+		///  
+		///  Please note that this only returns useful values if an actual movement
+		///  is present.
+		///  
+		///  This data is only valid if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPS.GetStatus"/>.
+		/// </summary>
+		public void GetMotion(out long course, out long speed)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MOTION);
+
+			byte[] response = SendRequest(request, 16);
+
+			course = LEConverter.UIntFrom(8, response);
+			speed = LEConverter.UIntFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the current date and time. The date is
+		///  given in the format ``ddmmyy`` and the time is given
+		///  in the format ``hhmmss.sss``. For example, 140713 means
+		///  14.07.13 as date and 195923568 means 19:59:23.568 as time.
+		/// </summary>
+		public void GetDateTime(out long date, out long time)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DATE_TIME);
+
+			byte[] response = SendRequest(request, 16);
+
+			date = LEConverter.UIntFrom(8, response);
+			time = LEConverter.UIntFrom(12, response);
+		}
+
+		/// <summary>
+		///  Restarts the GPS Bricklet, the following restart types are available:
+		///  
+		///  <code>
+		///   "Value", "Description"
+		///  
+		///   "0", "Hot start (use all available data in the NV store)"
+		///   "1", "Warm start (don't use ephemeris at restart)"
+		///   "2", "Cold start (don't use time, position, almanacs and ephemeris at restart)"
+		///   "3", "Factory reset (clear all system/user configurations at restart)"
+		///  </code>
+		/// </summary>
+		public void Restart(byte restartType)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_RESTART);
+			LEConverter.To((byte)restartType, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletGPS.CoordinatesCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPS.CoordinatesCallback"/> callback is only triggered if the coordinates changed
+		///  since the last triggering.
+		/// </summary>
+		public void SetCoordinatesCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_COORDINATES_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletGPS.SetCoordinatesCallbackPeriod"/>.
+		/// </summary>
+		public long GetCoordinatesCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COORDINATES_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletGPS.StatusCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPS.StatusCallback"/> callback is only triggered if the status changed since the
+		///  last triggering.
+		/// </summary>
+		public void SetStatusCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_STATUS_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletGPS.SetStatusCallbackPeriod"/>.
+		/// </summary>
+		public long GetStatusCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletGPS.AltitudeCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPS.AltitudeCallback"/> callback is only triggered if the altitude changed since
+		///  the last triggering.
+		/// </summary>
+		public void SetAltitudeCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletGPS.SetAltitudeCallbackPeriod"/>.
+		/// </summary>
+		public long GetAltitudeCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletGPS.MotionCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPS.MotionCallback"/> callback is only triggered if the motion changed since the
+		///  last triggering.
+		/// </summary>
+		public void SetMotionCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_MOTION_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletGPS.SetMotionCallbackPeriod"/>.
+		/// </summary>
+		public long GetMotionCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MOTION_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletGPS.DateTimeCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPS.DateTimeCallback"/> callback is only triggered if the date or time changed
+		///  since the last triggering.
+		/// </summary>
+		public void SetDateTimeCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletGPS.SetDateTimeCallbackPeriod"/>.
+		/// </summary>
+		public long GetDateTimeCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnCoordinatesCallback(byte[] response)
+		{
+			if (response.Length != 26)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long latitude = LEConverter.UIntFrom(8, response);
+			char ns = LEConverter.CharFrom(12, response);
+			long longitude = LEConverter.UIntFrom(13, response);
+			char ew = LEConverter.CharFrom(17, response);
+			int pdop = LEConverter.UShortFrom(18, response);
+			int hdop = LEConverter.UShortFrom(20, response);
+			int vdop = LEConverter.UShortFrom(22, response);
+			int epe = LEConverter.UShortFrom(24, response);
+			var handler = CoordinatesCallback;
+
+			if (handler != null)
+			{
+				handler(this, latitude, ns, longitude, ew, pdop, hdop, vdop, epe);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnStatusCallback(byte[] response)
+		{
+			if (response.Length != 11)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte fix = LEConverter.ByteFrom(8, response);
+			byte satellitesView = LEConverter.ByteFrom(9, response);
+			byte satellitesUsed = LEConverter.ByteFrom(10, response);
+			var handler = StatusCallback;
+
+			if (handler != null)
+			{
+				handler(this, fix, satellitesView, satellitesUsed);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAltitudeCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int altitude = LEConverter.IntFrom(8, response);
+			int geoidalSeparation = LEConverter.IntFrom(12, response);
+			var handler = AltitudeCallback;
+
+			if (handler != null)
+			{
+				handler(this, altitude, geoidalSeparation);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnMotionCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long course = LEConverter.UIntFrom(8, response);
+			long speed = LEConverter.UIntFrom(12, response);
+			var handler = MotionCallback;
+
+			if (handler != null)
+			{
+				handler(this, course, speed);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnDateTimeCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long date = LEConverter.UIntFrom(8, response);
+			long time = LEConverter.UIntFrom(12, response);
+			var handler = DateTimeCallback;
+
+			if (handler != null)
+			{
+				handler(this, date, time);
+			}
+		}
+	}
+}
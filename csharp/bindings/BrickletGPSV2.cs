@@ -0,0 +1,1336 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Determine position, velocity and altitude using GPS
+	/// </summary>
+	public class BrickletGPSV2 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 276;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "GPS Bricklet 2.0";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COORDINATES = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALTITUDE = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MOTION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DATE_TIME = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESTART = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SATELLITE_STATUS = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FIX_LED_CONFIG = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FIX_LED_CONFIG = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_COORDINATES_CALLBACK_PERIOD = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COORDINATES_CALLBACK_PERIOD = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_CALLBACK_PERIOD = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_CALLBACK_PERIOD = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MOTION_CALLBACK_PERIOD = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MOTION_CALLBACK_PERIOD = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SBAS_CONFIG = 27;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SBAS_CONFIG = 28;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_PULSE_PER_SECOND = 21;
+
+		private const int CALLBACK_COORDINATES = 22;
+
+		private const int CALLBACK_STATUS = 23;
+
+		private const int CALLBACK_ALTITUDE = 24;
+
+		private const int CALLBACK_MOTION = 25;
+
+		private const int CALLBACK_DATE_TIME = 26;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte RESTART_TYPE_HOT_START = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte RESTART_TYPE_WARM_START = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte RESTART_TYPE_COLD_START = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte RESTART_TYPE_FACTORY_RESET = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte SATELLITE_SYSTEM_GPS = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SATELLITE_SYSTEM_GLONASS = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte SATELLITE_SYSTEM_GALILEO = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FIX_NO_FIX = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FIX_2D_FIX = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FIX_3D_FIX = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte FIX_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FIX_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FIX_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FIX_LED_CONFIG_SHOW_FIX = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte FIX_LED_CONFIG_SHOW_PPS = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte SBAS_ENABLED = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SBAS_DISABLED = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered precisely once per second,
+		///  see `PPS &lt;https://en.wikipedia.org/wiki/Pulse-per-second_signal&gt;`__.
+		///  
+		///  The precision of two subsequent pulses will be skewed because
+		///  of the latency in the USB/RS485/Ethernet connection. But in the
+		///  long run this will be very precise. For example a count of
+		///  3600 pulses will take exactly 1 hour.
+		/// </summary>
+		public event PulsePerSecondEventHandler PulsePerSecondCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void PulsePerSecondEventHandler(BrickletGPSV2 sender);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletGPSV2.SetCoordinatesCallbackPeriod"/>. The parameters are the same
+		///  as for <see cref="Tinkerforge.BrickletGPSV2.GetCoordinates"/>.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPSV2.CoordinatesCallback"/> callback is only triggered if the coordinates changed
+		///  since the last triggering and if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPSV2.GetStatus"/>.
+		/// </summary>
+		public event CoordinatesEventHandler CoordinatesCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void CoordinatesEventHandler(BrickletGPSV2 sender, long latitude, char ns, long longitude, char ew);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletGPSV2.SetStatusCallbackPeriod"/>. The parameters are the same
+		///  as for <see cref="Tinkerforge.BrickletGPSV2.GetStatus"/>.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPSV2.StatusCallback"/> callback is only triggered if the status changed since the
+		///  last triggering.
+		/// </summary>
+		public event StatusEventHandler StatusCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void StatusEventHandler(BrickletGPSV2 sender, bool hasFix, byte satellitesView);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletGPSV2.SetAltitudeCallbackPeriod"/>. The parameters are the same
+		///  as for <see cref="Tinkerforge.BrickletGPSV2.GetAltitude"/>.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPSV2.AltitudeCallback"/> callback is only triggered if the altitude changed since the
+		///  last triggering and if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPSV2.GetStatus"/>.
+		/// </summary>
+		public event AltitudeEventHandler AltitudeCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AltitudeEventHandler(BrickletGPSV2 sender, int altitude, int geoidalSeparation);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletGPSV2.SetMotionCallbackPeriod"/>. The parameters are the same
+		///  as for <see cref="Tinkerforge.BrickletGPSV2.GetMotion"/>.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPSV2.MotionCallback"/> callback is only triggered if the motion changed since the
+		///  last triggering and if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPSV2.GetStatus"/>.
+		/// </summary>
+		public event MotionEventHandler MotionCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void MotionEventHandler(BrickletGPSV2 sender, long course, long speed);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletGPSV2.SetDateTimeCallbackPeriod"/>. The parameters are the same
+		///  as for <see cref="Tinkerforge.BrickletGPSV2.GetDateTime"/>.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPSV2.DateTimeCallback"/> callback is only triggered if the date or time changed
+		///  since the last triggering.
+		/// </summary>
+		public event DateTimeEventHandler DateTimeCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void DateTimeEventHandler(BrickletGPSV2 sender, long date, long time);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletGPSV2(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_PULSE_PER_SECOND] = new CallbackWrapper(OnPulsePerSecondCallback);
+			callbackWrappers[CALLBACK_COORDINATES] = new CallbackWrapper(OnCoordinatesCallback);
+			callbackWrappers[CALLBACK_STATUS] = new CallbackWrapper(OnStatusCallback);
+			callbackWrappers[CALLBACK_ALTITUDE] = new CallbackWrapper(OnAltitudeCallback);
+			callbackWrappers[CALLBACK_MOTION] = new CallbackWrapper(OnMotionCallback);
+			callbackWrappers[CALLBACK_DATE_TIME] = new CallbackWrapper(OnDateTimeCallback);
+
+
+			responseExpected[FUNCTION_GET_COORDINATES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ALTITUDE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_MOTION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_DATE_TIME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESTART] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SATELLITE_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_FIX_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_FIX_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_COORDINATES_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_COORDINATES_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_STATUS_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MOTION_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_MOTION_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SBAS_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SBAS_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the GPS coordinates. Latitude and longitude are given in the
+		///  ``DD.dddddd°`` format, the value 57123468 means 57.123468°.
+		///  The parameter ``ns`` and ``ew`` are the cardinal directions for
+		///  latitude and longitude. Possible values for ``ns`` and ``ew`` are 'N', 'S', 'E'
+		///  and 'W' (north, south, east and west).
+		///  
+		///  This data is only valid if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPSV2.GetStatus"/>.
+		/// </summary>
+		public void GetCoordinates(out long latitude, out char ns, out long longitude, out char ew)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COORDINATES);
+
+			byte[] response = SendRequest(request, 18);
+
+			latitude = LEConverter.UIntFrom(8, response);
+			ns = LEConverter.CharFrom(12, response);
+			longitude = LEConverter.UIntFrom(13, response);
+			ew = LEConverter.CharFrom(17, response);
+		}
+
+		/// <summary>
+		///  Returns if a fix is currently available as well as the, the number of
+		///  satellites that are in view.
+		///  
+		///  There is also a :ref:`green LED &lt;gps_v2_bricklet_fix_led&gt;` on the Bricklet that
+		///  indicates the fix status.
+		/// </summary>
+		public void GetStatus(out bool hasFix, out byte satellitesView)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS);
+
+			byte[] response = SendRequest(request, 10);
+
+			hasFix = LEConverter.BoolFrom(8, response);
+			satellitesView = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the current altitude and corresponding geoidal separation.
+		///  
+		///  This data is only valid if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPSV2.GetStatus"/>.
+		/// </summary>
+		public void GetAltitude(out int altitude, out int geoidalSeparation)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALTITUDE);
+
+			byte[] response = SendRequest(request, 16);
+
+			altitude = LEConverter.IntFrom(8, response);
+			geoidalSeparation = LEConverter.IntFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the current course and speed. A course of 0° means the Bricklet is
+		///  traveling north bound and 90° means it is traveling east bound.
+		///  
+		///  Please note that this only returns useful values if an actual movement
+		///  is present.
+		///  
+		///  This data is only valid if there is currently a fix as indicated by
+		///  <see cref="Tinkerforge.BrickletGPSV2.GetStatus"/>.
+		/// </summary>
+		public void GetMotion(out long course, out long speed)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MOTION);
+
+			byte[] response = SendRequest(request, 16);
+
+			course = LEConverter.UIntFrom(8, response);
+			speed = LEConverter.UIntFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the current date and time. The date is
+		///  given in the format ``ddmmyy`` and the time is given
+		///  in the format ``hhmmss.sss``. For example, 140713 means
+		///  14.07.13 as date and 195923568 means 19:59:23.568 as time.
+		/// </summary>
+		public void GetDateTime(out long date, out long time)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DATE_TIME);
+
+			byte[] response = SendRequest(request, 16);
+
+			date = LEConverter.UIntFrom(8, response);
+			time = LEConverter.UIntFrom(12, response);
+		}
+
+		/// <summary>
+		///  Restarts the GPS Bricklet, the following restart types are available:
+		///  
+		///  <code>
+		///   "Value", "Description"
+		///  
+		///   "0", "Hot start (use all available data in the NV store)"
+		///   "1", "Warm start (don't use ephemeris at restart)"
+		///   "2", "Cold start (don't use time, position, almanacs and ephemeris at restart)"
+		///   "3", "Factory reset (clear all system/user configurations at restart)"
+		///  </code>
+		/// </summary>
+		public void Restart(byte restartType)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_RESTART);
+			LEConverter.To((byte)restartType, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the
+		///  
+		///  * satellite numbers list (up to 12 items)
+		///  * fix value,
+		///  * PDOP value,
+		///  * HDOP value and
+		///  * VDOP value
+		///  
+		///  for a given satellite system. Currently GPS and GLONASS are supported, Galileo
+		///  is not yet supported.
+		///  
+		///  The GPS and GLONASS satellites have unique numbers and the satellite list gives
+		///  the numbers of the satellites that are currently utilized. The number 0 is not
+		///  a valid satellite number and can be ignored in the list.
+		/// </summary>
+		public void GetSatelliteSystemStatusLowLevel(byte satelliteSystem, out byte satelliteNumbersLength, out byte[] satelliteNumbersData, out byte fix, out int pdop, out int hdop, out int vdop)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL);
+			LEConverter.To((byte)satelliteSystem, 8, request);
+
+			byte[] response = SendRequest(request, 28);
+
+			satelliteNumbersLength = LEConverter.ByteFrom(8, response);
+			satelliteNumbersData = LEConverter.ByteArrayFrom(9, response, 12);
+			fix = LEConverter.ByteFrom(21, response);
+			pdop = LEConverter.UShortFrom(22, response);
+			hdop = LEConverter.UShortFrom(24, response);
+			vdop = LEConverter.UShortFrom(26, response);
+		}
+
+		/// <summary>
+		///  Returns the current elevation, azimuth and SNR
+		///  for a given satellite and satellite system.
+		///  
+		///  The satellite number here always goes from 1 to 32. For GLONASS it corresponds to
+		///  the satellites 65-96.
+		///  
+		///  Galileo is not yet supported.
+		/// </summary>
+		public void GetSatelliteStatus(byte satelliteSystem, byte satelliteNumber, out short elevation, out short azimuth, out short snr)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_GET_SATELLITE_STATUS);
+			LEConverter.To((byte)satelliteSystem, 8, request);
+			LEConverter.To((byte)satelliteNumber, 9, request);
+
+			byte[] response = SendRequest(request, 14);
+
+			elevation = LEConverter.ShortFrom(8, response);
+			azimuth = LEConverter.ShortFrom(10, response);
+			snr = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Sets the fix LED configuration. By default the LED shows if
+		///  the Bricklet got a GPS fix yet. If a fix is established the LED turns on.
+		///  If there is no fix then the LED is turned off.
+		///  
+		///  You can also turn the LED permanently on/off, show a heartbeat or let it blink
+		///  in sync with the PPS (pulse per second) output of the GPS module.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is off.
+		/// </summary>
+		public void SetFixLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_FIX_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletGPSV2.SetFixLEDConfig"/>
+		/// </summary>
+		public byte GetFixLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FIX_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletGPSV2.CoordinatesCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPSV2.CoordinatesCallback"/> callback is only triggered if the coordinates changed
+		///  since the last triggering.
+		/// </summary>
+		public void SetCoordinatesCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_COORDINATES_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletGPSV2.SetCoordinatesCallbackPeriod"/>.
+		/// </summary>
+		public long GetCoordinatesCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COORDINATES_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletGPSV2.StatusCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPSV2.StatusCallback"/> callback is only triggered if the status changed since the
+		///  last triggering.
+		/// </summary>
+		public void SetStatusCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_STATUS_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletGPSV2.SetStatusCallbackPeriod"/>.
+		/// </summary>
+		public long GetStatusCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletGPSV2.AltitudeCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPSV2.AltitudeCallback"/> callback is only triggered if the altitude changed since the
+		///  last triggering.
+		/// </summary>
+		public void SetAltitudeCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletGPSV2.SetAltitudeCallbackPeriod"/>.
+		/// </summary>
+		public long GetAltitudeCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletGPSV2.MotionCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPSV2.MotionCallback"/> callback is only triggered if the motion changed since the
+		///  last triggering.
+		/// </summary>
+		public void SetMotionCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_MOTION_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletGPSV2.SetMotionCallbackPeriod"/>.
+		/// </summary>
+		public long GetMotionCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MOTION_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletGPSV2.DateTimeCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletGPSV2.DateTimeCallback"/> callback is only triggered if the date or time changed
+		///  since the last triggering.
+		/// </summary>
+		public void SetDateTimeCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletGPSV2.SetDateTimeCallbackPeriod"/>.
+		/// </summary>
+		public long GetDateTimeCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  If `SBAS &lt;https://en.wikipedia.org/wiki/GNSS_augmentation#Satellite-based_augmentation_system&gt;`__ is enabled,
+		///  the position accuracy increases (if SBAS satellites are in view),
+		///  but the update rate is limited to 5Hz. With SBAS disabled the update rate is increased to 10Hz.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetSBASConfig(byte sbasConfig)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_SBAS_CONFIG);
+			LEConverter.To((byte)sbasConfig, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the SBAS configuration as set by <see cref="Tinkerforge.BrickletGPSV2.SetSBASConfig"/>
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public byte GetSBASConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SBAS_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletGPSV2.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletGPSV2.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletGPSV2.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletGPSV2.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Returns the
+		///  
+		///  * satellite numbers list (up to 12 items)
+		///  * fix value,
+		///  * PDOP value,
+		///  * HDOP value and
+		///  * VDOP value
+		///  
+		///  for a given satellite system. Currently GPS and GLONASS are supported, Galileo
+		///  is not yet supported.
+		///  
+		///  The GPS and GLONASS satellites have unique numbers and the satellite list gives
+		///  the numbers of the satellites that are currently utilized. The number 0 is not
+		///  a valid satellite number and can be ignored in the list.
+		/// </summary>
+		public void GetSatelliteSystemStatus(byte satelliteSystem, out byte[] satelliteNumbers, out byte fix, out int pdop, out int hdop, out int vdop)
+		{
+			byte satelliteNumbersLength;
+			byte[] satelliteNumbersData = new byte[12];
+
+			GetSatelliteSystemStatusLowLevel(satelliteSystem, out satelliteNumbersLength, out satelliteNumbersData, out fix, out pdop, out hdop, out vdop);
+
+			satelliteNumbers = new byte[satelliteNumbersLength];
+
+			Array.Copy(satelliteNumbersData, satelliteNumbers, satelliteNumbersLength);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnPulsePerSecondCallback(byte[] response)
+		{
+			if (response.Length != 8)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			var handler = PulsePerSecondCallback;
+
+			if (handler != null)
+			{
+				handler(this);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnCoordinatesCallback(byte[] response)
+		{
+			if (response.Length != 18)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long latitude = LEConverter.UIntFrom(8, response);
+			char ns = LEConverter.CharFrom(12, response);
+			long longitude = LEConverter.UIntFrom(13, response);
+			char ew = LEConverter.CharFrom(17, response);
+			var handler = CoordinatesCallback;
+
+			if (handler != null)
+			{
+				handler(this, latitude, ns, longitude, ew);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnStatusCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			bool hasFix = LEConverter.BoolFrom(8, response);
+			byte satellitesView = LEConverter.ByteFrom(9, response);
+			var handler = StatusCallback;
+
+			if (handler != null)
+			{
+				handler(this, hasFix, satellitesView);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAltitudeCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int altitude = LEConverter.IntFrom(8, response);
+			int geoidalSeparation = LEConverter.IntFrom(12, response);
+			var handler = AltitudeCallback;
+
+			if (handler != null)
+			{
+				handler(this, altitude, geoidalSeparation);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnMotionCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long course = LEConverter.UIntFrom(8, response);
+			long speed = LEConverter.UIntFrom(12, response);
+			var handler = MotionCallback;
+
+			if (handler != null)
+			{
+				handler(this, course, speed);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnDateTimeCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long date = LEConverter.UIntFrom(8, response);
+			long time = LEConverter.UIntFrom(12, response);
+			var handler = DateTimeCallback;
+
+			if (handler != null)
+			{
+				handler(this, date, time);
+			}
+		}
+	}
+}
@@ -0,0 +1,1827 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Full fledged AHRS with 9 degrees of freedom
+	/// </summary>
+	public class BrickletIMUV3 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2161;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "IMU Bricklet 3.0";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MAGNETIC_FIELD = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ANGULAR_VELOCITY = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ORIENTATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_LINEAR_ACCELERATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GRAVITY_VECTOR = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_QUATERNION = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_DATA = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SAVE_CALIBRATION = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SENSOR_CONFIGURATION = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SENSOR_CONFIGURATION = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SENSOR_FUSION_MODE = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SENSOR_FUSION_MODE = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ORIENTATION_CALLBACK_CONFIGURATION = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ORIENTATION_CALLBACK_CONFIGURATION = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION = 27;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION = 28;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_QUATERNION_CALLBACK_CONFIGURATION = 29;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_QUATERNION_CALLBACK_CONFIGURATION = 30;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALL_DATA_CALLBACK_CONFIGURATION = 31;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_DATA_CALLBACK_CONFIGURATION = 32;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_ACCELERATION = 33;
+
+		private const int CALLBACK_MAGNETIC_FIELD = 34;
+
+		private const int CALLBACK_ANGULAR_VELOCITY = 35;
+
+		private const int CALLBACK_TEMPERATURE = 36;
+
+		private const int CALLBACK_LINEAR_ACCELERATION = 37;
+
+		private const int CALLBACK_GRAVITY_VECTOR = 38;
+
+		private const int CALLBACK_ORIENTATION = 39;
+
+		private const int CALLBACK_QUATERNION = 40;
+
+		private const int CALLBACK_ALL_DATA = 41;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_2HZ = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_6HZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_8HZ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_10HZ = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_15HZ = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_20HZ = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_25HZ = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte MAGNETOMETER_RATE_30HZ = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_RANGE_2000DPS = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_RANGE_1000DPS = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_RANGE_500DPS = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_RANGE_250DPS = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_RANGE_125DPS = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_523HZ = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_230HZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_116HZ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_47HZ = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_23HZ = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_12HZ = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_64HZ = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte GYROSCOPE_BANDWIDTH_32HZ = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_RANGE_2G = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_RANGE_4G = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_RANGE_8G = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_RANGE_16G = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_7_81HZ = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_15_63HZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_31_25HZ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_62_5HZ = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_125HZ = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_250HZ = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_500HZ = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte ACCELEROMETER_BANDWIDTH_1000HZ = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte SENSOR_FUSION_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SENSOR_FUSION_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte SENSOR_FUSION_ON_WITHOUT_MAGNETOMETER = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte SENSOR_FUSION_ON_WITHOUT_FAST_MAGNETOMETER_CALIBRATION = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetAccelerationCallbackConfiguration"/>. The parameters are the acceleration
+		///  for the x, y and z axis.
+		/// </summary>
+		public event AccelerationEventHandler AccelerationCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AccelerationEventHandler(BrickletIMUV3 sender, short x, short y, short z);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetMagneticFieldCallbackConfiguration"/>. The parameters are the magnetic
+		///  field for the x, y and z axis.
+		/// </summary>
+		public event MagneticFieldEventHandler MagneticFieldCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void MagneticFieldEventHandler(BrickletIMUV3 sender, short x, short y, short z);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetAngularVelocityCallbackConfiguration"/>. The parameters are the angular
+		///  velocity for the x, y and z axis.
+		/// </summary>
+		public event AngularVelocityEventHandler AngularVelocityCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AngularVelocityEventHandler(BrickletIMUV3 sender, short x, short y, short z);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetTemperatureCallbackConfiguration"/>. The parameter is the temperature.
+		/// </summary>
+		public event TemperatureEventHandler TemperatureCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void TemperatureEventHandler(BrickletIMUV3 sender, short temperature);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetLinearAccelerationCallbackConfiguration"/>. The parameters are the
+		///  linear acceleration for the x, y and z axis.
+		/// </summary>
+		public event LinearAccelerationEventHandler LinearAccelerationCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void LinearAccelerationEventHandler(BrickletIMUV3 sender, short x, short y, short z);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetGravityVectorCallbackConfiguration"/>. The parameters gravity vector
+		///  for the x, y and z axis.
+		/// </summary>
+		public event GravityVectorEventHandler GravityVectorCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void GravityVectorEventHandler(BrickletIMUV3 sender, short x, short y, short z);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetOrientationCallbackConfiguration"/>. The parameters are the orientation
+		///  (heading (yaw), roll, pitch) of the IMU Brick in Euler angles. See
+		///  <see cref="Tinkerforge.BrickletIMUV3.GetOrientation"/> for details.
+		/// </summary>
+		public event OrientationEventHandler OrientationCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void OrientationEventHandler(BrickletIMUV3 sender, short heading, short roll, short pitch);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetQuaternionCallbackConfiguration"/>. The parameters are the orientation
+		///  (w, x, y, z) of the IMU Brick in quaternions. See <see cref="Tinkerforge.BrickletIMUV3.GetQuaternion"/>
+		///  for details.
+		/// </summary>
+		public event QuaternionEventHandler QuaternionCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void QuaternionEventHandler(BrickletIMUV3 sender, short w, short x, short y, short z);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetAllDataCallbackConfiguration"/>. The parameters are as for
+		///  <see cref="Tinkerforge.BrickletIMUV3.GetAllData"/>.
+		/// </summary>
+		public event AllDataEventHandler AllDataCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AllDataEventHandler(BrickletIMUV3 sender, short[] acceleration, short[] magneticField, short[] angularVelocity, short[] eulerAngle, short[] quaternion, short[] linearAcceleration, short[] gravityVector, short temperature, byte calibrationStatus);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletIMUV3(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_ACCELERATION] = new CallbackWrapper(OnAccelerationCallback);
+			callbackWrappers[CALLBACK_MAGNETIC_FIELD] = new CallbackWrapper(OnMagneticFieldCallback);
+			callbackWrappers[CALLBACK_ANGULAR_VELOCITY] = new CallbackWrapper(OnAngularVelocityCallback);
+			callbackWrappers[CALLBACK_TEMPERATURE] = new CallbackWrapper(OnTemperatureCallback);
+			callbackWrappers[CALLBACK_LINEAR_ACCELERATION] = new CallbackWrapper(OnLinearAccelerationCallback);
+			callbackWrappers[CALLBACK_GRAVITY_VECTOR] = new CallbackWrapper(OnGravityVectorCallback);
+			callbackWrappers[CALLBACK_ORIENTATION] = new CallbackWrapper(OnOrientationCallback);
+			callbackWrappers[CALLBACK_QUATERNION] = new CallbackWrapper(OnQuaternionCallback);
+			callbackWrappers[CALLBACK_ALL_DATA] = new CallbackWrapper(OnAllDataCallback);
+
+
+			responseExpected[FUNCTION_GET_ACCELERATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_MAGNETIC_FIELD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ANGULAR_VELOCITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ORIENTATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_LINEAR_ACCELERATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_GRAVITY_VECTOR] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_QUATERNION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ALL_DATA] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SAVE_CALIBRATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SENSOR_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SENSOR_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SENSOR_FUSION_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SENSOR_FUSION_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ORIENTATION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ORIENTATION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_QUATERNION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_QUATERNION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALL_DATA_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALL_DATA_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the calibrated acceleration from the accelerometer for the
+		///  x, y and z axis. The acceleration is in the range configured with
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetSensorConfiguration"/>.
+		///  
+		///  If you want to get the acceleration periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletIMUV3.AccelerationCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetAccelerationCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAcceleration(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the calibrated magnetic field from the magnetometer for the
+		///  x, y and z axis.
+		///  
+		///  If you want to get the magnetic field periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletIMUV3.MagneticFieldCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetMagneticFieldCallbackConfiguration"/>.
+		/// </summary>
+		public void GetMagneticField(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MAGNETIC_FIELD);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the calibrated angular velocity from the gyroscope for the
+		///  x, y and z axis. The angular velocity is in the range configured with
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetSensorConfiguration"/>.
+		///  
+		///  If you want to get the angular velocity periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletIMUV3.AngularVelocityCallback"/> acallback nd set the period with
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetAngularVelocityCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAngularVelocity(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ANGULAR_VELOCITY);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature of the IMU Brick.
+		///  The temperature is measured in the core of the BNO055 IC, it is not the
+		///  ambient temperature
+		/// </summary>
+		public short GetTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.SByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current orientation (heading, roll, pitch) of the IMU Brick as
+		///  independent Euler angles. Note that Euler angles always
+		///  experience a `gimbal lock &lt;https://en.wikipedia.org/wiki/Gimbal_lock&gt;`__.
+		///  We recommend that you use quaternions instead, if you need the absolute
+		///  orientation.
+		///  
+		///  If you want to get the orientation periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletIMUV3.OrientationCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetOrientationCallbackConfiguration"/>.
+		/// </summary>
+		public void GetOrientation(out short heading, out short roll, out short pitch)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ORIENTATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			heading = LEConverter.ShortFrom(8, response);
+			roll = LEConverter.ShortFrom(10, response);
+			pitch = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the linear acceleration of the IMU Brick for the
+		///  x, y and z axis. The acceleration is in the range configured with
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetSensorConfiguration"/>.
+		///  
+		///  The linear acceleration is the acceleration in each of the three
+		///  axis of the IMU Brick with the influences of gravity removed.
+		///  
+		///  It is also possible to get the gravity vector with the influence of linear
+		///  acceleration removed, see <see cref="Tinkerforge.BrickletIMUV3.GetGravityVector"/>.
+		///  
+		///  If you want to get the linear acceleration periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletIMUV3.LinearAccelerationCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetLinearAccelerationCallbackConfiguration"/>.
+		/// </summary>
+		public void GetLinearAcceleration(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_LINEAR_ACCELERATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the current gravity vector of the IMU Brick for the
+		///  x, y and z axis.
+		///  
+		///  The gravity vector is the acceleration that occurs due to gravity.
+		///  Influences of additional linear acceleration are removed.
+		///  
+		///  It is also possible to get the linear acceleration with the influence
+		///  of gravity removed, see <see cref="Tinkerforge.BrickletIMUV3.GetLinearAcceleration"/>.
+		///  
+		///  If you want to get the gravity vector periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletIMUV3.GravityVectorCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetGravityVectorCallbackConfiguration"/>.
+		/// </summary>
+		public void GetGravityVector(out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_GRAVITY_VECTOR);
+
+			byte[] response = SendRequest(request, 14);
+
+			x = LEConverter.ShortFrom(8, response);
+			y = LEConverter.ShortFrom(10, response);
+			z = LEConverter.ShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the current orientation (w, x, y, z) of the IMU Brick as
+		///  `quaternions &lt;https://en.wikipedia.org/wiki/Quaternions_and_spatial_rotation&gt;`__.
+		///  
+		///  You have to divide the return values by 16383 (14 bit) to get
+		///  the usual range of -1.0 to +1.0 for quaternions.
+		///  
+		///  If you want to get the quaternions periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletIMUV3.QuaternionCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetQuaternionCallbackConfiguration"/>.
+		/// </summary>
+		public void GetQuaternion(out short w, out short x, out short y, out short z)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_QUATERNION);
+
+			byte[] response = SendRequest(request, 16);
+
+			w = LEConverter.ShortFrom(8, response);
+			x = LEConverter.ShortFrom(10, response);
+			y = LEConverter.ShortFrom(12, response);
+			z = LEConverter.ShortFrom(14, response);
+		}
+
+		/// <summary>
+		///  Return all of the available data of the IMU Brick.
+		///  
+		///  * acceleration (see <see cref="Tinkerforge.BrickletIMUV3.GetAcceleration"/>)
+		///  * magnetic field (see <see cref="Tinkerforge.BrickletIMUV3.GetMagneticField"/>)
+		///  * angular velocity (see <see cref="Tinkerforge.BrickletIMUV3.GetAngularVelocity"/>)
+		///  * Euler angles (see <see cref="Tinkerforge.BrickletIMUV3.GetOrientation"/>)
+		///  * quaternion (see <see cref="Tinkerforge.BrickletIMUV3.GetQuaternion"/>)
+		///  * linear acceleration (see <see cref="Tinkerforge.BrickletIMUV3.GetLinearAcceleration"/>)
+		///  * gravity vector (see <see cref="Tinkerforge.BrickletIMUV3.GetGravityVector"/>)
+		///  * temperature (see <see cref="Tinkerforge.BrickletIMUV3.GetTemperature"/>)
+		///  * calibration status (see below)
+		///  
+		///  The calibration status consists of four pairs of two bits. Each pair
+		///  of bits represents the status of the current calibration.
+		///  
+		///  * bit 0-1: Magnetometer
+		///  * bit 2-3: Accelerometer
+		///  * bit 4-5: Gyroscope
+		///  * bit 6-7: System
+		///  
+		///  A value of 0 means for "not calibrated" and a value of 3 means
+		///  "fully calibrated". In your program you should always be able to
+		///  ignore the calibration status, it is used by the calibration
+		///  window of the Brick Viewer and it can be ignored after the first
+		///  calibration. See the documentation in the calibration window for
+		///  more information regarding the calibration of the IMU Brick.
+		///  
+		///  If you want to get the data periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletIMUV3.AllDataCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetAllDataCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAllData(out short[] acceleration, out short[] magneticField, out short[] angularVelocity, out short[] eulerAngle, out short[] quaternion, out short[] linearAcceleration, out short[] gravityVector, out short temperature, out byte calibrationStatus)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_DATA);
+
+			byte[] response = SendRequest(request, 54);
+
+			acceleration = LEConverter.ShortArrayFrom(8, response, 3);
+			magneticField = LEConverter.ShortArrayFrom(14, response, 3);
+			angularVelocity = LEConverter.ShortArrayFrom(20, response, 3);
+			eulerAngle = LEConverter.ShortArrayFrom(26, response, 3);
+			quaternion = LEConverter.ShortArrayFrom(32, response, 4);
+			linearAcceleration = LEConverter.ShortArrayFrom(40, response, 3);
+			gravityVector = LEConverter.ShortArrayFrom(46, response, 3);
+			temperature = LEConverter.SByteFrom(52, response);
+			calibrationStatus = LEConverter.ByteFrom(53, response);
+		}
+
+		/// <summary>
+		///  A call of this function saves the current calibration to be used
+		///  as a starting point for the next restart of continuous calibration
+		///  of the IMU Brick.
+		///  
+		///  A return value of *true* means that the calibration could be used and
+		///  *false* means that it could not be used (this happens if the calibration
+		///  status is not "fully calibrated").
+		///  
+		///  This function is used by the calibration window of the Brick Viewer, you
+		///  should not need to call it in your program.
+		/// </summary>
+		public bool SaveCalibration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_SAVE_CALIBRATION);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the available sensor configuration for the Magnetometer, Gyroscope and
+		///  Accelerometer. The Accelerometer Range is user selectable in all fusion modes,
+		///  all other configurations are auto-controlled in fusion mode.
+		/// </summary>
+		public void SetSensorConfiguration(byte magnetometerRate, byte gyroscopeRange, byte gyroscopeBandwidth, byte accelerometerRange, byte accelerometerBandwidth)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_SENSOR_CONFIGURATION);
+			LEConverter.To((byte)magnetometerRate, 8, request);
+			LEConverter.To((byte)gyroscopeRange, 9, request);
+			LEConverter.To((byte)gyroscopeBandwidth, 10, request);
+			LEConverter.To((byte)accelerometerRange, 11, request);
+			LEConverter.To((byte)accelerometerBandwidth, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the sensor configuration as set by <see cref="Tinkerforge.BrickletIMUV3.SetSensorConfiguration"/>.
+		/// </summary>
+		public void GetSensorConfiguration(out byte magnetometerRate, out byte gyroscopeRange, out byte gyroscopeBandwidth, out byte accelerometerRange, out byte accelerometerBandwidth)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SENSOR_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			magnetometerRate = LEConverter.ByteFrom(8, response);
+			gyroscopeRange = LEConverter.ByteFrom(9, response);
+			gyroscopeBandwidth = LEConverter.ByteFrom(10, response);
+			accelerometerRange = LEConverter.ByteFrom(11, response);
+			accelerometerBandwidth = LEConverter.ByteFrom(12, response);
+		}
+
+		/// <summary>
+		///  If the fusion mode is turned off, the functions <see cref="Tinkerforge.BrickletIMUV3.GetAcceleration"/>,
+		///  <see cref="Tinkerforge.BrickletIMUV3.GetMagneticField"/> and <see cref="Tinkerforge.BrickletIMUV3.GetAngularVelocity"/> return uncalibrated
+		///  and uncompensated sensor data. All other sensor data getters return no data.
+		///  
+		///  Since firmware version 2.0.6 you can also use a fusion mode without magnetometer.
+		///  In this mode the calculated orientation is relative (with magnetometer it is
+		///  absolute with respect to the earth). However, the calculation can't be influenced
+		///  by spurious magnetic fields.
+		///  
+		///  Since firmware version 2.0.13 you can also use a fusion mode without fast
+		///  magnetometer calibration. This mode is the same as the normal fusion mode,
+		///  but the fast magnetometer calibration is turned off. So to find the orientation
+		///  the first time will likely take longer, but small magnetic influences might
+		///  not affect the automatic calibration as much.
+		/// </summary>
+		public void SetSensorFusionMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_SENSOR_FUSION_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the sensor fusion mode as set by <see cref="Tinkerforge.BrickletIMUV3.SetSensorFusionMode"/>.
+		/// </summary>
+		public byte GetSensorFusionMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SENSOR_FUSION_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIMUV3.AccelerationCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetAccelerationCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletIMUV3.SetAccelerationCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAccelerationCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIMUV3.MagneticFieldCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetMagneticFieldCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletIMUV3.SetMagneticFieldCallbackConfiguration"/>.
+		/// </summary>
+		public void GetMagneticFieldCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIMUV3.AngularVelocityCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetAngularVelocityCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletIMUV3.SetAngularVelocityCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAngularVelocityCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIMUV3.TemperatureCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetTemperatureCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletIMUV3.SetTemperatureCallbackConfiguration"/>.
+		/// </summary>
+		public void GetTemperatureCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIMUV3.OrientationCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetOrientationCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_ORIENTATION_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletIMUV3.SetOrientationCallbackConfiguration"/>.
+		/// </summary>
+		public void GetOrientationCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ORIENTATION_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIMUV3.LinearAccelerationCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetLinearAccelerationCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletIMUV3.SetLinearAccelerationCallbackConfiguration"/>.
+		/// </summary>
+		public void GetLinearAccelerationCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIMUV3.GravityVectorCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetGravityVectorCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletIMUV3.SetGravityVectorCallbackConfiguration"/>.
+		/// </summary>
+		public void GetGravityVectorCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIMUV3.QuaternionCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetQuaternionCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_QUATERNION_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletIMUV3.SetQuaternionCallbackConfiguration"/>.
+		/// </summary>
+		public void GetQuaternionCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_QUATERNION_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIMUV3.AllDataCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetAllDataCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_ALL_DATA_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletIMUV3.SetAllDataCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAllDataCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_DATA_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletIMUV3.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletIMUV3.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletIMUV3.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletIMUV3.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAccelerationCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = AccelerationCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnMagneticFieldCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = MagneticFieldCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAngularVelocityCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = AngularVelocityCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnTemperatureCallback(byte[] response)
+		{
+			if (response.Length != 9)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short temperature = LEConverter.SByteFrom(8, response);
+			var handler = TemperatureCallback;
+
+			if (handler != null)
+			{
+				handler(this, temperature);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnLinearAccelerationCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = LinearAccelerationCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnGravityVectorCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short x = LEConverter.ShortFrom(8, response);
+			short y = LEConverter.ShortFrom(10, response);
+			short z = LEConverter.ShortFrom(12, response);
+			var handler = GravityVectorCallback;
+
+			if (handler != null)
+			{
+				handler(this, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnOrientationCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short heading = LEConverter.ShortFrom(8, response);
+			short roll = LEConverter.ShortFrom(10, response);
+			short pitch = LEConverter.ShortFrom(12, response);
+			var handler = OrientationCallback;
+
+			if (handler != null)
+			{
+				handler(this, heading, roll, pitch);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnQuaternionCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short w = LEConverter.ShortFrom(8, response);
+			short x = LEConverter.ShortFrom(10, response);
+			short y = LEConverter.ShortFrom(12, response);
+			short z = LEConverter.ShortFrom(14, response);
+			var handler = QuaternionCallback;
+
+			if (handler != null)
+			{
+				handler(this, w, x, y, z);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAllDataCallback(byte[] response)
+		{
+			if (response.Length != 54)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short[] acceleration = LEConverter.ShortArrayFrom(8, response, 3);
+			short[] magneticField = LEConverter.ShortArrayFrom(14, response, 3);
+			short[] angularVelocity = LEConverter.ShortArrayFrom(20, response, 3);
+			short[] eulerAngle = LEConverter.ShortArrayFrom(26, response, 3);
+			short[] quaternion = LEConverter.ShortArrayFrom(32, response, 4);
+			short[] linearAcceleration = LEConverter.ShortArrayFrom(40, response, 3);
+			short[] gravityVector = LEConverter.ShortArrayFrom(46, response, 3);
+			short temperature = LEConverter.SByteFrom(52, response);
+			byte calibrationStatus = LEConverter.ByteFrom(53, response);
+			var handler = AllDataCallback;
+
+			if (handler != null)
+			{
+				handler(this, acceleration, magneticField, angularVelocity, eulerAngle, quaternion, linearAcceleration, gravityVector, temperature, calibrationStatus);
+			}
+		}
+	}
+}
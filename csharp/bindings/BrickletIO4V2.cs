@@ -0,0 +1,1070 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  4-channel digital input/output
+	/// </summary>
+	public class BrickletIO4V2 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2111;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "IO-4 Bricklet 2.0";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VALUE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VALUE = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SELECTED_VALUE = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CONFIGURATION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CONFIGURATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_INPUT_VALUE_CALLBACK_CONFIGURATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_INPUT_VALUE_CALLBACK_CONFIGURATION = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALL_INPUT_VALUE_CALLBACK_CONFIGURATION = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_INPUT_VALUE_CALLBACK_CONFIGURATION = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MONOFLOP = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MONOFLOP = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_EDGE_COUNT = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_EDGE_COUNT_CONFIGURATION = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_EDGE_COUNT_CONFIGURATION = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_PWM_CONFIGURATION = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_PWM_CONFIGURATION = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_INPUT_VALUE = 17;
+
+		private const int CALLBACK_ALL_INPUT_VALUE = 18;
+
+		private const int CALLBACK_MONOFLOP_DONE = 19;
+
+
+		/// <summary>
+		/// </summary>
+		public const char DIRECTION_IN = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char DIRECTION_OUT = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const byte EDGE_TYPE_RISING = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte EDGE_TYPE_FALLING = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte EDGE_TYPE_BOTH = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletIO4V2.SetInputValueCallbackConfiguration"/>.
+		///  
+		///  The parameters are the channel, a value-changed indicator and the actual value
+		///  for the channel. The `changed` parameter is true if the value has changed since
+		///  the last callback.
+		/// </summary>
+		public event InputValueEventHandler InputValueCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void InputValueEventHandler(BrickletIO4V2 sender, byte channel, bool changed, bool value);
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletIO4V2.SetAllInputValueCallbackConfiguration"/>.
+		///  
+		///  The parameters are the same as <see cref="Tinkerforge.BrickletIO4V2.GetValue"/>. Additional the
+		///  `changed` parameter is true if the value has changed since
+		///  the last callback.
+		/// </summary>
+		public event AllInputValueEventHandler AllInputValueCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AllInputValueEventHandler(BrickletIO4V2 sender, bool[] changed, bool[] value);
+
+		/// <summary>
+		///  This callback is triggered whenever a monoflop timer reaches 0. The
+		///  parameters contain the channel and the current value of the channel
+		///  (the value after the monoflop).
+		/// </summary>
+		public event MonoflopDoneEventHandler MonoflopDoneCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void MonoflopDoneEventHandler(BrickletIO4V2 sender, byte channel, bool value);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletIO4V2(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_INPUT_VALUE] = new CallbackWrapper(OnInputValueCallback);
+			callbackWrappers[CALLBACK_ALL_INPUT_VALUE] = new CallbackWrapper(OnAllInputValueCallback);
+			callbackWrappers[CALLBACK_MONOFLOP_DONE] = new CallbackWrapper(OnMonoflopDoneCallback);
+
+
+			responseExpected[FUNCTION_SET_VALUE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_VALUE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SELECTED_VALUE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_INPUT_VALUE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_INPUT_VALUE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALL_INPUT_VALUE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALL_INPUT_VALUE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MONOFLOP] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_MONOFLOP] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_EDGE_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_EDGE_COUNT_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_EDGE_COUNT_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_PWM_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_PWM_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Sets the output value of all four channels. A value of *true* or *false* outputs
+		///  logic 1 or logic 0 respectively on the corresponding channel.
+		///  
+		///  Use <see cref="Tinkerforge.BrickletIO4V2.SetSelectedValue"/> to change only one output channel state.
+		///  
+		///  For example: (True, True, False, False) will turn the channels 0-1 high and the
+		///  channels 2-3 low.
+		///  
+		///  All running monoflop timers and PWMs will be aborted if this function is called.
+		///  
+		///  <note>
+		///   This function does nothing for channels that are configured as input. Pull-up
+		///   resistors can be switched on with <see cref="Tinkerforge.BrickletIO4V2.SetConfiguration"/>.
+		///  </note>
+		/// </summary>
+		public void SetValue(bool[] value)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_VALUE);
+			byte[] valueBits = new byte[1];
+			for (int i = 0; i < 4; i++) {
+				if (value[i]) {
+					valueBits[i / 8] |= (byte)(1 << (i % 8));
+				}
+			}
+			LEConverter.To((byte[])valueBits, 8, 1, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the logic levels that are currently measured on the channels.
+		///  This function works if the channel is configured as input as well as if it is
+		///  configured as output.
+		/// </summary>
+		public bool[] GetValue()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VALUE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolArrayFrom(8, response, 4);
+		}
+
+		/// <summary>
+		///  Sets the output value of a specific channel without affecting the other channels.
+		///  
+		///  A running monoflop timer or PWM for the specific channel will be aborted if this
+		///  function is called.
+		///  
+		///  <note>
+		///   This function does nothing for channels that are configured as input. Pull-up
+		///   resistors can be switched on with <see cref="Tinkerforge.BrickletIO4V2.SetConfiguration"/>.
+		///  </note>
+		/// </summary>
+		public void SetSelectedValue(byte channel, bool value)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_SELECTED_VALUE);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((bool)value, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Configures the value and direction of a specific channel. Possible directions
+		///  are 'i' and 'o' for input and output.
+		///  
+		///  If the direction is configured as output, the value is either high or low
+		///  (set as *true* or *false*).
+		///  
+		///  If the direction is configured as input, the value is either pull-up or
+		///  default (set as *true* or *false*).
+		///  
+		///  For example:
+		///  
+		///  * (0, 'i', true) will set channel 0 as input pull-up.
+		///  * (1, 'i', false) will set channel 1 as input default (floating if nothing is connected).
+		///  * (2, 'o', true) will set channel 2 as output high.
+		///  * (3, 'o', false) will set channel 3 as output low.
+		///  
+		///  A running monoflop timer or PWM for the specific channel will be aborted if this
+		///  function is called.
+		/// </summary>
+		public void SetConfiguration(byte channel, char direction, bool value)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((char)direction, 9, request);
+			LEConverter.To((bool)value, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the channel configuration as set by <see cref="Tinkerforge.BrickletIO4V2.SetConfiguration"/>.
+		/// </summary>
+		public void GetConfiguration(byte channel, out char direction, out bool value)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			direction = LEConverter.CharFrom(8, response);
+			value = LEConverter.BoolFrom(9, response);
+		}
+
+		/// <summary>
+		///  This callback can be configured per channel.
+		///  
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIO4V2.InputValueCallback"/>
+		///  callback is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetInputValueCallbackConfiguration(byte channel, long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_SET_INPUT_VALUE_CALLBACK_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((int)period, 9, request);
+			LEConverter.To((bool)valueHasToChange, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration for the given channel as set by
+		///  <see cref="Tinkerforge.BrickletIO4V2.SetInputValueCallbackConfiguration"/>.
+		/// </summary>
+		public void GetInputValueCallbackConfiguration(byte channel, out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_INPUT_VALUE_CALLBACK_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIO4V2.AllInputValueCallback"/>
+		///  callback is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetAllInputValueCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_ALL_INPUT_VALUE_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletIO4V2.SetAllInputValueCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAllInputValueCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_INPUT_VALUE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  The first parameter is the desired state of the channel (*true* means output *high*
+		///  and *false* means output *low*). The second parameter indicates the time that
+		///  the channel should hold the state.
+		///  
+		///  If this function is called with the parameters (true, 1500):
+		///  The channel will turn on and in 1.5s it will turn off again.
+		///  
+		///  A PWM for the selected channel will be aborted if this function is called.
+		///  
+		///  A monoflop can be used as a failsafe mechanism. For example: Lets assume you
+		///  have a RS485 bus and a IO-4 Bricklet 2.0 is connected to one of the slave
+		///  stacks. You can now call this function every second, with a time parameter
+		///  of two seconds. The channel will be *high* all the time. If now the RS485
+		///  connection is lost, the channel will turn *low* in at most two seconds.
+		/// </summary>
+		public void SetMonoflop(byte channel, bool value, long time)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_SET_MONOFLOP);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((bool)value, 9, request);
+			LEConverter.To((int)time, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns (for the given channel) the current value and the time as set by
+		///  <see cref="Tinkerforge.BrickletIO4V2.SetMonoflop"/> as well as the remaining time until the value flips.
+		///  
+		///  If the timer is not running currently, the remaining time will be returned
+		///  as 0.
+		/// </summary>
+		public void GetMonoflop(byte channel, out bool value, out long time, out long timeRemaining)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_MONOFLOP);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 17);
+
+			value = LEConverter.BoolFrom(8, response);
+			time = LEConverter.UIntFrom(9, response);
+			timeRemaining = LEConverter.UIntFrom(13, response);
+		}
+
+		/// <summary>
+		///  Returns the current value of the edge counter for the selected channel. You can
+		///  configure the edges that are counted with <see cref="Tinkerforge.BrickletIO4V2.SetEdgeCountConfiguration"/>.
+		///  
+		///  If you set the reset counter to *true*, the count is set back to 0
+		///  directly after it is read.
+		///  
+		///  <note>
+		///   Calling this function is only allowed for channels configured as input.
+		///  </note>
+		/// </summary>
+		public long GetEdgeCount(byte channel, bool resetCounter)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_GET_EDGE_COUNT);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((bool)resetCounter, 9, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Configures the edge counter for a specific channel.
+		///  
+		///  The edge type parameter configures if rising edges, falling edges or
+		///  both are counted if the channel is configured for input. Possible edge types are:
+		///  
+		///  * 0 = rising
+		///  * 1 = falling
+		///  * 2 = both
+		///  
+		///  Configuring an edge counter resets its value to 0.
+		///  
+		///  If you don't know what any of this means, just leave it at default. The
+		///  default configuration is very likely OK for you.
+		///  
+		///  <note>
+		///   Calling this function is only allowed for channels configured as input.
+		///  </note>
+		/// </summary>
+		public void SetEdgeCountConfiguration(byte channel, byte edgeType, byte debounce)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_EDGE_COUNT_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((byte)edgeType, 9, request);
+			LEConverter.To((byte)debounce, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the edge type and debounce time for the selected channel as set by
+		///  <see cref="Tinkerforge.BrickletIO4V2.SetEdgeCountConfiguration"/>.
+		///  
+		///  <note>
+		///   Calling this function is only allowed for channels configured as input.
+		///  </note>
+		/// </summary>
+		public void GetEdgeCountConfiguration(byte channel, out byte edgeType, out byte debounce)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_EDGE_COUNT_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			edgeType = LEConverter.ByteFrom(8, response);
+			debounce = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  Activates a PWM for the given channel.
+		///  
+		///  You need to set the channel to output before you call this function, otherwise it will
+		///  report an invalid parameter error. To turn the PWM off again, you can set the frequency to 0 or any other
+		///  function that changes a value of the channel (e.g. <see cref="Tinkerforge.BrickletIO4V2.SetSelectedValue"/>).
+		///  
+		///  A running monoflop timer for the given channel will be aborted if this function
+		///  is called.
+		/// </summary>
+		public void SetPWMConfiguration(byte channel, long frequency, int dutyCycle)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(15, FUNCTION_SET_PWM_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((int)frequency, 9, request);
+			LEConverter.To((short)dutyCycle, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the PWM configuration as set by <see cref="Tinkerforge.BrickletIO4V2.SetPWMConfiguration"/>.
+		/// </summary>
+		public void GetPWMConfiguration(byte channel, out long frequency, out int dutyCycle)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_PWM_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 14);
+
+			frequency = LEConverter.UIntFrom(8, response);
+			dutyCycle = LEConverter.UShortFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletIO4V2.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletIO4V2.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletIO4V2.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletIO4V2.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnInputValueCallback(byte[] response)
+		{
+			if (response.Length != 11)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte channel = LEConverter.ByteFrom(8, response);
+			bool changed = LEConverter.BoolFrom(9, response);
+			bool value = LEConverter.BoolFrom(10, response);
+			var handler = InputValueCallback;
+
+			if (handler != null)
+			{
+				handler(this, channel, changed, value);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAllInputValueCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			bool[] changed = new bool[4];
+			byte[] changedBits = new byte[1];
+			changedBits = LEConverter.ByteArrayFrom(8, response, 1);
+			for (int i = 0; i < 4; i++) {
+				changed[i] = (changedBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+			bool[] value = new bool[4];
+			byte[] valueBits = new byte[1];
+			valueBits = LEConverter.ByteArrayFrom(9, response, 1);
+			for (int i = 0; i < 4; i++) {
+				value[i] = (valueBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+			var handler = AllInputValueCallback;
+
+			if (handler != null)
+			{
+				handler(this, changed, value);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnMonoflopDoneCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte channel = LEConverter.ByteFrom(8, response);
+			bool value = LEConverter.BoolFrom(9, response);
+			var handler = MonoflopDoneCallback;
+
+			if (handler != null)
+			{
+				handler(this, channel, value);
+			}
+		}
+	}
+}
@@ -0,0 +1,1155 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  4 channel counter up to 4MHz
+	/// </summary>
+	public class BrickletIndustrialCounter : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 293;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Industrial Counter Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COUNTER = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_COUNTER = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_COUNTER = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALL_COUNTER = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SIGNAL_DATA = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_SIGNAL_DATA = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_COUNTER_ACTIVE = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALL_COUNTER_ACTIVE = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COUNTER_ACTIVE = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_COUNTER_ACTIVE = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_COUNTER_CONFIGURATION = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COUNTER_CONFIGURATION = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALL_COUNTER_CALLBACK_CONFIGURATION = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_COUNTER_CALLBACK_CONFIGURATION = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALL_SIGNAL_DATA_CALLBACK_CONFIGURATION = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALL_SIGNAL_DATA_CALLBACK_CONFIGURATION = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHANNEL_LED_CONFIG = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHANNEL_LED_CONFIG = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_ALL_COUNTER = 19;
+
+		private const int CALLBACK_ALL_SIGNAL_DATA = 20;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_0 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_1 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_2 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_3 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte COUNT_EDGE_RISING = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte COUNT_EDGE_FALLING = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COUNT_EDGE_BOTH = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COUNT_DIRECTION_UP = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte COUNT_DIRECTION_DOWN = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COUNT_DIRECTION_EXTERNAL_UP = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COUNT_DIRECTION_EXTERNAL_DOWN = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_1 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_2 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_4 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_8 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_16 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_32 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_64 = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_128 = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_256 = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_512 = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_1024 = 10;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_2048 = 11;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_4096 = 12;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_8192 = 13;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_16384 = 14;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUTY_CYCLE_PRESCALER_32768 = 15;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREQUENCY_INTEGRATION_TIME_128_MS = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREQUENCY_INTEGRATION_TIME_256_MS = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREQUENCY_INTEGRATION_TIME_512_MS = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREQUENCY_INTEGRATION_TIME_1024_MS = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREQUENCY_INTEGRATION_TIME_2048_MS = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREQUENCY_INTEGRATION_TIME_4096_MS = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREQUENCY_INTEGRATION_TIME_8192_MS = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREQUENCY_INTEGRATION_TIME_16384_MS = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREQUENCY_INTEGRATION_TIME_32768_MS = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_LED_CONFIG_SHOW_CHANNEL_STATUS = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletIndustrialCounter.SetAllCounterCallbackConfiguration"/>.
+		///  
+		///  The parameters are the same as <see cref="Tinkerforge.BrickletIndustrialCounter.GetAllCounter"/>.
+		/// </summary>
+		public event AllCounterEventHandler AllCounterCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AllCounterEventHandler(BrickletIndustrialCounter sender, long[] counter);
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletIndustrialCounter.SetAllSignalDataCallbackConfiguration"/>.
+		///  
+		///  The parameters are the same as <see cref="Tinkerforge.BrickletIndustrialCounter.GetAllSignalData"/>.
+		/// </summary>
+		public event AllSignalDataEventHandler AllSignalDataCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AllSignalDataEventHandler(BrickletIndustrialCounter sender, int[] dutyCycle, long[] period, long[] frequency, bool[] value);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletIndustrialCounter(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_ALL_COUNTER] = new CallbackWrapper(OnAllCounterCallback);
+			callbackWrappers[CALLBACK_ALL_SIGNAL_DATA] = new CallbackWrapper(OnAllSignalDataCallback);
+
+
+			responseExpected[FUNCTION_GET_COUNTER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ALL_COUNTER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_COUNTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_ALL_COUNTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SIGNAL_DATA] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ALL_SIGNAL_DATA] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_COUNTER_ACTIVE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_ALL_COUNTER_ACTIVE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_COUNTER_ACTIVE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ALL_COUNTER_ACTIVE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_COUNTER_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_COUNTER_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALL_COUNTER_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALL_COUNTER_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALL_SIGNAL_DATA_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALL_SIGNAL_DATA_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHANNEL_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHANNEL_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the current counter value for the given channel.
+		/// </summary>
+		public long GetCounter(byte channel)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_COUNTER);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 16);
+
+			return LEConverter.LongFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current counter values for all four channels.
+		/// </summary>
+		public long[] GetAllCounter()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_COUNTER);
+
+			byte[] response = SendRequest(request, 40);
+
+			return LEConverter.LongArrayFrom(8, response, 4);
+		}
+
+		/// <summary>
+		///  Sets the counter value for the given channel.
+		///  
+		///  The default value for the counters on startup is 0.
+		/// </summary>
+		public void SetCounter(byte channel, long counter)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_SET_COUNTER);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((long)counter, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Sets the counter values for all four channels.
+		///  
+		///  The default value for the counters on startup is 0.
+		/// </summary>
+		public void SetAllCounter(long[] counter)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(40, FUNCTION_SET_ALL_COUNTER);
+			LEConverter.To((long[])counter, 8, 4, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the signal data (duty cycle, period, frequency and value) for the
+		///  given channel.
+		/// </summary>
+		public void GetSignalData(byte channel, out int dutyCycle, out long period, out long frequency, out bool value)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SIGNAL_DATA);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 23);
+
+			dutyCycle = LEConverter.UShortFrom(8, response);
+			period = LEConverter.ULongFrom(10, response);
+			frequency = LEConverter.UIntFrom(18, response);
+			value = LEConverter.BoolFrom(22, response);
+		}
+
+		/// <summary>
+		///  Returns the signal data (duty cycle, period, frequency and value) for all four
+		///  channels.
+		/// </summary>
+		public void GetAllSignalData(out int[] dutyCycle, out long[] period, out long[] frequency, out bool[] value)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_SIGNAL_DATA);
+
+			byte[] response = SendRequest(request, 65);
+
+			dutyCycle = LEConverter.UShortArrayFrom(8, response, 4);
+			period = LEConverter.ULongArrayFrom(16, response, 4);
+			frequency = LEConverter.UIntArrayFrom(48, response, 4);
+			byte[] valueBits = new byte[1];
+			value = new bool[4];
+			valueBits = LEConverter.ByteArrayFrom(64, response, 1);
+			for (int i = 0; i < 4; i++) {
+				value[i] = (valueBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+		}
+
+		/// <summary>
+		///  Activates/deactivates the counter of the given channel.
+		///  
+		///  true = activate, false = deactivate.
+		///  
+		///  By default all channels are activated.
+		/// </summary>
+		public void SetCounterActive(byte channel, bool active)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_COUNTER_ACTIVE);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((bool)active, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Activates/deactivates the counter of all four channels.
+		///  
+		///  true = activate, false = deactivate.
+		///  
+		///  By default all channels are activated.
+		/// </summary>
+		public void SetAllCounterActive(bool[] active)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_ALL_COUNTER_ACTIVE);
+			byte[] activeBits = new byte[1];
+			for (int i = 0; i < 4; i++) {
+				if (active[i]) {
+					activeBits[i / 8] |= (byte)(1 << (i % 8));
+				}
+			}
+			LEConverter.To((byte[])activeBits, 8, 1, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the activation state of the given channel.
+		///  
+		///  true = activated, false = deactivated.
+		/// </summary>
+		public bool GetCounterActive(byte channel)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_COUNTER_ACTIVE);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the activation state of all four channels.
+		///  
+		///  true = activated, false = deactivated.
+		/// </summary>
+		public bool[] GetAllCounterActive()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_COUNTER_ACTIVE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolArrayFrom(8, response, 4);
+		}
+
+		/// <summary>
+		///  Sets the counter configuration for the given channel.
+		///  
+		///  * Count Edge: Counter can count on rising, falling or both edges.
+		///  * Count Direction: Counter can count up or down. You can also use
+		///    another channel as direction input, see
+		///    `here &lt;https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Industrial_Counter.html#external-count-direction&gt;`__
+		///    for details.
+		///  * Duty Cycle Prescaler: Sets a divider for the internal clock. See
+		///    `here &lt;https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Industrial_Counter.html#duty-cycle-prescaler-and-frequency-integration-time&gt;`__
+		///    for details.
+		///  * Frequency Integration Time: Sets the integration time for the
+		///    frequency measurement. See
+		///    `here &lt;https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Industrial_Counter.html#duty-cycle-prescaler-and-frequency-integration-time&gt;`__
+		///    for details.
+		/// </summary>
+		public void SetCounterConfiguration(byte channel, byte countEdge, byte countDirection, byte dutyCyclePrescaler, byte frequencyIntegrationTime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_COUNTER_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((byte)countEdge, 9, request);
+			LEConverter.To((byte)countDirection, 10, request);
+			LEConverter.To((byte)dutyCyclePrescaler, 11, request);
+			LEConverter.To((byte)frequencyIntegrationTime, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the counter configuration as set by <see cref="Tinkerforge.BrickletIndustrialCounter.SetCounterConfiguration"/>.
+		/// </summary>
+		public void GetCounterConfiguration(byte channel, out byte countEdge, out byte countDirection, out byte dutyCyclePrescaler, out byte frequencyIntegrationTime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_COUNTER_CONFIGURATION);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			countEdge = LEConverter.ByteFrom(8, response);
+			countDirection = LEConverter.ByteFrom(9, response);
+			dutyCyclePrescaler = LEConverter.ByteFrom(10, response);
+			frequencyIntegrationTime = LEConverter.ByteFrom(11, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIndustrialCounter.AllCounterCallback"/>
+		///  callback is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetAllCounterCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_ALL_COUNTER_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletIndustrialCounter.SetAllCounterCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAllCounterCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_COUNTER_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletIndustrialCounter.AllSignalDataCallback"/>
+		///  callback is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetAllSignalDataCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_ALL_SIGNAL_DATA_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletIndustrialCounter.SetAllSignalDataCallbackConfiguration"/>.
+		/// </summary>
+		public void GetAllSignalDataCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALL_SIGNAL_DATA_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Each channel has a corresponding LED. You can turn the LED off, on or show a
+		///  heartbeat. You can also set the LED to "Channel Status". In this mode the
+		///  LED is on if the channel is high and off otherwise.
+		/// </summary>
+		public void SetChannelLEDConfig(byte channel, byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_CHANNEL_LED_CONFIG);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((byte)config, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the channel LED configuration as set by <see cref="Tinkerforge.BrickletIndustrialCounter.SetChannelLEDConfig"/>
+		/// </summary>
+		public byte GetChannelLEDConfig(byte channel)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_CHANNEL_LED_CONFIG);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletIndustrialCounter.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletIndustrialCounter.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletIndustrialCounter.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletIndustrialCounter.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAllCounterCallback(byte[] response)
+		{
+			if (response.Length != 40)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long[] counter = LEConverter.LongArrayFrom(8, response, 4);
+			var handler = AllCounterCallback;
+
+			if (handler != null)
+			{
+				handler(this, counter);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAllSignalDataCallback(byte[] response)
+		{
+			if (response.Length != 65)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int[] dutyCycle = LEConverter.UShortArrayFrom(8, response, 4);
+			long[] period = LEConverter.ULongArrayFrom(16, response, 4);
+			long[] frequency = LEConverter.UIntArrayFrom(48, response, 4);
+			bool[] value = new bool[4];
+			byte[] valueBits = new byte[1];
+			valueBits = LEConverter.ByteArrayFrom(64, response, 1);
+			for (int i = 0; i < 4; i++) {
+				value[i] = (valueBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+			var handler = AllSignalDataCallback;
+
+			if (handler != null)
+			{
+				handler(this, dutyCycle, period, frequency, value);
+			}
+		}
+	}
+}
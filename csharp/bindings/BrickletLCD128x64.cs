@@ -0,0 +1,2439 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  7.1cm (2.8") display with 128x64 pixel and touch screen
+	/// </summary>
+	public class BrickletLCD128x64 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 298;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "LCD 128x64 Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_PIXELS_LOW_LEVEL = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_PIXELS_LOW_LEVEL = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CLEAR_DISPLAY = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DISPLAY_CONFIGURATION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DISPLAY_CONFIGURATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_LINE = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DRAW_BUFFERED_FRAME = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TOUCH_POSITION = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TOUCH_POSITION_CALLBACK_CONFIGURATION = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TOUCH_POSITION_CALLBACK_CONFIGURATION = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TOUCH_GESTURE = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TOUCH_GESTURE_CALLBACK_CONFIGURATION = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TOUCH_GESTURE_CALLBACK_CONFIGURATION = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DRAW_LINE = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DRAW_BOX = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DRAW_TEXT = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GUI_BUTTON = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_BUTTON = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_REMOVE_GUI_BUTTON = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GUI_BUTTON_PRESSED_CALLBACK_CONFIGURATION = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_BUTTON_PRESSED_CALLBACK_CONFIGURATION = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_BUTTON_PRESSED = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GUI_SLIDER = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_SLIDER = 27;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_REMOVE_GUI_SLIDER = 28;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GUI_SLIDER_VALUE_CALLBACK_CONFIGURATION = 29;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_SLIDER_VALUE_CALLBACK_CONFIGURATION = 30;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_SLIDER_VALUE = 31;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GUI_TAB_CONFIGURATION = 33;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_TAB_CONFIGURATION = 34;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GUI_TAB_TEXT = 35;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_TAB_TEXT = 36;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GUI_TAB_ICON = 37;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_TAB_ICON = 38;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_REMOVE_GUI_TAB = 39;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GUI_TAB_SELECTED = 40;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GUI_TAB_SELECTED_CALLBACK_CONFIGURATION = 41;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_TAB_SELECTED_CALLBACK_CONFIGURATION = 42;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_TAB_SELECTED = 43;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GUI_GRAPH_CONFIGURATION = 45;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_GRAPH_CONFIGURATION = 46;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GUI_GRAPH_DATA_LOW_LEVEL = 47;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GUI_GRAPH_DATA_LOW_LEVEL = 48;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_REMOVE_GUI_GRAPH = 49;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_REMOVE_ALL_GUI = 50;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TOUCH_LED_CONFIG = 51;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TOUCH_LED_CONFIG = 52;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_TOUCH_POSITION = 11;
+
+		private const int CALLBACK_TOUCH_GESTURE = 15;
+
+		private const int CALLBACK_GUI_BUTTON_PRESSED = 25;
+
+		private const int CALLBACK_GUI_SLIDER_VALUE = 32;
+
+		private const int CALLBACK_GUI_TAB_SELECTED = 44;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte GESTURE_LEFT_TO_RIGHT = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte GESTURE_RIGHT_TO_LEFT = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte GESTURE_TOP_TO_BOTTOM = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte GESTURE_BOTTOM_TO_TOP = 3;
+
+		/// <summary>
+		/// </summary>
+		public const bool COLOR_WHITE = false;
+
+		/// <summary>
+		/// </summary>
+		public const bool COLOR_BLACK = true;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_6X8 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_6X16 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_6X24 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_6X32 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_12X16 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_12X24 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_12X32 = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_18X24 = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_18X32 = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte FONT_24X32 = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte DIRECTION_HORIZONTAL = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DIRECTION_VERTICAL = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANGE_TAB_ON_CLICK = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANGE_TAB_ON_SWIPE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANGE_TAB_ON_CLICK_AND_SWIPE = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte GRAPH_TYPE_DOT = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte GRAPH_TYPE_LINE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte GRAPH_TYPE_BAR = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte TOUCH_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte TOUCH_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte TOUCH_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte TOUCH_LED_CONFIG_SHOW_TOUCH = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetTouchPositionCallbackConfiguration"/>. The parameters are the
+		///  same as for <see cref="Tinkerforge.BrickletLCD128x64.GetTouchPosition"/>.
+		/// </summary>
+		public event TouchPositionEventHandler TouchPositionCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void TouchPositionEventHandler(BrickletLCD128x64 sender, int pressure, int x, int y, long age);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetTouchGestureCallbackConfiguration"/>. The parameters are the
+		///  same as for <see cref="Tinkerforge.BrickletLCD128x64.GetTouchGesture"/>.
+		/// </summary>
+		public event TouchGestureEventHandler TouchGestureCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void TouchGestureEventHandler(BrickletLCD128x64 sender, byte gesture, long duration, int pressureMax, int xStart, int yStart, int xEnd, int yEnd, long age);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetGUIButtonPressedCallbackConfiguration"/>. The parameters are the
+		///  same as for <see cref="Tinkerforge.BrickletLCD128x64.GetGUIButtonPressed"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public event GUIButtonPressedEventHandler GUIButtonPressedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void GUIButtonPressedEventHandler(BrickletLCD128x64 sender, byte index, bool pressed);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetGUISliderValueCallbackConfiguration"/>. The parameters are the
+		///  same as for <see cref="Tinkerforge.BrickletLCD128x64.GetGUISliderValue"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public event GUISliderValueEventHandler GUISliderValueCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void GUISliderValueEventHandler(BrickletLCD128x64 sender, byte index, byte value);
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetGUITabSelectedCallbackConfiguration"/>. The parameters are the
+		///  same as for <see cref="Tinkerforge.BrickletLCD128x64.GetGUITabSelected"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public event GUITabSelectedEventHandler GUITabSelectedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void GUITabSelectedEventHandler(BrickletLCD128x64 sender, short index);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletLCD128x64(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_TOUCH_POSITION] = new CallbackWrapper(OnTouchPositionCallback);
+			callbackWrappers[CALLBACK_TOUCH_GESTURE] = new CallbackWrapper(OnTouchGestureCallback);
+			callbackWrappers[CALLBACK_GUI_BUTTON_PRESSED] = new CallbackWrapper(OnGUIButtonPressedCallback);
+			callbackWrappers[CALLBACK_GUI_SLIDER_VALUE] = new CallbackWrapper(OnGUISliderValueCallback);
+			callbackWrappers[CALLBACK_GUI_TAB_SELECTED] = new CallbackWrapper(OnGUITabSelectedCallback);
+
+
+			responseExpected[FUNCTION_WRITE_PIXELS_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_READ_PIXELS_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_CLEAR_DISPLAY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_DISPLAY_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_DISPLAY_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_WRITE_LINE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DRAW_BUFFERED_FRAME] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_TOUCH_POSITION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_TOUCH_POSITION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_TOUCH_POSITION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_TOUCH_GESTURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_TOUCH_GESTURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_TOUCH_GESTURE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_DRAW_LINE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DRAW_BOX] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DRAW_TEXT] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_GUI_BUTTON] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_GUI_BUTTON] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_REMOVE_GUI_BUTTON] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_GUI_BUTTON_PRESSED_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_GUI_BUTTON_PRESSED_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_GUI_BUTTON_PRESSED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_GUI_SLIDER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_GUI_SLIDER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_REMOVE_GUI_SLIDER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_GUI_SLIDER_VALUE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_GUI_SLIDER_VALUE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_GUI_SLIDER_VALUE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_GUI_TAB_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_GUI_TAB_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_GUI_TAB_TEXT] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_GUI_TAB_TEXT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_GUI_TAB_ICON] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_GUI_TAB_ICON] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_REMOVE_GUI_TAB] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_GUI_TAB_SELECTED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_GUI_TAB_SELECTED_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_GUI_TAB_SELECTED_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_GUI_TAB_SELECTED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_GUI_GRAPH_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_GUI_GRAPH_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_GUI_GRAPH_DATA_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_GUI_GRAPH_DATA_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_REMOVE_GUI_GRAPH] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_REMOVE_ALL_GUI] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_TOUCH_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_TOUCH_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Writes pixels to the specified window.
+		///  
+		///  The pixels are written into the window line by line top to bottom
+		///  and each line is written from left to right.
+		///  
+		///  If automatic draw is enabled (default) the pixels are directly written to
+		///  the screen. Only pixels that have actually changed are updated on the screen,
+		///  the rest stays the same.
+		///  
+		///  If automatic draw is disabled the pixels are written to an internal buffer and
+		///  the buffer is transferred to the display only after <see cref="Tinkerforge.BrickletLCD128x64.DrawBufferedFrame"/>
+		///  is called. This can be used to avoid flicker when drawing a complex frame in
+		///  multiple steps.
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletLCD128x64.SetDisplayConfiguration"/>
+		///  function.
+		/// </summary>
+		public void WritePixelsLowLevel(byte xStart, byte yStart, byte xEnd, byte yEnd, int pixelsLength, int pixelsChunkOffset, bool[] pixelsChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_PIXELS_LOW_LEVEL);
+			LEConverter.To((byte)xStart, 8, request);
+			LEConverter.To((byte)yStart, 9, request);
+			LEConverter.To((byte)xEnd, 10, request);
+			LEConverter.To((byte)yEnd, 11, request);
+			LEConverter.To((short)pixelsLength, 12, request);
+			LEConverter.To((short)pixelsChunkOffset, 14, request);
+			byte[] pixelsChunkDataBits = new byte[56];
+			for (int i = 0; i < 448; i++) {
+				if (pixelsChunkData[i]) {
+					pixelsChunkDataBits[i / 8] |= (byte)(1 << (i % 8));
+				}
+			}
+			LEConverter.To((byte[])pixelsChunkDataBits, 16, 56, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Reads pixels from the specified window.
+		///  
+		///  The pixels are read from the window line by line top to bottom
+		///  and each line is read from left to right.
+		///  
+		///  If automatic draw is enabled (default) the pixels that are read are always the
+		///  same that are shown on the display.
+		///  
+		///  If automatic draw is disabled the pixels are read from the internal buffer
+		///  (see <see cref="Tinkerforge.BrickletLCD128x64.DrawBufferedFrame"/>).
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletLCD128x64.SetDisplayConfiguration"/>
+		///  function.
+		/// </summary>
+		public void ReadPixelsLowLevel(byte xStart, byte yStart, byte xEnd, byte yEnd, out int pixelsLength, out int pixelsChunkOffset, out bool[] pixelsChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_READ_PIXELS_LOW_LEVEL);
+			LEConverter.To((byte)xStart, 8, request);
+			LEConverter.To((byte)yStart, 9, request);
+			LEConverter.To((byte)xEnd, 10, request);
+			LEConverter.To((byte)yEnd, 11, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			pixelsLength = LEConverter.UShortFrom(8, response);
+			pixelsChunkOffset = LEConverter.UShortFrom(10, response);
+			byte[] pixelsChunkDataBits = new byte[60];
+			pixelsChunkData = new bool[480];
+			pixelsChunkDataBits = LEConverter.ByteArrayFrom(12, response, 60);
+			for (int i = 0; i < 480; i++) {
+				pixelsChunkData[i] = (pixelsChunkDataBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+		}
+
+		/// <summary>
+		///  Clears the complete content of the display.
+		///  
+		///  If automatic draw is enabled (default) the pixels are directly cleared.
+		///  
+		///  If automatic draw is disabled the the internal buffer is cleared and
+		///  the buffer is transferred to the display only after <see cref="Tinkerforge.BrickletLCD128x64.DrawBufferedFrame"/>
+		///  is called. This can be used to avoid flicker when drawing a complex frame in
+		///  multiple steps.
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletLCD128x64.SetDisplayConfiguration"/>
+		///  function.
+		/// </summary>
+		public void ClearDisplay()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_CLEAR_DISPLAY);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Sets the configuration of the display.
+		///  
+		///  If automatic draw is set to *true*, the display is automatically updated with every
+		///  call of <see cref="Tinkerforge.BrickletLCD128x64.WritePixels"/> and <see cref="Tinkerforge.BrickletLCD128x64.WriteLine"/>. If it is set to false, the
+		///  changes are written into an internal buffer and only shown on the display after
+		///  a call of <see cref="Tinkerforge.BrickletLCD128x64.DrawBufferedFrame"/>.
+		/// </summary>
+		public void SetDisplayConfiguration(byte contrast, byte backlight, bool invert, bool automaticDraw)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DISPLAY_CONFIGURATION);
+			LEConverter.To((byte)contrast, 8, request);
+			LEConverter.To((byte)backlight, 9, request);
+			LEConverter.To((bool)invert, 10, request);
+			LEConverter.To((bool)automaticDraw, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletLCD128x64.SetDisplayConfiguration"/>.
+		/// </summary>
+		public void GetDisplayConfiguration(out byte contrast, out byte backlight, out bool invert, out bool automaticDraw)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DISPLAY_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 12);
+
+			contrast = LEConverter.ByteFrom(8, response);
+			backlight = LEConverter.ByteFrom(9, response);
+			invert = LEConverter.BoolFrom(10, response);
+			automaticDraw = LEConverter.BoolFrom(11, response);
+		}
+
+		/// <summary>
+		///  Writes text to a specific line with a specific position.
+		///  
+		///  For example: (1, 10, "Hello") will write *Hello* in the middle of the
+		///  second line of the display.
+		///  
+		///  The display uses a special 5x7 pixel charset. You can view the characters
+		///  of the charset in Brick Viewer.
+		///  
+		///  If automatic draw is enabled (default) the text is directly written to
+		///  the screen. Only pixels that have actually changed are updated on the screen,
+		///  the rest stays the same.
+		///  
+		///  If automatic draw is disabled the text is written to an internal buffer and
+		///  the buffer is transferred to the display only after <see cref="Tinkerforge.BrickletLCD128x64.DrawBufferedFrame"/>
+		///  is called. This can be used to avoid flicker when drawing a complex frame in
+		///  multiple steps.
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletLCD128x64.SetDisplayConfiguration"/>
+		///  function.
+		///  
+		///  This function is a 1:1 replacement for the function with the same name
+		///  in the LCD 20x4 Bricklet. You can draw text at a specific pixel position
+		///  and with different font sizes with the <see cref="Tinkerforge.BrickletLCD128x64.DrawText"/> function.
+		/// </summary>
+		public void WriteLine(byte line, byte position, string text)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(32, FUNCTION_WRITE_LINE);
+			LEConverter.To((byte)line, 8, request);
+			LEConverter.To((byte)position, 9, request);
+			LEConverter.To((string)text, 10, 22, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Draws the currently buffered frame. Normally each call of <see cref="Tinkerforge.BrickletLCD128x64.WritePixels"/> and
+		///  <see cref="Tinkerforge.BrickletLCD128x64.WriteLine"/> draws directly onto the display. If you turn automatic draw off
+		///  (<see cref="Tinkerforge.BrickletLCD128x64.SetDisplayConfiguration"/>), the data is written in an internal buffer and
+		///  only transferred to the display by calling this function. This can be used to
+		///  avoid flicker when drawing a complex frame in multiple steps.
+		///  
+		///  Set the `force complete redraw` to *true* to redraw the whole display
+		///  instead of only the changed parts. Normally it should not be necessary to set this to
+		///  *true*. It may only become necessary in case of stuck pixels because of errors.
+		/// </summary>
+		public void DrawBufferedFrame(bool forceCompleteRedraw)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_DRAW_BUFFERED_FRAME);
+			LEConverter.To((bool)forceCompleteRedraw, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the last valid touch position:
+		///  
+		///  * Pressure: Amount of pressure applied by the user
+		///  * X: Touch position on x-axis
+		///  * Y: Touch position on y-axis
+		///  * Age: Age of touch press (how long ago it was)
+		/// </summary>
+		public void GetTouchPosition(out int pressure, out int x, out int y, out long age)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TOUCH_POSITION);
+
+			byte[] response = SendRequest(request, 18);
+
+			pressure = LEConverter.UShortFrom(8, response);
+			x = LEConverter.UShortFrom(10, response);
+			y = LEConverter.UShortFrom(12, response);
+			age = LEConverter.UIntFrom(14, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletLCD128x64.TouchPositionCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetTouchPositionCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_TOUCH_POSITION_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetTouchPositionCallbackConfiguration"/>.
+		/// </summary>
+		public void GetTouchPositionCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TOUCH_POSITION_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns one of four touch gestures that can be automatically detected by the Bricklet.
+		///  
+		///  The gestures are swipes from left to right, right to left, top to bottom and bottom to top.
+		///  
+		///  Additionally to the gestures a vector with a start and end position of the gesture is
+		///  provided. You can use this vector do determine a more exact location of the gesture (e.g.
+		///  the swipe from top to bottom was on the left or right part of the screen).
+		///  
+		///  The age parameter corresponds to the age of gesture (how long ago it was).
+		/// </summary>
+		public void GetTouchGesture(out byte gesture, out long duration, out int pressureMax, out int xStart, out int yStart, out int xEnd, out int yEnd, out long age)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TOUCH_GESTURE);
+
+			byte[] response = SendRequest(request, 27);
+
+			gesture = LEConverter.ByteFrom(8, response);
+			duration = LEConverter.UIntFrom(9, response);
+			pressureMax = LEConverter.UShortFrom(13, response);
+			xStart = LEConverter.UShortFrom(15, response);
+			yStart = LEConverter.UShortFrom(17, response);
+			xEnd = LEConverter.UShortFrom(19, response);
+			yEnd = LEConverter.UShortFrom(21, response);
+			age = LEConverter.UIntFrom(23, response);
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletLCD128x64.TouchGestureCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		/// </summary>
+		public void SetTouchGestureCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_TOUCH_GESTURE_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetTouchGestureCallbackConfiguration"/>.
+		/// </summary>
+		public void GetTouchGestureCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TOUCH_GESTURE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Draws a white or black line from (x, y)-start to (x, y)-end.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void DrawLine(byte positionXStart, byte positionYStart, byte positionXEnd, byte positionYEnd, bool color)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_DRAW_LINE);
+			LEConverter.To((byte)positionXStart, 8, request);
+			LEConverter.To((byte)positionYStart, 9, request);
+			LEConverter.To((byte)positionXEnd, 10, request);
+			LEConverter.To((byte)positionYEnd, 11, request);
+			LEConverter.To((bool)color, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Draws a white or black box from (x, y)-start to (x, y)-end.
+		///  
+		///  If you set fill to true, the box will be filled with the
+		///  color. Otherwise only the outline will be drawn.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void DrawBox(byte positionXStart, byte positionYStart, byte positionXEnd, byte positionYEnd, bool fill, bool color)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_DRAW_BOX);
+			LEConverter.To((byte)positionXStart, 8, request);
+			LEConverter.To((byte)positionYStart, 9, request);
+			LEConverter.To((byte)positionXEnd, 10, request);
+			LEConverter.To((byte)positionYEnd, 11, request);
+			LEConverter.To((bool)fill, 12, request);
+			LEConverter.To((bool)color, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Draws a text at the pixel position (x, y).
+		///  
+		///  You can use one of 9 different font sizes and draw the text in white or black.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void DrawText(byte positionX, byte positionY, byte font, bool color, string text)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(34, FUNCTION_DRAW_TEXT);
+			LEConverter.To((byte)positionX, 8, request);
+			LEConverter.To((byte)positionY, 9, request);
+			LEConverter.To((byte)font, 10, request);
+			LEConverter.To((bool)color, 11, request);
+			LEConverter.To((string)text, 12, 22, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Draws a clickable button at position (x, y) with the given text.
+		///  
+		///  You can use up to 12 buttons.
+		///  
+		///  The x position + width has to be within the range of 1 to 128 and the y
+		///  position + height has to be within the range of 1 to 64.
+		///  
+		///  The minimum useful width/height of a button is 3.
+		///  
+		///  You can enable a callback for a button press with
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetGUIButtonPressedCallbackConfiguration"/>. The callback will
+		///  be triggered for press and release-events.
+		///  
+		///  The button is drawn in a separate GUI buffer and the button-frame will
+		///  always stay on top of the graphics drawn with <see cref="Tinkerforge.BrickletLCD128x64.WritePixels"/>. To
+		///  remove the button use <see cref="Tinkerforge.BrickletLCD128x64.RemoveGUIButton"/>.
+		///  
+		///  If you want an icon instead of text, you can draw the icon inside of the
+		///  button with <see cref="Tinkerforge.BrickletLCD128x64.WritePixels"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUIButton(byte index, byte positionX, byte positionY, byte width, byte height, string text)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(29, FUNCTION_SET_GUI_BUTTON);
+			LEConverter.To((byte)index, 8, request);
+			LEConverter.To((byte)positionX, 9, request);
+			LEConverter.To((byte)positionY, 10, request);
+			LEConverter.To((byte)width, 11, request);
+			LEConverter.To((byte)height, 12, request);
+			LEConverter.To((string)text, 13, 16, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the button properties for a given `Index` as set by <see cref="Tinkerforge.BrickletLCD128x64.SetGUIButton"/>.
+		///  
+		///  Additionally the `Active` parameter shows if a button is currently active/visible
+		///  or not.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void GetGUIButton(byte index, out bool active, out byte positionX, out byte positionY, out byte width, out byte height, out string text)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_GUI_BUTTON);
+			LEConverter.To((byte)index, 8, request);
+
+			byte[] response = SendRequest(request, 29);
+
+			active = LEConverter.BoolFrom(8, response);
+			positionX = LEConverter.ByteFrom(9, response);
+			positionY = LEConverter.ByteFrom(10, response);
+			width = LEConverter.ByteFrom(11, response);
+			height = LEConverter.ByteFrom(12, response);
+			text = LEConverter.StringFrom(13, response, 16);
+		}
+
+		/// <summary>
+		///  Removes the button with the given index.
+		///  
+		///  You can use index 255 to remove all buttons.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void RemoveGUIButton(byte index)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_REMOVE_GUI_BUTTON);
+			LEConverter.To((byte)index, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletLCD128x64.GUIButtonPressedCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUIButtonPressedCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_GUI_BUTTON_PRESSED_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetGUIButtonPressedCallbackConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void GetGUIButtonPressedCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_GUI_BUTTON_PRESSED_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the state of the button for the given index.
+		///  
+		///  The state can either be pressed (true) or released (false).
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public bool GetGUIButtonPressed(byte index)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_GUI_BUTTON_PRESSED);
+			LEConverter.To((byte)index, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Draws a slider at position (x, y) with the given length.
+		///  
+		///  You can use up to 6 sliders.
+		///  
+		///  If you use the horizontal direction, the x position + length has to be
+		///  within the range of 1 to 128 and the y position has to be within
+		///  the range of 0 to 46.
+		///  
+		///  If you use the vertical direction, the y position + length has to be
+		///  within the range of 1 to 64 and the x position has to be within
+		///  the range of 0 to 110.
+		///  
+		///  The minimum length of a slider is 8.
+		///  
+		///  The parameter value is the start-position of the slider, it can
+		///  be between 0 and length-8.
+		///  
+		///  You can enable a callback for the slider value with
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetGUISliderValueCallbackConfiguration"/>.
+		///  
+		///  The slider is drawn in a separate GUI buffer and it will
+		///  always stay on top of the graphics drawn with <see cref="Tinkerforge.BrickletLCD128x64.WritePixels"/>. To
+		///  remove the button use <see cref="Tinkerforge.BrickletLCD128x64.RemoveGUISlider"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUISlider(byte index, byte positionX, byte positionY, byte length, byte direction, byte value)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_SET_GUI_SLIDER);
+			LEConverter.To((byte)index, 8, request);
+			LEConverter.To((byte)positionX, 9, request);
+			LEConverter.To((byte)positionY, 10, request);
+			LEConverter.To((byte)length, 11, request);
+			LEConverter.To((byte)direction, 12, request);
+			LEConverter.To((byte)value, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the slider properties for a given `Index` as set by <see cref="Tinkerforge.BrickletLCD128x64.SetGUISlider"/>.
+		///  
+		///  Additionally the `Active` parameter shows if a button is currently active/visible
+		///  or not.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void GetGUISlider(byte index, out bool active, out byte positionX, out byte positionY, out byte length, out byte direction, out byte value)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_GUI_SLIDER);
+			LEConverter.To((byte)index, 8, request);
+
+			byte[] response = SendRequest(request, 14);
+
+			active = LEConverter.BoolFrom(8, response);
+			positionX = LEConverter.ByteFrom(9, response);
+			positionY = LEConverter.ByteFrom(10, response);
+			length = LEConverter.ByteFrom(11, response);
+			direction = LEConverter.ByteFrom(12, response);
+			value = LEConverter.ByteFrom(13, response);
+		}
+
+		/// <summary>
+		///  Removes the slider with the given index.
+		///  
+		///  You can use index 255 to remove all slider.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void RemoveGUISlider(byte index)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_REMOVE_GUI_SLIDER);
+			LEConverter.To((byte)index, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletLCD128x64.GUISliderValueCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUISliderValueCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_GUI_SLIDER_VALUE_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetGUISliderValueCallbackConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void GetGUISliderValueCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_GUI_SLIDER_VALUE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the current slider value for the given index.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public byte GetGUISliderValue(byte index)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_GUI_SLIDER_VALUE);
+			LEConverter.To((byte)index, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the general configuration for tabs. You can configure the tabs to only
+		///  accept clicks or only swipes (gesture left/right and right/left) or both.
+		///  
+		///  Additionally, if you set `Clear GUI` to true, all of the GUI elements (buttons,
+		///  slider, graphs) will automatically be removed on every tab change.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUITabConfiguration(byte changeTabConfig, bool clearGUI)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_GUI_TAB_CONFIGURATION);
+			LEConverter.To((byte)changeTabConfig, 8, request);
+			LEConverter.To((bool)clearGUI, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the tab configuration as set by <see cref="Tinkerforge.BrickletLCD128x64.SetGUITabConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void GetGUITabConfiguration(out byte changeTabConfig, out bool clearGUI)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_GUI_TAB_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			changeTabConfig = LEConverter.ByteFrom(8, response);
+			clearGUI = LEConverter.BoolFrom(9, response);
+		}
+
+		/// <summary>
+		///  Adds a text-tab with the given index.
+		///  
+		///  You can use up to 10 tabs.
+		///  
+		///  A text-tab with the same index as a icon-tab will overwrite the icon-tab.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUITabText(byte index, string text)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_SET_GUI_TAB_TEXT);
+			LEConverter.To((byte)index, 8, request);
+			LEConverter.To((string)text, 9, 5, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the text for a given index as set by <see cref="Tinkerforge.BrickletLCD128x64.SetGUITabText"/>.
+		///  
+		///  Additionally the `Active` parameter shows if the tab is currently active/visible
+		///  or not.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void GetGUITabText(byte index, out bool active, out string text)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_GUI_TAB_TEXT);
+			LEConverter.To((byte)index, 8, request);
+
+			byte[] response = SendRequest(request, 14);
+
+			active = LEConverter.BoolFrom(8, response);
+			text = LEConverter.StringFrom(9, response, 5);
+		}
+
+		/// <summary>
+		///  Adds a icon-tab with the given index. The icon can have a width of 28 pixels
+		///  with a height of 6 pixels. It is drawn line-by-line from left to right.
+		///  
+		///  You can use up to 10 tabs.
+		///  
+		///  A icon-tab with the same index as a text-tab will overwrite the text-tab.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUITabIcon(byte index, bool[] icon)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(30, FUNCTION_SET_GUI_TAB_ICON);
+			LEConverter.To((byte)index, 8, request);
+			byte[] iconBits = new byte[21];
+			for (int i = 0; i < 168; i++) {
+				if (icon[i]) {
+					iconBits[i / 8] |= (byte)(1 << (i % 8));
+				}
+			}
+			LEConverter.To((byte[])iconBits, 9, 21, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the icon for a given index as set by <see cref="Tinkerforge.BrickletLCD128x64.SetGUITabIcon"/>.
+		///  
+		///  Additionally the `Active` parameter shows if the tab is currently active/visible
+		///  or not.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void GetGUITabIcon(byte index, out bool active, out bool[] icon)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_GUI_TAB_ICON);
+			LEConverter.To((byte)index, 8, request);
+
+			byte[] response = SendRequest(request, 30);
+
+			active = LEConverter.BoolFrom(8, response);
+			byte[] iconBits = new byte[21];
+			icon = new bool[168];
+			iconBits = LEConverter.ByteArrayFrom(9, response, 21);
+			for (int i = 0; i < 168; i++) {
+				icon[i] = (iconBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+		}
+
+		/// <summary>
+		///  Removes the tab with the given index.
+		///  
+		///  You can use index 255 to remove all tabs.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void RemoveGUITab(byte index)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_REMOVE_GUI_TAB);
+			LEConverter.To((byte)index, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Sets the tab with the given index as selected (drawn as selected on the display).
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUITabSelected(byte index)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_GUI_TAB_SELECTED);
+			LEConverter.To((byte)index, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  The period is the period with which the <see cref="Tinkerforge.BrickletLCD128x64.GUITabSelectedCallback"/> callback
+		///  is triggered periodically. A value of 0 turns the callback off.
+		///  
+		///  If the `value has to change`-parameter is set to true, the callback is only
+		///  triggered after the value has changed. If the value didn't change within the
+		///  period, the callback is triggered immediately on change.
+		///  
+		///  If it is set to false, the callback is continuously triggered with the period,
+		///  independent of the value.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUITabSelectedCallbackConfiguration(long period, bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_GUI_TAB_SELECTED_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+			LEConverter.To((bool)valueHasToChange, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetGUITabSelectedCallbackConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void GetGUITabSelectedCallbackConfiguration(out long period, out bool valueHasToChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_GUI_TAB_SELECTED_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			period = LEConverter.UIntFrom(8, response);
+			valueHasToChange = LEConverter.BoolFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the index of the currently selected tab.
+		///  If there are not tabs, the returned index is -1.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public short GetGUITabSelected()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_GUI_TAB_SELECTED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.SByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the configuration for up to four graphs.
+		///  
+		///  The graph type can be dot-, line- or bar-graph.
+		///  
+		///  The x and y position are pixel positions.
+		///  
+		///  You can add a text for the x and y axis.
+		///  The text is drawn at the inside of the graph and it can overwrite some
+		///  of the graph data. If you need the text outside of the graph you can
+		///  leave this text here empty and use <see cref="Tinkerforge.BrickletLCD128x64.DrawText"/> to draw the caption
+		///  outside of the graph.
+		///  
+		///  The data of the graph can be set and updated with <see cref="Tinkerforge.BrickletLCD128x64.SetGUIGraphData"/>.
+		///  
+		///  The graph is drawn in a separate GUI buffer and the graph-frame and data will
+		///  always stay on top of the graphics drawn with <see cref="Tinkerforge.BrickletLCD128x64.WritePixels"/>. To
+		///  remove the graph use <see cref="Tinkerforge.BrickletLCD128x64.RemoveGUIGraph"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUIGraphConfiguration(byte index, byte graphType, byte positionX, byte positionY, byte width, byte height, string textX, string textY)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(22, FUNCTION_SET_GUI_GRAPH_CONFIGURATION);
+			LEConverter.To((byte)index, 8, request);
+			LEConverter.To((byte)graphType, 9, request);
+			LEConverter.To((byte)positionX, 10, request);
+			LEConverter.To((byte)positionY, 11, request);
+			LEConverter.To((byte)width, 12, request);
+			LEConverter.To((byte)height, 13, request);
+			LEConverter.To((string)textX, 14, 4, request);
+			LEConverter.To((string)textY, 18, 4, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the graph properties for a given `Index` as set by <see cref="Tinkerforge.BrickletLCD128x64.SetGUIGraphConfiguration"/>.
+		///  
+		///  Additionally the `Active` parameter shows if a graph is currently active/visible
+		///  or not.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void GetGUIGraphConfiguration(byte index, out bool active, out byte graphType, out byte positionX, out byte positionY, out byte width, out byte height, out string textX, out string textY)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_GUI_GRAPH_CONFIGURATION);
+			LEConverter.To((byte)index, 8, request);
+
+			byte[] response = SendRequest(request, 22);
+
+			active = LEConverter.BoolFrom(8, response);
+			graphType = LEConverter.ByteFrom(9, response);
+			positionX = LEConverter.ByteFrom(10, response);
+			positionY = LEConverter.ByteFrom(11, response);
+			width = LEConverter.ByteFrom(12, response);
+			height = LEConverter.ByteFrom(13, response);
+			textX = LEConverter.StringFrom(14, response, 4);
+			textY = LEConverter.StringFrom(18, response, 4);
+		}
+
+		/// <summary>
+		///  Sets the data for a graph with the given index. You have to configure the graph with
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetGUIGraphConfiguration"/> before you can set the first data.
+		///  
+		///  The graph will show the first n values of the data that you set, where
+		///  n is the width set with <see cref="Tinkerforge.BrickletLCD128x64.SetGUIGraphConfiguration"/>. If you set
+		///  less then n values it will show the rest of the values as zero.
+		///  
+		///  The maximum number of data-points you can set is 118 (which also corresponds to the
+		///  maximum width of the graph).
+		///  
+		///  You have to scale your values to be between 0 and 255. 0 will be shown
+		///  at the bottom of the graph and 255 at the top.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUIGraphDataLowLevel(byte index, int dataLength, int dataChunkOffset, byte[] dataChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_GUI_GRAPH_DATA_LOW_LEVEL);
+			LEConverter.To((byte)index, 8, request);
+			LEConverter.To((short)dataLength, 9, request);
+			LEConverter.To((short)dataChunkOffset, 11, request);
+			LEConverter.To((byte[])dataChunkData, 13, 59, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the graph data for a given index as set by <see cref="Tinkerforge.BrickletLCD128x64.SetGUIGraphData"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void GetGUIGraphDataLowLevel(byte index, out int dataLength, out int dataChunkOffset, out byte[] dataChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_GUI_GRAPH_DATA_LOW_LEVEL);
+			LEConverter.To((byte)index, 8, request);
+
+			byte[] response = SendRequest(request, 71);
+
+			dataLength = LEConverter.UShortFrom(8, response);
+			dataChunkOffset = LEConverter.UShortFrom(10, response);
+			dataChunkData = LEConverter.ByteArrayFrom(12, response, 59);
+		}
+
+		/// <summary>
+		///  Removes the graph with the given index.
+		///  
+		///  You can use index 255 to remove all graphs.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void RemoveGUIGraph(byte index)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_REMOVE_GUI_GRAPH);
+			LEConverter.To((byte)index, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Removes all GUI elements (buttons, slider, graphs, tabs).
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void RemoveAllGUI()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_REMOVE_ALL_GUI);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Sets the touch LED configuration. By default the LED is on if the
+		///  LCD is touched.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is off.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetTouchLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_TOUCH_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletLCD128x64.SetTouchLEDConfig"/>
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public byte GetTouchLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TOUCH_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletLCD128x64.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletLCD128x64.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletLCD128x64.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Writes pixels to the specified window.
+		///  
+		///  The pixels are written into the window line by line top to bottom
+		///  and each line is written from left to right.
+		///  
+		///  If automatic draw is enabled (default) the pixels are directly written to
+		///  the screen. Only pixels that have actually changed are updated on the screen,
+		///  the rest stays the same.
+		///  
+		///  If automatic draw is disabled the pixels are written to an internal buffer and
+		///  the buffer is transferred to the display only after <see cref="Tinkerforge.BrickletLCD128x64.DrawBufferedFrame"/>
+		///  is called. This can be used to avoid flicker when drawing a complex frame in
+		///  multiple steps.
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletLCD128x64.SetDisplayConfiguration"/>
+		///  function.
+		/// </summary>
+		public void WritePixels(byte xStart, byte yStart, byte xEnd, byte yEnd, bool[] pixels)
+		{
+			if (pixels.Length > 65535)
+			{
+				throw new ArgumentException("Pixels can be at most 65535 items long");
+			}
+
+			int pixelsLength = pixels.Length;
+			int pixelsChunkOffset = 0;
+			bool[] pixelsChunkData = new bool[448];
+			int pixelsChunkLength;
+
+			if (pixelsLength == 0)
+			{
+				Array.Clear(pixelsChunkData, 0, 448);
+
+				WritePixelsLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (pixelsChunkOffset < pixelsLength)
+					{
+						pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 448);
+
+						Array.Copy(pixels, pixelsChunkOffset, pixelsChunkData, 0, pixelsChunkLength);
+						Array.Clear(pixelsChunkData, pixelsChunkLength, 448 - pixelsChunkLength);
+
+						WritePixelsLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+
+						pixelsChunkOffset += 448;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  Reads pixels from the specified window.
+		///  
+		///  The pixels are read from the window line by line top to bottom
+		///  and each line is read from left to right.
+		///  
+		///  If automatic draw is enabled (default) the pixels that are read are always the
+		///  same that are shown on the display.
+		///  
+		///  If automatic draw is disabled the pixels are read from the internal buffer
+		///  (see <see cref="Tinkerforge.BrickletLCD128x64.DrawBufferedFrame"/>).
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletLCD128x64.SetDisplayConfiguration"/>
+		///  function.
+		/// </summary>
+		public bool[] ReadPixels(byte xStart, byte yStart, byte xEnd, byte yEnd)
+		{
+			bool[] pixels = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int pixelsLength = 0;
+			int pixelsChunkOffset;
+			bool[] pixelsChunkData = new bool[480];
+			int pixelsChunkLength;
+			bool pixelsOutOfSync;
+			int pixelsCurrentLength;
+
+			lock (streamLock)
+			{
+				ReadPixelsLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+
+				pixelsOutOfSync = pixelsChunkOffset != 0;
+
+				if (!pixelsOutOfSync) {
+					pixels = new bool[pixelsLength];
+					pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 480);
+
+					Array.Copy(pixelsChunkData, pixels, pixelsChunkLength);
+
+					pixelsCurrentLength = pixelsChunkLength;
+
+					while (pixelsCurrentLength < pixelsLength)
+					{
+						ReadPixelsLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+
+						pixelsOutOfSync = pixelsChunkOffset != pixelsCurrentLength;
+
+						if (pixelsOutOfSync) {
+							break;
+						}
+
+						pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 480);
+
+						Array.Copy(pixelsChunkData, 0, pixels, pixelsCurrentLength, pixelsChunkLength);
+
+						pixelsCurrentLength += pixelsChunkLength;
+					}
+				}
+
+				if (pixelsOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (pixelsChunkOffset + 480 < pixelsLength)
+					{
+						ReadPixelsLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Pixels is out-of-sync");
+				}
+			}
+
+			return pixels;
+		}
+
+		/// <summary>
+		///  Sets the data for a graph with the given index. You have to configure the graph with
+		///  <see cref="Tinkerforge.BrickletLCD128x64.SetGUIGraphConfiguration"/> before you can set the first data.
+		///  
+		///  The graph will show the first n values of the data that you set, where
+		///  n is the width set with <see cref="Tinkerforge.BrickletLCD128x64.SetGUIGraphConfiguration"/>. If you set
+		///  less then n values it will show the rest of the values as zero.
+		///  
+		///  The maximum number of data-points you can set is 118 (which also corresponds to the
+		///  maximum width of the graph).
+		///  
+		///  You have to scale your values to be between 0 and 255. 0 will be shown
+		///  at the bottom of the graph and 255 at the top.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetGUIGraphData(byte index, byte[] data)
+		{
+			if (data.Length > 65535)
+			{
+				throw new ArgumentException("Data can be at most 65535 items long");
+			}
+
+			int dataLength = data.Length;
+			int dataChunkOffset = 0;
+			byte[] dataChunkData = new byte[59];
+			int dataChunkLength;
+
+			if (dataLength == 0)
+			{
+				Array.Clear(dataChunkData, 0, 59);
+
+				SetGUIGraphDataLowLevel(index, dataLength, dataChunkOffset, dataChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (dataChunkOffset < dataLength)
+					{
+						dataChunkLength = Math.Min(dataLength - dataChunkOffset, 59);
+
+						Array.Copy(data, dataChunkOffset, dataChunkData, 0, dataChunkLength);
+						Array.Clear(dataChunkData, dataChunkLength, 59 - dataChunkLength);
+
+						SetGUIGraphDataLowLevel(index, dataLength, dataChunkOffset, dataChunkData);
+
+						dataChunkOffset += 59;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  Returns the graph data for a given index as set by <see cref="Tinkerforge.BrickletLCD128x64.SetGUIGraphData"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public byte[] GetGUIGraphData(byte index)
+		{
+			byte[] data = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int dataLength = 0;
+			int dataChunkOffset;
+			byte[] dataChunkData = new byte[59];
+			int dataChunkLength;
+			bool dataOutOfSync;
+			int dataCurrentLength;
+
+			lock (streamLock)
+			{
+				GetGUIGraphDataLowLevel(index, out dataLength, out dataChunkOffset, out dataChunkData);
+
+				dataOutOfSync = dataChunkOffset != 0;
+
+				if (!dataOutOfSync) {
+					data = new byte[dataLength];
+					dataChunkLength = Math.Min(dataLength - dataChunkOffset, 59);
+
+					Array.Copy(dataChunkData, data, dataChunkLength);
+
+					dataCurrentLength = dataChunkLength;
+
+					while (dataCurrentLength < dataLength)
+					{
+						GetGUIGraphDataLowLevel(index, out dataLength, out dataChunkOffset, out dataChunkData);
+
+						dataOutOfSync = dataChunkOffset != dataCurrentLength;
+
+						if (dataOutOfSync) {
+							break;
+						}
+
+						dataChunkLength = Math.Min(dataLength - dataChunkOffset, 59);
+
+						Array.Copy(dataChunkData, 0, data, dataCurrentLength, dataChunkLength);
+
+						dataCurrentLength += dataChunkLength;
+					}
+				}
+
+				if (dataOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (dataChunkOffset + 59 < dataLength)
+					{
+						GetGUIGraphDataLowLevel(index, out dataLength, out dataChunkOffset, out dataChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Data is out-of-sync");
+				}
+			}
+
+			return data;
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnTouchPositionCallback(byte[] response)
+		{
+			if (response.Length != 18)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int pressure = LEConverter.UShortFrom(8, response);
+			int x = LEConverter.UShortFrom(10, response);
+			int y = LEConverter.UShortFrom(12, response);
+			long age = LEConverter.UIntFrom(14, response);
+			var handler = TouchPositionCallback;
+
+			if (handler != null)
+			{
+				handler(this, pressure, x, y, age);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnTouchGestureCallback(byte[] response)
+		{
+			if (response.Length != 27)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte gesture = LEConverter.ByteFrom(8, response);
+			long duration = LEConverter.UIntFrom(9, response);
+			int pressureMax = LEConverter.UShortFrom(13, response);
+			int xStart = LEConverter.UShortFrom(15, response);
+			int yStart = LEConverter.UShortFrom(17, response);
+			int xEnd = LEConverter.UShortFrom(19, response);
+			int yEnd = LEConverter.UShortFrom(21, response);
+			long age = LEConverter.UIntFrom(23, response);
+			var handler = TouchGestureCallback;
+
+			if (handler != null)
+			{
+				handler(this, gesture, duration, pressureMax, xStart, yStart, xEnd, yEnd, age);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnGUIButtonPressedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte index = LEConverter.ByteFrom(8, response);
+			bool pressed = LEConverter.BoolFrom(9, response);
+			var handler = GUIButtonPressedCallback;
+
+			if (handler != null)
+			{
+				handler(this, index, pressed);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnGUISliderValueCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte index = LEConverter.ByteFrom(8, response);
+			byte value = LEConverter.ByteFrom(9, response);
+			var handler = GUISliderValueCallback;
+
+			if (handler != null)
+			{
+				handler(this, index, value);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnGUITabSelectedCallback(byte[] response)
+		{
+			if (response.Length != 9)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short index = LEConverter.SByteFrom(8, response);
+			var handler = GUITabSelectedCallback;
+
+			if (handler != null)
+			{
+				handler(this, index);
+			}
+		}
+	}
+}
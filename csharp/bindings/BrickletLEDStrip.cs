@@ -0,0 +1,798 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Controls up to 320 RGB LEDs
+	/// </summary>
+	public class BrickletLEDStrip : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 231;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "LED Strip Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RGB_VALUES = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RGB_VALUES = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FRAME_DURATION = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FRAME_DURATION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SUPPLY_VOLTAGE = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CLOCK_FREQUENCY = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CLOCK_FREQUENCY = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHIP_TYPE = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TYPE = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RGBW_VALUES = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RGBW_VALUES = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHANNEL_MAPPING = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHANNEL_MAPPING = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_FRAME_RENDERED_CALLBACK = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_FRAME_RENDERED_CALLBACK = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_FRAME_RENDERED_CALLBACK_ENABLED = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_FRAME_RENDERED = 6;
+
+
+		/// <summary>
+		/// </summary>
+		public const int CHIP_TYPE_WS2801 = 2801;
+
+		/// <summary>
+		/// </summary>
+		public const int CHIP_TYPE_WS2811 = 2811;
+
+		/// <summary>
+		/// </summary>
+		public const int CHIP_TYPE_WS2812 = 2812;
+
+		/// <summary>
+		/// </summary>
+		public const int CHIP_TYPE_LPD8806 = 8806;
+
+		/// <summary>
+		/// </summary>
+		public const int CHIP_TYPE_APA102 = 102;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RGB = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RBG = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BRG = 33;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BGR = 36;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GRB = 18;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GBR = 24;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RGBW = 27;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RGWB = 30;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RBGW = 39;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RBWG = 45;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RWGB = 54;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RWBG = 57;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GRWB = 78;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GRBW = 75;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GBWR = 108;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GBRW = 99;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GWBR = 120;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GWRB = 114;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BRGW = 135;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BRWG = 141;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BGRW = 147;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BGWR = 156;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BWRG = 177;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BWGR = 180;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WRBG = 201;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WRGB = 198;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WGBR = 216;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WGRB = 210;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WBGR = 228;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WBRG = 225;
+
+
+		/// <summary>
+		///  This callback is triggered directly after a new frame is rendered. The
+		///  parameter is the number of RGB or RGBW LEDs in that frame.
+		///  
+		///  You should send the data for the next frame directly after this callback
+		///  was triggered.
+		///  
+		///  For an explanation of the general approach see <see cref="Tinkerforge.BrickletLEDStrip.SetRGBValues"/>.
+		/// </summary>
+		public event FrameRenderedEventHandler FrameRenderedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FrameRenderedEventHandler(BrickletLEDStrip sender, int length);
+
+		/// <summary>
+		/// </summary>
+		public event FrameRenderedEventHandler FrameRendered // for backward compatibility
+		{
+			add { FrameRenderedCallback += value; }
+			remove { FrameRenderedCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletLEDStrip(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 3;
+
+			callbackWrappers[CALLBACK_FRAME_RENDERED] = new CallbackWrapper(OnFrameRenderedCallback);
+
+
+			responseExpected[FUNCTION_SET_RGB_VALUES] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_RGB_VALUES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_FRAME_DURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_FRAME_DURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SUPPLY_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CLOCK_FREQUENCY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CLOCK_FREQUENCY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHIP_TYPE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHIP_TYPE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_RGBW_VALUES] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_RGBW_VALUES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHANNEL_MAPPING] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHANNEL_MAPPING] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_FRAME_RENDERED_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_DISABLE_FRAME_RENDERED_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_IS_FRAME_RENDERED_CALLBACK_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Sets *length* RGB values for the LEDs starting from *index*.
+		///  
+		///  To make the colors show correctly you need to configure the chip type
+		///  (<see cref="Tinkerforge.BrickletLEDStrip.SetChipType"/>) and a 3-channel channel mapping (<see cref="Tinkerforge.BrickletLEDStrip.SetChannelMapping"/>)
+		///  according to the connected LEDs.
+		///  
+		///  Example: If you set
+		///  
+		///  * index to 5,
+		///  * length to 3,
+		///  * r to [255, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+		///  * g to [0, 255, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0] and
+		///  * b to [0, 0, 255, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+		///  
+		///  the LED with index 5 will be red, 6 will be green and 7 will be blue.
+		///  
+		///  .. note:: Depending on the LED circuitry colors can be permuted.
+		///  
+		///  The colors will be transfered to actual LEDs when the next
+		///  frame duration ends, see <see cref="Tinkerforge.BrickletLEDStrip.SetFrameDuration"/>.
+		///  
+		///  Generic approach:
+		///  
+		///  * Set the frame duration to a value that represents
+		///    the number of frames per second you want to achieve.
+		///  * Set all of the LED colors for one frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletLEDStrip.FrameRenderedCallback"/> callback.
+		///  * Set all of the LED colors for next frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletLEDStrip.FrameRenderedCallback"/> callback.
+		///  * and so on.
+		///  
+		///  This approach ensures that you can change the LED colors with
+		///  a fixed frame rate.
+		///  
+		///  The actual number of controllable LEDs depends on the number of free
+		///  Bricklet ports. See :ref:`here &lt;led_strip_bricklet_ram_constraints&gt;` for more
+		///  information. A call of <see cref="Tinkerforge.BrickletLEDStrip.SetRGBValues"/> with index + length above the
+		///  bounds is ignored completely.
+		/// </summary>
+		public void SetRGBValues(int index, byte length, byte[] r, byte[] g, byte[] b)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(59, FUNCTION_SET_RGB_VALUES);
+			LEConverter.To((short)index, 8, request);
+			LEConverter.To((byte)length, 10, request);
+			LEConverter.To((byte[])r, 11, 16, request);
+			LEConverter.To((byte[])g, 27, 16, request);
+			LEConverter.To((byte[])b, 43, 16, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *length* R, G and B values starting from the
+		///  given LED *index*.
+		///  
+		///  The values are the last values that were set by <see cref="Tinkerforge.BrickletLEDStrip.SetRGBValues"/>.
+		/// </summary>
+		public void GetRGBValues(int index, byte length, out byte[] r, out byte[] g, out byte[] b)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_GET_RGB_VALUES);
+			LEConverter.To((short)index, 8, request);
+			LEConverter.To((byte)length, 10, request);
+
+			byte[] response = SendRequest(request, 56);
+
+			r = LEConverter.ByteArrayFrom(8, response, 16);
+			g = LEConverter.ByteArrayFrom(24, response, 16);
+			b = LEConverter.ByteArrayFrom(40, response, 16);
+		}
+
+		/// <summary>
+		///  Sets the frame duration.
+		///  
+		///  Example: If you want to achieve 20 frames per second, you should
+		///  set the frame duration to 50ms (50ms * 20 = 1 second).
+		///  
+		///  For an explanation of the general approach see <see cref="Tinkerforge.BrickletLEDStrip.SetRGBValues"/>.
+		/// </summary>
+		public void SetFrameDuration(int duration)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_FRAME_DURATION);
+			LEConverter.To((short)duration, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the frame duration as set by <see cref="Tinkerforge.BrickletLEDStrip.SetFrameDuration"/>.
+		/// </summary>
+		public int GetFrameDuration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FRAME_DURATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current supply voltage of the LEDs.
+		/// </summary>
+		public int GetSupplyVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SUPPLY_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the frequency of the clock.
+		///  
+		///  The Bricklet will choose the nearest achievable frequency, which may
+		///  be off by a few Hz. You can get the exact frequency that is used by
+		///  calling <see cref="Tinkerforge.BrickletLEDStrip.GetClockFrequency"/>.
+		///  
+		///  If you have problems with flickering LEDs, they may be bits flipping. You
+		///  can fix this by either making the connection between the LEDs and the
+		///  Bricklet shorter or by reducing the frequency.
+		///  
+		///  With a decreasing frequency your maximum frames per second will decrease
+		///  too.
+		///  
+		///  <note>
+		///   The frequency in firmware version 2.0.0 is fixed at 2MHz.
+		///  </note>
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Plugin)
+		/// </summary>
+		public void SetClockFrequency(long frequency)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_CLOCK_FREQUENCY);
+			LEConverter.To((int)frequency, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the currently used clock frequency as set by <see cref="Tinkerforge.BrickletLEDStrip.SetClockFrequency"/>.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Plugin)
+		/// </summary>
+		public long GetClockFrequency()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CLOCK_FREQUENCY);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the type of the LED driver chip. We currently support the chips
+		///  
+		///  * WS2801,
+		///  * WS2811,
+		///  * WS2812 / SK6812 / NeoPixel RGB,
+		///  * SK6812RGBW / NeoPixel RGBW (Chip Type = WS2812),
+		///  * LPD8806 and
+		///  * APA102 / DotStar.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetChipType(int chip)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_CHIP_TYPE);
+			LEConverter.To((short)chip, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the currently used chip type as set by <see cref="Tinkerforge.BrickletLEDStrip.SetChipType"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public int GetChipType()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TYPE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets *length* RGBW values for the LEDs starting from *index*.
+		///  
+		///  To make the colors show correctly you need to configure the chip type
+		///  (<see cref="Tinkerforge.BrickletLEDStrip.SetChipType"/>) and a 4-channel channel mapping (<see cref="Tinkerforge.BrickletLEDStrip.SetChannelMapping"/>)
+		///  according to the connected LEDs.
+		///  
+		///  The maximum length is 12, the index goes from 0 to 239 and the rgbw values
+		///  have 8 bits each.
+		///  
+		///  Example: If you set
+		///  
+		///  * index to 5,
+		///  * length to 4,
+		///  * r to [255, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+		///  * g to [0, 255, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+		///  * b to [0, 0, 255, 0, 0, 0, 0, 0, 0, 0, 0, 0] and
+		///  * w to [0, 0, 255, 0, 0, 0, 0, 0, 0, 0, 0, 0]
+		///  
+		///  the LED with index 5 will be red, 6 will be green, 7 will be blue and 8 will be white.
+		///  
+		///  .. note:: Depending on the LED circuitry colors can be permuted.
+		///  
+		///  The colors will be transfered to actual LEDs when the next
+		///  frame duration ends, see <see cref="Tinkerforge.BrickletLEDStrip.SetFrameDuration"/>.
+		///  
+		///  Generic approach:
+		///  
+		///  * Set the frame duration to a value that represents
+		///    the number of frames per second you want to achieve.
+		///  * Set all of the LED colors for one frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletLEDStrip.FrameRenderedCallback"/> callback.
+		///  * Set all of the LED colors for next frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletLEDStrip.FrameRenderedCallback"/> callback.
+		///  * and so on.
+		///  
+		///  This approach ensures that you can change the LED colors with
+		///  a fixed frame rate.
+		///  
+		///  The actual number of controllable LEDs depends on the number of free
+		///  Bricklet ports. See :ref:`here &lt;led_strip_bricklet_ram_constraints&gt;` for more
+		///  information. A call of <see cref="Tinkerforge.BrickletLEDStrip.SetRGBWValues"/> with index + length above the
+		///  bounds is ignored completely.
+		///  
+		///  The LPD8806 LED driver chips have 7-bit channels for RGB. Internally the LED
+		///  Strip Bricklets divides the 8-bit values set using this function by 2 to make
+		///  them 7-bit. Therefore, you can just use the normal value range (0-255) for
+		///  LPD8806 LEDs.
+		///  
+		///  The brightness channel of the APA102 LED driver chips has 5-bit. Internally the
+		///  LED Strip Bricklets divides the 8-bit values set using this function by 8 to make
+		///  them 5-bit. Therefore, you can just use the normal value range (0-255) for
+		///  the brightness channel of APA102 LEDs.
+		///  
+		///  .. versionadded:: 2.0.6$nbsp;(Plugin)
+		/// </summary>
+		public void SetRGBWValues(int index, byte length, byte[] r, byte[] g, byte[] b, byte[] w)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(59, FUNCTION_SET_RGBW_VALUES);
+			LEConverter.To((short)index, 8, request);
+			LEConverter.To((byte)length, 10, request);
+			LEConverter.To((byte[])r, 11, 12, request);
+			LEConverter.To((byte[])g, 23, 12, request);
+			LEConverter.To((byte[])b, 35, 12, request);
+			LEConverter.To((byte[])w, 47, 12, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *length* RGBW values starting from the given *index*.
+		///  
+		///  The values are the last values that were set by <see cref="Tinkerforge.BrickletLEDStrip.SetRGBWValues"/>.
+		///  
+		///  .. versionadded:: 2.0.6$nbsp;(Plugin)
+		/// </summary>
+		public void GetRGBWValues(int index, byte length, out byte[] r, out byte[] g, out byte[] b, out byte[] w)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_GET_RGBW_VALUES);
+			LEConverter.To((short)index, 8, request);
+			LEConverter.To((byte)length, 10, request);
+
+			byte[] response = SendRequest(request, 56);
+
+			r = LEConverter.ByteArrayFrom(8, response, 12);
+			g = LEConverter.ByteArrayFrom(20, response, 12);
+			b = LEConverter.ByteArrayFrom(32, response, 12);
+			w = LEConverter.ByteArrayFrom(44, response, 12);
+		}
+
+		/// <summary>
+		///  Sets the channel mapping for the connected LEDs.
+		///  
+		///  <see cref="Tinkerforge.BrickletLEDStrip.SetRGBValues"/> and <see cref="Tinkerforge.BrickletLEDStrip.SetRGBWValues"/> take the data in RGB(W) order.
+		///  But the connected LED driver chips might have their 3 or 4 channels in a
+		///  different order. For example, the WS2801 chips typically use BGR order, the
+		///  WS2812 chips typically use GRB order and the APA102 chips typically use WBGR
+		///  order.
+		///  
+		///  The APA102 chips are special. They have three 8-bit channels for RGB
+		///  and an additional 5-bit channel for the overall brightness of the RGB LED
+		///  making them 4-channel chips. Internally the brightness channel is the first
+		///  channel, therefore one of the Wxyz channel mappings should be used. Then
+		///  the W channel controls the brightness.
+		///  
+		///  If a 3-channel mapping is selected then <see cref="Tinkerforge.BrickletLEDStrip.SetRGBValues"/> has to be used.
+		///  Calling <see cref="Tinkerforge.BrickletLEDStrip.SetRGBWValues"/> with a 3-channel mapping will produce incorrect
+		///  results. Vice-versa if a 4-channel mapping is selected then
+		///  <see cref="Tinkerforge.BrickletLEDStrip.SetRGBWValues"/> has to be used. Calling <see cref="Tinkerforge.BrickletLEDStrip.SetRGBValues"/> with a
+		///  4-channel mapping will produce incorrect results.
+		///  
+		///  .. versionadded:: 2.0.6$nbsp;(Plugin)
+		/// </summary>
+		public void SetChannelMapping(byte mapping)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_CHANNEL_MAPPING);
+			LEConverter.To((byte)mapping, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the currently used channel mapping as set by <see cref="Tinkerforge.BrickletLEDStrip.SetChannelMapping"/>.
+		///  
+		///  .. versionadded:: 2.0.6$nbsp;(Plugin)
+		/// </summary>
+		public byte GetChannelMapping()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHANNEL_MAPPING);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Enables the <see cref="Tinkerforge.BrickletLEDStrip.FrameRenderedCallback"/> callback.
+		///  
+		///  By default the callback is enabled.
+		///  
+		///  .. versionadded:: 2.0.6$nbsp;(Plugin)
+		/// </summary>
+		public void EnableFrameRenderedCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_FRAME_RENDERED_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the <see cref="Tinkerforge.BrickletLEDStrip.FrameRenderedCallback"/> callback.
+		///  
+		///  By default the callback is enabled.
+		///  
+		///  .. versionadded:: 2.0.6$nbsp;(Plugin)
+		/// </summary>
+		public void DisableFrameRenderedCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_FRAME_RENDERED_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the <see cref="Tinkerforge.BrickletLEDStrip.FrameRenderedCallback"/> callback is enabled, *false* otherwise.
+		///  
+		///  .. versionadded:: 2.0.6$nbsp;(Plugin)
+		/// </summary>
+		public bool IsFrameRenderedCallbackEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_FRAME_RENDERED_CALLBACK_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFrameRenderedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int length = LEConverter.UShortFrom(8, response);
+			var handler = FrameRenderedCallback;
+
+			if (handler != null)
+			{
+				handler(this, length);
+			}
+		}
+	}
+}
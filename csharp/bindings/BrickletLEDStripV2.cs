@@ -0,0 +1,1108 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Controls up to 2048 RGB(W) LEDs
+	/// </summary>
+	public class BrickletLEDStripV2 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2103;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "LED Strip Bricklet 2.0";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_LED_VALUES_LOW_LEVEL = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_LED_VALUES_LOW_LEVEL = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FRAME_DURATION = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FRAME_DURATION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SUPPLY_VOLTAGE = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CLOCK_FREQUENCY = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CLOCK_FREQUENCY = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHIP_TYPE = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TYPE = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CHANNEL_MAPPING = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHANNEL_MAPPING = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FRAME_STARTED_CALLBACK_CONFIGURATION = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FRAME_STARTED_CALLBACK_CONFIGURATION = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_FRAME_STARTED = 6;
+
+
+		/// <summary>
+		/// </summary>
+		public const int CHIP_TYPE_WS2801 = 2801;
+
+		/// <summary>
+		/// </summary>
+		public const int CHIP_TYPE_WS2811 = 2811;
+
+		/// <summary>
+		/// </summary>
+		public const int CHIP_TYPE_WS2812 = 2812;
+
+		/// <summary>
+		/// </summary>
+		public const int CHIP_TYPE_LPD8806 = 8806;
+
+		/// <summary>
+		/// </summary>
+		public const int CHIP_TYPE_APA102 = 102;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RGB = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RBG = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BRG = 33;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BGR = 36;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GRB = 18;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GBR = 24;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RGBW = 27;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RGWB = 30;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RBGW = 39;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RBWG = 45;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RWGB = 54;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_RWBG = 57;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GRWB = 78;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GRBW = 75;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GBWR = 108;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GBRW = 99;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GWBR = 120;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_GWRB = 114;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BRGW = 135;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BRWG = 141;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BGRW = 147;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BGWR = 156;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BWRG = 177;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_BWGR = 180;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WRBG = 201;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WRGB = 198;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WGBR = 216;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WGRB = 210;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WBGR = 228;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHANNEL_MAPPING_WBRG = 225;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered directly after a new frame render is started.
+		///  The parameter is the number of LEDs in that frame.
+		///  
+		///  You should send the data for the next frame directly after this callback
+		///  was triggered.
+		///  
+		///  For an explanation of the general approach see <see cref="Tinkerforge.BrickletLEDStripV2.SetLEDValues"/>.
+		/// </summary>
+		public event FrameStartedEventHandler FrameStartedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FrameStartedEventHandler(BrickletLEDStripV2 sender, int length);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletLEDStripV2(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_FRAME_STARTED] = new CallbackWrapper(OnFrameStartedCallback);
+
+
+			responseExpected[FUNCTION_SET_LED_VALUES_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_LED_VALUES_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_FRAME_DURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_FRAME_DURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SUPPLY_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CLOCK_FREQUENCY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CLOCK_FREQUENCY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHIP_TYPE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHIP_TYPE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CHANNEL_MAPPING] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CHANNEL_MAPPING] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_FRAME_STARTED_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_FRAME_STARTED_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Sets the RGB(W) values for the LEDs starting from *index*.
+		///  You can set at most 2048 RGB values or 1536 RGBW values (6144 byte each).
+		///  
+		///  To make the colors show correctly you need to configure the chip type
+		///  (see <see cref="Tinkerforge.BrickletLEDStripV2.SetChipType"/>) and a channel mapping (see <see cref="Tinkerforge.BrickletLEDStripV2.SetChannelMapping"/>)
+		///  according to the connected LEDs.
+		///  
+		///  If the channel mapping has 3 colors, you need to give the data in the sequence
+		///  RGBRGBRGB... if the channel mapping has 4 colors you need to give data in the
+		///  sequence RGBWRGBWRGBW...
+		///  
+		///  The data is double buffered and the colors will be transfered to the
+		///  LEDs when the next frame duration ends (see <see cref="Tinkerforge.BrickletLEDStripV2.SetFrameDuration"/>).
+		///  
+		///  Generic approach:
+		///  
+		///  * Set the frame duration to a value that represents the number of frames per
+		///    second you want to achieve.
+		///  * Set all of the LED colors for one frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletLEDStripV2.FrameStartedCallback"/> callback.
+		///  * Set all of the LED colors for next frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletLEDStripV2.FrameStartedCallback"/> callback.
+		///  * And so on.
+		///  
+		///  This approach ensures that you can change the LED colors with a fixed frame rate.
+		/// </summary>
+		public void SetLEDValuesLowLevel(int index, int valueLength, int valueChunkOffset, byte[] valueChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SET_LED_VALUES_LOW_LEVEL);
+			LEConverter.To((short)index, 8, request);
+			LEConverter.To((short)valueLength, 10, request);
+			LEConverter.To((short)valueChunkOffset, 12, request);
+			LEConverter.To((byte[])valueChunkData, 14, 58, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *length* RGB(W) values starting from the
+		///  given *index*.
+		///  
+		///  If the channel mapping has 3 colors, you will get the data in the sequence
+		///  RGBRGBRGB... if the channel mapping has 4 colors you will get the data in the
+		///  sequence RGBWRGBWRGBW...
+		///  (assuming you start at an index divisible by 3 (RGB) or 4 (RGBW)).
+		/// </summary>
+		public void GetLEDValuesLowLevel(int index, int length, out int valueLength, out int valueChunkOffset, out byte[] valueChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_GET_LED_VALUES_LOW_LEVEL);
+			LEConverter.To((short)index, 8, request);
+			LEConverter.To((short)length, 10, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			valueLength = LEConverter.UShortFrom(8, response);
+			valueChunkOffset = LEConverter.UShortFrom(10, response);
+			valueChunkData = LEConverter.ByteArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  Sets the frame duration.
+		///  
+		///  Example: If you want to achieve 20 frames per second, you should
+		///  set the frame duration to 50ms (50ms * 20 = 1 second).
+		///  
+		///  For an explanation of the general approach see <see cref="Tinkerforge.BrickletLEDStripV2.SetLEDValues"/>.
+		///  
+		///  Default value: 100ms (10 frames per second).
+		/// </summary>
+		public void SetFrameDuration(int duration)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_FRAME_DURATION);
+			LEConverter.To((short)duration, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the frame duration as set by <see cref="Tinkerforge.BrickletLEDStripV2.SetFrameDuration"/>.
+		/// </summary>
+		public int GetFrameDuration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FRAME_DURATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current supply voltage of the LEDs.
+		/// </summary>
+		public int GetSupplyVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SUPPLY_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the frequency of the clock.
+		///  
+		///  The Bricklet will choose the nearest achievable frequency, which may
+		///  be off by a few Hz. You can get the exact frequency that is used by
+		///  calling <see cref="Tinkerforge.BrickletLEDStripV2.GetClockFrequency"/>.
+		///  
+		///  If you have problems with flickering LEDs, they may be bits flipping. You
+		///  can fix this by either making the connection between the LEDs and the
+		///  Bricklet shorter or by reducing the frequency.
+		///  
+		///  With a decreasing frequency your maximum frames per second will decrease
+		///  too.
+		/// </summary>
+		public void SetClockFrequency(long frequency)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_CLOCK_FREQUENCY);
+			LEConverter.To((int)frequency, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the currently used clock frequency as set by <see cref="Tinkerforge.BrickletLEDStripV2.SetClockFrequency"/>.
+		/// </summary>
+		public long GetClockFrequency()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CLOCK_FREQUENCY);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the type of the LED driver chip. We currently support the chips
+		///  
+		///  * WS2801,
+		///  * WS2811,
+		///  * WS2812 / SK6812 / NeoPixel RGB,
+		///  * SK6812RGBW / NeoPixel RGBW (Chip Type = WS2812),
+		///  * WS2813 / WS2815 (Chip Type = WS2812)
+		///  * LPD8806 and
+		///  * APA102 / DotStar.
+		/// </summary>
+		public void SetChipType(int chip)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_CHIP_TYPE);
+			LEConverter.To((short)chip, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the currently used chip type as set by <see cref="Tinkerforge.BrickletLEDStripV2.SetChipType"/>.
+		/// </summary>
+		public int GetChipType()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TYPE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the channel mapping for the connected LEDs.
+		///  
+		///  If the mapping has 4 colors, the function <see cref="Tinkerforge.BrickletLEDStripV2.SetLEDValues"/> expects 4
+		///  values per pixel and if the mapping has 3 colors it expects 3 values per pixel.
+		///  
+		///  The function always expects the order RGB(W). The connected LED driver chips
+		///  might have their 3 or 4 channels in a different order. For example, the WS2801
+		///  chips typically use BGR order, then WS2812 chips typically use GRB order and
+		///  the APA102 chips typically use WBGR order.
+		///  
+		///  The APA102 chips are special. They have three 8-bit channels for RGB
+		///  and an additional 5-bit channel for the overall brightness of the RGB LED
+		///  making them 4-channel chips. Internally the brightness channel is the first
+		///  channel, therefore one of the Wxyz channel mappings should be used. Then
+		///  the W channel controls the brightness.
+		/// </summary>
+		public void SetChannelMapping(byte mapping)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_CHANNEL_MAPPING);
+			LEConverter.To((byte)mapping, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the currently used channel mapping as set by <see cref="Tinkerforge.BrickletLEDStripV2.SetChannelMapping"/>.
+		/// </summary>
+		public byte GetChannelMapping()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHANNEL_MAPPING);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Enables/disables the <see cref="Tinkerforge.BrickletLEDStripV2.FrameStartedCallback"/> callback.
+		/// </summary>
+		public void SetFrameStartedCallbackConfiguration(bool enable)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_FRAME_STARTED_CALLBACK_CONFIGURATION);
+			LEConverter.To((bool)enable, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by
+		///  <see cref="Tinkerforge.BrickletLEDStripV2.SetFrameStartedCallbackConfiguration"/>.
+		/// </summary>
+		public bool GetFrameStartedCallbackConfiguration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FRAME_STARTED_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletLEDStripV2.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletLEDStripV2.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletLEDStripV2.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletLEDStripV2.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Sets the RGB(W) values for the LEDs starting from *index*.
+		///  You can set at most 2048 RGB values or 1536 RGBW values (6144 byte each).
+		///  
+		///  To make the colors show correctly you need to configure the chip type
+		///  (see <see cref="Tinkerforge.BrickletLEDStripV2.SetChipType"/>) and a channel mapping (see <see cref="Tinkerforge.BrickletLEDStripV2.SetChannelMapping"/>)
+		///  according to the connected LEDs.
+		///  
+		///  If the channel mapping has 3 colors, you need to give the data in the sequence
+		///  RGBRGBRGB... if the channel mapping has 4 colors you need to give data in the
+		///  sequence RGBWRGBWRGBW...
+		///  
+		///  The data is double buffered and the colors will be transfered to the
+		///  LEDs when the next frame duration ends (see <see cref="Tinkerforge.BrickletLEDStripV2.SetFrameDuration"/>).
+		///  
+		///  Generic approach:
+		///  
+		///  * Set the frame duration to a value that represents the number of frames per
+		///    second you want to achieve.
+		///  * Set all of the LED colors for one frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletLEDStripV2.FrameStartedCallback"/> callback.
+		///  * Set all of the LED colors for next frame.
+		///  * Wait for the <see cref="Tinkerforge.BrickletLEDStripV2.FrameStartedCallback"/> callback.
+		///  * And so on.
+		///  
+		///  This approach ensures that you can change the LED colors with a fixed frame rate.
+		/// </summary>
+		public void SetLEDValues(int index, byte[] value)
+		{
+			if (value.Length > 65535)
+			{
+				throw new ArgumentException("Value can be at most 65535 items long");
+			}
+
+			int valueLength = value.Length;
+			int valueChunkOffset = 0;
+			byte[] valueChunkData = new byte[58];
+			int valueChunkLength;
+
+			if (valueLength == 0)
+			{
+				Array.Clear(valueChunkData, 0, 58);
+
+				SetLEDValuesLowLevel(index, valueLength, valueChunkOffset, valueChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (valueChunkOffset < valueLength)
+					{
+						valueChunkLength = Math.Min(valueLength - valueChunkOffset, 58);
+
+						Array.Copy(value, valueChunkOffset, valueChunkData, 0, valueChunkLength);
+						Array.Clear(valueChunkData, valueChunkLength, 58 - valueChunkLength);
+
+						SetLEDValuesLowLevel(index, valueLength, valueChunkOffset, valueChunkData);
+
+						valueChunkOffset += 58;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  Returns *length* RGB(W) values starting from the
+		///  given *index*.
+		///  
+		///  If the channel mapping has 3 colors, you will get the data in the sequence
+		///  RGBRGBRGB... if the channel mapping has 4 colors you will get the data in the
+		///  sequence RGBWRGBWRGBW...
+		///  (assuming you start at an index divisible by 3 (RGB) or 4 (RGBW)).
+		/// </summary>
+		public byte[] GetLEDValues(int index, int length)
+		{
+			byte[] value = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int valueLength = 0;
+			int valueChunkOffset;
+			byte[] valueChunkData = new byte[60];
+			int valueChunkLength;
+			bool valueOutOfSync;
+			int valueCurrentLength;
+
+			lock (streamLock)
+			{
+				GetLEDValuesLowLevel(index, length, out valueLength, out valueChunkOffset, out valueChunkData);
+
+				valueOutOfSync = valueChunkOffset != 0;
+
+				if (!valueOutOfSync) {
+					value = new byte[valueLength];
+					valueChunkLength = Math.Min(valueLength - valueChunkOffset, 60);
+
+					Array.Copy(valueChunkData, value, valueChunkLength);
+
+					valueCurrentLength = valueChunkLength;
+
+					while (valueCurrentLength < valueLength)
+					{
+						GetLEDValuesLowLevel(index, length, out valueLength, out valueChunkOffset, out valueChunkData);
+
+						valueOutOfSync = valueChunkOffset != valueCurrentLength;
+
+						if (valueOutOfSync) {
+							break;
+						}
+
+						valueChunkLength = Math.Min(valueLength - valueChunkOffset, 60);
+
+						Array.Copy(valueChunkData, 0, value, valueCurrentLength, valueChunkLength);
+
+						valueCurrentLength += valueChunkLength;
+					}
+				}
+
+				if (valueOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (valueChunkOffset + 60 < valueLength)
+					{
+						GetLEDValuesLowLevel(index, length, out valueLength, out valueChunkOffset, out valueChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Value is out-of-sync");
+				}
+			}
+
+			return value;
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFrameStartedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int length = LEConverter.UShortFrom(8, response);
+			var handler = FrameStartedCallback;
+
+			if (handler != null)
+			{
+				handler(this, length);
+			}
+		}
+	}
+}
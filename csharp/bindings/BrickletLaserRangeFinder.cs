@@ -0,0 +1,919 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Measures distance up to 40m with laser light
+	/// </summary>
+	public class BrickletLaserRangeFinder : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 255;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Laser Range Finder Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DISTANCE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VELOCITY = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DISTANCE_CALLBACK_PERIOD = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DISTANCE_CALLBACK_PERIOD = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VELOCITY_CALLBACK_PERIOD = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VELOCITY_CALLBACK_PERIOD = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DISTANCE_CALLBACK_THRESHOLD = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DISTANCE_CALLBACK_THRESHOLD = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VELOCITY_CALLBACK_THRESHOLD = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VELOCITY_CALLBACK_THRESHOLD = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DEBOUNCE_PERIOD = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DEBOUNCE_PERIOD = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MOVING_AVERAGE = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MOVING_AVERAGE = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MODE = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MODE = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_LASER = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_LASER = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_LASER_ENABLED = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SENSOR_HARDWARE_VERSION = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CONFIGURATION = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CONFIGURATION = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_DISTANCE = 20;
+
+		private const int CALLBACK_VELOCITY = 21;
+
+		private const int CALLBACK_DISTANCE_REACHED = 22;
+
+		private const int CALLBACK_VELOCITY_REACHED = 23;
+
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OFF = 'x';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OUTSIDE = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_INSIDE = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_SMALLER = '<';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_GREATER = '>';
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_DISTANCE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_VELOCITY_MAX_13MS = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_VELOCITY_MAX_32MS = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_VELOCITY_MAX_64MS = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_VELOCITY_MAX_127MS = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte VERSION_1 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte VERSION_3 = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletLaserRangeFinder.SetDistanceCallbackPeriod"/>. The parameter is the distance
+		///  value of the sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickletLaserRangeFinder.DistanceCallback"/> callback is only triggered if the distance value has changed
+		///  since the last triggering.
+		/// </summary>
+		public event DistanceEventHandler DistanceCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void DistanceEventHandler(BrickletLaserRangeFinder sender, int distance);
+
+		/// <summary>
+		/// </summary>
+		public event DistanceEventHandler Distance // for backward compatibility
+		{
+			add { DistanceCallback += value; }
+			remove { DistanceCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletLaserRangeFinder.SetVelocityCallbackPeriod"/>. The parameter is the velocity
+		///  value of the sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickletLaserRangeFinder.VelocityCallback"/> callback is only triggered if the velocity has changed since
+		///  the last triggering.
+		/// </summary>
+		public event VelocityEventHandler VelocityCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void VelocityEventHandler(BrickletLaserRangeFinder sender, short velocity);
+
+		/// <summary>
+		/// </summary>
+		public event VelocityEventHandler Velocity // for backward compatibility
+		{
+			add { VelocityCallback += value; }
+			remove { VelocityCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletLaserRangeFinder.SetDistanceCallbackThreshold"/> is reached.
+		///  The parameter is the distance value of the sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletLaserRangeFinder.SetDebouncePeriod"/>.
+		/// </summary>
+		public event DistanceReachedEventHandler DistanceReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void DistanceReachedEventHandler(BrickletLaserRangeFinder sender, int distance);
+
+		/// <summary>
+		/// </summary>
+		public event DistanceReachedEventHandler DistanceReached // for backward compatibility
+		{
+			add { DistanceReachedCallback += value; }
+			remove { DistanceReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletLaserRangeFinder.SetVelocityCallbackThreshold"/> is reached.
+		///  The parameter is the velocity value of the sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletLaserRangeFinder.SetDebouncePeriod"/>.
+		/// </summary>
+		public event VelocityReachedEventHandler VelocityReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void VelocityReachedEventHandler(BrickletLaserRangeFinder sender, short velocity);
+
+		/// <summary>
+		/// </summary>
+		public event VelocityReachedEventHandler VelocityReached // for backward compatibility
+		{
+			add { VelocityReachedCallback += value; }
+			remove { VelocityReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletLaserRangeFinder(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_DISTANCE] = new CallbackWrapper(OnDistanceCallback);
+			callbackWrappers[CALLBACK_VELOCITY] = new CallbackWrapper(OnVelocityCallback);
+			callbackWrappers[CALLBACK_DISTANCE_REACHED] = new CallbackWrapper(OnDistanceReachedCallback);
+			callbackWrappers[CALLBACK_VELOCITY_REACHED] = new CallbackWrapper(OnVelocityReachedCallback);
+
+
+			responseExpected[FUNCTION_GET_DISTANCE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_VELOCITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DISTANCE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DISTANCE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_VELOCITY_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_VELOCITY_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DISTANCE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DISTANCE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_VELOCITY_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_VELOCITY_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MOVING_AVERAGE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_MOVING_AVERAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_LASER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DISABLE_LASER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_IS_LASER_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SENSOR_HARDWARE_VERSION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the measured distance.
+		///  
+		///  Sensor hardware version 1 (see <see cref="Tinkerforge.BrickletLaserRangeFinder.GetSensorHardwareVersion"/>) cannot
+		///  measure distance and velocity at the same time. Therefore, the distance mode
+		///  has to be enabled using <see cref="Tinkerforge.BrickletLaserRangeFinder.SetMode"/>.
+		///  Sensor hardware version 3 can measure distance and velocity at the same
+		///  time. Also the laser has to be enabled, see <see cref="Tinkerforge.BrickletLaserRangeFinder.EnableLaser"/>.
+		///  
+		///  If you want to get the distance periodically, it is recommended to
+		///  use the <see cref="Tinkerforge.BrickletLaserRangeFinder.DistanceCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletLaserRangeFinder.SetDistanceCallbackPeriod"/>.
+		/// </summary>
+		public int GetDistance()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DISTANCE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the measured velocity.
+		///  
+		///  Sensor hardware version 1 (see <see cref="Tinkerforge.BrickletLaserRangeFinder.GetSensorHardwareVersion"/>) cannot
+		///  measure distance and velocity at the same time. Therefore, the velocity mode
+		///  has to be enabled using <see cref="Tinkerforge.BrickletLaserRangeFinder.SetMode"/>.
+		///  Sensor hardware version 3 can measure distance and velocity at the same
+		///  time, but the velocity measurement only produces stables results if a fixed
+		///  measurement rate (see <see cref="Tinkerforge.BrickletLaserRangeFinder.SetConfiguration"/>) is configured. Also the laser
+		///  has to be enabled, see <see cref="Tinkerforge.BrickletLaserRangeFinder.EnableLaser"/>.
+		///  
+		///  If you want to get the velocity periodically, it is recommended to
+		///  use the <see cref="Tinkerforge.BrickletLaserRangeFinder.VelocityCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletLaserRangeFinder.SetVelocityCallbackPeriod"/>.
+		/// </summary>
+		public short GetVelocity()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VELOCITY);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletLaserRangeFinder.DistanceCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletLaserRangeFinder.DistanceCallback"/> callback is only triggered if the distance value has
+		///  changed since the last triggering.
+		/// </summary>
+		public void SetDistanceCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DISTANCE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletLaserRangeFinder.SetDistanceCallbackPeriod"/>.
+		/// </summary>
+		public long GetDistanceCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DISTANCE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletLaserRangeFinder.VelocityCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletLaserRangeFinder.VelocityCallback"/> callback is only triggered if the velocity value has
+		///  changed since the last triggering.
+		/// </summary>
+		public void SetVelocityCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_VELOCITY_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletLaserRangeFinder.SetVelocityCallbackPeriod"/>.
+		/// </summary>
+		public long GetVelocityCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VELOCITY_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletLaserRangeFinder.DistanceReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the distance value is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the distance value is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the distance value is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the distance value is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetDistanceCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_DISTANCE_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((short)min, 9, request);
+			LEConverter.To((short)max, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletLaserRangeFinder.SetDistanceCallbackThreshold"/>.
+		/// </summary>
+		public void GetDistanceCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DISTANCE_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 13);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.UShortFrom(9, response);
+			max = LEConverter.UShortFrom(11, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletLaserRangeFinder.VelocityReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the velocity is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the velocity is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the velocity is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the velocity is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetVelocityCallbackThreshold(char option, short min, short max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_VELOCITY_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((short)min, 9, request);
+			LEConverter.To((short)max, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletLaserRangeFinder.SetVelocityCallbackThreshold"/>.
+		/// </summary>
+		public void GetVelocityCallbackThreshold(out char option, out short min, out short max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VELOCITY_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 13);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.ShortFrom(9, response);
+			max = LEConverter.ShortFrom(11, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the threshold callbacks
+		///  
+		///  * <see cref="Tinkerforge.BrickletLaserRangeFinder.DistanceReachedCallback"/>,
+		///  * <see cref="Tinkerforge.BrickletLaserRangeFinder.VelocityReachedCallback"/>,
+		///  
+		///  are triggered, if the thresholds
+		///  
+		///  * <see cref="Tinkerforge.BrickletLaserRangeFinder.SetDistanceCallbackThreshold"/>,
+		///  * <see cref="Tinkerforge.BrickletLaserRangeFinder.SetVelocityCallbackThreshold"/>,
+		///  
+		///  keep being reached.
+		/// </summary>
+		public void SetDebouncePeriod(long debounce)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DEBOUNCE_PERIOD);
+			LEConverter.To((int)debounce, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the debounce period as set by <see cref="Tinkerforge.BrickletLaserRangeFinder.SetDebouncePeriod"/>.
+		/// </summary>
+		public long GetDebouncePeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DEBOUNCE_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the length of a `moving averaging &lt;https://en.wikipedia.org/wiki/Moving_average&gt;`__
+		///  for the distance and velocity.
+		///  
+		///  Setting the length to 0 will turn the averaging completely off. With less
+		///  averaging, there is more noise on the data.
+		/// </summary>
+		public void SetMovingAverage(byte distanceAverageLength, byte velocityAverageLength)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_MOVING_AVERAGE);
+			LEConverter.To((byte)distanceAverageLength, 8, request);
+			LEConverter.To((byte)velocityAverageLength, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the length moving average as set by <see cref="Tinkerforge.BrickletLaserRangeFinder.SetMovingAverage"/>.
+		/// </summary>
+		public void GetMovingAverage(out byte distanceAverageLength, out byte velocityAverageLength)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MOVING_AVERAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			distanceAverageLength = LEConverter.ByteFrom(8, response);
+			velocityAverageLength = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  <note>
+		///   This function is only available if you have a LIDAR-Lite sensor with hardware
+		///   version 1. Use <see cref="Tinkerforge.BrickletLaserRangeFinder.SetConfiguration"/> for hardware version 3. You can check
+		///   the sensor hardware version using <see cref="Tinkerforge.BrickletLaserRangeFinder.GetSensorHardwareVersion"/>.
+		///  </note>
+		///  
+		///  The LIDAR-Lite sensor (hardware version 1) has five different modes. One mode is
+		///  for distance measurements and four modes are for velocity measurements with
+		///  different ranges.
+		///  
+		///  The following modes are available:
+		///  
+		///  * 0: Distance is measured with resolution 1.0 cm and range 0-4000 cm
+		///  * 1: Velocity is measured with resolution 0.1 m/s and range is 0-12.7 m/s
+		///  * 2: Velocity is measured with resolution 0.25 m/s and range is 0-31.75 m/s
+		///  * 3: Velocity is measured with resolution 0.5 m/s and range is 0-63.5 m/s
+		///  * 4: Velocity is measured with resolution 1.0 m/s and range is 0-127 m/s
+		/// </summary>
+		public void SetMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the mode as set by <see cref="Tinkerforge.BrickletLaserRangeFinder.SetMode"/>.
+		/// </summary>
+		public byte GetMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Activates the laser of the LIDAR.
+		///  
+		///  We recommend that you wait 250ms after enabling the laser before
+		///  the first call of <see cref="Tinkerforge.BrickletLaserRangeFinder.GetDistance"/> to ensure stable measurements.
+		/// </summary>
+		public void EnableLaser()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_LASER);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Deactivates the laser of the LIDAR.
+		/// </summary>
+		public void DisableLaser()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_LASER);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the laser is enabled, *false* otherwise.
+		/// </summary>
+		public bool IsLaserEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_LASER_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the LIDAR-Lite hardware version.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public byte GetSensorHardwareVersion()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SENSOR_HARDWARE_VERSION);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  <note>
+		///   This function is only available if you have a LIDAR-Lite sensor with hardware
+		///   version 3. Use <see cref="Tinkerforge.BrickletLaserRangeFinder.SetMode"/> for hardware version 1. You can check
+		///   the sensor hardware version using <see cref="Tinkerforge.BrickletLaserRangeFinder.GetSensorHardwareVersion"/>.
+		///  </note>
+		///  
+		///  The **Acquisition Count** defines the number of times the Laser Range Finder Bricklet
+		///  will integrate acquisitions to find a correlation record peak. With a higher count,
+		///  the Bricklet can measure longer distances. With a lower count, the rate increases. The
+		///  allowed values are 1-255.
+		///  
+		///  If you set **Enable Quick Termination** to true, the distance measurement will be terminated
+		///  early if a high peak was already detected. This means that a higher measurement rate can be achieved
+		///  and long distances can be measured at the same time. However, the chance of false-positive
+		///  distance measurements increases.
+		///  
+		///  Normally the distance is calculated with a detection algorithm that uses peak value,
+		///  signal strength and noise. You can however also define a fixed **Threshold Value**.
+		///  Set this to a low value if you want to measure the distance to something that has
+		///  very little reflection (e.g. glass) and set it to a high value if you want to measure
+		///  the distance to something with a very high reflection (e.g. mirror). Set this to 0 to
+		///  use the default algorithm. The other allowed values are 1-255.
+		///  
+		///  Set the **Measurement Frequency** to force a fixed measurement rate. If set to 0,
+		///  the Laser Range Finder Bricklet will use the optimal frequency according to the other
+		///  configurations and the actual measured distance. Since the rate is not fixed in this case,
+		///  the velocity measurement is not stable. For a stable velocity measurement you should
+		///  set a fixed measurement frequency. The lower the frequency, the higher is the resolution
+		///  of the calculated velocity. The allowed values are 10Hz-500Hz (and 0 to turn the fixed
+		///  frequency off).
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public void SetConfiguration(byte acquisitionCount, bool enableQuickTermination, byte thresholdValue, int measurementFrequency)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_CONFIGURATION);
+			LEConverter.To((byte)acquisitionCount, 8, request);
+			LEConverter.To((bool)enableQuickTermination, 9, request);
+			LEConverter.To((byte)thresholdValue, 10, request);
+			LEConverter.To((short)measurementFrequency, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletLaserRangeFinder.SetConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public void GetConfiguration(out byte acquisitionCount, out bool enableQuickTermination, out byte thresholdValue, out int measurementFrequency)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			acquisitionCount = LEConverter.ByteFrom(8, response);
+			enableQuickTermination = LEConverter.BoolFrom(9, response);
+			thresholdValue = LEConverter.ByteFrom(10, response);
+			measurementFrequency = LEConverter.UShortFrom(11, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnDistanceCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int distance = LEConverter.UShortFrom(8, response);
+			var handler = DistanceCallback;
+
+			if (handler != null)
+			{
+				handler(this, distance);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnVelocityCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short velocity = LEConverter.ShortFrom(8, response);
+			var handler = VelocityCallback;
+
+			if (handler != null)
+			{
+				handler(this, velocity);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnDistanceReachedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int distance = LEConverter.UShortFrom(8, response);
+			var handler = DistanceReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, distance);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnVelocityReachedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			short velocity = LEConverter.ShortFrom(8, response);
+			var handler = VelocityReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, velocity);
+			}
+		}
+	}
+}
@@ -0,0 +1,2029 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  NFC tag read/write, NFC P2P and Card Emulation
+	/// </summary>
+	public class BrickletNFC : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 286;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "NFC Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MODE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MODE = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READER_REQUEST_TAG_ID = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READER_GET_TAG_ID_LOW_LEVEL = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READER_GET_STATE = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READER_WRITE_NDEF_LOW_LEVEL = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READER_REQUEST_NDEF = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READER_READ_NDEF_LOW_LEVEL = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READER_AUTHENTICATE_MIFARE_CLASSIC_PAGE = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READER_WRITE_PAGE_LOW_LEVEL = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READER_REQUEST_PAGE = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READER_READ_PAGE_LOW_LEVEL = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CARDEMU_GET_STATE = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CARDEMU_START_DISCOVERY = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CARDEMU_WRITE_NDEF_LOW_LEVEL = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CARDEMU_START_TRANSFER = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_P2P_GET_STATE = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_P2P_START_DISCOVERY = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_P2P_WRITE_NDEF_LOW_LEVEL = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_P2P_START_TRANSFER = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_P2P_READ_NDEF_LOW_LEVEL = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DETECTION_LED_CONFIG = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DETECTION_LED_CONFIG = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MAXIMUM_TIMEOUT = 27;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MAXIMUM_TIMEOUT = 28;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_READER_STATE_CHANGED = 13;
+
+		private const int CALLBACK_CARDEMU_STATE_CHANGED = 18;
+
+		private const int CALLBACK_P2P_STATE_CHANGED = 24;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_CARDEMU = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_P2P = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_READER = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte TAG_TYPE_MIFARE_CLASSIC = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte TAG_TYPE_TYPE1 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte TAG_TYPE_TYPE2 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte TAG_TYPE_TYPE3 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte TAG_TYPE_TYPE4 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_INITIALIZATION = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_IDLE = 128;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_ERROR = 192;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_REQUEST_TAG_ID = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_REQUEST_TAG_ID_READY = 130;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_REQUEST_TAG_ID_ERROR = 194;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_AUTHENTICATE_MIFARE_CLASSIC_PAGE = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_AUTHENTICATE_MIFARE_CLASSIC_PAGE_READY = 131;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_AUTHENTICATE_MIFARE_CLASSIC_PAGE_ERROR = 195;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_WRITE_PAGE = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_WRITE_PAGE_READY = 132;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_WRITE_PAGE_ERROR = 196;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_REQUEST_PAGE = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_REQUEST_PAGE_READY = 133;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_REQUEST_PAGE_ERROR = 197;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_WRITE_NDEF = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_WRITE_NDEF_READY = 134;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_WRITE_NDEF_ERROR = 198;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_REQUEST_NDEF = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_REQUEST_NDEF_READY = 135;
+
+		/// <summary>
+		/// </summary>
+		public const byte READER_STATE_REQUEST_NDEF_ERROR = 199;
+
+		/// <summary>
+		/// </summary>
+		public const byte KEY_A = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte KEY_B = 1;
+
+		/// <summary>
+		/// </summary>
+		public const int READER_WRITE_TYPE4_CAPABILITY_CONTAINER = 3;
+
+		/// <summary>
+		/// </summary>
+		public const int READER_WRITE_TYPE4_NDEF = 4;
+
+		/// <summary>
+		/// </summary>
+		public const int READER_REQUEST_TYPE4_CAPABILITY_CONTAINER = 3;
+
+		/// <summary>
+		/// </summary>
+		public const int READER_REQUEST_TYPE4_NDEF = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte CARDEMU_STATE_INITIALIZATION = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CARDEMU_STATE_IDLE = 128;
+
+		/// <summary>
+		/// </summary>
+		public const byte CARDEMU_STATE_ERROR = 192;
+
+		/// <summary>
+		/// </summary>
+		public const byte CARDEMU_STATE_DISCOVER = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte CARDEMU_STATE_DISCOVER_READY = 130;
+
+		/// <summary>
+		/// </summary>
+		public const byte CARDEMU_STATE_DISCOVER_ERROR = 194;
+
+		/// <summary>
+		/// </summary>
+		public const byte CARDEMU_STATE_TRANSFER_NDEF = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte CARDEMU_STATE_TRANSFER_NDEF_READY = 131;
+
+		/// <summary>
+		/// </summary>
+		public const byte CARDEMU_STATE_TRANSFER_NDEF_ERROR = 195;
+
+		/// <summary>
+		/// </summary>
+		public const byte CARDEMU_TRANSFER_ABORT = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CARDEMU_TRANSFER_WRITE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_STATE_INITIALIZATION = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_STATE_IDLE = 128;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_STATE_ERROR = 192;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_STATE_DISCOVER = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_STATE_DISCOVER_READY = 130;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_STATE_DISCOVER_ERROR = 194;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_STATE_TRANSFER_NDEF = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_STATE_TRANSFER_NDEF_READY = 131;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_STATE_TRANSFER_NDEF_ERROR = 195;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_TRANSFER_ABORT = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_TRANSFER_WRITE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte P2P_TRANSFER_READ = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte DETECTION_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DETECTION_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte DETECTION_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte DETECTION_LED_CONFIG_SHOW_DETECTION = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is called if the reader state of the NFC Bricklet changes.
+		///  See <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/> for more information about the possible states.
+		/// </summary>
+		public event ReaderStateChangedEventHandler ReaderStateChangedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ReaderStateChangedEventHandler(BrickletNFC sender, byte state, bool idle);
+
+		/// <summary>
+		///  This callback is called if the cardemu state of the NFC Bricklet changes.
+		///  See <see cref="Tinkerforge.BrickletNFC.CardemuGetState"/> for more information about the possible states.
+		/// </summary>
+		public event CardemuStateChangedEventHandler CardemuStateChangedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void CardemuStateChangedEventHandler(BrickletNFC sender, byte state, bool idle);
+
+		/// <summary>
+		///  This callback is called if the P2P state of the NFC Bricklet changes.
+		///  See <see cref="Tinkerforge.BrickletNFC.P2PGetState"/> for more information about the possible states.
+		/// </summary>
+		public event P2PStateChangedEventHandler P2PStateChangedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void P2PStateChangedEventHandler(BrickletNFC sender, byte state, bool idle);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletNFC(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_READER_STATE_CHANGED] = new CallbackWrapper(OnReaderStateChangedCallback);
+			callbackWrappers[CALLBACK_CARDEMU_STATE_CHANGED] = new CallbackWrapper(OnCardemuStateChangedCallback);
+			callbackWrappers[CALLBACK_P2P_STATE_CHANGED] = new CallbackWrapper(OnP2PStateChangedCallback);
+
+
+			responseExpected[FUNCTION_SET_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READER_REQUEST_TAG_ID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READER_GET_TAG_ID_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READER_GET_STATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READER_WRITE_NDEF_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_READER_REQUEST_NDEF] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READER_READ_NDEF_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READER_AUTHENTICATE_MIFARE_CLASSIC_PAGE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READER_WRITE_PAGE_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_READER_REQUEST_PAGE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READER_READ_PAGE_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_CARDEMU_GET_STATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_CARDEMU_START_DISCOVERY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_CARDEMU_WRITE_NDEF_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_CARDEMU_START_TRANSFER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_P2P_GET_STATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_P2P_START_DISCOVERY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_P2P_WRITE_NDEF_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_P2P_START_TRANSFER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_P2P_READ_NDEF_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DETECTION_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_DETECTION_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MAXIMUM_TIMEOUT] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_MAXIMUM_TIMEOUT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Sets the mode. The NFC Bricklet supports four modes:
+		///  
+		///  * Off
+		///  * Card Emulation (Cardemu): Emulates a tag for other readers
+		///  * Peer to Peer (P2P): Exchange data with other readers
+		///  * Reader: Reads and writes tags
+		///  
+		///  If you change a mode, the Bricklet will reconfigure the hardware for this mode.
+		///  Therefore, you can only use functions corresponding to the current mode. For
+		///  example, in Reader mode you can only use Reader functions.
+		/// </summary>
+		public void SetMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the mode as set by <see cref="Tinkerforge.BrickletNFC.SetMode"/>.
+		/// </summary>
+		public byte GetMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  After you call <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/> the NFC Bricklet will try to read
+		///  the tag ID from the tag. After this process is done the state will change.
+		///  You can either register the <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback or you can poll
+		///  <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/> to find out about the state change.
+		///  
+		///  If the state changes to *ReaderRequestTagIDError* it means that either there was
+		///  no tag present or that the tag has an incompatible type. If the state
+		///  changes to *ReaderRequestTagIDReady* it means that a compatible tag was found
+		///  and that the tag ID has been saved. You can now read out the tag ID by
+		///  calling <see cref="Tinkerforge.BrickletNFC.ReaderGetTagID"/>.
+		///  
+		///  If two tags are in the proximity of the NFC Bricklet, this
+		///  function will cycle through the tags. To select a specific tag you have
+		///  to call <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/> until the correct tag ID is found.
+		///  
+		///  In case of any *ReaderError* state the selection is lost and you have to
+		///  start again by calling <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>.
+		/// </summary>
+		public void ReaderRequestTagID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READER_REQUEST_TAG_ID);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the tag type and the tag ID. This function can only be called if the
+		///  NFC Bricklet is currently in one of the *ReaderReady* states. The returned tag ID
+		///  is the tag ID that was saved through the last call of <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>.
+		///  
+		///  To get the tag ID of a tag the approach is as follows:
+		///  
+		///  1. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>
+		///  2. Wait for state to change to *ReaderRequestTagIDReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/> or
+		///     <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  3. Call <see cref="Tinkerforge.BrickletNFC.ReaderGetTagID"/>
+		/// </summary>
+		public void ReaderGetTagIDLowLevel(out byte tagType, out byte tagIDLength, out byte[] tagIDData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READER_GET_TAG_ID_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 42);
+
+			tagType = LEConverter.ByteFrom(8, response);
+			tagIDLength = LEConverter.ByteFrom(9, response);
+			tagIDData = LEConverter.ByteArrayFrom(10, response, 32);
+		}
+
+		/// <summary>
+		///  Returns the current reader state of the NFC Bricklet.
+		///  
+		///  On startup the Bricklet will be in the *ReaderInitialization* state. The
+		///  initialization will only take about 20ms. After that it changes to *ReaderIdle*.
+		///  
+		///  The Bricklet is also reinitialized if the mode is changed, see <see cref="Tinkerforge.BrickletNFC.SetMode"/>.
+		///  
+		///  The functions of this Bricklet can be called in the *ReaderIdle* state and all of
+		///  the *ReaderReady* and *ReaderError* states.
+		///  
+		///  Example: If you call <see cref="Tinkerforge.BrickletNFC.ReaderRequestPage"/>, the state will change to
+		///  *ReaderRequestPage* until the reading of the page is finished. Then it will change
+		///  to either *ReaderRequestPageReady* if it worked or to *ReaderRequestPageError* if it
+		///  didn't. If the request worked you can get the page by calling <see cref="Tinkerforge.BrickletNFC.ReaderReadPage"/>.
+		///  
+		///  The same approach is used analogously for the other API functions.
+		/// </summary>
+		public void ReaderGetState(out byte state, out bool idle)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READER_GET_STATE);
+
+			byte[] response = SendRequest(request, 10);
+
+			state = LEConverter.ByteFrom(8, response);
+			idle = LEConverter.BoolFrom(9, response);
+		}
+
+		/// <summary>
+		///  Writes NDEF formated data.
+		///  
+		///  This function currently supports NFC Forum Type 2 and 4.
+		///  
+		///  The general approach for writing a NDEF message is as follows:
+		///  
+		///  1. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>
+		///  2. Wait for state to change to *ReaderRequestTagIDReady* (see
+		///     <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/> or <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  3. If looking for a specific tag then call <see cref="Tinkerforge.BrickletNFC.ReaderGetTagID"/> and check
+		///     if the expected tag was found, if it was not found got back to step 1
+		///  4. Call <see cref="Tinkerforge.BrickletNFC.ReaderWriteNDEF"/> with the NDEF message that you want to write
+		///  5. Wait for state to change to *ReaderWriteNDEFReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/>
+		///     or <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		/// </summary>
+		public void ReaderWriteNDEFLowLevel(int ndefLength, int ndefChunkOffset, byte[] ndefChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_READER_WRITE_NDEF_LOW_LEVEL);
+			LEConverter.To((short)ndefLength, 8, request);
+			LEConverter.To((short)ndefChunkOffset, 10, request);
+			LEConverter.To((byte[])ndefChunkData, 12, 60, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Reads NDEF formated data from a tag.
+		///  
+		///  This function currently supports NFC Forum Type 1, 2, 3 and 4.
+		///  
+		///  The general approach for reading a NDEF message is as follows:
+		///  
+		///  1. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>
+		///  2. Wait for state to change to *RequestTagIDReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/>
+		///     or <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  3. If looking for a specific tag then call <see cref="Tinkerforge.BrickletNFC.ReaderGetTagID"/> and check if the
+		///     expected tag was found, if it was not found got back to step 1
+		///  4. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestNDEF"/>
+		///  5. Wait for state to change to *ReaderRequestNDEFReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/>
+		///     or <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  6. Call <see cref="Tinkerforge.BrickletNFC.ReaderReadNDEF"/> to retrieve the NDEF message from the buffer
+		/// </summary>
+		public void ReaderRequestNDEF()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READER_REQUEST_NDEF);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the NDEF data from an internal buffer. To fill the buffer
+		///  with a NDEF message you have to call <see cref="Tinkerforge.BrickletNFC.ReaderRequestNDEF"/> beforehand.
+		/// </summary>
+		public void ReaderReadNDEFLowLevel(out int ndefLength, out int ndefChunkOffset, out byte[] ndefChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READER_READ_NDEF_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			ndefLength = LEConverter.UShortFrom(8, response);
+			ndefChunkOffset = LEConverter.UShortFrom(10, response);
+			ndefChunkData = LEConverter.ByteArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  Mifare Classic tags use authentication. If you want to read from or write to
+		///  a Mifare Classic page you have to authenticate it beforehand.
+		///  Each page can be authenticated with two keys: A (``key_number`` = 0) and B
+		///  (``key_number`` = 1). A new Mifare Classic
+		///  tag that has not yet been written to can be accessed with key A
+		///  and the default key ``[0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF]``.
+		///  
+		///  The approach to read or write a Mifare Classic page is as follows:
+		///  
+		///  1. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>
+		///  2. Wait for state to change to *ReaderRequestTagIDReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/>
+		///     or <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  3. If looking for a specific tag then call <see cref="Tinkerforge.BrickletNFC.ReaderGetTagID"/> and check if the
+		///     expected tag was found, if it was not found got back to step 1
+		///  4. Call <see cref="Tinkerforge.BrickletNFC.ReaderAuthenticateMifareClassicPage"/> with page and key for the page
+		///  5. Wait for state to change to *ReaderAuthenticatingMifareClassicPageReady* (see
+		///     <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/> or <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  6. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestPage"/> or <see cref="Tinkerforge.BrickletNFC.ReaderWritePage"/> to read/write page
+		///  
+		///  The authentication will always work for one whole sector (4 pages).
+		/// </summary>
+		public void ReaderAuthenticateMifareClassicPage(int page, byte keyNumber, byte[] key)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_READER_AUTHENTICATE_MIFARE_CLASSIC_PAGE);
+			LEConverter.To((short)page, 8, request);
+			LEConverter.To((byte)keyNumber, 10, request);
+			LEConverter.To((byte[])key, 11, 6, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a maximum of 8192 bytes starting from the given page. How many pages are written
+		///  depends on the tag type. The page sizes are as follows:
+		///  
+		///  * Mifare Classic page size: 16 byte
+		///  * NFC Forum Type 1 page size: 8 byte
+		///  * NFC Forum Type 2 page size: 4 byte
+		///  * NFC Forum Type 3 page size: 16 byte
+		///  * NFC Forum Type 4: No pages, page = file selection (CC or NDEF, see below)
+		///  
+		///  The general approach for writing to a tag is as follows:
+		///  
+		///  1. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>
+		///  2. Wait for state to change to *ReaderRequestTagIDReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/> or
+		///     <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  3. If looking for a specific tag then call <see cref="Tinkerforge.BrickletNFC.ReaderGetTagID"/> and check if the
+		///     expected tag was found, if it was not found got back to step 1
+		///  4. Call <see cref="Tinkerforge.BrickletNFC.ReaderWritePage"/> with page number and data
+		///  5. Wait for state to change to *ReaderWritePageReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/> or
+		///     <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  
+		///  If you use a Mifare Classic tag you have to authenticate a page before you
+		///  can write to it. See <see cref="Tinkerforge.BrickletNFC.ReaderAuthenticateMifareClassicPage"/>.
+		///  
+		///  NFC Forum Type 4 tags are not organized into pages but different files. We currently
+		///  support two files: Capability Container file (CC) and NDEF file.
+		///  
+		///  Choose CC by setting page to 3 or NDEF by setting page to 4.
+		/// </summary>
+		public void ReaderWritePageLowLevel(int page, int dataLength, int dataChunkOffset, byte[] dataChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_READER_WRITE_PAGE_LOW_LEVEL);
+			LEConverter.To((short)page, 8, request);
+			LEConverter.To((short)dataLength, 10, request);
+			LEConverter.To((short)dataChunkOffset, 12, request);
+			LEConverter.To((byte[])dataChunkData, 14, 58, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Reads a maximum of 8192 bytes starting from the given page and stores them into a buffer.
+		///  The buffer can then be read out with <see cref="Tinkerforge.BrickletNFC.ReaderReadPage"/>.
+		///  How many pages are read depends on the tag type. The page sizes are
+		///  as follows:
+		///  
+		///  * Mifare Classic page size: 16 byte
+		///  * NFC Forum Type 1 page size: 8 byte
+		///  * NFC Forum Type 2 page size: 4 byte
+		///  * NFC Forum Type 3 page size: 16 byte
+		///  * NFC Forum Type 4: No pages, page = file selection (CC or NDEF, see below)
+		///  
+		///  The general approach for reading a tag is as follows:
+		///  
+		///  1. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>
+		///  2. Wait for state to change to *RequestTagIDReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/>
+		///     or <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  3. If looking for a specific tag then call <see cref="Tinkerforge.BrickletNFC.ReaderGetTagID"/> and check if the
+		///     expected tag was found, if it was not found got back to step 1
+		///  4. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestPage"/> with page number
+		///  5. Wait for state to change to *ReaderRequestPageReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/>
+		///     or <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  6. Call <see cref="Tinkerforge.BrickletNFC.ReaderReadPage"/> to retrieve the page from the buffer
+		///  
+		///  If you use a Mifare Classic tag you have to authenticate a page before you
+		///  can read it. See <see cref="Tinkerforge.BrickletNFC.ReaderAuthenticateMifareClassicPage"/>.
+		///  
+		///  NFC Forum Type 4 tags are not organized into pages but different files. We currently
+		///  support two files: Capability Container file (CC) and NDEF file.
+		///  
+		///  Choose CC by setting page to 3 or NDEF by setting page to 4.
+		/// </summary>
+		public void ReaderRequestPage(int page, int length)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_READER_REQUEST_PAGE);
+			LEConverter.To((short)page, 8, request);
+			LEConverter.To((short)length, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the page data from an internal buffer. To fill the buffer
+		///  with specific pages you have to call <see cref="Tinkerforge.BrickletNFC.ReaderRequestPage"/> beforehand.
+		/// </summary>
+		public void ReaderReadPageLowLevel(out int dataLength, out int dataChunkOffset, out byte[] dataChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READER_READ_PAGE_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			dataLength = LEConverter.UShortFrom(8, response);
+			dataChunkOffset = LEConverter.UShortFrom(10, response);
+			dataChunkData = LEConverter.ByteArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  Returns the current cardemu state of the NFC Bricklet.
+		///  
+		///  On startup the Bricklet will be in the *CardemuInitialization* state. The
+		///  initialization will only take about 20ms. After that it changes to *CardemuIdle*.
+		///  
+		///  The Bricklet is also reinitialized if the mode is changed, see <see cref="Tinkerforge.BrickletNFC.SetMode"/>.
+		///  
+		///  The functions of this Bricklet can be called in the *CardemuIdle* state and all of
+		///  the *CardemuReady* and *CardemuError* states.
+		///  
+		///  Example: If you call <see cref="Tinkerforge.BrickletNFC.CardemuStartDiscovery"/>, the state will change to
+		///  *CardemuDiscover* until the discovery is finished. Then it will change
+		///  to either *CardemuDiscoverReady* if it worked or to *CardemuDiscoverError* if it
+		///  didn't.
+		///  
+		///  The same approach is used analogously for the other API functions.
+		/// </summary>
+		public void CardemuGetState(out byte state, out bool idle)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_CARDEMU_GET_STATE);
+
+			byte[] response = SendRequest(request, 10);
+
+			state = LEConverter.ByteFrom(8, response);
+			idle = LEConverter.BoolFrom(9, response);
+		}
+
+		/// <summary>
+		///  Starts the discovery process. If you call this function while a NFC
+		///  reader device is near to the NFC Bricklet the state will change from
+		///  *CardemuDiscovery* to *CardemuDiscoveryReady*.
+		///  
+		///  If no NFC reader device can be found or if there is an error during
+		///  discovery the cardemu state will change to *CardemuDiscoveryError*. In this case you
+		///  have to restart the discovery process.
+		///  
+		///  If the cardemu state changes to *CardemuDiscoveryReady* you can start the NDEF message
+		///  transfer with <see cref="Tinkerforge.BrickletNFC.CardemuWriteNDEF"/> and <see cref="Tinkerforge.BrickletNFC.CardemuStartTransfer"/>.
+		/// </summary>
+		public void CardemuStartDiscovery()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_CARDEMU_START_DISCOVERY);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes the NDEF message that is to be transferred to the NFC peer.
+		///  
+		///  The maximum supported NDEF message size in Cardemu mode is 255 byte.
+		///  
+		///  You can call this function at any time in Cardemu mode. The internal buffer
+		///  will not be overwritten until you call this function again or change the
+		///  mode.
+		/// </summary>
+		public void CardemuWriteNDEFLowLevel(int ndefLength, int ndefChunkOffset, byte[] ndefChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_CARDEMU_WRITE_NDEF_LOW_LEVEL);
+			LEConverter.To((short)ndefLength, 8, request);
+			LEConverter.To((short)ndefChunkOffset, 10, request);
+			LEConverter.To((byte[])ndefChunkData, 12, 60, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  You can start the transfer of a NDEF message if the cardemu state is *CardemuDiscoveryReady*.
+		///  
+		///  Before you call this function to start a write transfer, the NDEF message that
+		///  is to be transferred has to be written via <see cref="Tinkerforge.BrickletNFC.CardemuWriteNDEF"/> first.
+		///  
+		///  After you call this function the state will change to *CardemuTransferNDEF*. It will
+		///  change to *CardemuTransferNDEFReady* if the transfer was successful or
+		///  *CardemuTransferNDEFError* if it wasn't.
+		/// </summary>
+		public void CardemuStartTransfer(byte transfer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_CARDEMU_START_TRANSFER);
+			LEConverter.To((byte)transfer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current P2P state of the NFC Bricklet.
+		///  
+		///  On startup the Bricklet will be in the *P2PInitialization* state. The
+		///  initialization will only take about 20ms. After that it changes to *P2PIdle*.
+		///  
+		///  The Bricklet is also reinitialized if the mode is changed, see <see cref="Tinkerforge.BrickletNFC.SetMode"/>.
+		///  
+		///  The functions of this Bricklet can be called in the *P2PIdle* state and all of
+		///  the *P2PReady* and *P2PError* states.
+		///  
+		///  Example: If you call <see cref="Tinkerforge.BrickletNFC.P2PStartDiscovery"/>, the state will change to
+		///  *P2PDiscover* until the discovery is finished. Then it will change
+		///  to either P2PDiscoverReady* if it worked or to *P2PDiscoverError* if it
+		///  didn't.
+		///  
+		///  The same approach is used analogously for the other API functions.
+		/// </summary>
+		public void P2PGetState(out byte state, out bool idle)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_P2P_GET_STATE);
+
+			byte[] response = SendRequest(request, 10);
+
+			state = LEConverter.ByteFrom(8, response);
+			idle = LEConverter.BoolFrom(9, response);
+		}
+
+		/// <summary>
+		///  Starts the discovery process. If you call this function while another NFC
+		///  P2P enabled device is near to the NFC Bricklet the state will change from
+		///  *P2PDiscovery* to *P2PDiscoveryReady*.
+		///  
+		///  If no NFC P2P enabled device can be found or if there is an error during
+		///  discovery the P2P state will change to *P2PDiscoveryError*. In this case you
+		///  have to restart the discovery process.
+		///  
+		///  If the P2P state changes to *P2PDiscoveryReady* you can start the NDEF message
+		///  transfer with <see cref="Tinkerforge.BrickletNFC.P2PStartTransfer"/>.
+		/// </summary>
+		public void P2PStartDiscovery()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_P2P_START_DISCOVERY);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes the NDEF message that is to be transferred to the NFC peer.
+		///  
+		///  The maximum supported NDEF message size for P2P transfer is 255 byte.
+		///  
+		///  You can call this function at any time in P2P mode. The internal buffer
+		///  will not be overwritten until you call this function again, change the
+		///  mode or use P2P to read an NDEF messages.
+		/// </summary>
+		public void P2PWriteNDEFLowLevel(int ndefLength, int ndefChunkOffset, byte[] ndefChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_P2P_WRITE_NDEF_LOW_LEVEL);
+			LEConverter.To((short)ndefLength, 8, request);
+			LEConverter.To((short)ndefChunkOffset, 10, request);
+			LEConverter.To((byte[])ndefChunkData, 12, 60, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  You can start the transfer of a NDEF message if the P2P state is *P2PDiscoveryReady*.
+		///  
+		///  Before you call this function to start a write transfer, the NDEF message that
+		///  is to be transferred has to be written via <see cref="Tinkerforge.BrickletNFC.P2PWriteNDEF"/> first.
+		///  
+		///  After you call this function the P2P state will change to *P2PTransferNDEF*. It will
+		///  change to *P2PTransferNDEFReady* if the transfer was successfull or
+		///  *P2PTransferNDEFError* if it wasn't.
+		///  
+		///  If you started a write transfer you are now done. If you started a read transfer
+		///  you can now use <see cref="Tinkerforge.BrickletNFC.P2PReadNDEF"/> to read the NDEF message that was written
+		///  by the NFC peer.
+		/// </summary>
+		public void P2PStartTransfer(byte transfer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_P2P_START_TRANSFER);
+			LEConverter.To((byte)transfer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the NDEF message that was written by a NFC peer in NFC P2P mode.
+		///  
+		///  The NDEF message is ready if you called <see cref="Tinkerforge.BrickletNFC.P2PStartTransfer"/> with a
+		///  read transfer and the P2P state changed to *P2PTransferNDEFReady*.
+		/// </summary>
+		public void P2PReadNDEFLowLevel(out int ndefLength, out int ndefChunkOffset, out byte[] ndefChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_P2P_READ_NDEF_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			ndefLength = LEConverter.UShortFrom(8, response);
+			ndefChunkOffset = LEConverter.UShortFrom(10, response);
+			ndefChunkData = LEConverter.ByteArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  Sets the detection LED configuration. By default the LED shows
+		///  if a card/reader is detected.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is off.
+		/// </summary>
+		public void SetDetectionLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_DETECTION_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletNFC.SetDetectionLEDConfig"/>
+		/// </summary>
+		public byte GetDetectionLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DETECTION_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the maximum timeout.
+		///  
+		///  This is a global maximum used for all internal state timeouts. The timeouts depend heavily
+		///  on the used tags etc. For example: If you use a Type 2 tag and you want to detect if
+		///  it is present, you have to use <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/> and wait for the state
+		///  to change to either the error state or the ready state.
+		///  
+		///  With the default configuration this takes 2-3 seconds. By setting the maximum timeout to
+		///  100ms you can reduce this time to ~150-200ms. For Type 2 this would also still work
+		///  with a 20ms timeout (a Type 2 tag answers usually within 10ms). A type 4 tag can take
+		///  up to 500ms in our tests.
+		///  
+		///  If you need a fast response time to discover if a tag is present or not you can find
+		///  a good timeout value by trial and error for your specific tag.
+		///  
+		///  By default we use a very conservative timeout, to be sure that any tag can always
+		///  answer in time.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Plugin)
+		/// </summary>
+		public void SetMaximumTimeout(int timeout)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_MAXIMUM_TIMEOUT);
+			LEConverter.To((short)timeout, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the timeout as set by <see cref="Tinkerforge.BrickletNFC.SetMaximumTimeout"/>
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Plugin)
+		/// </summary>
+		public int GetMaximumTimeout()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MAXIMUM_TIMEOUT);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletNFC.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletNFC.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletNFC.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletNFC.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Returns the tag type and the tag ID. This function can only be called if the
+		///  NFC Bricklet is currently in one of the *ReaderReady* states. The returned tag ID
+		///  is the tag ID that was saved through the last call of <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>.
+		///  
+		///  To get the tag ID of a tag the approach is as follows:
+		///  
+		///  1. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>
+		///  2. Wait for state to change to *ReaderRequestTagIDReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/> or
+		///     <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  3. Call <see cref="Tinkerforge.BrickletNFC.ReaderGetTagID"/>
+		/// </summary>
+		public void ReaderGetTagID(out byte tagType, out byte[] tagID)
+		{
+			byte tagIDLength;
+			byte[] tagIDData = new byte[32];
+
+			ReaderGetTagIDLowLevel(out tagType, out tagIDLength, out tagIDData);
+
+			tagID = new byte[tagIDLength];
+
+			Array.Copy(tagIDData, tagID, tagIDLength);
+		}
+
+		/// <summary>
+		///  Writes NDEF formated data.
+		///  
+		///  This function currently supports NFC Forum Type 2 and 4.
+		///  
+		///  The general approach for writing a NDEF message is as follows:
+		///  
+		///  1. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>
+		///  2. Wait for state to change to *ReaderRequestTagIDReady* (see
+		///     <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/> or <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  3. If looking for a specific tag then call <see cref="Tinkerforge.BrickletNFC.ReaderGetTagID"/> and check
+		///     if the expected tag was found, if it was not found got back to step 1
+		///  4. Call <see cref="Tinkerforge.BrickletNFC.ReaderWriteNDEF"/> with the NDEF message that you want to write
+		///  5. Wait for state to change to *ReaderWriteNDEFReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/>
+		///     or <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		/// </summary>
+		public void ReaderWriteNDEF(byte[] ndef)
+		{
+			if (ndef.Length > 65535)
+			{
+				throw new ArgumentException("NDEF can be at most 65535 items long");
+			}
+
+			int ndefLength = ndef.Length;
+			int ndefChunkOffset = 0;
+			byte[] ndefChunkData = new byte[60];
+			int ndefChunkLength;
+
+			if (ndefLength == 0)
+			{
+				Array.Clear(ndefChunkData, 0, 60);
+
+				ReaderWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (ndefChunkOffset < ndefLength)
+					{
+						ndefChunkLength = Math.Min(ndefLength - ndefChunkOffset, 60);
+
+						Array.Copy(ndef, ndefChunkOffset, ndefChunkData, 0, ndefChunkLength);
+						Array.Clear(ndefChunkData, ndefChunkLength, 60 - ndefChunkLength);
+
+						ReaderWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+
+						ndefChunkOffset += 60;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  Returns the NDEF data from an internal buffer. To fill the buffer
+		///  with a NDEF message you have to call <see cref="Tinkerforge.BrickletNFC.ReaderRequestNDEF"/> beforehand.
+		/// </summary>
+		public byte[] ReaderReadNDEF()
+		{
+			byte[] ndef = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int ndefLength = 0;
+			int ndefChunkOffset;
+			byte[] ndefChunkData = new byte[60];
+			int ndefChunkLength;
+			bool ndefOutOfSync;
+			int ndefCurrentLength;
+
+			lock (streamLock)
+			{
+				ReaderReadNDEFLowLevel(out ndefLength, out ndefChunkOffset, out ndefChunkData);
+
+				ndefOutOfSync = ndefChunkOffset != 0;
+
+				if (!ndefOutOfSync) {
+					ndef = new byte[ndefLength];
+					ndefChunkLength = Math.Min(ndefLength - ndefChunkOffset, 60);
+
+					Array.Copy(ndefChunkData, ndef, ndefChunkLength);
+
+					ndefCurrentLength = ndefChunkLength;
+
+					while (ndefCurrentLength < ndefLength)
+					{
+						ReaderReadNDEFLowLevel(out ndefLength, out ndefChunkOffset, out ndefChunkData);
+
+						ndefOutOfSync = ndefChunkOffset != ndefCurrentLength;
+
+						if (ndefOutOfSync) {
+							break;
+						}
+
+						ndefChunkLength = Math.Min(ndefLength - ndefChunkOffset, 60);
+
+						Array.Copy(ndefChunkData, 0, ndef, ndefCurrentLength, ndefChunkLength);
+
+						ndefCurrentLength += ndefChunkLength;
+					}
+				}
+
+				if (ndefOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (ndefChunkOffset + 60 < ndefLength)
+					{
+						ReaderReadNDEFLowLevel(out ndefLength, out ndefChunkOffset, out ndefChunkData);
+					}
+
+					throw new StreamOutOfSyncException("NDEF is out-of-sync");
+				}
+			}
+
+			return ndef;
+		}
+
+		/// <summary>
+		///  Writes a maximum of 8192 bytes starting from the given page. How many pages are written
+		///  depends on the tag type. The page sizes are as follows:
+		///  
+		///  * Mifare Classic page size: 16 byte
+		///  * NFC Forum Type 1 page size: 8 byte
+		///  * NFC Forum Type 2 page size: 4 byte
+		///  * NFC Forum Type 3 page size: 16 byte
+		///  * NFC Forum Type 4: No pages, page = file selection (CC or NDEF, see below)
+		///  
+		///  The general approach for writing to a tag is as follows:
+		///  
+		///  1. Call <see cref="Tinkerforge.BrickletNFC.ReaderRequestTagID"/>
+		///  2. Wait for state to change to *ReaderRequestTagIDReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/> or
+		///     <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  3. If looking for a specific tag then call <see cref="Tinkerforge.BrickletNFC.ReaderGetTagID"/> and check if the
+		///     expected tag was found, if it was not found got back to step 1
+		///  4. Call <see cref="Tinkerforge.BrickletNFC.ReaderWritePage"/> with page number and data
+		///  5. Wait for state to change to *ReaderWritePageReady* (see <see cref="Tinkerforge.BrickletNFC.ReaderGetState"/> or
+		///     <see cref="Tinkerforge.BrickletNFC.ReaderStateChangedCallback"/> callback)
+		///  
+		///  If you use a Mifare Classic tag you have to authenticate a page before you
+		///  can write to it. See <see cref="Tinkerforge.BrickletNFC.ReaderAuthenticateMifareClassicPage"/>.
+		///  
+		///  NFC Forum Type 4 tags are not organized into pages but different files. We currently
+		///  support two files: Capability Container file (CC) and NDEF file.
+		///  
+		///  Choose CC by setting page to 3 or NDEF by setting page to 4.
+		/// </summary>
+		public void ReaderWritePage(int page, byte[] data)
+		{
+			if (data.Length > 65535)
+			{
+				throw new ArgumentException("Data can be at most 65535 items long");
+			}
+
+			int dataLength = data.Length;
+			int dataChunkOffset = 0;
+			byte[] dataChunkData = new byte[58];
+			int dataChunkLength;
+
+			if (dataLength == 0)
+			{
+				Array.Clear(dataChunkData, 0, 58);
+
+				ReaderWritePageLowLevel(page, dataLength, dataChunkOffset, dataChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (dataChunkOffset < dataLength)
+					{
+						dataChunkLength = Math.Min(dataLength - dataChunkOffset, 58);
+
+						Array.Copy(data, dataChunkOffset, dataChunkData, 0, dataChunkLength);
+						Array.Clear(dataChunkData, dataChunkLength, 58 - dataChunkLength);
+
+						ReaderWritePageLowLevel(page, dataLength, dataChunkOffset, dataChunkData);
+
+						dataChunkOffset += 58;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  Returns the page data from an internal buffer. To fill the buffer
+		///  with specific pages you have to call <see cref="Tinkerforge.BrickletNFC.ReaderRequestPage"/> beforehand.
+		/// </summary>
+		public byte[] ReaderReadPage()
+		{
+			byte[] data = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int dataLength = 0;
+			int dataChunkOffset;
+			byte[] dataChunkData = new byte[60];
+			int dataChunkLength;
+			bool dataOutOfSync;
+			int dataCurrentLength;
+
+			lock (streamLock)
+			{
+				ReaderReadPageLowLevel(out dataLength, out dataChunkOffset, out dataChunkData);
+
+				dataOutOfSync = dataChunkOffset != 0;
+
+				if (!dataOutOfSync) {
+					data = new byte[dataLength];
+					dataChunkLength = Math.Min(dataLength - dataChunkOffset, 60);
+
+					Array.Copy(dataChunkData, data, dataChunkLength);
+
+					dataCurrentLength = dataChunkLength;
+
+					while (dataCurrentLength < dataLength)
+					{
+						ReaderReadPageLowLevel(out dataLength, out dataChunkOffset, out dataChunkData);
+
+						dataOutOfSync = dataChunkOffset != dataCurrentLength;
+
+						if (dataOutOfSync) {
+							break;
+						}
+
+						dataChunkLength = Math.Min(dataLength - dataChunkOffset, 60);
+
+						Array.Copy(dataChunkData, 0, data, dataCurrentLength, dataChunkLength);
+
+						dataCurrentLength += dataChunkLength;
+					}
+				}
+
+				if (dataOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (dataChunkOffset + 60 < dataLength)
+					{
+						ReaderReadPageLowLevel(out dataLength, out dataChunkOffset, out dataChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Data is out-of-sync");
+				}
+			}
+
+			return data;
+		}
+
+		/// <summary>
+		///  Writes the NDEF message that is to be transferred to the NFC peer.
+		///  
+		///  The maximum supported NDEF message size in Cardemu mode is 255 byte.
+		///  
+		///  You can call this function at any time in Cardemu mode. The internal buffer
+		///  will not be overwritten until you call this function again or change the
+		///  mode.
+		/// </summary>
+		public void CardemuWriteNDEF(byte[] ndef)
+		{
+			if (ndef.Length > 65535)
+			{
+				throw new ArgumentException("NDEF can be at most 65535 items long");
+			}
+
+			int ndefLength = ndef.Length;
+			int ndefChunkOffset = 0;
+			byte[] ndefChunkData = new byte[60];
+			int ndefChunkLength;
+
+			if (ndefLength == 0)
+			{
+				Array.Clear(ndefChunkData, 0, 60);
+
+				CardemuWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (ndefChunkOffset < ndefLength)
+					{
+						ndefChunkLength = Math.Min(ndefLength - ndefChunkOffset, 60);
+
+						Array.Copy(ndef, ndefChunkOffset, ndefChunkData, 0, ndefChunkLength);
+						Array.Clear(ndefChunkData, ndefChunkLength, 60 - ndefChunkLength);
+
+						CardemuWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+
+						ndefChunkOffset += 60;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  Writes the NDEF message that is to be transferred to the NFC peer.
+		///  
+		///  The maximum supported NDEF message size for P2P transfer is 255 byte.
+		///  
+		///  You can call this function at any time in P2P mode. The internal buffer
+		///  will not be overwritten until you call this function again, change the
+		///  mode or use P2P to read an NDEF messages.
+		/// </summary>
+		public void P2PWriteNDEF(byte[] ndef)
+		{
+			if (ndef.Length > 65535)
+			{
+				throw new ArgumentException("NDEF can be at most 65535 items long");
+			}
+
+			int ndefLength = ndef.Length;
+			int ndefChunkOffset = 0;
+			byte[] ndefChunkData = new byte[60];
+			int ndefChunkLength;
+
+			if (ndefLength == 0)
+			{
+				Array.Clear(ndefChunkData, 0, 60);
+
+				P2PWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (ndefChunkOffset < ndefLength)
+					{
+						ndefChunkLength = Math.Min(ndefLength - ndefChunkOffset, 60);
+
+						Array.Copy(ndef, ndefChunkOffset, ndefChunkData, 0, ndefChunkLength);
+						Array.Clear(ndefChunkData, ndefChunkLength, 60 - ndefChunkLength);
+
+						P2PWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+
+						ndefChunkOffset += 60;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  Returns the NDEF message that was written by a NFC peer in NFC P2P mode.
+		///  
+		///  The NDEF message is ready if you called <see cref="Tinkerforge.BrickletNFC.P2PStartTransfer"/> with a
+		///  read transfer and the P2P state changed to *P2PTransferNDEFReady*.
+		/// </summary>
+		public byte[] P2PReadNDEF()
+		{
+			byte[] ndef = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int ndefLength = 0;
+			int ndefChunkOffset;
+			byte[] ndefChunkData = new byte[60];
+			int ndefChunkLength;
+			bool ndefOutOfSync;
+			int ndefCurrentLength;
+
+			lock (streamLock)
+			{
+				P2PReadNDEFLowLevel(out ndefLength, out ndefChunkOffset, out ndefChunkData);
+
+				ndefOutOfSync = ndefChunkOffset != 0;
+
+				if (!ndefOutOfSync) {
+					ndef = new byte[ndefLength];
+					ndefChunkLength = Math.Min(ndefLength - ndefChunkOffset, 60);
+
+					Array.Copy(ndefChunkData, ndef, ndefChunkLength);
+
+					ndefCurrentLength = ndefChunkLength;
+
+					while (ndefCurrentLength < ndefLength)
+					{
+						P2PReadNDEFLowLevel(out ndefLength, out ndefChunkOffset, out ndefChunkData);
+
+						ndefOutOfSync = ndefChunkOffset != ndefCurrentLength;
+
+						if (ndefOutOfSync) {
+							break;
+						}
+
+						ndefChunkLength = Math.Min(ndefLength - ndefChunkOffset, 60);
+
+						Array.Copy(ndefChunkData, 0, ndef, ndefCurrentLength, ndefChunkLength);
+
+						ndefCurrentLength += ndefChunkLength;
+					}
+				}
+
+				if (ndefOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (ndefChunkOffset + 60 < ndefLength)
+					{
+						P2PReadNDEFLowLevel(out ndefLength, out ndefChunkOffset, out ndefChunkData);
+					}
+
+					throw new StreamOutOfSyncException("NDEF is out-of-sync");
+				}
+			}
+
+			return ndef;
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnReaderStateChangedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte state = LEConverter.ByteFrom(8, response);
+			bool idle = LEConverter.BoolFrom(9, response);
+			var handler = ReaderStateChangedCallback;
+
+			if (handler != null)
+			{
+				handler(this, state, idle);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnCardemuStateChangedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte state = LEConverter.ByteFrom(8, response);
+			bool idle = LEConverter.BoolFrom(9, response);
+			var handler = CardemuStateChangedCallback;
+
+			if (handler != null)
+			{
+				handler(this, state, idle);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnP2PStateChangedCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte state = LEConverter.ByteFrom(8, response);
+			bool idle = LEConverter.BoolFrom(9, response);
+			var handler = P2PStateChangedCallback;
+
+			if (handler != null)
+			{
+				handler(this, state, idle);
+			}
+		}
+	}
+}
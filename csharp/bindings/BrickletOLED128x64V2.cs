@@ -0,0 +1,820 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  3.3cm (1.3") OLED display with 128x64 pixels
+	/// </summary>
+	public class BrickletOLED128x64V2 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2112;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "OLED 128x64 Bricklet 2.0";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_PIXELS_LOW_LEVEL = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_PIXELS_LOW_LEVEL = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_CLEAR_DISPLAY = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DISPLAY_CONFIGURATION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DISPLAY_CONFIGURATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_LINE = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DRAW_BUFFERED_FRAME = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletOLED128x64V2(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+
+
+			responseExpected[FUNCTION_WRITE_PIXELS_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_READ_PIXELS_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_CLEAR_DISPLAY] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_DISPLAY_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_DISPLAY_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_WRITE_LINE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DRAW_BUFFERED_FRAME] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Writes pixels to the specified window.
+		///  
+		///  The pixels are written into the window line by line top to bottom
+		///  and each line is written from left to right.
+		///  
+		///  If automatic draw is enabled (default) the pixels are directly written to
+		///  the screen. Only pixels that have actually changed are updated on the screen,
+		///  the rest stays the same.
+		///  
+		///  If automatic draw is disabled the pixels are written to an internal buffer and
+		///  the buffer is transferred to the display only after <see cref="Tinkerforge.BrickletOLED128x64V2.DrawBufferedFrame"/>
+		///  is called. This can be used to avoid flicker when drawing a complex frame in
+		///  multiple steps.
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletOLED128x64V2.SetDisplayConfiguration"/>
+		///  function.
+		/// </summary>
+		public void WritePixelsLowLevel(byte xStart, byte yStart, byte xEnd, byte yEnd, int pixelsLength, int pixelsChunkOffset, bool[] pixelsChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_PIXELS_LOW_LEVEL);
+			LEConverter.To((byte)xStart, 8, request);
+			LEConverter.To((byte)yStart, 9, request);
+			LEConverter.To((byte)xEnd, 10, request);
+			LEConverter.To((byte)yEnd, 11, request);
+			LEConverter.To((short)pixelsLength, 12, request);
+			LEConverter.To((short)pixelsChunkOffset, 14, request);
+			byte[] pixelsChunkDataBits = new byte[56];
+			for (int i = 0; i < 448; i++) {
+				if (pixelsChunkData[i]) {
+					pixelsChunkDataBits[i / 8] |= (byte)(1 << (i % 8));
+				}
+			}
+			LEConverter.To((byte[])pixelsChunkDataBits, 16, 56, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Reads pixels from the specified window.
+		///  
+		///  The pixels are read from the window line by line top to bottom
+		///  and each line is read from left to right.
+		///  
+		///  If automatic draw is enabled (default) the pixels that are read are always the
+		///  same that are shown on the display.
+		///  
+		///  If automatic draw is disabled the pixels are read from the internal buffer
+		///  (see <see cref="Tinkerforge.BrickletOLED128x64V2.DrawBufferedFrame"/>).
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletOLED128x64V2.SetDisplayConfiguration"/>
+		///  function.
+		/// </summary>
+		public void ReadPixelsLowLevel(byte xStart, byte yStart, byte xEnd, byte yEnd, out int pixelsLength, out int pixelsChunkOffset, out bool[] pixelsChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_READ_PIXELS_LOW_LEVEL);
+			LEConverter.To((byte)xStart, 8, request);
+			LEConverter.To((byte)yStart, 9, request);
+			LEConverter.To((byte)xEnd, 10, request);
+			LEConverter.To((byte)yEnd, 11, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			pixelsLength = LEConverter.UShortFrom(8, response);
+			pixelsChunkOffset = LEConverter.UShortFrom(10, response);
+			byte[] pixelsChunkDataBits = new byte[60];
+			pixelsChunkData = new bool[480];
+			pixelsChunkDataBits = LEConverter.ByteArrayFrom(12, response, 60);
+			for (int i = 0; i < 480; i++) {
+				pixelsChunkData[i] = (pixelsChunkDataBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+		}
+
+		/// <summary>
+		///  Clears the complete content of the display.
+		///  
+		///  If automatic draw is enabled (default) the pixels are directly cleared.
+		///  
+		///  If automatic draw is disabled the the internal buffer is cleared and
+		///  the buffer is transferred to the display only after <see cref="Tinkerforge.BrickletOLED128x64V2.DrawBufferedFrame"/>
+		///  is called. This can be used to avoid flicker when drawing a complex frame in
+		///  multiple steps.
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletOLED128x64V2.SetDisplayConfiguration"/>
+		///  function.
+		/// </summary>
+		public void ClearDisplay()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_CLEAR_DISPLAY);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Sets the configuration of the display.
+		///  
+		///  You can set a contrast value from 0 to 255 and you can invert the color
+		///  (white/black) of the display.
+		///  
+		///  If automatic draw is set to *true*, the display is automatically updated with every
+		///  call of <see cref="Tinkerforge.BrickletOLED128x64V2.WritePixels"/> or <see cref="Tinkerforge.BrickletOLED128x64V2.WriteLine"/>. If it is set to false, the
+		///  changes are written into an internal buffer and only shown on the display after
+		///  a call of <see cref="Tinkerforge.BrickletOLED128x64V2.DrawBufferedFrame"/>.
+		/// </summary>
+		public void SetDisplayConfiguration(byte contrast, bool invert, bool automaticDraw)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_DISPLAY_CONFIGURATION);
+			LEConverter.To((byte)contrast, 8, request);
+			LEConverter.To((bool)invert, 9, request);
+			LEConverter.To((bool)automaticDraw, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletOLED128x64V2.SetDisplayConfiguration"/>.
+		/// </summary>
+		public void GetDisplayConfiguration(out byte contrast, out bool invert, out bool automaticDraw)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DISPLAY_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 11);
+
+			contrast = LEConverter.ByteFrom(8, response);
+			invert = LEConverter.BoolFrom(9, response);
+			automaticDraw = LEConverter.BoolFrom(10, response);
+		}
+
+		/// <summary>
+		///  Writes text to a specific line with a specific position.
+		///  The text can have a maximum of 22 characters.
+		///  
+		///  For example: (1, 10, "Hello") will write *Hello* in the middle of the
+		///  second line of the display.
+		///  
+		///  The display uses a special 5x7 pixel charset. You can view the characters
+		///  of the charset in Brick Viewer.
+		///  
+		///  If automatic draw is enabled (default) the text is directly written to
+		///  the screen. Only pixels that have actually changed are updated on the screen,
+		///  the rest stays the same.
+		///  
+		///  If automatic draw is disabled the text is written to an internal buffer and
+		///  the buffer is transferred to the display only after <see cref="Tinkerforge.BrickletOLED128x64V2.DrawBufferedFrame"/>
+		///  is called. This can be used to avoid flicker when drawing a complex frame in
+		///  multiple steps.
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletOLED128x64V2.SetDisplayConfiguration"/>
+		///  function.
+		/// </summary>
+		public void WriteLine(byte line, byte position, string text)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(32, FUNCTION_WRITE_LINE);
+			LEConverter.To((byte)line, 8, request);
+			LEConverter.To((byte)position, 9, request);
+			LEConverter.To((string)text, 10, 22, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Draws the currently buffered frame. Normally each call of <see cref="Tinkerforge.BrickletOLED128x64V2.WritePixels"/> and
+		///  <see cref="Tinkerforge.BrickletOLED128x64V2.WriteLine"/> draws directly onto the display. If you turn automatic draw off
+		///  (<see cref="Tinkerforge.BrickletOLED128x64V2.SetDisplayConfiguration"/>), the data is written in an internal buffer and
+		///  only transferred to the display by calling this function. This can be used to
+		///  avoid flicker when drawing a complex frame in multiple steps.
+		///  
+		///  Set the `force complete redraw` to *true* to redraw the whole display
+		///  instead of only the changed parts. Normally it should not be necessary to set this to
+		///  *true*. It may only become necessary in case of stuck pixels because of errors.
+		/// </summary>
+		public void DrawBufferedFrame(bool forceCompleteRedraw)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_DRAW_BUFFERED_FRAME);
+			LEConverter.To((bool)forceCompleteRedraw, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletOLED128x64V2.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletOLED128x64V2.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletOLED128x64V2.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletOLED128x64V2.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Writes pixels to the specified window.
+		///  
+		///  The pixels are written into the window line by line top to bottom
+		///  and each line is written from left to right.
+		///  
+		///  If automatic draw is enabled (default) the pixels are directly written to
+		///  the screen. Only pixels that have actually changed are updated on the screen,
+		///  the rest stays the same.
+		///  
+		///  If automatic draw is disabled the pixels are written to an internal buffer and
+		///  the buffer is transferred to the display only after <see cref="Tinkerforge.BrickletOLED128x64V2.DrawBufferedFrame"/>
+		///  is called. This can be used to avoid flicker when drawing a complex frame in
+		///  multiple steps.
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletOLED128x64V2.SetDisplayConfiguration"/>
+		///  function.
+		/// </summary>
+		public void WritePixels(byte xStart, byte yStart, byte xEnd, byte yEnd, bool[] pixels)
+		{
+			if (pixels.Length > 65535)
+			{
+				throw new ArgumentException("Pixels can be at most 65535 items long");
+			}
+
+			int pixelsLength = pixels.Length;
+			int pixelsChunkOffset = 0;
+			bool[] pixelsChunkData = new bool[448];
+			int pixelsChunkLength;
+
+			if (pixelsLength == 0)
+			{
+				Array.Clear(pixelsChunkData, 0, 448);
+
+				WritePixelsLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (pixelsChunkOffset < pixelsLength)
+					{
+						pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 448);
+
+						Array.Copy(pixels, pixelsChunkOffset, pixelsChunkData, 0, pixelsChunkLength);
+						Array.Clear(pixelsChunkData, pixelsChunkLength, 448 - pixelsChunkLength);
+
+						WritePixelsLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+
+						pixelsChunkOffset += 448;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  Reads pixels from the specified window.
+		///  
+		///  The pixels are read from the window line by line top to bottom
+		///  and each line is read from left to right.
+		///  
+		///  If automatic draw is enabled (default) the pixels that are read are always the
+		///  same that are shown on the display.
+		///  
+		///  If automatic draw is disabled the pixels are read from the internal buffer
+		///  (see <see cref="Tinkerforge.BrickletOLED128x64V2.DrawBufferedFrame"/>).
+		///  
+		///  Automatic draw can be configured with the <see cref="Tinkerforge.BrickletOLED128x64V2.SetDisplayConfiguration"/>
+		///  function.
+		/// </summary>
+		public bool[] ReadPixels(byte xStart, byte yStart, byte xEnd, byte yEnd)
+		{
+			bool[] pixels = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int pixelsLength = 0;
+			int pixelsChunkOffset;
+			bool[] pixelsChunkData = new bool[480];
+			int pixelsChunkLength;
+			bool pixelsOutOfSync;
+			int pixelsCurrentLength;
+
+			lock (streamLock)
+			{
+				ReadPixelsLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+
+				pixelsOutOfSync = pixelsChunkOffset != 0;
+
+				if (!pixelsOutOfSync) {
+					pixels = new bool[pixelsLength];
+					pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 480);
+
+					Array.Copy(pixelsChunkData, pixels, pixelsChunkLength);
+
+					pixelsCurrentLength = pixelsChunkLength;
+
+					while (pixelsCurrentLength < pixelsLength)
+					{
+						ReadPixelsLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+
+						pixelsOutOfSync = pixelsChunkOffset != pixelsCurrentLength;
+
+						if (pixelsOutOfSync) {
+							break;
+						}
+
+						pixelsChunkLength = Math.Min(pixelsLength - pixelsChunkOffset, 480);
+
+						Array.Copy(pixelsChunkData, 0, pixels, pixelsCurrentLength, pixelsChunkLength);
+
+						pixelsCurrentLength += pixelsChunkLength;
+					}
+				}
+
+				if (pixelsOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (pixelsChunkOffset + 480 < pixelsLength)
+					{
+						ReadPixelsLowLevel(xStart, yStart, xEnd, yEnd, out pixelsLength, out pixelsChunkOffset, out pixelsChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Pixels is out-of-sync");
+				}
+			}
+
+			return pixels;
+		}
+	}
+}
@@ -0,0 +1,943 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  433MHz receiver for outdoor weather station
+	/// </summary>
+	public class BrickletOutdoorWeather : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 288;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Outdoor Weather Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATION_IDENTIFIERS_LOW_LEVEL = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SENSOR_IDENTIFIERS_LOW_LEVEL = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATION_DATA = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SENSOR_DATA = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATION_CALLBACK_CONFIGURATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATION_CALLBACK_CONFIGURATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SENSOR_CALLBACK_CONFIGURATION = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SENSOR_CALLBACK_CONFIGURATION = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_STATION_DATA = 9;
+
+		private const int CALLBACK_SENSOR_DATA = 10;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_N = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_NNE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_NE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_ENE = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_E = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_ESE = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_SE = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_SSE = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_S = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_SSW = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_SW = 10;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_WSW = 11;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_W = 12;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_WNW = 13;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_NW = 14;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_NNW = 15;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIND_DIRECTION_ERROR = 255;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  Reports the station data every time a new data packet is received.
+		///  See <see cref="Tinkerforge.BrickletOutdoorWeather.GetStationData"/> for information about the data.
+		///  
+		///  For each station the callback will be triggered about every 45 seconds.
+		///  
+		///  Turn the callback on/off with <see cref="Tinkerforge.BrickletOutdoorWeather.SetStationCallbackConfiguration"/>
+		///  (by default it is turned off).
+		/// </summary>
+		public event StationDataEventHandler StationDataCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void StationDataEventHandler(BrickletOutdoorWeather sender, byte identifier, short temperature, byte humidity, long windSpeed, long gustSpeed, long rain, byte windDirection, bool batteryLow);
+
+		/// <summary>
+		///  Reports the sensor data every time a new data packet is received.
+		///  See <see cref="Tinkerforge.BrickletOutdoorWeather.GetSensorData"/> for information about the data.
+		///  
+		///  For each sensor the callback will be called about every 45 seconds.
+		///  
+		///  Turn the callback on/off with <see cref="Tinkerforge.BrickletOutdoorWeather.SetSensorCallbackConfiguration"/>
+		///  (by default it is turned off).
+		/// </summary>
+		public event SensorDataEventHandler SensorDataCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void SensorDataEventHandler(BrickletOutdoorWeather sender, byte identifier, short temperature, byte humidity);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletOutdoorWeather(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_STATION_DATA] = new CallbackWrapper(OnStationDataCallback);
+			callbackWrappers[CALLBACK_SENSOR_DATA] = new CallbackWrapper(OnSensorDataCallback);
+
+
+			responseExpected[FUNCTION_GET_STATION_IDENTIFIERS_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SENSOR_IDENTIFIERS_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_STATION_DATA] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SENSOR_DATA] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_STATION_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SENSOR_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_SENSOR_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the identifiers (number between 0 and 255) of all `stations
+		///  &lt;https://www.tinkerforge.com/en/shop/accessories/sensors/outdoor-weather-station-ws-6147.html&gt;`__
+		///  that have been seen since the startup of the Bricklet.
+		///  
+		///  Each station gives itself a random identifier on first startup.
+		///  
+		///  Since firmware version 2.0.2 a station is removed from the list if no data was received for
+		///  12 hours.
+		/// </summary>
+		public void GetStationIdentifiersLowLevel(out int identifiersLength, out int identifiersChunkOffset, out byte[] identifiersChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATION_IDENTIFIERS_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			identifiersLength = LEConverter.UShortFrom(8, response);
+			identifiersChunkOffset = LEConverter.UShortFrom(10, response);
+			identifiersChunkData = LEConverter.ByteArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  Returns the identifiers (number between 0 and 255) of all `sensors
+		///  &lt;https://www.tinkerforge.com/en/shop/accessories/sensors/temperature-humidity-sensor-th-6148.html&gt;`__
+		///  that have been seen since the startup of the Bricklet.
+		///  
+		///  Each sensor gives itself a random identifier on first startup.
+		///  
+		///  Since firmware version 2.0.2 a sensor is removed from the list if no data was received for
+		///  12 hours.
+		/// </summary>
+		public void GetSensorIdentifiersLowLevel(out int identifiersLength, out int identifiersChunkOffset, out byte[] identifiersChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SENSOR_IDENTIFIERS_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			identifiersLength = LEConverter.UShortFrom(8, response);
+			identifiersChunkOffset = LEConverter.UShortFrom(10, response);
+			identifiersChunkData = LEConverter.ByteArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  Returns the last received data for a station with the given identifier.
+		///  Call <see cref="Tinkerforge.BrickletOutdoorWeather.GetStationIdentifiers"/> for a list of all available identifiers.
+		///  
+		///  The return values are:
+		///  
+		///  * Temperature,
+		///  * Humidity,
+		///  * Wind Speed,
+		///  * Gust Speed,
+		///  * Rain Fall (accumulated since station power-up),
+		///  * Wind Direction,
+		///  * Battery Low (true if battery is low) and
+		///  * Last Change (seconds since the reception of this data).
+		/// </summary>
+		public void GetStationData(byte identifier, out short temperature, out byte humidity, out long windSpeed, out long gustSpeed, out long rain, out byte windDirection, out bool batteryLow, out int lastChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_STATION_DATA);
+			LEConverter.To((byte)identifier, 8, request);
+
+			byte[] response = SendRequest(request, 27);
+
+			temperature = LEConverter.ShortFrom(8, response);
+			humidity = LEConverter.ByteFrom(10, response);
+			windSpeed = LEConverter.UIntFrom(11, response);
+			gustSpeed = LEConverter.UIntFrom(15, response);
+			rain = LEConverter.UIntFrom(19, response);
+			windDirection = LEConverter.ByteFrom(23, response);
+			batteryLow = LEConverter.BoolFrom(24, response);
+			lastChange = LEConverter.UShortFrom(25, response);
+		}
+
+		/// <summary>
+		///  Returns the last measured data for a sensor with the given identifier.
+		///  Call <see cref="Tinkerforge.BrickletOutdoorWeather.GetSensorIdentifiers"/> for a list of all available identifiers.
+		///  
+		///  The return values are:
+		///  
+		///  * Temperature,
+		///  * Humidity and
+		///  * Last Change (seconds since the last reception of data).
+		/// </summary>
+		public void GetSensorData(byte identifier, out short temperature, out byte humidity, out int lastChange)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SENSOR_DATA);
+			LEConverter.To((byte)identifier, 8, request);
+
+			byte[] response = SendRequest(request, 13);
+
+			temperature = LEConverter.ShortFrom(8, response);
+			humidity = LEConverter.ByteFrom(10, response);
+			lastChange = LEConverter.UShortFrom(11, response);
+		}
+
+		/// <summary>
+		///  Turns callback for station data on or off.
+		/// </summary>
+		public void SetStationCallbackConfiguration(bool enableCallback)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATION_CALLBACK_CONFIGURATION);
+			LEConverter.To((bool)enableCallback, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletOutdoorWeather.SetStationCallbackConfiguration"/>.
+		/// </summary>
+		public bool GetStationCallbackConfiguration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATION_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Turns callback for sensor data on or off.
+		/// </summary>
+		public void SetSensorCallbackConfiguration(bool enableCallback)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_SENSOR_CALLBACK_CONFIGURATION);
+			LEConverter.To((bool)enableCallback, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletOutdoorWeather.SetSensorCallbackConfiguration"/>.
+		/// </summary>
+		public bool GetSensorCallbackConfiguration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SENSOR_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletOutdoorWeather.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletOutdoorWeather.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletOutdoorWeather.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletOutdoorWeather.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Returns the identifiers (number between 0 and 255) of all `stations
+		///  &lt;https://www.tinkerforge.com/en/shop/accessories/sensors/outdoor-weather-station-ws-6147.html&gt;`__
+		///  that have been seen since the startup of the Bricklet.
+		///  
+		///  Each station gives itself a random identifier on first startup.
+		///  
+		///  Since firmware version 2.0.2 a station is removed from the list if no data was received for
+		///  12 hours.
+		/// </summary>
+		public byte[] GetStationIdentifiers()
+		{
+			byte[] identifiers = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int identifiersLength = 0;
+			int identifiersChunkOffset;
+			byte[] identifiersChunkData = new byte[60];
+			int identifiersChunkLength;
+			bool identifiersOutOfSync;
+			int identifiersCurrentLength;
+
+			lock (streamLock)
+			{
+				GetStationIdentifiersLowLevel(out identifiersLength, out identifiersChunkOffset, out identifiersChunkData);
+
+				identifiersOutOfSync = identifiersChunkOffset != 0;
+
+				if (!identifiersOutOfSync) {
+					identifiers = new byte[identifiersLength];
+					identifiersChunkLength = Math.Min(identifiersLength - identifiersChunkOffset, 60);
+
+					Array.Copy(identifiersChunkData, identifiers, identifiersChunkLength);
+
+					identifiersCurrentLength = identifiersChunkLength;
+
+					while (identifiersCurrentLength < identifiersLength)
+					{
+						GetStationIdentifiersLowLevel(out identifiersLength, out identifiersChunkOffset, out identifiersChunkData);
+
+						identifiersOutOfSync = identifiersChunkOffset != identifiersCurrentLength;
+
+						if (identifiersOutOfSync) {
+							break;
+						}
+
+						identifiersChunkLength = Math.Min(identifiersLength - identifiersChunkOffset, 60);
+
+						Array.Copy(identifiersChunkData, 0, identifiers, identifiersCurrentLength, identifiersChunkLength);
+
+						identifiersCurrentLength += identifiersChunkLength;
+					}
+				}
+
+				if (identifiersOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (identifiersChunkOffset + 60 < identifiersLength)
+					{
+						GetStationIdentifiersLowLevel(out identifiersLength, out identifiersChunkOffset, out identifiersChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Identifiers is out-of-sync");
+				}
+			}
+
+			return identifiers;
+		}
+
+		/// <summary>
+		///  Returns the identifiers (number between 0 and 255) of all `sensors
+		///  &lt;https://www.tinkerforge.com/en/shop/accessories/sensors/temperature-humidity-sensor-th-6148.html&gt;`__
+		///  that have been seen since the startup of the Bricklet.
+		///  
+		///  Each sensor gives itself a random identifier on first startup.
+		///  
+		///  Since firmware version 2.0.2 a sensor is removed from the list if no data was received for
+		///  12 hours.
+		/// </summary>
+		public byte[] GetSensorIdentifiers()
+		{
+			byte[] identifiers = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int identifiersLength = 0;
+			int identifiersChunkOffset;
+			byte[] identifiersChunkData = new byte[60];
+			int identifiersChunkLength;
+			bool identifiersOutOfSync;
+			int identifiersCurrentLength;
+
+			lock (streamLock)
+			{
+				GetSensorIdentifiersLowLevel(out identifiersLength, out identifiersChunkOffset, out identifiersChunkData);
+
+				identifiersOutOfSync = identifiersChunkOffset != 0;
+
+				if (!identifiersOutOfSync) {
+					identifiers = new byte[identifiersLength];
+					identifiersChunkLength = Math.Min(identifiersLength - identifiersChunkOffset, 60);
+
+					Array.Copy(identifiersChunkData, identifiers, identifiersChunkLength);
+
+					identifiersCurrentLength = identifiersChunkLength;
+
+					while (identifiersCurrentLength < identifiersLength)
+					{
+						GetSensorIdentifiersLowLevel(out identifiersLength, out identifiersChunkOffset, out identifiersChunkData);
+
+						identifiersOutOfSync = identifiersChunkOffset != identifiersCurrentLength;
+
+						if (identifiersOutOfSync) {
+							break;
+						}
+
+						identifiersChunkLength = Math.Min(identifiersLength - identifiersChunkOffset, 60);
+
+						Array.Copy(identifiersChunkData, 0, identifiers, identifiersCurrentLength, identifiersChunkLength);
+
+						identifiersCurrentLength += identifiersChunkLength;
+					}
+				}
+
+				if (identifiersOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (identifiersChunkOffset + 60 < identifiersLength)
+					{
+						GetSensorIdentifiersLowLevel(out identifiersLength, out identifiersChunkOffset, out identifiersChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Identifiers is out-of-sync");
+				}
+			}
+
+			return identifiers;
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnStationDataCallback(byte[] response)
+		{
+			if (response.Length != 26)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte identifier = LEConverter.ByteFrom(8, response);
+			short temperature = LEConverter.ShortFrom(9, response);
+			byte humidity = LEConverter.ByteFrom(11, response);
+			long windSpeed = LEConverter.UIntFrom(12, response);
+			long gustSpeed = LEConverter.UIntFrom(16, response);
+			long rain = LEConverter.UIntFrom(20, response);
+			byte windDirection = LEConverter.ByteFrom(24, response);
+			bool batteryLow = LEConverter.BoolFrom(25, response);
+			var handler = StationDataCallback;
+
+			if (handler != null)
+			{
+				handler(this, identifier, temperature, humidity, windSpeed, gustSpeed, rain, windDirection, batteryLow);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnSensorDataCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte identifier = LEConverter.ByteFrom(8, response);
+			short temperature = LEConverter.ShortFrom(9, response);
+			byte humidity = LEConverter.ByteFrom(11, response);
+			var handler = SensorDataCallback;
+
+			if (handler != null)
+			{
+				handler(this, identifier, temperature, humidity);
+			}
+		}
+	}
+}
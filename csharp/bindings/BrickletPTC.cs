@@ -0,0 +1,829 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Reads temperatures from Pt100 und Pt1000 sensors
+	/// </summary>
+	public class BrickletPTC : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 226;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "PTC Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RESISTANCE = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TEMPERATURE_CALLBACK_PERIOD = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE_CALLBACK_PERIOD = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RESISTANCE_CALLBACK_PERIOD = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RESISTANCE_CALLBACK_PERIOD = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TEMPERATURE_CALLBACK_THRESHOLD = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE_CALLBACK_THRESHOLD = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RESISTANCE_CALLBACK_THRESHOLD = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RESISTANCE_CALLBACK_THRESHOLD = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DEBOUNCE_PERIOD = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DEBOUNCE_PERIOD = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_NOISE_REJECTION_FILTER = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_NOISE_REJECTION_FILTER = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_SENSOR_CONNECTED = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WIRE_MODE = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_WIRE_MODE = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_TEMPERATURE = 13;
+
+		private const int CALLBACK_TEMPERATURE_REACHED = 14;
+
+		private const int CALLBACK_RESISTANCE = 15;
+
+		private const int CALLBACK_RESISTANCE_REACHED = 16;
+
+		private const int CALLBACK_SENSOR_CONNECTED = 24;
+
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OFF = 'x';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OUTSIDE = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_INSIDE = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_SMALLER = '<';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_GREATER = '>';
+
+		/// <summary>
+		/// </summary>
+		public const byte FILTER_OPTION_50HZ = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILTER_OPTION_60HZ = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIRE_MODE_2 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIRE_MODE_3 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte WIRE_MODE_4 = 4;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletPTC.SetTemperatureCallbackPeriod"/>. The parameter is the
+		///  temperature of the connected sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickletPTC.TemperatureCallback"/> callback is only triggered if the temperature has changed
+		///  since the last triggering.
+		/// </summary>
+		public event TemperatureEventHandler TemperatureCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void TemperatureEventHandler(BrickletPTC sender, int temperature);
+
+		/// <summary>
+		/// </summary>
+		public event TemperatureEventHandler Temperature // for backward compatibility
+		{
+			add { TemperatureCallback += value; }
+			remove { TemperatureCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletPTC.SetTemperatureCallbackThreshold"/> is reached.
+		///  The parameter is the temperature of the connected sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletPTC.SetDebouncePeriod"/>.
+		/// </summary>
+		public event TemperatureReachedEventHandler TemperatureReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void TemperatureReachedEventHandler(BrickletPTC sender, int temperature);
+
+		/// <summary>
+		/// </summary>
+		public event TemperatureReachedEventHandler TemperatureReached // for backward compatibility
+		{
+			add { TemperatureReachedCallback += value; }
+			remove { TemperatureReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletPTC.SetResistanceCallbackPeriod"/>. The parameter is the resistance
+		///  of the connected sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickletPTC.ResistanceCallback"/> callback is only triggered if the resistance has changed
+		///  since the last triggering.
+		/// </summary>
+		public event ResistanceEventHandler ResistanceCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ResistanceEventHandler(BrickletPTC sender, int resistance);
+
+		/// <summary>
+		/// </summary>
+		public event ResistanceEventHandler Resistance // for backward compatibility
+		{
+			add { ResistanceCallback += value; }
+			remove { ResistanceCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletPTC.SetResistanceCallbackThreshold"/> is reached.
+		///  The parameter is the resistance of the connected sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletPTC.SetDebouncePeriod"/>.
+		/// </summary>
+		public event ResistanceReachedEventHandler ResistanceReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ResistanceReachedEventHandler(BrickletPTC sender, int resistance);
+
+		/// <summary>
+		/// </summary>
+		public event ResistanceReachedEventHandler ResistanceReached // for backward compatibility
+		{
+			add { ResistanceReachedCallback += value; }
+			remove { ResistanceReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically according to the configuration set by
+		///  <see cref="Tinkerforge.BrickletPTC.SetSensorConnectedCallbackConfiguration"/>.
+		///  
+		///  The parameter is the same as <see cref="Tinkerforge.BrickletPTC.IsSensorConnected"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public event SensorConnectedEventHandler SensorConnectedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void SensorConnectedEventHandler(BrickletPTC sender, bool connected);
+
+		/// <summary>
+		/// </summary>
+		public event SensorConnectedEventHandler SensorConnected // for backward compatibility
+		{
+			add { SensorConnectedCallback += value; }
+			remove { SensorConnectedCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletPTC(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_TEMPERATURE] = new CallbackWrapper(OnTemperatureCallback);
+			callbackWrappers[CALLBACK_TEMPERATURE_REACHED] = new CallbackWrapper(OnTemperatureReachedCallback);
+			callbackWrappers[CALLBACK_RESISTANCE] = new CallbackWrapper(OnResistanceCallback);
+			callbackWrappers[CALLBACK_RESISTANCE_REACHED] = new CallbackWrapper(OnResistanceReachedCallback);
+			callbackWrappers[CALLBACK_SENSOR_CONNECTED] = new CallbackWrapper(OnSensorConnectedCallback);
+
+
+			responseExpected[FUNCTION_GET_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_RESISTANCE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_TEMPERATURE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_RESISTANCE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_RESISTANCE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_TEMPERATURE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_RESISTANCE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_RESISTANCE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_NOISE_REJECTION_FILTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_NOISE_REJECTION_FILTER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_IS_SENSOR_CONNECTED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WIRE_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_WIRE_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the temperature of connected sensor.
+		///  
+		///  If you want to get the temperature periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletPTC.TemperatureCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletPTC.SetTemperatureCallbackPeriod"/>.
+		/// </summary>
+		public int GetTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the value as measured by the MAX31865 precision delta-sigma ADC.
+		///  
+		///  The value can be converted with the following formulas:
+		///  
+		///  * Pt100:  resistance = (value * 390) / 32768
+		///  * Pt1000: resistance = (value * 3900) / 32768
+		///  
+		///  If you want to get the resistance periodically, it is recommended
+		///  to use the <see cref="Tinkerforge.BrickletPTC.ResistanceCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletPTC.SetResistanceCallbackPeriod"/>.
+		/// </summary>
+		public int GetResistance()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_RESISTANCE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletPTC.TemperatureCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletPTC.TemperatureCallback"/> callback is only triggered if the temperature has
+		///  changed since the last triggering.
+		/// </summary>
+		public void SetTemperatureCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_TEMPERATURE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletPTC.SetTemperatureCallbackPeriod"/>.
+		/// </summary>
+		public long GetTemperatureCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletPTC.ResistanceCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletPTC.ResistanceCallback"/> callback is only triggered if the resistance has changed
+		///  since the last triggering.
+		/// </summary>
+		public void SetResistanceCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_RESISTANCE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletPTC.SetResistanceCallbackPeriod"/>.
+		/// </summary>
+		public long GetResistanceCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_RESISTANCE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletPTC.TemperatureReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the temperature is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the temperature is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the temperature is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the temperature is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetTemperatureCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_SET_TEMPERATURE_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((int)min, 9, request);
+			LEConverter.To((int)max, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletPTC.SetTemperatureCallbackThreshold"/>.
+		/// </summary>
+		public void GetTemperatureCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 17);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.IntFrom(9, response);
+			max = LEConverter.IntFrom(13, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletPTC.ResistanceReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the temperature is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the temperature is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the temperature is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the temperature is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetResistanceCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_SET_RESISTANCE_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((int)min, 9, request);
+			LEConverter.To((int)max, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletPTC.SetResistanceCallbackThreshold"/>.
+		/// </summary>
+		public void GetResistanceCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_RESISTANCE_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 17);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.IntFrom(9, response);
+			max = LEConverter.IntFrom(13, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the threshold callback
+		///  
+		///  * <see cref="Tinkerforge.BrickletPTC.TemperatureReachedCallback"/>,
+		///  * <see cref="Tinkerforge.BrickletPTC.ResistanceReachedCallback"/>
+		///  
+		///  is triggered, if the threshold
+		///  
+		///  * <see cref="Tinkerforge.BrickletPTC.SetTemperatureCallbackThreshold"/>,
+		///  * <see cref="Tinkerforge.BrickletPTC.SetResistanceCallbackThreshold"/>
+		///  
+		///  keeps being reached.
+		/// </summary>
+		public void SetDebouncePeriod(long debounce)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DEBOUNCE_PERIOD);
+			LEConverter.To((int)debounce, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the debounce period as set by <see cref="Tinkerforge.BrickletPTC.SetDebouncePeriod"/>.
+		/// </summary>
+		public long GetDebouncePeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DEBOUNCE_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the noise rejection filter to either 50Hz (0) or 60Hz (1).
+		///  Noise from 50Hz or 60Hz power sources (including
+		///  harmonics of the AC power's fundamental frequency) is
+		///  attenuated by 82dB.
+		/// </summary>
+		public void SetNoiseRejectionFilter(byte filter)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_NOISE_REJECTION_FILTER);
+			LEConverter.To((byte)filter, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the noise rejection filter option as set by
+		///  <see cref="Tinkerforge.BrickletPTC.SetNoiseRejectionFilter"/>
+		/// </summary>
+		public byte GetNoiseRejectionFilter()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_NOISE_REJECTION_FILTER);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns *true* if the sensor is connected correctly.
+		///  
+		///  If this function
+		///  returns *false*, there is either no Pt100 or Pt1000 sensor connected,
+		///  the sensor is connected incorrectly or the sensor itself is faulty.
+		/// </summary>
+		public bool IsSensorConnected()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_SENSOR_CONNECTED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the wire mode of the sensor. Possible values are 2, 3 and 4 which
+		///  correspond to 2-, 3- and 4-wire sensors. The value has to match the jumper
+		///  configuration on the Bricklet.
+		/// </summary>
+		public void SetWireMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_WIRE_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the wire mode as set by <see cref="Tinkerforge.BrickletPTC.SetWireMode"/>
+		/// </summary>
+		public byte GetWireMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_WIRE_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  If you enable this callback, the <see cref="Tinkerforge.BrickletPTC.SensorConnectedCallback"/> callback is triggered
+		///  every time a Pt sensor is connected/disconnected.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetSensorConnectedCallbackConfiguration(bool enabled)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION);
+			LEConverter.To((bool)enabled, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletPTC.SetSensorConnectedCallbackConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public bool GetSensorConnectedCallbackConfiguration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnTemperatureCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int temperature = LEConverter.IntFrom(8, response);
+			var handler = TemperatureCallback;
+
+			if (handler != null)
+			{
+				handler(this, temperature);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnTemperatureReachedCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int temperature = LEConverter.IntFrom(8, response);
+			var handler = TemperatureReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, temperature);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnResistanceCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int resistance = LEConverter.IntFrom(8, response);
+			var handler = ResistanceCallback;
+
+			if (handler != null)
+			{
+				handler(this, resistance);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnResistanceReachedCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int resistance = LEConverter.IntFrom(8, response);
+			var handler = ResistanceReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, resistance);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnSensorConnectedCallback(byte[] response)
+		{
+			if (response.Length != 9)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			bool connected = LEConverter.BoolFrom(8, response);
+			var handler = SensorConnectedCallback;
+
+			if (handler != null)
+			{
+				handler(this, connected);
+			}
+		}
+	}
+}
@@ -0,0 +1,2036 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  TBD
+	/// </summary>
+	public class BrickletPerformanceStepper : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2158;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Performance Stepper Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MOTION_CONFIGURATION = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MOTION_CONFIGURATION = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CURRENT_POSITION = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CURRENT_POSITION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CURRENT_VELOCITY = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_TARGET_POSITION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TARGET_POSITION = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STEPS = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STEPS = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_REMAINING_STEPS = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STEP_CONFIGURATION = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STEP_CONFIGURATION = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MOTOR_CURRENT = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MOTOR_CURRENT = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ENABLED = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ENABLED = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BASIC_CONFIGURATION = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BASIC_CONFIGURATION = 27;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPREADCYCLE_CONFIGURATION = 28;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPREADCYCLE_CONFIGURATION = 29;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STEALTH_CONFIGURATION = 30;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STEALTH_CONFIGURATION = 31;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_COOLSTEP_CONFIGURATION = 32;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COOLSTEP_CONFIGURATION = 33;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SHORT_CONFIGURATION = 34;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SHORT_CONFIGURATION = 35;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DRIVER_STATUS = 36;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_INPUT_VOLTAGE = 37;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE = 38;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GPIO_CONFIGURATION = 39;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GPIO_CONFIGURATION = 40;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GPIO_ACTION = 41;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GPIO_ACTION = 42;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GPIO_STATE = 43;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ERROR_LED_CONFIG = 44;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ERROR_LED_CONFIG = 45;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ENABLE_LED_CONFIG = 46;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ENABLE_LED_CONFIG = 47;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STEPS_LED_CONFIG = 48;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STEPS_LED_CONFIG = 49;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_GPIO_LED_CONFIG = 50;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_GPIO_LED_CONFIG = 51;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_REGISTER = 52;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_REGISTER = 53;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte STEP_RESOLUTION_1 = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEP_RESOLUTION_2 = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEP_RESOLUTION_4 = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEP_RESOLUTION_8 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEP_RESOLUTION_16 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEP_RESOLUTION_32 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEP_RESOLUTION_64 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEP_RESOLUTION_128 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEP_RESOLUTION_256 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte RAMPING_MODE_POSITIONING = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte RAMPING_MODE_VELOCITY_NEGATIVE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte RAMPING_MODE_VELOCITY_POSITIVE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte RAMPING_MODE_HOLD = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHOPPER_MODE_SPREAD_CYCLE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CHOPPER_MODE_FAST_DECAY = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREEWHEEL_MODE_NORMAL = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREEWHEEL_MODE_FREEWHEELING = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREEWHEEL_MODE_COIL_SHORT_LS = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FREEWHEEL_MODE_COIL_SHORT_HS = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte CURRENT_UP_STEP_INCREMENT_1 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CURRENT_UP_STEP_INCREMENT_2 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CURRENT_UP_STEP_INCREMENT_4 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte CURRENT_UP_STEP_INCREMENT_8 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte CURRENT_DOWN_STEP_DECREMENT_1 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CURRENT_DOWN_STEP_DECREMENT_2 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CURRENT_DOWN_STEP_DECREMENT_8 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte CURRENT_DOWN_STEP_DECREMENT_32 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte MINIMUM_CURRENT_HALF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte MINIMUM_CURRENT_QUARTER = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STALLGUARD_MODE_STANDARD = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STALLGUARD_MODE_FILTERED = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte OPEN_LOAD_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte OPEN_LOAD_PHASE_A = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte OPEN_LOAD_PHASE_B = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte OPEN_LOAD_PHASE_AB = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte SHORT_TO_GROUND_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SHORT_TO_GROUND_PHASE_A = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte SHORT_TO_GROUND_PHASE_B = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte SHORT_TO_GROUND_PHASE_AB = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte OVER_TEMPERATURE_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte OVER_TEMPERATURE_WARNING = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte OVER_TEMPERATURE_LIMIT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATE_STOP = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATE_ACCELERATION = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATE_RUN = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATE_DEACCELERATION = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATE_DIRECTION_CHANGE_TO_FORWARD = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATE_DIRECTION_CHANGE_TO_BACKWARD = 6;
+
+		/// <summary>
+		/// </summary>
+		public const long GPIO_ACTION_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const long GPIO_ACTION_NORMAL_STOP_RISING_EDGE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const long GPIO_ACTION_NORMAL_STOP_FALLING_EDGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const long GPIO_ACTION_EMERGENCY_STOP_RISING_EDGE = 4;
+
+		/// <summary>
+		/// </summary>
+		public const long GPIO_ACTION_EMERGENCY_STOP_FALLING_EDGE = 8;
+
+		/// <summary>
+		/// </summary>
+		public const long GPIO_ACTION_CALLBACK_RISING_EDGE = 16;
+
+		/// <summary>
+		/// </summary>
+		public const long GPIO_ACTION_CALLBACK_FALLING_EDGE = 32;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_SHOW_ERROR = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte ENABLE_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ENABLE_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ENABLE_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte ENABLE_LED_CONFIG_SHOW_ENABLE = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEPS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEPS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEPS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STEPS_LED_CONFIG_SHOW_STEPS = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte GPIO_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte GPIO_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte GPIO_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte GPIO_LED_CONFIG_SHOW_GPIO_ACTIVE_HIGH = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte GPIO_LED_CONFIG_SHOW_GPIO_ACTIVE_LOW = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILTER_TIME_100 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILTER_TIME_200 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILTER_TIME_300 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FILTER_TIME_400 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte SPIKE_FILTER_BANDWIDTH_100 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SPIKE_FILTER_BANDWIDTH_1000 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte SPIKE_FILTER_BANDWIDTH_2000 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte SPIKE_FILTER_BANDWIDTH_3000 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletPerformanceStepper(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+
+
+			responseExpected[FUNCTION_SET_MOTION_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_MOTION_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CURRENT_POSITION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CURRENT_POSITION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CURRENT_VELOCITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_TARGET_POSITION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_TARGET_POSITION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STEPS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STEPS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_REMAINING_STEPS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STEP_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STEP_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MOTOR_CURRENT] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_MOTOR_CURRENT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ENABLED] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BASIC_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_BASIC_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPREADCYCLE_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPREADCYCLE_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STEALTH_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STEALTH_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_COOLSTEP_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_COOLSTEP_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SHORT_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SHORT_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_DRIVER_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_INPUT_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_GPIO_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_GPIO_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_GPIO_ACTION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_GPIO_ACTION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_GPIO_STATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ERROR_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_ERROR_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ENABLE_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_ENABLE_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STEPS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STEPS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_GPIO_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_GPIO_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_WRITE_REGISTER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READ_REGISTER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public void SetMotionConfiguration(byte rampingMode, int velocityStart, int acceleration1, int velocity1, int accelerationMax, int velocityMax, int decelerationMax, int deceleration1, int velocityStop, int rampZeroWait)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(45, FUNCTION_SET_MOTION_CONFIGURATION);
+			LEConverter.To((byte)rampingMode, 8, request);
+			LEConverter.To((int)velocityStart, 9, request);
+			LEConverter.To((int)acceleration1, 13, request);
+			LEConverter.To((int)velocity1, 17, request);
+			LEConverter.To((int)accelerationMax, 21, request);
+			LEConverter.To((int)velocityMax, 25, request);
+			LEConverter.To((int)decelerationMax, 29, request);
+			LEConverter.To((int)deceleration1, 33, request);
+			LEConverter.To((int)velocityStop, 37, request);
+			LEConverter.To((int)rampZeroWait, 41, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public void GetMotionConfiguration(out byte rampingMode, out int velocityStart, out int acceleration1, out int velocity1, out int accelerationMax, out int velocityMax, out int decelerationMax, out int deceleration1, out int velocityStop, out int rampZeroWait)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MOTION_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 45);
+
+			rampingMode = LEConverter.ByteFrom(8, response);
+			velocityStart = LEConverter.IntFrom(9, response);
+			acceleration1 = LEConverter.IntFrom(13, response);
+			velocity1 = LEConverter.IntFrom(17, response);
+			accelerationMax = LEConverter.IntFrom(21, response);
+			velocityMax = LEConverter.IntFrom(25, response);
+			decelerationMax = LEConverter.IntFrom(29, response);
+			deceleration1 = LEConverter.IntFrom(33, response);
+			velocityStop = LEConverter.IntFrom(37, response);
+			rampZeroWait = LEConverter.IntFrom(41, response);
+		}
+
+		/// <summary>
+		///  Sets the current steps of the internal step counter. This can be used to
+		///  set the current position to 0 when some kind of starting position
+		///  is reached (e.g. when a CNC machine reaches a corner).
+		/// </summary>
+		public void SetCurrentPosition(int position)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_CURRENT_POSITION);
+			LEConverter.To((int)position, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current position of the stepper motor in steps. On startup
+		///  the position is 0. The steps are counted with all possible driving
+		///  functions (<see cref="Tinkerforge.BrickletPerformanceStepper.SetTargetPosition"/>, <see cref="Tinkerforge.BrickletPerformanceStepper.SetSteps"/>).
+		///  It also is possible to reset the steps to 0 or
+		///  set them to any other desired value with <see cref="Tinkerforge.BrickletPerformanceStepper.SetCurrentPosition"/>.
+		/// </summary>
+		public int GetCurrentPosition()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CURRENT_POSITION);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public int GetCurrentVelocity()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CURRENT_VELOCITY);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the target position of the stepper motor in steps. For example,
+		///  if the current position of the motor is 500 and <see cref="Tinkerforge.BrickletPerformanceStepper.SetTargetPosition"/> is
+		///  called with 1000, the stepper motor will drive 500 steps forward. It will
+		///  use the velocity, acceleration and deacceleration as set by
+		///  <see cref="Tinkerforge.BrickletPerformanceStepper.SetMotionConfiguration"/>.
+		///  
+		///  A call of <see cref="Tinkerforge.BrickletPerformanceStepper.SetTargetPosition"/> with the parameter *x* is equivalent to
+		///  a call of <see cref="Tinkerforge.BrickletPerformanceStepper.SetSteps"/> with the parameter
+		///  (*x* - <see cref="Tinkerforge.BrickletPerformanceStepper.GetCurrentPosition"/>).
+		/// </summary>
+		public void SetTargetPosition(int position)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_TARGET_POSITION);
+			LEConverter.To((int)position, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the last target position as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetTargetPosition"/>.
+		/// </summary>
+		public int GetTargetPosition()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TARGET_POSITION);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the number of steps the stepper motor should run. Positive values
+		///  will drive the motor forward and negative values backward.
+		///  The velocity, acceleration and deacceleration as set by
+		///  <see cref="Tinkerforge.BrickletPerformanceStepper.SetMotionConfiguration"/> will be used.
+		/// </summary>
+		public void SetSteps(int steps)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_STEPS);
+			LEConverter.To((int)steps, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the last steps as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetSteps"/>.
+		/// </summary>
+		public int GetSteps()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STEPS);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the remaining steps of the last call of <see cref="Tinkerforge.BrickletPerformanceStepper.SetSteps"/>.
+		///  For example, if <see cref="Tinkerforge.BrickletPerformanceStepper.SetSteps"/> is called with 2000 and
+		///  <see cref="Tinkerforge.BrickletPerformanceStepper.GetRemainingSteps"/> is called after the motor has run for 500 steps,
+		///  it will return 1500.
+		/// </summary>
+		public int GetRemainingSteps()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_REMAINING_STEPS);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the step resolution from full-step up to 1/256-step.
+		///  
+		///  If interpolation is turned on, the Silent Stepper Brick will always interpolate
+		///  your step inputs as 1/256-step. If you use full-step mode with interpolation, each
+		///  step will generate 256 1/256 steps.
+		///  
+		///  For maximum torque use full-step without interpolation. For maximum resolution use
+		///  1/256-step. Turn interpolation on to make the Stepper driving less noisy.
+		///  
+		///  If you often change the speed with high acceleration you should turn the
+		///  interpolation off.
+		/// </summary>
+		public void SetStepConfiguration(byte stepResolution, bool interpolation)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_STEP_CONFIGURATION);
+			LEConverter.To((byte)stepResolution, 8, request);
+			LEConverter.To((bool)interpolation, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the step mode as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetStepConfiguration"/>.
+		/// </summary>
+		public void GetStepConfiguration(out byte stepResolution, out bool interpolation)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STEP_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			stepResolution = LEConverter.ByteFrom(8, response);
+			interpolation = LEConverter.BoolFrom(9, response);
+		}
+
+		/// <summary>
+		///  Sets the current with which the motor will be driven.
+		///  
+		///  <note type="caution">
+		///   Do not set this value above the specifications of your stepper motor.
+		///   Otherwise it may damage your motor.
+		///  </note>
+		/// </summary>
+		public void SetMotorCurrent(int current)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_MOTOR_CURRENT);
+			LEConverter.To((short)current, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetMotorCurrent"/>.
+		/// </summary>
+		public int GetMotorCurrent()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MOTOR_CURRENT);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Enables the driver chip. The driver parameters can be configured (maximum velocity,
+		///  acceleration, etc) before it is enabled.
+		/// </summary>
+		public void SetEnabled(bool enabled)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_ENABLED);
+			LEConverter.To((bool)enabled, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public bool GetEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the basic configuration parameters for the different modes (Stealth, Coolstep, Classic).
+		///  
+		///  * Standstill Current: This value can be used to lower the current during stand still. This might
+		///    be reasonable to reduce the heating of the motor and the Brick. When the motor is in standstill
+		///    the configured motor phase current will be driven until the configured
+		///    Power Down Time is elapsed. After that the phase current will be reduced to the standstill
+		///    current. The elapsed time for this reduction can be configured with the Standstill Delay Time.
+		///    The maximum allowed value is the configured maximum motor current
+		///    (see <see cref="Tinkerforge.BrickletPerformanceStepper.SetMotorCurrent"/>).
+		///  
+		///  * Motor Run Current: The value sets the motor current when the motor is running.
+		///    Use a value of at least one half of the global maximum motor current for a good
+		///    microstep performance. The maximum allowed value is the current
+		///    motor current. The API maps the entered value to 1/32 ... 32/32 of the maximum
+		///    motor current. This value should be used to change the motor current during motor movement,
+		///    whereas the global maximum motor current should not be changed while the motor is moving
+		///    (see <see cref="Tinkerforge.BrickletPerformanceStepper.SetMotorCurrent"/>).
+		///  
+		///  * Standstill Delay Time: Controls the duration for motor power down after a motion
+		///    as soon as standstill is detected and the Power Down Time is expired. A high Standstill Delay
+		///    Time results in a smooth transition that avoids motor jerk during power down.
+		///  
+		///  * Power Down Time: Sets the delay time after a stand still.
+		///  
+		///  * Stealth Threshold: Sets the upper threshold for Stealth mode.
+		///    If the velocity of the motor goes above this value, Stealth mode is turned
+		///    off. Otherwise it is turned on. In Stealth mode the torque declines with high speed.
+		///  
+		///  * Coolstep Threshold: Sets the lower threshold for Coolstep mode.
+		///    The Coolstep Threshold needs to be above the Stealth Threshold.
+		///  
+		///  * Classic Threshold: Sets the lower threshold for classic mode.
+		///    In classic mode the stepper becomes more noisy, but the torque is maximized.
+		///  
+		///  * High Velocity Chopper Mode: If High Velocity Chopper Mode is enabled, the stepper control
+		///    is optimized to run the stepper motors at high velocities.
+		///  
+		///  If you want to use all three thresholds make sure that
+		///  Stealth Threshold &lt; Coolstep Threshold &lt; Classic Threshold.
+		/// </summary>
+		public void SetBasicConfiguration(int standstillCurrent, int motorRunCurrent, int standstillDelayTime, int powerDownTime, int stealthThreshold, int coolstepThreshold, int classicThreshold, bool highVelocityChopperMode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(23, FUNCTION_SET_BASIC_CONFIGURATION);
+			LEConverter.To((short)standstillCurrent, 8, request);
+			LEConverter.To((short)motorRunCurrent, 10, request);
+			LEConverter.To((short)standstillDelayTime, 12, request);
+			LEConverter.To((short)powerDownTime, 14, request);
+			LEConverter.To((short)stealthThreshold, 16, request);
+			LEConverter.To((short)coolstepThreshold, 18, request);
+			LEConverter.To((short)classicThreshold, 20, request);
+			LEConverter.To((bool)highVelocityChopperMode, 22, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetBasicConfiguration"/>.
+		/// </summary>
+		public void GetBasicConfiguration(out int standstillCurrent, out int motorRunCurrent, out int standstillDelayTime, out int powerDownTime, out int stealthThreshold, out int coolstepThreshold, out int classicThreshold, out bool highVelocityChopperMode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BASIC_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 23);
+
+			standstillCurrent = LEConverter.UShortFrom(8, response);
+			motorRunCurrent = LEConverter.UShortFrom(10, response);
+			standstillDelayTime = LEConverter.UShortFrom(12, response);
+			powerDownTime = LEConverter.UShortFrom(14, response);
+			stealthThreshold = LEConverter.UShortFrom(16, response);
+			coolstepThreshold = LEConverter.UShortFrom(18, response);
+			classicThreshold = LEConverter.UShortFrom(20, response);
+			highVelocityChopperMode = LEConverter.BoolFrom(22, response);
+		}
+
+		/// <summary>
+		///  Note: If you don't know what any of this means you can very likely keep all of
+		///  the values as default!
+		///  
+		///  Sets the Spreadcycle configuration parameters. Spreadcycle is a chopper algorithm which actively
+		///  controls the motor current flow. More information can be found in the TMC2130 datasheet on page
+		///  47 (7 spreadCycle and Classic Chopper).
+		///  
+		///  * Slow Decay Duration: Controls duration of off time setting of slow decay phase.
+		///    0 = driver disabled, all bridges off. Use 1 only with Comparator Blank time &gt;= 2.
+		///  
+		///  * High Velocity Fullstep: TODO.
+		///  
+		///  * Fast Decay Duration: Sets the fast decay duration. This parameters is
+		///    only used if the Chopper Mode is set to Fast Decay.
+		///  
+		///  * Hysteresis Start Value: Sets the hysteresis start value. This parameter is
+		///    only used if the Chopper Mode is set to Spread Cycle.
+		///  
+		///  * Hysteresis End Value: Sets the hysteresis end value. This parameter is
+		///    only used if the Chopper Mode is set to Spread Cycle.
+		///  
+		///  * Sine Wave Offset: Sets the sine wave offset. This parameters is
+		///    only used if the Chopper Mode is set to Fast Decay. 1/512 of the value becomes added to the absolute
+		///    value of the sine wave.
+		///  
+		///  * Chopper Mode: 0 = Spread Cycle, 1 = Fast Decay.
+		///  
+		///  * Comparator Blank Time: Sets the blank time of the comparator. Available values are
+		///  
+		///    * 0 = 16 clocks,
+		///    * 1 = 24 clocks,
+		///    * 2 = 36 clocks and
+		///    * 3 = 54 clocks.
+		///  
+		///    A value of 1 or 2 is recommended for most applications.
+		///  
+		///  * Fast Decay Without Comparator: If set to true the current comparator usage for termination of the
+		///    fast decay cycle is disabled.
+		/// </summary>
+		public void SetSpreadcycleConfiguration(byte slowDecayDuration, bool highVelocityFullstep, byte fastDecayDuration, byte hysteresisStartValue, short hysteresisEndValue, short sineWaveOffset, byte chopperMode, byte comparatorBlankTime, bool fastDecayWithoutComparator)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_SET_SPREADCYCLE_CONFIGURATION);
+			LEConverter.To((byte)slowDecayDuration, 8, request);
+			LEConverter.To((bool)highVelocityFullstep, 9, request);
+			LEConverter.To((byte)fastDecayDuration, 10, request);
+			LEConverter.To((byte)hysteresisStartValue, 11, request);
+			LEConverter.To((byte)hysteresisEndValue, 12, request);
+			LEConverter.To((byte)sineWaveOffset, 13, request);
+			LEConverter.To((byte)chopperMode, 14, request);
+			LEConverter.To((byte)comparatorBlankTime, 15, request);
+			LEConverter.To((bool)fastDecayWithoutComparator, 16, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetBasicConfiguration"/>.
+		/// </summary>
+		public void GetSpreadcycleConfiguration(out byte slowDecayDuration, out bool highVelocityFullstep, out bool enableRandomSlowDecay, out byte fastDecayDuration, out byte hysteresisStartValue, out short hysteresisEndValue, out short sineWaveOffset, out byte chopperMode, out byte comparatorBlankTime, out bool fastDecayWithoutComparator)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPREADCYCLE_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 18);
+
+			slowDecayDuration = LEConverter.ByteFrom(8, response);
+			highVelocityFullstep = LEConverter.BoolFrom(9, response);
+			enableRandomSlowDecay = LEConverter.BoolFrom(10, response);
+			fastDecayDuration = LEConverter.ByteFrom(11, response);
+			hysteresisStartValue = LEConverter.ByteFrom(12, response);
+			hysteresisEndValue = LEConverter.SByteFrom(13, response);
+			sineWaveOffset = LEConverter.SByteFrom(14, response);
+			chopperMode = LEConverter.ByteFrom(15, response);
+			comparatorBlankTime = LEConverter.ByteFrom(16, response);
+			fastDecayWithoutComparator = LEConverter.BoolFrom(17, response);
+		}
+
+		/// <summary>
+		///  Note: If you don't know what any of this means you can very likely keep all of
+		///  the values as default!
+		///  
+		///  Sets the configuration relevant for Stealth mode.
+		///  
+		///  * Enable Stealth: If set to true the stealth mode is enabled, if set to false the
+		///    stealth mode is disabled, even if the speed is below the threshold set in <see cref="Tinkerforge.BrickletPerformanceStepper.SetBasicConfiguration"/>.
+		///  
+		///  * Amplitude: If autoscale is disabled, the PWM amplitude is scaled by this value. If autoscale is enabled,
+		///    this value defines the maximum PWM amplitude change per half wave.
+		///  
+		///  * Gradient: If autoscale is disabled, the PWM gradient is scaled by this value. If autoscale is enabled,
+		///    this value defines the maximum PWM gradient. With autoscale a value above 64 is recommended,
+		///    otherwise the regulation might not be able to measure the current.
+		///  
+		///  * Enable Autoscale: If set to true, automatic current control is used. Otherwise the user defined
+		///    amplitude and gradient are used.
+		///  
+		///  * Enable Autogradient: TODO
+		///  
+		///  * Freewheel Mode: The freewheel mode defines the behavior in stand still if the Standstill Current
+		///    (see <see cref="Tinkerforge.BrickletPerformanceStepper.SetBasicConfiguration"/>) is set to 0.
+		/// </summary>
+		public void SetStealthConfiguration(bool enableStealth, byte offset, byte gradient, bool enableAutoscale, bool enableAutogradient, byte freewheelMode, byte regulationLoopGradient, byte amplitudeLimit)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(16, FUNCTION_SET_STEALTH_CONFIGURATION);
+			LEConverter.To((bool)enableStealth, 8, request);
+			LEConverter.To((byte)offset, 9, request);
+			LEConverter.To((byte)gradient, 10, request);
+			LEConverter.To((bool)enableAutoscale, 11, request);
+			LEConverter.To((bool)enableAutogradient, 12, request);
+			LEConverter.To((byte)freewheelMode, 13, request);
+			LEConverter.To((byte)regulationLoopGradient, 14, request);
+			LEConverter.To((byte)amplitudeLimit, 15, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetStealthConfiguration"/>.
+		/// </summary>
+		public void GetStealthConfiguration(out bool enableStealth, out byte offset, out byte gradient, out bool enableAutoscale, out bool enableAutogradient, out byte freewheelMode, out byte regulationLoopGradient, out byte amplitudeLimit)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STEALTH_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 16);
+
+			enableStealth = LEConverter.BoolFrom(8, response);
+			offset = LEConverter.ByteFrom(9, response);
+			gradient = LEConverter.ByteFrom(10, response);
+			enableAutoscale = LEConverter.BoolFrom(11, response);
+			enableAutogradient = LEConverter.BoolFrom(12, response);
+			freewheelMode = LEConverter.ByteFrom(13, response);
+			regulationLoopGradient = LEConverter.ByteFrom(14, response);
+			amplitudeLimit = LEConverter.ByteFrom(15, response);
+		}
+
+		/// <summary>
+		///  Note: If you don't know what any of this means you can very likely keep all of
+		///  the values as default!
+		///  
+		///  Sets the configuration relevant for Coolstep.
+		///  
+		///  * Minimum Stallguard Value: If the Stallguard result falls below this value*32, the motor current
+		///    is increased to reduce motor load angle. A value of 0 turns Coolstep off.
+		///  
+		///  * Maximum Stallguard Value: If the Stallguard result goes above
+		///    (Min Stallguard Value + Max Stallguard Value + 1) * 32, the motor current is decreased to save
+		///    energy.
+		///  
+		///  * Current Up Step Width: Sets the up step increment per Stallguard value. The value range is 0-3,
+		///    corresponding to the increments 1, 2, 4 and 8.
+		///  
+		///  * Current Down Step Width: Sets the down step decrement per Stallguard value. The value range is 0-3,
+		///    corresponding to the decrements 1, 2, 8 and 16.
+		///  
+		///  * Minimum Current: Sets the minimum current for Coolstep current control. You can choose between
+		///    half and quarter of the run current.
+		///  
+		///  * Stallguard Threshold Value: Sets the level for stall output (see <see cref="Tinkerforge.BrickletPerformanceStepper.GetDriverStatus"/>).
+		///    A lower value gives a higher sensitivity. You have to find a suitable value for your
+		///    motor by trial and error, 0 works for most motors.
+		///  
+		///  * Stallguard Mode: Set to 0 for standard resolution or 1 for filtered mode. In filtered mode the Stallguard
+		///    signal will be updated every four full-steps.
+		/// </summary>
+		public void SetCoolstepConfiguration(byte minimumStallguardValue, byte maximumStallguardValue, byte currentUpStepWidth, byte currentDownStepWidth, byte minimumCurrent, short stallguardThresholdValue, byte stallguardMode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(15, FUNCTION_SET_COOLSTEP_CONFIGURATION);
+			LEConverter.To((byte)minimumStallguardValue, 8, request);
+			LEConverter.To((byte)maximumStallguardValue, 9, request);
+			LEConverter.To((byte)currentUpStepWidth, 10, request);
+			LEConverter.To((byte)currentDownStepWidth, 11, request);
+			LEConverter.To((byte)minimumCurrent, 12, request);
+			LEConverter.To((byte)stallguardThresholdValue, 13, request);
+			LEConverter.To((byte)stallguardMode, 14, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetCoolstepConfiguration"/>.
+		/// </summary>
+		public void GetCoolstepConfiguration(out byte minimumStallguardValue, out byte maximumStallguardValue, out byte currentUpStepWidth, out byte currentDownStepWidth, out byte minimumCurrent, out short stallguardThresholdValue, out byte stallguardMode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COOLSTEP_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 15);
+
+			minimumStallguardValue = LEConverter.ByteFrom(8, response);
+			maximumStallguardValue = LEConverter.ByteFrom(9, response);
+			currentUpStepWidth = LEConverter.ByteFrom(10, response);
+			currentDownStepWidth = LEConverter.ByteFrom(11, response);
+			minimumCurrent = LEConverter.ByteFrom(12, response);
+			stallguardThresholdValue = LEConverter.SByteFrom(13, response);
+			stallguardMode = LEConverter.ByteFrom(14, response);
+		}
+
+		/// <summary>
+		///  Note: If you don't know what any of this means you can very likely keep all of
+		///  the values as default!
+		///  
+		///  Sets miscellaneous configuration parameters.
+		///  
+		///  * Disable Short To Ground Protection: Set to false to enable short to ground protection, otherwise
+		///    it is disabled.
+		///  
+		///  * TODO
+		/// </summary>
+		public void SetShortConfiguration(bool disableShortToVoltageProtection, bool disableShortToGroundProtection, byte shortToVoltageLevel, byte shortToGroundLevel, byte spikeFilterBandwidth, bool shortDetectionDelay, byte filterTime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(15, FUNCTION_SET_SHORT_CONFIGURATION);
+			LEConverter.To((bool)disableShortToVoltageProtection, 8, request);
+			LEConverter.To((bool)disableShortToGroundProtection, 9, request);
+			LEConverter.To((byte)shortToVoltageLevel, 10, request);
+			LEConverter.To((byte)shortToGroundLevel, 11, request);
+			LEConverter.To((byte)spikeFilterBandwidth, 12, request);
+			LEConverter.To((bool)shortDetectionDelay, 13, request);
+			LEConverter.To((byte)filterTime, 14, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetShortConfiguration"/>.
+		/// </summary>
+		public void GetShortConfiguration(out bool disableShortToVoltageProtection, out bool disableShortToGroundProtection, out byte shortToVoltageLevel, out byte shortToGroundLevel, out byte spikeFilterBandwidth, out bool shortDetectionDelay, out byte filterTime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SHORT_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 15);
+
+			disableShortToVoltageProtection = LEConverter.BoolFrom(8, response);
+			disableShortToGroundProtection = LEConverter.BoolFrom(9, response);
+			shortToVoltageLevel = LEConverter.ByteFrom(10, response);
+			shortToGroundLevel = LEConverter.ByteFrom(11, response);
+			spikeFilterBandwidth = LEConverter.ByteFrom(12, response);
+			shortDetectionDelay = LEConverter.BoolFrom(13, response);
+			filterTime = LEConverter.ByteFrom(14, response);
+		}
+
+		/// <summary>
+		///  Returns the current driver status.
+		///  
+		///  * Open Load: Indicates if an open load is present on phase A, B or both. This could mean that there is a problem
+		///    with the wiring of the motor. False detection can occur in fast motion as well as during stand still.
+		///  
+		///  * Short To Ground: Indicates if a short to ground is present on phase A, B or both. If this is detected the driver
+		///    automatically becomes disabled and stays disabled until it is enabled again manually.
+		///  
+		///  * Over Temperature: The over temperature indicator switches to "Warning" if the driver IC warms up. The warning flag
+		///    is expected during long duration stepper uses. If the temperature limit is reached the indicator switches
+		///    to "Limit". In this case the driver becomes disabled until it cools down again.
+		///  
+		///  * Motor Stalled: Is true if a motor stall was detected.
+		///  
+		///  * Actual Motor Current: Indicates the actual current control scaling as used in Coolstep mode.
+		///    It represents a multiplier of 1/32 to 32/32 of the
+		///    ``Motor Run Current`` as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetBasicConfiguration"/>. Example: If a ``Motor Run Current``
+		///    of 1000mA was set and the returned value is 15, the ``Actual Motor Current`` is 16/32*1000mA = 500mA.
+		///  
+		///  * Stallguard Result: Indicates the load of the motor. A lower value signals a higher load. Per trial and error
+		///    you can find out which value corresponds to a suitable torque for the velocity used in your application.
+		///    After that you can use this threshold value to find out if a motor stall becomes probable and react on it (e.g.
+		///    decrease velocity).
+		///    During stand still this value can not be used for stall detection, it shows the chopper on-time for motor coil A.
+		///  
+		///  * Stealth Voltage Amplitude: Shows the actual PWM scaling. In Stealth mode it can be used to detect motor load and
+		///    stall if autoscale is enabled (see <see cref="Tinkerforge.BrickletPerformanceStepper.SetStealthConfiguration"/>).
+		/// </summary>
+		public void GetDriverStatus(out byte openLoad, out byte shortToGround, out byte overTemperature, out bool motorStalled, out byte actualMotorCurrent, out bool fullStepActive, out byte stallguardResult, out byte stealthVoltageAmplitude)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DRIVER_STATUS);
+
+			byte[] response = SendRequest(request, 16);
+
+			openLoad = LEConverter.ByteFrom(8, response);
+			shortToGround = LEConverter.ByteFrom(9, response);
+			overTemperature = LEConverter.ByteFrom(10, response);
+			motorStalled = LEConverter.BoolFrom(11, response);
+			actualMotorCurrent = LEConverter.ByteFrom(12, response);
+			fullStepActive = LEConverter.BoolFrom(13, response);
+			stallguardResult = LEConverter.ByteFrom(14, response);
+			stealthVoltageAmplitude = LEConverter.ByteFrom(15, response);
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public int GetInputVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_INPUT_VOLTAGE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public short GetTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public void SetGPIOConfiguration(int debounce, int stopDeceleration)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_SET_GPIO_CONFIGURATION);
+			LEConverter.To((short)debounce, 8, request);
+			LEConverter.To((int)stopDeceleration, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public void GetGPIOConfiguration(out int debounce, out int stopDeceleration)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_GPIO_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			debounce = LEConverter.UShortFrom(8, response);
+			stopDeceleration = LEConverter.IntFrom(10, response);
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public void SetGPIOAction(byte channel, long action)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_GPIO_ACTION);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((int)action, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public long GetGPIOAction(byte channel)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_GPIO_ACTION);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public bool[] GetGPIOState()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_GPIO_STATE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolArrayFrom(8, response, 2);
+		}
+
+		/// <summary>
+		///  Configures the touch LED to be either turned off, turned on, blink in
+		///  heartbeat mode or show TBD.
+		///  
+		///  TODO:
+		///  
+		///  * one second interval blink: Input voltage too small
+		///  * 250ms interval blink: Overtemperature warning
+		///  * full red: motor disabled because of short to ground in phase a or b or because of overtemperature
+		/// </summary>
+		public void SetErrorLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_ERROR_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the LED configuration as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetErrorLEDConfig"/>
+		/// </summary>
+		public byte GetErrorLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ERROR_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Configures the touch LED to be either turned off, turned on, blink in
+		///  heartbeat mode or show TBD.
+		/// </summary>
+		public void SetEnableLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_ENABLE_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the LED configuration as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetEnableLEDConfig"/>
+		/// </summary>
+		public byte GetEnableLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ENABLE_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Configures the touch LED to be either turned off, turned on, blink in
+		///  heartbeat mode or show TBD.
+		/// </summary>
+		public void SetStepsLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STEPS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the LED configuration as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetStepsLEDConfig"/>
+		/// </summary>
+		public byte GetStepsLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STEPS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Configures the touch LED to be either turned off, turned on, blink in
+		///  heartbeat mode or show TBD.
+		/// </summary>
+		public void SetGPIOLEDConfig(byte channel, byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_GPIO_LED_CONFIG);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((byte)config, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the LED configuration as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetGPIOLEDConfig"/>
+		/// </summary>
+		public byte GetGPIOLEDConfig(byte channel)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_GPIO_LED_CONFIG);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public byte WriteRegister(byte register, long value)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_WRITE_REGISTER);
+			LEConverter.To((byte)register, 8, request);
+			LEConverter.To((int)value, 9, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  TBD
+		/// </summary>
+		public void ReadRegister(byte register, out byte status, out long value)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_READ_REGISTER);
+			LEConverter.To((byte)register, 8, request);
+
+			byte[] response = SendRequest(request, 13);
+
+			status = LEConverter.ByteFrom(8, response);
+			value = LEConverter.UIntFrom(9, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletPerformanceStepper.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletPerformanceStepper.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletPerformanceStepper.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletPerformanceStepper.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+	}
+}
@@ -0,0 +1,594 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Communicates with RS232 devices
+	/// </summary>
+	public class BrickletRS232 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 254;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "RS232 Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_READ_CALLBACK = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_READ_CALLBACK = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_READ_CALLBACK_ENABLED = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CONFIGURATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CONFIGURATION = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BREAK_CONDITION = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_FRAME = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_READ = 8;
+
+		private const int CALLBACK_ERROR = 9;
+
+		private const int CALLBACK_FRAME_READABLE = 13;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_300 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_600 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_1200 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_2400 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_4800 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_9600 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_14400 = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_19200 = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_28800 = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_38400 = 9;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_57600 = 10;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_115200 = 11;
+
+		/// <summary>
+		/// </summary>
+		public const byte BAUDRATE_230400 = 12;
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_ODD = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_EVEN = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_FORCED_PARITY_1 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_FORCED_PARITY_0 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte STOPBITS_1 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STOPBITS_2 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_5 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_6 = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_7 = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_8 = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte HARDWARE_FLOWCONTROL_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte HARDWARE_FLOWCONTROL_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte SOFTWARE_FLOWCONTROL_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SOFTWARE_FLOWCONTROL_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_OVERRUN = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_PARITY = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_FRAMING = 4;
+
+
+		/// <summary>
+		///  This callback is called if new data is available. The message has
+		///  a maximum size of 60 characters. The actual length of the message
+		///  is given in addition.
+		///  
+		///  To enable this callback, use <see cref="Tinkerforge.BrickletRS232.EnableReadCallback"/>.
+		/// </summary>
+		public event ReadEventHandler ReadCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ReadEventHandler(BrickletRS232 sender, char[] message, byte length);
+
+		/// <summary>
+		///  This callback is called if an error occurs.
+		///  Possible errors are overrun, parity or framing error.
+		///  
+		///  .. versionadded:: 2.0.1$nbsp;(Plugin)
+		/// </summary>
+		public event ErrorEventHandler ErrorCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ErrorEventHandler(BrickletRS232 sender, byte error);
+
+		/// <summary>
+		///  This callback is called if at least one frame of data is readable. The frame size is configured with <see cref="Tinkerforge.BrickletRS232.SetFrameReadableCallbackConfiguration"/>.
+		///  The frame count parameter is the number of frames that can be read.
+		///  This callback is triggered only once until <see cref="Tinkerforge.BrickletRS232.Read"/> or <see cref="Tinkerforge.BrickletRS232.ReadFrame"/> is called. This means, that if you have configured a frame size of X bytes,
+		///  you can read exactly X bytes using the <see cref="Tinkerforge.BrickletRS232.ReadFrame"/> function, every time the callback triggers without checking the frame count parameter.
+		///  
+		///  .. versionadded:: 2.0.4$nbsp;(Plugin)
+		/// </summary>
+		public event FrameReadableEventHandler FrameReadableCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FrameReadableEventHandler(BrickletRS232 sender, byte frameCount);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletRS232(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 3;
+
+			callbackWrappers[CALLBACK_READ] = new CallbackWrapper(OnReadCallback);
+			callbackWrappers[CALLBACK_ERROR] = new CallbackWrapper(OnErrorCallback);
+			callbackWrappers[CALLBACK_FRAME_READABLE] = new CallbackWrapper(OnFrameReadableCallback);
+
+
+			responseExpected[FUNCTION_WRITE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READ] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_READ_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_DISABLE_READ_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_IS_READ_CALLBACK_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BREAK_CONDITION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READ_FRAME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Writes a string of up to 60 characters to the RS232 interface. The string
+		///  can be binary data, ASCII or similar is not necessary.
+		///  
+		///  The length of the string has to be given as an additional parameter.
+		///  
+		///  The return value is the number of bytes that could be written.
+		///  
+		///  See <see cref="Tinkerforge.BrickletRS232.SetConfiguration"/> for configuration possibilities
+		///  regarding baudrate, parity and so on.
+		/// </summary>
+		public byte Write(char[] message, byte length)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(69, FUNCTION_WRITE);
+			LEConverter.To((char[])message, 8, 60, request);
+			LEConverter.To((byte)length, 68, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the currently buffered message. The maximum length
+		///  of message is 60. If the returned length is 0, no new data was available.
+		///  
+		///  Instead of polling with this function, you can also use
+		///  callbacks. See <see cref="Tinkerforge.BrickletRS232.EnableReadCallback"/> and <see cref="Tinkerforge.BrickletRS232.ReadCallback"/> callback.
+		/// </summary>
+		public void Read(out char[] message, out byte length)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ);
+
+			byte[] response = SendRequest(request, 69);
+
+			message = LEConverter.CharArrayFrom(8, response, 60);
+			length = LEConverter.ByteFrom(68, response);
+		}
+
+		/// <summary>
+		///  Enables the <see cref="Tinkerforge.BrickletRS232.ReadCallback"/> callback. This will disable the <see cref="Tinkerforge.BrickletRS232.FrameReadableCallback"/> callback.
+		///  
+		///  By default the callback is disabled.
+		/// </summary>
+		public void EnableReadCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_READ_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the <see cref="Tinkerforge.BrickletRS232.ReadCallback"/> callback.
+		///  
+		///  By default the callback is disabled.
+		/// </summary>
+		public void DisableReadCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_READ_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the <see cref="Tinkerforge.BrickletRS232.ReadCallback"/> callback is enabled,
+		///  *false* otherwise.
+		/// </summary>
+		public bool IsReadCallbackEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_READ_CALLBACK_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the configuration for the RS232 communication.
+		///  
+		///  Hard-/Software flow control can either be on or off but not both simultaneously on.
+		/// </summary>
+		public void SetConfiguration(byte baudrate, byte parity, byte stopbits, byte wordlength, byte hardwareFlowcontrol, byte softwareFlowcontrol)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_SET_CONFIGURATION);
+			LEConverter.To((byte)baudrate, 8, request);
+			LEConverter.To((byte)parity, 9, request);
+			LEConverter.To((byte)stopbits, 10, request);
+			LEConverter.To((byte)wordlength, 11, request);
+			LEConverter.To((byte)hardwareFlowcontrol, 12, request);
+			LEConverter.To((byte)softwareFlowcontrol, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletRS232.SetConfiguration"/>.
+		/// </summary>
+		public void GetConfiguration(out byte baudrate, out byte parity, out byte stopbits, out byte wordlength, out byte hardwareFlowcontrol, out byte softwareFlowcontrol)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 14);
+
+			baudrate = LEConverter.ByteFrom(8, response);
+			parity = LEConverter.ByteFrom(9, response);
+			stopbits = LEConverter.ByteFrom(10, response);
+			wordlength = LEConverter.ByteFrom(11, response);
+			hardwareFlowcontrol = LEConverter.ByteFrom(12, response);
+			softwareFlowcontrol = LEConverter.ByteFrom(13, response);
+		}
+
+		/// <summary>
+		///  Sets a break condition (the TX output is forced to a logic 0 state).
+		///  The parameter sets the hold-time of the break condition.
+		///  
+		///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+		/// </summary>
+		public void SetBreakCondition(int breakTime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_BREAK_CONDITION);
+			LEConverter.To((short)breakTime, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Configures the <see cref="Tinkerforge.BrickletRS232.FrameReadableCallback"/> callback. The frame size is the number of bytes, that have to be readable to trigger the callback.
+		///  A frame size of 0 disables the callback. A frame size greater than 0 enables the callback and disables the <see cref="Tinkerforge.BrickletRS232.ReadCallback"/> callback.
+		///  
+		///  By default the callback is disabled.
+		///  
+		///  .. versionadded:: 2.0.4$nbsp;(Plugin)
+		/// </summary>
+		public void SetFrameReadableCallbackConfiguration(byte frameSize)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION);
+			LEConverter.To((byte)frameSize, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletRS232.SetFrameReadableCallbackConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.4$nbsp;(Plugin)
+		/// </summary>
+		public byte GetFrameReadableCallbackConfiguration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns up to one frame of bytes from the read buffer.
+		///  The frame size is configured with <see cref="Tinkerforge.BrickletRS232.SetFrameReadableCallbackConfiguration"/>.
+		///  If the returned length is 0, no new data was available.
+		///  
+		///  .. versionadded:: 2.0.4$nbsp;(Plugin)
+		/// </summary>
+		public void ReadFrame(out char[] message, out byte length)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_FRAME);
+
+			byte[] response = SendRequest(request, 69);
+
+			message = LEConverter.CharArrayFrom(8, response, 60);
+			length = LEConverter.ByteFrom(68, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnReadCallback(byte[] response)
+		{
+			if (response.Length != 69)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			char[] message = LEConverter.CharArrayFrom(8, response, 60);
+			byte length = LEConverter.ByteFrom(68, response);
+			var handler = ReadCallback;
+
+			if (handler != null)
+			{
+				handler(this, message, length);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnErrorCallback(byte[] response)
+		{
+			if (response.Length != 9)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte error = LEConverter.ByteFrom(8, response);
+			var handler = ErrorCallback;
+
+			if (handler != null)
+			{
+				handler(this, error);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFrameReadableCallback(byte[] response)
+		{
+			if (response.Length != 9)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte frameCount = LEConverter.ByteFrom(8, response);
+			var handler = FrameReadableCallback;
+
+			if (handler != null)
+			{
+				handler(this, frameCount);
+			}
+		}
+	}
+}
@@ -0,0 +1,1119 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Communicates with RS232 devices
+	/// </summary>
+	public class BrickletRS232V2 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2108;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "RS232 Bricklet 2.0";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_LOW_LEVEL = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_LOW_LEVEL = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_READ_CALLBACK = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_READ_CALLBACK = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_READ_CALLBACK_ENABLED = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CONFIGURATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CONFIGURATION = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BUFFER_CONFIG = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BUFFER_CONFIG = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BUFFER_STATUS = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ERROR_COUNT = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_READ_LOW_LEVEL = 12;
+
+		private const int CALLBACK_ERROR_COUNT = 13;
+
+		private const int CALLBACK_FRAME_READABLE = 16;
+
+		private const int CALLBACK_READ = -12;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_ODD = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_EVEN = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STOPBITS_1 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STOPBITS_2 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_5 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_6 = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_7 = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_8 = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte FLOWCONTROL_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FLOWCONTROL_SOFTWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FLOWCONTROL_HARDWARE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletRS232V2.ReadCallback"/>
+		/// </summary>
+		public event ReadLowLevelEventHandler ReadLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ReadLowLevelEventHandler(BrickletRS232V2 sender, int messageLength, int messageChunkOffset, char[] messageChunkData);
+
+		/// <summary>
+		///  This callback is called if a new error occurs. It returns
+		///  the current overrun and parity error count.
+		/// </summary>
+		public event ErrorCountEventHandler ErrorCountCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ErrorCountEventHandler(BrickletRS232V2 sender, long errorCountOverrun, long errorCountParity);
+
+		/// <summary>
+		///  This callback is called if at least one frame of data is readable. The frame size is configured with <see cref="Tinkerforge.BrickletRS232V2.SetFrameReadableCallbackConfiguration"/>.
+		///  The frame count parameter is the number of frames that can be read.
+		///  This callback is triggered only once until <see cref="Tinkerforge.BrickletRS232V2.Read"/> is called. This means, that if you have configured a frame size of X bytes,
+		///  you can read exactly X bytes using the <see cref="Tinkerforge.BrickletRS232V2.Read"/> function, every time the callback triggers without checking the frame count parameter.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public event FrameReadableEventHandler FrameReadableCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FrameReadableEventHandler(BrickletRS232V2 sender, int frameCount);
+
+		/// <summary>
+		///  This callback is called if new data is available.
+		///  
+		///  To enable this callback, use <see cref="Tinkerforge.BrickletRS232V2.EnableReadCallback"/>.
+		///  
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event ReadEventHandler ReadCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ReadEventHandler(BrickletRS232V2 sender, char[] message);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletRS232V2(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_READ_LOW_LEVEL] = new CallbackWrapper(OnReadLowLevelCallback);
+			callbackWrappers[CALLBACK_ERROR_COUNT] = new CallbackWrapper(OnErrorCountCallback);
+			callbackWrappers[CALLBACK_FRAME_READABLE] = new CallbackWrapper(OnFrameReadableCallback);
+
+			highLevelCallbacks[-CALLBACK_READ] = new HighLevelCallback();
+
+			responseExpected[FUNCTION_WRITE_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READ_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_READ_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_DISABLE_READ_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_IS_READ_CALLBACK_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BUFFER_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_BUFFER_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BUFFER_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Writes characters to the RS232 interface. The characters can be binary data,
+		///  ASCII or similar is not necessary.
+		///  
+		///  The return value is the number of characters that were written.
+		///  
+		///  See <see cref="Tinkerforge.BrickletRS232V2.SetConfiguration"/> for configuration possibilities
+		///  regarding baud rate, parity and so on.
+		/// </summary>
+		public byte WriteLowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 60, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns up to *length* characters from receive buffer.
+		///  
+		///  Instead of polling with this function, you can also use
+		///  callbacks. But note that this function will return available
+		///  data only when the read callback is disabled.
+		///  See <see cref="Tinkerforge.BrickletRS232V2.EnableReadCallback"/> and <see cref="Tinkerforge.BrickletRS232V2.ReadCallback"/> callback.
+		/// </summary>
+		public void ReadLowLevel(int length, out int messageLength, out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_READ_LOW_LEVEL);
+			LEConverter.To((short)length, 8, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageLength = LEConverter.UShortFrom(8, response);
+			messageChunkOffset = LEConverter.UShortFrom(10, response);
+			messageChunkData = LEConverter.CharArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  Enables the <see cref="Tinkerforge.BrickletRS232V2.ReadCallback"/> callback. This will disable the <see cref="Tinkerforge.BrickletRS232V2.FrameReadableCallback"/> callback.
+		///  
+		///  By default the callback is disabled.
+		/// </summary>
+		public void EnableReadCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_READ_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the <see cref="Tinkerforge.BrickletRS232V2.ReadCallback"/> callback.
+		///  
+		///  By default the callback is disabled.
+		/// </summary>
+		public void DisableReadCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_READ_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the <see cref="Tinkerforge.BrickletRS232V2.ReadCallback"/> callback is enabled,
+		///  *false* otherwise.
+		/// </summary>
+		public bool IsReadCallbackEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_READ_CALLBACK_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the configuration for the RS232 communication.
+		/// </summary>
+		public void SetConfiguration(long baudrate, byte parity, byte stopbits, byte wordlength, byte flowcontrol)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(16, FUNCTION_SET_CONFIGURATION);
+			LEConverter.To((int)baudrate, 8, request);
+			LEConverter.To((byte)parity, 12, request);
+			LEConverter.To((byte)stopbits, 13, request);
+			LEConverter.To((byte)wordlength, 14, request);
+			LEConverter.To((byte)flowcontrol, 15, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletRS232V2.SetConfiguration"/>.
+		/// </summary>
+		public void GetConfiguration(out long baudrate, out byte parity, out byte stopbits, out byte wordlength, out byte flowcontrol)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 16);
+
+			baudrate = LEConverter.UIntFrom(8, response);
+			parity = LEConverter.ByteFrom(12, response);
+			stopbits = LEConverter.ByteFrom(13, response);
+			wordlength = LEConverter.ByteFrom(14, response);
+			flowcontrol = LEConverter.ByteFrom(15, response);
+		}
+
+		/// <summary>
+		///  Sets the send and receive buffer size in byte. In total the buffers have to be
+		///  10240 byte (10KiB) in size, the minimum buffer size is 1024 byte (1KiB) for each.
+		///  
+		///  The current buffer content is lost if this function is called.
+		///  
+		///  The send buffer holds data that is given by <see cref="Tinkerforge.BrickletRS232V2.Write"/> and
+		///  can not be written yet. The receive buffer holds data that is
+		///  received through RS232 but could not yet be send to the
+		///  user, either by <see cref="Tinkerforge.BrickletRS232V2.Read"/> or through <see cref="Tinkerforge.BrickletRS232V2.ReadCallback"/> callback.
+		/// </summary>
+		public void SetBufferConfig(int sendBufferSize, int receiveBufferSize)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_BUFFER_CONFIG);
+			LEConverter.To((short)sendBufferSize, 8, request);
+			LEConverter.To((short)receiveBufferSize, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the buffer configuration as set by <see cref="Tinkerforge.BrickletRS232V2.SetBufferConfig"/>.
+		/// </summary>
+		public void GetBufferConfig(out int sendBufferSize, out int receiveBufferSize)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BUFFER_CONFIG);
+
+			byte[] response = SendRequest(request, 12);
+
+			sendBufferSize = LEConverter.UShortFrom(8, response);
+			receiveBufferSize = LEConverter.UShortFrom(10, response);
+		}
+
+		/// <summary>
+		///  Returns the currently used bytes for the send and received buffer.
+		///  
+		///  See <see cref="Tinkerforge.BrickletRS232V2.SetBufferConfig"/> for buffer size configuration.
+		/// </summary>
+		public void GetBufferStatus(out int sendBufferUsed, out int receiveBufferUsed)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BUFFER_STATUS);
+
+			byte[] response = SendRequest(request, 12);
+
+			sendBufferUsed = LEConverter.UShortFrom(8, response);
+			receiveBufferUsed = LEConverter.UShortFrom(10, response);
+		}
+
+		/// <summary>
+		///  Returns the current number of overrun and parity errors.
+		/// </summary>
+		public void GetErrorCount(out long errorCountOverrun, out long errorCountParity)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 16);
+
+			errorCountOverrun = LEConverter.UIntFrom(8, response);
+			errorCountParity = LEConverter.UIntFrom(12, response);
+		}
+
+		/// <summary>
+		///  Configures the <see cref="Tinkerforge.BrickletRS232V2.FrameReadableCallback"/> callback. The frame size is the number of bytes, that have to be readable to trigger the callback.
+		///  A frame size of 0 disables the callback. A frame size greater than 0 enables the callback and disables the <see cref="Tinkerforge.BrickletRS232V2.ReadCallback"/> callback.
+		///  
+		///  By default the callback is disabled.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public void SetFrameReadableCallbackConfiguration(int frameSize)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION);
+			LEConverter.To((short)frameSize, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletRS232V2.SetFrameReadableCallbackConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+		/// </summary>
+		public int GetFrameReadableCallbackConfiguration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletRS232V2.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletRS232V2.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletRS232V2.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletRS232V2.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Writes characters to the RS232 interface. The characters can be binary data,
+		///  ASCII or similar is not necessary.
+		///  
+		///  The return value is the number of characters that were written.
+		///  
+		///  See <see cref="Tinkerforge.BrickletRS232V2.SetConfiguration"/> for configuration possibilities
+		///  regarding baud rate, parity and so on.
+		/// </summary>
+		public int Write(char[] message)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageWritten = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 60);
+
+				messageChunkWritten = WriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+						messageChunkWritten = WriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 60)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 60;
+					}
+				}
+			}
+
+			return messageWritten;
+		}
+
+		/// <summary>
+		///  Returns up to *length* characters from receive buffer.
+		///  
+		///  Instead of polling with this function, you can also use
+		///  callbacks. But note that this function will return available
+		///  data only when the read callback is disabled.
+		///  See <see cref="Tinkerforge.BrickletRS232V2.EnableReadCallback"/> and <see cref="Tinkerforge.BrickletRS232V2.ReadCallback"/> callback.
+		/// </summary>
+		public char[] Read(int length)
+		{
+			char[] message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = 0;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				ReadLowLevel(length, out messageLength, out messageChunkOffset, out messageChunkData);
+
+				messageOutOfSync = messageChunkOffset != 0;
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						ReadLowLevel(length, out messageLength, out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 60 < messageLength)
+					{
+						ReadLowLevel(length, out messageLength, out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+
+			return message;
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnReadLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int messageLength = LEConverter.UShortFrom(8, response);
+			int messageChunkOffset = LEConverter.UShortFrom(10, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(12, response, 60);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_READ];
+			int messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+			var highLevelHandler = ReadCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[messageLength];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, (char[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = ReadLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, messageLength, messageChunkOffset, messageChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnErrorCountCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long errorCountOverrun = LEConverter.UIntFrom(8, response);
+			long errorCountParity = LEConverter.UIntFrom(12, response);
+			var handler = ErrorCountCallback;
+
+			if (handler != null)
+			{
+				handler(this, errorCountOverrun, errorCountParity);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFrameReadableCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int frameCount = LEConverter.UShortFrom(8, response);
+			var handler = FrameReadableCallback;
+
+			if (handler != null)
+			{
+				handler(this, frameCount);
+			}
+		}
+	}
+}
@@ -0,0 +1,3520 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Communicates with RS485/Modbus devices with full- or half-duplex
+	/// </summary>
+	public class BrickletRS485 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 277;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "RS485 Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_LOW_LEVEL = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_LOW_LEVEL = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_READ_CALLBACK = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_READ_CALLBACK = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_READ_CALLBACK_ENABLED = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RS485_CONFIGURATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RS485_CONFIGURATION = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MODBUS_CONFIGURATION = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MODBUS_CONFIGURATION = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_MODE = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MODE = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_COMMUNICATION_LED_CONFIG = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_COMMUNICATION_LED_CONFIG = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ERROR_LED_CONFIG = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ERROR_LED_CONFIG = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BUFFER_CONFIG = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BUFFER_CONFIG = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BUFFER_STATUS = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_ENABLE_ERROR_COUNT_CALLBACK = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DISABLE_ERROR_COUNT_CALLBACK = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_IS_ERROR_COUNT_CALLBACK_ENABLED = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ERROR_COUNT = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_MODBUS_COMMON_ERROR_COUNT = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_SLAVE_REPORT_EXCEPTION = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_SLAVE_ANSWER_READ_COILS_REQUEST_LOW_LEVEL = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_MASTER_READ_COILS = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_SLAVE_ANSWER_READ_HOLDING_REGISTERS_REQUEST_LOW_LEVEL = 27;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_MASTER_READ_HOLDING_REGISTERS = 28;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_COIL_REQUEST = 29;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_MASTER_WRITE_SINGLE_COIL = 30;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_REGISTER_REQUEST = 31;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_MASTER_WRITE_SINGLE_REGISTER = 32;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_COILS_REQUEST = 33;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL = 34;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_REGISTERS_REQUEST = 35;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL = 36;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_SLAVE_ANSWER_READ_DISCRETE_INPUTS_REQUEST_LOW_LEVEL = 37;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_MASTER_READ_DISCRETE_INPUTS = 38;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_SLAVE_ANSWER_READ_INPUT_REGISTERS_REQUEST_LOW_LEVEL = 39;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_MODBUS_MASTER_READ_INPUT_REGISTERS = 40;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION = 59;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION = 60;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_READ_LOW_LEVEL = 41;
+
+		private const int CALLBACK_ERROR_COUNT = 42;
+
+		private const int CALLBACK_MODBUS_SLAVE_READ_COILS_REQUEST = 43;
+
+		private const int CALLBACK_MODBUS_MASTER_READ_COILS_RESPONSE_LOW_LEVEL = 44;
+
+		private const int CALLBACK_MODBUS_SLAVE_READ_HOLDING_REGISTERS_REQUEST = 45;
+
+		private const int CALLBACK_MODBUS_MASTER_READ_HOLDING_REGISTERS_RESPONSE_LOW_LEVEL = 46;
+
+		private const int CALLBACK_MODBUS_SLAVE_WRITE_SINGLE_COIL_REQUEST = 47;
+
+		private const int CALLBACK_MODBUS_MASTER_WRITE_SINGLE_COIL_RESPONSE = 48;
+
+		private const int CALLBACK_MODBUS_SLAVE_WRITE_SINGLE_REGISTER_REQUEST = 49;
+
+		private const int CALLBACK_MODBUS_MASTER_WRITE_SINGLE_REGISTER_RESPONSE = 50;
+
+		private const int CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_COILS_REQUEST_LOW_LEVEL = 51;
+
+		private const int CALLBACK_MODBUS_MASTER_WRITE_MULTIPLE_COILS_RESPONSE = 52;
+
+		private const int CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_REGISTERS_REQUEST_LOW_LEVEL = 53;
+
+		private const int CALLBACK_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_RESPONSE = 54;
+
+		private const int CALLBACK_MODBUS_SLAVE_READ_DISCRETE_INPUTS_REQUEST = 55;
+
+		private const int CALLBACK_MODBUS_MASTER_READ_DISCRETE_INPUTS_RESPONSE_LOW_LEVEL = 56;
+
+		private const int CALLBACK_MODBUS_SLAVE_READ_INPUT_REGISTERS_REQUEST = 57;
+
+		private const int CALLBACK_MODBUS_MASTER_READ_INPUT_REGISTERS_RESPONSE_LOW_LEVEL = 58;
+
+		private const int CALLBACK_FRAME_READABLE = 61;
+
+		private const int CALLBACK_READ = -41;
+
+		private const int CALLBACK_MODBUS_MASTER_READ_COILS_RESPONSE = -44;
+
+		private const int CALLBACK_MODBUS_MASTER_READ_HOLDING_REGISTERS_RESPONSE = -46;
+
+		private const int CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_COILS_REQUEST = -51;
+
+		private const int CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_REGISTERS_REQUEST = -53;
+
+		private const int CALLBACK_MODBUS_MASTER_READ_DISCRETE_INPUTS_RESPONSE = -56;
+
+		private const int CALLBACK_MODBUS_MASTER_READ_INPUT_REGISTERS_RESPONSE = -58;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_NONE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_ODD = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte PARITY_EVEN = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STOPBITS_1 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STOPBITS_2 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_5 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_6 = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_7 = 7;
+
+		/// <summary>
+		/// </summary>
+		public const byte WORDLENGTH_8 = 8;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUPLEX_HALF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte DUPLEX_FULL = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_RS485 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_MODBUS_MASTER_RTU = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte MODE_MODBUS_SLAVE_RTU = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COMMUNICATION_LED_CONFIG_SHOW_COMMUNICATION = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte ERROR_LED_CONFIG_SHOW_ERROR = 3;
+
+		/// <summary>
+		/// </summary>
+		public const short EXCEPTION_CODE_TIMEOUT = -1;
+
+		/// <summary>
+		/// </summary>
+		public const short EXCEPTION_CODE_SUCCESS = 0;
+
+		/// <summary>
+		/// </summary>
+		public const short EXCEPTION_CODE_ILLEGAL_FUNCTION = 1;
+
+		/// <summary>
+		/// </summary>
+		public const short EXCEPTION_CODE_ILLEGAL_DATA_ADDRESS = 2;
+
+		/// <summary>
+		/// </summary>
+		public const short EXCEPTION_CODE_ILLEGAL_DATA_VALUE = 3;
+
+		/// <summary>
+		/// </summary>
+		public const short EXCEPTION_CODE_SLAVE_DEVICE_FAILURE = 4;
+
+		/// <summary>
+		/// </summary>
+		public const short EXCEPTION_CODE_ACKNOWLEDGE = 5;
+
+		/// <summary>
+		/// </summary>
+		public const short EXCEPTION_CODE_SLAVE_DEVICE_BUSY = 6;
+
+		/// <summary>
+		/// </summary>
+		public const short EXCEPTION_CODE_MEMORY_PARITY_ERROR = 8;
+
+		/// <summary>
+		/// </summary>
+		public const short EXCEPTION_CODE_GATEWAY_PATH_UNAVAILABLE = 10;
+
+		/// <summary>
+		/// </summary>
+		public const short EXCEPTION_CODE_GATEWAY_TARGET_DEVICE_FAILED_TO_RESPOND = 11;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletRS485.ReadCallback"/>
+		/// </summary>
+		public event ReadLowLevelEventHandler ReadLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ReadLowLevelEventHandler(BrickletRS485 sender, int messageLength, int messageChunkOffset, char[] messageChunkData);
+
+		/// <summary>
+		///  This callback is called if a new error occurs. It returns
+		///  the current overrun and parity error count.
+		/// </summary>
+		public event ErrorCountEventHandler ErrorCountCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ErrorCountEventHandler(BrickletRS485 sender, long overrunErrorCount, long parityErrorCount);
+
+		/// <summary>
+		///  This callback is called only in Modbus slave mode when the slave receives a
+		///  valid request from a Modbus master to read coils. The parameters are
+		///  request ID of the request, the number of the first coil to be read and the number of coils to
+		///  be read as received by the request. The number of the first coil is called starting address for backwards compatibility reasons.
+		///  It is not an address, but instead a coil number in the range of 1 to 65536.
+		///  
+		///  To send a response of this request use <see cref="Tinkerforge.BrickletRS485.ModbusSlaveAnswerReadCoilsRequest"/>.
+		/// </summary>
+		public event ModbusSlaveReadCoilsRequestEventHandler ModbusSlaveReadCoilsRequestCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusSlaveReadCoilsRequestEventHandler(BrickletRS485 sender, byte requestID, long startingAddress, int count);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletRS485.ModbusMasterReadCoilsResponseCallback"/>
+		/// </summary>
+		public event ModbusMasterReadCoilsResponseLowLevelEventHandler ModbusMasterReadCoilsResponseLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterReadCoilsResponseLowLevelEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode, int coilsLength, int coilsChunkOffset, bool[] coilsChunkData);
+
+		/// <summary>
+		///  This callback is called only in Modbus slave mode when the slave receives a
+		///  valid request from a Modbus master to read holding registers. The parameters
+		///  are request ID of the request, the number of the first holding register to be read and the number of holding
+		///  registers to be read as received by the request. The number of the first holding register is called starting address for backwards compatibility reasons.
+		///  It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is omitted.
+		///  
+		///  To send a response of this request use <see cref="Tinkerforge.BrickletRS485.ModbusSlaveAnswerReadHoldingRegistersRequest"/>.
+		/// </summary>
+		public event ModbusSlaveReadHoldingRegistersRequestEventHandler ModbusSlaveReadHoldingRegistersRequestCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusSlaveReadHoldingRegistersRequestEventHandler(BrickletRS485 sender, byte requestID, long startingAddress, int count);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletRS485.ModbusMasterReadHoldingRegistersResponseCallback"/>
+		/// </summary>
+		public event ModbusMasterReadHoldingRegistersResponseLowLevelEventHandler ModbusMasterReadHoldingRegistersResponseLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterReadHoldingRegistersResponseLowLevelEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode, int holdingRegistersLength, int holdingRegistersChunkOffset, int[] holdingRegistersChunkData);
+
+		/// <summary>
+		///  This callback is called only in Modbus slave mode when the slave receives a
+		///  valid request from a Modbus master to write a single coil. The parameters
+		///  are request ID of the request, the number of the coil and the value of coil to be
+		///  written as received by the request. The number of the coil is called coil address for backwards compatibility reasons.
+		///  It is not an address, but instead a coil number in the range of 1 to 65536.
+		///  
+		///  To send a response of this request use <see cref="Tinkerforge.BrickletRS485.ModbusSlaveAnswerWriteSingleCoilRequest"/>.
+		/// </summary>
+		public event ModbusSlaveWriteSingleCoilRequestEventHandler ModbusSlaveWriteSingleCoilRequestCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusSlaveWriteSingleCoilRequestEventHandler(BrickletRS485 sender, byte requestID, long coilAddress, bool coilValue);
+
+		/// <summary>
+		///  This callback is called only in Modbus master mode when the master receives a
+		///  valid response of a request to write a single coil.
+		///  
+		///  The parameters are
+		///  request ID of the request and exception code of the response.
+		///  
+		///  Any non-zero exception code indicates a problem.
+		///  If the exception code is greater than 0 then the number represents a Modbus
+		///  exception code. If it is less than 0 then it represents other errors. For
+		///  example, -1 indicates that the request timed out or that the master did not receive
+		///  any valid response of the request within the master request timeout period as set
+		///  by <see cref="Tinkerforge.BrickletRS485.SetModbusConfiguration"/>.
+		/// </summary>
+		public event ModbusMasterWriteSingleCoilResponseEventHandler ModbusMasterWriteSingleCoilResponseCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterWriteSingleCoilResponseEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode);
+
+		/// <summary>
+		///  This callback is called only in Modbus slave mode when the slave receives a
+		///  valid request from a Modbus master to write a single holding register. The parameters
+		///  are request ID of the request, the number of the holding register and the register value to
+		///  be written as received by the request. The number of the holding register is called starting address for backwards compatibility reasons.
+		///  It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is omitted.
+		///  
+		///  To send a response of this request use <see cref="Tinkerforge.BrickletRS485.ModbusSlaveAnswerWriteSingleRegisterRequest"/>.
+		/// </summary>
+		public event ModbusSlaveWriteSingleRegisterRequestEventHandler ModbusSlaveWriteSingleRegisterRequestCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusSlaveWriteSingleRegisterRequestEventHandler(BrickletRS485 sender, byte requestID, long registerAddress, int registerValue);
+
+		/// <summary>
+		///  This callback is called only in Modbus master mode when the master receives a
+		///  valid response of a request to write a single register.
+		///  
+		///  The parameters are
+		///  request ID of the request and exception code of the response.
+		///  
+		///  Any non-zero exception code
+		///  indicates a problem. If the exception code is greater than 0 then the number
+		///  represents a Modbus exception code. If it is less than 0 then it represents
+		///  other errors. For example, -1 indicates that the request timed out or that the
+		///  master did not receive any valid response of the request within the master request
+		///  timeout period as set by <see cref="Tinkerforge.BrickletRS485.SetModbusConfiguration"/>.
+		/// </summary>
+		public event ModbusMasterWriteSingleRegisterResponseEventHandler ModbusMasterWriteSingleRegisterResponseCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterWriteSingleRegisterResponseEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletRS485.ModbusSlaveWriteMultipleCoilsRequestCallback"/>
+		/// </summary>
+		public event ModbusSlaveWriteMultipleCoilsRequestLowLevelEventHandler ModbusSlaveWriteMultipleCoilsRequestLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusSlaveWriteMultipleCoilsRequestLowLevelEventHandler(BrickletRS485 sender, byte requestID, long startingAddress, int coilsLength, int coilsChunkOffset, bool[] coilsChunkData);
+
+		/// <summary>
+		///  This callback is called only in Modbus master mode when the master receives a
+		///  valid response of a request to read coils.
+		///  
+		///  The parameters are
+		///  request ID of the request and exception code of the response.
+		///  
+		///  Any non-zero exception code
+		///  indicates a problem. If the exception code is greater than 0 then the number
+		///  represents a Modbus exception code. If it is less than 0 then it represents
+		///  other errors. For example, -1 indicates that the request timedout or that the
+		///  master did not receive any valid response of the request within the master request
+		///  timeout period as set by <see cref="Tinkerforge.BrickletRS485.SetModbusConfiguration"/>.
+		/// </summary>
+		public event ModbusMasterWriteMultipleCoilsResponseEventHandler ModbusMasterWriteMultipleCoilsResponseCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterWriteMultipleCoilsResponseEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletRS485.ModbusSlaveWriteMultipleRegistersRequestCallback"/>
+		/// </summary>
+		public event ModbusSlaveWriteMultipleRegistersRequestLowLevelEventHandler ModbusSlaveWriteMultipleRegistersRequestLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusSlaveWriteMultipleRegistersRequestLowLevelEventHandler(BrickletRS485 sender, byte requestID, long startingAddress, int registersLength, int registersChunkOffset, int[] registersChunkData);
+
+		/// <summary>
+		///  This callback is called only in Modbus master mode when the master receives a
+		///  valid response of a request to write multiple registers.
+		///  
+		///  The parameters
+		///  are request ID of the request and exception code of the response.
+		///  
+		///  Any non-zero
+		///  exception code indicates a problem. If the exception code is greater than 0 then
+		///  the number represents a Modbus exception code. If it is less than 0 then it
+		///  represents other errors. For example, -1 indicates that the request timedout or
+		///  that the master did not receive any valid response of the request within the master
+		///  request timeout period as set by <see cref="Tinkerforge.BrickletRS485.SetModbusConfiguration"/>.
+		/// </summary>
+		public event ModbusMasterWriteMultipleRegistersResponseEventHandler ModbusMasterWriteMultipleRegistersResponseCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterWriteMultipleRegistersResponseEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode);
+
+		/// <summary>
+		///  This callback is called only in Modbus slave mode when the slave receives a
+		///  valid request from a Modbus master to read discrete inputs. The parameters
+		///  are request ID of the request, the number of the first discrete input and the number of discrete
+		///  inputs to be read as received by the request. The number of the first discrete input is called starting address for backwards compatibility reasons.
+		///  It is not an address, but instead a discrete input number in the range of 1 to 65536. The prefix digit 1 (for discrete input) is omitted.
+		///  
+		///  To send a response of this request use <see cref="Tinkerforge.BrickletRS485.ModbusSlaveAnswerReadDiscreteInputsRequest"/>.
+		/// </summary>
+		public event ModbusSlaveReadDiscreteInputsRequestEventHandler ModbusSlaveReadDiscreteInputsRequestCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusSlaveReadDiscreteInputsRequestEventHandler(BrickletRS485 sender, byte requestID, long startingAddress, int count);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletRS485.ModbusMasterReadDiscreteInputsResponseCallback"/>
+		/// </summary>
+		public event ModbusMasterReadDiscreteInputsResponseLowLevelEventHandler ModbusMasterReadDiscreteInputsResponseLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterReadDiscreteInputsResponseLowLevelEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode, int discreteInputsLength, int discreteInputsChunkOffset, bool[] discreteInputsChunkData);
+
+		/// <summary>
+		///  This callback is called only in Modbus slave mode when the slave receives a
+		///  valid request from a Modbus master to read input registers. The parameters
+		///  are request ID of the request, the number of the first input register and the number of input
+		///  registers to be read as received by the request. The number of the first input register is called starting address for backwards compatibility reasons.
+		///  It is not an address, but instead a input register number in the range of 1 to 65536. The prefix digit 3 (for input register) is omitted.
+		///  
+		///  To send a response of this request use <see cref="Tinkerforge.BrickletRS485.ModbusSlaveAnswerReadInputRegistersRequest"/>.
+		/// </summary>
+		public event ModbusSlaveReadInputRegistersRequestEventHandler ModbusSlaveReadInputRegistersRequestCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusSlaveReadInputRegistersRequestEventHandler(BrickletRS485 sender, byte requestID, long startingAddress, int count);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletRS485.ModbusMasterReadInputRegistersResponseCallback"/>
+		/// </summary>
+		public event ModbusMasterReadInputRegistersResponseLowLevelEventHandler ModbusMasterReadInputRegistersResponseLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterReadInputRegistersResponseLowLevelEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode, int inputRegistersLength, int inputRegistersChunkOffset, int[] inputRegistersChunkData);
+
+		/// <summary>
+		///  This callback is called if at least one frame of data is readable. The frame size is configured with <see cref="Tinkerforge.BrickletRS485.SetFrameReadableCallbackConfiguration"/>.
+		///  The frame count parameter is the number of frames that can be read.
+		///  This callback is triggered only once until <see cref="Tinkerforge.BrickletRS485.Read"/> is called. This means, that if you have configured a frame size of X bytes,
+		///  you can read exactly X bytes using the <see cref="Tinkerforge.BrickletRS485.Read"/> function, every time the callback triggers without checking the frame count parameter.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Plugin)
+		/// </summary>
+		public event FrameReadableEventHandler FrameReadableCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FrameReadableEventHandler(BrickletRS485 sender, int frameCount);
+
+		/// <summary>
+		///  This callback is called if new data is available.
+		///  
+		///  To enable this callback, use <see cref="Tinkerforge.BrickletRS485.EnableReadCallback"/>.
+		///  
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event ReadEventHandler ReadCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ReadEventHandler(BrickletRS485 sender, char[] message);
+
+		/// <summary>
+		///  This callback is called only in Modbus master mode when the master receives a
+		///  valid response of a request to read coils.
+		///  
+		///  The parameters are request ID
+		///  of the request, exception code of the response and the data as received by the
+		///  response.
+		///  
+		///  Any non-zero exception code indicates a problem. If the exception code
+		///  is greater than 0 then the number represents a Modbus exception code. If it is
+		///  less than 0 then it represents other errors. For example, -1 indicates that
+		///  the request timed out or that the master did not receive any valid response of the
+		///  request within the master request timeout period as set by
+		///  <see cref="Tinkerforge.BrickletRS485.SetModbusConfiguration"/>.
+		///  
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for coils.
+		///  </note>
+		/// </summary>
+		public event ModbusMasterReadCoilsResponseEventHandler ModbusMasterReadCoilsResponseCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterReadCoilsResponseEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode, bool[] coils);
+
+		/// <summary>
+		///  This callback is called only in Modbus master mode when the master receives a
+		///  valid response of a request to read holding registers.
+		///  
+		///  The parameters are
+		///  request ID of the request, exception code of the response and the data as received
+		///  by the response.
+		///  
+		///  Any non-zero exception code indicates a problem. If the exception
+		///  code is greater than 0 then the number represents a Modbus exception code. If
+		///  it is less than 0 then it represents other errors. For example, -1 indicates that
+		///  the request timed out or that the master did not receive any valid response of the
+		///  request within the master request timeout period as set by
+		///  <see cref="Tinkerforge.BrickletRS485.SetModbusConfiguration"/>.
+		///  
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for holdingRegisters.
+		///  </note>
+		/// </summary>
+		public event ModbusMasterReadHoldingRegistersResponseEventHandler ModbusMasterReadHoldingRegistersResponseCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterReadHoldingRegistersResponseEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode, int[] holdingRegisters);
+
+		/// <summary>
+		///  This callback is called only in Modbus slave mode when the slave receives a
+		///  valid request from a Modbus master to write multiple coils. The parameters
+		///  are request ID of the request, the number of the first coil and the data to be written as
+		///  received by the request. The number of the first coil is called starting address for backwards compatibility reasons.
+		///  It is not an address, but instead a coil number in the range of 1 to 65536.
+		///  
+		///  To send a response of this request use <see cref="Tinkerforge.BrickletRS485.ModbusSlaveAnswerWriteMultipleCoilsRequest"/>.
+		///  
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for coils.
+		///  </note>
+		/// </summary>
+		public event ModbusSlaveWriteMultipleCoilsRequestEventHandler ModbusSlaveWriteMultipleCoilsRequestCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusSlaveWriteMultipleCoilsRequestEventHandler(BrickletRS485 sender, byte requestID, long startingAddress, bool[] coils);
+
+		/// <summary>
+		///  This callback is called only in Modbus slave mode when the slave receives a
+		///  valid request from a Modbus master to write multiple holding registers. The parameters
+		///  are request ID of the request, the number of the first holding register and the data to be written as
+		///  received by the request. The number of the first holding register is called starting address for backwards compatibility reasons.
+		///  It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is omitted.
+		///  
+		///  To send a response of this request use <see cref="Tinkerforge.BrickletRS485.ModbusSlaveAnswerWriteMultipleRegistersRequest"/>.
+		///  
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for registers.
+		///  </note>
+		/// </summary>
+		public event ModbusSlaveWriteMultipleRegistersRequestEventHandler ModbusSlaveWriteMultipleRegistersRequestCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusSlaveWriteMultipleRegistersRequestEventHandler(BrickletRS485 sender, byte requestID, long startingAddress, int[] registers);
+
+		/// <summary>
+		///  This callback is called only in Modbus master mode when the master receives a
+		///  valid response of a request to read discrete inputs.
+		///  
+		///  The parameters are
+		///  request ID of the request, exception code of the response and the data as received
+		///  by the response.
+		///  
+		///  Any non-zero exception code indicates a problem. If the exception
+		///  code is greater than 0 then the number represents a Modbus exception code. If
+		///  it is less than 0 then it represents other errors. For example, -1 indicates that
+		///  the request timedout or that the master did not receive any valid response of the
+		///  request within the master request timeout period as set by
+		///  <see cref="Tinkerforge.BrickletRS485.SetModbusConfiguration"/>.
+		///  
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for discreteInputs.
+		///  </note>
+		/// </summary>
+		public event ModbusMasterReadDiscreteInputsResponseEventHandler ModbusMasterReadDiscreteInputsResponseCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterReadDiscreteInputsResponseEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode, bool[] discreteInputs);
+
+		/// <summary>
+		///  This callback is called only in Modbus master mode when the master receives a
+		///  valid response of a request to read input registers.
+		///  
+		///  The parameters are
+		///  request ID of the request, exception code of the response and the data as received
+		///  by the response.
+		///  
+		///  Any non-zero exception code indicates a problem. If the exception
+		///  code is greater than 0 then the number represents a Modbus exception code. If
+		///  it is less than 0 then it represents other errors. For example, -1 indicates that
+		///  the request timedout or that the master did not receive any valid response of the
+		///  request within the master request timeout period as set by
+		///  <see cref="Tinkerforge.BrickletRS485.SetModbusConfiguration"/>.
+		///  
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for inputRegisters.
+		///  </note>
+		/// </summary>
+		public event ModbusMasterReadInputRegistersResponseEventHandler ModbusMasterReadInputRegistersResponseCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void ModbusMasterReadInputRegistersResponseEventHandler(BrickletRS485 sender, byte requestID, short exceptionCode, int[] inputRegisters);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletRS485(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_READ_LOW_LEVEL] = new CallbackWrapper(OnReadLowLevelCallback);
+			callbackWrappers[CALLBACK_ERROR_COUNT] = new CallbackWrapper(OnErrorCountCallback);
+			callbackWrappers[CALLBACK_MODBUS_SLAVE_READ_COILS_REQUEST] = new CallbackWrapper(OnModbusSlaveReadCoilsRequestCallback);
+			callbackWrappers[CALLBACK_MODBUS_MASTER_READ_COILS_RESPONSE_LOW_LEVEL] = new CallbackWrapper(OnModbusMasterReadCoilsResponseLowLevelCallback);
+			callbackWrappers[CALLBACK_MODBUS_SLAVE_READ_HOLDING_REGISTERS_REQUEST] = new CallbackWrapper(OnModbusSlaveReadHoldingRegistersRequestCallback);
+			callbackWrappers[CALLBACK_MODBUS_MASTER_READ_HOLDING_REGISTERS_RESPONSE_LOW_LEVEL] = new CallbackWrapper(OnModbusMasterReadHoldingRegistersResponseLowLevelCallback);
+			callbackWrappers[CALLBACK_MODBUS_SLAVE_WRITE_SINGLE_COIL_REQUEST] = new CallbackWrapper(OnModbusSlaveWriteSingleCoilRequestCallback);
+			callbackWrappers[CALLBACK_MODBUS_MASTER_WRITE_SINGLE_COIL_RESPONSE] = new CallbackWrapper(OnModbusMasterWriteSingleCoilResponseCallback);
+			callbackWrappers[CALLBACK_MODBUS_SLAVE_WRITE_SINGLE_REGISTER_REQUEST] = new CallbackWrapper(OnModbusSlaveWriteSingleRegisterRequestCallback);
+			callbackWrappers[CALLBACK_MODBUS_MASTER_WRITE_SINGLE_REGISTER_RESPONSE] = new CallbackWrapper(OnModbusMasterWriteSingleRegisterResponseCallback);
+			callbackWrappers[CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_COILS_REQUEST_LOW_LEVEL] = new CallbackWrapper(OnModbusSlaveWriteMultipleCoilsRequestLowLevelCallback);
+			callbackWrappers[CALLBACK_MODBUS_MASTER_WRITE_MULTIPLE_COILS_RESPONSE] = new CallbackWrapper(OnModbusMasterWriteMultipleCoilsResponseCallback);
+			callbackWrappers[CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_REGISTERS_REQUEST_LOW_LEVEL] = new CallbackWrapper(OnModbusSlaveWriteMultipleRegistersRequestLowLevelCallback);
+			callbackWrappers[CALLBACK_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_RESPONSE] = new CallbackWrapper(OnModbusMasterWriteMultipleRegistersResponseCallback);
+			callbackWrappers[CALLBACK_MODBUS_SLAVE_READ_DISCRETE_INPUTS_REQUEST] = new CallbackWrapper(OnModbusSlaveReadDiscreteInputsRequestCallback);
+			callbackWrappers[CALLBACK_MODBUS_MASTER_READ_DISCRETE_INPUTS_RESPONSE_LOW_LEVEL] = new CallbackWrapper(OnModbusMasterReadDiscreteInputsResponseLowLevelCallback);
+			callbackWrappers[CALLBACK_MODBUS_SLAVE_READ_INPUT_REGISTERS_REQUEST] = new CallbackWrapper(OnModbusSlaveReadInputRegistersRequestCallback);
+			callbackWrappers[CALLBACK_MODBUS_MASTER_READ_INPUT_REGISTERS_RESPONSE_LOW_LEVEL] = new CallbackWrapper(OnModbusMasterReadInputRegistersResponseLowLevelCallback);
+			callbackWrappers[CALLBACK_FRAME_READABLE] = new CallbackWrapper(OnFrameReadableCallback);
+
+			highLevelCallbacks[-CALLBACK_READ] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_MODBUS_MASTER_READ_COILS_RESPONSE] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_MODBUS_MASTER_READ_HOLDING_REGISTERS_RESPONSE] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_COILS_REQUEST] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_REGISTERS_REQUEST] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_MODBUS_MASTER_READ_DISCRETE_INPUTS_RESPONSE] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_MODBUS_MASTER_READ_INPUT_REGISTERS_RESPONSE] = new HighLevelCallback();
+
+			responseExpected[FUNCTION_WRITE_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_READ_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_READ_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_DISABLE_READ_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_IS_READ_CALLBACK_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_RS485_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_RS485_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MODBUS_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_MODBUS_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_MODE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_COMMUNICATION_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_COMMUNICATION_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ERROR_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_ERROR_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BUFFER_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_BUFFER_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BUFFER_STATUS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_ENABLE_ERROR_COUNT_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_DISABLE_ERROR_COUNT_CALLBACK] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_IS_ERROR_COUNT_CALLBACK_ENABLED] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_MODBUS_COMMON_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_MODBUS_SLAVE_REPORT_EXCEPTION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_MODBUS_SLAVE_ANSWER_READ_COILS_REQUEST_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_MODBUS_MASTER_READ_COILS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_MODBUS_SLAVE_ANSWER_READ_HOLDING_REGISTERS_REQUEST_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_MODBUS_MASTER_READ_HOLDING_REGISTERS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_COIL_REQUEST] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_MODBUS_MASTER_WRITE_SINGLE_COIL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_REGISTER_REQUEST] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_MODBUS_MASTER_WRITE_SINGLE_REGISTER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_COILS_REQUEST] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_REGISTERS_REQUEST] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_MODBUS_SLAVE_ANSWER_READ_DISCRETE_INPUTS_REQUEST_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_MODBUS_MASTER_READ_DISCRETE_INPUTS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_MODBUS_SLAVE_ANSWER_READ_INPUT_REGISTERS_REQUEST_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_MODBUS_MASTER_READ_INPUT_REGISTERS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Writes characters to the RS485 interface. The characters can be binary data,
+		///  ASCII or similar is not necessary.
+		///  
+		///  The return value is the number of characters that were written.
+		///  
+		///  See <see cref="Tinkerforge.BrickletRS485.SetRS485Configuration"/> for configuration possibilities
+		///  regarding baudrate, parity and so on.
+		/// </summary>
+		public byte WriteLowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 60, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns up to *length* characters from receive buffer.
+		///  
+		///  Instead of polling with this function, you can also use
+		///  callbacks. But note that this function will return available
+		///  data only when the read callback is disabled.
+		///  See <see cref="Tinkerforge.BrickletRS485.EnableReadCallback"/> and <see cref="Tinkerforge.BrickletRS485.ReadCallback"/> callback.
+		/// </summary>
+		public void ReadLowLevel(int length, out int messageLength, out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_READ_LOW_LEVEL);
+			LEConverter.To((short)length, 8, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageLength = LEConverter.UShortFrom(8, response);
+			messageChunkOffset = LEConverter.UShortFrom(10, response);
+			messageChunkData = LEConverter.CharArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  Enables the <see cref="Tinkerforge.BrickletRS485.ReadCallback"/> callback. This will disable the <see cref="Tinkerforge.BrickletRS485.FrameReadableCallback"/> callback.
+		///  
+		///  By default the callback is disabled.
+		/// </summary>
+		public void EnableReadCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_READ_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the <see cref="Tinkerforge.BrickletRS485.ReadCallback"/> callback.
+		///  
+		///  By default the callback is disabled.
+		/// </summary>
+		public void DisableReadCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_READ_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the <see cref="Tinkerforge.BrickletRS485.ReadCallback"/> callback is enabled,
+		///  *false* otherwise.
+		/// </summary>
+		public bool IsReadCallbackEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_READ_CALLBACK_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the configuration for the RS485 communication.
+		/// </summary>
+		public void SetRS485Configuration(long baudrate, byte parity, byte stopbits, byte wordlength, byte duplex)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(16, FUNCTION_SET_RS485_CONFIGURATION);
+			LEConverter.To((int)baudrate, 8, request);
+			LEConverter.To((byte)parity, 12, request);
+			LEConverter.To((byte)stopbits, 13, request);
+			LEConverter.To((byte)wordlength, 14, request);
+			LEConverter.To((byte)duplex, 15, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletRS485.SetRS485Configuration"/>.
+		/// </summary>
+		public void GetRS485Configuration(out long baudrate, out byte parity, out byte stopbits, out byte wordlength, out byte duplex)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_RS485_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 16);
+
+			baudrate = LEConverter.UIntFrom(8, response);
+			parity = LEConverter.ByteFrom(12, response);
+			stopbits = LEConverter.ByteFrom(13, response);
+			wordlength = LEConverter.ByteFrom(14, response);
+			duplex = LEConverter.ByteFrom(15, response);
+		}
+
+		/// <summary>
+		///  Sets the configuration for the RS485 Modbus communication. Available options:
+		///  
+		///  * Slave Address: Address to be used as the Modbus slave address in Modbus slave mode. Valid Modbus slave address range is 1 to 247.
+		///  * Master Request Timeout: Specifies how long the master should wait for a response from a slave when in Modbus master mode.
+		/// </summary>
+		public void SetModbusConfiguration(byte slaveAddress, long masterRequestTimeout)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(13, FUNCTION_SET_MODBUS_CONFIGURATION);
+			LEConverter.To((byte)slaveAddress, 8, request);
+			LEConverter.To((int)masterRequestTimeout, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletRS485.SetModbusConfiguration"/>.
+		/// </summary>
+		public void GetModbusConfiguration(out byte slaveAddress, out long masterRequestTimeout)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MODBUS_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 13);
+
+			slaveAddress = LEConverter.ByteFrom(8, response);
+			masterRequestTimeout = LEConverter.UIntFrom(9, response);
+		}
+
+		/// <summary>
+		///  Sets the mode of the Bricklet in which it operates. Available options are
+		///  
+		///  * RS485,
+		///  * Modbus Master RTU and
+		///  * Modbus Slave RTU.
+		/// </summary>
+		public void SetMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletRS485.SetMode"/>.
+		/// </summary>
+		public byte GetMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the communication LED configuration. By default the LED shows RS485
+		///  communication traffic by flickering.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is off.
+		/// </summary>
+		public void SetCommunicationLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_COMMUNICATION_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletRS485.SetCommunicationLEDConfig"/>
+		/// </summary>
+		public byte GetCommunicationLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_COMMUNICATION_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the error LED configuration.
+		///  
+		///  By default the error LED turns on if there is any error (see <see cref="Tinkerforge.BrickletRS485.ErrorCountCallback"/>
+		///  callback). If you call this function with the SHOW ERROR option again, the LED
+		///  will turn off until the next error occurs.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is off.
+		/// </summary>
+		public void SetErrorLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_ERROR_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletRS485.SetErrorLEDConfig"/>.
+		/// </summary>
+		public byte GetErrorLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ERROR_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the send and receive buffer size in byte. In sum there is
+		///  10240 byte (10KiB) buffer available and the minimum buffer size
+		///  is 1024 byte (1KiB) for both.
+		///  
+		///  The current buffer content is lost if this function is called.
+		///  
+		///  The send buffer holds data that was given by <see cref="Tinkerforge.BrickletRS485.Write"/> and
+		///  could not be written yet. The receive buffer holds data that is
+		///  received through RS485 but could not yet be send to the
+		///  user, either by <see cref="Tinkerforge.BrickletRS485.Read"/> or through <see cref="Tinkerforge.BrickletRS485.ReadCallback"/> callback.
+		/// </summary>
+		public void SetBufferConfig(int sendBufferSize, int receiveBufferSize)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_BUFFER_CONFIG);
+			LEConverter.To((short)sendBufferSize, 8, request);
+			LEConverter.To((short)receiveBufferSize, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the buffer configuration as set by <see cref="Tinkerforge.BrickletRS485.SetBufferConfig"/>.
+		/// </summary>
+		public void GetBufferConfig(out int sendBufferSize, out int receiveBufferSize)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BUFFER_CONFIG);
+
+			byte[] response = SendRequest(request, 12);
+
+			sendBufferSize = LEConverter.UShortFrom(8, response);
+			receiveBufferSize = LEConverter.UShortFrom(10, response);
+		}
+
+		/// <summary>
+		///  Returns the currently used bytes for the send and received buffer.
+		///  
+		///  See <see cref="Tinkerforge.BrickletRS485.SetBufferConfig"/> for buffer size configuration.
+		/// </summary>
+		public void GetBufferStatus(out int sendBufferUsed, out int receiveBufferUsed)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BUFFER_STATUS);
+
+			byte[] response = SendRequest(request, 12);
+
+			sendBufferUsed = LEConverter.UShortFrom(8, response);
+			receiveBufferUsed = LEConverter.UShortFrom(10, response);
+		}
+
+		/// <summary>
+		///  Enables the <see cref="Tinkerforge.BrickletRS485.ErrorCountCallback"/> callback.
+		///  
+		///  By default the callback is disabled.
+		/// </summary>
+		public void EnableErrorCountCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_ENABLE_ERROR_COUNT_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Disables the <see cref="Tinkerforge.BrickletRS485.ErrorCountCallback"/> callback.
+		///  
+		///  By default the callback is disabled.
+		/// </summary>
+		public void DisableErrorCountCallback()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_DISABLE_ERROR_COUNT_CALLBACK);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns *true* if the <see cref="Tinkerforge.BrickletRS485.ErrorCountCallback"/> callback is enabled,
+		///  *false* otherwise.
+		/// </summary>
+		public bool IsErrorCountCallbackEnabled()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_IS_ERROR_COUNT_CALLBACK_ENABLED);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.BoolFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current number of overrun and parity errors.
+		/// </summary>
+		public void GetErrorCount(out long overrunErrorCount, out long parityErrorCount)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 16);
+
+			overrunErrorCount = LEConverter.UIntFrom(8, response);
+			parityErrorCount = LEConverter.UIntFrom(12, response);
+		}
+
+		/// <summary>
+		///  Returns the current number of errors occurred in Modbus mode.
+		///  
+		///  * Timeout Error Count: Number of timeouts occurred.
+		///  * Checksum Error Count: Number of failures due to Modbus frame CRC16 checksum mismatch.
+		///  * Frame Too Big Error Count: Number of times frames were rejected because they exceeded maximum Modbus frame size which is 256 bytes.
+		///  * Illegal Function Error Count: Number of errors when an unimplemented or illegal function is requested. This corresponds to Modbus exception code 1.
+		///  * Illegal Data Address Error Count: Number of errors due to invalid data address. This corresponds to Modbus exception code 2.
+		///  * Illegal Data Value Error Count: Number of errors due to invalid data value. This corresponds to Modbus exception code 3.
+		///  * Slave Device Failure Error Count: Number of errors occurred on the slave device which were unrecoverable. This corresponds to Modbus exception code 4.
+		/// </summary>
+		public void GetModbusCommonErrorCount(out long timeoutErrorCount, out long checksumErrorCount, out long frameTooBigErrorCount, out long illegalFunctionErrorCount, out long illegalDataAddressErrorCount, out long illegalDataValueErrorCount, out long slaveDeviceFailureErrorCount)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_MODBUS_COMMON_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 36);
+
+			timeoutErrorCount = LEConverter.UIntFrom(8, response);
+			checksumErrorCount = LEConverter.UIntFrom(12, response);
+			frameTooBigErrorCount = LEConverter.UIntFrom(16, response);
+			illegalFunctionErrorCount = LEConverter.UIntFrom(20, response);
+			illegalDataAddressErrorCount = LEConverter.UIntFrom(24, response);
+			illegalDataValueErrorCount = LEConverter.UIntFrom(28, response);
+			slaveDeviceFailureErrorCount = LEConverter.UIntFrom(32, response);
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to report a Modbus exception for
+		///  a Modbus master request.
+		///  
+		///  * Request ID: Request ID of the request received by the slave.
+		///  * Exception Code: Modbus exception code to report to the Modbus master.
+		/// </summary>
+		public void ModbusSlaveReportException(byte requestID, short exceptionCode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_MODBUS_SLAVE_REPORT_EXCEPTION);
+			LEConverter.To((byte)requestID, 8, request);
+			LEConverter.To((byte)exceptionCode, 9, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  read coils.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  * Coils: Data that is to be sent to the Modbus master for the corresponding request.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveReadCoilsRequestCallback"/> callback
+		///  with the Request ID as provided by the argument of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerReadCoilsRequestLowLevel(byte requestID, int coilsLength, int coilsChunkOffset, bool[] coilsChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_MODBUS_SLAVE_ANSWER_READ_COILS_REQUEST_LOW_LEVEL);
+			LEConverter.To((byte)requestID, 8, request);
+			LEConverter.To((short)coilsLength, 9, request);
+			LEConverter.To((short)coilsChunkOffset, 11, request);
+			byte[] coilsChunkDataBits = new byte[59];
+			for (int i = 0; i < 472; i++) {
+				if (coilsChunkData[i]) {
+					coilsChunkDataBits[i / 8] |= (byte)(1 << (i % 8));
+				}
+			}
+			LEConverter.To((byte[])coilsChunkDataBits, 13, 59, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  In Modbus master mode this function can be used to read coils from a slave. This
+		///  function creates a Modbus function code 1 request.
+		///  
+		///  * Slave Address: Address of the target Modbus slave.
+		///  * Starting Address: Number of the first coil to read. For backwards compatibility reasons this parameter is called Starting Address. It is not an address, but instead a coil number in the range of 1 to 65536.
+		///  * Count: Number of coils to read.
+		///  
+		///  Upon success the function will return a non-zero request ID which will represent
+		///  the current request initiated by the Modbus master. In case of failure the returned
+		///  request ID will be 0.
+		///  
+		///  When successful this function will also invoke the <see cref="Tinkerforge.BrickletRS485.ModbusMasterReadCoilsResponseCallback"/>
+		///  callback. In this callback the Request ID provided by the callback argument must be
+		///  matched with the Request ID returned from this function to verify that the callback
+		///  is indeed for a particular request.
+		/// </summary>
+		public byte ModbusMasterReadCoils(byte slaveAddress, long startingAddress, int count)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(15, FUNCTION_MODBUS_MASTER_READ_COILS);
+			LEConverter.To((byte)slaveAddress, 8, request);
+			LEConverter.To((int)startingAddress, 9, request);
+			LEConverter.To((short)count, 13, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  read holding registers.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  * Holding Registers: Data that is to be sent to the Modbus master for the corresponding request.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveReadHoldingRegistersRequestCallback"/>
+		///  callback with the Request ID as provided by the argument of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerReadHoldingRegistersRequestLowLevel(byte requestID, int holdingRegistersLength, int holdingRegistersChunkOffset, int[] holdingRegistersChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(71, FUNCTION_MODBUS_SLAVE_ANSWER_READ_HOLDING_REGISTERS_REQUEST_LOW_LEVEL);
+			LEConverter.To((byte)requestID, 8, request);
+			LEConverter.To((short)holdingRegistersLength, 9, request);
+			LEConverter.To((short)holdingRegistersChunkOffset, 11, request);
+			short[] _holdingRegistersChunkData = new short[29];
+			for (int i = 0; i < 29; ++i) {
+				_holdingRegistersChunkData[i] = (short)holdingRegistersChunkData[i];
+			}
+			LEConverter.To(_holdingRegistersChunkData, 13, 29, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  In Modbus master mode this function can be used to read holding registers from a slave.
+		///  This function creates a Modbus function code 3 request.
+		///  
+		///  * Slave Address: Address of the target Modbus slave.
+		///  * Starting Address: Number of the first holding register to read. For backwards compatibility reasons this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+		///  * Count: Number of holding registers to read.
+		///  
+		///  Upon success the function will return a non-zero request ID which will represent
+		///  the current request initiated by the Modbus master. In case of failure the returned
+		///  request ID will be 0.
+		///  
+		///  When successful this function will also invoke the <see cref="Tinkerforge.BrickletRS485.ModbusMasterReadHoldingRegistersResponseCallback"/>
+		///  callback. In this callback the Request ID provided by the callback argument must be matched
+		///  with the Request ID returned from this function to verify that the callback is indeed for a
+		///  particular request.
+		/// </summary>
+		public byte ModbusMasterReadHoldingRegisters(byte slaveAddress, long startingAddress, int count)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(15, FUNCTION_MODBUS_MASTER_READ_HOLDING_REGISTERS);
+			LEConverter.To((byte)slaveAddress, 8, request);
+			LEConverter.To((int)startingAddress, 9, request);
+			LEConverter.To((short)count, 13, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  write a single coil.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveWriteSingleCoilRequestCallback"/>
+		///  callback with the Request ID as provided by the arguments of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerWriteSingleCoilRequest(byte requestID)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_COIL_REQUEST);
+			LEConverter.To((byte)requestID, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  In Modbus master mode this function can be used to write a single coil of a slave.
+		///  This function creates a Modbus function code 5 request.
+		///  
+		///  * Slave Address: Address of the target Modbus slave.
+		///  * Coil Address: Number of the coil to be written. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a coil number in the range of 1 to 65536.
+		///  * Coil Value: Value to be written.
+		///  
+		///  Upon success the function will return a non-zero request ID which will represent
+		///  the current request initiated by the Modbus master. In case of failure the returned
+		///  request ID will be 0.
+		///  
+		///  When successful this function will also invoke the <see cref="Tinkerforge.BrickletRS485.ModbusMasterWriteSingleCoilResponseCallback"/>
+		///  callback. In this callback the Request ID provided by the callback argument must be matched
+		///  with the Request ID returned from this function to verify that the callback is indeed for a
+		///  particular request.
+		/// </summary>
+		public byte ModbusMasterWriteSingleCoil(byte slaveAddress, long coilAddress, bool coilValue)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_MODBUS_MASTER_WRITE_SINGLE_COIL);
+			LEConverter.To((byte)slaveAddress, 8, request);
+			LEConverter.To((int)coilAddress, 9, request);
+			LEConverter.To((bool)coilValue, 13, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  write a single register.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveWriteSingleRegisterRequestCallback"/>
+		///  callback with the Request ID, Register Address and Register Value as provided by
+		///  the arguments of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerWriteSingleRegisterRequest(byte requestID)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_REGISTER_REQUEST);
+			LEConverter.To((byte)requestID, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  In Modbus master mode this function can be used to write a single holding register of a
+		///  slave. This function creates a Modbus function code 6 request.
+		///  
+		///  * Slave Address: Address of the target Modbus slave.
+		///  * Register Address: Number of the holding register to be written. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+		///  * Register Value: Value to be written.
+		///  
+		///  Upon success the function will return a non-zero request ID which will represent
+		///  the current request initiated by the Modbus master. In case of failure the returned
+		///  request ID will be 0.
+		///  
+		///  When successful this function will also invoke the <see cref="Tinkerforge.BrickletRS485.ModbusMasterWriteSingleRegisterResponseCallback"/>
+		///  callback. In this callback the Request ID provided by the callback argument must be matched
+		///  with the Request ID returned from this function to verify that the callback is indeed for a
+		///  particular request.
+		/// </summary>
+		public byte ModbusMasterWriteSingleRegister(byte slaveAddress, long registerAddress, int registerValue)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(15, FUNCTION_MODBUS_MASTER_WRITE_SINGLE_REGISTER);
+			LEConverter.To((byte)slaveAddress, 8, request);
+			LEConverter.To((int)registerAddress, 9, request);
+			LEConverter.To((short)registerValue, 13, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  write multiple coils.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveWriteMultipleCoilsRequestCallback"/>
+		///  callback with the Request ID of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerWriteMultipleCoilsRequest(byte requestID)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_COILS_REQUEST);
+			LEConverter.To((byte)requestID, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  In Modbus master mode this function can be used to write multiple coils of a slave.
+		///  This function creates a Modbus function code 15 request.
+		///  
+		///  * Slave Address: Address of the target Modbus slave.
+		///  * Starting Address: Number of the first coil to write. For backwards compatibility reasons, this parameter is called Starting Address.It is not an address, but instead a coil number in the range of 1 to 65536.
+		///  
+		///  Upon success the function will return a non-zero request ID which will represent
+		///  the current request initiated by the Modbus master. In case of failure the returned
+		///  request ID will be 0.
+		///  
+		///  When successful this function will also invoke the <see cref="Tinkerforge.BrickletRS485.ModbusMasterWriteMultipleCoilsResponseCallback"/>
+		///  callback. In this callback the Request ID provided by the callback argument must be matched
+		///  with the Request ID returned from this function to verify that the callback is indeed for a
+		///  particular request.
+		/// </summary>
+		public byte ModbusMasterWriteMultipleCoilsLowLevel(byte slaveAddress, long startingAddress, int coilsLength, int coilsChunkOffset, bool[] coilsChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL);
+			LEConverter.To((byte)slaveAddress, 8, request);
+			LEConverter.To((int)startingAddress, 9, request);
+			LEConverter.To((short)coilsLength, 13, request);
+			LEConverter.To((short)coilsChunkOffset, 15, request);
+			byte[] coilsChunkDataBits = new byte[55];
+			for (int i = 0; i < 440; i++) {
+				if (coilsChunkData[i]) {
+					coilsChunkDataBits[i / 8] |= (byte)(1 << (i % 8));
+				}
+			}
+			LEConverter.To((byte[])coilsChunkDataBits, 17, 55, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  write multiple registers.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveWriteMultipleRegistersRequestCallback"/>
+		///  callback with the Request ID of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerWriteMultipleRegistersRequest(byte requestID)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_REGISTERS_REQUEST);
+			LEConverter.To((byte)requestID, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  In Modbus master mode this function can be used to write multiple registers of a slave.
+		///  This function creates a Modbus function code 16 request.
+		///  
+		///  * Slave Address: Address of the target Modbus slave.
+		///  * Starting Address: Number of the first holding register to write. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+		///  
+		///  Upon success the function will return a non-zero request ID which will represent
+		///  the current request initiated by the Modbus master. In case of failure the returned
+		///  request ID will be 0.
+		///  
+		///  When successful this function will also invoke the <see cref="Tinkerforge.BrickletRS485.ModbusMasterWriteMultipleRegistersResponseCallback"/>
+		///  callback. In this callback the Request ID provided by the callback argument must be matched
+		///  with the Request ID returned from this function to verify that the callback is indeed for a
+		///  particular request.
+		/// </summary>
+		public byte ModbusMasterWriteMultipleRegistersLowLevel(byte slaveAddress, long startingAddress, int registersLength, int registersChunkOffset, int[] registersChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(71, FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL);
+			LEConverter.To((byte)slaveAddress, 8, request);
+			LEConverter.To((int)startingAddress, 9, request);
+			LEConverter.To((short)registersLength, 13, request);
+			LEConverter.To((short)registersChunkOffset, 15, request);
+			short[] _registersChunkData = new short[27];
+			for (int i = 0; i < 27; ++i) {
+				_registersChunkData[i] = (short)registersChunkData[i];
+			}
+			LEConverter.To(_registersChunkData, 17, 27, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  read discrete inputs.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  * Discrete Inputs: Data that is to be sent to the Modbus master for the corresponding request.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveReadDiscreteInputsRequestCallback"/>
+		///  callback with the Request ID as provided by the argument of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerReadDiscreteInputsRequestLowLevel(byte requestID, int discreteInputsLength, int discreteInputsChunkOffset, bool[] discreteInputsChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_MODBUS_SLAVE_ANSWER_READ_DISCRETE_INPUTS_REQUEST_LOW_LEVEL);
+			LEConverter.To((byte)requestID, 8, request);
+			LEConverter.To((short)discreteInputsLength, 9, request);
+			LEConverter.To((short)discreteInputsChunkOffset, 11, request);
+			byte[] discreteInputsChunkDataBits = new byte[59];
+			for (int i = 0; i < 472; i++) {
+				if (discreteInputsChunkData[i]) {
+					discreteInputsChunkDataBits[i / 8] |= (byte)(1 << (i % 8));
+				}
+			}
+			LEConverter.To((byte[])discreteInputsChunkDataBits, 13, 59, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  In Modbus master mode this function can be used to read discrete inputs from a slave.
+		///  This function creates a Modbus function code 2 request.
+		///  
+		///  * Slave Address: Address of the target Modbus slave.
+		///  * Starting Address: Number of the first discrete input to read. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a discrete input number in the range of 1 to 65536. The prefix digit 1 (for discrete input) is implicit and must be omitted.
+		///  * Count: Number of discrete inputs to read.
+		///  
+		///  Upon success the function will return a non-zero request ID which will represent
+		///  the current request initiated by the Modbus master. In case of failure the returned
+		///  request ID will be 0.
+		///  
+		///  When successful this function will also invoke the <see cref="Tinkerforge.BrickletRS485.ModbusMasterReadDiscreteInputsResponseCallback"/>
+		///  callback. In this callback the Request ID provided by the callback argument must be matched
+		///  with the Request ID returned from this function to verify that the callback is indeed for a
+		///  particular request.
+		/// </summary>
+		public byte ModbusMasterReadDiscreteInputs(byte slaveAddress, long startingAddress, int count)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(15, FUNCTION_MODBUS_MASTER_READ_DISCRETE_INPUTS);
+			LEConverter.To((byte)slaveAddress, 8, request);
+			LEConverter.To((int)startingAddress, 9, request);
+			LEConverter.To((short)count, 13, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  read input registers.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  * Input Registers: Data that is to be sent to the Modbus master for the corresponding request.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveReadInputRegistersRequestCallback"/> callback
+		///  with the Request ID as provided by the argument of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerReadInputRegistersRequestLowLevel(byte requestID, int inputRegistersLength, int inputRegistersChunkOffset, int[] inputRegistersChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(71, FUNCTION_MODBUS_SLAVE_ANSWER_READ_INPUT_REGISTERS_REQUEST_LOW_LEVEL);
+			LEConverter.To((byte)requestID, 8, request);
+			LEConverter.To((short)inputRegistersLength, 9, request);
+			LEConverter.To((short)inputRegistersChunkOffset, 11, request);
+			short[] _inputRegistersChunkData = new short[29];
+			for (int i = 0; i < 29; ++i) {
+				_inputRegistersChunkData[i] = (short)inputRegistersChunkData[i];
+			}
+			LEConverter.To(_inputRegistersChunkData, 13, 29, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  In Modbus master mode this function can be used to read input registers from a slave.
+		///  This function creates a Modbus function code 4 request.
+		///  
+		///  * Slave Address: Address of the target Modbus slave.
+		///  * Starting Address: Number of the first input register to read. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead an input register number in the range of 1 to 65536. The prefix digit 3 (for input register) is implicit and must be omitted.
+		///  * Count: Number of input registers to read.
+		///  
+		///  Upon success the function will return a non-zero request ID which will represent
+		///  the current request initiated by the Modbus master. In case of failure the returned
+		///  request ID will be 0.
+		///  
+		///  When successful this function will also invoke the <see cref="Tinkerforge.BrickletRS485.ModbusMasterReadInputRegistersResponseCallback"/>
+		///  callback. In this callback the Request ID provided by the callback argument must be matched
+		///  with the Request ID returned from this function to verify that the callback is indeed for a
+		///  particular request.
+		/// </summary>
+		public byte ModbusMasterReadInputRegisters(byte slaveAddress, long startingAddress, int count)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(15, FUNCTION_MODBUS_MASTER_READ_INPUT_REGISTERS);
+			LEConverter.To((byte)slaveAddress, 8, request);
+			LEConverter.To((int)startingAddress, 9, request);
+			LEConverter.To((short)count, 13, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Configures the <see cref="Tinkerforge.BrickletRS485.FrameReadableCallback"/> callback. The frame size is the number of bytes, that have to be readable to trigger the callback.
+		///  A frame size of 0 disables the callback. A frame size greater than 0 enables the callback and disables the <see cref="Tinkerforge.BrickletRS485.ReadCallback"/> callback.
+		///  
+		///  By default the callback is disabled.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Plugin)
+		/// </summary>
+		public void SetFrameReadableCallbackConfiguration(int frameSize)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION);
+			LEConverter.To((short)frameSize, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the callback configuration as set by <see cref="Tinkerforge.BrickletRS485.SetFrameReadableCallbackConfiguration"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Plugin)
+		/// </summary>
+		public int GetFrameReadableCallbackConfiguration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.UShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletRS485.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletRS485.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletRS485.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletRS485.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Writes characters to the RS485 interface. The characters can be binary data,
+		///  ASCII or similar is not necessary.
+		///  
+		///  The return value is the number of characters that were written.
+		///  
+		///  See <see cref="Tinkerforge.BrickletRS485.SetRS485Configuration"/> for configuration possibilities
+		///  regarding baudrate, parity and so on.
+		/// </summary>
+		public int Write(char[] message)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageWritten = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 60);
+
+				messageChunkWritten = WriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+						messageChunkWritten = WriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 60)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 60;
+					}
+				}
+			}
+
+			return messageWritten;
+		}
+
+		/// <summary>
+		///  Returns up to *length* characters from receive buffer.
+		///  
+		///  Instead of polling with this function, you can also use
+		///  callbacks. But note that this function will return available
+		///  data only when the read callback is disabled.
+		///  See <see cref="Tinkerforge.BrickletRS485.EnableReadCallback"/> and <see cref="Tinkerforge.BrickletRS485.ReadCallback"/> callback.
+		/// </summary>
+		public char[] Read(int length)
+		{
+			char[] message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = 0;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				ReadLowLevel(length, out messageLength, out messageChunkOffset, out messageChunkData);
+
+				messageOutOfSync = messageChunkOffset != 0;
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						ReadLowLevel(length, out messageLength, out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 60 < messageLength)
+					{
+						ReadLowLevel(length, out messageLength, out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+
+			return message;
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  read coils.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  * Coils: Data that is to be sent to the Modbus master for the corresponding request.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveReadCoilsRequestCallback"/> callback
+		///  with the Request ID as provided by the argument of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerReadCoilsRequest(byte requestID, bool[] coils)
+		{
+			if (coils.Length > 65535)
+			{
+				throw new ArgumentException("Coils can be at most 65535 items long");
+			}
+
+			int coilsLength = coils.Length;
+			int coilsChunkOffset = 0;
+			bool[] coilsChunkData = new bool[472];
+			int coilsChunkLength;
+
+			if (coilsLength == 0)
+			{
+				Array.Clear(coilsChunkData, 0, 472);
+
+				ModbusSlaveAnswerReadCoilsRequestLowLevel(requestID, coilsLength, coilsChunkOffset, coilsChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (coilsChunkOffset < coilsLength)
+					{
+						coilsChunkLength = Math.Min(coilsLength - coilsChunkOffset, 472);
+
+						Array.Copy(coils, coilsChunkOffset, coilsChunkData, 0, coilsChunkLength);
+						Array.Clear(coilsChunkData, coilsChunkLength, 472 - coilsChunkLength);
+
+						ModbusSlaveAnswerReadCoilsRequestLowLevel(requestID, coilsLength, coilsChunkOffset, coilsChunkData);
+
+						coilsChunkOffset += 472;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  read holding registers.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  * Holding Registers: Data that is to be sent to the Modbus master for the corresponding request.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveReadHoldingRegistersRequestCallback"/>
+		///  callback with the Request ID as provided by the argument of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerReadHoldingRegistersRequest(byte requestID, int[] holdingRegisters)
+		{
+			if (holdingRegisters.Length > 65535)
+			{
+				throw new ArgumentException("Holding Registers can be at most 65535 items long");
+			}
+
+			int holdingRegistersLength = holdingRegisters.Length;
+			int holdingRegistersChunkOffset = 0;
+			int[] holdingRegistersChunkData = new int[29];
+			int holdingRegistersChunkLength;
+
+			if (holdingRegistersLength == 0)
+			{
+				Array.Clear(holdingRegistersChunkData, 0, 29);
+
+				ModbusSlaveAnswerReadHoldingRegistersRequestLowLevel(requestID, holdingRegistersLength, holdingRegistersChunkOffset, holdingRegistersChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (holdingRegistersChunkOffset < holdingRegistersLength)
+					{
+						holdingRegistersChunkLength = Math.Min(holdingRegistersLength - holdingRegistersChunkOffset, 29);
+
+						Array.Copy(holdingRegisters, holdingRegistersChunkOffset, holdingRegistersChunkData, 0, holdingRegistersChunkLength);
+						Array.Clear(holdingRegistersChunkData, holdingRegistersChunkLength, 29 - holdingRegistersChunkLength);
+
+						ModbusSlaveAnswerReadHoldingRegistersRequestLowLevel(requestID, holdingRegistersLength, holdingRegistersChunkOffset, holdingRegistersChunkData);
+
+						holdingRegistersChunkOffset += 29;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  In Modbus master mode this function can be used to write multiple coils of a slave.
+		///  This function creates a Modbus function code 15 request.
+		///  
+		///  * Slave Address: Address of the target Modbus slave.
+		///  * Starting Address: Number of the first coil to write. For backwards compatibility reasons, this parameter is called Starting Address.It is not an address, but instead a coil number in the range of 1 to 65536.
+		///  
+		///  Upon success the function will return a non-zero request ID which will represent
+		///  the current request initiated by the Modbus master. In case of failure the returned
+		///  request ID will be 0.
+		///  
+		///  When successful this function will also invoke the <see cref="Tinkerforge.BrickletRS485.ModbusMasterWriteMultipleCoilsResponseCallback"/>
+		///  callback. In this callback the Request ID provided by the callback argument must be matched
+		///  with the Request ID returned from this function to verify that the callback is indeed for a
+		///  particular request.
+		/// </summary>
+		public byte ModbusMasterWriteMultipleCoils(byte slaveAddress, long startingAddress, bool[] coils)
+		{
+			if (coils.Length > 65535)
+			{
+				throw new ArgumentException("Coils can be at most 65535 items long");
+			}
+
+			byte requestID = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int coilsLength = coils.Length;
+			int coilsChunkOffset = 0;
+			bool[] coilsChunkData = new bool[440];
+			int coilsChunkLength;
+
+			if (coilsLength == 0)
+			{
+				Array.Clear(coilsChunkData, 0, 440);
+
+				requestID = ModbusMasterWriteMultipleCoilsLowLevel(slaveAddress, startingAddress, coilsLength, coilsChunkOffset, coilsChunkData);
+			}
+			else
+			{
+				requestID = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				lock (streamLock)
+				{
+					while (coilsChunkOffset < coilsLength)
+					{
+						coilsChunkLength = Math.Min(coilsLength - coilsChunkOffset, 440);
+
+						Array.Copy(coils, coilsChunkOffset, coilsChunkData, 0, coilsChunkLength);
+						Array.Clear(coilsChunkData, coilsChunkLength, 440 - coilsChunkLength);
+
+						requestID = ModbusMasterWriteMultipleCoilsLowLevel(slaveAddress, startingAddress, coilsLength, coilsChunkOffset, coilsChunkData);
+
+						coilsChunkOffset += 440;
+					}
+				}
+			}
+
+			return requestID;
+		}
+
+		/// <summary>
+		///  In Modbus master mode this function can be used to write multiple registers of a slave.
+		///  This function creates a Modbus function code 16 request.
+		///  
+		///  * Slave Address: Address of the target Modbus slave.
+		///  * Starting Address: Number of the first holding register to write. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+		///  
+		///  Upon success the function will return a non-zero request ID which will represent
+		///  the current request initiated by the Modbus master. In case of failure the returned
+		///  request ID will be 0.
+		///  
+		///  When successful this function will also invoke the <see cref="Tinkerforge.BrickletRS485.ModbusMasterWriteMultipleRegistersResponseCallback"/>
+		///  callback. In this callback the Request ID provided by the callback argument must be matched
+		///  with the Request ID returned from this function to verify that the callback is indeed for a
+		///  particular request.
+		/// </summary>
+		public byte ModbusMasterWriteMultipleRegisters(byte slaveAddress, long startingAddress, int[] registers)
+		{
+			if (registers.Length > 65535)
+			{
+				throw new ArgumentException("Registers can be at most 65535 items long");
+			}
+
+			byte requestID = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int registersLength = registers.Length;
+			int registersChunkOffset = 0;
+			int[] registersChunkData = new int[27];
+			int registersChunkLength;
+
+			if (registersLength == 0)
+			{
+				Array.Clear(registersChunkData, 0, 27);
+
+				requestID = ModbusMasterWriteMultipleRegistersLowLevel(slaveAddress, startingAddress, registersLength, registersChunkOffset, registersChunkData);
+			}
+			else
+			{
+				requestID = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				lock (streamLock)
+				{
+					while (registersChunkOffset < registersLength)
+					{
+						registersChunkLength = Math.Min(registersLength - registersChunkOffset, 27);
+
+						Array.Copy(registers, registersChunkOffset, registersChunkData, 0, registersChunkLength);
+						Array.Clear(registersChunkData, registersChunkLength, 27 - registersChunkLength);
+
+						requestID = ModbusMasterWriteMultipleRegistersLowLevel(slaveAddress, startingAddress, registersLength, registersChunkOffset, registersChunkData);
+
+						registersChunkOffset += 27;
+					}
+				}
+			}
+
+			return requestID;
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  read discrete inputs.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  * Discrete Inputs: Data that is to be sent to the Modbus master for the corresponding request.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveReadDiscreteInputsRequestCallback"/>
+		///  callback with the Request ID as provided by the argument of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerReadDiscreteInputsRequest(byte requestID, bool[] discreteInputs)
+		{
+			if (discreteInputs.Length > 65535)
+			{
+				throw new ArgumentException("Discrete Inputs can be at most 65535 items long");
+			}
+
+			int discreteInputsLength = discreteInputs.Length;
+			int discreteInputsChunkOffset = 0;
+			bool[] discreteInputsChunkData = new bool[472];
+			int discreteInputsChunkLength;
+
+			if (discreteInputsLength == 0)
+			{
+				Array.Clear(discreteInputsChunkData, 0, 472);
+
+				ModbusSlaveAnswerReadDiscreteInputsRequestLowLevel(requestID, discreteInputsLength, discreteInputsChunkOffset, discreteInputsChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (discreteInputsChunkOffset < discreteInputsLength)
+					{
+						discreteInputsChunkLength = Math.Min(discreteInputsLength - discreteInputsChunkOffset, 472);
+
+						Array.Copy(discreteInputs, discreteInputsChunkOffset, discreteInputsChunkData, 0, discreteInputsChunkLength);
+						Array.Clear(discreteInputsChunkData, discreteInputsChunkLength, 472 - discreteInputsChunkLength);
+
+						ModbusSlaveAnswerReadDiscreteInputsRequestLowLevel(requestID, discreteInputsLength, discreteInputsChunkOffset, discreteInputsChunkData);
+
+						discreteInputsChunkOffset += 472;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  In Modbus slave mode this function can be used to answer a master request to
+		///  read input registers.
+		///  
+		///  * Request ID: Request ID of the corresponding request that is being answered.
+		///  * Input Registers: Data that is to be sent to the Modbus master for the corresponding request.
+		///  
+		///  This function must be called from the <see cref="Tinkerforge.BrickletRS485.ModbusSlaveReadInputRegistersRequestCallback"/> callback
+		///  with the Request ID as provided by the argument of the callback.
+		/// </summary>
+		public void ModbusSlaveAnswerReadInputRegistersRequest(byte requestID, int[] inputRegisters)
+		{
+			if (inputRegisters.Length > 65535)
+			{
+				throw new ArgumentException("Input Registers can be at most 65535 items long");
+			}
+
+			int inputRegistersLength = inputRegisters.Length;
+			int inputRegistersChunkOffset = 0;
+			int[] inputRegistersChunkData = new int[29];
+			int inputRegistersChunkLength;
+
+			if (inputRegistersLength == 0)
+			{
+				Array.Clear(inputRegistersChunkData, 0, 29);
+
+				ModbusSlaveAnswerReadInputRegistersRequestLowLevel(requestID, inputRegistersLength, inputRegistersChunkOffset, inputRegistersChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (inputRegistersChunkOffset < inputRegistersLength)
+					{
+						inputRegistersChunkLength = Math.Min(inputRegistersLength - inputRegistersChunkOffset, 29);
+
+						Array.Copy(inputRegisters, inputRegistersChunkOffset, inputRegistersChunkData, 0, inputRegistersChunkLength);
+						Array.Clear(inputRegistersChunkData, inputRegistersChunkLength, 29 - inputRegistersChunkLength);
+
+						ModbusSlaveAnswerReadInputRegistersRequestLowLevel(requestID, inputRegistersLength, inputRegistersChunkOffset, inputRegistersChunkData);
+
+						inputRegistersChunkOffset += 29;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnReadLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int messageLength = LEConverter.UShortFrom(8, response);
+			int messageChunkOffset = LEConverter.UShortFrom(10, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(12, response, 60);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_READ];
+			int messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+			var highLevelHandler = ReadCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[messageLength];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, (char[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = ReadLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, messageLength, messageChunkOffset, messageChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnErrorCountCallback(byte[] response)
+		{
+			if (response.Length != 16)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long overrunErrorCount = LEConverter.UIntFrom(8, response);
+			long parityErrorCount = LEConverter.UIntFrom(12, response);
+			var handler = ErrorCountCallback;
+
+			if (handler != null)
+			{
+				handler(this, overrunErrorCount, parityErrorCount);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusSlaveReadCoilsRequestCallback(byte[] response)
+		{
+			if (response.Length != 15)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			long startingAddress = LEConverter.UIntFrom(9, response);
+			int count = LEConverter.UShortFrom(13, response);
+			var handler = ModbusSlaveReadCoilsRequestCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, startingAddress, count);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusMasterReadCoilsResponseLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			short exceptionCode = LEConverter.SByteFrom(9, response);
+			int coilsLength = LEConverter.UShortFrom(10, response);
+			int coilsChunkOffset = LEConverter.UShortFrom(12, response);
+			bool[] coilsChunkData = new bool[464];
+			byte[] coilsChunkDataBits = new byte[58];
+			coilsChunkDataBits = LEConverter.ByteArrayFrom(14, response, 58);
+			for (int i = 0; i < 464; i++) {
+				coilsChunkData[i] = (coilsChunkDataBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_MODBUS_MASTER_READ_COILS_RESPONSE];
+			int coilsChunkLength = Math.Min(coilsLength - coilsChunkOffset, 464);
+			var highLevelHandler = ModbusMasterReadCoilsResponseCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (coilsChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new bool[coilsLength];
+					highLevelCallback.length = coilsChunkLength;
+
+					Array.Copy(coilsChunkData, (bool[])highLevelCallback.data, coilsChunkLength);
+
+					if (highLevelCallback.length >= coilsLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, exceptionCode, (bool[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (coilsChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, requestID, exceptionCode, (bool[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(coilsChunkData, 0, (bool[])highLevelCallback.data, highLevelCallback.length, coilsChunkLength);
+					highLevelCallback.length += coilsChunkLength;
+
+					if (highLevelCallback.length >= coilsLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, exceptionCode, (bool[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = ModbusMasterReadCoilsResponseLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, exceptionCode, coilsLength, coilsChunkOffset, coilsChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusSlaveReadHoldingRegistersRequestCallback(byte[] response)
+		{
+			if (response.Length != 15)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			long startingAddress = LEConverter.UIntFrom(9, response);
+			int count = LEConverter.UShortFrom(13, response);
+			var handler = ModbusSlaveReadHoldingRegistersRequestCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, startingAddress, count);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusMasterReadHoldingRegistersResponseLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			short exceptionCode = LEConverter.SByteFrom(9, response);
+			int holdingRegistersLength = LEConverter.UShortFrom(10, response);
+			int holdingRegistersChunkOffset = LEConverter.UShortFrom(12, response);
+			int[] holdingRegistersChunkData = LEConverter.UShortArrayFrom(14, response, 29);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_MODBUS_MASTER_READ_HOLDING_REGISTERS_RESPONSE];
+			int holdingRegistersChunkLength = Math.Min(holdingRegistersLength - holdingRegistersChunkOffset, 29);
+			var highLevelHandler = ModbusMasterReadHoldingRegistersResponseCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (holdingRegistersChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new int[holdingRegistersLength];
+					highLevelCallback.length = holdingRegistersChunkLength;
+
+					Array.Copy(holdingRegistersChunkData, (int[])highLevelCallback.data, holdingRegistersChunkLength);
+
+					if (highLevelCallback.length >= holdingRegistersLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, exceptionCode, (int[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (holdingRegistersChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, requestID, exceptionCode, (int[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(holdingRegistersChunkData, 0, (int[])highLevelCallback.data, highLevelCallback.length, holdingRegistersChunkLength);
+					highLevelCallback.length += holdingRegistersChunkLength;
+
+					if (highLevelCallback.length >= holdingRegistersLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, exceptionCode, (int[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = ModbusMasterReadHoldingRegistersResponseLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, exceptionCode, holdingRegistersLength, holdingRegistersChunkOffset, holdingRegistersChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusSlaveWriteSingleCoilRequestCallback(byte[] response)
+		{
+			if (response.Length != 14)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			long coilAddress = LEConverter.UIntFrom(9, response);
+			bool coilValue = LEConverter.BoolFrom(13, response);
+			var handler = ModbusSlaveWriteSingleCoilRequestCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, coilAddress, coilValue);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusMasterWriteSingleCoilResponseCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			short exceptionCode = LEConverter.SByteFrom(9, response);
+			var handler = ModbusMasterWriteSingleCoilResponseCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, exceptionCode);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusSlaveWriteSingleRegisterRequestCallback(byte[] response)
+		{
+			if (response.Length != 15)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			long registerAddress = LEConverter.UIntFrom(9, response);
+			int registerValue = LEConverter.UShortFrom(13, response);
+			var handler = ModbusSlaveWriteSingleRegisterRequestCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, registerAddress, registerValue);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusMasterWriteSingleRegisterResponseCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			short exceptionCode = LEConverter.SByteFrom(9, response);
+			var handler = ModbusMasterWriteSingleRegisterResponseCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, exceptionCode);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusSlaveWriteMultipleCoilsRequestLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			long startingAddress = LEConverter.UIntFrom(9, response);
+			int coilsLength = LEConverter.UShortFrom(13, response);
+			int coilsChunkOffset = LEConverter.UShortFrom(15, response);
+			bool[] coilsChunkData = new bool[440];
+			byte[] coilsChunkDataBits = new byte[55];
+			coilsChunkDataBits = LEConverter.ByteArrayFrom(17, response, 55);
+			for (int i = 0; i < 440; i++) {
+				coilsChunkData[i] = (coilsChunkDataBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_COILS_REQUEST];
+			int coilsChunkLength = Math.Min(coilsLength - coilsChunkOffset, 440);
+			var highLevelHandler = ModbusSlaveWriteMultipleCoilsRequestCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (coilsChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new bool[coilsLength];
+					highLevelCallback.length = coilsChunkLength;
+
+					Array.Copy(coilsChunkData, (bool[])highLevelCallback.data, coilsChunkLength);
+
+					if (highLevelCallback.length >= coilsLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, startingAddress, (bool[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (coilsChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, requestID, startingAddress, (bool[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(coilsChunkData, 0, (bool[])highLevelCallback.data, highLevelCallback.length, coilsChunkLength);
+					highLevelCallback.length += coilsChunkLength;
+
+					if (highLevelCallback.length >= coilsLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, startingAddress, (bool[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = ModbusSlaveWriteMultipleCoilsRequestLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, startingAddress, coilsLength, coilsChunkOffset, coilsChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusMasterWriteMultipleCoilsResponseCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			short exceptionCode = LEConverter.SByteFrom(9, response);
+			var handler = ModbusMasterWriteMultipleCoilsResponseCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, exceptionCode);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusSlaveWriteMultipleRegistersRequestLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 71)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			long startingAddress = LEConverter.UIntFrom(9, response);
+			int registersLength = LEConverter.UShortFrom(13, response);
+			int registersChunkOffset = LEConverter.UShortFrom(15, response);
+			int[] registersChunkData = LEConverter.UShortArrayFrom(17, response, 27);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_REGISTERS_REQUEST];
+			int registersChunkLength = Math.Min(registersLength - registersChunkOffset, 27);
+			var highLevelHandler = ModbusSlaveWriteMultipleRegistersRequestCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (registersChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new int[registersLength];
+					highLevelCallback.length = registersChunkLength;
+
+					Array.Copy(registersChunkData, (int[])highLevelCallback.data, registersChunkLength);
+
+					if (highLevelCallback.length >= registersLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, startingAddress, (int[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (registersChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, requestID, startingAddress, (int[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(registersChunkData, 0, (int[])highLevelCallback.data, highLevelCallback.length, registersChunkLength);
+					highLevelCallback.length += registersChunkLength;
+
+					if (highLevelCallback.length >= registersLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, startingAddress, (int[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = ModbusSlaveWriteMultipleRegistersRequestLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, startingAddress, registersLength, registersChunkOffset, registersChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusMasterWriteMultipleRegistersResponseCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			short exceptionCode = LEConverter.SByteFrom(9, response);
+			var handler = ModbusMasterWriteMultipleRegistersResponseCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, exceptionCode);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusSlaveReadDiscreteInputsRequestCallback(byte[] response)
+		{
+			if (response.Length != 15)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			long startingAddress = LEConverter.UIntFrom(9, response);
+			int count = LEConverter.UShortFrom(13, response);
+			var handler = ModbusSlaveReadDiscreteInputsRequestCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, startingAddress, count);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusMasterReadDiscreteInputsResponseLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			short exceptionCode = LEConverter.SByteFrom(9, response);
+			int discreteInputsLength = LEConverter.UShortFrom(10, response);
+			int discreteInputsChunkOffset = LEConverter.UShortFrom(12, response);
+			bool[] discreteInputsChunkData = new bool[464];
+			byte[] discreteInputsChunkDataBits = new byte[58];
+			discreteInputsChunkDataBits = LEConverter.ByteArrayFrom(14, response, 58);
+			for (int i = 0; i < 464; i++) {
+				discreteInputsChunkData[i] = (discreteInputsChunkDataBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_MODBUS_MASTER_READ_DISCRETE_INPUTS_RESPONSE];
+			int discreteInputsChunkLength = Math.Min(discreteInputsLength - discreteInputsChunkOffset, 464);
+			var highLevelHandler = ModbusMasterReadDiscreteInputsResponseCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (discreteInputsChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new bool[discreteInputsLength];
+					highLevelCallback.length = discreteInputsChunkLength;
+
+					Array.Copy(discreteInputsChunkData, (bool[])highLevelCallback.data, discreteInputsChunkLength);
+
+					if (highLevelCallback.length >= discreteInputsLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, exceptionCode, (bool[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (discreteInputsChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, requestID, exceptionCode, (bool[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(discreteInputsChunkData, 0, (bool[])highLevelCallback.data, highLevelCallback.length, discreteInputsChunkLength);
+					highLevelCallback.length += discreteInputsChunkLength;
+
+					if (highLevelCallback.length >= discreteInputsLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, exceptionCode, (bool[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = ModbusMasterReadDiscreteInputsResponseLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, exceptionCode, discreteInputsLength, discreteInputsChunkOffset, discreteInputsChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusSlaveReadInputRegistersRequestCallback(byte[] response)
+		{
+			if (response.Length != 15)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			long startingAddress = LEConverter.UIntFrom(9, response);
+			int count = LEConverter.UShortFrom(13, response);
+			var handler = ModbusSlaveReadInputRegistersRequestCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, startingAddress, count);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnModbusMasterReadInputRegistersResponseLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte requestID = LEConverter.ByteFrom(8, response);
+			short exceptionCode = LEConverter.SByteFrom(9, response);
+			int inputRegistersLength = LEConverter.UShortFrom(10, response);
+			int inputRegistersChunkOffset = LEConverter.UShortFrom(12, response);
+			int[] inputRegistersChunkData = LEConverter.UShortArrayFrom(14, response, 29);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_MODBUS_MASTER_READ_INPUT_REGISTERS_RESPONSE];
+			int inputRegistersChunkLength = Math.Min(inputRegistersLength - inputRegistersChunkOffset, 29);
+			var highLevelHandler = ModbusMasterReadInputRegistersResponseCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (inputRegistersChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new int[inputRegistersLength];
+					highLevelCallback.length = inputRegistersChunkLength;
+
+					Array.Copy(inputRegistersChunkData, (int[])highLevelCallback.data, inputRegistersChunkLength);
+
+					if (highLevelCallback.length >= inputRegistersLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, exceptionCode, (int[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (inputRegistersChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, requestID, exceptionCode, (int[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(inputRegistersChunkData, 0, (int[])highLevelCallback.data, highLevelCallback.length, inputRegistersChunkLength);
+					highLevelCallback.length += inputRegistersChunkLength;
+
+					if (highLevelCallback.length >= inputRegistersLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, requestID, exceptionCode, (int[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = ModbusMasterReadInputRegistersResponseLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, requestID, exceptionCode, inputRegistersLength, inputRegistersChunkOffset, inputRegistersChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFrameReadableCallback(byte[] response)
+		{
+			if (response.Length != 10)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int frameCount = LEConverter.UShortFrom(8, response);
+			var handler = FrameReadableCallback;
+
+			if (handler != null)
+			{
+				handler(this, frameCount);
+			}
+		}
+	}
+}
@@ -0,0 +1,840 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Battery-backed real-time clock
+	/// </summary>
+	public class BrickletRealTimeClockV2 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 2106;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Real-Time Clock Bricklet 2.0";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DATE_TIME = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DATE_TIME = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TIMESTAMP = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_OFFSET = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_OFFSET = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DATE_TIME_CALLBACK_CONFIGURATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DATE_TIME_CALLBACK_CONFIGURATION = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_ALARM = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_ALARM = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_DATE_TIME = 10;
+
+		private const int CALLBACK_ALARM = 11;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte WEEKDAY_MONDAY = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte WEEKDAY_TUESDAY = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte WEEKDAY_WEDNESDAY = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte WEEKDAY_THURSDAY = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte WEEKDAY_FRIDAY = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte WEEKDAY_SATURDAY = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte WEEKDAY_SUNDAY = 7;
+
+		/// <summary>
+		/// </summary>
+		public const short ALARM_MATCH_DISABLED = -1;
+
+		/// <summary>
+		/// </summary>
+		public const int ALARM_INTERVAL_DISABLED = -1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletRealTimeClockV2.SetDateTimeCallbackConfiguration"/>. The parameters are the
+		///  same as for <see cref="Tinkerforge.BrickletRealTimeClockV2.GetDateTime"/>.
+		/// </summary>
+		public event DateTimeEventHandler DateTimeCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void DateTimeEventHandler(BrickletRealTimeClockV2 sender, int year, byte month, byte day, byte hour, byte minute, byte second, byte centisecond, byte weekday, long timestamp);
+
+		/// <summary>
+		///  This callback is triggered every time the current date and time matches the
+		///  configured alarm (see <see cref="Tinkerforge.BrickletRealTimeClockV2.SetAlarm"/>). The parameters are the same
+		///  as for <see cref="Tinkerforge.BrickletRealTimeClockV2.GetDateTime"/>.
+		/// </summary>
+		public event AlarmEventHandler AlarmCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void AlarmEventHandler(BrickletRealTimeClockV2 sender, int year, byte month, byte day, byte hour, byte minute, byte second, byte centisecond, byte weekday, long timestamp);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletRealTimeClockV2(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_DATE_TIME] = new CallbackWrapper(OnDateTimeCallback);
+			callbackWrappers[CALLBACK_ALARM] = new CallbackWrapper(OnAlarmCallback);
+
+
+			responseExpected[FUNCTION_SET_DATE_TIME] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_DATE_TIME] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_TIMESTAMP] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_OFFSET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_OFFSET] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DATE_TIME_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DATE_TIME_CALLBACK_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_ALARM] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_ALARM] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Sets the current date (including weekday) and the current time.
+		///  
+		///  If the backup battery is installed then the real-time clock keeps date and
+		///  time even if the Bricklet is not powered by a Brick.
+		///  
+		///  The real-time clock handles leap year and inserts the 29th of February
+		///  accordingly. But leap seconds, time zones and daylight saving time are not
+		///  handled.
+		/// </summary>
+		public void SetDateTime(int year, byte month, byte day, byte hour, byte minute, byte second, byte centisecond, byte weekday)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_SET_DATE_TIME);
+			LEConverter.To((short)year, 8, request);
+			LEConverter.To((byte)month, 10, request);
+			LEConverter.To((byte)day, 11, request);
+			LEConverter.To((byte)hour, 12, request);
+			LEConverter.To((byte)minute, 13, request);
+			LEConverter.To((byte)second, 14, request);
+			LEConverter.To((byte)centisecond, 15, request);
+			LEConverter.To((byte)weekday, 16, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current date (including weekday) and the current time of the
+		///  real-time.
+		///  
+		///  The timestamp represents the current date and the the current time of the
+		///  real-time clock converted to milliseconds and is an offset to 2000-01-01 00:00:00.0000.
+		/// </summary>
+		public void GetDateTime(out int year, out byte month, out byte day, out byte hour, out byte minute, out byte second, out byte centisecond, out byte weekday, out long timestamp)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DATE_TIME);
+
+			byte[] response = SendRequest(request, 25);
+
+			year = LEConverter.UShortFrom(8, response);
+			month = LEConverter.ByteFrom(10, response);
+			day = LEConverter.ByteFrom(11, response);
+			hour = LEConverter.ByteFrom(12, response);
+			minute = LEConverter.ByteFrom(13, response);
+			second = LEConverter.ByteFrom(14, response);
+			centisecond = LEConverter.ByteFrom(15, response);
+			weekday = LEConverter.ByteFrom(16, response);
+			timestamp = LEConverter.LongFrom(17, response);
+		}
+
+		/// <summary>
+		///  Returns the current date and the time of the real-time clock converted to
+		///  milliseconds. The timestamp has an effective resolution of hundredths of a
+		///  second and is an offset to 2000-01-01 00:00:00.0000.
+		/// </summary>
+		public long GetTimestamp()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TIMESTAMP);
+
+			byte[] response = SendRequest(request, 16);
+
+			return LEConverter.LongFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the offset the real-time clock should compensate for in 2.17 ppm steps
+		///  between -277.76 ppm (-128) and +275.59 ppm (127).
+		///  
+		///  The real-time clock time can deviate from the actual time due to the frequency
+		///  deviation of its 32.768 kHz crystal. Even without compensation (factory
+		///  default) the resulting time deviation should be at most ±20 ppm (±52.6
+		///  seconds per month).
+		///  
+		///  This deviation can be calculated by comparing the same duration measured by the
+		///  real-time clock (``rtc_duration``) an accurate reference clock
+		///  (``ref_duration``).
+		///  
+		///  For best results the configured offset should be set to 0 ppm first and then a
+		///  duration of at least 6 hours should be measured.
+		///  
+		///  The new offset (``new_offset``) can be calculated from the currently configured
+		///  offset (``current_offset``) and the measured durations as follow::
+		///  
+		///    new_offset = current_offset - round(1000000 * (rtc_duration - ref_duration) / rtc_duration / 2.17)
+		///  
+		///  If you want to calculate the offset, then we recommend using the calibration
+		///  dialog in Brick Viewer, instead of doing it manually.
+		///  
+		///  The offset is saved in the EEPROM of the Bricklet and only needs to be
+		///  configured once.
+		/// </summary>
+		public void SetOffset(short offset)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_OFFSET);
+			LEConverter.To((byte)offset, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the offset as set by <see cref="Tinkerforge.BrickletRealTimeClockV2.SetOffset"/>.
+		/// </summary>
+		public short GetOffset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_OFFSET);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.SByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletRealTimeClockV2.DateTimeCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		/// </summary>
+		public void SetDateTimeCallbackConfiguration(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DATE_TIME_CALLBACK_CONFIGURATION);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletRealTimeClockV2.SetDateTimeCallbackConfiguration"/>.
+		/// </summary>
+		public long GetDateTimeCallbackConfiguration()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DATE_TIME_CALLBACK_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Configures a repeatable alarm. The <see cref="Tinkerforge.BrickletRealTimeClockV2.AlarmCallback"/> callback is triggered if the
+		///  current date and time matches the configured alarm.
+		///  
+		///  Setting a parameter to -1 means that it should be disabled and doesn't take part
+		///  in the match. Setting all parameters to -1 disables the alarm completely.
+		///  
+		///  For example, to make the alarm trigger every day at 7:30 AM it can be
+		///  configured as (-1, -1, 7, 30, -1, -1, -1). The hour is set to match 7 and the
+		///  minute is set to match 30. The alarm is triggered if all enabled parameters
+		///  match.
+		///  
+		///  The interval has a special role. It allows to make the alarm reconfigure itself.
+		///  This is useful if you need a repeated alarm that cannot be expressed by matching
+		///  the current date and time. For example, to make the alarm trigger every 23
+		///  seconds it can be configured as (-1, -1, -1, -1, -1, -1, 23). Internally the
+		///  Bricklet will take the current date and time, add 23 seconds to it and set the
+		///  result as its alarm. The first alarm will be triggered 23 seconds after the
+		///  call. Because the interval is not -1, the Bricklet will do the same again
+		///  internally, take the current date and time, add 23 seconds to it and set that
+		///  as its alarm. This results in a repeated alarm that triggers every 23 seconds.
+		///  
+		///  The interval can also be used in combination with the other parameters. For
+		///  example, configuring the alarm as (-1, -1, 7, 30, -1, -1, 300) results in an
+		///  alarm that triggers every day at 7:30 AM and is then repeated every 5 minutes.
+		/// </summary>
+		public void SetAlarm(short month, short day, short hour, short minute, short second, short weekday, int interval)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(18, FUNCTION_SET_ALARM);
+			LEConverter.To((byte)month, 8, request);
+			LEConverter.To((byte)day, 9, request);
+			LEConverter.To((byte)hour, 10, request);
+			LEConverter.To((byte)minute, 11, request);
+			LEConverter.To((byte)second, 12, request);
+			LEConverter.To((byte)weekday, 13, request);
+			LEConverter.To((int)interval, 14, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the alarm configuration as set by <see cref="Tinkerforge.BrickletRealTimeClockV2.SetAlarm"/>.
+		/// </summary>
+		public void GetAlarm(out short month, out short day, out short hour, out short minute, out short second, out short weekday, out int interval)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_ALARM);
+
+			byte[] response = SendRequest(request, 18);
+
+			month = LEConverter.SByteFrom(8, response);
+			day = LEConverter.SByteFrom(9, response);
+			hour = LEConverter.SByteFrom(10, response);
+			minute = LEConverter.SByteFrom(11, response);
+			second = LEConverter.SByteFrom(12, response);
+			weekday = LEConverter.SByteFrom(13, response);
+			interval = LEConverter.IntFrom(14, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletRealTimeClockV2.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletRealTimeClockV2.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletRealTimeClockV2.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletRealTimeClockV2.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnDateTimeCallback(byte[] response)
+		{
+			if (response.Length != 25)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int year = LEConverter.UShortFrom(8, response);
+			byte month = LEConverter.ByteFrom(10, response);
+			byte day = LEConverter.ByteFrom(11, response);
+			byte hour = LEConverter.ByteFrom(12, response);
+			byte minute = LEConverter.ByteFrom(13, response);
+			byte second = LEConverter.ByteFrom(14, response);
+			byte centisecond = LEConverter.ByteFrom(15, response);
+			byte weekday = LEConverter.ByteFrom(16, response);
+			long timestamp = LEConverter.LongFrom(17, response);
+			var handler = DateTimeCallback;
+
+			if (handler != null)
+			{
+				handler(this, year, month, day, hour, minute, second, centisecond, weekday, timestamp);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnAlarmCallback(byte[] response)
+		{
+			if (response.Length != 25)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int year = LEConverter.UShortFrom(8, response);
+			byte month = LEConverter.ByteFrom(10, response);
+			byte day = LEConverter.ByteFrom(11, response);
+			byte hour = LEConverter.ByteFrom(12, response);
+			byte minute = LEConverter.ByteFrom(13, response);
+			byte second = LEConverter.ByteFrom(14, response);
+			byte centisecond = LEConverter.ByteFrom(15, response);
+			byte weekday = LEConverter.ByteFrom(16, response);
+			long timestamp = LEConverter.LongFrom(17, response);
+			var handler = AlarmCallback;
+
+			if (handler != null)
+			{
+				handler(this, year, month, day, hour, minute, second, centisecond, weekday, timestamp);
+			}
+		}
+	}
+}
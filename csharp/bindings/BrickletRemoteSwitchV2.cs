@@ -0,0 +1,967 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Controls remote mains switches and receives signals from remotes
+	/// </summary>
+	public class BrickletRemoteSwitchV2 : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 289;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Remote Switch Bricklet 2.0";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SWITCHING_STATE = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_REPEATS = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_REPEATS = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SWITCH_SOCKET_A = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SWITCH_SOCKET_B = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_DIM_SOCKET_B = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SWITCH_SOCKET_C = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_REMOTE_CONFIGURATION = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_REMOTE_CONFIGURATION = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_REMOTE_STATUS_A = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_REMOTE_STATUS_B = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_REMOTE_STATUS_C = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_SWITCHING_DONE = 2;
+
+		private const int CALLBACK_REMOTE_STATUS_A = 14;
+
+		private const int CALLBACK_REMOTE_STATUS_B = 15;
+
+		private const int CALLBACK_REMOTE_STATUS_C = 16;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte SWITCHING_STATE_READY = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SWITCHING_STATE_BUSY = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte SWITCH_TO_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte SWITCH_TO_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte REMOTE_TYPE_A = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte REMOTE_TYPE_B = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte REMOTE_TYPE_C = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  This callback is triggered whenever the switching state changes
+		///  from busy to ready, see <see cref="Tinkerforge.BrickletRemoteSwitchV2.GetSwitchingState"/>.
+		/// </summary>
+		public event SwitchingDoneEventHandler SwitchingDoneCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void SwitchingDoneEventHandler(BrickletRemoteSwitchV2 sender);
+
+		/// <summary>
+		///  Returns the house code, receiver code, switch state (on/off) and number of repeats for
+		///  remote type A.
+		///  
+		///  The repeats are the number of received identical data packets. The longer the button is pressed,
+		///  the higher the repeat number. The callback is triggered with every repeat.
+		///  
+		///  You have to enable the callback with <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetRemoteConfiguration"/>. The number
+		///  of repeats that you can set in the configuration is the minimum number of repeats that have
+		///  to be seen before the callback is triggered for the first time.
+		/// </summary>
+		public event RemoteStatusAEventHandler RemoteStatusACallback;
+		/// <summary>
+		/// </summary>
+		public delegate void RemoteStatusAEventHandler(BrickletRemoteSwitchV2 sender, byte houseCode, byte receiverCode, byte switchTo, int repeats);
+
+		/// <summary>
+		///  Returns the address (unique per remote), unit (button number), switch state (on/off) and number of repeats for
+		///  remote type B.
+		///  
+		///  If the remote supports dimming the dim value is used instead of the switch state.
+		///  
+		///  The repeats are the number of received identical data packets. The longer the button is pressed,
+		///  the higher the repeat number. The callback is triggered with every repeat.
+		///  
+		///  You have to enable the callback with <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetRemoteConfiguration"/>. The number
+		///  of repeats that you can set in the configuration is the minimum number of repeats that have
+		///  to be seen before the callback is triggered for the first time.
+		/// </summary>
+		public event RemoteStatusBEventHandler RemoteStatusBCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void RemoteStatusBEventHandler(BrickletRemoteSwitchV2 sender, long address, byte unit, byte switchTo, byte dimValue, int repeats);
+
+		/// <summary>
+		///  Returns the system code, device code, switch state (on/off) and number of repeats for
+		///  remote type C.
+		///  
+		///  The repeats are the number of received identical data packets. The longer the button is pressed,
+		///  the higher the repeat number. The callback is triggered with every repeat.
+		///  
+		///  You have to enable the callback with <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetRemoteConfiguration"/>. The number
+		///  of repeats that you can set in the configuration is the minimum number of repeats that have
+		///  to be seen before the callback is triggered for the first time.
+		/// </summary>
+		public event RemoteStatusCEventHandler RemoteStatusCCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void RemoteStatusCEventHandler(BrickletRemoteSwitchV2 sender, char systemCode, byte deviceCode, byte switchTo, int repeats);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletRemoteSwitchV2(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_SWITCHING_DONE] = new CallbackWrapper(OnSwitchingDoneCallback);
+			callbackWrappers[CALLBACK_REMOTE_STATUS_A] = new CallbackWrapper(OnRemoteStatusACallback);
+			callbackWrappers[CALLBACK_REMOTE_STATUS_B] = new CallbackWrapper(OnRemoteStatusBCallback);
+			callbackWrappers[CALLBACK_REMOTE_STATUS_C] = new CallbackWrapper(OnRemoteStatusCCallback);
+
+
+			responseExpected[FUNCTION_GET_SWITCHING_STATE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_REPEATS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_REPEATS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SWITCH_SOCKET_A] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SWITCH_SOCKET_B] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_DIM_SOCKET_B] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SWITCH_SOCKET_C] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_SET_REMOTE_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_REMOTE_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_REMOTE_STATUS_A] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_REMOTE_STATUS_B] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_REMOTE_STATUS_C] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the current switching state. If the current state is busy, the
+		///  Bricklet is currently sending a code to switch a socket. It will not
+		///  accept any calls of switch socket functions until the state changes to ready.
+		///  
+		///  How long the switching takes is dependent on the number of repeats, see
+		///  <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetRepeats"/>.
+		/// </summary>
+		public byte GetSwitchingState()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SWITCHING_STATE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the number of times the code is sent when one of the Switch Socket
+		///  functions is called. The repeats basically correspond to the amount of time
+		///  that a button of the remote is pressed.
+		///  
+		///  Some dimmers are controlled by the length of a button pressed,
+		///  this can be simulated by increasing the repeats.
+		/// </summary>
+		public void SetRepeats(byte repeats)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_REPEATS);
+			LEConverter.To((byte)repeats, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the number of repeats as set by <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetRepeats"/>.
+		/// </summary>
+		public byte GetRepeats()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_REPEATS);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  To switch a type A socket you have to give the house code, receiver code and the
+		///  state (on or off) you want to switch to.
+		///  
+		///  A detailed description on how you can figure out the house and receiver code
+		///  can be found :ref:`here &lt;remote_switch_bricklet_type_a_house_and_receiver_code&gt;`.
+		/// </summary>
+		public void SwitchSocketA(byte houseCode, byte receiverCode, byte switchTo)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SWITCH_SOCKET_A);
+			LEConverter.To((byte)houseCode, 8, request);
+			LEConverter.To((byte)receiverCode, 9, request);
+			LEConverter.To((byte)switchTo, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  To switch a type B socket you have to give the address, unit and the state
+		///  (on or off) you want to switch to.
+		///  
+		///  To switch all devices with the same address use 255 for the unit.
+		///  
+		///  A detailed description on how you can teach a socket the address and unit can
+		///  be found :ref:`here &lt;remote_switch_bricklet_type_b_address_and_unit&gt;`.
+		/// </summary>
+		public void SwitchSocketB(long address, byte unit, byte switchTo)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_SWITCH_SOCKET_B);
+			LEConverter.To((int)address, 8, request);
+			LEConverter.To((byte)unit, 12, request);
+			LEConverter.To((byte)switchTo, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  To control a type B dimmer you have to give the address, unit and the
+		///  dim value you want to set the dimmer to.
+		///  
+		///  A detailed description on how you can teach a dimmer the address and unit can
+		///  be found :ref:`here &lt;remote_switch_bricklet_type_b_address_and_unit&gt;`.
+		/// </summary>
+		public void DimSocketB(long address, byte unit, byte dimValue)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(14, FUNCTION_DIM_SOCKET_B);
+			LEConverter.To((int)address, 8, request);
+			LEConverter.To((byte)unit, 12, request);
+			LEConverter.To((byte)dimValue, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  To switch a type C socket you have to give the system code, device code and the
+		///  state (on or off) you want to switch to.
+		///  
+		///  A detailed description on how you can figure out the system and device code
+		///  can be found :ref:`here &lt;remote_switch_bricklet_type_c_system_and_device_code&gt;`.
+		/// </summary>
+		public void SwitchSocketC(char systemCode, byte deviceCode, byte switchTo)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SWITCH_SOCKET_C);
+			LEConverter.To((char)systemCode, 8, request);
+			LEConverter.To((byte)deviceCode, 9, request);
+			LEConverter.To((byte)switchTo, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Sets the configuration for **receiving** data from a remote of type A, B or C.
+		///  
+		///  * Remote Type: A, B or C depending on the type of remote you want to receive.
+		///  * Minimum Repeats: The minimum number of repeated data packets until the callback
+		///    is triggered (if enabled).
+		///  * Callback Enabled: Enable or disable callback (see <see cref="Tinkerforge.BrickletRemoteSwitchV2.RemoteStatusACallback"/> callback,
+		///    <see cref="Tinkerforge.BrickletRemoteSwitchV2.RemoteStatusBCallback"/> callback and <see cref="Tinkerforge.BrickletRemoteSwitchV2.RemoteStatusCCallback"/> callback).
+		/// </summary>
+		public void SetRemoteConfiguration(byte remoteType, int minimumRepeats, bool callbackEnabled)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_REMOTE_CONFIGURATION);
+			LEConverter.To((byte)remoteType, 8, request);
+			LEConverter.To((short)minimumRepeats, 9, request);
+			LEConverter.To((bool)callbackEnabled, 11, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the remote configuration as set by <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetRemoteConfiguration"/>
+		/// </summary>
+		public void GetRemoteConfiguration(out byte remoteType, out int minimumRepeats, out bool callbackEnabled)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_REMOTE_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 12);
+
+			remoteType = LEConverter.ByteFrom(8, response);
+			minimumRepeats = LEConverter.UShortFrom(9, response);
+			callbackEnabled = LEConverter.BoolFrom(11, response);
+		}
+
+		/// <summary>
+		///  Returns the house code, receiver code, switch state (on/off) and number of
+		///  repeats for remote type A.
+		///  
+		///  Repeats == 0 means there was no button press. Repeats &gt;= 1 means there
+		///  was a button press with the specified house/receiver code. The repeats are the
+		///  number of received identical data packets. The longer the button is pressed,
+		///  the higher the repeat number.
+		///  
+		///  Use the callback to get this data automatically when a button is pressed,
+		///  see <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetRemoteConfiguration"/> and <see cref="Tinkerforge.BrickletRemoteSwitchV2.RemoteStatusACallback"/> callback.
+		/// </summary>
+		public void GetRemoteStatusA(out byte houseCode, out byte receiverCode, out byte switchTo, out int repeats)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_REMOTE_STATUS_A);
+
+			byte[] response = SendRequest(request, 13);
+
+			houseCode = LEConverter.ByteFrom(8, response);
+			receiverCode = LEConverter.ByteFrom(9, response);
+			switchTo = LEConverter.ByteFrom(10, response);
+			repeats = LEConverter.UShortFrom(11, response);
+		}
+
+		/// <summary>
+		///  Returns the address (unique per remote), unit (button number), switch state
+		///  (on/off) and number of repeats for remote type B.
+		///  
+		///  If the remote supports dimming the dim value is used instead of the switch state.
+		///  
+		///  If repeats=0 there was no button press. If repeats &gt;= 1 there
+		///  was a button press with the specified address/unit. The repeats are the number of received
+		///  identical data packets. The longer the button is pressed, the higher the repeat number.
+		///  
+		///  Use the callback to get this data automatically when a button is pressed,
+		///  see <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetRemoteConfiguration"/> and <see cref="Tinkerforge.BrickletRemoteSwitchV2.RemoteStatusBCallback"/> callback.
+		/// </summary>
+		public void GetRemoteStatusB(out long address, out byte unit, out byte switchTo, out byte dimValue, out int repeats)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_REMOTE_STATUS_B);
+
+			byte[] response = SendRequest(request, 17);
+
+			address = LEConverter.UIntFrom(8, response);
+			unit = LEConverter.ByteFrom(12, response);
+			switchTo = LEConverter.ByteFrom(13, response);
+			dimValue = LEConverter.ByteFrom(14, response);
+			repeats = LEConverter.UShortFrom(15, response);
+		}
+
+		/// <summary>
+		///  Returns the system code, device code, switch state (on/off) and number of repeats for
+		///  remote type C.
+		///  
+		///  If repeats=0 there was no button press. If repeats &gt;= 1 there
+		///  was a button press with the specified system/device code. The repeats are the number of received
+		///  identical data packets. The longer the button is pressed, the higher the repeat number.
+		///  
+		///  Use the callback to get this data automatically when a button is pressed,
+		///  see <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetRemoteConfiguration"/> and <see cref="Tinkerforge.BrickletRemoteSwitchV2.RemoteStatusCCallback"/> callback.
+		/// </summary>
+		public void GetRemoteStatusC(out char systemCode, out byte deviceCode, out byte switchTo, out int repeats)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_REMOTE_STATUS_C);
+
+			byte[] response = SendRequest(request, 13);
+
+			systemCode = LEConverter.CharFrom(8, response);
+			deviceCode = LEConverter.ByteFrom(9, response);
+			switchTo = LEConverter.ByteFrom(10, response);
+			repeats = LEConverter.UShortFrom(11, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletRemoteSwitchV2.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletRemoteSwitchV2.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnSwitchingDoneCallback(byte[] response)
+		{
+			if (response.Length != 8)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			var handler = SwitchingDoneCallback;
+
+			if (handler != null)
+			{
+				handler(this);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnRemoteStatusACallback(byte[] response)
+		{
+			if (response.Length != 13)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte houseCode = LEConverter.ByteFrom(8, response);
+			byte receiverCode = LEConverter.ByteFrom(9, response);
+			byte switchTo = LEConverter.ByteFrom(10, response);
+			int repeats = LEConverter.UShortFrom(11, response);
+			var handler = RemoteStatusACallback;
+
+			if (handler != null)
+			{
+				handler(this, houseCode, receiverCode, switchTo, repeats);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnRemoteStatusBCallback(byte[] response)
+		{
+			if (response.Length != 17)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			long address = LEConverter.UIntFrom(8, response);
+			byte unit = LEConverter.ByteFrom(12, response);
+			byte switchTo = LEConverter.ByteFrom(13, response);
+			byte dimValue = LEConverter.ByteFrom(14, response);
+			int repeats = LEConverter.UShortFrom(15, response);
+			var handler = RemoteStatusBCallback;
+
+			if (handler != null)
+			{
+				handler(this, address, unit, switchTo, dimValue, repeats);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnRemoteStatusCCallback(byte[] response)
+		{
+			if (response.Length != 13)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			char systemCode = LEConverter.CharFrom(8, response);
+			byte deviceCode = LEConverter.ByteFrom(9, response);
+			byte switchTo = LEConverter.ByteFrom(10, response);
+			int repeats = LEConverter.UShortFrom(11, response);
+			var handler = RemoteStatusCCallback;
+
+			if (handler != null)
+			{
+				handler(this, systemCode, deviceCode, switchTo, repeats);
+			}
+		}
+	}
+}
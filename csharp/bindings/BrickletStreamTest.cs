@@ -0,0 +1,5957 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  
+	/// </summary>
+	public class BrickletStreamTest : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 21111;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Stream Test Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_WRITE_LOW_LEVEL = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_WRITE_LOW_LEVEL = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_WRITE_LOW_LEVEL = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL = 22;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL = 23;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL = 24;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL = 25;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL = 26;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_WRITE_LOW_LEVEL = 27;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL = 28;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL = 29;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL = 30;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL = 31;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_WRITE_EXTRA_IN_FULL_LOW_LEVEL = 32;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL = 33;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL = 34;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_SINGLE_WRITE_LOW_LEVEL = 35;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL = 36;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL = 37;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL = 38;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL = 39;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL = 40;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL = 41;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL = 42;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL = 43;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL = 44;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_READ_LOW_LEVEL = 45;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL = 46;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL = 47;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL = 48;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL = 49;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL = 50;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL = 51;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL = 52;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_READ_LOW_LEVEL = 53;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL = 54;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL = 55;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL = 56;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL = 57;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL = 58;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL = 59;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL = 60;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_READ_LOW_LEVEL = 61;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL = 62;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL = 63;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL = 64;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL = 65;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL = 66;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL = 67;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL = 68;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_NORMAL_READ_LOW_LEVEL = 69;
+
+		private const int CALLBACK_NORMAL_READ_EXTRA_PREFIX_1_LOW_LEVEL = 70;
+
+		private const int CALLBACK_NORMAL_READ_EXTRA_PREFIX_2_LOW_LEVEL = 71;
+
+		private const int CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1_LOW_LEVEL = 72;
+
+		private const int CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2_LOW_LEVEL = 73;
+
+		private const int CALLBACK_NORMAL_READ_EXTRA_FULL_LOW_LEVEL = 74;
+
+		private const int CALLBACK_FIXED_READ_LOW_LEVEL = 75;
+
+		private const int CALLBACK_FIXED_READ_EXTRA_PREFIX_1_LOW_LEVEL = 76;
+
+		private const int CALLBACK_FIXED_READ_EXTRA_PREFIX_2_LOW_LEVEL = 77;
+
+		private const int CALLBACK_FIXED_READ_EXTRA_SUFFIX_1_LOW_LEVEL = 78;
+
+		private const int CALLBACK_FIXED_READ_EXTRA_SUFFIX_2_LOW_LEVEL = 79;
+
+		private const int CALLBACK_FIXED_READ_EXTRA_FULL_LOW_LEVEL = 80;
+
+		private const int CALLBACK_SINGLE_READ_LOW_LEVEL = 81;
+
+		private const int CALLBACK_SINGLE_READ_EXTRA_PREFIX_1_LOW_LEVEL = 82;
+
+		private const int CALLBACK_SINGLE_READ_EXTRA_PREFIX_2_LOW_LEVEL = 83;
+
+		private const int CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1_LOW_LEVEL = 84;
+
+		private const int CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2_LOW_LEVEL = 85;
+
+		private const int CALLBACK_SINGLE_READ_EXTRA_FULL_LOW_LEVEL = 86;
+
+		private const int CALLBACK_NORMAL_READ = -69;
+
+		private const int CALLBACK_NORMAL_READ_EXTRA_PREFIX_1 = -70;
+
+		private const int CALLBACK_NORMAL_READ_EXTRA_PREFIX_2 = -71;
+
+		private const int CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1 = -72;
+
+		private const int CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2 = -73;
+
+		private const int CALLBACK_NORMAL_READ_EXTRA_FULL = -74;
+
+		private const int CALLBACK_FIXED_READ = -75;
+
+		private const int CALLBACK_FIXED_READ_EXTRA_PREFIX_1 = -76;
+
+		private const int CALLBACK_FIXED_READ_EXTRA_PREFIX_2 = -77;
+
+		private const int CALLBACK_FIXED_READ_EXTRA_SUFFIX_1 = -78;
+
+		private const int CALLBACK_FIXED_READ_EXTRA_SUFFIX_2 = -79;
+
+		private const int CALLBACK_FIXED_READ_EXTRA_FULL = -80;
+
+		private const int CALLBACK_SINGLE_READ = -81;
+
+		private const int CALLBACK_SINGLE_READ_EXTRA_PREFIX_1 = -82;
+
+		private const int CALLBACK_SINGLE_READ_EXTRA_PREFIX_2 = -83;
+
+		private const int CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1 = -84;
+
+		private const int CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2 = -85;
+
+		private const int CALLBACK_SINGLE_READ_EXTRA_FULL = -86;
+
+
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.NormalReadCallback"/>
+		/// </summary>
+		public event NormalReadLowLevelEventHandler NormalReadLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadLowLevelEventHandler(BrickletStreamTest sender, int messageLength, int messageChunkOffset, char[] messageChunkData);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.NormalReadExtraPrefix1Callback"/>
+		/// </summary>
+		public event NormalReadExtraPrefix1LowLevelEventHandler NormalReadExtraPrefix1LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadExtraPrefix1LowLevelEventHandler(BrickletStreamTest sender, byte extra, int messageLength, int messageChunkOffset, char[] messageChunkData);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.NormalReadExtraPrefix2Callback"/>
+		/// </summary>
+		public event NormalReadExtraPrefix2LowLevelEventHandler NormalReadExtraPrefix2LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadExtraPrefix2LowLevelEventHandler(BrickletStreamTest sender, byte extra1, byte extra2, int messageLength, int messageChunkOffset, char[] messageChunkData);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.NormalReadExtraSuffix1Callback"/>
+		/// </summary>
+		public event NormalReadExtraSuffix1LowLevelEventHandler NormalReadExtraSuffix1LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadExtraSuffix1LowLevelEventHandler(BrickletStreamTest sender, int messageLength, int messageChunkOffset, char[] messageChunkData, byte extra);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.NormalReadExtraSuffix2Callback"/>
+		/// </summary>
+		public event NormalReadExtraSuffix2LowLevelEventHandler NormalReadExtraSuffix2LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadExtraSuffix2LowLevelEventHandler(BrickletStreamTest sender, int messageLength, int messageChunkOffset, char[] messageChunkData, byte extra1, byte extra2);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.NormalReadExtraFullCallback"/>
+		/// </summary>
+		public event NormalReadExtraFullLowLevelEventHandler NormalReadExtraFullLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadExtraFullLowLevelEventHandler(BrickletStreamTest sender, byte extra1, int messageLength, byte extra2, int messageChunkOffset, byte extra3, char[] messageChunkData, byte extra4);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.FixedReadCallback"/>
+		/// </summary>
+		public event FixedReadLowLevelEventHandler FixedReadLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadLowLevelEventHandler(BrickletStreamTest sender, int messageChunkOffset, char[] messageChunkData);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.FixedReadExtraPrefix1Callback"/>
+		/// </summary>
+		public event FixedReadExtraPrefix1LowLevelEventHandler FixedReadExtraPrefix1LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadExtraPrefix1LowLevelEventHandler(BrickletStreamTest sender, byte extra, int messageChunkOffset, char[] messageChunkData);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.FixedReadExtraPrefix2Callback"/>
+		/// </summary>
+		public event FixedReadExtraPrefix2LowLevelEventHandler FixedReadExtraPrefix2LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadExtraPrefix2LowLevelEventHandler(BrickletStreamTest sender, byte extra1, byte extra2, int messageChunkOffset, char[] messageChunkData);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.FixedReadExtraSuffix1Callback"/>
+		/// </summary>
+		public event FixedReadExtraSuffix1LowLevelEventHandler FixedReadExtraSuffix1LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadExtraSuffix1LowLevelEventHandler(BrickletStreamTest sender, int messageChunkOffset, char[] messageChunkData, byte extra);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.FixedReadExtraSuffix2Callback"/>
+		/// </summary>
+		public event FixedReadExtraSuffix2LowLevelEventHandler FixedReadExtraSuffix2LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadExtraSuffix2LowLevelEventHandler(BrickletStreamTest sender, int messageChunkOffset, char[] messageChunkData, byte extra1, byte extra2);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.FixedReadExtraFullCallback"/>
+		/// </summary>
+		public event FixedReadExtraFullLowLevelEventHandler FixedReadExtraFullLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadExtraFullLowLevelEventHandler(BrickletStreamTest sender, byte extra1, int messageChunkOffset, byte extra2, char[] messageChunkData, byte extra3);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.SingleReadCallback"/>
+		/// </summary>
+		public event SingleReadLowLevelEventHandler SingleReadLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadLowLevelEventHandler(BrickletStreamTest sender, byte messageLength, char[] messageData);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.SingleReadExtraPrefix1Callback"/>
+		/// </summary>
+		public event SingleReadExtraPrefix1LowLevelEventHandler SingleReadExtraPrefix1LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadExtraPrefix1LowLevelEventHandler(BrickletStreamTest sender, byte extra, byte messageLength, char[] messageData);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.SingleReadExtraPrefix2Callback"/>
+		/// </summary>
+		public event SingleReadExtraPrefix2LowLevelEventHandler SingleReadExtraPrefix2LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadExtraPrefix2LowLevelEventHandler(BrickletStreamTest sender, byte extra1, byte extra2, byte messageLength, char[] messageData);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.SingleReadExtraSuffix1Callback"/>
+		/// </summary>
+		public event SingleReadExtraSuffix1LowLevelEventHandler SingleReadExtraSuffix1LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadExtraSuffix1LowLevelEventHandler(BrickletStreamTest sender, byte messageLength, char[] messageData, byte extra);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.SingleReadExtraSuffix2Callback"/>
+		/// </summary>
+		public event SingleReadExtraSuffix2LowLevelEventHandler SingleReadExtraSuffix2LowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadExtraSuffix2LowLevelEventHandler(BrickletStreamTest sender, byte messageLength, char[] messageData, byte extra1, byte extra2);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletStreamTest.SingleReadExtraFullCallback"/>
+		/// </summary>
+		public event SingleReadExtraFullLowLevelEventHandler SingleReadExtraFullLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadExtraFullLowLevelEventHandler(BrickletStreamTest sender, byte extra1, byte messageLength, byte extra2, char[] messageData, byte extra3);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event NormalReadEventHandler NormalReadCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadEventHandler(BrickletStreamTest sender, char[] message);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event NormalReadExtraPrefix1EventHandler NormalReadExtraPrefix1Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadExtraPrefix1EventHandler(BrickletStreamTest sender, byte extra, char[] message);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event NormalReadExtraPrefix2EventHandler NormalReadExtraPrefix2Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadExtraPrefix2EventHandler(BrickletStreamTest sender, byte extra1, byte extra2, char[] message);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event NormalReadExtraSuffix1EventHandler NormalReadExtraSuffix1Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadExtraSuffix1EventHandler(BrickletStreamTest sender, char[] message, byte extra);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event NormalReadExtraSuffix2EventHandler NormalReadExtraSuffix2Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadExtraSuffix2EventHandler(BrickletStreamTest sender, char[] message, byte extra1, byte extra2);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event NormalReadExtraFullEventHandler NormalReadExtraFullCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void NormalReadExtraFullEventHandler(BrickletStreamTest sender, byte extra1, byte extra2, byte extra3, char[] message, byte extra4);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event FixedReadEventHandler FixedReadCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadEventHandler(BrickletStreamTest sender, char[] message);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event FixedReadExtraPrefix1EventHandler FixedReadExtraPrefix1Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadExtraPrefix1EventHandler(BrickletStreamTest sender, byte extra, char[] message);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event FixedReadExtraPrefix2EventHandler FixedReadExtraPrefix2Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadExtraPrefix2EventHandler(BrickletStreamTest sender, byte extra1, byte extra2, char[] message);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event FixedReadExtraSuffix1EventHandler FixedReadExtraSuffix1Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadExtraSuffix1EventHandler(BrickletStreamTest sender, char[] message, byte extra);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event FixedReadExtraSuffix2EventHandler FixedReadExtraSuffix2Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadExtraSuffix2EventHandler(BrickletStreamTest sender, char[] message, byte extra1, byte extra2);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event FixedReadExtraFullEventHandler FixedReadExtraFullCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void FixedReadExtraFullEventHandler(BrickletStreamTest sender, byte extra1, byte extra2, char[] message, byte extra3);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event SingleReadEventHandler SingleReadCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadEventHandler(BrickletStreamTest sender, char[] message);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event SingleReadExtraPrefix1EventHandler SingleReadExtraPrefix1Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadExtraPrefix1EventHandler(BrickletStreamTest sender, byte extra, char[] message);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event SingleReadExtraPrefix2EventHandler SingleReadExtraPrefix2Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadExtraPrefix2EventHandler(BrickletStreamTest sender, byte extra1, byte extra2, char[] message);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event SingleReadExtraSuffix1EventHandler SingleReadExtraSuffix1Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadExtraSuffix1EventHandler(BrickletStreamTest sender, char[] message, byte extra);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event SingleReadExtraSuffix2EventHandler SingleReadExtraSuffix2Callback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadExtraSuffix2EventHandler(BrickletStreamTest sender, char[] message, byte extra1, byte extra2);
+
+		/// <summary>
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for message.
+		///  </note>
+		/// </summary>
+		public event SingleReadExtraFullEventHandler SingleReadExtraFullCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void SingleReadExtraFullEventHandler(BrickletStreamTest sender, byte extra1, byte extra2, char[] message, byte extra3);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletStreamTest(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_NORMAL_READ_LOW_LEVEL] = new CallbackWrapper(OnNormalReadLowLevelCallback);
+			callbackWrappers[CALLBACK_NORMAL_READ_EXTRA_PREFIX_1_LOW_LEVEL] = new CallbackWrapper(OnNormalReadExtraPrefix1LowLevelCallback);
+			callbackWrappers[CALLBACK_NORMAL_READ_EXTRA_PREFIX_2_LOW_LEVEL] = new CallbackWrapper(OnNormalReadExtraPrefix2LowLevelCallback);
+			callbackWrappers[CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1_LOW_LEVEL] = new CallbackWrapper(OnNormalReadExtraSuffix1LowLevelCallback);
+			callbackWrappers[CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2_LOW_LEVEL] = new CallbackWrapper(OnNormalReadExtraSuffix2LowLevelCallback);
+			callbackWrappers[CALLBACK_NORMAL_READ_EXTRA_FULL_LOW_LEVEL] = new CallbackWrapper(OnNormalReadExtraFullLowLevelCallback);
+			callbackWrappers[CALLBACK_FIXED_READ_LOW_LEVEL] = new CallbackWrapper(OnFixedReadLowLevelCallback);
+			callbackWrappers[CALLBACK_FIXED_READ_EXTRA_PREFIX_1_LOW_LEVEL] = new CallbackWrapper(OnFixedReadExtraPrefix1LowLevelCallback);
+			callbackWrappers[CALLBACK_FIXED_READ_EXTRA_PREFIX_2_LOW_LEVEL] = new CallbackWrapper(OnFixedReadExtraPrefix2LowLevelCallback);
+			callbackWrappers[CALLBACK_FIXED_READ_EXTRA_SUFFIX_1_LOW_LEVEL] = new CallbackWrapper(OnFixedReadExtraSuffix1LowLevelCallback);
+			callbackWrappers[CALLBACK_FIXED_READ_EXTRA_SUFFIX_2_LOW_LEVEL] = new CallbackWrapper(OnFixedReadExtraSuffix2LowLevelCallback);
+			callbackWrappers[CALLBACK_FIXED_READ_EXTRA_FULL_LOW_LEVEL] = new CallbackWrapper(OnFixedReadExtraFullLowLevelCallback);
+			callbackWrappers[CALLBACK_SINGLE_READ_LOW_LEVEL] = new CallbackWrapper(OnSingleReadLowLevelCallback);
+			callbackWrappers[CALLBACK_SINGLE_READ_EXTRA_PREFIX_1_LOW_LEVEL] = new CallbackWrapper(OnSingleReadExtraPrefix1LowLevelCallback);
+			callbackWrappers[CALLBACK_SINGLE_READ_EXTRA_PREFIX_2_LOW_LEVEL] = new CallbackWrapper(OnSingleReadExtraPrefix2LowLevelCallback);
+			callbackWrappers[CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1_LOW_LEVEL] = new CallbackWrapper(OnSingleReadExtraSuffix1LowLevelCallback);
+			callbackWrappers[CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2_LOW_LEVEL] = new CallbackWrapper(OnSingleReadExtraSuffix2LowLevelCallback);
+			callbackWrappers[CALLBACK_SINGLE_READ_EXTRA_FULL_LOW_LEVEL] = new CallbackWrapper(OnSingleReadExtraFullLowLevelCallback);
+
+			highLevelCallbacks[-CALLBACK_NORMAL_READ] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_NORMAL_READ_EXTRA_PREFIX_1] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_NORMAL_READ_EXTRA_PREFIX_2] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_NORMAL_READ_EXTRA_FULL] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_FIXED_READ] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_FIXED_READ_EXTRA_PREFIX_1] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_FIXED_READ_EXTRA_PREFIX_2] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_FIXED_READ_EXTRA_SUFFIX_1] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_FIXED_READ_EXTRA_SUFFIX_2] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_FIXED_READ_EXTRA_FULL] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_SINGLE_READ] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_SINGLE_READ_EXTRA_PREFIX_1] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_SINGLE_READ_EXTRA_PREFIX_2] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_SINGLE_READ_EXTRA_FULL] = new HighLevelCallback();
+
+			responseExpected[FUNCTION_NORMAL_WRITE_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FIXED_WRITE_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_WRITE_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SINGLE_WRITE_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_SINGLE_WRITE_EXTRA_IN_FULL_LOW_LEVEL] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_SINGLE_WRITE_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_NORMAL_READ_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FIXED_READ_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SINGLE_READ_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteLowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_NORMAL_WRITE_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 60, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraInPrefix1LowLevel(byte extra, int messageLength, int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL);
+			LEConverter.To((byte)extra, 8, request);
+			LEConverter.To((short)messageLength, 9, request);
+			LEConverter.To((short)messageChunkOffset, 11, request);
+			LEConverter.To((char[])messageChunkData, 13, 59, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraInPrefix2LowLevel(byte extra1, byte extra2, int messageLength, int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((byte)extra2, 9, request);
+			LEConverter.To((short)messageLength, 10, request);
+			LEConverter.To((short)messageChunkOffset, 12, request);
+			LEConverter.To((char[])messageChunkData, 14, 58, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraInSuffix1LowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData, byte extra)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 59, request);
+			LEConverter.To((byte)extra, 71, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraInSuffix2LowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData, byte extra1, byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 58, request);
+			LEConverter.To((byte)extra1, 70, request);
+			LEConverter.To((byte)extra2, 71, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraInFullLowLevel(byte extra1, int messageLength, byte extra2, int messageChunkOffset, byte extra3, char[] messageChunkData, byte extra4)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((short)messageLength, 9, request);
+			LEConverter.To((byte)extra2, 11, request);
+			LEConverter.To((short)messageChunkOffset, 12, request);
+			LEConverter.To((byte)extra3, 14, request);
+			LEConverter.To((char[])messageChunkData, 15, 56, request);
+			LEConverter.To((byte)extra4, 71, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte NormalWriteExtraOut1LowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 60, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraOut2LowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData, out byte extra1, out byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 60, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			extra1 = LEConverter.ByteFrom(8, response);
+			extra2 = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteLowLevel(int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_FIXED_WRITE_LOW_LEVEL);
+			LEConverter.To((short)messageChunkOffset, 8, request);
+			LEConverter.To((char[])messageChunkData, 10, 62, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraInPrefix1LowLevel(byte extra, int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL);
+			LEConverter.To((byte)extra, 8, request);
+			LEConverter.To((short)messageChunkOffset, 9, request);
+			LEConverter.To((char[])messageChunkData, 11, 61, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraInPrefix2LowLevel(byte extra1, byte extra2, int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((byte)extra2, 9, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 60, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraInSuffix1LowLevel(int messageChunkOffset, char[] messageChunkData, byte extra)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL);
+			LEConverter.To((short)messageChunkOffset, 8, request);
+			LEConverter.To((char[])messageChunkData, 10, 61, request);
+			LEConverter.To((byte)extra, 71, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraInSuffix2LowLevel(int messageChunkOffset, char[] messageChunkData, byte extra1, byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL);
+			LEConverter.To((short)messageChunkOffset, 8, request);
+			LEConverter.To((char[])messageChunkData, 10, 60, request);
+			LEConverter.To((byte)extra1, 70, request);
+			LEConverter.To((byte)extra2, 71, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraInFullLowLevel(byte extra1, int messageChunkOffset, byte extra2, char[] messageChunkData, byte extra3)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((short)messageChunkOffset, 9, request);
+			LEConverter.To((byte)extra2, 11, request);
+			LEConverter.To((char[])messageChunkData, 12, 59, request);
+			LEConverter.To((byte)extra3, 71, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte FixedWriteExtraOut1LowLevel(int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL);
+			LEConverter.To((short)messageChunkOffset, 8, request);
+			LEConverter.To((char[])messageChunkData, 10, 62, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraOut2LowLevel(int messageChunkOffset, char[] messageChunkData, out byte extra1, out byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL);
+			LEConverter.To((short)messageChunkOffset, 8, request);
+			LEConverter.To((char[])messageChunkData, 10, 62, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			extra1 = LEConverter.ByteFrom(8, response);
+			extra2 = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortWriteLowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_WRITE_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 60, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortWriteExtraInPrefix1LowLevel(byte extra, int messageLength, int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL);
+			LEConverter.To((byte)extra, 8, request);
+			LEConverter.To((short)messageLength, 9, request);
+			LEConverter.To((short)messageChunkOffset, 11, request);
+			LEConverter.To((char[])messageChunkData, 13, 59, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortWriteExtraInPrefix2LowLevel(byte extra1, byte extra2, int messageLength, int messageChunkOffset, char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((byte)extra2, 9, request);
+			LEConverter.To((short)messageLength, 10, request);
+			LEConverter.To((short)messageChunkOffset, 12, request);
+			LEConverter.To((char[])messageChunkData, 14, 58, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortWriteExtraInSuffix1LowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData, byte extra)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 59, request);
+			LEConverter.To((byte)extra, 71, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortWriteExtraInSuffix2LowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData, byte extra1, byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 58, request);
+			LEConverter.To((byte)extra1, 70, request);
+			LEConverter.To((byte)extra2, 71, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortWriteExtraOutPrefix1LowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData, out byte extra, out byte messageChunkWritten)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 60, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			extra = LEConverter.ByteFrom(8, response);
+			messageChunkWritten = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortWriteExtraOutPrefix2LowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData, out byte extra1, out byte extra2, out byte messageChunkWritten)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 60, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			extra1 = LEConverter.ByteFrom(8, response);
+			extra2 = LEConverter.ByteFrom(9, response);
+			messageChunkWritten = LEConverter.ByteFrom(10, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortWriteExtraOutSuffix1LowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData, out byte messageChunkWritten, out byte extra)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 60, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			messageChunkWritten = LEConverter.ByteFrom(8, response);
+			extra = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortWriteExtraOutSuffix2LowLevel(int messageLength, int messageChunkOffset, char[] messageChunkData, out byte messageChunkWritten, out byte extra1, out byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL);
+			LEConverter.To((short)messageLength, 8, request);
+			LEConverter.To((short)messageChunkOffset, 10, request);
+			LEConverter.To((char[])messageChunkData, 12, 60, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			messageChunkWritten = LEConverter.ByteFrom(8, response);
+			extra1 = LEConverter.ByteFrom(9, response);
+			extra2 = LEConverter.ByteFrom(10, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortWriteExtraFullLowLevel(byte extra1, int messageLength, byte extra2, int messageChunkOffset, byte extra3, char[] messageChunkData, byte extra4, out byte extra5, out byte messageChunkWritten, out byte extra6)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((short)messageLength, 9, request);
+			LEConverter.To((byte)extra2, 11, request);
+			LEConverter.To((short)messageChunkOffset, 12, request);
+			LEConverter.To((byte)extra3, 14, request);
+			LEConverter.To((char[])messageChunkData, 15, 56, request);
+			LEConverter.To((byte)extra4, 71, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			extra5 = LEConverter.ByteFrom(8, response);
+			messageChunkWritten = LEConverter.ByteFrom(9, response);
+			extra6 = LEConverter.ByteFrom(10, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteLowLevel(byte messageLength, char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SINGLE_WRITE_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 63, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraInPrefix1LowLevel(byte extra, byte messageLength, char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL);
+			LEConverter.To((byte)extra, 8, request);
+			LEConverter.To((byte)messageLength, 9, request);
+			LEConverter.To((char[])messageData, 10, 62, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraInPrefix2LowLevel(byte extra1, byte extra2, byte messageLength, char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((byte)extra2, 9, request);
+			LEConverter.To((byte)messageLength, 10, request);
+			LEConverter.To((char[])messageData, 11, 61, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraInSuffix1LowLevel(byte messageLength, char[] messageData, byte extra)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 62, request);
+			LEConverter.To((byte)extra, 71, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraInSuffix2LowLevel(byte messageLength, char[] messageData, byte extra1, byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 61, request);
+			LEConverter.To((byte)extra1, 70, request);
+			LEConverter.To((byte)extra2, 71, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraInFullLowLevel(byte extra1, byte messageLength, byte extra2, char[] messageData, byte extra3)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SINGLE_WRITE_EXTRA_IN_FULL_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((byte)messageLength, 9, request);
+			LEConverter.To((byte)extra2, 10, request);
+			LEConverter.To((char[])messageData, 11, 60, request);
+			LEConverter.To((byte)extra3, 71, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte SingleWriteExtraOut1LowLevel(byte messageLength, char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 63, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraOut2LowLevel(byte messageLength, char[] messageData, out byte extra1, out byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 63, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			extra1 = LEConverter.ByteFrom(8, response);
+			extra2 = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortSingleWriteLowLevel(byte messageLength, char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_SINGLE_WRITE_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 63, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortSingleWriteExtraInPrefix1LowLevel(byte extra, byte messageLength, char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL);
+			LEConverter.To((byte)extra, 8, request);
+			LEConverter.To((byte)messageLength, 9, request);
+			LEConverter.To((char[])messageData, 10, 62, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortSingleWriteExtraInPrefix2LowLevel(byte extra1, byte extra2, byte messageLength, char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((byte)extra2, 9, request);
+			LEConverter.To((byte)messageLength, 10, request);
+			LEConverter.To((char[])messageData, 11, 61, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortSingleWriteExtraInSuffix1LowLevel(byte messageLength, char[] messageData, byte extra)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 62, request);
+			LEConverter.To((byte)extra, 71, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortSingleWriteExtraInSuffix2LowLevel(byte messageLength, char[] messageData, byte extra1, byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 61, request);
+			LEConverter.To((byte)extra1, 70, request);
+			LEConverter.To((byte)extra2, 71, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortSingleWriteExtraOutPrefix1LowLevel(byte messageLength, char[] messageData, out byte extra, out byte messageWritten)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(71, FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 62, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			extra = LEConverter.ByteFrom(8, response);
+			messageWritten = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortSingleWriteExtraOutPrefix2LowLevel(byte messageLength, char[] messageData, out byte extra1, out byte extra2, out byte messageWritten)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(71, FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 62, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			extra1 = LEConverter.ByteFrom(8, response);
+			extra2 = LEConverter.ByteFrom(9, response);
+			messageWritten = LEConverter.ByteFrom(10, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortSingleWriteExtraOutSuffix1LowLevel(byte messageLength, char[] messageData, out byte messageWritten, out byte extra)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 63, request);
+
+			byte[] response = SendRequest(request, 10);
+
+			messageWritten = LEConverter.ByteFrom(8, response);
+			extra = LEConverter.ByteFrom(9, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortSingleWriteExtraOutSuffix2LowLevel(byte messageLength, char[] messageData, out byte messageWritten, out byte extra1, out byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL);
+			LEConverter.To((byte)messageLength, 8, request);
+			LEConverter.To((char[])messageData, 9, 63, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			messageWritten = LEConverter.ByteFrom(8, response);
+			extra1 = LEConverter.ByteFrom(9, response);
+			extra2 = LEConverter.ByteFrom(10, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortSingleWriteExtraFullLowLevel(byte extra1, byte messageLength, byte extra2, char[] messageData, byte extra3, out byte extra4, out byte messageWritten, out byte extra5)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((byte)messageLength, 9, request);
+			LEConverter.To((byte)extra2, 10, request);
+			LEConverter.To((char[])messageData, 11, 60, request);
+			LEConverter.To((byte)extra3, 71, request);
+
+			byte[] response = SendRequest(request, 11);
+
+			extra4 = LEConverter.ByteFrom(8, response);
+			messageWritten = LEConverter.ByteFrom(9, response);
+			extra5 = LEConverter.ByteFrom(10, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadLowLevel(out int messageLength, out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_NORMAL_READ_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageLength = LEConverter.UShortFrom(8, response);
+			messageChunkOffset = LEConverter.UShortFrom(10, response);
+			messageChunkData = LEConverter.CharArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraIn1LowLevel(byte extra, out int messageLength, out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL);
+			LEConverter.To((byte)extra, 8, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageLength = LEConverter.UShortFrom(8, response);
+			messageChunkOffset = LEConverter.UShortFrom(10, response);
+			messageChunkData = LEConverter.CharArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraIn2LowLevel(byte extra1, byte extra2, out int messageLength, out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((byte)extra2, 9, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageLength = LEConverter.UShortFrom(8, response);
+			messageChunkOffset = LEConverter.UShortFrom(10, response);
+			messageChunkData = LEConverter.CharArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraOutPrefix1LowLevel(out byte extra, out int messageLength, out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			extra = LEConverter.ByteFrom(8, response);
+			messageLength = LEConverter.UShortFrom(9, response);
+			messageChunkOffset = LEConverter.UShortFrom(11, response);
+			messageChunkData = LEConverter.CharArrayFrom(13, response, 59);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraOutPrefix2LowLevel(out byte extra1, out byte extra2, out int messageLength, out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			extra1 = LEConverter.ByteFrom(8, response);
+			extra2 = LEConverter.ByteFrom(9, response);
+			messageLength = LEConverter.UShortFrom(10, response);
+			messageChunkOffset = LEConverter.UShortFrom(12, response);
+			messageChunkData = LEConverter.CharArrayFrom(14, response, 58);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraOutSuffix1LowLevel(out int messageLength, out int messageChunkOffset, out char[] messageChunkData, out byte extra)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageLength = LEConverter.UShortFrom(8, response);
+			messageChunkOffset = LEConverter.UShortFrom(10, response);
+			messageChunkData = LEConverter.CharArrayFrom(12, response, 59);
+			extra = LEConverter.ByteFrom(71, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraOutSuffix2LowLevel(out int messageLength, out int messageChunkOffset, out char[] messageChunkData, out byte extra1, out byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageLength = LEConverter.UShortFrom(8, response);
+			messageChunkOffset = LEConverter.UShortFrom(10, response);
+			messageChunkData = LEConverter.CharArrayFrom(12, response, 58);
+			extra1 = LEConverter.ByteFrom(70, response);
+			extra2 = LEConverter.ByteFrom(71, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraOutFullLowLevel(out byte extra1, out int messageLength, out byte extra2, out int messageChunkOffset, out byte extra3, out char[] messageChunkData, out byte extra4)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			extra1 = LEConverter.ByteFrom(8, response);
+			messageLength = LEConverter.UShortFrom(9, response);
+			extra2 = LEConverter.ByteFrom(11, response);
+			messageChunkOffset = LEConverter.UShortFrom(12, response);
+			extra3 = LEConverter.ByteFrom(14, response);
+			messageChunkData = LEConverter.CharArrayFrom(15, response, 56);
+			extra4 = LEConverter.ByteFrom(71, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadLowLevel(out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_FIXED_READ_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageChunkOffset = LEConverter.UShortFrom(8, response);
+			messageChunkData = LEConverter.CharArrayFrom(10, response, 62);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraIn1LowLevel(byte extra, out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL);
+			LEConverter.To((byte)extra, 8, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageChunkOffset = LEConverter.UShortFrom(8, response);
+			messageChunkData = LEConverter.CharArrayFrom(10, response, 62);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraIn2LowLevel(byte extra1, byte extra2, out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((byte)extra2, 9, request);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageChunkOffset = LEConverter.UShortFrom(8, response);
+			messageChunkData = LEConverter.CharArrayFrom(10, response, 62);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraOutPrefix1LowLevel(out byte extra, out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			extra = LEConverter.ByteFrom(8, response);
+			messageChunkOffset = LEConverter.UShortFrom(9, response);
+			messageChunkData = LEConverter.CharArrayFrom(11, response, 61);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraOutPrefix2LowLevel(out byte extra1, out byte extra2, out int messageChunkOffset, out char[] messageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			extra1 = LEConverter.ByteFrom(8, response);
+			extra2 = LEConverter.ByteFrom(9, response);
+			messageChunkOffset = LEConverter.UShortFrom(10, response);
+			messageChunkData = LEConverter.CharArrayFrom(12, response, 60);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraOutSuffix1LowLevel(out int messageChunkOffset, out char[] messageChunkData, out byte extra)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageChunkOffset = LEConverter.UShortFrom(8, response);
+			messageChunkData = LEConverter.CharArrayFrom(10, response, 61);
+			extra = LEConverter.ByteFrom(71, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraOutSuffix2LowLevel(out int messageChunkOffset, out char[] messageChunkData, out byte extra1, out byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageChunkOffset = LEConverter.UShortFrom(8, response);
+			messageChunkData = LEConverter.CharArrayFrom(10, response, 60);
+			extra1 = LEConverter.ByteFrom(70, response);
+			extra2 = LEConverter.ByteFrom(71, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraOutFullLowLevel(out byte extra1, out int messageChunkOffset, out byte extra2, out char[] messageChunkData, out byte extra3)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			extra1 = LEConverter.ByteFrom(8, response);
+			messageChunkOffset = LEConverter.UShortFrom(9, response);
+			extra2 = LEConverter.ByteFrom(11, response);
+			messageChunkData = LEConverter.CharArrayFrom(12, response, 59);
+			extra3 = LEConverter.ByteFrom(71, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadLowLevel(out byte messageLength, out char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_SINGLE_READ_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageLength = LEConverter.ByteFrom(8, response);
+			messageData = LEConverter.CharArrayFrom(9, response, 63);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraIn1LowLevel(byte extra, out byte messageLength, out char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL);
+			LEConverter.To((byte)extra, 8, request);
+
+			byte[] response = SendRequest(request, 71);
+
+			messageLength = LEConverter.ByteFrom(8, response);
+			messageData = LEConverter.CharArrayFrom(9, response, 62);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraIn2LowLevel(byte extra1, byte extra2, out byte messageLength, out char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(10, FUNCTION_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL);
+			LEConverter.To((byte)extra1, 8, request);
+			LEConverter.To((byte)extra2, 9, request);
+
+			byte[] response = SendRequest(request, 71);
+
+			messageLength = LEConverter.ByteFrom(8, response);
+			messageData = LEConverter.CharArrayFrom(9, response, 62);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraOutPrefix1LowLevel(out byte extra, out byte messageLength, out char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			extra = LEConverter.ByteFrom(8, response);
+			messageLength = LEConverter.ByteFrom(9, response);
+			messageData = LEConverter.CharArrayFrom(10, response, 62);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraOutPrefix2LowLevel(out byte extra1, out byte extra2, out byte messageLength, out char[] messageData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			extra1 = LEConverter.ByteFrom(8, response);
+			extra2 = LEConverter.ByteFrom(9, response);
+			messageLength = LEConverter.ByteFrom(10, response);
+			messageData = LEConverter.CharArrayFrom(11, response, 61);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraOutSuffix1LowLevel(out byte messageLength, out char[] messageData, out byte extra)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageLength = LEConverter.ByteFrom(8, response);
+			messageData = LEConverter.CharArrayFrom(9, response, 62);
+			extra = LEConverter.ByteFrom(71, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraOutSuffix2LowLevel(out byte messageLength, out char[] messageData, out byte extra1, out byte extra2)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			messageLength = LEConverter.ByteFrom(8, response);
+			messageData = LEConverter.CharArrayFrom(9, response, 61);
+			extra1 = LEConverter.ByteFrom(70, response);
+			extra2 = LEConverter.ByteFrom(71, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraOutFullLowLevel(out byte extra1, out byte messageLength, out byte extra2, out char[] messageData, out byte extra3)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			extra1 = LEConverter.ByteFrom(8, response);
+			messageLength = LEConverter.ByteFrom(9, response);
+			extra2 = LEConverter.ByteFrom(10, response);
+			messageData = LEConverter.CharArrayFrom(11, response, 60);
+			extra3 = LEConverter.ByteFrom(71, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWrite(char[] message)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 60);
+
+				NormalWriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+						NormalWriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+
+						messageChunkOffset += 60;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraInPrefix1(byte extra, char[] message)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[59];
+			int messageChunkLength;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 59);
+
+				NormalWriteExtraInPrefix1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 59 - messageChunkLength);
+
+						NormalWriteExtraInPrefix1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+
+						messageChunkOffset += 59;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraInPrefix2(byte extra1, byte extra2, char[] message)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[58];
+			int messageChunkLength;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 58);
+
+				NormalWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 58);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 58 - messageChunkLength);
+
+						NormalWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+
+						messageChunkOffset += 58;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraInSuffix1(char[] message, byte extra)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[59];
+			int messageChunkLength;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 59);
+
+				NormalWriteExtraInSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 59 - messageChunkLength);
+
+						NormalWriteExtraInSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra);
+
+						messageChunkOffset += 59;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraInSuffix2(char[] message, byte extra1, byte extra2)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[58];
+			int messageChunkLength;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 58);
+
+				NormalWriteExtraInSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 58);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 58 - messageChunkLength);
+
+						NormalWriteExtraInSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+
+						messageChunkOffset += 58;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraInFull(byte extra1, byte extra2, byte extra3, char[] message, byte extra4)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[56];
+			int messageChunkLength;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 56);
+
+				NormalWriteExtraInFullLowLevel(extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4);
+			}
+			else
+			{
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 56);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 56 - messageChunkLength);
+
+						NormalWriteExtraInFullLowLevel(extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4);
+
+						messageChunkOffset += 56;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte NormalWriteExtraOut1(char[] message)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			byte extra = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 60);
+
+				extra = NormalWriteExtraOut1LowLevel(messageLength, messageChunkOffset, messageChunkData);
+			}
+			else
+			{
+				extra = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+						extra = NormalWriteExtraOut1LowLevel(messageLength, messageChunkOffset, messageChunkData);
+
+						messageChunkOffset += 60;
+					}
+				}
+			}
+
+			return extra;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalWriteExtraOut2(char[] message, out byte extra1, out byte extra2)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 60);
+
+				NormalWriteExtraOut2LowLevel(messageLength, messageChunkOffset, messageChunkData, out extra1, out extra2);
+			}
+			else
+			{
+				extra1 = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+				extra2 = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+						NormalWriteExtraOut2LowLevel(messageLength, messageChunkOffset, messageChunkData, out extra1, out extra2);
+
+						messageChunkOffset += 60;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWrite(char[] message)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[62];
+			int messageChunkLength;
+
+			if (message.Length != messageLength)
+			{
+				throw new ArgumentException("Message has to be exactly " + messageLength + " items long");
+			}
+
+			lock (streamLock)
+			{
+				while (messageChunkOffset < messageLength)
+				{
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 62);
+
+					Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+					Array.Clear(messageChunkData, messageChunkLength, 62 - messageChunkLength);
+
+					FixedWriteLowLevel(messageChunkOffset, messageChunkData);
+
+					messageChunkOffset += 62;
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraInPrefix1(byte extra, char[] message)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[61];
+			int messageChunkLength;
+
+			if (message.Length != messageLength)
+			{
+				throw new ArgumentException("Message has to be exactly " + messageLength + " items long");
+			}
+
+			lock (streamLock)
+			{
+				while (messageChunkOffset < messageLength)
+				{
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 61);
+
+					Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+					Array.Clear(messageChunkData, messageChunkLength, 61 - messageChunkLength);
+
+					FixedWriteExtraInPrefix1LowLevel(extra, messageChunkOffset, messageChunkData);
+
+					messageChunkOffset += 61;
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraInPrefix2(byte extra1, byte extra2, char[] message)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+
+			if (message.Length != messageLength)
+			{
+				throw new ArgumentException("Message has to be exactly " + messageLength + " items long");
+			}
+
+			lock (streamLock)
+			{
+				while (messageChunkOffset < messageLength)
+				{
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+					Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+					Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+					FixedWriteExtraInPrefix2LowLevel(extra1, extra2, messageChunkOffset, messageChunkData);
+
+					messageChunkOffset += 60;
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraInSuffix1(char[] message, byte extra)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[61];
+			int messageChunkLength;
+
+			if (message.Length != messageLength)
+			{
+				throw new ArgumentException("Message has to be exactly " + messageLength + " items long");
+			}
+
+			lock (streamLock)
+			{
+				while (messageChunkOffset < messageLength)
+				{
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 61);
+
+					Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+					Array.Clear(messageChunkData, messageChunkLength, 61 - messageChunkLength);
+
+					FixedWriteExtraInSuffix1LowLevel(messageChunkOffset, messageChunkData, extra);
+
+					messageChunkOffset += 61;
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraInSuffix2(char[] message, byte extra1, byte extra2)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+
+			if (message.Length != messageLength)
+			{
+				throw new ArgumentException("Message has to be exactly " + messageLength + " items long");
+			}
+
+			lock (streamLock)
+			{
+				while (messageChunkOffset < messageLength)
+				{
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+					Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+					Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+					FixedWriteExtraInSuffix2LowLevel(messageChunkOffset, messageChunkData, extra1, extra2);
+
+					messageChunkOffset += 60;
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraInFull(byte extra1, byte extra2, char[] message, byte extra3)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[59];
+			int messageChunkLength;
+
+			if (message.Length != messageLength)
+			{
+				throw new ArgumentException("Message has to be exactly " + messageLength + " items long");
+			}
+
+			lock (streamLock)
+			{
+				while (messageChunkOffset < messageLength)
+				{
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+
+					Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+					Array.Clear(messageChunkData, messageChunkLength, 59 - messageChunkLength);
+
+					FixedWriteExtraInFullLowLevel(extra1, messageChunkOffset, extra2, messageChunkData, extra3);
+
+					messageChunkOffset += 59;
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte FixedWriteExtraOut1(char[] message)
+		{
+			byte extra = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = 1000;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[62];
+			int messageChunkLength;
+
+			if (message.Length != messageLength)
+			{
+				throw new ArgumentException("Message has to be exactly " + messageLength + " items long");
+			}
+
+			lock (streamLock)
+			{
+				extra = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				while (messageChunkOffset < messageLength)
+				{
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 62);
+
+					Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+					Array.Clear(messageChunkData, messageChunkLength, 62 - messageChunkLength);
+
+					extra = FixedWriteExtraOut1LowLevel(messageChunkOffset, messageChunkData);
+
+					messageChunkOffset += 62;
+				}
+			}
+
+			return extra;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedWriteExtraOut2(char[] message, out byte extra1, out byte extra2)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[62];
+			int messageChunkLength;
+
+			if (message.Length != messageLength)
+			{
+				throw new ArgumentException("Message has to be exactly " + messageLength + " items long");
+			}
+
+			lock (streamLock)
+			{
+				extra1 = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+				extra2 = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				while (messageChunkOffset < messageLength)
+				{
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 62);
+
+					Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+					Array.Clear(messageChunkData, messageChunkLength, 62 - messageChunkLength);
+
+					FixedWriteExtraOut2LowLevel(messageChunkOffset, messageChunkData, out extra1, out extra2);
+
+					messageChunkOffset += 62;
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public int ShortWrite(char[] message)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageWritten = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 60);
+
+				messageChunkWritten = ShortWriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+						messageChunkWritten = ShortWriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 60)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 60;
+					}
+				}
+			}
+
+			return messageWritten;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public int ShortWriteExtraInPrefix1(byte extra, char[] message)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageWritten = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[59];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 59);
+
+				messageChunkWritten = ShortWriteExtraInPrefix1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 59 - messageChunkLength);
+
+						messageChunkWritten = ShortWriteExtraInPrefix1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 59)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 59;
+					}
+				}
+			}
+
+			return messageWritten;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public int ShortWriteExtraInPrefix2(byte extra1, byte extra2, char[] message)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageWritten = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[58];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 58);
+
+				messageChunkWritten = ShortWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 58);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 58 - messageChunkLength);
+
+						messageChunkWritten = ShortWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 58)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 58;
+					}
+				}
+			}
+
+			return messageWritten;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public int ShortWriteExtraInSuffix1(char[] message, byte extra)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageWritten = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[59];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 59);
+
+				messageChunkWritten = ShortWriteExtraInSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 59 - messageChunkLength);
+
+						messageChunkWritten = ShortWriteExtraInSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 59)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 59;
+					}
+				}
+			}
+
+			return messageWritten;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public int ShortWriteExtraInSuffix2(char[] message, byte extra1, byte extra2)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageWritten = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[58];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 58);
+
+				messageChunkWritten = ShortWriteExtraInSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 58);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 58 - messageChunkLength);
+
+						messageChunkWritten = ShortWriteExtraInSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 58)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 58;
+					}
+				}
+			}
+
+			return messageWritten;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortWriteExtraOutPrefix1(char[] message, out byte extra, out int messageWritten)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 60);
+
+				ShortWriteExtraOutPrefix1LowLevel(messageLength, messageChunkOffset, messageChunkData, out extra, out messageChunkWritten);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				extra = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+						ShortWriteExtraOutPrefix1LowLevel(messageLength, messageChunkOffset, messageChunkData, out extra, out messageChunkWritten);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 60)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 60;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortWriteExtraOutPrefix2(char[] message, out byte extra1, out byte extra2, out int messageWritten)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 60);
+
+				ShortWriteExtraOutPrefix2LowLevel(messageLength, messageChunkOffset, messageChunkData, out extra1, out extra2, out messageChunkWritten);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				extra1 = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+				extra2 = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+						ShortWriteExtraOutPrefix2LowLevel(messageLength, messageChunkOffset, messageChunkData, out extra1, out extra2, out messageChunkWritten);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 60)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 60;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortWriteExtraOutSuffix1(char[] message, out int messageWritten, out byte extra)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 60);
+
+				ShortWriteExtraOutSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, out messageChunkWritten, out extra);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				extra = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+						ShortWriteExtraOutSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, out messageChunkWritten, out extra);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 60)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 60;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortWriteExtraOutSuffix2(char[] message, out int messageWritten, out byte extra1, out byte extra2)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 60);
+
+				ShortWriteExtraOutSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, out messageChunkWritten, out extra1, out extra2);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				extra1 = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+				extra2 = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 60 - messageChunkLength);
+
+						ShortWriteExtraOutSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, out messageChunkWritten, out extra1, out extra2);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 60)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 60;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortWriteExtraFull(byte extra1, byte extra2, byte extra3, char[] message, byte extra4, out byte extra5, out int messageWritten, out byte extra6)
+		{
+			if (message.Length > 65535)
+			{
+				throw new ArgumentException("Message can be at most 65535 items long");
+			}
+
+			int messageLength = message.Length;
+			int messageChunkOffset = 0;
+			char[] messageChunkData = new char[56];
+			int messageChunkLength;
+			byte messageChunkWritten;
+
+			if (messageLength == 0)
+			{
+				Array.Clear(messageChunkData, 0, 56);
+
+				ShortWriteExtraFullLowLevel(extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4, out extra5, out messageChunkWritten, out extra6);
+
+				messageWritten = messageChunkWritten;
+			}
+			else
+			{
+				extra5 = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+				extra6 = 0; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				messageWritten = 0;
+
+				lock (streamLock)
+				{
+					while (messageChunkOffset < messageLength)
+					{
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 56);
+
+						Array.Copy(message, messageChunkOffset, messageChunkData, 0, messageChunkLength);
+						Array.Clear(messageChunkData, messageChunkLength, 56 - messageChunkLength);
+
+						ShortWriteExtraFullLowLevel(extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4, out extra5, out messageChunkWritten, out extra6);
+
+						messageWritten += messageChunkWritten;
+
+						if (messageChunkWritten < 56)
+						{
+							break; // either last chunk or short write
+						}
+
+						messageChunkOffset += 56;
+					}
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWrite(char[] message)
+		{
+			if (message.Length > 63)
+			{
+				throw new ArgumentException("Message can be at most 63 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[63];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 63 - messageLength);
+
+			SingleWriteLowLevel(messageLength, messageData);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraInPrefix1(byte extra, char[] message)
+		{
+			if (message.Length > 62)
+			{
+				throw new ArgumentException("Message can be at most 62 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[62];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 62 - messageLength);
+
+			SingleWriteExtraInPrefix1LowLevel(extra, messageLength, messageData);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraInPrefix2(byte extra1, byte extra2, char[] message)
+		{
+			if (message.Length > 61)
+			{
+				throw new ArgumentException("Message can be at most 61 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[61];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 61 - messageLength);
+
+			SingleWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageData);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraInSuffix1(char[] message, byte extra)
+		{
+			if (message.Length > 62)
+			{
+				throw new ArgumentException("Message can be at most 62 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[62];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 62 - messageLength);
+
+			SingleWriteExtraInSuffix1LowLevel(messageLength, messageData, extra);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraInSuffix2(char[] message, byte extra1, byte extra2)
+		{
+			if (message.Length > 61)
+			{
+				throw new ArgumentException("Message can be at most 61 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[61];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 61 - messageLength);
+
+			SingleWriteExtraInSuffix2LowLevel(messageLength, messageData, extra1, extra2);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraInFull(byte extra1, byte extra2, char[] message, byte extra3)
+		{
+			if (message.Length > 60)
+			{
+				throw new ArgumentException("Message can be at most 60 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[60];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 60 - messageLength);
+
+			SingleWriteExtraInFullLowLevel(extra1, messageLength, extra2, messageData, extra3);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte SingleWriteExtraOut1(char[] message)
+		{
+			if (message.Length > 63)
+			{
+				throw new ArgumentException("Message can be at most 63 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[63];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 63 - messageLength);
+
+			return SingleWriteExtraOut1LowLevel(messageLength, messageData);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleWriteExtraOut2(char[] message, out byte extra1, out byte extra2)
+		{
+			if (message.Length > 63)
+			{
+				throw new ArgumentException("Message can be at most 63 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[63];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 63 - messageLength);
+
+			SingleWriteExtraOut2LowLevel(messageLength, messageData, out extra1, out extra2);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortSingleWrite(char[] message)
+		{
+			if (message.Length > 63)
+			{
+				throw new ArgumentException("Message can be at most 63 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[63];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 63 - messageLength);
+
+			return ShortSingleWriteLowLevel(messageLength, messageData);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortSingleWriteExtraInPrefix1(byte extra, char[] message)
+		{
+			if (message.Length > 62)
+			{
+				throw new ArgumentException("Message can be at most 62 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[62];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 62 - messageLength);
+
+			return ShortSingleWriteExtraInPrefix1LowLevel(extra, messageLength, messageData);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortSingleWriteExtraInPrefix2(byte extra1, byte extra2, char[] message)
+		{
+			if (message.Length > 61)
+			{
+				throw new ArgumentException("Message can be at most 61 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[61];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 61 - messageLength);
+
+			return ShortSingleWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageData);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortSingleWriteExtraInSuffix1(char[] message, byte extra)
+		{
+			if (message.Length > 62)
+			{
+				throw new ArgumentException("Message can be at most 62 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[62];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 62 - messageLength);
+
+			return ShortSingleWriteExtraInSuffix1LowLevel(messageLength, messageData, extra);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public byte ShortSingleWriteExtraInSuffix2(char[] message, byte extra1, byte extra2)
+		{
+			if (message.Length > 61)
+			{
+				throw new ArgumentException("Message can be at most 61 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[61];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 61 - messageLength);
+
+			return ShortSingleWriteExtraInSuffix2LowLevel(messageLength, messageData, extra1, extra2);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortSingleWriteExtraOutPrefix1(char[] message, out byte extra, out byte messageWritten)
+		{
+			if (message.Length > 62)
+			{
+				throw new ArgumentException("Message can be at most 62 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[62];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 62 - messageLength);
+
+			ShortSingleWriteExtraOutPrefix1LowLevel(messageLength, messageData, out extra, out messageWritten);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortSingleWriteExtraOutPrefix2(char[] message, out byte extra1, out byte extra2, out byte messageWritten)
+		{
+			if (message.Length > 62)
+			{
+				throw new ArgumentException("Message can be at most 62 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[62];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 62 - messageLength);
+
+			ShortSingleWriteExtraOutPrefix2LowLevel(messageLength, messageData, out extra1, out extra2, out messageWritten);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortSingleWriteExtraOutSuffix1(char[] message, out byte messageWritten, out byte extra)
+		{
+			if (message.Length > 63)
+			{
+				throw new ArgumentException("Message can be at most 63 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[63];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 63 - messageLength);
+
+			ShortSingleWriteExtraOutSuffix1LowLevel(messageLength, messageData, out messageWritten, out extra);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortSingleWriteExtraOutSuffix2(char[] message, out byte messageWritten, out byte extra1, out byte extra2)
+		{
+			if (message.Length > 63)
+			{
+				throw new ArgumentException("Message can be at most 63 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[63];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 63 - messageLength);
+
+			ShortSingleWriteExtraOutSuffix2LowLevel(messageLength, messageData, out messageWritten, out extra1, out extra2);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void ShortSingleWriteExtraFull(byte extra1, byte extra2, char[] message, byte extra3, out byte extra4, out byte messageWritten, out byte extra5)
+		{
+			if (message.Length > 60)
+			{
+				throw new ArgumentException("Message can be at most 60 items long");
+			}
+
+			byte messageLength = (byte)message.Length;
+			char[] messageData = new char[60];
+
+			Array.Copy(message, messageData, messageLength);
+			Array.Clear(messageData, messageLength, 60 - messageLength);
+
+			ShortSingleWriteExtraFullLowLevel(extra1, messageLength, extra2, messageData, extra3, out extra4, out messageWritten, out extra5);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public char[] NormalRead()
+		{
+			char[] message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = 0;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				NormalReadLowLevel(out messageLength, out messageChunkOffset, out messageChunkData);
+
+				messageOutOfSync = messageChunkOffset != 0;
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						NormalReadLowLevel(out messageLength, out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 60 < messageLength)
+					{
+						NormalReadLowLevel(out messageLength, out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+
+			return message;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public char[] NormalReadExtraIn1(byte extra)
+		{
+			char[] message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = 0;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				NormalReadExtraIn1LowLevel(extra, out messageLength, out messageChunkOffset, out messageChunkData);
+
+				messageOutOfSync = messageChunkOffset != 0;
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						NormalReadExtraIn1LowLevel(extra, out messageLength, out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 60 < messageLength)
+					{
+						NormalReadExtraIn1LowLevel(extra, out messageLength, out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+
+			return message;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public char[] NormalReadExtraIn2(byte extra1, byte extra2)
+		{
+			char[] message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = 0;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				NormalReadExtraIn2LowLevel(extra1, extra2, out messageLength, out messageChunkOffset, out messageChunkData);
+
+				messageOutOfSync = messageChunkOffset != 0;
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						NormalReadExtraIn2LowLevel(extra1, extra2, out messageLength, out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 60 < messageLength)
+					{
+						NormalReadExtraIn2LowLevel(extra1, extra2, out messageLength, out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+
+			return message;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraOutPrefix1(out byte extra, out char[] message)
+		{
+			int messageLength = 0;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[59];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				NormalReadExtraOutPrefix1LowLevel(out extra, out messageLength, out messageChunkOffset, out messageChunkData);
+
+				messageOutOfSync = messageChunkOffset != 0;
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						NormalReadExtraOutPrefix1LowLevel(out extra, out messageLength, out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 59 < messageLength)
+					{
+						NormalReadExtraOutPrefix1LowLevel(out extra, out messageLength, out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraOutPrefix2(out byte extra1, out byte extra2, out char[] message)
+		{
+			int messageLength = 0;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[58];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				NormalReadExtraOutPrefix2LowLevel(out extra1, out extra2, out messageLength, out messageChunkOffset, out messageChunkData);
+
+				messageOutOfSync = messageChunkOffset != 0;
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 58);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						NormalReadExtraOutPrefix2LowLevel(out extra1, out extra2, out messageLength, out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 58);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 58 < messageLength)
+					{
+						NormalReadExtraOutPrefix2LowLevel(out extra1, out extra2, out messageLength, out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraOutSuffix1(out char[] message, out byte extra)
+		{
+			int messageLength = 0;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[59];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				NormalReadExtraOutSuffix1LowLevel(out messageLength, out messageChunkOffset, out messageChunkData, out extra);
+
+				messageOutOfSync = messageChunkOffset != 0;
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						NormalReadExtraOutSuffix1LowLevel(out messageLength, out messageChunkOffset, out messageChunkData, out extra);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 59 < messageLength)
+					{
+						NormalReadExtraOutSuffix1LowLevel(out messageLength, out messageChunkOffset, out messageChunkData, out extra);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraOutSuffix2(out char[] message, out byte extra1, out byte extra2)
+		{
+			int messageLength = 0;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[58];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				NormalReadExtraOutSuffix2LowLevel(out messageLength, out messageChunkOffset, out messageChunkData, out extra1, out extra2);
+
+				messageOutOfSync = messageChunkOffset != 0;
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 58);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						NormalReadExtraOutSuffix2LowLevel(out messageLength, out messageChunkOffset, out messageChunkData, out extra1, out extra2);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 58);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 58 < messageLength)
+					{
+						NormalReadExtraOutSuffix2LowLevel(out messageLength, out messageChunkOffset, out messageChunkData, out extra1, out extra2);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void NormalReadExtraOutFull(out byte extra1, out byte extra2, out byte extra3, out char[] message, out byte extra4)
+		{
+			int messageLength = 0;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[56];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				NormalReadExtraOutFullLowLevel(out extra1, out messageLength, out extra2, out messageChunkOffset, out extra3, out messageChunkData, out extra4);
+
+				messageOutOfSync = messageChunkOffset != 0;
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 56);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						NormalReadExtraOutFullLowLevel(out extra1, out messageLength, out extra2, out messageChunkOffset, out extra3, out messageChunkData, out extra4);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 56);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 56 < messageLength)
+					{
+						NormalReadExtraOutFullLowLevel(out extra1, out messageLength, out extra2, out messageChunkOffset, out extra3, out messageChunkData, out extra4);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public char[] FixedRead()
+		{
+			char[] message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = 1000;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[62];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				FixedReadLowLevel(out messageChunkOffset, out messageChunkData);
+
+				if (messageChunkOffset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+					messageLength = 0;
+					messageChunkOffset = 0;
+					messageOutOfSync = false;
+				} else {
+					messageOutOfSync = messageChunkOffset != 0;
+				}
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 62);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						FixedReadLowLevel(out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 62);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 62 < messageLength)
+					{
+						FixedReadLowLevel(out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+
+			return message;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public char[] FixedReadExtraIn1(byte extra)
+		{
+			char[] message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = 1000;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[62];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				FixedReadExtraIn1LowLevel(extra, out messageChunkOffset, out messageChunkData);
+
+				if (messageChunkOffset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+					messageLength = 0;
+					messageChunkOffset = 0;
+					messageOutOfSync = false;
+				} else {
+					messageOutOfSync = messageChunkOffset != 0;
+				}
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 62);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						FixedReadExtraIn1LowLevel(extra, out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 62);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 62 < messageLength)
+					{
+						FixedReadExtraIn1LowLevel(extra, out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+
+			return message;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public char[] FixedReadExtraIn2(byte extra1, byte extra2)
+		{
+			char[] message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int messageLength = 1000;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[62];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				FixedReadExtraIn2LowLevel(extra1, extra2, out messageChunkOffset, out messageChunkData);
+
+				if (messageChunkOffset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+					messageLength = 0;
+					messageChunkOffset = 0;
+					messageOutOfSync = false;
+				} else {
+					messageOutOfSync = messageChunkOffset != 0;
+				}
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 62);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						FixedReadExtraIn2LowLevel(extra1, extra2, out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 62);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 62 < messageLength)
+					{
+						FixedReadExtraIn2LowLevel(extra1, extra2, out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+
+			return message;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraOutPrefix1(out byte extra, out char[] message)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[61];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				FixedReadExtraOutPrefix1LowLevel(out extra, out messageChunkOffset, out messageChunkData);
+
+				if (messageChunkOffset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+					messageLength = 0;
+					messageChunkOffset = 0;
+					messageOutOfSync = false;
+				} else {
+					messageOutOfSync = messageChunkOffset != 0;
+				}
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 61);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						FixedReadExtraOutPrefix1LowLevel(out extra, out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 61);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 61 < messageLength)
+					{
+						FixedReadExtraOutPrefix1LowLevel(out extra, out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraOutPrefix2(out byte extra1, out byte extra2, out char[] message)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				FixedReadExtraOutPrefix2LowLevel(out extra1, out extra2, out messageChunkOffset, out messageChunkData);
+
+				if (messageChunkOffset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+					messageLength = 0;
+					messageChunkOffset = 0;
+					messageOutOfSync = false;
+				} else {
+					messageOutOfSync = messageChunkOffset != 0;
+				}
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						FixedReadExtraOutPrefix2LowLevel(out extra1, out extra2, out messageChunkOffset, out messageChunkData);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 60 < messageLength)
+					{
+						FixedReadExtraOutPrefix2LowLevel(out extra1, out extra2, out messageChunkOffset, out messageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraOutSuffix1(out char[] message, out byte extra)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[61];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				FixedReadExtraOutSuffix1LowLevel(out messageChunkOffset, out messageChunkData, out extra);
+
+				if (messageChunkOffset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+					messageLength = 0;
+					messageChunkOffset = 0;
+					messageOutOfSync = false;
+				} else {
+					messageOutOfSync = messageChunkOffset != 0;
+				}
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 61);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						FixedReadExtraOutSuffix1LowLevel(out messageChunkOffset, out messageChunkData, out extra);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 61);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 61 < messageLength)
+					{
+						FixedReadExtraOutSuffix1LowLevel(out messageChunkOffset, out messageChunkData, out extra);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraOutSuffix2(out char[] message, out byte extra1, out byte extra2)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[60];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				FixedReadExtraOutSuffix2LowLevel(out messageChunkOffset, out messageChunkData, out extra1, out extra2);
+
+				if (messageChunkOffset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+					messageLength = 0;
+					messageChunkOffset = 0;
+					messageOutOfSync = false;
+				} else {
+					messageOutOfSync = messageChunkOffset != 0;
+				}
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						FixedReadExtraOutSuffix2LowLevel(out messageChunkOffset, out messageChunkData, out extra1, out extra2);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 60 < messageLength)
+					{
+						FixedReadExtraOutSuffix2LowLevel(out messageChunkOffset, out messageChunkData, out extra1, out extra2);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void FixedReadExtraOutFull(out byte extra1, out byte extra2, out char[] message, out byte extra3)
+		{
+			int messageLength = 1000;
+			int messageChunkOffset;
+			char[] messageChunkData = new char[59];
+			int messageChunkLength;
+			bool messageOutOfSync;
+			int messageCurrentLength;
+
+			lock (streamLock)
+			{
+				message = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+
+				FixedReadExtraOutFullLowLevel(out extra1, out messageChunkOffset, out extra2, out messageChunkData, out extra3);
+
+				if (messageChunkOffset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+					messageLength = 0;
+					messageChunkOffset = 0;
+					messageOutOfSync = false;
+				} else {
+					messageOutOfSync = messageChunkOffset != 0;
+				}
+
+				if (!messageOutOfSync) {
+					message = new char[messageLength];
+					messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+
+					Array.Copy(messageChunkData, message, messageChunkLength);
+
+					messageCurrentLength = messageChunkLength;
+
+					while (messageCurrentLength < messageLength)
+					{
+						FixedReadExtraOutFullLowLevel(out extra1, out messageChunkOffset, out extra2, out messageChunkData, out extra3);
+
+						messageOutOfSync = messageChunkOffset != messageCurrentLength;
+
+						if (messageOutOfSync) {
+							break;
+						}
+
+						messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+
+						Array.Copy(messageChunkData, 0, message, messageCurrentLength, messageChunkLength);
+
+						messageCurrentLength += messageChunkLength;
+					}
+				}
+
+				if (messageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (messageChunkOffset + 59 < messageLength)
+					{
+						FixedReadExtraOutFullLowLevel(out extra1, out messageChunkOffset, out extra2, out messageChunkData, out extra3);
+					}
+
+					throw new StreamOutOfSyncException("Message is out-of-sync");
+				}
+			}
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public char[] SingleRead()
+		{
+			char[] message = null;
+			byte messageLength;
+			char[] messageData = new char[63];
+
+			SingleReadLowLevel(out messageLength, out messageData);
+
+			message = new char[messageLength];
+
+			Array.Copy(messageData, message, messageLength);
+
+			return message;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public char[] SingleReadExtraIn1(byte extra)
+		{
+			char[] message = null;
+			byte messageLength;
+			char[] messageData = new char[62];
+
+			SingleReadExtraIn1LowLevel(extra, out messageLength, out messageData);
+
+			message = new char[messageLength];
+
+			Array.Copy(messageData, message, messageLength);
+
+			return message;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public char[] SingleReadExtraIn2(byte extra1, byte extra2)
+		{
+			char[] message = null;
+			byte messageLength;
+			char[] messageData = new char[62];
+
+			SingleReadExtraIn2LowLevel(extra1, extra2, out messageLength, out messageData);
+
+			message = new char[messageLength];
+
+			Array.Copy(messageData, message, messageLength);
+
+			return message;
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraOutPrefix1(out byte extra, out char[] message)
+		{
+			byte messageLength;
+			char[] messageData = new char[62];
+
+			SingleReadExtraOutPrefix1LowLevel(out extra, out messageLength, out messageData);
+
+			message = new char[messageLength];
+
+			Array.Copy(messageData, message, messageLength);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraOutPrefix2(out byte extra1, out byte extra2, out char[] message)
+		{
+			byte messageLength;
+			char[] messageData = new char[61];
+
+			SingleReadExtraOutPrefix2LowLevel(out extra1, out extra2, out messageLength, out messageData);
+
+			message = new char[messageLength];
+
+			Array.Copy(messageData, message, messageLength);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraOutSuffix1(out char[] message, out byte extra)
+		{
+			byte messageLength;
+			char[] messageData = new char[62];
+
+			SingleReadExtraOutSuffix1LowLevel(out messageLength, out messageData, out extra);
+
+			message = new char[messageLength];
+
+			Array.Copy(messageData, message, messageLength);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraOutSuffix2(out char[] message, out byte extra1, out byte extra2)
+		{
+			byte messageLength;
+			char[] messageData = new char[61];
+
+			SingleReadExtraOutSuffix2LowLevel(out messageLength, out messageData, out extra1, out extra2);
+
+			message = new char[messageLength];
+
+			Array.Copy(messageData, message, messageLength);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SingleReadExtraOutFull(out byte extra1, out byte extra2, out char[] message, out byte extra3)
+		{
+			byte messageLength;
+			char[] messageData = new char[60];
+
+			SingleReadExtraOutFullLowLevel(out extra1, out messageLength, out extra2, out messageData, out extra3);
+
+			message = new char[messageLength];
+
+			Array.Copy(messageData, message, messageLength);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnNormalReadLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int messageLength = LEConverter.UShortFrom(8, response);
+			int messageChunkOffset = LEConverter.UShortFrom(10, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(12, response, 60);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_NORMAL_READ];
+			int messageChunkLength = Math.Min(messageLength - messageChunkOffset, 60);
+			var highLevelHandler = NormalReadCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[messageLength];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, (char[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = NormalReadLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, messageLength, messageChunkOffset, messageChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnNormalReadExtraPrefix1LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte extra = LEConverter.ByteFrom(8, response);
+			int messageLength = LEConverter.UShortFrom(9, response);
+			int messageChunkOffset = LEConverter.UShortFrom(11, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(13, response, 59);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_NORMAL_READ_EXTRA_PREFIX_1];
+			int messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+			var highLevelHandler = NormalReadExtraPrefix1Callback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[messageLength];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, extra, (char[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = NormalReadExtraPrefix1LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, extra, messageLength, messageChunkOffset, messageChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnNormalReadExtraPrefix2LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte extra1 = LEConverter.ByteFrom(8, response);
+			byte extra2 = LEConverter.ByteFrom(9, response);
+			int messageLength = LEConverter.UShortFrom(10, response);
+			int messageChunkOffset = LEConverter.UShortFrom(12, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(14, response, 58);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_NORMAL_READ_EXTRA_PREFIX_2];
+			int messageChunkLength = Math.Min(messageLength - messageChunkOffset, 58);
+			var highLevelHandler = NormalReadExtraPrefix2Callback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[messageLength];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra1, extra2, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, extra1, extra2, (char[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra1, extra2, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = NormalReadExtraPrefix2LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnNormalReadExtraSuffix1LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int messageLength = LEConverter.UShortFrom(8, response);
+			int messageChunkOffset = LEConverter.UShortFrom(10, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(12, response, 59);
+			byte extra = LEConverter.ByteFrom(71, response);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1];
+			int messageChunkLength = Math.Min(messageLength - messageChunkOffset, 59);
+			var highLevelHandler = NormalReadExtraSuffix1Callback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[messageLength];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data, extra);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, (char[])highLevelCallback.data, extra);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data, extra);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = NormalReadExtraSuffix1LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, messageLength, messageChunkOffset, messageChunkData, extra);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnNormalReadExtraSuffix2LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int messageLength = LEConverter.UShortFrom(8, response);
+			int messageChunkOffset = LEConverter.UShortFrom(10, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(12, response, 58);
+			byte extra1 = LEConverter.ByteFrom(70, response);
+			byte extra2 = LEConverter.ByteFrom(71, response);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2];
+			int messageChunkLength = Math.Min(messageLength - messageChunkOffset, 58);
+			var highLevelHandler = NormalReadExtraSuffix2Callback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[messageLength];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data, extra1, extra2);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, (char[])highLevelCallback.data, extra1, extra2);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data, extra1, extra2);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = NormalReadExtraSuffix2LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnNormalReadExtraFullLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte extra1 = LEConverter.ByteFrom(8, response);
+			int messageLength = LEConverter.UShortFrom(9, response);
+			byte extra2 = LEConverter.ByteFrom(11, response);
+			int messageChunkOffset = LEConverter.UShortFrom(12, response);
+			byte extra3 = LEConverter.ByteFrom(14, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(15, response, 56);
+			byte extra4 = LEConverter.ByteFrom(71, response);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_NORMAL_READ_EXTRA_FULL];
+			int messageChunkLength = Math.Min(messageLength - messageChunkOffset, 56);
+			var highLevelHandler = NormalReadExtraFullCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[messageLength];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra1, extra2, extra3, (char[])highLevelCallback.data, extra4);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, extra1, extra2, extra3, (char[])highLevelCallback.data, extra4);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= messageLength) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra1, extra2, extra3, (char[])highLevelCallback.data, extra4);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = NormalReadExtraFullLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFixedReadLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int messageChunkOffset = LEConverter.UShortFrom(8, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(10, response, 62);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_FIXED_READ];
+			int messageChunkLength = Math.Min(1000 - messageChunkOffset, 62);
+			var highLevelHandler = FixedReadCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[1000];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, (char[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = FixedReadLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, messageChunkOffset, messageChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFixedReadExtraPrefix1LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte extra = LEConverter.ByteFrom(8, response);
+			int messageChunkOffset = LEConverter.UShortFrom(9, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(11, response, 61);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_FIXED_READ_EXTRA_PREFIX_1];
+			int messageChunkLength = Math.Min(1000 - messageChunkOffset, 61);
+			var highLevelHandler = FixedReadExtraPrefix1Callback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[1000];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, extra, (char[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = FixedReadExtraPrefix1LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, extra, messageChunkOffset, messageChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFixedReadExtraPrefix2LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte extra1 = LEConverter.ByteFrom(8, response);
+			byte extra2 = LEConverter.ByteFrom(9, response);
+			int messageChunkOffset = LEConverter.UShortFrom(10, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(12, response, 60);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_FIXED_READ_EXTRA_PREFIX_2];
+			int messageChunkLength = Math.Min(1000 - messageChunkOffset, 60);
+			var highLevelHandler = FixedReadExtraPrefix2Callback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[1000];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra1, extra2, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, extra1, extra2, (char[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra1, extra2, (char[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = FixedReadExtraPrefix2LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, extra1, extra2, messageChunkOffset, messageChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFixedReadExtraSuffix1LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int messageChunkOffset = LEConverter.UShortFrom(8, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(10, response, 61);
+			byte extra = LEConverter.ByteFrom(71, response);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_FIXED_READ_EXTRA_SUFFIX_1];
+			int messageChunkLength = Math.Min(1000 - messageChunkOffset, 61);
+			var highLevelHandler = FixedReadExtraSuffix1Callback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[1000];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data, extra);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, (char[])highLevelCallback.data, extra);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data, extra);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = FixedReadExtraSuffix1LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, messageChunkOffset, messageChunkData, extra);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFixedReadExtraSuffix2LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int messageChunkOffset = LEConverter.UShortFrom(8, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(10, response, 60);
+			byte extra1 = LEConverter.ByteFrom(70, response);
+			byte extra2 = LEConverter.ByteFrom(71, response);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_FIXED_READ_EXTRA_SUFFIX_2];
+			int messageChunkLength = Math.Min(1000 - messageChunkOffset, 60);
+			var highLevelHandler = FixedReadExtraSuffix2Callback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[1000];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data, extra1, extra2);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, (char[])highLevelCallback.data, extra1, extra2);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (char[])highLevelCallback.data, extra1, extra2);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = FixedReadExtraSuffix2LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, messageChunkOffset, messageChunkData, extra1, extra2);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnFixedReadExtraFullLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte extra1 = LEConverter.ByteFrom(8, response);
+			int messageChunkOffset = LEConverter.UShortFrom(9, response);
+			byte extra2 = LEConverter.ByteFrom(11, response);
+			char[] messageChunkData = LEConverter.CharArrayFrom(12, response, 59);
+			byte extra3 = LEConverter.ByteFrom(71, response);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_FIXED_READ_EXTRA_FULL];
+			int messageChunkLength = Math.Min(1000 - messageChunkOffset, 59);
+			var highLevelHandler = FixedReadExtraFullCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (messageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new char[1000];
+					highLevelCallback.length = messageChunkLength;
+
+					Array.Copy(messageChunkData, (char[])highLevelCallback.data, messageChunkLength);
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra1, extra2, (char[])highLevelCallback.data, extra3);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (messageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, extra1, extra2, (char[])highLevelCallback.data, extra3);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(messageChunkData, 0, (char[])highLevelCallback.data, highLevelCallback.length, messageChunkLength);
+					highLevelCallback.length += messageChunkLength;
+
+					if (highLevelCallback.length >= 1000) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, extra1, extra2, (char[])highLevelCallback.data, extra3);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = FixedReadExtraFullLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, extra1, messageChunkOffset, extra2, messageChunkData, extra3);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnSingleReadLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte messageLength = LEConverter.ByteFrom(8, response);
+			char[] messageData = LEConverter.CharArrayFrom(9, response, 63);
+			var highLevelHandler = SingleReadCallback;
+
+			if (highLevelHandler != null)
+			{
+				char[] message = new char[messageLength];
+
+				Array.Copy(messageData, message, messageLength);
+
+				highLevelHandler(this, message);
+			}
+
+			var handler = SingleReadLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, messageLength, messageData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnSingleReadExtraPrefix1LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte extra = LEConverter.ByteFrom(8, response);
+			byte messageLength = LEConverter.ByteFrom(9, response);
+			char[] messageData = LEConverter.CharArrayFrom(10, response, 62);
+			var highLevelHandler = SingleReadExtraPrefix1Callback;
+
+			if (highLevelHandler != null)
+			{
+				char[] message = new char[messageLength];
+
+				Array.Copy(messageData, message, messageLength);
+
+				highLevelHandler(this, extra, message);
+			}
+
+			var handler = SingleReadExtraPrefix1LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, extra, messageLength, messageData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnSingleReadExtraPrefix2LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte extra1 = LEConverter.ByteFrom(8, response);
+			byte extra2 = LEConverter.ByteFrom(9, response);
+			byte messageLength = LEConverter.ByteFrom(10, response);
+			char[] messageData = LEConverter.CharArrayFrom(11, response, 61);
+			var highLevelHandler = SingleReadExtraPrefix2Callback;
+
+			if (highLevelHandler != null)
+			{
+				char[] message = new char[messageLength];
+
+				Array.Copy(messageData, message, messageLength);
+
+				highLevelHandler(this, extra1, extra2, message);
+			}
+
+			var handler = SingleReadExtraPrefix2LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, extra1, extra2, messageLength, messageData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnSingleReadExtraSuffix1LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte messageLength = LEConverter.ByteFrom(8, response);
+			char[] messageData = LEConverter.CharArrayFrom(9, response, 62);
+			byte extra = LEConverter.ByteFrom(71, response);
+			var highLevelHandler = SingleReadExtraSuffix1Callback;
+
+			if (highLevelHandler != null)
+			{
+				char[] message = new char[messageLength];
+
+				Array.Copy(messageData, message, messageLength);
+
+				highLevelHandler(this, message, extra);
+			}
+
+			var handler = SingleReadExtraSuffix1LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, messageLength, messageData, extra);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnSingleReadExtraSuffix2LowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte messageLength = LEConverter.ByteFrom(8, response);
+			char[] messageData = LEConverter.CharArrayFrom(9, response, 61);
+			byte extra1 = LEConverter.ByteFrom(70, response);
+			byte extra2 = LEConverter.ByteFrom(71, response);
+			var highLevelHandler = SingleReadExtraSuffix2Callback;
+
+			if (highLevelHandler != null)
+			{
+				char[] message = new char[messageLength];
+
+				Array.Copy(messageData, message, messageLength);
+
+				highLevelHandler(this, message, extra1, extra2);
+			}
+
+			var handler = SingleReadExtraSuffix2LowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, messageLength, messageData, extra1, extra2);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnSingleReadExtraFullLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			byte extra1 = LEConverter.ByteFrom(8, response);
+			byte messageLength = LEConverter.ByteFrom(9, response);
+			byte extra2 = LEConverter.ByteFrom(10, response);
+			char[] messageData = LEConverter.CharArrayFrom(11, response, 60);
+			byte extra3 = LEConverter.ByteFrom(71, response);
+			var highLevelHandler = SingleReadExtraFullCallback;
+
+			if (highLevelHandler != null)
+			{
+				char[] message = new char[messageLength];
+
+				Array.Copy(messageData, message, messageLength);
+
+				highLevelHandler(this, extra1, extra2, message, extra3);
+			}
+
+			var handler = SingleReadExtraFullLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, extra1, messageLength, extra2, messageData, extra3);
+			}
+		}
+	}
+}
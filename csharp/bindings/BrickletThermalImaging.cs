@@ -0,0 +1,1297 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  80x60 pixel thermal imaging camera
+	/// </summary>
+	public class BrickletThermalImaging : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 278;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Thermal Imaging Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_HIGH_CONTRAST_IMAGE_LOW_LEVEL = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TEMPERATURE_IMAGE_LOW_LEVEL = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATISTICS = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_RESOLUTION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_RESOLUTION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SPOTMETER_CONFIG = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPOTMETER_CONFIG = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_HIGH_CONTRAST_CONFIG = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_HIGH_CONTRAST_CONFIG = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_IMAGE_TRANSFER_CONFIG = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IMAGE_TRANSFER_CONFIG = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_FLUX_LINEAR_PARAMETERS = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_FLUX_LINEAR_PARAMETERS = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_BOOTLOADER_MODE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_BOOTLOADER_MODE = 236;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_STATUS_LED_CONFIG = 239;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_STATUS_LED_CONFIG = 240;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CHIP_TEMPERATURE = 242;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_HIGH_CONTRAST_IMAGE_LOW_LEVEL = 12;
+
+		private const int CALLBACK_TEMPERATURE_IMAGE_LOW_LEVEL = 13;
+
+		private const int CALLBACK_HIGH_CONTRAST_IMAGE = -12;
+
+		private const int CALLBACK_TEMPERATURE_IMAGE = -13;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte RESOLUTION_0_TO_6553_KELVIN = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte RESOLUTION_0_TO_655_KELVIN = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FFC_STATUS_NEVER_COMMANDED = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte FFC_STATUS_IMMINENT = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte FFC_STATUS_IN_PROGRESS = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte FFC_STATUS_COMPLETE = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte IMAGE_TRANSFER_MANUAL_HIGH_CONTRAST_IMAGE = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte IMAGE_TRANSFER_MANUAL_TEMPERATURE_IMAGE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte IMAGE_TRANSFER_CALLBACK_HIGH_CONTRAST_IMAGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte IMAGE_TRANSFER_CALLBACK_TEMPERATURE_IMAGE = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_INVALID_MODE = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_NO_CHANGE = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_OFF = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_ON = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletThermalImaging.HighContrastImageCallback"/>
+		/// </summary>
+		public event HighContrastImageLowLevelEventHandler HighContrastImageLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void HighContrastImageLowLevelEventHandler(BrickletThermalImaging sender, int imageChunkOffset, byte[] imageChunkData);
+
+		/// <summary>
+		///  <see cref="Tinkerforge.BrickletThermalImaging.TemperatureImageCallback"/>
+		/// </summary>
+		public event TemperatureImageLowLevelEventHandler TemperatureImageLowLevelCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void TemperatureImageLowLevelEventHandler(BrickletThermalImaging sender, int imageChunkOffset, int[] imageChunkData);
+
+		/// <summary>
+		///  This callback is triggered with every new high contrast image if the transfer image
+		///  config is configured for high contrast callback (see <see cref="Tinkerforge.BrickletThermalImaging.SetImageTransferConfig"/>).
+		///  
+		///  The data is organized as a 8-bit value 80x60 pixel matrix linearized in
+		///  a one-dimensional array. The data is arranged line by line from top left to
+		///  bottom right.
+		///  
+		///  Each 8-bit value represents one gray-scale image pixel that can directly be
+		///  shown to a user on a display.
+		///  
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for image.
+		///  </note>
+		/// </summary>
+		public event HighContrastImageEventHandler HighContrastImageCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void HighContrastImageEventHandler(BrickletThermalImaging sender, byte[] image);
+
+		/// <summary>
+		///  This callback is triggered with every new temperature image if the transfer image
+		///  config is configured for temperature callback (see <see cref="Tinkerforge.BrickletThermalImaging.SetImageTransferConfig"/>).
+		///  
+		///  The data is organized as a 16-bit value 80x60 pixel matrix linearized in
+		///  a one-dimensional array. The data is arranged line by line from top left to
+		///  bottom right.
+		///  
+		///  Each 16-bit value represents one temperature measurement in either
+		///  Kelvin/10 or Kelvin/100 (depending on the resolution set with <see cref="Tinkerforge.BrickletThermalImaging.SetResolution"/>).
+		///  
+		///  <note>
+		///   If reconstructing the value fails, the callback is triggered with null for image.
+		///  </note>
+		/// </summary>
+		public event TemperatureImageEventHandler TemperatureImageCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void TemperatureImageEventHandler(BrickletThermalImaging sender, int[] image);
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletThermalImaging(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 1;
+
+			callbackWrappers[CALLBACK_HIGH_CONTRAST_IMAGE_LOW_LEVEL] = new CallbackWrapper(OnHighContrastImageLowLevelCallback);
+			callbackWrappers[CALLBACK_TEMPERATURE_IMAGE_LOW_LEVEL] = new CallbackWrapper(OnTemperatureImageLowLevelCallback);
+
+			highLevelCallbacks[-CALLBACK_HIGH_CONTRAST_IMAGE] = new HighLevelCallback();
+			highLevelCallbacks[-CALLBACK_TEMPERATURE_IMAGE] = new HighLevelCallback();
+
+			responseExpected[FUNCTION_GET_HIGH_CONTRAST_IMAGE_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_TEMPERATURE_IMAGE_LOW_LEVEL] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_STATISTICS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_RESOLUTION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_RESOLUTION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SPOTMETER_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SPOTMETER_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_HIGH_CONTRAST_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_HIGH_CONTRAST_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_IMAGE_TRANSFER_CONFIG] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_IMAGE_TRANSFER_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_FLUX_LINEAR_PARAMETERS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_FLUX_LINEAR_PARAMETERS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_SPITFP_ERROR_COUNT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_BOOTLOADER_MODE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_STATUS_LED_CONFIG] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_STATUS_LED_CONFIG] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_CHIP_TEMPERATURE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the current high contrast image. See `here &lt;https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Thermal_Imaging.html#high-contrast-image-vs-temperature-image&gt;`__
+		///  for the difference between
+		///  High Contrast and Temperature Image. If you don't know what to use
+		///  the High Contrast Image is probably right for you.
+		///  
+		///  The data is organized as a 8-bit value 80x60 pixel matrix linearized in
+		///  a one-dimensional array. The data is arranged line by line from top left to
+		///  bottom right.
+		///  
+		///  Each 8-bit value represents one gray-scale image pixel that can directly be
+		///  shown to a user on a display.
+		///  
+		///  Before you can use this function you have to enable it with
+		///  <see cref="Tinkerforge.BrickletThermalImaging.SetImageTransferConfig"/>.
+		/// </summary>
+		public void GetHighContrastImageLowLevel(out int imageChunkOffset, out byte[] imageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_HIGH_CONTRAST_IMAGE_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			imageChunkOffset = LEConverter.UShortFrom(8, response);
+			imageChunkData = LEConverter.ByteArrayFrom(10, response, 62);
+		}
+
+		/// <summary>
+		///  Returns the current temperature image. See `here &lt;https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Thermal_Imaging.html#high-contrast-image-vs-temperature-image&gt;`__
+		///  for the difference between High Contrast and Temperature Image.
+		///  If you don't know what to use the High Contrast Image is probably right for you.
+		///  
+		///  The data is organized as a 16-bit value 80x60 pixel matrix linearized in
+		///  a one-dimensional array. The data is arranged line by line from top left to
+		///  bottom right.
+		///  
+		///  Each 16-bit value represents one temperature measurement in either
+		///  Kelvin/10 or Kelvin/100 (depending on the resolution set with <see cref="Tinkerforge.BrickletThermalImaging.SetResolution"/>).
+		///  
+		///  Before you can use this function you have to enable it with
+		///  <see cref="Tinkerforge.BrickletThermalImaging.SetImageTransferConfig"/>.
+		/// </summary>
+		public void GetTemperatureImageLowLevel(out int imageChunkOffset, out int[] imageChunkData)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TEMPERATURE_IMAGE_LOW_LEVEL);
+
+			byte[] response = SendRequest(request, 72);
+
+			imageChunkOffset = LEConverter.UShortFrom(8, response);
+			imageChunkData = LEConverter.UShortArrayFrom(10, response, 31);
+		}
+
+		/// <summary>
+		///  Returns the spotmeter statistics, various temperatures, current resolution and status bits.
+		///  
+		///  The spotmeter statistics are:
+		///  
+		///  * Index 0: Mean Temperature.
+		///  * Index 1: Maximum Temperature.
+		///  * Index 2: Minimum Temperature.
+		///  * Index 3: Pixel Count of spotmeter region of interest.
+		///  
+		///  The temperatures are:
+		///  
+		///  * Index 0: Focal Plain Array temperature.
+		///  * Index 1: Focal Plain Array temperature at last FFC (Flat Field Correction).
+		///  * Index 2: Housing temperature.
+		///  * Index 3: Housing temperature at last FFC.
+		///  
+		///  The resolution is either `0 to 6553 Kelvin` or `0 to 655 Kelvin`. If the resolution is the former,
+		///  the temperatures are in Kelvin/10, if it is the latter the temperatures are in Kelvin/100.
+		///  
+		///  FFC (Flat Field Correction) Status:
+		///  
+		///  * FFC Never Commanded: Only seen on startup before first FFC.
+		///  * FFC Imminent: This state is entered 2 seconds prior to initiating FFC.
+		///  * FFC In Progress: Flat field correction is started (shutter moves in front of lens and back). Takes about 1 second.
+		///  * FFC Complete: Shutter is in waiting position again, FFC done.
+		///  
+		///  Temperature warning bits:
+		///  
+		///  * Index 0: Shutter lockout (if true shutter is locked out because temperature is outside -10°C to +65°C)
+		///  * Index 1: Overtemperature shut down imminent (goes true 10 seconds before shutdown)
+		/// </summary>
+		public void GetStatistics(out int[] spotmeterStatistics, out int[] temperatures, out byte resolution, out byte ffcStatus, out bool[] temperatureWarning)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATISTICS);
+
+			byte[] response = SendRequest(request, 27);
+
+			spotmeterStatistics = LEConverter.UShortArrayFrom(8, response, 4);
+			temperatures = LEConverter.UShortArrayFrom(16, response, 4);
+			resolution = LEConverter.ByteFrom(24, response);
+			ffcStatus = LEConverter.ByteFrom(25, response);
+			byte[] temperatureWarningBits = new byte[1];
+			temperatureWarning = new bool[2];
+			temperatureWarningBits = LEConverter.ByteArrayFrom(26, response, 1);
+			for (int i = 0; i < 2; i++) {
+				temperatureWarning[i] = (temperatureWarningBits[i / 8] & (1 << (i % 8))) != 0;
+			}
+		}
+
+		/// <summary>
+		///  Sets the resolution. The Thermal Imaging Bricklet can either measure
+		///  
+		///  * from 0 to 6553 Kelvin (-273.15°C to +6279.85°C) with 0.1°C resolution or
+		///  * from 0 to 655 Kelvin (-273.15°C to +381.85°C) with 0.01°C resolution.
+		///  
+		///  The accuracy is specified for -10°C to 450°C in the
+		///  first range and -10°C and 140°C in the second range.
+		/// </summary>
+		public void SetResolution(byte resolution)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_RESOLUTION);
+			LEConverter.To((byte)resolution, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the resolution as set by <see cref="Tinkerforge.BrickletThermalImaging.SetResolution"/>.
+		/// </summary>
+		public byte GetResolution()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_RESOLUTION);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the spotmeter region of interest. The 4 values are
+		///  
+		///  * Index 0: Column start (has to be smaller then Column end).
+		///  * Index 1: Row start (has to be smaller then Row end).
+		///  * Index 2: Column end (has to be smaller then 80).
+		///  * Index 3: Row end (has to be smaller then 60).
+		///  
+		///  The spotmeter statistics can be read out with <see cref="Tinkerforge.BrickletThermalImaging.GetStatistics"/>.
+		/// </summary>
+		public void SetSpotmeterConfig(byte[] regionOfInterest)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_SPOTMETER_CONFIG);
+			LEConverter.To((byte[])regionOfInterest, 8, 4, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the spotmeter config as set by <see cref="Tinkerforge.BrickletThermalImaging.SetSpotmeterConfig"/>.
+		/// </summary>
+		public byte[] GetSpotmeterConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPOTMETER_CONFIG);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.ByteArrayFrom(8, response, 4);
+		}
+
+		/// <summary>
+		///  Sets the high contrast region of interest, dampening factor, clip limit and empty counts.
+		///  This config is only used in high contrast mode (see <see cref="Tinkerforge.BrickletThermalImaging.SetImageTransferConfig"/>).
+		///  
+		///  The high contrast region of interest consists of four values:
+		///  
+		///  * Index 0: Column start (has to be smaller or equal then Column end).
+		///  * Index 1: Row start (has to be smaller then Row end).
+		///  * Index 2: Column end (has to be smaller then 80).
+		///  * Index 3: Row end (has to be smaller then 60).
+		///  
+		///  The algorithm to generate the high contrast image is applied to this region.
+		///  
+		///  Dampening Factor: This parameter is the amount of temporal dampening applied to the HEQ
+		///  (history equalization) transformation function. An IIR filter of the form::
+		///  
+		///   (N / 256) * previous + ((256 - N) / 256) * current
+		///  
+		///  is applied, and the HEQ dampening factor
+		///  represents the value N in the equation, i.e., a value that applies to the amount of
+		///  influence the previous HEQ transformation function has on the current function. The
+		///  lower the value of N the higher the influence of the current video frame whereas
+		///  the higher the value of N the more influence the previous damped transfer function has.
+		///  
+		///  Clip Limit Index 0 (AGC HEQ Clip Limit High): This parameter defines the maximum number of pixels allowed
+		///  to accumulate in any given histogram bin. Any additional pixels in a given bin are clipped.
+		///  The effect of this parameter is to limit the influence of highly-populated bins on the
+		///  resulting HEQ transformation function.
+		///  
+		///  Clip Limit Index 1 (AGC HEQ Clip Limit Low): This parameter defines an artificial population that is added to
+		///  every non-empty histogram bin. In other words, if the Clip Limit Low is set to L, a bin
+		///  with an actual population of X will have an effective population of L + X. Any empty bin
+		///  that is nearby a populated bin will be given an artificial population of L. The effect of
+		///  higher values is to provide a more linear transfer function; lower values provide a more
+		///  non-linear (equalized) transfer function.
+		///  
+		///  Empty Counts: This parameter specifies the maximum number of pixels in a bin that will be
+		///  interpreted as an empty bin. Histogram bins with this number of pixels or less will be
+		///  processed as an empty bin.
+		/// </summary>
+		public void SetHighContrastConfig(byte[] regionOfInterest, int dampeningFactor, int[] clipLimit, int emptyCounts)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(20, FUNCTION_SET_HIGH_CONTRAST_CONFIG);
+			LEConverter.To((byte[])regionOfInterest, 8, 4, request);
+			LEConverter.To((short)dampeningFactor, 12, request);
+			short[] _clipLimit = new short[2];
+			for (int i = 0; i < 2; ++i) {
+				_clipLimit[i] = (short)clipLimit[i];
+			}
+			LEConverter.To(_clipLimit, 14, 2, request);
+			LEConverter.To((short)emptyCounts, 18, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the high contrast config as set by <see cref="Tinkerforge.BrickletThermalImaging.SetHighContrastConfig"/>.
+		/// </summary>
+		public void GetHighContrastConfig(out byte[] regionOfInterest, out int dampeningFactor, out int[] clipLimit, out int emptyCounts)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_HIGH_CONTRAST_CONFIG);
+
+			byte[] response = SendRequest(request, 20);
+
+			regionOfInterest = LEConverter.ByteArrayFrom(8, response, 4);
+			dampeningFactor = LEConverter.UShortFrom(12, response);
+			clipLimit = LEConverter.UShortArrayFrom(14, response, 2);
+			emptyCounts = LEConverter.UShortFrom(18, response);
+		}
+
+		/// <summary>
+		///  The necessary bandwidth of this Bricklet is too high to use getter/callback or
+		///  high contrast/temperature image at the same time. You have to configure the one
+		///  you want to use, the Bricklet will optimize the internal configuration accordingly.
+		///  
+		///  Corresponding functions:
+		///  
+		///  * Manual High Contrast Image: <see cref="Tinkerforge.BrickletThermalImaging.GetHighContrastImage"/>.
+		///  * Manual Temperature Image: <see cref="Tinkerforge.BrickletThermalImaging.GetTemperatureImage"/>.
+		///  * Callback High Contrast Image: <see cref="Tinkerforge.BrickletThermalImaging.HighContrastImageCallback"/> callback.
+		///  * Callback Temperature Image: <see cref="Tinkerforge.BrickletThermalImaging.TemperatureImageCallback"/> callback.
+		/// </summary>
+		public void SetImageTransferConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_IMAGE_TRANSFER_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the image transfer config, as set by <see cref="Tinkerforge.BrickletThermalImaging.SetImageTransferConfig"/>.
+		/// </summary>
+		public byte GetImageTransferConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IMAGE_TRANSFER_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the flux linear parameters that can be used for radiometry calibration.
+		///  
+		///  See FLIR document 102-PS245-100-01 for more details.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Plugin)
+		/// </summary>
+		public void SetFluxLinearParameters(int sceneEmissivity, int temperatureBackground, int tauWindow, int temperaturWindow, int tauAtmosphere, int temperatureAtmosphere, int reflectionWindow, int temperatureReflection)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(24, FUNCTION_SET_FLUX_LINEAR_PARAMETERS);
+			LEConverter.To((short)sceneEmissivity, 8, request);
+			LEConverter.To((short)temperatureBackground, 10, request);
+			LEConverter.To((short)tauWindow, 12, request);
+			LEConverter.To((short)temperaturWindow, 14, request);
+			LEConverter.To((short)tauAtmosphere, 16, request);
+			LEConverter.To((short)temperatureAtmosphere, 18, request);
+			LEConverter.To((short)reflectionWindow, 20, request);
+			LEConverter.To((short)temperatureReflection, 22, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the flux linear parameters, as set by <see cref="Tinkerforge.BrickletThermalImaging.SetFluxLinearParameters"/>.
+		///  
+		///  .. versionadded:: 2.0.5$nbsp;(Plugin)
+		/// </summary>
+		public void GetFluxLinearParameters(out int sceneEmissivity, out int temperatureBackground, out int tauWindow, out int temperaturWindow, out int tauAtmosphere, out int temperatureAtmosphere, out int reflectionWindow, out int temperatureReflection)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_FLUX_LINEAR_PARAMETERS);
+
+			byte[] response = SendRequest(request, 24);
+
+			sceneEmissivity = LEConverter.UShortFrom(8, response);
+			temperatureBackground = LEConverter.UShortFrom(10, response);
+			tauWindow = LEConverter.UShortFrom(12, response);
+			temperaturWindow = LEConverter.UShortFrom(14, response);
+			tauAtmosphere = LEConverter.UShortFrom(16, response);
+			temperatureAtmosphere = LEConverter.UShortFrom(18, response);
+			reflectionWindow = LEConverter.UShortFrom(20, response);
+			temperatureReflection = LEConverter.UShortFrom(22, response);
+		}
+
+		/// <summary>
+		///  Returns the error count for the communication between Brick and Bricklet.
+		///  
+		///  The errors are divided into
+		///  
+		///  * ACK checksum errors,
+		///  * message checksum errors,
+		///  * framing errors and
+		///  * overflow errors.
+		///  
+		///  The errors counts are for errors that occur on the Bricklet side. All
+		///  Bricks have a similar function that returns the errors on the Brick side.
+		/// </summary>
+		public void GetSPITFPErrorCount(out long errorCountAckChecksum, out long errorCountMessageChecksum, out long errorCountFrame, out long errorCountOverflow)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_SPITFP_ERROR_COUNT);
+
+			byte[] response = SendRequest(request, 24);
+
+			errorCountAckChecksum = LEConverter.UIntFrom(8, response);
+			errorCountMessageChecksum = LEConverter.UIntFrom(12, response);
+			errorCountFrame = LEConverter.UIntFrom(16, response);
+			errorCountOverflow = LEConverter.UIntFrom(20, response);
+		}
+
+		/// <summary>
+		///  Sets the bootloader mode and returns the status after the requested
+		///  mode change was instigated.
+		///  
+		///  You can change from bootloader mode to firmware mode and vice versa. A change
+		///  from bootloader mode to firmware mode will only take place if the entry function,
+		///  device identifier and CRC are present and correct.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte SetBootloaderMode(byte mode)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_BOOTLOADER_MODE);
+			LEConverter.To((byte)mode, 8, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the current bootloader mode, see <see cref="Tinkerforge.BrickletThermalImaging.SetBootloaderMode"/>.
+		/// </summary>
+		public byte GetBootloaderMode()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_BOOTLOADER_MODE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the firmware pointer for <see cref="Tinkerforge.BrickletThermalImaging.WriteFirmware"/>. The pointer has
+		///  to be increased by chunks of size 64. The data is written to flash
+		///  every 4 chunks (which equals to one page of size 256).
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes 64 Bytes of firmware at the position as written by
+		///  <see cref="Tinkerforge.BrickletThermalImaging.SetWriteFirmwarePointer"/> before. The firmware is written
+		///  to flash every 4 chunks.
+		///  
+		///  You can only write firmware in bootloader mode.
+		///  
+		///  This function is used by Brick Viewer during flashing. It should not be
+		///  necessary to call it in a normal user program.
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the status LED configuration. By default the LED shows
+		///  communication traffic between Brick and Bricklet, it flickers once
+		///  for every 10 received data packets.
+		///  
+		///  You can also turn the LED permanently on/off or show a heartbeat.
+		///  
+		///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+		/// </summary>
+		public void SetStatusLEDConfig(byte config)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_SET_STATUS_LED_CONFIG);
+			LEConverter.To((byte)config, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletThermalImaging.SetStatusLEDConfig"/>
+		/// </summary>
+		public byte GetStatusLEDConfig()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_STATUS_LED_CONFIG);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the temperature as measured inside the microcontroller. The
+		///  value returned is not the ambient temperature!
+		///  
+		///  The temperature is only proportional to the real temperature and it has bad
+		///  accuracy. Practically it is only useful as an indicator for
+		///  temperature changes.
+		/// </summary>
+		public short GetChipTemperature()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CHIP_TEMPERATURE);
+
+			byte[] response = SendRequest(request, 10);
+
+			return LEConverter.ShortFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the Bricklet. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		///  Returns the current high contrast image. See `here &lt;https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Thermal_Imaging.html#high-contrast-image-vs-temperature-image&gt;`__
+		///  for the difference between
+		///  High Contrast and Temperature Image. If you don't know what to use
+		///  the High Contrast Image is probably right for you.
+		///  
+		///  The data is organized as a 8-bit value 80x60 pixel matrix linearized in
+		///  a one-dimensional array. The data is arranged line by line from top left to
+		///  bottom right.
+		///  
+		///  Each 8-bit value represents one gray-scale image pixel that can directly be
+		///  shown to a user on a display.
+		///  
+		///  Before you can use this function you have to enable it with
+		///  <see cref="Tinkerforge.BrickletThermalImaging.SetImageTransferConfig"/>.
+		/// </summary>
+		public byte[] GetHighContrastImage()
+		{
+			byte[] image = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int imageLength = 4800;
+			int imageChunkOffset;
+			byte[] imageChunkData = new byte[62];
+			int imageChunkLength;
+			bool imageOutOfSync;
+			int imageCurrentLength;
+
+			lock (streamLock)
+			{
+				GetHighContrastImageLowLevel(out imageChunkOffset, out imageChunkData);
+
+				if (imageChunkOffset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+					imageLength = 0;
+					imageChunkOffset = 0;
+					imageOutOfSync = false;
+				} else {
+					imageOutOfSync = imageChunkOffset != 0;
+				}
+
+				if (!imageOutOfSync) {
+					image = new byte[imageLength];
+					imageChunkLength = Math.Min(imageLength - imageChunkOffset, 62);
+
+					Array.Copy(imageChunkData, image, imageChunkLength);
+
+					imageCurrentLength = imageChunkLength;
+
+					while (imageCurrentLength < imageLength)
+					{
+						GetHighContrastImageLowLevel(out imageChunkOffset, out imageChunkData);
+
+						imageOutOfSync = imageChunkOffset != imageCurrentLength;
+
+						if (imageOutOfSync) {
+							break;
+						}
+
+						imageChunkLength = Math.Min(imageLength - imageChunkOffset, 62);
+
+						Array.Copy(imageChunkData, 0, image, imageCurrentLength, imageChunkLength);
+
+						imageCurrentLength += imageChunkLength;
+					}
+				}
+
+				if (imageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (imageChunkOffset + 62 < imageLength)
+					{
+						GetHighContrastImageLowLevel(out imageChunkOffset, out imageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Image is out-of-sync");
+				}
+			}
+
+			return image;
+		}
+
+		/// <summary>
+		///  Returns the current temperature image. See `here &lt;https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Thermal_Imaging.html#high-contrast-image-vs-temperature-image&gt;`__
+		///  for the difference between High Contrast and Temperature Image.
+		///  If you don't know what to use the High Contrast Image is probably right for you.
+		///  
+		///  The data is organized as a 16-bit value 80x60 pixel matrix linearized in
+		///  a one-dimensional array. The data is arranged line by line from top left to
+		///  bottom right.
+		///  
+		///  Each 16-bit value represents one temperature measurement in either
+		///  Kelvin/10 or Kelvin/100 (depending on the resolution set with <see cref="Tinkerforge.BrickletThermalImaging.SetResolution"/>).
+		///  
+		///  Before you can use this function you have to enable it with
+		///  <see cref="Tinkerforge.BrickletThermalImaging.SetImageTransferConfig"/>.
+		/// </summary>
+		public int[] GetTemperatureImage()
+		{
+			int[] image = null; // stop the compiler from wrongly complaining that this variable is used unassigned
+			int imageLength = 4800;
+			int imageChunkOffset;
+			int[] imageChunkData = new int[31];
+			int imageChunkLength;
+			bool imageOutOfSync;
+			int imageCurrentLength;
+
+			lock (streamLock)
+			{
+				GetTemperatureImageLowLevel(out imageChunkOffset, out imageChunkData);
+
+				if (imageChunkOffset == (1 << 16) - 1) { // maximum chunk offset -> stream has no data
+					imageLength = 0;
+					imageChunkOffset = 0;
+					imageOutOfSync = false;
+				} else {
+					imageOutOfSync = imageChunkOffset != 0;
+				}
+
+				if (!imageOutOfSync) {
+					image = new int[imageLength];
+					imageChunkLength = Math.Min(imageLength - imageChunkOffset, 31);
+
+					Array.Copy(imageChunkData, image, imageChunkLength);
+
+					imageCurrentLength = imageChunkLength;
+
+					while (imageCurrentLength < imageLength)
+					{
+						GetTemperatureImageLowLevel(out imageChunkOffset, out imageChunkData);
+
+						imageOutOfSync = imageChunkOffset != imageCurrentLength;
+
+						if (imageOutOfSync) {
+							break;
+						}
+
+						imageChunkLength = Math.Min(imageLength - imageChunkOffset, 31);
+
+						Array.Copy(imageChunkData, 0, image, imageCurrentLength, imageChunkLength);
+
+						imageCurrentLength += imageChunkLength;
+					}
+				}
+
+				if (imageOutOfSync) {
+					// discard remaining stream to bring it back in-sync
+					while (imageChunkOffset + 31 < imageLength)
+					{
+						GetTemperatureImageLowLevel(out imageChunkOffset, out imageChunkData);
+					}
+
+					throw new StreamOutOfSyncException("Image is out-of-sync");
+				}
+			}
+
+			return image;
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnHighContrastImageLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int imageChunkOffset = LEConverter.UShortFrom(8, response);
+			byte[] imageChunkData = LEConverter.ByteArrayFrom(10, response, 62);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_HIGH_CONTRAST_IMAGE];
+			int imageChunkLength = Math.Min(4800 - imageChunkOffset, 62);
+			var highLevelHandler = HighContrastImageCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (imageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new byte[4800];
+					highLevelCallback.length = imageChunkLength;
+
+					Array.Copy(imageChunkData, (byte[])highLevelCallback.data, imageChunkLength);
+
+					if (highLevelCallback.length >= 4800) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (byte[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (imageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, (byte[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(imageChunkData, 0, (byte[])highLevelCallback.data, highLevelCallback.length, imageChunkLength);
+					highLevelCallback.length += imageChunkLength;
+
+					if (highLevelCallback.length >= 4800) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (byte[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = HighContrastImageLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, imageChunkOffset, imageChunkData);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnTemperatureImageLowLevelCallback(byte[] response)
+		{
+			if (response.Length != 72)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int imageChunkOffset = LEConverter.UShortFrom(8, response);
+			int[] imageChunkData = LEConverter.UShortArrayFrom(10, response, 31);
+			HighLevelCallback highLevelCallback = highLevelCallbacks[-CALLBACK_TEMPERATURE_IMAGE];
+			int imageChunkLength = Math.Min(4800 - imageChunkOffset, 31);
+			var highLevelHandler = TemperatureImageCallback;
+
+			if (highLevelCallback.data == null) // no stream in-progress
+			{
+				if (imageChunkOffset == 0) // stream starts
+				{
+					highLevelCallback.data = new int[4800];
+					highLevelCallback.length = imageChunkLength;
+
+					Array.Copy(imageChunkData, (int[])highLevelCallback.data, imageChunkLength);
+
+					if (highLevelCallback.length >= 4800) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (int[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+				else // ignore tail of current stream, wait for next stream start
+				{
+				}
+			}
+			else // stream in-progress
+			{
+				if (imageChunkOffset != highLevelCallback.length) // stream out-of-sync
+				{
+					highLevelCallback.data = null;
+					highLevelCallback.length = 0;
+
+					if (highLevelHandler != null)
+					{
+						highLevelHandler(this, (int[])highLevelCallback.data);
+					}
+				}
+				else // stream in-sync
+				{
+					Array.Copy(imageChunkData, 0, (int[])highLevelCallback.data, highLevelCallback.length, imageChunkLength);
+					highLevelCallback.length += imageChunkLength;
+
+					if (highLevelCallback.length >= 4800) // stream complete
+					{
+						if (highLevelHandler != null)
+						{
+							highLevelHandler(this, (int[])highLevelCallback.data);
+						}
+
+						highLevelCallback.data = null;
+						highLevelCallback.length = 0;
+					}
+				}
+			}
+
+			var handler = TemperatureImageLowLevelCallback;
+
+			if (handler != null)
+			{
+				handler(this, imageChunkOffset, imageChunkData);
+			}
+		}
+	}
+}
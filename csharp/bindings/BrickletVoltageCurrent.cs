@@ -0,0 +1,979 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  Measures power, DC voltage and DC current up to 720W/36V/20A
+	/// </summary>
+	public class BrickletVoltageCurrent : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 227;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "Voltage/Current Bricklet";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CURRENT = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VOLTAGE = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_POWER = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CONFIGURATION = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CONFIGURATION = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CALIBRATION = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CALIBRATION = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CURRENT_CALLBACK_PERIOD = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CURRENT_CALLBACK_PERIOD = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD = 11;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_POWER_CALLBACK_PERIOD = 12;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_POWER_CALLBACK_PERIOD = 13;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CURRENT_CALLBACK_THRESHOLD = 14;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD = 15;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD = 16;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD = 17;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_POWER_CALLBACK_THRESHOLD = 18;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_POWER_CALLBACK_THRESHOLD = 19;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_DEBOUNCE_PERIOD = 20;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_DEBOUNCE_PERIOD = 21;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+		private const int CALLBACK_CURRENT = 22;
+
+		private const int CALLBACK_VOLTAGE = 23;
+
+		private const int CALLBACK_POWER = 24;
+
+		private const int CALLBACK_CURRENT_REACHED = 25;
+
+		private const int CALLBACK_VOLTAGE_REACHED = 26;
+
+		private const int CALLBACK_POWER_REACHED = 27;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte AVERAGING_1 = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte AVERAGING_4 = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte AVERAGING_16 = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte AVERAGING_64 = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte AVERAGING_128 = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte AVERAGING_256 = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte AVERAGING_512 = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte AVERAGING_1024 = 7;
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OFF = 'x';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_OUTSIDE = 'o';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_INSIDE = 'i';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_SMALLER = '<';
+
+		/// <summary>
+		/// </summary>
+		public const char THRESHOLD_OPTION_GREATER = '>';
+
+		/// <summary>
+		/// </summary>
+		public const byte CONVERSION_TIME_140US = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONVERSION_TIME_204US = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONVERSION_TIME_332US = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONVERSION_TIME_588US = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONVERSION_TIME_1_1MS = 4;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONVERSION_TIME_2_116MS = 5;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONVERSION_TIME_4_156MS = 6;
+
+		/// <summary>
+		/// </summary>
+		public const byte CONVERSION_TIME_8_244MS = 7;
+
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.SetCurrentCallbackPeriod"/>. The parameter is the current of the
+		///  sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickletVoltageCurrent.CurrentCallback"/> callback is only triggered if the current has changed since
+		///  the last triggering.
+		/// </summary>
+		public event CurrentEventHandler CurrentCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void CurrentEventHandler(BrickletVoltageCurrent sender, int current);
+
+		/// <summary>
+		/// </summary>
+		public event CurrentEventHandler Current // for backward compatibility
+		{
+			add { CurrentCallback += value; }
+			remove { CurrentCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.SetVoltageCallbackPeriod"/>. The parameter is the voltage of
+		///  the sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickletVoltageCurrent.VoltageCallback"/> callback is only triggered if the voltage has changed since
+		///  the last triggering.
+		/// </summary>
+		public event VoltageEventHandler VoltageCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void VoltageEventHandler(BrickletVoltageCurrent sender, int voltage);
+
+		/// <summary>
+		/// </summary>
+		public event VoltageEventHandler Voltage // for backward compatibility
+		{
+			add { VoltageCallback += value; }
+			remove { VoltageCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered periodically with the period that is set by
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.SetPowerCallbackPeriod"/>. The parameter is the power of the
+		///  sensor.
+		///  
+		///  The <see cref="Tinkerforge.BrickletVoltageCurrent.PowerCallback"/> callback is only triggered if the power has changed since the
+		///  last triggering.
+		/// </summary>
+		public event PowerEventHandler PowerCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void PowerEventHandler(BrickletVoltageCurrent sender, int power);
+
+		/// <summary>
+		/// </summary>
+		public event PowerEventHandler Power // for backward compatibility
+		{
+			add { PowerCallback += value; }
+			remove { PowerCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.SetCurrentCallbackThreshold"/> is reached.
+		///  The parameter is the current of the sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletVoltageCurrent.SetDebouncePeriod"/>.
+		/// </summary>
+		public event CurrentReachedEventHandler CurrentReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void CurrentReachedEventHandler(BrickletVoltageCurrent sender, int current);
+
+		/// <summary>
+		/// </summary>
+		public event CurrentReachedEventHandler CurrentReached // for backward compatibility
+		{
+			add { CurrentReachedCallback += value; }
+			remove { CurrentReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.SetVoltageCallbackThreshold"/> is reached.
+		///  The parameter is the voltage of the sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletVoltageCurrent.SetDebouncePeriod"/>.
+		/// </summary>
+		public event VoltageReachedEventHandler VoltageReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void VoltageReachedEventHandler(BrickletVoltageCurrent sender, int voltage);
+
+		/// <summary>
+		/// </summary>
+		public event VoltageReachedEventHandler VoltageReached // for backward compatibility
+		{
+			add { VoltageReachedCallback += value; }
+			remove { VoltageReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  This callback is triggered when the threshold as set by
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.SetPowerCallbackThreshold"/> is reached.
+		///  The parameter is the power of the sensor.
+		///  
+		///  If the threshold keeps being reached, the callback is triggered periodically
+		///  with the period as set by <see cref="Tinkerforge.BrickletVoltageCurrent.SetDebouncePeriod"/>.
+		/// </summary>
+		public event PowerReachedEventHandler PowerReachedCallback;
+		/// <summary>
+		/// </summary>
+		public delegate void PowerReachedEventHandler(BrickletVoltageCurrent sender, int power);
+
+		/// <summary>
+		/// </summary>
+		public event PowerReachedEventHandler PowerReached // for backward compatibility
+		{
+			add { PowerReachedCallback += value; }
+			remove { PowerReachedCallback -= value; }
+		}
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public BrickletVoltageCurrent(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+			callbackWrappers[CALLBACK_CURRENT] = new CallbackWrapper(OnCurrentCallback);
+			callbackWrappers[CALLBACK_VOLTAGE] = new CallbackWrapper(OnVoltageCallback);
+			callbackWrappers[CALLBACK_POWER] = new CallbackWrapper(OnPowerCallback);
+			callbackWrappers[CALLBACK_CURRENT_REACHED] = new CallbackWrapper(OnCurrentReachedCallback);
+			callbackWrappers[CALLBACK_VOLTAGE_REACHED] = new CallbackWrapper(OnVoltageReachedCallback);
+			callbackWrappers[CALLBACK_POWER_REACHED] = new CallbackWrapper(OnPowerReachedCallback);
+
+
+			responseExpected[FUNCTION_GET_CURRENT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_POWER] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CONFIGURATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CONFIGURATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CALIBRATION] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CALIBRATION] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CURRENT_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_CURRENT_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_POWER_CALLBACK_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_POWER_CALLBACK_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CURRENT_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_POWER_CALLBACK_THRESHOLD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_POWER_CALLBACK_THRESHOLD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.TRUE;
+			responseExpected[FUNCTION_GET_DEBOUNCE_PERIOD] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  Returns the current.
+		///  
+		///  If you want to get the current periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.CurrentCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.SetCurrentCallbackPeriod"/>.
+		/// </summary>
+		public int GetCurrent()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CURRENT);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the voltage.
+		///  
+		///  If you want to get the voltage periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.VoltageCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.SetVoltageCallbackPeriod"/>.
+		/// </summary>
+		public int GetVoltage()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VOLTAGE);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the power.
+		///  
+		///  If you want to get the power periodically, it is recommended to use the
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.PowerCallback"/> callback and set the period with
+		///  <see cref="Tinkerforge.BrickletVoltageCurrent.SetPowerCallbackPeriod"/>.
+		/// </summary>
+		public int GetPower()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_POWER);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.IntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the configuration of the Voltage/Current Bricklet. It is
+		///  possible to configure number of averages as well as
+		///  voltage and current conversion time.
+		/// </summary>
+		public void SetConfiguration(byte averaging, byte voltageConversionTime, byte currentConversionTime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(11, FUNCTION_SET_CONFIGURATION);
+			LEConverter.To((byte)averaging, 8, request);
+			LEConverter.To((byte)voltageConversionTime, 9, request);
+			LEConverter.To((byte)currentConversionTime, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the configuration as set by <see cref="Tinkerforge.BrickletVoltageCurrent.SetConfiguration"/>.
+		/// </summary>
+		public void GetConfiguration(out byte averaging, out byte voltageConversionTime, out byte currentConversionTime)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CONFIGURATION);
+
+			byte[] response = SendRequest(request, 11);
+
+			averaging = LEConverter.ByteFrom(8, response);
+			voltageConversionTime = LEConverter.ByteFrom(9, response);
+			currentConversionTime = LEConverter.ByteFrom(10, response);
+		}
+
+		/// <summary>
+		///  Since the shunt resistor that is used to measure the current is not
+		///  perfectly precise, it needs to be calibrated by a multiplier and
+		///  divisor if a very precise reading is needed.
+		///  
+		///  For example, if you are expecting a measurement of 1000mA and you
+		///  are measuring 1023mA, you can calibrate the Voltage/Current Bricklet
+		///  by setting the multiplier to 1000 and the divisor to 1023.
+		/// </summary>
+		public void SetCalibration(int gainMultiplier, int gainDivisor)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_CALIBRATION);
+			LEConverter.To((short)gainMultiplier, 8, request);
+			LEConverter.To((short)gainDivisor, 10, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the calibration as set by <see cref="Tinkerforge.BrickletVoltageCurrent.SetCalibration"/>.
+		/// </summary>
+		public void GetCalibration(out int gainMultiplier, out int gainDivisor)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CALIBRATION);
+
+			byte[] response = SendRequest(request, 12);
+
+			gainMultiplier = LEConverter.UShortFrom(8, response);
+			gainDivisor = LEConverter.UShortFrom(10, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletVoltageCurrent.CurrentCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletVoltageCurrent.CurrentCallback"/> callback is only triggered if the current has changed since
+		///  the last triggering.
+		/// </summary>
+		public void SetCurrentCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_CURRENT_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletVoltageCurrent.SetCurrentCallbackPeriod"/>.
+		/// </summary>
+		public long GetCurrentCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CURRENT_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletVoltageCurrent.VoltageCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletVoltageCurrent.VoltageCallback"/> callback is only triggered if the voltage has changed since
+		///  the last triggering.
+		/// </summary>
+		public void SetVoltageCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_VOLTAGE_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletVoltageCurrent.SetVoltageCallbackPeriod"/>.
+		/// </summary>
+		public long GetVoltageCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VOLTAGE_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the <see cref="Tinkerforge.BrickletVoltageCurrent.PowerCallback"/> callback is triggered
+		///  periodically. A value of 0 turns the callback off.
+		///  
+		///  The <see cref="Tinkerforge.BrickletVoltageCurrent.PowerCallback"/> callback is only triggered if the power has changed since the
+		///  last triggering.
+		/// </summary>
+		public void SetPowerCallbackPeriod(long period)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_POWER_CALLBACK_PERIOD);
+			LEConverter.To((int)period, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the period as set by <see cref="Tinkerforge.BrickletVoltageCurrent.GetPowerCallbackPeriod"/>.
+		/// </summary>
+		public long GetPowerCallbackPeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_POWER_CALLBACK_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletVoltageCurrent.CurrentReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the current is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the current is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the current is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the current is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetCurrentCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_SET_CURRENT_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((int)min, 9, request);
+			LEConverter.To((int)max, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletVoltageCurrent.SetCurrentCallbackThreshold"/>.
+		/// </summary>
+		public void GetCurrentCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CURRENT_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 17);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.IntFrom(9, response);
+			max = LEConverter.IntFrom(13, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletVoltageCurrent.VoltageReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the voltage is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the voltage is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the voltage is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the voltage is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetVoltageCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_SET_VOLTAGE_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((int)min, 9, request);
+			LEConverter.To((int)max, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletVoltageCurrent.SetVoltageCallbackThreshold"/>.
+		/// </summary>
+		public void GetVoltageCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VOLTAGE_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 17);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.IntFrom(9, response);
+			max = LEConverter.IntFrom(13, response);
+		}
+
+		/// <summary>
+		///  Sets the thresholds for the <see cref="Tinkerforge.BrickletVoltageCurrent.PowerReachedCallback"/> callback.
+		///  
+		///  The following options are possible:
+		///  
+		///  <code>
+		///   "Option", "Description"
+		///  
+		///   "'x'",    "Callback is turned off"
+		///   "'o'",    "Callback is triggered when the power is *outside* the min and max values"
+		///   "'i'",    "Callback is triggered when the power is *inside* the min and max values"
+		///   "'&lt;'",    "Callback is triggered when the power is smaller than the min value (max is ignored)"
+		///   "'&gt;'",    "Callback is triggered when the power is greater than the min value (max is ignored)"
+		///  </code>
+		/// </summary>
+		public void SetPowerCallbackThreshold(char option, int min, int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(17, FUNCTION_SET_POWER_CALLBACK_THRESHOLD);
+			LEConverter.To((char)option, 8, request);
+			LEConverter.To((int)min, 9, request);
+			LEConverter.To((int)max, 13, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the threshold as set by <see cref="Tinkerforge.BrickletVoltageCurrent.SetPowerCallbackThreshold"/>.
+		/// </summary>
+		public void GetPowerCallbackThreshold(out char option, out int min, out int max)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_POWER_CALLBACK_THRESHOLD);
+
+			byte[] response = SendRequest(request, 17);
+
+			option = LEConverter.CharFrom(8, response);
+			min = LEConverter.IntFrom(9, response);
+			max = LEConverter.IntFrom(13, response);
+		}
+
+		/// <summary>
+		///  Sets the period with which the threshold callbacks
+		///  
+		///  * <see cref="Tinkerforge.BrickletVoltageCurrent.CurrentReachedCallback"/>,
+		///  * <see cref="Tinkerforge.BrickletVoltageCurrent.VoltageReachedCallback"/>,
+		///  * <see cref="Tinkerforge.BrickletVoltageCurrent.PowerReachedCallback"/>
+		///  
+		///  are triggered, if the thresholds
+		///  
+		///  * <see cref="Tinkerforge.BrickletVoltageCurrent.SetCurrentCallbackThreshold"/>,
+		///  * <see cref="Tinkerforge.BrickletVoltageCurrent.SetVoltageCallbackThreshold"/>,
+		///  * <see cref="Tinkerforge.BrickletVoltageCurrent.SetPowerCallbackThreshold"/>
+		///  
+		///  keep being reached.
+		/// </summary>
+		public void SetDebouncePeriod(long debounce)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_DEBOUNCE_PERIOD);
+			LEConverter.To((int)debounce, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the debounce period as set by <see cref="Tinkerforge.BrickletVoltageCurrent.SetDebouncePeriod"/>.
+		/// </summary>
+		public long GetDebouncePeriod()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_DEBOUNCE_PERIOD);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Bricklet is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+		///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+		///  position 'z'.
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnCurrentCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int current = LEConverter.IntFrom(8, response);
+			var handler = CurrentCallback;
+
+			if (handler != null)
+			{
+				handler(this, current);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnVoltageCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.IntFrom(8, response);
+			var handler = VoltageCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnPowerCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int power = LEConverter.IntFrom(8, response);
+			var handler = PowerCallback;
+
+			if (handler != null)
+			{
+				handler(this, power);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnCurrentReachedCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int current = LEConverter.IntFrom(8, response);
+			var handler = CurrentReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, current);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnVoltageReachedCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int voltage = LEConverter.IntFrom(8, response);
+			var handler = VoltageReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, voltage);
+			}
+		}
+
+		/// <summary>
+		/// </summary>
+		protected void OnPowerReachedCallback(byte[] response)
+		{
+			if (response.Length != 12)
+			{
+				return; // silently ignoring callback with wrong length
+			}
+
+			int power = LEConverter.IntFrom(8, response);
+			var handler = PowerReachedCallback;
+
+			if (handler != null)
+			{
+				handler(this, power);
+			}
+		}
+	}
+}
@@ -0,0 +1,501 @@
+/* ***********************************************************
+ * This file was automatically generated on 2026-10-18.      *
+ *                                                           *
+ * C# Bindings Version 2.1.28                                *
+ *                                                           *
+ * If you have a bugfix for this file and want to commit it, *
+ * please fix the bug in the generator. You can find a link  *
+ * to the generators git repository on tinkerforge.com       *
+ *************************************************************/
+
+using System;
+
+namespace Tinkerforge
+{
+	/// <summary>
+	///  TBD
+	/// </summary>
+	public class TNGAO4U4I : Device
+	{
+		/// <summary>
+		///  Used to identify this device type in
+		///  <see cref="Tinkerforge.IPConnection.EnumerateCallback"/>.
+		/// </summary>
+		public static int DEVICE_IDENTIFIER = 206;
+
+		/// <summary>
+		///  The display name of this device.
+		/// </summary>
+		public static string DEVICE_DISPLAY_NAME = "TNG AO 4U 4I";
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VALUES = 1;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VALUES = 2;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_VOLTAGES = 3;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_VOLTAGES = 4;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_CURRENTS = 5;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_CURRENTS = 6;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SELECTED_VOLTAGE = 7;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SELECTED_VOLTAGE = 8;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_SELECTED_CURRENT = 9;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_SELECTED_CURRENT = 10;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_TIMESTAMP = 234;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_COPY_FIRMWARE = 235;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_FIRMWARE = 238;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_RESET = 243;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_WRITE_UID = 248;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_READ_UID = 249;
+
+		/// <summary>
+		///  Function ID to be used with
+		///  <see cref="Tinkerforge.Device.GetResponseExpected"/> and
+		///  <see cref="Tinkerforge.Device.SetResponseExpected"/>.
+		/// </summary>
+		public const byte FUNCTION_GET_IDENTITY = 255;
+
+
+		/// <summary>
+		/// </summary>
+		public const byte COPY_STATUS_OK = 0;
+
+		/// <summary>
+		/// </summary>
+		public const byte COPY_STATUS_DEVICE_IDENTIFIER_INCORRECT = 1;
+
+		/// <summary>
+		/// </summary>
+		public const byte COPY_STATUS_MAGIC_NUMBER_INCORRECT = 2;
+
+		/// <summary>
+		/// </summary>
+		public const byte COPY_STATUS_LENGTH_MALFORMED = 3;
+
+		/// <summary>
+		/// </summary>
+		public const byte COPY_STATUS_CRC_MISMATCH = 4;
+
+
+		/// <summary>
+		///  Creates an object with the unique device ID <c>uid</c> and adds  it to
+		///  the IPConnection <c>ipcon</c>.
+		/// </summary>
+		public TNGAO4U4I(string uid, IPConnection ipcon) : base(uid, ipcon, DEVICE_IDENTIFIER, DEVICE_DISPLAY_NAME)
+		{
+			apiVersion[0] = 2;
+			apiVersion[1] = 0;
+			apiVersion[2] = 0;
+
+
+
+			responseExpected[FUNCTION_SET_VALUES] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_VALUES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_VOLTAGES] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_VOLTAGES] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_CURRENTS] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_CURRENTS] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SELECTED_VOLTAGE] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SELECTED_VOLTAGE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_SELECTED_CURRENT] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_GET_SELECTED_CURRENT] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_TIMESTAMP] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_COPY_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_SET_WRITE_FIRMWARE_POINTER] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_FIRMWARE] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_RESET] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_WRITE_UID] = ResponseExpectedFlag.FALSE;
+			responseExpected[FUNCTION_READ_UID] = ResponseExpectedFlag.ALWAYS_TRUE;
+			responseExpected[FUNCTION_GET_IDENTITY] = ResponseExpectedFlag.ALWAYS_TRUE;
+
+			ipcon.AddDevice(this);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SetValues(long timestamp, int[] voltages, int[] currents)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(48, FUNCTION_SET_VALUES);
+			LEConverter.To((long)timestamp, 8, request);
+			LEConverter.To((int[])voltages, 16, 4, request);
+			LEConverter.To((int[])currents, 32, 4, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetValues(out long timestamp, out int[] voltages, out int[] currents)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VALUES);
+
+			byte[] response = SendRequest(request, 48);
+
+			timestamp = LEConverter.ULongFrom(8, response);
+			voltages = LEConverter.IntArrayFrom(16, response, 4);
+			currents = LEConverter.IntArrayFrom(32, response, 4);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SetVoltages(long timestamp, int[] voltages)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(32, FUNCTION_SET_VOLTAGES);
+			LEConverter.To((long)timestamp, 8, request);
+			LEConverter.To((int[])voltages, 16, 4, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetVoltages(out long timestamp, out int[] voltages)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_VOLTAGES);
+
+			byte[] response = SendRequest(request, 32);
+
+			timestamp = LEConverter.ULongFrom(8, response);
+			voltages = LEConverter.IntArrayFrom(16, response, 4);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SetCurrents(long timestamp, int[] currents)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(32, FUNCTION_SET_CURRENTS);
+			LEConverter.To((long)timestamp, 8, request);
+			LEConverter.To((int[])currents, 16, 4, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetCurrents(out long timestamp, out int[] currents)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_CURRENTS);
+
+			byte[] response = SendRequest(request, 32);
+
+			timestamp = LEConverter.ULongFrom(8, response);
+			currents = LEConverter.IntArrayFrom(16, response, 4);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SetSelectedVoltage(byte channel, long timestamp, int voltage)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(21, FUNCTION_SET_SELECTED_VOLTAGE);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((long)timestamp, 9, request);
+			LEConverter.To((int)voltage, 17, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetSelectedVoltage(byte channel, out long timestamp, out int voltage)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SELECTED_VOLTAGE);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 20);
+
+			timestamp = LEConverter.ULongFrom(8, response);
+			voltage = LEConverter.IntFrom(16, response);
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void SetSelectedCurrent(byte channel, long timestamp, int current)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(21, FUNCTION_SET_SELECTED_CURRENT);
+			LEConverter.To((byte)channel, 8, request);
+			LEConverter.To((long)timestamp, 9, request);
+			LEConverter.To((int)current, 17, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  
+		/// </summary>
+		public void GetSelectedCurrent(byte channel, out long timestamp, out int current)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(9, FUNCTION_GET_SELECTED_CURRENT);
+			LEConverter.To((byte)channel, 8, request);
+
+			byte[] response = SendRequest(request, 20);
+
+			timestamp = LEConverter.ULongFrom(8, response);
+			current = LEConverter.IntFrom(16, response);
+		}
+
+		/// <summary>
+		///  TODO
+		/// </summary>
+		public long GetTimestamp()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_TIMESTAMP);
+
+			byte[] response = SendRequest(request, 16);
+
+			return LEConverter.ULongFrom(8, response);
+		}
+
+		/// <summary>
+		///  TODO
+		/// </summary>
+		public byte CopyFirmware()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_COPY_FIRMWARE);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  TODO
+		/// </summary>
+		public void SetWriteFirmwarePointer(long pointer)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_SET_WRITE_FIRMWARE_POINTER);
+			LEConverter.To((int)pointer, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  TODO
+		/// </summary>
+		public byte WriteFirmware(byte[] data)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(72, FUNCTION_WRITE_FIRMWARE);
+			LEConverter.To((byte[])data, 8, 64, request);
+
+			byte[] response = SendRequest(request, 9);
+
+			return LEConverter.ByteFrom(8, response);
+		}
+
+		/// <summary>
+		///  Calling this function will reset the TNG module. All configurations
+		///  will be lost.
+		///  
+		///  After a reset you have to create new device objects,
+		///  calling functions on the existing ones will result in
+		///  undefined behavior!
+		/// </summary>
+		public void Reset()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_RESET);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Writes a new UID into flash. If you want to set a new UID
+		///  you have to decode the Base58 encoded UID string into an
+		///  integer first.
+		///  
+		///  We recommend that you use Brick Viewer to change the UID.
+		/// </summary>
+		public void WriteUID(long uid)
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(12, FUNCTION_WRITE_UID);
+			LEConverter.To((int)uid, 8, request);
+
+			SendRequest(request, 0);
+
+		}
+
+		/// <summary>
+		///  Returns the current UID as an integer. Encode as
+		///  Base58 to get the usual string version.
+		/// </summary>
+		public long ReadUID()
+		{
+			CheckValidity();
+
+			byte[] request = CreateRequestPacket(8, FUNCTION_READ_UID);
+
+			byte[] response = SendRequest(request, 12);
+
+			return LEConverter.UIntFrom(8, response);
+		}
+
+		/// <summary>
+		///  Returns the UID, the UID where the Brick is connected to,
+		///  the position, the hardware and firmware version as well as the
+		///  device identifier.
+		///  
+		///  The position is the position in the stack from '0' (bottom) to '8' (top).
+		///  
+		///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+		///  |device_identifier_constant|
+		/// </summary>
+		public override void GetIdentity(out string uid, out string connectedUid, out char position, out byte[] hardwareVersion, out byte[] firmwareVersion, out int deviceIdentifier)
+		{
+			byte[] request = CreateRequestPacket(8, FUNCTION_GET_IDENTITY);
+
+			byte[] response = SendRequest(request, 33);
+
+			uid = LEConverter.StringFrom(8, response, 8);
+			connectedUid = LEConverter.StringFrom(16, response, 8);
+			position = LEConverter.CharFrom(24, response);
+			hardwareVersion = LEConverter.ByteArrayFrom(25, response, 3);
+			firmwareVersion = LEConverter.ByteArrayFrom(28, response, 3);
+			deviceIdentifier = LEConverter.UShortFrom(31, response);
+		}
+	}
+}
@@ -1084,7 +1084,7 @@ class CSharpBindingsGenerator(csharp_common.CSharpGeneratorTrait, common.Binding
     def generate(self, device):
         filename = '{0}.cs'.format(device.get_csharp_class_name())
 
-        with open(os.path.join(self.get_bindings_dir(), filename), 'w') as f:
+        with common.open_output_file(os.path.join(self.get_bindings_dir(), filename)) as f:
             f.write(device.get_csharp_source())
 
         if device.is_released():
@@ -409,7 +409,7 @@ class CSharpDocGenerator(csharp_common.CSharpGeneratorTrait, common.DocGenerator
         return csharp_common.CSharpElement
 
     def generate(self, device):
-        with open(device.get_doc_rst_path(), 'w') as f:
+        with common.open_output_file(device.get_doc_rst_path()) as f:
             f.write(device.get_csharp_doc())
 
 def generate(root_dir, language):
@@ -707,7 +707,7 @@ class CSharpExamplesGenerator(csharp_common.CSharpGeneratorTrait, common.Example
             else:
                 print('  - ' + filename)
 
-            with open(filepath, 'w') as f:
+            with common.open_output_file(filepath) as f:
                 f.write(example.get_csharp_source())
 
 def generate(root_dir, language):
@@ -0,0 +1,1030 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletARINC429;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_ARINC429_DEVICE_IDENTIFIER = 2160;
+  BRICKLET_ARINC429_DEVICE_DISPLAY_NAME = 'ARINC429 Bricklet';
+
+  BRICKLET_ARINC429_FUNCTION_DEBUG_GET_DISCRETES = 1;
+  BRICKLET_ARINC429_FUNCTION_DEBUG_READ_REGISTER_LOW_LEVEL = 2;
+  BRICKLET_ARINC429_FUNCTION_DEBUG_WRITE_REGISTER_LOW_LEVEL = 3;
+  BRICKLET_ARINC429_FUNCTION_GET_CAPABILITIES = 4;
+  BRICKLET_ARINC429_FUNCTION_SET_HEARTBEAT_CALLBACK_CONFIGURATION = 5;
+  BRICKLET_ARINC429_FUNCTION_GET_HEARTBEAT_CALLBACK_CONFIGURATION = 6;
+  BRICKLET_ARINC429_FUNCTION_SET_CHANNEL_CONFIGURATION = 8;
+  BRICKLET_ARINC429_FUNCTION_GET_CHANNEL_CONFIGURATION = 9;
+  BRICKLET_ARINC429_FUNCTION_SET_CHANNEL_MODE = 10;
+  BRICKLET_ARINC429_FUNCTION_GET_CHANNEL_MODE = 11;
+  BRICKLET_ARINC429_FUNCTION_CLEAR_ALL_RX_FILTERS = 12;
+  BRICKLET_ARINC429_FUNCTION_CLEAR_RX_FILTER = 13;
+  BRICKLET_ARINC429_FUNCTION_SET_RX_STANDARD_FILTERS = 14;
+  BRICKLET_ARINC429_FUNCTION_SET_RX_FILTER = 15;
+  BRICKLET_ARINC429_FUNCTION_GET_RX_FILTER = 16;
+  BRICKLET_ARINC429_FUNCTION_READ_FRAME = 17;
+  BRICKLET_ARINC429_FUNCTION_SET_RX_CALLBACK_CONFIGURATION = 18;
+  BRICKLET_ARINC429_FUNCTION_GET_RX_CALLBACK_CONFIGURATION = 19;
+  BRICKLET_ARINC429_FUNCTION_WRITE_FRAME_DIRECT = 21;
+  BRICKLET_ARINC429_FUNCTION_WRITE_FRAME_SCHEDULED = 22;
+  BRICKLET_ARINC429_FUNCTION_CLEAR_SCHEDULE_ENTRIES = 23;
+  BRICKLET_ARINC429_FUNCTION_SET_SCHEDULE_ENTRY = 24;
+  BRICKLET_ARINC429_FUNCTION_GET_SCHEDULE_ENTRY = 25;
+  BRICKLET_ARINC429_FUNCTION_RESET_A429 = 26;
+  BRICKLET_ARINC429_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_ARINC429_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_ARINC429_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_ARINC429_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_ARINC429_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_ARINC429_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_ARINC429_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_ARINC429_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_ARINC429_FUNCTION_RESET = 243;
+  BRICKLET_ARINC429_FUNCTION_WRITE_UID = 248;
+  BRICKLET_ARINC429_FUNCTION_READ_UID = 249;
+  BRICKLET_ARINC429_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_ARINC429_CALLBACK_HEARTBEAT = 7;
+  BRICKLET_ARINC429_CALLBACK_FRAME_MESSAGE = 20;
+
+  BRICKLET_ARINC429_RW_ERROR_OK = 0;
+  BRICKLET_ARINC429_RW_ERROR_NO_WRITE = 1;
+  BRICKLET_ARINC429_RW_ERROR_NO_READ = 2;
+  BRICKLET_ARINC429_RW_ERROR_INVALID_OP_CODE = 3;
+  BRICKLET_ARINC429_RW_ERROR_INVALID_LENGTH = 4;
+  BRICKLET_ARINC429_RW_ERROR_SPI = 5;
+  BRICKLET_ARINC429_CHANNEL_TX = 0;
+  BRICKLET_ARINC429_CHANNEL_TX1 = 1;
+  BRICKLET_ARINC429_CHANNEL_TX2 = 2;
+  BRICKLET_ARINC429_CHANNEL_TX3 = 3;
+  BRICKLET_ARINC429_CHANNEL_TX4 = 4;
+  BRICKLET_ARINC429_CHANNEL_TX5 = 5;
+  BRICKLET_ARINC429_CHANNEL_TX6 = 6;
+  BRICKLET_ARINC429_CHANNEL_TX7 = 7;
+  BRICKLET_ARINC429_CHANNEL_TX8 = 8;
+  BRICKLET_ARINC429_CHANNEL_TX9 = 9;
+  BRICKLET_ARINC429_CHANNEL_TX10 = 10;
+  BRICKLET_ARINC429_CHANNEL_TX11 = 11;
+  BRICKLET_ARINC429_CHANNEL_TX12 = 12;
+  BRICKLET_ARINC429_CHANNEL_RX = 32;
+  BRICKLET_ARINC429_CHANNEL_RX1 = 33;
+  BRICKLET_ARINC429_CHANNEL_RX2 = 34;
+  BRICKLET_ARINC429_CHANNEL_RX3 = 35;
+  BRICKLET_ARINC429_CHANNEL_RX4 = 36;
+  BRICKLET_ARINC429_CHANNEL_RX5 = 37;
+  BRICKLET_ARINC429_CHANNEL_RX6 = 38;
+  BRICKLET_ARINC429_CHANNEL_RX7 = 39;
+  BRICKLET_ARINC429_CHANNEL_RX8 = 40;
+  BRICKLET_ARINC429_CHANNEL_RX9 = 41;
+  BRICKLET_ARINC429_CHANNEL_RX10 = 42;
+  BRICKLET_ARINC429_CHANNEL_RX11 = 43;
+  BRICKLET_ARINC429_CHANNEL_RX12 = 44;
+  BRICKLET_ARINC429_SDI_SDI0 = 0;
+  BRICKLET_ARINC429_SDI_SDI1 = 1;
+  BRICKLET_ARINC429_SDI_SDI2 = 2;
+  BRICKLET_ARINC429_SDI_SDI3 = 3;
+  BRICKLET_ARINC429_SDI_DATA = 4;
+  BRICKLET_ARINC429_PARITY_DATA = 0;
+  BRICKLET_ARINC429_PARITY_AUTO = 1;
+  BRICKLET_ARINC429_SPEED_HS = 0;
+  BRICKLET_ARINC429_SPEED_LS = 1;
+  BRICKLET_ARINC429_CHANNEL_MODE_PASSIVE = 0;
+  BRICKLET_ARINC429_CHANNEL_MODE_ACTIVE = 1;
+  BRICKLET_ARINC429_CHANNEL_MODE_RUN = 2;
+  BRICKLET_ARINC429_FRAME_STATUS_UPDATE = 0;
+  BRICKLET_ARINC429_FRAME_STATUS_TIMEOUT = 1;
+  BRICKLET_ARINC429_SCHEDULER_JOB_SKIP = 0;
+  BRICKLET_ARINC429_SCHEDULER_JOB_DWELL = 1;
+  BRICKLET_ARINC429_SCHEDULER_JOB_SINGLE = 2;
+  BRICKLET_ARINC429_SCHEDULER_JOB_CYCLIC = 3;
+  BRICKLET_ARINC429_SCHEDULER_JOB_RETRANS_RX1 = 4;
+  BRICKLET_ARINC429_SCHEDULER_JOB_RETRANS_RX2 = 5;
+  BRICKLET_ARINC429_A429_MODE_NORMAL = 0;
+  BRICKLET_ARINC429_A429_MODE_DEBUG = 1;
+  BRICKLET_ARINC429_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_ARINC429_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_ARINC429_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_ARINC429_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_ARINC429_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_ARINC429_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_ARINC429_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_ARINC429_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_ARINC429_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_ARINC429_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_ARINC429_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_ARINC429_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_ARINC429_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_ARINC429_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_ARINC429_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To1OfUInt16 = array [0..1] of word;
+  TArray0To2OfUInt16 = array [0..2] of word;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To31OfUInt8 = array [0..31] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+  TArrayOfUInt8 = array of byte;
+
+  TBrickletARINC429 = class;
+  TBrickletARINC429NotifyHeartbeat = procedure(sender: TBrickletARINC429; const seqNumber: byte; const timestamp: word; const framesProcessed: TArray0To2OfUInt16; const framesLost: TArray0To2OfUInt16) of object;
+  TBrickletARINC429NotifyFrameMessage = procedure(sender: TBrickletARINC429; const channel: byte; const seqNumber: byte; const timestamp: word; const frameStatus: byte; const frame: longword; const age: word) of object;
+
+  /// <summary>
+  ///  TBD
+  /// </summary>
+  TBrickletARINC429 = class(TDevice)
+  private
+    streamMutex: TCriticalSection;
+    heartbeatCallback: TBrickletARINC429NotifyHeartbeat;
+    frameMessageCallback: TBrickletARINC429NotifyFrameMessage;
+  protected
+    procedure CallbackWrapperHeartbeat(const packet: TByteArray); virtual;
+    procedure CallbackWrapperFrameMessage(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Low-level debug function to read the discrete signals from the A429 chip.
+    ///  RX Discretes Bit   9: MB2-1   - pending frame in RX2, PRIO 1 mailbox
+    ///                     8: MB2-2   -                            2 mailbox
+    ///                     7: MB2-3   -                            3 mailbox
+    ///                     6: R2FLAG  -                       FIFO
+    ///                     5: R2INT   -                       FIFO (pulse only)
+    ///                     4: MB1-1   - pending frame in RX1, PRIO 1 mailbox
+    ///                     3: MB1-2   -                            2 mailbox
+    ///                     2: MB1-3   -                            3 mailbox
+    ///                     1: R1FLAG  -                       FIFO
+    ///                     0: R1INT   -                       FIFO (pulse only)
+    ///  TX Discretes Bit 2-7: unused
+    ///                     1: TFULL   - TX buffer full
+    ///                     0: TEMPTY  - TX buffer empty
+    /// </summary>
+    procedure DebugGetDiscretes(out rxDiscretes: word; out txDiscretes: word); virtual;
+
+    /// <summary>
+    ///  Low-level debug function to execute a direct SPI read access on the A429 chip.
+    ///   * OP Code:      code number of the SPI read command
+    ///   * Value Length: number of bytes read
+    ///   * Value Data:   data bytes read
+    ///   * RW Error:     'OK' if the read access was successful, else error code
+    /// </summary>
+    procedure DebugReadRegisterLowLevel(const opCode: byte; out valueLength: byte; out valueData: TArray0To31OfUInt8; out rwError: byte); virtual;
+
+    /// <summary>
+    ///  Low-level debug function to execute a direct SPI read access on the A429 chip.
+    ///   * OP Code:      code number of the SPI read command
+    ///   * Value Length: number of bytes read
+    ///   * Value Data:   data bytes read
+    ///   * RW Error:     'OK' if the read access was successful, else error code
+    /// </summary>
+    procedure DebugReadRegister(const opCode: byte; out value: TArrayOfUInt8; out rwError: byte); virtual;
+
+    /// <summary>
+    ///  Low-level debug function to execute a direct SPI write access on the A429 chip.
+    ///   * OP Code:      code number of the SPI read command
+    ///   * Value Length: number of bytes to write
+    ///   * Value Data:   data bytes to write
+    ///   * RW Error:     'OK' if the write access was successful, else error code
+    /// </summary>
+    function DebugWriteRegisterLowLevel(const opCode: byte; const valueLength: byte; const valueData: TArray0To31OfUInt8): byte; virtual;
+
+    /// <summary>
+    ///  Low-level debug function to execute a direct SPI write access on the A429 chip.
+    ///   * OP Code:      code number of the SPI read command
+    ///   * Value Length: number of bytes to write
+    ///   * Value Data:   data bytes to write
+    ///   * RW Error:     'OK' if the write access was successful, else error code
+    /// </summary>
+    function DebugWriteRegister(const opCode: byte; const value: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Get the TX and RX capabilities and their current usage:
+    ///   * TX Total Scheduler Tasks: total number of task entries in the scheduling table.
+    ///   * TX Used Scheduler Tasks:  number of task entries that are currently in use.
+    ///   * RX Total Frame Filters:   total number of frame filters that can be defined per channel.
+    ///   * RX Used Frame Filters:    number of frame filters that are currently in use per each channel.
+    /// </summary>
+    procedure GetCapabilities(out txTotalSchedulerTasks: word; out txUsedSchedulerTasks: word; out rxTotalFrameFilters: word; out rxUsedFrameFilters: TArray0To1OfUInt16); virtual;
+
+    /// <summary>
+    ///  Set the bricklet heartbeat which reports the statistics counters for processed frames and lost frames.
+    ///  The period is the period with which the <see cref="BrickletARINC429.TBrickletARINC429.OnHeartbeat"/> callback is triggered periodically. A value of 0 turns the callback off.
+    ///  When 'Value Has To Change' is enabled, the heartbeat will only be sent if there is a change in the statistics numbers.
+    /// </summary>
+    procedure SetHeartbeatCallbackConfiguration(const period: byte; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Get the configuration of the bricklet heartbeat reporting the statistics counters.
+    /// </summary>
+    procedure GetHeartbeatCallbackConfiguration(out period: byte; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Set the data transmission properties of the selected channel:
+    ///   * Channel: channel to configure
+    ///   * Parity:  'parity_auto' for automatic parity adjustment, 'parity_data' for parity bit supplied by the application or if used for data.
+    ///   * Speed:   'speed_hs' for high speed mode (100 kbit/s), 'speed_ls' for low speed mode (12.5 kbit/s).
+    ///  When parity set to 'parity_auto', frames received with a parity error will be counted in the lost frames counter but discarded otherwise.
+    /// </summary>
+    procedure SetChannelConfiguration(const channel: byte; const parity: byte; const speed: byte); virtual;
+
+    /// <summary>
+    ///  Get the data transmission properties of the selected channel.
+    /// </summary>
+    procedure GetChannelConfiguration(const channel: byte; out parity: byte; out speed: byte); virtual;
+
+    /// <summary>
+    ///  Set the operating mode of the selected channel:
+    ///   * passive: TX channel: all transmissions are stopped and the hardware interface becomes high-Z. RX channels: all arriving frames will be discarded.
+    ///   * active:  TX channel: Arinc429 frames can be sent via the 'Write Frame Direct' function. RX channels: arriving frames will be processed according to the frame filter and callback settings.
+    ///   * run:     TX channels only: the scheduler will run and transmit frames according to the entries made in the scheduler task table.
+    /// </summary>
+    procedure SetChannelMode(const channel: byte; const mode: byte); virtual;
+
+    /// <summary>
+    ///  Get the operating mode of the selected channel.
+    /// </summary>
+    function GetChannelMode(const channel: byte): byte; virtual;
+
+    /// <summary>
+    ///  Clear all receive filters on the selected RX channel.
+    /// </summary>
+    procedure ClearAllRXFilters(const channel: byte); virtual;
+
+    /// <summary>
+    ///  Clear one receive filter on the selected RX channel.
+    ///   * Channel: selected channel.
+    ///   * Label:   label code of the filter.
+    ///   * SDI:     SDI code of the filter (SDI_SDI0 to SDI_SDI3 or SDI_DATA if SDI bits are used for data).
+    ///   * Success: returns 'True' if the filter was cleared or 'False' if a respective filter was not set.
+    /// </summary>
+    function ClearRXFilter(const channel: byte; const label: byte; const sdi: byte): boolean; virtual;
+
+    /// <summary>
+    ///  Set a receive filter for each label value (0-255) with SDI bits set for data. Any previously existing filters will be overwritten.
+    /// </summary>
+    procedure SetRXStandardFilters(const channel: byte); virtual;
+
+    /// <summary>
+    ///  Set a receive filter on the selected channel:
+    ///   * Channel: selected channel.
+    ///   * Label:   label code for the filter.
+    ///   * SDI:     SDI code for the filter (SDI_SDI0 to SDI_SDI3 or SDI_DATA if SDI bits are used for data).
+    ///   * Success: returns 'True' if the filter was set or 'False' if a respective filter could not be set up (e.g. because label + SDI collides with an already existing filter or all available filters are used up).
+    /// </summary>
+    function SetRXFilter(const channel: byte; const label: byte; const sdi: byte): boolean; virtual;
+
+    /// <summary>
+    ///  Query if a specific filter is set up or not:
+    ///   * Channel:    channel to query.
+    ///   * Label:      label code to query for.
+    ///   * SDI:        SDI usage to query for (SDI_SDI0 to SDI_SDI3 or SDI_DATA if SDI bits shall be used for data).
+    ///   * Configured: returns 'True' if the inquired filter exists, else 'False'.
+    /// </summary>
+    function GetRXFilter(const channel: byte; const label: byte; const sdi: byte): boolean; virtual;
+
+    /// <summary>
+    ///  Direct read of an Arinc429 frame, i.e. without using the callback mechanism.
+    ///  In order to be able to do a direct read of a frame with a certain label and SDI combination, a respective receive filter needs to be set up beforehand.
+    ///   * Channel: RX channel to read from.
+    ///   * Label:   label code of the frame to read.
+    ///   * SDI:     SDI code of the frame to read (SDI_SDI0 to SDI_SDI3 or SDI_DATA if SDI bits are used for data).
+    ///   * Status:  returns 'True' if a respective frame was received, else 'False'.
+    ///   * Frame:   returns the complete Arinc429 frame including the label and SDI bits. If 'parity_auto' is set for the channel, the parity bit will always come as 0.
+    ///   * Age:     time in milliseconds since this frame (label + SDI combination) was received last. If not received for so far or after a previous timeout, 60000 or the timeout value set with the 'Set RX Callback Configuration' function will be returned.
+    /// </summary>
+    procedure ReadFrame(const channel: byte; const label: byte; const sdi: byte; out status: boolean; out frame: longword; out age: word); virtual;
+
+    /// <summary>
+    ///  Set the configuration of the Arinc429 frame reception callback:
+    ///   * Channel:             selected RX channel.
+    ///   * Enabled:             select 'True' for activating the frame callbacks and 'False' for deactivating them.
+    ///   * Value Has To Change: select 'True' if callbacks shall only be sent for frames whose data have changed. With 'False' a callback will be sent on every frame reception.
+    ///   * Timeout:             time period for all frames (label and SDI combinations) on this channel.
+    ///  
+    ///  Despite on frame reception, a callback is also generated if a frame encounters a timeout, i.e. if it is not periodically received again before the set timeout period has expired.
+    ///  In order to have callbacks being generated at all, respective receive filters need to be set up.
+    /// </summary>
+    procedure SetRXCallbackConfiguration(const channel: byte; const enabled: boolean; const valueHasToChange: boolean; const timeout: word); virtual;
+
+    /// <summary>
+    ///  Get the configuration of the frame reception callback.
+    /// </summary>
+    procedure GetRXCallbackConfiguration(const channel: byte; out enabled: boolean; out valueHasToChange: boolean; out timeout: word); virtual;
+
+    /// <summary>
+    ///  Immediately transmit an Arinc429 frame:
+    ///   * Channel: selected transmit channel.
+    ///   * frame:   complete Arinc429 frame including the label and SDI bits. If 'parity_auto' is set for the channel, the parity bit will be set (adjusted) automatically.
+    /// </summary>
+    procedure WriteFrameDirect(const channel: byte; const frame: longword); virtual;
+
+    /// <summary>
+    ///  Set or update an Arinc429 frame that is transmitted by the scheduler using the task types 'Single' and 'Cyclic'.
+    ///   * Channel:     selected transmit channel.
+    ///   * Frame Index: index number that will be used in the transmit scheduler task table to refer to this frame.
+    ///   * frame:       complete Arinc429 frame including the label and SDI bits. If 'parity_auto' is set for the channel, the parity bit will be set (adjusted) automatically.
+    /// </summary>
+    procedure WriteFrameScheduled(const channel: byte; const frameIndex: word; const frame: longword); virtual;
+
+    /// <summary>
+    ///  Clear a range of transmit scheduler task table entries:
+    ///   * Channel: selected TX channel.
+    ///   * First:   index of the first table entry to be cleared.
+    ///   * Last:    index of the last  table entry to be cleared.
+    ///  To clear a single entry, set 'First' and 'Last' to the one index of the one entry to be cleared.
+    /// </summary>
+    procedure ClearScheduleEntries(const channel: byte; const taskIndexFirst: word; const taskIndexLast: word); virtual;
+
+    /// <summary>
+    ///  Set an entry in the transmit scheduler task table:
+    ///   * Channel:     selected TX channel
+    ///   * Task Index:  index number of the task, the scheduler processes the task table in ascending order of these index numbers.
+    ///   * Job:         activity assigned to this entry, see below.
+    ///   * Frame Index: frame assigned to this task, either the 'Frame Index' used along with the :func: `Write Frame Scheduled` or the extended label (label + SDI) in case of RX1/RX2 retransmits.
+    ///   * Dwell Time:  time to wait before executing the next task table entry (0-250 milliseconds).
+    ///  
+    ///  When the scheduler is set to 'run' mode via the <see cref="BrickletARINC429.TBrickletARINC429.SetChannelMode"/>, it continuously loops through the task table and executes the assigned tasks.
+    ///  It starts with the task stored at task index 0.
+    ///  The scheduler can execute the following activity types (jobs):
+    ///   * Skip:        the task is skipped, i.e. no frame is transmitted and no dwelling is done. The frame index and dwell time are not used.
+    ///   * Dwell        the scheduler executes the dwelling but does not transmit any frame. The frame index is not used.
+    ///   * Single:      the scheduler transmits the referenced frame, but only once. On subsequent executions the frame is not sent until it is renewed via the <see cref="BrickletARINC429.TBrickletARINC429.WriteFrameScheduled"/>, then the process repeats.
+    ///   * Cyclic:      the scheduler transmits the referenced frame and executed the dwelling on each round.
+    ///   * Retrans RX1: the scheduler retransmits a frame that was previously received on the RX1 channel. The frame to send is referenced by setting the 'Frame Index' to its extended label code, which is a 10 bit number made of the label code in the lower bits and the two SDI bits in the upper bits. If the SDI bits are used for data, set the SDI bits to zero. As long as the referenced frame was not received yet, or if it is in timeout, no frame will be sent.
+    ///   * Retrans RX2: same as before, but for frames received on the RX2 channel.
+    /// </summary>
+    procedure SetScheduleEntry(const channel: byte; const taskIndex: word; const job: byte; const frameIndex: word; const dwellTime: byte); virtual;
+
+    /// <summary>
+    ///  Get a transmit scheduler task table entry.
+    /// </summary>
+    procedure GetScheduleEntry(const channel: byte; const taskIndex: word; out job: byte; out frameIndex: word; out frame: longword; out dwellTime: byte); virtual;
+
+    /// <summary>
+    ///  Reset the A429 bricklet. The bricklet will restart in the selected mode:
+    ///   * 'Normal': normal operating mode with all high-level Arinc429 frame processing being executed.
+    ///   * 'Debug':  debug mode with all high-level processing suspended, for use in conjunction with the low-level debug functions.
+    /// </summary>
+    procedure ResetA429(const mode: byte); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletARINC429.TBrickletARINC429.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletARINC429.TBrickletARINC429.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletARINC429.TBrickletARINC429.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletARINC429.TBrickletARINC429.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletARINC429.TBrickletARINC429.SetHeartbeatCallbackConfiguration"/>. It reports the statistics counters
+    ///  for processed frames and lost frames for all TX and RX channels.
+    ///   * Seq Number:       running counter that is incremented with each callback, starting with 0 and rolling over after 255 to 1. It will restart from 0 whenever the heartbeat is turned off and on again. This counter can be used to detect lost callbacks.
+    ///   * Timestamp:        running counter that is incremented on every millisecond, starting when the bricklet is powered up and rolling over after 65535 to 0. This counter can be used to measure the relative timing between events.
+    ///   * Frames Processed: number of Arinc429 frames that are transmitted or received on the respective channels TX, RX1 and RX2.
+    ///   * Frames Lost:      TX channel: number of Arinc429 frames that could not be transmitted due to a full transmit buffer, RX channels: number of received Arinc429 frames that could not be reported due to a full callback buffer.
+    /// </summary>
+    property OnHeartbeat: TBrickletARINC429NotifyHeartbeat read heartbeatCallback write heartbeatCallback;
+
+    /// <summary>
+    ///  This callback is triggered according to the configuration set by <see cref="BrickletARINC429.TBrickletARINC429.SetRXCallbackConfiguration"/>.
+    ///   * Channel:      RX channel on which the frame was received.
+    ///   * Seq Number:   running counter that is incremented with each callback, starting with 0 and rolling over after 255 to 1. It will restart from 0 whenever the callback is turned off and on again. This counter can be used to detect lost callbacks.
+    ///   * Timestamp:    running counter that is incremented on every millisecond, starting when the bricklet is powered up and rolling over after 65535 to 0. This counter can be used to measure the relative timing between frame receptions.
+    ///   * Frame Status: 'update' signals that a new frame (new data) was received, whereas 'timeout' signals that the frame (label and SDI combination) encountered the timeout state.
+    ///   * Frame:        the complete Arinc429 frame including the label and SDI bits. If 'parity_auto' is set for the channel, the parity bit will always come as 0.
+    ///   * Age:          time in milliseconds since this frame (label + SDI combination) was received last. If not received for so far or after a previous timeout, 60000 or the timeout value set with the 'Set RX Callback Configuration' function will be returned.
+    /// </summary>
+    property OnFrameMessage: TBrickletARINC429NotifyFrameMessage read frameMessageCallback write frameMessageCallback;
+  end;
+
+implementation
+
+constructor TBrickletARINC429.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_ARINC429_DEVICE_IDENTIFIER, BRICKLET_ARINC429_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_ARINC429_FUNCTION_DEBUG_GET_DISCRETES] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_DEBUG_READ_REGISTER_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_DEBUG_WRITE_REGISTER_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_CAPABILITIES] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_SET_HEARTBEAT_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_HEARTBEAT_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_SET_CHANNEL_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_CHANNEL_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_SET_CHANNEL_MODE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_CHANNEL_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_CLEAR_ALL_RX_FILTERS] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_CLEAR_RX_FILTER] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_SET_RX_STANDARD_FILTERS] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_SET_RX_FILTER] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_RX_FILTER] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_READ_FRAME] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_SET_RX_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_RX_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_WRITE_FRAME_DIRECT] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_WRITE_FRAME_SCHEDULED] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_CLEAR_SCHEDULE_ENTRIES] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_SET_SCHEDULE_ENTRY] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_SCHEDULE_ENTRY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_RESET_A429] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ARINC429_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  streamMutex := TCriticalSection.Create;
+
+  callbackWrappers[BRICKLET_ARINC429_CALLBACK_HEARTBEAT] := {$ifdef FPC}@{$endif}CallbackWrapperHeartbeat;
+  callbackWrappers[BRICKLET_ARINC429_CALLBACK_FRAME_MESSAGE] := {$ifdef FPC}@{$endif}CallbackWrapperFrameMessage;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletARINC429.DebugGetDiscretes(out rxDiscretes: word; out txDiscretes: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_DEBUG_GET_DISCRETES, 8);
+  response := SendRequest(request, 12);
+  rxDiscretes := LEConvertUInt16From(8, response);
+  txDiscretes := LEConvertUInt16From(10, response);
+end;
+
+procedure TBrickletARINC429.DebugReadRegisterLowLevel(const opCode: byte; out valueLength: byte; out valueData: TArray0To31OfUInt8; out rwError: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_DEBUG_READ_REGISTER_LOW_LEVEL, 9);
+  LEConvertUInt8To(opCode, 8, request);
+  response := SendRequest(request, 42);
+  valueLength := LEConvertUInt8From(8, response);
+  for i := 0 to 31 do valueData[i] := LEConvertUInt8From(9 + (i * 1), response);
+  rwError := LEConvertUInt8From(41, response);
+end;
+
+procedure TBrickletARINC429.DebugReadRegister(const opCode: byte; out value: TArrayOfUInt8; out rwError: byte);
+var
+  valueLength: byte;
+  valueData: TArray0To31OfUInt8;
+begin
+  DebugReadRegisterLowLevel(opCode, valueLength, valueData, rwError);
+  SetLength(value, valueLength);
+  Move(valueData, value[0], SizeOf(byte) * valueLength);
+end;
+
+function TBrickletARINC429.DebugWriteRegisterLowLevel(const opCode: byte; const valueLength: byte; const valueData: TArray0To31OfUInt8): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_DEBUG_WRITE_REGISTER_LOW_LEVEL, 42);
+  LEConvertUInt8To(opCode, 8, request);
+  LEConvertUInt8To(valueLength, 9, request);
+  for i := 0 to Length(valueData) - 1 do LEConvertUInt8To(valueData[i], 10 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletARINC429.DebugWriteRegister(const opCode: byte; const value: array of byte): byte;
+var
+  valueLength: byte;
+  valueData: TArray0To31OfUInt8;
+begin
+  if (Length(value) > 32) then begin
+    raise EInvalidParameterException.Create('Value can be at most 32 items long');
+  end;
+
+  valueLength := Length(value);
+
+  FillChar(valueData[0], SizeOf(byte) * 32, 0);
+  Move(value[0], valueData[0], SizeOf(byte) * valueLength);
+
+  result := DebugWriteRegisterLowLevel(opCode, valueLength, valueData);
+end;
+
+procedure TBrickletARINC429.GetCapabilities(out txTotalSchedulerTasks: word; out txUsedSchedulerTasks: word; out rxTotalFrameFilters: word; out rxUsedFrameFilters: TArray0To1OfUInt16);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_CAPABILITIES, 8);
+  response := SendRequest(request, 18);
+  txTotalSchedulerTasks := LEConvertUInt16From(8, response);
+  txUsedSchedulerTasks := LEConvertUInt16From(10, response);
+  rxTotalFrameFilters := LEConvertUInt16From(12, response);
+  for i := 0 to 1 do rxUsedFrameFilters[i] := LEConvertUInt16From(14 + (i * 2), response);
+end;
+
+procedure TBrickletARINC429.SetHeartbeatCallbackConfiguration(const period: byte; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_SET_HEARTBEAT_CALLBACK_CONFIGURATION, 10);
+  LEConvertUInt8To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletARINC429.GetHeartbeatCallbackConfiguration(out period: byte; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_HEARTBEAT_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  period := LEConvertUInt8From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(9, response);
+end;
+
+procedure TBrickletARINC429.SetChannelConfiguration(const channel: byte; const parity: byte; const speed: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_SET_CHANNEL_CONFIGURATION, 11);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt8To(parity, 9, request);
+  LEConvertUInt8To(speed, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletARINC429.GetChannelConfiguration(const channel: byte; out parity: byte; out speed: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_CHANNEL_CONFIGURATION, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 10);
+  parity := LEConvertUInt8From(8, response);
+  speed := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletARINC429.SetChannelMode(const channel: byte; const mode: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_SET_CHANNEL_MODE, 10);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt8To(mode, 9, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletARINC429.GetChannelMode(const channel: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_CHANNEL_MODE, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletARINC429.ClearAllRXFilters(const channel: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_CLEAR_ALL_RX_FILTERS, 9);
+  LEConvertUInt8To(channel, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletARINC429.ClearRXFilter(const channel: byte; const label: byte; const sdi: byte): boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_CLEAR_RX_FILTER, 11);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt8To(label, 9, request);
+  LEConvertUInt8To(sdi, 10, request);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletARINC429.SetRXStandardFilters(const channel: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_SET_RX_STANDARD_FILTERS, 9);
+  LEConvertUInt8To(channel, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletARINC429.SetRXFilter(const channel: byte; const label: byte; const sdi: byte): boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_SET_RX_FILTER, 11);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt8To(label, 9, request);
+  LEConvertUInt8To(sdi, 10, request);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+function TBrickletARINC429.GetRXFilter(const channel: byte; const label: byte; const sdi: byte): boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_RX_FILTER, 11);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt8To(label, 9, request);
+  LEConvertUInt8To(sdi, 10, request);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletARINC429.ReadFrame(const channel: byte; const label: byte; const sdi: byte; out status: boolean; out frame: longword; out age: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_READ_FRAME, 11);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt8To(label, 9, request);
+  LEConvertUInt8To(sdi, 10, request);
+  response := SendRequest(request, 15);
+  status := LEConvertBooleanFrom(8, response);
+  frame := LEConvertUInt32From(9, response);
+  age := LEConvertUInt16From(13, response);
+end;
+
+procedure TBrickletARINC429.SetRXCallbackConfiguration(const channel: byte; const enabled: boolean; const valueHasToChange: boolean; const timeout: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_SET_RX_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertBooleanTo(enabled, 9, request);
+  LEConvertBooleanTo(valueHasToChange, 10, request);
+  LEConvertUInt16To(timeout, 11, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletARINC429.GetRXCallbackConfiguration(const channel: byte; out enabled: boolean; out valueHasToChange: boolean; out timeout: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_RX_CALLBACK_CONFIGURATION, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 12);
+  enabled := LEConvertBooleanFrom(8, response);
+  valueHasToChange := LEConvertBooleanFrom(9, response);
+  timeout := LEConvertUInt16From(10, response);
+end;
+
+procedure TBrickletARINC429.WriteFrameDirect(const channel: byte; const frame: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_WRITE_FRAME_DIRECT, 13);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt32To(frame, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletARINC429.WriteFrameScheduled(const channel: byte; const frameIndex: word; const frame: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_WRITE_FRAME_SCHEDULED, 15);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt16To(frameIndex, 9, request);
+  LEConvertUInt32To(frame, 11, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletARINC429.ClearScheduleEntries(const channel: byte; const taskIndexFirst: word; const taskIndexLast: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_CLEAR_SCHEDULE_ENTRIES, 13);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt16To(taskIndexFirst, 9, request);
+  LEConvertUInt16To(taskIndexLast, 11, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletARINC429.SetScheduleEntry(const channel: byte; const taskIndex: word; const job: byte; const frameIndex: word; const dwellTime: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_SET_SCHEDULE_ENTRY, 15);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt16To(taskIndex, 9, request);
+  LEConvertUInt8To(job, 11, request);
+  LEConvertUInt16To(frameIndex, 12, request);
+  LEConvertUInt8To(dwellTime, 14, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletARINC429.GetScheduleEntry(const channel: byte; const taskIndex: word; out job: byte; out frameIndex: word; out frame: longword; out dwellTime: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_SCHEDULE_ENTRY, 11);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt16To(taskIndex, 9, request);
+  response := SendRequest(request, 16);
+  job := LEConvertUInt8From(8, response);
+  frameIndex := LEConvertUInt16From(9, response);
+  frame := LEConvertUInt32From(11, response);
+  dwellTime := LEConvertUInt8From(15, response);
+end;
+
+procedure TBrickletARINC429.ResetA429(const mode: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_RESET_A429, 9);
+  LEConvertUInt8To(mode, 8, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletARINC429.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletARINC429.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletARINC429.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletARINC429.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletARINC429.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletARINC429.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletARINC429.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletARINC429.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletARINC429.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletARINC429.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletARINC429.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletARINC429.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ARINC429_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletARINC429.CallbackWrapperHeartbeat(const packet: TByteArray);
+var seqNumber: byte; timestamp: word; framesProcessed: TArray0To2OfUInt16; framesLost: TArray0To2OfUInt16; i: longint;
+begin
+  if (Length(packet) <> 23) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  seqNumber := LEConvertUInt8From(8, packet);
+  timestamp := LEConvertUInt16From(9, packet);
+  for i := 0 to 2 do framesProcessed[i] := LEConvertUInt16From(11 + (i * 2), packet);
+  for i := 0 to 2 do framesLost[i] := LEConvertUInt16From(17 + (i * 2), packet);
+  if (Assigned(heartbeatCallback)) then begin
+    heartbeatCallback(self, seqNumber, timestamp, framesProcessed, framesLost);
+  end;
+end;
+
+procedure TBrickletARINC429.CallbackWrapperFrameMessage(const packet: TByteArray);
+var channel: byte; seqNumber: byte; timestamp: word; frameStatus: byte; frame: longword; age: word;
+begin
+  if (Length(packet) <> 19) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  channel := LEConvertUInt8From(8, packet);
+  seqNumber := LEConvertUInt8From(9, packet);
+  timestamp := LEConvertUInt16From(10, packet);
+  frameStatus := LEConvertUInt8From(12, packet);
+  frame := LEConvertUInt32From(13, packet);
+  age := LEConvertUInt16From(17, packet);
+  if (Assigned(frameMessageCallback)) then begin
+    frameMessageCallback(self, channel, seqNumber, timestamp, frameStatus, frame, age);
+  end;
+end;
+
+end.
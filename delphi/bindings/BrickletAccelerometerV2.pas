@@ -0,0 +1,759 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletAccelerometerV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_ACCELEROMETER_V2_DEVICE_IDENTIFIER = 2130;
+  BRICKLET_ACCELEROMETER_V2_DEVICE_DISPLAY_NAME = 'Accelerometer Bricklet 2.0';
+
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_ACCELERATION = 1;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_CONFIGURATION = 2;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_CONFIGURATION = 3;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION = 4;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION = 5;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_INFO_LED_CONFIG = 6;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_INFO_LED_CONFIG = 7;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_CONTINUOUS_ACCELERATION_CONFIGURATION = 9;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_CONTINUOUS_ACCELERATION_CONFIGURATION = 10;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_FILTER_CONFIGURATION = 13;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_FILTER_CONFIGURATION = 14;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_RESET = 243;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_ACCELEROMETER_V2_CALLBACK_ACCELERATION = 8;
+  BRICKLET_ACCELEROMETER_V2_CALLBACK_CONTINUOUS_ACCELERATION_16_BIT = 11;
+  BRICKLET_ACCELEROMETER_V2_CALLBACK_CONTINUOUS_ACCELERATION_8_BIT = 12;
+
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_0_781HZ = 0;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_1_563HZ = 1;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_3_125HZ = 2;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_6_2512HZ = 3;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_12_5HZ = 4;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_25HZ = 5;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_50HZ = 6;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_100HZ = 7;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_200HZ = 8;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_400HZ = 9;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_800HZ = 10;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_1600HZ = 11;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_3200HZ = 12;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_6400HZ = 13;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_12800HZ = 14;
+  BRICKLET_ACCELEROMETER_V2_DATA_RATE_25600HZ = 15;
+  BRICKLET_ACCELEROMETER_V2_FULL_SCALE_2G = 0;
+  BRICKLET_ACCELEROMETER_V2_FULL_SCALE_4G = 1;
+  BRICKLET_ACCELEROMETER_V2_FULL_SCALE_8G = 2;
+  BRICKLET_ACCELEROMETER_V2_INFO_LED_CONFIG_OFF = 0;
+  BRICKLET_ACCELEROMETER_V2_INFO_LED_CONFIG_ON = 1;
+  BRICKLET_ACCELEROMETER_V2_INFO_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_ACCELEROMETER_V2_RESOLUTION_8BIT = 0;
+  BRICKLET_ACCELEROMETER_V2_RESOLUTION_16BIT = 1;
+  BRICKLET_ACCELEROMETER_V2_IIR_BYPASS_APPLIED = 0;
+  BRICKLET_ACCELEROMETER_V2_IIR_BYPASS_BYPASSED = 1;
+  BRICKLET_ACCELEROMETER_V2_LOW_PASS_FILTER_NINTH = 0;
+  BRICKLET_ACCELEROMETER_V2_LOW_PASS_FILTER_HALF = 1;
+  BRICKLET_ACCELEROMETER_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_ACCELEROMETER_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_ACCELEROMETER_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_ACCELEROMETER_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_ACCELEROMETER_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_ACCELEROMETER_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_ACCELEROMETER_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_ACCELEROMETER_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_ACCELEROMETER_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_ACCELEROMETER_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_ACCELEROMETER_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_ACCELEROMETER_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_ACCELEROMETER_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_ACCELEROMETER_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_ACCELEROMETER_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To29OfInt16 = array [0..29] of smallint;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To59OfInt8 = array [0..59] of shortint;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletAccelerometerV2 = class;
+  TBrickletAccelerometerV2NotifyAcceleration = procedure(sender: TBrickletAccelerometerV2; const x: longint; const y: longint; const z: longint) of object;
+  TBrickletAccelerometerV2NotifyContinuousAcceleration16Bit = procedure(sender: TBrickletAccelerometerV2; const acceleration: TArray0To29OfInt16) of object;
+  TBrickletAccelerometerV2NotifyContinuousAcceleration8Bit = procedure(sender: TBrickletAccelerometerV2; const acceleration: TArray0To59OfInt8) of object;
+
+  /// <summary>
+  ///  Measures acceleration in three axis
+  /// </summary>
+  TBrickletAccelerometerV2 = class(TDevice)
+  private
+    accelerationCallback: TBrickletAccelerometerV2NotifyAcceleration;
+    continuousAcceleration16BitCallback: TBrickletAccelerometerV2NotifyContinuousAcceleration16Bit;
+    continuousAcceleration8BitCallback: TBrickletAccelerometerV2NotifyContinuousAcceleration8Bit;
+  protected
+    procedure CallbackWrapperAcceleration(const packet: TByteArray); virtual;
+    procedure CallbackWrapperContinuousAcceleration16Bit(const packet: TByteArray); virtual;
+    procedure CallbackWrapperContinuousAcceleration8Bit(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the acceleration in x, y and z direction. The values
+    ///  are given in gₙ/10000 (1gₙ = 9.80665m/s²). The range is
+    ///  configured with <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetConfiguration"/>.
+    ///  
+    ///  If you want to get the acceleration periodically, it is recommended
+    ///  to use the <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.OnAcceleration"/> callback and set the period with
+    ///  <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetAccelerationCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAcceleration(out x: longint; out y: longint; out z: longint); virtual;
+
+    /// <summary>
+    ///  Configures the data rate and full scale range.
+    ///  Possible values are:
+    ///  
+    ///  * Data rate of 0.781Hz to 25600Hz.
+    ///  * Full scale range of ±2g up to ±8g.
+    ///  
+    ///  Decreasing data rate or full scale range will also decrease the noise on
+    ///  the data.
+    /// </summary>
+    procedure SetConfiguration(const dataRate: byte; const fullScale: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetConfiguration"/>.
+    /// </summary>
+    procedure GetConfiguration(out dataRate: byte; out fullScale: byte); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.OnAcceleration"/>
+    ///  callback is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  If this callback is enabled, the <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.OnContinuousAcceleration16Bit"/> callback
+    ///  and <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.OnContinuousAcceleration8Bit"/> callback will automatically be disabled.
+    /// </summary>
+    procedure SetAccelerationCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by
+    ///  <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetAccelerationCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAccelerationCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Configures the info LED (marked as "Force" on the Bricklet) to be either turned off,
+    ///  turned on, or blink in heartbeat mode.
+    /// </summary>
+    procedure SetInfoLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the LED configuration as set by <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetInfoLEDConfig"/>
+    /// </summary>
+    function GetInfoLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  For high throughput of acceleration data (&gt; 1000Hz) you have to use the
+    ///  <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.OnContinuousAcceleration16Bit"/> or <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.OnContinuousAcceleration8Bit"/>
+    ///  callbacks.
+    ///  
+    ///  You can enable the callback for each axis (x, y, z) individually and choose a
+    ///  resolution of 8 bit or 16 bit.
+    ///  
+    ///  If at least one of the axis is enabled and the resolution is set to 8 bit,
+    ///  the <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.OnContinuousAcceleration8Bit"/> callback is activated. If at least
+    ///  one of the axis is enabled and the resolution is set to 16 bit,
+    ///  the <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.OnContinuousAcceleration16Bit"/> callback is activated.
+    ///  
+    ///  The returned values are raw ADC data. If you want to put this data into
+    ///  a FFT to determine the occurrences of specific frequencies we recommend
+    ///  that you use the data as is. It has all of the ADC noise in it. This noise
+    ///  looks like pure noise at first glance, but it might still have some frequnecy
+    ///  information in it that can be utilized by the FFT.
+    ///  
+    ///  Otherwise you have to use the following formulas that depend on the configured
+    ///  resolution (8/16 bit) and the full scale range (see <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetConfiguration"/>) to calculate
+    ///  the data in gₙ/10000 (same unit that is returned by <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.GetAcceleration"/>):
+    ///  
+    ///  * 16 bit, full scale 2g: acceleration = value * 625 / 1024
+    ///  * 16 bit, full scale 4g: acceleration = value * 1250 / 1024
+    ///  * 16 bit, full scale 8g: acceleration = value * 2500 / 1024
+    ///  
+    ///  If a resolution of 8 bit is used, only the 8 most significant bits will be
+    ///  transferred, so you can use the following formulas:
+    ///  
+    ///  * 8 bit, full scale 2g: acceleration = value * 256 * 625 / 1024
+    ///  * 8 bit, full scale 4g: acceleration = value * 256 * 1250 / 1024
+    ///  * 8 bit, full scale 8g: acceleration = value * 256 * 2500 / 1024
+    ///  
+    ///  If no axis is enabled, both callbacks are disabled. If one of the continuous
+    ///  callbacks is enabled, the <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.OnAcceleration"/> callback is disabled.
+    ///  
+    ///  The maximum throughput depends on the exact configuration:
+    ///  
+    ///  <code>
+    ///   "Number of axis enabled", "Throughput 8 bit", "Throughout 16 bit"
+    ///  
+    ///   "1", "25600Hz", "25600Hz"
+    ///   "2", "25600Hz", "15000Hz"
+    ///   "3", "20000Hz", "10000Hz"
+    ///  </code>
+    /// </summary>
+    procedure SetContinuousAccelerationConfiguration(const enableX: boolean; const enableY: boolean; const enableZ: boolean; const resolution: byte); virtual;
+
+    /// <summary>
+    ///  Returns the continuous acceleration configuration as set by
+    ///  <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetContinuousAccelerationConfiguration"/>.
+    /// </summary>
+    procedure GetContinuousAccelerationConfiguration(out enableX: boolean; out enableY: boolean; out enableZ: boolean; out resolution: byte); virtual;
+
+    /// <summary>
+    ///  Configures IIR Bypass filter mode and low pass filter roll off corner frequency.
+    ///  
+    ///  The filter can be applied or bypassed and the corner frequency can be
+    ///  half or a ninth of the output data rate.
+    ///  
+    ///  .. image:: /Images/Bricklets/bricklet_accelerometer_v2_filter.png
+    ///     :scale: 100 %
+    ///     :alt: Accelerometer filter
+    ///     :align: center
+    ///     :target: ../../_images/Bricklets/bricklet_accelerometer_v2_filter.png
+    ///  
+    ///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+    /// </summary>
+    procedure SetFilterConfiguration(const iirBypass: byte; const lowPassFilter: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetFilterConfiguration"/>.
+    ///  
+    ///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+    /// </summary>
+    procedure GetFilterConfiguration(out iirBypass: byte; out lowPassFilter: byte); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetAccelerationCallbackConfiguration"/>.
+    ///  
+    ///  The parameters are the same as <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.GetAcceleration"/>.
+    /// </summary>
+    property OnAcceleration: TBrickletAccelerometerV2NotifyAcceleration read accelerationCallback write accelerationCallback;
+
+    /// <summary>
+    ///  Returns 30 acceleration values with 16 bit resolution. The data rate can
+    ///  be configured with <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetConfiguration"/> and this callback can be
+    ///  enabled with <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetContinuousAccelerationConfiguration"/>.
+    ///  
+    ///  The returned values are raw ADC data. If you want to put this data into
+    ///  a FFT to determine the occurrences of specific frequencies we recommend
+    ///  that you use the data as is. It has all of the ADC noise in it. This noise
+    ///  looks like pure noise at first glance, but it might still have some frequnecy
+    ///  information in it that can be utilized by the FFT.
+    ///  
+    ///  Otherwise you have to use the following formulas that depend on the
+    ///  full scale range (see <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetConfiguration"/>) to calculate
+    ///  the data in gₙ/10000 (same unit that is returned by <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.GetAcceleration"/>):
+    ///  
+    ///  * Full scale 2g: acceleration = value * 625 / 1024
+    ///  * Full scale 4g: acceleration = value * 1250 / 1024
+    ///  * Full scale 8g: acceleration = value * 2500 / 1024
+    ///  
+    ///  The data is formated in the sequence "x, y, z, x, y, z, ..." depending on
+    ///  the enabled axis. Examples:
+    ///  
+    ///  * x, y, z enabled: "x, y, z, ..." 10x repeated
+    ///  * x, z enabled: "x, z, ..." 15x repeated
+    ///  * y enabled: "y, ..." 30x repeated
+    /// </summary>
+    property OnContinuousAcceleration16Bit: TBrickletAccelerometerV2NotifyContinuousAcceleration16Bit read continuousAcceleration16BitCallback write continuousAcceleration16BitCallback;
+
+    /// <summary>
+    ///  Returns 60 acceleration values with 8 bit resolution. The data rate can
+    ///  be configured with <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetConfiguration"/> and this callback can be
+    ///  enabled with <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetContinuousAccelerationConfiguration"/>.
+    ///  
+    ///  The returned values are raw ADC data. If you want to put this data into
+    ///  a FFT to determine the occurrences of specific frequencies we recommend
+    ///  that you use the data as is. It has all of the ADC noise in it. This noise
+    ///  looks like pure noise at first glance, but it might still have some frequnecy
+    ///  information in it that can be utilized by the FFT.
+    ///  
+    ///  Otherwise you have to use the following formulas that depend on the
+    ///  full scale range (see <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.SetConfiguration"/>) to calculate
+    ///  the data in gₙ/10000 (same unit that is returned by <see cref="BrickletAccelerometerV2.TBrickletAccelerometerV2.GetAcceleration"/>):
+    ///  
+    ///  * Full scale 2g: acceleration = value * 256 * 625 / 1024
+    ///  * Full scale 4g: acceleration = value * 256 * 1250 / 1024
+    ///  * Full scale 8g: acceleration = value * 256 * 2500 / 1024
+    ///  
+    ///  The data is formated in the sequence "x, y, z, x, y, z, ..." depending on
+    ///  the enabled axis. Examples:
+    ///  
+    ///  * x, y, z enabled: "x, y, z, ..." 20x repeated
+    ///  * x, z enabled: "x, z, ..." 30x repeated
+    ///  * y enabled: "y, ..." 60x repeated
+    /// </summary>
+    property OnContinuousAcceleration8Bit: TBrickletAccelerometerV2NotifyContinuousAcceleration8Bit read continuousAcceleration8BitCallback write continuousAcceleration8BitCallback;
+  end;
+
+implementation
+
+constructor TBrickletAccelerometerV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_ACCELEROMETER_V2_DEVICE_IDENTIFIER, BRICKLET_ACCELEROMETER_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 1;
+
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_ACCELERATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_INFO_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_INFO_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_CONTINUOUS_ACCELERATION_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_CONTINUOUS_ACCELERATION_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_FILTER_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_FILTER_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_ACCELEROMETER_V2_CALLBACK_ACCELERATION] := {$ifdef FPC}@{$endif}CallbackWrapperAcceleration;
+  callbackWrappers[BRICKLET_ACCELEROMETER_V2_CALLBACK_CONTINUOUS_ACCELERATION_16_BIT] := {$ifdef FPC}@{$endif}CallbackWrapperContinuousAcceleration16Bit;
+  callbackWrappers[BRICKLET_ACCELEROMETER_V2_CALLBACK_CONTINUOUS_ACCELERATION_8_BIT] := {$ifdef FPC}@{$endif}CallbackWrapperContinuousAcceleration8Bit;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletAccelerometerV2.GetAcceleration(out x: longint; out y: longint; out z: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_ACCELERATION, 8);
+  response := SendRequest(request, 20);
+  x := LEConvertInt32From(8, response);
+  y := LEConvertInt32From(12, response);
+  z := LEConvertInt32From(16, response);
+end;
+
+procedure TBrickletAccelerometerV2.SetConfiguration(const dataRate: byte; const fullScale: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_CONFIGURATION, 10);
+  LEConvertUInt8To(dataRate, 8, request);
+  LEConvertUInt8To(fullScale, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAccelerometerV2.GetConfiguration(out dataRate: byte; out fullScale: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  dataRate := LEConvertUInt8From(8, response);
+  fullScale := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletAccelerometerV2.SetAccelerationCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAccelerometerV2.GetAccelerationCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletAccelerometerV2.SetInfoLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_INFO_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAccelerometerV2.GetInfoLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_INFO_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletAccelerometerV2.SetContinuousAccelerationConfiguration(const enableX: boolean; const enableY: boolean; const enableZ: boolean; const resolution: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_CONTINUOUS_ACCELERATION_CONFIGURATION, 12);
+  LEConvertBooleanTo(enableX, 8, request);
+  LEConvertBooleanTo(enableY, 9, request);
+  LEConvertBooleanTo(enableZ, 10, request);
+  LEConvertUInt8To(resolution, 11, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAccelerometerV2.GetContinuousAccelerationConfiguration(out enableX: boolean; out enableY: boolean; out enableZ: boolean; out resolution: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_CONTINUOUS_ACCELERATION_CONFIGURATION, 8);
+  response := SendRequest(request, 12);
+  enableX := LEConvertBooleanFrom(8, response);
+  enableY := LEConvertBooleanFrom(9, response);
+  enableZ := LEConvertBooleanFrom(10, response);
+  resolution := LEConvertUInt8From(11, response);
+end;
+
+procedure TBrickletAccelerometerV2.SetFilterConfiguration(const iirBypass: byte; const lowPassFilter: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_FILTER_CONFIGURATION, 10);
+  LEConvertUInt8To(iirBypass, 8, request);
+  LEConvertUInt8To(lowPassFilter, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAccelerometerV2.GetFilterConfiguration(out iirBypass: byte; out lowPassFilter: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_FILTER_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  iirBypass := LEConvertUInt8From(8, response);
+  lowPassFilter := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletAccelerometerV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletAccelerometerV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletAccelerometerV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletAccelerometerV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAccelerometerV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletAccelerometerV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAccelerometerV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletAccelerometerV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletAccelerometerV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAccelerometerV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAccelerometerV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletAccelerometerV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_ACCELEROMETER_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletAccelerometerV2.CallbackWrapperAcceleration(const packet: TByteArray);
+var x: longint; y: longint; z: longint;
+begin
+  if (Length(packet) <> 20) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  x := LEConvertInt32From(8, packet);
+  y := LEConvertInt32From(12, packet);
+  z := LEConvertInt32From(16, packet);
+  if (Assigned(accelerationCallback)) then begin
+    accelerationCallback(self, x, y, z);
+  end;
+end;
+
+procedure TBrickletAccelerometerV2.CallbackWrapperContinuousAcceleration16Bit(const packet: TByteArray);
+var acceleration: TArray0To29OfInt16; i: longint;
+begin
+  if (Length(packet) <> 68) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  for i := 0 to 29 do acceleration[i] := LEConvertInt16From(8 + (i * 2), packet);
+  if (Assigned(continuousAcceleration16BitCallback)) then begin
+    continuousAcceleration16BitCallback(self, acceleration);
+  end;
+end;
+
+procedure TBrickletAccelerometerV2.CallbackWrapperContinuousAcceleration8Bit(const packet: TByteArray);
+var acceleration: TArray0To59OfInt8; i: longint;
+begin
+  if (Length(packet) <> 68) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  for i := 0 to 59 do acceleration[i] := LEConvertInt8From(8 + (i * 1), packet);
+  if (Assigned(continuousAcceleration8BitCallback)) then begin
+    continuousAcceleration8BitCallback(self, acceleration);
+  end;
+end;
+
+end.
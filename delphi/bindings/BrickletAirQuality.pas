@@ -0,0 +1,1007 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletAirQuality;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_AIR_QUALITY_DEVICE_IDENTIFIER = 297;
+  BRICKLET_AIR_QUALITY_DEVICE_DISPLAY_NAME = 'Air Quality Bricklet';
+
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_ALL_VALUES = 1;
+  BRICKLET_AIR_QUALITY_FUNCTION_SET_TEMPERATURE_OFFSET = 2;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_TEMPERATURE_OFFSET = 3;
+  BRICKLET_AIR_QUALITY_FUNCTION_SET_ALL_VALUES_CALLBACK_CONFIGURATION = 4;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_ALL_VALUES_CALLBACK_CONFIGURATION = 5;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_IAQ_INDEX = 7;
+  BRICKLET_AIR_QUALITY_FUNCTION_SET_IAQ_INDEX_CALLBACK_CONFIGURATION = 8;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_IAQ_INDEX_CALLBACK_CONFIGURATION = 9;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_TEMPERATURE = 11;
+  BRICKLET_AIR_QUALITY_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION = 12;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION = 13;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_HUMIDITY = 15;
+  BRICKLET_AIR_QUALITY_FUNCTION_SET_HUMIDITY_CALLBACK_CONFIGURATION = 16;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_HUMIDITY_CALLBACK_CONFIGURATION = 17;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_AIR_PRESSURE = 19;
+  BRICKLET_AIR_QUALITY_FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION = 20;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION = 21;
+  BRICKLET_AIR_QUALITY_FUNCTION_REMOVE_CALIBRATION = 23;
+  BRICKLET_AIR_QUALITY_FUNCTION_SET_BACKGROUND_CALIBRATION_DURATION = 24;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_BACKGROUND_CALIBRATION_DURATION = 25;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_AIR_QUALITY_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_AIR_QUALITY_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_AIR_QUALITY_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_AIR_QUALITY_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_AIR_QUALITY_FUNCTION_RESET = 243;
+  BRICKLET_AIR_QUALITY_FUNCTION_WRITE_UID = 248;
+  BRICKLET_AIR_QUALITY_FUNCTION_READ_UID = 249;
+  BRICKLET_AIR_QUALITY_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_AIR_QUALITY_CALLBACK_ALL_VALUES = 6;
+  BRICKLET_AIR_QUALITY_CALLBACK_IAQ_INDEX = 10;
+  BRICKLET_AIR_QUALITY_CALLBACK_TEMPERATURE = 14;
+  BRICKLET_AIR_QUALITY_CALLBACK_HUMIDITY = 18;
+  BRICKLET_AIR_QUALITY_CALLBACK_AIR_PRESSURE = 22;
+
+  BRICKLET_AIR_QUALITY_ACCURACY_UNRELIABLE = 0;
+  BRICKLET_AIR_QUALITY_ACCURACY_LOW = 1;
+  BRICKLET_AIR_QUALITY_ACCURACY_MEDIUM = 2;
+  BRICKLET_AIR_QUALITY_ACCURACY_HIGH = 3;
+  BRICKLET_AIR_QUALITY_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_AIR_QUALITY_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_AIR_QUALITY_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_AIR_QUALITY_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_AIR_QUALITY_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_AIR_QUALITY_DURATION_4_DAYS = 0;
+  BRICKLET_AIR_QUALITY_DURATION_28_DAYS = 1;
+  BRICKLET_AIR_QUALITY_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_AIR_QUALITY_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_AIR_QUALITY_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_AIR_QUALITY_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_AIR_QUALITY_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_AIR_QUALITY_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_AIR_QUALITY_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_AIR_QUALITY_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_AIR_QUALITY_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_AIR_QUALITY_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_AIR_QUALITY_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_AIR_QUALITY_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_AIR_QUALITY_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_AIR_QUALITY_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_AIR_QUALITY_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletAirQuality = class;
+  TBrickletAirQualityNotifyAllValues = procedure(sender: TBrickletAirQuality; const iaqIndex: longint; const iaqIndexAccuracy: byte; const temperature: longint; const humidity: longint; const airPressure: longint) of object;
+  TBrickletAirQualityNotifyIAQIndex = procedure(sender: TBrickletAirQuality; const iaqIndex: longint; const iaqIndexAccuracy: byte) of object;
+  TBrickletAirQualityNotifyTemperature = procedure(sender: TBrickletAirQuality; const temperature: longint) of object;
+  TBrickletAirQualityNotifyHumidity = procedure(sender: TBrickletAirQuality; const humidity: longint) of object;
+  TBrickletAirQualityNotifyAirPressure = procedure(sender: TBrickletAirQuality; const airPressure: longint) of object;
+
+  /// <summary>
+  ///  Measures IAQ index, temperature, humidity and air pressure
+  /// </summary>
+  TBrickletAirQuality = class(TDevice)
+  private
+    allValuesCallback: TBrickletAirQualityNotifyAllValues;
+    iaqIndexCallback: TBrickletAirQualityNotifyIAQIndex;
+    temperatureCallback: TBrickletAirQualityNotifyTemperature;
+    humidityCallback: TBrickletAirQualityNotifyHumidity;
+    airPressureCallback: TBrickletAirQualityNotifyAirPressure;
+  protected
+    procedure CallbackWrapperAllValues(const packet: TByteArray); virtual;
+    procedure CallbackWrapperIAQIndex(const packet: TByteArray); virtual;
+    procedure CallbackWrapperTemperature(const packet: TByteArray); virtual;
+    procedure CallbackWrapperHumidity(const packet: TByteArray); virtual;
+    procedure CallbackWrapperAirPressure(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns all values measured by the Air Quality Bricklet. The values are
+    ///  IAQ (Indoor Air Quality) Index (higher value means greater level of air pollution), IAQ Index Accuracy, Temperature, Humidity and
+    ///  Air Pressure.
+    ///  
+    ///  .. image:: /Images/Misc/bricklet_air_quality_iaq_index.png
+    ///     :scale: 100 %
+    ///     :alt: Air Quality Index description
+    ///     :align: center
+    ///     :target: ../../_images/Misc/bricklet_air_quality_iaq_index.png
+    /// </summary>
+    procedure GetAllValues(out iaqIndex: longint; out iaqIndexAccuracy: byte; out temperature: longint; out humidity: longint; out airPressure: longint); virtual;
+
+    /// <summary>
+    ///  Sets a temperature offset. A offset of 10 will decrease the measured temperature by 0.1 °C.
+    ///  
+    ///  If you install this Bricklet into an enclosure and you want to measure the ambient
+    ///  temperature, you may have to decrease the measured temperature by some value to
+    ///  compensate for the error because of the heating inside of the enclosure.
+    ///  
+    ///  We recommend that you leave the parts in the enclosure running for at least
+    ///  24 hours such that a temperature equilibrium can be reached. After that you can measure
+    ///  the temperature directly outside of enclosure and set the difference as offset.
+    ///  
+    ///  This temperature offset is used to calculate the relative humidity and
+    ///  IAQ index measurements. In case the Bricklet is installed in an enclosure, we
+    ///  recommend to measure and set the temperature offset to improve the accuracy of
+    ///  the measurements.
+    /// </summary>
+    procedure SetTemperatureOffset(const offset: longint); virtual;
+
+    /// <summary>
+    ///  Returns the temperature offset as set by
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.SetTemperatureOffset"/>.
+    /// </summary>
+    function GetTemperatureOffset: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletAirQuality.TBrickletAirQuality.OnAllValues"/>
+    ///  callback is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after at least one of the values has changed. If the values didn't
+    ///  change within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetAllValuesCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.SetAllValuesCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAllValuesCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the IAQ index and accuracy. The higher the IAQ index, the greater the level of air pollution.
+    ///  
+    ///  .. image:: /Images/Misc/bricklet_air_quality_iaq_index.png
+    ///     :scale: 100 %
+    ///     :alt: IAQ index description
+    ///     :align: center
+    ///     :target: ../../_images/Misc/bricklet_air_quality_iaq_index.png
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.OnIAQIndex"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletAirQuality.TBrickletAirQuality.SetIAQIndexCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetIAQIndex(out iaqIndex: longint; out iaqIndexAccuracy: byte); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletAirQuality.TBrickletAirQuality.OnIAQIndex"/>
+    ///  callback is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after at least one of the values has changed. If the values didn't
+    ///  change within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetIAQIndexCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.SetIAQIndexCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetIAQIndexCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns temperature.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.OnTemperature"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletAirQuality.TBrickletAirQuality.SetTemperatureCallbackConfiguration"/>.
+    /// </summary>
+    function GetTemperature: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletAirQuality.TBrickletAirQuality.OnTemperature"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletAirQuality.TBrickletAirQuality.OnTemperature"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletAirQuality.TBrickletAirQuality.SetTemperatureCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Returns relative humidity.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.OnHumidity"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletAirQuality.TBrickletAirQuality.SetHumidityCallbackConfiguration"/>.
+    /// </summary>
+    function GetHumidity: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletAirQuality.TBrickletAirQuality.OnHumidity"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletAirQuality.TBrickletAirQuality.OnHumidity"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetHumidityCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletAirQuality.TBrickletAirQuality.SetHumidityCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetHumidityCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Returns air pressure.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.OnAirPressure"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletAirQuality.TBrickletAirQuality.SetAirPressureCallbackConfiguration"/>.
+    /// </summary>
+    function GetAirPressure: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletAirQuality.TBrickletAirQuality.OnAirPressure"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletAirQuality.TBrickletAirQuality.OnAirPressure"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetAirPressureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletAirQuality.TBrickletAirQuality.SetAirPressureCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAirPressureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Deletes the calibration from flash. After you call this function,
+    ///  you need to power cycle the Air Quality Bricklet.
+    ///  
+    ///  On the next power up the Bricklet will start a new calibration, as
+    ///  if it was started for the very first time.
+    ///  
+    ///  The calibration is based on the data of the last four days, so it takes
+    ///  four days until a full calibration is re-established.
+    ///  
+    ///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+    /// </summary>
+    procedure RemoveCalibration; virtual;
+
+    /// <summary>
+    ///  The Air Quality Bricklet uses an automatic background calibration mechanism to
+    ///  calculate the IAQ Index. This calibration mechanism considers a history of
+    ///  measured data. The duration of this history can be configured to either be
+    ///  4 days or 28 days.
+    ///  
+    ///  If you keep the Bricklet mostly at one place and it does not get moved around
+    ///  to different environments, we recommend that you use a duration of 28 days.
+    ///  
+    ///  If you change the duration, the current calibration will be discarded and
+    ///  the calibration will start from beginning again. The configuration of the
+    ///  duration is saved in flash, so you should only have to call this function
+    ///  once in the lifetime of the Bricklet.
+    ///  
+    ///  The Bricklet has to be power cycled after this function is called
+    ///  for a duration change to take effect.
+    ///  
+    ///  Before firmware version 2.0.3 this was not configurable and the duration was
+    ///  4 days.
+    ///  
+    ///  The default value (since firmware version 2.0.3) is 28 days.
+    ///  
+    ///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+    /// </summary>
+    procedure SetBackgroundCalibrationDuration(const duration: byte); virtual;
+
+    /// <summary>
+    ///  Returns the background calibration duration as set by
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.SetBackgroundCalibrationDuration"/>.
+    ///  
+    ///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+    /// </summary>
+    function GetBackgroundCalibrationDuration: byte; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletAirQuality.TBrickletAirQuality.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletAirQuality.TBrickletAirQuality.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletAirQuality.TBrickletAirQuality.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.SetAllValuesCallbackConfiguration"/>.
+    ///  
+    ///  The parameters are the same as <see cref="BrickletAirQuality.TBrickletAirQuality.GetAllValues"/>.
+    /// </summary>
+    property OnAllValues: TBrickletAirQualityNotifyAllValues read allValuesCallback write allValuesCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.SetIAQIndexCallbackConfiguration"/>.
+    ///  
+    ///  The parameters are the same as <see cref="BrickletAirQuality.TBrickletAirQuality.GetIAQIndex"/>.
+    /// </summary>
+    property OnIAQIndex: TBrickletAirQualityNotifyIAQIndex read iaqIndexCallback write iaqIndexCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.SetTemperatureCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletAirQuality.TBrickletAirQuality.GetTemperature"/>.
+    /// </summary>
+    property OnTemperature: TBrickletAirQualityNotifyTemperature read temperatureCallback write temperatureCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.SetHumidityCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletAirQuality.TBrickletAirQuality.GetHumidity"/>.
+    /// </summary>
+    property OnHumidity: TBrickletAirQualityNotifyHumidity read humidityCallback write humidityCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletAirQuality.TBrickletAirQuality.SetAirPressureCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletAirQuality.TBrickletAirQuality.GetAirPressure"/>.
+    /// </summary>
+    property OnAirPressure: TBrickletAirQualityNotifyAirPressure read airPressureCallback write airPressureCallback;
+  end;
+
+implementation
+
+constructor TBrickletAirQuality.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_AIR_QUALITY_DEVICE_IDENTIFIER, BRICKLET_AIR_QUALITY_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 1;
+
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_ALL_VALUES] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_SET_TEMPERATURE_OFFSET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_TEMPERATURE_OFFSET] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_SET_ALL_VALUES_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_ALL_VALUES_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_IAQ_INDEX] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_SET_IAQ_INDEX_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_IAQ_INDEX_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_HUMIDITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_SET_HUMIDITY_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_HUMIDITY_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_AIR_PRESSURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_REMOVE_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_SET_BACKGROUND_CALIBRATION_DURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_BACKGROUND_CALIBRATION_DURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AIR_QUALITY_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_AIR_QUALITY_CALLBACK_ALL_VALUES] := {$ifdef FPC}@{$endif}CallbackWrapperAllValues;
+  callbackWrappers[BRICKLET_AIR_QUALITY_CALLBACK_IAQ_INDEX] := {$ifdef FPC}@{$endif}CallbackWrapperIAQIndex;
+  callbackWrappers[BRICKLET_AIR_QUALITY_CALLBACK_TEMPERATURE] := {$ifdef FPC}@{$endif}CallbackWrapperTemperature;
+  callbackWrappers[BRICKLET_AIR_QUALITY_CALLBACK_HUMIDITY] := {$ifdef FPC}@{$endif}CallbackWrapperHumidity;
+  callbackWrappers[BRICKLET_AIR_QUALITY_CALLBACK_AIR_PRESSURE] := {$ifdef FPC}@{$endif}CallbackWrapperAirPressure;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletAirQuality.GetAllValues(out iaqIndex: longint; out iaqIndexAccuracy: byte; out temperature: longint; out humidity: longint; out airPressure: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_ALL_VALUES, 8);
+  response := SendRequest(request, 25);
+  iaqIndex := LEConvertInt32From(8, response);
+  iaqIndexAccuracy := LEConvertUInt8From(12, response);
+  temperature := LEConvertInt32From(13, response);
+  humidity := LEConvertInt32From(17, response);
+  airPressure := LEConvertInt32From(21, response);
+end;
+
+procedure TBrickletAirQuality.SetTemperatureOffset(const offset: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_SET_TEMPERATURE_OFFSET, 12);
+  LEConvertInt32To(offset, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAirQuality.GetTemperatureOffset: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_TEMPERATURE_OFFSET, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletAirQuality.SetAllValuesCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_SET_ALL_VALUES_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAirQuality.GetAllValuesCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_ALL_VALUES_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletAirQuality.GetIAQIndex(out iaqIndex: longint; out iaqIndexAccuracy: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_IAQ_INDEX, 8);
+  response := SendRequest(request, 13);
+  iaqIndex := LEConvertInt32From(8, response);
+  iaqIndexAccuracy := LEConvertUInt8From(12, response);
+end;
+
+procedure TBrickletAirQuality.SetIAQIndexCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_SET_IAQ_INDEX_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAirQuality.GetIAQIndexCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_IAQ_INDEX_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+function TBrickletAirQuality.GetTemperature: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_TEMPERATURE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletAirQuality.SetTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAirQuality.GetTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+function TBrickletAirQuality.GetHumidity: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_HUMIDITY, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletAirQuality.SetHumidityCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_SET_HUMIDITY_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAirQuality.GetHumidityCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_HUMIDITY_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+function TBrickletAirQuality.GetAirPressure: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_AIR_PRESSURE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletAirQuality.SetAirPressureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAirQuality.GetAirPressureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+procedure TBrickletAirQuality.RemoveCalibration;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_REMOVE_CALIBRATION, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAirQuality.SetBackgroundCalibrationDuration(const duration: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_SET_BACKGROUND_CALIBRATION_DURATION, 9);
+  LEConvertUInt8To(duration, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAirQuality.GetBackgroundCalibrationDuration: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_BACKGROUND_CALIBRATION_DURATION, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletAirQuality.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletAirQuality.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletAirQuality.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletAirQuality.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAirQuality.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletAirQuality.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAirQuality.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletAirQuality.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletAirQuality.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAirQuality.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAirQuality.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletAirQuality.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AIR_QUALITY_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletAirQuality.CallbackWrapperAllValues(const packet: TByteArray);
+var iaqIndex: longint; iaqIndexAccuracy: byte; temperature: longint; humidity: longint; airPressure: longint;
+begin
+  if (Length(packet) <> 25) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  iaqIndex := LEConvertInt32From(8, packet);
+  iaqIndexAccuracy := LEConvertUInt8From(12, packet);
+  temperature := LEConvertInt32From(13, packet);
+  humidity := LEConvertInt32From(17, packet);
+  airPressure := LEConvertInt32From(21, packet);
+  if (Assigned(allValuesCallback)) then begin
+    allValuesCallback(self, iaqIndex, iaqIndexAccuracy, temperature, humidity, airPressure);
+  end;
+end;
+
+procedure TBrickletAirQuality.CallbackWrapperIAQIndex(const packet: TByteArray);
+var iaqIndex: longint; iaqIndexAccuracy: byte;
+begin
+  if (Length(packet) <> 13) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  iaqIndex := LEConvertInt32From(8, packet);
+  iaqIndexAccuracy := LEConvertUInt8From(12, packet);
+  if (Assigned(iaqIndexCallback)) then begin
+    iaqIndexCallback(self, iaqIndex, iaqIndexAccuracy);
+  end;
+end;
+
+procedure TBrickletAirQuality.CallbackWrapperTemperature(const packet: TByteArray);
+var temperature: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  temperature := LEConvertInt32From(8, packet);
+  if (Assigned(temperatureCallback)) then begin
+    temperatureCallback(self, temperature);
+  end;
+end;
+
+procedure TBrickletAirQuality.CallbackWrapperHumidity(const packet: TByteArray);
+var humidity: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  humidity := LEConvertInt32From(8, packet);
+  if (Assigned(humidityCallback)) then begin
+    humidityCallback(self, humidity);
+  end;
+end;
+
+procedure TBrickletAirQuality.CallbackWrapperAirPressure(const packet: TByteArray);
+var airPressure: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  airPressure := LEConvertInt32From(8, packet);
+  if (Assigned(airPressureCallback)) then begin
+    airPressureCallback(self, airPressure);
+  end;
+end;
+
+end.
@@ -0,0 +1,529 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletAmbientLightV3;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_AMBIENT_LIGHT_V3_DEVICE_IDENTIFIER = 2131;
+  BRICKLET_AMBIENT_LIGHT_V3_DEVICE_DISPLAY_NAME = 'Ambient Light Bricklet 3.0';
+
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_ILLUMINANCE = 1;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_ILLUMINANCE_CALLBACK_CONFIGURATION = 2;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_ILLUMINANCE_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_CONFIGURATION = 5;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_CONFIGURATION = 6;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_RESET = 243;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_WRITE_UID = 248;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_READ_UID = 249;
+  BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_AMBIENT_LIGHT_V3_CALLBACK_ILLUMINANCE = 4;
+
+  BRICKLET_AMBIENT_LIGHT_V3_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_AMBIENT_LIGHT_V3_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_AMBIENT_LIGHT_V3_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_AMBIENT_LIGHT_V3_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_AMBIENT_LIGHT_V3_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_AMBIENT_LIGHT_V3_ILLUMINANCE_RANGE_UNLIMITED = 6;
+  BRICKLET_AMBIENT_LIGHT_V3_ILLUMINANCE_RANGE_64000LUX = 0;
+  BRICKLET_AMBIENT_LIGHT_V3_ILLUMINANCE_RANGE_32000LUX = 1;
+  BRICKLET_AMBIENT_LIGHT_V3_ILLUMINANCE_RANGE_16000LUX = 2;
+  BRICKLET_AMBIENT_LIGHT_V3_ILLUMINANCE_RANGE_8000LUX = 3;
+  BRICKLET_AMBIENT_LIGHT_V3_ILLUMINANCE_RANGE_1300LUX = 4;
+  BRICKLET_AMBIENT_LIGHT_V3_ILLUMINANCE_RANGE_600LUX = 5;
+  BRICKLET_AMBIENT_LIGHT_V3_INTEGRATION_TIME_50MS = 0;
+  BRICKLET_AMBIENT_LIGHT_V3_INTEGRATION_TIME_100MS = 1;
+  BRICKLET_AMBIENT_LIGHT_V3_INTEGRATION_TIME_150MS = 2;
+  BRICKLET_AMBIENT_LIGHT_V3_INTEGRATION_TIME_200MS = 3;
+  BRICKLET_AMBIENT_LIGHT_V3_INTEGRATION_TIME_250MS = 4;
+  BRICKLET_AMBIENT_LIGHT_V3_INTEGRATION_TIME_300MS = 5;
+  BRICKLET_AMBIENT_LIGHT_V3_INTEGRATION_TIME_350MS = 6;
+  BRICKLET_AMBIENT_LIGHT_V3_INTEGRATION_TIME_400MS = 7;
+  BRICKLET_AMBIENT_LIGHT_V3_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_AMBIENT_LIGHT_V3_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_AMBIENT_LIGHT_V3_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_AMBIENT_LIGHT_V3_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_AMBIENT_LIGHT_V3_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_AMBIENT_LIGHT_V3_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_AMBIENT_LIGHT_V3_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_AMBIENT_LIGHT_V3_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_AMBIENT_LIGHT_V3_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_AMBIENT_LIGHT_V3_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_AMBIENT_LIGHT_V3_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_AMBIENT_LIGHT_V3_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_AMBIENT_LIGHT_V3_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_AMBIENT_LIGHT_V3_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_AMBIENT_LIGHT_V3_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletAmbientLightV3 = class;
+  TBrickletAmbientLightV3NotifyIlluminance = procedure(sender: TBrickletAmbientLightV3; const illuminance: longword) of object;
+
+  /// <summary>
+  ///  Measures ambient light up to 64000lux
+  /// </summary>
+  TBrickletAmbientLightV3 = class(TDevice)
+  private
+    illuminanceCallback: TBrickletAmbientLightV3NotifyIlluminance;
+  protected
+    procedure CallbackWrapperIlluminance(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the illuminance of the ambient light sensor. The measurement range goes
+    ///  up to about 100000lux, but above 64000lux the precision starts to drop.
+    ///  The illuminance is given in lux/100, i.e. a value of 450000 means that an
+    ///  illuminance of 4500lux is measured.
+    ///  
+    ///  An illuminance of 0lux indicates that the sensor is saturated and the
+    ///  configuration should be modified, see <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.SetConfiguration"/>.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.OnIlluminance"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.SetIlluminanceCallbackConfiguration"/>.
+    /// </summary>
+    function GetIlluminance: longword; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.OnIlluminance"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.OnIlluminance"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetIlluminanceCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longword; const max: longword); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.SetIlluminanceCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetIlluminanceCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longword; out max: longword); virtual;
+
+    /// <summary>
+    ///  Sets the configuration. It is possible to configure an illuminance range
+    ///  between 0-600lux and 0-64000lux and an integration time between 50ms and 400ms.
+    ///  
+    ///  The unlimited illuminance range allows to measure up to about 100000lux, but
+    ///  above 64000lux the precision starts to drop.
+    ///  
+    ///  A smaller illuminance range increases the resolution of the data. A longer
+    ///  integration time will result in less noise on the data.
+    ///  
+    ///  If the actual measure illuminance is out-of-range then the current illuminance
+    ///  range maximum +0.01lux is reported by <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.GetIlluminance"/> and the
+    ///  <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.OnIlluminance"/> callback. For example, 800001 for the 0-8000lux range.
+    ///  
+    ///  With a long integration time the sensor might be saturated before the measured
+    ///  value reaches the maximum of the selected illuminance range. In this case 0lux
+    ///  is reported by <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.GetIlluminance"/> and the <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.OnIlluminance"/> callback.
+    ///  
+    ///  If the measurement is out-of-range or the sensor is saturated then you should
+    ///  configure the next higher illuminance range. If the highest range is already
+    ///  in use, then start to reduce the integration time.
+    /// </summary>
+    procedure SetConfiguration(const illuminanceRange: byte; const integrationTime: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.SetConfiguration"/>.
+    /// </summary>
+    procedure GetConfiguration(out illuminanceRange: byte; out integrationTime: byte); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.SetIlluminanceCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletAmbientLightV3.TBrickletAmbientLightV3.GetIlluminance"/>.
+    /// </summary>
+    property OnIlluminance: TBrickletAmbientLightV3NotifyIlluminance read illuminanceCallback write illuminanceCallback;
+  end;
+
+implementation
+
+constructor TBrickletAmbientLightV3.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_AMBIENT_LIGHT_V3_DEVICE_IDENTIFIER, BRICKLET_AMBIENT_LIGHT_V3_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_ILLUMINANCE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_ILLUMINANCE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_ILLUMINANCE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_AMBIENT_LIGHT_V3_CALLBACK_ILLUMINANCE] := {$ifdef FPC}@{$endif}CallbackWrapperIlluminance;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletAmbientLightV3.GetIlluminance: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_ILLUMINANCE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletAmbientLightV3.SetIlluminanceCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longword; const max: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_ILLUMINANCE_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertUInt32To(min, 14, request);
+  LEConvertUInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAmbientLightV3.GetIlluminanceCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longword; out max: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_ILLUMINANCE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertUInt32From(14, response);
+  max := LEConvertUInt32From(18, response);
+end;
+
+procedure TBrickletAmbientLightV3.SetConfiguration(const illuminanceRange: byte; const integrationTime: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_CONFIGURATION, 10);
+  LEConvertUInt8To(illuminanceRange, 8, request);
+  LEConvertUInt8To(integrationTime, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAmbientLightV3.GetConfiguration(out illuminanceRange: byte; out integrationTime: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  illuminanceRange := LEConvertUInt8From(8, response);
+  integrationTime := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletAmbientLightV3.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletAmbientLightV3.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletAmbientLightV3.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletAmbientLightV3.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAmbientLightV3.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletAmbientLightV3.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAmbientLightV3.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletAmbientLightV3.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletAmbientLightV3.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletAmbientLightV3.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletAmbientLightV3.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletAmbientLightV3.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_AMBIENT_LIGHT_V3_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletAmbientLightV3.CallbackWrapperIlluminance(const packet: TByteArray);
+var illuminance: longword;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  illuminance := LEConvertUInt32From(8, packet);
+  if (Assigned(illuminanceCallback)) then begin
+    illuminanceCallback(self, illuminance);
+  end;
+end;
+
+end.
@@ -0,0 +1,869 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletBarometerV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_BAROMETER_V2_DEVICE_IDENTIFIER = 2117;
+  BRICKLET_BAROMETER_V2_DEVICE_DISPLAY_NAME = 'Barometer Bricklet 2.0';
+
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_AIR_PRESSURE = 1;
+  BRICKLET_BAROMETER_V2_FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION = 2;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_ALTITUDE = 5;
+  BRICKLET_BAROMETER_V2_FUNCTION_SET_ALTITUDE_CALLBACK_CONFIGURATION = 6;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_ALTITUDE_CALLBACK_CONFIGURATION = 7;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_TEMPERATURE = 9;
+  BRICKLET_BAROMETER_V2_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION = 10;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION = 11;
+  BRICKLET_BAROMETER_V2_FUNCTION_SET_MOVING_AVERAGE_CONFIGURATION = 13;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_MOVING_AVERAGE_CONFIGURATION = 14;
+  BRICKLET_BAROMETER_V2_FUNCTION_SET_REFERENCE_AIR_PRESSURE = 15;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_REFERENCE_AIR_PRESSURE = 16;
+  BRICKLET_BAROMETER_V2_FUNCTION_SET_CALIBRATION = 17;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_CALIBRATION = 18;
+  BRICKLET_BAROMETER_V2_FUNCTION_SET_SENSOR_CONFIGURATION = 19;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_SENSOR_CONFIGURATION = 20;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_BAROMETER_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_BAROMETER_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_BAROMETER_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_BAROMETER_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_BAROMETER_V2_FUNCTION_RESET = 243;
+  BRICKLET_BAROMETER_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_BAROMETER_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_BAROMETER_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_BAROMETER_V2_CALLBACK_AIR_PRESSURE = 4;
+  BRICKLET_BAROMETER_V2_CALLBACK_ALTITUDE = 8;
+  BRICKLET_BAROMETER_V2_CALLBACK_TEMPERATURE = 12;
+
+  BRICKLET_BAROMETER_V2_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_BAROMETER_V2_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_BAROMETER_V2_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_BAROMETER_V2_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_BAROMETER_V2_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_BAROMETER_V2_DATA_RATE_OFF = 0;
+  BRICKLET_BAROMETER_V2_DATA_RATE_1HZ = 1;
+  BRICKLET_BAROMETER_V2_DATA_RATE_10HZ = 2;
+  BRICKLET_BAROMETER_V2_DATA_RATE_25HZ = 3;
+  BRICKLET_BAROMETER_V2_DATA_RATE_50HZ = 4;
+  BRICKLET_BAROMETER_V2_DATA_RATE_75HZ = 5;
+  BRICKLET_BAROMETER_V2_LOW_PASS_FILTER_OFF = 0;
+  BRICKLET_BAROMETER_V2_LOW_PASS_FILTER_1_9TH = 1;
+  BRICKLET_BAROMETER_V2_LOW_PASS_FILTER_1_20TH = 2;
+  BRICKLET_BAROMETER_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_BAROMETER_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_BAROMETER_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_BAROMETER_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_BAROMETER_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_BAROMETER_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_BAROMETER_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_BAROMETER_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_BAROMETER_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_BAROMETER_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_BAROMETER_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_BAROMETER_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_BAROMETER_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_BAROMETER_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_BAROMETER_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletBarometerV2 = class;
+  TBrickletBarometerV2NotifyAirPressure = procedure(sender: TBrickletBarometerV2; const airPressure: longint) of object;
+  TBrickletBarometerV2NotifyAltitude = procedure(sender: TBrickletBarometerV2; const altitude: longint) of object;
+  TBrickletBarometerV2NotifyTemperature = procedure(sender: TBrickletBarometerV2; const temperature: longint) of object;
+
+  /// <summary>
+  ///  Measures air pressure and altitude changes
+  /// </summary>
+  TBrickletBarometerV2 = class(TDevice)
+  private
+    airPressureCallback: TBrickletBarometerV2NotifyAirPressure;
+    altitudeCallback: TBrickletBarometerV2NotifyAltitude;
+    temperatureCallback: TBrickletBarometerV2NotifyTemperature;
+  protected
+    procedure CallbackWrapperAirPressure(const packet: TByteArray); virtual;
+    procedure CallbackWrapperAltitude(const packet: TByteArray); virtual;
+    procedure CallbackWrapperTemperature(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the measured air pressure.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletBarometerV2.TBrickletBarometerV2.OnAirPressure"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetAirPressureCallbackConfiguration"/>.
+    /// </summary>
+    function GetAirPressure: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletBarometerV2.TBrickletBarometerV2.OnAirPressure"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletBarometerV2.TBrickletBarometerV2.OnAirPressure"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetAirPressureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetAirPressureCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAirPressureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the relative altitude of the air pressure sensor. The value
+    ///  is calculated based on the difference between the
+    ///  current air pressure and the reference air pressure that can be set
+    ///  with <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetReferenceAirPressure"/>.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletBarometerV2.TBrickletBarometerV2.OnAltitude"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetAltitudeCallbackConfiguration"/>.
+    /// </summary>
+    function GetAltitude: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletBarometerV2.TBrickletBarometerV2.OnAltitude"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletBarometerV2.TBrickletBarometerV2.OnAltitude"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetAltitudeCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetAltitudeCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAltitudeCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the temperature of the air pressure sensor.
+    ///  
+    ///  This temperature is used internally for temperature compensation
+    ///  of the air pressure measurement. It is not as accurate as the
+    ///  temperature measured by the :ref:`temperature_v2_bricklet` or the
+    ///  :ref:`temperature_ir_v2_bricklet`.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletBarometerV2.TBrickletBarometerV2.OnTemperature"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetTemperatureCallbackConfiguration"/>.
+    /// </summary>
+    function GetTemperature: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletBarometerV2.TBrickletBarometerV2.OnTemperature"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletBarometerV2.TBrickletBarometerV2.OnTemperature"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetTemperatureCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Sets the length of a `moving averaging &lt;https://en.wikipedia.org/wiki/Moving_average&gt;`__
+    ///  for the air pressure and temperature measurements.
+    ///  
+    ///  Setting the length to 1 will turn the averaging off. With less
+    ///  averaging, there is more noise on the data.
+    ///  
+    ///  If you want to do long term measurements the longest moving average will give
+    ///  the cleanest results.
+    /// </summary>
+    procedure SetMovingAverageConfiguration(const movingAverageLengthAirPressure: word; const movingAverageLengthTemperature: word); virtual;
+
+    /// <summary>
+    ///  Returns the moving average configuration as set by
+    ///  <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetMovingAverageConfiguration"/>.
+    /// </summary>
+    procedure GetMovingAverageConfiguration(out movingAverageLengthAirPressure: word; out movingAverageLengthTemperature: word); virtual;
+
+    /// <summary>
+    ///  Sets the reference air pressure for the altitude calculation.
+    ///  Setting the reference to the
+    ///  current air pressure results in a calculated altitude of 0mm. Passing 0 is
+    ///  a shortcut for passing the current air pressure as reference.
+    ///  
+    ///  Well known reference values are the Q codes
+    ///  `QNH &lt;https://en.wikipedia.org/wiki/QNH&gt;`__ and
+    ///  `QFE &lt;https://en.wikipedia.org/wiki/Mean_sea_level_pressure#Mean_sea_level_pressure&gt;`__
+    ///  used in aviation.
+    /// </summary>
+    procedure SetReferenceAirPressure(const airPressure: longint); virtual;
+
+    /// <summary>
+    ///  Returns the reference air pressure as set by <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetReferenceAirPressure"/>.
+    /// </summary>
+    function GetReferenceAirPressure: longint; virtual;
+
+    /// <summary>
+    ///  Sets the one point calibration (OPC) values for the air pressure measurement.
+    ///  
+    ///  Before the Bricklet can be calibrated any previous calibration has to be removed
+    ///  by setting ``measured air pressure`` and ``actual air pressure`` to 0.
+    ///  
+    ///  Then the current air pressure has to be measured using the Bricklet
+    ///  (``measured air pressure``) and with an accurate reference barometer
+    ///  (``actual air pressure``) at the same time and passed to this function.
+    ///  
+    ///  After proper calibration the air pressure measurement can achieve an accuracy
+    ///  up to 0.2 hPa.
+    ///  
+    ///  The calibration is saved in the EEPROM of the Bricklet and only needs to be
+    ///  configured once.
+    /// </summary>
+    procedure SetCalibration(const measuredAirPressure: longint; const actualAirPressure: longint); virtual;
+
+    /// <summary>
+    ///  Returns the air pressure one point calibration values as set by
+    ///  <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetCalibration"/>.
+    /// </summary>
+    procedure GetCalibration(out measuredAirPressure: longint; out actualAirPressure: longint); virtual;
+
+    /// <summary>
+    ///  Configures the data rate and air pressure low pass filter. The low pass filter
+    ///  cut-off frequency (if enabled) can be set to 1/9th or 1/20th of the configure
+    ///  data rate to decrease the noise on the air pressure data.
+    ///  
+    ///  The low pass filter configuration only applies to the air pressure measurement.
+    ///  There is no low pass filter for the temperature measurement.
+    ///  
+    ///  A higher data rate will result in a less precise temperature because of
+    ///  self-heating of the sensor. If the accuracy of the temperature reading is
+    ///  important to you, we would recommend the 1Hz data rate.
+    /// </summary>
+    procedure SetSensorConfiguration(const dataRate: byte; const airPressureLowPassFilter: byte); virtual;
+
+    /// <summary>
+    ///  Returns the sensor configuration as set by <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetSensorConfiguration"/>.
+    /// </summary>
+    procedure GetSensorConfiguration(out dataRate: byte; out airPressureLowPassFilter: byte); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletBarometerV2.TBrickletBarometerV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetAirPressureCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletBarometerV2.TBrickletBarometerV2.GetAirPressure"/>.
+    /// </summary>
+    property OnAirPressure: TBrickletBarometerV2NotifyAirPressure read airPressureCallback write airPressureCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetAltitudeCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletBarometerV2.TBrickletBarometerV2.GetAltitude"/>.
+    /// </summary>
+    property OnAltitude: TBrickletBarometerV2NotifyAltitude read altitudeCallback write altitudeCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletBarometerV2.TBrickletBarometerV2.SetTemperatureCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletBarometerV2.TBrickletBarometerV2.GetTemperature"/>.
+    /// </summary>
+    property OnTemperature: TBrickletBarometerV2NotifyTemperature read temperatureCallback write temperatureCallback;
+  end;
+
+implementation
+
+constructor TBrickletBarometerV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_BAROMETER_V2_DEVICE_IDENTIFIER, BRICKLET_BAROMETER_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_AIR_PRESSURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_ALTITUDE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_SET_ALTITUDE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_ALTITUDE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_SET_MOVING_AVERAGE_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_MOVING_AVERAGE_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_SET_REFERENCE_AIR_PRESSURE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_REFERENCE_AIR_PRESSURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_SET_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_SET_SENSOR_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_SENSOR_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_BAROMETER_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_BAROMETER_V2_CALLBACK_AIR_PRESSURE] := {$ifdef FPC}@{$endif}CallbackWrapperAirPressure;
+  callbackWrappers[BRICKLET_BAROMETER_V2_CALLBACK_ALTITUDE] := {$ifdef FPC}@{$endif}CallbackWrapperAltitude;
+  callbackWrappers[BRICKLET_BAROMETER_V2_CALLBACK_TEMPERATURE] := {$ifdef FPC}@{$endif}CallbackWrapperTemperature;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletBarometerV2.GetAirPressure: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_AIR_PRESSURE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletBarometerV2.SetAirPressureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_SET_AIR_PRESSURE_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletBarometerV2.GetAirPressureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_AIR_PRESSURE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+function TBrickletBarometerV2.GetAltitude: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_ALTITUDE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletBarometerV2.SetAltitudeCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_SET_ALTITUDE_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletBarometerV2.GetAltitudeCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_ALTITUDE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+function TBrickletBarometerV2.GetTemperature: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_TEMPERATURE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletBarometerV2.SetTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletBarometerV2.GetTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+procedure TBrickletBarometerV2.SetMovingAverageConfiguration(const movingAverageLengthAirPressure: word; const movingAverageLengthTemperature: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_SET_MOVING_AVERAGE_CONFIGURATION, 12);
+  LEConvertUInt16To(movingAverageLengthAirPressure, 8, request);
+  LEConvertUInt16To(movingAverageLengthTemperature, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletBarometerV2.GetMovingAverageConfiguration(out movingAverageLengthAirPressure: word; out movingAverageLengthTemperature: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_MOVING_AVERAGE_CONFIGURATION, 8);
+  response := SendRequest(request, 12);
+  movingAverageLengthAirPressure := LEConvertUInt16From(8, response);
+  movingAverageLengthTemperature := LEConvertUInt16From(10, response);
+end;
+
+procedure TBrickletBarometerV2.SetReferenceAirPressure(const airPressure: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_SET_REFERENCE_AIR_PRESSURE, 12);
+  LEConvertInt32To(airPressure, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletBarometerV2.GetReferenceAirPressure: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_REFERENCE_AIR_PRESSURE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletBarometerV2.SetCalibration(const measuredAirPressure: longint; const actualAirPressure: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_SET_CALIBRATION, 16);
+  LEConvertInt32To(measuredAirPressure, 8, request);
+  LEConvertInt32To(actualAirPressure, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletBarometerV2.GetCalibration(out measuredAirPressure: longint; out actualAirPressure: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_CALIBRATION, 8);
+  response := SendRequest(request, 16);
+  measuredAirPressure := LEConvertInt32From(8, response);
+  actualAirPressure := LEConvertInt32From(12, response);
+end;
+
+procedure TBrickletBarometerV2.SetSensorConfiguration(const dataRate: byte; const airPressureLowPassFilter: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_SET_SENSOR_CONFIGURATION, 10);
+  LEConvertUInt8To(dataRate, 8, request);
+  LEConvertUInt8To(airPressureLowPassFilter, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletBarometerV2.GetSensorConfiguration(out dataRate: byte; out airPressureLowPassFilter: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_SENSOR_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  dataRate := LEConvertUInt8From(8, response);
+  airPressureLowPassFilter := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletBarometerV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletBarometerV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletBarometerV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletBarometerV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletBarometerV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletBarometerV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletBarometerV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletBarometerV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletBarometerV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletBarometerV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletBarometerV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletBarometerV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_BAROMETER_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletBarometerV2.CallbackWrapperAirPressure(const packet: TByteArray);
+var airPressure: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  airPressure := LEConvertInt32From(8, packet);
+  if (Assigned(airPressureCallback)) then begin
+    airPressureCallback(self, airPressure);
+  end;
+end;
+
+procedure TBrickletBarometerV2.CallbackWrapperAltitude(const packet: TByteArray);
+var altitude: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  altitude := LEConvertInt32From(8, packet);
+  if (Assigned(altitudeCallback)) then begin
+    altitudeCallback(self, altitude);
+  end;
+end;
+
+procedure TBrickletBarometerV2.CallbackWrapperTemperature(const packet: TByteArray);
+var temperature: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  temperature := LEConvertInt32From(8, packet);
+  if (Assigned(temperatureCallback)) then begin
+    temperatureCallback(self, temperature);
+  end;
+end;
+
+end.
@@ -0,0 +1,1282 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletCANV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_CAN_V2_DEVICE_IDENTIFIER = 2107;
+  BRICKLET_CAN_V2_DEVICE_DISPLAY_NAME = 'CAN Bricklet 2.0';
+
+  BRICKLET_CAN_V2_FUNCTION_WRITE_FRAME_LOW_LEVEL = 1;
+  BRICKLET_CAN_V2_FUNCTION_READ_FRAME_LOW_LEVEL = 2;
+  BRICKLET_CAN_V2_FUNCTION_SET_FRAME_READ_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_CAN_V2_FUNCTION_GET_FRAME_READ_CALLBACK_CONFIGURATION = 4;
+  BRICKLET_CAN_V2_FUNCTION_SET_TRANSCEIVER_CONFIGURATION = 5;
+  BRICKLET_CAN_V2_FUNCTION_GET_TRANSCEIVER_CONFIGURATION = 6;
+  BRICKLET_CAN_V2_FUNCTION_SET_QUEUE_CONFIGURATION_LOW_LEVEL = 7;
+  BRICKLET_CAN_V2_FUNCTION_GET_QUEUE_CONFIGURATION_LOW_LEVEL = 8;
+  BRICKLET_CAN_V2_FUNCTION_SET_READ_FILTER_CONFIGURATION = 9;
+  BRICKLET_CAN_V2_FUNCTION_GET_READ_FILTER_CONFIGURATION = 10;
+  BRICKLET_CAN_V2_FUNCTION_GET_ERROR_LOG_LOW_LEVEL = 11;
+  BRICKLET_CAN_V2_FUNCTION_SET_COMMUNICATION_LED_CONFIG = 12;
+  BRICKLET_CAN_V2_FUNCTION_GET_COMMUNICATION_LED_CONFIG = 13;
+  BRICKLET_CAN_V2_FUNCTION_SET_ERROR_LED_CONFIG = 14;
+  BRICKLET_CAN_V2_FUNCTION_GET_ERROR_LED_CONFIG = 15;
+  BRICKLET_CAN_V2_FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION = 17;
+  BRICKLET_CAN_V2_FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION = 18;
+  BRICKLET_CAN_V2_FUNCTION_SET_ERROR_OCCURRED_CALLBACK_CONFIGURATION = 20;
+  BRICKLET_CAN_V2_FUNCTION_GET_ERROR_OCCURRED_CALLBACK_CONFIGURATION = 21;
+  BRICKLET_CAN_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_CAN_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_CAN_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_CAN_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_CAN_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_CAN_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_CAN_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_CAN_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_CAN_V2_FUNCTION_RESET = 243;
+  BRICKLET_CAN_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_CAN_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_CAN_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_CAN_V2_CALLBACK_FRAME_READ_LOW_LEVEL = 16;
+  BRICKLET_CAN_V2_CALLBACK_FRAME_READABLE = 19;
+  BRICKLET_CAN_V2_CALLBACK_ERROR_OCCURRED = 22;
+
+  BRICKLET_CAN_V2_FRAME_TYPE_STANDARD_DATA = 0;
+  BRICKLET_CAN_V2_FRAME_TYPE_STANDARD_REMOTE = 1;
+  BRICKLET_CAN_V2_FRAME_TYPE_EXTENDED_DATA = 2;
+  BRICKLET_CAN_V2_FRAME_TYPE_EXTENDED_REMOTE = 3;
+  BRICKLET_CAN_V2_TRANSCEIVER_MODE_NORMAL = 0;
+  BRICKLET_CAN_V2_TRANSCEIVER_MODE_LOOPBACK = 1;
+  BRICKLET_CAN_V2_TRANSCEIVER_MODE_READ_ONLY = 2;
+  BRICKLET_CAN_V2_FILTER_MODE_ACCEPT_ALL = 0;
+  BRICKLET_CAN_V2_FILTER_MODE_MATCH_STANDARD_ONLY = 1;
+  BRICKLET_CAN_V2_FILTER_MODE_MATCH_EXTENDED_ONLY = 2;
+  BRICKLET_CAN_V2_FILTER_MODE_MATCH_STANDARD_AND_EXTENDED = 3;
+  BRICKLET_CAN_V2_TRANSCEIVER_STATE_ACTIVE = 0;
+  BRICKLET_CAN_V2_TRANSCEIVER_STATE_PASSIVE = 1;
+  BRICKLET_CAN_V2_TRANSCEIVER_STATE_DISABLED = 2;
+  BRICKLET_CAN_V2_COMMUNICATION_LED_CONFIG_OFF = 0;
+  BRICKLET_CAN_V2_COMMUNICATION_LED_CONFIG_ON = 1;
+  BRICKLET_CAN_V2_COMMUNICATION_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_CAN_V2_COMMUNICATION_LED_CONFIG_SHOW_COMMUNICATION = 3;
+  BRICKLET_CAN_V2_ERROR_LED_CONFIG_OFF = 0;
+  BRICKLET_CAN_V2_ERROR_LED_CONFIG_ON = 1;
+  BRICKLET_CAN_V2_ERROR_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_CAN_V2_ERROR_LED_CONFIG_SHOW_TRANSCEIVER_STATE = 3;
+  BRICKLET_CAN_V2_ERROR_LED_CONFIG_SHOW_ERROR = 4;
+  BRICKLET_CAN_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_CAN_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_CAN_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_CAN_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_CAN_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_CAN_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_CAN_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_CAN_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_CAN_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_CAN_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_CAN_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_CAN_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_CAN_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_CAN_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_CAN_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To14OfUInt8 = array [0..14] of byte;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To31OfBoolean = array [0..31] of boolean;
+  TArray0To31OfInt8 = array [0..31] of shortint;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+  TArrayOfBoolean = array of boolean;
+  TArrayOfInt8 = array of shortint;
+  TArrayOfUInt8 = array of byte;
+
+  TFrameReadHighLevelCallbackState = record data: TArrayOfUInt8; length: byte; end;
+
+  TBrickletCANV2 = class;
+  TBrickletCANV2NotifyFrameReadLowLevel = procedure(sender: TBrickletCANV2; const frameType: byte; const identifier: longword; const dataLength: byte; const dataData: TArray0To14OfUInt8) of object;
+  TBrickletCANV2NotifyFrameRead = procedure(sender: TBrickletCANV2; const frameType: byte; const identifier: longword; const data: TArrayOfUInt8) of object;
+  TBrickletCANV2NotifyFrameReadable = procedure(sender: TBrickletCANV2) of object;
+  TBrickletCANV2NotifyErrorOccurred = procedure(sender: TBrickletCANV2) of object;
+
+  /// <summary>
+  ///  Communicates with CAN bus devices
+  /// </summary>
+  TBrickletCANV2 = class(TDevice)
+  private
+    streamMutex: TCriticalSection;
+    frameReadHighLevelCallbackState: TFrameReadHighLevelCallbackState;
+    frameReadLowLevelCallback: TBrickletCANV2NotifyFrameReadLowLevel;
+    frameReadCallback: TBrickletCANV2NotifyFrameRead;
+    frameReadableCallback: TBrickletCANV2NotifyFrameReadable;
+    errorOccurredCallback: TBrickletCANV2NotifyErrorOccurred;
+  protected
+    procedure CallbackWrapperFrameReadLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperFrameReadable(const packet: TByteArray); virtual;
+    procedure CallbackWrapperErrorOccurred(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Writes a data or remote frame to the write queue to be transmitted over the
+    ///  CAN transceiver.
+    ///  
+    ///  The Bricklet supports the standard 11-bit (CAN 2.0A) and the additional extended
+    ///  29-bit (CAN 2.0B) identifiers. For standard frames the Bricklet uses bit 0 to 10
+    ///  from the ``identifier`` parameter as standard 11-bit identifier. For extended
+    ///  frames the Bricklet uses bit 0 to 28 from the ``identifier`` parameter as
+    ///  extended 29-bit identifier.
+    ///  
+    ///  The ``data`` parameter can be up to 15 bytes long. For data frames up to 8 bytes
+    ///  will be used as the actual data. The length (DLC) field in the data or remote
+    ///  frame will be set to the actual length of the ``data`` parameter. This allows
+    ///  to transmit data and remote frames with excess length. For remote frames only
+    ///  the length of the ``data`` parameter is used. The actual ``data`` bytes are
+    ///  ignored.
+    ///  
+    ///  Returns *true* if the frame was successfully added to the write queue. Returns
+    ///  *false* if the frame could not be added because write queue is already full or
+    ///  because the write buffer or the write backlog are configured with a size of
+    ///  zero (see <see cref="BrickletCANV2.TBrickletCANV2.SetQueueConfiguration"/>).
+    ///  
+    ///  The write queue can overflow if frames are written to it at a higher rate
+    ///  than the Bricklet can transmitted them over the CAN transceiver. This may
+    ///  happen if the CAN transceiver is configured as read-only or is using a low baud
+    ///  rate (see <see cref="BrickletCANV2.TBrickletCANV2.SetTransceiverConfiguration"/>). It can also happen if the CAN
+    ///  bus is congested and the frame cannot be transmitted because it constantly loses
+    ///  arbitration or because the CAN transceiver is currently disabled due to a high
+    ///  write error level (see <see cref="BrickletCANV2.TBrickletCANV2.GetErrorLog"/>).
+    /// </summary>
+    function WriteFrameLowLevel(const frameType: byte; const identifier: longword; const dataLength: byte; const dataData: TArray0To14OfUInt8): boolean; virtual;
+
+    /// <summary>
+    ///  Writes a data or remote frame to the write queue to be transmitted over the
+    ///  CAN transceiver.
+    ///  
+    ///  The Bricklet supports the standard 11-bit (CAN 2.0A) and the additional extended
+    ///  29-bit (CAN 2.0B) identifiers. For standard frames the Bricklet uses bit 0 to 10
+    ///  from the ``identifier`` parameter as standard 11-bit identifier. For extended
+    ///  frames the Bricklet uses bit 0 to 28 from the ``identifier`` parameter as
+    ///  extended 29-bit identifier.
+    ///  
+    ///  The ``data`` parameter can be up to 15 bytes long. For data frames up to 8 bytes
+    ///  will be used as the actual data. The length (DLC) field in the data or remote
+    ///  frame will be set to the actual length of the ``data`` parameter. This allows
+    ///  to transmit data and remote frames with excess length. For remote frames only
+    ///  the length of the ``data`` parameter is used. The actual ``data`` bytes are
+    ///  ignored.
+    ///  
+    ///  Returns *true* if the frame was successfully added to the write queue. Returns
+    ///  *false* if the frame could not be added because write queue is already full or
+    ///  because the write buffer or the write backlog are configured with a size of
+    ///  zero (see <see cref="BrickletCANV2.TBrickletCANV2.SetQueueConfiguration"/>).
+    ///  
+    ///  The write queue can overflow if frames are written to it at a higher rate
+    ///  than the Bricklet can transmitted them over the CAN transceiver. This may
+    ///  happen if the CAN transceiver is configured as read-only or is using a low baud
+    ///  rate (see <see cref="BrickletCANV2.TBrickletCANV2.SetTransceiverConfiguration"/>). It can also happen if the CAN
+    ///  bus is congested and the frame cannot be transmitted because it constantly loses
+    ///  arbitration or because the CAN transceiver is currently disabled due to a high
+    ///  write error level (see <see cref="BrickletCANV2.TBrickletCANV2.GetErrorLog"/>).
+    /// </summary>
+    function WriteFrame(const frameType: byte; const identifier: longword; const data: array of byte): boolean; virtual;
+
+    /// <summary>
+    ///  Tries to read the next data or remote frame from the read queue and returns it.
+    ///  If a frame was successfully read, then the ``success`` return value is set to
+    ///  *true* and the other return values contain the frame. If the read queue is
+    ///  empty and no frame could be read, then the ``success`` return value is set to
+    ///  *false* and the other return values contain invalid data.
+    ///  
+    ///  The ``identifier`` return value follows the identifier format described for
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.WriteFrame"/>.
+    ///  
+    ///  The ``data`` return value can be up to 15 bytes long. For data frames up to the
+    ///  first 8 bytes are the actual received data. All bytes after the 8th byte are
+    ///  always zero and only there to indicate the length of a data or remote frame
+    ///  with excess length. For remote frames the length of the ``data`` return value
+    ///  represents the requested length. The actual ``data`` bytes are always zero.
+    ///  
+    ///  A configurable read filter can be used to define which frames should be
+    ///  received by the CAN transceiver and put into the read queue (see
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.SetReadFilterConfiguration"/>).
+    ///  
+    ///  Instead of polling with this function, you can also use callbacks. See the
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.SetFrameReadCallbackConfiguration"/> function and the <see cref="BrickletCANV2.TBrickletCANV2.OnFrameRead"/>
+    ///  callback.
+    /// </summary>
+    procedure ReadFrameLowLevel(out success: boolean; out frameType: byte; out identifier: longword; out dataLength: byte; out dataData: TArray0To14OfUInt8); virtual;
+
+    /// <summary>
+    ///  Tries to read the next data or remote frame from the read queue and returns it.
+    ///  If a frame was successfully read, then the ``success`` return value is set to
+    ///  *true* and the other return values contain the frame. If the read queue is
+    ///  empty and no frame could be read, then the ``success`` return value is set to
+    ///  *false* and the other return values contain invalid data.
+    ///  
+    ///  The ``identifier`` return value follows the identifier format described for
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.WriteFrame"/>.
+    ///  
+    ///  The ``data`` return value can be up to 15 bytes long. For data frames up to the
+    ///  first 8 bytes are the actual received data. All bytes after the 8th byte are
+    ///  always zero and only there to indicate the length of a data or remote frame
+    ///  with excess length. For remote frames the length of the ``data`` return value
+    ///  represents the requested length. The actual ``data`` bytes are always zero.
+    ///  
+    ///  A configurable read filter can be used to define which frames should be
+    ///  received by the CAN transceiver and put into the read queue (see
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.SetReadFilterConfiguration"/>).
+    ///  
+    ///  Instead of polling with this function, you can also use callbacks. See the
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.SetFrameReadCallbackConfiguration"/> function and the <see cref="BrickletCANV2.TBrickletCANV2.OnFrameRead"/>
+    ///  callback.
+    /// </summary>
+    procedure ReadFrame(out success: boolean; out frameType: byte; out identifier: longword; out data: TArrayOfUInt8); virtual;
+
+    /// <summary>
+    ///  Enables and disables the <see cref="BrickletCANV2.TBrickletCANV2.OnFrameRead"/> callback.
+    ///  
+    ///  By default the callback is disabled. Enabling this callback will disable the <see cref="BrickletCANV2.TBrickletCANV2.OnFrameReadable"/> callback.
+    /// </summary>
+    procedure SetFrameReadCallbackConfiguration(const enabled: boolean); virtual;
+
+    /// <summary>
+    ///  Returns *true* if the <see cref="BrickletCANV2.TBrickletCANV2.OnFrameRead"/> callback is enabled, *false* otherwise.
+    /// </summary>
+    function GetFrameReadCallbackConfiguration: boolean; virtual;
+
+    /// <summary>
+    ///  Sets the transceiver configuration for the CAN bus communication.
+    ///  
+    ///  The CAN transceiver has three different modes:
+    ///  
+    ///  * Normal: Reads from and writes to the CAN bus and performs active bus
+    ///    error detection and acknowledgement.
+    ///  * Loopback: All reads and writes are performed internally. The transceiver
+    ///    is disconnected from the actual CAN bus.
+    ///  * Read-Only: Only reads from the CAN bus, but does neither active bus error
+    ///    detection nor acknowledgement. Only the receiving part of the transceiver
+    ///    is connected to the CAN bus.
+    /// </summary>
+    procedure SetTransceiverConfiguration(const baudRate: longword; const samplePoint: word; const transceiverMode: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletCANV2.TBrickletCANV2.SetTransceiverConfiguration"/>.
+    /// </summary>
+    procedure GetTransceiverConfiguration(out baudRate: longword; out samplePoint: word; out transceiverMode: byte); virtual;
+
+    /// <summary>
+    ///  Sets the write and read queue configuration.
+    ///  
+    ///  The CAN transceiver has 32 buffers in total in hardware for transmitting and
+    ///  receiving frames. Additionally, the Bricklet has a backlog for 768 frames in
+    ///  total in software. The buffers and the backlog can be freely assigned to the
+    ///  write and read queues.
+    ///  
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.WriteFrame"/> writes a frame into the write backlog. The Bricklet moves
+    ///  the frame from the backlog into a free write buffer. The CAN transceiver then
+    ///  transmits the frame from the write buffer to the CAN bus. If there are no
+    ///  write buffers (``write_buffer_size`` is zero) or there is no write backlog
+    ///  (``write_backlog_size`` is zero) then no frames can be transmitted and
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.WriteFrame"/> returns always *false*.
+    ///  
+    ///  The CAN transceiver receives a frame from the CAN bus and stores it into a
+    ///  free read buffer. The Bricklet moves the frame from the read buffer into the
+    ///  read backlog. <see cref="BrickletCANV2.TBrickletCANV2.ReadFrame"/> reads the frame from the read backlog and
+    ///  returns it. If there are no read buffers (``read_buffer_sizes`` is empty) or
+    ///  there is no read backlog (``read_backlog_size`` is zero) then no frames can be
+    ///  received and <see cref="BrickletCANV2.TBrickletCANV2.ReadFrame"/> returns always *false*.
+    ///  
+    ///  There can be multiple read buffers, because the CAN transceiver cannot receive
+    ///  data and remote frames into the same read buffer. A positive read buffer size
+    ///  represents a data frame read buffer and a negative read buffer size represents
+    ///  a remote frame read buffer. A read buffer size of zero is not allowed. By
+    ///  default the first read buffer is configured for data frames and the second read
+    ///  buffer is configured for remote frame. There can be up to 32 different read
+    ///  buffers, assuming that no write buffer is used. Each read buffer has its own
+    ///  filter configuration (see <see cref="BrickletCANV2.TBrickletCANV2.SetReadFilterConfiguration"/>).
+    ///  
+    ///  A valid queue configuration fulfills these conditions::
+    ///  
+    ///   write_buffer_size + abs(read_buffer_size_0) + abs(read_buffer_size_1) + ... + abs(read_buffer_size_31) &lt;= 32
+    ///   write_backlog_size + read_backlog_size &lt;= 768
+    ///  
+    ///  The write buffer timeout has three different modes that define how a failed
+    ///  frame transmission should be handled:
+    ///  
+    ///  * Single-Shot (&lt; 0): Only one transmission attempt will be made. If the
+    ///    transmission fails then the frame is discarded.
+    ///  * Infinite (= 0): Infinite transmission attempts will be made. The frame will
+    ///    never be discarded.
+    ///  * Milliseconds (&gt; 0): A limited number of transmission attempts will be made.
+    ///    If the frame could not be transmitted successfully after the configured
+    ///    number of milliseconds then the frame is discarded.
+    ///  
+    ///  The current content of the queues is lost when this function is called.
+    /// </summary>
+    procedure SetQueueConfigurationLowLevel(const writeBufferSize: byte; const writeBufferTimeout: longint; const writeBacklogSize: word; const readBufferSizesLength: byte; const readBufferSizesData: TArray0To31OfInt8; const readBacklogSize: word); virtual;
+
+    /// <summary>
+    ///  Sets the write and read queue configuration.
+    ///  
+    ///  The CAN transceiver has 32 buffers in total in hardware for transmitting and
+    ///  receiving frames. Additionally, the Bricklet has a backlog for 768 frames in
+    ///  total in software. The buffers and the backlog can be freely assigned to the
+    ///  write and read queues.
+    ///  
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.WriteFrame"/> writes a frame into the write backlog. The Bricklet moves
+    ///  the frame from the backlog into a free write buffer. The CAN transceiver then
+    ///  transmits the frame from the write buffer to the CAN bus. If there are no
+    ///  write buffers (``write_buffer_size`` is zero) or there is no write backlog
+    ///  (``write_backlog_size`` is zero) then no frames can be transmitted and
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.WriteFrame"/> returns always *false*.
+    ///  
+    ///  The CAN transceiver receives a frame from the CAN bus and stores it into a
+    ///  free read buffer. The Bricklet moves the frame from the read buffer into the
+    ///  read backlog. <see cref="BrickletCANV2.TBrickletCANV2.ReadFrame"/> reads the frame from the read backlog and
+    ///  returns it. If there are no read buffers (``read_buffer_sizes`` is empty) or
+    ///  there is no read backlog (``read_backlog_size`` is zero) then no frames can be
+    ///  received and <see cref="BrickletCANV2.TBrickletCANV2.ReadFrame"/> returns always *false*.
+    ///  
+    ///  There can be multiple read buffers, because the CAN transceiver cannot receive
+    ///  data and remote frames into the same read buffer. A positive read buffer size
+    ///  represents a data frame read buffer and a negative read buffer size represents
+    ///  a remote frame read buffer. A read buffer size of zero is not allowed. By
+    ///  default the first read buffer is configured for data frames and the second read
+    ///  buffer is configured for remote frame. There can be up to 32 different read
+    ///  buffers, assuming that no write buffer is used. Each read buffer has its own
+    ///  filter configuration (see <see cref="BrickletCANV2.TBrickletCANV2.SetReadFilterConfiguration"/>).
+    ///  
+    ///  A valid queue configuration fulfills these conditions::
+    ///  
+    ///   write_buffer_size + abs(read_buffer_size_0) + abs(read_buffer_size_1) + ... + abs(read_buffer_size_31) &lt;= 32
+    ///   write_backlog_size + read_backlog_size &lt;= 768
+    ///  
+    ///  The write buffer timeout has three different modes that define how a failed
+    ///  frame transmission should be handled:
+    ///  
+    ///  * Single-Shot (&lt; 0): Only one transmission attempt will be made. If the
+    ///    transmission fails then the frame is discarded.
+    ///  * Infinite (= 0): Infinite transmission attempts will be made. The frame will
+    ///    never be discarded.
+    ///  * Milliseconds (&gt; 0): A limited number of transmission attempts will be made.
+    ///    If the frame could not be transmitted successfully after the configured
+    ///    number of milliseconds then the frame is discarded.
+    ///  
+    ///  The current content of the queues is lost when this function is called.
+    /// </summary>
+    procedure SetQueueConfiguration(const writeBufferSize: byte; const writeBufferTimeout: longint; const writeBacklogSize: word; const readBufferSizes: array of shortint; const readBacklogSize: word); virtual;
+
+    /// <summary>
+    ///  Returns the queue configuration as set by <see cref="BrickletCANV2.TBrickletCANV2.SetQueueConfiguration"/>.
+    /// </summary>
+    procedure GetQueueConfigurationLowLevel(out writeBufferSize: byte; out writeBufferTimeout: longint; out writeBacklogSize: word; out readBufferSizesLength: byte; out readBufferSizesData: TArray0To31OfInt8; out readBacklogSize: word); virtual;
+
+    /// <summary>
+    ///  Returns the queue configuration as set by <see cref="BrickletCANV2.TBrickletCANV2.SetQueueConfiguration"/>.
+    /// </summary>
+    procedure GetQueueConfiguration(out writeBufferSize: byte; out writeBufferTimeout: longint; out writeBacklogSize: word; out readBufferSizes: TArrayOfInt8; out readBacklogSize: word); virtual;
+
+    /// <summary>
+    ///  Set the read filter configuration for the given read buffer index. This can be
+    ///  used to define which frames should be received by the CAN transceiver and put
+    ///  into the read buffer.
+    ///  
+    ///  The read filter has four different modes that define if and how the filter mask
+    ///  and the filter identifier are applied:
+    ///  
+    ///  * Accept-All: All frames are received.
+    ///  * Match-Standard-Only: Only standard frames with a matching identifier are
+    ///    received.
+    ///  * Match-Extended-Only: Only extended frames with a matching identifier are
+    ///    received.
+    ///  * Match-Standard-And-Extended: Standard and extended frames with a matching
+    ///    identifier are received.
+    ///  
+    ///  The filter mask and filter identifier are used as bit masks. Their usage
+    ///  depends on the mode:
+    ///  
+    ///  * Accept-All: Mask and identifier are ignored.
+    ///  * Match-Standard-Only: Bit 0 to 10 (11 bits) of filter mask and filter
+    ///    identifier are used to match the 11-bit identifier of standard frames.
+    ///  * Match-Extended-Only: Bit 0 to 28 (29 bits) of filter mask and filter
+    ///    identifier are used to match the 29-bit identifier of extended frames.
+    ///  * Match-Standard-And-Extended: Bit 18 to 28 (11 bits) of filter mask and filter
+    ///    identifier are used to match the 11-bit identifier of standard frames, bit 0
+    ///    to 17 (18 bits) are ignored in this case. Bit 0 to 28 (29 bits) of filter
+    ///    mask and filter identifier are used to match the 29-bit identifier of extended
+    ///    frames.
+    ///  
+    ///  The filter mask and filter identifier are applied in this way: The filter mask
+    ///  is used to select the frame identifier bits that should be compared to the
+    ///  corresponding filter identifier bits. All unselected bits are automatically
+    ///  accepted. All selected bits have to match the filter identifier to be accepted.
+    ///  If all bits for the selected mode are accepted then the frame is accepted and
+    ///  is added to the read buffer.
+    ///  
+    ///  <code>
+    ///   "Filter Mask Bit", "Filter Identifier Bit", "Frame Identifier Bit", "Result"
+    ///  
+    ///   0, X, X, Accept
+    ///   1, 0, 0, Accept
+    ///   1, 0, 1, Reject
+    ///   1, 1, 0, Reject
+    ///   1, 1, 1, Accept
+    ///  </code>
+    ///  
+    ///  For example, to receive standard frames with identifier 0x123 only, the mode
+    ///  can be set to Match-Standard-Only with 0x7FF as mask and 0x123 as identifier.
+    ///  The mask of 0x7FF selects all 11 identifier bits for matching so that the
+    ///  identifier has to be exactly 0x123 to be accepted.
+    ///  
+    ///  To accept identifier 0x123 and identifier 0x456 at the same time, just set
+    ///  filter 2 to 0x456 and keep mask and filter 1 unchanged.
+    ///  
+    ///  There can be up to 32 different read filters configured at the same time,
+    ///  because there can be up to 32 read buffer (see <see cref="BrickletCANV2.TBrickletCANV2.SetQueueConfiguration"/>).
+    ///  
+    ///  The default mode is accept-all for all read buffers.
+    /// </summary>
+    procedure SetReadFilterConfiguration(const bufferIndex: byte; const filterMode: byte; const filterMask: longword; const filterIdentifier: longword); virtual;
+
+    /// <summary>
+    ///  Returns the read filter configuration as set by <see cref="BrickletCANV2.TBrickletCANV2.SetReadFilterConfiguration"/>.
+    /// </summary>
+    procedure GetReadFilterConfiguration(const bufferIndex: byte; out filterMode: byte; out filterMask: longword; out filterIdentifier: longword); virtual;
+
+    /// <summary>
+    ///  Returns information about different kinds of errors.
+    ///  
+    ///  The write and read error levels indicate the current level of stuffing, form,
+    ///  acknowledgement, bit and checksum errors during CAN bus write and read
+    ///  operations. For each of this error kinds there is also an individual counter.
+    ///  
+    ///  When the write error level extends 255 then the CAN transceiver gets disabled
+    ///  and no frames can be transmitted or received anymore. The CAN transceiver will
+    ///  automatically be activated again after the CAN bus is idle for a while.
+    ///  
+    ///  The write buffer timeout, read buffer and backlog overflow counts represents the
+    ///  number of these errors:
+    ///  
+    ///  * A write buffer timeout occurs if a frame could not be transmitted before the
+    ///    configured write buffer timeout expired (see <see cref="BrickletCANV2.TBrickletCANV2.SetQueueConfiguration"/>).
+    ///  * A read buffer overflow occurs if a read buffer of the CAN transceiver
+    ///    still contains the last received frame when the next frame arrives. In this
+    ///    case the last received frame is lost. This happens if the CAN transceiver
+    ///    receives more frames than the Bricklet can handle. Using the read filter
+    ///    (see <see cref="BrickletCANV2.TBrickletCANV2.SetReadFilterConfiguration"/>) can help to reduce the amount of
+    ///    received frames. This count is not exact, but a lower bound, because the
+    ///    Bricklet might not able detect all overflows if they occur in rapid succession.
+    ///  * A read backlog overflow occurs if the read backlog of the Bricklet is already
+    ///    full when the next frame should be read from a read buffer of the CAN
+    ///    transceiver. In this case the frame in the read buffer is lost. This
+    ///    happens if the CAN transceiver receives more frames to be added to the read
+    ///    backlog than are removed from the read backlog using the <see cref="BrickletCANV2.TBrickletCANV2.ReadFrame"/>
+    ///    function. Using the <see cref="BrickletCANV2.TBrickletCANV2.OnFrameRead"/> callback ensures that the read backlog
+    ///    can not overflow.
+    ///  
+    ///  The read buffer overflow counter counts the overflows of all configured read
+    ///  buffers. Which read buffer exactly suffered from an overflow can be figured
+    ///  out from the read buffer overflow occurrence list
+    ///  (``read_buffer_overflow_error_occurred``). Reading the error log clears the
+    ///  occurence list.
+    /// </summary>
+    procedure GetErrorLogLowLevel(out transceiverState: byte; out transceiverWriteErrorLevel: byte; out transceiverReadErrorLevel: byte; out transceiverStuffingErrorCount: longword; out transceiverFormatErrorCount: longword; out transceiverACKErrorCount: longword; out transceiverBit1ErrorCount: longword; out transceiverBit0ErrorCount: longword; out transceiverCRCErrorCount: longword; out writeBufferTimeoutErrorCount: longword; out readBufferOverflowErrorCount: longword; out readBufferOverflowErrorOccurredLength: byte; out readBufferOverflowErrorOccurredData: TArray0To31OfBoolean; out readBacklogOverflowErrorCount: longword); virtual;
+
+    /// <summary>
+    ///  Returns information about different kinds of errors.
+    ///  
+    ///  The write and read error levels indicate the current level of stuffing, form,
+    ///  acknowledgement, bit and checksum errors during CAN bus write and read
+    ///  operations. For each of this error kinds there is also an individual counter.
+    ///  
+    ///  When the write error level extends 255 then the CAN transceiver gets disabled
+    ///  and no frames can be transmitted or received anymore. The CAN transceiver will
+    ///  automatically be activated again after the CAN bus is idle for a while.
+    ///  
+    ///  The write buffer timeout, read buffer and backlog overflow counts represents the
+    ///  number of these errors:
+    ///  
+    ///  * A write buffer timeout occurs if a frame could not be transmitted before the
+    ///    configured write buffer timeout expired (see <see cref="BrickletCANV2.TBrickletCANV2.SetQueueConfiguration"/>).
+    ///  * A read buffer overflow occurs if a read buffer of the CAN transceiver
+    ///    still contains the last received frame when the next frame arrives. In this
+    ///    case the last received frame is lost. This happens if the CAN transceiver
+    ///    receives more frames than the Bricklet can handle. Using the read filter
+    ///    (see <see cref="BrickletCANV2.TBrickletCANV2.SetReadFilterConfiguration"/>) can help to reduce the amount of
+    ///    received frames. This count is not exact, but a lower bound, because the
+    ///    Bricklet might not able detect all overflows if they occur in rapid succession.
+    ///  * A read backlog overflow occurs if the read backlog of the Bricklet is already
+    ///    full when the next frame should be read from a read buffer of the CAN
+    ///    transceiver. In this case the frame in the read buffer is lost. This
+    ///    happens if the CAN transceiver receives more frames to be added to the read
+    ///    backlog than are removed from the read backlog using the <see cref="BrickletCANV2.TBrickletCANV2.ReadFrame"/>
+    ///    function. Using the <see cref="BrickletCANV2.TBrickletCANV2.OnFrameRead"/> callback ensures that the read backlog
+    ///    can not overflow.
+    ///  
+    ///  The read buffer overflow counter counts the overflows of all configured read
+    ///  buffers. Which read buffer exactly suffered from an overflow can be figured
+    ///  out from the read buffer overflow occurrence list
+    ///  (``read_buffer_overflow_error_occurred``). Reading the error log clears the
+    ///  occurence list.
+    /// </summary>
+    procedure GetErrorLog(out transceiverState: byte; out transceiverWriteErrorLevel: byte; out transceiverReadErrorLevel: byte; out transceiverStuffingErrorCount: longword; out transceiverFormatErrorCount: longword; out transceiverACKErrorCount: longword; out transceiverBit1ErrorCount: longword; out transceiverBit0ErrorCount: longword; out transceiverCRCErrorCount: longword; out writeBufferTimeoutErrorCount: longword; out readBufferOverflowErrorCount: longword; out readBufferOverflowErrorOccurred: TArrayOfBoolean; out readBacklogOverflowErrorCount: longword); virtual;
+
+    /// <summary>
+    ///  Sets the communication LED configuration. By default the LED shows
+    ///  CAN-Bus traffic, it flickers once for every 40 transmitted or received frames.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is off.
+    /// </summary>
+    procedure SetCommunicationLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletCANV2.TBrickletCANV2.SetCommunicationLEDConfig"/>
+    /// </summary>
+    function GetCommunicationLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Sets the error LED configuration.
+    ///  
+    ///  By default (show-transceiver-state) the error LED turns on if the CAN
+    ///  transceiver is passive or disabled state (see <see cref="BrickletCANV2.TBrickletCANV2.GetErrorLog"/>). If
+    ///  the CAN transceiver is in active state the LED turns off.
+    ///  
+    ///  If the LED is configured as show-error then the error LED turns on if any error
+    ///  occurs. If you call this function with the show-error option again, the LED will
+    ///  turn off until the next error occurs.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is off.
+    /// </summary>
+    procedure SetErrorLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletCANV2.TBrickletCANV2.SetErrorLEDConfig"/>.
+    /// </summary>
+    function GetErrorLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Enables and disables the <see cref="BrickletCANV2.TBrickletCANV2.OnFrameReadable"/> callback.
+    ///  
+    ///  By default the callback is disabled. Enabling this callback will disable the <see cref="BrickletCANV2.TBrickletCANV2.OnFrameRead"/> callback.
+    ///  
+    ///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+    /// </summary>
+    procedure SetFrameReadableCallbackConfiguration(const enabled: boolean); virtual;
+
+    /// <summary>
+    ///  Returns *true* if the <see cref="BrickletCANV2.TBrickletCANV2.OnFrameReadable"/> callback is enabled, *false* otherwise.
+    ///  
+    ///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+    /// </summary>
+    function GetFrameReadableCallbackConfiguration: boolean; virtual;
+
+    /// <summary>
+    ///  Enables and disables the <see cref="BrickletCANV2.TBrickletCANV2.OnErrorOccurred"/> callback.
+    ///  
+    ///  By default the callback is disabled.
+    ///  
+    ///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+    /// </summary>
+    procedure SetErrorOccurredCallbackConfiguration(const enabled: boolean); virtual;
+
+    /// <summary>
+    ///  Returns *true* if the <see cref="BrickletCANV2.TBrickletCANV2.OnErrorOccurred"/> callback is enabled, *false* otherwise.
+    ///  
+    ///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+    /// </summary>
+    function GetErrorOccurredCallbackConfiguration: boolean; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletCANV2.TBrickletCANV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletCANV2.TBrickletCANV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletCANV2.TBrickletCANV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.OnFrameRead"/>
+    /// </summary>
+    property OnFrameReadLowLevel: TBrickletCANV2NotifyFrameReadLowLevel read frameReadLowLevelCallback write frameReadLowLevelCallback;
+
+    /// <summary>
+    ///  This callback is triggered if a data or remote frame was received by the CAN
+    ///  transceiver.
+    ///  
+    ///  The ``identifier`` return value follows the identifier format described for
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.WriteFrame"/>.
+    ///  
+    ///  For details on the ``data`` return value see <see cref="BrickletCANV2.TBrickletCANV2.ReadFrame"/>.
+    ///  
+    ///  A configurable read filter can be used to define which frames should be
+    ///  received by the CAN transceiver and put into the read queue (see
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.SetReadFilterConfiguration"/>).
+    ///  
+    ///  To enable this callback, use <see cref="BrickletCANV2.TBrickletCANV2.SetFrameReadCallbackConfiguration"/>.
+    ///  
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for data.
+    ///  </note>
+    /// </summary>
+    property OnFrameRead: TBrickletCANV2NotifyFrameRead read frameReadCallback write frameReadCallback;
+
+    /// <summary>
+    ///  This callback is triggered if a data or remote frame was received by the CAN
+    ///  transceiver. The received frame can be read with <see cref="BrickletCANV2.TBrickletCANV2.ReadFrame"/>.
+    ///  If additional frames are received, but <see cref="BrickletCANV2.TBrickletCANV2.ReadFrame"/> was not called yet, the callback
+    ///  will not trigger again.
+    ///  
+    ///  A configurable read filter can be used to define which frames should be
+    ///  received by the CAN transceiver and put into the read queue (see
+    ///  <see cref="BrickletCANV2.TBrickletCANV2.SetReadFilterConfiguration"/>).
+    ///  
+    ///  To enable this callback, use <see cref="BrickletCANV2.TBrickletCANV2.SetFrameReadableCallbackConfiguration"/>.
+    ///  
+    ///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+    /// </summary>
+    property OnFrameReadable: TBrickletCANV2NotifyFrameReadable read frameReadableCallback write frameReadableCallback;
+
+    /// <summary>
+    ///  This callback is triggered if any error occurred while writing, reading or transmitting CAN frames.
+    ///  
+    ///  The callback is only triggered once until <see cref="BrickletCANV2.TBrickletCANV2.GetErrorLog"/> is called. That function will return
+    ///  details abount the error(s) occurred.
+    ///  
+    ///  To enable this callback, use <see cref="BrickletCANV2.TBrickletCANV2.SetErrorOccurredCallbackConfiguration"/>.
+    ///  
+    ///  .. versionadded:: 2.0.3$nbsp;(Plugin)
+    /// </summary>
+    property OnErrorOccurred: TBrickletCANV2NotifyErrorOccurred read errorOccurredCallback write errorOccurredCallback;
+  end;
+
+implementation
+
+constructor TBrickletCANV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_CAN_V2_DEVICE_IDENTIFIER, BRICKLET_CAN_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 1;
+
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_WRITE_FRAME_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_READ_FRAME_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_SET_FRAME_READ_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_FRAME_READ_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_SET_TRANSCEIVER_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_TRANSCEIVER_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_SET_QUEUE_CONFIGURATION_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_QUEUE_CONFIGURATION_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_SET_READ_FILTER_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_READ_FILTER_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_ERROR_LOG_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_SET_COMMUNICATION_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_COMMUNICATION_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_SET_ERROR_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_ERROR_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_SET_ERROR_OCCURRED_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_ERROR_OCCURRED_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_CAN_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  streamMutex := TCriticalSection.Create;
+
+  SetLength(frameReadHighLevelCallbackState.data, 0);
+  frameReadHighLevelCallbackState.data := nil;
+  frameReadHighLevelCallbackState.length := 0;
+
+  callbackWrappers[BRICKLET_CAN_V2_CALLBACK_FRAME_READ_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperFrameReadLowLevel;
+  callbackWrappers[BRICKLET_CAN_V2_CALLBACK_FRAME_READABLE] := {$ifdef FPC}@{$endif}CallbackWrapperFrameReadable;
+  callbackWrappers[BRICKLET_CAN_V2_CALLBACK_ERROR_OCCURRED] := {$ifdef FPC}@{$endif}CallbackWrapperErrorOccurred;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletCANV2.WriteFrameLowLevel(const frameType: byte; const identifier: longword; const dataLength: byte; const dataData: TArray0To14OfUInt8): boolean;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_WRITE_FRAME_LOW_LEVEL, 29);
+  LEConvertUInt8To(frameType, 8, request);
+  LEConvertUInt32To(identifier, 9, request);
+  LEConvertUInt8To(dataLength, 13, request);
+  for i := 0 to Length(dataData) - 1 do LEConvertUInt8To(dataData[i], 14 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+function TBrickletCANV2.WriteFrame(const frameType: byte; const identifier: longword; const data: array of byte): boolean;
+var
+  dataLength: byte;
+  dataData: TArray0To14OfUInt8;
+begin
+  if (Length(data) > 15) then begin
+    raise EInvalidParameterException.Create('Data can be at most 15 items long');
+  end;
+
+  dataLength := Length(data);
+
+  FillChar(dataData[0], SizeOf(byte) * 15, 0);
+  Move(data[0], dataData[0], SizeOf(byte) * dataLength);
+
+  result := WriteFrameLowLevel(frameType, identifier, dataLength, dataData);
+end;
+
+procedure TBrickletCANV2.ReadFrameLowLevel(out success: boolean; out frameType: byte; out identifier: longword; out dataLength: byte; out dataData: TArray0To14OfUInt8);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_READ_FRAME_LOW_LEVEL, 8);
+  response := SendRequest(request, 30);
+  success := LEConvertBooleanFrom(8, response);
+  frameType := LEConvertUInt8From(9, response);
+  identifier := LEConvertUInt32From(10, response);
+  dataLength := LEConvertUInt8From(14, response);
+  for i := 0 to 14 do dataData[i] := LEConvertUInt8From(15 + (i * 1), response);
+end;
+
+procedure TBrickletCANV2.ReadFrame(out success: boolean; out frameType: byte; out identifier: longword; out data: TArrayOfUInt8);
+var
+  dataLength: byte;
+  dataData: TArray0To14OfUInt8;
+begin
+  ReadFrameLowLevel(success, frameType, identifier, dataLength, dataData);
+  SetLength(data, dataLength);
+  Move(dataData, data[0], SizeOf(byte) * dataLength);
+end;
+
+procedure TBrickletCANV2.SetFrameReadCallbackConfiguration(const enabled: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_SET_FRAME_READ_CALLBACK_CONFIGURATION, 9);
+  LEConvertBooleanTo(enabled, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletCANV2.GetFrameReadCallbackConfiguration: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_FRAME_READ_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletCANV2.SetTransceiverConfiguration(const baudRate: longword; const samplePoint: word; const transceiverMode: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_SET_TRANSCEIVER_CONFIGURATION, 15);
+  LEConvertUInt32To(baudRate, 8, request);
+  LEConvertUInt16To(samplePoint, 12, request);
+  LEConvertUInt8To(transceiverMode, 14, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletCANV2.GetTransceiverConfiguration(out baudRate: longword; out samplePoint: word; out transceiverMode: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_TRANSCEIVER_CONFIGURATION, 8);
+  response := SendRequest(request, 15);
+  baudRate := LEConvertUInt32From(8, response);
+  samplePoint := LEConvertUInt16From(12, response);
+  transceiverMode := LEConvertUInt8From(14, response);
+end;
+
+procedure TBrickletCANV2.SetQueueConfigurationLowLevel(const writeBufferSize: byte; const writeBufferTimeout: longint; const writeBacklogSize: word; const readBufferSizesLength: byte; const readBufferSizesData: TArray0To31OfInt8; const readBacklogSize: word);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_SET_QUEUE_CONFIGURATION_LOW_LEVEL, 50);
+  LEConvertUInt8To(writeBufferSize, 8, request);
+  LEConvertInt32To(writeBufferTimeout, 9, request);
+  LEConvertUInt16To(writeBacklogSize, 13, request);
+  LEConvertUInt8To(readBufferSizesLength, 15, request);
+  for i := 0 to Length(readBufferSizesData) - 1 do LEConvertInt8To(readBufferSizesData[i], 16 + (i * 1), request);
+  LEConvertUInt16To(readBacklogSize, 48, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletCANV2.SetQueueConfiguration(const writeBufferSize: byte; const writeBufferTimeout: longint; const writeBacklogSize: word; const readBufferSizes: array of shortint; const readBacklogSize: word);
+var
+  readBufferSizesLength: byte;
+  readBufferSizesData: TArray0To31OfInt8;
+begin
+  if (Length(readBufferSizes) > 32) then begin
+    raise EInvalidParameterException.Create('Read Buffer Sizes can be at most 32 items long');
+  end;
+
+  readBufferSizesLength := Length(readBufferSizes);
+
+  FillChar(readBufferSizesData[0], SizeOf(shortint) * 32, 0);
+  Move(readBufferSizes[0], readBufferSizesData[0], SizeOf(shortint) * readBufferSizesLength);
+
+  SetQueueConfigurationLowLevel(writeBufferSize, writeBufferTimeout, writeBacklogSize, readBufferSizesLength, readBufferSizesData, readBacklogSize);
+end;
+
+procedure TBrickletCANV2.GetQueueConfigurationLowLevel(out writeBufferSize: byte; out writeBufferTimeout: longint; out writeBacklogSize: word; out readBufferSizesLength: byte; out readBufferSizesData: TArray0To31OfInt8; out readBacklogSize: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_QUEUE_CONFIGURATION_LOW_LEVEL, 8);
+  response := SendRequest(request, 50);
+  writeBufferSize := LEConvertUInt8From(8, response);
+  writeBufferTimeout := LEConvertInt32From(9, response);
+  writeBacklogSize := LEConvertUInt16From(13, response);
+  readBufferSizesLength := LEConvertUInt8From(15, response);
+  for i := 0 to 31 do readBufferSizesData[i] := LEConvertInt8From(16 + (i * 1), response);
+  readBacklogSize := LEConvertUInt16From(48, response);
+end;
+
+procedure TBrickletCANV2.GetQueueConfiguration(out writeBufferSize: byte; out writeBufferTimeout: longint; out writeBacklogSize: word; out readBufferSizes: TArrayOfInt8; out readBacklogSize: word);
+var
+  readBufferSizesLength: byte;
+  readBufferSizesData: TArray0To31OfInt8;
+begin
+  GetQueueConfigurationLowLevel(writeBufferSize, writeBufferTimeout, writeBacklogSize, readBufferSizesLength, readBufferSizesData, readBacklogSize);
+  SetLength(readBufferSizes, readBufferSizesLength);
+  Move(readBufferSizesData, readBufferSizes[0], SizeOf(shortint) * readBufferSizesLength);
+end;
+
+procedure TBrickletCANV2.SetReadFilterConfiguration(const bufferIndex: byte; const filterMode: byte; const filterMask: longword; const filterIdentifier: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_SET_READ_FILTER_CONFIGURATION, 18);
+  LEConvertUInt8To(bufferIndex, 8, request);
+  LEConvertUInt8To(filterMode, 9, request);
+  LEConvertUInt32To(filterMask, 10, request);
+  LEConvertUInt32To(filterIdentifier, 14, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletCANV2.GetReadFilterConfiguration(const bufferIndex: byte; out filterMode: byte; out filterMask: longword; out filterIdentifier: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_READ_FILTER_CONFIGURATION, 9);
+  LEConvertUInt8To(bufferIndex, 8, request);
+  response := SendRequest(request, 17);
+  filterMode := LEConvertUInt8From(8, response);
+  filterMask := LEConvertUInt32From(9, response);
+  filterIdentifier := LEConvertUInt32From(13, response);
+end;
+
+procedure TBrickletCANV2.GetErrorLogLowLevel(out transceiverState: byte; out transceiverWriteErrorLevel: byte; out transceiverReadErrorLevel: byte; out transceiverStuffingErrorCount: longword; out transceiverFormatErrorCount: longword; out transceiverACKErrorCount: longword; out transceiverBit1ErrorCount: longword; out transceiverBit0ErrorCount: longword; out transceiverCRCErrorCount: longword; out writeBufferTimeoutErrorCount: longword; out readBufferOverflowErrorCount: longword; out readBufferOverflowErrorOccurredLength: byte; out readBufferOverflowErrorOccurredData: TArray0To31OfBoolean; out readBacklogOverflowErrorCount: longword);
+var request, response: TByteArray; i: longint; readBufferOverflowErrorOccurredDataBits: array [0..3] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_ERROR_LOG_LOW_LEVEL, 8);
+  response := SendRequest(request, 52);
+  transceiverState := LEConvertUInt8From(8, response);
+  transceiverWriteErrorLevel := LEConvertUInt8From(9, response);
+  transceiverReadErrorLevel := LEConvertUInt8From(10, response);
+  transceiverStuffingErrorCount := LEConvertUInt32From(11, response);
+  transceiverFormatErrorCount := LEConvertUInt32From(15, response);
+  transceiverACKErrorCount := LEConvertUInt32From(19, response);
+  transceiverBit1ErrorCount := LEConvertUInt32From(23, response);
+  transceiverBit0ErrorCount := LEConvertUInt32From(27, response);
+  transceiverCRCErrorCount := LEConvertUInt32From(31, response);
+  writeBufferTimeoutErrorCount := LEConvertUInt32From(35, response);
+  readBufferOverflowErrorCount := LEConvertUInt32From(39, response);
+  readBufferOverflowErrorOccurredLength := LEConvertUInt8From(43, response);
+  FillChar(readBufferOverflowErrorOccurredDataBits[0], Length(readBufferOverflowErrorOccurredDataBits) * SizeOf(readBufferOverflowErrorOccurredDataBits[0]), 0);
+  for i := 0 to 3 do readBufferOverflowErrorOccurredDataBits[i] := LEConvertUInt8From(44 + (i * 1), response);
+  for i := 0 to 31 do readBufferOverflowErrorOccurredData[i] := ((readBufferOverflowErrorOccurredDataBits[Floor(i / 8)] and (1 shl (i mod 8))) <> 0);
+  readBacklogOverflowErrorCount := LEConvertUInt32From(48, response);
+end;
+
+procedure TBrickletCANV2.GetErrorLog(out transceiverState: byte; out transceiverWriteErrorLevel: byte; out transceiverReadErrorLevel: byte; out transceiverStuffingErrorCount: longword; out transceiverFormatErrorCount: longword; out transceiverACKErrorCount: longword; out transceiverBit1ErrorCount: longword; out transceiverBit0ErrorCount: longword; out transceiverCRCErrorCount: longword; out writeBufferTimeoutErrorCount: longword; out readBufferOverflowErrorCount: longword; out readBufferOverflowErrorOccurred: TArrayOfBoolean; out readBacklogOverflowErrorCount: longword);
+var
+  readBufferOverflowErrorOccurredLength: byte;
+  readBufferOverflowErrorOccurredData: TArray0To31OfBoolean;
+begin
+  GetErrorLogLowLevel(transceiverState, transceiverWriteErrorLevel, transceiverReadErrorLevel, transceiverStuffingErrorCount, transceiverFormatErrorCount, transceiverACKErrorCount, transceiverBit1ErrorCount, transceiverBit0ErrorCount, transceiverCRCErrorCount, writeBufferTimeoutErrorCount, readBufferOverflowErrorCount, readBufferOverflowErrorOccurredLength, readBufferOverflowErrorOccurredData, readBacklogOverflowErrorCount);
+  SetLength(readBufferOverflowErrorOccurred, readBufferOverflowErrorOccurredLength);
+  Move(readBufferOverflowErrorOccurredData, readBufferOverflowErrorOccurred[0], SizeOf(boolean) * readBufferOverflowErrorOccurredLength);
+end;
+
+procedure TBrickletCANV2.SetCommunicationLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_SET_COMMUNICATION_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletCANV2.GetCommunicationLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_COMMUNICATION_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletCANV2.SetErrorLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_SET_ERROR_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletCANV2.GetErrorLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_ERROR_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletCANV2.SetFrameReadableCallbackConfiguration(const enabled: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION, 9);
+  LEConvertBooleanTo(enabled, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletCANV2.GetFrameReadableCallbackConfiguration: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletCANV2.SetErrorOccurredCallbackConfiguration(const enabled: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_SET_ERROR_OCCURRED_CALLBACK_CONFIGURATION, 9);
+  LEConvertBooleanTo(enabled, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletCANV2.GetErrorOccurredCallbackConfiguration: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_ERROR_OCCURRED_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletCANV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletCANV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletCANV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletCANV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletCANV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletCANV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletCANV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletCANV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletCANV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletCANV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletCANV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletCANV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_CAN_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletCANV2.CallbackWrapperFrameReadLowLevel(const packet: TByteArray);
+var frameType: byte; identifier: longword; dataLength: byte; dataData: TArray0To14OfUInt8; i: longint;
+begin
+  if (Length(packet) <> 29) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  frameType := LEConvertUInt8From(8, packet);
+  identifier := LEConvertUInt32From(9, packet);
+  dataLength := LEConvertUInt8From(13, packet);
+  for i := 0 to 14 do dataData[i] := LEConvertUInt8From(14 + (i * 1), packet);
+
+  SetLength(frameReadHighLevelCallbackState.data, dataLength);
+  Move(dataData[0], frameReadHighLevelCallbackState.data[0], SizeOf(byte) * dataLength);
+  if (Assigned(frameReadCallback)) then begin
+    frameReadCallback(self, frameType, identifier, frameReadHighLevelCallbackState.data);
+  end;
+  SetLength(frameReadHighLevelCallbackState.data, 0);
+  frameReadHighLevelCallbackState.data := nil;
+  frameReadHighLevelCallbackState.length := 0;
+  if (Assigned(frameReadLowLevelCallback)) then begin
+    frameReadLowLevelCallback(self, frameType, identifier, dataLength, dataData);
+  end;
+end;
+
+procedure TBrickletCANV2.CallbackWrapperFrameReadable(const packet: TByteArray);
+begin
+  if (Length(packet) <> 8) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  if (Assigned(frameReadableCallback)) then begin
+    frameReadableCallback(self);
+  end;
+end;
+
+procedure TBrickletCANV2.CallbackWrapperErrorOccurred(const packet: TByteArray);
+begin
+  if (Length(packet) <> 8) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  if (Assigned(errorOccurredCallback)) then begin
+    errorOccurredCallback(self);
+  end;
+end;
+
+end.
@@ -0,0 +1,785 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletColorV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_COLOR_V2_DEVICE_IDENTIFIER = 2128;
+  BRICKLET_COLOR_V2_DEVICE_DISPLAY_NAME = 'Color Bricklet 2.0';
+
+  BRICKLET_COLOR_V2_FUNCTION_GET_COLOR = 1;
+  BRICKLET_COLOR_V2_FUNCTION_SET_COLOR_CALLBACK_CONFIGURATION = 2;
+  BRICKLET_COLOR_V2_FUNCTION_GET_COLOR_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_COLOR_V2_FUNCTION_GET_ILLUMINANCE = 5;
+  BRICKLET_COLOR_V2_FUNCTION_SET_ILLUMINANCE_CALLBACK_CONFIGURATION = 6;
+  BRICKLET_COLOR_V2_FUNCTION_GET_ILLUMINANCE_CALLBACK_CONFIGURATION = 7;
+  BRICKLET_COLOR_V2_FUNCTION_GET_COLOR_TEMPERATURE = 9;
+  BRICKLET_COLOR_V2_FUNCTION_SET_COLOR_TEMPERATURE_CALLBACK_CONFIGURATION = 10;
+  BRICKLET_COLOR_V2_FUNCTION_GET_COLOR_TEMPERATURE_CALLBACK_CONFIGURATION = 11;
+  BRICKLET_COLOR_V2_FUNCTION_SET_LIGHT = 13;
+  BRICKLET_COLOR_V2_FUNCTION_GET_LIGHT = 14;
+  BRICKLET_COLOR_V2_FUNCTION_SET_CONFIGURATION = 15;
+  BRICKLET_COLOR_V2_FUNCTION_GET_CONFIGURATION = 16;
+  BRICKLET_COLOR_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_COLOR_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_COLOR_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_COLOR_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_COLOR_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_COLOR_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_COLOR_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_COLOR_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_COLOR_V2_FUNCTION_RESET = 243;
+  BRICKLET_COLOR_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_COLOR_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_COLOR_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_COLOR_V2_CALLBACK_COLOR = 4;
+  BRICKLET_COLOR_V2_CALLBACK_ILLUMINANCE = 8;
+  BRICKLET_COLOR_V2_CALLBACK_COLOR_TEMPERATURE = 12;
+
+  BRICKLET_COLOR_V2_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_COLOR_V2_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_COLOR_V2_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_COLOR_V2_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_COLOR_V2_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_COLOR_V2_GAIN_1X = 0;
+  BRICKLET_COLOR_V2_GAIN_4X = 1;
+  BRICKLET_COLOR_V2_GAIN_16X = 2;
+  BRICKLET_COLOR_V2_GAIN_60X = 3;
+  BRICKLET_COLOR_V2_INTEGRATION_TIME_2MS = 0;
+  BRICKLET_COLOR_V2_INTEGRATION_TIME_24MS = 1;
+  BRICKLET_COLOR_V2_INTEGRATION_TIME_101MS = 2;
+  BRICKLET_COLOR_V2_INTEGRATION_TIME_154MS = 3;
+  BRICKLET_COLOR_V2_INTEGRATION_TIME_700MS = 4;
+  BRICKLET_COLOR_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_COLOR_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_COLOR_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_COLOR_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_COLOR_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_COLOR_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_COLOR_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_COLOR_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_COLOR_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_COLOR_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_COLOR_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_COLOR_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_COLOR_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_COLOR_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_COLOR_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletColorV2 = class;
+  TBrickletColorV2NotifyColor = procedure(sender: TBrickletColorV2; const r: word; const g: word; const b: word; const c: word) of object;
+  TBrickletColorV2NotifyIlluminance = procedure(sender: TBrickletColorV2; const illuminance: longword) of object;
+  TBrickletColorV2NotifyColorTemperature = procedure(sender: TBrickletColorV2; const colorTemperature: word) of object;
+
+  /// <summary>
+  ///  Measures color (RGB value), illuminance and color temperature
+  /// </summary>
+  TBrickletColorV2 = class(TDevice)
+  private
+    colorCallback: TBrickletColorV2NotifyColor;
+    illuminanceCallback: TBrickletColorV2NotifyIlluminance;
+    colorTemperatureCallback: TBrickletColorV2NotifyColorTemperature;
+  protected
+    procedure CallbackWrapperColor(const packet: TByteArray); virtual;
+    procedure CallbackWrapperIlluminance(const packet: TByteArray); virtual;
+    procedure CallbackWrapperColorTemperature(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the measured color of the sensor.
+    ///  
+    ///  The red (r), green (g), blue (b) and clear (c) colors are measured
+    ///  with four different photodiodes that are responsive at different
+    ///  wavelengths:
+    ///  
+    ///  .. image:: /Images/Bricklets/bricklet_color_wavelength_chart_600.jpg
+    ///     :scale: 100 %
+    ///     :alt: Chart Responsivity / Wavelength
+    ///     :align: center
+    ///     :target: ../../_images/Bricklets/bricklet_color_wavelength_chart_600.jpg
+    ///  
+    ///  If you want to get the color periodically, it is recommended
+    ///  to use the <see cref="BrickletColorV2.TBrickletColorV2.OnColor"/> callback and set the period with
+    ///  <see cref="BrickletColorV2.TBrickletColorV2.SetColorCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetColor(out r: word; out g: word; out b: word; out c: word); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletColorV2.TBrickletColorV2.OnColor"/>
+    ///  callback is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetColorCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by
+    ///  <see cref="BrickletColorV2.TBrickletColorV2.SetColorCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetColorCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the illuminance affected by the gain and integration time as
+    ///  set by <see cref="BrickletColorV2.TBrickletColorV2.SetConfiguration"/>. To get the illuminance in Lux apply this formula::
+    ///  
+    ///   lux = illuminance * 700 / gain / integration_time
+    ///  
+    ///  To get a correct illuminance measurement make sure that the color
+    ///  values themselves are not saturated. The color value (R, G or B)
+    ///  is saturated if it is equal to the maximum value of 65535.
+    ///  In that case you have to reduce the gain, see <see cref="BrickletColorV2.TBrickletColorV2.SetConfiguration"/>.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletColorV2.TBrickletColorV2.OnIlluminance"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletColorV2.TBrickletColorV2.SetIlluminanceCallbackConfiguration"/>.
+    /// </summary>
+    function GetIlluminance: longword; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletColorV2.TBrickletColorV2.OnIlluminance"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletColorV2.TBrickletColorV2.OnIlluminance"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetIlluminanceCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longword; const max: longword); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletColorV2.TBrickletColorV2.SetIlluminanceCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetIlluminanceCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longword; out max: longword); virtual;
+
+    /// <summary>
+    ///  Returns the color temperature.
+    ///  
+    ///  To get a correct color temperature measurement make sure that the color
+    ///  values themselves are not saturated. The color value (R, G or B)
+    ///  is saturated if it is equal to the maximum value of 65535.
+    ///  In that case you have to reduce the gain, see <see cref="BrickletColorV2.TBrickletColorV2.SetConfiguration"/>.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletColorV2.TBrickletColorV2.OnColorTemperature"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletColorV2.TBrickletColorV2.SetColorTemperatureCallbackConfiguration"/>.
+    /// </summary>
+    function GetColorTemperature: word; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletColorV2.TBrickletColorV2.OnColorTemperature"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletColorV2.TBrickletColorV2.OnColorTemperature"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetColorTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: word; const max: word); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletColorV2.TBrickletColorV2.SetColorTemperatureCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetColorTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: word; out max: word); virtual;
+
+    /// <summary>
+    ///  Turns the white LED on the Bricklet on/off.
+    /// </summary>
+    procedure SetLight(const enable: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the value as set by <see cref="BrickletColorV2.TBrickletColorV2.SetLight"/>.
+    /// </summary>
+    function GetLight: boolean; virtual;
+
+    /// <summary>
+    ///  Sets the configuration of the sensor. Gain and integration time
+    ///  can be configured this way.
+    ///  
+    ///  For configuring the gain:
+    ///  
+    ///  * 0: 1x Gain
+    ///  * 1: 4x Gain
+    ///  * 2: 16x Gain
+    ///  * 3: 60x Gain
+    ///  
+    ///  For configuring the integration time:
+    ///  
+    ///  * 0: 2.4ms
+    ///  * 1: 24ms
+    ///  * 2: 101ms
+    ///  * 3: 154ms
+    ///  * 4: 700ms
+    ///  
+    ///  Increasing the gain enables the sensor to detect a
+    ///  color from a higher distance.
+    ///  
+    ///  The integration time provides a trade-off between conversion time
+    ///  and accuracy. With a longer integration time the values read will
+    ///  be more accurate but it will take longer to get the conversion
+    ///  results.
+    /// </summary>
+    procedure SetConfiguration(const gain: byte; const integrationTime: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletColorV2.TBrickletColorV2.SetConfiguration"/>.
+    /// </summary>
+    procedure GetConfiguration(out gain: byte; out integrationTime: byte); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletColorV2.TBrickletColorV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletColorV2.TBrickletColorV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletColorV2.TBrickletColorV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletColorV2.TBrickletColorV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletColorV2.TBrickletColorV2.SetColorCallbackConfiguration"/>. The parameter is the color
+    ///  of the sensor as RGBC.
+    ///  
+    ///  The <see cref="BrickletColorV2.TBrickletColorV2.OnColor"/> callback is only triggered if the color has changed since the
+    ///  last triggering.
+    /// </summary>
+    property OnColor: TBrickletColorV2NotifyColor read colorCallback write colorCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletColorV2.TBrickletColorV2.SetIlluminanceCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletColorV2.TBrickletColorV2.GetIlluminance"/>.
+    /// </summary>
+    property OnIlluminance: TBrickletColorV2NotifyIlluminance read illuminanceCallback write illuminanceCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletColorV2.TBrickletColorV2.SetColorTemperatureCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletColorV2.TBrickletColorV2.GetColorTemperature"/>.
+    /// </summary>
+    property OnColorTemperature: TBrickletColorV2NotifyColorTemperature read colorTemperatureCallback write colorTemperatureCallback;
+  end;
+
+implementation
+
+constructor TBrickletColorV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_COLOR_V2_DEVICE_IDENTIFIER, BRICKLET_COLOR_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_COLOR] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_SET_COLOR_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_COLOR_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_ILLUMINANCE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_SET_ILLUMINANCE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_ILLUMINANCE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_COLOR_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_SET_COLOR_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_COLOR_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_SET_LIGHT] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_LIGHT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_SET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COLOR_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_COLOR_V2_CALLBACK_COLOR] := {$ifdef FPC}@{$endif}CallbackWrapperColor;
+  callbackWrappers[BRICKLET_COLOR_V2_CALLBACK_ILLUMINANCE] := {$ifdef FPC}@{$endif}CallbackWrapperIlluminance;
+  callbackWrappers[BRICKLET_COLOR_V2_CALLBACK_COLOR_TEMPERATURE] := {$ifdef FPC}@{$endif}CallbackWrapperColorTemperature;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletColorV2.GetColor(out r: word; out g: word; out b: word; out c: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_COLOR, 8);
+  response := SendRequest(request, 16);
+  r := LEConvertUInt16From(8, response);
+  g := LEConvertUInt16From(10, response);
+  b := LEConvertUInt16From(12, response);
+  c := LEConvertUInt16From(14, response);
+end;
+
+procedure TBrickletColorV2.SetColorCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_SET_COLOR_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletColorV2.GetColorCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_COLOR_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+function TBrickletColorV2.GetIlluminance: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_ILLUMINANCE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletColorV2.SetIlluminanceCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longword; const max: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_SET_ILLUMINANCE_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertUInt32To(min, 14, request);
+  LEConvertUInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletColorV2.GetIlluminanceCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longword; out max: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_ILLUMINANCE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertUInt32From(14, response);
+  max := LEConvertUInt32From(18, response);
+end;
+
+function TBrickletColorV2.GetColorTemperature: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_COLOR_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+procedure TBrickletColorV2.SetColorTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: word; const max: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_SET_COLOR_TEMPERATURE_CALLBACK_CONFIGURATION, 18);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertUInt16To(min, 14, request);
+  LEConvertUInt16To(max, 16, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletColorV2.GetColorTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: word; out max: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_COLOR_TEMPERATURE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 18);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertUInt16From(14, response);
+  max := LEConvertUInt16From(16, response);
+end;
+
+procedure TBrickletColorV2.SetLight(const enable: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_SET_LIGHT, 9);
+  LEConvertBooleanTo(enable, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletColorV2.GetLight: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_LIGHT, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletColorV2.SetConfiguration(const gain: byte; const integrationTime: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_SET_CONFIGURATION, 10);
+  LEConvertUInt8To(gain, 8, request);
+  LEConvertUInt8To(integrationTime, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletColorV2.GetConfiguration(out gain: byte; out integrationTime: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  gain := LEConvertUInt8From(8, response);
+  integrationTime := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletColorV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletColorV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletColorV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletColorV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletColorV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletColorV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletColorV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletColorV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletColorV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletColorV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletColorV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletColorV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COLOR_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletColorV2.CallbackWrapperColor(const packet: TByteArray);
+var r: word; g: word; b: word; c: word;
+begin
+  if (Length(packet) <> 16) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  r := LEConvertUInt16From(8, packet);
+  g := LEConvertUInt16From(10, packet);
+  b := LEConvertUInt16From(12, packet);
+  c := LEConvertUInt16From(14, packet);
+  if (Assigned(colorCallback)) then begin
+    colorCallback(self, r, g, b, c);
+  end;
+end;
+
+procedure TBrickletColorV2.CallbackWrapperIlluminance(const packet: TByteArray);
+var illuminance: longword;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  illuminance := LEConvertUInt32From(8, packet);
+  if (Assigned(illuminanceCallback)) then begin
+    illuminanceCallback(self, illuminance);
+  end;
+end;
+
+procedure TBrickletColorV2.CallbackWrapperColorTemperature(const packet: TByteArray);
+var colorTemperature: word;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  colorTemperature := LEConvertUInt16From(8, packet);
+  if (Assigned(colorTemperatureCallback)) then begin
+    colorTemperatureCallback(self, colorTemperature);
+  end;
+end;
+
+end.
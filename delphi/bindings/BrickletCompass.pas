@@ -0,0 +1,643 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletCompass;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_COMPASS_DEVICE_IDENTIFIER = 2153;
+  BRICKLET_COMPASS_DEVICE_DISPLAY_NAME = 'Compass Bricklet';
+
+  BRICKLET_COMPASS_FUNCTION_GET_HEADING = 1;
+  BRICKLET_COMPASS_FUNCTION_SET_HEADING_CALLBACK_CONFIGURATION = 2;
+  BRICKLET_COMPASS_FUNCTION_GET_HEADING_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_COMPASS_FUNCTION_GET_MAGNETIC_FLUX_DENSITY = 5;
+  BRICKLET_COMPASS_FUNCTION_SET_MAGNETIC_FLUX_DENSITY_CALLBACK_CONFIGURATION = 6;
+  BRICKLET_COMPASS_FUNCTION_GET_MAGNETIC_FLUX_DENSITY_CALLBACK_CONFIGURATION = 7;
+  BRICKLET_COMPASS_FUNCTION_SET_CONFIGURATION = 9;
+  BRICKLET_COMPASS_FUNCTION_GET_CONFIGURATION = 10;
+  BRICKLET_COMPASS_FUNCTION_SET_CALIBRATION = 11;
+  BRICKLET_COMPASS_FUNCTION_GET_CALIBRATION = 12;
+  BRICKLET_COMPASS_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_COMPASS_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_COMPASS_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_COMPASS_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_COMPASS_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_COMPASS_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_COMPASS_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_COMPASS_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_COMPASS_FUNCTION_RESET = 243;
+  BRICKLET_COMPASS_FUNCTION_WRITE_UID = 248;
+  BRICKLET_COMPASS_FUNCTION_READ_UID = 249;
+  BRICKLET_COMPASS_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_COMPASS_CALLBACK_HEADING = 4;
+  BRICKLET_COMPASS_CALLBACK_MAGNETIC_FLUX_DENSITY = 8;
+
+  BRICKLET_COMPASS_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_COMPASS_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_COMPASS_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_COMPASS_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_COMPASS_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_COMPASS_DATA_RATE_100HZ = 0;
+  BRICKLET_COMPASS_DATA_RATE_200HZ = 1;
+  BRICKLET_COMPASS_DATA_RATE_400HZ = 2;
+  BRICKLET_COMPASS_DATA_RATE_600HZ = 3;
+  BRICKLET_COMPASS_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_COMPASS_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_COMPASS_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_COMPASS_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_COMPASS_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_COMPASS_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_COMPASS_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_COMPASS_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_COMPASS_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_COMPASS_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_COMPASS_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_COMPASS_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_COMPASS_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_COMPASS_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_COMPASS_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfInt16 = array [0..2] of smallint;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletCompass = class;
+  TBrickletCompassNotifyHeading = procedure(sender: TBrickletCompass; const heading: smallint) of object;
+  TBrickletCompassNotifyMagneticFluxDensity = procedure(sender: TBrickletCompass; const x: longint; const y: longint; const z: longint) of object;
+
+  /// <summary>
+  ///  3-axis compass with 10 nanotesla and 0.1° resolution
+  /// </summary>
+  TBrickletCompass = class(TDevice)
+  private
+    headingCallback: TBrickletCompassNotifyHeading;
+    magneticFluxDensityCallback: TBrickletCompassNotifyMagneticFluxDensity;
+  protected
+    procedure CallbackWrapperHeading(const packet: TByteArray); virtual;
+    procedure CallbackWrapperMagneticFluxDensity(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the heading (north = 0 degree, east = 90 degree).
+    ///  
+    ///  Alternatively you can use <see cref="BrickletCompass.TBrickletCompass.GetMagneticFluxDensity"/> and calculate the
+    ///  heading with ``heading = atan2(y, x) * 180 / PI``.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletCompass.TBrickletCompass.OnHeading"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletCompass.TBrickletCompass.SetHeadingCallbackConfiguration"/>.
+    /// </summary>
+    function GetHeading: smallint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletCompass.TBrickletCompass.OnHeading"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletCompass.TBrickletCompass.OnHeading"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetHeadingCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: smallint; const max: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletCompass.TBrickletCompass.SetHeadingCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetHeadingCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: smallint; out max: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the `magnetic flux density (magnetic induction) &lt;https://en.wikipedia.org/wiki/Magnetic_flux&gt;`__
+    ///  for all three axis.
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletCompass.TBrickletCompass.OnMagneticFluxDensity"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletCompass.TBrickletCompass.SetMagneticFluxDensityCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetMagneticFluxDensity(out x: longint; out y: longint; out z: longint); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletCompass.TBrickletCompass.OnMagneticFluxDensity"/> callback
+    ///  is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetMagneticFluxDensityCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by
+    ///  <see cref="BrickletCompass.TBrickletCompass.SetMagneticFluxDensityCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetMagneticFluxDensityCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Configures the data rate and background calibration.
+    ///  
+    ///  * Data Rate: Sets the data rate that is used by the magnetometer.
+    ///    The lower the data rate, the lower is the noise on the data.
+    ///  * Background Calibration: Set to *true* to enable the background
+    ///    calibration and *false* to turn it off. If the background calibration
+    ///    is enabled the sensing polarity is flipped once per second to automatically
+    ///    calculate and remove offset that is caused by temperature changes.
+    ///    This polarity flipping takes about 20ms. This means that once a second
+    ///    you will not get new data for a period of 20ms. We highly recommend that
+    ///    you keep the background calibration enabled and only disable it if the 20ms
+    ///    off-time is a problem in your application.
+    /// </summary>
+    procedure SetConfiguration(const dataRate: byte; const backgroundCalibration: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletCompass.TBrickletCompass.SetConfiguration"/>.
+    /// </summary>
+    procedure GetConfiguration(out dataRate: byte; out backgroundCalibration: boolean); virtual;
+
+    /// <summary>
+    ///  Sets offset and gain for each of the three axes.
+    ///  
+    ///  The Bricklet is factory calibrated. If you want to re-calibrate the
+    ///  Bricklet we recommend that you do the calibration through Brick Viewer.
+    ///  
+    ///  The calibration is saved in non-volatile memory and only has to be
+    ///  done once.
+    /// </summary>
+    procedure SetCalibration(const offset: array of smallint; const gain: array of smallint); virtual;
+
+    /// <summary>
+    ///  Returns the calibration parameters as set by <see cref="BrickletCompass.TBrickletCompass.SetCalibration"/>.
+    /// </summary>
+    procedure GetCalibration(out offset: TArray0To2OfInt16; out gain: TArray0To2OfInt16); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletCompass.TBrickletCompass.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletCompass.TBrickletCompass.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletCompass.TBrickletCompass.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletCompass.TBrickletCompass.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletCompass.TBrickletCompass.SetHeadingCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletCompass.TBrickletCompass.GetHeading"/>.
+    /// </summary>
+    property OnHeading: TBrickletCompassNotifyHeading read headingCallback write headingCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletCompass.TBrickletCompass.SetMagneticFluxDensityCallbackConfiguration"/>.
+    ///  
+    ///  The parameters are the same as <see cref="BrickletCompass.TBrickletCompass.GetMagneticFluxDensity"/>.
+    /// </summary>
+    property OnMagneticFluxDensity: TBrickletCompassNotifyMagneticFluxDensity read magneticFluxDensityCallback write magneticFluxDensityCallback;
+  end;
+
+implementation
+
+constructor TBrickletCompass.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_COMPASS_DEVICE_IDENTIFIER, BRICKLET_COMPASS_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_COMPASS_FUNCTION_GET_HEADING] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_SET_HEADING_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_GET_HEADING_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_GET_MAGNETIC_FLUX_DENSITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_SET_MAGNETIC_FLUX_DENSITY_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_GET_MAGNETIC_FLUX_DENSITY_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_SET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_GET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_SET_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_GET_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_COMPASS_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_COMPASS_CALLBACK_HEADING] := {$ifdef FPC}@{$endif}CallbackWrapperHeading;
+  callbackWrappers[BRICKLET_COMPASS_CALLBACK_MAGNETIC_FLUX_DENSITY] := {$ifdef FPC}@{$endif}CallbackWrapperMagneticFluxDensity;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletCompass.GetHeading: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_GET_HEADING, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletCompass.SetHeadingCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: smallint; const max: smallint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_SET_HEADING_CALLBACK_CONFIGURATION, 18);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt16To(min, 14, request);
+  LEConvertInt16To(max, 16, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletCompass.GetHeadingCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: smallint; out max: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_GET_HEADING_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 18);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt16From(14, response);
+  max := LEConvertInt16From(16, response);
+end;
+
+procedure TBrickletCompass.GetMagneticFluxDensity(out x: longint; out y: longint; out z: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_GET_MAGNETIC_FLUX_DENSITY, 8);
+  response := SendRequest(request, 20);
+  x := LEConvertInt32From(8, response);
+  y := LEConvertInt32From(12, response);
+  z := LEConvertInt32From(16, response);
+end;
+
+procedure TBrickletCompass.SetMagneticFluxDensityCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_SET_MAGNETIC_FLUX_DENSITY_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletCompass.GetMagneticFluxDensityCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_GET_MAGNETIC_FLUX_DENSITY_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletCompass.SetConfiguration(const dataRate: byte; const backgroundCalibration: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_SET_CONFIGURATION, 10);
+  LEConvertUInt8To(dataRate, 8, request);
+  LEConvertBooleanTo(backgroundCalibration, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletCompass.GetConfiguration(out dataRate: byte; out backgroundCalibration: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_GET_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  dataRate := LEConvertUInt8From(8, response);
+  backgroundCalibration := LEConvertBooleanFrom(9, response);
+end;
+
+procedure TBrickletCompass.SetCalibration(const offset: array of smallint; const gain: array of smallint);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_SET_CALIBRATION, 20);
+  if (Length(offset) <> 3) then raise EInvalidParameterException.Create('Offset has to be exactly 3 items long');
+  for i := 0 to Length(offset) - 1 do LEConvertInt16To(offset[i], 8 + (i * 2), request);
+  if (Length(gain) <> 3) then raise EInvalidParameterException.Create('Gain has to be exactly 3 items long');
+  for i := 0 to Length(gain) - 1 do LEConvertInt16To(gain[i], 14 + (i * 2), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletCompass.GetCalibration(out offset: TArray0To2OfInt16; out gain: TArray0To2OfInt16);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_GET_CALIBRATION, 8);
+  response := SendRequest(request, 20);
+  for i := 0 to 2 do offset[i] := LEConvertInt16From(8 + (i * 2), response);
+  for i := 0 to 2 do gain[i] := LEConvertInt16From(14 + (i * 2), response);
+end;
+
+procedure TBrickletCompass.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletCompass.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletCompass.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletCompass.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletCompass.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletCompass.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletCompass.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletCompass.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletCompass.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletCompass.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletCompass.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletCompass.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_COMPASS_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletCompass.CallbackWrapperHeading(const packet: TByteArray);
+var heading: smallint;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  heading := LEConvertInt16From(8, packet);
+  if (Assigned(headingCallback)) then begin
+    headingCallback(self, heading);
+  end;
+end;
+
+procedure TBrickletCompass.CallbackWrapperMagneticFluxDensity(const packet: TByteArray);
+var x: longint; y: longint; z: longint;
+begin
+  if (Length(packet) <> 20) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  x := LEConvertInt32From(8, packet);
+  y := LEConvertInt32From(12, packet);
+  z := LEConvertInt32From(16, packet);
+  if (Assigned(magneticFluxDensityCallback)) then begin
+    magneticFluxDensityCallback(self, x, y, z);
+  end;
+end;
+
+end.
@@ -0,0 +1,999 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletEPaper296x128;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_E_PAPER_296X128_DEVICE_IDENTIFIER = 2146;
+  BRICKLET_E_PAPER_296X128_DEVICE_DISPLAY_NAME = 'E-Paper 296x128 Bricklet';
+
+  BRICKLET_E_PAPER_296X128_FUNCTION_DRAW = 1;
+  BRICKLET_E_PAPER_296X128_FUNCTION_GET_DRAW_STATUS = 2;
+  BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_BLACK_WHITE_LOW_LEVEL = 3;
+  BRICKLET_E_PAPER_296X128_FUNCTION_READ_BLACK_WHITE_LOW_LEVEL = 4;
+  BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_COLOR_LOW_LEVEL = 5;
+  BRICKLET_E_PAPER_296X128_FUNCTION_READ_COLOR_LOW_LEVEL = 6;
+  BRICKLET_E_PAPER_296X128_FUNCTION_FILL_DISPLAY = 7;
+  BRICKLET_E_PAPER_296X128_FUNCTION_DRAW_TEXT = 8;
+  BRICKLET_E_PAPER_296X128_FUNCTION_DRAW_LINE = 9;
+  BRICKLET_E_PAPER_296X128_FUNCTION_DRAW_BOX = 10;
+  BRICKLET_E_PAPER_296X128_FUNCTION_SET_UPDATE_MODE = 12;
+  BRICKLET_E_PAPER_296X128_FUNCTION_GET_UPDATE_MODE = 13;
+  BRICKLET_E_PAPER_296X128_FUNCTION_SET_DISPLAY_TYPE = 14;
+  BRICKLET_E_PAPER_296X128_FUNCTION_GET_DISPLAY_TYPE = 15;
+  BRICKLET_E_PAPER_296X128_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_E_PAPER_296X128_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_E_PAPER_296X128_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_E_PAPER_296X128_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_E_PAPER_296X128_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_E_PAPER_296X128_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_E_PAPER_296X128_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_E_PAPER_296X128_FUNCTION_RESET = 243;
+  BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_UID = 248;
+  BRICKLET_E_PAPER_296X128_FUNCTION_READ_UID = 249;
+  BRICKLET_E_PAPER_296X128_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_E_PAPER_296X128_CALLBACK_DRAW_STATUS = 11;
+
+  BRICKLET_E_PAPER_296X128_DRAW_STATUS_IDLE = 0;
+  BRICKLET_E_PAPER_296X128_DRAW_STATUS_COPYING = 1;
+  BRICKLET_E_PAPER_296X128_DRAW_STATUS_DRAWING = 2;
+  BRICKLET_E_PAPER_296X128_COLOR_BLACK = 0;
+  BRICKLET_E_PAPER_296X128_COLOR_WHITE = 1;
+  BRICKLET_E_PAPER_296X128_COLOR_RED = 2;
+  BRICKLET_E_PAPER_296X128_COLOR_GRAY = 2;
+  BRICKLET_E_PAPER_296X128_FONT_6X8 = 0;
+  BRICKLET_E_PAPER_296X128_FONT_6X16 = 1;
+  BRICKLET_E_PAPER_296X128_FONT_6X24 = 2;
+  BRICKLET_E_PAPER_296X128_FONT_6X32 = 3;
+  BRICKLET_E_PAPER_296X128_FONT_12X16 = 4;
+  BRICKLET_E_PAPER_296X128_FONT_12X24 = 5;
+  BRICKLET_E_PAPER_296X128_FONT_12X32 = 6;
+  BRICKLET_E_PAPER_296X128_FONT_18X24 = 7;
+  BRICKLET_E_PAPER_296X128_FONT_18X32 = 8;
+  BRICKLET_E_PAPER_296X128_FONT_24X32 = 9;
+  BRICKLET_E_PAPER_296X128_ORIENTATION_HORIZONTAL = 0;
+  BRICKLET_E_PAPER_296X128_ORIENTATION_VERTICAL = 1;
+  BRICKLET_E_PAPER_296X128_UPDATE_MODE_DEFAULT = 0;
+  BRICKLET_E_PAPER_296X128_UPDATE_MODE_BLACK_WHITE = 1;
+  BRICKLET_E_PAPER_296X128_UPDATE_MODE_DELTA = 2;
+  BRICKLET_E_PAPER_296X128_DISPLAY_TYPE_BLACK_WHITE_RED = 0;
+  BRICKLET_E_PAPER_296X128_DISPLAY_TYPE_BLACK_WHITE_GRAY = 1;
+  BRICKLET_E_PAPER_296X128_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_E_PAPER_296X128_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_E_PAPER_296X128_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_E_PAPER_296X128_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_E_PAPER_296X128_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_E_PAPER_296X128_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_E_PAPER_296X128_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_E_PAPER_296X128_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_E_PAPER_296X128_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_E_PAPER_296X128_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_E_PAPER_296X128_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_E_PAPER_296X128_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_E_PAPER_296X128_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_E_PAPER_296X128_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_E_PAPER_296X128_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To431OfBoolean = array [0..431] of boolean;
+  TArray0To463OfBoolean = array [0..463] of boolean;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+  TArrayOfBoolean = array of boolean;
+
+  TBrickletEPaper296x128 = class;
+  TBrickletEPaper296x128NotifyDrawStatus = procedure(sender: TBrickletEPaper296x128; const drawStatus: byte) of object;
+
+  /// <summary>
+  ///  Three color 296x128 e-paper display
+  /// </summary>
+  TBrickletEPaper296x128 = class(TDevice)
+  private
+    streamMutex: TCriticalSection;
+    drawStatusCallback: TBrickletEPaper296x128NotifyDrawStatus;
+  protected
+    procedure CallbackWrapperDrawStatus(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Draws the current black/white and red or gray buffer to the e-paper display.
+    ///  
+    ///  The Bricklet does not have any double-buffering. You should not call
+    ///  this function while writing to the buffer. See <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.GetDrawStatus"/>.
+    /// </summary>
+    procedure Draw; virtual;
+
+    /// <summary>
+    ///  Returns one of three draw statuses:
+    ///  
+    ///  * Idle
+    ///  * Copying: Data is being copied from the buffer of the Bricklet to the buffer of the display.
+    ///  * Drawing: The display is updating its content (during this phase the flickering etc happens).
+    ///  
+    ///  You can write to the buffer (through one of the write or draw functions) when the status is
+    ///  either *idle* or *drawing*. You should not write to the buffer while it is being *copied* to the
+    ///  display. There is no double-buffering.
+    /// </summary>
+    function GetDrawStatus: byte; virtual;
+
+    /// <summary>
+    ///  Writes black/white pixels to the specified window into the buffer.
+    ///  
+    ///  The pixels are written into the window line by line top to bottom
+    ///  and each line is written from left to right.
+    ///  
+    ///  The value 0 (false) corresponds to a black pixel and the value 1 (true) to a
+    ///  white pixel.
+    ///  
+    ///  This function writes the pixels into the black/white pixel buffer, to draw the
+    ///  buffer to the display use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.Draw"/>.
+    ///  
+    ///  Use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.WriteColor"/> to write red or gray pixels.
+    /// </summary>
+    procedure WriteBlackWhiteLowLevel(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; const pixelsLength: word; const pixelsChunkOffset: word; const pixelsChunkData: TArray0To431OfBoolean); virtual;
+
+    /// <summary>
+    ///  Writes black/white pixels to the specified window into the buffer.
+    ///  
+    ///  The pixels are written into the window line by line top to bottom
+    ///  and each line is written from left to right.
+    ///  
+    ///  The value 0 (false) corresponds to a black pixel and the value 1 (true) to a
+    ///  white pixel.
+    ///  
+    ///  This function writes the pixels into the black/white pixel buffer, to draw the
+    ///  buffer to the display use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.Draw"/>.
+    ///  
+    ///  Use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.WriteColor"/> to write red or gray pixels.
+    /// </summary>
+    procedure WriteBlackWhite(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; const pixels: array of boolean); virtual;
+
+    /// <summary>
+    ///  Returns the current content of the black/white pixel buffer for the specified window.
+    ///  
+    ///  The pixels are read into the window line by line top to bottom and
+    ///  each line is read from left to right.
+    ///  
+    ///  The current content of the buffer does not have to be the current content of the display.
+    ///  It is possible that the data was not drawn to the display yet and after a restart of
+    ///  the Bricklet the buffer will be reset to black, while the display retains its content.
+    /// </summary>
+    procedure ReadBlackWhiteLowLevel(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; out pixelsLength: word; out pixelsChunkOffset: word; out pixelsChunkData: TArray0To463OfBoolean); virtual;
+
+    /// <summary>
+    ///  Returns the current content of the black/white pixel buffer for the specified window.
+    ///  
+    ///  The pixels are read into the window line by line top to bottom and
+    ///  each line is read from left to right.
+    ///  
+    ///  The current content of the buffer does not have to be the current content of the display.
+    ///  It is possible that the data was not drawn to the display yet and after a restart of
+    ///  the Bricklet the buffer will be reset to black, while the display retains its content.
+    /// </summary>
+    function ReadBlackWhite(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte): TArrayOfBoolean; virtual;
+
+    /// <summary>
+    ///  The E-Paper 296x128 Bricklet is available with the colors black/white/red and
+    ///  black/white/gray. Depending on the model this function writes either red or
+    ///  gray pixels to the specified window into the buffer.
+    ///  
+    ///  The pixels are written into the window line by line top to bottom
+    ///  and each line is written from left to right.
+    ///  
+    ///  The value 0 (false) means that this pixel does not have color. It will be either black
+    ///  or white (see <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.WriteBlackWhite"/>). The value 1 (true) corresponds to a red or gray
+    ///  pixel, depending on the Bricklet model.
+    ///  
+    ///  This function writes the pixels into the red or gray pixel buffer, to draw the buffer
+    ///  to the display use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.Draw"/>.
+    ///  
+    ///  Use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.WriteBlackWhite"/> to write black/white pixels.
+    /// </summary>
+    procedure WriteColorLowLevel(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; const pixelsLength: word; const pixelsChunkOffset: word; const pixelsChunkData: TArray0To431OfBoolean); virtual;
+
+    /// <summary>
+    ///  The E-Paper 296x128 Bricklet is available with the colors black/white/red and
+    ///  black/white/gray. Depending on the model this function writes either red or
+    ///  gray pixels to the specified window into the buffer.
+    ///  
+    ///  The pixels are written into the window line by line top to bottom
+    ///  and each line is written from left to right.
+    ///  
+    ///  The value 0 (false) means that this pixel does not have color. It will be either black
+    ///  or white (see <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.WriteBlackWhite"/>). The value 1 (true) corresponds to a red or gray
+    ///  pixel, depending on the Bricklet model.
+    ///  
+    ///  This function writes the pixels into the red or gray pixel buffer, to draw the buffer
+    ///  to the display use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.Draw"/>.
+    ///  
+    ///  Use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.WriteBlackWhite"/> to write black/white pixels.
+    /// </summary>
+    procedure WriteColor(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; const pixels: array of boolean); virtual;
+
+    /// <summary>
+    ///  Returns the current content of the red or gray pixel buffer for the specified window.
+    ///  
+    ///  The pixels are written into the window line by line top to bottom
+    ///  and each line is written from left to right.
+    ///  
+    ///  The current content of the buffer does not have to be the current content of the display.
+    ///  It is possible that the data was not drawn to the display yet and after a restart of
+    ///  the Bricklet the buffer will be reset to black, while the display retains its content.
+    /// </summary>
+    procedure ReadColorLowLevel(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; out pixelsLength: word; out pixelsChunkOffset: word; out pixelsChunkData: TArray0To463OfBoolean); virtual;
+
+    /// <summary>
+    ///  Returns the current content of the red or gray pixel buffer for the specified window.
+    ///  
+    ///  The pixels are written into the window line by line top to bottom
+    ///  and each line is written from left to right.
+    ///  
+    ///  The current content of the buffer does not have to be the current content of the display.
+    ///  It is possible that the data was not drawn to the display yet and after a restart of
+    ///  the Bricklet the buffer will be reset to black, while the display retains its content.
+    /// </summary>
+    function ReadColor(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte): TArrayOfBoolean; virtual;
+
+    /// <summary>
+    ///  Fills the complete content of the display with the given color.
+    ///  
+    ///  This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+    ///  to the display use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.Draw"/>.
+    /// </summary>
+    procedure FillDisplay(const color: byte); virtual;
+
+    /// <summary>
+    ///  Draws a text with up to 50 characters at the pixel position (x, y).
+    ///  
+    ///  You can use one of 9 different font sizes and draw the text in
+    ///  black/white/red|gray. The text can be drawn horizontal or vertical.
+    ///  
+    ///  This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+    ///  to the display use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.Draw"/>.
+    /// </summary>
+    procedure DrawText(const positionX: word; const positionY: byte; const font: byte; const color: byte; const orientation: byte; const text: string); virtual;
+
+    /// <summary>
+    ///  Draws a line from (x, y)-start to (x, y)-end in the given color.
+    ///  
+    ///  This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+    ///  to the display use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.Draw"/>.
+    /// </summary>
+    procedure DrawLine(const positionXStart: word; const positionYStart: byte; const positionXEnd: word; const positionYEnd: byte; const color: byte); virtual;
+
+    /// <summary>
+    ///  Draws a box from (x, y)-start to (x, y)-end in the given color.
+    ///  
+    ///  If you set fill to true, the box will be filled with the
+    ///  color. Otherwise only the outline will be drawn.
+    ///  
+    ///  This function writes the pixels into the black/white/red|gray pixel buffer, to draw the buffer
+    ///  to the display use <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.Draw"/>.
+    /// </summary>
+    procedure DrawBox(const positionXStart: word; const positionYStart: byte; const positionXEnd: word; const positionYEnd: byte; const fill: boolean; const color: byte); virtual;
+
+    /// <summary>
+    ///  <note>
+    ///   The default update mode corresponds to the default e-paper display
+    ///   manufacturer settings. All of the other modes are experimental and
+    ///   will result in increased ghosting and possibly other long-term
+    ///   side effects.
+    ///  </note>
+    ///  
+    ///   If you want to know more about the inner workings of an e-paper display
+    ///   take a look at this excellent video from Ben Krasnow:
+    ///   `https://www.youtube.com/watch?v=MsbiO8EAsGw &lt;https://www.youtube.com/watch?v=MsbiO8EAsGw&gt;`__.
+    ///  
+    ///   If you are not sure about this option, leave the update mode at default.
+    ///  
+    ///  Currently there are three update modes available:
+    ///  
+    ///  * Default: Settings as given by the manufacturer. An update will take about
+    ///    7.5 seconds and during the update the screen will flicker several times.
+    ///  * Black/White: This will only update the black/white pixel. It uses the manufacturer
+    ///    settings for black/white and ignores the red or gray pixel buffer. With this mode the
+    ///    display will flicker once and it takes about 2.5 seconds. Compared to the default settings
+    ///    there is more ghosting.
+    ///  * Delta: This will only update the black/white pixel. It uses an aggressive method where
+    ///    the changes are not applied for a whole buffer but only for the delta between the last
+    ///    and the next buffer. With this mode the display will not flicker during an update and
+    ///    it takes about 900-950ms. Compared to the other two settings there is more ghosting. This
+    ///    mode can be used for something like a flicker-free live update of a text.
+    ///  
+    ///  With the black/white/red display if you use either the black/white or the delta mode,
+    ///  after a while of going back and forth between black and white the white color will
+    ///  start to appear red-ish or pink-ish.
+    ///  
+    ///  If you use the aggressive delta mode and rapidly change the content, we recommend that you
+    ///  change back to the default mode every few hours and in the default mode cycle between the
+    ///  three available colors a few times. This will get rid of the ghosting and after that you can
+    ///  go back to the delta mode with flicker-free updates.
+    /// </summary>
+    procedure SetUpdateMode(const updateMode: byte); virtual;
+
+    /// <summary>
+    ///  Returns the update mode as set by <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.SetUpdateMode"/>.
+    /// </summary>
+    function GetUpdateMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the type of the display. The e-paper display is available
+    ///  in black/white/red and black/white/gray. This will be factory set
+    ///  during the flashing and testing phase. The value is saved in
+    ///  non-volatile memory and will stay after a power cycle.
+    /// </summary>
+    procedure SetDisplayType(const displayType: byte); virtual;
+
+    /// <summary>
+    ///  Returns the type of the e-paper display. It can either be
+    ///  black/white/red or black/white/gray.
+    /// </summary>
+    function GetDisplayType: byte; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  Callback for the current draw status. Will be called every time the
+    ///  draw status changes (see <see cref="BrickletEPaper296x128.TBrickletEPaper296x128.GetDrawStatus"/>).
+    /// </summary>
+    property OnDrawStatus: TBrickletEPaper296x128NotifyDrawStatus read drawStatusCallback write drawStatusCallback;
+  end;
+
+implementation
+
+constructor TBrickletEPaper296x128.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_E_PAPER_296X128_DEVICE_IDENTIFIER, BRICKLET_E_PAPER_296X128_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_DRAW] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_GET_DRAW_STATUS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_BLACK_WHITE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_READ_BLACK_WHITE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_COLOR_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_READ_COLOR_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_FILL_DISPLAY] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_DRAW_TEXT] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_DRAW_LINE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_DRAW_BOX] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_SET_UPDATE_MODE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_GET_UPDATE_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_SET_DISPLAY_TYPE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_GET_DISPLAY_TYPE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_E_PAPER_296X128_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  streamMutex := TCriticalSection.Create;
+
+  callbackWrappers[BRICKLET_E_PAPER_296X128_CALLBACK_DRAW_STATUS] := {$ifdef FPC}@{$endif}CallbackWrapperDrawStatus;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletEPaper296x128.Draw;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_DRAW, 8);
+  SendRequest(request, 0);
+end;
+
+function TBrickletEPaper296x128.GetDrawStatus: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_GET_DRAW_STATUS, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletEPaper296x128.WriteBlackWhiteLowLevel(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; const pixelsLength: word; const pixelsChunkOffset: word; const pixelsChunkData: TArray0To431OfBoolean);
+var request: TByteArray; i: longint; pixelsChunkDataBits: array [0..53] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_BLACK_WHITE_LOW_LEVEL, 72);
+  LEConvertUInt16To(xStart, 8, request);
+  LEConvertUInt8To(yStart, 10, request);
+  LEConvertUInt16To(xEnd, 11, request);
+  LEConvertUInt8To(yEnd, 13, request);
+  LEConvertUInt16To(pixelsLength, 14, request);
+  LEConvertUInt16To(pixelsChunkOffset, 16, request);
+  FillChar(pixelsChunkDataBits[0], Length(pixelsChunkDataBits) * SizeOf(pixelsChunkDataBits[0]), 0);
+  for i := 0 to 431 do if pixelsChunkData[i] then pixelsChunkDataBits[Floor(i/8)] := pixelsChunkDataBits[Floor(i/8)] or (1 shl (i mod 8));
+  for i := 0 to 53 do LEConvertUInt8To(pixelsChunkDataBits[i], 18 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletEPaper296x128.WriteBlackWhite(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; const pixels: array of boolean);
+var
+  pixelsChunkOffset: word;
+  pixelsChunkData: TArray0To431OfBoolean;
+  pixelsChunkLength: word;
+  pixelsLength: word;
+begin
+  if (Length(pixels) > 65535) then begin
+    raise EInvalidParameterException.Create('Pixels can be at most 65535 items long');
+  end;
+
+  pixelsLength := Length(pixels);
+  pixelsChunkOffset := 0;
+
+  if (pixelsLength = 0) then begin
+    FillChar(pixelsChunkData[0], SizeOf(boolean) * 432, 0);
+    WriteBlackWhiteLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (pixelsChunkOffset < pixelsLength) do begin
+        pixelsChunkLength := pixelsLength - pixelsChunkOffset;
+
+        if (pixelsChunkLength > 432) then pixelsChunkLength := 432;
+
+        FillChar(pixelsChunkData[0], SizeOf(boolean) * 432, 0);
+        Move(pixels[pixelsChunkOffset], pixelsChunkData[0], SizeOf(boolean) * pixelsChunkLength);
+
+        WriteBlackWhiteLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+        Inc(pixelsChunkOffset, 432);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletEPaper296x128.ReadBlackWhiteLowLevel(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; out pixelsLength: word; out pixelsChunkOffset: word; out pixelsChunkData: TArray0To463OfBoolean);
+var request, response: TByteArray; i: longint; pixelsChunkDataBits: array [0..57] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_READ_BLACK_WHITE_LOW_LEVEL, 14);
+  LEConvertUInt16To(xStart, 8, request);
+  LEConvertUInt8To(yStart, 10, request);
+  LEConvertUInt16To(xEnd, 11, request);
+  LEConvertUInt8To(yEnd, 13, request);
+  response := SendRequest(request, 70);
+  pixelsLength := LEConvertUInt16From(8, response);
+  pixelsChunkOffset := LEConvertUInt16From(10, response);
+  FillChar(pixelsChunkDataBits[0], Length(pixelsChunkDataBits) * SizeOf(pixelsChunkDataBits[0]), 0);
+  for i := 0 to 57 do pixelsChunkDataBits[i] := LEConvertUInt8From(12 + (i * 1), response);
+  for i := 0 to 463 do pixelsChunkData[i] := ((pixelsChunkDataBits[Floor(i / 8)] and (1 shl (i mod 8))) <> 0);
+end;
+
+function TBrickletEPaper296x128.ReadBlackWhite(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte): TArrayOfBoolean;
+var
+  pixels: TArrayOfBoolean;
+  pixelsCurrentLength: word;
+  pixelsLength: word;
+  pixelsChunkOffset: word;
+  pixelsChunkData: TArray0To463OfBoolean;
+  pixelsOutOfSync: boolean;
+  pixelsChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(pixels, 0);
+  streamMutex.Acquire;
+  try
+    pixelsLength := 0;
+    ReadBlackWhiteLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+    SetLength(pixels, pixelsLength);
+    pixelsOutOfSync := (pixelsChunkOffset <> 0);
+
+    if ((not pixelsOutOfSync) and (pixelsLength > 0)) then begin
+      pixelsChunkLength := pixelsLength - pixelsChunkOffset;
+      if (pixelsChunkLength > 464) then pixelsChunkLength := 464;
+      Move(pixelsChunkData, pixels[0], SizeOf(boolean) * pixelsChunkLength);
+      pixelsCurrentLength := pixelsChunkLength;
+
+      while ((not pixelsOutOfSync) and (pixelsCurrentLength < pixelsLength)) do begin
+        ReadBlackWhiteLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+        pixelsOutOfSync := pixelsChunkOffset <> pixelsCurrentLength;
+        pixelsChunkLength := pixelsLength - pixelsChunkOffset;
+        if (pixelsChunkLength > 464) then pixelsChunkLength := 464;
+        Move(pixelsChunkData, pixels[pixelsCurrentLength], SizeOf(boolean) * pixelsChunkLength);
+        Inc(pixelsCurrentLength, pixelsChunkLength);
+      end;
+    end;
+
+    if (pixelsOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (pixelsChunkOffset + 464 < pixelsLength) do begin
+        ReadBlackWhiteLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Pixels stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := pixels;
+end;
+
+procedure TBrickletEPaper296x128.WriteColorLowLevel(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; const pixelsLength: word; const pixelsChunkOffset: word; const pixelsChunkData: TArray0To431OfBoolean);
+var request: TByteArray; i: longint; pixelsChunkDataBits: array [0..53] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_COLOR_LOW_LEVEL, 72);
+  LEConvertUInt16To(xStart, 8, request);
+  LEConvertUInt8To(yStart, 10, request);
+  LEConvertUInt16To(xEnd, 11, request);
+  LEConvertUInt8To(yEnd, 13, request);
+  LEConvertUInt16To(pixelsLength, 14, request);
+  LEConvertUInt16To(pixelsChunkOffset, 16, request);
+  FillChar(pixelsChunkDataBits[0], Length(pixelsChunkDataBits) * SizeOf(pixelsChunkDataBits[0]), 0);
+  for i := 0 to 431 do if pixelsChunkData[i] then pixelsChunkDataBits[Floor(i/8)] := pixelsChunkDataBits[Floor(i/8)] or (1 shl (i mod 8));
+  for i := 0 to 53 do LEConvertUInt8To(pixelsChunkDataBits[i], 18 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletEPaper296x128.WriteColor(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; const pixels: array of boolean);
+var
+  pixelsChunkOffset: word;
+  pixelsChunkData: TArray0To431OfBoolean;
+  pixelsChunkLength: word;
+  pixelsLength: word;
+begin
+  if (Length(pixels) > 65535) then begin
+    raise EInvalidParameterException.Create('Pixels can be at most 65535 items long');
+  end;
+
+  pixelsLength := Length(pixels);
+  pixelsChunkOffset := 0;
+
+  if (pixelsLength = 0) then begin
+    FillChar(pixelsChunkData[0], SizeOf(boolean) * 432, 0);
+    WriteColorLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (pixelsChunkOffset < pixelsLength) do begin
+        pixelsChunkLength := pixelsLength - pixelsChunkOffset;
+
+        if (pixelsChunkLength > 432) then pixelsChunkLength := 432;
+
+        FillChar(pixelsChunkData[0], SizeOf(boolean) * 432, 0);
+        Move(pixels[pixelsChunkOffset], pixelsChunkData[0], SizeOf(boolean) * pixelsChunkLength);
+
+        WriteColorLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+        Inc(pixelsChunkOffset, 432);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletEPaper296x128.ReadColorLowLevel(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte; out pixelsLength: word; out pixelsChunkOffset: word; out pixelsChunkData: TArray0To463OfBoolean);
+var request, response: TByteArray; i: longint; pixelsChunkDataBits: array [0..57] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_READ_COLOR_LOW_LEVEL, 14);
+  LEConvertUInt16To(xStart, 8, request);
+  LEConvertUInt8To(yStart, 10, request);
+  LEConvertUInt16To(xEnd, 11, request);
+  LEConvertUInt8To(yEnd, 13, request);
+  response := SendRequest(request, 70);
+  pixelsLength := LEConvertUInt16From(8, response);
+  pixelsChunkOffset := LEConvertUInt16From(10, response);
+  FillChar(pixelsChunkDataBits[0], Length(pixelsChunkDataBits) * SizeOf(pixelsChunkDataBits[0]), 0);
+  for i := 0 to 57 do pixelsChunkDataBits[i] := LEConvertUInt8From(12 + (i * 1), response);
+  for i := 0 to 463 do pixelsChunkData[i] := ((pixelsChunkDataBits[Floor(i / 8)] and (1 shl (i mod 8))) <> 0);
+end;
+
+function TBrickletEPaper296x128.ReadColor(const xStart: word; const yStart: byte; const xEnd: word; const yEnd: byte): TArrayOfBoolean;
+var
+  pixels: TArrayOfBoolean;
+  pixelsCurrentLength: word;
+  pixelsLength: word;
+  pixelsChunkOffset: word;
+  pixelsChunkData: TArray0To463OfBoolean;
+  pixelsOutOfSync: boolean;
+  pixelsChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(pixels, 0);
+  streamMutex.Acquire;
+  try
+    pixelsLength := 0;
+    ReadColorLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+    SetLength(pixels, pixelsLength);
+    pixelsOutOfSync := (pixelsChunkOffset <> 0);
+
+    if ((not pixelsOutOfSync) and (pixelsLength > 0)) then begin
+      pixelsChunkLength := pixelsLength - pixelsChunkOffset;
+      if (pixelsChunkLength > 464) then pixelsChunkLength := 464;
+      Move(pixelsChunkData, pixels[0], SizeOf(boolean) * pixelsChunkLength);
+      pixelsCurrentLength := pixelsChunkLength;
+
+      while ((not pixelsOutOfSync) and (pixelsCurrentLength < pixelsLength)) do begin
+        ReadColorLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+        pixelsOutOfSync := pixelsChunkOffset <> pixelsCurrentLength;
+        pixelsChunkLength := pixelsLength - pixelsChunkOffset;
+        if (pixelsChunkLength > 464) then pixelsChunkLength := 464;
+        Move(pixelsChunkData, pixels[pixelsCurrentLength], SizeOf(boolean) * pixelsChunkLength);
+        Inc(pixelsCurrentLength, pixelsChunkLength);
+      end;
+    end;
+
+    if (pixelsOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (pixelsChunkOffset + 464 < pixelsLength) do begin
+        ReadColorLowLevel(xStart, yStart, xEnd, yEnd, pixelsLength, pixelsChunkOffset, pixelsChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Pixels stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := pixels;
+end;
+
+procedure TBrickletEPaper296x128.FillDisplay(const color: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_FILL_DISPLAY, 9);
+  LEConvertUInt8To(color, 8, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletEPaper296x128.DrawText(const positionX: word; const positionY: byte; const font: byte; const color: byte; const orientation: byte; const text: string);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_DRAW_TEXT, 64);
+  LEConvertUInt16To(positionX, 8, request);
+  LEConvertUInt8To(positionY, 10, request);
+  LEConvertUInt8To(font, 11, request);
+  LEConvertUInt8To(color, 12, request);
+  LEConvertUInt8To(orientation, 13, request);
+  LEConvertStringTo(text, 14, 50, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletEPaper296x128.DrawLine(const positionXStart: word; const positionYStart: byte; const positionXEnd: word; const positionYEnd: byte; const color: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_DRAW_LINE, 15);
+  LEConvertUInt16To(positionXStart, 8, request);
+  LEConvertUInt8To(positionYStart, 10, request);
+  LEConvertUInt16To(positionXEnd, 11, request);
+  LEConvertUInt8To(positionYEnd, 13, request);
+  LEConvertUInt8To(color, 14, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletEPaper296x128.DrawBox(const positionXStart: word; const positionYStart: byte; const positionXEnd: word; const positionYEnd: byte; const fill: boolean; const color: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_DRAW_BOX, 16);
+  LEConvertUInt16To(positionXStart, 8, request);
+  LEConvertUInt8To(positionYStart, 10, request);
+  LEConvertUInt16To(positionXEnd, 11, request);
+  LEConvertUInt8To(positionYEnd, 13, request);
+  LEConvertBooleanTo(fill, 14, request);
+  LEConvertUInt8To(color, 15, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletEPaper296x128.SetUpdateMode(const updateMode: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_SET_UPDATE_MODE, 9);
+  LEConvertUInt8To(updateMode, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletEPaper296x128.GetUpdateMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_GET_UPDATE_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletEPaper296x128.SetDisplayType(const displayType: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_SET_DISPLAY_TYPE, 9);
+  LEConvertUInt8To(displayType, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletEPaper296x128.GetDisplayType: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_GET_DISPLAY_TYPE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletEPaper296x128.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletEPaper296x128.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletEPaper296x128.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletEPaper296x128.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletEPaper296x128.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletEPaper296x128.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletEPaper296x128.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletEPaper296x128.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletEPaper296x128.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletEPaper296x128.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletEPaper296x128.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletEPaper296x128.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_E_PAPER_296X128_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletEPaper296x128.CallbackWrapperDrawStatus(const packet: TByteArray);
+var drawStatus: byte;
+begin
+  if (Length(packet) <> 9) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  drawStatus := LEConvertUInt8From(8, packet);
+  if (Assigned(drawStatusCallback)) then begin
+    drawStatusCallback(self, drawStatus);
+  end;
+end;
+
+end.
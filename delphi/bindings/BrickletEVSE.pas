@@ -0,0 +1,490 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletEVSE;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_EVSE_DEVICE_IDENTIFIER = 2159;
+  BRICKLET_EVSE_DEVICE_DISPLAY_NAME = 'EVSE Bricklet';
+
+  BRICKLET_EVSE_FUNCTION_GET_STATE = 1;
+  BRICKLET_EVSE_FUNCTION_GET_HARDWARE_CONFIGURATION = 2;
+  BRICKLET_EVSE_FUNCTION_GET_LOW_LEVEL_STATE = 3;
+  BRICKLET_EVSE_FUNCTION_SET_MAX_CHARGING_CURRENT = 4;
+  BRICKLET_EVSE_FUNCTION_GET_MAX_CHARGING_CURRENT = 5;
+  BRICKLET_EVSE_FUNCTION_CALIBRATE = 6;
+  BRICKLET_EVSE_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_EVSE_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_EVSE_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_EVSE_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_EVSE_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_EVSE_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_EVSE_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_EVSE_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_EVSE_FUNCTION_RESET = 243;
+  BRICKLET_EVSE_FUNCTION_WRITE_UID = 248;
+  BRICKLET_EVSE_FUNCTION_READ_UID = 249;
+  BRICKLET_EVSE_FUNCTION_GET_IDENTITY = 255;
+
+
+  BRICKLET_EVSE_IEC61851_STATE_A = 0;
+  BRICKLET_EVSE_IEC61851_STATE_B = 1;
+  BRICKLET_EVSE_IEC61851_STATE_C = 2;
+  BRICKLET_EVSE_IEC61851_STATE_D = 3;
+  BRICKLET_EVSE_IEC61851_STATE_EF = 4;
+  BRICKLET_EVSE_LED_STATE_OFF = 0;
+  BRICKLET_EVSE_LED_STATE_ON = 1;
+  BRICKLET_EVSE_LED_STATE_BLINKING = 2;
+  BRICKLET_EVSE_LED_STATE_BREATHING = 3;
+  BRICKLET_EVSE_CONTACTOR_STATE_AC1_NLIVE_AC2_NLIVE = 0;
+  BRICKLET_EVSE_CONTACTOR_STATE_AC1_LIVE_AC2_NLIVE = 1;
+  BRICKLET_EVSE_CONTACTOR_STATE_AC1_NLIVE_AC2_LIVE = 2;
+  BRICKLET_EVSE_CONTACTOR_STATE_AC1_LIVE_AC2_LIVE = 3;
+  BRICKLET_EVSE_LOCK_STATE_INIT = 0;
+  BRICKLET_EVSE_LOCK_STATE_OPEN = 1;
+  BRICKLET_EVSE_LOCK_STATE_CLOSING = 2;
+  BRICKLET_EVSE_LOCK_STATE_CLOSE = 3;
+  BRICKLET_EVSE_LOCK_STATE_OPENING = 4;
+  BRICKLET_EVSE_LOCK_STATE_ERROR = 5;
+  BRICKLET_EVSE_JUMPER_CONFIGURATION_6A = 0;
+  BRICKLET_EVSE_JUMPER_CONFIGURATION_10A = 1;
+  BRICKLET_EVSE_JUMPER_CONFIGURATION_13A = 2;
+  BRICKLET_EVSE_JUMPER_CONFIGURATION_16A = 3;
+  BRICKLET_EVSE_JUMPER_CONFIGURATION_20A = 4;
+  BRICKLET_EVSE_JUMPER_CONFIGURATION_25A = 5;
+  BRICKLET_EVSE_JUMPER_CONFIGURATION_32A = 6;
+  BRICKLET_EVSE_JUMPER_CONFIGURATION_SOFTWARE = 7;
+  BRICKLET_EVSE_JUMPER_CONFIGURATION_UNCONFIGURED = 8;
+  BRICKLET_EVSE_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_EVSE_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_EVSE_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_EVSE_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_EVSE_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_EVSE_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_EVSE_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_EVSE_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_EVSE_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_EVSE_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_EVSE_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_EVSE_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_EVSE_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_EVSE_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_EVSE_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To1OfUInt16 = array [0..1] of word;
+  TArray0To1OfUInt32 = array [0..1] of longword;
+  TArray0To2OfInt16 = array [0..2] of smallint;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To4OfBoolean = array [0..4] of boolean;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  /// <summary>
+  ///  TBD
+  /// </summary>
+  TBrickletEVSE = class(TDevice)
+  private
+  protected
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  TODO
+    /// </summary>
+    procedure GetState(out iec61851State: byte; out contactorState: byte; out contactorError: byte; out allowedChargingCurrent: word; out lockState: byte; out timeSinceStateChange: longword; out uptime: longword); virtual;
+
+    /// <summary>
+    ///  TODO
+    /// </summary>
+    procedure GetHardwareConfiguration(out jumperConfiguration: byte; out hasLockSwitch: boolean); virtual;
+
+    /// <summary>
+    ///  TODO
+    /// </summary>
+    procedure GetLowLevelState(out lowLevelModeEnabled: boolean; out ledState: byte; out cpPWMDutyCycle: word; out adcValues: TArray0To1OfUInt16; out voltages: TArray0To2OfInt16; out resistances: TArray0To1OfUInt32; out gpio: TArray0To4OfBoolean; out motorDirection: boolean; out motorDutyCycle: word); virtual;
+
+    /// <summary>
+    ///  TODO
+    /// </summary>
+    procedure SetMaxChargingCurrent(const maxCurrent: word); virtual;
+
+    /// <summary>
+    ///  * Max Current Configured -&gt; set with <see cref="BrickletEVSE.TBrickletEVSE.SetMaxChargingCurrent"/>
+    ///  * Max Current Incoming Cable -&gt; set with jumper on EVSE
+    ///  * Max Current Outgoing Cable -&gt; set with resistor between PP/PE (if fixed cable is used)
+    ///  
+    ///  TODO
+    /// </summary>
+    procedure GetMaxChargingCurrent(out maxCurrentConfigured: word; out maxCurrentIncomingCable: word; out maxCurrentOutgoingCable: word); virtual;
+
+    /// <summary>
+    ///  TODO
+    /// </summary>
+    function Calibrate(const state: byte; const password: longword; const value: longint): boolean; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletEVSE.TBrickletEVSE.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletEVSE.TBrickletEVSE.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletEVSE.TBrickletEVSE.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletEVSE.TBrickletEVSE.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+  end;
+
+implementation
+
+constructor TBrickletEVSE.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_EVSE_DEVICE_IDENTIFIER, BRICKLET_EVSE_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_EVSE_FUNCTION_GET_STATE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_GET_HARDWARE_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_GET_LOW_LEVEL_STATE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_SET_MAX_CHARGING_CURRENT] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_GET_MAX_CHARGING_CURRENT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_CALIBRATE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_EVSE_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletEVSE.GetState(out iec61851State: byte; out contactorState: byte; out contactorError: byte; out allowedChargingCurrent: word; out lockState: byte; out timeSinceStateChange: longword; out uptime: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_GET_STATE, 8);
+  response := SendRequest(request, 22);
+  iec61851State := LEConvertUInt8From(8, response);
+  contactorState := LEConvertUInt8From(9, response);
+  contactorError := LEConvertUInt8From(10, response);
+  allowedChargingCurrent := LEConvertUInt16From(11, response);
+  lockState := LEConvertUInt8From(13, response);
+  timeSinceStateChange := LEConvertUInt32From(14, response);
+  uptime := LEConvertUInt32From(18, response);
+end;
+
+procedure TBrickletEVSE.GetHardwareConfiguration(out jumperConfiguration: byte; out hasLockSwitch: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_GET_HARDWARE_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  jumperConfiguration := LEConvertUInt8From(8, response);
+  hasLockSwitch := LEConvertBooleanFrom(9, response);
+end;
+
+procedure TBrickletEVSE.GetLowLevelState(out lowLevelModeEnabled: boolean; out ledState: byte; out cpPWMDutyCycle: word; out adcValues: TArray0To1OfUInt16; out voltages: TArray0To2OfInt16; out resistances: TArray0To1OfUInt32; out gpio: TArray0To4OfBoolean; out motorDirection: boolean; out motorDutyCycle: word);
+var request, response: TByteArray; i: longint; gpioBits: array [0..0] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_GET_LOW_LEVEL_STATE, 8);
+  response := SendRequest(request, 34);
+  lowLevelModeEnabled := LEConvertBooleanFrom(8, response);
+  ledState := LEConvertUInt8From(9, response);
+  cpPWMDutyCycle := LEConvertUInt16From(10, response);
+  for i := 0 to 1 do adcValues[i] := LEConvertUInt16From(12 + (i * 2), response);
+  for i := 0 to 2 do voltages[i] := LEConvertInt16From(16 + (i * 2), response);
+  for i := 0 to 1 do resistances[i] := LEConvertUInt32From(22 + (i * 4), response);
+  FillChar(gpioBits[0], Length(gpioBits) * SizeOf(gpioBits[0]), 0);
+  for i := 0 to 0 do gpioBits[i] := LEConvertUInt8From(30 + (i * 1), response);
+  for i := 0 to 4 do gpio[i] := ((gpioBits[Floor(i / 8)] and (1 shl (i mod 8))) <> 0);
+  motorDirection := LEConvertBooleanFrom(31, response);
+  motorDutyCycle := LEConvertUInt16From(32, response);
+end;
+
+procedure TBrickletEVSE.SetMaxChargingCurrent(const maxCurrent: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_SET_MAX_CHARGING_CURRENT, 10);
+  LEConvertUInt16To(maxCurrent, 8, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletEVSE.GetMaxChargingCurrent(out maxCurrentConfigured: word; out maxCurrentIncomingCable: word; out maxCurrentOutgoingCable: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_GET_MAX_CHARGING_CURRENT, 8);
+  response := SendRequest(request, 14);
+  maxCurrentConfigured := LEConvertUInt16From(8, response);
+  maxCurrentIncomingCable := LEConvertUInt16From(10, response);
+  maxCurrentOutgoingCable := LEConvertUInt16From(12, response);
+end;
+
+function TBrickletEVSE.Calibrate(const state: byte; const password: longword; const value: longint): boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_CALIBRATE, 17);
+  LEConvertUInt8To(state, 8, request);
+  LEConvertUInt32To(password, 9, request);
+  LEConvertInt32To(value, 13, request);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletEVSE.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletEVSE.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletEVSE.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletEVSE.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletEVSE.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletEVSE.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletEVSE.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletEVSE.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletEVSE.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletEVSE.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletEVSE.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletEVSE.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_EVSE_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+end.
@@ -0,0 +1,1013 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletGPSV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_GPS_V2_DEVICE_IDENTIFIER = 276;
+  BRICKLET_GPS_V2_DEVICE_DISPLAY_NAME = 'GPS Bricklet 2.0';
+
+  BRICKLET_GPS_V2_FUNCTION_GET_COORDINATES = 1;
+  BRICKLET_GPS_V2_FUNCTION_GET_STATUS = 2;
+  BRICKLET_GPS_V2_FUNCTION_GET_ALTITUDE = 3;
+  BRICKLET_GPS_V2_FUNCTION_GET_MOTION = 4;
+  BRICKLET_GPS_V2_FUNCTION_GET_DATE_TIME = 5;
+  BRICKLET_GPS_V2_FUNCTION_RESTART = 6;
+  BRICKLET_GPS_V2_FUNCTION_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL = 7;
+  BRICKLET_GPS_V2_FUNCTION_GET_SATELLITE_STATUS = 8;
+  BRICKLET_GPS_V2_FUNCTION_SET_FIX_LED_CONFIG = 9;
+  BRICKLET_GPS_V2_FUNCTION_GET_FIX_LED_CONFIG = 10;
+  BRICKLET_GPS_V2_FUNCTION_SET_COORDINATES_CALLBACK_PERIOD = 11;
+  BRICKLET_GPS_V2_FUNCTION_GET_COORDINATES_CALLBACK_PERIOD = 12;
+  BRICKLET_GPS_V2_FUNCTION_SET_STATUS_CALLBACK_PERIOD = 13;
+  BRICKLET_GPS_V2_FUNCTION_GET_STATUS_CALLBACK_PERIOD = 14;
+  BRICKLET_GPS_V2_FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD = 15;
+  BRICKLET_GPS_V2_FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD = 16;
+  BRICKLET_GPS_V2_FUNCTION_SET_MOTION_CALLBACK_PERIOD = 17;
+  BRICKLET_GPS_V2_FUNCTION_GET_MOTION_CALLBACK_PERIOD = 18;
+  BRICKLET_GPS_V2_FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD = 19;
+  BRICKLET_GPS_V2_FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD = 20;
+  BRICKLET_GPS_V2_FUNCTION_SET_SBAS_CONFIG = 27;
+  BRICKLET_GPS_V2_FUNCTION_GET_SBAS_CONFIG = 28;
+  BRICKLET_GPS_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_GPS_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_GPS_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_GPS_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_GPS_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_GPS_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_GPS_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_GPS_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_GPS_V2_FUNCTION_RESET = 243;
+  BRICKLET_GPS_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_GPS_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_GPS_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_GPS_V2_CALLBACK_PULSE_PER_SECOND = 21;
+  BRICKLET_GPS_V2_CALLBACK_COORDINATES = 22;
+  BRICKLET_GPS_V2_CALLBACK_STATUS = 23;
+  BRICKLET_GPS_V2_CALLBACK_ALTITUDE = 24;
+  BRICKLET_GPS_V2_CALLBACK_MOTION = 25;
+  BRICKLET_GPS_V2_CALLBACK_DATE_TIME = 26;
+
+  BRICKLET_GPS_V2_RESTART_TYPE_HOT_START = 0;
+  BRICKLET_GPS_V2_RESTART_TYPE_WARM_START = 1;
+  BRICKLET_GPS_V2_RESTART_TYPE_COLD_START = 2;
+  BRICKLET_GPS_V2_RESTART_TYPE_FACTORY_RESET = 3;
+  BRICKLET_GPS_V2_SATELLITE_SYSTEM_GPS = 0;
+  BRICKLET_GPS_V2_SATELLITE_SYSTEM_GLONASS = 1;
+  BRICKLET_GPS_V2_SATELLITE_SYSTEM_GALILEO = 2;
+  BRICKLET_GPS_V2_FIX_NO_FIX = 1;
+  BRICKLET_GPS_V2_FIX_2D_FIX = 2;
+  BRICKLET_GPS_V2_FIX_3D_FIX = 3;
+  BRICKLET_GPS_V2_FIX_LED_CONFIG_OFF = 0;
+  BRICKLET_GPS_V2_FIX_LED_CONFIG_ON = 1;
+  BRICKLET_GPS_V2_FIX_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_GPS_V2_FIX_LED_CONFIG_SHOW_FIX = 3;
+  BRICKLET_GPS_V2_FIX_LED_CONFIG_SHOW_PPS = 4;
+  BRICKLET_GPS_V2_SBAS_ENABLED = 0;
+  BRICKLET_GPS_V2_SBAS_DISABLED = 1;
+  BRICKLET_GPS_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_GPS_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_GPS_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_GPS_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_GPS_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_GPS_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_GPS_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_GPS_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_GPS_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_GPS_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_GPS_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_GPS_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_GPS_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_GPS_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_GPS_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To11OfUInt8 = array [0..11] of byte;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+  TArrayOfUInt8 = array of byte;
+
+  TBrickletGPSV2 = class;
+  TBrickletGPSV2NotifyPulsePerSecond = procedure(sender: TBrickletGPSV2) of object;
+  TBrickletGPSV2NotifyCoordinates = procedure(sender: TBrickletGPSV2; const latitude: longword; const ns: char; const longitude: longword; const ew: char) of object;
+  TBrickletGPSV2NotifyStatus = procedure(sender: TBrickletGPSV2; const hasFix: boolean; const satellitesView: byte) of object;
+  TBrickletGPSV2NotifyAltitude = procedure(sender: TBrickletGPSV2; const altitude: longint; const geoidalSeparation: longint) of object;
+  TBrickletGPSV2NotifyMotion = procedure(sender: TBrickletGPSV2; const course: longword; const speed: longword) of object;
+  TBrickletGPSV2NotifyDateTime = procedure(sender: TBrickletGPSV2; const date: longword; const time: longword) of object;
+
+  /// <summary>
+  ///  Determine position, velocity and altitude using GPS
+  /// </summary>
+  TBrickletGPSV2 = class(TDevice)
+  private
+    streamMutex: TCriticalSection;
+    pulsePerSecondCallback: TBrickletGPSV2NotifyPulsePerSecond;
+    coordinatesCallback: TBrickletGPSV2NotifyCoordinates;
+    statusCallback: TBrickletGPSV2NotifyStatus;
+    altitudeCallback: TBrickletGPSV2NotifyAltitude;
+    motionCallback: TBrickletGPSV2NotifyMotion;
+    dateTimeCallback: TBrickletGPSV2NotifyDateTime;
+  protected
+    procedure CallbackWrapperPulsePerSecond(const packet: TByteArray); virtual;
+    procedure CallbackWrapperCoordinates(const packet: TByteArray); virtual;
+    procedure CallbackWrapperStatus(const packet: TByteArray); virtual;
+    procedure CallbackWrapperAltitude(const packet: TByteArray); virtual;
+    procedure CallbackWrapperMotion(const packet: TByteArray); virtual;
+    procedure CallbackWrapperDateTime(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the GPS coordinates. Latitude and longitude are given in the
+    ///  ``DD.dddddd°`` format, the value 57123468 means 57.123468°.
+    ///  The parameter ``ns`` and ``ew`` are the cardinal directions for
+    ///  latitude and longitude. Possible values for ``ns`` and ``ew`` are 'N', 'S', 'E'
+    ///  and 'W' (north, south, east and west).
+    ///  
+    ///  This data is only valid if there is currently a fix as indicated by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.GetStatus"/>.
+    /// </summary>
+    procedure GetCoordinates(out latitude: longword; out ns: char; out longitude: longword; out ew: char); virtual;
+
+    /// <summary>
+    ///  Returns if a fix is currently available as well as the, the number of
+    ///  satellites that are in view.
+    ///  
+    ///  There is also a :ref:`green LED &lt;gps_v2_bricklet_fix_led&gt;` on the Bricklet that
+    ///  indicates the fix status.
+    /// </summary>
+    procedure GetStatus(out hasFix: boolean; out satellitesView: byte); virtual;
+
+    /// <summary>
+    ///  Returns the current altitude and corresponding geoidal separation.
+    ///  
+    ///  This data is only valid if there is currently a fix as indicated by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.GetStatus"/>.
+    /// </summary>
+    procedure GetAltitude(out altitude: longint; out geoidalSeparation: longint); virtual;
+
+    /// <summary>
+    ///  Returns the current course and speed. A course of 0° means the Bricklet is
+    ///  traveling north bound and 90° means it is traveling east bound.
+    ///  
+    ///  Please note that this only returns useful values if an actual movement
+    ///  is present.
+    ///  
+    ///  This data is only valid if there is currently a fix as indicated by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.GetStatus"/>.
+    /// </summary>
+    procedure GetMotion(out course: longword; out speed: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current date and time. The date is
+    ///  given in the format ``ddmmyy`` and the time is given
+    ///  in the format ``hhmmss.sss``. For example, 140713 means
+    ///  14.07.13 as date and 195923568 means 19:59:23.568 as time.
+    /// </summary>
+    procedure GetDateTime(out date: longword; out time: longword); virtual;
+
+    /// <summary>
+    ///  Restarts the GPS Bricklet, the following restart types are available:
+    ///  
+    ///  <code>
+    ///   "Value", "Description"
+    ///  
+    ///   "0", "Hot start (use all available data in the NV store)"
+    ///   "1", "Warm start (don't use ephemeris at restart)"
+    ///   "2", "Cold start (don't use time, position, almanacs and ephemeris at restart)"
+    ///   "3", "Factory reset (clear all system/user configurations at restart)"
+    ///  </code>
+    /// </summary>
+    procedure Restart(const restartType: byte); virtual;
+
+    /// <summary>
+    ///  Returns the
+    ///  
+    ///  * satellite numbers list (up to 12 items)
+    ///  * fix value,
+    ///  * PDOP value,
+    ///  * HDOP value and
+    ///  * VDOP value
+    ///  
+    ///  for a given satellite system. Currently GPS and GLONASS are supported, Galileo
+    ///  is not yet supported.
+    ///  
+    ///  The GPS and GLONASS satellites have unique numbers and the satellite list gives
+    ///  the numbers of the satellites that are currently utilized. The number 0 is not
+    ///  a valid satellite number and can be ignored in the list.
+    /// </summary>
+    procedure GetSatelliteSystemStatusLowLevel(const satelliteSystem: byte; out satelliteNumbersLength: byte; out satelliteNumbersData: TArray0To11OfUInt8; out fix: byte; out pdop: word; out hdop: word; out vdop: word); virtual;
+
+    /// <summary>
+    ///  Returns the
+    ///  
+    ///  * satellite numbers list (up to 12 items)
+    ///  * fix value,
+    ///  * PDOP value,
+    ///  * HDOP value and
+    ///  * VDOP value
+    ///  
+    ///  for a given satellite system. Currently GPS and GLONASS are supported, Galileo
+    ///  is not yet supported.
+    ///  
+    ///  The GPS and GLONASS satellites have unique numbers and the satellite list gives
+    ///  the numbers of the satellites that are currently utilized. The number 0 is not
+    ///  a valid satellite number and can be ignored in the list.
+    /// </summary>
+    procedure GetSatelliteSystemStatus(const satelliteSystem: byte; out satelliteNumbers: TArrayOfUInt8; out fix: byte; out pdop: word; out hdop: word; out vdop: word); virtual;
+
+    /// <summary>
+    ///  Returns the current elevation, azimuth and SNR
+    ///  for a given satellite and satellite system.
+    ///  
+    ///  The satellite number here always goes from 1 to 32. For GLONASS it corresponds to
+    ///  the satellites 65-96.
+    ///  
+    ///  Galileo is not yet supported.
+    /// </summary>
+    procedure GetSatelliteStatus(const satelliteSystem: byte; const satelliteNumber: byte; out elevation: smallint; out azimuth: smallint; out snr: smallint); virtual;
+
+    /// <summary>
+    ///  Sets the fix LED configuration. By default the LED shows if
+    ///  the Bricklet got a GPS fix yet. If a fix is established the LED turns on.
+    ///  If there is no fix then the LED is turned off.
+    ///  
+    ///  You can also turn the LED permanently on/off, show a heartbeat or let it blink
+    ///  in sync with the PPS (pulse per second) output of the GPS module.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is off.
+    /// </summary>
+    procedure SetFixLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletGPSV2.TBrickletGPSV2.SetFixLEDConfig"/>
+    /// </summary>
+    function GetFixLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Sets the period with which the <see cref="BrickletGPSV2.TBrickletGPSV2.OnCoordinates"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  The <see cref="BrickletGPSV2.TBrickletGPSV2.OnCoordinates"/> callback is only triggered if the coordinates changed
+    ///  since the last triggering.
+    /// </summary>
+    procedure SetCoordinatesCallbackPeriod(const period: longword); virtual;
+
+    /// <summary>
+    ///  Returns the period as set by <see cref="BrickletGPSV2.TBrickletGPSV2.SetCoordinatesCallbackPeriod"/>.
+    /// </summary>
+    function GetCoordinatesCallbackPeriod: longword; virtual;
+
+    /// <summary>
+    ///  Sets the period with which the <see cref="BrickletGPSV2.TBrickletGPSV2.OnStatus"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  The <see cref="BrickletGPSV2.TBrickletGPSV2.OnStatus"/> callback is only triggered if the status changed since the
+    ///  last triggering.
+    /// </summary>
+    procedure SetStatusCallbackPeriod(const period: longword); virtual;
+
+    /// <summary>
+    ///  Returns the period as set by <see cref="BrickletGPSV2.TBrickletGPSV2.SetStatusCallbackPeriod"/>.
+    /// </summary>
+    function GetStatusCallbackPeriod: longword; virtual;
+
+    /// <summary>
+    ///  Sets the period with which the <see cref="BrickletGPSV2.TBrickletGPSV2.OnAltitude"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  The <see cref="BrickletGPSV2.TBrickletGPSV2.OnAltitude"/> callback is only triggered if the altitude changed since the
+    ///  last triggering.
+    /// </summary>
+    procedure SetAltitudeCallbackPeriod(const period: longword); virtual;
+
+    /// <summary>
+    ///  Returns the period as set by <see cref="BrickletGPSV2.TBrickletGPSV2.SetAltitudeCallbackPeriod"/>.
+    /// </summary>
+    function GetAltitudeCallbackPeriod: longword; virtual;
+
+    /// <summary>
+    ///  Sets the period with which the <see cref="BrickletGPSV2.TBrickletGPSV2.OnMotion"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  The <see cref="BrickletGPSV2.TBrickletGPSV2.OnMotion"/> callback is only triggered if the motion changed since the
+    ///  last triggering.
+    /// </summary>
+    procedure SetMotionCallbackPeriod(const period: longword); virtual;
+
+    /// <summary>
+    ///  Returns the period as set by <see cref="BrickletGPSV2.TBrickletGPSV2.SetMotionCallbackPeriod"/>.
+    /// </summary>
+    function GetMotionCallbackPeriod: longword; virtual;
+
+    /// <summary>
+    ///  Sets the period with which the <see cref="BrickletGPSV2.TBrickletGPSV2.OnDateTime"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  The <see cref="BrickletGPSV2.TBrickletGPSV2.OnDateTime"/> callback is only triggered if the date or time changed
+    ///  since the last triggering.
+    /// </summary>
+    procedure SetDateTimeCallbackPeriod(const period: longword); virtual;
+
+    /// <summary>
+    ///  Returns the period as set by <see cref="BrickletGPSV2.TBrickletGPSV2.SetDateTimeCallbackPeriod"/>.
+    /// </summary>
+    function GetDateTimeCallbackPeriod: longword; virtual;
+
+    /// <summary>
+    ///  If `SBAS &lt;https://en.wikipedia.org/wiki/GNSS_augmentation#Satellite-based_augmentation_system&gt;`__ is enabled,
+    ///  the position accuracy increases (if SBAS satellites are in view),
+    ///  but the update rate is limited to 5Hz. With SBAS disabled the update rate is increased to 10Hz.
+    ///  
+    ///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+    /// </summary>
+    procedure SetSBASConfig(const sbasConfig: byte); virtual;
+
+    /// <summary>
+    ///  Returns the SBAS configuration as set by <see cref="BrickletGPSV2.TBrickletGPSV2.SetSBASConfig"/>
+    ///  
+    ///  .. versionadded:: 2.0.2$nbsp;(Plugin)
+    /// </summary>
+    function GetSBASConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletGPSV2.TBrickletGPSV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletGPSV2.TBrickletGPSV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletGPSV2.TBrickletGPSV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered precisely once per second,
+    ///  see `PPS &lt;https://en.wikipedia.org/wiki/Pulse-per-second_signal&gt;`__.
+    ///  
+    ///  The precision of two subsequent pulses will be skewed because
+    ///  of the latency in the USB/RS485/Ethernet connection. But in the
+    ///  long run this will be very precise. For example a count of
+    ///  3600 pulses will take exactly 1 hour.
+    /// </summary>
+    property OnPulsePerSecond: TBrickletGPSV2NotifyPulsePerSecond read pulsePerSecondCallback write pulsePerSecondCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.SetCoordinatesCallbackPeriod"/>. The parameters are the same
+    ///  as for <see cref="BrickletGPSV2.TBrickletGPSV2.GetCoordinates"/>.
+    ///  
+    ///  The <see cref="BrickletGPSV2.TBrickletGPSV2.OnCoordinates"/> callback is only triggered if the coordinates changed
+    ///  since the last triggering and if there is currently a fix as indicated by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.GetStatus"/>.
+    /// </summary>
+    property OnCoordinates: TBrickletGPSV2NotifyCoordinates read coordinatesCallback write coordinatesCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.SetStatusCallbackPeriod"/>. The parameters are the same
+    ///  as for <see cref="BrickletGPSV2.TBrickletGPSV2.GetStatus"/>.
+    ///  
+    ///  The <see cref="BrickletGPSV2.TBrickletGPSV2.OnStatus"/> callback is only triggered if the status changed since the
+    ///  last triggering.
+    /// </summary>
+    property OnStatus: TBrickletGPSV2NotifyStatus read statusCallback write statusCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.SetAltitudeCallbackPeriod"/>. The parameters are the same
+    ///  as for <see cref="BrickletGPSV2.TBrickletGPSV2.GetAltitude"/>.
+    ///  
+    ///  The <see cref="BrickletGPSV2.TBrickletGPSV2.OnAltitude"/> callback is only triggered if the altitude changed since the
+    ///  last triggering and if there is currently a fix as indicated by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.GetStatus"/>.
+    /// </summary>
+    property OnAltitude: TBrickletGPSV2NotifyAltitude read altitudeCallback write altitudeCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.SetMotionCallbackPeriod"/>. The parameters are the same
+    ///  as for <see cref="BrickletGPSV2.TBrickletGPSV2.GetMotion"/>.
+    ///  
+    ///  The <see cref="BrickletGPSV2.TBrickletGPSV2.OnMotion"/> callback is only triggered if the motion changed since the
+    ///  last triggering and if there is currently a fix as indicated by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.GetStatus"/>.
+    /// </summary>
+    property OnMotion: TBrickletGPSV2NotifyMotion read motionCallback write motionCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletGPSV2.TBrickletGPSV2.SetDateTimeCallbackPeriod"/>. The parameters are the same
+    ///  as for <see cref="BrickletGPSV2.TBrickletGPSV2.GetDateTime"/>.
+    ///  
+    ///  The <see cref="BrickletGPSV2.TBrickletGPSV2.OnDateTime"/> callback is only triggered if the date or time changed
+    ///  since the last triggering.
+    /// </summary>
+    property OnDateTime: TBrickletGPSV2NotifyDateTime read dateTimeCallback write dateTimeCallback;
+  end;
+
+implementation
+
+constructor TBrickletGPSV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_GPS_V2_DEVICE_IDENTIFIER, BRICKLET_GPS_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 1;
+
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_COORDINATES] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_STATUS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_ALTITUDE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_MOTION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_DATE_TIME] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_RESTART] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_SATELLITE_STATUS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_SET_FIX_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_FIX_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_SET_COORDINATES_CALLBACK_PERIOD] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_COORDINATES_CALLBACK_PERIOD] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_SET_STATUS_CALLBACK_PERIOD] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_STATUS_CALLBACK_PERIOD] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_SET_MOTION_CALLBACK_PERIOD] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_MOTION_CALLBACK_PERIOD] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_SET_SBAS_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_SBAS_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_GPS_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  streamMutex := TCriticalSection.Create;
+
+  callbackWrappers[BRICKLET_GPS_V2_CALLBACK_PULSE_PER_SECOND] := {$ifdef FPC}@{$endif}CallbackWrapperPulsePerSecond;
+  callbackWrappers[BRICKLET_GPS_V2_CALLBACK_COORDINATES] := {$ifdef FPC}@{$endif}CallbackWrapperCoordinates;
+  callbackWrappers[BRICKLET_GPS_V2_CALLBACK_STATUS] := {$ifdef FPC}@{$endif}CallbackWrapperStatus;
+  callbackWrappers[BRICKLET_GPS_V2_CALLBACK_ALTITUDE] := {$ifdef FPC}@{$endif}CallbackWrapperAltitude;
+  callbackWrappers[BRICKLET_GPS_V2_CALLBACK_MOTION] := {$ifdef FPC}@{$endif}CallbackWrapperMotion;
+  callbackWrappers[BRICKLET_GPS_V2_CALLBACK_DATE_TIME] := {$ifdef FPC}@{$endif}CallbackWrapperDateTime;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletGPSV2.GetCoordinates(out latitude: longword; out ns: char; out longitude: longword; out ew: char);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_COORDINATES, 8);
+  response := SendRequest(request, 18);
+  latitude := LEConvertUInt32From(8, response);
+  ns := LEConvertCharFrom(12, response);
+  longitude := LEConvertUInt32From(13, response);
+  ew := LEConvertCharFrom(17, response);
+end;
+
+procedure TBrickletGPSV2.GetStatus(out hasFix: boolean; out satellitesView: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_STATUS, 8);
+  response := SendRequest(request, 10);
+  hasFix := LEConvertBooleanFrom(8, response);
+  satellitesView := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletGPSV2.GetAltitude(out altitude: longint; out geoidalSeparation: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_ALTITUDE, 8);
+  response := SendRequest(request, 16);
+  altitude := LEConvertInt32From(8, response);
+  geoidalSeparation := LEConvertInt32From(12, response);
+end;
+
+procedure TBrickletGPSV2.GetMotion(out course: longword; out speed: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_MOTION, 8);
+  response := SendRequest(request, 16);
+  course := LEConvertUInt32From(8, response);
+  speed := LEConvertUInt32From(12, response);
+end;
+
+procedure TBrickletGPSV2.GetDateTime(out date: longword; out time: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_DATE_TIME, 8);
+  response := SendRequest(request, 16);
+  date := LEConvertUInt32From(8, response);
+  time := LEConvertUInt32From(12, response);
+end;
+
+procedure TBrickletGPSV2.Restart(const restartType: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_RESTART, 9);
+  LEConvertUInt8To(restartType, 8, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletGPSV2.GetSatelliteSystemStatusLowLevel(const satelliteSystem: byte; out satelliteNumbersLength: byte; out satelliteNumbersData: TArray0To11OfUInt8; out fix: byte; out pdop: word; out hdop: word; out vdop: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_SATELLITE_SYSTEM_STATUS_LOW_LEVEL, 9);
+  LEConvertUInt8To(satelliteSystem, 8, request);
+  response := SendRequest(request, 28);
+  satelliteNumbersLength := LEConvertUInt8From(8, response);
+  for i := 0 to 11 do satelliteNumbersData[i] := LEConvertUInt8From(9 + (i * 1), response);
+  fix := LEConvertUInt8From(21, response);
+  pdop := LEConvertUInt16From(22, response);
+  hdop := LEConvertUInt16From(24, response);
+  vdop := LEConvertUInt16From(26, response);
+end;
+
+procedure TBrickletGPSV2.GetSatelliteSystemStatus(const satelliteSystem: byte; out satelliteNumbers: TArrayOfUInt8; out fix: byte; out pdop: word; out hdop: word; out vdop: word);
+var
+  satelliteNumbersLength: byte;
+  satelliteNumbersData: TArray0To11OfUInt8;
+begin
+  GetSatelliteSystemStatusLowLevel(satelliteSystem, satelliteNumbersLength, satelliteNumbersData, fix, pdop, hdop, vdop);
+  SetLength(satelliteNumbers, satelliteNumbersLength);
+  Move(satelliteNumbersData, satelliteNumbers[0], SizeOf(byte) * satelliteNumbersLength);
+end;
+
+procedure TBrickletGPSV2.GetSatelliteStatus(const satelliteSystem: byte; const satelliteNumber: byte; out elevation: smallint; out azimuth: smallint; out snr: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_SATELLITE_STATUS, 10);
+  LEConvertUInt8To(satelliteSystem, 8, request);
+  LEConvertUInt8To(satelliteNumber, 9, request);
+  response := SendRequest(request, 14);
+  elevation := LEConvertInt16From(8, response);
+  azimuth := LEConvertInt16From(10, response);
+  snr := LEConvertInt16From(12, response);
+end;
+
+procedure TBrickletGPSV2.SetFixLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_SET_FIX_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletGPSV2.GetFixLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_FIX_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletGPSV2.SetCoordinatesCallbackPeriod(const period: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_SET_COORDINATES_CALLBACK_PERIOD, 12);
+  LEConvertUInt32To(period, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletGPSV2.GetCoordinatesCallbackPeriod: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_COORDINATES_CALLBACK_PERIOD, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletGPSV2.SetStatusCallbackPeriod(const period: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_SET_STATUS_CALLBACK_PERIOD, 12);
+  LEConvertUInt32To(period, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletGPSV2.GetStatusCallbackPeriod: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_STATUS_CALLBACK_PERIOD, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletGPSV2.SetAltitudeCallbackPeriod(const period: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_SET_ALTITUDE_CALLBACK_PERIOD, 12);
+  LEConvertUInt32To(period, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletGPSV2.GetAltitudeCallbackPeriod: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_ALTITUDE_CALLBACK_PERIOD, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletGPSV2.SetMotionCallbackPeriod(const period: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_SET_MOTION_CALLBACK_PERIOD, 12);
+  LEConvertUInt32To(period, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletGPSV2.GetMotionCallbackPeriod: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_MOTION_CALLBACK_PERIOD, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletGPSV2.SetDateTimeCallbackPeriod(const period: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_SET_DATE_TIME_CALLBACK_PERIOD, 12);
+  LEConvertUInt32To(period, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletGPSV2.GetDateTimeCallbackPeriod: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_DATE_TIME_CALLBACK_PERIOD, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletGPSV2.SetSBASConfig(const sbasConfig: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_SET_SBAS_CONFIG, 9);
+  LEConvertUInt8To(sbasConfig, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletGPSV2.GetSBASConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_SBAS_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletGPSV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletGPSV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletGPSV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletGPSV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletGPSV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletGPSV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletGPSV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletGPSV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletGPSV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletGPSV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletGPSV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletGPSV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_GPS_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletGPSV2.CallbackWrapperPulsePerSecond(const packet: TByteArray);
+begin
+  if (Length(packet) <> 8) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  if (Assigned(pulsePerSecondCallback)) then begin
+    pulsePerSecondCallback(self);
+  end;
+end;
+
+procedure TBrickletGPSV2.CallbackWrapperCoordinates(const packet: TByteArray);
+var latitude: longword; ns: char; longitude: longword; ew: char;
+begin
+  if (Length(packet) <> 18) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  latitude := LEConvertUInt32From(8, packet);
+  ns := LEConvertCharFrom(12, packet);
+  longitude := LEConvertUInt32From(13, packet);
+  ew := LEConvertCharFrom(17, packet);
+  if (Assigned(coordinatesCallback)) then begin
+    coordinatesCallback(self, latitude, ns, longitude, ew);
+  end;
+end;
+
+procedure TBrickletGPSV2.CallbackWrapperStatus(const packet: TByteArray);
+var hasFix: boolean; satellitesView: byte;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  hasFix := LEConvertBooleanFrom(8, packet);
+  satellitesView := LEConvertUInt8From(9, packet);
+  if (Assigned(statusCallback)) then begin
+    statusCallback(self, hasFix, satellitesView);
+  end;
+end;
+
+procedure TBrickletGPSV2.CallbackWrapperAltitude(const packet: TByteArray);
+var altitude: longint; geoidalSeparation: longint;
+begin
+  if (Length(packet) <> 16) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  altitude := LEConvertInt32From(8, packet);
+  geoidalSeparation := LEConvertInt32From(12, packet);
+  if (Assigned(altitudeCallback)) then begin
+    altitudeCallback(self, altitude, geoidalSeparation);
+  end;
+end;
+
+procedure TBrickletGPSV2.CallbackWrapperMotion(const packet: TByteArray);
+var course: longword; speed: longword;
+begin
+  if (Length(packet) <> 16) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  course := LEConvertUInt32From(8, packet);
+  speed := LEConvertUInt32From(12, packet);
+  if (Assigned(motionCallback)) then begin
+    motionCallback(self, course, speed);
+  end;
+end;
+
+procedure TBrickletGPSV2.CallbackWrapperDateTime(const packet: TByteArray);
+var date: longword; time: longword;
+begin
+  if (Length(packet) <> 16) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  date := LEConvertUInt32From(8, packet);
+  time := LEConvertUInt32From(12, packet);
+  if (Assigned(dateTimeCallback)) then begin
+    dateTimeCallback(self, date, time);
+  end;
+end;
+
+end.
@@ -0,0 +1,1361 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletIMUV3;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_IMU_V3_DEVICE_IDENTIFIER = 2161;
+  BRICKLET_IMU_V3_DEVICE_DISPLAY_NAME = 'IMU Bricklet 3.0';
+
+  BRICKLET_IMU_V3_FUNCTION_GET_ACCELERATION = 1;
+  BRICKLET_IMU_V3_FUNCTION_GET_MAGNETIC_FIELD = 2;
+  BRICKLET_IMU_V3_FUNCTION_GET_ANGULAR_VELOCITY = 3;
+  BRICKLET_IMU_V3_FUNCTION_GET_TEMPERATURE = 4;
+  BRICKLET_IMU_V3_FUNCTION_GET_ORIENTATION = 5;
+  BRICKLET_IMU_V3_FUNCTION_GET_LINEAR_ACCELERATION = 6;
+  BRICKLET_IMU_V3_FUNCTION_GET_GRAVITY_VECTOR = 7;
+  BRICKLET_IMU_V3_FUNCTION_GET_QUATERNION = 8;
+  BRICKLET_IMU_V3_FUNCTION_GET_ALL_DATA = 9;
+  BRICKLET_IMU_V3_FUNCTION_SAVE_CALIBRATION = 10;
+  BRICKLET_IMU_V3_FUNCTION_SET_SENSOR_CONFIGURATION = 11;
+  BRICKLET_IMU_V3_FUNCTION_GET_SENSOR_CONFIGURATION = 12;
+  BRICKLET_IMU_V3_FUNCTION_SET_SENSOR_FUSION_MODE = 13;
+  BRICKLET_IMU_V3_FUNCTION_GET_SENSOR_FUSION_MODE = 14;
+  BRICKLET_IMU_V3_FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION = 15;
+  BRICKLET_IMU_V3_FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION = 16;
+  BRICKLET_IMU_V3_FUNCTION_SET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION = 17;
+  BRICKLET_IMU_V3_FUNCTION_GET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION = 18;
+  BRICKLET_IMU_V3_FUNCTION_SET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION = 19;
+  BRICKLET_IMU_V3_FUNCTION_GET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION = 20;
+  BRICKLET_IMU_V3_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION = 21;
+  BRICKLET_IMU_V3_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION = 22;
+  BRICKLET_IMU_V3_FUNCTION_SET_ORIENTATION_CALLBACK_CONFIGURATION = 23;
+  BRICKLET_IMU_V3_FUNCTION_GET_ORIENTATION_CALLBACK_CONFIGURATION = 24;
+  BRICKLET_IMU_V3_FUNCTION_SET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION = 25;
+  BRICKLET_IMU_V3_FUNCTION_GET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION = 26;
+  BRICKLET_IMU_V3_FUNCTION_SET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION = 27;
+  BRICKLET_IMU_V3_FUNCTION_GET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION = 28;
+  BRICKLET_IMU_V3_FUNCTION_SET_QUATERNION_CALLBACK_CONFIGURATION = 29;
+  BRICKLET_IMU_V3_FUNCTION_GET_QUATERNION_CALLBACK_CONFIGURATION = 30;
+  BRICKLET_IMU_V3_FUNCTION_SET_ALL_DATA_CALLBACK_CONFIGURATION = 31;
+  BRICKLET_IMU_V3_FUNCTION_GET_ALL_DATA_CALLBACK_CONFIGURATION = 32;
+  BRICKLET_IMU_V3_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_IMU_V3_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_IMU_V3_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_IMU_V3_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_IMU_V3_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_IMU_V3_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_IMU_V3_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_IMU_V3_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_IMU_V3_FUNCTION_RESET = 243;
+  BRICKLET_IMU_V3_FUNCTION_WRITE_UID = 248;
+  BRICKLET_IMU_V3_FUNCTION_READ_UID = 249;
+  BRICKLET_IMU_V3_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_IMU_V3_CALLBACK_ACCELERATION = 33;
+  BRICKLET_IMU_V3_CALLBACK_MAGNETIC_FIELD = 34;
+  BRICKLET_IMU_V3_CALLBACK_ANGULAR_VELOCITY = 35;
+  BRICKLET_IMU_V3_CALLBACK_TEMPERATURE = 36;
+  BRICKLET_IMU_V3_CALLBACK_LINEAR_ACCELERATION = 37;
+  BRICKLET_IMU_V3_CALLBACK_GRAVITY_VECTOR = 38;
+  BRICKLET_IMU_V3_CALLBACK_ORIENTATION = 39;
+  BRICKLET_IMU_V3_CALLBACK_QUATERNION = 40;
+  BRICKLET_IMU_V3_CALLBACK_ALL_DATA = 41;
+
+  BRICKLET_IMU_V3_MAGNETOMETER_RATE_2HZ = 0;
+  BRICKLET_IMU_V3_MAGNETOMETER_RATE_6HZ = 1;
+  BRICKLET_IMU_V3_MAGNETOMETER_RATE_8HZ = 2;
+  BRICKLET_IMU_V3_MAGNETOMETER_RATE_10HZ = 3;
+  BRICKLET_IMU_V3_MAGNETOMETER_RATE_15HZ = 4;
+  BRICKLET_IMU_V3_MAGNETOMETER_RATE_20HZ = 5;
+  BRICKLET_IMU_V3_MAGNETOMETER_RATE_25HZ = 6;
+  BRICKLET_IMU_V3_MAGNETOMETER_RATE_30HZ = 7;
+  BRICKLET_IMU_V3_GYROSCOPE_RANGE_2000DPS = 0;
+  BRICKLET_IMU_V3_GYROSCOPE_RANGE_1000DPS = 1;
+  BRICKLET_IMU_V3_GYROSCOPE_RANGE_500DPS = 2;
+  BRICKLET_IMU_V3_GYROSCOPE_RANGE_250DPS = 3;
+  BRICKLET_IMU_V3_GYROSCOPE_RANGE_125DPS = 4;
+  BRICKLET_IMU_V3_GYROSCOPE_BANDWIDTH_523HZ = 0;
+  BRICKLET_IMU_V3_GYROSCOPE_BANDWIDTH_230HZ = 1;
+  BRICKLET_IMU_V3_GYROSCOPE_BANDWIDTH_116HZ = 2;
+  BRICKLET_IMU_V3_GYROSCOPE_BANDWIDTH_47HZ = 3;
+  BRICKLET_IMU_V3_GYROSCOPE_BANDWIDTH_23HZ = 4;
+  BRICKLET_IMU_V3_GYROSCOPE_BANDWIDTH_12HZ = 5;
+  BRICKLET_IMU_V3_GYROSCOPE_BANDWIDTH_64HZ = 6;
+  BRICKLET_IMU_V3_GYROSCOPE_BANDWIDTH_32HZ = 7;
+  BRICKLET_IMU_V3_ACCELEROMETER_RANGE_2G = 0;
+  BRICKLET_IMU_V3_ACCELEROMETER_RANGE_4G = 1;
+  BRICKLET_IMU_V3_ACCELEROMETER_RANGE_8G = 2;
+  BRICKLET_IMU_V3_ACCELEROMETER_RANGE_16G = 3;
+  BRICKLET_IMU_V3_ACCELEROMETER_BANDWIDTH_7_81HZ = 0;
+  BRICKLET_IMU_V3_ACCELEROMETER_BANDWIDTH_15_63HZ = 1;
+  BRICKLET_IMU_V3_ACCELEROMETER_BANDWIDTH_31_25HZ = 2;
+  BRICKLET_IMU_V3_ACCELEROMETER_BANDWIDTH_62_5HZ = 3;
+  BRICKLET_IMU_V3_ACCELEROMETER_BANDWIDTH_125HZ = 4;
+  BRICKLET_IMU_V3_ACCELEROMETER_BANDWIDTH_250HZ = 5;
+  BRICKLET_IMU_V3_ACCELEROMETER_BANDWIDTH_500HZ = 6;
+  BRICKLET_IMU_V3_ACCELEROMETER_BANDWIDTH_1000HZ = 7;
+  BRICKLET_IMU_V3_SENSOR_FUSION_OFF = 0;
+  BRICKLET_IMU_V3_SENSOR_FUSION_ON = 1;
+  BRICKLET_IMU_V3_SENSOR_FUSION_ON_WITHOUT_MAGNETOMETER = 2;
+  BRICKLET_IMU_V3_SENSOR_FUSION_ON_WITHOUT_FAST_MAGNETOMETER_CALIBRATION = 3;
+  BRICKLET_IMU_V3_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_IMU_V3_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_IMU_V3_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_IMU_V3_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_IMU_V3_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_IMU_V3_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_IMU_V3_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_IMU_V3_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_IMU_V3_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_IMU_V3_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_IMU_V3_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_IMU_V3_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_IMU_V3_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_IMU_V3_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_IMU_V3_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfInt16 = array [0..2] of smallint;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To3OfInt16 = array [0..3] of smallint;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletIMUV3 = class;
+  TBrickletIMUV3NotifyAcceleration = procedure(sender: TBrickletIMUV3; const x: smallint; const y: smallint; const z: smallint) of object;
+  TBrickletIMUV3NotifyMagneticField = procedure(sender: TBrickletIMUV3; const x: smallint; const y: smallint; const z: smallint) of object;
+  TBrickletIMUV3NotifyAngularVelocity = procedure(sender: TBrickletIMUV3; const x: smallint; const y: smallint; const z: smallint) of object;
+  TBrickletIMUV3NotifyTemperature = procedure(sender: TBrickletIMUV3; const temperature: shortint) of object;
+  TBrickletIMUV3NotifyLinearAcceleration = procedure(sender: TBrickletIMUV3; const x: smallint; const y: smallint; const z: smallint) of object;
+  TBrickletIMUV3NotifyGravityVector = procedure(sender: TBrickletIMUV3; const x: smallint; const y: smallint; const z: smallint) of object;
+  TBrickletIMUV3NotifyOrientation = procedure(sender: TBrickletIMUV3; const heading: smallint; const roll: smallint; const pitch: smallint) of object;
+  TBrickletIMUV3NotifyQuaternion = procedure(sender: TBrickletIMUV3; const w: smallint; const x: smallint; const y: smallint; const z: smallint) of object;
+  TBrickletIMUV3NotifyAllData = procedure(sender: TBrickletIMUV3; const acceleration: TArray0To2OfInt16; const magneticField: TArray0To2OfInt16; const angularVelocity: TArray0To2OfInt16; const eulerAngle: TArray0To2OfInt16; const quaternion: TArray0To3OfInt16; const linearAcceleration: TArray0To2OfInt16; const gravityVector: TArray0To2OfInt16; const temperature: shortint; const calibrationStatus: byte) of object;
+
+  /// <summary>
+  ///  Full fledged AHRS with 9 degrees of freedom
+  /// </summary>
+  TBrickletIMUV3 = class(TDevice)
+  private
+    accelerationCallback: TBrickletIMUV3NotifyAcceleration;
+    magneticFieldCallback: TBrickletIMUV3NotifyMagneticField;
+    angularVelocityCallback: TBrickletIMUV3NotifyAngularVelocity;
+    temperatureCallback: TBrickletIMUV3NotifyTemperature;
+    linearAccelerationCallback: TBrickletIMUV3NotifyLinearAcceleration;
+    gravityVectorCallback: TBrickletIMUV3NotifyGravityVector;
+    orientationCallback: TBrickletIMUV3NotifyOrientation;
+    quaternionCallback: TBrickletIMUV3NotifyQuaternion;
+    allDataCallback: TBrickletIMUV3NotifyAllData;
+  protected
+    procedure CallbackWrapperAcceleration(const packet: TByteArray); virtual;
+    procedure CallbackWrapperMagneticField(const packet: TByteArray); virtual;
+    procedure CallbackWrapperAngularVelocity(const packet: TByteArray); virtual;
+    procedure CallbackWrapperTemperature(const packet: TByteArray); virtual;
+    procedure CallbackWrapperLinearAcceleration(const packet: TByteArray); virtual;
+    procedure CallbackWrapperGravityVector(const packet: TByteArray); virtual;
+    procedure CallbackWrapperOrientation(const packet: TByteArray); virtual;
+    procedure CallbackWrapperQuaternion(const packet: TByteArray); virtual;
+    procedure CallbackWrapperAllData(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the calibrated acceleration from the accelerometer for the
+    ///  x, y and z axis. The acceleration is in the range configured with
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetSensorConfiguration"/>.
+    ///  
+    ///  If you want to get the acceleration periodically, it is recommended
+    ///  to use the <see cref="BrickletIMUV3.TBrickletIMUV3.OnAcceleration"/> callback and set the period with
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetAccelerationCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAcceleration(out x: smallint; out y: smallint; out z: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the calibrated magnetic field from the magnetometer for the
+    ///  x, y and z axis.
+    ///  
+    ///  If you want to get the magnetic field periodically, it is recommended
+    ///  to use the <see cref="BrickletIMUV3.TBrickletIMUV3.OnMagneticField"/> callback and set the period with
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetMagneticFieldCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetMagneticField(out x: smallint; out y: smallint; out z: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the calibrated angular velocity from the gyroscope for the
+    ///  x, y and z axis. The angular velocity is in the range configured with
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetSensorConfiguration"/>.
+    ///  
+    ///  If you want to get the angular velocity periodically, it is recommended
+    ///  to use the <see cref="BrickletIMUV3.TBrickletIMUV3.OnAngularVelocity"/> acallback nd set the period with
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetAngularVelocityCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAngularVelocity(out x: smallint; out y: smallint; out z: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the temperature of the IMU Brick.
+    ///  The temperature is measured in the core of the BNO055 IC, it is not the
+    ///  ambient temperature
+    /// </summary>
+    function GetTemperature: shortint; virtual;
+
+    /// <summary>
+    ///  Returns the current orientation (heading, roll, pitch) of the IMU Brick as
+    ///  independent Euler angles. Note that Euler angles always
+    ///  experience a `gimbal lock &lt;https://en.wikipedia.org/wiki/Gimbal_lock&gt;`__.
+    ///  We recommend that you use quaternions instead, if you need the absolute
+    ///  orientation.
+    ///  
+    ///  If you want to get the orientation periodically, it is recommended
+    ///  to use the <see cref="BrickletIMUV3.TBrickletIMUV3.OnOrientation"/> callback and set the period with
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetOrientationCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetOrientation(out heading: smallint; out roll: smallint; out pitch: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the linear acceleration of the IMU Brick for the
+    ///  x, y and z axis. The acceleration is in the range configured with
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetSensorConfiguration"/>.
+    ///  
+    ///  The linear acceleration is the acceleration in each of the three
+    ///  axis of the IMU Brick with the influences of gravity removed.
+    ///  
+    ///  It is also possible to get the gravity vector with the influence of linear
+    ///  acceleration removed, see <see cref="BrickletIMUV3.TBrickletIMUV3.GetGravityVector"/>.
+    ///  
+    ///  If you want to get the linear acceleration periodically, it is recommended
+    ///  to use the <see cref="BrickletIMUV3.TBrickletIMUV3.OnLinearAcceleration"/> callback and set the period with
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetLinearAccelerationCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetLinearAcceleration(out x: smallint; out y: smallint; out z: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the current gravity vector of the IMU Brick for the
+    ///  x, y and z axis.
+    ///  
+    ///  The gravity vector is the acceleration that occurs due to gravity.
+    ///  Influences of additional linear acceleration are removed.
+    ///  
+    ///  It is also possible to get the linear acceleration with the influence
+    ///  of gravity removed, see <see cref="BrickletIMUV3.TBrickletIMUV3.GetLinearAcceleration"/>.
+    ///  
+    ///  If you want to get the gravity vector periodically, it is recommended
+    ///  to use the <see cref="BrickletIMUV3.TBrickletIMUV3.OnGravityVector"/> callback and set the period with
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetGravityVectorCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetGravityVector(out x: smallint; out y: smallint; out z: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the current orientation (w, x, y, z) of the IMU Brick as
+    ///  `quaternions &lt;https://en.wikipedia.org/wiki/Quaternions_and_spatial_rotation&gt;`__.
+    ///  
+    ///  You have to divide the return values by 16383 (14 bit) to get
+    ///  the usual range of -1.0 to +1.0 for quaternions.
+    ///  
+    ///  If you want to get the quaternions periodically, it is recommended
+    ///  to use the <see cref="BrickletIMUV3.TBrickletIMUV3.OnQuaternion"/> callback and set the period with
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetQuaternionCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetQuaternion(out w: smallint; out x: smallint; out y: smallint; out z: smallint); virtual;
+
+    /// <summary>
+    ///  Return all of the available data of the IMU Brick.
+    ///  
+    ///  * acceleration (see <see cref="BrickletIMUV3.TBrickletIMUV3.GetAcceleration"/>)
+    ///  * magnetic field (see <see cref="BrickletIMUV3.TBrickletIMUV3.GetMagneticField"/>)
+    ///  * angular velocity (see <see cref="BrickletIMUV3.TBrickletIMUV3.GetAngularVelocity"/>)
+    ///  * Euler angles (see <see cref="BrickletIMUV3.TBrickletIMUV3.GetOrientation"/>)
+    ///  * quaternion (see <see cref="BrickletIMUV3.TBrickletIMUV3.GetQuaternion"/>)
+    ///  * linear acceleration (see <see cref="BrickletIMUV3.TBrickletIMUV3.GetLinearAcceleration"/>)
+    ///  * gravity vector (see <see cref="BrickletIMUV3.TBrickletIMUV3.GetGravityVector"/>)
+    ///  * temperature (see <see cref="BrickletIMUV3.TBrickletIMUV3.GetTemperature"/>)
+    ///  * calibration status (see below)
+    ///  
+    ///  The calibration status consists of four pairs of two bits. Each pair
+    ///  of bits represents the status of the current calibration.
+    ///  
+    ///  * bit 0-1: Magnetometer
+    ///  * bit 2-3: Accelerometer
+    ///  * bit 4-5: Gyroscope
+    ///  * bit 6-7: System
+    ///  
+    ///  A value of 0 means for "not calibrated" and a value of 3 means
+    ///  "fully calibrated". In your program you should always be able to
+    ///  ignore the calibration status, it is used by the calibration
+    ///  window of the Brick Viewer and it can be ignored after the first
+    ///  calibration. See the documentation in the calibration window for
+    ///  more information regarding the calibration of the IMU Brick.
+    ///  
+    ///  If you want to get the data periodically, it is recommended
+    ///  to use the <see cref="BrickletIMUV3.TBrickletIMUV3.OnAllData"/> callback and set the period with
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetAllDataCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAllData(out acceleration: TArray0To2OfInt16; out magneticField: TArray0To2OfInt16; out angularVelocity: TArray0To2OfInt16; out eulerAngle: TArray0To2OfInt16; out quaternion: TArray0To3OfInt16; out linearAcceleration: TArray0To2OfInt16; out gravityVector: TArray0To2OfInt16; out temperature: shortint; out calibrationStatus: byte); virtual;
+
+    /// <summary>
+    ///  A call of this function saves the current calibration to be used
+    ///  as a starting point for the next restart of continuous calibration
+    ///  of the IMU Brick.
+    ///  
+    ///  A return value of *true* means that the calibration could be used and
+    ///  *false* means that it could not be used (this happens if the calibration
+    ///  status is not "fully calibrated").
+    ///  
+    ///  This function is used by the calibration window of the Brick Viewer, you
+    ///  should not need to call it in your program.
+    /// </summary>
+    function SaveCalibration: boolean; virtual;
+
+    /// <summary>
+    ///  Sets the available sensor configuration for the Magnetometer, Gyroscope and
+    ///  Accelerometer. The Accelerometer Range is user selectable in all fusion modes,
+    ///  all other configurations are auto-controlled in fusion mode.
+    /// </summary>
+    procedure SetSensorConfiguration(const magnetometerRate: byte; const gyroscopeRange: byte; const gyroscopeBandwidth: byte; const accelerometerRange: byte; const accelerometerBandwidth: byte); virtual;
+
+    /// <summary>
+    ///  Returns the sensor configuration as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetSensorConfiguration"/>.
+    /// </summary>
+    procedure GetSensorConfiguration(out magnetometerRate: byte; out gyroscopeRange: byte; out gyroscopeBandwidth: byte; out accelerometerRange: byte; out accelerometerBandwidth: byte); virtual;
+
+    /// <summary>
+    ///  If the fusion mode is turned off, the functions <see cref="BrickletIMUV3.TBrickletIMUV3.GetAcceleration"/>,
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.GetMagneticField"/> and <see cref="BrickletIMUV3.TBrickletIMUV3.GetAngularVelocity"/> return uncalibrated
+    ///  and uncompensated sensor data. All other sensor data getters return no data.
+    ///  
+    ///  Since firmware version 2.0.6 you can also use a fusion mode without magnetometer.
+    ///  In this mode the calculated orientation is relative (with magnetometer it is
+    ///  absolute with respect to the earth). However, the calculation can't be influenced
+    ///  by spurious magnetic fields.
+    ///  
+    ///  Since firmware version 2.0.13 you can also use a fusion mode without fast
+    ///  magnetometer calibration. This mode is the same as the normal fusion mode,
+    ///  but the fast magnetometer calibration is turned off. So to find the orientation
+    ///  the first time will likely take longer, but small magnetic influences might
+    ///  not affect the automatic calibration as much.
+    /// </summary>
+    procedure SetSensorFusionMode(const mode: byte); virtual;
+
+    /// <summary>
+    ///  Returns the sensor fusion mode as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetSensorFusionMode"/>.
+    /// </summary>
+    function GetSensorFusionMode: byte; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletIMUV3.TBrickletIMUV3.OnAcceleration"/> callback
+    ///  is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetAccelerationCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetAccelerationCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAccelerationCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletIMUV3.TBrickletIMUV3.OnMagneticField"/> callback
+    ///  is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetMagneticFieldCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetMagneticFieldCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetMagneticFieldCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletIMUV3.TBrickletIMUV3.OnAngularVelocity"/> callback
+    ///  is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetAngularVelocityCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetAngularVelocityCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAngularVelocityCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletIMUV3.TBrickletIMUV3.OnTemperature"/> callback
+    ///  is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetTemperatureCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletIMUV3.TBrickletIMUV3.OnOrientation"/> callback
+    ///  is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetOrientationCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetOrientationCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetOrientationCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletIMUV3.TBrickletIMUV3.OnLinearAcceleration"/> callback
+    ///  is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetLinearAccelerationCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetLinearAccelerationCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetLinearAccelerationCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletIMUV3.TBrickletIMUV3.OnGravityVector"/> callback
+    ///  is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetGravityVectorCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetGravityVectorCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetGravityVectorCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletIMUV3.TBrickletIMUV3.OnQuaternion"/> callback
+    ///  is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetQuaternionCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetQuaternionCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetQuaternionCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletIMUV3.TBrickletIMUV3.OnAllData"/> callback
+    ///  is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetAllDataCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetAllDataCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetAllDataCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletIMUV3.TBrickletIMUV3.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletIMUV3.TBrickletIMUV3.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletIMUV3.TBrickletIMUV3.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetAccelerationCallbackConfiguration"/>. The parameters are the acceleration
+    ///  for the x, y and z axis.
+    /// </summary>
+    property OnAcceleration: TBrickletIMUV3NotifyAcceleration read accelerationCallback write accelerationCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetMagneticFieldCallbackConfiguration"/>. The parameters are the magnetic
+    ///  field for the x, y and z axis.
+    /// </summary>
+    property OnMagneticField: TBrickletIMUV3NotifyMagneticField read magneticFieldCallback write magneticFieldCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetAngularVelocityCallbackConfiguration"/>. The parameters are the angular
+    ///  velocity for the x, y and z axis.
+    /// </summary>
+    property OnAngularVelocity: TBrickletIMUV3NotifyAngularVelocity read angularVelocityCallback write angularVelocityCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetTemperatureCallbackConfiguration"/>. The parameter is the temperature.
+    /// </summary>
+    property OnTemperature: TBrickletIMUV3NotifyTemperature read temperatureCallback write temperatureCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetLinearAccelerationCallbackConfiguration"/>. The parameters are the
+    ///  linear acceleration for the x, y and z axis.
+    /// </summary>
+    property OnLinearAcceleration: TBrickletIMUV3NotifyLinearAcceleration read linearAccelerationCallback write linearAccelerationCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetGravityVectorCallbackConfiguration"/>. The parameters gravity vector
+    ///  for the x, y and z axis.
+    /// </summary>
+    property OnGravityVector: TBrickletIMUV3NotifyGravityVector read gravityVectorCallback write gravityVectorCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetOrientationCallbackConfiguration"/>. The parameters are the orientation
+    ///  (heading (yaw), roll, pitch) of the IMU Brick in Euler angles. See
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.GetOrientation"/> for details.
+    /// </summary>
+    property OnOrientation: TBrickletIMUV3NotifyOrientation read orientationCallback write orientationCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetQuaternionCallbackConfiguration"/>. The parameters are the orientation
+    ///  (w, x, y, z) of the IMU Brick in quaternions. See <see cref="BrickletIMUV3.TBrickletIMUV3.GetQuaternion"/>
+    ///  for details.
+    /// </summary>
+    property OnQuaternion: TBrickletIMUV3NotifyQuaternion read quaternionCallback write quaternionCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.SetAllDataCallbackConfiguration"/>. The parameters are as for
+    ///  <see cref="BrickletIMUV3.TBrickletIMUV3.GetAllData"/>.
+    /// </summary>
+    property OnAllData: TBrickletIMUV3NotifyAllData read allDataCallback write allDataCallback;
+  end;
+
+implementation
+
+constructor TBrickletIMUV3.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_IMU_V3_DEVICE_IDENTIFIER, BRICKLET_IMU_V3_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_ACCELERATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_MAGNETIC_FIELD] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_ANGULAR_VELOCITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_ORIENTATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_LINEAR_ACCELERATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_GRAVITY_VECTOR] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_QUATERNION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_ALL_DATA] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SAVE_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_SENSOR_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_SENSOR_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_SENSOR_FUSION_MODE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_SENSOR_FUSION_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_ORIENTATION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_ORIENTATION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_QUATERNION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_QUATERNION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_ALL_DATA_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_ALL_DATA_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_IMU_V3_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_IMU_V3_CALLBACK_ACCELERATION] := {$ifdef FPC}@{$endif}CallbackWrapperAcceleration;
+  callbackWrappers[BRICKLET_IMU_V3_CALLBACK_MAGNETIC_FIELD] := {$ifdef FPC}@{$endif}CallbackWrapperMagneticField;
+  callbackWrappers[BRICKLET_IMU_V3_CALLBACK_ANGULAR_VELOCITY] := {$ifdef FPC}@{$endif}CallbackWrapperAngularVelocity;
+  callbackWrappers[BRICKLET_IMU_V3_CALLBACK_TEMPERATURE] := {$ifdef FPC}@{$endif}CallbackWrapperTemperature;
+  callbackWrappers[BRICKLET_IMU_V3_CALLBACK_LINEAR_ACCELERATION] := {$ifdef FPC}@{$endif}CallbackWrapperLinearAcceleration;
+  callbackWrappers[BRICKLET_IMU_V3_CALLBACK_GRAVITY_VECTOR] := {$ifdef FPC}@{$endif}CallbackWrapperGravityVector;
+  callbackWrappers[BRICKLET_IMU_V3_CALLBACK_ORIENTATION] := {$ifdef FPC}@{$endif}CallbackWrapperOrientation;
+  callbackWrappers[BRICKLET_IMU_V3_CALLBACK_QUATERNION] := {$ifdef FPC}@{$endif}CallbackWrapperQuaternion;
+  callbackWrappers[BRICKLET_IMU_V3_CALLBACK_ALL_DATA] := {$ifdef FPC}@{$endif}CallbackWrapperAllData;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletIMUV3.GetAcceleration(out x: smallint; out y: smallint; out z: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_ACCELERATION, 8);
+  response := SendRequest(request, 14);
+  x := LEConvertInt16From(8, response);
+  y := LEConvertInt16From(10, response);
+  z := LEConvertInt16From(12, response);
+end;
+
+procedure TBrickletIMUV3.GetMagneticField(out x: smallint; out y: smallint; out z: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_MAGNETIC_FIELD, 8);
+  response := SendRequest(request, 14);
+  x := LEConvertInt16From(8, response);
+  y := LEConvertInt16From(10, response);
+  z := LEConvertInt16From(12, response);
+end;
+
+procedure TBrickletIMUV3.GetAngularVelocity(out x: smallint; out y: smallint; out z: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_ANGULAR_VELOCITY, 8);
+  response := SendRequest(request, 14);
+  x := LEConvertInt16From(8, response);
+  y := LEConvertInt16From(10, response);
+  z := LEConvertInt16From(12, response);
+end;
+
+function TBrickletIMUV3.GetTemperature: shortint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_TEMPERATURE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertInt8From(8, response);
+end;
+
+procedure TBrickletIMUV3.GetOrientation(out heading: smallint; out roll: smallint; out pitch: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_ORIENTATION, 8);
+  response := SendRequest(request, 14);
+  heading := LEConvertInt16From(8, response);
+  roll := LEConvertInt16From(10, response);
+  pitch := LEConvertInt16From(12, response);
+end;
+
+procedure TBrickletIMUV3.GetLinearAcceleration(out x: smallint; out y: smallint; out z: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_LINEAR_ACCELERATION, 8);
+  response := SendRequest(request, 14);
+  x := LEConvertInt16From(8, response);
+  y := LEConvertInt16From(10, response);
+  z := LEConvertInt16From(12, response);
+end;
+
+procedure TBrickletIMUV3.GetGravityVector(out x: smallint; out y: smallint; out z: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_GRAVITY_VECTOR, 8);
+  response := SendRequest(request, 14);
+  x := LEConvertInt16From(8, response);
+  y := LEConvertInt16From(10, response);
+  z := LEConvertInt16From(12, response);
+end;
+
+procedure TBrickletIMUV3.GetQuaternion(out w: smallint; out x: smallint; out y: smallint; out z: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_QUATERNION, 8);
+  response := SendRequest(request, 16);
+  w := LEConvertInt16From(8, response);
+  x := LEConvertInt16From(10, response);
+  y := LEConvertInt16From(12, response);
+  z := LEConvertInt16From(14, response);
+end;
+
+procedure TBrickletIMUV3.GetAllData(out acceleration: TArray0To2OfInt16; out magneticField: TArray0To2OfInt16; out angularVelocity: TArray0To2OfInt16; out eulerAngle: TArray0To2OfInt16; out quaternion: TArray0To3OfInt16; out linearAcceleration: TArray0To2OfInt16; out gravityVector: TArray0To2OfInt16; out temperature: shortint; out calibrationStatus: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_ALL_DATA, 8);
+  response := SendRequest(request, 54);
+  for i := 0 to 2 do acceleration[i] := LEConvertInt16From(8 + (i * 2), response);
+  for i := 0 to 2 do magneticField[i] := LEConvertInt16From(14 + (i * 2), response);
+  for i := 0 to 2 do angularVelocity[i] := LEConvertInt16From(20 + (i * 2), response);
+  for i := 0 to 2 do eulerAngle[i] := LEConvertInt16From(26 + (i * 2), response);
+  for i := 0 to 3 do quaternion[i] := LEConvertInt16From(32 + (i * 2), response);
+  for i := 0 to 2 do linearAcceleration[i] := LEConvertInt16From(40 + (i * 2), response);
+  for i := 0 to 2 do gravityVector[i] := LEConvertInt16From(46 + (i * 2), response);
+  temperature := LEConvertInt8From(52, response);
+  calibrationStatus := LEConvertUInt8From(53, response);
+end;
+
+function TBrickletIMUV3.SaveCalibration: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SAVE_CALIBRATION, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletIMUV3.SetSensorConfiguration(const magnetometerRate: byte; const gyroscopeRange: byte; const gyroscopeBandwidth: byte; const accelerometerRange: byte; const accelerometerBandwidth: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_SENSOR_CONFIGURATION, 13);
+  LEConvertUInt8To(magnetometerRate, 8, request);
+  LEConvertUInt8To(gyroscopeRange, 9, request);
+  LEConvertUInt8To(gyroscopeBandwidth, 10, request);
+  LEConvertUInt8To(accelerometerRange, 11, request);
+  LEConvertUInt8To(accelerometerBandwidth, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIMUV3.GetSensorConfiguration(out magnetometerRate: byte; out gyroscopeRange: byte; out gyroscopeBandwidth: byte; out accelerometerRange: byte; out accelerometerBandwidth: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_SENSOR_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  magnetometerRate := LEConvertUInt8From(8, response);
+  gyroscopeRange := LEConvertUInt8From(9, response);
+  gyroscopeBandwidth := LEConvertUInt8From(10, response);
+  accelerometerRange := LEConvertUInt8From(11, response);
+  accelerometerBandwidth := LEConvertUInt8From(12, response);
+end;
+
+procedure TBrickletIMUV3.SetSensorFusionMode(const mode: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_SENSOR_FUSION_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIMUV3.GetSensorFusionMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_SENSOR_FUSION_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletIMUV3.SetAccelerationCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_ACCELERATION_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIMUV3.GetAccelerationCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_ACCELERATION_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletIMUV3.SetMagneticFieldCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIMUV3.GetMagneticFieldCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_MAGNETIC_FIELD_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletIMUV3.SetAngularVelocityCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIMUV3.GetAngularVelocityCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_ANGULAR_VELOCITY_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletIMUV3.SetTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIMUV3.GetTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletIMUV3.SetOrientationCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_ORIENTATION_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIMUV3.GetOrientationCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_ORIENTATION_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletIMUV3.SetLinearAccelerationCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIMUV3.GetLinearAccelerationCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_LINEAR_ACCELERATION_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletIMUV3.SetGravityVectorCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIMUV3.GetGravityVectorCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_GRAVITY_VECTOR_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletIMUV3.SetQuaternionCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_QUATERNION_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIMUV3.GetQuaternionCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_QUATERNION_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletIMUV3.SetAllDataCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_ALL_DATA_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIMUV3.GetAllDataCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_ALL_DATA_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletIMUV3.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletIMUV3.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletIMUV3.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletIMUV3.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIMUV3.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletIMUV3.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIMUV3.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletIMUV3.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletIMUV3.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIMUV3.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIMUV3.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletIMUV3.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_IMU_V3_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletIMUV3.CallbackWrapperAcceleration(const packet: TByteArray);
+var x: smallint; y: smallint; z: smallint;
+begin
+  if (Length(packet) <> 14) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  x := LEConvertInt16From(8, packet);
+  y := LEConvertInt16From(10, packet);
+  z := LEConvertInt16From(12, packet);
+  if (Assigned(accelerationCallback)) then begin
+    accelerationCallback(self, x, y, z);
+  end;
+end;
+
+procedure TBrickletIMUV3.CallbackWrapperMagneticField(const packet: TByteArray);
+var x: smallint; y: smallint; z: smallint;
+begin
+  if (Length(packet) <> 14) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  x := LEConvertInt16From(8, packet);
+  y := LEConvertInt16From(10, packet);
+  z := LEConvertInt16From(12, packet);
+  if (Assigned(magneticFieldCallback)) then begin
+    magneticFieldCallback(self, x, y, z);
+  end;
+end;
+
+procedure TBrickletIMUV3.CallbackWrapperAngularVelocity(const packet: TByteArray);
+var x: smallint; y: smallint; z: smallint;
+begin
+  if (Length(packet) <> 14) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  x := LEConvertInt16From(8, packet);
+  y := LEConvertInt16From(10, packet);
+  z := LEConvertInt16From(12, packet);
+  if (Assigned(angularVelocityCallback)) then begin
+    angularVelocityCallback(self, x, y, z);
+  end;
+end;
+
+procedure TBrickletIMUV3.CallbackWrapperTemperature(const packet: TByteArray);
+var temperature: shortint;
+begin
+  if (Length(packet) <> 9) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  temperature := LEConvertInt8From(8, packet);
+  if (Assigned(temperatureCallback)) then begin
+    temperatureCallback(self, temperature);
+  end;
+end;
+
+procedure TBrickletIMUV3.CallbackWrapperLinearAcceleration(const packet: TByteArray);
+var x: smallint; y: smallint; z: smallint;
+begin
+  if (Length(packet) <> 14) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  x := LEConvertInt16From(8, packet);
+  y := LEConvertInt16From(10, packet);
+  z := LEConvertInt16From(12, packet);
+  if (Assigned(linearAccelerationCallback)) then begin
+    linearAccelerationCallback(self, x, y, z);
+  end;
+end;
+
+procedure TBrickletIMUV3.CallbackWrapperGravityVector(const packet: TByteArray);
+var x: smallint; y: smallint; z: smallint;
+begin
+  if (Length(packet) <> 14) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  x := LEConvertInt16From(8, packet);
+  y := LEConvertInt16From(10, packet);
+  z := LEConvertInt16From(12, packet);
+  if (Assigned(gravityVectorCallback)) then begin
+    gravityVectorCallback(self, x, y, z);
+  end;
+end;
+
+procedure TBrickletIMUV3.CallbackWrapperOrientation(const packet: TByteArray);
+var heading: smallint; roll: smallint; pitch: smallint;
+begin
+  if (Length(packet) <> 14) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  heading := LEConvertInt16From(8, packet);
+  roll := LEConvertInt16From(10, packet);
+  pitch := LEConvertInt16From(12, packet);
+  if (Assigned(orientationCallback)) then begin
+    orientationCallback(self, heading, roll, pitch);
+  end;
+end;
+
+procedure TBrickletIMUV3.CallbackWrapperQuaternion(const packet: TByteArray);
+var w: smallint; x: smallint; y: smallint; z: smallint;
+begin
+  if (Length(packet) <> 16) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  w := LEConvertInt16From(8, packet);
+  x := LEConvertInt16From(10, packet);
+  y := LEConvertInt16From(12, packet);
+  z := LEConvertInt16From(14, packet);
+  if (Assigned(quaternionCallback)) then begin
+    quaternionCallback(self, w, x, y, z);
+  end;
+end;
+
+procedure TBrickletIMUV3.CallbackWrapperAllData(const packet: TByteArray);
+var acceleration: TArray0To2OfInt16; magneticField: TArray0To2OfInt16; angularVelocity: TArray0To2OfInt16; eulerAngle: TArray0To2OfInt16; quaternion: TArray0To3OfInt16; linearAcceleration: TArray0To2OfInt16; gravityVector: TArray0To2OfInt16; temperature: shortint; calibrationStatus: byte; i: longint;
+begin
+  if (Length(packet) <> 54) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  for i := 0 to 2 do acceleration[i] := LEConvertInt16From(8 + (i * 2), packet);
+  for i := 0 to 2 do magneticField[i] := LEConvertInt16From(14 + (i * 2), packet);
+  for i := 0 to 2 do angularVelocity[i] := LEConvertInt16From(20 + (i * 2), packet);
+  for i := 0 to 2 do eulerAngle[i] := LEConvertInt16From(26 + (i * 2), packet);
+  for i := 0 to 3 do quaternion[i] := LEConvertInt16From(32 + (i * 2), packet);
+  for i := 0 to 2 do linearAcceleration[i] := LEConvertInt16From(40 + (i * 2), packet);
+  for i := 0 to 2 do gravityVector[i] := LEConvertInt16From(46 + (i * 2), packet);
+  temperature := LEConvertInt8From(52, packet);
+  calibrationStatus := LEConvertUInt8From(53, packet);
+  if (Assigned(allDataCallback)) then begin
+    allDataCallback(self, acceleration, magneticField, angularVelocity, eulerAngle, quaternion, linearAcceleration, gravityVector, temperature, calibrationStatus);
+  end;
+end;
+
+end.
@@ -0,0 +1,590 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletIndustrialAnalogOutV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_DEVICE_IDENTIFIER = 2116;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_DEVICE_DISPLAY_NAME = 'Industrial Analog Out Bricklet 2.0';
+
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_ENABLED = 1;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_ENABLED = 2;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_VOLTAGE = 3;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_VOLTAGE = 4;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_CURRENT = 5;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_CURRENT = 6;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_CONFIGURATION = 7;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_CONFIGURATION = 8;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_OUT_LED_CONFIG = 9;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_OUT_LED_CONFIG = 10;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_OUT_LED_STATUS_CONFIG = 11;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_OUT_LED_STATUS_CONFIG = 12;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_RESET = 243;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_IDENTITY = 255;
+
+
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_VOLTAGE_RANGE_0_TO_5V = 0;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_VOLTAGE_RANGE_0_TO_10V = 1;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_CURRENT_RANGE_4_TO_20MA = 0;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_CURRENT_RANGE_0_TO_20MA = 1;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_CURRENT_RANGE_0_TO_24MA = 2;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_OUT_LED_CONFIG_OFF = 0;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_OUT_LED_CONFIG_ON = 1;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_OUT_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_OUT_LED_CONFIG_SHOW_OUT_STATUS = 3;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_OUT_LED_STATUS_CONFIG_THRESHOLD = 0;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_OUT_LED_STATUS_CONFIG_INTENSITY = 1;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  /// <summary>
+  ///  Generates configurable DC voltage and current, 0V to 10V and 4mA to 20mA
+  /// </summary>
+  TBrickletIndustrialAnalogOutV2 = class(TDevice)
+  private
+  protected
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Enables/disables the output of voltage and current.
+    /// </summary>
+    procedure SetEnabled(const enabled: boolean); virtual;
+
+    /// <summary>
+    ///  Returns *true* if output of voltage and current is enabled, *false* otherwise.
+    /// </summary>
+    function GetEnabled: boolean; virtual;
+
+    /// <summary>
+    ///  Sets the output voltage.
+    ///  
+    ///  The output voltage and output current are linked. Changing the output voltage
+    ///  also changes the output current.
+    /// </summary>
+    procedure SetVoltage(const voltage: word); virtual;
+
+    /// <summary>
+    ///  Returns the voltage as set by <see cref="BrickletIndustrialAnalogOutV2.TBrickletIndustrialAnalogOutV2.SetVoltage"/>.
+    /// </summary>
+    function GetVoltage: word; virtual;
+
+    /// <summary>
+    ///  Sets the output current.
+    ///  
+    ///  The output current and output voltage are linked. Changing the output current
+    ///  also changes the output voltage.
+    /// </summary>
+    procedure SetCurrent(const current: word); virtual;
+
+    /// <summary>
+    ///  Returns the current as set by <see cref="BrickletIndustrialAnalogOutV2.TBrickletIndustrialAnalogOutV2.SetCurrent"/>.
+    /// </summary>
+    function GetCurrent: word; virtual;
+
+    /// <summary>
+    ///  Configures the voltage and current range.
+    ///  
+    ///  Possible voltage ranges are:
+    ///  
+    ///  * 0V to 5V
+    ///  * 0V to 10V
+    ///  
+    ///  Possible current ranges are:
+    ///  
+    ///  * 4mA to 20mA
+    ///  * 0mA to 20mA
+    ///  * 0mA to 24mA
+    ///  
+    ///  The resolution will always be 12 bit. This means, that the
+    ///  precision is higher with a smaller range.
+    /// </summary>
+    procedure SetConfiguration(const voltageRange: byte; const currentRange: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletIndustrialAnalogOutV2.TBrickletIndustrialAnalogOutV2.SetConfiguration"/>.
+    /// </summary>
+    procedure GetConfiguration(out voltageRange: byte; out currentRange: byte); virtual;
+
+    /// <summary>
+    ///  You can turn the Out LED off, on or show a
+    ///  heartbeat. You can also set the LED to "Out Status". In this mode the
+    ///  LED can either be turned on with a pre-defined threshold or the intensity
+    ///  of the LED can change with the output value (voltage or current).
+    ///  
+    ///  You can configure the channel status behavior with <see cref="BrickletIndustrialAnalogOutV2.TBrickletIndustrialAnalogOutV2.SetOutLEDStatusConfig"/>.
+    /// </summary>
+    procedure SetOutLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the Out LED configuration as set by <see cref="BrickletIndustrialAnalogOutV2.TBrickletIndustrialAnalogOutV2.SetOutLEDConfig"/>
+    /// </summary>
+    function GetOutLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Sets the Out LED status config. This config is used if the Out LED is
+    ///  configured as "Out Status", see <see cref="BrickletIndustrialAnalogOutV2.TBrickletIndustrialAnalogOutV2.SetOutLEDConfig"/>.
+    ///  
+    ///  For each channel you can choose between threshold and intensity mode.
+    ///  
+    ///  In threshold mode you can define a positive or a negative threshold.
+    ///  For a positive threshold set the "min" parameter to the threshold value in mV or
+    ///  µA above which the LED should turn on and set the "max" parameter to 0. Example:
+    ///  If you set a positive threshold of 5V, the LED will turn on as soon as the
+    ///  output value exceeds 5V and turn off again if it goes below 5V.
+    ///  For a negative threshold set the "max" parameter to the threshold value in mV or
+    ///  µA below which the LED should turn on and set the "min" parameter to 0. Example:
+    ///  If you set a negative threshold of 5V, the LED will turn on as soon as the
+    ///  output value goes below 5V and the LED will turn off when the output value
+    ///  exceeds 5V.
+    ///  
+    ///  In intensity mode you can define a range mV or µA that is used to scale the brightness
+    ///  of the LED. Example with min=2V, max=8V: The LED is off at 2V and below, on at
+    ///  8V and above and the brightness is linearly scaled between the values 2V and 8V.
+    ///  If the min value is greater than the max value, the LED brightness is scaled the
+    ///  other way around.
+    /// </summary>
+    procedure SetOutLEDStatusConfig(const min: word; const max: word; const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the Out LED status configuration as set by <see cref="BrickletIndustrialAnalogOutV2.TBrickletIndustrialAnalogOutV2.SetOutLEDStatusConfig"/>.
+    /// </summary>
+    procedure GetOutLEDStatusConfig(out min: word; out max: word; out config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletIndustrialAnalogOutV2.TBrickletIndustrialAnalogOutV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletIndustrialAnalogOutV2.TBrickletIndustrialAnalogOutV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletIndustrialAnalogOutV2.TBrickletIndustrialAnalogOutV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletIndustrialAnalogOutV2.TBrickletIndustrialAnalogOutV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+  end;
+
+implementation
+
+constructor TBrickletIndustrialAnalogOutV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_DEVICE_IDENTIFIER, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_ENABLED] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_ENABLED] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_VOLTAGE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_VOLTAGE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_CURRENT] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_CURRENT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_OUT_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_OUT_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_OUT_LED_STATUS_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_OUT_LED_STATUS_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.SetEnabled(const enabled: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_ENABLED, 9);
+  LEConvertBooleanTo(enabled, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialAnalogOutV2.GetEnabled: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_ENABLED, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.SetVoltage(const voltage: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_VOLTAGE, 10);
+  LEConvertUInt16To(voltage, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialAnalogOutV2.GetVoltage: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_VOLTAGE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.SetCurrent(const current: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_CURRENT, 10);
+  LEConvertUInt16To(current, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialAnalogOutV2.GetCurrent: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_CURRENT, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.SetConfiguration(const voltageRange: byte; const currentRange: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_CONFIGURATION, 10);
+  LEConvertUInt8To(voltageRange, 8, request);
+  LEConvertUInt8To(currentRange, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.GetConfiguration(out voltageRange: byte; out currentRange: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  voltageRange := LEConvertUInt8From(8, response);
+  currentRange := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.SetOutLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_OUT_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialAnalogOutV2.GetOutLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_OUT_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.SetOutLEDStatusConfig(const min: word; const max: word; const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_OUT_LED_STATUS_CONFIG, 13);
+  LEConvertUInt16To(min, 8, request);
+  LEConvertUInt16To(max, 10, request);
+  LEConvertUInt8To(config, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.GetOutLEDStatusConfig(out min: word; out max: word; out config: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_OUT_LED_STATUS_CONFIG, 8);
+  response := SendRequest(request, 13);
+  min := LEConvertUInt16From(8, response);
+  max := LEConvertUInt16From(10, response);
+  config := LEConvertUInt8From(12, response);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletIndustrialAnalogOutV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletIndustrialAnalogOutV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialAnalogOutV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialAnalogOutV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletIndustrialAnalogOutV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialAnalogOutV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletIndustrialAnalogOutV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_ANALOG_OUT_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+end.
@@ -0,0 +1,760 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletIndustrialDualAnalogInV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_DEVICE_IDENTIFIER = 2121;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_DEVICE_DISPLAY_NAME = 'Industrial Dual Analog In Bricklet 2.0';
+
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_VOLTAGE = 1;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_VOLTAGE_CALLBACK_CONFIGURATION = 2;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_VOLTAGE_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_SAMPLE_RATE = 5;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_SAMPLE_RATE = 6;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_CALIBRATION = 7;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CALIBRATION = 8;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_ADC_VALUES = 9;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_CHANNEL_LED_CONFIG = 10;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CHANNEL_LED_CONFIG = 11;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_CHANNEL_LED_STATUS_CONFIG = 12;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CHANNEL_LED_STATUS_CONFIG = 13;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_ALL_VOLTAGES = 14;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_ALL_VOLTAGES_CALLBACK_CONFIGURATION = 15;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_ALL_VOLTAGES_CALLBACK_CONFIGURATION = 16;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_RESET = 243;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_CALLBACK_VOLTAGE = 4;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_CALLBACK_ALL_VOLTAGES = 17;
+
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_SAMPLE_RATE_976_SPS = 0;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_SAMPLE_RATE_488_SPS = 1;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_SAMPLE_RATE_244_SPS = 2;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_SAMPLE_RATE_122_SPS = 3;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_SAMPLE_RATE_61_SPS = 4;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_SAMPLE_RATE_4_SPS = 5;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_SAMPLE_RATE_2_SPS = 6;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_SAMPLE_RATE_1_SPS = 7;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_CHANNEL_LED_CONFIG_OFF = 0;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_CHANNEL_LED_CONFIG_ON = 1;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_CHANNEL_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_CHANNEL_LED_CONFIG_SHOW_CHANNEL_STATUS = 3;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_CHANNEL_LED_STATUS_CONFIG_THRESHOLD = 0;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_CHANNEL_LED_STATUS_CONFIG_INTENSITY = 1;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To1OfInt32 = array [0..1] of longint;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletIndustrialDualAnalogInV2 = class;
+  TBrickletIndustrialDualAnalogInV2NotifyVoltage = procedure(sender: TBrickletIndustrialDualAnalogInV2; const channel: byte; const voltage: longint) of object;
+  TBrickletIndustrialDualAnalogInV2NotifyAllVoltages = procedure(sender: TBrickletIndustrialDualAnalogInV2; const voltages: TArray0To1OfInt32) of object;
+
+  /// <summary>
+  ///  Measures two DC voltages between -35V and +35V with 24bit resolution each
+  /// </summary>
+  TBrickletIndustrialDualAnalogInV2 = class(TDevice)
+  private
+    voltageCallback: TBrickletIndustrialDualAnalogInV2NotifyVoltage;
+    allVoltagesCallback: TBrickletIndustrialDualAnalogInV2NotifyAllVoltages;
+  protected
+    procedure CallbackWrapperVoltage(const packet: TByteArray); virtual;
+    procedure CallbackWrapperAllVoltages(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the voltage for the given channel.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.OnVoltage"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetVoltageCallbackConfiguration"/>.
+    /// </summary>
+    function GetVoltage(const channel: byte): longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.OnVoltage"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.OnVoltage"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetVoltageCallbackConfiguration(const channel: byte; const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetVoltageCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetVoltageCallbackConfiguration(const channel: byte; out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Sets the sample rate. The sample rate can be between 1 sample per second
+    ///  and 976 samples per second. Decreasing the sample rate will also decrease the
+    ///  noise on the data.
+    /// </summary>
+    procedure SetSampleRate(const rate: byte); virtual;
+
+    /// <summary>
+    ///  Returns the sample rate as set by <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetSampleRate"/>.
+    /// </summary>
+    function GetSampleRate: byte; virtual;
+
+    /// <summary>
+    ///  Sets offset and gain of MCP3911 internal calibration registers.
+    ///  
+    ///  See MCP3911 datasheet 7.7 and 7.8. The Industrial Dual Analog In Bricklet 2.0
+    ///  is already factory calibrated by Tinkerforge. It should not be necessary
+    ///  for you to use this function
+    /// </summary>
+    procedure SetCalibration(const offset: array of longint; const gain: array of longint); virtual;
+
+    /// <summary>
+    ///  Returns the calibration as set by <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetCalibration"/>.
+    /// </summary>
+    procedure GetCalibration(out offset: TArray0To1OfInt32; out gain: TArray0To1OfInt32); virtual;
+
+    /// <summary>
+    ///  Returns the ADC values as given by the MCP3911 IC. This function
+    ///  is needed for proper calibration, see <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetCalibration"/>.
+    /// </summary>
+    function GetADCValues: TArray0To1OfInt32; virtual;
+
+    /// <summary>
+    ///  Each channel has a corresponding LED. You can turn the LED off, on or show a
+    ///  heartbeat. You can also set the LED to "Channel Status". In this mode the
+    ///  LED can either be turned on with a pre-defined threshold or the intensity
+    ///  of the LED can change with the measured value.
+    ///  
+    ///  You can configure the channel status behavior with <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetChannelLEDStatusConfig"/>.
+    ///  
+    ///  By default all channel LEDs are configured as "Channel Status".
+    /// </summary>
+    procedure SetChannelLEDConfig(const channel: byte; const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the channel LED configuration as set by <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetChannelLEDConfig"/>
+    /// </summary>
+    function GetChannelLEDConfig(const channel: byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the channel LED status config. This config is used if the channel LED is
+    ///  configured as "Channel Status", see <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetChannelLEDConfig"/>.
+    ///  
+    ///  For each channel you can choose between threshold and intensity mode.
+    ///  
+    ///  In threshold mode you can define a positive or a negative threshold.
+    ///  For a positive threshold set the "min" parameter to the threshold value in mV
+    ///  above which the LED should turn on and set the "max" parameter to 0. Example:
+    ///  If you set a positive threshold of 10V, the LED will turn on as soon as the
+    ///  voltage exceeds 10V and turn off again if it goes below 10V.
+    ///  For a negative threshold set the "max" parameter to the threshold value in mV
+    ///  below which the LED should turn on and set the "min" parameter to 0. Example:
+    ///  If you set a negative threshold of 10V, the LED will turn on as soon as the
+    ///  voltage goes below 10V and the LED will turn off when the voltage exceeds 10V.
+    ///  
+    ///  In intensity mode you can define a range in mV that is used to scale the brightness
+    ///  of the LED. Example with min=4V, max=20V: The LED is off at 4V, on at 20V
+    ///  and the brightness is linearly scaled between the values 4V and 20V. If the
+    ///  min value is greater than the max value, the LED brightness is scaled the other
+    ///  way around.
+    /// </summary>
+    procedure SetChannelLEDStatusConfig(const channel: byte; const min: longint; const max: longint; const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the channel LED status configuration as set by
+    ///  <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetChannelLEDStatusConfig"/>.
+    /// </summary>
+    procedure GetChannelLEDStatusConfig(const channel: byte; out min: longint; out max: longint; out config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the voltages for all channels.
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.OnAllVoltages"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetAllVoltagesCallbackConfiguration"/>.
+    ///  
+    ///  .. versionadded:: 2.0.6$nbsp;(Plugin)
+    /// </summary>
+    function GetAllVoltages: TArray0To1OfInt32; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.OnAllVoltages"/>
+    ///  callback is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after at least one of the values has changed. If the values didn't
+    ///  change within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  .. versionadded:: 2.0.6$nbsp;(Plugin)
+    /// </summary>
+    procedure SetAllVoltagesCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by
+    ///  <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetAllVoltagesCallbackConfiguration"/>.
+    ///  
+    ///  .. versionadded:: 2.0.6$nbsp;(Plugin)
+    /// </summary>
+    procedure GetAllVoltagesCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetVoltageCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.GetVoltage"/>.
+    /// </summary>
+    property OnVoltage: TBrickletIndustrialDualAnalogInV2NotifyVoltage read voltageCallback write voltageCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.SetAllVoltagesCallbackConfiguration"/>.
+    ///  
+    ///  The parameters are the same as <see cref="BrickletIndustrialDualAnalogInV2.TBrickletIndustrialDualAnalogInV2.GetAllVoltages"/>.
+    ///  
+    ///  .. versionadded:: 2.0.6$nbsp;(Plugin)
+    /// </summary>
+    property OnAllVoltages: TBrickletIndustrialDualAnalogInV2NotifyAllVoltages read allVoltagesCallback write allVoltagesCallback;
+  end;
+
+implementation
+
+constructor TBrickletIndustrialDualAnalogInV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_DEVICE_IDENTIFIER, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 1;
+
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_VOLTAGE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_VOLTAGE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_VOLTAGE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_SAMPLE_RATE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_SAMPLE_RATE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_ADC_VALUES] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_CHANNEL_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CHANNEL_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_CHANNEL_LED_STATUS_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CHANNEL_LED_STATUS_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_ALL_VOLTAGES] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_ALL_VOLTAGES_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_ALL_VOLTAGES_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_CALLBACK_VOLTAGE] := {$ifdef FPC}@{$endif}CallbackWrapperVoltage;
+  callbackWrappers[BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_CALLBACK_ALL_VOLTAGES] := {$ifdef FPC}@{$endif}CallbackWrapperAllVoltages;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletIndustrialDualAnalogInV2.GetVoltage(const channel: byte): longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_VOLTAGE, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.SetVoltageCallbackConfiguration(const channel: byte; const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_VOLTAGE_CALLBACK_CONFIGURATION, 23);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt32To(period, 9, request);
+  LEConvertBooleanTo(valueHasToChange, 13, request);
+  LEConvertCharTo(option, 14, request);
+  LEConvertInt32To(min, 15, request);
+  LEConvertInt32To(max, 19, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.GetVoltageCallbackConfiguration(const channel: byte; out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_VOLTAGE_CALLBACK_CONFIGURATION, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.SetSampleRate(const rate: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_SAMPLE_RATE, 9);
+  LEConvertUInt8To(rate, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialDualAnalogInV2.GetSampleRate: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_SAMPLE_RATE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.SetCalibration(const offset: array of longint; const gain: array of longint);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_CALIBRATION, 24);
+  if (Length(offset) <> 2) then raise EInvalidParameterException.Create('Offset has to be exactly 2 items long');
+  for i := 0 to Length(offset) - 1 do LEConvertInt32To(offset[i], 8 + (i * 4), request);
+  if (Length(gain) <> 2) then raise EInvalidParameterException.Create('Gain has to be exactly 2 items long');
+  for i := 0 to Length(gain) - 1 do LEConvertInt32To(gain[i], 16 + (i * 4), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.GetCalibration(out offset: TArray0To1OfInt32; out gain: TArray0To1OfInt32);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CALIBRATION, 8);
+  response := SendRequest(request, 24);
+  for i := 0 to 1 do offset[i] := LEConvertInt32From(8 + (i * 4), response);
+  for i := 0 to 1 do gain[i] := LEConvertInt32From(16 + (i * 4), response);
+end;
+
+function TBrickletIndustrialDualAnalogInV2.GetADCValues: TArray0To1OfInt32;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_ADC_VALUES, 8);
+  response := SendRequest(request, 16);
+  for i := 0 to 1 do result[i] := LEConvertInt32From(8 + (i * 4), response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.SetChannelLEDConfig(const channel: byte; const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_CHANNEL_LED_CONFIG, 10);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt8To(config, 9, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialDualAnalogInV2.GetChannelLEDConfig(const channel: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CHANNEL_LED_CONFIG, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.SetChannelLEDStatusConfig(const channel: byte; const min: longint; const max: longint; const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_CHANNEL_LED_STATUS_CONFIG, 18);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertInt32To(min, 9, request);
+  LEConvertInt32To(max, 13, request);
+  LEConvertUInt8To(config, 17, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.GetChannelLEDStatusConfig(const channel: byte; out min: longint; out max: longint; out config: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CHANNEL_LED_STATUS_CONFIG, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 17);
+  min := LEConvertInt32From(8, response);
+  max := LEConvertInt32From(12, response);
+  config := LEConvertUInt8From(16, response);
+end;
+
+function TBrickletIndustrialDualAnalogInV2.GetAllVoltages: TArray0To1OfInt32;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_ALL_VOLTAGES, 8);
+  response := SendRequest(request, 16);
+  for i := 0 to 1 do result[i] := LEConvertInt32From(8 + (i * 4), response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.SetAllVoltagesCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_ALL_VOLTAGES_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.GetAllVoltagesCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_ALL_VOLTAGES_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletIndustrialDualAnalogInV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletIndustrialDualAnalogInV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialDualAnalogInV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialDualAnalogInV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletIndustrialDualAnalogInV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletIndustrialDualAnalogInV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_INDUSTRIAL_DUAL_ANALOG_IN_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.CallbackWrapperVoltage(const packet: TByteArray);
+var channel: byte; voltage: longint;
+begin
+  if (Length(packet) <> 13) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  channel := LEConvertUInt8From(8, packet);
+  voltage := LEConvertInt32From(9, packet);
+  if (Assigned(voltageCallback)) then begin
+    voltageCallback(self, channel, voltage);
+  end;
+end;
+
+procedure TBrickletIndustrialDualAnalogInV2.CallbackWrapperAllVoltages(const packet: TByteArray);
+var voltages: TArray0To1OfInt32; i: longint;
+begin
+  if (Length(packet) <> 16) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  for i := 0 to 1 do voltages[i] := LEConvertInt32From(8 + (i * 4), packet);
+  if (Assigned(allVoltagesCallback)) then begin
+    allVoltagesCallback(self, voltages);
+  end;
+end;
+
+end.
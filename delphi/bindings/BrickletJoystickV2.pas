@@ -0,0 +1,537 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletJoystickV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_JOYSTICK_V2_DEVICE_IDENTIFIER = 2138;
+  BRICKLET_JOYSTICK_V2_DEVICE_DISPLAY_NAME = 'Joystick Bricklet 2.0';
+
+  BRICKLET_JOYSTICK_V2_FUNCTION_GET_POSITION = 1;
+  BRICKLET_JOYSTICK_V2_FUNCTION_IS_PRESSED = 2;
+  BRICKLET_JOYSTICK_V2_FUNCTION_CALIBRATE = 3;
+  BRICKLET_JOYSTICK_V2_FUNCTION_SET_POSITION_CALLBACK_CONFIGURATION = 4;
+  BRICKLET_JOYSTICK_V2_FUNCTION_GET_POSITION_CALLBACK_CONFIGURATION = 5;
+  BRICKLET_JOYSTICK_V2_FUNCTION_SET_PRESSED_CALLBACK_CONFIGURATION = 7;
+  BRICKLET_JOYSTICK_V2_FUNCTION_GET_PRESSED_CALLBACK_CONFIGURATION = 8;
+  BRICKLET_JOYSTICK_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_JOYSTICK_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_JOYSTICK_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_JOYSTICK_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_JOYSTICK_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_JOYSTICK_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_JOYSTICK_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_JOYSTICK_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_JOYSTICK_V2_FUNCTION_RESET = 243;
+  BRICKLET_JOYSTICK_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_JOYSTICK_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_JOYSTICK_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_JOYSTICK_V2_CALLBACK_POSITION = 6;
+  BRICKLET_JOYSTICK_V2_CALLBACK_PRESSED = 9;
+
+  BRICKLET_JOYSTICK_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_JOYSTICK_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_JOYSTICK_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_JOYSTICK_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_JOYSTICK_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_JOYSTICK_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_JOYSTICK_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_JOYSTICK_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_JOYSTICK_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_JOYSTICK_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_JOYSTICK_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_JOYSTICK_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_JOYSTICK_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_JOYSTICK_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_JOYSTICK_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletJoystickV2 = class;
+  TBrickletJoystickV2NotifyPosition = procedure(sender: TBrickletJoystickV2; const x: smallint; const y: smallint) of object;
+  TBrickletJoystickV2NotifyPressed = procedure(sender: TBrickletJoystickV2; const pressed: boolean) of object;
+
+  /// <summary>
+  ///  2-axis joystick with push-button
+  /// </summary>
+  TBrickletJoystickV2 = class(TDevice)
+  private
+    positionCallback: TBrickletJoystickV2NotifyPosition;
+    pressedCallback: TBrickletJoystickV2NotifyPressed;
+  protected
+    procedure CallbackWrapperPosition(const packet: TByteArray); virtual;
+    procedure CallbackWrapperPressed(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the position of the joystick. The middle position of the joystick is x=0, y=0.
+    ///  The returned values are averaged and calibrated (see <see cref="BrickletJoystickV2.TBrickletJoystickV2.Calibrate"/>).
+    ///  
+    ///  If you want to get the position periodically, it is recommended to use the
+    ///  <see cref="BrickletJoystickV2.TBrickletJoystickV2.OnPosition"/> callback and set the period with
+    ///  <see cref="BrickletJoystickV2.TBrickletJoystickV2.SetPositionCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetPosition(out x: smallint; out y: smallint); virtual;
+
+    /// <summary>
+    ///  Returns *true* if the button is pressed and *false* otherwise.
+    ///  
+    ///  If you want to get the press-state periodically, it is recommended to use the
+    ///  <see cref="BrickletJoystickV2.TBrickletJoystickV2.OnPressed"/> callback and set the period with
+    ///  <see cref="BrickletJoystickV2.TBrickletJoystickV2.SetPressedCallbackConfiguration"/>.
+    /// </summary>
+    function IsPressed: boolean; virtual;
+
+    /// <summary>
+    ///  Calibrates the middle position of the joystick. If your Joystick Bricklet 2.0
+    ///  does not return x=0 and y=0 in the middle position, call this function
+    ///  while the joystick is standing still in the middle position.
+    ///  
+    ///  The resulting calibration will be saved in non-volatile memory,
+    ///  thus you only have to calibrate it once.
+    /// </summary>
+    procedure Calibrate; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletJoystickV2.TBrickletJoystickV2.OnPosition"/>
+    ///  callback is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after at least one of the values has changed. If the values didn't
+    ///  change within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetPositionCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by
+    ///  <see cref="BrickletJoystickV2.TBrickletJoystickV2.SetPositionCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetPositionCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletJoystickV2.TBrickletJoystickV2.OnPressed"/>
+    ///  callback is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after at least one of the values has changed. If the values didn't
+    ///  change within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetPressedCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by
+    ///  <see cref="BrickletJoystickV2.TBrickletJoystickV2.SetPressedCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetPressedCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletJoystickV2.TBrickletJoystickV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletJoystickV2.TBrickletJoystickV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletJoystickV2.TBrickletJoystickV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletJoystickV2.TBrickletJoystickV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletJoystickV2.TBrickletJoystickV2.SetPositionCallbackConfiguration"/>.
+    ///  
+    ///  The parameters are the same as with <see cref="BrickletJoystickV2.TBrickletJoystickV2.GetPosition"/>.
+    /// </summary>
+    property OnPosition: TBrickletJoystickV2NotifyPosition read positionCallback write positionCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletJoystickV2.TBrickletJoystickV2.SetPressedCallbackConfiguration"/>.
+    ///  
+    ///  The parameters are the same as with <see cref="BrickletJoystickV2.TBrickletJoystickV2.IsPressed"/>.
+    /// </summary>
+    property OnPressed: TBrickletJoystickV2NotifyPressed read pressedCallback write pressedCallback;
+  end;
+
+implementation
+
+constructor TBrickletJoystickV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_JOYSTICK_V2_DEVICE_IDENTIFIER, BRICKLET_JOYSTICK_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_GET_POSITION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_IS_PRESSED] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_CALIBRATE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_SET_POSITION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_GET_POSITION_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_SET_PRESSED_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_GET_PRESSED_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_JOYSTICK_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_JOYSTICK_V2_CALLBACK_POSITION] := {$ifdef FPC}@{$endif}CallbackWrapperPosition;
+  callbackWrappers[BRICKLET_JOYSTICK_V2_CALLBACK_PRESSED] := {$ifdef FPC}@{$endif}CallbackWrapperPressed;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletJoystickV2.GetPosition(out x: smallint; out y: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_GET_POSITION, 8);
+  response := SendRequest(request, 12);
+  x := LEConvertInt16From(8, response);
+  y := LEConvertInt16From(10, response);
+end;
+
+function TBrickletJoystickV2.IsPressed: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_IS_PRESSED, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletJoystickV2.Calibrate;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_CALIBRATE, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletJoystickV2.SetPositionCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_SET_POSITION_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletJoystickV2.GetPositionCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_GET_POSITION_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletJoystickV2.SetPressedCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_SET_PRESSED_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletJoystickV2.GetPressedCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_GET_PRESSED_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+procedure TBrickletJoystickV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletJoystickV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletJoystickV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletJoystickV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletJoystickV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletJoystickV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletJoystickV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletJoystickV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletJoystickV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletJoystickV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletJoystickV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletJoystickV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_JOYSTICK_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletJoystickV2.CallbackWrapperPosition(const packet: TByteArray);
+var x: smallint; y: smallint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  x := LEConvertInt16From(8, packet);
+  y := LEConvertInt16From(10, packet);
+  if (Assigned(positionCallback)) then begin
+    positionCallback(self, x, y);
+  end;
+end;
+
+procedure TBrickletJoystickV2.CallbackWrapperPressed(const packet: TByteArray);
+var pressed: boolean;
+begin
+  if (Length(packet) <> 9) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  pressed := LEConvertBooleanFrom(8, packet);
+  if (Assigned(pressedCallback)) then begin
+    pressedCallback(self, pressed);
+  end;
+end;
+
+end.
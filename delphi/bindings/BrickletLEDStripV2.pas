@@ -0,0 +1,820 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletLEDStripV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_LED_STRIP_V2_DEVICE_IDENTIFIER = 2103;
+  BRICKLET_LED_STRIP_V2_DEVICE_DISPLAY_NAME = 'LED Strip Bricklet 2.0';
+
+  BRICKLET_LED_STRIP_V2_FUNCTION_SET_LED_VALUES_LOW_LEVEL = 1;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_LED_VALUES_LOW_LEVEL = 2;
+  BRICKLET_LED_STRIP_V2_FUNCTION_SET_FRAME_DURATION = 3;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_FRAME_DURATION = 4;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_SUPPLY_VOLTAGE = 5;
+  BRICKLET_LED_STRIP_V2_FUNCTION_SET_CLOCK_FREQUENCY = 7;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_CLOCK_FREQUENCY = 8;
+  BRICKLET_LED_STRIP_V2_FUNCTION_SET_CHIP_TYPE = 9;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_CHIP_TYPE = 10;
+  BRICKLET_LED_STRIP_V2_FUNCTION_SET_CHANNEL_MAPPING = 11;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_CHANNEL_MAPPING = 12;
+  BRICKLET_LED_STRIP_V2_FUNCTION_SET_FRAME_STARTED_CALLBACK_CONFIGURATION = 13;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_FRAME_STARTED_CALLBACK_CONFIGURATION = 14;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_LED_STRIP_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_LED_STRIP_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_LED_STRIP_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_LED_STRIP_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_LED_STRIP_V2_FUNCTION_RESET = 243;
+  BRICKLET_LED_STRIP_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_LED_STRIP_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_LED_STRIP_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_LED_STRIP_V2_CALLBACK_FRAME_STARTED = 6;
+
+  BRICKLET_LED_STRIP_V2_CHIP_TYPE_WS2801 = 2801;
+  BRICKLET_LED_STRIP_V2_CHIP_TYPE_WS2811 = 2811;
+  BRICKLET_LED_STRIP_V2_CHIP_TYPE_WS2812 = 2812;
+  BRICKLET_LED_STRIP_V2_CHIP_TYPE_LPD8806 = 8806;
+  BRICKLET_LED_STRIP_V2_CHIP_TYPE_APA102 = 102;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_RGB = 6;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_RBG = 9;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_BRG = 33;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_BGR = 36;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_GRB = 18;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_GBR = 24;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_RGBW = 27;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_RGWB = 30;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_RBGW = 39;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_RBWG = 45;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_RWGB = 54;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_RWBG = 57;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_GRWB = 78;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_GRBW = 75;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_GBWR = 108;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_GBRW = 99;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_GWBR = 120;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_GWRB = 114;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_BRGW = 135;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_BRWG = 141;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_BGRW = 147;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_BGWR = 156;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_BWRG = 177;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_BWGR = 180;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_WRBG = 201;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_WRGB = 198;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_WGBR = 216;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_WGRB = 210;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_WBGR = 228;
+  BRICKLET_LED_STRIP_V2_CHANNEL_MAPPING_WBRG = 225;
+  BRICKLET_LED_STRIP_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_LED_STRIP_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_LED_STRIP_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_LED_STRIP_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_LED_STRIP_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_LED_STRIP_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_LED_STRIP_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_LED_STRIP_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_LED_STRIP_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_LED_STRIP_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_LED_STRIP_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_LED_STRIP_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_LED_STRIP_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_LED_STRIP_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_LED_STRIP_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To57OfUInt8 = array [0..57] of byte;
+  TArray0To59OfUInt8 = array [0..59] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+  TArrayOfUInt8 = array of byte;
+
+  TBrickletLEDStripV2 = class;
+  TBrickletLEDStripV2NotifyFrameStarted = procedure(sender: TBrickletLEDStripV2; const length_: word) of object;
+
+  /// <summary>
+  ///  Controls up to 2048 RGB(W) LEDs
+  /// </summary>
+  TBrickletLEDStripV2 = class(TDevice)
+  private
+    streamMutex: TCriticalSection;
+    frameStartedCallback: TBrickletLEDStripV2NotifyFrameStarted;
+  protected
+    procedure CallbackWrapperFrameStarted(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Sets the RGB(W) values for the LEDs starting from *index*.
+    ///  You can set at most 2048 RGB values or 1536 RGBW values (6144 byte each).
+    ///  
+    ///  To make the colors show correctly you need to configure the chip type
+    ///  (see <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetChipType"/>) and a channel mapping (see <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetChannelMapping"/>)
+    ///  according to the connected LEDs.
+    ///  
+    ///  If the channel mapping has 3 colors, you need to give the data in the sequence
+    ///  RGBRGBRGB... if the channel mapping has 4 colors you need to give data in the
+    ///  sequence RGBWRGBWRGBW...
+    ///  
+    ///  The data is double buffered and the colors will be transfered to the
+    ///  LEDs when the next frame duration ends (see <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetFrameDuration"/>).
+    ///  
+    ///  Generic approach:
+    ///  
+    ///  * Set the frame duration to a value that represents the number of frames per
+    ///    second you want to achieve.
+    ///  * Set all of the LED colors for one frame.
+    ///  * Wait for the <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.OnFrameStarted"/> callback.
+    ///  * Set all of the LED colors for next frame.
+    ///  * Wait for the <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.OnFrameStarted"/> callback.
+    ///  * And so on.
+    ///  
+    ///  This approach ensures that you can change the LED colors with a fixed frame rate.
+    /// </summary>
+    procedure SetLEDValuesLowLevel(const index: word; const valueLength: word; const valueChunkOffset: word; const valueChunkData: TArray0To57OfUInt8); virtual;
+
+    /// <summary>
+    ///  Sets the RGB(W) values for the LEDs starting from *index*.
+    ///  You can set at most 2048 RGB values or 1536 RGBW values (6144 byte each).
+    ///  
+    ///  To make the colors show correctly you need to configure the chip type
+    ///  (see <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetChipType"/>) and a channel mapping (see <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetChannelMapping"/>)
+    ///  according to the connected LEDs.
+    ///  
+    ///  If the channel mapping has 3 colors, you need to give the data in the sequence
+    ///  RGBRGBRGB... if the channel mapping has 4 colors you need to give data in the
+    ///  sequence RGBWRGBWRGBW...
+    ///  
+    ///  The data is double buffered and the colors will be transfered to the
+    ///  LEDs when the next frame duration ends (see <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetFrameDuration"/>).
+    ///  
+    ///  Generic approach:
+    ///  
+    ///  * Set the frame duration to a value that represents the number of frames per
+    ///    second you want to achieve.
+    ///  * Set all of the LED colors for one frame.
+    ///  * Wait for the <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.OnFrameStarted"/> callback.
+    ///  * Set all of the LED colors for next frame.
+    ///  * Wait for the <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.OnFrameStarted"/> callback.
+    ///  * And so on.
+    ///  
+    ///  This approach ensures that you can change the LED colors with a fixed frame rate.
+    /// </summary>
+    procedure SetLEDValues(const index: word; const value: array of byte); virtual;
+
+    /// <summary>
+    ///  Returns *length* RGB(W) values starting from the
+    ///  given *index*.
+    ///  
+    ///  If the channel mapping has 3 colors, you will get the data in the sequence
+    ///  RGBRGBRGB... if the channel mapping has 4 colors you will get the data in the
+    ///  sequence RGBWRGBWRGBW...
+    ///  (assuming you start at an index divisible by 3 (RGB) or 4 (RGBW)).
+    /// </summary>
+    procedure GetLEDValuesLowLevel(const index: word; const length_: word; out valueLength: word; out valueChunkOffset: word; out valueChunkData: TArray0To59OfUInt8); virtual;
+
+    /// <summary>
+    ///  Returns *length* RGB(W) values starting from the
+    ///  given *index*.
+    ///  
+    ///  If the channel mapping has 3 colors, you will get the data in the sequence
+    ///  RGBRGBRGB... if the channel mapping has 4 colors you will get the data in the
+    ///  sequence RGBWRGBWRGBW...
+    ///  (assuming you start at an index divisible by 3 (RGB) or 4 (RGBW)).
+    /// </summary>
+    function GetLEDValues(const index: word; const length_: word): TArrayOfUInt8; virtual;
+
+    /// <summary>
+    ///  Sets the frame duration.
+    ///  
+    ///  Example: If you want to achieve 20 frames per second, you should
+    ///  set the frame duration to 50ms (50ms * 20 = 1 second).
+    ///  
+    ///  For an explanation of the general approach see <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetLEDValues"/>.
+    ///  
+    ///  Default value: 100ms (10 frames per second).
+    /// </summary>
+    procedure SetFrameDuration(const duration: word); virtual;
+
+    /// <summary>
+    ///  Returns the frame duration as set by <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetFrameDuration"/>.
+    /// </summary>
+    function GetFrameDuration: word; virtual;
+
+    /// <summary>
+    ///  Returns the current supply voltage of the LEDs.
+    /// </summary>
+    function GetSupplyVoltage: word; virtual;
+
+    /// <summary>
+    ///  Sets the frequency of the clock.
+    ///  
+    ///  The Bricklet will choose the nearest achievable frequency, which may
+    ///  be off by a few Hz. You can get the exact frequency that is used by
+    ///  calling <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.GetClockFrequency"/>.
+    ///  
+    ///  If you have problems with flickering LEDs, they may be bits flipping. You
+    ///  can fix this by either making the connection between the LEDs and the
+    ///  Bricklet shorter or by reducing the frequency.
+    ///  
+    ///  With a decreasing frequency your maximum frames per second will decrease
+    ///  too.
+    /// </summary>
+    procedure SetClockFrequency(const frequency: longword); virtual;
+
+    /// <summary>
+    ///  Returns the currently used clock frequency as set by <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetClockFrequency"/>.
+    /// </summary>
+    function GetClockFrequency: longword; virtual;
+
+    /// <summary>
+    ///  Sets the type of the LED driver chip. We currently support the chips
+    ///  
+    ///  * WS2801,
+    ///  * WS2811,
+    ///  * WS2812 / SK6812 / NeoPixel RGB,
+    ///  * SK6812RGBW / NeoPixel RGBW (Chip Type = WS2812),
+    ///  * WS2813 / WS2815 (Chip Type = WS2812)
+    ///  * LPD8806 and
+    ///  * APA102 / DotStar.
+    /// </summary>
+    procedure SetChipType(const chip: word); virtual;
+
+    /// <summary>
+    ///  Returns the currently used chip type as set by <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetChipType"/>.
+    /// </summary>
+    function GetChipType: word; virtual;
+
+    /// <summary>
+    ///  Sets the channel mapping for the connected LEDs.
+    ///  
+    ///  If the mapping has 4 colors, the function <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetLEDValues"/> expects 4
+    ///  values per pixel and if the mapping has 3 colors it expects 3 values per pixel.
+    ///  
+    ///  The function always expects the order RGB(W). The connected LED driver chips
+    ///  might have their 3 or 4 channels in a different order. For example, the WS2801
+    ///  chips typically use BGR order, then WS2812 chips typically use GRB order and
+    ///  the APA102 chips typically use WBGR order.
+    ///  
+    ///  The APA102 chips are special. They have three 8-bit channels for RGB
+    ///  and an additional 5-bit channel for the overall brightness of the RGB LED
+    ///  making them 4-channel chips. Internally the brightness channel is the first
+    ///  channel, therefore one of the Wxyz channel mappings should be used. Then
+    ///  the W channel controls the brightness.
+    /// </summary>
+    procedure SetChannelMapping(const mapping: byte); virtual;
+
+    /// <summary>
+    ///  Returns the currently used channel mapping as set by <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetChannelMapping"/>.
+    /// </summary>
+    function GetChannelMapping: byte; virtual;
+
+    /// <summary>
+    ///  Enables/disables the <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.OnFrameStarted"/> callback.
+    /// </summary>
+    procedure SetFrameStartedCallbackConfiguration(const enable: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by
+    ///  <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetFrameStartedCallbackConfiguration"/>.
+    /// </summary>
+    function GetFrameStartedCallbackConfiguration: boolean; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered directly after a new frame render is started.
+    ///  The parameter is the number of LEDs in that frame.
+    ///  
+    ///  You should send the data for the next frame directly after this callback
+    ///  was triggered.
+    ///  
+    ///  For an explanation of the general approach see <see cref="BrickletLEDStripV2.TBrickletLEDStripV2.SetLEDValues"/>.
+    /// </summary>
+    property OnFrameStarted: TBrickletLEDStripV2NotifyFrameStarted read frameStartedCallback write frameStartedCallback;
+  end;
+
+implementation
+
+constructor TBrickletLEDStripV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_LED_STRIP_V2_DEVICE_IDENTIFIER, BRICKLET_LED_STRIP_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_SET_LED_VALUES_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_LED_VALUES_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_SET_FRAME_DURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_FRAME_DURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_SUPPLY_VOLTAGE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_SET_CLOCK_FREQUENCY] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_CLOCK_FREQUENCY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_SET_CHIP_TYPE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_CHIP_TYPE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_SET_CHANNEL_MAPPING] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_CHANNEL_MAPPING] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_SET_FRAME_STARTED_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_FRAME_STARTED_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LED_STRIP_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  streamMutex := TCriticalSection.Create;
+
+  callbackWrappers[BRICKLET_LED_STRIP_V2_CALLBACK_FRAME_STARTED] := {$ifdef FPC}@{$endif}CallbackWrapperFrameStarted;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletLEDStripV2.SetLEDValuesLowLevel(const index: word; const valueLength: word; const valueChunkOffset: word; const valueChunkData: TArray0To57OfUInt8);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_SET_LED_VALUES_LOW_LEVEL, 72);
+  LEConvertUInt16To(index, 8, request);
+  LEConvertUInt16To(valueLength, 10, request);
+  LEConvertUInt16To(valueChunkOffset, 12, request);
+  for i := 0 to Length(valueChunkData) - 1 do LEConvertUInt8To(valueChunkData[i], 14 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletLEDStripV2.SetLEDValues(const index: word; const value: array of byte);
+var
+  valueChunkOffset: word;
+  valueChunkData: TArray0To57OfUInt8;
+  valueChunkLength: word;
+  valueLength: word;
+begin
+  if (Length(value) > 65535) then begin
+    raise EInvalidParameterException.Create('Value can be at most 65535 items long');
+  end;
+
+  valueLength := Length(value);
+  valueChunkOffset := 0;
+
+  if (valueLength = 0) then begin
+    FillChar(valueChunkData[0], SizeOf(byte) * 58, 0);
+    SetLEDValuesLowLevel(index, valueLength, valueChunkOffset, valueChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (valueChunkOffset < valueLength) do begin
+        valueChunkLength := valueLength - valueChunkOffset;
+
+        if (valueChunkLength > 58) then valueChunkLength := 58;
+
+        FillChar(valueChunkData[0], SizeOf(byte) * 58, 0);
+        Move(value[valueChunkOffset], valueChunkData[0], SizeOf(byte) * valueChunkLength);
+
+        SetLEDValuesLowLevel(index, valueLength, valueChunkOffset, valueChunkData);
+        Inc(valueChunkOffset, 58);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletLEDStripV2.GetLEDValuesLowLevel(const index: word; const length_: word; out valueLength: word; out valueChunkOffset: word; out valueChunkData: TArray0To59OfUInt8);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_LED_VALUES_LOW_LEVEL, 12);
+  LEConvertUInt16To(index, 8, request);
+  LEConvertUInt16To(length_, 10, request);
+  response := SendRequest(request, 72);
+  valueLength := LEConvertUInt16From(8, response);
+  valueChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 59 do valueChunkData[i] := LEConvertUInt8From(12 + (i * 1), response);
+end;
+
+function TBrickletLEDStripV2.GetLEDValues(const index: word; const length_: word): TArrayOfUInt8;
+var
+  value: TArrayOfUInt8;
+  valueCurrentLength: word;
+  valueLength: word;
+  valueChunkOffset: word;
+  valueChunkData: TArray0To59OfUInt8;
+  valueOutOfSync: boolean;
+  valueChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(value, 0);
+  streamMutex.Acquire;
+  try
+    valueLength := 0;
+    GetLEDValuesLowLevel(index, length_, valueLength, valueChunkOffset, valueChunkData);
+    SetLength(value, valueLength);
+    valueOutOfSync := (valueChunkOffset <> 0);
+
+    if ((not valueOutOfSync) and (valueLength > 0)) then begin
+      valueChunkLength := valueLength - valueChunkOffset;
+      if (valueChunkLength > 60) then valueChunkLength := 60;
+      Move(valueChunkData, value[0], SizeOf(byte) * valueChunkLength);
+      valueCurrentLength := valueChunkLength;
+
+      while ((not valueOutOfSync) and (valueCurrentLength < valueLength)) do begin
+        GetLEDValuesLowLevel(index, length_, valueLength, valueChunkOffset, valueChunkData);
+        valueOutOfSync := valueChunkOffset <> valueCurrentLength;
+        valueChunkLength := valueLength - valueChunkOffset;
+        if (valueChunkLength > 60) then valueChunkLength := 60;
+        Move(valueChunkData, value[valueCurrentLength], SizeOf(byte) * valueChunkLength);
+        Inc(valueCurrentLength, valueChunkLength);
+      end;
+    end;
+
+    if (valueOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (valueChunkOffset + 60 < valueLength) do begin
+        GetLEDValuesLowLevel(index, length_, valueLength, valueChunkOffset, valueChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Value stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := value;
+end;
+
+procedure TBrickletLEDStripV2.SetFrameDuration(const duration: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_SET_FRAME_DURATION, 10);
+  LEConvertUInt16To(duration, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLEDStripV2.GetFrameDuration: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_FRAME_DURATION, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+function TBrickletLEDStripV2.GetSupplyVoltage: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_SUPPLY_VOLTAGE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+procedure TBrickletLEDStripV2.SetClockFrequency(const frequency: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_SET_CLOCK_FREQUENCY, 12);
+  LEConvertUInt32To(frequency, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLEDStripV2.GetClockFrequency: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_CLOCK_FREQUENCY, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletLEDStripV2.SetChipType(const chip: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_SET_CHIP_TYPE, 10);
+  LEConvertUInt16To(chip, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLEDStripV2.GetChipType: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_CHIP_TYPE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+procedure TBrickletLEDStripV2.SetChannelMapping(const mapping: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_SET_CHANNEL_MAPPING, 9);
+  LEConvertUInt8To(mapping, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLEDStripV2.GetChannelMapping: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_CHANNEL_MAPPING, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletLEDStripV2.SetFrameStartedCallbackConfiguration(const enable: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_SET_FRAME_STARTED_CALLBACK_CONFIGURATION, 9);
+  LEConvertBooleanTo(enable, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLEDStripV2.GetFrameStartedCallbackConfiguration: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_FRAME_STARTED_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletLEDStripV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletLEDStripV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletLEDStripV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletLEDStripV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLEDStripV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletLEDStripV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLEDStripV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletLEDStripV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletLEDStripV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletLEDStripV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLEDStripV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletLEDStripV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LED_STRIP_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletLEDStripV2.CallbackWrapperFrameStarted(const packet: TByteArray);
+var length_: word;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  length_ := LEConvertUInt16From(8, packet);
+  if (Assigned(frameStartedCallback)) then begin
+    frameStartedCallback(self, length_);
+  end;
+end;
+
+end.
@@ -0,0 +1,788 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletLaserRangeFinderV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_LASER_RANGE_FINDER_V2_DEVICE_IDENTIFIER = 2144;
+  BRICKLET_LASER_RANGE_FINDER_V2_DEVICE_DISPLAY_NAME = 'Laser Range Finder Bricklet 2.0';
+
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_DISTANCE = 1;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_DISTANCE_CALLBACK_CONFIGURATION = 2;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_DISTANCE_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_VELOCITY = 5;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_VELOCITY_CALLBACK_CONFIGURATION = 6;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_VELOCITY_CALLBACK_CONFIGURATION = 7;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_ENABLE = 9;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_ENABLE = 10;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_CONFIGURATION = 11;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_CONFIGURATION = 12;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_MOVING_AVERAGE = 13;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_MOVING_AVERAGE = 14;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_OFFSET_CALIBRATION = 15;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_OFFSET_CALIBRATION = 16;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_DISTANCE_LED_CONFIG = 17;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_DISTANCE_LED_CONFIG = 18;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_RESET = 243;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_LASER_RANGE_FINDER_V2_CALLBACK_DISTANCE = 4;
+  BRICKLET_LASER_RANGE_FINDER_V2_CALLBACK_VELOCITY = 8;
+
+  BRICKLET_LASER_RANGE_FINDER_V2_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_LASER_RANGE_FINDER_V2_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_LASER_RANGE_FINDER_V2_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_LASER_RANGE_FINDER_V2_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_LASER_RANGE_FINDER_V2_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_LASER_RANGE_FINDER_V2_DISTANCE_LED_CONFIG_OFF = 0;
+  BRICKLET_LASER_RANGE_FINDER_V2_DISTANCE_LED_CONFIG_ON = 1;
+  BRICKLET_LASER_RANGE_FINDER_V2_DISTANCE_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_LASER_RANGE_FINDER_V2_DISTANCE_LED_CONFIG_SHOW_DISTANCE = 3;
+  BRICKLET_LASER_RANGE_FINDER_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_LASER_RANGE_FINDER_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_LASER_RANGE_FINDER_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_LASER_RANGE_FINDER_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_LASER_RANGE_FINDER_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_LASER_RANGE_FINDER_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_LASER_RANGE_FINDER_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_LASER_RANGE_FINDER_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_LASER_RANGE_FINDER_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_LASER_RANGE_FINDER_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_LASER_RANGE_FINDER_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_LASER_RANGE_FINDER_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_LASER_RANGE_FINDER_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_LASER_RANGE_FINDER_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_LASER_RANGE_FINDER_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletLaserRangeFinderV2 = class;
+  TBrickletLaserRangeFinderV2NotifyDistance = procedure(sender: TBrickletLaserRangeFinderV2; const distance: smallint) of object;
+  TBrickletLaserRangeFinderV2NotifyVelocity = procedure(sender: TBrickletLaserRangeFinderV2; const velocity: smallint) of object;
+
+  /// <summary>
+  ///  Measures distance up to 40m with laser light
+  /// </summary>
+  TBrickletLaserRangeFinderV2 = class(TDevice)
+  private
+    distanceCallback: TBrickletLaserRangeFinderV2NotifyDistance;
+    velocityCallback: TBrickletLaserRangeFinderV2NotifyVelocity;
+  protected
+    procedure CallbackWrapperDistance(const packet: TByteArray); virtual;
+    procedure CallbackWrapperVelocity(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the measured distance.
+    ///  
+    ///  The laser has to be enabled, see <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetEnable"/>.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.OnDistance"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetDistanceCallbackConfiguration"/>.
+    /// </summary>
+    function GetDistance: smallint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.OnDistance"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.OnDistance"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetDistanceCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: smallint; const max: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetDistanceCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetDistanceCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: smallint; out max: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the measured velocity. The value has a range of -12800 to 12700
+    ///  and is given in 1/100 m/s.
+    ///  
+    ///  The velocity measurement only produces stables results if a fixed
+    ///  measurement rate (see <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetConfiguration"/>) is configured. Also the laser
+    ///  has to be enabled, see <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetEnable"/>.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.OnVelocity"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetVelocityCallbackConfiguration"/>.
+    /// </summary>
+    function GetVelocity: smallint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.OnVelocity"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.OnVelocity"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetVelocityCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: smallint; const max: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetVelocityCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetVelocityCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: smallint; out max: smallint); virtual;
+
+    /// <summary>
+    ///  Enables the laser of the LIDAR if set to *true*.
+    ///  
+    ///  We recommend that you wait 250ms after enabling the laser before
+    ///  the first call of <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.GetDistance"/> to ensure stable measurements.
+    /// </summary>
+    procedure SetEnable(const enable: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the value as set by <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetEnable"/>.
+    /// </summary>
+    function GetEnable: boolean; virtual;
+
+    /// <summary>
+    ///  The **Acquisition Count** defines the number of times the Laser Range Finder Bricklet
+    ///  will integrate acquisitions to find a correlation record peak. With a higher count,
+    ///  the Bricklet can measure longer distances. With a lower count, the rate increases. The
+    ///  allowed values are 1-255.
+    ///  
+    ///  If you set **Enable Quick Termination** to true, the distance measurement will be terminated
+    ///  early if a high peak was already detected. This means that a higher measurement rate can be achieved
+    ///  and long distances can be measured at the same time. However, the chance of false-positive
+    ///  distance measurements increases.
+    ///  
+    ///  Normally the distance is calculated with a detection algorithm that uses peak value,
+    ///  signal strength and noise. You can however also define a fixed **Threshold Value**.
+    ///  Set this to a low value if you want to measure the distance to something that has
+    ///  very little reflection (e.g. glass) and set it to a high value if you want to measure
+    ///  the distance to something with a very high reflection (e.g. mirror). Set this to 0 to
+    ///  use the default algorithm. The other allowed values are 1-255.
+    ///  
+    ///  Set the **Measurement Frequency** to force a fixed measurement rate. If set to 0,
+    ///  the Laser Range Finder Bricklet will use the optimal frequency according to the other
+    ///  configurations and the actual measured distance. Since the rate is not fixed in this case,
+    ///  the velocity measurement is not stable. For a stable velocity measurement you should
+    ///  set a fixed measurement frequency. The lower the frequency, the higher is the resolution
+    ///  of the calculated velocity. The allowed values are 10Hz-500Hz (and 0 to turn the fixed
+    ///  frequency off).
+    ///  
+    ///  The default values for Acquisition Count, Enable Quick Termination, Threshold Value and
+    ///  Measurement Frequency are 128, false, 0 and 0.
+    /// </summary>
+    procedure SetConfiguration(const acquisitionCount: byte; const enableQuickTermination: boolean; const thresholdValue: byte; const measurementFrequency: word); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetConfiguration"/>.
+    /// </summary>
+    procedure GetConfiguration(out acquisitionCount: byte; out enableQuickTermination: boolean; out thresholdValue: byte; out measurementFrequency: word); virtual;
+
+    /// <summary>
+    ///  Sets the length of a `moving averaging &lt;https://en.wikipedia.org/wiki/Moving_average&gt;`__
+    ///  for the distance and velocity.
+    ///  
+    ///  Setting the length to 0 will turn the averaging completely off. With less
+    ///  averaging, there is more noise on the data.
+    /// </summary>
+    procedure SetMovingAverage(const distanceAverageLength: byte; const velocityAverageLength: byte); virtual;
+
+    /// <summary>
+    ///  Returns the length moving average as set by <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetMovingAverage"/>.
+    /// </summary>
+    procedure GetMovingAverage(out distanceAverageLength: byte; out velocityAverageLength: byte); virtual;
+
+    /// <summary>
+    ///  The offset is added to the measured distance.
+    ///  It is saved in non-volatile memory, you only have to set it once.
+    ///  
+    ///  The Bricklet comes with a per-sensor factory-calibrated offset value,
+    ///  you should not have to call this function.
+    ///  
+    ///  If you want to re-calibrate the offset you first have to set it to 0.
+    ///  Calculate the offset by measuring the distance to a known distance
+    ///  and set it again.
+    /// </summary>
+    procedure SetOffsetCalibration(const offset: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the offset value as set by <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetOffsetCalibration"/>.
+    /// </summary>
+    function GetOffsetCalibration: smallint; virtual;
+
+    /// <summary>
+    ///  Configures the distance LED to be either turned off, turned on, blink in
+    ///  heartbeat mode or show the distance (brighter = object is nearer).
+    /// </summary>
+    procedure SetDistanceLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the LED configuration as set by <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetDistanceLEDConfig"/>
+    /// </summary>
+    function GetDistanceLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetDistanceCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.GetDistance"/>.
+    /// </summary>
+    property OnDistance: TBrickletLaserRangeFinderV2NotifyDistance read distanceCallback write distanceCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.SetVelocityCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletLaserRangeFinderV2.TBrickletLaserRangeFinderV2.GetVelocity"/>.
+    /// </summary>
+    property OnVelocity: TBrickletLaserRangeFinderV2NotifyVelocity read velocityCallback write velocityCallback;
+  end;
+
+implementation
+
+constructor TBrickletLaserRangeFinderV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_LASER_RANGE_FINDER_V2_DEVICE_IDENTIFIER, BRICKLET_LASER_RANGE_FINDER_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_DISTANCE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_DISTANCE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_DISTANCE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_VELOCITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_VELOCITY_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_VELOCITY_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_ENABLE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_ENABLE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_MOVING_AVERAGE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_MOVING_AVERAGE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_OFFSET_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_OFFSET_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_DISTANCE_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_DISTANCE_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_LASER_RANGE_FINDER_V2_CALLBACK_DISTANCE] := {$ifdef FPC}@{$endif}CallbackWrapperDistance;
+  callbackWrappers[BRICKLET_LASER_RANGE_FINDER_V2_CALLBACK_VELOCITY] := {$ifdef FPC}@{$endif}CallbackWrapperVelocity;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletLaserRangeFinderV2.GetDistance: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_DISTANCE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.SetDistanceCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: smallint; const max: smallint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_DISTANCE_CALLBACK_CONFIGURATION, 18);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt16To(min, 14, request);
+  LEConvertInt16To(max, 16, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletLaserRangeFinderV2.GetDistanceCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: smallint; out max: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_DISTANCE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 18);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt16From(14, response);
+  max := LEConvertInt16From(16, response);
+end;
+
+function TBrickletLaserRangeFinderV2.GetVelocity: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_VELOCITY, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.SetVelocityCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: smallint; const max: smallint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_VELOCITY_CALLBACK_CONFIGURATION, 18);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt16To(min, 14, request);
+  LEConvertInt16To(max, 16, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletLaserRangeFinderV2.GetVelocityCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: smallint; out max: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_VELOCITY_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 18);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt16From(14, response);
+  max := LEConvertInt16From(16, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.SetEnable(const enable: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_ENABLE, 9);
+  LEConvertBooleanTo(enable, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLaserRangeFinderV2.GetEnable: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_ENABLE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.SetConfiguration(const acquisitionCount: byte; const enableQuickTermination: boolean; const thresholdValue: byte; const measurementFrequency: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_CONFIGURATION, 13);
+  LEConvertUInt8To(acquisitionCount, 8, request);
+  LEConvertBooleanTo(enableQuickTermination, 9, request);
+  LEConvertUInt8To(thresholdValue, 10, request);
+  LEConvertUInt16To(measurementFrequency, 11, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletLaserRangeFinderV2.GetConfiguration(out acquisitionCount: byte; out enableQuickTermination: boolean; out thresholdValue: byte; out measurementFrequency: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  acquisitionCount := LEConvertUInt8From(8, response);
+  enableQuickTermination := LEConvertBooleanFrom(9, response);
+  thresholdValue := LEConvertUInt8From(10, response);
+  measurementFrequency := LEConvertUInt16From(11, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.SetMovingAverage(const distanceAverageLength: byte; const velocityAverageLength: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_MOVING_AVERAGE, 10);
+  LEConvertUInt8To(distanceAverageLength, 8, request);
+  LEConvertUInt8To(velocityAverageLength, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletLaserRangeFinderV2.GetMovingAverage(out distanceAverageLength: byte; out velocityAverageLength: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_MOVING_AVERAGE, 8);
+  response := SendRequest(request, 10);
+  distanceAverageLength := LEConvertUInt8From(8, response);
+  velocityAverageLength := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.SetOffsetCalibration(const offset: smallint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_OFFSET_CALIBRATION, 10);
+  LEConvertInt16To(offset, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLaserRangeFinderV2.GetOffsetCalibration: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_OFFSET_CALIBRATION, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.SetDistanceLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_DISTANCE_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLaserRangeFinderV2.GetDistanceLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_DISTANCE_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletLaserRangeFinderV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletLaserRangeFinderV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLaserRangeFinderV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLaserRangeFinderV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletLaserRangeFinderV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletLaserRangeFinderV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletLaserRangeFinderV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_LASER_RANGE_FINDER_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletLaserRangeFinderV2.CallbackWrapperDistance(const packet: TByteArray);
+var distance: smallint;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  distance := LEConvertInt16From(8, packet);
+  if (Assigned(distanceCallback)) then begin
+    distanceCallback(self, distance);
+  end;
+end;
+
+procedure TBrickletLaserRangeFinderV2.CallbackWrapperVelocity(const packet: TByteArray);
+var velocity: smallint;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  velocity := LEConvertInt16From(8, packet);
+  if (Assigned(velocityCallback)) then begin
+    velocityCallback(self, velocity);
+  end;
+end;
+
+end.
@@ -0,0 +1,480 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletMotionDetectorV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_MOTION_DETECTOR_V2_DEVICE_IDENTIFIER = 292;
+  BRICKLET_MOTION_DETECTOR_V2_DEVICE_DISPLAY_NAME = 'Motion Detector Bricklet 2.0';
+
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_MOTION_DETECTED = 1;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_SENSITIVITY = 2;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_SENSITIVITY = 3;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_INDICATOR = 4;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_INDICATOR = 5;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_RESET = 243;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_MOTION_DETECTOR_V2_CALLBACK_MOTION_DETECTED = 6;
+  BRICKLET_MOTION_DETECTOR_V2_CALLBACK_DETECTION_CYCLE_ENDED = 7;
+
+  BRICKLET_MOTION_DETECTOR_V2_MOTION_NOT_DETECTED = 0;
+  BRICKLET_MOTION_DETECTOR_V2_MOTION_DETECTED = 1;
+  BRICKLET_MOTION_DETECTOR_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_MOTION_DETECTOR_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_MOTION_DETECTOR_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_MOTION_DETECTOR_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_MOTION_DETECTOR_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_MOTION_DETECTOR_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_MOTION_DETECTOR_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_MOTION_DETECTOR_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_MOTION_DETECTOR_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_MOTION_DETECTOR_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_MOTION_DETECTOR_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_MOTION_DETECTOR_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_MOTION_DETECTOR_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_MOTION_DETECTOR_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_MOTION_DETECTOR_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletMotionDetectorV2 = class;
+  TBrickletMotionDetectorV2NotifyMotionDetected = procedure(sender: TBrickletMotionDetectorV2) of object;
+  TBrickletMotionDetectorV2NotifyDetectionCycleEnded = procedure(sender: TBrickletMotionDetectorV2) of object;
+
+  /// <summary>
+  ///  Passive infrared (PIR) motion sensor with 12m range and dimmable backlight
+  /// </summary>
+  TBrickletMotionDetectorV2 = class(TDevice)
+  private
+    motionDetectedCallback: TBrickletMotionDetectorV2NotifyMotionDetected;
+    detectionCycleEndedCallback: TBrickletMotionDetectorV2NotifyDetectionCycleEnded;
+  protected
+    procedure CallbackWrapperMotionDetected(const packet: TByteArray); virtual;
+    procedure CallbackWrapperDetectionCycleEnded(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns 1 if a motion was detected. It returns 1 approx. for 1.8 seconds
+    ///  until the sensor checks for a new movement.
+    ///  
+    ///  There is also a blue LED on the Bricklet that is on as long as the Bricklet is
+    ///  in the "motion detected" state.
+    /// </summary>
+    function GetMotionDetected: byte; virtual;
+
+    /// <summary>
+    ///  Sets the sensitivity of the PIR sensor. At full
+    ///  sensitivity (100), the Bricklet can detect motion in a range of approximately 12m.
+    ///  
+    ///  The actual range depends on many things in the environment (e.g. reflections) and the
+    ///  size of the object to be detected. While a big person might be detected in a range
+    ///  of 10m a cat may only be detected at 2m distance with the same setting.
+    ///  
+    ///  So you will have to find a good sensitivity for your application by trial and error.
+    /// </summary>
+    procedure SetSensitivity(const sensitivity: byte); virtual;
+
+    /// <summary>
+    ///  Returns the sensitivity as set by <see cref="BrickletMotionDetectorV2.TBrickletMotionDetectorV2.SetSensitivity"/>.
+    /// </summary>
+    function GetSensitivity: byte; virtual;
+
+    /// <summary>
+    ///  Sets the blue backlight of the fresnel lens. The backlight consists of
+    ///  three LEDs. The brightness of each LED can be controlled with a 8-bit value
+    ///  (0-255). A value of 0 turns the LED off and a value of 255 turns the LED
+    ///  to full brightness.
+    /// </summary>
+    procedure SetIndicator(const topLeft: byte; const topRight: byte; const bottom: byte); virtual;
+
+    /// <summary>
+    ///  Returns the indicator configuration as set by <see cref="BrickletMotionDetectorV2.TBrickletMotionDetectorV2.SetIndicator"/>.
+    /// </summary>
+    procedure GetIndicator(out topLeft: byte; out topRight: byte; out bottom: byte); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletMotionDetectorV2.TBrickletMotionDetectorV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletMotionDetectorV2.TBrickletMotionDetectorV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletMotionDetectorV2.TBrickletMotionDetectorV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletMotionDetectorV2.TBrickletMotionDetectorV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is called after a motion was detected.
+    /// </summary>
+    property OnMotionDetected: TBrickletMotionDetectorV2NotifyMotionDetected read motionDetectedCallback write motionDetectedCallback;
+
+    /// <summary>
+    ///  This callback is called when the detection cycle ended. When this
+    ///  callback is called, a new motion can be detected again after approximately 2
+    ///  seconds.
+    /// </summary>
+    property OnDetectionCycleEnded: TBrickletMotionDetectorV2NotifyDetectionCycleEnded read detectionCycleEndedCallback write detectionCycleEndedCallback;
+  end;
+
+implementation
+
+constructor TBrickletMotionDetectorV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_MOTION_DETECTOR_V2_DEVICE_IDENTIFIER, BRICKLET_MOTION_DETECTOR_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_MOTION_DETECTED] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_SENSITIVITY] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_SENSITIVITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_INDICATOR] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_INDICATOR] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_MOTION_DETECTOR_V2_CALLBACK_MOTION_DETECTED] := {$ifdef FPC}@{$endif}CallbackWrapperMotionDetected;
+  callbackWrappers[BRICKLET_MOTION_DETECTOR_V2_CALLBACK_DETECTION_CYCLE_ENDED] := {$ifdef FPC}@{$endif}CallbackWrapperDetectionCycleEnded;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletMotionDetectorV2.GetMotionDetected: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_MOTION_DETECTED, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletMotionDetectorV2.SetSensitivity(const sensitivity: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_SENSITIVITY, 9);
+  LEConvertUInt8To(sensitivity, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletMotionDetectorV2.GetSensitivity: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_SENSITIVITY, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletMotionDetectorV2.SetIndicator(const topLeft: byte; const topRight: byte; const bottom: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_INDICATOR, 11);
+  LEConvertUInt8To(topLeft, 8, request);
+  LEConvertUInt8To(topRight, 9, request);
+  LEConvertUInt8To(bottom, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletMotionDetectorV2.GetIndicator(out topLeft: byte; out topRight: byte; out bottom: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_INDICATOR, 8);
+  response := SendRequest(request, 11);
+  topLeft := LEConvertUInt8From(8, response);
+  topRight := LEConvertUInt8From(9, response);
+  bottom := LEConvertUInt8From(10, response);
+end;
+
+procedure TBrickletMotionDetectorV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletMotionDetectorV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletMotionDetectorV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletMotionDetectorV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletMotionDetectorV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletMotionDetectorV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletMotionDetectorV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletMotionDetectorV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletMotionDetectorV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletMotionDetectorV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletMotionDetectorV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletMotionDetectorV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_MOTION_DETECTOR_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletMotionDetectorV2.CallbackWrapperMotionDetected(const packet: TByteArray);
+begin
+  if (Length(packet) <> 8) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  if (Assigned(motionDetectedCallback)) then begin
+    motionDetectedCallback(self);
+  end;
+end;
+
+procedure TBrickletMotionDetectorV2.CallbackWrapperDetectionCycleEnded(const packet: TByteArray);
+begin
+  if (Length(packet) <> 8) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  if (Assigned(detectionCycleEndedCallback)) then begin
+    detectionCycleEndedCallback(self);
+  end;
+end;
+
+end.
@@ -0,0 +1,1573 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletNFC;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_NFC_DEVICE_IDENTIFIER = 286;
+  BRICKLET_NFC_DEVICE_DISPLAY_NAME = 'NFC Bricklet';
+
+  BRICKLET_NFC_FUNCTION_SET_MODE = 1;
+  BRICKLET_NFC_FUNCTION_GET_MODE = 2;
+  BRICKLET_NFC_FUNCTION_READER_REQUEST_TAG_ID = 3;
+  BRICKLET_NFC_FUNCTION_READER_GET_TAG_ID_LOW_LEVEL = 4;
+  BRICKLET_NFC_FUNCTION_READER_GET_STATE = 5;
+  BRICKLET_NFC_FUNCTION_READER_WRITE_NDEF_LOW_LEVEL = 6;
+  BRICKLET_NFC_FUNCTION_READER_REQUEST_NDEF = 7;
+  BRICKLET_NFC_FUNCTION_READER_READ_NDEF_LOW_LEVEL = 8;
+  BRICKLET_NFC_FUNCTION_READER_AUTHENTICATE_MIFARE_CLASSIC_PAGE = 9;
+  BRICKLET_NFC_FUNCTION_READER_WRITE_PAGE_LOW_LEVEL = 10;
+  BRICKLET_NFC_FUNCTION_READER_REQUEST_PAGE = 11;
+  BRICKLET_NFC_FUNCTION_READER_READ_PAGE_LOW_LEVEL = 12;
+  BRICKLET_NFC_FUNCTION_CARDEMU_GET_STATE = 14;
+  BRICKLET_NFC_FUNCTION_CARDEMU_START_DISCOVERY = 15;
+  BRICKLET_NFC_FUNCTION_CARDEMU_WRITE_NDEF_LOW_LEVEL = 16;
+  BRICKLET_NFC_FUNCTION_CARDEMU_START_TRANSFER = 17;
+  BRICKLET_NFC_FUNCTION_P2P_GET_STATE = 19;
+  BRICKLET_NFC_FUNCTION_P2P_START_DISCOVERY = 20;
+  BRICKLET_NFC_FUNCTION_P2P_WRITE_NDEF_LOW_LEVEL = 21;
+  BRICKLET_NFC_FUNCTION_P2P_START_TRANSFER = 22;
+  BRICKLET_NFC_FUNCTION_P2P_READ_NDEF_LOW_LEVEL = 23;
+  BRICKLET_NFC_FUNCTION_SET_DETECTION_LED_CONFIG = 25;
+  BRICKLET_NFC_FUNCTION_GET_DETECTION_LED_CONFIG = 26;
+  BRICKLET_NFC_FUNCTION_SET_MAXIMUM_TIMEOUT = 27;
+  BRICKLET_NFC_FUNCTION_GET_MAXIMUM_TIMEOUT = 28;
+  BRICKLET_NFC_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_NFC_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_NFC_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_NFC_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_NFC_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_NFC_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_NFC_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_NFC_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_NFC_FUNCTION_RESET = 243;
+  BRICKLET_NFC_FUNCTION_WRITE_UID = 248;
+  BRICKLET_NFC_FUNCTION_READ_UID = 249;
+  BRICKLET_NFC_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_NFC_CALLBACK_READER_STATE_CHANGED = 13;
+  BRICKLET_NFC_CALLBACK_CARDEMU_STATE_CHANGED = 18;
+  BRICKLET_NFC_CALLBACK_P2P_STATE_CHANGED = 24;
+
+  BRICKLET_NFC_MODE_OFF = 0;
+  BRICKLET_NFC_MODE_CARDEMU = 1;
+  BRICKLET_NFC_MODE_P2P = 2;
+  BRICKLET_NFC_MODE_READER = 3;
+  BRICKLET_NFC_TAG_TYPE_MIFARE_CLASSIC = 0;
+  BRICKLET_NFC_TAG_TYPE_TYPE1 = 1;
+  BRICKLET_NFC_TAG_TYPE_TYPE2 = 2;
+  BRICKLET_NFC_TAG_TYPE_TYPE3 = 3;
+  BRICKLET_NFC_TAG_TYPE_TYPE4 = 4;
+  BRICKLET_NFC_READER_STATE_INITIALIZATION = 0;
+  BRICKLET_NFC_READER_STATE_IDLE = 128;
+  BRICKLET_NFC_READER_STATE_ERROR = 192;
+  BRICKLET_NFC_READER_STATE_REQUEST_TAG_ID = 2;
+  BRICKLET_NFC_READER_STATE_REQUEST_TAG_ID_READY = 130;
+  BRICKLET_NFC_READER_STATE_REQUEST_TAG_ID_ERROR = 194;
+  BRICKLET_NFC_READER_STATE_AUTHENTICATE_MIFARE_CLASSIC_PAGE = 3;
+  BRICKLET_NFC_READER_STATE_AUTHENTICATE_MIFARE_CLASSIC_PAGE_READY = 131;
+  BRICKLET_NFC_READER_STATE_AUTHENTICATE_MIFARE_CLASSIC_PAGE_ERROR = 195;
+  BRICKLET_NFC_READER_STATE_WRITE_PAGE = 4;
+  BRICKLET_NFC_READER_STATE_WRITE_PAGE_READY = 132;
+  BRICKLET_NFC_READER_STATE_WRITE_PAGE_ERROR = 196;
+  BRICKLET_NFC_READER_STATE_REQUEST_PAGE = 5;
+  BRICKLET_NFC_READER_STATE_REQUEST_PAGE_READY = 133;
+  BRICKLET_NFC_READER_STATE_REQUEST_PAGE_ERROR = 197;
+  BRICKLET_NFC_READER_STATE_WRITE_NDEF = 6;
+  BRICKLET_NFC_READER_STATE_WRITE_NDEF_READY = 134;
+  BRICKLET_NFC_READER_STATE_WRITE_NDEF_ERROR = 198;
+  BRICKLET_NFC_READER_STATE_REQUEST_NDEF = 7;
+  BRICKLET_NFC_READER_STATE_REQUEST_NDEF_READY = 135;
+  BRICKLET_NFC_READER_STATE_REQUEST_NDEF_ERROR = 199;
+  BRICKLET_NFC_KEY_A = 0;
+  BRICKLET_NFC_KEY_B = 1;
+  BRICKLET_NFC_READER_WRITE_TYPE4_CAPABILITY_CONTAINER = 3;
+  BRICKLET_NFC_READER_WRITE_TYPE4_NDEF = 4;
+  BRICKLET_NFC_READER_REQUEST_TYPE4_CAPABILITY_CONTAINER = 3;
+  BRICKLET_NFC_READER_REQUEST_TYPE4_NDEF = 4;
+  BRICKLET_NFC_CARDEMU_STATE_INITIALIZATION = 0;
+  BRICKLET_NFC_CARDEMU_STATE_IDLE = 128;
+  BRICKLET_NFC_CARDEMU_STATE_ERROR = 192;
+  BRICKLET_NFC_CARDEMU_STATE_DISCOVER = 2;
+  BRICKLET_NFC_CARDEMU_STATE_DISCOVER_READY = 130;
+  BRICKLET_NFC_CARDEMU_STATE_DISCOVER_ERROR = 194;
+  BRICKLET_NFC_CARDEMU_STATE_TRANSFER_NDEF = 3;
+  BRICKLET_NFC_CARDEMU_STATE_TRANSFER_NDEF_READY = 131;
+  BRICKLET_NFC_CARDEMU_STATE_TRANSFER_NDEF_ERROR = 195;
+  BRICKLET_NFC_CARDEMU_TRANSFER_ABORT = 0;
+  BRICKLET_NFC_CARDEMU_TRANSFER_WRITE = 1;
+  BRICKLET_NFC_P2P_STATE_INITIALIZATION = 0;
+  BRICKLET_NFC_P2P_STATE_IDLE = 128;
+  BRICKLET_NFC_P2P_STATE_ERROR = 192;
+  BRICKLET_NFC_P2P_STATE_DISCOVER = 2;
+  BRICKLET_NFC_P2P_STATE_DISCOVER_READY = 130;
+  BRICKLET_NFC_P2P_STATE_DISCOVER_ERROR = 194;
+  BRICKLET_NFC_P2P_STATE_TRANSFER_NDEF = 3;
+  BRICKLET_NFC_P2P_STATE_TRANSFER_NDEF_READY = 131;
+  BRICKLET_NFC_P2P_STATE_TRANSFER_NDEF_ERROR = 195;
+  BRICKLET_NFC_P2P_TRANSFER_ABORT = 0;
+  BRICKLET_NFC_P2P_TRANSFER_WRITE = 1;
+  BRICKLET_NFC_P2P_TRANSFER_READ = 2;
+  BRICKLET_NFC_DETECTION_LED_CONFIG_OFF = 0;
+  BRICKLET_NFC_DETECTION_LED_CONFIG_ON = 1;
+  BRICKLET_NFC_DETECTION_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_NFC_DETECTION_LED_CONFIG_SHOW_DETECTION = 3;
+  BRICKLET_NFC_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_NFC_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_NFC_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_NFC_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_NFC_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_NFC_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_NFC_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_NFC_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_NFC_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_NFC_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_NFC_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_NFC_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_NFC_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_NFC_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_NFC_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To31OfUInt8 = array [0..31] of byte;
+  TArray0To57OfUInt8 = array [0..57] of byte;
+  TArray0To59OfUInt8 = array [0..59] of byte;
+  TArray0To5OfUInt8 = array [0..5] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+  TArrayOfUInt8 = array of byte;
+
+  TBrickletNFC = class;
+  TBrickletNFCNotifyReaderStateChanged = procedure(sender: TBrickletNFC; const state: byte; const idle: boolean) of object;
+  TBrickletNFCNotifyCardemuStateChanged = procedure(sender: TBrickletNFC; const state: byte; const idle: boolean) of object;
+  TBrickletNFCNotifyP2PStateChanged = procedure(sender: TBrickletNFC; const state: byte; const idle: boolean) of object;
+
+  /// <summary>
+  ///  NFC tag read/write, NFC P2P and Card Emulation
+  /// </summary>
+  TBrickletNFC = class(TDevice)
+  private
+    streamMutex: TCriticalSection;
+    readerStateChangedCallback: TBrickletNFCNotifyReaderStateChanged;
+    cardemuStateChangedCallback: TBrickletNFCNotifyCardemuStateChanged;
+    p2pStateChangedCallback: TBrickletNFCNotifyP2PStateChanged;
+  protected
+    procedure CallbackWrapperReaderStateChanged(const packet: TByteArray); virtual;
+    procedure CallbackWrapperCardemuStateChanged(const packet: TByteArray); virtual;
+    procedure CallbackWrapperP2PStateChanged(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Sets the mode. The NFC Bricklet supports four modes:
+    ///  
+    ///  * Off
+    ///  * Card Emulation (Cardemu): Emulates a tag for other readers
+    ///  * Peer to Peer (P2P): Exchange data with other readers
+    ///  * Reader: Reads and writes tags
+    ///  
+    ///  If you change a mode, the Bricklet will reconfigure the hardware for this mode.
+    ///  Therefore, you can only use functions corresponding to the current mode. For
+    ///  example, in Reader mode you can only use Reader functions.
+    /// </summary>
+    procedure SetMode(const mode: byte); virtual;
+
+    /// <summary>
+    ///  Returns the mode as set by <see cref="BrickletNFC.TBrickletNFC.SetMode"/>.
+    /// </summary>
+    function GetMode: byte; virtual;
+
+    /// <summary>
+    ///  After you call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/> the NFC Bricklet will try to read
+    ///  the tag ID from the tag. After this process is done the state will change.
+    ///  You can either register the <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback or you can poll
+    ///  <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/> to find out about the state change.
+    ///  
+    ///  If the state changes to *ReaderRequestTagIDError* it means that either there was
+    ///  no tag present or that the tag has an incompatible type. If the state
+    ///  changes to *ReaderRequestTagIDReady* it means that a compatible tag was found
+    ///  and that the tag ID has been saved. You can now read out the tag ID by
+    ///  calling <see cref="BrickletNFC.TBrickletNFC.ReaderGetTagID"/>.
+    ///  
+    ///  If two tags are in the proximity of the NFC Bricklet, this
+    ///  function will cycle through the tags. To select a specific tag you have
+    ///  to call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/> until the correct tag ID is found.
+    ///  
+    ///  In case of any *ReaderError* state the selection is lost and you have to
+    ///  start again by calling <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>.
+    /// </summary>
+    procedure ReaderRequestTagID; virtual;
+
+    /// <summary>
+    ///  Returns the tag type and the tag ID. This function can only be called if the
+    ///  NFC Bricklet is currently in one of the *ReaderReady* states. The returned tag ID
+    ///  is the tag ID that was saved through the last call of <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>.
+    ///  
+    ///  To get the tag ID of a tag the approach is as follows:
+    ///  
+    ///  1. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>
+    ///  2. Wait for state to change to *ReaderRequestTagIDReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/> or
+    ///     <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  3. Call <see cref="BrickletNFC.TBrickletNFC.ReaderGetTagID"/>
+    /// </summary>
+    procedure ReaderGetTagIDLowLevel(out tagType: byte; out tagIDLength: byte; out tagIDData: TArray0To31OfUInt8); virtual;
+
+    /// <summary>
+    ///  Returns the tag type and the tag ID. This function can only be called if the
+    ///  NFC Bricklet is currently in one of the *ReaderReady* states. The returned tag ID
+    ///  is the tag ID that was saved through the last call of <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>.
+    ///  
+    ///  To get the tag ID of a tag the approach is as follows:
+    ///  
+    ///  1. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>
+    ///  2. Wait for state to change to *ReaderRequestTagIDReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/> or
+    ///     <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  3. Call <see cref="BrickletNFC.TBrickletNFC.ReaderGetTagID"/>
+    /// </summary>
+    procedure ReaderGetTagID(out tagType: byte; out tagID: TArrayOfUInt8); virtual;
+
+    /// <summary>
+    ///  Returns the current reader state of the NFC Bricklet.
+    ///  
+    ///  On startup the Bricklet will be in the *ReaderInitialization* state. The
+    ///  initialization will only take about 20ms. After that it changes to *ReaderIdle*.
+    ///  
+    ///  The Bricklet is also reinitialized if the mode is changed, see <see cref="BrickletNFC.TBrickletNFC.SetMode"/>.
+    ///  
+    ///  The functions of this Bricklet can be called in the *ReaderIdle* state and all of
+    ///  the *ReaderReady* and *ReaderError* states.
+    ///  
+    ///  Example: If you call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestPage"/>, the state will change to
+    ///  *ReaderRequestPage* until the reading of the page is finished. Then it will change
+    ///  to either *ReaderRequestPageReady* if it worked or to *ReaderRequestPageError* if it
+    ///  didn't. If the request worked you can get the page by calling <see cref="BrickletNFC.TBrickletNFC.ReaderReadPage"/>.
+    ///  
+    ///  The same approach is used analogously for the other API functions.
+    /// </summary>
+    procedure ReaderGetState(out state: byte; out idle: boolean); virtual;
+
+    /// <summary>
+    ///  Writes NDEF formated data.
+    ///  
+    ///  This function currently supports NFC Forum Type 2 and 4.
+    ///  
+    ///  The general approach for writing a NDEF message is as follows:
+    ///  
+    ///  1. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>
+    ///  2. Wait for state to change to *ReaderRequestTagIDReady* (see
+    ///     <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/> or <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  3. If looking for a specific tag then call <see cref="BrickletNFC.TBrickletNFC.ReaderGetTagID"/> and check
+    ///     if the expected tag was found, if it was not found got back to step 1
+    ///  4. Call <see cref="BrickletNFC.TBrickletNFC.ReaderWriteNDEF"/> with the NDEF message that you want to write
+    ///  5. Wait for state to change to *ReaderWriteNDEFReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/>
+    ///     or <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    /// </summary>
+    procedure ReaderWriteNDEFLowLevel(const ndefLength: word; const ndefChunkOffset: word; const ndefChunkData: TArray0To59OfUInt8); virtual;
+
+    /// <summary>
+    ///  Writes NDEF formated data.
+    ///  
+    ///  This function currently supports NFC Forum Type 2 and 4.
+    ///  
+    ///  The general approach for writing a NDEF message is as follows:
+    ///  
+    ///  1. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>
+    ///  2. Wait for state to change to *ReaderRequestTagIDReady* (see
+    ///     <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/> or <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  3. If looking for a specific tag then call <see cref="BrickletNFC.TBrickletNFC.ReaderGetTagID"/> and check
+    ///     if the expected tag was found, if it was not found got back to step 1
+    ///  4. Call <see cref="BrickletNFC.TBrickletNFC.ReaderWriteNDEF"/> with the NDEF message that you want to write
+    ///  5. Wait for state to change to *ReaderWriteNDEFReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/>
+    ///     or <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    /// </summary>
+    procedure ReaderWriteNDEF(const ndef: array of byte); virtual;
+
+    /// <summary>
+    ///  Reads NDEF formated data from a tag.
+    ///  
+    ///  This function currently supports NFC Forum Type 1, 2, 3 and 4.
+    ///  
+    ///  The general approach for reading a NDEF message is as follows:
+    ///  
+    ///  1. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>
+    ///  2. Wait for state to change to *RequestTagIDReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/>
+    ///     or <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  3. If looking for a specific tag then call <see cref="BrickletNFC.TBrickletNFC.ReaderGetTagID"/> and check if the
+    ///     expected tag was found, if it was not found got back to step 1
+    ///  4. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestNDEF"/>
+    ///  5. Wait for state to change to *ReaderRequestNDEFReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/>
+    ///     or <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  6. Call <see cref="BrickletNFC.TBrickletNFC.ReaderReadNDEF"/> to retrieve the NDEF message from the buffer
+    /// </summary>
+    procedure ReaderRequestNDEF; virtual;
+
+    /// <summary>
+    ///  Returns the NDEF data from an internal buffer. To fill the buffer
+    ///  with a NDEF message you have to call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestNDEF"/> beforehand.
+    /// </summary>
+    procedure ReaderReadNDEFLowLevel(out ndefLength: word; out ndefChunkOffset: word; out ndefChunkData: TArray0To59OfUInt8); virtual;
+
+    /// <summary>
+    ///  Returns the NDEF data from an internal buffer. To fill the buffer
+    ///  with a NDEF message you have to call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestNDEF"/> beforehand.
+    /// </summary>
+    function ReaderReadNDEF: TArrayOfUInt8; virtual;
+
+    /// <summary>
+    ///  Mifare Classic tags use authentication. If you want to read from or write to
+    ///  a Mifare Classic page you have to authenticate it beforehand.
+    ///  Each page can be authenticated with two keys: A (``key_number`` = 0) and B
+    ///  (``key_number`` = 1). A new Mifare Classic
+    ///  tag that has not yet been written to can be accessed with key A
+    ///  and the default key ``[0xFF, 0xFF, 0xFF, 0xFF, 0xFF, 0xFF]``.
+    ///  
+    ///  The approach to read or write a Mifare Classic page is as follows:
+    ///  
+    ///  1. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>
+    ///  2. Wait for state to change to *ReaderRequestTagIDReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/>
+    ///     or <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  3. If looking for a specific tag then call <see cref="BrickletNFC.TBrickletNFC.ReaderGetTagID"/> and check if the
+    ///     expected tag was found, if it was not found got back to step 1
+    ///  4. Call <see cref="BrickletNFC.TBrickletNFC.ReaderAuthenticateMifareClassicPage"/> with page and key for the page
+    ///  5. Wait for state to change to *ReaderAuthenticatingMifareClassicPageReady* (see
+    ///     <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/> or <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  6. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestPage"/> or <see cref="BrickletNFC.TBrickletNFC.ReaderWritePage"/> to read/write page
+    ///  
+    ///  The authentication will always work for one whole sector (4 pages).
+    /// </summary>
+    procedure ReaderAuthenticateMifareClassicPage(const page: word; const keyNumber: byte; const key: array of byte); virtual;
+
+    /// <summary>
+    ///  Writes a maximum of 8192 bytes starting from the given page. How many pages are written
+    ///  depends on the tag type. The page sizes are as follows:
+    ///  
+    ///  * Mifare Classic page size: 16 byte
+    ///  * NFC Forum Type 1 page size: 8 byte
+    ///  * NFC Forum Type 2 page size: 4 byte
+    ///  * NFC Forum Type 3 page size: 16 byte
+    ///  * NFC Forum Type 4: No pages, page = file selection (CC or NDEF, see below)
+    ///  
+    ///  The general approach for writing to a tag is as follows:
+    ///  
+    ///  1. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>
+    ///  2. Wait for state to change to *ReaderRequestTagIDReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/> or
+    ///     <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  3. If looking for a specific tag then call <see cref="BrickletNFC.TBrickletNFC.ReaderGetTagID"/> and check if the
+    ///     expected tag was found, if it was not found got back to step 1
+    ///  4. Call <see cref="BrickletNFC.TBrickletNFC.ReaderWritePage"/> with page number and data
+    ///  5. Wait for state to change to *ReaderWritePageReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/> or
+    ///     <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  
+    ///  If you use a Mifare Classic tag you have to authenticate a page before you
+    ///  can write to it. See <see cref="BrickletNFC.TBrickletNFC.ReaderAuthenticateMifareClassicPage"/>.
+    ///  
+    ///  NFC Forum Type 4 tags are not organized into pages but different files. We currently
+    ///  support two files: Capability Container file (CC) and NDEF file.
+    ///  
+    ///  Choose CC by setting page to 3 or NDEF by setting page to 4.
+    /// </summary>
+    procedure ReaderWritePageLowLevel(const page: word; const dataLength: word; const dataChunkOffset: word; const dataChunkData: TArray0To57OfUInt8); virtual;
+
+    /// <summary>
+    ///  Writes a maximum of 8192 bytes starting from the given page. How many pages are written
+    ///  depends on the tag type. The page sizes are as follows:
+    ///  
+    ///  * Mifare Classic page size: 16 byte
+    ///  * NFC Forum Type 1 page size: 8 byte
+    ///  * NFC Forum Type 2 page size: 4 byte
+    ///  * NFC Forum Type 3 page size: 16 byte
+    ///  * NFC Forum Type 4: No pages, page = file selection (CC or NDEF, see below)
+    ///  
+    ///  The general approach for writing to a tag is as follows:
+    ///  
+    ///  1. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>
+    ///  2. Wait for state to change to *ReaderRequestTagIDReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/> or
+    ///     <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  3. If looking for a specific tag then call <see cref="BrickletNFC.TBrickletNFC.ReaderGetTagID"/> and check if the
+    ///     expected tag was found, if it was not found got back to step 1
+    ///  4. Call <see cref="BrickletNFC.TBrickletNFC.ReaderWritePage"/> with page number and data
+    ///  5. Wait for state to change to *ReaderWritePageReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/> or
+    ///     <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  
+    ///  If you use a Mifare Classic tag you have to authenticate a page before you
+    ///  can write to it. See <see cref="BrickletNFC.TBrickletNFC.ReaderAuthenticateMifareClassicPage"/>.
+    ///  
+    ///  NFC Forum Type 4 tags are not organized into pages but different files. We currently
+    ///  support two files: Capability Container file (CC) and NDEF file.
+    ///  
+    ///  Choose CC by setting page to 3 or NDEF by setting page to 4.
+    /// </summary>
+    procedure ReaderWritePage(const page: word; const data: array of byte); virtual;
+
+    /// <summary>
+    ///  Reads a maximum of 8192 bytes starting from the given page and stores them into a buffer.
+    ///  The buffer can then be read out with <see cref="BrickletNFC.TBrickletNFC.ReaderReadPage"/>.
+    ///  How many pages are read depends on the tag type. The page sizes are
+    ///  as follows:
+    ///  
+    ///  * Mifare Classic page size: 16 byte
+    ///  * NFC Forum Type 1 page size: 8 byte
+    ///  * NFC Forum Type 2 page size: 4 byte
+    ///  * NFC Forum Type 3 page size: 16 byte
+    ///  * NFC Forum Type 4: No pages, page = file selection (CC or NDEF, see below)
+    ///  
+    ///  The general approach for reading a tag is as follows:
+    ///  
+    ///  1. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/>
+    ///  2. Wait for state to change to *RequestTagIDReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/>
+    ///     or <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  3. If looking for a specific tag then call <see cref="BrickletNFC.TBrickletNFC.ReaderGetTagID"/> and check if the
+    ///     expected tag was found, if it was not found got back to step 1
+    ///  4. Call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestPage"/> with page number
+    ///  5. Wait for state to change to *ReaderRequestPageReady* (see <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/>
+    ///     or <see cref="BrickletNFC.TBrickletNFC.OnReaderStateChanged"/> callback)
+    ///  6. Call <see cref="BrickletNFC.TBrickletNFC.ReaderReadPage"/> to retrieve the page from the buffer
+    ///  
+    ///  If you use a Mifare Classic tag you have to authenticate a page before you
+    ///  can read it. See <see cref="BrickletNFC.TBrickletNFC.ReaderAuthenticateMifareClassicPage"/>.
+    ///  
+    ///  NFC Forum Type 4 tags are not organized into pages but different files. We currently
+    ///  support two files: Capability Container file (CC) and NDEF file.
+    ///  
+    ///  Choose CC by setting page to 3 or NDEF by setting page to 4.
+    /// </summary>
+    procedure ReaderRequestPage(const page: word; const length_: word); virtual;
+
+    /// <summary>
+    ///  Returns the page data from an internal buffer. To fill the buffer
+    ///  with specific pages you have to call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestPage"/> beforehand.
+    /// </summary>
+    procedure ReaderReadPageLowLevel(out dataLength: word; out dataChunkOffset: word; out dataChunkData: TArray0To59OfUInt8); virtual;
+
+    /// <summary>
+    ///  Returns the page data from an internal buffer. To fill the buffer
+    ///  with specific pages you have to call <see cref="BrickletNFC.TBrickletNFC.ReaderRequestPage"/> beforehand.
+    /// </summary>
+    function ReaderReadPage: TArrayOfUInt8; virtual;
+
+    /// <summary>
+    ///  Returns the current cardemu state of the NFC Bricklet.
+    ///  
+    ///  On startup the Bricklet will be in the *CardemuInitialization* state. The
+    ///  initialization will only take about 20ms. After that it changes to *CardemuIdle*.
+    ///  
+    ///  The Bricklet is also reinitialized if the mode is changed, see <see cref="BrickletNFC.TBrickletNFC.SetMode"/>.
+    ///  
+    ///  The functions of this Bricklet can be called in the *CardemuIdle* state and all of
+    ///  the *CardemuReady* and *CardemuError* states.
+    ///  
+    ///  Example: If you call <see cref="BrickletNFC.TBrickletNFC.CardemuStartDiscovery"/>, the state will change to
+    ///  *CardemuDiscover* until the discovery is finished. Then it will change
+    ///  to either *CardemuDiscoverReady* if it worked or to *CardemuDiscoverError* if it
+    ///  didn't.
+    ///  
+    ///  The same approach is used analogously for the other API functions.
+    /// </summary>
+    procedure CardemuGetState(out state: byte; out idle: boolean); virtual;
+
+    /// <summary>
+    ///  Starts the discovery process. If you call this function while a NFC
+    ///  reader device is near to the NFC Bricklet the state will change from
+    ///  *CardemuDiscovery* to *CardemuDiscoveryReady*.
+    ///  
+    ///  If no NFC reader device can be found or if there is an error during
+    ///  discovery the cardemu state will change to *CardemuDiscoveryError*. In this case you
+    ///  have to restart the discovery process.
+    ///  
+    ///  If the cardemu state changes to *CardemuDiscoveryReady* you can start the NDEF message
+    ///  transfer with <see cref="BrickletNFC.TBrickletNFC.CardemuWriteNDEF"/> and <see cref="BrickletNFC.TBrickletNFC.CardemuStartTransfer"/>.
+    /// </summary>
+    procedure CardemuStartDiscovery; virtual;
+
+    /// <summary>
+    ///  Writes the NDEF message that is to be transferred to the NFC peer.
+    ///  
+    ///  The maximum supported NDEF message size in Cardemu mode is 255 byte.
+    ///  
+    ///  You can call this function at any time in Cardemu mode. The internal buffer
+    ///  will not be overwritten until you call this function again or change the
+    ///  mode.
+    /// </summary>
+    procedure CardemuWriteNDEFLowLevel(const ndefLength: word; const ndefChunkOffset: word; const ndefChunkData: TArray0To59OfUInt8); virtual;
+
+    /// <summary>
+    ///  Writes the NDEF message that is to be transferred to the NFC peer.
+    ///  
+    ///  The maximum supported NDEF message size in Cardemu mode is 255 byte.
+    ///  
+    ///  You can call this function at any time in Cardemu mode. The internal buffer
+    ///  will not be overwritten until you call this function again or change the
+    ///  mode.
+    /// </summary>
+    procedure CardemuWriteNDEF(const ndef: array of byte); virtual;
+
+    /// <summary>
+    ///  You can start the transfer of a NDEF message if the cardemu state is *CardemuDiscoveryReady*.
+    ///  
+    ///  Before you call this function to start a write transfer, the NDEF message that
+    ///  is to be transferred has to be written via <see cref="BrickletNFC.TBrickletNFC.CardemuWriteNDEF"/> first.
+    ///  
+    ///  After you call this function the state will change to *CardemuTransferNDEF*. It will
+    ///  change to *CardemuTransferNDEFReady* if the transfer was successful or
+    ///  *CardemuTransferNDEFError* if it wasn't.
+    /// </summary>
+    procedure CardemuStartTransfer(const transfer: byte); virtual;
+
+    /// <summary>
+    ///  Returns the current P2P state of the NFC Bricklet.
+    ///  
+    ///  On startup the Bricklet will be in the *P2PInitialization* state. The
+    ///  initialization will only take about 20ms. After that it changes to *P2PIdle*.
+    ///  
+    ///  The Bricklet is also reinitialized if the mode is changed, see <see cref="BrickletNFC.TBrickletNFC.SetMode"/>.
+    ///  
+    ///  The functions of this Bricklet can be called in the *P2PIdle* state and all of
+    ///  the *P2PReady* and *P2PError* states.
+    ///  
+    ///  Example: If you call <see cref="BrickletNFC.TBrickletNFC.P2PStartDiscovery"/>, the state will change to
+    ///  *P2PDiscover* until the discovery is finished. Then it will change
+    ///  to either P2PDiscoverReady* if it worked or to *P2PDiscoverError* if it
+    ///  didn't.
+    ///  
+    ///  The same approach is used analogously for the other API functions.
+    /// </summary>
+    procedure P2PGetState(out state: byte; out idle: boolean); virtual;
+
+    /// <summary>
+    ///  Starts the discovery process. If you call this function while another NFC
+    ///  P2P enabled device is near to the NFC Bricklet the state will change from
+    ///  *P2PDiscovery* to *P2PDiscoveryReady*.
+    ///  
+    ///  If no NFC P2P enabled device can be found or if there is an error during
+    ///  discovery the P2P state will change to *P2PDiscoveryError*. In this case you
+    ///  have to restart the discovery process.
+    ///  
+    ///  If the P2P state changes to *P2PDiscoveryReady* you can start the NDEF message
+    ///  transfer with <see cref="BrickletNFC.TBrickletNFC.P2PStartTransfer"/>.
+    /// </summary>
+    procedure P2PStartDiscovery; virtual;
+
+    /// <summary>
+    ///  Writes the NDEF message that is to be transferred to the NFC peer.
+    ///  
+    ///  The maximum supported NDEF message size for P2P transfer is 255 byte.
+    ///  
+    ///  You can call this function at any time in P2P mode. The internal buffer
+    ///  will not be overwritten until you call this function again, change the
+    ///  mode or use P2P to read an NDEF messages.
+    /// </summary>
+    procedure P2PWriteNDEFLowLevel(const ndefLength: word; const ndefChunkOffset: word; const ndefChunkData: TArray0To59OfUInt8); virtual;
+
+    /// <summary>
+    ///  Writes the NDEF message that is to be transferred to the NFC peer.
+    ///  
+    ///  The maximum supported NDEF message size for P2P transfer is 255 byte.
+    ///  
+    ///  You can call this function at any time in P2P mode. The internal buffer
+    ///  will not be overwritten until you call this function again, change the
+    ///  mode or use P2P to read an NDEF messages.
+    /// </summary>
+    procedure P2PWriteNDEF(const ndef: array of byte); virtual;
+
+    /// <summary>
+    ///  You can start the transfer of a NDEF message if the P2P state is *P2PDiscoveryReady*.
+    ///  
+    ///  Before you call this function to start a write transfer, the NDEF message that
+    ///  is to be transferred has to be written via <see cref="BrickletNFC.TBrickletNFC.P2PWriteNDEF"/> first.
+    ///  
+    ///  After you call this function the P2P state will change to *P2PTransferNDEF*. It will
+    ///  change to *P2PTransferNDEFReady* if the transfer was successfull or
+    ///  *P2PTransferNDEFError* if it wasn't.
+    ///  
+    ///  If you started a write transfer you are now done. If you started a read transfer
+    ///  you can now use <see cref="BrickletNFC.TBrickletNFC.P2PReadNDEF"/> to read the NDEF message that was written
+    ///  by the NFC peer.
+    /// </summary>
+    procedure P2PStartTransfer(const transfer: byte); virtual;
+
+    /// <summary>
+    ///  Returns the NDEF message that was written by a NFC peer in NFC P2P mode.
+    ///  
+    ///  The NDEF message is ready if you called <see cref="BrickletNFC.TBrickletNFC.P2PStartTransfer"/> with a
+    ///  read transfer and the P2P state changed to *P2PTransferNDEFReady*.
+    /// </summary>
+    procedure P2PReadNDEFLowLevel(out ndefLength: word; out ndefChunkOffset: word; out ndefChunkData: TArray0To59OfUInt8); virtual;
+
+    /// <summary>
+    ///  Returns the NDEF message that was written by a NFC peer in NFC P2P mode.
+    ///  
+    ///  The NDEF message is ready if you called <see cref="BrickletNFC.TBrickletNFC.P2PStartTransfer"/> with a
+    ///  read transfer and the P2P state changed to *P2PTransferNDEFReady*.
+    /// </summary>
+    function P2PReadNDEF: TArrayOfUInt8; virtual;
+
+    /// <summary>
+    ///  Sets the detection LED configuration. By default the LED shows
+    ///  if a card/reader is detected.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is off.
+    /// </summary>
+    procedure SetDetectionLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletNFC.TBrickletNFC.SetDetectionLEDConfig"/>
+    /// </summary>
+    function GetDetectionLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Sets the maximum timeout.
+    ///  
+    ///  This is a global maximum used for all internal state timeouts. The timeouts depend heavily
+    ///  on the used tags etc. For example: If you use a Type 2 tag and you want to detect if
+    ///  it is present, you have to use <see cref="BrickletNFC.TBrickletNFC.ReaderRequestTagID"/> and wait for the state
+    ///  to change to either the error state or the ready state.
+    ///  
+    ///  With the default configuration this takes 2-3 seconds. By setting the maximum timeout to
+    ///  100ms you can reduce this time to ~150-200ms. For Type 2 this would also still work
+    ///  with a 20ms timeout (a Type 2 tag answers usually within 10ms). A type 4 tag can take
+    ///  up to 500ms in our tests.
+    ///  
+    ///  If you need a fast response time to discover if a tag is present or not you can find
+    ///  a good timeout value by trial and error for your specific tag.
+    ///  
+    ///  By default we use a very conservative timeout, to be sure that any tag can always
+    ///  answer in time.
+    ///  
+    ///  .. versionadded:: 2.0.1$nbsp;(Plugin)
+    /// </summary>
+    procedure SetMaximumTimeout(const timeout: word); virtual;
+
+    /// <summary>
+    ///  Returns the timeout as set by <see cref="BrickletNFC.TBrickletNFC.SetMaximumTimeout"/>
+    ///  
+    ///  .. versionadded:: 2.0.1$nbsp;(Plugin)
+    /// </summary>
+    function GetMaximumTimeout: word; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletNFC.TBrickletNFC.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletNFC.TBrickletNFC.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletNFC.TBrickletNFC.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletNFC.TBrickletNFC.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is called if the reader state of the NFC Bricklet changes.
+    ///  See <see cref="BrickletNFC.TBrickletNFC.ReaderGetState"/> for more information about the possible states.
+    /// </summary>
+    property OnReaderStateChanged: TBrickletNFCNotifyReaderStateChanged read readerStateChangedCallback write readerStateChangedCallback;
+
+    /// <summary>
+    ///  This callback is called if the cardemu state of the NFC Bricklet changes.
+    ///  See <see cref="BrickletNFC.TBrickletNFC.CardemuGetState"/> for more information about the possible states.
+    /// </summary>
+    property OnCardemuStateChanged: TBrickletNFCNotifyCardemuStateChanged read cardemuStateChangedCallback write cardemuStateChangedCallback;
+
+    /// <summary>
+    ///  This callback is called if the P2P state of the NFC Bricklet changes.
+    ///  See <see cref="BrickletNFC.TBrickletNFC.P2PGetState"/> for more information about the possible states.
+    /// </summary>
+    property OnP2PStateChanged: TBrickletNFCNotifyP2PStateChanged read p2pStateChangedCallback write p2pStateChangedCallback;
+  end;
+
+implementation
+
+constructor TBrickletNFC.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_NFC_DEVICE_IDENTIFIER, BRICKLET_NFC_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 1;
+
+  responseExpected[BRICKLET_NFC_FUNCTION_SET_MODE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_GET_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_READER_REQUEST_TAG_ID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_READER_GET_TAG_ID_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_READER_GET_STATE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_READER_WRITE_NDEF_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_READER_REQUEST_NDEF] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_READER_READ_NDEF_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_READER_AUTHENTICATE_MIFARE_CLASSIC_PAGE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_READER_WRITE_PAGE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_READER_REQUEST_PAGE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_READER_READ_PAGE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_CARDEMU_GET_STATE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_CARDEMU_START_DISCOVERY] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_CARDEMU_WRITE_NDEF_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_CARDEMU_START_TRANSFER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_P2P_GET_STATE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_P2P_START_DISCOVERY] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_P2P_WRITE_NDEF_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_P2P_START_TRANSFER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_P2P_READ_NDEF_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_SET_DETECTION_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_GET_DETECTION_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_SET_MAXIMUM_TIMEOUT] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_GET_MAXIMUM_TIMEOUT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_NFC_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_NFC_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  streamMutex := TCriticalSection.Create;
+
+  callbackWrappers[BRICKLET_NFC_CALLBACK_READER_STATE_CHANGED] := {$ifdef FPC}@{$endif}CallbackWrapperReaderStateChanged;
+  callbackWrappers[BRICKLET_NFC_CALLBACK_CARDEMU_STATE_CHANGED] := {$ifdef FPC}@{$endif}CallbackWrapperCardemuStateChanged;
+  callbackWrappers[BRICKLET_NFC_CALLBACK_P2P_STATE_CHANGED] := {$ifdef FPC}@{$endif}CallbackWrapperP2PStateChanged;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletNFC.SetMode(const mode: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_SET_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletNFC.GetMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_GET_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletNFC.ReaderRequestTagID;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_READER_REQUEST_TAG_ID, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.ReaderGetTagIDLowLevel(out tagType: byte; out tagIDLength: byte; out tagIDData: TArray0To31OfUInt8);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_READER_GET_TAG_ID_LOW_LEVEL, 8);
+  response := SendRequest(request, 42);
+  tagType := LEConvertUInt8From(8, response);
+  tagIDLength := LEConvertUInt8From(9, response);
+  for i := 0 to 31 do tagIDData[i] := LEConvertUInt8From(10 + (i * 1), response);
+end;
+
+procedure TBrickletNFC.ReaderGetTagID(out tagType: byte; out tagID: TArrayOfUInt8);
+var
+  tagIDLength: byte;
+  tagIDData: TArray0To31OfUInt8;
+begin
+  ReaderGetTagIDLowLevel(tagType, tagIDLength, tagIDData);
+  SetLength(tagID, tagIDLength);
+  Move(tagIDData, tagID[0], SizeOf(byte) * tagIDLength);
+end;
+
+procedure TBrickletNFC.ReaderGetState(out state: byte; out idle: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_READER_GET_STATE, 8);
+  response := SendRequest(request, 10);
+  state := LEConvertUInt8From(8, response);
+  idle := LEConvertBooleanFrom(9, response);
+end;
+
+procedure TBrickletNFC.ReaderWriteNDEFLowLevel(const ndefLength: word; const ndefChunkOffset: word; const ndefChunkData: TArray0To59OfUInt8);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_READER_WRITE_NDEF_LOW_LEVEL, 72);
+  LEConvertUInt16To(ndefLength, 8, request);
+  LEConvertUInt16To(ndefChunkOffset, 10, request);
+  for i := 0 to Length(ndefChunkData) - 1 do LEConvertUInt8To(ndefChunkData[i], 12 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.ReaderWriteNDEF(const ndef: array of byte);
+var
+  ndefChunkOffset: word;
+  ndefChunkData: TArray0To59OfUInt8;
+  ndefChunkLength: word;
+  ndefLength: word;
+begin
+  if (Length(ndef) > 65535) then begin
+    raise EInvalidParameterException.Create('NDEF can be at most 65535 items long');
+  end;
+
+  ndefLength := Length(ndef);
+  ndefChunkOffset := 0;
+
+  if (ndefLength = 0) then begin
+    FillChar(ndefChunkData[0], SizeOf(byte) * 60, 0);
+    ReaderWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (ndefChunkOffset < ndefLength) do begin
+        ndefChunkLength := ndefLength - ndefChunkOffset;
+
+        if (ndefChunkLength > 60) then ndefChunkLength := 60;
+
+        FillChar(ndefChunkData[0], SizeOf(byte) * 60, 0);
+        Move(ndef[ndefChunkOffset], ndefChunkData[0], SizeOf(byte) * ndefChunkLength);
+
+        ReaderWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+        Inc(ndefChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletNFC.ReaderRequestNDEF;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_READER_REQUEST_NDEF, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.ReaderReadNDEFLowLevel(out ndefLength: word; out ndefChunkOffset: word; out ndefChunkData: TArray0To59OfUInt8);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_READER_READ_NDEF_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  ndefLength := LEConvertUInt16From(8, response);
+  ndefChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 59 do ndefChunkData[i] := LEConvertUInt8From(12 + (i * 1), response);
+end;
+
+function TBrickletNFC.ReaderReadNDEF: TArrayOfUInt8;
+var
+  ndef: TArrayOfUInt8;
+  ndefCurrentLength: word;
+  ndefLength: word;
+  ndefChunkOffset: word;
+  ndefChunkData: TArray0To59OfUInt8;
+  ndefOutOfSync: boolean;
+  ndefChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(ndef, 0);
+  streamMutex.Acquire;
+  try
+    ndefLength := 0;
+    ReaderReadNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+    SetLength(ndef, ndefLength);
+    ndefOutOfSync := (ndefChunkOffset <> 0);
+
+    if ((not ndefOutOfSync) and (ndefLength > 0)) then begin
+      ndefChunkLength := ndefLength - ndefChunkOffset;
+      if (ndefChunkLength > 60) then ndefChunkLength := 60;
+      Move(ndefChunkData, ndef[0], SizeOf(byte) * ndefChunkLength);
+      ndefCurrentLength := ndefChunkLength;
+
+      while ((not ndefOutOfSync) and (ndefCurrentLength < ndefLength)) do begin
+        ReaderReadNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+        ndefOutOfSync := ndefChunkOffset <> ndefCurrentLength;
+        ndefChunkLength := ndefLength - ndefChunkOffset;
+        if (ndefChunkLength > 60) then ndefChunkLength := 60;
+        Move(ndefChunkData, ndef[ndefCurrentLength], SizeOf(byte) * ndefChunkLength);
+        Inc(ndefCurrentLength, ndefChunkLength);
+      end;
+    end;
+
+    if (ndefOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (ndefChunkOffset + 60 < ndefLength) do begin
+        ReaderReadNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('NDEF stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := ndef;
+end;
+
+procedure TBrickletNFC.ReaderAuthenticateMifareClassicPage(const page: word; const keyNumber: byte; const key: array of byte);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_READER_AUTHENTICATE_MIFARE_CLASSIC_PAGE, 17);
+  LEConvertUInt16To(page, 8, request);
+  LEConvertUInt8To(keyNumber, 10, request);
+  if (Length(key) <> 6) then raise EInvalidParameterException.Create('Key has to be exactly 6 items long');
+  for i := 0 to Length(key) - 1 do LEConvertUInt8To(key[i], 11 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.ReaderWritePageLowLevel(const page: word; const dataLength: word; const dataChunkOffset: word; const dataChunkData: TArray0To57OfUInt8);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_READER_WRITE_PAGE_LOW_LEVEL, 72);
+  LEConvertUInt16To(page, 8, request);
+  LEConvertUInt16To(dataLength, 10, request);
+  LEConvertUInt16To(dataChunkOffset, 12, request);
+  for i := 0 to Length(dataChunkData) - 1 do LEConvertUInt8To(dataChunkData[i], 14 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.ReaderWritePage(const page: word; const data: array of byte);
+var
+  dataChunkOffset: word;
+  dataChunkData: TArray0To57OfUInt8;
+  dataChunkLength: word;
+  dataLength: word;
+begin
+  if (Length(data) > 65535) then begin
+    raise EInvalidParameterException.Create('Data can be at most 65535 items long');
+  end;
+
+  dataLength := Length(data);
+  dataChunkOffset := 0;
+
+  if (dataLength = 0) then begin
+    FillChar(dataChunkData[0], SizeOf(byte) * 58, 0);
+    ReaderWritePageLowLevel(page, dataLength, dataChunkOffset, dataChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (dataChunkOffset < dataLength) do begin
+        dataChunkLength := dataLength - dataChunkOffset;
+
+        if (dataChunkLength > 58) then dataChunkLength := 58;
+
+        FillChar(dataChunkData[0], SizeOf(byte) * 58, 0);
+        Move(data[dataChunkOffset], dataChunkData[0], SizeOf(byte) * dataChunkLength);
+
+        ReaderWritePageLowLevel(page, dataLength, dataChunkOffset, dataChunkData);
+        Inc(dataChunkOffset, 58);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletNFC.ReaderRequestPage(const page: word; const length_: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_READER_REQUEST_PAGE, 12);
+  LEConvertUInt16To(page, 8, request);
+  LEConvertUInt16To(length_, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.ReaderReadPageLowLevel(out dataLength: word; out dataChunkOffset: word; out dataChunkData: TArray0To59OfUInt8);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_READER_READ_PAGE_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  dataLength := LEConvertUInt16From(8, response);
+  dataChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 59 do dataChunkData[i] := LEConvertUInt8From(12 + (i * 1), response);
+end;
+
+function TBrickletNFC.ReaderReadPage: TArrayOfUInt8;
+var
+  data: TArrayOfUInt8;
+  dataCurrentLength: word;
+  dataLength: word;
+  dataChunkOffset: word;
+  dataChunkData: TArray0To59OfUInt8;
+  dataOutOfSync: boolean;
+  dataChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(data, 0);
+  streamMutex.Acquire;
+  try
+    dataLength := 0;
+    ReaderReadPageLowLevel(dataLength, dataChunkOffset, dataChunkData);
+    SetLength(data, dataLength);
+    dataOutOfSync := (dataChunkOffset <> 0);
+
+    if ((not dataOutOfSync) and (dataLength > 0)) then begin
+      dataChunkLength := dataLength - dataChunkOffset;
+      if (dataChunkLength > 60) then dataChunkLength := 60;
+      Move(dataChunkData, data[0], SizeOf(byte) * dataChunkLength);
+      dataCurrentLength := dataChunkLength;
+
+      while ((not dataOutOfSync) and (dataCurrentLength < dataLength)) do begin
+        ReaderReadPageLowLevel(dataLength, dataChunkOffset, dataChunkData);
+        dataOutOfSync := dataChunkOffset <> dataCurrentLength;
+        dataChunkLength := dataLength - dataChunkOffset;
+        if (dataChunkLength > 60) then dataChunkLength := 60;
+        Move(dataChunkData, data[dataCurrentLength], SizeOf(byte) * dataChunkLength);
+        Inc(dataCurrentLength, dataChunkLength);
+      end;
+    end;
+
+    if (dataOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (dataChunkOffset + 60 < dataLength) do begin
+        ReaderReadPageLowLevel(dataLength, dataChunkOffset, dataChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Data stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := data;
+end;
+
+procedure TBrickletNFC.CardemuGetState(out state: byte; out idle: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_CARDEMU_GET_STATE, 8);
+  response := SendRequest(request, 10);
+  state := LEConvertUInt8From(8, response);
+  idle := LEConvertBooleanFrom(9, response);
+end;
+
+procedure TBrickletNFC.CardemuStartDiscovery;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_CARDEMU_START_DISCOVERY, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.CardemuWriteNDEFLowLevel(const ndefLength: word; const ndefChunkOffset: word; const ndefChunkData: TArray0To59OfUInt8);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_CARDEMU_WRITE_NDEF_LOW_LEVEL, 72);
+  LEConvertUInt16To(ndefLength, 8, request);
+  LEConvertUInt16To(ndefChunkOffset, 10, request);
+  for i := 0 to Length(ndefChunkData) - 1 do LEConvertUInt8To(ndefChunkData[i], 12 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.CardemuWriteNDEF(const ndef: array of byte);
+var
+  ndefChunkOffset: word;
+  ndefChunkData: TArray0To59OfUInt8;
+  ndefChunkLength: word;
+  ndefLength: word;
+begin
+  if (Length(ndef) > 65535) then begin
+    raise EInvalidParameterException.Create('NDEF can be at most 65535 items long');
+  end;
+
+  ndefLength := Length(ndef);
+  ndefChunkOffset := 0;
+
+  if (ndefLength = 0) then begin
+    FillChar(ndefChunkData[0], SizeOf(byte) * 60, 0);
+    CardemuWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (ndefChunkOffset < ndefLength) do begin
+        ndefChunkLength := ndefLength - ndefChunkOffset;
+
+        if (ndefChunkLength > 60) then ndefChunkLength := 60;
+
+        FillChar(ndefChunkData[0], SizeOf(byte) * 60, 0);
+        Move(ndef[ndefChunkOffset], ndefChunkData[0], SizeOf(byte) * ndefChunkLength);
+
+        CardemuWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+        Inc(ndefChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletNFC.CardemuStartTransfer(const transfer: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_CARDEMU_START_TRANSFER, 9);
+  LEConvertUInt8To(transfer, 8, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.P2PGetState(out state: byte; out idle: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_P2P_GET_STATE, 8);
+  response := SendRequest(request, 10);
+  state := LEConvertUInt8From(8, response);
+  idle := LEConvertBooleanFrom(9, response);
+end;
+
+procedure TBrickletNFC.P2PStartDiscovery;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_P2P_START_DISCOVERY, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.P2PWriteNDEFLowLevel(const ndefLength: word; const ndefChunkOffset: word; const ndefChunkData: TArray0To59OfUInt8);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_P2P_WRITE_NDEF_LOW_LEVEL, 72);
+  LEConvertUInt16To(ndefLength, 8, request);
+  LEConvertUInt16To(ndefChunkOffset, 10, request);
+  for i := 0 to Length(ndefChunkData) - 1 do LEConvertUInt8To(ndefChunkData[i], 12 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.P2PWriteNDEF(const ndef: array of byte);
+var
+  ndefChunkOffset: word;
+  ndefChunkData: TArray0To59OfUInt8;
+  ndefChunkLength: word;
+  ndefLength: word;
+begin
+  if (Length(ndef) > 65535) then begin
+    raise EInvalidParameterException.Create('NDEF can be at most 65535 items long');
+  end;
+
+  ndefLength := Length(ndef);
+  ndefChunkOffset := 0;
+
+  if (ndefLength = 0) then begin
+    FillChar(ndefChunkData[0], SizeOf(byte) * 60, 0);
+    P2PWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (ndefChunkOffset < ndefLength) do begin
+        ndefChunkLength := ndefLength - ndefChunkOffset;
+
+        if (ndefChunkLength > 60) then ndefChunkLength := 60;
+
+        FillChar(ndefChunkData[0], SizeOf(byte) * 60, 0);
+        Move(ndef[ndefChunkOffset], ndefChunkData[0], SizeOf(byte) * ndefChunkLength);
+
+        P2PWriteNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+        Inc(ndefChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletNFC.P2PStartTransfer(const transfer: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_P2P_START_TRANSFER, 9);
+  LEConvertUInt8To(transfer, 8, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.P2PReadNDEFLowLevel(out ndefLength: word; out ndefChunkOffset: word; out ndefChunkData: TArray0To59OfUInt8);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_P2P_READ_NDEF_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  ndefLength := LEConvertUInt16From(8, response);
+  ndefChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 59 do ndefChunkData[i] := LEConvertUInt8From(12 + (i * 1), response);
+end;
+
+function TBrickletNFC.P2PReadNDEF: TArrayOfUInt8;
+var
+  ndef: TArrayOfUInt8;
+  ndefCurrentLength: word;
+  ndefLength: word;
+  ndefChunkOffset: word;
+  ndefChunkData: TArray0To59OfUInt8;
+  ndefOutOfSync: boolean;
+  ndefChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(ndef, 0);
+  streamMutex.Acquire;
+  try
+    ndefLength := 0;
+    P2PReadNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+    SetLength(ndef, ndefLength);
+    ndefOutOfSync := (ndefChunkOffset <> 0);
+
+    if ((not ndefOutOfSync) and (ndefLength > 0)) then begin
+      ndefChunkLength := ndefLength - ndefChunkOffset;
+      if (ndefChunkLength > 60) then ndefChunkLength := 60;
+      Move(ndefChunkData, ndef[0], SizeOf(byte) * ndefChunkLength);
+      ndefCurrentLength := ndefChunkLength;
+
+      while ((not ndefOutOfSync) and (ndefCurrentLength < ndefLength)) do begin
+        P2PReadNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+        ndefOutOfSync := ndefChunkOffset <> ndefCurrentLength;
+        ndefChunkLength := ndefLength - ndefChunkOffset;
+        if (ndefChunkLength > 60) then ndefChunkLength := 60;
+        Move(ndefChunkData, ndef[ndefCurrentLength], SizeOf(byte) * ndefChunkLength);
+        Inc(ndefCurrentLength, ndefChunkLength);
+      end;
+    end;
+
+    if (ndefOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (ndefChunkOffset + 60 < ndefLength) do begin
+        P2PReadNDEFLowLevel(ndefLength, ndefChunkOffset, ndefChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('NDEF stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := ndef;
+end;
+
+procedure TBrickletNFC.SetDetectionLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_SET_DETECTION_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletNFC.GetDetectionLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_GET_DETECTION_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletNFC.SetMaximumTimeout(const timeout: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_SET_MAXIMUM_TIMEOUT, 10);
+  LEConvertUInt16To(timeout, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletNFC.GetMaximumTimeout: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_GET_MAXIMUM_TIMEOUT, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+procedure TBrickletNFC.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletNFC.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletNFC.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletNFC.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletNFC.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletNFC.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletNFC.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletNFC.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletNFC.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletNFC.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletNFC.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletNFC.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_NFC_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletNFC.CallbackWrapperReaderStateChanged(const packet: TByteArray);
+var state: byte; idle: boolean;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  state := LEConvertUInt8From(8, packet);
+  idle := LEConvertBooleanFrom(9, packet);
+  if (Assigned(readerStateChangedCallback)) then begin
+    readerStateChangedCallback(self, state, idle);
+  end;
+end;
+
+procedure TBrickletNFC.CallbackWrapperCardemuStateChanged(const packet: TByteArray);
+var state: byte; idle: boolean;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  state := LEConvertUInt8From(8, packet);
+  idle := LEConvertBooleanFrom(9, packet);
+  if (Assigned(cardemuStateChangedCallback)) then begin
+    cardemuStateChangedCallback(self, state, idle);
+  end;
+end;
+
+procedure TBrickletNFC.CallbackWrapperP2PStateChanged(const packet: TByteArray);
+var state: byte; idle: boolean;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  state := LEConvertUInt8From(8, packet);
+  idle := LEConvertBooleanFrom(9, packet);
+  if (Assigned(p2pStateChangedCallback)) then begin
+    p2pStateChangedCallback(self, state, idle);
+  end;
+end;
+
+end.
@@ -0,0 +1,773 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletPTCV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_PTC_V2_DEVICE_IDENTIFIER = 2101;
+  BRICKLET_PTC_V2_DEVICE_DISPLAY_NAME = 'PTC Bricklet 2.0';
+
+  BRICKLET_PTC_V2_FUNCTION_GET_TEMPERATURE = 1;
+  BRICKLET_PTC_V2_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION = 2;
+  BRICKLET_PTC_V2_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_PTC_V2_FUNCTION_GET_RESISTANCE = 5;
+  BRICKLET_PTC_V2_FUNCTION_SET_RESISTANCE_CALLBACK_CONFIGURATION = 6;
+  BRICKLET_PTC_V2_FUNCTION_GET_RESISTANCE_CALLBACK_CONFIGURATION = 7;
+  BRICKLET_PTC_V2_FUNCTION_SET_NOISE_REJECTION_FILTER = 9;
+  BRICKLET_PTC_V2_FUNCTION_GET_NOISE_REJECTION_FILTER = 10;
+  BRICKLET_PTC_V2_FUNCTION_IS_SENSOR_CONNECTED = 11;
+  BRICKLET_PTC_V2_FUNCTION_SET_WIRE_MODE = 12;
+  BRICKLET_PTC_V2_FUNCTION_GET_WIRE_MODE = 13;
+  BRICKLET_PTC_V2_FUNCTION_SET_MOVING_AVERAGE_CONFIGURATION = 14;
+  BRICKLET_PTC_V2_FUNCTION_GET_MOVING_AVERAGE_CONFIGURATION = 15;
+  BRICKLET_PTC_V2_FUNCTION_SET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION = 16;
+  BRICKLET_PTC_V2_FUNCTION_GET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION = 17;
+  BRICKLET_PTC_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_PTC_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_PTC_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_PTC_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_PTC_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_PTC_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_PTC_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_PTC_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_PTC_V2_FUNCTION_RESET = 243;
+  BRICKLET_PTC_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_PTC_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_PTC_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_PTC_V2_CALLBACK_TEMPERATURE = 4;
+  BRICKLET_PTC_V2_CALLBACK_RESISTANCE = 8;
+  BRICKLET_PTC_V2_CALLBACK_SENSOR_CONNECTED = 18;
+
+  BRICKLET_PTC_V2_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_PTC_V2_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_PTC_V2_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_PTC_V2_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_PTC_V2_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_PTC_V2_FILTER_OPTION_50HZ = 0;
+  BRICKLET_PTC_V2_FILTER_OPTION_60HZ = 1;
+  BRICKLET_PTC_V2_WIRE_MODE_2 = 2;
+  BRICKLET_PTC_V2_WIRE_MODE_3 = 3;
+  BRICKLET_PTC_V2_WIRE_MODE_4 = 4;
+  BRICKLET_PTC_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_PTC_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_PTC_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_PTC_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_PTC_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_PTC_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_PTC_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_PTC_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_PTC_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_PTC_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_PTC_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_PTC_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_PTC_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_PTC_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_PTC_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletPTCV2 = class;
+  TBrickletPTCV2NotifyTemperature = procedure(sender: TBrickletPTCV2; const temperature: longint) of object;
+  TBrickletPTCV2NotifyResistance = procedure(sender: TBrickletPTCV2; const resistance: longint) of object;
+  TBrickletPTCV2NotifySensorConnected = procedure(sender: TBrickletPTCV2; const connected: boolean) of object;
+
+  /// <summary>
+  ///  Reads temperatures from Pt100 und Pt1000 sensors
+  /// </summary>
+  TBrickletPTCV2 = class(TDevice)
+  private
+    temperatureCallback: TBrickletPTCV2NotifyTemperature;
+    resistanceCallback: TBrickletPTCV2NotifyResistance;
+    sensorConnectedCallback: TBrickletPTCV2NotifySensorConnected;
+  protected
+    procedure CallbackWrapperTemperature(const packet: TByteArray); virtual;
+    procedure CallbackWrapperResistance(const packet: TByteArray); virtual;
+    procedure CallbackWrapperSensorConnected(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the temperature of the connected sensor.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletPTCV2.TBrickletPTCV2.OnTemperature"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletPTCV2.TBrickletPTCV2.SetTemperatureCallbackConfiguration"/>.
+    /// </summary>
+    function GetTemperature: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletPTCV2.TBrickletPTCV2.OnTemperature"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletPTCV2.TBrickletPTCV2.OnTemperature"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletPTCV2.TBrickletPTCV2.SetTemperatureCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the value as measured by the MAX31865 precision delta-sigma ADC.
+    ///  
+    ///  The value can be converted with the following formulas:
+    ///  
+    ///  * Pt100:  resistance = (value * 390) / 32768
+    ///  * Pt1000: resistance = (value * 3900) / 32768
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletPTCV2.TBrickletPTCV2.OnResistance"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletPTCV2.TBrickletPTCV2.SetResistanceCallbackConfiguration"/>.
+    /// </summary>
+    function GetResistance: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletPTCV2.TBrickletPTCV2.OnResistance"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletPTCV2.TBrickletPTCV2.OnResistance"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetResistanceCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletPTCV2.TBrickletPTCV2.SetResistanceCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetResistanceCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Sets the noise rejection filter to either 50Hz (0) or 60Hz (1).
+    ///  Noise from 50Hz or 60Hz power sources (including
+    ///  harmonics of the AC power's fundamental frequency) is
+    ///  attenuated by 82dB.
+    /// </summary>
+    procedure SetNoiseRejectionFilter(const filter: byte); virtual;
+
+    /// <summary>
+    ///  Returns the noise rejection filter option as set by
+    ///  <see cref="BrickletPTCV2.TBrickletPTCV2.SetNoiseRejectionFilter"/>
+    /// </summary>
+    function GetNoiseRejectionFilter: byte; virtual;
+
+    /// <summary>
+    ///  Returns *true* if the sensor is connected correctly.
+    ///  
+    ///  If this function
+    ///  returns *false*, there is either no Pt100 or Pt1000 sensor connected,
+    ///  the sensor is connected incorrectly or the sensor itself is faulty.
+    ///  
+    ///  If you want to get the status automatically, it is recommended to use the
+    ///  <see cref="BrickletPTCV2.TBrickletPTCV2.OnSensorConnected"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletPTCV2.TBrickletPTCV2.SetSensorConnectedCallbackConfiguration"/>.
+    /// </summary>
+    function IsSensorConnected: boolean; virtual;
+
+    /// <summary>
+    ///  Sets the wire mode of the sensor. Possible values are 2, 3 and 4 which
+    ///  correspond to 2-, 3- and 4-wire sensors. The value has to match the jumper
+    ///  configuration on the Bricklet.
+    /// </summary>
+    procedure SetWireMode(const mode: byte); virtual;
+
+    /// <summary>
+    ///  Returns the wire mode as set by <see cref="BrickletPTCV2.TBrickletPTCV2.SetWireMode"/>
+    /// </summary>
+    function GetWireMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the length of a `moving averaging &lt;https://en.wikipedia.org/wiki/Moving_average&gt;`__
+    ///  for the resistance and temperature.
+    ///  
+    ///  Setting the length to 1 will turn the averaging off. With less
+    ///  averaging, there is more noise on the data.
+    ///  
+    ///  New data is gathered every 20ms. With a moving average of length 1000 the resulting
+    ///  averaging window has a length of 20s. If you want to do long term measurements the longest
+    ///  moving average will give the cleanest results.
+    ///  
+    ///  The default values match the non-changeable averaging settings of the old PTC Bricklet 1.0
+    /// </summary>
+    procedure SetMovingAverageConfiguration(const movingAverageLengthResistance: word; const movingAverageLengthTemperature: word); virtual;
+
+    /// <summary>
+    ///  Returns the moving average configuration as set by <see cref="BrickletPTCV2.TBrickletPTCV2.SetMovingAverageConfiguration"/>.
+    /// </summary>
+    procedure GetMovingAverageConfiguration(out movingAverageLengthResistance: word; out movingAverageLengthTemperature: word); virtual;
+
+    /// <summary>
+    ///  If you enable this callback, the <see cref="BrickletPTCV2.TBrickletPTCV2.OnSensorConnected"/> callback is triggered
+    ///  every time a Pt sensor is connected/disconnected.
+    /// </summary>
+    procedure SetSensorConnectedCallbackConfiguration(const enabled: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletPTCV2.TBrickletPTCV2.SetSensorConnectedCallbackConfiguration"/>.
+    /// </summary>
+    function GetSensorConnectedCallbackConfiguration: boolean; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletPTCV2.TBrickletPTCV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletPTCV2.TBrickletPTCV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletPTCV2.TBrickletPTCV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletPTCV2.TBrickletPTCV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletPTCV2.TBrickletPTCV2.SetTemperatureCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletPTCV2.TBrickletPTCV2.GetTemperature"/>.
+    /// </summary>
+    property OnTemperature: TBrickletPTCV2NotifyTemperature read temperatureCallback write temperatureCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletPTCV2.TBrickletPTCV2.SetResistanceCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletPTCV2.TBrickletPTCV2.GetResistance"/>.
+    /// </summary>
+    property OnResistance: TBrickletPTCV2NotifyResistance read resistanceCallback write resistanceCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletPTCV2.TBrickletPTCV2.SetSensorConnectedCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletPTCV2.TBrickletPTCV2.IsSensorConnected"/>.
+    /// </summary>
+    property OnSensorConnected: TBrickletPTCV2NotifySensorConnected read sensorConnectedCallback write sensorConnectedCallback;
+  end;
+
+implementation
+
+constructor TBrickletPTCV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_PTC_V2_DEVICE_IDENTIFIER, BRICKLET_PTC_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_RESISTANCE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_SET_RESISTANCE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_RESISTANCE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_SET_NOISE_REJECTION_FILTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_NOISE_REJECTION_FILTER] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_IS_SENSOR_CONNECTED] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_SET_WIRE_MODE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_WIRE_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_SET_MOVING_AVERAGE_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_MOVING_AVERAGE_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_SET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PTC_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_PTC_V2_CALLBACK_TEMPERATURE] := {$ifdef FPC}@{$endif}CallbackWrapperTemperature;
+  callbackWrappers[BRICKLET_PTC_V2_CALLBACK_RESISTANCE] := {$ifdef FPC}@{$endif}CallbackWrapperResistance;
+  callbackWrappers[BRICKLET_PTC_V2_CALLBACK_SENSOR_CONNECTED] := {$ifdef FPC}@{$endif}CallbackWrapperSensorConnected;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletPTCV2.GetTemperature: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_TEMPERATURE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletPTCV2.SetTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPTCV2.GetTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+function TBrickletPTCV2.GetResistance: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_RESISTANCE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletPTCV2.SetResistanceCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_SET_RESISTANCE_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPTCV2.GetResistanceCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_RESISTANCE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+procedure TBrickletPTCV2.SetNoiseRejectionFilter(const filter: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_SET_NOISE_REJECTION_FILTER, 9);
+  LEConvertUInt8To(filter, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPTCV2.GetNoiseRejectionFilter: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_NOISE_REJECTION_FILTER, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletPTCV2.IsSensorConnected: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_IS_SENSOR_CONNECTED, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletPTCV2.SetWireMode(const mode: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_SET_WIRE_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPTCV2.GetWireMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_WIRE_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPTCV2.SetMovingAverageConfiguration(const movingAverageLengthResistance: word; const movingAverageLengthTemperature: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_SET_MOVING_AVERAGE_CONFIGURATION, 12);
+  LEConvertUInt16To(movingAverageLengthResistance, 8, request);
+  LEConvertUInt16To(movingAverageLengthTemperature, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPTCV2.GetMovingAverageConfiguration(out movingAverageLengthResistance: word; out movingAverageLengthTemperature: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_MOVING_AVERAGE_CONFIGURATION, 8);
+  response := SendRequest(request, 12);
+  movingAverageLengthResistance := LEConvertUInt16From(8, response);
+  movingAverageLengthTemperature := LEConvertUInt16From(10, response);
+end;
+
+procedure TBrickletPTCV2.SetSensorConnectedCallbackConfiguration(const enabled: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_SET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION, 9);
+  LEConvertBooleanTo(enabled, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPTCV2.GetSensorConnectedCallbackConfiguration: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_SENSOR_CONNECTED_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletPTCV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletPTCV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletPTCV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPTCV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPTCV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPTCV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPTCV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletPTCV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletPTCV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPTCV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPTCV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletPTCV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PTC_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletPTCV2.CallbackWrapperTemperature(const packet: TByteArray);
+var temperature: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  temperature := LEConvertInt32From(8, packet);
+  if (Assigned(temperatureCallback)) then begin
+    temperatureCallback(self, temperature);
+  end;
+end;
+
+procedure TBrickletPTCV2.CallbackWrapperResistance(const packet: TByteArray);
+var resistance: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  resistance := LEConvertInt32From(8, packet);
+  if (Assigned(resistanceCallback)) then begin
+    resistanceCallback(self, resistance);
+  end;
+end;
+
+procedure TBrickletPTCV2.CallbackWrapperSensorConnected(const packet: TByteArray);
+var connected: boolean;
+begin
+  if (Length(packet) <> 9) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  connected := LEConvertBooleanFrom(8, packet);
+  if (Assigned(sensorConnectedCallback)) then begin
+    sensorConnectedCallback(self, connected);
+  end;
+end;
+
+end.
@@ -0,0 +1,850 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletPerformanceDC;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_PERFORMANCE_DC_DEVICE_IDENTIFIER = 2156;
+  BRICKLET_PERFORMANCE_DC_DEVICE_DISPLAY_NAME = 'Performance DC Bricklet';
+
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_ENABLED = 1;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_ENABLED = 2;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_VELOCITY = 3;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_VELOCITY = 4;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CURRENT_VELOCITY = 5;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_MOTION = 6;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_MOTION = 7;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_FULL_BRAKE = 8;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_DRIVE_MODE = 9;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_DRIVE_MODE = 10;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_PWM_FREQUENCY = 11;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_PWM_FREQUENCY = 12;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_POWER_STATISTICS = 13;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_GPIO_CONFIGURATION = 14;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_CONFIGURATION = 15;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_GPIO_ACTION = 16;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_ACTION = 17;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_STATE = 18;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_ERROR_LED_CONFIG = 19;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_ERROR_LED_CONFIG = 20;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_CW_LED_CONFIG = 21;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CW_LED_CONFIG = 22;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_CCW_LED_CONFIG = 23;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CCW_LED_CONFIG = 24;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_GPIO_LED_CONFIG = 25;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_LED_CONFIG = 26;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_RESET = 243;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_WRITE_UID = 248;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_READ_UID = 249;
+  BRICKLET_PERFORMANCE_DC_FUNCTION_GET_IDENTITY = 255;
+
+
+  BRICKLET_PERFORMANCE_DC_DRIVE_MODE_DRIVE_BRAKE = 0;
+  BRICKLET_PERFORMANCE_DC_DRIVE_MODE_DRIVE_COAST = 1;
+  BRICKLET_PERFORMANCE_DC_GPIO_ACTION_NONE = 0;
+  BRICKLET_PERFORMANCE_DC_GPIO_ACTION_NORMAL_STOP_RISING_EDGE = 1;
+  BRICKLET_PERFORMANCE_DC_GPIO_ACTION_NORMAL_STOP_FALLING_EDGE = 2;
+  BRICKLET_PERFORMANCE_DC_GPIO_ACTION_FULL_BRAKE_RISING_EDGE = 4;
+  BRICKLET_PERFORMANCE_DC_GPIO_ACTION_FULL_BRAKE_FALLING_EDGE = 8;
+  BRICKLET_PERFORMANCE_DC_GPIO_ACTION_CALLBACK_RISING_EDGE = 16;
+  BRICKLET_PERFORMANCE_DC_GPIO_ACTION_CALLBACK_FALLING_EDGE = 32;
+  BRICKLET_PERFORMANCE_DC_ERROR_LED_CONFIG_OFF = 0;
+  BRICKLET_PERFORMANCE_DC_ERROR_LED_CONFIG_ON = 1;
+  BRICKLET_PERFORMANCE_DC_ERROR_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_PERFORMANCE_DC_ERROR_LED_CONFIG_SHOW_ERROR = 3;
+  BRICKLET_PERFORMANCE_DC_CW_LED_CONFIG_OFF = 0;
+  BRICKLET_PERFORMANCE_DC_CW_LED_CONFIG_ON = 1;
+  BRICKLET_PERFORMANCE_DC_CW_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_PERFORMANCE_DC_CW_LED_CONFIG_SHOW_CW_AS_FORWARD = 3;
+  BRICKLET_PERFORMANCE_DC_CW_LED_CONFIG_SHOW_CW_AS_BACKWARD = 4;
+  BRICKLET_PERFORMANCE_DC_CCW_LED_CONFIG_OFF = 0;
+  BRICKLET_PERFORMANCE_DC_CCW_LED_CONFIG_ON = 1;
+  BRICKLET_PERFORMANCE_DC_CCW_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_PERFORMANCE_DC_CCW_LED_CONFIG_SHOW_CCW_AS_FORWARD = 3;
+  BRICKLET_PERFORMANCE_DC_CCW_LED_CONFIG_SHOW_CCW_AS_BACKWARD = 4;
+  BRICKLET_PERFORMANCE_DC_GPIO_LED_CONFIG_OFF = 0;
+  BRICKLET_PERFORMANCE_DC_GPIO_LED_CONFIG_ON = 1;
+  BRICKLET_PERFORMANCE_DC_GPIO_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_PERFORMANCE_DC_GPIO_LED_CONFIG_SHOW_GPIO_ACTIVE_HIGH = 3;
+  BRICKLET_PERFORMANCE_DC_GPIO_LED_CONFIG_SHOW_GPIO_ACTIVE_LOW = 4;
+  BRICKLET_PERFORMANCE_DC_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_PERFORMANCE_DC_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_PERFORMANCE_DC_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_PERFORMANCE_DC_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_PERFORMANCE_DC_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_PERFORMANCE_DC_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_PERFORMANCE_DC_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_PERFORMANCE_DC_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_PERFORMANCE_DC_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_PERFORMANCE_DC_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_PERFORMANCE_DC_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_PERFORMANCE_DC_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_PERFORMANCE_DC_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_PERFORMANCE_DC_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_PERFORMANCE_DC_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To1OfBoolean = array [0..1] of boolean;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  /// <summary>
+  ///  TBD
+  /// </summary>
+  TBrickletPerformanceDC = class(TDevice)
+  private
+  protected
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure SetEnabled(const enabled: boolean); virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    function GetEnabled: boolean; virtual;
+
+    /// <summary>
+    ///  Sets the velocity of the motor. Whereas -32767 is full speed backward,
+    ///  0 is stop and 32767 is full speed forward. Depending on the
+    ///  acceleration (see TBD), the motor is not immediately
+    ///  brought to the velocity but smoothly accelerated.
+    ///  
+    ///  The velocity describes the duty cycle of the PWM with which the motor is
+    ///  controlled, e.g. a velocity of 3277 sets a PWM with a 10% duty cycle.
+    ///  You can not only control the duty cycle of the PWM but also the frequency,
+    ///  see TBD.
+    /// </summary>
+    procedure SetVelocity(const velocity: smallint); virtual;
+
+    /// <summary>
+    ///  Returns the velocity as set by <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetVelocity"/>.
+    /// </summary>
+    function GetVelocity: smallint; virtual;
+
+    /// <summary>
+    ///  Returns the *current* velocity of the motor. This value is different
+    ///  from <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.GetVelocity"/> whenever the motor is currently accelerating
+    ///  to a goal set by <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetVelocity"/>.
+    /// </summary>
+    function GetCurrentVelocity: smallint; virtual;
+
+    /// <summary>
+    ///  Sets the acceleration of the motor. It is given in *velocity/s*. An
+    ///  acceleration of 10000 means, that every second the velocity is increased
+    ///  by 10000 (or about 30% duty cycle).
+    ///  
+    ///  For example: If the current velocity is 0 and you want to accelerate to a
+    ///  velocity of 16000 (about 50% duty cycle) in 10 seconds, you should set
+    ///  an acceleration of 1600.
+    ///  
+    ///  If acceleration is set to 0, there is no speed ramping, i.e. a new velocity
+    ///  is immediately given to the motor.
+    /// </summary>
+    procedure SetMotion(const acceleration: word; const deceleration: word); virtual;
+
+    /// <summary>
+    ///  Returns the acceleration as set by <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetMotion"/>.
+    /// </summary>
+    procedure GetMotion(out acceleration: word; out deceleration: word); virtual;
+
+    /// <summary>
+    ///  Executes an active full brake.
+    ///  
+    ///  <note type="caution">
+    ///   This function is for emergency purposes,
+    ///   where an immediate brake is necessary. Depending on the current velocity and
+    ///   the strength of the motor, a full brake can be quite violent.
+    ///  </note>
+    ///  
+    ///  Call <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetVelocity"/> with 0 if you just want to stop the motor.
+    /// </summary>
+    procedure FullBrake; virtual;
+
+    /// <summary>
+    ///  Sets the drive mode. Possible modes are:
+    ///  
+    ///  * 0 = Drive/Brake
+    ///  * 1 = Drive/Coast
+    ///  
+    ///  These modes are different kinds of motor controls.
+    ///  
+    ///  In Drive/Brake mode, the motor is always either driving or braking. There
+    ///  is no freewheeling. Advantages are: A more linear correlation between
+    ///  PWM and velocity, more exact accelerations and the possibility to drive
+    ///  with slower velocities.
+    ///  
+    ///  In Drive/Coast mode, the motor is always either driving or freewheeling.
+    ///  Advantages are: Less current consumption and less demands on the motor and
+    ///  driver chip.
+    /// </summary>
+    procedure SetDriveMode(const mode: byte); virtual;
+
+    /// <summary>
+    ///  Returns the drive mode, as set by <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetDriveMode"/>.
+    /// </summary>
+    function GetDriveMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the frequency of the PWM with which the motor is driven.
+    ///  Often a high frequency
+    ///  is less noisy and the motor runs smoother. However, with a low frequency
+    ///  there are less switches and therefore fewer switching losses. Also with
+    ///  most motors lower frequencies enable higher torque.
+    ///  
+    ///  If you have no idea what all this means, just ignore this function and use
+    ///  the default frequency, it will very likely work fine.
+    /// </summary>
+    procedure SetPWMFrequency(const frequency: word); virtual;
+
+    /// <summary>
+    ///  Returns the PWM frequency as set by <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetPWMFrequency"/>.
+    /// </summary>
+    function GetPWMFrequency: word; virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure GetPowerStatistics(out voltage: word; out current: word; out temperature: smallint); virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure SetGPIOConfiguration(const channel: byte; const debounce: word; const stopDeceleration: word); virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure GetGPIOConfiguration(const channel: byte; out debounce: word; out stopDeceleration: word); virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure SetGPIOAction(const channel: byte; const action: longword); virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    function GetGPIOAction(const channel: byte): longword; virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    function GetGPIOState: TArray0To1OfBoolean; virtual;
+
+    /// <summary>
+    ///  Configures the touch LED to be either turned off, turned on, blink in
+    ///  heartbeat mode or show TBD.
+    ///  
+    ///  TODO:
+    ///  
+    ///  * one second interval blink: Input voltage too small
+    ///  * 250ms interval blink: Overtemperature warning
+    ///  * full red: motor disabled because of short to ground in phase a or b or because of overtemperature
+    /// </summary>
+    procedure SetErrorLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the LED configuration as set by <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetErrorLEDConfig"/>
+    /// </summary>
+    function GetErrorLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure SetCWLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the LED configuration as set by <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetCWLEDConfig"/>
+    /// </summary>
+    function GetCWLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure SetCCWLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the LED configuration as set by <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetCCWLEDConfig"/>
+    /// </summary>
+    function GetCCWLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Configures the touch LED to be either turned off, turned on, blink in
+    ///  heartbeat mode or show TBD.
+    /// </summary>
+    procedure SetGPIOLEDConfig(const channel: byte; const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the LED configuration as set by <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetGPIOLEDConfig"/>
+    /// </summary>
+    function GetGPIOLEDConfig(const channel: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletPerformanceDC.TBrickletPerformanceDC.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+  end;
+
+implementation
+
+constructor TBrickletPerformanceDC.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_PERFORMANCE_DC_DEVICE_IDENTIFIER, BRICKLET_PERFORMANCE_DC_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_ENABLED] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_ENABLED] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_VELOCITY] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_VELOCITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CURRENT_VELOCITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_MOTION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_MOTION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_FULL_BRAKE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_DRIVE_MODE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_DRIVE_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_PWM_FREQUENCY] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_PWM_FREQUENCY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_POWER_STATISTICS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_GPIO_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_GPIO_ACTION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_ACTION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_STATE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_ERROR_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_ERROR_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_CW_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CW_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_CCW_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CCW_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_GPIO_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_DC_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletPerformanceDC.SetEnabled(const enabled: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_ENABLED, 9);
+  LEConvertBooleanTo(enabled, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.GetEnabled: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_ENABLED, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletPerformanceDC.SetVelocity(const velocity: smallint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_VELOCITY, 10);
+  LEConvertInt16To(velocity, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.GetVelocity: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_VELOCITY, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+function TBrickletPerformanceDC.GetCurrentVelocity: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CURRENT_VELOCITY, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletPerformanceDC.SetMotion(const acceleration: word; const deceleration: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_MOTION, 12);
+  LEConvertUInt16To(acceleration, 8, request);
+  LEConvertUInt16To(deceleration, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceDC.GetMotion(out acceleration: word; out deceleration: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_MOTION, 8);
+  response := SendRequest(request, 12);
+  acceleration := LEConvertUInt16From(8, response);
+  deceleration := LEConvertUInt16From(10, response);
+end;
+
+procedure TBrickletPerformanceDC.FullBrake;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_FULL_BRAKE, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceDC.SetDriveMode(const mode: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_DRIVE_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.GetDriveMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_DRIVE_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceDC.SetPWMFrequency(const frequency: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_PWM_FREQUENCY, 10);
+  LEConvertUInt16To(frequency, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.GetPWMFrequency: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_PWM_FREQUENCY, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+procedure TBrickletPerformanceDC.GetPowerStatistics(out voltage: word; out current: word; out temperature: smallint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_POWER_STATISTICS, 8);
+  response := SendRequest(request, 14);
+  voltage := LEConvertUInt16From(8, response);
+  current := LEConvertUInt16From(10, response);
+  temperature := LEConvertInt16From(12, response);
+end;
+
+procedure TBrickletPerformanceDC.SetGPIOConfiguration(const channel: byte; const debounce: word; const stopDeceleration: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_GPIO_CONFIGURATION, 13);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt16To(debounce, 9, request);
+  LEConvertUInt16To(stopDeceleration, 11, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceDC.GetGPIOConfiguration(const channel: byte; out debounce: word; out stopDeceleration: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_CONFIGURATION, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 12);
+  debounce := LEConvertUInt16From(8, response);
+  stopDeceleration := LEConvertUInt16From(10, response);
+end;
+
+procedure TBrickletPerformanceDC.SetGPIOAction(const channel: byte; const action: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_GPIO_ACTION, 13);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt32To(action, 9, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.GetGPIOAction(const channel: byte): longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_ACTION, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+function TBrickletPerformanceDC.GetGPIOState: TArray0To1OfBoolean;
+var request, response: TByteArray; i: longint; gpioStateBits: array [0..0] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_STATE, 8);
+  response := SendRequest(request, 9);
+  FillChar(gpioStateBits[0], Length(gpioStateBits) * SizeOf(gpioStateBits[0]), 0);
+  for i := 0 to 0 do gpioStateBits[i] := LEConvertUInt8From(8 + (i * 1), response);
+  for i := 0 to 1 do result[i] := ((gpioStateBits[Floor(i / 8)] and (1 shl (i mod 8))) <> 0);
+end;
+
+procedure TBrickletPerformanceDC.SetErrorLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_ERROR_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.GetErrorLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_ERROR_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceDC.SetCWLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_CW_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.GetCWLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CW_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceDC.SetCCWLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_CCW_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.GetCCWLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CCW_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceDC.SetGPIOLEDConfig(const channel: byte; const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_GPIO_LED_CONFIG, 10);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt8To(config, 9, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.GetGPIOLEDConfig(const channel: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_GPIO_LED_CONFIG, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceDC.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletPerformanceDC.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletPerformanceDC.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceDC.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceDC.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletPerformanceDC.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletPerformanceDC.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceDC.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceDC.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletPerformanceDC.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_DC_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+end.
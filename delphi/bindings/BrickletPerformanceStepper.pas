@@ -0,0 +1,1431 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletPerformanceStepper;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_PERFORMANCE_STEPPER_DEVICE_IDENTIFIER = 2158;
+  BRICKLET_PERFORMANCE_STEPPER_DEVICE_DISPLAY_NAME = 'Performance Stepper Bricklet';
+
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_MOTION_CONFIGURATION = 1;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_MOTION_CONFIGURATION = 2;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_CURRENT_POSITION = 3;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_CURRENT_POSITION = 4;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_CURRENT_VELOCITY = 5;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_TARGET_POSITION = 6;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_TARGET_POSITION = 7;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEPS = 8;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEPS = 9;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_REMAINING_STEPS = 10;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEP_CONFIGURATION = 11;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEP_CONFIGURATION = 12;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_MOTOR_CURRENT = 22;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_MOTOR_CURRENT = 23;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_ENABLED = 24;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_ENABLED = 25;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_BASIC_CONFIGURATION = 26;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_BASIC_CONFIGURATION = 27;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_SPREADCYCLE_CONFIGURATION = 28;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_SPREADCYCLE_CONFIGURATION = 29;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEALTH_CONFIGURATION = 30;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEALTH_CONFIGURATION = 31;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_COOLSTEP_CONFIGURATION = 32;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_COOLSTEP_CONFIGURATION = 33;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_SHORT_CONFIGURATION = 34;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_SHORT_CONFIGURATION = 35;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_DRIVER_STATUS = 36;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_INPUT_VOLTAGE = 37;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_TEMPERATURE = 38;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_CONFIGURATION = 39;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_CONFIGURATION = 40;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_ACTION = 41;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_ACTION = 42;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_STATE = 43;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_ERROR_LED_CONFIG = 44;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_ERROR_LED_CONFIG = 45;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_ENABLE_LED_CONFIG = 46;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_ENABLE_LED_CONFIG = 47;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEPS_LED_CONFIG = 48;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEPS_LED_CONFIG = 49;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_LED_CONFIG = 50;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_LED_CONFIG = 51;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_WRITE_REGISTER = 52;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_READ_REGISTER = 53;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_RESET = 243;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_WRITE_UID = 248;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_READ_UID = 249;
+  BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_IDENTITY = 255;
+
+
+  BRICKLET_PERFORMANCE_STEPPER_STEP_RESOLUTION_1 = 8;
+  BRICKLET_PERFORMANCE_STEPPER_STEP_RESOLUTION_2 = 7;
+  BRICKLET_PERFORMANCE_STEPPER_STEP_RESOLUTION_4 = 6;
+  BRICKLET_PERFORMANCE_STEPPER_STEP_RESOLUTION_8 = 5;
+  BRICKLET_PERFORMANCE_STEPPER_STEP_RESOLUTION_16 = 4;
+  BRICKLET_PERFORMANCE_STEPPER_STEP_RESOLUTION_32 = 3;
+  BRICKLET_PERFORMANCE_STEPPER_STEP_RESOLUTION_64 = 2;
+  BRICKLET_PERFORMANCE_STEPPER_STEP_RESOLUTION_128 = 1;
+  BRICKLET_PERFORMANCE_STEPPER_STEP_RESOLUTION_256 = 0;
+  BRICKLET_PERFORMANCE_STEPPER_RAMPING_MODE_POSITIONING = 0;
+  BRICKLET_PERFORMANCE_STEPPER_RAMPING_MODE_VELOCITY_NEGATIVE = 1;
+  BRICKLET_PERFORMANCE_STEPPER_RAMPING_MODE_VELOCITY_POSITIVE = 2;
+  BRICKLET_PERFORMANCE_STEPPER_RAMPING_MODE_HOLD = 3;
+  BRICKLET_PERFORMANCE_STEPPER_CHOPPER_MODE_SPREAD_CYCLE = 0;
+  BRICKLET_PERFORMANCE_STEPPER_CHOPPER_MODE_FAST_DECAY = 1;
+  BRICKLET_PERFORMANCE_STEPPER_FREEWHEEL_MODE_NORMAL = 0;
+  BRICKLET_PERFORMANCE_STEPPER_FREEWHEEL_MODE_FREEWHEELING = 1;
+  BRICKLET_PERFORMANCE_STEPPER_FREEWHEEL_MODE_COIL_SHORT_LS = 2;
+  BRICKLET_PERFORMANCE_STEPPER_FREEWHEEL_MODE_COIL_SHORT_HS = 3;
+  BRICKLET_PERFORMANCE_STEPPER_CURRENT_UP_STEP_INCREMENT_1 = 0;
+  BRICKLET_PERFORMANCE_STEPPER_CURRENT_UP_STEP_INCREMENT_2 = 1;
+  BRICKLET_PERFORMANCE_STEPPER_CURRENT_UP_STEP_INCREMENT_4 = 2;
+  BRICKLET_PERFORMANCE_STEPPER_CURRENT_UP_STEP_INCREMENT_8 = 3;
+  BRICKLET_PERFORMANCE_STEPPER_CURRENT_DOWN_STEP_DECREMENT_1 = 0;
+  BRICKLET_PERFORMANCE_STEPPER_CURRENT_DOWN_STEP_DECREMENT_2 = 1;
+  BRICKLET_PERFORMANCE_STEPPER_CURRENT_DOWN_STEP_DECREMENT_8 = 2;
+  BRICKLET_PERFORMANCE_STEPPER_CURRENT_DOWN_STEP_DECREMENT_32 = 3;
+  BRICKLET_PERFORMANCE_STEPPER_MINIMUM_CURRENT_HALF = 0;
+  BRICKLET_PERFORMANCE_STEPPER_MINIMUM_CURRENT_QUARTER = 1;
+  BRICKLET_PERFORMANCE_STEPPER_STALLGUARD_MODE_STANDARD = 0;
+  BRICKLET_PERFORMANCE_STEPPER_STALLGUARD_MODE_FILTERED = 1;
+  BRICKLET_PERFORMANCE_STEPPER_OPEN_LOAD_NONE = 0;
+  BRICKLET_PERFORMANCE_STEPPER_OPEN_LOAD_PHASE_A = 1;
+  BRICKLET_PERFORMANCE_STEPPER_OPEN_LOAD_PHASE_B = 2;
+  BRICKLET_PERFORMANCE_STEPPER_OPEN_LOAD_PHASE_AB = 3;
+  BRICKLET_PERFORMANCE_STEPPER_SHORT_TO_GROUND_NONE = 0;
+  BRICKLET_PERFORMANCE_STEPPER_SHORT_TO_GROUND_PHASE_A = 1;
+  BRICKLET_PERFORMANCE_STEPPER_SHORT_TO_GROUND_PHASE_B = 2;
+  BRICKLET_PERFORMANCE_STEPPER_SHORT_TO_GROUND_PHASE_AB = 3;
+  BRICKLET_PERFORMANCE_STEPPER_OVER_TEMPERATURE_NONE = 0;
+  BRICKLET_PERFORMANCE_STEPPER_OVER_TEMPERATURE_WARNING = 1;
+  BRICKLET_PERFORMANCE_STEPPER_OVER_TEMPERATURE_LIMIT = 2;
+  BRICKLET_PERFORMANCE_STEPPER_STATE_STOP = 1;
+  BRICKLET_PERFORMANCE_STEPPER_STATE_ACCELERATION = 2;
+  BRICKLET_PERFORMANCE_STEPPER_STATE_RUN = 3;
+  BRICKLET_PERFORMANCE_STEPPER_STATE_DEACCELERATION = 4;
+  BRICKLET_PERFORMANCE_STEPPER_STATE_DIRECTION_CHANGE_TO_FORWARD = 5;
+  BRICKLET_PERFORMANCE_STEPPER_STATE_DIRECTION_CHANGE_TO_BACKWARD = 6;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_ACTION_NONE = 0;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_ACTION_NORMAL_STOP_RISING_EDGE = 1;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_ACTION_NORMAL_STOP_FALLING_EDGE = 2;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_ACTION_EMERGENCY_STOP_RISING_EDGE = 4;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_ACTION_EMERGENCY_STOP_FALLING_EDGE = 8;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_ACTION_CALLBACK_RISING_EDGE = 16;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_ACTION_CALLBACK_FALLING_EDGE = 32;
+  BRICKLET_PERFORMANCE_STEPPER_ERROR_LED_CONFIG_OFF = 0;
+  BRICKLET_PERFORMANCE_STEPPER_ERROR_LED_CONFIG_ON = 1;
+  BRICKLET_PERFORMANCE_STEPPER_ERROR_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_PERFORMANCE_STEPPER_ERROR_LED_CONFIG_SHOW_ERROR = 3;
+  BRICKLET_PERFORMANCE_STEPPER_ENABLE_LED_CONFIG_OFF = 0;
+  BRICKLET_PERFORMANCE_STEPPER_ENABLE_LED_CONFIG_ON = 1;
+  BRICKLET_PERFORMANCE_STEPPER_ENABLE_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_PERFORMANCE_STEPPER_ENABLE_LED_CONFIG_SHOW_ENABLE = 3;
+  BRICKLET_PERFORMANCE_STEPPER_STEPS_LED_CONFIG_OFF = 0;
+  BRICKLET_PERFORMANCE_STEPPER_STEPS_LED_CONFIG_ON = 1;
+  BRICKLET_PERFORMANCE_STEPPER_STEPS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_PERFORMANCE_STEPPER_STEPS_LED_CONFIG_SHOW_STEPS = 3;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_LED_CONFIG_OFF = 0;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_LED_CONFIG_ON = 1;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_LED_CONFIG_SHOW_GPIO_ACTIVE_HIGH = 3;
+  BRICKLET_PERFORMANCE_STEPPER_GPIO_LED_CONFIG_SHOW_GPIO_ACTIVE_LOW = 4;
+  BRICKLET_PERFORMANCE_STEPPER_FILTER_TIME_100 = 0;
+  BRICKLET_PERFORMANCE_STEPPER_FILTER_TIME_200 = 1;
+  BRICKLET_PERFORMANCE_STEPPER_FILTER_TIME_300 = 2;
+  BRICKLET_PERFORMANCE_STEPPER_FILTER_TIME_400 = 3;
+  BRICKLET_PERFORMANCE_STEPPER_SPIKE_FILTER_BANDWIDTH_100 = 0;
+  BRICKLET_PERFORMANCE_STEPPER_SPIKE_FILTER_BANDWIDTH_1000 = 1;
+  BRICKLET_PERFORMANCE_STEPPER_SPIKE_FILTER_BANDWIDTH_2000 = 2;
+  BRICKLET_PERFORMANCE_STEPPER_SPIKE_FILTER_BANDWIDTH_3000 = 3;
+  BRICKLET_PERFORMANCE_STEPPER_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_PERFORMANCE_STEPPER_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_PERFORMANCE_STEPPER_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_PERFORMANCE_STEPPER_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_PERFORMANCE_STEPPER_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_PERFORMANCE_STEPPER_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_PERFORMANCE_STEPPER_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_PERFORMANCE_STEPPER_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_PERFORMANCE_STEPPER_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_PERFORMANCE_STEPPER_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_PERFORMANCE_STEPPER_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_PERFORMANCE_STEPPER_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_PERFORMANCE_STEPPER_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_PERFORMANCE_STEPPER_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_PERFORMANCE_STEPPER_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To1OfBoolean = array [0..1] of boolean;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  /// <summary>
+  ///  TBD
+  /// </summary>
+  TBrickletPerformanceStepper = class(TDevice)
+  private
+  protected
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure SetMotionConfiguration(const rampingMode: byte; const velocityStart: longint; const acceleration1: longint; const velocity1: longint; const accelerationMax: longint; const velocityMax: longint; const decelerationMax: longint; const deceleration1: longint; const velocityStop: longint; const rampZeroWait: longint); virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure GetMotionConfiguration(out rampingMode: byte; out velocityStart: longint; out acceleration1: longint; out velocity1: longint; out accelerationMax: longint; out velocityMax: longint; out decelerationMax: longint; out deceleration1: longint; out velocityStop: longint; out rampZeroWait: longint); virtual;
+
+    /// <summary>
+    ///  Sets the current steps of the internal step counter. This can be used to
+    ///  set the current position to 0 when some kind of starting position
+    ///  is reached (e.g. when a CNC machine reaches a corner).
+    /// </summary>
+    procedure SetCurrentPosition(const position: longint); virtual;
+
+    /// <summary>
+    ///  Returns the current position of the stepper motor in steps. On startup
+    ///  the position is 0. The steps are counted with all possible driving
+    ///  functions (<see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetTargetPosition"/>, <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetSteps"/>).
+    ///  It also is possible to reset the steps to 0 or
+    ///  set them to any other desired value with <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetCurrentPosition"/>.
+    /// </summary>
+    function GetCurrentPosition: longint; virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    function GetCurrentVelocity: longint; virtual;
+
+    /// <summary>
+    ///  Sets the target position of the stepper motor in steps. For example,
+    ///  if the current position of the motor is 500 and <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetTargetPosition"/> is
+    ///  called with 1000, the stepper motor will drive 500 steps forward. It will
+    ///  use the velocity, acceleration and deacceleration as set by
+    ///  <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetMotionConfiguration"/>.
+    ///  
+    ///  A call of <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetTargetPosition"/> with the parameter *x* is equivalent to
+    ///  a call of <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetSteps"/> with the parameter
+    ///  (*x* - <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.GetCurrentPosition"/>).
+    /// </summary>
+    procedure SetTargetPosition(const position: longint); virtual;
+
+    /// <summary>
+    ///  Returns the last target position as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetTargetPosition"/>.
+    /// </summary>
+    function GetTargetPosition: longint; virtual;
+
+    /// <summary>
+    ///  Sets the number of steps the stepper motor should run. Positive values
+    ///  will drive the motor forward and negative values backward.
+    ///  The velocity, acceleration and deacceleration as set by
+    ///  <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetMotionConfiguration"/> will be used.
+    /// </summary>
+    procedure SetSteps(const steps: longint); virtual;
+
+    /// <summary>
+    ///  Returns the last steps as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetSteps"/>.
+    /// </summary>
+    function GetSteps: longint; virtual;
+
+    /// <summary>
+    ///  Returns the remaining steps of the last call of <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetSteps"/>.
+    ///  For example, if <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetSteps"/> is called with 2000 and
+    ///  <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.GetRemainingSteps"/> is called after the motor has run for 500 steps,
+    ///  it will return 1500.
+    /// </summary>
+    function GetRemainingSteps: longint; virtual;
+
+    /// <summary>
+    ///  Sets the step resolution from full-step up to 1/256-step.
+    ///  
+    ///  If interpolation is turned on, the Silent Stepper Brick will always interpolate
+    ///  your step inputs as 1/256-step. If you use full-step mode with interpolation, each
+    ///  step will generate 256 1/256 steps.
+    ///  
+    ///  For maximum torque use full-step without interpolation. For maximum resolution use
+    ///  1/256-step. Turn interpolation on to make the Stepper driving less noisy.
+    ///  
+    ///  If you often change the speed with high acceleration you should turn the
+    ///  interpolation off.
+    /// </summary>
+    procedure SetStepConfiguration(const stepResolution: byte; const interpolation: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the step mode as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetStepConfiguration"/>.
+    /// </summary>
+    procedure GetStepConfiguration(out stepResolution: byte; out interpolation: boolean); virtual;
+
+    /// <summary>
+    ///  Sets the current with which the motor will be driven.
+    ///  
+    ///  <note type="caution">
+    ///   Do not set this value above the specifications of your stepper motor.
+    ///   Otherwise it may damage your motor.
+    ///  </note>
+    /// </summary>
+    procedure SetMotorCurrent(const current: word); virtual;
+
+    /// <summary>
+    ///  Returns the current as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetMotorCurrent"/>.
+    /// </summary>
+    function GetMotorCurrent: word; virtual;
+
+    /// <summary>
+    ///  Enables the driver chip. The driver parameters can be configured (maximum velocity,
+    ///  acceleration, etc) before it is enabled.
+    /// </summary>
+    procedure SetEnabled(const enabled: boolean); virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    function GetEnabled: boolean; virtual;
+
+    /// <summary>
+    ///  Sets the basic configuration parameters for the different modes (Stealth, Coolstep, Classic).
+    ///  
+    ///  * Standstill Current: This value can be used to lower the current during stand still. This might
+    ///    be reasonable to reduce the heating of the motor and the Brick. When the motor is in standstill
+    ///    the configured motor phase current will be driven until the configured
+    ///    Power Down Time is elapsed. After that the phase current will be reduced to the standstill
+    ///    current. The elapsed time for this reduction can be configured with the Standstill Delay Time.
+    ///    The maximum allowed value is the configured maximum motor current
+    ///    (see <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetMotorCurrent"/>).
+    ///  
+    ///  * Motor Run Current: The value sets the motor current when the motor is running.
+    ///    Use a value of at least one half of the global maximum motor current for a good
+    ///    microstep performance. The maximum allowed value is the current
+    ///    motor current. The API maps the entered value to 1/32 ... 32/32 of the maximum
+    ///    motor current. This value should be used to change the motor current during motor movement,
+    ///    whereas the global maximum motor current should not be changed while the motor is moving
+    ///    (see <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetMotorCurrent"/>).
+    ///  
+    ///  * Standstill Delay Time: Controls the duration for motor power down after a motion
+    ///    as soon as standstill is detected and the Power Down Time is expired. A high Standstill Delay
+    ///    Time results in a smooth transition that avoids motor jerk during power down.
+    ///  
+    ///  * Power Down Time: Sets the delay time after a stand still.
+    ///  
+    ///  * Stealth Threshold: Sets the upper threshold for Stealth mode.
+    ///    If the velocity of the motor goes above this value, Stealth mode is turned
+    ///    off. Otherwise it is turned on. In Stealth mode the torque declines with high speed.
+    ///  
+    ///  * Coolstep Threshold: Sets the lower threshold for Coolstep mode.
+    ///    The Coolstep Threshold needs to be above the Stealth Threshold.
+    ///  
+    ///  * Classic Threshold: Sets the lower threshold for classic mode.
+    ///    In classic mode the stepper becomes more noisy, but the torque is maximized.
+    ///  
+    ///  * High Velocity Chopper Mode: If High Velocity Chopper Mode is enabled, the stepper control
+    ///    is optimized to run the stepper motors at high velocities.
+    ///  
+    ///  If you want to use all three thresholds make sure that
+    ///  Stealth Threshold &lt; Coolstep Threshold &lt; Classic Threshold.
+    /// </summary>
+    procedure SetBasicConfiguration(const standstillCurrent: word; const motorRunCurrent: word; const standstillDelayTime: word; const powerDownTime: word; const stealthThreshold: word; const coolstepThreshold: word; const classicThreshold: word; const highVelocityChopperMode: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetBasicConfiguration"/>.
+    /// </summary>
+    procedure GetBasicConfiguration(out standstillCurrent: word; out motorRunCurrent: word; out standstillDelayTime: word; out powerDownTime: word; out stealthThreshold: word; out coolstepThreshold: word; out classicThreshold: word; out highVelocityChopperMode: boolean); virtual;
+
+    /// <summary>
+    ///  Note: If you don't know what any of this means you can very likely keep all of
+    ///  the values as default!
+    ///  
+    ///  Sets the Spreadcycle configuration parameters. Spreadcycle is a chopper algorithm which actively
+    ///  controls the motor current flow. More information can be found in the TMC2130 datasheet on page
+    ///  47 (7 spreadCycle and Classic Chopper).
+    ///  
+    ///  * Slow Decay Duration: Controls duration of off time setting of slow decay phase.
+    ///    0 = driver disabled, all bridges off. Use 1 only with Comparator Blank time &gt;= 2.
+    ///  
+    ///  * High Velocity Fullstep: TODO.
+    ///  
+    ///  * Fast Decay Duration: Sets the fast decay duration. This parameters is
+    ///    only used if the Chopper Mode is set to Fast Decay.
+    ///  
+    ///  * Hysteresis Start Value: Sets the hysteresis start value. This parameter is
+    ///    only used if the Chopper Mode is set to Spread Cycle.
+    ///  
+    ///  * Hysteresis End Value: Sets the hysteresis end value. This parameter is
+    ///    only used if the Chopper Mode is set to Spread Cycle.
+    ///  
+    ///  * Sine Wave Offset: Sets the sine wave offset. This parameters is
+    ///    only used if the Chopper Mode is set to Fast Decay. 1/512 of the value becomes added to the absolute
+    ///    value of the sine wave.
+    ///  
+    ///  * Chopper Mode: 0 = Spread Cycle, 1 = Fast Decay.
+    ///  
+    ///  * Comparator Blank Time: Sets the blank time of the comparator. Available values are
+    ///  
+    ///    * 0 = 16 clocks,
+    ///    * 1 = 24 clocks,
+    ///    * 2 = 36 clocks and
+    ///    * 3 = 54 clocks.
+    ///  
+    ///    A value of 1 or 2 is recommended for most applications.
+    ///  
+    ///  * Fast Decay Without Comparator: If set to true the current comparator usage for termination of the
+    ///    fast decay cycle is disabled.
+    /// </summary>
+    procedure SetSpreadcycleConfiguration(const slowDecayDuration: byte; const highVelocityFullstep: boolean; const fastDecayDuration: byte; const hysteresisStartValue: byte; const hysteresisEndValue: shortint; const sineWaveOffset: shortint; const chopperMode: byte; const comparatorBlankTime: byte; const fastDecayWithoutComparator: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetBasicConfiguration"/>.
+    /// </summary>
+    procedure GetSpreadcycleConfiguration(out slowDecayDuration: byte; out highVelocityFullstep: boolean; out enableRandomSlowDecay: boolean; out fastDecayDuration: byte; out hysteresisStartValue: byte; out hysteresisEndValue: shortint; out sineWaveOffset: shortint; out chopperMode: byte; out comparatorBlankTime: byte; out fastDecayWithoutComparator: boolean); virtual;
+
+    /// <summary>
+    ///  Note: If you don't know what any of this means you can very likely keep all of
+    ///  the values as default!
+    ///  
+    ///  Sets the configuration relevant for Stealth mode.
+    ///  
+    ///  * Enable Stealth: If set to true the stealth mode is enabled, if set to false the
+    ///    stealth mode is disabled, even if the speed is below the threshold set in <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetBasicConfiguration"/>.
+    ///  
+    ///  * Amplitude: If autoscale is disabled, the PWM amplitude is scaled by this value. If autoscale is enabled,
+    ///    this value defines the maximum PWM amplitude change per half wave.
+    ///  
+    ///  * Gradient: If autoscale is disabled, the PWM gradient is scaled by this value. If autoscale is enabled,
+    ///    this value defines the maximum PWM gradient. With autoscale a value above 64 is recommended,
+    ///    otherwise the regulation might not be able to measure the current.
+    ///  
+    ///  * Enable Autoscale: If set to true, automatic current control is used. Otherwise the user defined
+    ///    amplitude and gradient are used.
+    ///  
+    ///  * Enable Autogradient: TODO
+    ///  
+    ///  * Freewheel Mode: The freewheel mode defines the behavior in stand still if the Standstill Current
+    ///    (see <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetBasicConfiguration"/>) is set to 0.
+    /// </summary>
+    procedure SetStealthConfiguration(const enableStealth: boolean; const offset: byte; const gradient: byte; const enableAutoscale: boolean; const enableAutogradient: boolean; const freewheelMode: byte; const regulationLoopGradient: byte; const amplitudeLimit: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetStealthConfiguration"/>.
+    /// </summary>
+    procedure GetStealthConfiguration(out enableStealth: boolean; out offset: byte; out gradient: byte; out enableAutoscale: boolean; out enableAutogradient: boolean; out freewheelMode: byte; out regulationLoopGradient: byte; out amplitudeLimit: byte); virtual;
+
+    /// <summary>
+    ///  Note: If you don't know what any of this means you can very likely keep all of
+    ///  the values as default!
+    ///  
+    ///  Sets the configuration relevant for Coolstep.
+    ///  
+    ///  * Minimum Stallguard Value: If the Stallguard result falls below this value*32, the motor current
+    ///    is increased to reduce motor load angle. A value of 0 turns Coolstep off.
+    ///  
+    ///  * Maximum Stallguard Value: If the Stallguard result goes above
+    ///    (Min Stallguard Value + Max Stallguard Value + 1) * 32, the motor current is decreased to save
+    ///    energy.
+    ///  
+    ///  * Current Up Step Width: Sets the up step increment per Stallguard value. The value range is 0-3,
+    ///    corresponding to the increments 1, 2, 4 and 8.
+    ///  
+    ///  * Current Down Step Width: Sets the down step decrement per Stallguard value. The value range is 0-3,
+    ///    corresponding to the decrements 1, 2, 8 and 16.
+    ///  
+    ///  * Minimum Current: Sets the minimum current for Coolstep current control. You can choose between
+    ///    half and quarter of the run current.
+    ///  
+    ///  * Stallguard Threshold Value: Sets the level for stall output (see <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.GetDriverStatus"/>).
+    ///    A lower value gives a higher sensitivity. You have to find a suitable value for your
+    ///    motor by trial and error, 0 works for most motors.
+    ///  
+    ///  * Stallguard Mode: Set to 0 for standard resolution or 1 for filtered mode. In filtered mode the Stallguard
+    ///    signal will be updated every four full-steps.
+    /// </summary>
+    procedure SetCoolstepConfiguration(const minimumStallguardValue: byte; const maximumStallguardValue: byte; const currentUpStepWidth: byte; const currentDownStepWidth: byte; const minimumCurrent: byte; const stallguardThresholdValue: shortint; const stallguardMode: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetCoolstepConfiguration"/>.
+    /// </summary>
+    procedure GetCoolstepConfiguration(out minimumStallguardValue: byte; out maximumStallguardValue: byte; out currentUpStepWidth: byte; out currentDownStepWidth: byte; out minimumCurrent: byte; out stallguardThresholdValue: shortint; out stallguardMode: byte); virtual;
+
+    /// <summary>
+    ///  Note: If you don't know what any of this means you can very likely keep all of
+    ///  the values as default!
+    ///  
+    ///  Sets miscellaneous configuration parameters.
+    ///  
+    ///  * Disable Short To Ground Protection: Set to false to enable short to ground protection, otherwise
+    ///    it is disabled.
+    ///  
+    ///  * TODO
+    /// </summary>
+    procedure SetShortConfiguration(const disableShortToVoltageProtection: boolean; const disableShortToGroundProtection: boolean; const shortToVoltageLevel: byte; const shortToGroundLevel: byte; const spikeFilterBandwidth: byte; const shortDetectionDelay: boolean; const filterTime: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetShortConfiguration"/>.
+    /// </summary>
+    procedure GetShortConfiguration(out disableShortToVoltageProtection: boolean; out disableShortToGroundProtection: boolean; out shortToVoltageLevel: byte; out shortToGroundLevel: byte; out spikeFilterBandwidth: byte; out shortDetectionDelay: boolean; out filterTime: byte); virtual;
+
+    /// <summary>
+    ///  Returns the current driver status.
+    ///  
+    ///  * Open Load: Indicates if an open load is present on phase A, B or both. This could mean that there is a problem
+    ///    with the wiring of the motor. False detection can occur in fast motion as well as during stand still.
+    ///  
+    ///  * Short To Ground: Indicates if a short to ground is present on phase A, B or both. If this is detected the driver
+    ///    automatically becomes disabled and stays disabled until it is enabled again manually.
+    ///  
+    ///  * Over Temperature: The over temperature indicator switches to "Warning" if the driver IC warms up. The warning flag
+    ///    is expected during long duration stepper uses. If the temperature limit is reached the indicator switches
+    ///    to "Limit". In this case the driver becomes disabled until it cools down again.
+    ///  
+    ///  * Motor Stalled: Is true if a motor stall was detected.
+    ///  
+    ///  * Actual Motor Current: Indicates the actual current control scaling as used in Coolstep mode.
+    ///    It represents a multiplier of 1/32 to 32/32 of the
+    ///    ``Motor Run Current`` as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetBasicConfiguration"/>. Example: If a ``Motor Run Current``
+    ///    of 1000mA was set and the returned value is 15, the ``Actual Motor Current`` is 16/32*1000mA = 500mA.
+    ///  
+    ///  * Stallguard Result: Indicates the load of the motor. A lower value signals a higher load. Per trial and error
+    ///    you can find out which value corresponds to a suitable torque for the velocity used in your application.
+    ///    After that you can use this threshold value to find out if a motor stall becomes probable and react on it (e.g.
+    ///    decrease velocity).
+    ///    During stand still this value can not be used for stall detection, it shows the chopper on-time for motor coil A.
+    ///  
+    ///  * Stealth Voltage Amplitude: Shows the actual PWM scaling. In Stealth mode it can be used to detect motor load and
+    ///    stall if autoscale is enabled (see <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetStealthConfiguration"/>).
+    /// </summary>
+    procedure GetDriverStatus(out openLoad: byte; out shortToGround: byte; out overTemperature: byte; out motorStalled: boolean; out actualMotorCurrent: byte; out fullStepActive: boolean; out stallguardResult: byte; out stealthVoltageAmplitude: byte); virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    function GetInputVoltage: word; virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    function GetTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure SetGPIOConfiguration(const debounce: word; const stopDeceleration: longint); virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure GetGPIOConfiguration(out debounce: word; out stopDeceleration: longint); virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure SetGPIOAction(const channel: byte; const action: longword); virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    function GetGPIOAction(const channel: byte): longword; virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    function GetGPIOState: TArray0To1OfBoolean; virtual;
+
+    /// <summary>
+    ///  Configures the touch LED to be either turned off, turned on, blink in
+    ///  heartbeat mode or show TBD.
+    ///  
+    ///  TODO:
+    ///  
+    ///  * one second interval blink: Input voltage too small
+    ///  * 250ms interval blink: Overtemperature warning
+    ///  * full red: motor disabled because of short to ground in phase a or b or because of overtemperature
+    /// </summary>
+    procedure SetErrorLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the LED configuration as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetErrorLEDConfig"/>
+    /// </summary>
+    function GetErrorLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Configures the touch LED to be either turned off, turned on, blink in
+    ///  heartbeat mode or show TBD.
+    /// </summary>
+    procedure SetEnableLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the LED configuration as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetEnableLEDConfig"/>
+    /// </summary>
+    function GetEnableLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Configures the touch LED to be either turned off, turned on, blink in
+    ///  heartbeat mode or show TBD.
+    /// </summary>
+    procedure SetStepsLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the LED configuration as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetStepsLEDConfig"/>
+    /// </summary>
+    function GetStepsLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Configures the touch LED to be either turned off, turned on, blink in
+    ///  heartbeat mode or show TBD.
+    /// </summary>
+    procedure SetGPIOLEDConfig(const channel: byte; const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the LED configuration as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetGPIOLEDConfig"/>
+    /// </summary>
+    function GetGPIOLEDConfig(const channel: byte): byte; virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    function WriteRegister(const register: byte; const value: longword): byte; virtual;
+
+    /// <summary>
+    ///  TBD
+    /// </summary>
+    procedure ReadRegister(const register: byte; out status: byte; out value: longword); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletPerformanceStepper.TBrickletPerformanceStepper.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+  end;
+
+implementation
+
+constructor TBrickletPerformanceStepper.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_PERFORMANCE_STEPPER_DEVICE_IDENTIFIER, BRICKLET_PERFORMANCE_STEPPER_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_MOTION_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_MOTION_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_CURRENT_POSITION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_CURRENT_POSITION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_CURRENT_VELOCITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_TARGET_POSITION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_TARGET_POSITION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEPS] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEPS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_REMAINING_STEPS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEP_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEP_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_MOTOR_CURRENT] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_MOTOR_CURRENT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_ENABLED] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_ENABLED] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_BASIC_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_BASIC_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_SPREADCYCLE_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_SPREADCYCLE_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEALTH_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEALTH_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_COOLSTEP_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_COOLSTEP_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_SHORT_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_SHORT_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_DRIVER_STATUS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_INPUT_VOLTAGE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_ACTION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_ACTION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_STATE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_ERROR_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_ERROR_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_ENABLE_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_ENABLE_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEPS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEPS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_WRITE_REGISTER] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_READ_REGISTER] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletPerformanceStepper.SetMotionConfiguration(const rampingMode: byte; const velocityStart: longint; const acceleration1: longint; const velocity1: longint; const accelerationMax: longint; const velocityMax: longint; const decelerationMax: longint; const deceleration1: longint; const velocityStop: longint; const rampZeroWait: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_MOTION_CONFIGURATION, 45);
+  LEConvertUInt8To(rampingMode, 8, request);
+  LEConvertInt32To(velocityStart, 9, request);
+  LEConvertInt32To(acceleration1, 13, request);
+  LEConvertInt32To(velocity1, 17, request);
+  LEConvertInt32To(accelerationMax, 21, request);
+  LEConvertInt32To(velocityMax, 25, request);
+  LEConvertInt32To(decelerationMax, 29, request);
+  LEConvertInt32To(deceleration1, 33, request);
+  LEConvertInt32To(velocityStop, 37, request);
+  LEConvertInt32To(rampZeroWait, 41, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceStepper.GetMotionConfiguration(out rampingMode: byte; out velocityStart: longint; out acceleration1: longint; out velocity1: longint; out accelerationMax: longint; out velocityMax: longint; out decelerationMax: longint; out deceleration1: longint; out velocityStop: longint; out rampZeroWait: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_MOTION_CONFIGURATION, 8);
+  response := SendRequest(request, 45);
+  rampingMode := LEConvertUInt8From(8, response);
+  velocityStart := LEConvertInt32From(9, response);
+  acceleration1 := LEConvertInt32From(13, response);
+  velocity1 := LEConvertInt32From(17, response);
+  accelerationMax := LEConvertInt32From(21, response);
+  velocityMax := LEConvertInt32From(25, response);
+  decelerationMax := LEConvertInt32From(29, response);
+  deceleration1 := LEConvertInt32From(33, response);
+  velocityStop := LEConvertInt32From(37, response);
+  rampZeroWait := LEConvertInt32From(41, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetCurrentPosition(const position: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_CURRENT_POSITION, 12);
+  LEConvertInt32To(position, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.GetCurrentPosition: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_CURRENT_POSITION, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+function TBrickletPerformanceStepper.GetCurrentVelocity: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_CURRENT_VELOCITY, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetTargetPosition(const position: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_TARGET_POSITION, 12);
+  LEConvertInt32To(position, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.GetTargetPosition: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_TARGET_POSITION, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetSteps(const steps: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEPS, 12);
+  LEConvertInt32To(steps, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.GetSteps: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEPS, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+function TBrickletPerformanceStepper.GetRemainingSteps: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_REMAINING_STEPS, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetStepConfiguration(const stepResolution: byte; const interpolation: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEP_CONFIGURATION, 10);
+  LEConvertUInt8To(stepResolution, 8, request);
+  LEConvertBooleanTo(interpolation, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceStepper.GetStepConfiguration(out stepResolution: byte; out interpolation: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEP_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  stepResolution := LEConvertUInt8From(8, response);
+  interpolation := LEConvertBooleanFrom(9, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetMotorCurrent(const current: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_MOTOR_CURRENT, 10);
+  LEConvertUInt16To(current, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.GetMotorCurrent: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_MOTOR_CURRENT, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetEnabled(const enabled: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_ENABLED, 9);
+  LEConvertBooleanTo(enabled, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.GetEnabled: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_ENABLED, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetBasicConfiguration(const standstillCurrent: word; const motorRunCurrent: word; const standstillDelayTime: word; const powerDownTime: word; const stealthThreshold: word; const coolstepThreshold: word; const classicThreshold: word; const highVelocityChopperMode: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_BASIC_CONFIGURATION, 23);
+  LEConvertUInt16To(standstillCurrent, 8, request);
+  LEConvertUInt16To(motorRunCurrent, 10, request);
+  LEConvertUInt16To(standstillDelayTime, 12, request);
+  LEConvertUInt16To(powerDownTime, 14, request);
+  LEConvertUInt16To(stealthThreshold, 16, request);
+  LEConvertUInt16To(coolstepThreshold, 18, request);
+  LEConvertUInt16To(classicThreshold, 20, request);
+  LEConvertBooleanTo(highVelocityChopperMode, 22, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceStepper.GetBasicConfiguration(out standstillCurrent: word; out motorRunCurrent: word; out standstillDelayTime: word; out powerDownTime: word; out stealthThreshold: word; out coolstepThreshold: word; out classicThreshold: word; out highVelocityChopperMode: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_BASIC_CONFIGURATION, 8);
+  response := SendRequest(request, 23);
+  standstillCurrent := LEConvertUInt16From(8, response);
+  motorRunCurrent := LEConvertUInt16From(10, response);
+  standstillDelayTime := LEConvertUInt16From(12, response);
+  powerDownTime := LEConvertUInt16From(14, response);
+  stealthThreshold := LEConvertUInt16From(16, response);
+  coolstepThreshold := LEConvertUInt16From(18, response);
+  classicThreshold := LEConvertUInt16From(20, response);
+  highVelocityChopperMode := LEConvertBooleanFrom(22, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetSpreadcycleConfiguration(const slowDecayDuration: byte; const highVelocityFullstep: boolean; const fastDecayDuration: byte; const hysteresisStartValue: byte; const hysteresisEndValue: shortint; const sineWaveOffset: shortint; const chopperMode: byte; const comparatorBlankTime: byte; const fastDecayWithoutComparator: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_SPREADCYCLE_CONFIGURATION, 17);
+  LEConvertUInt8To(slowDecayDuration, 8, request);
+  LEConvertBooleanTo(highVelocityFullstep, 9, request);
+  LEConvertUInt8To(fastDecayDuration, 10, request);
+  LEConvertUInt8To(hysteresisStartValue, 11, request);
+  LEConvertInt8To(hysteresisEndValue, 12, request);
+  LEConvertInt8To(sineWaveOffset, 13, request);
+  LEConvertUInt8To(chopperMode, 14, request);
+  LEConvertUInt8To(comparatorBlankTime, 15, request);
+  LEConvertBooleanTo(fastDecayWithoutComparator, 16, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceStepper.GetSpreadcycleConfiguration(out slowDecayDuration: byte; out highVelocityFullstep: boolean; out enableRandomSlowDecay: boolean; out fastDecayDuration: byte; out hysteresisStartValue: byte; out hysteresisEndValue: shortint; out sineWaveOffset: shortint; out chopperMode: byte; out comparatorBlankTime: byte; out fastDecayWithoutComparator: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_SPREADCYCLE_CONFIGURATION, 8);
+  response := SendRequest(request, 18);
+  slowDecayDuration := LEConvertUInt8From(8, response);
+  highVelocityFullstep := LEConvertBooleanFrom(9, response);
+  enableRandomSlowDecay := LEConvertBooleanFrom(10, response);
+  fastDecayDuration := LEConvertUInt8From(11, response);
+  hysteresisStartValue := LEConvertUInt8From(12, response);
+  hysteresisEndValue := LEConvertInt8From(13, response);
+  sineWaveOffset := LEConvertInt8From(14, response);
+  chopperMode := LEConvertUInt8From(15, response);
+  comparatorBlankTime := LEConvertUInt8From(16, response);
+  fastDecayWithoutComparator := LEConvertBooleanFrom(17, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetStealthConfiguration(const enableStealth: boolean; const offset: byte; const gradient: byte; const enableAutoscale: boolean; const enableAutogradient: boolean; const freewheelMode: byte; const regulationLoopGradient: byte; const amplitudeLimit: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEALTH_CONFIGURATION, 16);
+  LEConvertBooleanTo(enableStealth, 8, request);
+  LEConvertUInt8To(offset, 9, request);
+  LEConvertUInt8To(gradient, 10, request);
+  LEConvertBooleanTo(enableAutoscale, 11, request);
+  LEConvertBooleanTo(enableAutogradient, 12, request);
+  LEConvertUInt8To(freewheelMode, 13, request);
+  LEConvertUInt8To(regulationLoopGradient, 14, request);
+  LEConvertUInt8To(amplitudeLimit, 15, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceStepper.GetStealthConfiguration(out enableStealth: boolean; out offset: byte; out gradient: byte; out enableAutoscale: boolean; out enableAutogradient: boolean; out freewheelMode: byte; out regulationLoopGradient: byte; out amplitudeLimit: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEALTH_CONFIGURATION, 8);
+  response := SendRequest(request, 16);
+  enableStealth := LEConvertBooleanFrom(8, response);
+  offset := LEConvertUInt8From(9, response);
+  gradient := LEConvertUInt8From(10, response);
+  enableAutoscale := LEConvertBooleanFrom(11, response);
+  enableAutogradient := LEConvertBooleanFrom(12, response);
+  freewheelMode := LEConvertUInt8From(13, response);
+  regulationLoopGradient := LEConvertUInt8From(14, response);
+  amplitudeLimit := LEConvertUInt8From(15, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetCoolstepConfiguration(const minimumStallguardValue: byte; const maximumStallguardValue: byte; const currentUpStepWidth: byte; const currentDownStepWidth: byte; const minimumCurrent: byte; const stallguardThresholdValue: shortint; const stallguardMode: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_COOLSTEP_CONFIGURATION, 15);
+  LEConvertUInt8To(minimumStallguardValue, 8, request);
+  LEConvertUInt8To(maximumStallguardValue, 9, request);
+  LEConvertUInt8To(currentUpStepWidth, 10, request);
+  LEConvertUInt8To(currentDownStepWidth, 11, request);
+  LEConvertUInt8To(minimumCurrent, 12, request);
+  LEConvertInt8To(stallguardThresholdValue, 13, request);
+  LEConvertUInt8To(stallguardMode, 14, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceStepper.GetCoolstepConfiguration(out minimumStallguardValue: byte; out maximumStallguardValue: byte; out currentUpStepWidth: byte; out currentDownStepWidth: byte; out minimumCurrent: byte; out stallguardThresholdValue: shortint; out stallguardMode: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_COOLSTEP_CONFIGURATION, 8);
+  response := SendRequest(request, 15);
+  minimumStallguardValue := LEConvertUInt8From(8, response);
+  maximumStallguardValue := LEConvertUInt8From(9, response);
+  currentUpStepWidth := LEConvertUInt8From(10, response);
+  currentDownStepWidth := LEConvertUInt8From(11, response);
+  minimumCurrent := LEConvertUInt8From(12, response);
+  stallguardThresholdValue := LEConvertInt8From(13, response);
+  stallguardMode := LEConvertUInt8From(14, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetShortConfiguration(const disableShortToVoltageProtection: boolean; const disableShortToGroundProtection: boolean; const shortToVoltageLevel: byte; const shortToGroundLevel: byte; const spikeFilterBandwidth: byte; const shortDetectionDelay: boolean; const filterTime: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_SHORT_CONFIGURATION, 15);
+  LEConvertBooleanTo(disableShortToVoltageProtection, 8, request);
+  LEConvertBooleanTo(disableShortToGroundProtection, 9, request);
+  LEConvertUInt8To(shortToVoltageLevel, 10, request);
+  LEConvertUInt8To(shortToGroundLevel, 11, request);
+  LEConvertUInt8To(spikeFilterBandwidth, 12, request);
+  LEConvertBooleanTo(shortDetectionDelay, 13, request);
+  LEConvertUInt8To(filterTime, 14, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceStepper.GetShortConfiguration(out disableShortToVoltageProtection: boolean; out disableShortToGroundProtection: boolean; out shortToVoltageLevel: byte; out shortToGroundLevel: byte; out spikeFilterBandwidth: byte; out shortDetectionDelay: boolean; out filterTime: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_SHORT_CONFIGURATION, 8);
+  response := SendRequest(request, 15);
+  disableShortToVoltageProtection := LEConvertBooleanFrom(8, response);
+  disableShortToGroundProtection := LEConvertBooleanFrom(9, response);
+  shortToVoltageLevel := LEConvertUInt8From(10, response);
+  shortToGroundLevel := LEConvertUInt8From(11, response);
+  spikeFilterBandwidth := LEConvertUInt8From(12, response);
+  shortDetectionDelay := LEConvertBooleanFrom(13, response);
+  filterTime := LEConvertUInt8From(14, response);
+end;
+
+procedure TBrickletPerformanceStepper.GetDriverStatus(out openLoad: byte; out shortToGround: byte; out overTemperature: byte; out motorStalled: boolean; out actualMotorCurrent: byte; out fullStepActive: boolean; out stallguardResult: byte; out stealthVoltageAmplitude: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_DRIVER_STATUS, 8);
+  response := SendRequest(request, 16);
+  openLoad := LEConvertUInt8From(8, response);
+  shortToGround := LEConvertUInt8From(9, response);
+  overTemperature := LEConvertUInt8From(10, response);
+  motorStalled := LEConvertBooleanFrom(11, response);
+  actualMotorCurrent := LEConvertUInt8From(12, response);
+  fullStepActive := LEConvertBooleanFrom(13, response);
+  stallguardResult := LEConvertUInt8From(14, response);
+  stealthVoltageAmplitude := LEConvertUInt8From(15, response);
+end;
+
+function TBrickletPerformanceStepper.GetInputVoltage: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_INPUT_VOLTAGE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+function TBrickletPerformanceStepper.GetTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetGPIOConfiguration(const debounce: word; const stopDeceleration: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_CONFIGURATION, 14);
+  LEConvertUInt16To(debounce, 8, request);
+  LEConvertInt32To(stopDeceleration, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceStepper.GetGPIOConfiguration(out debounce: word; out stopDeceleration: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_CONFIGURATION, 8);
+  response := SendRequest(request, 14);
+  debounce := LEConvertUInt16From(8, response);
+  stopDeceleration := LEConvertInt32From(10, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetGPIOAction(const channel: byte; const action: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_ACTION, 13);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt32To(action, 9, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.GetGPIOAction(const channel: byte): longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_ACTION, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+function TBrickletPerformanceStepper.GetGPIOState: TArray0To1OfBoolean;
+var request, response: TByteArray; i: longint; gpioStateBits: array [0..0] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_STATE, 8);
+  response := SendRequest(request, 9);
+  FillChar(gpioStateBits[0], Length(gpioStateBits) * SizeOf(gpioStateBits[0]), 0);
+  for i := 0 to 0 do gpioStateBits[i] := LEConvertUInt8From(8 + (i * 1), response);
+  for i := 0 to 1 do result[i] := ((gpioStateBits[Floor(i / 8)] and (1 shl (i mod 8))) <> 0);
+end;
+
+procedure TBrickletPerformanceStepper.SetErrorLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_ERROR_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.GetErrorLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_ERROR_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetEnableLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_ENABLE_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.GetEnableLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_ENABLE_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetStepsLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STEPS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.GetStepsLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STEPS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetGPIOLEDConfig(const channel: byte; const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_GPIO_LED_CONFIG, 10);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertUInt8To(config, 9, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.GetGPIOLEDConfig(const channel: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_GPIO_LED_CONFIG, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletPerformanceStepper.WriteRegister(const register: byte; const value: longword): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_WRITE_REGISTER, 13);
+  LEConvertUInt8To(register, 8, request);
+  LEConvertUInt32To(value, 9, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.ReadRegister(const register: byte; out status: byte; out value: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_READ_REGISTER, 9);
+  LEConvertUInt8To(register, 8, request);
+  response := SendRequest(request, 13);
+  status := LEConvertUInt8From(8, response);
+  value := LEConvertUInt32From(9, response);
+end;
+
+procedure TBrickletPerformanceStepper.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletPerformanceStepper.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletPerformanceStepper.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletPerformanceStepper.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletPerformanceStepper.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletPerformanceStepper.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletPerformanceStepper.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_PERFORMANCE_STEPPER_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+end.
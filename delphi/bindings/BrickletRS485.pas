@@ -0,0 +1,2827 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletRS485;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_RS485_DEVICE_IDENTIFIER = 277;
+  BRICKLET_RS485_DEVICE_DISPLAY_NAME = 'RS485 Bricklet';
+
+  BRICKLET_RS485_FUNCTION_WRITE_LOW_LEVEL = 1;
+  BRICKLET_RS485_FUNCTION_READ_LOW_LEVEL = 2;
+  BRICKLET_RS485_FUNCTION_ENABLE_READ_CALLBACK = 3;
+  BRICKLET_RS485_FUNCTION_DISABLE_READ_CALLBACK = 4;
+  BRICKLET_RS485_FUNCTION_IS_READ_CALLBACK_ENABLED = 5;
+  BRICKLET_RS485_FUNCTION_SET_RS485_CONFIGURATION = 6;
+  BRICKLET_RS485_FUNCTION_GET_RS485_CONFIGURATION = 7;
+  BRICKLET_RS485_FUNCTION_SET_MODBUS_CONFIGURATION = 8;
+  BRICKLET_RS485_FUNCTION_GET_MODBUS_CONFIGURATION = 9;
+  BRICKLET_RS485_FUNCTION_SET_MODE = 10;
+  BRICKLET_RS485_FUNCTION_GET_MODE = 11;
+  BRICKLET_RS485_FUNCTION_SET_COMMUNICATION_LED_CONFIG = 12;
+  BRICKLET_RS485_FUNCTION_GET_COMMUNICATION_LED_CONFIG = 13;
+  BRICKLET_RS485_FUNCTION_SET_ERROR_LED_CONFIG = 14;
+  BRICKLET_RS485_FUNCTION_GET_ERROR_LED_CONFIG = 15;
+  BRICKLET_RS485_FUNCTION_SET_BUFFER_CONFIG = 16;
+  BRICKLET_RS485_FUNCTION_GET_BUFFER_CONFIG = 17;
+  BRICKLET_RS485_FUNCTION_GET_BUFFER_STATUS = 18;
+  BRICKLET_RS485_FUNCTION_ENABLE_ERROR_COUNT_CALLBACK = 19;
+  BRICKLET_RS485_FUNCTION_DISABLE_ERROR_COUNT_CALLBACK = 20;
+  BRICKLET_RS485_FUNCTION_IS_ERROR_COUNT_CALLBACK_ENABLED = 21;
+  BRICKLET_RS485_FUNCTION_GET_ERROR_COUNT = 22;
+  BRICKLET_RS485_FUNCTION_GET_MODBUS_COMMON_ERROR_COUNT = 23;
+  BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_REPORT_EXCEPTION = 24;
+  BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_COILS_REQUEST_LOW_LEVEL = 25;
+  BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_COILS = 26;
+  BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_HOLDING_REGISTERS_REQUEST_LOW_LEVEL = 27;
+  BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_HOLDING_REGISTERS = 28;
+  BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_COIL_REQUEST = 29;
+  BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_SINGLE_COIL = 30;
+  BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_REGISTER_REQUEST = 31;
+  BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_SINGLE_REGISTER = 32;
+  BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_COILS_REQUEST = 33;
+  BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL = 34;
+  BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_REGISTERS_REQUEST = 35;
+  BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL = 36;
+  BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_DISCRETE_INPUTS_REQUEST_LOW_LEVEL = 37;
+  BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_DISCRETE_INPUTS = 38;
+  BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_INPUT_REGISTERS_REQUEST_LOW_LEVEL = 39;
+  BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_INPUT_REGISTERS = 40;
+  BRICKLET_RS485_FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION = 59;
+  BRICKLET_RS485_FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION = 60;
+  BRICKLET_RS485_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_RS485_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_RS485_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_RS485_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_RS485_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_RS485_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_RS485_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_RS485_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_RS485_FUNCTION_RESET = 243;
+  BRICKLET_RS485_FUNCTION_WRITE_UID = 248;
+  BRICKLET_RS485_FUNCTION_READ_UID = 249;
+  BRICKLET_RS485_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_RS485_CALLBACK_READ_LOW_LEVEL = 41;
+  BRICKLET_RS485_CALLBACK_ERROR_COUNT = 42;
+  BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_READ_COILS_REQUEST = 43;
+  BRICKLET_RS485_CALLBACK_MODBUS_MASTER_READ_COILS_RESPONSE_LOW_LEVEL = 44;
+  BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_READ_HOLDING_REGISTERS_REQUEST = 45;
+  BRICKLET_RS485_CALLBACK_MODBUS_MASTER_READ_HOLDING_REGISTERS_RESPONSE_LOW_LEVEL = 46;
+  BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_WRITE_SINGLE_COIL_REQUEST = 47;
+  BRICKLET_RS485_CALLBACK_MODBUS_MASTER_WRITE_SINGLE_COIL_RESPONSE = 48;
+  BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_WRITE_SINGLE_REGISTER_REQUEST = 49;
+  BRICKLET_RS485_CALLBACK_MODBUS_MASTER_WRITE_SINGLE_REGISTER_RESPONSE = 50;
+  BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_COILS_REQUEST_LOW_LEVEL = 51;
+  BRICKLET_RS485_CALLBACK_MODBUS_MASTER_WRITE_MULTIPLE_COILS_RESPONSE = 52;
+  BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_REGISTERS_REQUEST_LOW_LEVEL = 53;
+  BRICKLET_RS485_CALLBACK_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_RESPONSE = 54;
+  BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_READ_DISCRETE_INPUTS_REQUEST = 55;
+  BRICKLET_RS485_CALLBACK_MODBUS_MASTER_READ_DISCRETE_INPUTS_RESPONSE_LOW_LEVEL = 56;
+  BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_READ_INPUT_REGISTERS_REQUEST = 57;
+  BRICKLET_RS485_CALLBACK_MODBUS_MASTER_READ_INPUT_REGISTERS_RESPONSE_LOW_LEVEL = 58;
+  BRICKLET_RS485_CALLBACK_FRAME_READABLE = 61;
+
+  BRICKLET_RS485_PARITY_NONE = 0;
+  BRICKLET_RS485_PARITY_ODD = 1;
+  BRICKLET_RS485_PARITY_EVEN = 2;
+  BRICKLET_RS485_STOPBITS_1 = 1;
+  BRICKLET_RS485_STOPBITS_2 = 2;
+  BRICKLET_RS485_WORDLENGTH_5 = 5;
+  BRICKLET_RS485_WORDLENGTH_6 = 6;
+  BRICKLET_RS485_WORDLENGTH_7 = 7;
+  BRICKLET_RS485_WORDLENGTH_8 = 8;
+  BRICKLET_RS485_DUPLEX_HALF = 0;
+  BRICKLET_RS485_DUPLEX_FULL = 1;
+  BRICKLET_RS485_MODE_RS485 = 0;
+  BRICKLET_RS485_MODE_MODBUS_MASTER_RTU = 1;
+  BRICKLET_RS485_MODE_MODBUS_SLAVE_RTU = 2;
+  BRICKLET_RS485_COMMUNICATION_LED_CONFIG_OFF = 0;
+  BRICKLET_RS485_COMMUNICATION_LED_CONFIG_ON = 1;
+  BRICKLET_RS485_COMMUNICATION_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_RS485_COMMUNICATION_LED_CONFIG_SHOW_COMMUNICATION = 3;
+  BRICKLET_RS485_ERROR_LED_CONFIG_OFF = 0;
+  BRICKLET_RS485_ERROR_LED_CONFIG_ON = 1;
+  BRICKLET_RS485_ERROR_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_RS485_ERROR_LED_CONFIG_SHOW_ERROR = 3;
+  BRICKLET_RS485_EXCEPTION_CODE_TIMEOUT = -1;
+  BRICKLET_RS485_EXCEPTION_CODE_SUCCESS = 0;
+  BRICKLET_RS485_EXCEPTION_CODE_ILLEGAL_FUNCTION = 1;
+  BRICKLET_RS485_EXCEPTION_CODE_ILLEGAL_DATA_ADDRESS = 2;
+  BRICKLET_RS485_EXCEPTION_CODE_ILLEGAL_DATA_VALUE = 3;
+  BRICKLET_RS485_EXCEPTION_CODE_SLAVE_DEVICE_FAILURE = 4;
+  BRICKLET_RS485_EXCEPTION_CODE_ACKNOWLEDGE = 5;
+  BRICKLET_RS485_EXCEPTION_CODE_SLAVE_DEVICE_BUSY = 6;
+  BRICKLET_RS485_EXCEPTION_CODE_MEMORY_PARITY_ERROR = 8;
+  BRICKLET_RS485_EXCEPTION_CODE_GATEWAY_PATH_UNAVAILABLE = 10;
+  BRICKLET_RS485_EXCEPTION_CODE_GATEWAY_TARGET_DEVICE_FAILED_TO_RESPOND = 11;
+  BRICKLET_RS485_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_RS485_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_RS485_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_RS485_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_RS485_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_RS485_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_RS485_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_RS485_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_RS485_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_RS485_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_RS485_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_RS485_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_RS485_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_RS485_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_RS485_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To26OfUInt16 = array [0..26] of word;
+  TArray0To28OfUInt16 = array [0..28] of word;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To439OfBoolean = array [0..439] of boolean;
+  TArray0To463OfBoolean = array [0..463] of boolean;
+  TArray0To471OfBoolean = array [0..471] of boolean;
+  TArray0To59OfChar = array [0..59] of char;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+  TArrayOfBoolean = array of boolean;
+  TArrayOfChar = array of char;
+  TArrayOfUInt16 = array of word;
+
+  TReadHighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TModbusMasterReadCoilsResponseHighLevelCallbackState = record data: TArrayOfBoolean; length: word; end;
+  TModbusMasterReadHoldingRegistersResponseHighLevelCallbackState = record data: TArrayOfUInt16; length: word; end;
+  TModbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState = record data: TArrayOfBoolean; length: word; end;
+  TModbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState = record data: TArrayOfUInt16; length: word; end;
+  TModbusMasterReadDiscreteInputsResponseHighLevelCallbackState = record data: TArrayOfBoolean; length: word; end;
+  TModbusMasterReadInputRegistersResponseHighLevelCallbackState = record data: TArrayOfUInt16; length: word; end;
+
+  TBrickletRS485 = class;
+  TBrickletRS485NotifyReadLowLevel = procedure(sender: TBrickletRS485; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar) of object;
+  TBrickletRS485NotifyRead = procedure(sender: TBrickletRS485; const message: TArrayOfChar) of object;
+  TBrickletRS485NotifyErrorCount = procedure(sender: TBrickletRS485; const overrunErrorCount: longword; const parityErrorCount: longword) of object;
+  TBrickletRS485NotifyModbusSlaveReadCoilsRequest = procedure(sender: TBrickletRS485; const requestID: byte; const startingAddress: longword; const count: word) of object;
+  TBrickletRS485NotifyModbusMasterReadCoilsResponseLowLevel = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint; const coilsLength: word; const coilsChunkOffset: word; const coilsChunkData: TArray0To463OfBoolean) of object;
+  TBrickletRS485NotifyModbusMasterReadCoilsResponse = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint; const coils: TArrayOfBoolean) of object;
+  TBrickletRS485NotifyModbusSlaveReadHoldingRegistersRequest = procedure(sender: TBrickletRS485; const requestID: byte; const startingAddress: longword; const count: word) of object;
+  TBrickletRS485NotifyModbusMasterReadHoldingRegistersResponseLowLevel = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint; const holdingRegistersLength: word; const holdingRegistersChunkOffset: word; const holdingRegistersChunkData: TArray0To28OfUInt16) of object;
+  TBrickletRS485NotifyModbusMasterReadHoldingRegistersResponse = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint; const holdingRegisters: TArrayOfUInt16) of object;
+  TBrickletRS485NotifyModbusSlaveWriteSingleCoilRequest = procedure(sender: TBrickletRS485; const requestID: byte; const coilAddress: longword; const coilValue: boolean) of object;
+  TBrickletRS485NotifyModbusMasterWriteSingleCoilResponse = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint) of object;
+  TBrickletRS485NotifyModbusSlaveWriteSingleRegisterRequest = procedure(sender: TBrickletRS485; const requestID: byte; const registerAddress: longword; const registerValue: word) of object;
+  TBrickletRS485NotifyModbusMasterWriteSingleRegisterResponse = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint) of object;
+  TBrickletRS485NotifyModbusSlaveWriteMultipleCoilsRequestLowLevel = procedure(sender: TBrickletRS485; const requestID: byte; const startingAddress: longword; const coilsLength: word; const coilsChunkOffset: word; const coilsChunkData: TArray0To439OfBoolean) of object;
+  TBrickletRS485NotifyModbusSlaveWriteMultipleCoilsRequest = procedure(sender: TBrickletRS485; const requestID: byte; const startingAddress: longword; const coils: TArrayOfBoolean) of object;
+  TBrickletRS485NotifyModbusMasterWriteMultipleCoilsResponse = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint) of object;
+  TBrickletRS485NotifyModbusSlaveWriteMultipleRegistersRequestLowLevel = procedure(sender: TBrickletRS485; const requestID: byte; const startingAddress: longword; const registersLength: word; const registersChunkOffset: word; const registersChunkData: TArray0To26OfUInt16) of object;
+  TBrickletRS485NotifyModbusSlaveWriteMultipleRegistersRequest = procedure(sender: TBrickletRS485; const requestID: byte; const startingAddress: longword; const registers: TArrayOfUInt16) of object;
+  TBrickletRS485NotifyModbusMasterWriteMultipleRegistersResponse = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint) of object;
+  TBrickletRS485NotifyModbusSlaveReadDiscreteInputsRequest = procedure(sender: TBrickletRS485; const requestID: byte; const startingAddress: longword; const count: word) of object;
+  TBrickletRS485NotifyModbusMasterReadDiscreteInputsResponseLowLevel = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint; const discreteInputsLength: word; const discreteInputsChunkOffset: word; const discreteInputsChunkData: TArray0To463OfBoolean) of object;
+  TBrickletRS485NotifyModbusMasterReadDiscreteInputsResponse = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint; const discreteInputs: TArrayOfBoolean) of object;
+  TBrickletRS485NotifyModbusSlaveReadInputRegistersRequest = procedure(sender: TBrickletRS485; const requestID: byte; const startingAddress: longword; const count: word) of object;
+  TBrickletRS485NotifyModbusMasterReadInputRegistersResponseLowLevel = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint; const inputRegistersLength: word; const inputRegistersChunkOffset: word; const inputRegistersChunkData: TArray0To28OfUInt16) of object;
+  TBrickletRS485NotifyModbusMasterReadInputRegistersResponse = procedure(sender: TBrickletRS485; const requestID: byte; const exceptionCode: shortint; const inputRegisters: TArrayOfUInt16) of object;
+  TBrickletRS485NotifyFrameReadable = procedure(sender: TBrickletRS485; const frameCount: word) of object;
+
+  /// <summary>
+  ///  Communicates with RS485/Modbus devices with full- or half-duplex
+  /// </summary>
+  TBrickletRS485 = class(TDevice)
+  private
+    streamMutex: TCriticalSection;
+    readHighLevelCallbackState: TReadHighLevelCallbackState;
+    modbusMasterReadCoilsResponseHighLevelCallbackState: TModbusMasterReadCoilsResponseHighLevelCallbackState;
+    modbusMasterReadHoldingRegistersResponseHighLevelCallbackState: TModbusMasterReadHoldingRegistersResponseHighLevelCallbackState;
+    modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState: TModbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState;
+    modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState: TModbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState;
+    modbusMasterReadDiscreteInputsResponseHighLevelCallbackState: TModbusMasterReadDiscreteInputsResponseHighLevelCallbackState;
+    modbusMasterReadInputRegistersResponseHighLevelCallbackState: TModbusMasterReadInputRegistersResponseHighLevelCallbackState;
+    readLowLevelCallback: TBrickletRS485NotifyReadLowLevel;
+    readCallback: TBrickletRS485NotifyRead;
+    errorCountCallback: TBrickletRS485NotifyErrorCount;
+    modbusSlaveReadCoilsRequestCallback: TBrickletRS485NotifyModbusSlaveReadCoilsRequest;
+    modbusMasterReadCoilsResponseLowLevelCallback: TBrickletRS485NotifyModbusMasterReadCoilsResponseLowLevel;
+    modbusMasterReadCoilsResponseCallback: TBrickletRS485NotifyModbusMasterReadCoilsResponse;
+    modbusSlaveReadHoldingRegistersRequestCallback: TBrickletRS485NotifyModbusSlaveReadHoldingRegistersRequest;
+    modbusMasterReadHoldingRegistersResponseLowLevelCallback: TBrickletRS485NotifyModbusMasterReadHoldingRegistersResponseLowLevel;
+    modbusMasterReadHoldingRegistersResponseCallback: TBrickletRS485NotifyModbusMasterReadHoldingRegistersResponse;
+    modbusSlaveWriteSingleCoilRequestCallback: TBrickletRS485NotifyModbusSlaveWriteSingleCoilRequest;
+    modbusMasterWriteSingleCoilResponseCallback: TBrickletRS485NotifyModbusMasterWriteSingleCoilResponse;
+    modbusSlaveWriteSingleRegisterRequestCallback: TBrickletRS485NotifyModbusSlaveWriteSingleRegisterRequest;
+    modbusMasterWriteSingleRegisterResponseCallback: TBrickletRS485NotifyModbusMasterWriteSingleRegisterResponse;
+    modbusSlaveWriteMultipleCoilsRequestLowLevelCallback: TBrickletRS485NotifyModbusSlaveWriteMultipleCoilsRequestLowLevel;
+    modbusSlaveWriteMultipleCoilsRequestCallback: TBrickletRS485NotifyModbusSlaveWriteMultipleCoilsRequest;
+    modbusMasterWriteMultipleCoilsResponseCallback: TBrickletRS485NotifyModbusMasterWriteMultipleCoilsResponse;
+    modbusSlaveWriteMultipleRegistersRequestLowLevelCallback: TBrickletRS485NotifyModbusSlaveWriteMultipleRegistersRequestLowLevel;
+    modbusSlaveWriteMultipleRegistersRequestCallback: TBrickletRS485NotifyModbusSlaveWriteMultipleRegistersRequest;
+    modbusMasterWriteMultipleRegistersResponseCallback: TBrickletRS485NotifyModbusMasterWriteMultipleRegistersResponse;
+    modbusSlaveReadDiscreteInputsRequestCallback: TBrickletRS485NotifyModbusSlaveReadDiscreteInputsRequest;
+    modbusMasterReadDiscreteInputsResponseLowLevelCallback: TBrickletRS485NotifyModbusMasterReadDiscreteInputsResponseLowLevel;
+    modbusMasterReadDiscreteInputsResponseCallback: TBrickletRS485NotifyModbusMasterReadDiscreteInputsResponse;
+    modbusSlaveReadInputRegistersRequestCallback: TBrickletRS485NotifyModbusSlaveReadInputRegistersRequest;
+    modbusMasterReadInputRegistersResponseLowLevelCallback: TBrickletRS485NotifyModbusMasterReadInputRegistersResponseLowLevel;
+    modbusMasterReadInputRegistersResponseCallback: TBrickletRS485NotifyModbusMasterReadInputRegistersResponse;
+    frameReadableCallback: TBrickletRS485NotifyFrameReadable;
+  protected
+    procedure CallbackWrapperReadLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperErrorCount(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusSlaveReadCoilsRequest(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusMasterReadCoilsResponseLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusSlaveReadHoldingRegistersRequest(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusMasterReadHoldingRegistersResponseLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusSlaveWriteSingleCoilRequest(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusMasterWriteSingleCoilResponse(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusSlaveWriteSingleRegisterRequest(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusMasterWriteSingleRegisterResponse(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusSlaveWriteMultipleCoilsRequestLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusMasterWriteMultipleCoilsResponse(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusSlaveWriteMultipleRegistersRequestLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusMasterWriteMultipleRegistersResponse(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusSlaveReadDiscreteInputsRequest(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusMasterReadDiscreteInputsResponseLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusSlaveReadInputRegistersRequest(const packet: TByteArray); virtual;
+    procedure CallbackWrapperModbusMasterReadInputRegistersResponseLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperFrameReadable(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Writes characters to the RS485 interface. The characters can be binary data,
+    ///  ASCII or similar is not necessary.
+    ///  
+    ///  The return value is the number of characters that were written.
+    ///  
+    ///  See <see cref="BrickletRS485.TBrickletRS485.SetRS485Configuration"/> for configuration possibilities
+    ///  regarding baudrate, parity and so on.
+    /// </summary>
+    function WriteLowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar): byte; virtual;
+
+    /// <summary>
+    ///  Writes characters to the RS485 interface. The characters can be binary data,
+    ///  ASCII or similar is not necessary.
+    ///  
+    ///  The return value is the number of characters that were written.
+    ///  
+    ///  See <see cref="BrickletRS485.TBrickletRS485.SetRS485Configuration"/> for configuration possibilities
+    ///  regarding baudrate, parity and so on.
+    /// </summary>
+    function Write(const message: array of char): word; virtual;
+
+    /// <summary>
+    ///  Returns up to *length* characters from receive buffer.
+    ///  
+    ///  Instead of polling with this function, you can also use
+    ///  callbacks. But note that this function will return available
+    ///  data only when the read callback is disabled.
+    ///  See <see cref="BrickletRS485.TBrickletRS485.EnableReadCallback"/> and <see cref="BrickletRS485.TBrickletRS485.OnRead"/> callback.
+    /// </summary>
+    procedure ReadLowLevel(const length_: word; out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar); virtual;
+
+    /// <summary>
+    ///  Returns up to *length* characters from receive buffer.
+    ///  
+    ///  Instead of polling with this function, you can also use
+    ///  callbacks. But note that this function will return available
+    ///  data only when the read callback is disabled.
+    ///  See <see cref="BrickletRS485.TBrickletRS485.EnableReadCallback"/> and <see cref="BrickletRS485.TBrickletRS485.OnRead"/> callback.
+    /// </summary>
+    function Read(const length_: word): TArrayOfChar; virtual;
+
+    /// <summary>
+    ///  Enables the <see cref="BrickletRS485.TBrickletRS485.OnRead"/> callback. This will disable the <see cref="BrickletRS485.TBrickletRS485.OnFrameReadable"/> callback.
+    ///  
+    ///  By default the callback is disabled.
+    /// </summary>
+    procedure EnableReadCallback; virtual;
+
+    /// <summary>
+    ///  Disables the <see cref="BrickletRS485.TBrickletRS485.OnRead"/> callback.
+    ///  
+    ///  By default the callback is disabled.
+    /// </summary>
+    procedure DisableReadCallback; virtual;
+
+    /// <summary>
+    ///  Returns *true* if the <see cref="BrickletRS485.TBrickletRS485.OnRead"/> callback is enabled,
+    ///  *false* otherwise.
+    /// </summary>
+    function IsReadCallbackEnabled: boolean; virtual;
+
+    /// <summary>
+    ///  Sets the configuration for the RS485 communication.
+    /// </summary>
+    procedure SetRS485Configuration(const baudrate: longword; const parity: byte; const stopbits: byte; const wordlength: byte; const duplex: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletRS485.TBrickletRS485.SetRS485Configuration"/>.
+    /// </summary>
+    procedure GetRS485Configuration(out baudrate: longword; out parity: byte; out stopbits: byte; out wordlength: byte; out duplex: byte); virtual;
+
+    /// <summary>
+    ///  Sets the configuration for the RS485 Modbus communication. Available options:
+    ///  
+    ///  * Slave Address: Address to be used as the Modbus slave address in Modbus slave mode. Valid Modbus slave address range is 1 to 247.
+    ///  * Master Request Timeout: Specifies how long the master should wait for a response from a slave when in Modbus master mode.
+    /// </summary>
+    procedure SetModbusConfiguration(const slaveAddress: byte; const masterRequestTimeout: longword); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletRS485.TBrickletRS485.SetModbusConfiguration"/>.
+    /// </summary>
+    procedure GetModbusConfiguration(out slaveAddress: byte; out masterRequestTimeout: longword); virtual;
+
+    /// <summary>
+    ///  Sets the mode of the Bricklet in which it operates. Available options are
+    ///  
+    ///  * RS485,
+    ///  * Modbus Master RTU and
+    ///  * Modbus Slave RTU.
+    /// </summary>
+    procedure SetMode(const mode: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletRS485.TBrickletRS485.SetMode"/>.
+    /// </summary>
+    function GetMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the communication LED configuration. By default the LED shows RS485
+    ///  communication traffic by flickering.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is off.
+    /// </summary>
+    procedure SetCommunicationLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletRS485.TBrickletRS485.SetCommunicationLEDConfig"/>
+    /// </summary>
+    function GetCommunicationLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Sets the error LED configuration.
+    ///  
+    ///  By default the error LED turns on if there is any error (see <see cref="BrickletRS485.TBrickletRS485.OnErrorCount"/>
+    ///  callback). If you call this function with the SHOW ERROR option again, the LED
+    ///  will turn off until the next error occurs.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is off.
+    /// </summary>
+    procedure SetErrorLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletRS485.TBrickletRS485.SetErrorLEDConfig"/>.
+    /// </summary>
+    function GetErrorLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Sets the send and receive buffer size in byte. In sum there is
+    ///  10240 byte (10KiB) buffer available and the minimum buffer size
+    ///  is 1024 byte (1KiB) for both.
+    ///  
+    ///  The current buffer content is lost if this function is called.
+    ///  
+    ///  The send buffer holds data that was given by <see cref="BrickletRS485.TBrickletRS485.Write"/> and
+    ///  could not be written yet. The receive buffer holds data that is
+    ///  received through RS485 but could not yet be send to the
+    ///  user, either by <see cref="BrickletRS485.TBrickletRS485.Read"/> or through <see cref="BrickletRS485.TBrickletRS485.OnRead"/> callback.
+    /// </summary>
+    procedure SetBufferConfig(const sendBufferSize: word; const receiveBufferSize: word); virtual;
+
+    /// <summary>
+    ///  Returns the buffer configuration as set by <see cref="BrickletRS485.TBrickletRS485.SetBufferConfig"/>.
+    /// </summary>
+    procedure GetBufferConfig(out sendBufferSize: word; out receiveBufferSize: word); virtual;
+
+    /// <summary>
+    ///  Returns the currently used bytes for the send and received buffer.
+    ///  
+    ///  See <see cref="BrickletRS485.TBrickletRS485.SetBufferConfig"/> for buffer size configuration.
+    /// </summary>
+    procedure GetBufferStatus(out sendBufferUsed: word; out receiveBufferUsed: word); virtual;
+
+    /// <summary>
+    ///  Enables the <see cref="BrickletRS485.TBrickletRS485.OnErrorCount"/> callback.
+    ///  
+    ///  By default the callback is disabled.
+    /// </summary>
+    procedure EnableErrorCountCallback; virtual;
+
+    /// <summary>
+    ///  Disables the <see cref="BrickletRS485.TBrickletRS485.OnErrorCount"/> callback.
+    ///  
+    ///  By default the callback is disabled.
+    /// </summary>
+    procedure DisableErrorCountCallback; virtual;
+
+    /// <summary>
+    ///  Returns *true* if the <see cref="BrickletRS485.TBrickletRS485.OnErrorCount"/> callback is enabled,
+    ///  *false* otherwise.
+    /// </summary>
+    function IsErrorCountCallbackEnabled: boolean; virtual;
+
+    /// <summary>
+    ///  Returns the current number of overrun and parity errors.
+    /// </summary>
+    procedure GetErrorCount(out overrunErrorCount: longword; out parityErrorCount: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current number of errors occurred in Modbus mode.
+    ///  
+    ///  * Timeout Error Count: Number of timeouts occurred.
+    ///  * Checksum Error Count: Number of failures due to Modbus frame CRC16 checksum mismatch.
+    ///  * Frame Too Big Error Count: Number of times frames were rejected because they exceeded maximum Modbus frame size which is 256 bytes.
+    ///  * Illegal Function Error Count: Number of errors when an unimplemented or illegal function is requested. This corresponds to Modbus exception code 1.
+    ///  * Illegal Data Address Error Count: Number of errors due to invalid data address. This corresponds to Modbus exception code 2.
+    ///  * Illegal Data Value Error Count: Number of errors due to invalid data value. This corresponds to Modbus exception code 3.
+    ///  * Slave Device Failure Error Count: Number of errors occurred on the slave device which were unrecoverable. This corresponds to Modbus exception code 4.
+    /// </summary>
+    procedure GetModbusCommonErrorCount(out timeoutErrorCount: longword; out checksumErrorCount: longword; out frameTooBigErrorCount: longword; out illegalFunctionErrorCount: longword; out illegalDataAddressErrorCount: longword; out illegalDataValueErrorCount: longword; out slaveDeviceFailureErrorCount: longword); virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to report a Modbus exception for
+    ///  a Modbus master request.
+    ///  
+    ///  * Request ID: Request ID of the request received by the slave.
+    ///  * Exception Code: Modbus exception code to report to the Modbus master.
+    /// </summary>
+    procedure ModbusSlaveReportException(const requestID: byte; const exceptionCode: shortint); virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  read coils.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  * Coils: Data that is to be sent to the Modbus master for the corresponding request.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveReadCoilsRequest"/> callback
+    ///  with the Request ID as provided by the argument of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerReadCoilsRequestLowLevel(const requestID: byte; const coilsLength: word; const coilsChunkOffset: word; const coilsChunkData: TArray0To471OfBoolean); virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  read coils.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  * Coils: Data that is to be sent to the Modbus master for the corresponding request.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveReadCoilsRequest"/> callback
+    ///  with the Request ID as provided by the argument of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerReadCoilsRequest(const requestID: byte; const coils: array of boolean); virtual;
+
+    /// <summary>
+    ///  In Modbus master mode this function can be used to read coils from a slave. This
+    ///  function creates a Modbus function code 1 request.
+    ///  
+    ///  * Slave Address: Address of the target Modbus slave.
+    ///  * Starting Address: Number of the first coil to read. For backwards compatibility reasons this parameter is called Starting Address. It is not an address, but instead a coil number in the range of 1 to 65536.
+    ///  * Count: Number of coils to read.
+    ///  
+    ///  Upon success the function will return a non-zero request ID which will represent
+    ///  the current request initiated by the Modbus master. In case of failure the returned
+    ///  request ID will be 0.
+    ///  
+    ///  When successful this function will also invoke the <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterReadCoilsResponse"/>
+    ///  callback. In this callback the Request ID provided by the callback argument must be
+    ///  matched with the Request ID returned from this function to verify that the callback
+    ///  is indeed for a particular request.
+    /// </summary>
+    function ModbusMasterReadCoils(const slaveAddress: byte; const startingAddress: longword; const count: word): byte; virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  read holding registers.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  * Holding Registers: Data that is to be sent to the Modbus master for the corresponding request.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveReadHoldingRegistersRequest"/>
+    ///  callback with the Request ID as provided by the argument of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerReadHoldingRegistersRequestLowLevel(const requestID: byte; const holdingRegistersLength: word; const holdingRegistersChunkOffset: word; const holdingRegistersChunkData: TArray0To28OfUInt16); virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  read holding registers.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  * Holding Registers: Data that is to be sent to the Modbus master for the corresponding request.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveReadHoldingRegistersRequest"/>
+    ///  callback with the Request ID as provided by the argument of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerReadHoldingRegistersRequest(const requestID: byte; const holdingRegisters: array of word); virtual;
+
+    /// <summary>
+    ///  In Modbus master mode this function can be used to read holding registers from a slave.
+    ///  This function creates a Modbus function code 3 request.
+    ///  
+    ///  * Slave Address: Address of the target Modbus slave.
+    ///  * Starting Address: Number of the first holding register to read. For backwards compatibility reasons this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+    ///  * Count: Number of holding registers to read.
+    ///  
+    ///  Upon success the function will return a non-zero request ID which will represent
+    ///  the current request initiated by the Modbus master. In case of failure the returned
+    ///  request ID will be 0.
+    ///  
+    ///  When successful this function will also invoke the <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterReadHoldingRegistersResponse"/>
+    ///  callback. In this callback the Request ID provided by the callback argument must be matched
+    ///  with the Request ID returned from this function to verify that the callback is indeed for a
+    ///  particular request.
+    /// </summary>
+    function ModbusMasterReadHoldingRegisters(const slaveAddress: byte; const startingAddress: longword; const count: word): byte; virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  write a single coil.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveWriteSingleCoilRequest"/>
+    ///  callback with the Request ID as provided by the arguments of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerWriteSingleCoilRequest(const requestID: byte); virtual;
+
+    /// <summary>
+    ///  In Modbus master mode this function can be used to write a single coil of a slave.
+    ///  This function creates a Modbus function code 5 request.
+    ///  
+    ///  * Slave Address: Address of the target Modbus slave.
+    ///  * Coil Address: Number of the coil to be written. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a coil number in the range of 1 to 65536.
+    ///  * Coil Value: Value to be written.
+    ///  
+    ///  Upon success the function will return a non-zero request ID which will represent
+    ///  the current request initiated by the Modbus master. In case of failure the returned
+    ///  request ID will be 0.
+    ///  
+    ///  When successful this function will also invoke the <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterWriteSingleCoilResponse"/>
+    ///  callback. In this callback the Request ID provided by the callback argument must be matched
+    ///  with the Request ID returned from this function to verify that the callback is indeed for a
+    ///  particular request.
+    /// </summary>
+    function ModbusMasterWriteSingleCoil(const slaveAddress: byte; const coilAddress: longword; const coilValue: boolean): byte; virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  write a single register.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveWriteSingleRegisterRequest"/>
+    ///  callback with the Request ID, Register Address and Register Value as provided by
+    ///  the arguments of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerWriteSingleRegisterRequest(const requestID: byte); virtual;
+
+    /// <summary>
+    ///  In Modbus master mode this function can be used to write a single holding register of a
+    ///  slave. This function creates a Modbus function code 6 request.
+    ///  
+    ///  * Slave Address: Address of the target Modbus slave.
+    ///  * Register Address: Number of the holding register to be written. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+    ///  * Register Value: Value to be written.
+    ///  
+    ///  Upon success the function will return a non-zero request ID which will represent
+    ///  the current request initiated by the Modbus master. In case of failure the returned
+    ///  request ID will be 0.
+    ///  
+    ///  When successful this function will also invoke the <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterWriteSingleRegisterResponse"/>
+    ///  callback. In this callback the Request ID provided by the callback argument must be matched
+    ///  with the Request ID returned from this function to verify that the callback is indeed for a
+    ///  particular request.
+    /// </summary>
+    function ModbusMasterWriteSingleRegister(const slaveAddress: byte; const registerAddress: longword; const registerValue: word): byte; virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  write multiple coils.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveWriteMultipleCoilsRequest"/>
+    ///  callback with the Request ID of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerWriteMultipleCoilsRequest(const requestID: byte); virtual;
+
+    /// <summary>
+    ///  In Modbus master mode this function can be used to write multiple coils of a slave.
+    ///  This function creates a Modbus function code 15 request.
+    ///  
+    ///  * Slave Address: Address of the target Modbus slave.
+    ///  * Starting Address: Number of the first coil to write. For backwards compatibility reasons, this parameter is called Starting Address.It is not an address, but instead a coil number in the range of 1 to 65536.
+    ///  
+    ///  Upon success the function will return a non-zero request ID which will represent
+    ///  the current request initiated by the Modbus master. In case of failure the returned
+    ///  request ID will be 0.
+    ///  
+    ///  When successful this function will also invoke the <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterWriteMultipleCoilsResponse"/>
+    ///  callback. In this callback the Request ID provided by the callback argument must be matched
+    ///  with the Request ID returned from this function to verify that the callback is indeed for a
+    ///  particular request.
+    /// </summary>
+    function ModbusMasterWriteMultipleCoilsLowLevel(const slaveAddress: byte; const startingAddress: longword; const coilsLength: word; const coilsChunkOffset: word; const coilsChunkData: TArray0To439OfBoolean): byte; virtual;
+
+    /// <summary>
+    ///  In Modbus master mode this function can be used to write multiple coils of a slave.
+    ///  This function creates a Modbus function code 15 request.
+    ///  
+    ///  * Slave Address: Address of the target Modbus slave.
+    ///  * Starting Address: Number of the first coil to write. For backwards compatibility reasons, this parameter is called Starting Address.It is not an address, but instead a coil number in the range of 1 to 65536.
+    ///  
+    ///  Upon success the function will return a non-zero request ID which will represent
+    ///  the current request initiated by the Modbus master. In case of failure the returned
+    ///  request ID will be 0.
+    ///  
+    ///  When successful this function will also invoke the <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterWriteMultipleCoilsResponse"/>
+    ///  callback. In this callback the Request ID provided by the callback argument must be matched
+    ///  with the Request ID returned from this function to verify that the callback is indeed for a
+    ///  particular request.
+    /// </summary>
+    function ModbusMasterWriteMultipleCoils(const slaveAddress: byte; const startingAddress: longword; const coils: array of boolean): byte; virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  write multiple registers.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveWriteMultipleRegistersRequest"/>
+    ///  callback with the Request ID of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerWriteMultipleRegistersRequest(const requestID: byte); virtual;
+
+    /// <summary>
+    ///  In Modbus master mode this function can be used to write multiple registers of a slave.
+    ///  This function creates a Modbus function code 16 request.
+    ///  
+    ///  * Slave Address: Address of the target Modbus slave.
+    ///  * Starting Address: Number of the first holding register to write. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+    ///  
+    ///  Upon success the function will return a non-zero request ID which will represent
+    ///  the current request initiated by the Modbus master. In case of failure the returned
+    ///  request ID will be 0.
+    ///  
+    ///  When successful this function will also invoke the <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterWriteMultipleRegistersResponse"/>
+    ///  callback. In this callback the Request ID provided by the callback argument must be matched
+    ///  with the Request ID returned from this function to verify that the callback is indeed for a
+    ///  particular request.
+    /// </summary>
+    function ModbusMasterWriteMultipleRegistersLowLevel(const slaveAddress: byte; const startingAddress: longword; const registersLength: word; const registersChunkOffset: word; const registersChunkData: TArray0To26OfUInt16): byte; virtual;
+
+    /// <summary>
+    ///  In Modbus master mode this function can be used to write multiple registers of a slave.
+    ///  This function creates a Modbus function code 16 request.
+    ///  
+    ///  * Slave Address: Address of the target Modbus slave.
+    ///  * Starting Address: Number of the first holding register to write. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is implicit and must be omitted.
+    ///  
+    ///  Upon success the function will return a non-zero request ID which will represent
+    ///  the current request initiated by the Modbus master. In case of failure the returned
+    ///  request ID will be 0.
+    ///  
+    ///  When successful this function will also invoke the <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterWriteMultipleRegistersResponse"/>
+    ///  callback. In this callback the Request ID provided by the callback argument must be matched
+    ///  with the Request ID returned from this function to verify that the callback is indeed for a
+    ///  particular request.
+    /// </summary>
+    function ModbusMasterWriteMultipleRegisters(const slaveAddress: byte; const startingAddress: longword; const registers: array of word): byte; virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  read discrete inputs.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  * Discrete Inputs: Data that is to be sent to the Modbus master for the corresponding request.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveReadDiscreteInputsRequest"/>
+    ///  callback with the Request ID as provided by the argument of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerReadDiscreteInputsRequestLowLevel(const requestID: byte; const discreteInputsLength: word; const discreteInputsChunkOffset: word; const discreteInputsChunkData: TArray0To471OfBoolean); virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  read discrete inputs.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  * Discrete Inputs: Data that is to be sent to the Modbus master for the corresponding request.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveReadDiscreteInputsRequest"/>
+    ///  callback with the Request ID as provided by the argument of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerReadDiscreteInputsRequest(const requestID: byte; const discreteInputs: array of boolean); virtual;
+
+    /// <summary>
+    ///  In Modbus master mode this function can be used to read discrete inputs from a slave.
+    ///  This function creates a Modbus function code 2 request.
+    ///  
+    ///  * Slave Address: Address of the target Modbus slave.
+    ///  * Starting Address: Number of the first discrete input to read. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead a discrete input number in the range of 1 to 65536. The prefix digit 1 (for discrete input) is implicit and must be omitted.
+    ///  * Count: Number of discrete inputs to read.
+    ///  
+    ///  Upon success the function will return a non-zero request ID which will represent
+    ///  the current request initiated by the Modbus master. In case of failure the returned
+    ///  request ID will be 0.
+    ///  
+    ///  When successful this function will also invoke the <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterReadDiscreteInputsResponse"/>
+    ///  callback. In this callback the Request ID provided by the callback argument must be matched
+    ///  with the Request ID returned from this function to verify that the callback is indeed for a
+    ///  particular request.
+    /// </summary>
+    function ModbusMasterReadDiscreteInputs(const slaveAddress: byte; const startingAddress: longword; const count: word): byte; virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  read input registers.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  * Input Registers: Data that is to be sent to the Modbus master for the corresponding request.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveReadInputRegistersRequest"/> callback
+    ///  with the Request ID as provided by the argument of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerReadInputRegistersRequestLowLevel(const requestID: byte; const inputRegistersLength: word; const inputRegistersChunkOffset: word; const inputRegistersChunkData: TArray0To28OfUInt16); virtual;
+
+    /// <summary>
+    ///  In Modbus slave mode this function can be used to answer a master request to
+    ///  read input registers.
+    ///  
+    ///  * Request ID: Request ID of the corresponding request that is being answered.
+    ///  * Input Registers: Data that is to be sent to the Modbus master for the corresponding request.
+    ///  
+    ///  This function must be called from the <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveReadInputRegistersRequest"/> callback
+    ///  with the Request ID as provided by the argument of the callback.
+    /// </summary>
+    procedure ModbusSlaveAnswerReadInputRegistersRequest(const requestID: byte; const inputRegisters: array of word); virtual;
+
+    /// <summary>
+    ///  In Modbus master mode this function can be used to read input registers from a slave.
+    ///  This function creates a Modbus function code 4 request.
+    ///  
+    ///  * Slave Address: Address of the target Modbus slave.
+    ///  * Starting Address: Number of the first input register to read. For backwards compatibility reasons, this parameter is called Starting Address. It is not an address, but instead an input register number in the range of 1 to 65536. The prefix digit 3 (for input register) is implicit and must be omitted.
+    ///  * Count: Number of input registers to read.
+    ///  
+    ///  Upon success the function will return a non-zero request ID which will represent
+    ///  the current request initiated by the Modbus master. In case of failure the returned
+    ///  request ID will be 0.
+    ///  
+    ///  When successful this function will also invoke the <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterReadInputRegistersResponse"/>
+    ///  callback. In this callback the Request ID provided by the callback argument must be matched
+    ///  with the Request ID returned from this function to verify that the callback is indeed for a
+    ///  particular request.
+    /// </summary>
+    function ModbusMasterReadInputRegisters(const slaveAddress: byte; const startingAddress: longword; const count: word): byte; virtual;
+
+    /// <summary>
+    ///  Configures the <see cref="BrickletRS485.TBrickletRS485.OnFrameReadable"/> callback. The frame size is the number of bytes, that have to be readable to trigger the callback.
+    ///  A frame size of 0 disables the callback. A frame size greater than 0 enables the callback and disables the <see cref="BrickletRS485.TBrickletRS485.OnRead"/> callback.
+    ///  
+    ///  By default the callback is disabled.
+    ///  
+    ///  .. versionadded:: 2.0.5$nbsp;(Plugin)
+    /// </summary>
+    procedure SetFrameReadableCallbackConfiguration(const frameSize: word); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletRS485.TBrickletRS485.SetFrameReadableCallbackConfiguration"/>.
+    ///  
+    ///  .. versionadded:: 2.0.5$nbsp;(Plugin)
+    /// </summary>
+    function GetFrameReadableCallbackConfiguration: word; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletRS485.TBrickletRS485.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletRS485.TBrickletRS485.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletRS485.TBrickletRS485.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletRS485.TBrickletRS485.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  <see cref="BrickletRS485.TBrickletRS485.OnRead"/>
+    /// </summary>
+    property OnReadLowLevel: TBrickletRS485NotifyReadLowLevel read readLowLevelCallback write readLowLevelCallback;
+
+    /// <summary>
+    ///  This callback is called if new data is available.
+    ///  
+    ///  To enable this callback, use <see cref="BrickletRS485.TBrickletRS485.EnableReadCallback"/>.
+    ///  
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnRead: TBrickletRS485NotifyRead read readCallback write readCallback;
+
+    /// <summary>
+    ///  This callback is called if a new error occurs. It returns
+    ///  the current overrun and parity error count.
+    /// </summary>
+    property OnErrorCount: TBrickletRS485NotifyErrorCount read errorCountCallback write errorCountCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus slave mode when the slave receives a
+    ///  valid request from a Modbus master to read coils. The parameters are
+    ///  request ID of the request, the number of the first coil to be read and the number of coils to
+    ///  be read as received by the request. The number of the first coil is called starting address for backwards compatibility reasons.
+    ///  It is not an address, but instead a coil number in the range of 1 to 65536.
+    ///  
+    ///  To send a response of this request use <see cref="BrickletRS485.TBrickletRS485.ModbusSlaveAnswerReadCoilsRequest"/>.
+    /// </summary>
+    property OnModbusSlaveReadCoilsRequest: TBrickletRS485NotifyModbusSlaveReadCoilsRequest read modbusSlaveReadCoilsRequestCallback write modbusSlaveReadCoilsRequestCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterReadCoilsResponse"/>
+    /// </summary>
+    property OnModbusMasterReadCoilsResponseLowLevel: TBrickletRS485NotifyModbusMasterReadCoilsResponseLowLevel read modbusMasterReadCoilsResponseLowLevelCallback write modbusMasterReadCoilsResponseLowLevelCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus master mode when the master receives a
+    ///  valid response of a request to read coils.
+    ///  
+    ///  The parameters are request ID
+    ///  of the request, exception code of the response and the data as received by the
+    ///  response.
+    ///  
+    ///  Any non-zero exception code indicates a problem. If the exception code
+    ///  is greater than 0 then the number represents a Modbus exception code. If it is
+    ///  less than 0 then it represents other errors. For example, -1 indicates that
+    ///  the request timed out or that the master did not receive any valid response of the
+    ///  request within the master request timeout period as set by
+    ///  <see cref="BrickletRS485.TBrickletRS485.SetModbusConfiguration"/>.
+    ///  
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for coils.
+    ///  </note>
+    /// </summary>
+    property OnModbusMasterReadCoilsResponse: TBrickletRS485NotifyModbusMasterReadCoilsResponse read modbusMasterReadCoilsResponseCallback write modbusMasterReadCoilsResponseCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus slave mode when the slave receives a
+    ///  valid request from a Modbus master to read holding registers. The parameters
+    ///  are request ID of the request, the number of the first holding register to be read and the number of holding
+    ///  registers to be read as received by the request. The number of the first holding register is called starting address for backwards compatibility reasons.
+    ///  It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is omitted.
+    ///  
+    ///  To send a response of this request use <see cref="BrickletRS485.TBrickletRS485.ModbusSlaveAnswerReadHoldingRegistersRequest"/>.
+    /// </summary>
+    property OnModbusSlaveReadHoldingRegistersRequest: TBrickletRS485NotifyModbusSlaveReadHoldingRegistersRequest read modbusSlaveReadHoldingRegistersRequestCallback write modbusSlaveReadHoldingRegistersRequestCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterReadHoldingRegistersResponse"/>
+    /// </summary>
+    property OnModbusMasterReadHoldingRegistersResponseLowLevel: TBrickletRS485NotifyModbusMasterReadHoldingRegistersResponseLowLevel read modbusMasterReadHoldingRegistersResponseLowLevelCallback write modbusMasterReadHoldingRegistersResponseLowLevelCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus master mode when the master receives a
+    ///  valid response of a request to read holding registers.
+    ///  
+    ///  The parameters are
+    ///  request ID of the request, exception code of the response and the data as received
+    ///  by the response.
+    ///  
+    ///  Any non-zero exception code indicates a problem. If the exception
+    ///  code is greater than 0 then the number represents a Modbus exception code. If
+    ///  it is less than 0 then it represents other errors. For example, -1 indicates that
+    ///  the request timed out or that the master did not receive any valid response of the
+    ///  request within the master request timeout period as set by
+    ///  <see cref="BrickletRS485.TBrickletRS485.SetModbusConfiguration"/>.
+    ///  
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for holdingRegisters.
+    ///  </note>
+    /// </summary>
+    property OnModbusMasterReadHoldingRegistersResponse: TBrickletRS485NotifyModbusMasterReadHoldingRegistersResponse read modbusMasterReadHoldingRegistersResponseCallback write modbusMasterReadHoldingRegistersResponseCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus slave mode when the slave receives a
+    ///  valid request from a Modbus master to write a single coil. The parameters
+    ///  are request ID of the request, the number of the coil and the value of coil to be
+    ///  written as received by the request. The number of the coil is called coil address for backwards compatibility reasons.
+    ///  It is not an address, but instead a coil number in the range of 1 to 65536.
+    ///  
+    ///  To send a response of this request use <see cref="BrickletRS485.TBrickletRS485.ModbusSlaveAnswerWriteSingleCoilRequest"/>.
+    /// </summary>
+    property OnModbusSlaveWriteSingleCoilRequest: TBrickletRS485NotifyModbusSlaveWriteSingleCoilRequest read modbusSlaveWriteSingleCoilRequestCallback write modbusSlaveWriteSingleCoilRequestCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus master mode when the master receives a
+    ///  valid response of a request to write a single coil.
+    ///  
+    ///  The parameters are
+    ///  request ID of the request and exception code of the response.
+    ///  
+    ///  Any non-zero exception code indicates a problem.
+    ///  If the exception code is greater than 0 then the number represents a Modbus
+    ///  exception code. If it is less than 0 then it represents other errors. For
+    ///  example, -1 indicates that the request timed out or that the master did not receive
+    ///  any valid response of the request within the master request timeout period as set
+    ///  by <see cref="BrickletRS485.TBrickletRS485.SetModbusConfiguration"/>.
+    /// </summary>
+    property OnModbusMasterWriteSingleCoilResponse: TBrickletRS485NotifyModbusMasterWriteSingleCoilResponse read modbusMasterWriteSingleCoilResponseCallback write modbusMasterWriteSingleCoilResponseCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus slave mode when the slave receives a
+    ///  valid request from a Modbus master to write a single holding register. The parameters
+    ///  are request ID of the request, the number of the holding register and the register value to
+    ///  be written as received by the request. The number of the holding register is called starting address for backwards compatibility reasons.
+    ///  It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is omitted.
+    ///  
+    ///  To send a response of this request use <see cref="BrickletRS485.TBrickletRS485.ModbusSlaveAnswerWriteSingleRegisterRequest"/>.
+    /// </summary>
+    property OnModbusSlaveWriteSingleRegisterRequest: TBrickletRS485NotifyModbusSlaveWriteSingleRegisterRequest read modbusSlaveWriteSingleRegisterRequestCallback write modbusSlaveWriteSingleRegisterRequestCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus master mode when the master receives a
+    ///  valid response of a request to write a single register.
+    ///  
+    ///  The parameters are
+    ///  request ID of the request and exception code of the response.
+    ///  
+    ///  Any non-zero exception code
+    ///  indicates a problem. If the exception code is greater than 0 then the number
+    ///  represents a Modbus exception code. If it is less than 0 then it represents
+    ///  other errors. For example, -1 indicates that the request timed out or that the
+    ///  master did not receive any valid response of the request within the master request
+    ///  timeout period as set by <see cref="BrickletRS485.TBrickletRS485.SetModbusConfiguration"/>.
+    /// </summary>
+    property OnModbusMasterWriteSingleRegisterResponse: TBrickletRS485NotifyModbusMasterWriteSingleRegisterResponse read modbusMasterWriteSingleRegisterResponseCallback write modbusMasterWriteSingleRegisterResponseCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveWriteMultipleCoilsRequest"/>
+    /// </summary>
+    property OnModbusSlaveWriteMultipleCoilsRequestLowLevel: TBrickletRS485NotifyModbusSlaveWriteMultipleCoilsRequestLowLevel read modbusSlaveWriteMultipleCoilsRequestLowLevelCallback write modbusSlaveWriteMultipleCoilsRequestLowLevelCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus slave mode when the slave receives a
+    ///  valid request from a Modbus master to write multiple coils. The parameters
+    ///  are request ID of the request, the number of the first coil and the data to be written as
+    ///  received by the request. The number of the first coil is called starting address for backwards compatibility reasons.
+    ///  It is not an address, but instead a coil number in the range of 1 to 65536.
+    ///  
+    ///  To send a response of this request use <see cref="BrickletRS485.TBrickletRS485.ModbusSlaveAnswerWriteMultipleCoilsRequest"/>.
+    ///  
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for coils.
+    ///  </note>
+    /// </summary>
+    property OnModbusSlaveWriteMultipleCoilsRequest: TBrickletRS485NotifyModbusSlaveWriteMultipleCoilsRequest read modbusSlaveWriteMultipleCoilsRequestCallback write modbusSlaveWriteMultipleCoilsRequestCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus master mode when the master receives a
+    ///  valid response of a request to read coils.
+    ///  
+    ///  The parameters are
+    ///  request ID of the request and exception code of the response.
+    ///  
+    ///  Any non-zero exception code
+    ///  indicates a problem. If the exception code is greater than 0 then the number
+    ///  represents a Modbus exception code. If it is less than 0 then it represents
+    ///  other errors. For example, -1 indicates that the request timedout or that the
+    ///  master did not receive any valid response of the request within the master request
+    ///  timeout period as set by <see cref="BrickletRS485.TBrickletRS485.SetModbusConfiguration"/>.
+    /// </summary>
+    property OnModbusMasterWriteMultipleCoilsResponse: TBrickletRS485NotifyModbusMasterWriteMultipleCoilsResponse read modbusMasterWriteMultipleCoilsResponseCallback write modbusMasterWriteMultipleCoilsResponseCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletRS485.TBrickletRS485.OnModbusSlaveWriteMultipleRegistersRequest"/>
+    /// </summary>
+    property OnModbusSlaveWriteMultipleRegistersRequestLowLevel: TBrickletRS485NotifyModbusSlaveWriteMultipleRegistersRequestLowLevel read modbusSlaveWriteMultipleRegistersRequestLowLevelCallback write modbusSlaveWriteMultipleRegistersRequestLowLevelCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus slave mode when the slave receives a
+    ///  valid request from a Modbus master to write multiple holding registers. The parameters
+    ///  are request ID of the request, the number of the first holding register and the data to be written as
+    ///  received by the request. The number of the first holding register is called starting address for backwards compatibility reasons.
+    ///  It is not an address, but instead a holding register number in the range of 1 to 65536. The prefix digit 4 (for holding register) is omitted.
+    ///  
+    ///  To send a response of this request use <see cref="BrickletRS485.TBrickletRS485.ModbusSlaveAnswerWriteMultipleRegistersRequest"/>.
+    ///  
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for registers.
+    ///  </note>
+    /// </summary>
+    property OnModbusSlaveWriteMultipleRegistersRequest: TBrickletRS485NotifyModbusSlaveWriteMultipleRegistersRequest read modbusSlaveWriteMultipleRegistersRequestCallback write modbusSlaveWriteMultipleRegistersRequestCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus master mode when the master receives a
+    ///  valid response of a request to write multiple registers.
+    ///  
+    ///  The parameters
+    ///  are request ID of the request and exception code of the response.
+    ///  
+    ///  Any non-zero
+    ///  exception code indicates a problem. If the exception code is greater than 0 then
+    ///  the number represents a Modbus exception code. If it is less than 0 then it
+    ///  represents other errors. For example, -1 indicates that the request timedout or
+    ///  that the master did not receive any valid response of the request within the master
+    ///  request timeout period as set by <see cref="BrickletRS485.TBrickletRS485.SetModbusConfiguration"/>.
+    /// </summary>
+    property OnModbusMasterWriteMultipleRegistersResponse: TBrickletRS485NotifyModbusMasterWriteMultipleRegistersResponse read modbusMasterWriteMultipleRegistersResponseCallback write modbusMasterWriteMultipleRegistersResponseCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus slave mode when the slave receives a
+    ///  valid request from a Modbus master to read discrete inputs. The parameters
+    ///  are request ID of the request, the number of the first discrete input and the number of discrete
+    ///  inputs to be read as received by the request. The number of the first discrete input is called starting address for backwards compatibility reasons.
+    ///  It is not an address, but instead a discrete input number in the range of 1 to 65536. The prefix digit 1 (for discrete input) is omitted.
+    ///  
+    ///  To send a response of this request use <see cref="BrickletRS485.TBrickletRS485.ModbusSlaveAnswerReadDiscreteInputsRequest"/>.
+    /// </summary>
+    property OnModbusSlaveReadDiscreteInputsRequest: TBrickletRS485NotifyModbusSlaveReadDiscreteInputsRequest read modbusSlaveReadDiscreteInputsRequestCallback write modbusSlaveReadDiscreteInputsRequestCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterReadDiscreteInputsResponse"/>
+    /// </summary>
+    property OnModbusMasterReadDiscreteInputsResponseLowLevel: TBrickletRS485NotifyModbusMasterReadDiscreteInputsResponseLowLevel read modbusMasterReadDiscreteInputsResponseLowLevelCallback write modbusMasterReadDiscreteInputsResponseLowLevelCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus master mode when the master receives a
+    ///  valid response of a request to read discrete inputs.
+    ///  
+    ///  The parameters are
+    ///  request ID of the request, exception code of the response and the data as received
+    ///  by the response.
+    ///  
+    ///  Any non-zero exception code indicates a problem. If the exception
+    ///  code is greater than 0 then the number represents a Modbus exception code. If
+    ///  it is less than 0 then it represents other errors. For example, -1 indicates that
+    ///  the request timedout or that the master did not receive any valid response of the
+    ///  request within the master request timeout period as set by
+    ///  <see cref="BrickletRS485.TBrickletRS485.SetModbusConfiguration"/>.
+    ///  
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for discreteInputs.
+    ///  </note>
+    /// </summary>
+    property OnModbusMasterReadDiscreteInputsResponse: TBrickletRS485NotifyModbusMasterReadDiscreteInputsResponse read modbusMasterReadDiscreteInputsResponseCallback write modbusMasterReadDiscreteInputsResponseCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus slave mode when the slave receives a
+    ///  valid request from a Modbus master to read input registers. The parameters
+    ///  are request ID of the request, the number of the first input register and the number of input
+    ///  registers to be read as received by the request. The number of the first input register is called starting address for backwards compatibility reasons.
+    ///  It is not an address, but instead a input register number in the range of 1 to 65536. The prefix digit 3 (for input register) is omitted.
+    ///  
+    ///  To send a response of this request use <see cref="BrickletRS485.TBrickletRS485.ModbusSlaveAnswerReadInputRegistersRequest"/>.
+    /// </summary>
+    property OnModbusSlaveReadInputRegistersRequest: TBrickletRS485NotifyModbusSlaveReadInputRegistersRequest read modbusSlaveReadInputRegistersRequestCallback write modbusSlaveReadInputRegistersRequestCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletRS485.TBrickletRS485.OnModbusMasterReadInputRegistersResponse"/>
+    /// </summary>
+    property OnModbusMasterReadInputRegistersResponseLowLevel: TBrickletRS485NotifyModbusMasterReadInputRegistersResponseLowLevel read modbusMasterReadInputRegistersResponseLowLevelCallback write modbusMasterReadInputRegistersResponseLowLevelCallback;
+
+    /// <summary>
+    ///  This callback is called only in Modbus master mode when the master receives a
+    ///  valid response of a request to read input registers.
+    ///  
+    ///  The parameters are
+    ///  request ID of the request, exception code of the response and the data as received
+    ///  by the response.
+    ///  
+    ///  Any non-zero exception code indicates a problem. If the exception
+    ///  code is greater than 0 then the number represents a Modbus exception code. If
+    ///  it is less than 0 then it represents other errors. For example, -1 indicates that
+    ///  the request timedout or that the master did not receive any valid response of the
+    ///  request within the master request timeout period as set by
+    ///  <see cref="BrickletRS485.TBrickletRS485.SetModbusConfiguration"/>.
+    ///  
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for inputRegisters.
+    ///  </note>
+    /// </summary>
+    property OnModbusMasterReadInputRegistersResponse: TBrickletRS485NotifyModbusMasterReadInputRegistersResponse read modbusMasterReadInputRegistersResponseCallback write modbusMasterReadInputRegistersResponseCallback;
+
+    /// <summary>
+    ///  This callback is called if at least one frame of data is readable. The frame size is configured with <see cref="BrickletRS485.TBrickletRS485.SetFrameReadableCallbackConfiguration"/>.
+    ///  The frame count parameter is the number of frames that can be read.
+    ///  This callback is triggered only once until <see cref="BrickletRS485.TBrickletRS485.Read"/> is called. This means, that if you have configured a frame size of X bytes,
+    ///  you can read exactly X bytes using the <see cref="BrickletRS485.TBrickletRS485.Read"/> function, every time the callback triggers without checking the frame count parameter.
+    ///  
+    ///  .. versionadded:: 2.0.5$nbsp;(Plugin)
+    /// </summary>
+    property OnFrameReadable: TBrickletRS485NotifyFrameReadable read frameReadableCallback write frameReadableCallback;
+  end;
+
+implementation
+
+constructor TBrickletRS485.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_RS485_DEVICE_IDENTIFIER, BRICKLET_RS485_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 1;
+
+  responseExpected[BRICKLET_RS485_FUNCTION_WRITE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_READ_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_ENABLE_READ_CALLBACK] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_DISABLE_READ_CALLBACK] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_IS_READ_CALLBACK_ENABLED] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_SET_RS485_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_RS485_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_SET_MODBUS_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_MODBUS_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_SET_MODE] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_SET_COMMUNICATION_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_COMMUNICATION_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_SET_ERROR_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_ERROR_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_SET_BUFFER_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_BUFFER_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_BUFFER_STATUS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_ENABLE_ERROR_COUNT_CALLBACK] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_DISABLE_ERROR_COUNT_CALLBACK] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_IS_ERROR_COUNT_CALLBACK_ENABLED] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_MODBUS_COMMON_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_REPORT_EXCEPTION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_COILS_REQUEST_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_COILS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_HOLDING_REGISTERS_REQUEST_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_HOLDING_REGISTERS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_COIL_REQUEST] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_SINGLE_COIL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_REGISTER_REQUEST] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_SINGLE_REGISTER] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_COILS_REQUEST] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_REGISTERS_REQUEST] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_DISCRETE_INPUTS_REQUEST_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_DISCRETE_INPUTS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_INPUT_REGISTERS_REQUEST_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_INPUT_REGISTERS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_RS485_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_RS485_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  streamMutex := TCriticalSection.Create;
+
+  SetLength(readHighLevelCallbackState.data, 0);
+  readHighLevelCallbackState.data := nil;
+  readHighLevelCallbackState.length := 0;
+
+  SetLength(modbusMasterReadCoilsResponseHighLevelCallbackState.data, 0);
+  modbusMasterReadCoilsResponseHighLevelCallbackState.data := nil;
+  modbusMasterReadCoilsResponseHighLevelCallbackState.length := 0;
+
+  SetLength(modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data, 0);
+  modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data := nil;
+  modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.length := 0;
+
+  SetLength(modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data, 0);
+  modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data := nil;
+  modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.length := 0;
+
+  SetLength(modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data, 0);
+  modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data := nil;
+  modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.length := 0;
+
+  SetLength(modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data, 0);
+  modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data := nil;
+  modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.length := 0;
+
+  SetLength(modbusMasterReadInputRegistersResponseHighLevelCallbackState.data, 0);
+  modbusMasterReadInputRegistersResponseHighLevelCallbackState.data := nil;
+  modbusMasterReadInputRegistersResponseHighLevelCallbackState.length := 0;
+
+  callbackWrappers[BRICKLET_RS485_CALLBACK_READ_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperReadLowLevel;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_ERROR_COUNT] := {$ifdef FPC}@{$endif}CallbackWrapperErrorCount;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_READ_COILS_REQUEST] := {$ifdef FPC}@{$endif}CallbackWrapperModbusSlaveReadCoilsRequest;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_MASTER_READ_COILS_RESPONSE_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperModbusMasterReadCoilsResponseLowLevel;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_READ_HOLDING_REGISTERS_REQUEST] := {$ifdef FPC}@{$endif}CallbackWrapperModbusSlaveReadHoldingRegistersRequest;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_MASTER_READ_HOLDING_REGISTERS_RESPONSE_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperModbusMasterReadHoldingRegistersResponseLowLevel;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_WRITE_SINGLE_COIL_REQUEST] := {$ifdef FPC}@{$endif}CallbackWrapperModbusSlaveWriteSingleCoilRequest;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_MASTER_WRITE_SINGLE_COIL_RESPONSE] := {$ifdef FPC}@{$endif}CallbackWrapperModbusMasterWriteSingleCoilResponse;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_WRITE_SINGLE_REGISTER_REQUEST] := {$ifdef FPC}@{$endif}CallbackWrapperModbusSlaveWriteSingleRegisterRequest;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_MASTER_WRITE_SINGLE_REGISTER_RESPONSE] := {$ifdef FPC}@{$endif}CallbackWrapperModbusMasterWriteSingleRegisterResponse;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_COILS_REQUEST_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperModbusSlaveWriteMultipleCoilsRequestLowLevel;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_MASTER_WRITE_MULTIPLE_COILS_RESPONSE] := {$ifdef FPC}@{$endif}CallbackWrapperModbusMasterWriteMultipleCoilsResponse;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_WRITE_MULTIPLE_REGISTERS_REQUEST_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperModbusSlaveWriteMultipleRegistersRequestLowLevel;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_RESPONSE] := {$ifdef FPC}@{$endif}CallbackWrapperModbusMasterWriteMultipleRegistersResponse;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_READ_DISCRETE_INPUTS_REQUEST] := {$ifdef FPC}@{$endif}CallbackWrapperModbusSlaveReadDiscreteInputsRequest;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_MASTER_READ_DISCRETE_INPUTS_RESPONSE_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperModbusMasterReadDiscreteInputsResponseLowLevel;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_SLAVE_READ_INPUT_REGISTERS_REQUEST] := {$ifdef FPC}@{$endif}CallbackWrapperModbusSlaveReadInputRegistersRequest;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_MODBUS_MASTER_READ_INPUT_REGISTERS_RESPONSE_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperModbusMasterReadInputRegistersResponseLowLevel;
+  callbackWrappers[BRICKLET_RS485_CALLBACK_FRAME_READABLE] := {$ifdef FPC}@{$endif}CallbackWrapperFrameReadable;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletRS485.WriteLowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_WRITE_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletRS485.Write(const message: array of char): word;
+var
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkLength: word;
+  messageChunkData: TArray0To59OfChar;
+  messageChunkWritten: byte;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+  result := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+    result := WriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        messageChunkWritten := WriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+        Inc(result, messageChunkWritten);
+
+        if (messageChunkWritten < 60) then break; { Either last chunk or short write }
+
+        Inc(messageChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletRS485.ReadLowLevel(const length_: word; out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_READ_LOW_LEVEL, 10);
+  LEConvertUInt16To(length_, 8, request);
+  response := SendRequest(request, 72);
+  messageLength := LEConvertUInt16From(8, response);
+  messageChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 59 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), response);
+end;
+
+function TBrickletRS485.Read(const length_: word): TArrayOfChar;
+var
+  message: TArrayOfChar;
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To59OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(message, 0);
+  streamMutex.Acquire;
+  try
+    messageLength := 0;
+    ReadLowLevel(length_, messageLength, messageChunkOffset, messageChunkData);
+    SetLength(message, messageLength);
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 60) then messageChunkLength := 60;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        ReadLowLevel(length_, messageLength, messageChunkOffset, messageChunkData);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 60 < messageLength) do begin
+        ReadLowLevel(length_, messageLength, messageChunkOffset, messageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := message;
+end;
+
+procedure TBrickletRS485.EnableReadCallback;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_ENABLE_READ_CALLBACK, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRS485.DisableReadCallback;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_DISABLE_READ_CALLBACK, 8);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.IsReadCallbackEnabled: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_IS_READ_CALLBACK_ENABLED, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletRS485.SetRS485Configuration(const baudrate: longword; const parity: byte; const stopbits: byte; const wordlength: byte; const duplex: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_SET_RS485_CONFIGURATION, 16);
+  LEConvertUInt32To(baudrate, 8, request);
+  LEConvertUInt8To(parity, 12, request);
+  LEConvertUInt8To(stopbits, 13, request);
+  LEConvertUInt8To(wordlength, 14, request);
+  LEConvertUInt8To(duplex, 15, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRS485.GetRS485Configuration(out baudrate: longword; out parity: byte; out stopbits: byte; out wordlength: byte; out duplex: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_RS485_CONFIGURATION, 8);
+  response := SendRequest(request, 16);
+  baudrate := LEConvertUInt32From(8, response);
+  parity := LEConvertUInt8From(12, response);
+  stopbits := LEConvertUInt8From(13, response);
+  wordlength := LEConvertUInt8From(14, response);
+  duplex := LEConvertUInt8From(15, response);
+end;
+
+procedure TBrickletRS485.SetModbusConfiguration(const slaveAddress: byte; const masterRequestTimeout: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_SET_MODBUS_CONFIGURATION, 13);
+  LEConvertUInt8To(slaveAddress, 8, request);
+  LEConvertUInt32To(masterRequestTimeout, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRS485.GetModbusConfiguration(out slaveAddress: byte; out masterRequestTimeout: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_MODBUS_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  slaveAddress := LEConvertUInt8From(8, response);
+  masterRequestTimeout := LEConvertUInt32From(9, response);
+end;
+
+procedure TBrickletRS485.SetMode(const mode: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_SET_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.GetMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRS485.SetCommunicationLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_SET_COMMUNICATION_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.GetCommunicationLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_COMMUNICATION_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRS485.SetErrorLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_SET_ERROR_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.GetErrorLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_ERROR_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRS485.SetBufferConfig(const sendBufferSize: word; const receiveBufferSize: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_SET_BUFFER_CONFIG, 12);
+  LEConvertUInt16To(sendBufferSize, 8, request);
+  LEConvertUInt16To(receiveBufferSize, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRS485.GetBufferConfig(out sendBufferSize: word; out receiveBufferSize: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_BUFFER_CONFIG, 8);
+  response := SendRequest(request, 12);
+  sendBufferSize := LEConvertUInt16From(8, response);
+  receiveBufferSize := LEConvertUInt16From(10, response);
+end;
+
+procedure TBrickletRS485.GetBufferStatus(out sendBufferUsed: word; out receiveBufferUsed: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_BUFFER_STATUS, 8);
+  response := SendRequest(request, 12);
+  sendBufferUsed := LEConvertUInt16From(8, response);
+  receiveBufferUsed := LEConvertUInt16From(10, response);
+end;
+
+procedure TBrickletRS485.EnableErrorCountCallback;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_ENABLE_ERROR_COUNT_CALLBACK, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRS485.DisableErrorCountCallback;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_DISABLE_ERROR_COUNT_CALLBACK, 8);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.IsErrorCountCallbackEnabled: boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_IS_ERROR_COUNT_CALLBACK_ENABLED, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletRS485.GetErrorCount(out overrunErrorCount: longword; out parityErrorCount: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_ERROR_COUNT, 8);
+  response := SendRequest(request, 16);
+  overrunErrorCount := LEConvertUInt32From(8, response);
+  parityErrorCount := LEConvertUInt32From(12, response);
+end;
+
+procedure TBrickletRS485.GetModbusCommonErrorCount(out timeoutErrorCount: longword; out checksumErrorCount: longword; out frameTooBigErrorCount: longword; out illegalFunctionErrorCount: longword; out illegalDataAddressErrorCount: longword; out illegalDataValueErrorCount: longword; out slaveDeviceFailureErrorCount: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_MODBUS_COMMON_ERROR_COUNT, 8);
+  response := SendRequest(request, 36);
+  timeoutErrorCount := LEConvertUInt32From(8, response);
+  checksumErrorCount := LEConvertUInt32From(12, response);
+  frameTooBigErrorCount := LEConvertUInt32From(16, response);
+  illegalFunctionErrorCount := LEConvertUInt32From(20, response);
+  illegalDataAddressErrorCount := LEConvertUInt32From(24, response);
+  illegalDataValueErrorCount := LEConvertUInt32From(28, response);
+  slaveDeviceFailureErrorCount := LEConvertUInt32From(32, response);
+end;
+
+procedure TBrickletRS485.ModbusSlaveReportException(const requestID: byte; const exceptionCode: shortint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_REPORT_EXCEPTION, 10);
+  LEConvertUInt8To(requestID, 8, request);
+  LEConvertInt8To(exceptionCode, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerReadCoilsRequestLowLevel(const requestID: byte; const coilsLength: word; const coilsChunkOffset: word; const coilsChunkData: TArray0To471OfBoolean);
+var request: TByteArray; i: longint; coilsChunkDataBits: array [0..58] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_COILS_REQUEST_LOW_LEVEL, 72);
+  LEConvertUInt8To(requestID, 8, request);
+  LEConvertUInt16To(coilsLength, 9, request);
+  LEConvertUInt16To(coilsChunkOffset, 11, request);
+  FillChar(coilsChunkDataBits[0], Length(coilsChunkDataBits) * SizeOf(coilsChunkDataBits[0]), 0);
+  for i := 0 to 471 do if coilsChunkData[i] then coilsChunkDataBits[Floor(i/8)] := coilsChunkDataBits[Floor(i/8)] or (1 shl (i mod 8));
+  for i := 0 to 58 do LEConvertUInt8To(coilsChunkDataBits[i], 13 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerReadCoilsRequest(const requestID: byte; const coils: array of boolean);
+var
+  coilsChunkOffset: word;
+  coilsChunkData: TArray0To471OfBoolean;
+  coilsChunkLength: word;
+  coilsLength: word;
+begin
+  if (Length(coils) > 65535) then begin
+    raise EInvalidParameterException.Create('Coils can be at most 65535 items long');
+  end;
+
+  coilsLength := Length(coils);
+  coilsChunkOffset := 0;
+
+  if (coilsLength = 0) then begin
+    FillChar(coilsChunkData[0], SizeOf(boolean) * 472, 0);
+    ModbusSlaveAnswerReadCoilsRequestLowLevel(requestID, coilsLength, coilsChunkOffset, coilsChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (coilsChunkOffset < coilsLength) do begin
+        coilsChunkLength := coilsLength - coilsChunkOffset;
+
+        if (coilsChunkLength > 472) then coilsChunkLength := 472;
+
+        FillChar(coilsChunkData[0], SizeOf(boolean) * 472, 0);
+        Move(coils[coilsChunkOffset], coilsChunkData[0], SizeOf(boolean) * coilsChunkLength);
+
+        ModbusSlaveAnswerReadCoilsRequestLowLevel(requestID, coilsLength, coilsChunkOffset, coilsChunkData);
+        Inc(coilsChunkOffset, 472);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+function TBrickletRS485.ModbusMasterReadCoils(const slaveAddress: byte; const startingAddress: longword; const count: word): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_COILS, 15);
+  LEConvertUInt8To(slaveAddress, 8, request);
+  LEConvertUInt32To(startingAddress, 9, request);
+  LEConvertUInt16To(count, 13, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerReadHoldingRegistersRequestLowLevel(const requestID: byte; const holdingRegistersLength: word; const holdingRegistersChunkOffset: word; const holdingRegistersChunkData: TArray0To28OfUInt16);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_HOLDING_REGISTERS_REQUEST_LOW_LEVEL, 71);
+  LEConvertUInt8To(requestID, 8, request);
+  LEConvertUInt16To(holdingRegistersLength, 9, request);
+  LEConvertUInt16To(holdingRegistersChunkOffset, 11, request);
+  for i := 0 to Length(holdingRegistersChunkData) - 1 do LEConvertUInt16To(holdingRegistersChunkData[i], 13 + (i * 2), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerReadHoldingRegistersRequest(const requestID: byte; const holdingRegisters: array of word);
+var
+  holdingRegistersChunkOffset: word;
+  holdingRegistersChunkData: TArray0To28OfUInt16;
+  holdingRegistersChunkLength: word;
+  holdingRegistersLength: word;
+begin
+  if (Length(holdingRegisters) > 65535) then begin
+    raise EInvalidParameterException.Create('Holding Registers can be at most 65535 items long');
+  end;
+
+  holdingRegistersLength := Length(holdingRegisters);
+  holdingRegistersChunkOffset := 0;
+
+  if (holdingRegistersLength = 0) then begin
+    FillChar(holdingRegistersChunkData[0], SizeOf(word) * 29, 0);
+    ModbusSlaveAnswerReadHoldingRegistersRequestLowLevel(requestID, holdingRegistersLength, holdingRegistersChunkOffset, holdingRegistersChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (holdingRegistersChunkOffset < holdingRegistersLength) do begin
+        holdingRegistersChunkLength := holdingRegistersLength - holdingRegistersChunkOffset;
+
+        if (holdingRegistersChunkLength > 29) then holdingRegistersChunkLength := 29;
+
+        FillChar(holdingRegistersChunkData[0], SizeOf(word) * 29, 0);
+        Move(holdingRegisters[holdingRegistersChunkOffset], holdingRegistersChunkData[0], SizeOf(word) * holdingRegistersChunkLength);
+
+        ModbusSlaveAnswerReadHoldingRegistersRequestLowLevel(requestID, holdingRegistersLength, holdingRegistersChunkOffset, holdingRegistersChunkData);
+        Inc(holdingRegistersChunkOffset, 29);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+function TBrickletRS485.ModbusMasterReadHoldingRegisters(const slaveAddress: byte; const startingAddress: longword; const count: word): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_HOLDING_REGISTERS, 15);
+  LEConvertUInt8To(slaveAddress, 8, request);
+  LEConvertUInt32To(startingAddress, 9, request);
+  LEConvertUInt16To(count, 13, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerWriteSingleCoilRequest(const requestID: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_COIL_REQUEST, 9);
+  LEConvertUInt8To(requestID, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.ModbusMasterWriteSingleCoil(const slaveAddress: byte; const coilAddress: longword; const coilValue: boolean): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_SINGLE_COIL, 14);
+  LEConvertUInt8To(slaveAddress, 8, request);
+  LEConvertUInt32To(coilAddress, 9, request);
+  LEConvertBooleanTo(coilValue, 13, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerWriteSingleRegisterRequest(const requestID: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_SINGLE_REGISTER_REQUEST, 9);
+  LEConvertUInt8To(requestID, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.ModbusMasterWriteSingleRegister(const slaveAddress: byte; const registerAddress: longword; const registerValue: word): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_SINGLE_REGISTER, 15);
+  LEConvertUInt8To(slaveAddress, 8, request);
+  LEConvertUInt32To(registerAddress, 9, request);
+  LEConvertUInt16To(registerValue, 13, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerWriteMultipleCoilsRequest(const requestID: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_COILS_REQUEST, 9);
+  LEConvertUInt8To(requestID, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.ModbusMasterWriteMultipleCoilsLowLevel(const slaveAddress: byte; const startingAddress: longword; const coilsLength: word; const coilsChunkOffset: word; const coilsChunkData: TArray0To439OfBoolean): byte;
+var request, response: TByteArray; i: longint; coilsChunkDataBits: array [0..54] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_COILS_LOW_LEVEL, 72);
+  LEConvertUInt8To(slaveAddress, 8, request);
+  LEConvertUInt32To(startingAddress, 9, request);
+  LEConvertUInt16To(coilsLength, 13, request);
+  LEConvertUInt16To(coilsChunkOffset, 15, request);
+  FillChar(coilsChunkDataBits[0], Length(coilsChunkDataBits) * SizeOf(coilsChunkDataBits[0]), 0);
+  for i := 0 to 439 do if coilsChunkData[i] then coilsChunkDataBits[Floor(i/8)] := coilsChunkDataBits[Floor(i/8)] or (1 shl (i mod 8));
+  for i := 0 to 54 do LEConvertUInt8To(coilsChunkDataBits[i], 17 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletRS485.ModbusMasterWriteMultipleCoils(const slaveAddress: byte; const startingAddress: longword; const coils: array of boolean): byte;
+var
+  coilsChunkOffset: word;
+  coilsChunkData: TArray0To439OfBoolean;
+  coilsChunkLength: word;
+  coilsLength: word;
+begin
+  if (Length(coils) > 65535) then begin
+    raise EInvalidParameterException.Create('Coils can be at most 65535 items long');
+  end;
+
+  coilsLength := Length(coils);
+  coilsChunkOffset := 0;
+
+  if (coilsLength = 0) then begin
+    FillChar(coilsChunkData[0], SizeOf(boolean) * 440, 0);
+    result := ModbusMasterWriteMultipleCoilsLowLevel(slaveAddress, startingAddress, coilsLength, coilsChunkOffset, coilsChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (coilsChunkOffset < coilsLength) do begin
+        coilsChunkLength := coilsLength - coilsChunkOffset;
+
+        if (coilsChunkLength > 440) then coilsChunkLength := 440;
+
+        FillChar(coilsChunkData[0], SizeOf(boolean) * 440, 0);
+        Move(coils[coilsChunkOffset], coilsChunkData[0], SizeOf(boolean) * coilsChunkLength);
+
+        result := ModbusMasterWriteMultipleCoilsLowLevel(slaveAddress, startingAddress, coilsLength, coilsChunkOffset, coilsChunkData);
+        Inc(coilsChunkOffset, 440);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerWriteMultipleRegistersRequest(const requestID: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_WRITE_MULTIPLE_REGISTERS_REQUEST, 9);
+  LEConvertUInt8To(requestID, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.ModbusMasterWriteMultipleRegistersLowLevel(const slaveAddress: byte; const startingAddress: longword; const registersLength: word; const registersChunkOffset: word; const registersChunkData: TArray0To26OfUInt16): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_MASTER_WRITE_MULTIPLE_REGISTERS_LOW_LEVEL, 71);
+  LEConvertUInt8To(slaveAddress, 8, request);
+  LEConvertUInt32To(startingAddress, 9, request);
+  LEConvertUInt16To(registersLength, 13, request);
+  LEConvertUInt16To(registersChunkOffset, 15, request);
+  for i := 0 to Length(registersChunkData) - 1 do LEConvertUInt16To(registersChunkData[i], 17 + (i * 2), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletRS485.ModbusMasterWriteMultipleRegisters(const slaveAddress: byte; const startingAddress: longword; const registers: array of word): byte;
+var
+  registersChunkOffset: word;
+  registersChunkData: TArray0To26OfUInt16;
+  registersChunkLength: word;
+  registersLength: word;
+begin
+  if (Length(registers) > 65535) then begin
+    raise EInvalidParameterException.Create('Registers can be at most 65535 items long');
+  end;
+
+  registersLength := Length(registers);
+  registersChunkOffset := 0;
+
+  if (registersLength = 0) then begin
+    FillChar(registersChunkData[0], SizeOf(word) * 27, 0);
+    result := ModbusMasterWriteMultipleRegistersLowLevel(slaveAddress, startingAddress, registersLength, registersChunkOffset, registersChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (registersChunkOffset < registersLength) do begin
+        registersChunkLength := registersLength - registersChunkOffset;
+
+        if (registersChunkLength > 27) then registersChunkLength := 27;
+
+        FillChar(registersChunkData[0], SizeOf(word) * 27, 0);
+        Move(registers[registersChunkOffset], registersChunkData[0], SizeOf(word) * registersChunkLength);
+
+        result := ModbusMasterWriteMultipleRegistersLowLevel(slaveAddress, startingAddress, registersLength, registersChunkOffset, registersChunkData);
+        Inc(registersChunkOffset, 27);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerReadDiscreteInputsRequestLowLevel(const requestID: byte; const discreteInputsLength: word; const discreteInputsChunkOffset: word; const discreteInputsChunkData: TArray0To471OfBoolean);
+var request: TByteArray; i: longint; discreteInputsChunkDataBits: array [0..58] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_DISCRETE_INPUTS_REQUEST_LOW_LEVEL, 72);
+  LEConvertUInt8To(requestID, 8, request);
+  LEConvertUInt16To(discreteInputsLength, 9, request);
+  LEConvertUInt16To(discreteInputsChunkOffset, 11, request);
+  FillChar(discreteInputsChunkDataBits[0], Length(discreteInputsChunkDataBits) * SizeOf(discreteInputsChunkDataBits[0]), 0);
+  for i := 0 to 471 do if discreteInputsChunkData[i] then discreteInputsChunkDataBits[Floor(i/8)] := discreteInputsChunkDataBits[Floor(i/8)] or (1 shl (i mod 8));
+  for i := 0 to 58 do LEConvertUInt8To(discreteInputsChunkDataBits[i], 13 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerReadDiscreteInputsRequest(const requestID: byte; const discreteInputs: array of boolean);
+var
+  discreteInputsChunkOffset: word;
+  discreteInputsChunkData: TArray0To471OfBoolean;
+  discreteInputsChunkLength: word;
+  discreteInputsLength: word;
+begin
+  if (Length(discreteInputs) > 65535) then begin
+    raise EInvalidParameterException.Create('Discrete Inputs can be at most 65535 items long');
+  end;
+
+  discreteInputsLength := Length(discreteInputs);
+  discreteInputsChunkOffset := 0;
+
+  if (discreteInputsLength = 0) then begin
+    FillChar(discreteInputsChunkData[0], SizeOf(boolean) * 472, 0);
+    ModbusSlaveAnswerReadDiscreteInputsRequestLowLevel(requestID, discreteInputsLength, discreteInputsChunkOffset, discreteInputsChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (discreteInputsChunkOffset < discreteInputsLength) do begin
+        discreteInputsChunkLength := discreteInputsLength - discreteInputsChunkOffset;
+
+        if (discreteInputsChunkLength > 472) then discreteInputsChunkLength := 472;
+
+        FillChar(discreteInputsChunkData[0], SizeOf(boolean) * 472, 0);
+        Move(discreteInputs[discreteInputsChunkOffset], discreteInputsChunkData[0], SizeOf(boolean) * discreteInputsChunkLength);
+
+        ModbusSlaveAnswerReadDiscreteInputsRequestLowLevel(requestID, discreteInputsLength, discreteInputsChunkOffset, discreteInputsChunkData);
+        Inc(discreteInputsChunkOffset, 472);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+function TBrickletRS485.ModbusMasterReadDiscreteInputs(const slaveAddress: byte; const startingAddress: longword; const count: word): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_DISCRETE_INPUTS, 15);
+  LEConvertUInt8To(slaveAddress, 8, request);
+  LEConvertUInt32To(startingAddress, 9, request);
+  LEConvertUInt16To(count, 13, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerReadInputRegistersRequestLowLevel(const requestID: byte; const inputRegistersLength: word; const inputRegistersChunkOffset: word; const inputRegistersChunkData: TArray0To28OfUInt16);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_SLAVE_ANSWER_READ_INPUT_REGISTERS_REQUEST_LOW_LEVEL, 71);
+  LEConvertUInt8To(requestID, 8, request);
+  LEConvertUInt16To(inputRegistersLength, 9, request);
+  LEConvertUInt16To(inputRegistersChunkOffset, 11, request);
+  for i := 0 to Length(inputRegistersChunkData) - 1 do LEConvertUInt16To(inputRegistersChunkData[i], 13 + (i * 2), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRS485.ModbusSlaveAnswerReadInputRegistersRequest(const requestID: byte; const inputRegisters: array of word);
+var
+  inputRegistersChunkOffset: word;
+  inputRegistersChunkData: TArray0To28OfUInt16;
+  inputRegistersChunkLength: word;
+  inputRegistersLength: word;
+begin
+  if (Length(inputRegisters) > 65535) then begin
+    raise EInvalidParameterException.Create('Input Registers can be at most 65535 items long');
+  end;
+
+  inputRegistersLength := Length(inputRegisters);
+  inputRegistersChunkOffset := 0;
+
+  if (inputRegistersLength = 0) then begin
+    FillChar(inputRegistersChunkData[0], SizeOf(word) * 29, 0);
+    ModbusSlaveAnswerReadInputRegistersRequestLowLevel(requestID, inputRegistersLength, inputRegistersChunkOffset, inputRegistersChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (inputRegistersChunkOffset < inputRegistersLength) do begin
+        inputRegistersChunkLength := inputRegistersLength - inputRegistersChunkOffset;
+
+        if (inputRegistersChunkLength > 29) then inputRegistersChunkLength := 29;
+
+        FillChar(inputRegistersChunkData[0], SizeOf(word) * 29, 0);
+        Move(inputRegisters[inputRegistersChunkOffset], inputRegistersChunkData[0], SizeOf(word) * inputRegistersChunkLength);
+
+        ModbusSlaveAnswerReadInputRegistersRequestLowLevel(requestID, inputRegistersLength, inputRegistersChunkOffset, inputRegistersChunkData);
+        Inc(inputRegistersChunkOffset, 29);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+function TBrickletRS485.ModbusMasterReadInputRegisters(const slaveAddress: byte; const startingAddress: longword; const count: word): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_MODBUS_MASTER_READ_INPUT_REGISTERS, 15);
+  LEConvertUInt8To(slaveAddress, 8, request);
+  LEConvertUInt32To(startingAddress, 9, request);
+  LEConvertUInt16To(count, 13, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRS485.SetFrameReadableCallbackConfiguration(const frameSize: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_SET_FRAME_READABLE_CALLBACK_CONFIGURATION, 10);
+  LEConvertUInt16To(frameSize, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.GetFrameReadableCallbackConfiguration: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_FRAME_READABLE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+procedure TBrickletRS485.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletRS485.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletRS485.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRS485.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRS485.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletRS485.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletRS485.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRS485.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRS485.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletRS485.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_RS485_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletRS485.CallbackWrapperReadLowLevel(const packet: TByteArray);
+var messageLength: word; messageChunkOffset: word; messageChunkData: TArray0To59OfChar; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  messageLength := LEConvertUInt16From(8, packet);
+  messageChunkOffset := LEConvertUInt16From(10, packet);
+  for i := 0 to 59 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), packet);
+
+  messageChunkLength := messageLength - messageChunkOffset;
+  if (messageChunkLength > 60) then begin
+    messageChunkLength := 60;
+  end;
+  if (readHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(readHighLevelCallbackState.data, messageLength);
+      Move(messageChunkData[0], readHighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      readHighLevelCallbackState.length := messageChunkLength;
+
+      if (readHighLevelCallbackState.length >= messageLength) then begin { Stream complete }
+        if (Assigned(readCallback)) then begin
+          readCallback(self, readHighLevelCallbackState.data);
+        end;
+        SetLength(readHighLevelCallbackState.data, 0);
+        readHighLevelCallbackState.data := nil;
+        readHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> readHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(readHighLevelCallbackState.data, 0);
+      readHighLevelCallbackState.data := nil;
+      readHighLevelCallbackState.length := 0;
+      if (Assigned(readCallback)) then begin
+        readCallback(self, readHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], readHighLevelCallbackState.data[readHighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(readHighLevelCallbackState.length, messageChunkLength);
+
+      if readHighLevelCallbackState.length >= messageLength then begin { Stream complete }
+        if (Assigned(readCallback)) then begin
+          readCallback(self, readHighLevelCallbackState.data);
+        end;
+        SetLength(readHighLevelCallbackState.data, 0);
+        readHighLevelCallbackState.data := nil;
+        readHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(readLowLevelCallback)) then begin
+    readLowLevelCallback(self, messageLength, messageChunkOffset, messageChunkData);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperErrorCount(const packet: TByteArray);
+var overrunErrorCount: longword; parityErrorCount: longword;
+begin
+  if (Length(packet) <> 16) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  overrunErrorCount := LEConvertUInt32From(8, packet);
+  parityErrorCount := LEConvertUInt32From(12, packet);
+  if (Assigned(errorCountCallback)) then begin
+    errorCountCallback(self, overrunErrorCount, parityErrorCount);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusSlaveReadCoilsRequest(const packet: TByteArray);
+var requestID: byte; startingAddress: longword; count: word;
+begin
+  if (Length(packet) <> 15) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  startingAddress := LEConvertUInt32From(9, packet);
+  count := LEConvertUInt16From(13, packet);
+  if (Assigned(modbusSlaveReadCoilsRequestCallback)) then begin
+    modbusSlaveReadCoilsRequestCallback(self, requestID, startingAddress, count);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusMasterReadCoilsResponseLowLevel(const packet: TByteArray);
+var requestID: byte; exceptionCode: shortint; coilsLength: word; coilsChunkOffset: word; coilsChunkData: TArray0To463OfBoolean; coilsChunkLength: word; i: longint; coilsChunkDataBits: array [0..57] of byte;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  exceptionCode := LEConvertInt8From(9, packet);
+  coilsLength := LEConvertUInt16From(10, packet);
+  coilsChunkOffset := LEConvertUInt16From(12, packet);
+  FillChar(coilsChunkDataBits[0], Length(coilsChunkDataBits) * SizeOf(coilsChunkDataBits[0]), 0);
+  for i := 0 to 57 do coilsChunkDataBits[i] := LEConvertUInt8From(14 + (i * 1), packet);
+  for i := 0 to 463 do coilsChunkData[i] := ((coilsChunkDataBits[Floor(i / 8)] and (1 shl (i mod 8))) <> 0);
+
+  coilsChunkLength := coilsLength - coilsChunkOffset;
+  if (coilsChunkLength > 464) then begin
+    coilsChunkLength := 464;
+  end;
+  if (modbusMasterReadCoilsResponseHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (coilsChunkOffset = 0) then begin { Stream starts }
+      SetLength(modbusMasterReadCoilsResponseHighLevelCallbackState.data, coilsLength);
+      Move(coilsChunkData[0], modbusMasterReadCoilsResponseHighLevelCallbackState.data[0], SizeOf(boolean) * coilsChunkLength);
+      modbusMasterReadCoilsResponseHighLevelCallbackState.length := coilsChunkLength;
+
+      if (modbusMasterReadCoilsResponseHighLevelCallbackState.length >= coilsLength) then begin { Stream complete }
+        if (Assigned(modbusMasterReadCoilsResponseCallback)) then begin
+          modbusMasterReadCoilsResponseCallback(self, requestID, exceptionCode, modbusMasterReadCoilsResponseHighLevelCallbackState.data);
+        end;
+        SetLength(modbusMasterReadCoilsResponseHighLevelCallbackState.data, 0);
+        modbusMasterReadCoilsResponseHighLevelCallbackState.data := nil;
+        modbusMasterReadCoilsResponseHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (coilsChunkOffset <> modbusMasterReadCoilsResponseHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(modbusMasterReadCoilsResponseHighLevelCallbackState.data, 0);
+      modbusMasterReadCoilsResponseHighLevelCallbackState.data := nil;
+      modbusMasterReadCoilsResponseHighLevelCallbackState.length := 0;
+      if (Assigned(modbusMasterReadCoilsResponseCallback)) then begin
+        modbusMasterReadCoilsResponseCallback(self, requestID, exceptionCode, modbusMasterReadCoilsResponseHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(coilsChunkData[0], modbusMasterReadCoilsResponseHighLevelCallbackState.data[modbusMasterReadCoilsResponseHighLevelCallbackState.length], SizeOf(boolean) * coilsChunkLength);
+      Inc(modbusMasterReadCoilsResponseHighLevelCallbackState.length, coilsChunkLength);
+
+      if modbusMasterReadCoilsResponseHighLevelCallbackState.length >= coilsLength then begin { Stream complete }
+        if (Assigned(modbusMasterReadCoilsResponseCallback)) then begin
+          modbusMasterReadCoilsResponseCallback(self, requestID, exceptionCode, modbusMasterReadCoilsResponseHighLevelCallbackState.data);
+        end;
+        SetLength(modbusMasterReadCoilsResponseHighLevelCallbackState.data, 0);
+        modbusMasterReadCoilsResponseHighLevelCallbackState.data := nil;
+        modbusMasterReadCoilsResponseHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(modbusMasterReadCoilsResponseLowLevelCallback)) then begin
+    modbusMasterReadCoilsResponseLowLevelCallback(self, requestID, exceptionCode, coilsLength, coilsChunkOffset, coilsChunkData);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusSlaveReadHoldingRegistersRequest(const packet: TByteArray);
+var requestID: byte; startingAddress: longword; count: word;
+begin
+  if (Length(packet) <> 15) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  startingAddress := LEConvertUInt32From(9, packet);
+  count := LEConvertUInt16From(13, packet);
+  if (Assigned(modbusSlaveReadHoldingRegistersRequestCallback)) then begin
+    modbusSlaveReadHoldingRegistersRequestCallback(self, requestID, startingAddress, count);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusMasterReadHoldingRegistersResponseLowLevel(const packet: TByteArray);
+var requestID: byte; exceptionCode: shortint; holdingRegistersLength: word; holdingRegistersChunkOffset: word; holdingRegistersChunkData: TArray0To28OfUInt16; holdingRegistersChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  exceptionCode := LEConvertInt8From(9, packet);
+  holdingRegistersLength := LEConvertUInt16From(10, packet);
+  holdingRegistersChunkOffset := LEConvertUInt16From(12, packet);
+  for i := 0 to 28 do holdingRegistersChunkData[i] := LEConvertUInt16From(14 + (i * 2), packet);
+
+  holdingRegistersChunkLength := holdingRegistersLength - holdingRegistersChunkOffset;
+  if (holdingRegistersChunkLength > 29) then begin
+    holdingRegistersChunkLength := 29;
+  end;
+  if (modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (holdingRegistersChunkOffset = 0) then begin { Stream starts }
+      SetLength(modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data, holdingRegistersLength);
+      Move(holdingRegistersChunkData[0], modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data[0], SizeOf(word) * holdingRegistersChunkLength);
+      modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.length := holdingRegistersChunkLength;
+
+      if (modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.length >= holdingRegistersLength) then begin { Stream complete }
+        if (Assigned(modbusMasterReadHoldingRegistersResponseCallback)) then begin
+          modbusMasterReadHoldingRegistersResponseCallback(self, requestID, exceptionCode, modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data);
+        end;
+        SetLength(modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data, 0);
+        modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data := nil;
+        modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (holdingRegistersChunkOffset <> modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data, 0);
+      modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data := nil;
+      modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.length := 0;
+      if (Assigned(modbusMasterReadHoldingRegistersResponseCallback)) then begin
+        modbusMasterReadHoldingRegistersResponseCallback(self, requestID, exceptionCode, modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(holdingRegistersChunkData[0], modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data[modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.length], SizeOf(word) * holdingRegistersChunkLength);
+      Inc(modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.length, holdingRegistersChunkLength);
+
+      if modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.length >= holdingRegistersLength then begin { Stream complete }
+        if (Assigned(modbusMasterReadHoldingRegistersResponseCallback)) then begin
+          modbusMasterReadHoldingRegistersResponseCallback(self, requestID, exceptionCode, modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data);
+        end;
+        SetLength(modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data, 0);
+        modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.data := nil;
+        modbusMasterReadHoldingRegistersResponseHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(modbusMasterReadHoldingRegistersResponseLowLevelCallback)) then begin
+    modbusMasterReadHoldingRegistersResponseLowLevelCallback(self, requestID, exceptionCode, holdingRegistersLength, holdingRegistersChunkOffset, holdingRegistersChunkData);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusSlaveWriteSingleCoilRequest(const packet: TByteArray);
+var requestID: byte; coilAddress: longword; coilValue: boolean;
+begin
+  if (Length(packet) <> 14) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  coilAddress := LEConvertUInt32From(9, packet);
+  coilValue := LEConvertBooleanFrom(13, packet);
+  if (Assigned(modbusSlaveWriteSingleCoilRequestCallback)) then begin
+    modbusSlaveWriteSingleCoilRequestCallback(self, requestID, coilAddress, coilValue);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusMasterWriteSingleCoilResponse(const packet: TByteArray);
+var requestID: byte; exceptionCode: shortint;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  exceptionCode := LEConvertInt8From(9, packet);
+  if (Assigned(modbusMasterWriteSingleCoilResponseCallback)) then begin
+    modbusMasterWriteSingleCoilResponseCallback(self, requestID, exceptionCode);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusSlaveWriteSingleRegisterRequest(const packet: TByteArray);
+var requestID: byte; registerAddress: longword; registerValue: word;
+begin
+  if (Length(packet) <> 15) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  registerAddress := LEConvertUInt32From(9, packet);
+  registerValue := LEConvertUInt16From(13, packet);
+  if (Assigned(modbusSlaveWriteSingleRegisterRequestCallback)) then begin
+    modbusSlaveWriteSingleRegisterRequestCallback(self, requestID, registerAddress, registerValue);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusMasterWriteSingleRegisterResponse(const packet: TByteArray);
+var requestID: byte; exceptionCode: shortint;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  exceptionCode := LEConvertInt8From(9, packet);
+  if (Assigned(modbusMasterWriteSingleRegisterResponseCallback)) then begin
+    modbusMasterWriteSingleRegisterResponseCallback(self, requestID, exceptionCode);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusSlaveWriteMultipleCoilsRequestLowLevel(const packet: TByteArray);
+var requestID: byte; startingAddress: longword; coilsLength: word; coilsChunkOffset: word; coilsChunkData: TArray0To439OfBoolean; coilsChunkLength: word; i: longint; coilsChunkDataBits: array [0..54] of byte;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  startingAddress := LEConvertUInt32From(9, packet);
+  coilsLength := LEConvertUInt16From(13, packet);
+  coilsChunkOffset := LEConvertUInt16From(15, packet);
+  FillChar(coilsChunkDataBits[0], Length(coilsChunkDataBits) * SizeOf(coilsChunkDataBits[0]), 0);
+  for i := 0 to 54 do coilsChunkDataBits[i] := LEConvertUInt8From(17 + (i * 1), packet);
+  for i := 0 to 439 do coilsChunkData[i] := ((coilsChunkDataBits[Floor(i / 8)] and (1 shl (i mod 8))) <> 0);
+
+  coilsChunkLength := coilsLength - coilsChunkOffset;
+  if (coilsChunkLength > 440) then begin
+    coilsChunkLength := 440;
+  end;
+  if (modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (coilsChunkOffset = 0) then begin { Stream starts }
+      SetLength(modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data, coilsLength);
+      Move(coilsChunkData[0], modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data[0], SizeOf(boolean) * coilsChunkLength);
+      modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.length := coilsChunkLength;
+
+      if (modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.length >= coilsLength) then begin { Stream complete }
+        if (Assigned(modbusSlaveWriteMultipleCoilsRequestCallback)) then begin
+          modbusSlaveWriteMultipleCoilsRequestCallback(self, requestID, startingAddress, modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data);
+        end;
+        SetLength(modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data, 0);
+        modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data := nil;
+        modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (coilsChunkOffset <> modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data, 0);
+      modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data := nil;
+      modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.length := 0;
+      if (Assigned(modbusSlaveWriteMultipleCoilsRequestCallback)) then begin
+        modbusSlaveWriteMultipleCoilsRequestCallback(self, requestID, startingAddress, modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(coilsChunkData[0], modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data[modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.length], SizeOf(boolean) * coilsChunkLength);
+      Inc(modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.length, coilsChunkLength);
+
+      if modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.length >= coilsLength then begin { Stream complete }
+        if (Assigned(modbusSlaveWriteMultipleCoilsRequestCallback)) then begin
+          modbusSlaveWriteMultipleCoilsRequestCallback(self, requestID, startingAddress, modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data);
+        end;
+        SetLength(modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data, 0);
+        modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.data := nil;
+        modbusSlaveWriteMultipleCoilsRequestHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(modbusSlaveWriteMultipleCoilsRequestLowLevelCallback)) then begin
+    modbusSlaveWriteMultipleCoilsRequestLowLevelCallback(self, requestID, startingAddress, coilsLength, coilsChunkOffset, coilsChunkData);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusMasterWriteMultipleCoilsResponse(const packet: TByteArray);
+var requestID: byte; exceptionCode: shortint;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  exceptionCode := LEConvertInt8From(9, packet);
+  if (Assigned(modbusMasterWriteMultipleCoilsResponseCallback)) then begin
+    modbusMasterWriteMultipleCoilsResponseCallback(self, requestID, exceptionCode);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusSlaveWriteMultipleRegistersRequestLowLevel(const packet: TByteArray);
+var requestID: byte; startingAddress: longword; registersLength: word; registersChunkOffset: word; registersChunkData: TArray0To26OfUInt16; registersChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 71) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  startingAddress := LEConvertUInt32From(9, packet);
+  registersLength := LEConvertUInt16From(13, packet);
+  registersChunkOffset := LEConvertUInt16From(15, packet);
+  for i := 0 to 26 do registersChunkData[i] := LEConvertUInt16From(17 + (i * 2), packet);
+
+  registersChunkLength := registersLength - registersChunkOffset;
+  if (registersChunkLength > 27) then begin
+    registersChunkLength := 27;
+  end;
+  if (modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (registersChunkOffset = 0) then begin { Stream starts }
+      SetLength(modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data, registersLength);
+      Move(registersChunkData[0], modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data[0], SizeOf(word) * registersChunkLength);
+      modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.length := registersChunkLength;
+
+      if (modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.length >= registersLength) then begin { Stream complete }
+        if (Assigned(modbusSlaveWriteMultipleRegistersRequestCallback)) then begin
+          modbusSlaveWriteMultipleRegistersRequestCallback(self, requestID, startingAddress, modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data);
+        end;
+        SetLength(modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data, 0);
+        modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data := nil;
+        modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (registersChunkOffset <> modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data, 0);
+      modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data := nil;
+      modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.length := 0;
+      if (Assigned(modbusSlaveWriteMultipleRegistersRequestCallback)) then begin
+        modbusSlaveWriteMultipleRegistersRequestCallback(self, requestID, startingAddress, modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(registersChunkData[0], modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data[modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.length], SizeOf(word) * registersChunkLength);
+      Inc(modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.length, registersChunkLength);
+
+      if modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.length >= registersLength then begin { Stream complete }
+        if (Assigned(modbusSlaveWriteMultipleRegistersRequestCallback)) then begin
+          modbusSlaveWriteMultipleRegistersRequestCallback(self, requestID, startingAddress, modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data);
+        end;
+        SetLength(modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data, 0);
+        modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.data := nil;
+        modbusSlaveWriteMultipleRegistersRequestHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(modbusSlaveWriteMultipleRegistersRequestLowLevelCallback)) then begin
+    modbusSlaveWriteMultipleRegistersRequestLowLevelCallback(self, requestID, startingAddress, registersLength, registersChunkOffset, registersChunkData);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusMasterWriteMultipleRegistersResponse(const packet: TByteArray);
+var requestID: byte; exceptionCode: shortint;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  exceptionCode := LEConvertInt8From(9, packet);
+  if (Assigned(modbusMasterWriteMultipleRegistersResponseCallback)) then begin
+    modbusMasterWriteMultipleRegistersResponseCallback(self, requestID, exceptionCode);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusSlaveReadDiscreteInputsRequest(const packet: TByteArray);
+var requestID: byte; startingAddress: longword; count: word;
+begin
+  if (Length(packet) <> 15) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  startingAddress := LEConvertUInt32From(9, packet);
+  count := LEConvertUInt16From(13, packet);
+  if (Assigned(modbusSlaveReadDiscreteInputsRequestCallback)) then begin
+    modbusSlaveReadDiscreteInputsRequestCallback(self, requestID, startingAddress, count);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusMasterReadDiscreteInputsResponseLowLevel(const packet: TByteArray);
+var requestID: byte; exceptionCode: shortint; discreteInputsLength: word; discreteInputsChunkOffset: word; discreteInputsChunkData: TArray0To463OfBoolean; discreteInputsChunkLength: word; i: longint; discreteInputsChunkDataBits: array [0..57] of byte;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  exceptionCode := LEConvertInt8From(9, packet);
+  discreteInputsLength := LEConvertUInt16From(10, packet);
+  discreteInputsChunkOffset := LEConvertUInt16From(12, packet);
+  FillChar(discreteInputsChunkDataBits[0], Length(discreteInputsChunkDataBits) * SizeOf(discreteInputsChunkDataBits[0]), 0);
+  for i := 0 to 57 do discreteInputsChunkDataBits[i] := LEConvertUInt8From(14 + (i * 1), packet);
+  for i := 0 to 463 do discreteInputsChunkData[i] := ((discreteInputsChunkDataBits[Floor(i / 8)] and (1 shl (i mod 8))) <> 0);
+
+  discreteInputsChunkLength := discreteInputsLength - discreteInputsChunkOffset;
+  if (discreteInputsChunkLength > 464) then begin
+    discreteInputsChunkLength := 464;
+  end;
+  if (modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (discreteInputsChunkOffset = 0) then begin { Stream starts }
+      SetLength(modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data, discreteInputsLength);
+      Move(discreteInputsChunkData[0], modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data[0], SizeOf(boolean) * discreteInputsChunkLength);
+      modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.length := discreteInputsChunkLength;
+
+      if (modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.length >= discreteInputsLength) then begin { Stream complete }
+        if (Assigned(modbusMasterReadDiscreteInputsResponseCallback)) then begin
+          modbusMasterReadDiscreteInputsResponseCallback(self, requestID, exceptionCode, modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data);
+        end;
+        SetLength(modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data, 0);
+        modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data := nil;
+        modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (discreteInputsChunkOffset <> modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data, 0);
+      modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data := nil;
+      modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.length := 0;
+      if (Assigned(modbusMasterReadDiscreteInputsResponseCallback)) then begin
+        modbusMasterReadDiscreteInputsResponseCallback(self, requestID, exceptionCode, modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(discreteInputsChunkData[0], modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data[modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.length], SizeOf(boolean) * discreteInputsChunkLength);
+      Inc(modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.length, discreteInputsChunkLength);
+
+      if modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.length >= discreteInputsLength then begin { Stream complete }
+        if (Assigned(modbusMasterReadDiscreteInputsResponseCallback)) then begin
+          modbusMasterReadDiscreteInputsResponseCallback(self, requestID, exceptionCode, modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data);
+        end;
+        SetLength(modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data, 0);
+        modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.data := nil;
+        modbusMasterReadDiscreteInputsResponseHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(modbusMasterReadDiscreteInputsResponseLowLevelCallback)) then begin
+    modbusMasterReadDiscreteInputsResponseLowLevelCallback(self, requestID, exceptionCode, discreteInputsLength, discreteInputsChunkOffset, discreteInputsChunkData);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusSlaveReadInputRegistersRequest(const packet: TByteArray);
+var requestID: byte; startingAddress: longword; count: word;
+begin
+  if (Length(packet) <> 15) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  startingAddress := LEConvertUInt32From(9, packet);
+  count := LEConvertUInt16From(13, packet);
+  if (Assigned(modbusSlaveReadInputRegistersRequestCallback)) then begin
+    modbusSlaveReadInputRegistersRequestCallback(self, requestID, startingAddress, count);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperModbusMasterReadInputRegistersResponseLowLevel(const packet: TByteArray);
+var requestID: byte; exceptionCode: shortint; inputRegistersLength: word; inputRegistersChunkOffset: word; inputRegistersChunkData: TArray0To28OfUInt16; inputRegistersChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  requestID := LEConvertUInt8From(8, packet);
+  exceptionCode := LEConvertInt8From(9, packet);
+  inputRegistersLength := LEConvertUInt16From(10, packet);
+  inputRegistersChunkOffset := LEConvertUInt16From(12, packet);
+  for i := 0 to 28 do inputRegistersChunkData[i] := LEConvertUInt16From(14 + (i * 2), packet);
+
+  inputRegistersChunkLength := inputRegistersLength - inputRegistersChunkOffset;
+  if (inputRegistersChunkLength > 29) then begin
+    inputRegistersChunkLength := 29;
+  end;
+  if (modbusMasterReadInputRegistersResponseHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (inputRegistersChunkOffset = 0) then begin { Stream starts }
+      SetLength(modbusMasterReadInputRegistersResponseHighLevelCallbackState.data, inputRegistersLength);
+      Move(inputRegistersChunkData[0], modbusMasterReadInputRegistersResponseHighLevelCallbackState.data[0], SizeOf(word) * inputRegistersChunkLength);
+      modbusMasterReadInputRegistersResponseHighLevelCallbackState.length := inputRegistersChunkLength;
+
+      if (modbusMasterReadInputRegistersResponseHighLevelCallbackState.length >= inputRegistersLength) then begin { Stream complete }
+        if (Assigned(modbusMasterReadInputRegistersResponseCallback)) then begin
+          modbusMasterReadInputRegistersResponseCallback(self, requestID, exceptionCode, modbusMasterReadInputRegistersResponseHighLevelCallbackState.data);
+        end;
+        SetLength(modbusMasterReadInputRegistersResponseHighLevelCallbackState.data, 0);
+        modbusMasterReadInputRegistersResponseHighLevelCallbackState.data := nil;
+        modbusMasterReadInputRegistersResponseHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (inputRegistersChunkOffset <> modbusMasterReadInputRegistersResponseHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(modbusMasterReadInputRegistersResponseHighLevelCallbackState.data, 0);
+      modbusMasterReadInputRegistersResponseHighLevelCallbackState.data := nil;
+      modbusMasterReadInputRegistersResponseHighLevelCallbackState.length := 0;
+      if (Assigned(modbusMasterReadInputRegistersResponseCallback)) then begin
+        modbusMasterReadInputRegistersResponseCallback(self, requestID, exceptionCode, modbusMasterReadInputRegistersResponseHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(inputRegistersChunkData[0], modbusMasterReadInputRegistersResponseHighLevelCallbackState.data[modbusMasterReadInputRegistersResponseHighLevelCallbackState.length], SizeOf(word) * inputRegistersChunkLength);
+      Inc(modbusMasterReadInputRegistersResponseHighLevelCallbackState.length, inputRegistersChunkLength);
+
+      if modbusMasterReadInputRegistersResponseHighLevelCallbackState.length >= inputRegistersLength then begin { Stream complete }
+        if (Assigned(modbusMasterReadInputRegistersResponseCallback)) then begin
+          modbusMasterReadInputRegistersResponseCallback(self, requestID, exceptionCode, modbusMasterReadInputRegistersResponseHighLevelCallbackState.data);
+        end;
+        SetLength(modbusMasterReadInputRegistersResponseHighLevelCallbackState.data, 0);
+        modbusMasterReadInputRegistersResponseHighLevelCallbackState.data := nil;
+        modbusMasterReadInputRegistersResponseHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(modbusMasterReadInputRegistersResponseLowLevelCallback)) then begin
+    modbusMasterReadInputRegistersResponseLowLevelCallback(self, requestID, exceptionCode, inputRegistersLength, inputRegistersChunkOffset, inputRegistersChunkData);
+  end;
+end;
+
+procedure TBrickletRS485.CallbackWrapperFrameReadable(const packet: TByteArray);
+var frameCount: word;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  frameCount := LEConvertUInt16From(8, packet);
+  if (Assigned(frameReadableCallback)) then begin
+    frameReadableCallback(self, frameCount);
+  end;
+end;
+
+end.
@@ -0,0 +1,643 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletRealTimeClockV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_REAL_TIME_CLOCK_V2_DEVICE_IDENTIFIER = 2106;
+  BRICKLET_REAL_TIME_CLOCK_V2_DEVICE_DISPLAY_NAME = 'Real-Time Clock Bricklet 2.0';
+
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_DATE_TIME = 1;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_DATE_TIME = 2;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_TIMESTAMP = 3;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_OFFSET = 4;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_OFFSET = 5;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_DATE_TIME_CALLBACK_CONFIGURATION = 6;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_DATE_TIME_CALLBACK_CONFIGURATION = 7;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_ALARM = 8;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_ALARM = 9;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_RESET = 243;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_REAL_TIME_CLOCK_V2_CALLBACK_DATE_TIME = 10;
+  BRICKLET_REAL_TIME_CLOCK_V2_CALLBACK_ALARM = 11;
+
+  BRICKLET_REAL_TIME_CLOCK_V2_WEEKDAY_MONDAY = 1;
+  BRICKLET_REAL_TIME_CLOCK_V2_WEEKDAY_TUESDAY = 2;
+  BRICKLET_REAL_TIME_CLOCK_V2_WEEKDAY_WEDNESDAY = 3;
+  BRICKLET_REAL_TIME_CLOCK_V2_WEEKDAY_THURSDAY = 4;
+  BRICKLET_REAL_TIME_CLOCK_V2_WEEKDAY_FRIDAY = 5;
+  BRICKLET_REAL_TIME_CLOCK_V2_WEEKDAY_SATURDAY = 6;
+  BRICKLET_REAL_TIME_CLOCK_V2_WEEKDAY_SUNDAY = 7;
+  BRICKLET_REAL_TIME_CLOCK_V2_ALARM_MATCH_DISABLED = -1;
+  BRICKLET_REAL_TIME_CLOCK_V2_ALARM_INTERVAL_DISABLED = -1;
+  BRICKLET_REAL_TIME_CLOCK_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_REAL_TIME_CLOCK_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_REAL_TIME_CLOCK_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_REAL_TIME_CLOCK_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_REAL_TIME_CLOCK_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_REAL_TIME_CLOCK_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_REAL_TIME_CLOCK_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_REAL_TIME_CLOCK_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_REAL_TIME_CLOCK_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_REAL_TIME_CLOCK_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_REAL_TIME_CLOCK_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_REAL_TIME_CLOCK_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_REAL_TIME_CLOCK_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_REAL_TIME_CLOCK_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_REAL_TIME_CLOCK_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletRealTimeClockV2 = class;
+  TBrickletRealTimeClockV2NotifyDateTime = procedure(sender: TBrickletRealTimeClockV2; const year: word; const month: byte; const day: byte; const hour: byte; const minute: byte; const second: byte; const centisecond: byte; const weekday: byte; const timestamp: int64) of object;
+  TBrickletRealTimeClockV2NotifyAlarm = procedure(sender: TBrickletRealTimeClockV2; const year: word; const month: byte; const day: byte; const hour: byte; const minute: byte; const second: byte; const centisecond: byte; const weekday: byte; const timestamp: int64) of object;
+
+  /// <summary>
+  ///  Battery-backed real-time clock
+  /// </summary>
+  TBrickletRealTimeClockV2 = class(TDevice)
+  private
+    dateTimeCallback: TBrickletRealTimeClockV2NotifyDateTime;
+    alarmCallback: TBrickletRealTimeClockV2NotifyAlarm;
+  protected
+    procedure CallbackWrapperDateTime(const packet: TByteArray); virtual;
+    procedure CallbackWrapperAlarm(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Sets the current date (including weekday) and the current time.
+    ///  
+    ///  If the backup battery is installed then the real-time clock keeps date and
+    ///  time even if the Bricklet is not powered by a Brick.
+    ///  
+    ///  The real-time clock handles leap year and inserts the 29th of February
+    ///  accordingly. But leap seconds, time zones and daylight saving time are not
+    ///  handled.
+    /// </summary>
+    procedure SetDateTime(const year: word; const month: byte; const day: byte; const hour: byte; const minute: byte; const second: byte; const centisecond: byte; const weekday: byte); virtual;
+
+    /// <summary>
+    ///  Returns the current date (including weekday) and the current time of the
+    ///  real-time.
+    ///  
+    ///  The timestamp represents the current date and the the current time of the
+    ///  real-time clock converted to milliseconds and is an offset to 2000-01-01 00:00:00.0000.
+    /// </summary>
+    procedure GetDateTime(out year: word; out month: byte; out day: byte; out hour: byte; out minute: byte; out second: byte; out centisecond: byte; out weekday: byte; out timestamp: int64); virtual;
+
+    /// <summary>
+    ///  Returns the current date and the time of the real-time clock converted to
+    ///  milliseconds. The timestamp has an effective resolution of hundredths of a
+    ///  second and is an offset to 2000-01-01 00:00:00.0000.
+    /// </summary>
+    function GetTimestamp: int64; virtual;
+
+    /// <summary>
+    ///  Sets the offset the real-time clock should compensate for in 2.17 ppm steps
+    ///  between -277.76 ppm (-128) and +275.59 ppm (127).
+    ///  
+    ///  The real-time clock time can deviate from the actual time due to the frequency
+    ///  deviation of its 32.768 kHz crystal. Even without compensation (factory
+    ///  default) the resulting time deviation should be at most ±20 ppm (±52.6
+    ///  seconds per month).
+    ///  
+    ///  This deviation can be calculated by comparing the same duration measured by the
+    ///  real-time clock (``rtc_duration``) an accurate reference clock
+    ///  (``ref_duration``).
+    ///  
+    ///  For best results the configured offset should be set to 0 ppm first and then a
+    ///  duration of at least 6 hours should be measured.
+    ///  
+    ///  The new offset (``new_offset``) can be calculated from the currently configured
+    ///  offset (``current_offset``) and the measured durations as follow::
+    ///  
+    ///    new_offset = current_offset - round(1000000 * (rtc_duration - ref_duration) / rtc_duration / 2.17)
+    ///  
+    ///  If you want to calculate the offset, then we recommend using the calibration
+    ///  dialog in Brick Viewer, instead of doing it manually.
+    ///  
+    ///  The offset is saved in the EEPROM of the Bricklet and only needs to be
+    ///  configured once.
+    /// </summary>
+    procedure SetOffset(const offset: shortint); virtual;
+
+    /// <summary>
+    ///  Returns the offset as set by <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.SetOffset"/>.
+    /// </summary>
+    function GetOffset: shortint; virtual;
+
+    /// <summary>
+    ///  Sets the period with which the <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.OnDateTime"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    /// </summary>
+    procedure SetDateTimeCallbackConfiguration(const period: longword); virtual;
+
+    /// <summary>
+    ///  Returns the period as set by <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.SetDateTimeCallbackConfiguration"/>.
+    /// </summary>
+    function GetDateTimeCallbackConfiguration: longword; virtual;
+
+    /// <summary>
+    ///  Configures a repeatable alarm. The <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.OnAlarm"/> callback is triggered if the
+    ///  current date and time matches the configured alarm.
+    ///  
+    ///  Setting a parameter to -1 means that it should be disabled and doesn't take part
+    ///  in the match. Setting all parameters to -1 disables the alarm completely.
+    ///  
+    ///  For example, to make the alarm trigger every day at 7:30 AM it can be
+    ///  configured as (-1, -1, 7, 30, -1, -1, -1). The hour is set to match 7 and the
+    ///  minute is set to match 30. The alarm is triggered if all enabled parameters
+    ///  match.
+    ///  
+    ///  The interval has a special role. It allows to make the alarm reconfigure itself.
+    ///  This is useful if you need a repeated alarm that cannot be expressed by matching
+    ///  the current date and time. For example, to make the alarm trigger every 23
+    ///  seconds it can be configured as (-1, -1, -1, -1, -1, -1, 23). Internally the
+    ///  Bricklet will take the current date and time, add 23 seconds to it and set the
+    ///  result as its alarm. The first alarm will be triggered 23 seconds after the
+    ///  call. Because the interval is not -1, the Bricklet will do the same again
+    ///  internally, take the current date and time, add 23 seconds to it and set that
+    ///  as its alarm. This results in a repeated alarm that triggers every 23 seconds.
+    ///  
+    ///  The interval can also be used in combination with the other parameters. For
+    ///  example, configuring the alarm as (-1, -1, 7, 30, -1, -1, 300) results in an
+    ///  alarm that triggers every day at 7:30 AM and is then repeated every 5 minutes.
+    /// </summary>
+    procedure SetAlarm(const month: shortint; const day: shortint; const hour: shortint; const minute: shortint; const second: shortint; const weekday: shortint; const interval: longint); virtual;
+
+    /// <summary>
+    ///  Returns the alarm configuration as set by <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.SetAlarm"/>.
+    /// </summary>
+    procedure GetAlarm(out month: shortint; out day: shortint; out hour: shortint; out minute: shortint; out second: shortint; out weekday: shortint; out interval: longint); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically with the period that is set by
+    ///  <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.SetDateTimeCallbackConfiguration"/>. The parameters are the
+    ///  same as for <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.GetDateTime"/>.
+    /// </summary>
+    property OnDateTime: TBrickletRealTimeClockV2NotifyDateTime read dateTimeCallback write dateTimeCallback;
+
+    /// <summary>
+    ///  This callback is triggered every time the current date and time matches the
+    ///  configured alarm (see <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.SetAlarm"/>). The parameters are the same
+    ///  as for <see cref="BrickletRealTimeClockV2.TBrickletRealTimeClockV2.GetDateTime"/>.
+    /// </summary>
+    property OnAlarm: TBrickletRealTimeClockV2NotifyAlarm read alarmCallback write alarmCallback;
+  end;
+
+implementation
+
+constructor TBrickletRealTimeClockV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_REAL_TIME_CLOCK_V2_DEVICE_IDENTIFIER, BRICKLET_REAL_TIME_CLOCK_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_DATE_TIME] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_DATE_TIME] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_TIMESTAMP] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_OFFSET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_OFFSET] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_DATE_TIME_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_DATE_TIME_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_ALARM] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_ALARM] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_REAL_TIME_CLOCK_V2_CALLBACK_DATE_TIME] := {$ifdef FPC}@{$endif}CallbackWrapperDateTime;
+  callbackWrappers[BRICKLET_REAL_TIME_CLOCK_V2_CALLBACK_ALARM] := {$ifdef FPC}@{$endif}CallbackWrapperAlarm;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletRealTimeClockV2.SetDateTime(const year: word; const month: byte; const day: byte; const hour: byte; const minute: byte; const second: byte; const centisecond: byte; const weekday: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_DATE_TIME, 17);
+  LEConvertUInt16To(year, 8, request);
+  LEConvertUInt8To(month, 10, request);
+  LEConvertUInt8To(day, 11, request);
+  LEConvertUInt8To(hour, 12, request);
+  LEConvertUInt8To(minute, 13, request);
+  LEConvertUInt8To(second, 14, request);
+  LEConvertUInt8To(centisecond, 15, request);
+  LEConvertUInt8To(weekday, 16, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRealTimeClockV2.GetDateTime(out year: word; out month: byte; out day: byte; out hour: byte; out minute: byte; out second: byte; out centisecond: byte; out weekday: byte; out timestamp: int64);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_DATE_TIME, 8);
+  response := SendRequest(request, 25);
+  year := LEConvertUInt16From(8, response);
+  month := LEConvertUInt8From(10, response);
+  day := LEConvertUInt8From(11, response);
+  hour := LEConvertUInt8From(12, response);
+  minute := LEConvertUInt8From(13, response);
+  second := LEConvertUInt8From(14, response);
+  centisecond := LEConvertUInt8From(15, response);
+  weekday := LEConvertUInt8From(16, response);
+  timestamp := LEConvertInt64From(17, response);
+end;
+
+function TBrickletRealTimeClockV2.GetTimestamp: int64;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_TIMESTAMP, 8);
+  response := SendRequest(request, 16);
+  result := LEConvertInt64From(8, response);
+end;
+
+procedure TBrickletRealTimeClockV2.SetOffset(const offset: shortint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_OFFSET, 9);
+  LEConvertInt8To(offset, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRealTimeClockV2.GetOffset: shortint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_OFFSET, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertInt8From(8, response);
+end;
+
+procedure TBrickletRealTimeClockV2.SetDateTimeCallbackConfiguration(const period: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_DATE_TIME_CALLBACK_CONFIGURATION, 12);
+  LEConvertUInt32To(period, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRealTimeClockV2.GetDateTimeCallbackConfiguration: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_DATE_TIME_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletRealTimeClockV2.SetAlarm(const month: shortint; const day: shortint; const hour: shortint; const minute: shortint; const second: shortint; const weekday: shortint; const interval: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_ALARM, 18);
+  LEConvertInt8To(month, 8, request);
+  LEConvertInt8To(day, 9, request);
+  LEConvertInt8To(hour, 10, request);
+  LEConvertInt8To(minute, 11, request);
+  LEConvertInt8To(second, 12, request);
+  LEConvertInt8To(weekday, 13, request);
+  LEConvertInt32To(interval, 14, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRealTimeClockV2.GetAlarm(out month: shortint; out day: shortint; out hour: shortint; out minute: shortint; out second: shortint; out weekday: shortint; out interval: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_ALARM, 8);
+  response := SendRequest(request, 18);
+  month := LEConvertInt8From(8, response);
+  day := LEConvertInt8From(9, response);
+  hour := LEConvertInt8From(10, response);
+  minute := LEConvertInt8From(11, response);
+  second := LEConvertInt8From(12, response);
+  weekday := LEConvertInt8From(13, response);
+  interval := LEConvertInt32From(14, response);
+end;
+
+procedure TBrickletRealTimeClockV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletRealTimeClockV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletRealTimeClockV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRealTimeClockV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRealTimeClockV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRealTimeClockV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRealTimeClockV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletRealTimeClockV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletRealTimeClockV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRealTimeClockV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRealTimeClockV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletRealTimeClockV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REAL_TIME_CLOCK_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletRealTimeClockV2.CallbackWrapperDateTime(const packet: TByteArray);
+var year: word; month: byte; day: byte; hour: byte; minute: byte; second: byte; centisecond: byte; weekday: byte; timestamp: int64;
+begin
+  if (Length(packet) <> 25) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  year := LEConvertUInt16From(8, packet);
+  month := LEConvertUInt8From(10, packet);
+  day := LEConvertUInt8From(11, packet);
+  hour := LEConvertUInt8From(12, packet);
+  minute := LEConvertUInt8From(13, packet);
+  second := LEConvertUInt8From(14, packet);
+  centisecond := LEConvertUInt8From(15, packet);
+  weekday := LEConvertUInt8From(16, packet);
+  timestamp := LEConvertInt64From(17, packet);
+  if (Assigned(dateTimeCallback)) then begin
+    dateTimeCallback(self, year, month, day, hour, minute, second, centisecond, weekday, timestamp);
+  end;
+end;
+
+procedure TBrickletRealTimeClockV2.CallbackWrapperAlarm(const packet: TByteArray);
+var year: word; month: byte; day: byte; hour: byte; minute: byte; second: byte; centisecond: byte; weekday: byte; timestamp: int64;
+begin
+  if (Length(packet) <> 25) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  year := LEConvertUInt16From(8, packet);
+  month := LEConvertUInt8From(10, packet);
+  day := LEConvertUInt8From(11, packet);
+  hour := LEConvertUInt8From(12, packet);
+  minute := LEConvertUInt8From(13, packet);
+  second := LEConvertUInt8From(14, packet);
+  centisecond := LEConvertUInt8From(15, packet);
+  weekday := LEConvertUInt8From(16, packet);
+  timestamp := LEConvertInt64From(17, packet);
+  if (Assigned(alarmCallback)) then begin
+    alarmCallback(self, year, month, day, hour, minute, second, centisecond, weekday, timestamp);
+  end;
+end;
+
+end.
@@ -0,0 +1,743 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletRemoteSwitchV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_REMOTE_SWITCH_V2_DEVICE_IDENTIFIER = 289;
+  BRICKLET_REMOTE_SWITCH_V2_DEVICE_DISPLAY_NAME = 'Remote Switch Bricklet 2.0';
+
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_SWITCHING_STATE = 1;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_REPEATS = 3;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REPEATS = 4;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SWITCH_SOCKET_A = 5;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SWITCH_SOCKET_B = 6;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_DIM_SOCKET_B = 7;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SWITCH_SOCKET_C = 8;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_REMOTE_CONFIGURATION = 9;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_CONFIGURATION = 10;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_STATUS_A = 11;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_STATUS_B = 12;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_STATUS_C = 13;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_RESET = 243;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_REMOTE_SWITCH_V2_CALLBACK_SWITCHING_DONE = 2;
+  BRICKLET_REMOTE_SWITCH_V2_CALLBACK_REMOTE_STATUS_A = 14;
+  BRICKLET_REMOTE_SWITCH_V2_CALLBACK_REMOTE_STATUS_B = 15;
+  BRICKLET_REMOTE_SWITCH_V2_CALLBACK_REMOTE_STATUS_C = 16;
+
+  BRICKLET_REMOTE_SWITCH_V2_SWITCHING_STATE_READY = 0;
+  BRICKLET_REMOTE_SWITCH_V2_SWITCHING_STATE_BUSY = 1;
+  BRICKLET_REMOTE_SWITCH_V2_SWITCH_TO_OFF = 0;
+  BRICKLET_REMOTE_SWITCH_V2_SWITCH_TO_ON = 1;
+  BRICKLET_REMOTE_SWITCH_V2_REMOTE_TYPE_A = 0;
+  BRICKLET_REMOTE_SWITCH_V2_REMOTE_TYPE_B = 1;
+  BRICKLET_REMOTE_SWITCH_V2_REMOTE_TYPE_C = 2;
+  BRICKLET_REMOTE_SWITCH_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_REMOTE_SWITCH_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_REMOTE_SWITCH_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_REMOTE_SWITCH_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_REMOTE_SWITCH_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_REMOTE_SWITCH_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_REMOTE_SWITCH_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_REMOTE_SWITCH_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_REMOTE_SWITCH_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_REMOTE_SWITCH_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_REMOTE_SWITCH_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_REMOTE_SWITCH_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_REMOTE_SWITCH_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_REMOTE_SWITCH_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_REMOTE_SWITCH_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletRemoteSwitchV2 = class;
+  TBrickletRemoteSwitchV2NotifySwitchingDone = procedure(sender: TBrickletRemoteSwitchV2) of object;
+  TBrickletRemoteSwitchV2NotifyRemoteStatusA = procedure(sender: TBrickletRemoteSwitchV2; const houseCode: byte; const receiverCode: byte; const switchTo: byte; const repeats: word) of object;
+  TBrickletRemoteSwitchV2NotifyRemoteStatusB = procedure(sender: TBrickletRemoteSwitchV2; const address: longword; const unit_: byte; const switchTo: byte; const dimValue: byte; const repeats: word) of object;
+  TBrickletRemoteSwitchV2NotifyRemoteStatusC = procedure(sender: TBrickletRemoteSwitchV2; const systemCode: char; const deviceCode: byte; const switchTo: byte; const repeats: word) of object;
+
+  /// <summary>
+  ///  Controls remote mains switches and receives signals from remotes
+  /// </summary>
+  TBrickletRemoteSwitchV2 = class(TDevice)
+  private
+    switchingDoneCallback: TBrickletRemoteSwitchV2NotifySwitchingDone;
+    remoteStatusACallback: TBrickletRemoteSwitchV2NotifyRemoteStatusA;
+    remoteStatusBCallback: TBrickletRemoteSwitchV2NotifyRemoteStatusB;
+    remoteStatusCCallback: TBrickletRemoteSwitchV2NotifyRemoteStatusC;
+  protected
+    procedure CallbackWrapperSwitchingDone(const packet: TByteArray); virtual;
+    procedure CallbackWrapperRemoteStatusA(const packet: TByteArray); virtual;
+    procedure CallbackWrapperRemoteStatusB(const packet: TByteArray); virtual;
+    procedure CallbackWrapperRemoteStatusC(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the current switching state. If the current state is busy, the
+    ///  Bricklet is currently sending a code to switch a socket. It will not
+    ///  accept any calls of switch socket functions until the state changes to ready.
+    ///  
+    ///  How long the switching takes is dependent on the number of repeats, see
+    ///  <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetRepeats"/>.
+    /// </summary>
+    function GetSwitchingState: byte; virtual;
+
+    /// <summary>
+    ///  Sets the number of times the code is sent when one of the Switch Socket
+    ///  functions is called. The repeats basically correspond to the amount of time
+    ///  that a button of the remote is pressed.
+    ///  
+    ///  Some dimmers are controlled by the length of a button pressed,
+    ///  this can be simulated by increasing the repeats.
+    /// </summary>
+    procedure SetRepeats(const repeats: byte); virtual;
+
+    /// <summary>
+    ///  Returns the number of repeats as set by <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetRepeats"/>.
+    /// </summary>
+    function GetRepeats: byte; virtual;
+
+    /// <summary>
+    ///  To switch a type A socket you have to give the house code, receiver code and the
+    ///  state (on or off) you want to switch to.
+    ///  
+    ///  A detailed description on how you can figure out the house and receiver code
+    ///  can be found :ref:`here &lt;remote_switch_bricklet_type_a_house_and_receiver_code&gt;`.
+    /// </summary>
+    procedure SwitchSocketA(const houseCode: byte; const receiverCode: byte; const switchTo: byte); virtual;
+
+    /// <summary>
+    ///  To switch a type B socket you have to give the address, unit and the state
+    ///  (on or off) you want to switch to.
+    ///  
+    ///  To switch all devices with the same address use 255 for the unit.
+    ///  
+    ///  A detailed description on how you can teach a socket the address and unit can
+    ///  be found :ref:`here &lt;remote_switch_bricklet_type_b_address_and_unit&gt;`.
+    /// </summary>
+    procedure SwitchSocketB(const address: longword; const unit_: byte; const switchTo: byte); virtual;
+
+    /// <summary>
+    ///  To control a type B dimmer you have to give the address, unit and the
+    ///  dim value you want to set the dimmer to.
+    ///  
+    ///  A detailed description on how you can teach a dimmer the address and unit can
+    ///  be found :ref:`here &lt;remote_switch_bricklet_type_b_address_and_unit&gt;`.
+    /// </summary>
+    procedure DimSocketB(const address: longword; const unit_: byte; const dimValue: byte); virtual;
+
+    /// <summary>
+    ///  To switch a type C socket you have to give the system code, device code and the
+    ///  state (on or off) you want to switch to.
+    ///  
+    ///  A detailed description on how you can figure out the system and device code
+    ///  can be found :ref:`here &lt;remote_switch_bricklet_type_c_system_and_device_code&gt;`.
+    /// </summary>
+    procedure SwitchSocketC(const systemCode: char; const deviceCode: byte; const switchTo: byte); virtual;
+
+    /// <summary>
+    ///  Sets the configuration for **receiving** data from a remote of type A, B or C.
+    ///  
+    ///  * Remote Type: A, B or C depending on the type of remote you want to receive.
+    ///  * Minimum Repeats: The minimum number of repeated data packets until the callback
+    ///    is triggered (if enabled).
+    ///  * Callback Enabled: Enable or disable callback (see <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.OnRemoteStatusA"/> callback,
+    ///    <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.OnRemoteStatusB"/> callback and <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.OnRemoteStatusC"/> callback).
+    /// </summary>
+    procedure SetRemoteConfiguration(const remoteType: byte; const minimumRepeats: word; const callbackEnabled: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the remote configuration as set by <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetRemoteConfiguration"/>
+    /// </summary>
+    procedure GetRemoteConfiguration(out remoteType: byte; out minimumRepeats: word; out callbackEnabled: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the house code, receiver code, switch state (on/off) and number of
+    ///  repeats for remote type A.
+    ///  
+    ///  Repeats == 0 means there was no button press. Repeats &gt;= 1 means there
+    ///  was a button press with the specified house/receiver code. The repeats are the
+    ///  number of received identical data packets. The longer the button is pressed,
+    ///  the higher the repeat number.
+    ///  
+    ///  Use the callback to get this data automatically when a button is pressed,
+    ///  see <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetRemoteConfiguration"/> and <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.OnRemoteStatusA"/> callback.
+    /// </summary>
+    procedure GetRemoteStatusA(out houseCode: byte; out receiverCode: byte; out switchTo: byte; out repeats: word); virtual;
+
+    /// <summary>
+    ///  Returns the address (unique per remote), unit (button number), switch state
+    ///  (on/off) and number of repeats for remote type B.
+    ///  
+    ///  If the remote supports dimming the dim value is used instead of the switch state.
+    ///  
+    ///  If repeats=0 there was no button press. If repeats &gt;= 1 there
+    ///  was a button press with the specified address/unit. The repeats are the number of received
+    ///  identical data packets. The longer the button is pressed, the higher the repeat number.
+    ///  
+    ///  Use the callback to get this data automatically when a button is pressed,
+    ///  see <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetRemoteConfiguration"/> and <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.OnRemoteStatusB"/> callback.
+    /// </summary>
+    procedure GetRemoteStatusB(out address: longword; out unit_: byte; out switchTo: byte; out dimValue: byte; out repeats: word); virtual;
+
+    /// <summary>
+    ///  Returns the system code, device code, switch state (on/off) and number of repeats for
+    ///  remote type C.
+    ///  
+    ///  If repeats=0 there was no button press. If repeats &gt;= 1 there
+    ///  was a button press with the specified system/device code. The repeats are the number of received
+    ///  identical data packets. The longer the button is pressed, the higher the repeat number.
+    ///  
+    ///  Use the callback to get this data automatically when a button is pressed,
+    ///  see <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetRemoteConfiguration"/> and <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.OnRemoteStatusC"/> callback.
+    /// </summary>
+    procedure GetRemoteStatusC(out systemCode: char; out deviceCode: byte; out switchTo: byte; out repeats: word); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered whenever the switching state changes
+    ///  from busy to ready, see <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.GetSwitchingState"/>.
+    /// </summary>
+    property OnSwitchingDone: TBrickletRemoteSwitchV2NotifySwitchingDone read switchingDoneCallback write switchingDoneCallback;
+
+    /// <summary>
+    ///  Returns the house code, receiver code, switch state (on/off) and number of repeats for
+    ///  remote type A.
+    ///  
+    ///  The repeats are the number of received identical data packets. The longer the button is pressed,
+    ///  the higher the repeat number. The callback is triggered with every repeat.
+    ///  
+    ///  You have to enable the callback with <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetRemoteConfiguration"/>. The number
+    ///  of repeats that you can set in the configuration is the minimum number of repeats that have
+    ///  to be seen before the callback is triggered for the first time.
+    /// </summary>
+    property OnRemoteStatusA: TBrickletRemoteSwitchV2NotifyRemoteStatusA read remoteStatusACallback write remoteStatusACallback;
+
+    /// <summary>
+    ///  Returns the address (unique per remote), unit (button number), switch state (on/off) and number of repeats for
+    ///  remote type B.
+    ///  
+    ///  If the remote supports dimming the dim value is used instead of the switch state.
+    ///  
+    ///  The repeats are the number of received identical data packets. The longer the button is pressed,
+    ///  the higher the repeat number. The callback is triggered with every repeat.
+    ///  
+    ///  You have to enable the callback with <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetRemoteConfiguration"/>. The number
+    ///  of repeats that you can set in the configuration is the minimum number of repeats that have
+    ///  to be seen before the callback is triggered for the first time.
+    /// </summary>
+    property OnRemoteStatusB: TBrickletRemoteSwitchV2NotifyRemoteStatusB read remoteStatusBCallback write remoteStatusBCallback;
+
+    /// <summary>
+    ///  Returns the system code, device code, switch state (on/off) and number of repeats for
+    ///  remote type C.
+    ///  
+    ///  The repeats are the number of received identical data packets. The longer the button is pressed,
+    ///  the higher the repeat number. The callback is triggered with every repeat.
+    ///  
+    ///  You have to enable the callback with <see cref="BrickletRemoteSwitchV2.TBrickletRemoteSwitchV2.SetRemoteConfiguration"/>. The number
+    ///  of repeats that you can set in the configuration is the minimum number of repeats that have
+    ///  to be seen before the callback is triggered for the first time.
+    /// </summary>
+    property OnRemoteStatusC: TBrickletRemoteSwitchV2NotifyRemoteStatusC read remoteStatusCCallback write remoteStatusCCallback;
+  end;
+
+implementation
+
+constructor TBrickletRemoteSwitchV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_REMOTE_SWITCH_V2_DEVICE_IDENTIFIER, BRICKLET_REMOTE_SWITCH_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_SWITCHING_STATE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_REPEATS] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REPEATS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SWITCH_SOCKET_A] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SWITCH_SOCKET_B] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_DIM_SOCKET_B] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SWITCH_SOCKET_C] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_REMOTE_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_STATUS_A] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_STATUS_B] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_STATUS_C] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_REMOTE_SWITCH_V2_CALLBACK_SWITCHING_DONE] := {$ifdef FPC}@{$endif}CallbackWrapperSwitchingDone;
+  callbackWrappers[BRICKLET_REMOTE_SWITCH_V2_CALLBACK_REMOTE_STATUS_A] := {$ifdef FPC}@{$endif}CallbackWrapperRemoteStatusA;
+  callbackWrappers[BRICKLET_REMOTE_SWITCH_V2_CALLBACK_REMOTE_STATUS_B] := {$ifdef FPC}@{$endif}CallbackWrapperRemoteStatusB;
+  callbackWrappers[BRICKLET_REMOTE_SWITCH_V2_CALLBACK_REMOTE_STATUS_C] := {$ifdef FPC}@{$endif}CallbackWrapperRemoteStatusC;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletRemoteSwitchV2.GetSwitchingState: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_SWITCHING_STATE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRemoteSwitchV2.SetRepeats(const repeats: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_REPEATS, 9);
+  LEConvertUInt8To(repeats, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRemoteSwitchV2.GetRepeats: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REPEATS, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRemoteSwitchV2.SwitchSocketA(const houseCode: byte; const receiverCode: byte; const switchTo: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SWITCH_SOCKET_A, 11);
+  LEConvertUInt8To(houseCode, 8, request);
+  LEConvertUInt8To(receiverCode, 9, request);
+  LEConvertUInt8To(switchTo, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRemoteSwitchV2.SwitchSocketB(const address: longword; const unit_: byte; const switchTo: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SWITCH_SOCKET_B, 14);
+  LEConvertUInt32To(address, 8, request);
+  LEConvertUInt8To(unit_, 12, request);
+  LEConvertUInt8To(switchTo, 13, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRemoteSwitchV2.DimSocketB(const address: longword; const unit_: byte; const dimValue: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_DIM_SOCKET_B, 14);
+  LEConvertUInt32To(address, 8, request);
+  LEConvertUInt8To(unit_, 12, request);
+  LEConvertUInt8To(dimValue, 13, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRemoteSwitchV2.SwitchSocketC(const systemCode: char; const deviceCode: byte; const switchTo: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SWITCH_SOCKET_C, 11);
+  LEConvertCharTo(systemCode, 8, request);
+  LEConvertUInt8To(deviceCode, 9, request);
+  LEConvertUInt8To(switchTo, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRemoteSwitchV2.SetRemoteConfiguration(const remoteType: byte; const minimumRepeats: word; const callbackEnabled: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_REMOTE_CONFIGURATION, 12);
+  LEConvertUInt8To(remoteType, 8, request);
+  LEConvertUInt16To(minimumRepeats, 9, request);
+  LEConvertBooleanTo(callbackEnabled, 11, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRemoteSwitchV2.GetRemoteConfiguration(out remoteType: byte; out minimumRepeats: word; out callbackEnabled: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_CONFIGURATION, 8);
+  response := SendRequest(request, 12);
+  remoteType := LEConvertUInt8From(8, response);
+  minimumRepeats := LEConvertUInt16From(9, response);
+  callbackEnabled := LEConvertBooleanFrom(11, response);
+end;
+
+procedure TBrickletRemoteSwitchV2.GetRemoteStatusA(out houseCode: byte; out receiverCode: byte; out switchTo: byte; out repeats: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_STATUS_A, 8);
+  response := SendRequest(request, 13);
+  houseCode := LEConvertUInt8From(8, response);
+  receiverCode := LEConvertUInt8From(9, response);
+  switchTo := LEConvertUInt8From(10, response);
+  repeats := LEConvertUInt16From(11, response);
+end;
+
+procedure TBrickletRemoteSwitchV2.GetRemoteStatusB(out address: longword; out unit_: byte; out switchTo: byte; out dimValue: byte; out repeats: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_STATUS_B, 8);
+  response := SendRequest(request, 17);
+  address := LEConvertUInt32From(8, response);
+  unit_ := LEConvertUInt8From(12, response);
+  switchTo := LEConvertUInt8From(13, response);
+  dimValue := LEConvertUInt8From(14, response);
+  repeats := LEConvertUInt16From(15, response);
+end;
+
+procedure TBrickletRemoteSwitchV2.GetRemoteStatusC(out systemCode: char; out deviceCode: byte; out switchTo: byte; out repeats: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_REMOTE_STATUS_C, 8);
+  response := SendRequest(request, 13);
+  systemCode := LEConvertCharFrom(8, response);
+  deviceCode := LEConvertUInt8From(9, response);
+  switchTo := LEConvertUInt8From(10, response);
+  repeats := LEConvertUInt16From(11, response);
+end;
+
+procedure TBrickletRemoteSwitchV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletRemoteSwitchV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletRemoteSwitchV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRemoteSwitchV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRemoteSwitchV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletRemoteSwitchV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRemoteSwitchV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletRemoteSwitchV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletRemoteSwitchV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletRemoteSwitchV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletRemoteSwitchV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletRemoteSwitchV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_REMOTE_SWITCH_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletRemoteSwitchV2.CallbackWrapperSwitchingDone(const packet: TByteArray);
+begin
+  if (Length(packet) <> 8) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  if (Assigned(switchingDoneCallback)) then begin
+    switchingDoneCallback(self);
+  end;
+end;
+
+procedure TBrickletRemoteSwitchV2.CallbackWrapperRemoteStatusA(const packet: TByteArray);
+var houseCode: byte; receiverCode: byte; switchTo: byte; repeats: word;
+begin
+  if (Length(packet) <> 13) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  houseCode := LEConvertUInt8From(8, packet);
+  receiverCode := LEConvertUInt8From(9, packet);
+  switchTo := LEConvertUInt8From(10, packet);
+  repeats := LEConvertUInt16From(11, packet);
+  if (Assigned(remoteStatusACallback)) then begin
+    remoteStatusACallback(self, houseCode, receiverCode, switchTo, repeats);
+  end;
+end;
+
+procedure TBrickletRemoteSwitchV2.CallbackWrapperRemoteStatusB(const packet: TByteArray);
+var address: longword; unit_: byte; switchTo: byte; dimValue: byte; repeats: word;
+begin
+  if (Length(packet) <> 17) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  address := LEConvertUInt32From(8, packet);
+  unit_ := LEConvertUInt8From(12, packet);
+  switchTo := LEConvertUInt8From(13, packet);
+  dimValue := LEConvertUInt8From(14, packet);
+  repeats := LEConvertUInt16From(15, packet);
+  if (Assigned(remoteStatusBCallback)) then begin
+    remoteStatusBCallback(self, address, unit_, switchTo, dimValue, repeats);
+  end;
+end;
+
+procedure TBrickletRemoteSwitchV2.CallbackWrapperRemoteStatusC(const packet: TByteArray);
+var systemCode: char; deviceCode: byte; switchTo: byte; repeats: word;
+begin
+  if (Length(packet) <> 13) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  systemCode := LEConvertCharFrom(8, packet);
+  deviceCode := LEConvertUInt8From(9, packet);
+  switchTo := LEConvertUInt8From(10, packet);
+  repeats := LEConvertUInt16From(11, packet);
+  if (Assigned(remoteStatusCCallback)) then begin
+    remoteStatusCCallback(self, systemCode, deviceCode, switchTo, repeats);
+  end;
+end;
+
+end.
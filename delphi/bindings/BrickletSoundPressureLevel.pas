@@ -0,0 +1,761 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletSoundPressureLevel;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_SOUND_PRESSURE_LEVEL_DEVICE_IDENTIFIER = 290;
+  BRICKLET_SOUND_PRESSURE_LEVEL_DEVICE_DISPLAY_NAME = 'Sound Pressure Level Bricklet';
+
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_DECIBEL = 1;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_DECIBEL_CALLBACK_CONFIGURATION = 2;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_DECIBEL_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_SPECTRUM_LOW_LEVEL = 5;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_SPECTRUM_CALLBACK_CONFIGURATION = 6;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_SPECTRUM_CALLBACK_CONFIGURATION = 7;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_CONFIGURATION = 9;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_CONFIGURATION = 10;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_RESET = 243;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_WRITE_UID = 248;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_READ_UID = 249;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_SOUND_PRESSURE_LEVEL_CALLBACK_DECIBEL = 4;
+  BRICKLET_SOUND_PRESSURE_LEVEL_CALLBACK_SPECTRUM_LOW_LEVEL = 8;
+
+  BRICKLET_SOUND_PRESSURE_LEVEL_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_SOUND_PRESSURE_LEVEL_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_SOUND_PRESSURE_LEVEL_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_SOUND_PRESSURE_LEVEL_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_SOUND_PRESSURE_LEVEL_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_SOUND_PRESSURE_LEVEL_FFT_SIZE_128 = 0;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FFT_SIZE_256 = 1;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FFT_SIZE_512 = 2;
+  BRICKLET_SOUND_PRESSURE_LEVEL_FFT_SIZE_1024 = 3;
+  BRICKLET_SOUND_PRESSURE_LEVEL_WEIGHTING_A = 0;
+  BRICKLET_SOUND_PRESSURE_LEVEL_WEIGHTING_B = 1;
+  BRICKLET_SOUND_PRESSURE_LEVEL_WEIGHTING_C = 2;
+  BRICKLET_SOUND_PRESSURE_LEVEL_WEIGHTING_D = 3;
+  BRICKLET_SOUND_PRESSURE_LEVEL_WEIGHTING_Z = 4;
+  BRICKLET_SOUND_PRESSURE_LEVEL_WEIGHTING_ITU_R_468 = 5;
+  BRICKLET_SOUND_PRESSURE_LEVEL_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_SOUND_PRESSURE_LEVEL_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_SOUND_PRESSURE_LEVEL_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_SOUND_PRESSURE_LEVEL_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_SOUND_PRESSURE_LEVEL_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_SOUND_PRESSURE_LEVEL_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_SOUND_PRESSURE_LEVEL_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_SOUND_PRESSURE_LEVEL_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_SOUND_PRESSURE_LEVEL_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_SOUND_PRESSURE_LEVEL_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_SOUND_PRESSURE_LEVEL_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_SOUND_PRESSURE_LEVEL_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_SOUND_PRESSURE_LEVEL_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_SOUND_PRESSURE_LEVEL_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_SOUND_PRESSURE_LEVEL_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To29OfUInt16 = array [0..29] of word;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+  TArrayOfUInt16 = array of word;
+
+  TSpectrumHighLevelCallbackState = record data: TArrayOfUInt16; length: word; end;
+
+  TBrickletSoundPressureLevel = class;
+  TBrickletSoundPressureLevelNotifyDecibel = procedure(sender: TBrickletSoundPressureLevel; const decibel: word) of object;
+  TBrickletSoundPressureLevelNotifySpectrumLowLevel = procedure(sender: TBrickletSoundPressureLevel; const spectrumLength: word; const spectrumChunkOffset: word; const spectrumChunkData: TArray0To29OfUInt16) of object;
+  TBrickletSoundPressureLevelNotifySpectrum = procedure(sender: TBrickletSoundPressureLevel; const spectrum: TArrayOfUInt16) of object;
+
+  /// <summary>
+  ///  Measures Sound Pressure Level in dB(A/B/C/D/Z)
+  /// </summary>
+  TBrickletSoundPressureLevel = class(TDevice)
+  private
+    streamMutex: TCriticalSection;
+    spectrumHighLevelCallbackState: TSpectrumHighLevelCallbackState;
+    decibelCallback: TBrickletSoundPressureLevelNotifyDecibel;
+    spectrumLowLevelCallback: TBrickletSoundPressureLevelNotifySpectrumLowLevel;
+    spectrumCallback: TBrickletSoundPressureLevelNotifySpectrum;
+  protected
+    procedure CallbackWrapperDecibel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperSpectrumLowLevel(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the measured sound pressure in decibels.
+    ///  
+    ///  The Bricklet supports the weighting standards dB(A), dB(B), dB(C), dB(D),
+    ///  dB(Z) and ITU-R 468. You can configure the weighting with <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetConfiguration"/>.
+    ///  
+    ///  By default dB(A) will be used.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.OnDecibel"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetDecibelCallbackConfiguration"/>.
+    /// </summary>
+    function GetDecibel: word; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.OnDecibel"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.OnDecibel"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetDecibelCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: word; const max: word); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetDecibelCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetDecibelCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: word; out max: word); virtual;
+
+    /// <summary>
+    ///  Returns the frequency spectrum. The length of the spectrum is between
+    ///  512 (FFT size 1024) and 64 (FFT size 128). See <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetConfiguration"/>.
+    ///  
+    ///  Each array element is one bin of the FFT. The first bin is always the
+    ///  DC offset and the other bins have a size between 40Hz (FFT size 1024) and
+    ///  320Hz (FFT size 128).
+    ///  
+    ///  In sum the frequency of the spectrum always has a range from 0 to
+    ///  20480Hz (the FFT is applied to samples with a frequency of 40960Hz).
+    ///  
+    ///  The returned data is already equalized, which means that the microphone
+    ///  frequency response is compensated and the weighting function is applied
+    ///  (see <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetConfiguration"/> for the available weighting standards). Use
+    ///  dB(Z) if you need the unaltered spectrum.
+    ///  
+    ///  The values are not in dB form yet. If you want a proper dB scale of the
+    ///  spectrum you have to apply the formula f(x) = 20*log10(max(1, x/sqrt(2)))
+    ///  on each value.
+    /// </summary>
+    procedure GetSpectrumLowLevel(out spectrumLength: word; out spectrumChunkOffset: word; out spectrumChunkData: TArray0To29OfUInt16); virtual;
+
+    /// <summary>
+    ///  Returns the frequency spectrum. The length of the spectrum is between
+    ///  512 (FFT size 1024) and 64 (FFT size 128). See <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetConfiguration"/>.
+    ///  
+    ///  Each array element is one bin of the FFT. The first bin is always the
+    ///  DC offset and the other bins have a size between 40Hz (FFT size 1024) and
+    ///  320Hz (FFT size 128).
+    ///  
+    ///  In sum the frequency of the spectrum always has a range from 0 to
+    ///  20480Hz (the FFT is applied to samples with a frequency of 40960Hz).
+    ///  
+    ///  The returned data is already equalized, which means that the microphone
+    ///  frequency response is compensated and the weighting function is applied
+    ///  (see <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetConfiguration"/> for the available weighting standards). Use
+    ///  dB(Z) if you need the unaltered spectrum.
+    ///  
+    ///  The values are not in dB form yet. If you want a proper dB scale of the
+    ///  spectrum you have to apply the formula f(x) = 20*log10(max(1, x/sqrt(2)))
+    ///  on each value.
+    /// </summary>
+    function GetSpectrum: TArrayOfUInt16; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.OnSpectrum"/> callback is
+    ///  triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  Every new measured spectrum will be send at most once. Set the period to 1 to
+    ///  make sure that you get every spectrum.
+    /// </summary>
+    procedure SetSpectrumCallbackConfiguration(const period: longword); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by
+    ///  <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.GetSpectrumCallbackConfiguration"/>.
+    /// </summary>
+    function GetSpectrumCallbackConfiguration: longword; virtual;
+
+    /// <summary>
+    ///  Sets the Sound Pressure Level Bricklet configuration.
+    ///  
+    ///  With different FFT sizes the Bricklet has a different
+    ///  amount of samples per second and the size of the FFT bins
+    ///  changes. The higher the FFT size the more precise is the result
+    ///  of the dB(X) calculation.
+    ///  
+    ///  Available FFT sizes are:
+    ///  
+    ///  * 1024: 512 bins, 10 samples per second, each bin has size 40Hz
+    ///  * 512: 256 bins, 20 samples per second, each bin has size 80Hz
+    ///  * 256: 128 bins, 40 samples per second, each bin has size 160Hz
+    ///  * 128: 64 bins, 80 samples per second, each bin has size 320Hz
+    ///  
+    ///  The Bricklet supports different weighting functions. You can choose
+    ///  between dB(A), dB(B), dB(C), dB(D), dB(Z) and ITU-R 468.
+    ///  
+    ///  dB(A/B/C/D) are the standard dB weighting curves. dB(A) is
+    ///  often used to measure volumes at concerts etc. dB(Z) has a
+    ///  flat response, no weighting is applied. ITU-R 468 is an ITU
+    ///  weighting standard mostly used in the UK and Europe.
+    /// </summary>
+    procedure SetConfiguration(const fftSize: byte; const weighting: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetConfiguration"/>.
+    /// </summary>
+    procedure GetConfiguration(out fftSize: byte; out weighting: byte); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetDecibelCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.GetDecibel"/>.
+    /// </summary>
+    property OnDecibel: TBrickletSoundPressureLevelNotifyDecibel read decibelCallback write decibelCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.OnSpectrum"/>
+    /// </summary>
+    property OnSpectrumLowLevel: TBrickletSoundPressureLevelNotifySpectrumLowLevel read spectrumLowLevelCallback write spectrumLowLevelCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.SetSpectrumCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletSoundPressureLevel.TBrickletSoundPressureLevel.GetSpectrum"/>.
+    ///  
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for spectrum.
+    ///  </note>
+    /// </summary>
+    property OnSpectrum: TBrickletSoundPressureLevelNotifySpectrum read spectrumCallback write spectrumCallback;
+  end;
+
+implementation
+
+constructor TBrickletSoundPressureLevel.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_SOUND_PRESSURE_LEVEL_DEVICE_IDENTIFIER, BRICKLET_SOUND_PRESSURE_LEVEL_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_DECIBEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_DECIBEL_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_DECIBEL_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_SPECTRUM_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_SPECTRUM_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_SPECTRUM_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  streamMutex := TCriticalSection.Create;
+
+  SetLength(spectrumHighLevelCallbackState.data, 0);
+  spectrumHighLevelCallbackState.data := nil;
+  spectrumHighLevelCallbackState.length := 0;
+
+  callbackWrappers[BRICKLET_SOUND_PRESSURE_LEVEL_CALLBACK_DECIBEL] := {$ifdef FPC}@{$endif}CallbackWrapperDecibel;
+  callbackWrappers[BRICKLET_SOUND_PRESSURE_LEVEL_CALLBACK_SPECTRUM_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperSpectrumLowLevel;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletSoundPressureLevel.GetDecibel: word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_DECIBEL, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+procedure TBrickletSoundPressureLevel.SetDecibelCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: word; const max: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_DECIBEL_CALLBACK_CONFIGURATION, 18);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertUInt16To(min, 14, request);
+  LEConvertUInt16To(max, 16, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletSoundPressureLevel.GetDecibelCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: word; out max: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_DECIBEL_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 18);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertUInt16From(14, response);
+  max := LEConvertUInt16From(16, response);
+end;
+
+procedure TBrickletSoundPressureLevel.GetSpectrumLowLevel(out spectrumLength: word; out spectrumChunkOffset: word; out spectrumChunkData: TArray0To29OfUInt16);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_SPECTRUM_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  spectrumLength := LEConvertUInt16From(8, response);
+  spectrumChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 29 do spectrumChunkData[i] := LEConvertUInt16From(12 + (i * 2), response);
+end;
+
+function TBrickletSoundPressureLevel.GetSpectrum: TArrayOfUInt16;
+var
+  spectrum: TArrayOfUInt16;
+  spectrumCurrentLength: word;
+  spectrumLength: word;
+  spectrumChunkOffset: word;
+  spectrumChunkData: TArray0To29OfUInt16;
+  spectrumOutOfSync: boolean;
+  spectrumChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(spectrum, 0);
+  streamMutex.Acquire;
+  try
+    spectrumLength := 0;
+    GetSpectrumLowLevel(spectrumLength, spectrumChunkOffset, spectrumChunkData);
+    SetLength(spectrum, spectrumLength);
+    spectrumOutOfSync := (spectrumChunkOffset <> 0);
+
+    if ((not spectrumOutOfSync) and (spectrumLength > 0)) then begin
+      spectrumChunkLength := spectrumLength - spectrumChunkOffset;
+      if (spectrumChunkLength > 30) then spectrumChunkLength := 30;
+      Move(spectrumChunkData, spectrum[0], SizeOf(word) * spectrumChunkLength);
+      spectrumCurrentLength := spectrumChunkLength;
+
+      while ((not spectrumOutOfSync) and (spectrumCurrentLength < spectrumLength)) do begin
+        GetSpectrumLowLevel(spectrumLength, spectrumChunkOffset, spectrumChunkData);
+        spectrumOutOfSync := spectrumChunkOffset <> spectrumCurrentLength;
+        spectrumChunkLength := spectrumLength - spectrumChunkOffset;
+        if (spectrumChunkLength > 30) then spectrumChunkLength := 30;
+        Move(spectrumChunkData, spectrum[spectrumCurrentLength], SizeOf(word) * spectrumChunkLength);
+        Inc(spectrumCurrentLength, spectrumChunkLength);
+      end;
+    end;
+
+    if (spectrumOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (spectrumChunkOffset + 30 < spectrumLength) do begin
+        GetSpectrumLowLevel(spectrumLength, spectrumChunkOffset, spectrumChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Spectrum stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := spectrum;
+end;
+
+procedure TBrickletSoundPressureLevel.SetSpectrumCallbackConfiguration(const period: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_SPECTRUM_CALLBACK_CONFIGURATION, 12);
+  LEConvertUInt32To(period, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletSoundPressureLevel.GetSpectrumCallbackConfiguration: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_SPECTRUM_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletSoundPressureLevel.SetConfiguration(const fftSize: byte; const weighting: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_CONFIGURATION, 10);
+  LEConvertUInt8To(fftSize, 8, request);
+  LEConvertUInt8To(weighting, 9, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletSoundPressureLevel.GetConfiguration(out fftSize: byte; out weighting: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_CONFIGURATION, 8);
+  response := SendRequest(request, 10);
+  fftSize := LEConvertUInt8From(8, response);
+  weighting := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletSoundPressureLevel.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletSoundPressureLevel.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletSoundPressureLevel.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletSoundPressureLevel.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletSoundPressureLevel.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletSoundPressureLevel.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletSoundPressureLevel.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletSoundPressureLevel.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletSoundPressureLevel.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletSoundPressureLevel.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletSoundPressureLevel.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletSoundPressureLevel.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_SOUND_PRESSURE_LEVEL_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletSoundPressureLevel.CallbackWrapperDecibel(const packet: TByteArray);
+var decibel: word;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  decibel := LEConvertUInt16From(8, packet);
+  if (Assigned(decibelCallback)) then begin
+    decibelCallback(self, decibel);
+  end;
+end;
+
+procedure TBrickletSoundPressureLevel.CallbackWrapperSpectrumLowLevel(const packet: TByteArray);
+var spectrumLength: word; spectrumChunkOffset: word; spectrumChunkData: TArray0To29OfUInt16; spectrumChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  spectrumLength := LEConvertUInt16From(8, packet);
+  spectrumChunkOffset := LEConvertUInt16From(10, packet);
+  for i := 0 to 29 do spectrumChunkData[i] := LEConvertUInt16From(12 + (i * 2), packet);
+
+  spectrumChunkLength := spectrumLength - spectrumChunkOffset;
+  if (spectrumChunkLength > 30) then begin
+    spectrumChunkLength := 30;
+  end;
+  if (spectrumHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (spectrumChunkOffset = 0) then begin { Stream starts }
+      SetLength(spectrumHighLevelCallbackState.data, spectrumLength);
+      Move(spectrumChunkData[0], spectrumHighLevelCallbackState.data[0], SizeOf(word) * spectrumChunkLength);
+      spectrumHighLevelCallbackState.length := spectrumChunkLength;
+
+      if (spectrumHighLevelCallbackState.length >= spectrumLength) then begin { Stream complete }
+        if (Assigned(spectrumCallback)) then begin
+          spectrumCallback(self, spectrumHighLevelCallbackState.data);
+        end;
+        SetLength(spectrumHighLevelCallbackState.data, 0);
+        spectrumHighLevelCallbackState.data := nil;
+        spectrumHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (spectrumChunkOffset <> spectrumHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(spectrumHighLevelCallbackState.data, 0);
+      spectrumHighLevelCallbackState.data := nil;
+      spectrumHighLevelCallbackState.length := 0;
+      if (Assigned(spectrumCallback)) then begin
+        spectrumCallback(self, spectrumHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(spectrumChunkData[0], spectrumHighLevelCallbackState.data[spectrumHighLevelCallbackState.length], SizeOf(word) * spectrumChunkLength);
+      Inc(spectrumHighLevelCallbackState.length, spectrumChunkLength);
+
+      if spectrumHighLevelCallbackState.length >= spectrumLength then begin { Stream complete }
+        if (Assigned(spectrumCallback)) then begin
+          spectrumCallback(self, spectrumHighLevelCallbackState.data);
+        end;
+        SetLength(spectrumHighLevelCallbackState.data, 0);
+        spectrumHighLevelCallbackState.data := nil;
+        spectrumHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(spectrumLowLevelCallback)) then begin
+    spectrumLowLevelCallback(self, spectrumLength, spectrumChunkOffset, spectrumChunkData);
+  end;
+end;
+
+end.
@@ -0,0 +1,5299 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletStreamTest;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_STREAM_TEST_DEVICE_IDENTIFIER = 21111;
+  BRICKLET_STREAM_TEST_DEVICE_DISPLAY_NAME = 'Stream Test Bricklet';
+
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_LOW_LEVEL = 1;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL = 2;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL = 3;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL = 4;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL = 5;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL = 6;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL = 7;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL = 8;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_LOW_LEVEL = 9;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL = 10;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL = 11;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL = 12;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL = 13;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL = 14;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL = 15;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL = 16;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_LOW_LEVEL = 17;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL = 18;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL = 19;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL = 20;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL = 21;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL = 22;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL = 23;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL = 24;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL = 25;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL = 26;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_LOW_LEVEL = 27;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL = 28;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL = 29;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL = 30;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL = 31;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_FULL_LOW_LEVEL = 32;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL = 33;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL = 34;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_LOW_LEVEL = 35;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL = 36;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL = 37;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL = 38;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL = 39;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL = 40;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL = 41;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL = 42;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL = 43;
+  BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL = 44;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_LOW_LEVEL = 45;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL = 46;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL = 47;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL = 48;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL = 49;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL = 50;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL = 51;
+  BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL = 52;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_LOW_LEVEL = 53;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL = 54;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL = 55;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL = 56;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL = 57;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL = 58;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL = 59;
+  BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL = 60;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_LOW_LEVEL = 61;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL = 62;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL = 63;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL = 64;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL = 65;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL = 66;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL = 67;
+  BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL = 68;
+  BRICKLET_STREAM_TEST_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_LOW_LEVEL = 69;
+  BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1_LOW_LEVEL = 70;
+  BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2_LOW_LEVEL = 71;
+  BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1_LOW_LEVEL = 72;
+  BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2_LOW_LEVEL = 73;
+  BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL_LOW_LEVEL = 74;
+  BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_LOW_LEVEL = 75;
+  BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1_LOW_LEVEL = 76;
+  BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2_LOW_LEVEL = 77;
+  BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1_LOW_LEVEL = 78;
+  BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2_LOW_LEVEL = 79;
+  BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL_LOW_LEVEL = 80;
+  BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_LOW_LEVEL = 81;
+  BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_1_LOW_LEVEL = 82;
+  BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_2_LOW_LEVEL = 83;
+  BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1_LOW_LEVEL = 84;
+  BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2_LOW_LEVEL = 85;
+  BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_FULL_LOW_LEVEL = 86;
+
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To55OfChar = array [0..55] of char;
+  TArray0To57OfChar = array [0..57] of char;
+  TArray0To58OfChar = array [0..58] of char;
+  TArray0To59OfChar = array [0..59] of char;
+  TArray0To60OfChar = array [0..60] of char;
+  TArray0To61OfChar = array [0..61] of char;
+  TArray0To62OfChar = array [0..62] of char;
+  TArrayOfChar = array of char;
+
+  TNormalReadHighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TNormalReadExtraPrefix1HighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TNormalReadExtraPrefix2HighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TNormalReadExtraSuffix1HighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TNormalReadExtraSuffix2HighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TNormalReadExtraFullHighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TFixedReadHighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TFixedReadExtraPrefix1HighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TFixedReadExtraPrefix2HighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TFixedReadExtraSuffix1HighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TFixedReadExtraSuffix2HighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TFixedReadExtraFullHighLevelCallbackState = record data: TArrayOfChar; length: word; end;
+  TSingleReadHighLevelCallbackState = record data: TArrayOfChar; length: byte; end;
+  TSingleReadExtraPrefix1HighLevelCallbackState = record data: TArrayOfChar; length: byte; end;
+  TSingleReadExtraPrefix2HighLevelCallbackState = record data: TArrayOfChar; length: byte; end;
+  TSingleReadExtraSuffix1HighLevelCallbackState = record data: TArrayOfChar; length: byte; end;
+  TSingleReadExtraSuffix2HighLevelCallbackState = record data: TArrayOfChar; length: byte; end;
+  TSingleReadExtraFullHighLevelCallbackState = record data: TArrayOfChar; length: byte; end;
+
+  TBrickletStreamTest = class;
+  TBrickletStreamTestNotifyNormalReadLowLevel = procedure(sender: TBrickletStreamTest; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar) of object;
+  TBrickletStreamTestNotifyNormalRead = procedure(sender: TBrickletStreamTest; const message: TArrayOfChar) of object;
+  TBrickletStreamTestNotifyNormalReadExtraPrefix1LowLevel = procedure(sender: TBrickletStreamTest; const extra: byte; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To58OfChar) of object;
+  TBrickletStreamTestNotifyNormalReadExtraPrefix1 = procedure(sender: TBrickletStreamTest; const extra: byte; const message: TArrayOfChar) of object;
+  TBrickletStreamTestNotifyNormalReadExtraPrefix2LowLevel = procedure(sender: TBrickletStreamTest; const extra1: byte; const extra2: byte; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To57OfChar) of object;
+  TBrickletStreamTestNotifyNormalReadExtraPrefix2 = procedure(sender: TBrickletStreamTest; const extra1: byte; const extra2: byte; const message: TArrayOfChar) of object;
+  TBrickletStreamTestNotifyNormalReadExtraSuffix1LowLevel = procedure(sender: TBrickletStreamTest; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To58OfChar; const extra: byte) of object;
+  TBrickletStreamTestNotifyNormalReadExtraSuffix1 = procedure(sender: TBrickletStreamTest; const message: TArrayOfChar; const extra: byte) of object;
+  TBrickletStreamTestNotifyNormalReadExtraSuffix2LowLevel = procedure(sender: TBrickletStreamTest; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To57OfChar; const extra1: byte; const extra2: byte) of object;
+  TBrickletStreamTestNotifyNormalReadExtraSuffix2 = procedure(sender: TBrickletStreamTest; const message: TArrayOfChar; const extra1: byte; const extra2: byte) of object;
+  TBrickletStreamTestNotifyNormalReadExtraFullLowLevel = procedure(sender: TBrickletStreamTest; const extra1: byte; const messageLength: word; const extra2: byte; const messageChunkOffset: word; const extra3: byte; const messageChunkData: TArray0To55OfChar; const extra4: byte) of object;
+  TBrickletStreamTestNotifyNormalReadExtraFull = procedure(sender: TBrickletStreamTest; const extra1: byte; const extra2: byte; const extra3: byte; const message: TArrayOfChar; const extra4: byte) of object;
+  TBrickletStreamTestNotifyFixedReadLowLevel = procedure(sender: TBrickletStreamTest; const messageChunkOffset: word; const messageChunkData: TArray0To61OfChar) of object;
+  TBrickletStreamTestNotifyFixedRead = procedure(sender: TBrickletStreamTest; const message: TArrayOfChar) of object;
+  TBrickletStreamTestNotifyFixedReadExtraPrefix1LowLevel = procedure(sender: TBrickletStreamTest; const extra: byte; const messageChunkOffset: word; const messageChunkData: TArray0To60OfChar) of object;
+  TBrickletStreamTestNotifyFixedReadExtraPrefix1 = procedure(sender: TBrickletStreamTest; const extra: byte; const message: TArrayOfChar) of object;
+  TBrickletStreamTestNotifyFixedReadExtraPrefix2LowLevel = procedure(sender: TBrickletStreamTest; const extra1: byte; const extra2: byte; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar) of object;
+  TBrickletStreamTestNotifyFixedReadExtraPrefix2 = procedure(sender: TBrickletStreamTest; const extra1: byte; const extra2: byte; const message: TArrayOfChar) of object;
+  TBrickletStreamTestNotifyFixedReadExtraSuffix1LowLevel = procedure(sender: TBrickletStreamTest; const messageChunkOffset: word; const messageChunkData: TArray0To60OfChar; const extra: byte) of object;
+  TBrickletStreamTestNotifyFixedReadExtraSuffix1 = procedure(sender: TBrickletStreamTest; const message: TArrayOfChar; const extra: byte) of object;
+  TBrickletStreamTestNotifyFixedReadExtraSuffix2LowLevel = procedure(sender: TBrickletStreamTest; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; const extra1: byte; const extra2: byte) of object;
+  TBrickletStreamTestNotifyFixedReadExtraSuffix2 = procedure(sender: TBrickletStreamTest; const message: TArrayOfChar; const extra1: byte; const extra2: byte) of object;
+  TBrickletStreamTestNotifyFixedReadExtraFullLowLevel = procedure(sender: TBrickletStreamTest; const extra1: byte; const messageChunkOffset: word; const extra2: byte; const messageChunkData: TArray0To58OfChar; const extra3: byte) of object;
+  TBrickletStreamTestNotifyFixedReadExtraFull = procedure(sender: TBrickletStreamTest; const extra1: byte; const extra2: byte; const message: TArrayOfChar; const extra3: byte) of object;
+  TBrickletStreamTestNotifySingleReadLowLevel = procedure(sender: TBrickletStreamTest; const messageLength: byte; const messageData: TArray0To62OfChar) of object;
+  TBrickletStreamTestNotifySingleRead = procedure(sender: TBrickletStreamTest; const message: TArrayOfChar) of object;
+  TBrickletStreamTestNotifySingleReadExtraPrefix1LowLevel = procedure(sender: TBrickletStreamTest; const extra: byte; const messageLength: byte; const messageData: TArray0To61OfChar) of object;
+  TBrickletStreamTestNotifySingleReadExtraPrefix1 = procedure(sender: TBrickletStreamTest; const extra: byte; const message: TArrayOfChar) of object;
+  TBrickletStreamTestNotifySingleReadExtraPrefix2LowLevel = procedure(sender: TBrickletStreamTest; const extra1: byte; const extra2: byte; const messageLength: byte; const messageData: TArray0To60OfChar) of object;
+  TBrickletStreamTestNotifySingleReadExtraPrefix2 = procedure(sender: TBrickletStreamTest; const extra1: byte; const extra2: byte; const message: TArrayOfChar) of object;
+  TBrickletStreamTestNotifySingleReadExtraSuffix1LowLevel = procedure(sender: TBrickletStreamTest; const messageLength: byte; const messageData: TArray0To61OfChar; const extra: byte) of object;
+  TBrickletStreamTestNotifySingleReadExtraSuffix1 = procedure(sender: TBrickletStreamTest; const message: TArrayOfChar; const extra: byte) of object;
+  TBrickletStreamTestNotifySingleReadExtraSuffix2LowLevel = procedure(sender: TBrickletStreamTest; const messageLength: byte; const messageData: TArray0To60OfChar; const extra1: byte; const extra2: byte) of object;
+  TBrickletStreamTestNotifySingleReadExtraSuffix2 = procedure(sender: TBrickletStreamTest; const message: TArrayOfChar; const extra1: byte; const extra2: byte) of object;
+  TBrickletStreamTestNotifySingleReadExtraFullLowLevel = procedure(sender: TBrickletStreamTest; const extra1: byte; const messageLength: byte; const extra2: byte; const messageData: TArray0To59OfChar; const extra3: byte) of object;
+  TBrickletStreamTestNotifySingleReadExtraFull = procedure(sender: TBrickletStreamTest; const extra1: byte; const extra2: byte; const message: TArrayOfChar; const extra3: byte) of object;
+
+  /// <summary>
+  ///  
+  /// </summary>
+  TBrickletStreamTest = class(TDevice)
+  private
+    streamMutex: TCriticalSection;
+    normalReadHighLevelCallbackState: TNormalReadHighLevelCallbackState;
+    normalReadExtraPrefix1HighLevelCallbackState: TNormalReadExtraPrefix1HighLevelCallbackState;
+    normalReadExtraPrefix2HighLevelCallbackState: TNormalReadExtraPrefix2HighLevelCallbackState;
+    normalReadExtraSuffix1HighLevelCallbackState: TNormalReadExtraSuffix1HighLevelCallbackState;
+    normalReadExtraSuffix2HighLevelCallbackState: TNormalReadExtraSuffix2HighLevelCallbackState;
+    normalReadExtraFullHighLevelCallbackState: TNormalReadExtraFullHighLevelCallbackState;
+    fixedReadHighLevelCallbackState: TFixedReadHighLevelCallbackState;
+    fixedReadExtraPrefix1HighLevelCallbackState: TFixedReadExtraPrefix1HighLevelCallbackState;
+    fixedReadExtraPrefix2HighLevelCallbackState: TFixedReadExtraPrefix2HighLevelCallbackState;
+    fixedReadExtraSuffix1HighLevelCallbackState: TFixedReadExtraSuffix1HighLevelCallbackState;
+    fixedReadExtraSuffix2HighLevelCallbackState: TFixedReadExtraSuffix2HighLevelCallbackState;
+    fixedReadExtraFullHighLevelCallbackState: TFixedReadExtraFullHighLevelCallbackState;
+    singleReadHighLevelCallbackState: TSingleReadHighLevelCallbackState;
+    singleReadExtraPrefix1HighLevelCallbackState: TSingleReadExtraPrefix1HighLevelCallbackState;
+    singleReadExtraPrefix2HighLevelCallbackState: TSingleReadExtraPrefix2HighLevelCallbackState;
+    singleReadExtraSuffix1HighLevelCallbackState: TSingleReadExtraSuffix1HighLevelCallbackState;
+    singleReadExtraSuffix2HighLevelCallbackState: TSingleReadExtraSuffix2HighLevelCallbackState;
+    singleReadExtraFullHighLevelCallbackState: TSingleReadExtraFullHighLevelCallbackState;
+    normalReadLowLevelCallback: TBrickletStreamTestNotifyNormalReadLowLevel;
+    normalReadCallback: TBrickletStreamTestNotifyNormalRead;
+    normalReadExtraPrefix1LowLevelCallback: TBrickletStreamTestNotifyNormalReadExtraPrefix1LowLevel;
+    normalReadExtraPrefix1Callback: TBrickletStreamTestNotifyNormalReadExtraPrefix1;
+    normalReadExtraPrefix2LowLevelCallback: TBrickletStreamTestNotifyNormalReadExtraPrefix2LowLevel;
+    normalReadExtraPrefix2Callback: TBrickletStreamTestNotifyNormalReadExtraPrefix2;
+    normalReadExtraSuffix1LowLevelCallback: TBrickletStreamTestNotifyNormalReadExtraSuffix1LowLevel;
+    normalReadExtraSuffix1Callback: TBrickletStreamTestNotifyNormalReadExtraSuffix1;
+    normalReadExtraSuffix2LowLevelCallback: TBrickletStreamTestNotifyNormalReadExtraSuffix2LowLevel;
+    normalReadExtraSuffix2Callback: TBrickletStreamTestNotifyNormalReadExtraSuffix2;
+    normalReadExtraFullLowLevelCallback: TBrickletStreamTestNotifyNormalReadExtraFullLowLevel;
+    normalReadExtraFullCallback: TBrickletStreamTestNotifyNormalReadExtraFull;
+    fixedReadLowLevelCallback: TBrickletStreamTestNotifyFixedReadLowLevel;
+    fixedReadCallback: TBrickletStreamTestNotifyFixedRead;
+    fixedReadExtraPrefix1LowLevelCallback: TBrickletStreamTestNotifyFixedReadExtraPrefix1LowLevel;
+    fixedReadExtraPrefix1Callback: TBrickletStreamTestNotifyFixedReadExtraPrefix1;
+    fixedReadExtraPrefix2LowLevelCallback: TBrickletStreamTestNotifyFixedReadExtraPrefix2LowLevel;
+    fixedReadExtraPrefix2Callback: TBrickletStreamTestNotifyFixedReadExtraPrefix2;
+    fixedReadExtraSuffix1LowLevelCallback: TBrickletStreamTestNotifyFixedReadExtraSuffix1LowLevel;
+    fixedReadExtraSuffix1Callback: TBrickletStreamTestNotifyFixedReadExtraSuffix1;
+    fixedReadExtraSuffix2LowLevelCallback: TBrickletStreamTestNotifyFixedReadExtraSuffix2LowLevel;
+    fixedReadExtraSuffix2Callback: TBrickletStreamTestNotifyFixedReadExtraSuffix2;
+    fixedReadExtraFullLowLevelCallback: TBrickletStreamTestNotifyFixedReadExtraFullLowLevel;
+    fixedReadExtraFullCallback: TBrickletStreamTestNotifyFixedReadExtraFull;
+    singleReadLowLevelCallback: TBrickletStreamTestNotifySingleReadLowLevel;
+    singleReadCallback: TBrickletStreamTestNotifySingleRead;
+    singleReadExtraPrefix1LowLevelCallback: TBrickletStreamTestNotifySingleReadExtraPrefix1LowLevel;
+    singleReadExtraPrefix1Callback: TBrickletStreamTestNotifySingleReadExtraPrefix1;
+    singleReadExtraPrefix2LowLevelCallback: TBrickletStreamTestNotifySingleReadExtraPrefix2LowLevel;
+    singleReadExtraPrefix2Callback: TBrickletStreamTestNotifySingleReadExtraPrefix2;
+    singleReadExtraSuffix1LowLevelCallback: TBrickletStreamTestNotifySingleReadExtraSuffix1LowLevel;
+    singleReadExtraSuffix1Callback: TBrickletStreamTestNotifySingleReadExtraSuffix1;
+    singleReadExtraSuffix2LowLevelCallback: TBrickletStreamTestNotifySingleReadExtraSuffix2LowLevel;
+    singleReadExtraSuffix2Callback: TBrickletStreamTestNotifySingleReadExtraSuffix2;
+    singleReadExtraFullLowLevelCallback: TBrickletStreamTestNotifySingleReadExtraFullLowLevel;
+    singleReadExtraFullCallback: TBrickletStreamTestNotifySingleReadExtraFull;
+  protected
+    procedure CallbackWrapperNormalReadLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperNormalReadExtraPrefix1LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperNormalReadExtraPrefix2LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperNormalReadExtraSuffix1LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperNormalReadExtraSuffix2LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperNormalReadExtraFullLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperFixedReadLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperFixedReadExtraPrefix1LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperFixedReadExtraPrefix2LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperFixedReadExtraSuffix1LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperFixedReadExtraSuffix2LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperFixedReadExtraFullLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperSingleReadLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperSingleReadExtraPrefix1LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperSingleReadExtraPrefix2LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperSingleReadExtraSuffix1LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperSingleReadExtraSuffix2LowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperSingleReadExtraFullLowLevel(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteLowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWrite(const message: array of char); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraInPrefix1LowLevel(const extra: byte; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To58OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraInPrefix1(const extra: byte; const message: array of char); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraInPrefix2LowLevel(const extra1: byte; const extra2: byte; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To57OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraInPrefix2(const extra1: byte; const extra2: byte; const message: array of char); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraInSuffix1LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To58OfChar; const extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraInSuffix1(const message: array of char; const extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraInSuffix2LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To57OfChar; const extra1: byte; const extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraInSuffix2(const message: array of char; const extra1: byte; const extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraInFullLowLevel(const extra1: byte; const messageLength: word; const extra2: byte; const messageChunkOffset: word; const extra3: byte; const messageChunkData: TArray0To55OfChar; const extra4: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraInFull(const extra1: byte; const extra2: byte; const extra3: byte; const message: array of char; const extra4: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function NormalWriteExtraOut1LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function NormalWriteExtraOut1(const message: array of char): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraOut2LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalWriteExtraOut2(const message: array of char; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteLowLevel(const messageChunkOffset: word; const messageChunkData: TArray0To61OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWrite(const message: array of char); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraInPrefix1LowLevel(const extra: byte; const messageChunkOffset: word; const messageChunkData: TArray0To60OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraInPrefix1(const extra: byte; const message: array of char); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraInPrefix2LowLevel(const extra1: byte; const extra2: byte; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraInPrefix2(const extra1: byte; const extra2: byte; const message: array of char); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraInSuffix1LowLevel(const messageChunkOffset: word; const messageChunkData: TArray0To60OfChar; const extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraInSuffix1(const message: array of char; const extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraInSuffix2LowLevel(const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; const extra1: byte; const extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraInSuffix2(const message: array of char; const extra1: byte; const extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraInFullLowLevel(const extra1: byte; const messageChunkOffset: word; const extra2: byte; const messageChunkData: TArray0To58OfChar; const extra3: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraInFull(const extra1: byte; const extra2: byte; const message: array of char; const extra3: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function FixedWriteExtraOut1LowLevel(const messageChunkOffset: word; const messageChunkData: TArray0To61OfChar): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function FixedWriteExtraOut1(const message: array of char): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraOut2LowLevel(const messageChunkOffset: word; const messageChunkData: TArray0To61OfChar; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedWriteExtraOut2(const message: array of char; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortWriteLowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortWrite(const message: array of char): word; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortWriteExtraInPrefix1LowLevel(const extra: byte; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To58OfChar): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortWriteExtraInPrefix1(const extra: byte; const message: array of char): word; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortWriteExtraInPrefix2LowLevel(const extra1: byte; const extra2: byte; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To57OfChar): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortWriteExtraInPrefix2(const extra1: byte; const extra2: byte; const message: array of char): word; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortWriteExtraInSuffix1LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To58OfChar; const extra: byte): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortWriteExtraInSuffix1(const message: array of char; const extra: byte): word; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortWriteExtraInSuffix2LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To57OfChar; const extra1: byte; const extra2: byte): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortWriteExtraInSuffix2(const message: array of char; const extra1: byte; const extra2: byte): word; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortWriteExtraOutPrefix1LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; out extra: byte; out messageChunkWritten: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortWriteExtraOutPrefix1(const message: array of char; out extra: byte; out messageWritten: word); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortWriteExtraOutPrefix2LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; out extra1: byte; out extra2: byte; out messageChunkWritten: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortWriteExtraOutPrefix2(const message: array of char; out extra1: byte; out extra2: byte; out messageWritten: word); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortWriteExtraOutSuffix1LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; out messageChunkWritten: byte; out extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortWriteExtraOutSuffix1(const message: array of char; out messageWritten: word; out extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortWriteExtraOutSuffix2LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; out messageChunkWritten: byte; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortWriteExtraOutSuffix2(const message: array of char; out messageWritten: word; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortWriteExtraFullLowLevel(const extra1: byte; const messageLength: word; const extra2: byte; const messageChunkOffset: word; const extra3: byte; const messageChunkData: TArray0To55OfChar; const extra4: byte; out extra5: byte; out messageChunkWritten: byte; out extra6: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortWriteExtraFull(const extra1: byte; const extra2: byte; const extra3: byte; const message: array of char; const extra4: byte; out extra5: byte; out messageWritten: word; out extra6: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteLowLevel(const messageLength: byte; const messageData: TArray0To62OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWrite(const message: array of char); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraInPrefix1LowLevel(const extra: byte; const messageLength: byte; const messageData: TArray0To61OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraInPrefix1(const extra: byte; const message: array of char); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraInPrefix2LowLevel(const extra1: byte; const extra2: byte; const messageLength: byte; const messageData: TArray0To60OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraInPrefix2(const extra1: byte; const extra2: byte; const message: array of char); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraInSuffix1LowLevel(const messageLength: byte; const messageData: TArray0To61OfChar; const extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraInSuffix1(const message: array of char; const extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraInSuffix2LowLevel(const messageLength: byte; const messageData: TArray0To60OfChar; const extra1: byte; const extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraInSuffix2(const message: array of char; const extra1: byte; const extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraInFullLowLevel(const extra1: byte; const messageLength: byte; const extra2: byte; const messageData: TArray0To59OfChar; const extra3: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraInFull(const extra1: byte; const extra2: byte; const message: array of char; const extra3: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function SingleWriteExtraOut1LowLevel(const messageLength: byte; const messageData: TArray0To62OfChar): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function SingleWriteExtraOut1(const message: array of char): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraOut2LowLevel(const messageLength: byte; const messageData: TArray0To62OfChar; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleWriteExtraOut2(const message: array of char; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortSingleWriteLowLevel(const messageLength: byte; const messageData: TArray0To62OfChar): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortSingleWrite(const message: array of char): word; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortSingleWriteExtraInPrefix1LowLevel(const extra: byte; const messageLength: byte; const messageData: TArray0To61OfChar): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortSingleWriteExtraInPrefix1(const extra: byte; const message: array of char): word; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortSingleWriteExtraInPrefix2LowLevel(const extra1: byte; const extra2: byte; const messageLength: byte; const messageData: TArray0To60OfChar): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortSingleWriteExtraInPrefix2(const extra1: byte; const extra2: byte; const message: array of char): word; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortSingleWriteExtraInSuffix1LowLevel(const messageLength: byte; const messageData: TArray0To61OfChar; const extra: byte): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortSingleWriteExtraInSuffix1(const message: array of char; const extra: byte): word; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortSingleWriteExtraInSuffix2LowLevel(const messageLength: byte; const messageData: TArray0To60OfChar; const extra1: byte; const extra2: byte): byte; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function ShortSingleWriteExtraInSuffix2(const message: array of char; const extra1: byte; const extra2: byte): word; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortSingleWriteExtraOutPrefix1LowLevel(const messageLength: byte; const messageData: TArray0To61OfChar; out extra: byte; out messageWritten: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortSingleWriteExtraOutPrefix1(const message: array of char; out extra: byte; out messageWritten: word); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortSingleWriteExtraOutPrefix2LowLevel(const messageLength: byte; const messageData: TArray0To61OfChar; out extra1: byte; out extra2: byte; out messageWritten: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortSingleWriteExtraOutPrefix2(const message: array of char; out extra1: byte; out extra2: byte; out messageWritten: word); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortSingleWriteExtraOutSuffix1LowLevel(const messageLength: byte; const messageData: TArray0To62OfChar; out messageWritten: byte; out extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortSingleWriteExtraOutSuffix1(const message: array of char; out messageWritten: word; out extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortSingleWriteExtraOutSuffix2LowLevel(const messageLength: byte; const messageData: TArray0To62OfChar; out messageWritten: byte; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortSingleWriteExtraOutSuffix2(const message: array of char; out messageWritten: word; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortSingleWriteExtraFullLowLevel(const extra1: byte; const messageLength: byte; const extra2: byte; const messageData: TArray0To59OfChar; const extra3: byte; out extra4: byte; out messageWritten: byte; out extra5: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure ShortSingleWriteExtraFull(const extra1: byte; const extra2: byte; const message: array of char; const extra3: byte; out extra4: byte; out messageWritten: word; out extra5: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadLowLevel(out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function NormalRead: TArrayOfChar; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraIn1LowLevel(const extra: byte; out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function NormalReadExtraIn1(const extra: byte): TArrayOfChar; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraIn2LowLevel(const extra1: byte; const extra2: byte; out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function NormalReadExtraIn2(const extra1: byte; const extra2: byte): TArrayOfChar; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraOutPrefix1LowLevel(out extra: byte; out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To58OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraOutPrefix1(out extra: byte; out message: TArrayOfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraOutPrefix2LowLevel(out extra1: byte; out extra2: byte; out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To57OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraOutPrefix2(out extra1: byte; out extra2: byte; out message: TArrayOfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraOutSuffix1LowLevel(out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To58OfChar; out extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraOutSuffix1(out message: TArrayOfChar; out extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraOutSuffix2LowLevel(out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To57OfChar; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraOutSuffix2(out message: TArrayOfChar; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraOutFullLowLevel(out extra1: byte; out messageLength: word; out extra2: byte; out messageChunkOffset: word; out extra3: byte; out messageChunkData: TArray0To55OfChar; out extra4: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure NormalReadExtraOutFull(out extra1: byte; out extra2: byte; out extra3: byte; out message: TArrayOfChar; out extra4: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadLowLevel(out messageChunkOffset: word; out messageChunkData: TArray0To61OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function FixedRead: TArrayOfChar; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraIn1LowLevel(const extra: byte; out messageChunkOffset: word; out messageChunkData: TArray0To61OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function FixedReadExtraIn1(const extra: byte): TArrayOfChar; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraIn2LowLevel(const extra1: byte; const extra2: byte; out messageChunkOffset: word; out messageChunkData: TArray0To61OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function FixedReadExtraIn2(const extra1: byte; const extra2: byte): TArrayOfChar; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraOutPrefix1LowLevel(out extra: byte; out messageChunkOffset: word; out messageChunkData: TArray0To60OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraOutPrefix1(out extra: byte; out message: TArrayOfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraOutPrefix2LowLevel(out extra1: byte; out extra2: byte; out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraOutPrefix2(out extra1: byte; out extra2: byte; out message: TArrayOfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraOutSuffix1LowLevel(out messageChunkOffset: word; out messageChunkData: TArray0To60OfChar; out extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraOutSuffix1(out message: TArrayOfChar; out extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraOutSuffix2LowLevel(out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraOutSuffix2(out message: TArrayOfChar; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraOutFullLowLevel(out extra1: byte; out messageChunkOffset: word; out extra2: byte; out messageChunkData: TArray0To58OfChar; out extra3: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure FixedReadExtraOutFull(out extra1: byte; out extra2: byte; out message: TArrayOfChar; out extra3: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadLowLevel(out messageLength: byte; out messageData: TArray0To62OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function SingleRead: TArrayOfChar; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraIn1LowLevel(const extra: byte; out messageLength: byte; out messageData: TArray0To61OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function SingleReadExtraIn1(const extra: byte): TArrayOfChar; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraIn2LowLevel(const extra1: byte; const extra2: byte; out messageLength: byte; out messageData: TArray0To61OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    function SingleReadExtraIn2(const extra1: byte; const extra2: byte): TArrayOfChar; virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraOutPrefix1LowLevel(out extra: byte; out messageLength: byte; out messageData: TArray0To61OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraOutPrefix1(out extra: byte; out message: TArrayOfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraOutPrefix2LowLevel(out extra1: byte; out extra2: byte; out messageLength: byte; out messageData: TArray0To60OfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraOutPrefix2(out extra1: byte; out extra2: byte; out message: TArrayOfChar); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraOutSuffix1LowLevel(out messageLength: byte; out messageData: TArray0To61OfChar; out extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraOutSuffix1(out message: TArrayOfChar; out extra: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraOutSuffix2LowLevel(out messageLength: byte; out messageData: TArray0To60OfChar; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraOutSuffix2(out message: TArrayOfChar; out extra1: byte; out extra2: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraOutFullLowLevel(out extra1: byte; out messageLength: byte; out extra2: byte; out messageData: TArray0To59OfChar; out extra3: byte); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure SingleReadExtraOutFull(out extra1: byte; out extra2: byte; out message: TArrayOfChar; out extra3: byte); virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnNormalRead"/>
+    /// </summary>
+    property OnNormalReadLowLevel: TBrickletStreamTestNotifyNormalReadLowLevel read normalReadLowLevelCallback write normalReadLowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnNormalRead: TBrickletStreamTestNotifyNormalRead read normalReadCallback write normalReadCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnNormalReadExtraPrefix1"/>
+    /// </summary>
+    property OnNormalReadExtraPrefix1LowLevel: TBrickletStreamTestNotifyNormalReadExtraPrefix1LowLevel read normalReadExtraPrefix1LowLevelCallback write normalReadExtraPrefix1LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnNormalReadExtraPrefix1: TBrickletStreamTestNotifyNormalReadExtraPrefix1 read normalReadExtraPrefix1Callback write normalReadExtraPrefix1Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnNormalReadExtraPrefix2"/>
+    /// </summary>
+    property OnNormalReadExtraPrefix2LowLevel: TBrickletStreamTestNotifyNormalReadExtraPrefix2LowLevel read normalReadExtraPrefix2LowLevelCallback write normalReadExtraPrefix2LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnNormalReadExtraPrefix2: TBrickletStreamTestNotifyNormalReadExtraPrefix2 read normalReadExtraPrefix2Callback write normalReadExtraPrefix2Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnNormalReadExtraSuffix1"/>
+    /// </summary>
+    property OnNormalReadExtraSuffix1LowLevel: TBrickletStreamTestNotifyNormalReadExtraSuffix1LowLevel read normalReadExtraSuffix1LowLevelCallback write normalReadExtraSuffix1LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnNormalReadExtraSuffix1: TBrickletStreamTestNotifyNormalReadExtraSuffix1 read normalReadExtraSuffix1Callback write normalReadExtraSuffix1Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnNormalReadExtraSuffix2"/>
+    /// </summary>
+    property OnNormalReadExtraSuffix2LowLevel: TBrickletStreamTestNotifyNormalReadExtraSuffix2LowLevel read normalReadExtraSuffix2LowLevelCallback write normalReadExtraSuffix2LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnNormalReadExtraSuffix2: TBrickletStreamTestNotifyNormalReadExtraSuffix2 read normalReadExtraSuffix2Callback write normalReadExtraSuffix2Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnNormalReadExtraFull"/>
+    /// </summary>
+    property OnNormalReadExtraFullLowLevel: TBrickletStreamTestNotifyNormalReadExtraFullLowLevel read normalReadExtraFullLowLevelCallback write normalReadExtraFullLowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnNormalReadExtraFull: TBrickletStreamTestNotifyNormalReadExtraFull read normalReadExtraFullCallback write normalReadExtraFullCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnFixedRead"/>
+    /// </summary>
+    property OnFixedReadLowLevel: TBrickletStreamTestNotifyFixedReadLowLevel read fixedReadLowLevelCallback write fixedReadLowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnFixedRead: TBrickletStreamTestNotifyFixedRead read fixedReadCallback write fixedReadCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnFixedReadExtraPrefix1"/>
+    /// </summary>
+    property OnFixedReadExtraPrefix1LowLevel: TBrickletStreamTestNotifyFixedReadExtraPrefix1LowLevel read fixedReadExtraPrefix1LowLevelCallback write fixedReadExtraPrefix1LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnFixedReadExtraPrefix1: TBrickletStreamTestNotifyFixedReadExtraPrefix1 read fixedReadExtraPrefix1Callback write fixedReadExtraPrefix1Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnFixedReadExtraPrefix2"/>
+    /// </summary>
+    property OnFixedReadExtraPrefix2LowLevel: TBrickletStreamTestNotifyFixedReadExtraPrefix2LowLevel read fixedReadExtraPrefix2LowLevelCallback write fixedReadExtraPrefix2LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnFixedReadExtraPrefix2: TBrickletStreamTestNotifyFixedReadExtraPrefix2 read fixedReadExtraPrefix2Callback write fixedReadExtraPrefix2Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnFixedReadExtraSuffix1"/>
+    /// </summary>
+    property OnFixedReadExtraSuffix1LowLevel: TBrickletStreamTestNotifyFixedReadExtraSuffix1LowLevel read fixedReadExtraSuffix1LowLevelCallback write fixedReadExtraSuffix1LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnFixedReadExtraSuffix1: TBrickletStreamTestNotifyFixedReadExtraSuffix1 read fixedReadExtraSuffix1Callback write fixedReadExtraSuffix1Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnFixedReadExtraSuffix2"/>
+    /// </summary>
+    property OnFixedReadExtraSuffix2LowLevel: TBrickletStreamTestNotifyFixedReadExtraSuffix2LowLevel read fixedReadExtraSuffix2LowLevelCallback write fixedReadExtraSuffix2LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnFixedReadExtraSuffix2: TBrickletStreamTestNotifyFixedReadExtraSuffix2 read fixedReadExtraSuffix2Callback write fixedReadExtraSuffix2Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnFixedReadExtraFull"/>
+    /// </summary>
+    property OnFixedReadExtraFullLowLevel: TBrickletStreamTestNotifyFixedReadExtraFullLowLevel read fixedReadExtraFullLowLevelCallback write fixedReadExtraFullLowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnFixedReadExtraFull: TBrickletStreamTestNotifyFixedReadExtraFull read fixedReadExtraFullCallback write fixedReadExtraFullCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnSingleRead"/>
+    /// </summary>
+    property OnSingleReadLowLevel: TBrickletStreamTestNotifySingleReadLowLevel read singleReadLowLevelCallback write singleReadLowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnSingleRead: TBrickletStreamTestNotifySingleRead read singleReadCallback write singleReadCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnSingleReadExtraPrefix1"/>
+    /// </summary>
+    property OnSingleReadExtraPrefix1LowLevel: TBrickletStreamTestNotifySingleReadExtraPrefix1LowLevel read singleReadExtraPrefix1LowLevelCallback write singleReadExtraPrefix1LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnSingleReadExtraPrefix1: TBrickletStreamTestNotifySingleReadExtraPrefix1 read singleReadExtraPrefix1Callback write singleReadExtraPrefix1Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnSingleReadExtraPrefix2"/>
+    /// </summary>
+    property OnSingleReadExtraPrefix2LowLevel: TBrickletStreamTestNotifySingleReadExtraPrefix2LowLevel read singleReadExtraPrefix2LowLevelCallback write singleReadExtraPrefix2LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnSingleReadExtraPrefix2: TBrickletStreamTestNotifySingleReadExtraPrefix2 read singleReadExtraPrefix2Callback write singleReadExtraPrefix2Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnSingleReadExtraSuffix1"/>
+    /// </summary>
+    property OnSingleReadExtraSuffix1LowLevel: TBrickletStreamTestNotifySingleReadExtraSuffix1LowLevel read singleReadExtraSuffix1LowLevelCallback write singleReadExtraSuffix1LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnSingleReadExtraSuffix1: TBrickletStreamTestNotifySingleReadExtraSuffix1 read singleReadExtraSuffix1Callback write singleReadExtraSuffix1Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnSingleReadExtraSuffix2"/>
+    /// </summary>
+    property OnSingleReadExtraSuffix2LowLevel: TBrickletStreamTestNotifySingleReadExtraSuffix2LowLevel read singleReadExtraSuffix2LowLevelCallback write singleReadExtraSuffix2LowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnSingleReadExtraSuffix2: TBrickletStreamTestNotifySingleReadExtraSuffix2 read singleReadExtraSuffix2Callback write singleReadExtraSuffix2Callback;
+
+    /// <summary>
+    ///  <see cref="BrickletStreamTest.TBrickletStreamTest.OnSingleReadExtraFull"/>
+    /// </summary>
+    property OnSingleReadExtraFullLowLevel: TBrickletStreamTestNotifySingleReadExtraFullLowLevel read singleReadExtraFullLowLevelCallback write singleReadExtraFullLowLevelCallback;
+
+    /// <summary>
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for message_.
+    ///  </note>
+    /// </summary>
+    property OnSingleReadExtraFull: TBrickletStreamTestNotifySingleReadExtraFull read singleReadExtraFullCallback write singleReadExtraFullCallback;
+  end;
+
+implementation
+
+constructor TBrickletStreamTest.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_STREAM_TEST_DEVICE_IDENTIFIER, BRICKLET_STREAM_TEST_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_FULL_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_STREAM_TEST_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  streamMutex := TCriticalSection.Create;
+
+  SetLength(normalReadHighLevelCallbackState.data, 0);
+  normalReadHighLevelCallbackState.data := nil;
+  normalReadHighLevelCallbackState.length := 0;
+
+  SetLength(normalReadExtraPrefix1HighLevelCallbackState.data, 0);
+  normalReadExtraPrefix1HighLevelCallbackState.data := nil;
+  normalReadExtraPrefix1HighLevelCallbackState.length := 0;
+
+  SetLength(normalReadExtraPrefix2HighLevelCallbackState.data, 0);
+  normalReadExtraPrefix2HighLevelCallbackState.data := nil;
+  normalReadExtraPrefix2HighLevelCallbackState.length := 0;
+
+  SetLength(normalReadExtraSuffix1HighLevelCallbackState.data, 0);
+  normalReadExtraSuffix1HighLevelCallbackState.data := nil;
+  normalReadExtraSuffix1HighLevelCallbackState.length := 0;
+
+  SetLength(normalReadExtraSuffix2HighLevelCallbackState.data, 0);
+  normalReadExtraSuffix2HighLevelCallbackState.data := nil;
+  normalReadExtraSuffix2HighLevelCallbackState.length := 0;
+
+  SetLength(normalReadExtraFullHighLevelCallbackState.data, 0);
+  normalReadExtraFullHighLevelCallbackState.data := nil;
+  normalReadExtraFullHighLevelCallbackState.length := 0;
+
+  SetLength(fixedReadHighLevelCallbackState.data, 0);
+  fixedReadHighLevelCallbackState.data := nil;
+  fixedReadHighLevelCallbackState.length := 0;
+
+  SetLength(fixedReadExtraPrefix1HighLevelCallbackState.data, 0);
+  fixedReadExtraPrefix1HighLevelCallbackState.data := nil;
+  fixedReadExtraPrefix1HighLevelCallbackState.length := 0;
+
+  SetLength(fixedReadExtraPrefix2HighLevelCallbackState.data, 0);
+  fixedReadExtraPrefix2HighLevelCallbackState.data := nil;
+  fixedReadExtraPrefix2HighLevelCallbackState.length := 0;
+
+  SetLength(fixedReadExtraSuffix1HighLevelCallbackState.data, 0);
+  fixedReadExtraSuffix1HighLevelCallbackState.data := nil;
+  fixedReadExtraSuffix1HighLevelCallbackState.length := 0;
+
+  SetLength(fixedReadExtraSuffix2HighLevelCallbackState.data, 0);
+  fixedReadExtraSuffix2HighLevelCallbackState.data := nil;
+  fixedReadExtraSuffix2HighLevelCallbackState.length := 0;
+
+  SetLength(fixedReadExtraFullHighLevelCallbackState.data, 0);
+  fixedReadExtraFullHighLevelCallbackState.data := nil;
+  fixedReadExtraFullHighLevelCallbackState.length := 0;
+
+  SetLength(singleReadHighLevelCallbackState.data, 0);
+  singleReadHighLevelCallbackState.data := nil;
+  singleReadHighLevelCallbackState.length := 0;
+
+  SetLength(singleReadExtraPrefix1HighLevelCallbackState.data, 0);
+  singleReadExtraPrefix1HighLevelCallbackState.data := nil;
+  singleReadExtraPrefix1HighLevelCallbackState.length := 0;
+
+  SetLength(singleReadExtraPrefix2HighLevelCallbackState.data, 0);
+  singleReadExtraPrefix2HighLevelCallbackState.data := nil;
+  singleReadExtraPrefix2HighLevelCallbackState.length := 0;
+
+  SetLength(singleReadExtraSuffix1HighLevelCallbackState.data, 0);
+  singleReadExtraSuffix1HighLevelCallbackState.data := nil;
+  singleReadExtraSuffix1HighLevelCallbackState.length := 0;
+
+  SetLength(singleReadExtraSuffix2HighLevelCallbackState.data, 0);
+  singleReadExtraSuffix2HighLevelCallbackState.data := nil;
+  singleReadExtraSuffix2HighLevelCallbackState.length := 0;
+
+  SetLength(singleReadExtraFullHighLevelCallbackState.data, 0);
+  singleReadExtraFullHighLevelCallbackState.data := nil;
+  singleReadExtraFullHighLevelCallbackState.length := 0;
+
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperNormalReadLowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_1_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperNormalReadExtraPrefix1LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_PREFIX_2_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperNormalReadExtraPrefix2LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_1_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperNormalReadExtraSuffix1LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_SUFFIX_2_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperNormalReadExtraSuffix2LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_NORMAL_READ_EXTRA_FULL_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperNormalReadExtraFullLowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperFixedReadLowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_1_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperFixedReadExtraPrefix1LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_PREFIX_2_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperFixedReadExtraPrefix2LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_1_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperFixedReadExtraSuffix1LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_SUFFIX_2_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperFixedReadExtraSuffix2LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_FIXED_READ_EXTRA_FULL_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperFixedReadExtraFullLowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperSingleReadLowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_1_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperSingleReadExtraPrefix1LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_PREFIX_2_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperSingleReadExtraPrefix2LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_1_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperSingleReadExtraSuffix1LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_SUFFIX_2_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperSingleReadExtraSuffix2LowLevel;
+  callbackWrappers[BRICKLET_STREAM_TEST_CALLBACK_SINGLE_READ_EXTRA_FULL_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperSingleReadExtraFullLowLevel;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletStreamTest.NormalWriteLowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.NormalWrite(const message: array of char);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To59OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+    NormalWriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        NormalWriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+        Inc(messageChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraInPrefix1LowLevel(const extra: byte; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To58OfChar);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra, 8, request);
+  LEConvertUInt16To(messageLength, 9, request);
+  LEConvertUInt16To(messageChunkOffset, 11, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 13 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraInPrefix1(const extra: byte; const message: array of char);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To58OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 59, 0);
+    NormalWriteExtraInPrefix1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 59) then messageChunkLength := 59;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 59, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        NormalWriteExtraInPrefix1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+        Inc(messageChunkOffset, 59);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraInPrefix2LowLevel(const extra1: byte; const extra2: byte; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To57OfChar);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt8To(extra2, 9, request);
+  LEConvertUInt16To(messageLength, 10, request);
+  LEConvertUInt16To(messageChunkOffset, 12, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 14 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraInPrefix2(const extra1: byte; const extra2: byte; const message: array of char);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To57OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 58, 0);
+    NormalWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 58) then messageChunkLength := 58;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 58, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        NormalWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+        Inc(messageChunkOffset, 58);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraInSuffix1LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To58OfChar; const extra: byte);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  LEConvertUInt8To(extra, 71, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraInSuffix1(const message: array of char; const extra: byte);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To58OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 59, 0);
+    NormalWriteExtraInSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 59) then messageChunkLength := 59;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 59, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        NormalWriteExtraInSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra);
+        Inc(messageChunkOffset, 59);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraInSuffix2LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To57OfChar; const extra1: byte; const extra2: byte);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  LEConvertUInt8To(extra1, 70, request);
+  LEConvertUInt8To(extra2, 71, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraInSuffix2(const message: array of char; const extra1: byte; const extra2: byte);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To57OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 58, 0);
+    NormalWriteExtraInSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 58) then messageChunkLength := 58;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 58, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        NormalWriteExtraInSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+        Inc(messageChunkOffset, 58);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraInFullLowLevel(const extra1: byte; const messageLength: word; const extra2: byte; const messageChunkOffset: word; const extra3: byte; const messageChunkData: TArray0To55OfChar; const extra4: byte);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_IN_FULL_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt16To(messageLength, 9, request);
+  LEConvertUInt8To(extra2, 11, request);
+  LEConvertUInt16To(messageChunkOffset, 12, request);
+  LEConvertUInt8To(extra3, 14, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 15 + (i * 1), request);
+  LEConvertUInt8To(extra4, 71, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraInFull(const extra1: byte; const extra2: byte; const extra3: byte; const message: array of char; const extra4: byte);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To55OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 56, 0);
+    NormalWriteExtraInFullLowLevel(extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 56) then messageChunkLength := 56;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 56, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        NormalWriteExtraInFullLowLevel(extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4);
+        Inc(messageChunkOffset, 56);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+function TBrickletStreamTest.NormalWriteExtraOut1LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_1_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.NormalWriteExtraOut1(const message: array of char): byte;
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To59OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+    result := NormalWriteExtraOut1LowLevel(messageLength, messageChunkOffset, messageChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        result := NormalWriteExtraOut1LowLevel(messageLength, messageChunkOffset, messageChunkData);
+        Inc(messageChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraOut2LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; out extra1: byte; out extra2: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_WRITE_EXTRA_OUT_2_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  response := SendRequest(request, 10);
+  extra1 := LEConvertUInt8From(8, response);
+  extra2 := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletStreamTest.NormalWriteExtraOut2(const message: array of char; out extra1: byte; out extra2: byte);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To59OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+    NormalWriteExtraOut2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        NormalWriteExtraOut2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+        Inc(messageChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedWriteLowLevel(const messageChunkOffset: word; const messageChunkData: TArray0To61OfChar);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageChunkOffset, 8, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 10 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.FixedWrite(const message: array of char);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To61OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  messageLength := 1000;
+  messageChunkOffset := 0;
+
+  if (Length(message) <> messageLength) then begin
+    raise EInvalidParameterException.Create(Format('Message has to be exactly %d items long', [messageLength]));
+  end;
+
+  streamMutex.Acquire;
+  try
+    while (messageChunkOffset < messageLength) do begin
+      messageChunkLength := messageLength - messageChunkOffset;
+
+      if (messageChunkLength > 62) then begin
+        messageChunkLength := 62;
+      end;
+
+      FillChar(messageChunkData[0], SizeOf(char) * 62, 0);
+      Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+      FixedWriteLowLevel(messageChunkOffset, messageChunkData);
+      Inc(messageChunkOffset, 62);
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraInPrefix1LowLevel(const extra: byte; const messageChunkOffset: word; const messageChunkData: TArray0To60OfChar);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 9, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 11 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraInPrefix1(const extra: byte; const message: array of char);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To60OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  messageLength := 1000;
+  messageChunkOffset := 0;
+
+  if (Length(message) <> messageLength) then begin
+    raise EInvalidParameterException.Create(Format('Message has to be exactly %d items long', [messageLength]));
+  end;
+
+  streamMutex.Acquire;
+  try
+    while (messageChunkOffset < messageLength) do begin
+      messageChunkLength := messageLength - messageChunkOffset;
+
+      if (messageChunkLength > 61) then begin
+        messageChunkLength := 61;
+      end;
+
+      FillChar(messageChunkData[0], SizeOf(char) * 61, 0);
+      Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+      FixedWriteExtraInPrefix1LowLevel(extra, messageChunkOffset, messageChunkData);
+      Inc(messageChunkOffset, 61);
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraInPrefix2LowLevel(const extra1: byte; const extra2: byte; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt8To(extra2, 9, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraInPrefix2(const extra1: byte; const extra2: byte; const message: array of char);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To59OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  messageLength := 1000;
+  messageChunkOffset := 0;
+
+  if (Length(message) <> messageLength) then begin
+    raise EInvalidParameterException.Create(Format('Message has to be exactly %d items long', [messageLength]));
+  end;
+
+  streamMutex.Acquire;
+  try
+    while (messageChunkOffset < messageLength) do begin
+      messageChunkLength := messageLength - messageChunkOffset;
+
+      if (messageChunkLength > 60) then begin
+        messageChunkLength := 60;
+      end;
+
+      FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+      Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+      FixedWriteExtraInPrefix2LowLevel(extra1, extra2, messageChunkOffset, messageChunkData);
+      Inc(messageChunkOffset, 60);
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraInSuffix1LowLevel(const messageChunkOffset: word; const messageChunkData: TArray0To60OfChar; const extra: byte);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageChunkOffset, 8, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 10 + (i * 1), request);
+  LEConvertUInt8To(extra, 71, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraInSuffix1(const message: array of char; const extra: byte);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To60OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  messageLength := 1000;
+  messageChunkOffset := 0;
+
+  if (Length(message) <> messageLength) then begin
+    raise EInvalidParameterException.Create(Format('Message has to be exactly %d items long', [messageLength]));
+  end;
+
+  streamMutex.Acquire;
+  try
+    while (messageChunkOffset < messageLength) do begin
+      messageChunkLength := messageLength - messageChunkOffset;
+
+      if (messageChunkLength > 61) then begin
+        messageChunkLength := 61;
+      end;
+
+      FillChar(messageChunkData[0], SizeOf(char) * 61, 0);
+      Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+      FixedWriteExtraInSuffix1LowLevel(messageChunkOffset, messageChunkData, extra);
+      Inc(messageChunkOffset, 61);
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraInSuffix2LowLevel(const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; const extra1: byte; const extra2: byte);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageChunkOffset, 8, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 10 + (i * 1), request);
+  LEConvertUInt8To(extra1, 70, request);
+  LEConvertUInt8To(extra2, 71, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraInSuffix2(const message: array of char; const extra1: byte; const extra2: byte);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To59OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  messageLength := 1000;
+  messageChunkOffset := 0;
+
+  if (Length(message) <> messageLength) then begin
+    raise EInvalidParameterException.Create(Format('Message has to be exactly %d items long', [messageLength]));
+  end;
+
+  streamMutex.Acquire;
+  try
+    while (messageChunkOffset < messageLength) do begin
+      messageChunkLength := messageLength - messageChunkOffset;
+
+      if (messageChunkLength > 60) then begin
+        messageChunkLength := 60;
+      end;
+
+      FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+      Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+      FixedWriteExtraInSuffix2LowLevel(messageChunkOffset, messageChunkData, extra1, extra2);
+      Inc(messageChunkOffset, 60);
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraInFullLowLevel(const extra1: byte; const messageChunkOffset: word; const extra2: byte; const messageChunkData: TArray0To58OfChar; const extra3: byte);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_IN_FULL_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 9, request);
+  LEConvertUInt8To(extra2, 11, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  LEConvertUInt8To(extra3, 71, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraInFull(const extra1: byte; const extra2: byte; const message: array of char; const extra3: byte);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To58OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  messageLength := 1000;
+  messageChunkOffset := 0;
+
+  if (Length(message) <> messageLength) then begin
+    raise EInvalidParameterException.Create(Format('Message has to be exactly %d items long', [messageLength]));
+  end;
+
+  streamMutex.Acquire;
+  try
+    while (messageChunkOffset < messageLength) do begin
+      messageChunkLength := messageLength - messageChunkOffset;
+
+      if (messageChunkLength > 59) then begin
+        messageChunkLength := 59;
+      end;
+
+      FillChar(messageChunkData[0], SizeOf(char) * 59, 0);
+      Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+      FixedWriteExtraInFullLowLevel(extra1, messageChunkOffset, extra2, messageChunkData, extra3);
+      Inc(messageChunkOffset, 59);
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+function TBrickletStreamTest.FixedWriteExtraOut1LowLevel(const messageChunkOffset: word; const messageChunkData: TArray0To61OfChar): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_1_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageChunkOffset, 8, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 10 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.FixedWriteExtraOut1(const message: array of char): byte;
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To61OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  messageLength := 1000;
+  messageChunkOffset := 0;
+
+  if (Length(message) <> messageLength) then begin
+    raise EInvalidParameterException.Create(Format('Message has to be exactly %d items long', [messageLength]));
+  end;
+
+  streamMutex.Acquire;
+  try
+    while (messageChunkOffset < messageLength) do begin
+      messageChunkLength := messageLength - messageChunkOffset;
+
+      if (messageChunkLength > 62) then begin
+        messageChunkLength := 62;
+      end;
+
+      FillChar(messageChunkData[0], SizeOf(char) * 62, 0);
+      Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+      result := FixedWriteExtraOut1LowLevel(messageChunkOffset, messageChunkData);
+      Inc(messageChunkOffset, 62);
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraOut2LowLevel(const messageChunkOffset: word; const messageChunkData: TArray0To61OfChar; out extra1: byte; out extra2: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_WRITE_EXTRA_OUT_2_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageChunkOffset, 8, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 10 + (i * 1), request);
+  response := SendRequest(request, 10);
+  extra1 := LEConvertUInt8From(8, response);
+  extra2 := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletStreamTest.FixedWriteExtraOut2(const message: array of char; out extra1: byte; out extra2: byte);
+var
+  messageChunkOffset: word;
+  messageChunkData: TArray0To61OfChar;
+  messageChunkLength: word;
+  messageLength: word;
+begin
+  messageLength := 1000;
+  messageChunkOffset := 0;
+
+  if (Length(message) <> messageLength) then begin
+    raise EInvalidParameterException.Create(Format('Message has to be exactly %d items long', [messageLength]));
+  end;
+
+  streamMutex.Acquire;
+  try
+    while (messageChunkOffset < messageLength) do begin
+      messageChunkLength := messageLength - messageChunkOffset;
+
+      if (messageChunkLength > 62) then begin
+        messageChunkLength := 62;
+      end;
+
+      FillChar(messageChunkData[0], SizeOf(char) * 62, 0);
+      Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+      FixedWriteExtraOut2LowLevel(messageChunkOffset, messageChunkData, extra1, extra2);
+      Inc(messageChunkOffset, 62);
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+function TBrickletStreamTest.ShortWriteLowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.ShortWrite(const message: array of char): word;
+var
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkLength: word;
+  messageChunkData: TArray0To59OfChar;
+  messageChunkWritten: byte;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+  result := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+    result := ShortWriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        messageChunkWritten := ShortWriteLowLevel(messageLength, messageChunkOffset, messageChunkData);
+        Inc(result, messageChunkWritten);
+
+        if (messageChunkWritten < 60) then break; { Either last chunk or short write }
+
+        Inc(messageChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+function TBrickletStreamTest.ShortWriteExtraInPrefix1LowLevel(const extra: byte; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To58OfChar): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra, 8, request);
+  LEConvertUInt16To(messageLength, 9, request);
+  LEConvertUInt16To(messageChunkOffset, 11, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 13 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.ShortWriteExtraInPrefix1(const extra: byte; const message: array of char): word;
+var
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkLength: word;
+  messageChunkData: TArray0To58OfChar;
+  messageChunkWritten: byte;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+  result := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 59, 0);
+    result := ShortWriteExtraInPrefix1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 59) then messageChunkLength := 59;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 59, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        messageChunkWritten := ShortWriteExtraInPrefix1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+        Inc(result, messageChunkWritten);
+
+        if (messageChunkWritten < 59) then break; { Either last chunk or short write }
+
+        Inc(messageChunkOffset, 59);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+function TBrickletStreamTest.ShortWriteExtraInPrefix2LowLevel(const extra1: byte; const extra2: byte; const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To57OfChar): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt8To(extra2, 9, request);
+  LEConvertUInt16To(messageLength, 10, request);
+  LEConvertUInt16To(messageChunkOffset, 12, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 14 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.ShortWriteExtraInPrefix2(const extra1: byte; const extra2: byte; const message: array of char): word;
+var
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkLength: word;
+  messageChunkData: TArray0To57OfChar;
+  messageChunkWritten: byte;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+  result := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 58, 0);
+    result := ShortWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 58) then messageChunkLength := 58;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 58, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        messageChunkWritten := ShortWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+        Inc(result, messageChunkWritten);
+
+        if (messageChunkWritten < 58) then break; { Either last chunk or short write }
+
+        Inc(messageChunkOffset, 58);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+function TBrickletStreamTest.ShortWriteExtraInSuffix1LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To58OfChar; const extra: byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  LEConvertUInt8To(extra, 71, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.ShortWriteExtraInSuffix1(const message: array of char; const extra: byte): word;
+var
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkLength: word;
+  messageChunkData: TArray0To58OfChar;
+  messageChunkWritten: byte;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+  result := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 59, 0);
+    result := ShortWriteExtraInSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 59) then messageChunkLength := 59;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 59, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        messageChunkWritten := ShortWriteExtraInSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra);
+        Inc(result, messageChunkWritten);
+
+        if (messageChunkWritten < 59) then break; { Either last chunk or short write }
+
+        Inc(messageChunkOffset, 59);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+function TBrickletStreamTest.ShortWriteExtraInSuffix2LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To57OfChar; const extra1: byte; const extra2: byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  LEConvertUInt8To(extra1, 70, request);
+  LEConvertUInt8To(extra2, 71, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.ShortWriteExtraInSuffix2(const message: array of char; const extra1: byte; const extra2: byte): word;
+var
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkLength: word;
+  messageChunkData: TArray0To57OfChar;
+  messageChunkWritten: byte;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+  result := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 58, 0);
+    result := ShortWriteExtraInSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 58) then messageChunkLength := 58;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 58, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        messageChunkWritten := ShortWriteExtraInSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+        Inc(result, messageChunkWritten);
+
+        if (messageChunkWritten < 58) then break; { Either last chunk or short write }
+
+        Inc(messageChunkOffset, 58);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.ShortWriteExtraOutPrefix1LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; out extra: byte; out messageChunkWritten: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  response := SendRequest(request, 10);
+  extra := LEConvertUInt8From(8, response);
+  messageChunkWritten := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletStreamTest.ShortWriteExtraOutPrefix1(const message: array of char; out extra: byte; out messageWritten: word);
+var
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkLength: word;
+  messageChunkData: TArray0To59OfChar;
+  messageChunkWritten: byte;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+  messageWritten := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+    ShortWriteExtraOutPrefix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra, messageChunkWritten);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        ShortWriteExtraOutPrefix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra, messageChunkWritten);
+        Inc(messageWritten, messageChunkWritten);
+
+        if (messageChunkWritten < 60) then break; { Either last chunk or short write }
+
+        Inc(messageChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.ShortWriteExtraOutPrefix2LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; out extra1: byte; out extra2: byte; out messageChunkWritten: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  response := SendRequest(request, 11);
+  extra1 := LEConvertUInt8From(8, response);
+  extra2 := LEConvertUInt8From(9, response);
+  messageChunkWritten := LEConvertUInt8From(10, response);
+end;
+
+procedure TBrickletStreamTest.ShortWriteExtraOutPrefix2(const message: array of char; out extra1: byte; out extra2: byte; out messageWritten: word);
+var
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkLength: word;
+  messageChunkData: TArray0To59OfChar;
+  messageChunkWritten: byte;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+  messageWritten := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+    ShortWriteExtraOutPrefix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2, messageChunkWritten);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        ShortWriteExtraOutPrefix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2, messageChunkWritten);
+        Inc(messageWritten, messageChunkWritten);
+
+        if (messageChunkWritten < 60) then break; { Either last chunk or short write }
+
+        Inc(messageChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.ShortWriteExtraOutSuffix1LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; out messageChunkWritten: byte; out extra: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  response := SendRequest(request, 10);
+  messageChunkWritten := LEConvertUInt8From(8, response);
+  extra := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletStreamTest.ShortWriteExtraOutSuffix1(const message: array of char; out messageWritten: word; out extra: byte);
+var
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkLength: word;
+  messageChunkData: TArray0To59OfChar;
+  messageChunkWritten: byte;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+  messageWritten := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+    ShortWriteExtraOutSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, messageChunkWritten, extra);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        ShortWriteExtraOutSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, messageChunkWritten, extra);
+        Inc(messageWritten, messageChunkWritten);
+
+        if (messageChunkWritten < 60) then break; { Either last chunk or short write }
+
+        Inc(messageChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.ShortWriteExtraOutSuffix2LowLevel(const messageLength: word; const messageChunkOffset: word; const messageChunkData: TArray0To59OfChar; out messageChunkWritten: byte; out extra1: byte; out extra2: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt16To(messageLength, 8, request);
+  LEConvertUInt16To(messageChunkOffset, 10, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 12 + (i * 1), request);
+  response := SendRequest(request, 11);
+  messageChunkWritten := LEConvertUInt8From(8, response);
+  extra1 := LEConvertUInt8From(9, response);
+  extra2 := LEConvertUInt8From(10, response);
+end;
+
+procedure TBrickletStreamTest.ShortWriteExtraOutSuffix2(const message: array of char; out messageWritten: word; out extra1: byte; out extra2: byte);
+var
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkLength: word;
+  messageChunkData: TArray0To59OfChar;
+  messageChunkWritten: byte;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+  messageWritten := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+    ShortWriteExtraOutSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, messageChunkWritten, extra1, extra2);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 60, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        ShortWriteExtraOutSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, messageChunkWritten, extra1, extra2);
+        Inc(messageWritten, messageChunkWritten);
+
+        if (messageChunkWritten < 60) then break; { Either last chunk or short write }
+
+        Inc(messageChunkOffset, 60);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.ShortWriteExtraFullLowLevel(const extra1: byte; const messageLength: word; const extra2: byte; const messageChunkOffset: word; const extra3: byte; const messageChunkData: TArray0To55OfChar; const extra4: byte; out extra5: byte; out messageChunkWritten: byte; out extra6: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_WRITE_EXTRA_FULL_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt16To(messageLength, 9, request);
+  LEConvertUInt8To(extra2, 11, request);
+  LEConvertUInt16To(messageChunkOffset, 12, request);
+  LEConvertUInt8To(extra3, 14, request);
+  for i := 0 to Length(messageChunkData) - 1 do LEConvertCharTo(messageChunkData[i], 15 + (i * 1), request);
+  LEConvertUInt8To(extra4, 71, request);
+  response := SendRequest(request, 11);
+  extra5 := LEConvertUInt8From(8, response);
+  messageChunkWritten := LEConvertUInt8From(9, response);
+  extra6 := LEConvertUInt8From(10, response);
+end;
+
+procedure TBrickletStreamTest.ShortWriteExtraFull(const extra1: byte; const extra2: byte; const extra3: byte; const message: array of char; const extra4: byte; out extra5: byte; out messageWritten: word; out extra6: byte);
+var
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkLength: word;
+  messageChunkData: TArray0To55OfChar;
+  messageChunkWritten: byte;
+begin
+  if (Length(message) > 65535) then begin
+    raise EInvalidParameterException.Create('Message can be at most 65535 items long');
+  end;
+
+  messageLength := Length(message);
+  messageChunkOffset := 0;
+  messageWritten := 0;
+
+  if (messageLength = 0) then begin
+    FillChar(messageChunkData[0], SizeOf(char) * 56, 0);
+    ShortWriteExtraFullLowLevel(extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4, extra5, messageChunkWritten, extra6);
+  end
+  else begin
+    streamMutex.Acquire;
+    try
+      while (messageChunkOffset < messageLength) do begin
+        messageChunkLength := messageLength - messageChunkOffset;
+
+        if (messageChunkLength > 56) then messageChunkLength := 56;
+
+        FillChar(messageChunkData[0], SizeOf(char) * 56, 0);
+        Move(message[messageChunkOffset], messageChunkData[0], SizeOf(char) * messageChunkLength);
+
+        ShortWriteExtraFullLowLevel(extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4, extra5, messageChunkWritten, extra6);
+        Inc(messageWritten, messageChunkWritten);
+
+        if (messageChunkWritten < 56) then break; { Either last chunk or short write }
+
+        Inc(messageChunkOffset, 56);
+      end;
+    finally
+      streamMutex.Release;
+    end;
+  end;
+end;
+
+procedure TBrickletStreamTest.SingleWriteLowLevel(const messageLength: byte; const messageData: TArray0To62OfChar);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_LOW_LEVEL, 72);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.SingleWrite(const message: array of char);
+var
+  messageLength: byte;
+  messageData: TArray0To62OfChar;
+begin
+  if (Length(message) > 63) then begin
+    raise EInvalidParameterException.Create('Message can be at most 63 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 63, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  SingleWriteLowLevel(messageLength, messageData);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraInPrefix1LowLevel(const extra: byte; const messageLength: byte; const messageData: TArray0To61OfChar);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra, 8, request);
+  LEConvertUInt8To(messageLength, 9, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 10 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraInPrefix1(const extra: byte; const message: array of char);
+var
+  messageLength: byte;
+  messageData: TArray0To61OfChar;
+begin
+  if (Length(message) > 62) then begin
+    raise EInvalidParameterException.Create('Message can be at most 62 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 62, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  SingleWriteExtraInPrefix1LowLevel(extra, messageLength, messageData);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraInPrefix2LowLevel(const extra1: byte; const extra2: byte; const messageLength: byte; const messageData: TArray0To60OfChar);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt8To(extra2, 9, request);
+  LEConvertUInt8To(messageLength, 10, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 11 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraInPrefix2(const extra1: byte; const extra2: byte; const message: array of char);
+var
+  messageLength: byte;
+  messageData: TArray0To60OfChar;
+begin
+  if (Length(message) > 61) then begin
+    raise EInvalidParameterException.Create('Message can be at most 61 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 61, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  SingleWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageData);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraInSuffix1LowLevel(const messageLength: byte; const messageData: TArray0To61OfChar; const extra: byte);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  LEConvertUInt8To(extra, 71, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraInSuffix1(const message: array of char; const extra: byte);
+var
+  messageLength: byte;
+  messageData: TArray0To61OfChar;
+begin
+  if (Length(message) > 62) then begin
+    raise EInvalidParameterException.Create('Message can be at most 62 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 62, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  SingleWriteExtraInSuffix1LowLevel(messageLength, messageData, extra);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraInSuffix2LowLevel(const messageLength: byte; const messageData: TArray0To60OfChar; const extra1: byte; const extra2: byte);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  LEConvertUInt8To(extra1, 70, request);
+  LEConvertUInt8To(extra2, 71, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraInSuffix2(const message: array of char; const extra1: byte; const extra2: byte);
+var
+  messageLength: byte;
+  messageData: TArray0To60OfChar;
+begin
+  if (Length(message) > 61) then begin
+    raise EInvalidParameterException.Create('Message can be at most 61 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 61, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  SingleWriteExtraInSuffix2LowLevel(messageLength, messageData, extra1, extra2);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraInFullLowLevel(const extra1: byte; const messageLength: byte; const extra2: byte; const messageData: TArray0To59OfChar; const extra3: byte);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_IN_FULL_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt8To(messageLength, 9, request);
+  LEConvertUInt8To(extra2, 10, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 11 + (i * 1), request);
+  LEConvertUInt8To(extra3, 71, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraInFull(const extra1: byte; const extra2: byte; const message: array of char; const extra3: byte);
+var
+  messageLength: byte;
+  messageData: TArray0To59OfChar;
+begin
+  if (Length(message) > 60) then begin
+    raise EInvalidParameterException.Create('Message can be at most 60 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 60, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  SingleWriteExtraInFullLowLevel(extra1, messageLength, extra2, messageData, extra3);
+end;
+
+function TBrickletStreamTest.SingleWriteExtraOut1LowLevel(const messageLength: byte; const messageData: TArray0To62OfChar): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_1_LOW_LEVEL, 72);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.SingleWriteExtraOut1(const message: array of char): byte;
+var
+  messageLength: byte;
+  messageData: TArray0To62OfChar;
+begin
+  if (Length(message) > 63) then begin
+    raise EInvalidParameterException.Create('Message can be at most 63 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 63, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  result := SingleWriteExtraOut1LowLevel(messageLength, messageData);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraOut2LowLevel(const messageLength: byte; const messageData: TArray0To62OfChar; out extra1: byte; out extra2: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_WRITE_EXTRA_OUT_2_LOW_LEVEL, 72);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  response := SendRequest(request, 10);
+  extra1 := LEConvertUInt8From(8, response);
+  extra2 := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletStreamTest.SingleWriteExtraOut2(const message: array of char; out extra1: byte; out extra2: byte);
+var
+  messageLength: byte;
+  messageData: TArray0To62OfChar;
+begin
+  if (Length(message) > 63) then begin
+    raise EInvalidParameterException.Create('Message can be at most 63 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 63, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  SingleWriteExtraOut2LowLevel(messageLength, messageData, extra1, extra2);
+end;
+
+function TBrickletStreamTest.ShortSingleWriteLowLevel(const messageLength: byte; const messageData: TArray0To62OfChar): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_LOW_LEVEL, 72);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.ShortSingleWrite(const message: array of char): word;
+var
+  messageLength: byte;
+  messageData: TArray0To62OfChar;
+  messageChunkWritten: byte;
+begin
+  result := 0;
+
+  if (Length(message) > 63) then begin
+    raise EInvalidParameterException.Create('Message can be at most 63 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 63, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  messageChunkWritten := ShortSingleWriteLowLevel(messageLength, messageData);
+  Inc(result, messageChunkWritten);
+end;
+
+function TBrickletStreamTest.ShortSingleWriteExtraInPrefix1LowLevel(const extra: byte; const messageLength: byte; const messageData: TArray0To61OfChar): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra, 8, request);
+  LEConvertUInt8To(messageLength, 9, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 10 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.ShortSingleWriteExtraInPrefix1(const extra: byte; const message: array of char): word;
+var
+  messageLength: byte;
+  messageData: TArray0To61OfChar;
+  messageChunkWritten: byte;
+begin
+  result := 0;
+
+  if (Length(message) > 62) then begin
+    raise EInvalidParameterException.Create('Message can be at most 62 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 62, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  messageChunkWritten := ShortSingleWriteExtraInPrefix1LowLevel(extra, messageLength, messageData);
+  Inc(result, messageChunkWritten);
+end;
+
+function TBrickletStreamTest.ShortSingleWriteExtraInPrefix2LowLevel(const extra1: byte; const extra2: byte; const messageLength: byte; const messageData: TArray0To60OfChar): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_PREFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt8To(extra2, 9, request);
+  LEConvertUInt8To(messageLength, 10, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 11 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.ShortSingleWriteExtraInPrefix2(const extra1: byte; const extra2: byte; const message: array of char): word;
+var
+  messageLength: byte;
+  messageData: TArray0To60OfChar;
+  messageChunkWritten: byte;
+begin
+  result := 0;
+
+  if (Length(message) > 61) then begin
+    raise EInvalidParameterException.Create('Message can be at most 61 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 61, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  messageChunkWritten := ShortSingleWriteExtraInPrefix2LowLevel(extra1, extra2, messageLength, messageData);
+  Inc(result, messageChunkWritten);
+end;
+
+function TBrickletStreamTest.ShortSingleWriteExtraInSuffix1LowLevel(const messageLength: byte; const messageData: TArray0To61OfChar; const extra: byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  LEConvertUInt8To(extra, 71, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.ShortSingleWriteExtraInSuffix1(const message: array of char; const extra: byte): word;
+var
+  messageLength: byte;
+  messageData: TArray0To61OfChar;
+  messageChunkWritten: byte;
+begin
+  result := 0;
+
+  if (Length(message) > 62) then begin
+    raise EInvalidParameterException.Create('Message can be at most 62 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 62, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  messageChunkWritten := ShortSingleWriteExtraInSuffix1LowLevel(messageLength, messageData, extra);
+  Inc(result, messageChunkWritten);
+end;
+
+function TBrickletStreamTest.ShortSingleWriteExtraInSuffix2LowLevel(const messageLength: byte; const messageData: TArray0To60OfChar; const extra1: byte; const extra2: byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_IN_SUFFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  LEConvertUInt8To(extra1, 70, request);
+  LEConvertUInt8To(extra2, 71, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletStreamTest.ShortSingleWriteExtraInSuffix2(const message: array of char; const extra1: byte; const extra2: byte): word;
+var
+  messageLength: byte;
+  messageData: TArray0To60OfChar;
+  messageChunkWritten: byte;
+begin
+  result := 0;
+
+  if (Length(message) > 61) then begin
+    raise EInvalidParameterException.Create('Message can be at most 61 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 61, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  messageChunkWritten := ShortSingleWriteExtraInSuffix2LowLevel(messageLength, messageData, extra1, extra2);
+  Inc(result, messageChunkWritten);
+end;
+
+procedure TBrickletStreamTest.ShortSingleWriteExtraOutPrefix1LowLevel(const messageLength: byte; const messageData: TArray0To61OfChar; out extra: byte; out messageWritten: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_1_LOW_LEVEL, 71);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  response := SendRequest(request, 10);
+  extra := LEConvertUInt8From(8, response);
+  messageWritten := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletStreamTest.ShortSingleWriteExtraOutPrefix1(const message: array of char; out extra: byte; out messageWritten: word);
+var
+  messageLength: byte;
+  messageData: TArray0To61OfChar;
+  messageChunkWritten: byte;
+begin
+  messageWritten := 0;
+
+  if (Length(message) > 62) then begin
+    raise EInvalidParameterException.Create('Message can be at most 62 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 62, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  ShortSingleWriteExtraOutPrefix1LowLevel(messageLength, messageData, extra, messageChunkWritten);
+  Inc(messageWritten, messageChunkWritten);
+end;
+
+procedure TBrickletStreamTest.ShortSingleWriteExtraOutPrefix2LowLevel(const messageLength: byte; const messageData: TArray0To61OfChar; out extra1: byte; out extra2: byte; out messageWritten: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_PREFIX_2_LOW_LEVEL, 71);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  response := SendRequest(request, 11);
+  extra1 := LEConvertUInt8From(8, response);
+  extra2 := LEConvertUInt8From(9, response);
+  messageWritten := LEConvertUInt8From(10, response);
+end;
+
+procedure TBrickletStreamTest.ShortSingleWriteExtraOutPrefix2(const message: array of char; out extra1: byte; out extra2: byte; out messageWritten: word);
+var
+  messageLength: byte;
+  messageData: TArray0To61OfChar;
+  messageChunkWritten: byte;
+begin
+  messageWritten := 0;
+
+  if (Length(message) > 62) then begin
+    raise EInvalidParameterException.Create('Message can be at most 62 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 62, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  ShortSingleWriteExtraOutPrefix2LowLevel(messageLength, messageData, extra1, extra2, messageChunkWritten);
+  Inc(messageWritten, messageChunkWritten);
+end;
+
+procedure TBrickletStreamTest.ShortSingleWriteExtraOutSuffix1LowLevel(const messageLength: byte; const messageData: TArray0To62OfChar; out messageWritten: byte; out extra: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, 72);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  response := SendRequest(request, 10);
+  messageWritten := LEConvertUInt8From(8, response);
+  extra := LEConvertUInt8From(9, response);
+end;
+
+procedure TBrickletStreamTest.ShortSingleWriteExtraOutSuffix1(const message: array of char; out messageWritten: word; out extra: byte);
+var
+  messageLength: byte;
+  messageData: TArray0To62OfChar;
+  messageChunkWritten: byte;
+begin
+  messageWritten := 0;
+
+  if (Length(message) > 63) then begin
+    raise EInvalidParameterException.Create('Message can be at most 63 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 63, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  ShortSingleWriteExtraOutSuffix1LowLevel(messageLength, messageData, messageChunkWritten, extra);
+  Inc(messageWritten, messageChunkWritten);
+end;
+
+procedure TBrickletStreamTest.ShortSingleWriteExtraOutSuffix2LowLevel(const messageLength: byte; const messageData: TArray0To62OfChar; out messageWritten: byte; out extra1: byte; out extra2: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, 72);
+  LEConvertUInt8To(messageLength, 8, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 9 + (i * 1), request);
+  response := SendRequest(request, 11);
+  messageWritten := LEConvertUInt8From(8, response);
+  extra1 := LEConvertUInt8From(9, response);
+  extra2 := LEConvertUInt8From(10, response);
+end;
+
+procedure TBrickletStreamTest.ShortSingleWriteExtraOutSuffix2(const message: array of char; out messageWritten: word; out extra1: byte; out extra2: byte);
+var
+  messageLength: byte;
+  messageData: TArray0To62OfChar;
+  messageChunkWritten: byte;
+begin
+  messageWritten := 0;
+
+  if (Length(message) > 63) then begin
+    raise EInvalidParameterException.Create('Message can be at most 63 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 63, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  ShortSingleWriteExtraOutSuffix2LowLevel(messageLength, messageData, messageChunkWritten, extra1, extra2);
+  Inc(messageWritten, messageChunkWritten);
+end;
+
+procedure TBrickletStreamTest.ShortSingleWriteExtraFullLowLevel(const extra1: byte; const messageLength: byte; const extra2: byte; const messageData: TArray0To59OfChar; const extra3: byte; out extra4: byte; out messageWritten: byte; out extra5: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SHORT_SINGLE_WRITE_EXTRA_FULL_LOW_LEVEL, 72);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt8To(messageLength, 9, request);
+  LEConvertUInt8To(extra2, 10, request);
+  for i := 0 to Length(messageData) - 1 do LEConvertCharTo(messageData[i], 11 + (i * 1), request);
+  LEConvertUInt8To(extra3, 71, request);
+  response := SendRequest(request, 11);
+  extra4 := LEConvertUInt8From(8, response);
+  messageWritten := LEConvertUInt8From(9, response);
+  extra5 := LEConvertUInt8From(10, response);
+end;
+
+procedure TBrickletStreamTest.ShortSingleWriteExtraFull(const extra1: byte; const extra2: byte; const message: array of char; const extra3: byte; out extra4: byte; out messageWritten: word; out extra5: byte);
+var
+  messageLength: byte;
+  messageData: TArray0To59OfChar;
+  messageChunkWritten: byte;
+begin
+  messageWritten := 0;
+
+  if (Length(message) > 60) then begin
+    raise EInvalidParameterException.Create('Message can be at most 60 items long');
+  end;
+
+  messageLength := Length(message);
+
+  FillChar(messageData[0], SizeOf(char) * 60, 0);
+  Move(message[0], messageData[0], SizeOf(char) * messageLength);
+
+  ShortSingleWriteExtraFullLowLevel(extra1, messageLength, extra2, messageData, extra3, extra4, messageChunkWritten, extra5);
+  Inc(messageWritten, messageChunkWritten);
+end;
+
+procedure TBrickletStreamTest.NormalReadLowLevel(out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  messageLength := LEConvertUInt16From(8, response);
+  messageChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 59 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), response);
+end;
+
+function TBrickletStreamTest.NormalRead: TArrayOfChar;
+var
+  message: TArrayOfChar;
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To59OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(message, 0);
+  streamMutex.Acquire;
+  try
+    messageLength := 0;
+    NormalReadLowLevel(messageLength, messageChunkOffset, messageChunkData);
+    SetLength(message, messageLength);
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 60) then messageChunkLength := 60;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        NormalReadLowLevel(messageLength, messageChunkOffset, messageChunkData);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 60 < messageLength) do begin
+        NormalReadLowLevel(messageLength, messageChunkOffset, messageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := message;
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraIn1LowLevel(const extra: byte; out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_1_LOW_LEVEL, 9);
+  LEConvertUInt8To(extra, 8, request);
+  response := SendRequest(request, 72);
+  messageLength := LEConvertUInt16From(8, response);
+  messageChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 59 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), response);
+end;
+
+function TBrickletStreamTest.NormalReadExtraIn1(const extra: byte): TArrayOfChar;
+var
+  message: TArrayOfChar;
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To59OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(message, 0);
+  streamMutex.Acquire;
+  try
+    messageLength := 0;
+    NormalReadExtraIn1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+    SetLength(message, messageLength);
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 60) then messageChunkLength := 60;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        NormalReadExtraIn1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 60 < messageLength) do begin
+        NormalReadExtraIn1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := message;
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraIn2LowLevel(const extra1: byte; const extra2: byte; out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_IN_2_LOW_LEVEL, 10);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt8To(extra2, 9, request);
+  response := SendRequest(request, 72);
+  messageLength := LEConvertUInt16From(8, response);
+  messageChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 59 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), response);
+end;
+
+function TBrickletStreamTest.NormalReadExtraIn2(const extra1: byte; const extra2: byte): TArrayOfChar;
+var
+  message: TArrayOfChar;
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To59OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(message, 0);
+  streamMutex.Acquire;
+  try
+    messageLength := 0;
+    NormalReadExtraIn2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+    SetLength(message, messageLength);
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 60) then messageChunkLength := 60;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        NormalReadExtraIn2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 60 < messageLength) do begin
+        NormalReadExtraIn2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := message;
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraOutPrefix1LowLevel(out extra: byte; out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To58OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  extra := LEConvertUInt8From(8, response);
+  messageLength := LEConvertUInt16From(9, response);
+  messageChunkOffset := LEConvertUInt16From(11, response);
+  for i := 0 to 58 do messageChunkData[i] := LEConvertCharFrom(13 + (i * 1), response);
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraOutPrefix1(out extra: byte; out message: TArrayOfChar);
+var
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To58OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  streamMutex.Acquire;
+  try
+    messageLength := 0;
+    NormalReadExtraOutPrefix1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+    SetLength(message, messageLength);
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 59) then messageChunkLength := 59;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        NormalReadExtraOutPrefix1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 59) then messageChunkLength := 59;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 59 < messageLength) do begin
+        NormalReadExtraOutPrefix1LowLevel(extra, messageLength, messageChunkOffset, messageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraOutPrefix2LowLevel(out extra1: byte; out extra2: byte; out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To57OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  extra1 := LEConvertUInt8From(8, response);
+  extra2 := LEConvertUInt8From(9, response);
+  messageLength := LEConvertUInt16From(10, response);
+  messageChunkOffset := LEConvertUInt16From(12, response);
+  for i := 0 to 57 do messageChunkData[i] := LEConvertCharFrom(14 + (i * 1), response);
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraOutPrefix2(out extra1: byte; out extra2: byte; out message: TArrayOfChar);
+var
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To57OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  streamMutex.Acquire;
+  try
+    messageLength := 0;
+    NormalReadExtraOutPrefix2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+    SetLength(message, messageLength);
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 58) then messageChunkLength := 58;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        NormalReadExtraOutPrefix2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 58) then messageChunkLength := 58;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 58 < messageLength) do begin
+        NormalReadExtraOutPrefix2LowLevel(extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraOutSuffix1LowLevel(out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To58OfChar; out extra: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  messageLength := LEConvertUInt16From(8, response);
+  messageChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 58 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), response);
+  extra := LEConvertUInt8From(71, response);
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraOutSuffix1(out message: TArrayOfChar; out extra: byte);
+var
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To58OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  streamMutex.Acquire;
+  try
+    messageLength := 0;
+    NormalReadExtraOutSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra);
+    SetLength(message, messageLength);
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 59) then messageChunkLength := 59;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        NormalReadExtraOutSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 59) then messageChunkLength := 59;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 59 < messageLength) do begin
+        NormalReadExtraOutSuffix1LowLevel(messageLength, messageChunkOffset, messageChunkData, extra);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraOutSuffix2LowLevel(out messageLength: word; out messageChunkOffset: word; out messageChunkData: TArray0To57OfChar; out extra1: byte; out extra2: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  messageLength := LEConvertUInt16From(8, response);
+  messageChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 57 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), response);
+  extra1 := LEConvertUInt8From(70, response);
+  extra2 := LEConvertUInt8From(71, response);
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraOutSuffix2(out message: TArrayOfChar; out extra1: byte; out extra2: byte);
+var
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To57OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  streamMutex.Acquire;
+  try
+    messageLength := 0;
+    NormalReadExtraOutSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+    SetLength(message, messageLength);
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 58) then messageChunkLength := 58;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        NormalReadExtraOutSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 58) then messageChunkLength := 58;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 58 < messageLength) do begin
+        NormalReadExtraOutSuffix2LowLevel(messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraOutFullLowLevel(out extra1: byte; out messageLength: word; out extra2: byte; out messageChunkOffset: word; out extra3: byte; out messageChunkData: TArray0To55OfChar; out extra4: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_NORMAL_READ_EXTRA_OUT_FULL_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  extra1 := LEConvertUInt8From(8, response);
+  messageLength := LEConvertUInt16From(9, response);
+  extra2 := LEConvertUInt8From(11, response);
+  messageChunkOffset := LEConvertUInt16From(12, response);
+  extra3 := LEConvertUInt8From(14, response);
+  for i := 0 to 55 do messageChunkData[i] := LEConvertCharFrom(15 + (i * 1), response);
+  extra4 := LEConvertUInt8From(71, response);
+end;
+
+procedure TBrickletStreamTest.NormalReadExtraOutFull(out extra1: byte; out extra2: byte; out extra3: byte; out message: TArrayOfChar; out extra4: byte);
+var
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To55OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  streamMutex.Acquire;
+  try
+    messageLength := 0;
+    NormalReadExtraOutFullLowLevel(extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4);
+    SetLength(message, messageLength);
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 56) then messageChunkLength := 56;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        NormalReadExtraOutFullLowLevel(extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 56) then messageChunkLength := 56;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 56 < messageLength) do begin
+        NormalReadExtraOutFullLowLevel(extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedReadLowLevel(out messageChunkOffset: word; out messageChunkData: TArray0To61OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  messageChunkOffset := LEConvertUInt16From(8, response);
+  for i := 0 to 61 do messageChunkData[i] := LEConvertCharFrom(10 + (i * 1), response);
+end;
+
+function TBrickletStreamTest.FixedRead: TArrayOfChar;
+var
+  message: TArrayOfChar;
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To61OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(message, 0);
+  streamMutex.Acquire;
+  try
+    messageLength := 1000;
+    FixedReadLowLevel(messageChunkOffset, messageChunkData);
+    SetLength(message, messageLength);
+
+    if (messageChunkOffset = ((1 shl 16) - 1)) then begin { Maximum chunk offset -> stream has no data }
+      SetLength(message, 0);
+      exit;
+    end;
+
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 62) then messageChunkLength := 62;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        FixedReadLowLevel(messageChunkOffset, messageChunkData);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 62) then messageChunkLength := 62;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 62 < messageLength) do begin
+        FixedReadLowLevel(messageChunkOffset, messageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := message;
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraIn1LowLevel(const extra: byte; out messageChunkOffset: word; out messageChunkData: TArray0To61OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_1_LOW_LEVEL, 9);
+  LEConvertUInt8To(extra, 8, request);
+  response := SendRequest(request, 72);
+  messageChunkOffset := LEConvertUInt16From(8, response);
+  for i := 0 to 61 do messageChunkData[i] := LEConvertCharFrom(10 + (i * 1), response);
+end;
+
+function TBrickletStreamTest.FixedReadExtraIn1(const extra: byte): TArrayOfChar;
+var
+  message: TArrayOfChar;
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To61OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(message, 0);
+  streamMutex.Acquire;
+  try
+    messageLength := 1000;
+    FixedReadExtraIn1LowLevel(extra, messageChunkOffset, messageChunkData);
+    SetLength(message, messageLength);
+
+    if (messageChunkOffset = ((1 shl 16) - 1)) then begin { Maximum chunk offset -> stream has no data }
+      SetLength(message, 0);
+      exit;
+    end;
+
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 62) then messageChunkLength := 62;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        FixedReadExtraIn1LowLevel(extra, messageChunkOffset, messageChunkData);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 62) then messageChunkLength := 62;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 62 < messageLength) do begin
+        FixedReadExtraIn1LowLevel(extra, messageChunkOffset, messageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := message;
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraIn2LowLevel(const extra1: byte; const extra2: byte; out messageChunkOffset: word; out messageChunkData: TArray0To61OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_IN_2_LOW_LEVEL, 10);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt8To(extra2, 9, request);
+  response := SendRequest(request, 72);
+  messageChunkOffset := LEConvertUInt16From(8, response);
+  for i := 0 to 61 do messageChunkData[i] := LEConvertCharFrom(10 + (i * 1), response);
+end;
+
+function TBrickletStreamTest.FixedReadExtraIn2(const extra1: byte; const extra2: byte): TArrayOfChar;
+var
+  message: TArrayOfChar;
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To61OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(message, 0);
+  streamMutex.Acquire;
+  try
+    messageLength := 1000;
+    FixedReadExtraIn2LowLevel(extra1, extra2, messageChunkOffset, messageChunkData);
+    SetLength(message, messageLength);
+
+    if (messageChunkOffset = ((1 shl 16) - 1)) then begin { Maximum chunk offset -> stream has no data }
+      SetLength(message, 0);
+      exit;
+    end;
+
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 62) then messageChunkLength := 62;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        FixedReadExtraIn2LowLevel(extra1, extra2, messageChunkOffset, messageChunkData);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 62) then messageChunkLength := 62;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 62 < messageLength) do begin
+        FixedReadExtraIn2LowLevel(extra1, extra2, messageChunkOffset, messageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := message;
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraOutPrefix1LowLevel(out extra: byte; out messageChunkOffset: word; out messageChunkData: TArray0To60OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  extra := LEConvertUInt8From(8, response);
+  messageChunkOffset := LEConvertUInt16From(9, response);
+  for i := 0 to 60 do messageChunkData[i] := LEConvertCharFrom(11 + (i * 1), response);
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraOutPrefix1(out extra: byte; out message: TArrayOfChar);
+var
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To60OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  streamMutex.Acquire;
+  try
+    messageLength := 1000;
+    FixedReadExtraOutPrefix1LowLevel(extra, messageChunkOffset, messageChunkData);
+    SetLength(message, messageLength);
+
+    if (messageChunkOffset = ((1 shl 16) - 1)) then begin { Maximum chunk offset -> stream has no data }
+      SetLength(message, 0);
+      exit;
+    end;
+
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 61) then messageChunkLength := 61;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        FixedReadExtraOutPrefix1LowLevel(extra, messageChunkOffset, messageChunkData);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 61) then messageChunkLength := 61;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 61 < messageLength) do begin
+        FixedReadExtraOutPrefix1LowLevel(extra, messageChunkOffset, messageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraOutPrefix2LowLevel(out extra1: byte; out extra2: byte; out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  extra1 := LEConvertUInt8From(8, response);
+  extra2 := LEConvertUInt8From(9, response);
+  messageChunkOffset := LEConvertUInt16From(10, response);
+  for i := 0 to 59 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), response);
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraOutPrefix2(out extra1: byte; out extra2: byte; out message: TArrayOfChar);
+var
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To59OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  streamMutex.Acquire;
+  try
+    messageLength := 1000;
+    FixedReadExtraOutPrefix2LowLevel(extra1, extra2, messageChunkOffset, messageChunkData);
+    SetLength(message, messageLength);
+
+    if (messageChunkOffset = ((1 shl 16) - 1)) then begin { Maximum chunk offset -> stream has no data }
+      SetLength(message, 0);
+      exit;
+    end;
+
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 60) then messageChunkLength := 60;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        FixedReadExtraOutPrefix2LowLevel(extra1, extra2, messageChunkOffset, messageChunkData);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 60 < messageLength) do begin
+        FixedReadExtraOutPrefix2LowLevel(extra1, extra2, messageChunkOffset, messageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraOutSuffix1LowLevel(out messageChunkOffset: word; out messageChunkData: TArray0To60OfChar; out extra: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  messageChunkOffset := LEConvertUInt16From(8, response);
+  for i := 0 to 60 do messageChunkData[i] := LEConvertCharFrom(10 + (i * 1), response);
+  extra := LEConvertUInt8From(71, response);
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraOutSuffix1(out message: TArrayOfChar; out extra: byte);
+var
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To60OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  streamMutex.Acquire;
+  try
+    messageLength := 1000;
+    FixedReadExtraOutSuffix1LowLevel(messageChunkOffset, messageChunkData, extra);
+    SetLength(message, messageLength);
+
+    if (messageChunkOffset = ((1 shl 16) - 1)) then begin { Maximum chunk offset -> stream has no data }
+      SetLength(message, 0);
+      exit;
+    end;
+
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 61) then messageChunkLength := 61;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        FixedReadExtraOutSuffix1LowLevel(messageChunkOffset, messageChunkData, extra);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 61) then messageChunkLength := 61;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 61 < messageLength) do begin
+        FixedReadExtraOutSuffix1LowLevel(messageChunkOffset, messageChunkData, extra);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraOutSuffix2LowLevel(out messageChunkOffset: word; out messageChunkData: TArray0To59OfChar; out extra1: byte; out extra2: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  messageChunkOffset := LEConvertUInt16From(8, response);
+  for i := 0 to 59 do messageChunkData[i] := LEConvertCharFrom(10 + (i * 1), response);
+  extra1 := LEConvertUInt8From(70, response);
+  extra2 := LEConvertUInt8From(71, response);
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraOutSuffix2(out message: TArrayOfChar; out extra1: byte; out extra2: byte);
+var
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To59OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  streamMutex.Acquire;
+  try
+    messageLength := 1000;
+    FixedReadExtraOutSuffix2LowLevel(messageChunkOffset, messageChunkData, extra1, extra2);
+    SetLength(message, messageLength);
+
+    if (messageChunkOffset = ((1 shl 16) - 1)) then begin { Maximum chunk offset -> stream has no data }
+      SetLength(message, 0);
+      exit;
+    end;
+
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 60) then messageChunkLength := 60;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        FixedReadExtraOutSuffix2LowLevel(messageChunkOffset, messageChunkData, extra1, extra2);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 60) then messageChunkLength := 60;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 60 < messageLength) do begin
+        FixedReadExtraOutSuffix2LowLevel(messageChunkOffset, messageChunkData, extra1, extra2);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraOutFullLowLevel(out extra1: byte; out messageChunkOffset: word; out extra2: byte; out messageChunkData: TArray0To58OfChar; out extra3: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_FIXED_READ_EXTRA_OUT_FULL_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  extra1 := LEConvertUInt8From(8, response);
+  messageChunkOffset := LEConvertUInt16From(9, response);
+  extra2 := LEConvertUInt8From(11, response);
+  for i := 0 to 58 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), response);
+  extra3 := LEConvertUInt8From(71, response);
+end;
+
+procedure TBrickletStreamTest.FixedReadExtraOutFull(out extra1: byte; out extra2: byte; out message: TArrayOfChar; out extra3: byte);
+var
+  messageCurrentLength: word;
+  messageLength: word;
+  messageChunkOffset: word;
+  messageChunkData: TArray0To58OfChar;
+  messageOutOfSync: boolean;
+  messageChunkLength: word;
+begin
+  streamMutex.Acquire;
+  try
+    messageLength := 1000;
+    FixedReadExtraOutFullLowLevel(extra1, messageChunkOffset, extra2, messageChunkData, extra3);
+    SetLength(message, messageLength);
+
+    if (messageChunkOffset = ((1 shl 16) - 1)) then begin { Maximum chunk offset -> stream has no data }
+      SetLength(message, 0);
+      exit;
+    end;
+
+    messageOutOfSync := (messageChunkOffset <> 0);
+
+    if ((not messageOutOfSync) and (messageLength > 0)) then begin
+      messageChunkLength := messageLength - messageChunkOffset;
+      if (messageChunkLength > 59) then messageChunkLength := 59;
+      Move(messageChunkData, message[0], SizeOf(char) * messageChunkLength);
+      messageCurrentLength := messageChunkLength;
+
+      while ((not messageOutOfSync) and (messageCurrentLength < messageLength)) do begin
+        FixedReadExtraOutFullLowLevel(extra1, messageChunkOffset, extra2, messageChunkData, extra3);
+        messageOutOfSync := messageChunkOffset <> messageCurrentLength;
+        messageChunkLength := messageLength - messageChunkOffset;
+        if (messageChunkLength > 59) then messageChunkLength := 59;
+        Move(messageChunkData, message[messageCurrentLength], SizeOf(char) * messageChunkLength);
+        Inc(messageCurrentLength, messageChunkLength);
+      end;
+    end;
+
+    if (messageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (messageChunkOffset + 59 < messageLength) do begin
+        FixedReadExtraOutFullLowLevel(extra1, messageChunkOffset, extra2, messageChunkData, extra3);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Message stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+end;
+
+procedure TBrickletStreamTest.SingleReadLowLevel(out messageLength: byte; out messageData: TArray0To62OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  messageLength := LEConvertUInt8From(8, response);
+  for i := 0 to 62 do messageData[i] := LEConvertCharFrom(9 + (i * 1), response);
+end;
+
+function TBrickletStreamTest.SingleRead: TArrayOfChar;
+var
+  message: TArrayOfChar;
+  messageLength: byte;
+  messageData: TArray0To62OfChar;
+begin
+  SetLength(result, 0);
+  SetLength(message, 0);
+  SingleReadLowLevel(messageLength, messageData);
+  SetLength(message, messageLength);
+  Move(messageData, message[0], SizeOf(char) * messageLength);
+  result := message;
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraIn1LowLevel(const extra: byte; out messageLength: byte; out messageData: TArray0To61OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_1_LOW_LEVEL, 9);
+  LEConvertUInt8To(extra, 8, request);
+  response := SendRequest(request, 71);
+  messageLength := LEConvertUInt8From(8, response);
+  for i := 0 to 61 do messageData[i] := LEConvertCharFrom(9 + (i * 1), response);
+end;
+
+function TBrickletStreamTest.SingleReadExtraIn1(const extra: byte): TArrayOfChar;
+var
+  message: TArrayOfChar;
+  messageLength: byte;
+  messageData: TArray0To61OfChar;
+begin
+  SetLength(result, 0);
+  SetLength(message, 0);
+  SingleReadExtraIn1LowLevel(extra, messageLength, messageData);
+  SetLength(message, messageLength);
+  Move(messageData, message[0], SizeOf(char) * messageLength);
+  result := message;
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraIn2LowLevel(const extra1: byte; const extra2: byte; out messageLength: byte; out messageData: TArray0To61OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_IN_2_LOW_LEVEL, 10);
+  LEConvertUInt8To(extra1, 8, request);
+  LEConvertUInt8To(extra2, 9, request);
+  response := SendRequest(request, 71);
+  messageLength := LEConvertUInt8From(8, response);
+  for i := 0 to 61 do messageData[i] := LEConvertCharFrom(9 + (i * 1), response);
+end;
+
+function TBrickletStreamTest.SingleReadExtraIn2(const extra1: byte; const extra2: byte): TArrayOfChar;
+var
+  message: TArrayOfChar;
+  messageLength: byte;
+  messageData: TArray0To61OfChar;
+begin
+  SetLength(result, 0);
+  SetLength(message, 0);
+  SingleReadExtraIn2LowLevel(extra1, extra2, messageLength, messageData);
+  SetLength(message, messageLength);
+  Move(messageData, message[0], SizeOf(char) * messageLength);
+  result := message;
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraOutPrefix1LowLevel(out extra: byte; out messageLength: byte; out messageData: TArray0To61OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_1_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  extra := LEConvertUInt8From(8, response);
+  messageLength := LEConvertUInt8From(9, response);
+  for i := 0 to 61 do messageData[i] := LEConvertCharFrom(10 + (i * 1), response);
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraOutPrefix1(out extra: byte; out message: TArrayOfChar);
+var
+  messageLength: byte;
+  messageData: TArray0To61OfChar;
+begin
+  SingleReadExtraOutPrefix1LowLevel(extra, messageLength, messageData);
+  SetLength(message, messageLength);
+  Move(messageData, message[0], SizeOf(char) * messageLength);
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraOutPrefix2LowLevel(out extra1: byte; out extra2: byte; out messageLength: byte; out messageData: TArray0To60OfChar);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_PREFIX_2_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  extra1 := LEConvertUInt8From(8, response);
+  extra2 := LEConvertUInt8From(9, response);
+  messageLength := LEConvertUInt8From(10, response);
+  for i := 0 to 60 do messageData[i] := LEConvertCharFrom(11 + (i * 1), response);
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraOutPrefix2(out extra1: byte; out extra2: byte; out message: TArrayOfChar);
+var
+  messageLength: byte;
+  messageData: TArray0To60OfChar;
+begin
+  SingleReadExtraOutPrefix2LowLevel(extra1, extra2, messageLength, messageData);
+  SetLength(message, messageLength);
+  Move(messageData, message[0], SizeOf(char) * messageLength);
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraOutSuffix1LowLevel(out messageLength: byte; out messageData: TArray0To61OfChar; out extra: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_1_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  messageLength := LEConvertUInt8From(8, response);
+  for i := 0 to 61 do messageData[i] := LEConvertCharFrom(9 + (i * 1), response);
+  extra := LEConvertUInt8From(71, response);
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraOutSuffix1(out message: TArrayOfChar; out extra: byte);
+var
+  messageLength: byte;
+  messageData: TArray0To61OfChar;
+begin
+  SingleReadExtraOutSuffix1LowLevel(messageLength, messageData, extra);
+  SetLength(message, messageLength);
+  Move(messageData, message[0], SizeOf(char) * messageLength);
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraOutSuffix2LowLevel(out messageLength: byte; out messageData: TArray0To60OfChar; out extra1: byte; out extra2: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_SUFFIX_2_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  messageLength := LEConvertUInt8From(8, response);
+  for i := 0 to 60 do messageData[i] := LEConvertCharFrom(9 + (i * 1), response);
+  extra1 := LEConvertUInt8From(70, response);
+  extra2 := LEConvertUInt8From(71, response);
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraOutSuffix2(out message: TArrayOfChar; out extra1: byte; out extra2: byte);
+var
+  messageLength: byte;
+  messageData: TArray0To60OfChar;
+begin
+  SingleReadExtraOutSuffix2LowLevel(messageLength, messageData, extra1, extra2);
+  SetLength(message, messageLength);
+  Move(messageData, message[0], SizeOf(char) * messageLength);
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraOutFullLowLevel(out extra1: byte; out messageLength: byte; out extra2: byte; out messageData: TArray0To59OfChar; out extra3: byte);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_SINGLE_READ_EXTRA_OUT_FULL_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  extra1 := LEConvertUInt8From(8, response);
+  messageLength := LEConvertUInt8From(9, response);
+  extra2 := LEConvertUInt8From(10, response);
+  for i := 0 to 59 do messageData[i] := LEConvertCharFrom(11 + (i * 1), response);
+  extra3 := LEConvertUInt8From(71, response);
+end;
+
+procedure TBrickletStreamTest.SingleReadExtraOutFull(out extra1: byte; out extra2: byte; out message: TArrayOfChar; out extra3: byte);
+var
+  messageLength: byte;
+  messageData: TArray0To59OfChar;
+begin
+  SingleReadExtraOutFullLowLevel(extra1, messageLength, extra2, messageData, extra3);
+  SetLength(message, messageLength);
+  Move(messageData, message[0], SizeOf(char) * messageLength);
+end;
+
+procedure TBrickletStreamTest.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_STREAM_TEST_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperNormalReadLowLevel(const packet: TByteArray);
+var messageLength: word; messageChunkOffset: word; messageChunkData: TArray0To59OfChar; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  messageLength := LEConvertUInt16From(8, packet);
+  messageChunkOffset := LEConvertUInt16From(10, packet);
+  for i := 0 to 59 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), packet);
+
+  messageChunkLength := messageLength - messageChunkOffset;
+  if (messageChunkLength > 60) then begin
+    messageChunkLength := 60;
+  end;
+  if (normalReadHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(normalReadHighLevelCallbackState.data, messageLength);
+      Move(messageChunkData[0], normalReadHighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      normalReadHighLevelCallbackState.length := messageChunkLength;
+
+      if (normalReadHighLevelCallbackState.length >= messageLength) then begin { Stream complete }
+        if (Assigned(normalReadCallback)) then begin
+          normalReadCallback(self, normalReadHighLevelCallbackState.data);
+        end;
+        SetLength(normalReadHighLevelCallbackState.data, 0);
+        normalReadHighLevelCallbackState.data := nil;
+        normalReadHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> normalReadHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(normalReadHighLevelCallbackState.data, 0);
+      normalReadHighLevelCallbackState.data := nil;
+      normalReadHighLevelCallbackState.length := 0;
+      if (Assigned(normalReadCallback)) then begin
+        normalReadCallback(self, normalReadHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], normalReadHighLevelCallbackState.data[normalReadHighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(normalReadHighLevelCallbackState.length, messageChunkLength);
+
+      if normalReadHighLevelCallbackState.length >= messageLength then begin { Stream complete }
+        if (Assigned(normalReadCallback)) then begin
+          normalReadCallback(self, normalReadHighLevelCallbackState.data);
+        end;
+        SetLength(normalReadHighLevelCallbackState.data, 0);
+        normalReadHighLevelCallbackState.data := nil;
+        normalReadHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(normalReadLowLevelCallback)) then begin
+    normalReadLowLevelCallback(self, messageLength, messageChunkOffset, messageChunkData);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperNormalReadExtraPrefix1LowLevel(const packet: TByteArray);
+var extra: byte; messageLength: word; messageChunkOffset: word; messageChunkData: TArray0To58OfChar; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  extra := LEConvertUInt8From(8, packet);
+  messageLength := LEConvertUInt16From(9, packet);
+  messageChunkOffset := LEConvertUInt16From(11, packet);
+  for i := 0 to 58 do messageChunkData[i] := LEConvertCharFrom(13 + (i * 1), packet);
+
+  messageChunkLength := messageLength - messageChunkOffset;
+  if (messageChunkLength > 59) then begin
+    messageChunkLength := 59;
+  end;
+  if (normalReadExtraPrefix1HighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(normalReadExtraPrefix1HighLevelCallbackState.data, messageLength);
+      Move(messageChunkData[0], normalReadExtraPrefix1HighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      normalReadExtraPrefix1HighLevelCallbackState.length := messageChunkLength;
+
+      if (normalReadExtraPrefix1HighLevelCallbackState.length >= messageLength) then begin { Stream complete }
+        if (Assigned(normalReadExtraPrefix1Callback)) then begin
+          normalReadExtraPrefix1Callback(self, extra, normalReadExtraPrefix1HighLevelCallbackState.data);
+        end;
+        SetLength(normalReadExtraPrefix1HighLevelCallbackState.data, 0);
+        normalReadExtraPrefix1HighLevelCallbackState.data := nil;
+        normalReadExtraPrefix1HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> normalReadExtraPrefix1HighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(normalReadExtraPrefix1HighLevelCallbackState.data, 0);
+      normalReadExtraPrefix1HighLevelCallbackState.data := nil;
+      normalReadExtraPrefix1HighLevelCallbackState.length := 0;
+      if (Assigned(normalReadExtraPrefix1Callback)) then begin
+        normalReadExtraPrefix1Callback(self, extra, normalReadExtraPrefix1HighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], normalReadExtraPrefix1HighLevelCallbackState.data[normalReadExtraPrefix1HighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(normalReadExtraPrefix1HighLevelCallbackState.length, messageChunkLength);
+
+      if normalReadExtraPrefix1HighLevelCallbackState.length >= messageLength then begin { Stream complete }
+        if (Assigned(normalReadExtraPrefix1Callback)) then begin
+          normalReadExtraPrefix1Callback(self, extra, normalReadExtraPrefix1HighLevelCallbackState.data);
+        end;
+        SetLength(normalReadExtraPrefix1HighLevelCallbackState.data, 0);
+        normalReadExtraPrefix1HighLevelCallbackState.data := nil;
+        normalReadExtraPrefix1HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(normalReadExtraPrefix1LowLevelCallback)) then begin
+    normalReadExtraPrefix1LowLevelCallback(self, extra, messageLength, messageChunkOffset, messageChunkData);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperNormalReadExtraPrefix2LowLevel(const packet: TByteArray);
+var extra1: byte; extra2: byte; messageLength: word; messageChunkOffset: word; messageChunkData: TArray0To57OfChar; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  extra1 := LEConvertUInt8From(8, packet);
+  extra2 := LEConvertUInt8From(9, packet);
+  messageLength := LEConvertUInt16From(10, packet);
+  messageChunkOffset := LEConvertUInt16From(12, packet);
+  for i := 0 to 57 do messageChunkData[i] := LEConvertCharFrom(14 + (i * 1), packet);
+
+  messageChunkLength := messageLength - messageChunkOffset;
+  if (messageChunkLength > 58) then begin
+    messageChunkLength := 58;
+  end;
+  if (normalReadExtraPrefix2HighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(normalReadExtraPrefix2HighLevelCallbackState.data, messageLength);
+      Move(messageChunkData[0], normalReadExtraPrefix2HighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      normalReadExtraPrefix2HighLevelCallbackState.length := messageChunkLength;
+
+      if (normalReadExtraPrefix2HighLevelCallbackState.length >= messageLength) then begin { Stream complete }
+        if (Assigned(normalReadExtraPrefix2Callback)) then begin
+          normalReadExtraPrefix2Callback(self, extra1, extra2, normalReadExtraPrefix2HighLevelCallbackState.data);
+        end;
+        SetLength(normalReadExtraPrefix2HighLevelCallbackState.data, 0);
+        normalReadExtraPrefix2HighLevelCallbackState.data := nil;
+        normalReadExtraPrefix2HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> normalReadExtraPrefix2HighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(normalReadExtraPrefix2HighLevelCallbackState.data, 0);
+      normalReadExtraPrefix2HighLevelCallbackState.data := nil;
+      normalReadExtraPrefix2HighLevelCallbackState.length := 0;
+      if (Assigned(normalReadExtraPrefix2Callback)) then begin
+        normalReadExtraPrefix2Callback(self, extra1, extra2, normalReadExtraPrefix2HighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], normalReadExtraPrefix2HighLevelCallbackState.data[normalReadExtraPrefix2HighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(normalReadExtraPrefix2HighLevelCallbackState.length, messageChunkLength);
+
+      if normalReadExtraPrefix2HighLevelCallbackState.length >= messageLength then begin { Stream complete }
+        if (Assigned(normalReadExtraPrefix2Callback)) then begin
+          normalReadExtraPrefix2Callback(self, extra1, extra2, normalReadExtraPrefix2HighLevelCallbackState.data);
+        end;
+        SetLength(normalReadExtraPrefix2HighLevelCallbackState.data, 0);
+        normalReadExtraPrefix2HighLevelCallbackState.data := nil;
+        normalReadExtraPrefix2HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(normalReadExtraPrefix2LowLevelCallback)) then begin
+    normalReadExtraPrefix2LowLevelCallback(self, extra1, extra2, messageLength, messageChunkOffset, messageChunkData);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperNormalReadExtraSuffix1LowLevel(const packet: TByteArray);
+var messageLength: word; messageChunkOffset: word; messageChunkData: TArray0To58OfChar; extra: byte; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  messageLength := LEConvertUInt16From(8, packet);
+  messageChunkOffset := LEConvertUInt16From(10, packet);
+  for i := 0 to 58 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), packet);
+  extra := LEConvertUInt8From(71, packet);
+
+  messageChunkLength := messageLength - messageChunkOffset;
+  if (messageChunkLength > 59) then begin
+    messageChunkLength := 59;
+  end;
+  if (normalReadExtraSuffix1HighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(normalReadExtraSuffix1HighLevelCallbackState.data, messageLength);
+      Move(messageChunkData[0], normalReadExtraSuffix1HighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      normalReadExtraSuffix1HighLevelCallbackState.length := messageChunkLength;
+
+      if (normalReadExtraSuffix1HighLevelCallbackState.length >= messageLength) then begin { Stream complete }
+        if (Assigned(normalReadExtraSuffix1Callback)) then begin
+          normalReadExtraSuffix1Callback(self, normalReadExtraSuffix1HighLevelCallbackState.data, extra);
+        end;
+        SetLength(normalReadExtraSuffix1HighLevelCallbackState.data, 0);
+        normalReadExtraSuffix1HighLevelCallbackState.data := nil;
+        normalReadExtraSuffix1HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> normalReadExtraSuffix1HighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(normalReadExtraSuffix1HighLevelCallbackState.data, 0);
+      normalReadExtraSuffix1HighLevelCallbackState.data := nil;
+      normalReadExtraSuffix1HighLevelCallbackState.length := 0;
+      if (Assigned(normalReadExtraSuffix1Callback)) then begin
+        normalReadExtraSuffix1Callback(self, normalReadExtraSuffix1HighLevelCallbackState.data, extra);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], normalReadExtraSuffix1HighLevelCallbackState.data[normalReadExtraSuffix1HighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(normalReadExtraSuffix1HighLevelCallbackState.length, messageChunkLength);
+
+      if normalReadExtraSuffix1HighLevelCallbackState.length >= messageLength then begin { Stream complete }
+        if (Assigned(normalReadExtraSuffix1Callback)) then begin
+          normalReadExtraSuffix1Callback(self, normalReadExtraSuffix1HighLevelCallbackState.data, extra);
+        end;
+        SetLength(normalReadExtraSuffix1HighLevelCallbackState.data, 0);
+        normalReadExtraSuffix1HighLevelCallbackState.data := nil;
+        normalReadExtraSuffix1HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(normalReadExtraSuffix1LowLevelCallback)) then begin
+    normalReadExtraSuffix1LowLevelCallback(self, messageLength, messageChunkOffset, messageChunkData, extra);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperNormalReadExtraSuffix2LowLevel(const packet: TByteArray);
+var messageLength: word; messageChunkOffset: word; messageChunkData: TArray0To57OfChar; extra1: byte; extra2: byte; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  messageLength := LEConvertUInt16From(8, packet);
+  messageChunkOffset := LEConvertUInt16From(10, packet);
+  for i := 0 to 57 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), packet);
+  extra1 := LEConvertUInt8From(70, packet);
+  extra2 := LEConvertUInt8From(71, packet);
+
+  messageChunkLength := messageLength - messageChunkOffset;
+  if (messageChunkLength > 58) then begin
+    messageChunkLength := 58;
+  end;
+  if (normalReadExtraSuffix2HighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(normalReadExtraSuffix2HighLevelCallbackState.data, messageLength);
+      Move(messageChunkData[0], normalReadExtraSuffix2HighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      normalReadExtraSuffix2HighLevelCallbackState.length := messageChunkLength;
+
+      if (normalReadExtraSuffix2HighLevelCallbackState.length >= messageLength) then begin { Stream complete }
+        if (Assigned(normalReadExtraSuffix2Callback)) then begin
+          normalReadExtraSuffix2Callback(self, normalReadExtraSuffix2HighLevelCallbackState.data, extra1, extra2);
+        end;
+        SetLength(normalReadExtraSuffix2HighLevelCallbackState.data, 0);
+        normalReadExtraSuffix2HighLevelCallbackState.data := nil;
+        normalReadExtraSuffix2HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> normalReadExtraSuffix2HighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(normalReadExtraSuffix2HighLevelCallbackState.data, 0);
+      normalReadExtraSuffix2HighLevelCallbackState.data := nil;
+      normalReadExtraSuffix2HighLevelCallbackState.length := 0;
+      if (Assigned(normalReadExtraSuffix2Callback)) then begin
+        normalReadExtraSuffix2Callback(self, normalReadExtraSuffix2HighLevelCallbackState.data, extra1, extra2);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], normalReadExtraSuffix2HighLevelCallbackState.data[normalReadExtraSuffix2HighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(normalReadExtraSuffix2HighLevelCallbackState.length, messageChunkLength);
+
+      if normalReadExtraSuffix2HighLevelCallbackState.length >= messageLength then begin { Stream complete }
+        if (Assigned(normalReadExtraSuffix2Callback)) then begin
+          normalReadExtraSuffix2Callback(self, normalReadExtraSuffix2HighLevelCallbackState.data, extra1, extra2);
+        end;
+        SetLength(normalReadExtraSuffix2HighLevelCallbackState.data, 0);
+        normalReadExtraSuffix2HighLevelCallbackState.data := nil;
+        normalReadExtraSuffix2HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(normalReadExtraSuffix2LowLevelCallback)) then begin
+    normalReadExtraSuffix2LowLevelCallback(self, messageLength, messageChunkOffset, messageChunkData, extra1, extra2);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperNormalReadExtraFullLowLevel(const packet: TByteArray);
+var extra1: byte; messageLength: word; extra2: byte; messageChunkOffset: word; extra3: byte; messageChunkData: TArray0To55OfChar; extra4: byte; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  extra1 := LEConvertUInt8From(8, packet);
+  messageLength := LEConvertUInt16From(9, packet);
+  extra2 := LEConvertUInt8From(11, packet);
+  messageChunkOffset := LEConvertUInt16From(12, packet);
+  extra3 := LEConvertUInt8From(14, packet);
+  for i := 0 to 55 do messageChunkData[i] := LEConvertCharFrom(15 + (i * 1), packet);
+  extra4 := LEConvertUInt8From(71, packet);
+
+  messageChunkLength := messageLength - messageChunkOffset;
+  if (messageChunkLength > 56) then begin
+    messageChunkLength := 56;
+  end;
+  if (normalReadExtraFullHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(normalReadExtraFullHighLevelCallbackState.data, messageLength);
+      Move(messageChunkData[0], normalReadExtraFullHighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      normalReadExtraFullHighLevelCallbackState.length := messageChunkLength;
+
+      if (normalReadExtraFullHighLevelCallbackState.length >= messageLength) then begin { Stream complete }
+        if (Assigned(normalReadExtraFullCallback)) then begin
+          normalReadExtraFullCallback(self, extra1, extra2, extra3, normalReadExtraFullHighLevelCallbackState.data, extra4);
+        end;
+        SetLength(normalReadExtraFullHighLevelCallbackState.data, 0);
+        normalReadExtraFullHighLevelCallbackState.data := nil;
+        normalReadExtraFullHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> normalReadExtraFullHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(normalReadExtraFullHighLevelCallbackState.data, 0);
+      normalReadExtraFullHighLevelCallbackState.data := nil;
+      normalReadExtraFullHighLevelCallbackState.length := 0;
+      if (Assigned(normalReadExtraFullCallback)) then begin
+        normalReadExtraFullCallback(self, extra1, extra2, extra3, normalReadExtraFullHighLevelCallbackState.data, extra4);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], normalReadExtraFullHighLevelCallbackState.data[normalReadExtraFullHighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(normalReadExtraFullHighLevelCallbackState.length, messageChunkLength);
+
+      if normalReadExtraFullHighLevelCallbackState.length >= messageLength then begin { Stream complete }
+        if (Assigned(normalReadExtraFullCallback)) then begin
+          normalReadExtraFullCallback(self, extra1, extra2, extra3, normalReadExtraFullHighLevelCallbackState.data, extra4);
+        end;
+        SetLength(normalReadExtraFullHighLevelCallbackState.data, 0);
+        normalReadExtraFullHighLevelCallbackState.data := nil;
+        normalReadExtraFullHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(normalReadExtraFullLowLevelCallback)) then begin
+    normalReadExtraFullLowLevelCallback(self, extra1, messageLength, extra2, messageChunkOffset, extra3, messageChunkData, extra4);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperFixedReadLowLevel(const packet: TByteArray);
+var messageChunkOffset: word; messageChunkData: TArray0To61OfChar; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  messageChunkOffset := LEConvertUInt16From(8, packet);
+  for i := 0 to 61 do messageChunkData[i] := LEConvertCharFrom(10 + (i * 1), packet);
+
+  messageChunkLength := 1000 - messageChunkOffset;
+  if (messageChunkLength > 62) then begin
+    messageChunkLength := 62;
+  end;
+  if (fixedReadHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(fixedReadHighLevelCallbackState.data, 1000);
+      Move(messageChunkData[0], fixedReadHighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      fixedReadHighLevelCallbackState.length := messageChunkLength;
+
+      if (fixedReadHighLevelCallbackState.length >= 1000) then begin { Stream complete }
+        if (Assigned(fixedReadCallback)) then begin
+          fixedReadCallback(self, fixedReadHighLevelCallbackState.data);
+        end;
+        SetLength(fixedReadHighLevelCallbackState.data, 0);
+        fixedReadHighLevelCallbackState.data := nil;
+        fixedReadHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> fixedReadHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(fixedReadHighLevelCallbackState.data, 0);
+      fixedReadHighLevelCallbackState.data := nil;
+      fixedReadHighLevelCallbackState.length := 0;
+      if (Assigned(fixedReadCallback)) then begin
+        fixedReadCallback(self, fixedReadHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], fixedReadHighLevelCallbackState.data[fixedReadHighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(fixedReadHighLevelCallbackState.length, messageChunkLength);
+
+      if fixedReadHighLevelCallbackState.length >= 1000 then begin { Stream complete }
+        if (Assigned(fixedReadCallback)) then begin
+          fixedReadCallback(self, fixedReadHighLevelCallbackState.data);
+        end;
+        SetLength(fixedReadHighLevelCallbackState.data, 0);
+        fixedReadHighLevelCallbackState.data := nil;
+        fixedReadHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(fixedReadLowLevelCallback)) then begin
+    fixedReadLowLevelCallback(self, messageChunkOffset, messageChunkData);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperFixedReadExtraPrefix1LowLevel(const packet: TByteArray);
+var extra: byte; messageChunkOffset: word; messageChunkData: TArray0To60OfChar; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  extra := LEConvertUInt8From(8, packet);
+  messageChunkOffset := LEConvertUInt16From(9, packet);
+  for i := 0 to 60 do messageChunkData[i] := LEConvertCharFrom(11 + (i * 1), packet);
+
+  messageChunkLength := 1000 - messageChunkOffset;
+  if (messageChunkLength > 61) then begin
+    messageChunkLength := 61;
+  end;
+  if (fixedReadExtraPrefix1HighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(fixedReadExtraPrefix1HighLevelCallbackState.data, 1000);
+      Move(messageChunkData[0], fixedReadExtraPrefix1HighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      fixedReadExtraPrefix1HighLevelCallbackState.length := messageChunkLength;
+
+      if (fixedReadExtraPrefix1HighLevelCallbackState.length >= 1000) then begin { Stream complete }
+        if (Assigned(fixedReadExtraPrefix1Callback)) then begin
+          fixedReadExtraPrefix1Callback(self, extra, fixedReadExtraPrefix1HighLevelCallbackState.data);
+        end;
+        SetLength(fixedReadExtraPrefix1HighLevelCallbackState.data, 0);
+        fixedReadExtraPrefix1HighLevelCallbackState.data := nil;
+        fixedReadExtraPrefix1HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> fixedReadExtraPrefix1HighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(fixedReadExtraPrefix1HighLevelCallbackState.data, 0);
+      fixedReadExtraPrefix1HighLevelCallbackState.data := nil;
+      fixedReadExtraPrefix1HighLevelCallbackState.length := 0;
+      if (Assigned(fixedReadExtraPrefix1Callback)) then begin
+        fixedReadExtraPrefix1Callback(self, extra, fixedReadExtraPrefix1HighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], fixedReadExtraPrefix1HighLevelCallbackState.data[fixedReadExtraPrefix1HighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(fixedReadExtraPrefix1HighLevelCallbackState.length, messageChunkLength);
+
+      if fixedReadExtraPrefix1HighLevelCallbackState.length >= 1000 then begin { Stream complete }
+        if (Assigned(fixedReadExtraPrefix1Callback)) then begin
+          fixedReadExtraPrefix1Callback(self, extra, fixedReadExtraPrefix1HighLevelCallbackState.data);
+        end;
+        SetLength(fixedReadExtraPrefix1HighLevelCallbackState.data, 0);
+        fixedReadExtraPrefix1HighLevelCallbackState.data := nil;
+        fixedReadExtraPrefix1HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(fixedReadExtraPrefix1LowLevelCallback)) then begin
+    fixedReadExtraPrefix1LowLevelCallback(self, extra, messageChunkOffset, messageChunkData);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperFixedReadExtraPrefix2LowLevel(const packet: TByteArray);
+var extra1: byte; extra2: byte; messageChunkOffset: word; messageChunkData: TArray0To59OfChar; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  extra1 := LEConvertUInt8From(8, packet);
+  extra2 := LEConvertUInt8From(9, packet);
+  messageChunkOffset := LEConvertUInt16From(10, packet);
+  for i := 0 to 59 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), packet);
+
+  messageChunkLength := 1000 - messageChunkOffset;
+  if (messageChunkLength > 60) then begin
+    messageChunkLength := 60;
+  end;
+  if (fixedReadExtraPrefix2HighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(fixedReadExtraPrefix2HighLevelCallbackState.data, 1000);
+      Move(messageChunkData[0], fixedReadExtraPrefix2HighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      fixedReadExtraPrefix2HighLevelCallbackState.length := messageChunkLength;
+
+      if (fixedReadExtraPrefix2HighLevelCallbackState.length >= 1000) then begin { Stream complete }
+        if (Assigned(fixedReadExtraPrefix2Callback)) then begin
+          fixedReadExtraPrefix2Callback(self, extra1, extra2, fixedReadExtraPrefix2HighLevelCallbackState.data);
+        end;
+        SetLength(fixedReadExtraPrefix2HighLevelCallbackState.data, 0);
+        fixedReadExtraPrefix2HighLevelCallbackState.data := nil;
+        fixedReadExtraPrefix2HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> fixedReadExtraPrefix2HighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(fixedReadExtraPrefix2HighLevelCallbackState.data, 0);
+      fixedReadExtraPrefix2HighLevelCallbackState.data := nil;
+      fixedReadExtraPrefix2HighLevelCallbackState.length := 0;
+      if (Assigned(fixedReadExtraPrefix2Callback)) then begin
+        fixedReadExtraPrefix2Callback(self, extra1, extra2, fixedReadExtraPrefix2HighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], fixedReadExtraPrefix2HighLevelCallbackState.data[fixedReadExtraPrefix2HighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(fixedReadExtraPrefix2HighLevelCallbackState.length, messageChunkLength);
+
+      if fixedReadExtraPrefix2HighLevelCallbackState.length >= 1000 then begin { Stream complete }
+        if (Assigned(fixedReadExtraPrefix2Callback)) then begin
+          fixedReadExtraPrefix2Callback(self, extra1, extra2, fixedReadExtraPrefix2HighLevelCallbackState.data);
+        end;
+        SetLength(fixedReadExtraPrefix2HighLevelCallbackState.data, 0);
+        fixedReadExtraPrefix2HighLevelCallbackState.data := nil;
+        fixedReadExtraPrefix2HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(fixedReadExtraPrefix2LowLevelCallback)) then begin
+    fixedReadExtraPrefix2LowLevelCallback(self, extra1, extra2, messageChunkOffset, messageChunkData);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperFixedReadExtraSuffix1LowLevel(const packet: TByteArray);
+var messageChunkOffset: word; messageChunkData: TArray0To60OfChar; extra: byte; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  messageChunkOffset := LEConvertUInt16From(8, packet);
+  for i := 0 to 60 do messageChunkData[i] := LEConvertCharFrom(10 + (i * 1), packet);
+  extra := LEConvertUInt8From(71, packet);
+
+  messageChunkLength := 1000 - messageChunkOffset;
+  if (messageChunkLength > 61) then begin
+    messageChunkLength := 61;
+  end;
+  if (fixedReadExtraSuffix1HighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(fixedReadExtraSuffix1HighLevelCallbackState.data, 1000);
+      Move(messageChunkData[0], fixedReadExtraSuffix1HighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      fixedReadExtraSuffix1HighLevelCallbackState.length := messageChunkLength;
+
+      if (fixedReadExtraSuffix1HighLevelCallbackState.length >= 1000) then begin { Stream complete }
+        if (Assigned(fixedReadExtraSuffix1Callback)) then begin
+          fixedReadExtraSuffix1Callback(self, fixedReadExtraSuffix1HighLevelCallbackState.data, extra);
+        end;
+        SetLength(fixedReadExtraSuffix1HighLevelCallbackState.data, 0);
+        fixedReadExtraSuffix1HighLevelCallbackState.data := nil;
+        fixedReadExtraSuffix1HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> fixedReadExtraSuffix1HighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(fixedReadExtraSuffix1HighLevelCallbackState.data, 0);
+      fixedReadExtraSuffix1HighLevelCallbackState.data := nil;
+      fixedReadExtraSuffix1HighLevelCallbackState.length := 0;
+      if (Assigned(fixedReadExtraSuffix1Callback)) then begin
+        fixedReadExtraSuffix1Callback(self, fixedReadExtraSuffix1HighLevelCallbackState.data, extra);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], fixedReadExtraSuffix1HighLevelCallbackState.data[fixedReadExtraSuffix1HighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(fixedReadExtraSuffix1HighLevelCallbackState.length, messageChunkLength);
+
+      if fixedReadExtraSuffix1HighLevelCallbackState.length >= 1000 then begin { Stream complete }
+        if (Assigned(fixedReadExtraSuffix1Callback)) then begin
+          fixedReadExtraSuffix1Callback(self, fixedReadExtraSuffix1HighLevelCallbackState.data, extra);
+        end;
+        SetLength(fixedReadExtraSuffix1HighLevelCallbackState.data, 0);
+        fixedReadExtraSuffix1HighLevelCallbackState.data := nil;
+        fixedReadExtraSuffix1HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(fixedReadExtraSuffix1LowLevelCallback)) then begin
+    fixedReadExtraSuffix1LowLevelCallback(self, messageChunkOffset, messageChunkData, extra);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperFixedReadExtraSuffix2LowLevel(const packet: TByteArray);
+var messageChunkOffset: word; messageChunkData: TArray0To59OfChar; extra1: byte; extra2: byte; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  messageChunkOffset := LEConvertUInt16From(8, packet);
+  for i := 0 to 59 do messageChunkData[i] := LEConvertCharFrom(10 + (i * 1), packet);
+  extra1 := LEConvertUInt8From(70, packet);
+  extra2 := LEConvertUInt8From(71, packet);
+
+  messageChunkLength := 1000 - messageChunkOffset;
+  if (messageChunkLength > 60) then begin
+    messageChunkLength := 60;
+  end;
+  if (fixedReadExtraSuffix2HighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(fixedReadExtraSuffix2HighLevelCallbackState.data, 1000);
+      Move(messageChunkData[0], fixedReadExtraSuffix2HighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      fixedReadExtraSuffix2HighLevelCallbackState.length := messageChunkLength;
+
+      if (fixedReadExtraSuffix2HighLevelCallbackState.length >= 1000) then begin { Stream complete }
+        if (Assigned(fixedReadExtraSuffix2Callback)) then begin
+          fixedReadExtraSuffix2Callback(self, fixedReadExtraSuffix2HighLevelCallbackState.data, extra1, extra2);
+        end;
+        SetLength(fixedReadExtraSuffix2HighLevelCallbackState.data, 0);
+        fixedReadExtraSuffix2HighLevelCallbackState.data := nil;
+        fixedReadExtraSuffix2HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> fixedReadExtraSuffix2HighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(fixedReadExtraSuffix2HighLevelCallbackState.data, 0);
+      fixedReadExtraSuffix2HighLevelCallbackState.data := nil;
+      fixedReadExtraSuffix2HighLevelCallbackState.length := 0;
+      if (Assigned(fixedReadExtraSuffix2Callback)) then begin
+        fixedReadExtraSuffix2Callback(self, fixedReadExtraSuffix2HighLevelCallbackState.data, extra1, extra2);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], fixedReadExtraSuffix2HighLevelCallbackState.data[fixedReadExtraSuffix2HighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(fixedReadExtraSuffix2HighLevelCallbackState.length, messageChunkLength);
+
+      if fixedReadExtraSuffix2HighLevelCallbackState.length >= 1000 then begin { Stream complete }
+        if (Assigned(fixedReadExtraSuffix2Callback)) then begin
+          fixedReadExtraSuffix2Callback(self, fixedReadExtraSuffix2HighLevelCallbackState.data, extra1, extra2);
+        end;
+        SetLength(fixedReadExtraSuffix2HighLevelCallbackState.data, 0);
+        fixedReadExtraSuffix2HighLevelCallbackState.data := nil;
+        fixedReadExtraSuffix2HighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(fixedReadExtraSuffix2LowLevelCallback)) then begin
+    fixedReadExtraSuffix2LowLevelCallback(self, messageChunkOffset, messageChunkData, extra1, extra2);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperFixedReadExtraFullLowLevel(const packet: TByteArray);
+var extra1: byte; messageChunkOffset: word; extra2: byte; messageChunkData: TArray0To58OfChar; extra3: byte; messageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  extra1 := LEConvertUInt8From(8, packet);
+  messageChunkOffset := LEConvertUInt16From(9, packet);
+  extra2 := LEConvertUInt8From(11, packet);
+  for i := 0 to 58 do messageChunkData[i] := LEConvertCharFrom(12 + (i * 1), packet);
+  extra3 := LEConvertUInt8From(71, packet);
+
+  messageChunkLength := 1000 - messageChunkOffset;
+  if (messageChunkLength > 59) then begin
+    messageChunkLength := 59;
+  end;
+  if (fixedReadExtraFullHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (messageChunkOffset = 0) then begin { Stream starts }
+      SetLength(fixedReadExtraFullHighLevelCallbackState.data, 1000);
+      Move(messageChunkData[0], fixedReadExtraFullHighLevelCallbackState.data[0], SizeOf(char) * messageChunkLength);
+      fixedReadExtraFullHighLevelCallbackState.length := messageChunkLength;
+
+      if (fixedReadExtraFullHighLevelCallbackState.length >= 1000) then begin { Stream complete }
+        if (Assigned(fixedReadExtraFullCallback)) then begin
+          fixedReadExtraFullCallback(self, extra1, extra2, fixedReadExtraFullHighLevelCallbackState.data, extra3);
+        end;
+        SetLength(fixedReadExtraFullHighLevelCallbackState.data, 0);
+        fixedReadExtraFullHighLevelCallbackState.data := nil;
+        fixedReadExtraFullHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (messageChunkOffset <> fixedReadExtraFullHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(fixedReadExtraFullHighLevelCallbackState.data, 0);
+      fixedReadExtraFullHighLevelCallbackState.data := nil;
+      fixedReadExtraFullHighLevelCallbackState.length := 0;
+      if (Assigned(fixedReadExtraFullCallback)) then begin
+        fixedReadExtraFullCallback(self, extra1, extra2, fixedReadExtraFullHighLevelCallbackState.data, extra3);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(messageChunkData[0], fixedReadExtraFullHighLevelCallbackState.data[fixedReadExtraFullHighLevelCallbackState.length], SizeOf(char) * messageChunkLength);
+      Inc(fixedReadExtraFullHighLevelCallbackState.length, messageChunkLength);
+
+      if fixedReadExtraFullHighLevelCallbackState.length >= 1000 then begin { Stream complete }
+        if (Assigned(fixedReadExtraFullCallback)) then begin
+          fixedReadExtraFullCallback(self, extra1, extra2, fixedReadExtraFullHighLevelCallbackState.data, extra3);
+        end;
+        SetLength(fixedReadExtraFullHighLevelCallbackState.data, 0);
+        fixedReadExtraFullHighLevelCallbackState.data := nil;
+        fixedReadExtraFullHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(fixedReadExtraFullLowLevelCallback)) then begin
+    fixedReadExtraFullLowLevelCallback(self, extra1, messageChunkOffset, extra2, messageChunkData, extra3);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperSingleReadLowLevel(const packet: TByteArray);
+var messageLength: byte; messageData: TArray0To62OfChar; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  messageLength := LEConvertUInt8From(8, packet);
+  for i := 0 to 62 do messageData[i] := LEConvertCharFrom(9 + (i * 1), packet);
+
+  SetLength(singleReadHighLevelCallbackState.data, messageLength);
+  Move(messageData[0], singleReadHighLevelCallbackState.data[0], SizeOf(char) * messageLength);
+  if (Assigned(singleReadCallback)) then begin
+    singleReadCallback(self, singleReadHighLevelCallbackState.data);
+  end;
+  SetLength(singleReadHighLevelCallbackState.data, 0);
+  singleReadHighLevelCallbackState.data := nil;
+  singleReadHighLevelCallbackState.length := 0;
+  if (Assigned(singleReadLowLevelCallback)) then begin
+    singleReadLowLevelCallback(self, messageLength, messageData);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperSingleReadExtraPrefix1LowLevel(const packet: TByteArray);
+var extra: byte; messageLength: byte; messageData: TArray0To61OfChar; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  extra := LEConvertUInt8From(8, packet);
+  messageLength := LEConvertUInt8From(9, packet);
+  for i := 0 to 61 do messageData[i] := LEConvertCharFrom(10 + (i * 1), packet);
+
+  SetLength(singleReadExtraPrefix1HighLevelCallbackState.data, messageLength);
+  Move(messageData[0], singleReadExtraPrefix1HighLevelCallbackState.data[0], SizeOf(char) * messageLength);
+  if (Assigned(singleReadExtraPrefix1Callback)) then begin
+    singleReadExtraPrefix1Callback(self, extra, singleReadExtraPrefix1HighLevelCallbackState.data);
+  end;
+  SetLength(singleReadExtraPrefix1HighLevelCallbackState.data, 0);
+  singleReadExtraPrefix1HighLevelCallbackState.data := nil;
+  singleReadExtraPrefix1HighLevelCallbackState.length := 0;
+  if (Assigned(singleReadExtraPrefix1LowLevelCallback)) then begin
+    singleReadExtraPrefix1LowLevelCallback(self, extra, messageLength, messageData);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperSingleReadExtraPrefix2LowLevel(const packet: TByteArray);
+var extra1: byte; extra2: byte; messageLength: byte; messageData: TArray0To60OfChar; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  extra1 := LEConvertUInt8From(8, packet);
+  extra2 := LEConvertUInt8From(9, packet);
+  messageLength := LEConvertUInt8From(10, packet);
+  for i := 0 to 60 do messageData[i] := LEConvertCharFrom(11 + (i * 1), packet);
+
+  SetLength(singleReadExtraPrefix2HighLevelCallbackState.data, messageLength);
+  Move(messageData[0], singleReadExtraPrefix2HighLevelCallbackState.data[0], SizeOf(char) * messageLength);
+  if (Assigned(singleReadExtraPrefix2Callback)) then begin
+    singleReadExtraPrefix2Callback(self, extra1, extra2, singleReadExtraPrefix2HighLevelCallbackState.data);
+  end;
+  SetLength(singleReadExtraPrefix2HighLevelCallbackState.data, 0);
+  singleReadExtraPrefix2HighLevelCallbackState.data := nil;
+  singleReadExtraPrefix2HighLevelCallbackState.length := 0;
+  if (Assigned(singleReadExtraPrefix2LowLevelCallback)) then begin
+    singleReadExtraPrefix2LowLevelCallback(self, extra1, extra2, messageLength, messageData);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperSingleReadExtraSuffix1LowLevel(const packet: TByteArray);
+var messageLength: byte; messageData: TArray0To61OfChar; extra: byte; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  messageLength := LEConvertUInt8From(8, packet);
+  for i := 0 to 61 do messageData[i] := LEConvertCharFrom(9 + (i * 1), packet);
+  extra := LEConvertUInt8From(71, packet);
+
+  SetLength(singleReadExtraSuffix1HighLevelCallbackState.data, messageLength);
+  Move(messageData[0], singleReadExtraSuffix1HighLevelCallbackState.data[0], SizeOf(char) * messageLength);
+  if (Assigned(singleReadExtraSuffix1Callback)) then begin
+    singleReadExtraSuffix1Callback(self, singleReadExtraSuffix1HighLevelCallbackState.data, extra);
+  end;
+  SetLength(singleReadExtraSuffix1HighLevelCallbackState.data, 0);
+  singleReadExtraSuffix1HighLevelCallbackState.data := nil;
+  singleReadExtraSuffix1HighLevelCallbackState.length := 0;
+  if (Assigned(singleReadExtraSuffix1LowLevelCallback)) then begin
+    singleReadExtraSuffix1LowLevelCallback(self, messageLength, messageData, extra);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperSingleReadExtraSuffix2LowLevel(const packet: TByteArray);
+var messageLength: byte; messageData: TArray0To60OfChar; extra1: byte; extra2: byte; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  messageLength := LEConvertUInt8From(8, packet);
+  for i := 0 to 60 do messageData[i] := LEConvertCharFrom(9 + (i * 1), packet);
+  extra1 := LEConvertUInt8From(70, packet);
+  extra2 := LEConvertUInt8From(71, packet);
+
+  SetLength(singleReadExtraSuffix2HighLevelCallbackState.data, messageLength);
+  Move(messageData[0], singleReadExtraSuffix2HighLevelCallbackState.data[0], SizeOf(char) * messageLength);
+  if (Assigned(singleReadExtraSuffix2Callback)) then begin
+    singleReadExtraSuffix2Callback(self, singleReadExtraSuffix2HighLevelCallbackState.data, extra1, extra2);
+  end;
+  SetLength(singleReadExtraSuffix2HighLevelCallbackState.data, 0);
+  singleReadExtraSuffix2HighLevelCallbackState.data := nil;
+  singleReadExtraSuffix2HighLevelCallbackState.length := 0;
+  if (Assigned(singleReadExtraSuffix2LowLevelCallback)) then begin
+    singleReadExtraSuffix2LowLevelCallback(self, messageLength, messageData, extra1, extra2);
+  end;
+end;
+
+procedure TBrickletStreamTest.CallbackWrapperSingleReadExtraFullLowLevel(const packet: TByteArray);
+var extra1: byte; messageLength: byte; extra2: byte; messageData: TArray0To59OfChar; extra3: byte; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  extra1 := LEConvertUInt8From(8, packet);
+  messageLength := LEConvertUInt8From(9, packet);
+  extra2 := LEConvertUInt8From(10, packet);
+  for i := 0 to 59 do messageData[i] := LEConvertCharFrom(11 + (i * 1), packet);
+  extra3 := LEConvertUInt8From(71, packet);
+
+  SetLength(singleReadExtraFullHighLevelCallbackState.data, messageLength);
+  Move(messageData[0], singleReadExtraFullHighLevelCallbackState.data[0], SizeOf(char) * messageLength);
+  if (Assigned(singleReadExtraFullCallback)) then begin
+    singleReadExtraFullCallback(self, extra1, extra2, singleReadExtraFullHighLevelCallbackState.data, extra3);
+  end;
+  SetLength(singleReadExtraFullHighLevelCallbackState.data, 0);
+  singleReadExtraFullHighLevelCallbackState.data := nil;
+  singleReadExtraFullHighLevelCallbackState.length := 0;
+  if (Assigned(singleReadExtraFullLowLevelCallback)) then begin
+    singleReadExtraFullLowLevelCallback(self, extra1, messageLength, extra2, messageData, extra3);
+  end;
+end;
+
+end.
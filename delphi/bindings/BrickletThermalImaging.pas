@@ -0,0 +1,1047 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletThermalImaging;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_THERMAL_IMAGING_DEVICE_IDENTIFIER = 278;
+  BRICKLET_THERMAL_IMAGING_DEVICE_DISPLAY_NAME = 'Thermal Imaging Bricklet';
+
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_HIGH_CONTRAST_IMAGE_LOW_LEVEL = 1;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_TEMPERATURE_IMAGE_LOW_LEVEL = 2;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_STATISTICS = 3;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_SET_RESOLUTION = 4;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_RESOLUTION = 5;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_SET_SPOTMETER_CONFIG = 6;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_SPOTMETER_CONFIG = 7;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_SET_HIGH_CONTRAST_CONFIG = 8;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_HIGH_CONTRAST_CONFIG = 9;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_SET_IMAGE_TRANSFER_CONFIG = 10;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_IMAGE_TRANSFER_CONFIG = 11;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_SET_FLUX_LINEAR_PARAMETERS = 14;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_FLUX_LINEAR_PARAMETERS = 15;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_RESET = 243;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_WRITE_UID = 248;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_READ_UID = 249;
+  BRICKLET_THERMAL_IMAGING_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_THERMAL_IMAGING_CALLBACK_HIGH_CONTRAST_IMAGE_LOW_LEVEL = 12;
+  BRICKLET_THERMAL_IMAGING_CALLBACK_TEMPERATURE_IMAGE_LOW_LEVEL = 13;
+
+  BRICKLET_THERMAL_IMAGING_RESOLUTION_0_TO_6553_KELVIN = 0;
+  BRICKLET_THERMAL_IMAGING_RESOLUTION_0_TO_655_KELVIN = 1;
+  BRICKLET_THERMAL_IMAGING_FFC_STATUS_NEVER_COMMANDED = 0;
+  BRICKLET_THERMAL_IMAGING_FFC_STATUS_IMMINENT = 1;
+  BRICKLET_THERMAL_IMAGING_FFC_STATUS_IN_PROGRESS = 2;
+  BRICKLET_THERMAL_IMAGING_FFC_STATUS_COMPLETE = 3;
+  BRICKLET_THERMAL_IMAGING_IMAGE_TRANSFER_MANUAL_HIGH_CONTRAST_IMAGE = 0;
+  BRICKLET_THERMAL_IMAGING_IMAGE_TRANSFER_MANUAL_TEMPERATURE_IMAGE = 1;
+  BRICKLET_THERMAL_IMAGING_IMAGE_TRANSFER_CALLBACK_HIGH_CONTRAST_IMAGE = 2;
+  BRICKLET_THERMAL_IMAGING_IMAGE_TRANSFER_CALLBACK_TEMPERATURE_IMAGE = 3;
+  BRICKLET_THERMAL_IMAGING_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_THERMAL_IMAGING_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_THERMAL_IMAGING_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_THERMAL_IMAGING_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_THERMAL_IMAGING_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_THERMAL_IMAGING_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_THERMAL_IMAGING_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_THERMAL_IMAGING_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_THERMAL_IMAGING_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_THERMAL_IMAGING_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_THERMAL_IMAGING_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_THERMAL_IMAGING_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_THERMAL_IMAGING_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_THERMAL_IMAGING_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_THERMAL_IMAGING_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To1OfBoolean = array [0..1] of boolean;
+  TArray0To1OfUInt16 = array [0..1] of word;
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To30OfUInt16 = array [0..30] of word;
+  TArray0To3OfUInt16 = array [0..3] of word;
+  TArray0To3OfUInt8 = array [0..3] of byte;
+  TArray0To61OfUInt8 = array [0..61] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+  TArrayOfUInt16 = array of word;
+  TArrayOfUInt8 = array of byte;
+
+  THighContrastImageHighLevelCallbackState = record data: TArrayOfUInt8; length: word; end;
+  TTemperatureImageHighLevelCallbackState = record data: TArrayOfUInt16; length: word; end;
+
+  TBrickletThermalImaging = class;
+  TBrickletThermalImagingNotifyHighContrastImageLowLevel = procedure(sender: TBrickletThermalImaging; const imageChunkOffset: word; const imageChunkData: TArray0To61OfUInt8) of object;
+  TBrickletThermalImagingNotifyHighContrastImage = procedure(sender: TBrickletThermalImaging; const image: TArrayOfUInt8) of object;
+  TBrickletThermalImagingNotifyTemperatureImageLowLevel = procedure(sender: TBrickletThermalImaging; const imageChunkOffset: word; const imageChunkData: TArray0To30OfUInt16) of object;
+  TBrickletThermalImagingNotifyTemperatureImage = procedure(sender: TBrickletThermalImaging; const image: TArrayOfUInt16) of object;
+
+  /// <summary>
+  ///  80x60 pixel thermal imaging camera
+  /// </summary>
+  TBrickletThermalImaging = class(TDevice)
+  private
+    streamMutex: TCriticalSection;
+    highContrastImageHighLevelCallbackState: THighContrastImageHighLevelCallbackState;
+    temperatureImageHighLevelCallbackState: TTemperatureImageHighLevelCallbackState;
+    highContrastImageLowLevelCallback: TBrickletThermalImagingNotifyHighContrastImageLowLevel;
+    highContrastImageCallback: TBrickletThermalImagingNotifyHighContrastImage;
+    temperatureImageLowLevelCallback: TBrickletThermalImagingNotifyTemperatureImageLowLevel;
+    temperatureImageCallback: TBrickletThermalImagingNotifyTemperatureImage;
+  protected
+    procedure CallbackWrapperHighContrastImageLowLevel(const packet: TByteArray); virtual;
+    procedure CallbackWrapperTemperatureImageLowLevel(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the current high contrast image. See `here &lt;https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Thermal_Imaging.html#high-contrast-image-vs-temperature-image&gt;`__
+    ///  for the difference between
+    ///  High Contrast and Temperature Image. If you don't know what to use
+    ///  the High Contrast Image is probably right for you.
+    ///  
+    ///  The data is organized as a 8-bit value 80x60 pixel matrix linearized in
+    ///  a one-dimensional array. The data is arranged line by line from top left to
+    ///  bottom right.
+    ///  
+    ///  Each 8-bit value represents one gray-scale image pixel that can directly be
+    ///  shown to a user on a display.
+    ///  
+    ///  Before you can use this function you have to enable it with
+    ///  <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetImageTransferConfig"/>.
+    /// </summary>
+    procedure GetHighContrastImageLowLevel(out imageChunkOffset: word; out imageChunkData: TArray0To61OfUInt8); virtual;
+
+    /// <summary>
+    ///  Returns the current high contrast image. See `here &lt;https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Thermal_Imaging.html#high-contrast-image-vs-temperature-image&gt;`__
+    ///  for the difference between
+    ///  High Contrast and Temperature Image. If you don't know what to use
+    ///  the High Contrast Image is probably right for you.
+    ///  
+    ///  The data is organized as a 8-bit value 80x60 pixel matrix linearized in
+    ///  a one-dimensional array. The data is arranged line by line from top left to
+    ///  bottom right.
+    ///  
+    ///  Each 8-bit value represents one gray-scale image pixel that can directly be
+    ///  shown to a user on a display.
+    ///  
+    ///  Before you can use this function you have to enable it with
+    ///  <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetImageTransferConfig"/>.
+    /// </summary>
+    function GetHighContrastImage: TArrayOfUInt8; virtual;
+
+    /// <summary>
+    ///  Returns the current temperature image. See `here &lt;https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Thermal_Imaging.html#high-contrast-image-vs-temperature-image&gt;`__
+    ///  for the difference between High Contrast and Temperature Image.
+    ///  If you don't know what to use the High Contrast Image is probably right for you.
+    ///  
+    ///  The data is organized as a 16-bit value 80x60 pixel matrix linearized in
+    ///  a one-dimensional array. The data is arranged line by line from top left to
+    ///  bottom right.
+    ///  
+    ///  Each 16-bit value represents one temperature measurement in either
+    ///  Kelvin/10 or Kelvin/100 (depending on the resolution set with <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetResolution"/>).
+    ///  
+    ///  Before you can use this function you have to enable it with
+    ///  <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetImageTransferConfig"/>.
+    /// </summary>
+    procedure GetTemperatureImageLowLevel(out imageChunkOffset: word; out imageChunkData: TArray0To30OfUInt16); virtual;
+
+    /// <summary>
+    ///  Returns the current temperature image. See `here &lt;https://www.tinkerforge.com/en/doc/Hardware/Bricklets/Thermal_Imaging.html#high-contrast-image-vs-temperature-image&gt;`__
+    ///  for the difference between High Contrast and Temperature Image.
+    ///  If you don't know what to use the High Contrast Image is probably right for you.
+    ///  
+    ///  The data is organized as a 16-bit value 80x60 pixel matrix linearized in
+    ///  a one-dimensional array. The data is arranged line by line from top left to
+    ///  bottom right.
+    ///  
+    ///  Each 16-bit value represents one temperature measurement in either
+    ///  Kelvin/10 or Kelvin/100 (depending on the resolution set with <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetResolution"/>).
+    ///  
+    ///  Before you can use this function you have to enable it with
+    ///  <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetImageTransferConfig"/>.
+    /// </summary>
+    function GetTemperatureImage: TArrayOfUInt16; virtual;
+
+    /// <summary>
+    ///  Returns the spotmeter statistics, various temperatures, current resolution and status bits.
+    ///  
+    ///  The spotmeter statistics are:
+    ///  
+    ///  * Index 0: Mean Temperature.
+    ///  * Index 1: Maximum Temperature.
+    ///  * Index 2: Minimum Temperature.
+    ///  * Index 3: Pixel Count of spotmeter region of interest.
+    ///  
+    ///  The temperatures are:
+    ///  
+    ///  * Index 0: Focal Plain Array temperature.
+    ///  * Index 1: Focal Plain Array temperature at last FFC (Flat Field Correction).
+    ///  * Index 2: Housing temperature.
+    ///  * Index 3: Housing temperature at last FFC.
+    ///  
+    ///  The resolution is either `0 to 6553 Kelvin` or `0 to 655 Kelvin`. If the resolution is the former,
+    ///  the temperatures are in Kelvin/10, if it is the latter the temperatures are in Kelvin/100.
+    ///  
+    ///  FFC (Flat Field Correction) Status:
+    ///  
+    ///  * FFC Never Commanded: Only seen on startup before first FFC.
+    ///  * FFC Imminent: This state is entered 2 seconds prior to initiating FFC.
+    ///  * FFC In Progress: Flat field correction is started (shutter moves in front of lens and back). Takes about 1 second.
+    ///  * FFC Complete: Shutter is in waiting position again, FFC done.
+    ///  
+    ///  Temperature warning bits:
+    ///  
+    ///  * Index 0: Shutter lockout (if true shutter is locked out because temperature is outside -10°C to +65°C)
+    ///  * Index 1: Overtemperature shut down imminent (goes true 10 seconds before shutdown)
+    /// </summary>
+    procedure GetStatistics(out spotmeterStatistics: TArray0To3OfUInt16; out temperatures: TArray0To3OfUInt16; out resolution: byte; out ffcStatus: byte; out temperatureWarning: TArray0To1OfBoolean); virtual;
+
+    /// <summary>
+    ///  Sets the resolution. The Thermal Imaging Bricklet can either measure
+    ///  
+    ///  * from 0 to 6553 Kelvin (-273.15°C to +6279.85°C) with 0.1°C resolution or
+    ///  * from 0 to 655 Kelvin (-273.15°C to +381.85°C) with 0.01°C resolution.
+    ///  
+    ///  The accuracy is specified for -10°C to 450°C in the
+    ///  first range and -10°C and 140°C in the second range.
+    /// </summary>
+    procedure SetResolution(const resolution: byte); virtual;
+
+    /// <summary>
+    ///  Returns the resolution as set by <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetResolution"/>.
+    /// </summary>
+    function GetResolution: byte; virtual;
+
+    /// <summary>
+    ///  Sets the spotmeter region of interest. The 4 values are
+    ///  
+    ///  * Index 0: Column start (has to be smaller then Column end).
+    ///  * Index 1: Row start (has to be smaller then Row end).
+    ///  * Index 2: Column end (has to be smaller then 80).
+    ///  * Index 3: Row end (has to be smaller then 60).
+    ///  
+    ///  The spotmeter statistics can be read out with <see cref="BrickletThermalImaging.TBrickletThermalImaging.GetStatistics"/>.
+    /// </summary>
+    procedure SetSpotmeterConfig(const regionOfInterest: array of byte); virtual;
+
+    /// <summary>
+    ///  Returns the spotmeter config as set by <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetSpotmeterConfig"/>.
+    /// </summary>
+    function GetSpotmeterConfig: TArray0To3OfUInt8; virtual;
+
+    /// <summary>
+    ///  Sets the high contrast region of interest, dampening factor, clip limit and empty counts.
+    ///  This config is only used in high contrast mode (see <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetImageTransferConfig"/>).
+    ///  
+    ///  The high contrast region of interest consists of four values:
+    ///  
+    ///  * Index 0: Column start (has to be smaller or equal then Column end).
+    ///  * Index 1: Row start (has to be smaller then Row end).
+    ///  * Index 2: Column end (has to be smaller then 80).
+    ///  * Index 3: Row end (has to be smaller then 60).
+    ///  
+    ///  The algorithm to generate the high contrast image is applied to this region.
+    ///  
+    ///  Dampening Factor: This parameter is the amount of temporal dampening applied to the HEQ
+    ///  (history equalization) transformation function. An IIR filter of the form::
+    ///  
+    ///   (N / 256) * previous + ((256 - N) / 256) * current
+    ///  
+    ///  is applied, and the HEQ dampening factor
+    ///  represents the value N in the equation, i.e., a value that applies to the amount of
+    ///  influence the previous HEQ transformation function has on the current function. The
+    ///  lower the value of N the higher the influence of the current video frame whereas
+    ///  the higher the value of N the more influence the previous damped transfer function has.
+    ///  
+    ///  Clip Limit Index 0 (AGC HEQ Clip Limit High): This parameter defines the maximum number of pixels allowed
+    ///  to accumulate in any given histogram bin. Any additional pixels in a given bin are clipped.
+    ///  The effect of this parameter is to limit the influence of highly-populated bins on the
+    ///  resulting HEQ transformation function.
+    ///  
+    ///  Clip Limit Index 1 (AGC HEQ Clip Limit Low): This parameter defines an artificial population that is added to
+    ///  every non-empty histogram bin. In other words, if the Clip Limit Low is set to L, a bin
+    ///  with an actual population of X will have an effective population of L + X. Any empty bin
+    ///  that is nearby a populated bin will be given an artificial population of L. The effect of
+    ///  higher values is to provide a more linear transfer function; lower values provide a more
+    ///  non-linear (equalized) transfer function.
+    ///  
+    ///  Empty Counts: This parameter specifies the maximum number of pixels in a bin that will be
+    ///  interpreted as an empty bin. Histogram bins with this number of pixels or less will be
+    ///  processed as an empty bin.
+    /// </summary>
+    procedure SetHighContrastConfig(const regionOfInterest: array of byte; const dampeningFactor: word; const clipLimit: array of word; const emptyCounts: word); virtual;
+
+    /// <summary>
+    ///  Returns the high contrast config as set by <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetHighContrastConfig"/>.
+    /// </summary>
+    procedure GetHighContrastConfig(out regionOfInterest: TArray0To3OfUInt8; out dampeningFactor: word; out clipLimit: TArray0To1OfUInt16; out emptyCounts: word); virtual;
+
+    /// <summary>
+    ///  The necessary bandwidth of this Bricklet is too high to use getter/callback or
+    ///  high contrast/temperature image at the same time. You have to configure the one
+    ///  you want to use, the Bricklet will optimize the internal configuration accordingly.
+    ///  
+    ///  Corresponding functions:
+    ///  
+    ///  * Manual High Contrast Image: <see cref="BrickletThermalImaging.TBrickletThermalImaging.GetHighContrastImage"/>.
+    ///  * Manual Temperature Image: <see cref="BrickletThermalImaging.TBrickletThermalImaging.GetTemperatureImage"/>.
+    ///  * Callback High Contrast Image: <see cref="BrickletThermalImaging.TBrickletThermalImaging.OnHighContrastImage"/> callback.
+    ///  * Callback Temperature Image: <see cref="BrickletThermalImaging.TBrickletThermalImaging.OnTemperatureImage"/> callback.
+    /// </summary>
+    procedure SetImageTransferConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the image transfer config, as set by <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetImageTransferConfig"/>.
+    /// </summary>
+    function GetImageTransferConfig: byte; virtual;
+
+    /// <summary>
+    ///  Sets the flux linear parameters that can be used for radiometry calibration.
+    ///  
+    ///  See FLIR document 102-PS245-100-01 for more details.
+    ///  
+    ///  .. versionadded:: 2.0.5$nbsp;(Plugin)
+    /// </summary>
+    procedure SetFluxLinearParameters(const sceneEmissivity: word; const temperatureBackground: word; const tauWindow: word; const temperaturWindow: word; const tauAtmosphere: word; const temperatureAtmosphere: word; const reflectionWindow: word; const temperatureReflection: word); virtual;
+
+    /// <summary>
+    ///  Returns the flux linear parameters, as set by <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetFluxLinearParameters"/>.
+    ///  
+    ///  .. versionadded:: 2.0.5$nbsp;(Plugin)
+    /// </summary>
+    procedure GetFluxLinearParameters(out sceneEmissivity: word; out temperatureBackground: word; out tauWindow: word; out temperaturWindow: word; out tauAtmosphere: word; out temperatureAtmosphere: word; out reflectionWindow: word; out temperatureReflection: word); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletThermalImaging.TBrickletThermalImaging.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  <see cref="BrickletThermalImaging.TBrickletThermalImaging.OnHighContrastImage"/>
+    /// </summary>
+    property OnHighContrastImageLowLevel: TBrickletThermalImagingNotifyHighContrastImageLowLevel read highContrastImageLowLevelCallback write highContrastImageLowLevelCallback;
+
+    /// <summary>
+    ///  This callback is triggered with every new high contrast image if the transfer image
+    ///  config is configured for high contrast callback (see <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetImageTransferConfig"/>).
+    ///  
+    ///  The data is organized as a 8-bit value 80x60 pixel matrix linearized in
+    ///  a one-dimensional array. The data is arranged line by line from top left to
+    ///  bottom right.
+    ///  
+    ///  Each 8-bit value represents one gray-scale image pixel that can directly be
+    ///  shown to a user on a display.
+    ///  
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for image.
+    ///  </note>
+    /// </summary>
+    property OnHighContrastImage: TBrickletThermalImagingNotifyHighContrastImage read highContrastImageCallback write highContrastImageCallback;
+
+    /// <summary>
+    ///  <see cref="BrickletThermalImaging.TBrickletThermalImaging.OnTemperatureImage"/>
+    /// </summary>
+    property OnTemperatureImageLowLevel: TBrickletThermalImagingNotifyTemperatureImageLowLevel read temperatureImageLowLevelCallback write temperatureImageLowLevelCallback;
+
+    /// <summary>
+    ///  This callback is triggered with every new temperature image if the transfer image
+    ///  config is configured for temperature callback (see <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetImageTransferConfig"/>).
+    ///  
+    ///  The data is organized as a 16-bit value 80x60 pixel matrix linearized in
+    ///  a one-dimensional array. The data is arranged line by line from top left to
+    ///  bottom right.
+    ///  
+    ///  Each 16-bit value represents one temperature measurement in either
+    ///  Kelvin/10 or Kelvin/100 (depending on the resolution set with <see cref="BrickletThermalImaging.TBrickletThermalImaging.SetResolution"/>).
+    ///  
+    ///  <note>
+    ///   If reconstructing the value fails, the callback is triggered with nil for image.
+    ///  </note>
+    /// </summary>
+    property OnTemperatureImage: TBrickletThermalImagingNotifyTemperatureImage read temperatureImageCallback write temperatureImageCallback;
+  end;
+
+implementation
+
+constructor TBrickletThermalImaging.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_THERMAL_IMAGING_DEVICE_IDENTIFIER, BRICKLET_THERMAL_IMAGING_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 1;
+
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_HIGH_CONTRAST_IMAGE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_TEMPERATURE_IMAGE_LOW_LEVEL] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_STATISTICS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_SET_RESOLUTION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_RESOLUTION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_SET_SPOTMETER_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_SPOTMETER_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_SET_HIGH_CONTRAST_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_HIGH_CONTRAST_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_SET_IMAGE_TRANSFER_CONFIG] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_IMAGE_TRANSFER_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_SET_FLUX_LINEAR_PARAMETERS] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_FLUX_LINEAR_PARAMETERS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMAL_IMAGING_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  streamMutex := TCriticalSection.Create;
+
+  SetLength(highContrastImageHighLevelCallbackState.data, 0);
+  highContrastImageHighLevelCallbackState.data := nil;
+  highContrastImageHighLevelCallbackState.length := 0;
+
+  SetLength(temperatureImageHighLevelCallbackState.data, 0);
+  temperatureImageHighLevelCallbackState.data := nil;
+  temperatureImageHighLevelCallbackState.length := 0;
+
+  callbackWrappers[BRICKLET_THERMAL_IMAGING_CALLBACK_HIGH_CONTRAST_IMAGE_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperHighContrastImageLowLevel;
+  callbackWrappers[BRICKLET_THERMAL_IMAGING_CALLBACK_TEMPERATURE_IMAGE_LOW_LEVEL] := {$ifdef FPC}@{$endif}CallbackWrapperTemperatureImageLowLevel;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletThermalImaging.GetHighContrastImageLowLevel(out imageChunkOffset: word; out imageChunkData: TArray0To61OfUInt8);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_HIGH_CONTRAST_IMAGE_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  imageChunkOffset := LEConvertUInt16From(8, response);
+  for i := 0 to 61 do imageChunkData[i] := LEConvertUInt8From(10 + (i * 1), response);
+end;
+
+function TBrickletThermalImaging.GetHighContrastImage: TArrayOfUInt8;
+var
+  image: TArrayOfUInt8;
+  imageCurrentLength: word;
+  imageLength: word;
+  imageChunkOffset: word;
+  imageChunkData: TArray0To61OfUInt8;
+  imageOutOfSync: boolean;
+  imageChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(image, 0);
+  streamMutex.Acquire;
+  try
+    imageLength := 4800;
+    GetHighContrastImageLowLevel(imageChunkOffset, imageChunkData);
+    SetLength(image, imageLength);
+
+    if (imageChunkOffset = ((1 shl 16) - 1)) then begin { Maximum chunk offset -> stream has no data }
+      SetLength(image, 0);
+      exit;
+    end;
+
+    imageOutOfSync := (imageChunkOffset <> 0);
+
+    if ((not imageOutOfSync) and (imageLength > 0)) then begin
+      imageChunkLength := imageLength - imageChunkOffset;
+      if (imageChunkLength > 62) then imageChunkLength := 62;
+      Move(imageChunkData, image[0], SizeOf(byte) * imageChunkLength);
+      imageCurrentLength := imageChunkLength;
+
+      while ((not imageOutOfSync) and (imageCurrentLength < imageLength)) do begin
+        GetHighContrastImageLowLevel(imageChunkOffset, imageChunkData);
+        imageOutOfSync := imageChunkOffset <> imageCurrentLength;
+        imageChunkLength := imageLength - imageChunkOffset;
+        if (imageChunkLength > 62) then imageChunkLength := 62;
+        Move(imageChunkData, image[imageCurrentLength], SizeOf(byte) * imageChunkLength);
+        Inc(imageCurrentLength, imageChunkLength);
+      end;
+    end;
+
+    if (imageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (imageChunkOffset + 62 < imageLength) do begin
+        GetHighContrastImageLowLevel(imageChunkOffset, imageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Image stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := image;
+end;
+
+procedure TBrickletThermalImaging.GetTemperatureImageLowLevel(out imageChunkOffset: word; out imageChunkData: TArray0To30OfUInt16);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_TEMPERATURE_IMAGE_LOW_LEVEL, 8);
+  response := SendRequest(request, 72);
+  imageChunkOffset := LEConvertUInt16From(8, response);
+  for i := 0 to 30 do imageChunkData[i] := LEConvertUInt16From(10 + (i * 2), response);
+end;
+
+function TBrickletThermalImaging.GetTemperatureImage: TArrayOfUInt16;
+var
+  image: TArrayOfUInt16;
+  imageCurrentLength: word;
+  imageLength: word;
+  imageChunkOffset: word;
+  imageChunkData: TArray0To30OfUInt16;
+  imageOutOfSync: boolean;
+  imageChunkLength: word;
+begin
+  SetLength(result, 0);
+  SetLength(image, 0);
+  streamMutex.Acquire;
+  try
+    imageLength := 4800;
+    GetTemperatureImageLowLevel(imageChunkOffset, imageChunkData);
+    SetLength(image, imageLength);
+
+    if (imageChunkOffset = ((1 shl 16) - 1)) then begin { Maximum chunk offset -> stream has no data }
+      SetLength(image, 0);
+      exit;
+    end;
+
+    imageOutOfSync := (imageChunkOffset <> 0);
+
+    if ((not imageOutOfSync) and (imageLength > 0)) then begin
+      imageChunkLength := imageLength - imageChunkOffset;
+      if (imageChunkLength > 31) then imageChunkLength := 31;
+      Move(imageChunkData, image[0], SizeOf(word) * imageChunkLength);
+      imageCurrentLength := imageChunkLength;
+
+      while ((not imageOutOfSync) and (imageCurrentLength < imageLength)) do begin
+        GetTemperatureImageLowLevel(imageChunkOffset, imageChunkData);
+        imageOutOfSync := imageChunkOffset <> imageCurrentLength;
+        imageChunkLength := imageLength - imageChunkOffset;
+        if (imageChunkLength > 31) then imageChunkLength := 31;
+        Move(imageChunkData, image[imageCurrentLength], SizeOf(word) * imageChunkLength);
+        Inc(imageCurrentLength, imageChunkLength);
+      end;
+    end;
+
+    if (imageOutOfSync) then begin
+      { Discard remaining stream to bring it back in-sync }
+      while (imageChunkOffset + 31 < imageLength) do begin
+        GetTemperatureImageLowLevel(imageChunkOffset, imageChunkData);
+      end;
+
+      raise EStreamOutOfSyncException.Create('Image stream out-of-sync');
+    end;
+  finally
+    streamMutex.Release;
+  end;
+  result := image;
+end;
+
+procedure TBrickletThermalImaging.GetStatistics(out spotmeterStatistics: TArray0To3OfUInt16; out temperatures: TArray0To3OfUInt16; out resolution: byte; out ffcStatus: byte; out temperatureWarning: TArray0To1OfBoolean);
+var request, response: TByteArray; i: longint; temperatureWarningBits: array [0..0] of byte;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_STATISTICS, 8);
+  response := SendRequest(request, 27);
+  for i := 0 to 3 do spotmeterStatistics[i] := LEConvertUInt16From(8 + (i * 2), response);
+  for i := 0 to 3 do temperatures[i] := LEConvertUInt16From(16 + (i * 2), response);
+  resolution := LEConvertUInt8From(24, response);
+  ffcStatus := LEConvertUInt8From(25, response);
+  FillChar(temperatureWarningBits[0], Length(temperatureWarningBits) * SizeOf(temperatureWarningBits[0]), 0);
+  for i := 0 to 0 do temperatureWarningBits[i] := LEConvertUInt8From(26 + (i * 1), response);
+  for i := 0 to 1 do temperatureWarning[i] := ((temperatureWarningBits[Floor(i / 8)] and (1 shl (i mod 8))) <> 0);
+end;
+
+procedure TBrickletThermalImaging.SetResolution(const resolution: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_SET_RESOLUTION, 9);
+  LEConvertUInt8To(resolution, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletThermalImaging.GetResolution: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_RESOLUTION, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletThermalImaging.SetSpotmeterConfig(const regionOfInterest: array of byte);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_SET_SPOTMETER_CONFIG, 12);
+  if (Length(regionOfInterest) <> 4) then raise EInvalidParameterException.Create('Region Of Interest has to be exactly 4 items long');
+  for i := 0 to Length(regionOfInterest) - 1 do LEConvertUInt8To(regionOfInterest[i], 8 + (i * 1), request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletThermalImaging.GetSpotmeterConfig: TArray0To3OfUInt8;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_SPOTMETER_CONFIG, 8);
+  response := SendRequest(request, 12);
+  for i := 0 to 3 do result[i] := LEConvertUInt8From(8 + (i * 1), response);
+end;
+
+procedure TBrickletThermalImaging.SetHighContrastConfig(const regionOfInterest: array of byte; const dampeningFactor: word; const clipLimit: array of word; const emptyCounts: word);
+var request: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_SET_HIGH_CONTRAST_CONFIG, 20);
+  if (Length(regionOfInterest) <> 4) then raise EInvalidParameterException.Create('Region Of Interest has to be exactly 4 items long');
+  for i := 0 to Length(regionOfInterest) - 1 do LEConvertUInt8To(regionOfInterest[i], 8 + (i * 1), request);
+  LEConvertUInt16To(dampeningFactor, 12, request);
+  if (Length(clipLimit) <> 2) then raise EInvalidParameterException.Create('Clip Limit has to be exactly 2 items long');
+  for i := 0 to Length(clipLimit) - 1 do LEConvertUInt16To(clipLimit[i], 14 + (i * 2), request);
+  LEConvertUInt16To(emptyCounts, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletThermalImaging.GetHighContrastConfig(out regionOfInterest: TArray0To3OfUInt8; out dampeningFactor: word; out clipLimit: TArray0To1OfUInt16; out emptyCounts: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_HIGH_CONTRAST_CONFIG, 8);
+  response := SendRequest(request, 20);
+  for i := 0 to 3 do regionOfInterest[i] := LEConvertUInt8From(8 + (i * 1), response);
+  dampeningFactor := LEConvertUInt16From(12, response);
+  for i := 0 to 1 do clipLimit[i] := LEConvertUInt16From(14 + (i * 2), response);
+  emptyCounts := LEConvertUInt16From(18, response);
+end;
+
+procedure TBrickletThermalImaging.SetImageTransferConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_SET_IMAGE_TRANSFER_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletThermalImaging.GetImageTransferConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_IMAGE_TRANSFER_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletThermalImaging.SetFluxLinearParameters(const sceneEmissivity: word; const temperatureBackground: word; const tauWindow: word; const temperaturWindow: word; const tauAtmosphere: word; const temperatureAtmosphere: word; const reflectionWindow: word; const temperatureReflection: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_SET_FLUX_LINEAR_PARAMETERS, 24);
+  LEConvertUInt16To(sceneEmissivity, 8, request);
+  LEConvertUInt16To(temperatureBackground, 10, request);
+  LEConvertUInt16To(tauWindow, 12, request);
+  LEConvertUInt16To(temperaturWindow, 14, request);
+  LEConvertUInt16To(tauAtmosphere, 16, request);
+  LEConvertUInt16To(temperatureAtmosphere, 18, request);
+  LEConvertUInt16To(reflectionWindow, 20, request);
+  LEConvertUInt16To(temperatureReflection, 22, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletThermalImaging.GetFluxLinearParameters(out sceneEmissivity: word; out temperatureBackground: word; out tauWindow: word; out temperaturWindow: word; out tauAtmosphere: word; out temperatureAtmosphere: word; out reflectionWindow: word; out temperatureReflection: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_FLUX_LINEAR_PARAMETERS, 8);
+  response := SendRequest(request, 24);
+  sceneEmissivity := LEConvertUInt16From(8, response);
+  temperatureBackground := LEConvertUInt16From(10, response);
+  tauWindow := LEConvertUInt16From(12, response);
+  temperaturWindow := LEConvertUInt16From(14, response);
+  tauAtmosphere := LEConvertUInt16From(16, response);
+  temperatureAtmosphere := LEConvertUInt16From(18, response);
+  reflectionWindow := LEConvertUInt16From(20, response);
+  temperatureReflection := LEConvertUInt16From(22, response);
+end;
+
+procedure TBrickletThermalImaging.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletThermalImaging.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletThermalImaging.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletThermalImaging.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletThermalImaging.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletThermalImaging.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletThermalImaging.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletThermalImaging.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletThermalImaging.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletThermalImaging.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletThermalImaging.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletThermalImaging.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMAL_IMAGING_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletThermalImaging.CallbackWrapperHighContrastImageLowLevel(const packet: TByteArray);
+var imageChunkOffset: word; imageChunkData: TArray0To61OfUInt8; imageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  imageChunkOffset := LEConvertUInt16From(8, packet);
+  for i := 0 to 61 do imageChunkData[i] := LEConvertUInt8From(10 + (i * 1), packet);
+
+  imageChunkLength := 4800 - imageChunkOffset;
+  if (imageChunkLength > 62) then begin
+    imageChunkLength := 62;
+  end;
+  if (highContrastImageHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (imageChunkOffset = 0) then begin { Stream starts }
+      SetLength(highContrastImageHighLevelCallbackState.data, 4800);
+      Move(imageChunkData[0], highContrastImageHighLevelCallbackState.data[0], SizeOf(byte) * imageChunkLength);
+      highContrastImageHighLevelCallbackState.length := imageChunkLength;
+
+      if (highContrastImageHighLevelCallbackState.length >= 4800) then begin { Stream complete }
+        if (Assigned(highContrastImageCallback)) then begin
+          highContrastImageCallback(self, highContrastImageHighLevelCallbackState.data);
+        end;
+        SetLength(highContrastImageHighLevelCallbackState.data, 0);
+        highContrastImageHighLevelCallbackState.data := nil;
+        highContrastImageHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (imageChunkOffset <> highContrastImageHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(highContrastImageHighLevelCallbackState.data, 0);
+      highContrastImageHighLevelCallbackState.data := nil;
+      highContrastImageHighLevelCallbackState.length := 0;
+      if (Assigned(highContrastImageCallback)) then begin
+        highContrastImageCallback(self, highContrastImageHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(imageChunkData[0], highContrastImageHighLevelCallbackState.data[highContrastImageHighLevelCallbackState.length], SizeOf(byte) * imageChunkLength);
+      Inc(highContrastImageHighLevelCallbackState.length, imageChunkLength);
+
+      if highContrastImageHighLevelCallbackState.length >= 4800 then begin { Stream complete }
+        if (Assigned(highContrastImageCallback)) then begin
+          highContrastImageCallback(self, highContrastImageHighLevelCallbackState.data);
+        end;
+        SetLength(highContrastImageHighLevelCallbackState.data, 0);
+        highContrastImageHighLevelCallbackState.data := nil;
+        highContrastImageHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(highContrastImageLowLevelCallback)) then begin
+    highContrastImageLowLevelCallback(self, imageChunkOffset, imageChunkData);
+  end;
+end;
+
+procedure TBrickletThermalImaging.CallbackWrapperTemperatureImageLowLevel(const packet: TByteArray);
+var imageChunkOffset: word; imageChunkData: TArray0To30OfUInt16; imageChunkLength: word; i: longint;
+begin
+  if (Length(packet) <> 72) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  imageChunkOffset := LEConvertUInt16From(8, packet);
+  for i := 0 to 30 do imageChunkData[i] := LEConvertUInt16From(10 + (i * 2), packet);
+
+  imageChunkLength := 4800 - imageChunkOffset;
+  if (imageChunkLength > 31) then begin
+    imageChunkLength := 31;
+  end;
+  if (temperatureImageHighLevelCallbackState.data = nil) then begin { No stream in-progress }
+    if (imageChunkOffset = 0) then begin { Stream starts }
+      SetLength(temperatureImageHighLevelCallbackState.data, 4800);
+      Move(imageChunkData[0], temperatureImageHighLevelCallbackState.data[0], SizeOf(word) * imageChunkLength);
+      temperatureImageHighLevelCallbackState.length := imageChunkLength;
+
+      if (temperatureImageHighLevelCallbackState.length >= 4800) then begin { Stream complete }
+        if (Assigned(temperatureImageCallback)) then begin
+          temperatureImageCallback(self, temperatureImageHighLevelCallbackState.data);
+        end;
+        SetLength(temperatureImageHighLevelCallbackState.data, 0);
+        temperatureImageHighLevelCallbackState.data := nil;
+        temperatureImageHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end
+  else begin { Stream in-progress }
+    if (imageChunkOffset <> temperatureImageHighLevelCallbackState.length) then begin { Stream out-of-sync }
+      SetLength(temperatureImageHighLevelCallbackState.data, 0);
+      temperatureImageHighLevelCallbackState.data := nil;
+      temperatureImageHighLevelCallbackState.length := 0;
+      if (Assigned(temperatureImageCallback)) then begin
+        temperatureImageCallback(self, temperatureImageHighLevelCallbackState.data);
+      end;
+    end
+    else begin { Stream in-sync }
+      Move(imageChunkData[0], temperatureImageHighLevelCallbackState.data[temperatureImageHighLevelCallbackState.length], SizeOf(word) * imageChunkLength);
+      Inc(temperatureImageHighLevelCallbackState.length, imageChunkLength);
+
+      if temperatureImageHighLevelCallbackState.length >= 4800 then begin { Stream complete }
+        if (Assigned(temperatureImageCallback)) then begin
+          temperatureImageCallback(self, temperatureImageHighLevelCallbackState.data);
+        end;
+        SetLength(temperatureImageHighLevelCallbackState.data, 0);
+        temperatureImageHighLevelCallbackState.data := nil;
+        temperatureImageHighLevelCallbackState.length := 0;
+      end;
+    end;
+  end;
+  if (Assigned(temperatureImageLowLevelCallback)) then begin
+    temperatureImageLowLevelCallback(self, imageChunkOffset, imageChunkData);
+  end;
+end;
+
+end.
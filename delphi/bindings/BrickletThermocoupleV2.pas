@@ -0,0 +1,586 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletThermocoupleV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_THERMOCOUPLE_V2_DEVICE_IDENTIFIER = 2109;
+  BRICKLET_THERMOCOUPLE_V2_DEVICE_DISPLAY_NAME = 'Thermocouple Bricklet 2.0';
+
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_TEMPERATURE = 1;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION = 2;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_CONFIGURATION = 5;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_CONFIGURATION = 6;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_ERROR_STATE = 7;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_RESET = 243;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_THERMOCOUPLE_V2_CALLBACK_TEMPERATURE = 4;
+  BRICKLET_THERMOCOUPLE_V2_CALLBACK_ERROR_STATE = 8;
+
+  BRICKLET_THERMOCOUPLE_V2_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_THERMOCOUPLE_V2_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_THERMOCOUPLE_V2_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_THERMOCOUPLE_V2_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_THERMOCOUPLE_V2_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_THERMOCOUPLE_V2_AVERAGING_1 = 1;
+  BRICKLET_THERMOCOUPLE_V2_AVERAGING_2 = 2;
+  BRICKLET_THERMOCOUPLE_V2_AVERAGING_4 = 4;
+  BRICKLET_THERMOCOUPLE_V2_AVERAGING_8 = 8;
+  BRICKLET_THERMOCOUPLE_V2_AVERAGING_16 = 16;
+  BRICKLET_THERMOCOUPLE_V2_TYPE_B = 0;
+  BRICKLET_THERMOCOUPLE_V2_TYPE_E = 1;
+  BRICKLET_THERMOCOUPLE_V2_TYPE_J = 2;
+  BRICKLET_THERMOCOUPLE_V2_TYPE_K = 3;
+  BRICKLET_THERMOCOUPLE_V2_TYPE_N = 4;
+  BRICKLET_THERMOCOUPLE_V2_TYPE_R = 5;
+  BRICKLET_THERMOCOUPLE_V2_TYPE_S = 6;
+  BRICKLET_THERMOCOUPLE_V2_TYPE_T = 7;
+  BRICKLET_THERMOCOUPLE_V2_TYPE_G8 = 8;
+  BRICKLET_THERMOCOUPLE_V2_TYPE_G32 = 9;
+  BRICKLET_THERMOCOUPLE_V2_FILTER_OPTION_50HZ = 0;
+  BRICKLET_THERMOCOUPLE_V2_FILTER_OPTION_60HZ = 1;
+  BRICKLET_THERMOCOUPLE_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_THERMOCOUPLE_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_THERMOCOUPLE_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_THERMOCOUPLE_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_THERMOCOUPLE_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_THERMOCOUPLE_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_THERMOCOUPLE_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_THERMOCOUPLE_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_THERMOCOUPLE_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_THERMOCOUPLE_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_THERMOCOUPLE_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_THERMOCOUPLE_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_THERMOCOUPLE_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_THERMOCOUPLE_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_THERMOCOUPLE_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletThermocoupleV2 = class;
+  TBrickletThermocoupleV2NotifyTemperature = procedure(sender: TBrickletThermocoupleV2; const temperature: longint) of object;
+  TBrickletThermocoupleV2NotifyErrorState = procedure(sender: TBrickletThermocoupleV2; const overUnder: boolean; const openCircuit: boolean) of object;
+
+  /// <summary>
+  ///  Measures temperature with thermocouples
+  /// </summary>
+  TBrickletThermocoupleV2 = class(TDevice)
+  private
+    temperatureCallback: TBrickletThermocoupleV2NotifyTemperature;
+    errorStateCallback: TBrickletThermocoupleV2NotifyErrorState;
+  protected
+    procedure CallbackWrapperTemperature(const packet: TByteArray); virtual;
+    procedure CallbackWrapperErrorState(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the temperature of the thermocouple. The value is given in °C/100,
+    ///  e.g. a value of 4223 means that a temperature of 42.23 °C is measured.
+    ///  
+    ///  If you want to get the temperature periodically, it is recommended
+    ///  to use the <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.OnTemperature"/> callback and set the period with
+    ///  <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.SetTemperatureCallbackConfiguration"/>.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.OnTemperature"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.SetTemperatureCallbackConfiguration"/>.
+    /// </summary>
+    function GetTemperature: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.OnTemperature"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.OnTemperature"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.SetTemperatureCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  You can configure averaging size, thermocouple type and frequency
+    ///  filtering.
+    ///  
+    ///  Available averaging sizes are 1, 2, 4, 8 and 16 samples.
+    ///  
+    ///  As thermocouple type you can use B, E, J, K, N, R, S and T. If you have a
+    ///  different thermocouple or a custom thermocouple you can also use
+    ///  G8 and G32. With these types the returned value will not be in °C/100,
+    ///  it will be calculated by the following formulas:
+    ///  
+    ///  * G8: ``value = 8 * 1.6 * 2^17 * Vin``
+    ///  * G32: ``value = 32 * 1.6 * 2^17 * Vin``
+    ///  
+    ///  where Vin is the thermocouple input voltage.
+    ///  
+    ///  The frequency filter can be either configured to 50Hz or to 60Hz. You should
+    ///  configure it according to your utility frequency.
+    ///  
+    ///  The conversion time depends on the averaging and filter configuration, it can
+    ///  be calculated as follows:
+    ///  
+    ///  * 60Hz: ``time = 82 + (samples - 1) * 16.67``
+    ///  * 50Hz: ``time = 98 + (samples - 1) * 20``
+    /// </summary>
+    procedure SetConfiguration(const averaging: byte; const thermocoupleType: byte; const filter: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.SetConfiguration"/>.
+    /// </summary>
+    procedure GetConfiguration(out averaging: byte; out thermocoupleType: byte; out filter: byte); virtual;
+
+    /// <summary>
+    ///  Returns the current error state. There are two possible errors:
+    ///  
+    ///  * Over/Under Voltage and
+    ///  * Open Circuit.
+    ///  
+    ///  Over/Under Voltage happens for voltages below 0V or above 3.3V. In this case
+    ///  it is very likely that your thermocouple is defective. An Open Circuit error
+    ///  indicates that there is no thermocouple connected.
+    ///  
+    ///  You can use the <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.OnErrorState"/> callback to automatically get triggered
+    ///  when the error state changes.
+    /// </summary>
+    procedure GetErrorState(out overUnder: boolean; out openCircuit: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.SetTemperatureCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.GetTemperature"/>.
+    /// </summary>
+    property OnTemperature: TBrickletThermocoupleV2NotifyTemperature read temperatureCallback write temperatureCallback;
+
+    /// <summary>
+    ///  This Callback is triggered every time the error state changes
+    ///  (see <see cref="BrickletThermocoupleV2.TBrickletThermocoupleV2.GetErrorState"/>).
+    /// </summary>
+    property OnErrorState: TBrickletThermocoupleV2NotifyErrorState read errorStateCallback write errorStateCallback;
+  end;
+
+implementation
+
+constructor TBrickletThermocoupleV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_THERMOCOUPLE_V2_DEVICE_IDENTIFIER, BRICKLET_THERMOCOUPLE_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_ERROR_STATE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_THERMOCOUPLE_V2_CALLBACK_TEMPERATURE] := {$ifdef FPC}@{$endif}CallbackWrapperTemperature;
+  callbackWrappers[BRICKLET_THERMOCOUPLE_V2_CALLBACK_ERROR_STATE] := {$ifdef FPC}@{$endif}CallbackWrapperErrorState;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletThermocoupleV2.GetTemperature: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_TEMPERATURE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletThermocoupleV2.SetTemperatureCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_TEMPERATURE_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletThermocoupleV2.GetTemperatureCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_TEMPERATURE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+procedure TBrickletThermocoupleV2.SetConfiguration(const averaging: byte; const thermocoupleType: byte; const filter: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_CONFIGURATION, 11);
+  LEConvertUInt8To(averaging, 8, request);
+  LEConvertUInt8To(thermocoupleType, 9, request);
+  LEConvertUInt8To(filter, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletThermocoupleV2.GetConfiguration(out averaging: byte; out thermocoupleType: byte; out filter: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_CONFIGURATION, 8);
+  response := SendRequest(request, 11);
+  averaging := LEConvertUInt8From(8, response);
+  thermocoupleType := LEConvertUInt8From(9, response);
+  filter := LEConvertUInt8From(10, response);
+end;
+
+procedure TBrickletThermocoupleV2.GetErrorState(out overUnder: boolean; out openCircuit: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_ERROR_STATE, 8);
+  response := SendRequest(request, 10);
+  overUnder := LEConvertBooleanFrom(8, response);
+  openCircuit := LEConvertBooleanFrom(9, response);
+end;
+
+procedure TBrickletThermocoupleV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletThermocoupleV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletThermocoupleV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletThermocoupleV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletThermocoupleV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletThermocoupleV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletThermocoupleV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletThermocoupleV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletThermocoupleV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletThermocoupleV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletThermocoupleV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletThermocoupleV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_THERMOCOUPLE_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletThermocoupleV2.CallbackWrapperTemperature(const packet: TByteArray);
+var temperature: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  temperature := LEConvertInt32From(8, packet);
+  if (Assigned(temperatureCallback)) then begin
+    temperatureCallback(self, temperature);
+  end;
+end;
+
+procedure TBrickletThermocoupleV2.CallbackWrapperErrorState(const packet: TByteArray);
+var overUnder: boolean; openCircuit: boolean;
+begin
+  if (Length(packet) <> 10) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  overUnder := LEConvertBooleanFrom(8, packet);
+  openCircuit := LEConvertBooleanFrom(9, packet);
+  if (Assigned(errorStateCallback)) then begin
+    errorStateCallback(self, overUnder, openCircuit);
+  end;
+end;
+
+end.
@@ -0,0 +1,749 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletUVLightV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_UV_LIGHT_V2_DEVICE_IDENTIFIER = 2118;
+  BRICKLET_UV_LIGHT_V2_DEVICE_DISPLAY_NAME = 'UV Light Bricklet 2.0';
+
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVA = 1;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_SET_UVA_CALLBACK_CONFIGURATION = 2;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVA_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVB = 5;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_SET_UVB_CALLBACK_CONFIGURATION = 6;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVB_CALLBACK_CONFIGURATION = 7;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVI = 9;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_SET_UVI_CALLBACK_CONFIGURATION = 10;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVI_CALLBACK_CONFIGURATION = 11;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_SET_CONFIGURATION = 13;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_CONFIGURATION = 14;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_RESET = 243;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_UV_LIGHT_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_UV_LIGHT_V2_CALLBACK_UVA = 4;
+  BRICKLET_UV_LIGHT_V2_CALLBACK_UVB = 8;
+  BRICKLET_UV_LIGHT_V2_CALLBACK_UVI = 12;
+
+  BRICKLET_UV_LIGHT_V2_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_UV_LIGHT_V2_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_UV_LIGHT_V2_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_UV_LIGHT_V2_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_UV_LIGHT_V2_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_UV_LIGHT_V2_INTEGRATION_TIME_50MS = 0;
+  BRICKLET_UV_LIGHT_V2_INTEGRATION_TIME_100MS = 1;
+  BRICKLET_UV_LIGHT_V2_INTEGRATION_TIME_200MS = 2;
+  BRICKLET_UV_LIGHT_V2_INTEGRATION_TIME_400MS = 3;
+  BRICKLET_UV_LIGHT_V2_INTEGRATION_TIME_800MS = 4;
+  BRICKLET_UV_LIGHT_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_UV_LIGHT_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_UV_LIGHT_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_UV_LIGHT_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_UV_LIGHT_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_UV_LIGHT_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_UV_LIGHT_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_UV_LIGHT_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_UV_LIGHT_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_UV_LIGHT_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_UV_LIGHT_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_UV_LIGHT_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_UV_LIGHT_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_UV_LIGHT_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_UV_LIGHT_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletUVLightV2 = class;
+  TBrickletUVLightV2NotifyUVA = procedure(sender: TBrickletUVLightV2; const uva: longint) of object;
+  TBrickletUVLightV2NotifyUVB = procedure(sender: TBrickletUVLightV2; const uvb: longint) of object;
+  TBrickletUVLightV2NotifyUVI = procedure(sender: TBrickletUVLightV2; const uvi: longint) of object;
+
+  /// <summary>
+  ///  Measures UV-A, UV-B and UV index
+  /// </summary>
+  TBrickletUVLightV2 = class(TDevice)
+  private
+    uvaCallback: TBrickletUVLightV2NotifyUVA;
+    uvbCallback: TBrickletUVLightV2NotifyUVB;
+    uviCallback: TBrickletUVLightV2NotifyUVI;
+  protected
+    procedure CallbackWrapperUVA(const packet: TByteArray); virtual;
+    procedure CallbackWrapperUVB(const packet: TByteArray); virtual;
+    procedure CallbackWrapperUVI(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the UVA intensity of the sensor.
+    ///  The sensor has not weighted the intensity with the erythemal
+    ///  action spectrum to get the skin-affecting irradiation. Therefore, you cannot
+    ///  just divide the value by 250 to get the UVA index. To get the UV index use
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.GetUVI"/>.
+    ///  
+    ///  If the sensor is saturated, then -1 is returned, see <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetConfiguration"/>.
+    ///  
+    ///  If you want to get the intensity periodically, it is recommended to use the
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVA"/> callback and set the period with
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVACallbackConfiguration"/>.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVA"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVACallbackConfiguration"/>.
+    /// </summary>
+    function GetUVA: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVA"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVA"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetUVACallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVACallbackConfiguration"/>.
+    /// </summary>
+    procedure GetUVACallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the UVB intensity of the sensor.
+    ///  The sensor has not weighted the intensity with the erythemal
+    ///  action spectrum to get the skin-affecting irradiation. Therefore, you cannot
+    ///  just divide the value by 250 to get the UVB index. To get the UV index use
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.GetUVI"/>.
+    ///  
+    ///  If the sensor is saturated, then -1 is returned, see <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetConfiguration"/>.
+    ///  
+    ///  If you want to get the intensity periodically, it is recommended to use the
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVB"/> callback and set the period with
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVBCallbackConfiguration"/>.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVB"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVBCallbackConfiguration"/>.
+    /// </summary>
+    function GetUVB: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVB"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVB"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetUVBCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVBCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetUVBCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the UV index of the sensor, the index is given in 1/10.
+    ///  
+    ///  If the sensor is saturated, then -1 is returned, see <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetConfiguration"/>.
+    ///  
+    ///  If you want to get the intensity periodically, it is recommended to use the
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVI"/> callback and set the period with
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVICallbackConfiguration"/>.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVI"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVICallbackConfiguration"/>.
+    /// </summary>
+    function GetUVI: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVI"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletUVLightV2.TBrickletUVLightV2.OnUVI"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetUVICallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVICallbackConfiguration"/>.
+    /// </summary>
+    procedure GetUVICallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Sets the configuration of the sensor. The integration time can be configured
+    ///  between 50 and 800 ms. With a shorter integration time the sensor reading updates
+    ///  more often but contains more noise. With a longer integration the sensor reading
+    ///  contains less noise but updates less often.
+    ///  
+    ///  With a longer integration time (especially 800 ms) and a higher UV intensity the
+    ///  sensor can be saturated. If this happens the UVA/UVB/UVI readings are all -1.
+    ///  In this case you need to choose a shorter integration time.
+    /// </summary>
+    procedure SetConfiguration(const integrationTime: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetConfiguration"/>.
+    /// </summary>
+    function GetConfiguration: byte; virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletUVLightV2.TBrickletUVLightV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVACallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletUVLightV2.TBrickletUVLightV2.GetUVA"/>.
+    /// </summary>
+    property OnUVA: TBrickletUVLightV2NotifyUVA read uvaCallback write uvaCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVBCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletUVLightV2.TBrickletUVLightV2.GetUVB"/>.
+    /// </summary>
+    property OnUVB: TBrickletUVLightV2NotifyUVB read uvbCallback write uvbCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletUVLightV2.TBrickletUVLightV2.SetUVICallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletUVLightV2.TBrickletUVLightV2.GetUVI"/>.
+    /// </summary>
+    property OnUVI: TBrickletUVLightV2NotifyUVI read uviCallback write uviCallback;
+  end;
+
+implementation
+
+constructor TBrickletUVLightV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_UV_LIGHT_V2_DEVICE_IDENTIFIER, BRICKLET_UV_LIGHT_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVA] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_SET_UVA_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVA_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVB] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_SET_UVB_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVB_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVI] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_SET_UVI_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVI_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_SET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_UV_LIGHT_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_UV_LIGHT_V2_CALLBACK_UVA] := {$ifdef FPC}@{$endif}CallbackWrapperUVA;
+  callbackWrappers[BRICKLET_UV_LIGHT_V2_CALLBACK_UVB] := {$ifdef FPC}@{$endif}CallbackWrapperUVB;
+  callbackWrappers[BRICKLET_UV_LIGHT_V2_CALLBACK_UVI] := {$ifdef FPC}@{$endif}CallbackWrapperUVI;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletUVLightV2.GetUVA: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVA, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletUVLightV2.SetUVACallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_SET_UVA_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletUVLightV2.GetUVACallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVA_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+function TBrickletUVLightV2.GetUVB: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVB, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletUVLightV2.SetUVBCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_SET_UVB_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletUVLightV2.GetUVBCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVB_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+function TBrickletUVLightV2.GetUVI: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVI, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletUVLightV2.SetUVICallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_SET_UVI_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletUVLightV2.GetUVICallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_UVI_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+procedure TBrickletUVLightV2.SetConfiguration(const integrationTime: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_SET_CONFIGURATION, 9);
+  LEConvertUInt8To(integrationTime, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletUVLightV2.GetConfiguration: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_CONFIGURATION, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletUVLightV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletUVLightV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletUVLightV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletUVLightV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletUVLightV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletUVLightV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletUVLightV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletUVLightV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletUVLightV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletUVLightV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletUVLightV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletUVLightV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_UV_LIGHT_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletUVLightV2.CallbackWrapperUVA(const packet: TByteArray);
+var uva: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  uva := LEConvertInt32From(8, packet);
+  if (Assigned(uvaCallback)) then begin
+    uvaCallback(self, uva);
+  end;
+end;
+
+procedure TBrickletUVLightV2.CallbackWrapperUVB(const packet: TByteArray);
+var uvb: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  uvb := LEConvertInt32From(8, packet);
+  if (Assigned(uvbCallback)) then begin
+    uvbCallback(self, uvb);
+  end;
+end;
+
+procedure TBrickletUVLightV2.CallbackWrapperUVI(const packet: TByteArray);
+var uvi: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  uvi := LEConvertInt32From(8, packet);
+  if (Assigned(uviCallback)) then begin
+    uviCallback(self, uvi);
+  end;
+end;
+
+end.
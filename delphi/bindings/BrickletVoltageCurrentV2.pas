@@ -0,0 +1,781 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletVoltageCurrentV2;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_VOLTAGE_CURRENT_V2_DEVICE_IDENTIFIER = 2105;
+  BRICKLET_VOLTAGE_CURRENT_V2_DEVICE_DISPLAY_NAME = 'Voltage/Current Bricklet 2.0';
+
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CURRENT = 1;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_CURRENT_CALLBACK_CONFIGURATION = 2;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CURRENT_CALLBACK_CONFIGURATION = 3;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_VOLTAGE = 5;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_VOLTAGE_CALLBACK_CONFIGURATION = 6;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_VOLTAGE_CALLBACK_CONFIGURATION = 7;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_POWER = 9;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_POWER_CALLBACK_CONFIGURATION = 10;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_POWER_CALLBACK_CONFIGURATION = 11;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_CONFIGURATION = 13;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CONFIGURATION = 14;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_CALIBRATION = 15;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CALIBRATION = 16;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_RESET = 243;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_WRITE_UID = 248;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_READ_UID = 249;
+  BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_VOLTAGE_CURRENT_V2_CALLBACK_CURRENT = 4;
+  BRICKLET_VOLTAGE_CURRENT_V2_CALLBACK_VOLTAGE = 8;
+  BRICKLET_VOLTAGE_CURRENT_V2_CALLBACK_POWER = 12;
+
+  BRICKLET_VOLTAGE_CURRENT_V2_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_VOLTAGE_CURRENT_V2_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_VOLTAGE_CURRENT_V2_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_VOLTAGE_CURRENT_V2_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_VOLTAGE_CURRENT_V2_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_VOLTAGE_CURRENT_V2_AVERAGING_1 = 0;
+  BRICKLET_VOLTAGE_CURRENT_V2_AVERAGING_4 = 1;
+  BRICKLET_VOLTAGE_CURRENT_V2_AVERAGING_16 = 2;
+  BRICKLET_VOLTAGE_CURRENT_V2_AVERAGING_64 = 3;
+  BRICKLET_VOLTAGE_CURRENT_V2_AVERAGING_128 = 4;
+  BRICKLET_VOLTAGE_CURRENT_V2_AVERAGING_256 = 5;
+  BRICKLET_VOLTAGE_CURRENT_V2_AVERAGING_512 = 6;
+  BRICKLET_VOLTAGE_CURRENT_V2_AVERAGING_1024 = 7;
+  BRICKLET_VOLTAGE_CURRENT_V2_CONVERSION_TIME_140US = 0;
+  BRICKLET_VOLTAGE_CURRENT_V2_CONVERSION_TIME_204US = 1;
+  BRICKLET_VOLTAGE_CURRENT_V2_CONVERSION_TIME_332US = 2;
+  BRICKLET_VOLTAGE_CURRENT_V2_CONVERSION_TIME_588US = 3;
+  BRICKLET_VOLTAGE_CURRENT_V2_CONVERSION_TIME_1_1MS = 4;
+  BRICKLET_VOLTAGE_CURRENT_V2_CONVERSION_TIME_2_116MS = 5;
+  BRICKLET_VOLTAGE_CURRENT_V2_CONVERSION_TIME_4_156MS = 6;
+  BRICKLET_VOLTAGE_CURRENT_V2_CONVERSION_TIME_8_244MS = 7;
+  BRICKLET_VOLTAGE_CURRENT_V2_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_VOLTAGE_CURRENT_V2_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_VOLTAGE_CURRENT_V2_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_VOLTAGE_CURRENT_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_VOLTAGE_CURRENT_V2_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_VOLTAGE_CURRENT_V2_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_VOLTAGE_CURRENT_V2_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_VOLTAGE_CURRENT_V2_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_VOLTAGE_CURRENT_V2_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_VOLTAGE_CURRENT_V2_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_VOLTAGE_CURRENT_V2_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_VOLTAGE_CURRENT_V2_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_VOLTAGE_CURRENT_V2_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_VOLTAGE_CURRENT_V2_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_VOLTAGE_CURRENT_V2_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  TBrickletVoltageCurrentV2 = class;
+  TBrickletVoltageCurrentV2NotifyCurrent = procedure(sender: TBrickletVoltageCurrentV2; const current: longint) of object;
+  TBrickletVoltageCurrentV2NotifyVoltage = procedure(sender: TBrickletVoltageCurrentV2; const voltage: longint) of object;
+  TBrickletVoltageCurrentV2NotifyPower = procedure(sender: TBrickletVoltageCurrentV2; const power: longint) of object;
+
+  /// <summary>
+  ///  Measures power, DC voltage and DC current up to 720W/36V/20A
+  /// </summary>
+  TBrickletVoltageCurrentV2 = class(TDevice)
+  private
+    currentCallback: TBrickletVoltageCurrentV2NotifyCurrent;
+    voltageCallback: TBrickletVoltageCurrentV2NotifyVoltage;
+    powerCallback: TBrickletVoltageCurrentV2NotifyPower;
+  protected
+    procedure CallbackWrapperCurrent(const packet: TByteArray); virtual;
+    procedure CallbackWrapperVoltage(const packet: TByteArray); virtual;
+    procedure CallbackWrapperPower(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Returns the current.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.OnCurrent"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetCurrentCallbackConfiguration"/>.
+    /// </summary>
+    function GetCurrent: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.OnCurrent"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.OnCurrent"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetCurrentCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetCurrentCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetCurrentCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the voltage.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.OnVoltage"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetVoltageCallbackConfiguration"/>.
+    /// </summary>
+    function GetVoltage: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.OnVoltage"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.OnVoltage"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetVoltageCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetVoltageCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetVoltageCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the power.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.OnPower"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetPowerCallbackConfiguration"/>.
+    /// </summary>
+    function GetPower: longint; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.OnPower"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.OnPower"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetPowerCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetPowerCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetPowerCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint); virtual;
+
+    /// <summary>
+    ///  Sets the configuration of the Voltage/Current Bricklet 2.0. It is
+    ///  possible to configure number of averages as well as
+    ///  voltage and current conversion time.
+    /// </summary>
+    procedure SetConfiguration(const averaging: byte; const voltageConversionTime: byte; const currentConversionTime: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetConfiguration"/>.
+    /// </summary>
+    procedure GetConfiguration(out averaging: byte; out voltageConversionTime: byte; out currentConversionTime: byte); virtual;
+
+    /// <summary>
+    ///  Since the ADC and the shunt resistor used for the measurements
+    ///  are not perfect they need to be calibrated by a multiplier and
+    ///  a divisor if a very precise reading is needed.
+    ///  
+    ///  For example, if you are expecting a current of 1000mA and you
+    ///  are measuring 1023mA, you can calibrate the Voltage/Current Bricklet
+    ///  by setting the current multiplier to 1000 and the divisor to 1023.
+    ///  The same applies for the voltage.
+    ///  
+    ///  The calibration will be saved on the EEPROM of the Voltage/Current
+    ///  Bricklet and only needs to be done once.
+    /// </summary>
+    procedure SetCalibration(const voltageMultiplier: word; const voltageDivisor: word; const currentMultiplier: word; const currentDivisor: word); virtual;
+
+    /// <summary>
+    ///  Returns the calibration as set by <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetCalibration"/>.
+    /// </summary>
+    procedure GetCalibration(out voltageMultiplier: word; out voltageDivisor: word; out currentMultiplier: word; out currentDivisor: word); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetCurrentCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.GetCurrent"/>.
+    /// </summary>
+    property OnCurrent: TBrickletVoltageCurrentV2NotifyCurrent read currentCallback write currentCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetVoltageCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.GetVoltage"/>.
+    /// </summary>
+    property OnVoltage: TBrickletVoltageCurrentV2NotifyVoltage read voltageCallback write voltageCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.SetPowerCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletVoltageCurrentV2.TBrickletVoltageCurrentV2.GetPower"/>.
+    /// </summary>
+    property OnPower: TBrickletVoltageCurrentV2NotifyPower read powerCallback write powerCallback;
+  end;
+
+implementation
+
+constructor TBrickletVoltageCurrentV2.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_VOLTAGE_CURRENT_V2_DEVICE_IDENTIFIER, BRICKLET_VOLTAGE_CURRENT_V2_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CURRENT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_CURRENT_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CURRENT_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_VOLTAGE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_VOLTAGE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_VOLTAGE_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_POWER] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_POWER_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_POWER_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CALIBRATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_VOLTAGE_CURRENT_V2_CALLBACK_CURRENT] := {$ifdef FPC}@{$endif}CallbackWrapperCurrent;
+  callbackWrappers[BRICKLET_VOLTAGE_CURRENT_V2_CALLBACK_VOLTAGE] := {$ifdef FPC}@{$endif}CallbackWrapperVoltage;
+  callbackWrappers[BRICKLET_VOLTAGE_CURRENT_V2_CALLBACK_POWER] := {$ifdef FPC}@{$endif}CallbackWrapperPower;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+function TBrickletVoltageCurrentV2.GetCurrent: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CURRENT, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletVoltageCurrentV2.SetCurrentCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_CURRENT_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletVoltageCurrentV2.GetCurrentCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CURRENT_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+function TBrickletVoltageCurrentV2.GetVoltage: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_VOLTAGE, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletVoltageCurrentV2.SetVoltageCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_VOLTAGE_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletVoltageCurrentV2.GetVoltageCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_VOLTAGE_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+function TBrickletVoltageCurrentV2.GetPower: longint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_POWER, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertInt32From(8, response);
+end;
+
+procedure TBrickletVoltageCurrentV2.SetPowerCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longint; const max: longint);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_POWER_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertInt32To(min, 14, request);
+  LEConvertInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletVoltageCurrentV2.GetPowerCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longint; out max: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_POWER_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertInt32From(14, response);
+  max := LEConvertInt32From(18, response);
+end;
+
+procedure TBrickletVoltageCurrentV2.SetConfiguration(const averaging: byte; const voltageConversionTime: byte; const currentConversionTime: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_CONFIGURATION, 11);
+  LEConvertUInt8To(averaging, 8, request);
+  LEConvertUInt8To(voltageConversionTime, 9, request);
+  LEConvertUInt8To(currentConversionTime, 10, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletVoltageCurrentV2.GetConfiguration(out averaging: byte; out voltageConversionTime: byte; out currentConversionTime: byte);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CONFIGURATION, 8);
+  response := SendRequest(request, 11);
+  averaging := LEConvertUInt8From(8, response);
+  voltageConversionTime := LEConvertUInt8From(9, response);
+  currentConversionTime := LEConvertUInt8From(10, response);
+end;
+
+procedure TBrickletVoltageCurrentV2.SetCalibration(const voltageMultiplier: word; const voltageDivisor: word; const currentMultiplier: word; const currentDivisor: word);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_CALIBRATION, 16);
+  LEConvertUInt16To(voltageMultiplier, 8, request);
+  LEConvertUInt16To(voltageDivisor, 10, request);
+  LEConvertUInt16To(currentMultiplier, 12, request);
+  LEConvertUInt16To(currentDivisor, 14, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletVoltageCurrentV2.GetCalibration(out voltageMultiplier: word; out voltageDivisor: word; out currentMultiplier: word; out currentDivisor: word);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CALIBRATION, 8);
+  response := SendRequest(request, 16);
+  voltageMultiplier := LEConvertUInt16From(8, response);
+  voltageDivisor := LEConvertUInt16From(10, response);
+  currentMultiplier := LEConvertUInt16From(12, response);
+  currentDivisor := LEConvertUInt16From(14, response);
+end;
+
+procedure TBrickletVoltageCurrentV2.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletVoltageCurrentV2.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletVoltageCurrentV2.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletVoltageCurrentV2.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletVoltageCurrentV2.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletVoltageCurrentV2.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletVoltageCurrentV2.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletVoltageCurrentV2.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletVoltageCurrentV2.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletVoltageCurrentV2.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletVoltageCurrentV2.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletVoltageCurrentV2.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_VOLTAGE_CURRENT_V2_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletVoltageCurrentV2.CallbackWrapperCurrent(const packet: TByteArray);
+var current: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  current := LEConvertInt32From(8, packet);
+  if (Assigned(currentCallback)) then begin
+    currentCallback(self, current);
+  end;
+end;
+
+procedure TBrickletVoltageCurrentV2.CallbackWrapperVoltage(const packet: TByteArray);
+var voltage: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  voltage := LEConvertInt32From(8, packet);
+  if (Assigned(voltageCallback)) then begin
+    voltageCallback(self, voltage);
+  end;
+end;
+
+procedure TBrickletVoltageCurrentV2.CallbackWrapperPower(const packet: TByteArray);
+var power: longint;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  power := LEConvertInt32From(8, packet);
+  if (Assigned(powerCallback)) then begin
+    powerCallback(self, power);
+  end;
+end;
+
+end.
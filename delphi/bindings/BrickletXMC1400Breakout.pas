@@ -0,0 +1,662 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit BrickletXMC1400Breakout;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  BRICKLET_XMC1400_BREAKOUT_DEVICE_IDENTIFIER = 279;
+  BRICKLET_XMC1400_BREAKOUT_DEVICE_DISPLAY_NAME = 'XMC1400 Breakout Bricklet';
+
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_GPIO_CONFIG = 1;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_GPIO_INPUT = 2;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_ADC_CHANNEL_CONFIG = 3;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_CHANNEL_CONFIG = 4;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_CHANNEL_VALUE = 5;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_VALUES = 6;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_ADC_VALUES_CALLBACK_CONFIGURATION = 7;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_VALUES_CALLBACK_CONFIGURATION = 8;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_COUNT = 10;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_COUNT_CALLBACK_CONFIGURATION = 11;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_COUNT_CALLBACK_CONFIGURATION = 12;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_SPITFP_ERROR_COUNT = 234;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_BOOTLOADER_MODE = 235;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_BOOTLOADER_MODE = 236;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_WRITE_FIRMWARE = 238;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_STATUS_LED_CONFIG = 239;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_STATUS_LED_CONFIG = 240;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_CHIP_TEMPERATURE = 242;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_RESET = 243;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_WRITE_UID = 248;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_READ_UID = 249;
+  BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_IDENTITY = 255;
+
+  BRICKLET_XMC1400_BREAKOUT_CALLBACK_ADC_VALUES = 9;
+  BRICKLET_XMC1400_BREAKOUT_CALLBACK_COUNT = 13;
+
+  BRICKLET_XMC1400_BREAKOUT_THRESHOLD_OPTION_OFF = 'x';
+  BRICKLET_XMC1400_BREAKOUT_THRESHOLD_OPTION_OUTSIDE = 'o';
+  BRICKLET_XMC1400_BREAKOUT_THRESHOLD_OPTION_INSIDE = 'i';
+  BRICKLET_XMC1400_BREAKOUT_THRESHOLD_OPTION_SMALLER = '<';
+  BRICKLET_XMC1400_BREAKOUT_THRESHOLD_OPTION_GREATER = '>';
+  BRICKLET_XMC1400_BREAKOUT_GPIO_MODE_INPUT_TRISTATE = 0;
+  BRICKLET_XMC1400_BREAKOUT_GPIO_MODE_INPUT_PULL_DOWN = 1;
+  BRICKLET_XMC1400_BREAKOUT_GPIO_MODE_INPUT_PULL_UP = 2;
+  BRICKLET_XMC1400_BREAKOUT_GPIO_MODE_INPUT_SAMPLING = 3;
+  BRICKLET_XMC1400_BREAKOUT_GPIO_MODE_INPUT_INVERTED_TRISTATE = 4;
+  BRICKLET_XMC1400_BREAKOUT_GPIO_MODE_INPUT_INVERTED_PULL_DOWN = 5;
+  BRICKLET_XMC1400_BREAKOUT_GPIO_MODE_INPUT_INVERTED_PULL_UP = 6;
+  BRICKLET_XMC1400_BREAKOUT_GPIO_MODE_INPUT_INVERTED_SAMPLING = 7;
+  BRICKLET_XMC1400_BREAKOUT_GPIO_MODE_OUTPUT_PUSH_PULL = 8;
+  BRICKLET_XMC1400_BREAKOUT_GPIO_MODE_OUTPUT_OPEN_DRAIN = 9;
+  BRICKLET_XMC1400_BREAKOUT_GPIO_INPUT_HYSTERESIS_STANDARD = 0;
+  BRICKLET_XMC1400_BREAKOUT_GPIO_INPUT_HYSTERESIS_LARGE = 4;
+  BRICKLET_XMC1400_BREAKOUT_BOOTLOADER_MODE_BOOTLOADER = 0;
+  BRICKLET_XMC1400_BREAKOUT_BOOTLOADER_MODE_FIRMWARE = 1;
+  BRICKLET_XMC1400_BREAKOUT_BOOTLOADER_MODE_BOOTLOADER_WAIT_FOR_REBOOT = 2;
+  BRICKLET_XMC1400_BREAKOUT_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_REBOOT = 3;
+  BRICKLET_XMC1400_BREAKOUT_BOOTLOADER_MODE_FIRMWARE_WAIT_FOR_ERASE_AND_REBOOT = 4;
+  BRICKLET_XMC1400_BREAKOUT_BOOTLOADER_STATUS_OK = 0;
+  BRICKLET_XMC1400_BREAKOUT_BOOTLOADER_STATUS_INVALID_MODE = 1;
+  BRICKLET_XMC1400_BREAKOUT_BOOTLOADER_STATUS_NO_CHANGE = 2;
+  BRICKLET_XMC1400_BREAKOUT_BOOTLOADER_STATUS_ENTRY_FUNCTION_NOT_PRESENT = 3;
+  BRICKLET_XMC1400_BREAKOUT_BOOTLOADER_STATUS_DEVICE_IDENTIFIER_INCORRECT = 4;
+  BRICKLET_XMC1400_BREAKOUT_BOOTLOADER_STATUS_CRC_MISMATCH = 5;
+  BRICKLET_XMC1400_BREAKOUT_STATUS_LED_CONFIG_OFF = 0;
+  BRICKLET_XMC1400_BREAKOUT_STATUS_LED_CONFIG_ON = 1;
+  BRICKLET_XMC1400_BREAKOUT_STATUS_LED_CONFIG_SHOW_HEARTBEAT = 2;
+  BRICKLET_XMC1400_BREAKOUT_STATUS_LED_CONFIG_SHOW_STATUS = 3;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+  TArray0To7OfUInt16 = array [0..7] of word;
+
+  TBrickletXMC1400Breakout = class;
+  TBrickletXMC1400BreakoutNotifyADCValues = procedure(sender: TBrickletXMC1400Breakout; const values: TArray0To7OfUInt16) of object;
+  TBrickletXMC1400BreakoutNotifyCount = procedure(sender: TBrickletXMC1400Breakout; const count: longword) of object;
+
+  /// <summary>
+  ///  Breakout for Infineon XMC1400 microcontroller
+  /// </summary>
+  TBrickletXMC1400Breakout = class(TDevice)
+  private
+    adcValuesCallback: TBrickletXMC1400BreakoutNotifyADCValues;
+    countCallback: TBrickletXMC1400BreakoutNotifyCount;
+  protected
+    procedure CallbackWrapperADCValues(const packet: TByteArray); virtual;
+    procedure CallbackWrapperCount(const packet: TByteArray); virtual;
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  Example for a setter function. The values are the values that can be given to
+    ///  the XMC_GPIO_Init function. See communication.c in the firmware.
+    /// </summary>
+    procedure SetGPIOConfig(const port: byte; const pin: byte; const mode: byte; const inputHysteresis: byte; const outputLevel: boolean); virtual;
+
+    /// <summary>
+    ///  Example for a getter function. Returns the result of a
+    ///  XMC_GPIO_GetInput call for the given port/pin.
+    /// </summary>
+    function GetGPIOInput(const port: byte; const pin: byte): boolean; virtual;
+
+    /// <summary>
+    ///  Enables a ADC channel for the ADC driver example (adc.c/adc.h).
+    ///  
+    ///  There are 8 ADC channels and they correspond to the following pins:
+    ///  
+    ///  * Channel 0: P2_6
+    ///  * Channel 1: P2_8
+    ///  * Channel 2: P2_9
+    ///  * Channel 3: P2_10
+    ///  * Channel 4: P2_11
+    ///  * Channel 5: P2_0
+    ///  * Channel 6: P2_1
+    ///  * Channel 7: P2_2
+    /// </summary>
+    procedure SetADCChannelConfig(const channel: byte; const enable: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the config for the given channel as set by <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.SetADCChannelConfig"/>.
+    /// </summary>
+    function GetADCChannelConfig(const channel: byte): boolean; virtual;
+
+    /// <summary>
+    ///  Returns the 12-bit value of the given ADC channel of the ADC driver example.
+    /// </summary>
+    function GetADCChannelValue(const channel: byte): word; virtual;
+
+    /// <summary>
+    ///  Returns the values for all 8 ADC channels of the adc driver example.
+    ///  
+    ///  This example function also has a corresponding callback.
+    ///  
+    ///  See <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.SetADCValuesCallbackConfiguration"/> and <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.OnADCValues"/> callback.
+    /// </summary>
+    function GetADCValues: TArray0To7OfUInt16; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.OnADCValues"/>
+    ///  callback is triggered periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change within the
+    ///  period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    /// </summary>
+    procedure SetADCValuesCallbackConfiguration(const period: longword; const valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by
+    ///  <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.SetADCValuesCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetADCValuesCallbackConfiguration(out period: longword; out valueHasToChange: boolean); virtual;
+
+    /// <summary>
+    ///  Returns the value of the example count (see example.c).
+    ///  
+    ///  This example function uses the "add_callback_value_function"-helper in the
+    ///  generator. The getter as well as the callback and callback configuration
+    ///  functions are auto-generated for the API as well as the firmware.
+    ///  
+    ///  
+    ///  If you want to get the value periodically, it is recommended to use the
+    ///  <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.OnCount"/> callback. You can set the callback configuration
+    ///  with <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.SetCountCallbackConfiguration"/>.
+    /// </summary>
+    function GetCount: longword; virtual;
+
+    /// <summary>
+    ///  The period is the period with which the <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.OnCount"/> callback is triggered
+    ///  periodically. A value of 0 turns the callback off.
+    ///  
+    ///  If the `value has to change`-parameter is set to true, the callback is only
+    ///  triggered after the value has changed. If the value didn't change
+    ///  within the period, the callback is triggered immediately on change.
+    ///  
+    ///  If it is set to false, the callback is continuously triggered with the period,
+    ///  independent of the value.
+    ///  
+    ///  It is furthermore possible to constrain the callback with thresholds.
+    ///  
+    ///  The `option`-parameter together with min/max sets a threshold for the <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.OnCount"/> callback.
+    ///  
+    ///  The following options are possible:
+    ///  
+    ///  <code>
+    ///   "Option", "Description"
+    ///  
+    ///   "'x'",    "Threshold is turned off"
+    ///   "'o'",    "Threshold is triggered when the value is *outside* the min and max values"
+    ///   "'i'",    "Threshold is triggered when the value is *inside* or equal to the min and max values"
+    ///   "'&lt;'",    "Threshold is triggered when the value is smaller than the min value (max is ignored)"
+    ///   "'&gt;'",    "Threshold is triggered when the value is greater than the min value (max is ignored)"
+    ///  </code>
+    ///  
+    ///  If the option is set to 'x' (threshold turned off) the callback is triggered with the fixed period.
+    /// </summary>
+    procedure SetCountCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longword; const max: longword); virtual;
+
+    /// <summary>
+    ///  Returns the callback configuration as set by <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.SetCountCallbackConfiguration"/>.
+    /// </summary>
+    procedure GetCountCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longword; out max: longword); virtual;
+
+    /// <summary>
+    ///  Returns the error count for the communication between Brick and Bricklet.
+    ///  
+    ///  The errors are divided into
+    ///  
+    ///  * ACK checksum errors,
+    ///  * message checksum errors,
+    ///  * framing errors and
+    ///  * overflow errors.
+    ///  
+    ///  The errors counts are for errors that occur on the Bricklet side. All
+    ///  Bricks have a similar function that returns the errors on the Brick side.
+    /// </summary>
+    procedure GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword); virtual;
+
+    /// <summary>
+    ///  Sets the bootloader mode and returns the status after the requested
+    ///  mode change was instigated.
+    ///  
+    ///  You can change from bootloader mode to firmware mode and vice versa. A change
+    ///  from bootloader mode to firmware mode will only take place if the entry function,
+    ///  device identifier and CRC are present and correct.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function SetBootloaderMode(const mode: byte): byte; virtual;
+
+    /// <summary>
+    ///  Returns the current bootloader mode, see <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.SetBootloaderMode"/>.
+    /// </summary>
+    function GetBootloaderMode: byte; virtual;
+
+    /// <summary>
+    ///  Sets the firmware pointer for <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.WriteFirmware"/>. The pointer has
+    ///  to be increased by chunks of size 64. The data is written to flash
+    ///  every 4 chunks (which equals to one page of size 256).
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  Writes 64 Bytes of firmware at the position as written by
+    ///  <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.SetWriteFirmwarePointer"/> before. The firmware is written
+    ///  to flash every 4 chunks.
+    ///  
+    ///  You can only write firmware in bootloader mode.
+    ///  
+    ///  This function is used by Brick Viewer during flashing. It should not be
+    ///  necessary to call it in a normal user program.
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Sets the status LED configuration. By default the LED shows
+    ///  communication traffic between Brick and Bricklet, it flickers once
+    ///  for every 10 received data packets.
+    ///  
+    ///  You can also turn the LED permanently on/off or show a heartbeat.
+    ///  
+    ///  If the Bricklet is in bootloader mode, the LED is will show heartbeat by default.
+    /// </summary>
+    procedure SetStatusLEDConfig(const config: byte); virtual;
+
+    /// <summary>
+    ///  Returns the configuration as set by <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.SetStatusLEDConfig"/>
+    /// </summary>
+    function GetStatusLEDConfig: byte; virtual;
+
+    /// <summary>
+    ///  Returns the temperature as measured inside the microcontroller. The
+    ///  value returned is not the ambient temperature!
+    ///  
+    ///  The temperature is only proportional to the real temperature and it has bad
+    ///  accuracy. Practically it is only useful as an indicator for
+    ///  temperature changes.
+    /// </summary>
+    function GetChipTemperature: smallint; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the Bricklet. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Bricklet is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position can be 'a', 'b', 'c', 'd', 'e', 'f', 'g' or 'h' (Bricklet Port).
+    ///  A Bricklet connected to an :ref:`Isolator Bricklet &lt;isolator_bricklet&gt;` is always at
+    ///  position 'z'.
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.SetADCValuesCallbackConfiguration"/>.
+    ///  
+    ///  The parameters are the same as <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.GetADCValues"/>.
+    /// </summary>
+    property OnADCValues: TBrickletXMC1400BreakoutNotifyADCValues read adcValuesCallback write adcValuesCallback;
+
+    /// <summary>
+    ///  This callback is triggered periodically according to the configuration set by
+    ///  <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.SetCountCallbackConfiguration"/>.
+    ///  
+    ///  The parameter is the same as <see cref="BrickletXMC1400Breakout.TBrickletXMC1400Breakout.GetCount"/>.
+    /// </summary>
+    property OnCount: TBrickletXMC1400BreakoutNotifyCount read countCallback write countCallback;
+  end;
+
+implementation
+
+constructor TBrickletXMC1400Breakout.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, BRICKLET_XMC1400_BREAKOUT_DEVICE_IDENTIFIER, BRICKLET_XMC1400_BREAKOUT_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_GPIO_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_GPIO_INPUT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_ADC_CHANNEL_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_CHANNEL_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_CHANNEL_VALUE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_VALUES] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_ADC_VALUES_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_VALUES_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_COUNT_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_COUNT_CALLBACK_CONFIGURATION] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_SPITFP_ERROR_COUNT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_BOOTLOADER_MODE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_STATUS_LED_CONFIG] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_CHIP_TEMPERATURE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+  callbackWrappers[BRICKLET_XMC1400_BREAKOUT_CALLBACK_ADC_VALUES] := {$ifdef FPC}@{$endif}CallbackWrapperADCValues;
+  callbackWrappers[BRICKLET_XMC1400_BREAKOUT_CALLBACK_COUNT] := {$ifdef FPC}@{$endif}CallbackWrapperCount;
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TBrickletXMC1400Breakout.SetGPIOConfig(const port: byte; const pin: byte; const mode: byte; const inputHysteresis: byte; const outputLevel: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_GPIO_CONFIG, 13);
+  LEConvertUInt8To(port, 8, request);
+  LEConvertUInt8To(pin, 9, request);
+  LEConvertUInt8To(mode, 10, request);
+  LEConvertUInt8To(inputHysteresis, 11, request);
+  LEConvertBooleanTo(outputLevel, 12, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletXMC1400Breakout.GetGPIOInput(const port: byte; const pin: byte): boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_GPIO_INPUT, 10);
+  LEConvertUInt8To(port, 8, request);
+  LEConvertUInt8To(pin, 9, request);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+procedure TBrickletXMC1400Breakout.SetADCChannelConfig(const channel: byte; const enable: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_ADC_CHANNEL_CONFIG, 10);
+  LEConvertUInt8To(channel, 8, request);
+  LEConvertBooleanTo(enable, 9, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletXMC1400Breakout.GetADCChannelConfig(const channel: byte): boolean;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_CHANNEL_CONFIG, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertBooleanFrom(8, response);
+end;
+
+function TBrickletXMC1400Breakout.GetADCChannelValue(const channel: byte): word;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_CHANNEL_VALUE, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 10);
+  result := LEConvertUInt16From(8, response);
+end;
+
+function TBrickletXMC1400Breakout.GetADCValues: TArray0To7OfUInt16;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_VALUES, 8);
+  response := SendRequest(request, 24);
+  for i := 0 to 7 do result[i] := LEConvertUInt16From(8 + (i * 2), response);
+end;
+
+procedure TBrickletXMC1400Breakout.SetADCValuesCallbackConfiguration(const period: longword; const valueHasToChange: boolean);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_ADC_VALUES_CALLBACK_CONFIGURATION, 13);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletXMC1400Breakout.GetADCValuesCallbackConfiguration(out period: longword; out valueHasToChange: boolean);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_ADC_VALUES_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 13);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+end;
+
+function TBrickletXMC1400Breakout.GetCount: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_COUNT, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletXMC1400Breakout.SetCountCallbackConfiguration(const period: longword; const valueHasToChange: boolean; const option: char; const min: longword; const max: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_COUNT_CALLBACK_CONFIGURATION, 22);
+  LEConvertUInt32To(period, 8, request);
+  LEConvertBooleanTo(valueHasToChange, 12, request);
+  LEConvertCharTo(option, 13, request);
+  LEConvertUInt32To(min, 14, request);
+  LEConvertUInt32To(max, 18, request);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletXMC1400Breakout.GetCountCallbackConfiguration(out period: longword; out valueHasToChange: boolean; out option: char; out min: longword; out max: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_COUNT_CALLBACK_CONFIGURATION, 8);
+  response := SendRequest(request, 22);
+  period := LEConvertUInt32From(8, response);
+  valueHasToChange := LEConvertBooleanFrom(12, response);
+  option := LEConvertCharFrom(13, response);
+  min := LEConvertUInt32From(14, response);
+  max := LEConvertUInt32From(18, response);
+end;
+
+procedure TBrickletXMC1400Breakout.GetSPITFPErrorCount(out errorCountAckChecksum: longword; out errorCountMessageChecksum: longword; out errorCountFrame: longword; out errorCountOverflow: longword);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_SPITFP_ERROR_COUNT, 8);
+  response := SendRequest(request, 24);
+  errorCountAckChecksum := LEConvertUInt32From(8, response);
+  errorCountMessageChecksum := LEConvertUInt32From(12, response);
+  errorCountFrame := LEConvertUInt32From(16, response);
+  errorCountOverflow := LEConvertUInt32From(20, response);
+end;
+
+function TBrickletXMC1400Breakout.SetBootloaderMode(const mode: byte): byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_BOOTLOADER_MODE, 9);
+  LEConvertUInt8To(mode, 8, request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletXMC1400Breakout.GetBootloaderMode: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_BOOTLOADER_MODE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletXMC1400Breakout.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletXMC1400Breakout.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TBrickletXMC1400Breakout.SetStatusLEDConfig(const config: byte);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_SET_STATUS_LED_CONFIG, 9);
+  LEConvertUInt8To(config, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletXMC1400Breakout.GetStatusLEDConfig: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_STATUS_LED_CONFIG, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+function TBrickletXMC1400Breakout.GetChipTemperature: smallint;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_CHIP_TEMPERATURE, 8);
+  response := SendRequest(request, 10);
+  result := LEConvertInt16From(8, response);
+end;
+
+procedure TBrickletXMC1400Breakout.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TBrickletXMC1400Breakout.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TBrickletXMC1400Breakout.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TBrickletXMC1400Breakout.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, BRICKLET_XMC1400_BREAKOUT_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+procedure TBrickletXMC1400Breakout.CallbackWrapperADCValues(const packet: TByteArray);
+var values: TArray0To7OfUInt16; i: longint;
+begin
+  if (Length(packet) <> 24) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  for i := 0 to 7 do values[i] := LEConvertUInt16From(8 + (i * 2), packet);
+  if (Assigned(adcValuesCallback)) then begin
+    adcValuesCallback(self, values);
+  end;
+end;
+
+procedure TBrickletXMC1400Breakout.CallbackWrapperCount(const packet: TByteArray);
+var count: longword;
+begin
+  if (Length(packet) <> 12) then begin
+    exit; { Silently ignoring callback with wrong length }
+  end;
+  count := LEConvertUInt32From(8, packet);
+  if (Assigned(countCallback)) then begin
+    countCallback(self, count);
+  end;
+end;
+
+end.
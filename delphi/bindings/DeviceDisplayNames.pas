@@ -0,0 +1,170 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit DeviceDisplayNames;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  SysUtils;
+
+function GetDeviceDisplayName(const deviceIdentifier: word): string;
+
+implementation
+
+function GetDeviceDisplayName(const deviceIdentifier: word): string;
+begin
+  case deviceIdentifier of
+  11: result := 'DC Brick';
+  13: result := 'Master Brick';
+  14: result := 'Servo Brick';
+  15: result := 'Stepper Brick';
+  16: result := 'IMU Brick';
+  17: result := 'RED Brick';
+  18: result := 'IMU Brick 2.0';
+  19: result := 'Silent Stepper Brick';
+  21: result := 'Ambient Light Bricklet';
+  23: result := 'Current12 Bricklet';
+  24: result := 'Current25 Bricklet';
+  25: result := 'Distance IR Bricklet';
+  26: result := 'Dual Relay Bricklet';
+  27: result := 'Humidity Bricklet';
+  28: result := 'IO-16 Bricklet';
+  29: result := 'IO-4 Bricklet';
+  111: result := 'HAT Brick';
+  112: result := 'HAT Zero Brick';
+  210: result := 'Joystick Bricklet';
+  211: result := 'LCD 16x2 Bricklet';
+  212: result := 'LCD 20x4 Bricklet';
+  213: result := 'Linear Poti Bricklet';
+  214: result := 'Piezo Buzzer Bricklet';
+  215: result := 'Rotary Poti Bricklet';
+  216: result := 'Temperature Bricklet';
+  217: result := 'Temperature IR Bricklet';
+  218: result := 'Voltage Bricklet';
+  219: result := 'Analog In Bricklet';
+  220: result := 'Analog Out Bricklet';
+  221: result := 'Barometer Bricklet';
+  222: result := 'GPS Bricklet';
+  223: result := 'Industrial Digital In 4 Bricklet';
+  224: result := 'Industrial Digital Out 4 Bricklet';
+  225: result := 'Industrial Quad Relay Bricklet';
+  226: result := 'PTC Bricklet';
+  227: result := 'Voltage/Current Bricklet';
+  228: result := 'Industrial Dual 0-20mA Bricklet';
+  229: result := 'Distance US Bricklet';
+  230: result := 'Dual Button Bricklet';
+  231: result := 'LED Strip Bricklet';
+  232: result := 'Moisture Bricklet';
+  233: result := 'Motion Detector Bricklet';
+  234: result := 'Multi Touch Bricklet';
+  235: result := 'Remote Switch Bricklet';
+  236: result := 'Rotary Encoder Bricklet';
+  237: result := 'Segment Display 4x7 Bricklet';
+  238: result := 'Sound Intensity Bricklet';
+  239: result := 'Tilt Bricklet';
+  240: result := 'Hall Effect Bricklet';
+  241: result := 'Line Bricklet';
+  242: result := 'Piezo Speaker Bricklet';
+  243: result := 'Color Bricklet';
+  244: result := 'Solid State Relay Bricklet';
+  246: result := 'NFC/RFID Bricklet';
+  249: result := 'Industrial Dual Analog In Bricklet';
+  250: result := 'Accelerometer Bricklet';
+  251: result := 'Analog In Bricklet 2.0';
+  253: result := 'Load Cell Bricklet';
+  254: result := 'RS232 Bricklet';
+  255: result := 'Laser Range Finder Bricklet';
+  256: result := 'Analog Out Bricklet 2.0';
+  258: result := 'Industrial Analog Out Bricklet';
+  259: result := 'Ambient Light Bricklet 2.0';
+  260: result := 'Dust Detector Bricklet';
+  262: result := 'CO2 Bricklet';
+  263: result := 'OLED 128x64 Bricklet';
+  264: result := 'OLED 64x48 Bricklet';
+  265: result := 'UV Light Bricklet';
+  266: result := 'Thermocouple Bricklet';
+  267: result := 'Motorized Linear Poti Bricklet';
+  268: result := 'Real-Time Clock Bricklet';
+  270: result := 'CAN Bricklet';
+  271: result := 'RGB LED Bricklet';
+  272: result := 'RGB LED Matrix Bricklet';
+  276: result := 'GPS Bricklet 2.0';
+  277: result := 'RS485 Bricklet';
+  278: result := 'Thermal Imaging Bricklet';
+  279: result := 'XMC1400 Breakout Bricklet';
+  282: result := 'RGB LED Button Bricklet';
+  283: result := 'Humidity Bricklet 2.0';
+  284: result := 'Industrial Dual Relay Bricklet';
+  285: result := 'DMX Bricklet';
+  286: result := 'NFC Bricklet';
+  288: result := 'Outdoor Weather Bricklet';
+  289: result := 'Remote Switch Bricklet 2.0';
+  290: result := 'Sound Pressure Level Bricklet';
+  291: result := 'Temperature IR Bricklet 2.0';
+  292: result := 'Motion Detector Bricklet 2.0';
+  293: result := 'Industrial Counter Bricklet';
+  294: result := 'Rotary Encoder Bricklet 2.0';
+  295: result := 'Analog In Bricklet 3.0';
+  296: result := 'Solid State Relay Bricklet 2.0';
+  297: result := 'Air Quality Bricklet';
+  298: result := 'LCD 128x64 Bricklet';
+  299: result := 'Distance US Bricklet 2.0';
+  2100: result := 'Industrial Digital In 4 Bricklet 2.0';
+  2101: result := 'PTC Bricklet 2.0';
+  2102: result := 'Industrial Quad Relay Bricklet 2.0';
+  2103: result := 'LED Strip Bricklet 2.0';
+  2104: result := 'Load Cell Bricklet 2.0';
+  2105: result := 'Voltage/Current Bricklet 2.0';
+  2106: result := 'Real-Time Clock Bricklet 2.0';
+  2107: result := 'CAN Bricklet 2.0';
+  2108: result := 'RS232 Bricklet 2.0';
+  2109: result := 'Thermocouple Bricklet 2.0';
+  2110: result := 'Particulate Matter Bricklet';
+  2111: result := 'IO-4 Bricklet 2.0';
+  2112: result := 'OLED 128x64 Bricklet 2.0';
+  2113: result := 'Temperature Bricklet 2.0';
+  2114: result := 'IO-16 Bricklet 2.0';
+  2115: result := 'Analog Out Bricklet 3.0';
+  2116: result := 'Industrial Analog Out Bricklet 2.0';
+  2117: result := 'Barometer Bricklet 2.0';
+  2118: result := 'UV Light Bricklet 2.0';
+  2119: result := 'Dual Button Bricklet 2.0';
+  2120: result := 'Industrial Dual 0-20mA Bricklet 2.0';
+  2121: result := 'Industrial Dual Analog In Bricklet 2.0';
+  2122: result := 'Isolator Bricklet';
+  2123: result := 'One Wire Bricklet';
+  2124: result := 'Industrial Digital Out 4 Bricklet 2.0';
+  2125: result := 'Distance IR Bricklet 2.0';
+  2127: result := 'RGB LED Bricklet 2.0';
+  2128: result := 'Color Bricklet 2.0';
+  2129: result := 'Multi Touch Bricklet 2.0';
+  2130: result := 'Accelerometer Bricklet 2.0';
+  2131: result := 'Ambient Light Bricklet 3.0';
+  2132: result := 'Hall Effect Bricklet 2.0';
+  2137: result := 'Segment Display 4x7 Bricklet 2.0';
+  2138: result := 'Joystick Bricklet 2.0';
+  2139: result := 'Linear Poti Bricklet 2.0';
+  2140: result := 'Rotary Poti Bricklet 2.0';
+  2144: result := 'Laser Range Finder Bricklet 2.0';
+  2145: result := 'Piezo Speaker Bricklet 2.0';
+  2146: result := 'E-Paper 296x128 Bricklet';
+  2147: result := 'CO2 Bricklet 2.0';
+  2152: result := 'Energy Monitor Bricklet';
+  2153: result := 'Compass Bricklet';
+  2161: result := 'IMU Bricklet 3.0';
+  2162: result := 'Industrial Dual AC Relay Bricklet';
+  else result := 'Unknown Device [' + IntToStr(deviceIdentifier) + ']';
+  end;
+end;
+
+end.
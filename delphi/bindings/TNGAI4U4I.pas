@@ -0,0 +1,304 @@
+{
+  This file was automatically generated on 2026-10-18.
+
+  Delphi/Lazarus Bindings Version 2.1.29
+
+  If you have a bugfix for this file and want to commit it,
+  please fix the bug in the generator. You can find a link
+  to the generators git on tinkerforge.com
+}
+
+unit TNGAI4U4I;
+
+{$ifdef FPC}{$mode OBJFPC}{$H+}{$endif}
+
+interface
+
+uses
+  Device, IPConnection, LEConverter, Math, SyncObjs;
+
+const
+  TNG_AI_4U_4I_DEVICE_IDENTIFIER = 203;
+  TNG_AI_4U_4I_DEVICE_DISPLAY_NAME = 'TNG AI 4U 4I';
+
+  TNG_AI_4U_4I_FUNCTION_GET_VALUES = 1;
+  TNG_AI_4U_4I_FUNCTION_GET_VOLTAGES = 2;
+  TNG_AI_4U_4I_FUNCTION_GET_CURRENTS = 3;
+  TNG_AI_4U_4I_FUNCTION_GET_SELECTED_VOLTAGE = 4;
+  TNG_AI_4U_4I_FUNCTION_GET_SELECTED_CURRENT = 5;
+  TNG_AI_4U_4I_FUNCTION_GET_TIMESTAMP = 234;
+  TNG_AI_4U_4I_FUNCTION_COPY_FIRMWARE = 235;
+  TNG_AI_4U_4I_FUNCTION_SET_WRITE_FIRMWARE_POINTER = 237;
+  TNG_AI_4U_4I_FUNCTION_WRITE_FIRMWARE = 238;
+  TNG_AI_4U_4I_FUNCTION_RESET = 243;
+  TNG_AI_4U_4I_FUNCTION_WRITE_UID = 248;
+  TNG_AI_4U_4I_FUNCTION_READ_UID = 249;
+  TNG_AI_4U_4I_FUNCTION_GET_IDENTITY = 255;
+
+
+  TNG_AI_4U_4I_COPY_STATUS_OK = 0;
+  TNG_AI_4U_4I_COPY_STATUS_DEVICE_IDENTIFIER_INCORRECT = 1;
+  TNG_AI_4U_4I_COPY_STATUS_MAGIC_NUMBER_INCORRECT = 2;
+  TNG_AI_4U_4I_COPY_STATUS_LENGTH_MALFORMED = 3;
+  TNG_AI_4U_4I_COPY_STATUS_CRC_MISMATCH = 4;
+
+type
+  TArray0To2OfUInt8 = array [0..2] of byte;
+  TArray0To3OfInt32 = array [0..3] of longint;
+  TArray0To63OfUInt8 = array [0..63] of byte;
+
+  /// <summary>
+  ///  TBD
+  /// </summary>
+  TTNGAI4U4I = class(TDevice)
+  private
+  protected
+  public
+    /// <summary>
+    ///  Creates an object with the unique device ID <c>uid</c>. This object can
+    ///  then be added to the IP connection.
+    /// </summary>
+    constructor Create(const uid: string; ipcon_: TIPConnection);
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure GetValues(out timestamp: uint64; out voltages: TArray0To3OfInt32; out currents: TArray0To3OfInt32); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure GetVoltages(out timestamp: uint64; out voltages: TArray0To3OfInt32); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure GetCurrents(out timestamp: uint64; out currents: TArray0To3OfInt32); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure GetSelectedVoltage(const channel: byte; out timestamp: uint64; out voltage: longint); virtual;
+
+    /// <summary>
+    ///  
+    /// </summary>
+    procedure GetSelectedCurrent(const channel: byte; out timestamp: uint64; out current: longint); virtual;
+
+    /// <summary>
+    ///  TODO
+    /// </summary>
+    function GetTimestamp: uint64; virtual;
+
+    /// <summary>
+    ///  TODO
+    /// </summary>
+    function CopyFirmware: byte; virtual;
+
+    /// <summary>
+    ///  TODO
+    /// </summary>
+    procedure SetWriteFirmwarePointer(const pointer: longword); virtual;
+
+    /// <summary>
+    ///  TODO
+    /// </summary>
+    function WriteFirmware(const data: array of byte): byte; virtual;
+
+    /// <summary>
+    ///  Calling this function will reset the TNG module. All configurations
+    ///  will be lost.
+    ///  
+    ///  After a reset you have to create new device objects,
+    ///  calling functions on the existing ones will result in
+    ///  undefined behavior!
+    /// </summary>
+    procedure Reset; virtual;
+
+    /// <summary>
+    ///  Writes a new UID into flash. If you want to set a new UID
+    ///  you have to decode the Base58 encoded UID string into an
+    ///  integer first.
+    ///  
+    ///  We recommend that you use Brick Viewer to change the UID.
+    /// </summary>
+    procedure WriteUID(const uid: longword); virtual;
+
+    /// <summary>
+    ///  Returns the current UID as an integer. Encode as
+    ///  Base58 to get the usual string version.
+    /// </summary>
+    function ReadUID: longword; virtual;
+
+    /// <summary>
+    ///  Returns the UID, the UID where the Brick is connected to,
+    ///  the position, the hardware and firmware version as well as the
+    ///  device identifier.
+    ///  
+    ///  The position is the position in the stack from '0' (bottom) to '8' (top).
+    ///  
+    ///  The device identifier numbers can be found :ref:`here &lt;device_identifier&gt;`.
+    ///  |device_identifier_constant|
+    /// </summary>
+    procedure GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word); override;
+  end;
+
+implementation
+
+constructor TTNGAI4U4I.Create(const uid: string; ipcon_: TIPConnection);
+begin
+  inherited Create(uid, ipcon_, TNG_AI_4U_4I_DEVICE_IDENTIFIER, TNG_AI_4U_4I_DEVICE_DISPLAY_NAME);
+  apiVersion[0] := 2;
+  apiVersion[1] := 0;
+  apiVersion[2] := 0;
+
+  responseExpected[TNG_AI_4U_4I_FUNCTION_GET_VALUES] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_GET_VOLTAGES] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_GET_CURRENTS] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_GET_SELECTED_VOLTAGE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_GET_SELECTED_CURRENT] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_GET_TIMESTAMP] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_COPY_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_SET_WRITE_FIRMWARE_POINTER] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_WRITE_FIRMWARE] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_RESET] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_WRITE_UID] := DEVICE_RESPONSE_EXPECTED_FALSE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_READ_UID] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+  responseExpected[TNG_AI_4U_4I_FUNCTION_GET_IDENTITY] := DEVICE_RESPONSE_EXPECTED_ALWAYS_TRUE;
+
+
+  (ipcon as TIPConnection).AddDevice(self);
+end;
+
+procedure TTNGAI4U4I.GetValues(out timestamp: uint64; out voltages: TArray0To3OfInt32; out currents: TArray0To3OfInt32);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_GET_VALUES, 8);
+  response := SendRequest(request, 48);
+  timestamp := LEConvertUInt64From(8, response);
+  for i := 0 to 3 do voltages[i] := LEConvertInt32From(16 + (i * 4), response);
+  for i := 0 to 3 do currents[i] := LEConvertInt32From(32 + (i * 4), response);
+end;
+
+procedure TTNGAI4U4I.GetVoltages(out timestamp: uint64; out voltages: TArray0To3OfInt32);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_GET_VOLTAGES, 8);
+  response := SendRequest(request, 32);
+  timestamp := LEConvertUInt64From(8, response);
+  for i := 0 to 3 do voltages[i] := LEConvertInt32From(16 + (i * 4), response);
+end;
+
+procedure TTNGAI4U4I.GetCurrents(out timestamp: uint64; out currents: TArray0To3OfInt32);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_GET_CURRENTS, 8);
+  response := SendRequest(request, 32);
+  timestamp := LEConvertUInt64From(8, response);
+  for i := 0 to 3 do currents[i] := LEConvertInt32From(16 + (i * 4), response);
+end;
+
+procedure TTNGAI4U4I.GetSelectedVoltage(const channel: byte; out timestamp: uint64; out voltage: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_GET_SELECTED_VOLTAGE, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 20);
+  timestamp := LEConvertUInt64From(8, response);
+  voltage := LEConvertInt32From(16, response);
+end;
+
+procedure TTNGAI4U4I.GetSelectedCurrent(const channel: byte; out timestamp: uint64; out current: longint);
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_GET_SELECTED_CURRENT, 9);
+  LEConvertUInt8To(channel, 8, request);
+  response := SendRequest(request, 20);
+  timestamp := LEConvertUInt64From(8, response);
+  current := LEConvertInt32From(16, response);
+end;
+
+function TTNGAI4U4I.GetTimestamp: uint64;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_GET_TIMESTAMP, 8);
+  response := SendRequest(request, 16);
+  result := LEConvertUInt64From(8, response);
+end;
+
+function TTNGAI4U4I.CopyFirmware: byte;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_COPY_FIRMWARE, 8);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TTNGAI4U4I.SetWriteFirmwarePointer(const pointer: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_SET_WRITE_FIRMWARE_POINTER, 12);
+  LEConvertUInt32To(pointer, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TTNGAI4U4I.WriteFirmware(const data: array of byte): byte;
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_WRITE_FIRMWARE, 72);
+  if (Length(data) <> 64) then raise EInvalidParameterException.Create('Data has to be exactly 64 items long');
+  for i := 0 to Length(data) - 1 do LEConvertUInt8To(data[i], 8 + (i * 1), request);
+  response := SendRequest(request, 9);
+  result := LEConvertUInt8From(8, response);
+end;
+
+procedure TTNGAI4U4I.Reset;
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_RESET, 8);
+  SendRequest(request, 0);
+end;
+
+procedure TTNGAI4U4I.WriteUID(const uid: longword);
+var request: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_WRITE_UID, 12);
+  LEConvertUInt32To(uid, 8, request);
+  SendRequest(request, 0);
+end;
+
+function TTNGAI4U4I.ReadUID: longword;
+var request, response: TByteArray;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_READ_UID, 8);
+  response := SendRequest(request, 12);
+  result := LEConvertUInt32From(8, response);
+end;
+
+procedure TTNGAI4U4I.GetIdentity(out uid: string; out connectedUid: string; out position: char; out hardwareVersion: TVersionNumber; out firmwareVersion: TVersionNumber; out deviceIdentifier: word);
+var request, response: TByteArray; i: longint;
+begin
+  CheckValidity;
+  request := (ipcon as TIPConnection).CreateRequestPacket(self, TNG_AI_4U_4I_FUNCTION_GET_IDENTITY, 8);
+  response := SendRequest(request, 33);
+  uid := LEConvertStringFrom(8, 8, response);
+  connectedUid := LEConvertStringFrom(16, 8, response);
+  position := LEConvertCharFrom(24, response);
+  for i := 0 to 2 do hardwareVersion[i] := LEConvertUInt8From(25 + (i * 1), response);
+  for i := 0 to 2 do firmwareVersion[i] := LEConvertUInt8From(28 + (i * 1), response);
+  deviceIdentifier := LEConvertUInt16From(31, response);
+end;
+
+end.